@@ -0,0 +1,49 @@
+"""
+Aggregations (unitsnet_py.aggregate) versus functools.reduce(operator.add, ...).
+
+Run: python benchmarks/bench_aggregate.py [size]
+"""
+import functools
+import operator
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import Length  # noqa: E402
+from unitsnet_py import aggregate  # noqa: E402
+from utils import measure, print_table  # noqa: E402
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    lengths = [Length.from_meters(random.uniform(0, 1000)) for _ in range(size)]
+
+    cases = [
+        ("reduce(operator.add)", lambda: functools.reduce(operator.add, lengths)),
+        ("aggregate.sum", lambda: aggregate.sum(lengths)),
+        ("aggregate.sum(compensated=True)", lambda: aggregate.sum(lengths, compensated=True)),
+        ("aggregate.mean", lambda: aggregate.mean(lengths)),
+        ("aggregate.max", lambda: aggregate.max(lengths)),
+        ("aggregate.variance", lambda: aggregate.variance(lengths)),
+        ("aggregate.percentile(95)", lambda: aggregate.percentile(lengths, 95)),
+    ]
+    try:
+        from unitsnet_py.arrays import LengthArray
+
+        array = LengthArray([length.meters for length in lengths])
+        cases += [
+            ("aggregate.sum(LengthArray)", lambda: aggregate.sum(array)),
+            ("aggregate.percentile(LengthArray, 95)", lambda: aggregate.percentile(array, 95)),
+        ]
+    except ImportError:
+        pass
+
+    rows = [(name, f"{size * 1e9 / measure(operation, 1, 3) / 1e6:.1f}") for name, operation in cases]
+    print(f"Aggregating {size} lengths (M items/s)")
+    print_table(["aggregation", "throughput"], rows)
+
+
+if __name__ == "__main__":
+    main()
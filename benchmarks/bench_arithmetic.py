@@ -0,0 +1,39 @@
+"""
+Arithmetic operators microbenchmark on Length and VolumeFlow.
+
+Run: python benchmarks/bench_arithmetic.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import Duration, Length, VolumeFlow  # noqa: E402
+from utils import measure, print_table  # noqa: E402
+
+
+def main():
+    length1, length2 = Length.from_meters(10), Length.from_meters(3)
+    flow1, flow2 = VolumeFlow.from_liters_per_second(10), VolumeFlow.from_liters_per_second(3)
+    duration = Duration.from_seconds(2)
+
+    cases = [
+        ("Length + Length", lambda: length1 + length2),
+        ("Length - Length", lambda: length1 - length2),
+        ("Length * 2", lambda: length1 * 2),
+        ("Length / 2", lambda: length1 / 2),
+        ("Length * Length -> Area", lambda: length1 * length2),
+        ("Length / Length -> float", lambda: length1 / length2),
+        ("VolumeFlow + VolumeFlow", lambda: flow1 + flow2),
+        ("VolumeFlow - VolumeFlow", lambda: flow1 - flow2),
+        ("VolumeFlow * 2", lambda: flow1 * 2),
+        ("VolumeFlow / 2", lambda: flow1 / 2),
+        ("VolumeFlow * Duration -> Volume", lambda: flow1 * duration),
+        ("VolumeFlow / VolumeFlow -> float", lambda: flow1 / flow2),
+    ]
+    rows = [(case, f"{measure(operation, 200_000, 7):.0f}") for case, operation in cases]
+    print_table(["operation", "ns/op"], rows)
+
+
+if __name__ == "__main__":
+    main()
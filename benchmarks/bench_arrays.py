@@ -0,0 +1,53 @@
+"""
+Batch conversion throughput of the NumPy backed quantity arrays versus the per-object path.
+
+Run: python benchmarks/bench_arrays.py [size]
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import Length, LengthUnits, Pressure, PressureUnits  # noqa: E402
+from unitsnet_py.arrays import LengthArray, PressureArray  # noqa: E402
+from utils import measure, print_table  # noqa: E402
+
+
+CASES = [
+    (Pressure, PressureArray, PressureUnits.Bar, PressureUnits.PoundForcePerSquareInch),
+    (Length, LengthArray, LengthUnits.Foot, LengthUnits.Kilometer),
+]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    values = [random.uniform(0, 1000) for _ in range(size)]
+
+    rows = []
+    for quantity, array, from_unit, to_unit in CASES:
+        per_object = measure(
+            lambda: [quantity(value, from_unit).convert(to_unit) for value in values],
+            number=1,
+            repeat=3,
+        )
+        vectorized = measure(
+            lambda: array.from_array(values, from_unit).convert(to_unit),
+            number=1,
+            repeat=3,
+        )
+        rows.append(
+            (
+                f"{quantity.__name__} {from_unit.name} -> {to_unit.name}",
+                f"{size / per_object * 1e9 / 1e6:.2f}",
+                f"{size / vectorized * 1e9 / 1e6:.2f}",
+                f"{per_object / vectorized:.1f}x",
+            )
+        )
+
+    print(f"Converting {size} values")
+    print_table(["conversion", "per-object M/s", "array M/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Reading and converting unit-tagged Parquet columns (unitsnet_py.arrow) versus the per-object path.
+
+Run: python benchmarks/bench_arrow.py [rows]  (e.g. 100000000, the file and the columns need about 5 GB)
+"""
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pyarrow as pa  # noqa: E402
+import pyarrow.parquet as pq  # noqa: E402
+
+from unitsnet_py import Pressure, PressureUnits, Temperature, TemperatureUnits  # noqa: E402
+from unitsnet_py import arrow  # noqa: E402
+from utils import measure, print_table  # noqa: E402
+
+# The per-object path is measured on a sample, its throughput does not depend on the file size.
+OBJECTS_SAMPLE = 1_000_000
+
+
+def write_file(path: str, rows: int):
+    rng = np.random.default_rng(0)
+    schema = pa.schema(
+        [
+            arrow.quantity_field("pressure", Pressure, PressureUnits.Bar),
+            arrow.quantity_field("temperature", Temperature, TemperatureUnits.DegreeCelsius),
+        ]
+    )
+    chunk = 10_000_000
+    with pq.ParquetWriter(path, schema) as writer:
+        for start in range(0, rows, chunk):
+            size = min(chunk, rows - start)
+            writer.write_table(
+                pa.table(
+                    [
+                        pa.ExtensionArray.from_storage(schema.field(0).type, pa.array(rng.uniform(0, 100, size))),
+                        pa.ExtensionArray.from_storage(schema.field(1).type, pa.array(rng.uniform(-40, 40, size))),
+                    ],
+                    schema=schema,
+                )
+            )
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "telemetry.parquet")
+        write_file(path, rows)
+        size = os.path.getsize(path)
+        table = pq.read_table(path)
+        sample = pa.concat_arrays(table["pressure"].slice(0, OBJECTS_SAMPLE).chunks).storage
+        temperatures = table["temperature"]
+
+        cases = [
+            ("read Parquet (2 columns)", rows * 2, lambda: pq.read_table(path)),
+            (
+                "convert_column Bar -> Pascal",
+                rows,
+                lambda: arrow.convert_column(table, "pressure", PressureUnits.Pascal),
+            ),
+            (
+                "convert °C -> °F",
+                rows,
+                lambda: arrow.convert(temperatures, TemperatureUnits.DegreeFahrenheit),
+            ),
+            ("from_arrow -> TemperatureArray", rows, lambda: arrow.from_arrow(temperatures)),
+            (
+                "per-object Bar -> Pascal",
+                len(sample),
+                lambda: [Pressure.from_bars(value).pascals for value in sample.to_pylist()],
+            ),
+        ]
+        results = [
+            (name, f"{count * 1e9 / measure(operation, 1, 3) / 1e6:.1f}") for name, count, operation in cases
+        ]
+
+    print(f"{rows} rows Parquet file ({size / 1e6:.0f} MB)")
+    print_table(["operation", "M values/s"], results)
+
+
+if __name__ == "__main__":
+    main()
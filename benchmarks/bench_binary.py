@@ -0,0 +1,65 @@
+"""
+Binary codec (unitsnet_py.binary) versus a JSON baseline: encode/decode throughput and encoded size.
+
+Run: python benchmarks/bench_binary.py [size]
+"""
+import json
+import os
+import random
+import sys
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import Length, LengthUnits  # noqa: E402
+from unitsnet_py.binary import decode, decode_batch, encode, encode_batch  # noqa: E402
+from utils import measure, print_table  # noqa: E402
+
+
+def json_encode(length):
+    return json.dumps({"quantity": "Length", "unit": "Meter", "value": length.meters}).encode()
+
+
+def json_decode(data):
+    payload = json.loads(data)
+    return Length(payload["value"], LengthUnits[payload["unit"]])
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    values = array("d", (random.uniform(0, 1000) for _ in range(size)))
+    length = Length.from_meters(values[0])
+
+    json_data = json_encode(length)
+    binary_data = encode(length)
+    json_batch = json.dumps({"quantity": "Length", "unit": "Meter", "values": values.tolist()}).encode()
+    binary_batch = encode_batch(values, Length)
+
+    rows = [
+        (
+            "single measurement",
+            f"{1e9 / measure(lambda: json_encode(length), 100_000, 5) / 1e6:.2f}",
+            f"{1e9 / measure(lambda: encode(length), 100_000, 5) / 1e6:.2f}",
+            f"{1e9 / measure(lambda: json_decode(json_data), 100_000, 5) / 1e6:.2f}",
+            f"{1e9 / measure(lambda: decode(binary_data), 100_000, 5) / 1e6:.2f}",
+            len(json_data),
+            len(binary_data),
+        ),
+        (
+            f"batch of {size}",
+            f"{size * 1e9 / measure(lambda: json.dumps({'values': values.tolist()}).encode(), 1, 3) / 1e6:.2f}",
+            f"{size * 1e9 / measure(lambda: encode_batch(values, Length), 1, 3) / 1e6:.2f}",
+            f"{size * 1e9 / measure(lambda: json.loads(json_batch), 1, 3) / 1e6:.2f}",
+            f"{size * 1e9 / measure(lambda: decode_batch(binary_batch), 1, 3) / 1e6:.2f}",
+            len(json_batch),
+            len(binary_batch),
+        ),
+    ]
+    print("Throughput in M measurements/s, sizes in bytes")
+    print_table(
+        ["payload", "json encode", "binary encode", "json decode", "binary decode", "json size", "binary size"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
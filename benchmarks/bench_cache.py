@@ -0,0 +1,50 @@
+"""
+Unit property reads per cache policy, from threads sharing the same instances.
+
+Every task reads the 'meters' and 'inches' properties of all the shared instances,
+the instances are created again for each policy, so the first reads are cache misses.
+
+Run: python benchmarks/bench_cache.py [instances] [tasks]
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import Length, cache  # noqa: E402
+from utils import print_table  # noqa: E402
+
+THREADS = [1, 2, 4, 8, 16]
+
+
+def read(lengths):
+    for length in lengths:
+        length.meters
+        length.inches
+
+
+def run(policy, threads, size, tasks):
+    cache.set_policy(policy, maxsize=2 * size)
+    lengths = [Length.from_feet(value) for value in range(size)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        for _ in executor.map(lambda _: read(lengths), range(tasks)):
+            pass
+    return 2 * size * tasks / (time.perf_counter() - start) / 1e6
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    tasks = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    rows = [
+        (policy, *(f"{run(policy, threads, size, tasks):.2f}" for threads in THREADS)) for policy in cache.POLICIES
+    ]
+    cache.set_policy("instance")
+    print(f"{tasks} tasks reading 2 properties of {size} shared instances (M reads/s)")
+    print_table(["policy", *(f"{threads} threads" for threads in THREADS)], rows)
+
+
+if __name__ == "__main__":
+    main()
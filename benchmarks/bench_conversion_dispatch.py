@@ -0,0 +1,68 @@
+"""
+Per-unit conversion latency across all enum positions.
+
+With table driven dispatch the cost of `convert` should not depend on the position
+of the target unit in the units enumeration.
+
+Run: python benchmarks/bench_conversion_dispatch.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import (  # noqa: E402
+    Density,
+    DensityUnits,
+    Pressure,
+    PressureUnits,
+    Volume,
+    VolumeFlow,
+    VolumeFlowUnits,
+    VolumeUnits,
+)
+from utils import measure, print_table  # noqa: E402
+
+
+QUANTITIES = [
+    (VolumeFlow, VolumeFlowUnits),
+    (Volume, VolumeUnits),
+    (Density, DensityUnits),
+    (Pressure, PressureUnits),
+]
+
+
+def bench_quantity(quantity, units):
+    instance = quantity(1.0)
+    timings = []
+    for position, unit in enumerate(units):
+        timings.append((position, unit.name, measure(lambda: instance.convert(unit))))
+    return timings
+
+
+def main():
+    summary = []
+    for quantity, units in QUANTITIES:
+        timings = bench_quantity(quantity, units)
+        print(f"\n{quantity.__name__} ({len(timings)} units)")
+        print_table(
+            ["position", "unit", "ns/convert"],
+            [(position, name, f"{ns:.1f}") for position, name, ns in timings],
+        )
+        costs = [ns for _, _, ns in timings]
+        summary.append(
+            (
+                quantity.__name__,
+                len(costs),
+                f"{costs[0]:.1f}",
+                f"{costs[-1]:.1f}",
+                f"{max(costs) / min(costs):.2f}",
+            )
+        )
+
+    print("\nSummary")
+    print_table(["quantity", "units", "first ns", "last ns", "max/min"], summary)
+
+
+if __name__ == "__main__":
+    main()
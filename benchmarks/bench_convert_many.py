@@ -0,0 +1,60 @@
+"""
+Pure-Python bulk conversion (convert_many / convert_array) versus per-value conversion.
+
+Run: python benchmarks/bench_convert_many.py [size]
+"""
+import os
+import random
+import sys
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import (  # noqa: E402
+    Length,
+    LengthUnits,
+    Mass,
+    MassUnits,
+    Pressure,
+    PressureUnits,
+    Temperature,
+    TemperatureUnits,
+    VolumeFlow,
+    VolumeFlowUnits,
+)
+from utils import measure, print_table  # noqa: E402
+
+
+CASES = [
+    (Length, LengthUnits.Foot, LengthUnits.Meter),
+    (Mass, MassUnits.Pound, MassUnits.Kilogram),
+    (Temperature, TemperatureUnits.DegreeFahrenheit, TemperatureUnits.DegreeCelsius),
+    (Pressure, PressureUnits.PoundForcePerSquareInch, PressureUnits.Bar),
+    (VolumeFlow, VolumeFlowUnits.UsGallonPerMinute, VolumeFlowUnits.LiterPerSecond),
+]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    values = [random.uniform(0, 1000) for _ in range(size)]
+    values_array = array("d", values)
+
+    rows = []
+    for quantity, from_unit, to_unit in CASES:
+        timings = [
+            measure(lambda: [quantity(value, from_unit).convert(to_unit) for value in values], 1, 3),
+            measure(lambda: [quantity.convert_value(value, from_unit, to_unit) for value in values], 1, 3),
+            measure(lambda: quantity.convert_many(values, from_unit, to_unit), 1, 3),
+            measure(lambda: quantity.convert_array(values_array, from_unit, to_unit), 1, 3),
+        ]
+        rows.append(
+            (f"{quantity.__name__} {from_unit.name} -> {to_unit.name}",)
+            + tuple(f"{size / ns * 1e9 / 1e6:.2f}" for ns in timings)
+        )
+
+    print(f"Converting {size} values (M values/s)")
+    print_table(["conversion", "instance", "convert_value", "convert_many", "convert_array"], rows)
+
+
+if __name__ == "__main__":
+    main()
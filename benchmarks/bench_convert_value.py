@@ -0,0 +1,48 @@
+"""
+Direct unit-to-unit conversion (convert_value) versus converting through an instance.
+
+Run: python benchmarks/bench_convert_value.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import (  # noqa: E402
+    Length,
+    LengthUnits,
+    Pressure,
+    PressureUnits,
+    Temperature,
+    TemperatureUnits,
+)
+from utils import measure, print_table  # noqa: E402
+
+
+CASES = [
+    (Length, LengthUnits.Foot, LengthUnits.Inch),
+    (Length, LengthUnits.Kilometer, LengthUnits.Mile),
+    (Temperature, TemperatureUnits.DegreeFahrenheit, TemperatureUnits.DegreeCelsius),
+    (Pressure, PressureUnits.Bar, PressureUnits.PoundForcePerSquareInch),
+    (Pressure, PressureUnits.MeterOfElevation, PressureUnits.Bar),
+]
+
+
+def main():
+    rows = []
+    for quantity, from_unit, to_unit in CASES:
+        instance_ns = measure(lambda: quantity(12.5, from_unit).convert(to_unit))
+        direct_ns = measure(lambda: quantity.convert_value(12.5, from_unit, to_unit))
+        rows.append(
+            (
+                f"{quantity.__name__} {from_unit.name} -> {to_unit.name}",
+                f"{instance_ns:.1f}",
+                f"{direct_ns:.1f}",
+                f"{instance_ns / direct_ns:.1f}x",
+            )
+        )
+    print_table(["conversion", "instance ns", "convert_value ns", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Overhead of the dimensional arithmetic operators (cross-quantity * and /) versus same-quantity arithmetic.
+
+Run: python benchmarks/bench_dimensions.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import Duration, Energy, Length, Mass, Volume  # noqa: E402
+from utils import measure, print_table  # noqa: E402
+
+
+def main():
+    length = Length.from_meters(3)
+    energy = Energy.from_joules(100)
+    duration = Duration.from_seconds(10)
+    mass = Mass.from_kilograms(6)
+    volume = Volume.from_cubic_meters(2)
+
+    cases = [
+        ("Length + Length", lambda: length + length),
+        ("Length * Length -> Area", lambda: length * length),
+        ("Length / Length -> float", lambda: length / length),
+        ("Energy / Duration -> Power", lambda: energy / duration),
+        ("Mass / Volume -> Density", lambda: mass / volume),
+        ("Mass / Duration -> MassFlow", lambda: mass / duration),
+    ]
+    rows = [(name, f"{measure(operation, 200_000, 5):.0f}") for name, operation in cases]
+    print_table(["operation", "ns/op"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+JSON DTO bulk serialization (dumps_many / loads_many) versus per-item mapping.
+
+Run: python benchmarks/bench_dto.py [size]
+"""
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import Length, LengthUnits  # noqa: E402
+from unitsnet_py.dto import dumps_many, loads_many  # noqa: E402
+from utils import measure, print_table  # noqa: E402
+
+
+UNITS = [LengthUnits.Meter, LengthUnits.Kilometer, LengthUnits.Foot, LengthUnits.Mile]
+
+
+def naive_dumps(lengths):
+    return json.dumps([{"value": length.meters, "unit": LengthUnits.Meter.value} for length in lengths])
+
+
+def naive_loads(text):
+    return [Length(dto["value"], LengthUnits(dto["unit"])) for dto in json.loads(text)]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    lengths = [Length.from_meters(random.uniform(0, 1000)) for _ in range(size)]
+    text = json.dumps([{"value": random.uniform(0, 1000), "unit": random.choice(UNITS).value} for _ in range(size)])
+
+    rows = [
+        ("dumps", f"{size * 1e9 / measure(lambda: naive_dumps(lengths), 1, 5) / 1e6:.2f}",
+         f"{size * 1e9 / measure(lambda: dumps_many(lengths), 1, 5) / 1e6:.2f}"),
+        ("loads", f"{size * 1e9 / measure(lambda: naive_loads(text), 1, 5) / 1e6:.2f}",
+         f"{size * 1e9 / measure(lambda: loads_many(text, Length), 1, 5) / 1e6:.2f}"),
+    ]
+    print(f"{size} DTOs (M DTOs/s)")
+    print_table(["operation", "per item", "bulk"], rows)
+
+
+if __name__ == "__main__":
+    main()
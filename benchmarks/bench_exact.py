@@ -0,0 +1,45 @@
+"""
+The overhead of the exact (Fraction / Decimal) conversions over the float conversions.
+
+Run: python benchmarks/bench_exact.py
+"""
+import os
+import sys
+from decimal import Decimal
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import Length, LengthUnits, Temperature, TemperatureUnits  # noqa: E402
+from utils import measure, print_table  # noqa: E402
+
+CASES = [
+    ("Length", LengthUnits.UsSurveyFoot, LengthUnits.Meter),
+    ("Length", LengthUnits.PrinterPoint, LengthUnits.Inch),
+    ("Temperature", TemperatureUnits.DegreeFahrenheit, TemperatureUnits.DegreeCelsius),
+]
+QUANTITIES = {"Length": Length, "Temperature": Temperature}
+
+
+def main():
+    rows = []
+    for name, from_unit, to_unit in CASES:
+        quantity = QUANTITIES[name]
+        float_ns = measure(lambda: quantity.convert_value(1234.5, from_unit, to_unit))
+        fraction = Fraction(12345, 10)
+        fraction_ns = measure(lambda: quantity.convert_exact(fraction, from_unit, to_unit))
+        decimal = Decimal("1234.5")
+        decimal_ns = measure(lambda: quantity.convert_exact(decimal, from_unit, to_unit))
+        rows.append(
+            (
+                f"{name} {from_unit.name} -> {to_unit.name}",
+                f"{float_ns:.0f}",
+                f"{fraction_ns:.0f} ({fraction_ns / float_ns:.1f}x)",
+                f"{decimal_ns:.0f} ({decimal_ns / float_ns:.1f}x)",
+            )
+        )
+    print_table(["conversion", "float ns", "Fraction ns", "Decimal ns"], rows)
+
+
+if __name__ == "__main__":
+    main()
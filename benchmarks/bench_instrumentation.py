@@ -0,0 +1,36 @@
+"""
+The overhead of the conversion instrumentation, disabled (the original methods) and enabled.
+
+Run: python benchmarks/bench_instrumentation.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import Length, LengthUnits, instrumentation  # noqa: E402
+from utils import measure, print_table  # noqa: E402
+
+CASES = [
+    ("Length.from_feet(3)", lambda: Length.from_feet(3)),
+    ("length.convert(Inch)", lambda: LENGTH.convert(LengthUnits.Inch)),
+    ("length.meters (cached)", lambda: LENGTH.meters),
+    ("Length.convert_value", lambda: Length.convert_value(3, LengthUnits.Foot, LengthUnits.Inch)),
+]
+LENGTH = Length.from_feet(3)
+
+
+def main():
+    disabled = [measure(case) for _, case in CASES]
+    instrumentation.enable()
+    enabled = [measure(case) for _, case in CASES]
+    instrumentation.disable()
+    rows = [
+        (name, f"{off:.0f}", f"{on:.0f}", f"{on / off:.2f}x")
+        for (name, _), off, on in zip(CASES, disabled, enabled)
+    ]
+    print_table(["operation", "disabled ns", "enabled ns", "ratio"], rows)
+
+
+if __name__ == "__main__":
+    main()
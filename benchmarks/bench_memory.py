@@ -0,0 +1,43 @@
+"""
+Memory footprint (tracemalloc bytes per instance) of every generated quantity.
+
+Run: python benchmarks/bench_memory.py
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unitsnet_py  # noqa: E402
+from utils import print_table  # noqa: E402
+
+
+INSTANCES = 10000
+
+
+def bytes_per_instance(quantity) -> float:
+    values = [float(i) for i in range(INSTANCES)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [quantity(value) for value in values]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Exclude the list holding the instances.
+    overhead = sys.getsizeof(instances)
+    return (after - before - overhead) / INSTANCES
+
+
+def main():
+    # '__all__' also lists the package functions (parse, stats...), the quantities are the ones of '_quantity_modules'.
+    quantities = [getattr(unitsnet_py, name) for name in unitsnet_py._quantity_modules]
+    rows = []
+    for quantity in quantities:
+        rows.append((quantity.__name__, f"{bytes_per_instance(quantity):.0f}"))
+    print_table(["quantity", "bytes/instance"], rows)
+    total = sum(float(size) for _, size in rows)
+    print(f"\nMean bytes/instance over {len(rows)} quantities: {total / len(rows):.0f}")
+
+
+if __name__ == "__main__":
+    main()
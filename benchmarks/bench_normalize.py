@@ -0,0 +1,75 @@
+"""
+Throughput of the record normalization, against creating a quantity per field value.
+
+Run: python benchmarks/bench_normalize.py [size]
+"""
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import Pressure, Temperature, Volume  # noqa: E402
+from unitsnet_py.unit_systems import US_CUSTOMARY, Normalizer  # noqa: E402
+from utils import print_table  # noqa: E402
+
+SCHEMA = {"pressure": Pressure, "temperature": Temperature, "volume": Volume}
+UNITS = {
+    "pressure": ["psi", "bar", "kPa"],
+    "temperature": ["°F", "°C"],
+    "volume": ["gal (U.S.)", "l"],
+}
+
+
+def records(size):
+    units = {name: itertools.cycle(cycle) for name, cycle in UNITS.items()}
+    return [
+        {"id": index, **{name: (index % 100, next(units[name])) for name in SCHEMA}} for index in range(size)
+    ]
+
+
+def per_value(items, normalizer):
+    # The baseline: resolve the unit and create a quantity per value, then read the target unit.
+    targets = normalizer.units
+    for record in items:
+        normalized = dict(record)
+        for name, quantity in SCHEMA.items():
+            value, unit = record[name]
+            normalized[name] = quantity(value, quantity._resolve_unit(unit)).convert(targets[name])
+
+
+def rate(func, size):
+    start = time.perf_counter()
+    func()
+    return size / (time.perf_counter() - start) / 1e6
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    items = records(size)
+    tuples = [tuple(record[name] for name in SCHEMA) for record in items]
+    columns = {
+        name: ([value for value, _ in (record[name] for record in items)], UNITS[name][0]) for name in SCHEMA
+    }
+    normalizer = Normalizer(SCHEMA, US_CUSTOMARY)
+
+    rows = [
+        ("quantity per value (dicts)", f"{rate(lambda: per_value(items, normalizer), size):.2f}"),
+        ("Normalizer (dicts)", f"{rate(lambda: list(normalizer.normalize_many(items)), size):.2f}"),
+        ("Normalizer (tuples)", f"{rate(lambda: list(normalizer.normalize_many(tuples)), size):.2f}"),
+        ("Normalizer (columns)", f"{rate(lambda: normalizer.normalize_columns(columns), size):.2f}"),
+    ]
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        arrays = {name: (np.asarray(values, dtype=np.float64), unit) for name, (values, unit) in columns.items()}
+        rows.append(("Normalizer (NumPy columns)", f"{rate(lambda: normalizer.normalize_columns(arrays), size):.2f}"))
+    print(f"Normalizing {size} records of {len(SCHEMA)} fields (M records/s)")
+    print_table(["path", "throughput"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+pandas QuantityDtype columns (unitsnet_py.pandas) versus object dtype columns of quantity instances.
+
+Run: python benchmarks/bench_pandas.py [rows]  (e.g. 10000000, the object dtype cases need several GB of memory)
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from unitsnet_py import Pressure, PressureUnits  # noqa: E402
+from unitsnet_py.pandas import QuantityDtype  # noqa: E402
+from utils import measure, print_table  # noqa: E402
+
+
+def object_mean(pressures: pd.Series) -> Pressure:
+    return Pressure.from_pascals(sum(pressure.pascals for pressure in pressures) / len(pressures))
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    values = rng.uniform(0, 100, rows)
+    groups = rng.integers(0, 100, rows)
+
+    dtype = QuantityDtype(Pressure, PressureUnits.Bar)
+    typed = pd.Series(values, dtype=dtype)
+    objects = pd.Series([Pressure.from_bars(value) for value in values.tolist()], dtype=object)
+    typed_frame = pd.DataFrame({"group": groups, "pressure": typed})
+    objects_frame = pd.DataFrame({"group": groups, "pressure": objects})
+
+    cases = [
+        (
+            "create",
+            lambda: pd.Series([Pressure.from_bars(value) for value in values.tolist()], dtype=object),
+            lambda: pd.Series(values, dtype=dtype),
+        ),
+        (
+            "convert to psi",
+            lambda: objects.map(lambda pressure: pressure.pounds_force_per_square_inch),
+            lambda: typed.units.convert(PressureUnits.PoundForcePerSquareInch),
+        ),
+        ("sum", lambda: objects.sum(), lambda: typed.sum()),
+        ("max", lambda: objects.max(), lambda: typed.max()),
+        (
+            "groupby mean",
+            lambda: objects_frame.groupby("group")["pressure"].agg(object_mean),
+            lambda: typed_frame.groupby("group")["pressure"].mean(),
+        ),
+        ("concat", lambda: pd.concat([objects, objects]), lambda: pd.concat([typed, typed])),
+    ]
+
+    results = []
+    for name, object_case, typed_case in cases:
+        object_time = measure(object_case, 1, 3)
+        typed_time = measure(typed_case, 1, 3)
+        results.append(
+            (name, f"{object_time / 1e6:.1f}", f"{typed_time / 1e6:.1f}", f"{object_time / typed_time:.1f}x")
+        )
+
+    print(f"pandas columns of {rows} pressures")
+    object_memory = objects.memory_usage(deep=True) / 1e6
+    typed_memory = typed.memory_usage(deep=True) / 1e6
+    print(f"memory: object dtype {object_memory:.0f} MB, QuantityDtype {typed_memory:.0f} MB")
+    print_table(["operation", "object dtype ms", "QuantityDtype ms", "speedup"], results)
+
+
+if __name__ == "__main__":
+    main()
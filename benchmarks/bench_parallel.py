@@ -0,0 +1,54 @@
+"""
+Scaling of the process pool batch conversion across 1 to N worker processes.
+
+The baseline converts the same chunks in the main process, 'array("d")' to 'array("d")'.
+The speedup is bounded by the cores of the machine and by the transfer of the buffers to and from the workers.
+
+Run: python benchmarks/bench_parallel.py [values] [chunk size]
+"""
+import os
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import Temperature, TemperatureUnits  # noqa: E402
+from unitsnet_py.parallel import convert_batches  # noqa: E402
+from utils import print_table  # noqa: E402
+
+FROM_UNIT = TemperatureUnits.DegreeCelsius
+TO_UNIT = TemperatureUnits.DegreeFahrenheit
+
+
+def chunks(size, chunk_size):
+    values = array("d", (value % 1000 for value in range(chunk_size)))
+    for _ in range(size // chunk_size):
+        yield values
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000_000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    cores = os.cpu_count() or 1
+
+    start = time.perf_counter()
+    for chunk in chunks(size, chunk_size):
+        array("d", Temperature._convert_many(chunk, FROM_UNIT, TO_UNIT))
+    baseline = size / (time.perf_counter() - start)
+    rows = [("in process", f"{baseline / 1e6:.2f}", "1.00x")]
+
+    # 1, 2, 4, ... workers, up to the cores count.
+    for workers in sorted({min(2**power, cores) for power in range(cores.bit_length() + 1)}):
+        start = time.perf_counter()
+        for _ in convert_batches(chunks(size, chunk_size), Temperature, FROM_UNIT, TO_UNIT, workers=workers):
+            pass
+        rate = size / (time.perf_counter() - start)
+        rows.append((f"{workers} workers", f"{rate / 1e6:.2f}", f"{rate / baseline:.2f}x"))
+
+    print(f"Converting {size} values (°C -> °F) in chunks of {chunk_size}, {cores} cores (M values/s)")
+    print_table(["conversion", "throughput", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
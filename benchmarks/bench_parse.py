@@ -0,0 +1,42 @@
+"""
+Parsing throughput of quantity strings.
+
+Run: python benchmarks/bench_parse.py [size]
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unitsnet_py  # noqa: E402
+from unitsnet_py import Length, LengthUnits  # noqa: E402
+from utils import measure, print_table  # noqa: E402
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    # Abbreviations that are unique over all quantities (e.g. "m" is both Meter and Minute).
+    units = [LengthUnits.Kilometer, LengthUnits.Mile, LengthUnits.Foot, LengthUnits.UsSurveyFoot]
+    texts = [
+        Length(random.uniform(0, 1000), random.choice(units)).to_string(random.choice(units))
+        for _ in range(size)
+    ]
+
+    # Build the abbreviation indexes up front, the first global parse imports all quantities.
+    unitsnet_py.parse(texts[0])
+
+    rows = []
+    for name, parse in [
+        ("Length.parse", Length.parse),
+        ("unitsnet_py.parse", unitsnet_py.parse),
+    ]:
+        seconds = measure(lambda: [parse(text) for text in texts], number=1, repeat=3) / 1e9
+        rows.append((name, f"{seconds:.2f}", f"{size / seconds / 1e6:.2f}"))
+
+    print(f"Parsing {size} strings")
+    print_table(["parser", "seconds", "M strings/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Scaling measurements by plain numbers: scalar operators versus re-wrapping the base value.
+
+Run: python benchmarks/bench_scalar.py [size]
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import Length  # noqa: E402
+from utils import measure, print_table  # noqa: E402
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    lengths = [Length.from_meters(random.uniform(0, 1000)) for _ in range(size)]
+
+    cases = [
+        ("Length(length.base_value * 2)", lambda: [Length(length.base_value * 2) for length in lengths]),
+        ("length * 2", lambda: [length * 2 for length in lengths]),
+        ("2 * length", lambda: [2 * length for length in lengths]),
+        ("length / 2", lambda: [length / 2 for length in lengths]),
+        ("-length", lambda: [-length for length in lengths]),
+    ]
+    rows = [(name, f"{measure(operation, 1, 3) / size:.0f}") for name, operation in cases]
+    print(f"Scaling {size} lengths (ns/item)")
+    print_table(["operation", "ns/item"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Throughput of the lazy stream pipeline over a synthetic telemetry feed.
+
+Run: python benchmarks/bench_stream.py [size]
+"""
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import Pressure, PressureUnits  # noqa: E402
+from unitsnet_py.stream import pipeline  # noqa: E402
+from utils import print_table  # noqa: E402
+
+
+UNITS = ["psi", "bar", "kPa", "Pa", "atm"]
+
+
+def feed(size):
+    units = itertools.cycle(UNITS)
+    return ((timestamp, timestamp % 1000, next(units)) for timestamp in range(size))
+
+
+def run(size, **options):
+    start = time.perf_counter()
+    for _ in pipeline(feed(size), Pressure, PressureUnits.Bar, **options):
+        pass
+    return size / (time.perf_counter() - start)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    start = time.perf_counter()
+    for _ in feed(size):
+        pass
+    source_rate = size / (time.perf_counter() - start)
+
+    rows = [
+        ("source only", f"{source_rate / 1e6:.2f}"),
+        ("parse + validate + convert", f"{run(size) / 1e6:.2f}"),
+        ("parse + validate + convert + format", f"{run(size, formatted=True) / 1e6:.2f}"),
+    ]
+    print(f"Streaming {size} items (M items/s)")
+    print_table(["pipeline", "throughput"], rows)
+
+
+if __name__ == "__main__":
+    main()
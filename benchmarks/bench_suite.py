@@ -0,0 +1,187 @@
+"""
+The benchmarks suite of all the generated quantities, to evaluate performance changes and gate regressions.
+
+Every quantity of the package is discovered and measured per unit:
+construction, 'convert', cached property access and 'to_string',
+and per quantity: arithmetic and the import time of its module.
+The results can be saved as JSON and compared to a baseline JSON (e.g. of the previous package version),
+the comparison exits with status 1 when a case is slower than the allowed threshold.
+
+Run:
+    python benchmarks/bench_suite.py [--filter REGEX] [--json results.json]
+    python benchmarks/bench_suite.py --baseline baseline.json --threshold 1.25
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import unitsnet_py  # noqa: E402
+from utils import measure, print_table  # noqa: E402
+
+Case = Tuple[str, Callable[[], object]]
+
+
+def discover_quantities() -> List[type]:
+    """
+    Import all the generated quantities, in the definitions order.
+    """
+    return [
+        getattr(importlib.import_module(f"unitsnet_py.units.{module}"), name)
+        for name, module in unitsnet_py._quantity_modules.items()
+    ]
+
+
+def get_unit_properties(quantity: type) -> Dict[object, str]:
+    """
+    Map the quantity units to their property names (the 'from_' factories are generated in the units order).
+    """
+    attributes = vars(quantity)
+    names = [
+        name[len("from_"):]
+        for name in attributes
+        if name.startswith("from_") and isinstance(attributes.get(name[len("from_"):]), property)
+    ]
+    return dict(zip(quantity._units, names))
+
+
+def quantity_cases(quantity: type) -> Iterator[Case]:
+    name = quantity.__name__
+    base_unit = quantity._base_unit
+    measurement = quantity(0.5, base_unit)
+    properties = get_unit_properties(quantity)
+    for unit in quantity._units:
+        yield f"construct/{name}/{unit.name}", lambda unit=unit: quantity(0.5, unit)
+        yield f"convert/{name}/{unit.name}", lambda unit=unit: measurement.convert(unit)
+        yield f"to_string/{name}/{unit.name}", lambda unit=unit: measurement.to_string(unit)
+        property_name = properties.get(unit)
+        if property_name is not None:
+            getattr(measurement, property_name)
+            yield f"property/{name}/{unit.name}", lambda property_name=property_name: getattr(
+                measurement, property_name
+            )
+    other = quantity(0.25, base_unit)
+    if quantity._delta_quantity is None:
+        yield f"arithmetic/{name}/add", lambda: measurement + other
+    yield f"arithmetic/{name}/sub", lambda: measurement - other
+    yield f"arithmetic/{name}/scale", lambda: measurement * 2
+    yield f"arithmetic/{name}/compare", lambda: measurement < other
+
+
+# Imports the package, then each quantity module, in a fresh interpreter and prints their times (ns) as JSON.
+IMPORT_SCRIPT = """
+import json, sys, time
+timings = {}
+start = time.perf_counter_ns()
+import unitsnet_py
+timings["unitsnet_py"] = time.perf_counter_ns() - start
+for name, module in unitsnet_py._quantity_modules.items():
+    start = time.perf_counter_ns()
+    __import__(f"unitsnet_py.units.{module}")
+    timings[name] = time.perf_counter_ns() - start
+json.dump(timings, sys.stdout)
+"""
+
+
+def measure_imports(repeat: int) -> Dict[str, float]:
+    """
+    Measure the best import time of the package and of each quantity module (after the package), in nanoseconds.
+    """
+    best: Dict[str, float] = {}
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT], cwd=ROOT, capture_output=True, check=True, text=True
+        ).stdout
+        for name, value in json.loads(output).items():
+            best[name] = min(best.get(name, value), value)
+    return best
+
+
+def run(pattern: Optional[str], number: int, repeat: int) -> Dict[str, float]:
+    matches = re.compile(pattern).search if pattern else (lambda _: True)
+    results: Dict[str, float] = {}
+
+    names = ["import/unitsnet_py"] + [f"import/{name}" for name in unitsnet_py._quantity_modules]
+    if any(map(matches, names)):
+        for name, value in measure_imports(repeat).items():
+            name = f"import/{name}"
+            if matches(name):
+                results[name] = value
+
+    quantities = discover_quantities()
+    for quantity in quantities:
+        for name, case in quantity_cases(quantity):
+            if matches(name):
+                results[name] = measure(case, number, repeat)
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[Tuple[str, float, float]]:
+    """
+    Get the cases slower than 'threshold' times their baseline time.
+    """
+    return [
+        (name, baseline[name], value)
+        for name, value in results.items()
+        if name in baseline and value > baseline[name] * threshold
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", help="Run only the cases matching this regular expression")
+    parser.add_argument("--number", type=int, default=1000, help="Calls per timing (default 1000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timings per case, the best is kept (default 3)")
+    parser.add_argument("--json", help="Save the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare the results to this JSON file")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Allowed slowdown ratio (default 1.25)")
+    args = parser.parse_args()
+
+    started = time.time()
+    results = run(args.filter, args.number, args.repeat)
+    report = {
+        "machine": {"python": platform.python_version(), "platform": platform.platform()},
+        "timestamp": started,
+        "unit": "ns",
+        "number": args.number,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(report, file, indent=2)
+
+    groups: Dict[str, List[float]] = {}
+    for name, value in results.items():
+        groups.setdefault(name.split("/")[0], []).append(value)
+    print(f"{len(results)} cases in {time.time() - started:.1f}s")
+    print_table(
+        ["group", "cases", "min ns", "max ns"],
+        [(group, len(values), f"{min(values):.0f}", f"{max(values):.0f}") for group, values in groups.items()],
+    )
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} cases are slower than {args.threshold}x the baseline")
+            print_table(
+                ["case", "baseline ns", "ns", "ratio"],
+                [(name, f"{old:.0f}", f"{new:.0f}", f"{new / old:.2f}") for name, old, new in regressions],
+            )
+            sys.exit(1)
+        print(f"\nNo case is slower than {args.threshold}x the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Converting Fahrenheit readings to Celsius: per-instance conversion versus the collapsed affine conversion
+(scale and offset resolved once per units pair), in Python and over NumPy arrays.
+
+Run: python benchmarks/bench_temperature.py [size]
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unitsnet_py import Temperature, TemperatureUnits  # noqa: E402
+from utils import measure, print_table  # noqa: E402
+
+FAHRENHEIT = TemperatureUnits.DegreeFahrenheit
+CELSIUS = TemperatureUnits.DegreeCelsius
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    values = [random.uniform(-40, 120) for _ in range(size)]
+
+    cases = [
+        ("Temperature(value, F).degrees_celsius", lambda: [Temperature(value, FAHRENHEIT).degrees_celsius for value in values]),
+        ("Temperature.convert_many", lambda: Temperature.convert_many(values, FAHRENHEIT, CELSIUS)),
+    ]
+    try:
+        import numpy as np
+
+        from unitsnet_py.arrays import TemperatureArray
+    except ImportError:
+        print("NumPy is not installed, skipping the arrays cases")
+    else:
+        array = np.array(values)
+        out = np.empty_like(array)
+        cases += [
+            ("TemperatureArray(values, F).degrees_celsius", lambda: TemperatureArray(array, FAHRENHEIT).degrees_celsius),
+            ("TemperatureArray.convert_values", lambda: TemperatureArray.convert_values(array, FAHRENHEIT, CELSIUS)),
+            ("TemperatureArray.convert_values(out=)", lambda: TemperatureArray.convert_values(array, FAHRENHEIT, CELSIUS, out)),
+            ("(array - 32) * 5 / 9 (hand written)", lambda: (array - 32) * 5 / 9),
+        ]
+    rows = [(name, f"{measure(operation, 1, 3) / size:.2f}") for name, operation in cases]
+    print(f"Converting {size} temperatures from Fahrenheit to Celsius (ns/item)")
+    print_table(["operation", "ns/item"], rows)
+
+
+if __name__ == "__main__":
+    main()
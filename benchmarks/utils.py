@@ -0,0 +1,26 @@
+import timeit
+from typing import Callable, Iterable, List, Sequence
+
+
+def measure(func: Callable[[], object], number: int = 10000, repeat: int = 5) -> float:
+    """
+    Measure the best average call time of `func` in nanoseconds.
+    """
+    timer = timeit.Timer(func)
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e9
+
+
+def print_table(headers: Sequence[str], rows: Iterable[Sequence[object]]):
+    rows = [[str(cell) for cell in row] for row in rows]
+    widths = [len(header) for header in headers]
+    for row in rows:
+        widths = [max(width, len(cell)) for width, cell in zip(widths, row)]
+
+    lines: List[str] = [
+        "  ".join(header.ljust(width) for header, width in zip(headers, widths)),
+        "  ".join("-" * width for width in widths),
+    ]
+    for row in rows:
+        lines.append("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+    print("\n".join(lines))
@@ -5,7 +5,7 @@ this_directory = Path(__file__).parent
 long_description = (this_directory / "README.md").read_text()
 
 packages = \
-['unitsnet_py', 'unitsnet_py.units']
+['unitsnet_py', 'unitsnet_py.arrays', 'unitsnet_py.units']
 
 package_data = \
 {'': ['*']}
@@ -25,6 +25,7 @@ setup_kwargs = {
     'packages': packages,
     'package_data': package_data,
     'python_requires': '>=3.8,<4.0',
+    'extras_require': {'numpy': ['numpy>=1.20'], 'pandas': ['numpy>=1.20', 'pandas>=2.1; python_version >= "3.9"'], 'arrow': ['numpy>=1.20', 'pyarrow>=10']},
 }
 
 
@@ -0,0 +1,108 @@
+import unittest
+from unitsnet_py import Area, Length, LengthUnits, Mass, Ratio, Temperature, TemperatureDelta, TemperatureUnits
+from unitsnet_py import aggregate
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestUnitAggregate(unittest.TestCase):
+    lengths = [Length.from_meters(value) for value in [4, 1, 3, 2]]
+
+    def test_sum(self):
+        self.assertEqual(aggregate.sum(self.lengths), Length.from_meters(10))
+        self.assertEqual(aggregate.sum(iter(self.lengths)), Length.from_meters(10))
+        self.assertEqual(aggregate.sum(self.lengths, compensated=True), Length.from_meters(10))
+
+    def test_compensated_sum(self):
+        lengths = [Length.from_meters(value) for value in [1e16, 1.0, -1e16] * 10]
+        self.assertEqual(aggregate.sum(lengths).meters, 0)
+        self.assertEqual(aggregate.sum(lengths, compensated=True).meters, 10)
+
+    def test_mean_min_max(self):
+        self.assertEqual(aggregate.mean(self.lengths), Length.from_meters(2.5))
+        self.assertEqual(aggregate.min(self.lengths), Length.from_meters(1))
+        self.assertEqual(aggregate.max(self.lengths), Length.from_meters(4))
+
+    def test_single_pass(self):
+        for function in [aggregate.sum, aggregate.mean, aggregate.min, aggregate.max]:
+            with self.subTest(function=function.__name__):
+                self.assertEqual(function(length for length in self.lengths), function(self.lengths))
+        self.assertEqual(aggregate.mean(iter(self.lengths), compensated=True), Length.from_meters(2.5))
+
+    def test_variance(self):
+        variance = aggregate.variance(self.lengths)
+        self.assertIsInstance(variance, Area)
+        self.assertAlmostEqual(variance.square_meters, 1.25)
+        self.assertAlmostEqual(aggregate.variance(self.lengths, ddof=1).square_meters, 5 / 3)
+        self.assertAlmostEqual(aggregate.stdev(self.lengths).meters, 1.25 ** 0.5)
+        # No quantity of the squared dimensions.
+        self.assertAlmostEqual(aggregate.variance([Mass.from_kilograms(1), Mass.from_kilograms(3)]), 1)
+        ratios = [Ratio.from_decimal_fractions(1), Ratio.from_decimal_fractions(3)]
+        self.assertAlmostEqual(aggregate.variance(ratios), 1)
+
+    def test_temperatures(self):
+        temperatures = [Temperature.from_degrees_celsius(value) for value in [10, 20, 30, 40]]
+        with self.assertRaises(TypeError):
+            aggregate.sum(temperatures)
+        iterator = iter(temperatures)
+        with self.assertRaises(TypeError):
+            aggregate.sum(iterator, compensated=True)
+        # Only the first measurement is consumed to get the quantity.
+        self.assertEqual(list(iterator), temperatures[1:])
+        self.assertAlmostEqual(aggregate.mean(temperatures).degrees_celsius, 25)
+        self.assertAlmostEqual(aggregate.min(temperatures).degrees_celsius, 10)
+        stdev = aggregate.stdev(temperatures)
+        self.assertIsInstance(stdev, TemperatureDelta)
+        self.assertAlmostEqual(stdev.kelvins, 125 ** 0.5)
+        # No quantity of the squared TemperatureDelta dimensions, the variance is in K².
+        variance = aggregate.variance(temperatures)
+        self.assertIsInstance(variance, float)
+        self.assertAlmostEqual(variance, 125)
+        fahrenheit = [Temperature(value, TemperatureUnits.DegreeFahrenheit) for value in [50, 68, 86, 104]]
+        self.assertAlmostEqual(aggregate.variance(fahrenheit), 125)
+
+    def test_percentile(self):
+        self.assertEqual(aggregate.percentile(self.lengths, 0), Length.from_meters(1))
+        self.assertEqual(aggregate.percentile(self.lengths, 50), Length.from_meters(2.5))
+        self.assertEqual(aggregate.percentile(self.lengths, 100), Length.from_meters(4))
+        with self.assertRaises(ValueError):
+            aggregate.percentile(self.lengths, 101)
+
+    def test_invalid_measures(self):
+        with self.assertRaises(ValueError):
+            aggregate.sum([])
+        with self.assertRaises(TypeError):
+            aggregate.sum([Length.from_meters(1), Mass.from_kilograms(1)])
+        with self.assertRaises(TypeError):
+            aggregate.sum([1.0, 2.0])
+        for function in [aggregate.sum, aggregate.mean, aggregate.min, aggregate.max, aggregate.variance]:
+            with self.subTest(function=function.__name__):
+                with self.assertRaises(TypeError):
+                    function(iter([Length.from_meters(1), Length.from_meters(2), 3.0]))
+                with self.assertRaises(ValueError):
+                    function(iter([]))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_quantity_array(self):
+        from unitsnet_py.arrays import LengthArray
+
+        lengths = LengthArray([4, 1, 3, 2], LengthUnits.Meter)
+        for function in [aggregate.sum, aggregate.mean, aggregate.min, aggregate.max, aggregate.stdev]:
+            with self.subTest(function=function.__name__):
+                self.assertAlmostEqual(function(lengths).meters, function(self.lengths).meters)
+        self.assertAlmostEqual(aggregate.variance(lengths).square_meters, 1.25)
+        self.assertEqual(aggregate.percentile(lengths, 50), Length.from_meters(2.5))
+
+        from unitsnet_py.arrays import TemperatureArray
+
+        temperatures = TemperatureArray([10, 20, 30, 40], TemperatureUnits.DegreeCelsius)
+        with self.assertRaises(TypeError):
+            aggregate.sum(temperatures)
+        self.assertIsInstance(aggregate.stdev(temperatures), TemperatureDelta)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,21 @@
 import unittest
-from unitsnet_py import Length
+from decimal import Decimal
+from fractions import Fraction
+from unitsnet_py import (
+    Area,
+    Duration,
+    Energy,
+    Frequency,
+    Length,
+    Mass,
+    MassFlow,
+    Power,
+    Ratio,
+    Temperature,
+    TemperatureDelta,
+    Volume,
+    VolumeFlow,
+)
 
 
 class TestUnitArithmetics(unittest.TestCase):
@@ -16,11 +32,13 @@ class TestUnitArithmetics(unittest.TestCase):
 
     def test_multiply(self):
         result = self.length1 * self.length2
-        self.assertEqual(result.meters, 30)
+        self.assertIsInstance(result, Area)
+        self.assertEqual(result.square_meters, 30)
 
     def test_divide(self):
         result = self.length1 / self.length2
-        self.assertAlmostEqual(result.meters, 3.33333333333333, delta=0.000000001)
+        self.assertIsInstance(result, float)
+        self.assertAlmostEqual(result, 3.33333333333333, delta=0.000000001)
 
     def test_modulo(self):
         result = self.length1 % self.length2
@@ -31,5 +49,128 @@ class TestUnitArithmetics(unittest.TestCase):
         self.assertEqual(result.meters, 1000)
 
 
+class TestScalarArithmetics(unittest.TestCase):
+    length = Length.from_meters(10)
+
+    def test_multiply(self):
+        self.assertEqual((self.length * 2).meters, 20)
+        self.assertEqual((2.5 * self.length).meters, 25)
+        self.assertIsInstance(self.length * 2, Length)
+
+    def test_divide(self):
+        self.assertEqual((self.length / 4).meters, 2.5)
+        with self.assertRaises(TypeError):
+            2 / self.length
+
+    def test_fraction_and_decimal(self):
+        for scalar in [Fraction(1, 4), Decimal("0.25")]:
+            with self.subTest(scalar=scalar):
+                self.assertEqual(self.length * scalar, Length.from_meters(2.5))
+                self.assertEqual(scalar * self.length, Length.from_meters(2.5))
+                self.assertEqual(self.length / scalar, Length.from_meters(40))
+                self.assertIs(type((self.length * scalar).meters), float)
+        with self.assertRaises(ValueError):
+            self.length * Decimal("NaN")
+        with self.assertRaises(TypeError):
+            self.length * complex(1, 1)
+
+    def test_unary(self):
+        self.assertEqual((-self.length).meters, -10)
+        self.assertEqual(abs(-self.length), self.length)
+        self.assertEqual(+self.length, self.length)
+
+    def test_in_place(self):
+        length = self.length
+        length *= 3
+        length /= 2
+        length += self.length
+        length -= Length.from_meters(5)
+        self.assertEqual(length.meters, 20)
+        self.assertEqual(self.length.meters, 10)
+
+    def test_nan(self):
+        with self.assertRaises(ValueError):
+            self.length * float("nan")
+        with self.assertRaises(ValueError):
+            Length.from_meters(float("inf")) * 0
+
+
+class TestDimensionalArithmetics(unittest.TestCase):
+    def test_result_quantity(self):
+        self.assertEqual((Length.from_meters(2) * Area.from_square_meters(3)).cubic_meters, 6)
+        self.assertEqual((Energy.from_kilowatt_hours(1) / Duration.from_hours(1)).watts, 1000)
+        self.assertEqual((Power.from_watts(5) * Duration.from_seconds(2)).joules, 10)
+        self.assertEqual((Mass.from_kilograms(6) / Volume.from_cubic_meters(2)).kilograms_per_cubic_meter, 3)
+        self.assertIsInstance(Volume.from_cubic_meters(6) / Area.from_square_meters(2), Length)
+
+    def test_non_si_base_unit(self):
+        # The MassFlow base unit is g/s.
+        mass_flow = Mass.from_kilograms(2) / Duration.from_seconds(1)
+        self.assertIsInstance(mass_flow, MassFlow)
+        self.assertEqual(mass_flow.kilograms_per_second, 2)
+        self.assertEqual((mass_flow * Duration.from_minutes(1)).kilograms, 120)
+
+    def test_dimensionless_result(self):
+        self.assertEqual(Frequency.from_hertz(50) * Duration.from_seconds(2), 100)
+        self.assertEqual(Length.from_kilometers(1) / Length.from_meters(250), 4)
+
+    def test_no_dimensional_result(self):
+        with self.assertRaises(TypeError):
+            Length.from_meters(1) * Mass.from_kilograms(1)
+        with self.assertRaises(TypeError):
+            Length.from_meters(1) * Ratio.from_percent(50)
+        with self.assertRaises(TypeError):
+            VolumeFlow.from_cubic_meters_per_second(1) * VolumeFlow.from_cubic_meters_per_second(1)
+
+    def test_dimensions_index(self):
+        from unitsnet_py.dimensions import get_quantity, quantities_by_dimensions
+
+        for dimensions in quantities_by_dimensions:
+            with self.subTest(dimensions=dimensions):
+                self.assertEqual(get_quantity(dimensions)._dimensions, dimensions)
+        self.assertIs(get_quantity((2, 1, -2, 0, 0, 0, 0)), Energy)
+        self.assertIsNone(get_quantity((1, 1, 0, 0, 0, 0, 0)))
+
+    def test_dimensionless_quantity(self):
+        result = Ratio.from_decimal_fractions(0.5) * Ratio.from_decimal_fractions(0.5)
+        self.assertIsInstance(result, Ratio)
+        self.assertEqual(result.decimal_fractions, 0.25)
+
+
+class TestTemperatureArithmetics(unittest.TestCase):
+    freezing = Temperature.from_degrees_celsius(0)
+    boiling = Temperature.from_degrees_fahrenheit(212)
+
+    def test_subtract_temperatures(self):
+        result = self.boiling - self.freezing
+        self.assertIsInstance(result, TemperatureDelta)
+        self.assertAlmostEqual(result.degrees_celsius, 100)
+        self.assertAlmostEqual(result.degrees_fahrenheit, 180)
+
+    def test_add_delta(self):
+        delta = TemperatureDelta.from_degrees_fahrenheit(18)
+        for result in (self.freezing + delta, delta + self.freezing):
+            self.assertIsInstance(result, Temperature)
+            self.assertAlmostEqual(result.degrees_celsius, 10)
+        result = self.boiling - delta
+        self.assertIsInstance(result, Temperature)
+        self.assertAlmostEqual(result.degrees_fahrenheit, 194)
+
+    def test_in_place(self):
+        temperature = self.freezing
+        temperature += TemperatureDelta.from_kelvins(5)
+        self.assertAlmostEqual(temperature.degrees_celsius, 5)
+
+    def test_invalid_operations(self):
+        delta = TemperatureDelta.from_kelvins(1)
+        for operation in (
+            lambda: self.freezing + self.boiling,
+            lambda: delta - self.freezing,
+            lambda: self.freezing + Length.from_meters(1),
+        ):
+            with self.assertRaises(TypeError):
+                operation()
+
+
 if __name__ == "__main__":
     unittest.main()
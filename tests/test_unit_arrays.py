@@ -0,0 +1,129 @@
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+from unitsnet_py import Length, LengthUnits, Pressure, PressureUnits, Temperature, TemperatureDelta, TemperatureUnits
+
+try:
+    import numpy as np
+    from unitsnet_py.arrays import LengthArray, PressureArray, TemperatureArray, TemperatureDeltaArray
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestUnitArrays(unittest.TestCase):
+    def test_from_array_holds_base_values(self):
+        lengths = LengthArray.from_array([1, 2.5], LengthUnits.Kilometer)
+        np.testing.assert_array_equal(lengths.base_values, [1000, 2500])
+
+    def test_convert_matches_scalar_conversion(self):
+        values = [0.5, 1, 250, 1e5]
+        pressures = PressureArray.from_array(values, PressureUnits.Bar)
+        for unit in PressureUnits:
+            with self.subTest(unit=unit):
+                expected = [Pressure(value, PressureUnits.Bar).convert(unit) for value in values]
+                np.testing.assert_allclose(pressures.convert(unit), expected, rtol=1e-12)
+
+    def test_unit_properties(self):
+        lengths = LengthArray([1, 2])
+        np.testing.assert_array_equal(lengths.centimeters, [100, 200])
+        np.testing.assert_array_equal(lengths.convert(LengthUnits.Centimeter), lengths.centimeters)
+
+    def test_nan_values_raise(self):
+        with self.assertRaises(ValueError):
+            LengthArray([1, float("nan")])
+
+    def test_values_are_read_only(self):
+        lengths = LengthArray([1, 2])
+        with self.assertRaises(ValueError):
+            lengths.meters[0] = 5
+
+    def test_items(self):
+        lengths = LengthArray([1, 2, 3], LengthUnits.Kilometer)
+        self.assertEqual(len(lengths), 3)
+        self.assertEqual(lengths[1], Length.from_kilometers(2))
+        self.assertIsInstance(lengths[1:], LengthArray)
+        self.assertEqual(list(lengths), [Length.from_kilometers(v) for v in (1, 2, 3)])
+
+    def test_arithmetic(self):
+        lengths1 = LengthArray([10, 20])
+        lengths2 = LengthArray([3, 4])
+        np.testing.assert_array_equal((lengths1 + lengths2).meters, [13, 24])
+        np.testing.assert_array_equal((lengths1 - lengths2).meters, [7, 16])
+        np.testing.assert_array_equal((lengths1 * lengths2).square_meters, [30, 80])
+        np.testing.assert_array_equal(lengths1 / lengths2, [10 / 3, 5])
+        np.testing.assert_array_equal((lengths1 % lengths2).meters, [1, 0])
+        np.testing.assert_array_equal((lengths1 + Length.from_meters(1)).meters, [11, 21])
+        np.testing.assert_array_equal((Length.from_meters(1) + lengths1).meters, [11, 21])
+        np.testing.assert_array_equal((lengths1 * 2).meters, [20, 40])
+        np.testing.assert_array_equal((0.5 * lengths1).meters, [5, 10])
+        np.testing.assert_array_equal((lengths1 / 10).meters, [1, 2])
+        np.testing.assert_array_equal((lengths1 * Fraction(1, 2)).meters, [5, 10])
+        np.testing.assert_array_equal((Decimal("0.5") * lengths1).meters, [5, 10])
+        np.testing.assert_array_equal((lengths1 / Decimal("0.5")).meters, [20, 40])
+        np.testing.assert_array_equal(abs(-lengths1).meters, [10, 20])
+
+    def test_comparison(self):
+        lengths = LengthArray([1, 2, 3])
+        np.testing.assert_array_equal(lengths > Length.from_meters(2), [False, False, True])
+        np.testing.assert_array_equal(lengths == LengthArray([1, 0, 3]), [True, False, True])
+
+    def test_dimensional_arithmetic(self):
+        from unitsnet_py import Mass
+        from unitsnet_py.arrays import AreaArray, DurationArray, MassFlowArray
+
+        areas = LengthArray([1, 2]) * Length.from_meters(3)
+        self.assertIsInstance(areas, AreaArray)
+        np.testing.assert_array_equal(areas.square_meters, [3, 6])
+        mass_flows = Mass.from_kilograms(6) / DurationArray([1, 2])
+        self.assertIsInstance(mass_flows, MassFlowArray)
+        np.testing.assert_array_equal(mass_flows.kilograms_per_second, [6, 3])
+        with self.assertRaises(TypeError):
+            LengthArray([1]) * Mass.from_kilograms(1)
+
+    def test_different_quantities_raise_type_error(self):
+        with self.assertRaises(TypeError):
+            LengthArray([1]) + PressureArray([1])
+
+    def test_no_dimensional_result_raise_type_error(self):
+        from unitsnet_py import Duration
+        from unitsnet_py.arrays import DurationArray, VolumeFlowArray
+
+        with self.assertRaises(TypeError):
+            VolumeFlowArray([2]) * VolumeFlowArray([3])
+        with self.assertRaises(TypeError):
+            DurationArray([2]) * Duration.from_seconds(3)
+
+    def test_convert_values(self):
+        fahrenheits = np.array([-40, 32, 98.6, 212])
+        celsius = TemperatureArray.convert_values(fahrenheits, TemperatureUnits.DegreeFahrenheit, TemperatureUnits.DegreeCelsius)
+        np.testing.assert_allclose(celsius, [-40, 0, 37, 100], atol=1e-12)
+        for unit in TemperatureUnits:
+            with self.subTest(unit=unit):
+                expected = [Temperature(value, TemperatureUnits.DegreeFahrenheit).convert(unit) for value in fahrenheits]
+                converted = TemperatureArray.convert_values(fahrenheits, TemperatureUnits.DegreeFahrenheit, unit)
+                np.testing.assert_allclose(converted, expected, rtol=1e-12, atol=1e-9)
+
+    def test_convert_values_in_place(self):
+        values = np.array([32.0, 212.0])
+        result = TemperatureArray.convert_values(
+            values, TemperatureUnits.DegreeFahrenheit, TemperatureUnits.DegreeCelsius, out=values
+        )
+        self.assertIs(result, values)
+        np.testing.assert_allclose(values, [0, 100], atol=1e-12)
+
+    def test_temperature_arithmetic(self):
+        temperatures = TemperatureArray([20, 30], TemperatureUnits.DegreeCelsius)
+        differences = temperatures - TemperatureArray([10, 10], TemperatureUnits.DegreeCelsius)
+        self.assertIsInstance(differences, TemperatureDeltaArray)
+        np.testing.assert_allclose(differences.base_values, [10, 20])
+        for result in (temperatures + TemperatureDelta.from_kelvins(1), TemperatureDelta.from_kelvins(1) + temperatures):
+            self.assertIsInstance(result, TemperatureArray)
+            np.testing.assert_allclose(result.degrees_celsius, [21, 31])
+        self.assertIsInstance(Temperature.from_kelvins(300) - differences, TemperatureArray)
+        with self.assertRaises(TypeError):
+            temperatures + temperatures
+
+
+if __name__ == "__main__":
+    unittest.main()
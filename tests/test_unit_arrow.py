@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+from unitsnet_py import Pressure, PressureUnits, PowerRatio, PowerRatioUnits, Temperature, TemperatureUnits
+
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from unitsnet_py import arrow
+    from unitsnet_py.arrays import PressureArray, TemperatureArray
+except ImportError:
+    pa = None
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class TestUnitArrow(unittest.TestCase):
+    def setUp(self):
+        self.pressures = PressureArray([1.5, 2], PressureUnits.Bar)
+
+    def test_type(self):
+        quantity_type = arrow.QuantityType(Pressure, PressureUnits.Bar)
+        self.assertEqual(quantity_type.storage_type, pa.float64())
+        self.assertEqual(quantity_type, arrow.QuantityType(Pressure, PressureUnits.Bar))
+        self.assertNotEqual(quantity_type, arrow.QuantityType(Pressure))
+        self.assertEqual(len({quantity_type, arrow.QuantityType(Pressure, PressureUnits.Bar)}), 1)
+        self.assertIs(arrow.QuantityType(Pressure).unit, PressureUnits.Pascal)
+        with self.assertRaises(ValueError):
+            arrow.QuantityType(Pressure, TemperatureUnits.Kelvin)
+
+    def test_zero_copy(self):
+        values = arrow.to_arrow(self.pressures)
+        self.assertIs(values.type.unit, PressureUnits.Pascal)
+        self.assertTrue(np.shares_memory(values.storage.to_numpy(), self.pressures.base_values))
+        pressures = arrow.from_arrow(values)
+        self.assertIsInstance(pressures, PressureArray)
+        self.assertTrue(np.shares_memory(pressures.base_values, values.storage.to_numpy()))
+
+    def test_round_trip_in_unit(self):
+        values = arrow.to_arrow(self.pressures, PressureUnits.Bar)
+        self.assertEqual(values.storage.to_pylist(), [1.5, 2])
+        self.assertEqual(arrow.from_arrow(values).base_values.tolist(), [150000, 200000])
+        chunked = pa.chunked_array([values, values])
+        self.assertEqual(len(arrow.from_arrow(chunked)), 4)
+
+    def test_from_invalid_values(self):
+        with_nulls = pa.ExtensionArray.from_storage(arrow.QuantityType(Pressure), pa.array([1.0, None]))
+        with self.assertRaises(ValueError):
+            arrow.from_arrow(with_nulls)
+        with self.assertRaises(ValueError):
+            arrow.from_arrow(pa.array([1.0, 2.0]))
+
+    def test_convert(self):
+        temperatures = arrow.to_arrow(
+            TemperatureArray([0, 100], TemperatureUnits.DegreeCelsius), TemperatureUnits.DegreeCelsius
+        )
+        fahrenheit = arrow.convert(pa.chunked_array([temperatures]), TemperatureUnits.DegreeFahrenheit)
+        self.assertIsInstance(fahrenheit, pa.ChunkedArray)
+        self.assertEqual(fahrenheit.type, arrow.QuantityType(Temperature, TemperatureUnits.DegreeFahrenheit))
+        np.testing.assert_allclose(fahrenheit.chunk(0).storage.to_numpy(), [32, 212])
+
+        with_nulls = pa.ExtensionArray.from_storage(arrow.QuantityType(Pressure), pa.array([100000.0, None]))
+        self.assertEqual(arrow.convert(with_nulls, PressureUnits.Bar).storage.to_pylist(), [1, None])
+
+        # Logarithmic units are not affine.
+        decibels = pa.ExtensionArray.from_storage(arrow.QuantityType(PowerRatio), pa.array([10.0, None]))
+        milliwatts = arrow.convert(decibels, PowerRatioUnits.DecibelMilliwatt)
+        self.assertEqual(milliwatts.storage.to_pylist(), [40, None])
+
+    def test_parquet(self):
+        table = pa.table(
+            [arrow.to_arrow(self.pressures, PressureUnits.Bar)],
+            schema=pa.schema([arrow.quantity_field("pressure", Pressure, PressureUnits.Bar)]),
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "telemetry.parquet")
+            pq.write_table(table, path)
+            read = pq.read_table(path)
+        field = read.schema.field("pressure")
+        self.assertEqual(field.type, arrow.QuantityType(Pressure, PressureUnits.Bar))
+        self.assertEqual(field.metadata[arrow.UNIT_METADATA_KEY], b"Bar")
+        converted = arrow.convert_column(read, "pressure", PressureUnits.Kilopascal)
+        self.assertEqual(converted.schema.field("pressure").metadata[arrow.UNIT_METADATA_KEY], b"Kilopascal")
+        self.assertEqual(converted["pressure"].chunk(0).storage.to_pylist(), [150, 200])
+
+    def test_field_metadata_only(self):
+        # Read by a reader without the extension type, the field metadata still tags the column.
+        metadata = arrow.quantity_field("pressure", Pressure, PressureUnits.Bar).metadata
+        field = pa.field("pressure", pa.float64(), metadata=metadata)
+        table = pa.table([pa.array([1.5, 2.0])], schema=pa.schema([field]))
+        self.assertEqual(arrow.get_quantity_type(field), arrow.QuantityType(Pressure, PressureUnits.Bar))
+        self.assertIsNone(arrow.get_quantity_type(pa.field("other", pa.float64())))
+        converted = arrow.convert_column(table, "pressure", PressureUnits.Pascal)
+        self.assertEqual(converted["pressure"].chunk(0).storage.to_pylist(), [150000, 200000])
+        with self.assertRaises(ValueError):
+            arrow.convert_column(pa.table({"other": [1.0]}), "other", PressureUnits.Pascal)
+
+    def test_pandas(self):
+        try:
+            import pandas as pd
+        except ImportError:
+            self.skipTest("pandas is not installed")
+        from unitsnet_py.pandas import QuantityDtype
+
+        frame = pd.DataFrame({"pressure": pd.Series([1.5, np.nan], dtype="Quantity[Pressure, Bar]")})
+        table = pa.Table.from_pandas(frame)
+        self.assertEqual(table.schema.field("pressure").type, arrow.QuantityType(Pressure, PressureUnits.Bar))
+        self.assertEqual(table["pressure"].chunk(0).storage.to_pylist(), [1.5, None])
+        restored = table.to_pandas()
+        self.assertEqual(restored["pressure"].dtype, QuantityDtype(Pressure, PressureUnits.Bar))
+        self.assertEqual(restored["pressure"][0], Pressure.from_bars(1.5))
+        self.assertTrue(np.isnan(restored["pressure"][1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
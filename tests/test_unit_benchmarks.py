@@ -0,0 +1,34 @@
+import contextlib
+import importlib
+import io
+import os
+import sys
+import unittest
+import unitsnet_py
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks")
+
+
+class TestUnitBenchmarks(unittest.TestCase):
+    def setUp(self):
+        sys.path.insert(0, BENCHMARKS)
+
+    def tearDown(self):
+        sys.path.remove(BENCHMARKS)
+
+    def test_bench_memory(self):
+        bench_memory = importlib.import_module("bench_memory")
+        instances = bench_memory.INSTANCES
+        bench_memory.INSTANCES = 10
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                bench_memory.main()
+        finally:
+            bench_memory.INSTANCES = instances
+        self.assertIn("Length", output.getvalue())
+        self.assertIn(f"Mean bytes/instance over {len(unitsnet_py._quantity_modules)} quantities", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
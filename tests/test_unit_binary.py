@@ -0,0 +1,105 @@
+import json
+import unittest
+from array import array
+import unitsnet_py
+from unitsnet_py import Length, LengthUnits, Mass, MassUnits, Temperature, TemperatureUnits
+from unitsnet_py.binary import decode, decode_array, decode_batch, encode, encode_batch
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestUnitBinary(unittest.TestCase):
+    def test_round_trip(self):
+        for name in unitsnet_py._quantity_modules:
+            quantity = getattr(unitsnet_py, name)
+            for unit in quantity._units:
+                with self.subTest(quantity=name, unit=unit):
+                    data = quantity(0.5, unit).to_binary()
+                    self.assertEqual(len(data), 12)
+                    self.assertEqual(quantity.from_binary(data), quantity(0.5, unit))
+
+    def test_encode_in_unit(self):
+        temperature = Temperature.from_degrees_fahrenheit(-40)
+        data = temperature.to_binary(TemperatureUnits.DegreeFahrenheit)
+        self.assertAlmostEqual(decode(data).degrees_fahrenheit, -40)
+        self.assertAlmostEqual(decode(data).degrees_celsius, -40)
+
+    def test_decode_any_quantity(self):
+        self.assertEqual(decode(encode(Mass.from_grams(3))), Mass.from_grams(3))
+
+    def test_decode_invalid_data(self):
+        with self.assertRaises(ValueError):
+            Length.from_binary(b"\x00" * 11)
+        with self.assertRaises(ValueError):
+            Length.from_binary(Mass.from_grams(1).to_binary())
+        with self.assertRaises(ValueError):
+            decode(b"\xff\xff" + Length.from_meters(1).to_binary()[2:])
+
+    def test_pinned_ids(self):
+        # Encoded by a previous package version, the pinned ids keep it decodable.
+        self.assertEqual(decode(bytes.fromhex("350003000000000000000040")), Length.from_feet(2))
+        self.assertEqual(len(set(unitsnet_py._quantity_binary_ids.values())), len(unitsnet_py._quantity_binary_ids))
+        for name in unitsnet_py._quantity_modules:
+            quantity = getattr(unitsnet_py, name)
+            with self.subTest(quantity=name):
+                self.assertEqual(quantity._binary_id, unitsnet_py._quantity_binary_ids[name])
+                self.assertEqual(set(quantity._binary_unit_ids), set(quantity._units))
+                self.assertEqual(len(set(quantity._binary_unit_ids.values())), len(quantity._binary_unit_ids))
+
+    def test_encode_unit_of_other_quantity(self):
+        encode_batch([1], Mass, MassUnits.Gram)
+        with self.assertRaises(ValueError):
+            encode_batch([1], Length, MassUnits.Gram)
+        with self.assertRaises(ValueError):
+            Length.from_meters(1).to_binary(MassUnits.Gram)
+
+    def test_batch(self):
+        data = encode_batch([1, 2.5, -3], Length, LengthUnits.Foot)
+        self.assertEqual(len(data), 16 + 3 * 8)
+        batch = decode_batch(data)
+        self.assertIs(batch.quantity, Length)
+        self.assertIs(batch.unit, LengthUnits.Foot)
+        self.assertEqual(batch.values.tolist(), [1, 2.5, -3])
+        self.assertTrue(batch.values.readonly)
+
+    def test_batch_default_base_unit(self):
+        batch = decode_batch(encode_batch(array("d", [1, 2]), Length))
+        self.assertIs(batch.unit, LengthUnits.Meter)
+        self.assertEqual(batch.values.tolist(), [1, 2])
+
+    def test_decode_invalid_batch(self):
+        data = encode_batch([1, 2], Length)
+        for invalid in [b"", data[:-1], b"XXXX" + data[4:], data + b"\x00" * 8]:
+            with self.subTest(data=invalid):
+                with self.assertRaises(ValueError):
+                    decode_batch(invalid)
+
+    def test_smaller_than_json(self):
+        length = Length.from_meters(1234.5678)
+        text = json.dumps({"quantity": "Length", "value": length.meters, "unit": "Meter"}).encode()
+        self.assertLess(len(length.to_binary()), len(text))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_decode_array(self):
+        from unitsnet_py.arrays import LengthArray, MassArray
+
+        data = encode_batch(np.array([1.0, 2.0]), Length)
+        lengths = LengthArray.from_binary(data)
+        self.assertTrue(np.shares_memory(lengths.base_values, np.frombuffer(data, dtype=np.uint8)))
+        self.assertEqual(lengths.base_values.tolist(), [1, 2])
+
+        feet = decode_array(encode_batch([1, 2], Length, LengthUnits.Foot))
+        np.testing.assert_allclose(feet.feet, [1, 2])
+        self.assertEqual(LengthArray.from_binary(lengths.to_binary()).base_values.tolist(), [1, 2])
+
+        with self.assertRaises(ValueError):
+            MassArray.from_binary(data)
+        with self.assertRaises(ValueError):
+            decode_array(encode_batch([1, float("nan")], Length))
+
+
+if __name__ == "__main__":
+    unittest.main()
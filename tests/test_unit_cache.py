@@ -0,0 +1,74 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unitsnet_py import Length, LengthUnits, Pressure, cache, instrumentation
+from unitsnet_py.abstract_unit import AbstractMeasure
+
+
+class TestUnitCache(unittest.TestCase):
+    def tearDown(self):
+        instrumentation.disable()
+        cache.set_policy("instance")
+
+    def test_default_policy(self):
+        self.assertEqual(cache.get_policy(), "instance")
+        length = Length.from_feet(3)
+        self.assertFalse(hasattr(length, "_cache"))
+        self.assertAlmostEqual(length.meters, 0.9144)
+        self.assertEqual(list(length._cache), [LengthUnits.Meter])
+        self.assertIsNone(cache.shared_cache_info())
+
+    def test_policies(self):
+        for policy in cache.POLICIES:
+            with self.subTest(policy=policy):
+                cache.set_policy(policy)
+                self.assertEqual(cache.get_policy(), policy)
+                length = Length.from_feet(3)
+                self.assertAlmostEqual(length.meters, 0.9144)
+                self.assertAlmostEqual(length.meters, 0.9144)
+                self.assertAlmostEqual(length.inches, 36)
+                self.assertEqual(hasattr(length, "_cache"), policy == "instance")
+
+    def test_shared_cache(self):
+        cache.set_policy("shared", maxsize=2)
+        Length.from_feet(3).meters
+        Length.from_feet(3).meters
+        Pressure.from_bars(1).bars
+        Length.from_feet(1).meters
+        info = cache.shared_cache_info()
+        self.assertEqual((info.hits, info.misses, info.maxsize, info.currsize), (1, 3, 2, 2))
+        # Equal base values of distinct quantities are keyed by their distinct units.
+        self.assertEqual(Length.from_meters(100000).meters, 100000)
+        self.assertEqual(Pressure.from_pascals(100000).bars, 1)
+        cache.clear_shared_cache()
+        self.assertEqual(cache.shared_cache_info().currsize, 0)
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            cache.set_policy("global")
+        with self.assertRaises(ValueError):
+            cache.set_policy("shared", maxsize=0)
+        instrumentation.enable()
+        with self.assertRaises(RuntimeError):
+            cache.set_policy("none")
+
+    def test_instrumentation_restores_policy(self):
+        cache.set_policy("none")
+        instrumentation.enable()
+        instrumentation.disable()
+        self.assertIs(AbstractMeasure.__dict__["_cached_convert"], cache._uncached_convert)
+
+    def test_shared_instances_between_threads(self):
+        for policy in cache.POLICIES:
+            with self.subTest(policy=policy):
+                cache.set_policy(policy, maxsize=16)
+                lengths = [Length.from_feet(value) for value in range(100)]
+                expected = [value * 12 for value in range(100)]
+                with ThreadPoolExecutor(8) as executor:
+                    results = list(
+                        executor.map(lambda _: [round(length.inches, 9) for length in lengths], range(32))
+                    )
+                self.assertEqual(results, [expected] * 32)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -45,7 +45,6 @@ class TestComparingDifferentTypes(unittest.TestCase):
             operator.add,
             operator.sub,
             operator.mul,
-            operator.truediv,
             operator.pow,
         ]
         for op in operators:
@@ -1,8 +1,13 @@
 import unittest
+from array import array
 from unitsnet_py import (
     Angle,
     Length,
     LengthUnits,
+    Pressure,
+    PressureUnits,
+    Temperature,
+    TemperatureUnits,
 )
 
 
@@ -46,6 +51,101 @@ class TestUnitConversion(unittest.TestCase):
                     getattr(length, property_name),
                 )
 
+    def test_convert_round_trip_for_every_unit(self):
+        for unit in LengthUnits:
+            with self.subTest(unit=unit):
+                self.assertAlmostEqual(Length(1, unit).convert(unit), 1, delta=0.000000001)
+
+    def test_convert_with_invalid_unit_raises(self):
+        with self.assertRaises(KeyError):
+            Length.from_meters(1).convert("meter")
+
+
+class TestConvertValue(unittest.TestCase):
+    def test_matches_instance_conversion(self):
+        for quantity, units in [
+            (Length, LengthUnits),
+            (Temperature, TemperatureUnits),
+            (Pressure, PressureUnits),
+        ]:
+            for from_unit in units:
+                for to_unit in units:
+                    if from_unit == to_unit:
+                        # Covered by test_same_unit, some generated formulas are not exact inverses.
+                        continue
+                    with self.subTest(from_unit=from_unit, to_unit=to_unit):
+                        expected = quantity(1234.5, from_unit).convert(to_unit)
+                        self.assertAlmostEqual(
+                            quantity.convert_value(1234.5, from_unit, to_unit),
+                            expected,
+                            delta=abs(expected) * 1e-12,
+                        )
+
+    def test_affine_units(self):
+        self.assertAlmostEqual(
+            Temperature.convert_value(212, TemperatureUnits.DegreeFahrenheit, TemperatureUnits.DegreeCelsius),
+            100,
+            delta=0.000000001,
+        )
+
+    def test_same_unit(self):
+        self.assertEqual(Length.convert_value(3.3, LengthUnits.Foot, LengthUnits.Foot), 3.3)
+
+    def test_non_affine_units(self):
+        self.assertEqual(
+            Pressure.convert_value(1000, PressureUnits.MeterOfElevation, PressureUnits.Bar),
+            Pressure(1000, PressureUnits.MeterOfElevation).bars,
+        )
+
+    def test_units_of_other_quantity_raise(self):
+        with self.assertRaises(KeyError):
+            Length.convert_value(1, LengthUnits.Foot, TemperatureUnits.Kelvin)
+
+    def test_units_of_other_quantity_raise_after_their_conversion(self):
+        self.assertEqual(
+            Temperature.convert_value(0, TemperatureUnits.DegreeCelsius, TemperatureUnits.DegreeFahrenheit),
+            32,
+        )
+        with self.assertRaises(KeyError):
+            Length.convert_value(0, TemperatureUnits.DegreeCelsius, TemperatureUnits.DegreeFahrenheit)
+        with self.assertRaises(KeyError):
+            Length.convert_many([0], TemperatureUnits.DegreeCelsius, TemperatureUnits.DegreeFahrenheit)
+
+    def test_collapsed_factors_are_rounded_once(self):
+        self.assertEqual(Length.convert_value(1, LengthUnits.Foot, LengthUnits.Inch), 12)
+        self.assertEqual(
+            Temperature.convert_value(32, TemperatureUnits.DegreeFahrenheit, TemperatureUnits.DegreeCelsius),
+            0,
+        )
+
+
+class TestConvertMany(unittest.TestCase):
+    def test_convert_many(self):
+        values = [-40, 32, 98.6, 212]
+        self.assertEqual(
+            Temperature.convert_many(values, TemperatureUnits.DegreeFahrenheit, TemperatureUnits.DegreeCelsius),
+            [
+                Temperature.convert_value(value, TemperatureUnits.DegreeFahrenheit, TemperatureUnits.DegreeCelsius)
+                for value in values
+            ],
+        )
+
+    def test_convert_many_accepts_iterables(self):
+        values = (value for value in [1, 2])
+        self.assertEqual(Length.convert_many(values, LengthUnits.Foot, LengthUnits.Inch), [12, 24])
+
+    def test_convert_many_non_affine_units(self):
+        self.assertEqual(
+            Pressure.convert_many([0, 1000], PressureUnits.MeterOfElevation, PressureUnits.Bar),
+            [Pressure(value, PressureUnits.MeterOfElevation).bars for value in [0, 1000]],
+        )
+
+    def test_convert_array(self):
+        result = Length.convert_array(array("d", [1, 2]), LengthUnits.Foot, LengthUnits.Inch)
+        self.assertIsInstance(result, array)
+        self.assertEqual(result.typecode, "d")
+        self.assertEqual(list(result), [12, 24])
+
 
 if __name__ == "__main__":
     unittest.main()
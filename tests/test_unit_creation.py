@@ -1,5 +1,5 @@
 import unittest
-from unitsnet_py import Angle, AngleUnits
+from unitsnet_py import Angle, AngleUnits, VolumeFlow
 
 
 class TestUnitCreation(unittest.TestCase):
@@ -8,6 +8,18 @@ class TestUnitCreation(unittest.TestCase):
         angle_from_driven = Angle.from_degrees(180)
         self.assertEqual(angle_ctor_driven.base_value, angle_from_driven.base_value)
 
+    def test_compact_instance_layout(self):
+        flow = VolumeFlow.from_cubic_meters_per_second(1)
+        self.assertFalse(hasattr(flow, "__dict__"))
+        with self.assertRaises(AttributeError):
+            flow.unknown_attribute = 1
+
+    def test_cache_allocated_lazily(self):
+        angle = Angle.from_degrees(180)
+        self.assertFalse(hasattr(angle, "_cache"))
+        self.assertEqual(angle.radians, angle.radians)
+        self.assertEqual(list(angle._cache), [AngleUnits.Radian])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,98 @@
+import json
+import unittest
+import unitsnet_py
+from unitsnet_py import Length, LengthUnits, Mass, Temperature, TemperatureUnits
+from unitsnet_py.dto import dumps_many, loads_many
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestUnitDto(unittest.TestCase):
+    def test_round_trip(self):
+        for name in unitsnet_py._quantity_modules:
+            quantity = getattr(unitsnet_py, name)
+            measure = quantity(0.5, quantity._base_unit)
+            with self.subTest(quantity=name):
+                self.assertEqual(quantity.from_dto(measure.to_dto()), measure)
+                self.assertEqual(quantity.from_json(measure.to_json()), measure)
+
+    def test_to_dto(self):
+        length = Length.from_kilometers(1.5)
+        self.assertEqual(length.to_dto(), {"value": 1500, "unit": "Meter"})
+        self.assertEqual(length.to_dto(LengthUnits.Kilometer), {"value": 1.5, "unit": "Kilometer"})
+        self.assertEqual(json.loads(length.to_json(LengthUnits.Kilometer)), {"value": 1.5, "unit": "Kilometer"})
+
+    def test_units_net_payload(self):
+        # The DTO JSON of Units.NET and unitsnet-js, the unit being the units enum name.
+        self.assertEqual(Length.from_meters(1.5).to_json(), '{"value": 1.5, "unit": "Meter"}')
+        self.assertEqual(
+            Temperature.from_degrees_celsius(21.5).to_json(TemperatureUnits.DegreeCelsius),
+            '{"value": 21.5, "unit": "DegreeCelsius"}',
+        )
+        self.assertEqual(
+            dumps_many([Length.from_meters(1.5), Length.from_meters(2)]),
+            '[{"value": 1.5, "unit": "Meter"}, {"value": 2, "unit": "Meter"}]',
+        )
+        self.assertEqual(Length.from_json('{"value": 1.5, "unit": "Meter"}'), Length.from_meters(1.5))
+
+    def test_from_dto(self):
+        self.assertEqual(Length.from_dto({"value": 1.5, "unit": "kilometer"}), Length.from_kilometers(1.5))
+        self.assertEqual(Length.from_dto({"value": 1.5, "unit": "Kilometer"}), Length.from_kilometers(1.5))
+        temperature = Temperature.from_json('{"value": 32, "unit": "degree_fahrenheit"}')
+        self.assertAlmostEqual(temperature.degrees_celsius, 0)
+
+    def test_from_invalid_dto(self):
+        for dto in [
+            {"value": 1},
+            {"unit": "meter"},
+            {"value": 1, "unit": "cubit"},
+            {"value": 1, "unit": "gram"},
+            {"value": None, "unit": "meter"},
+            {"value": "1", "unit": "meter"},
+            [],
+        ]:
+            with self.subTest(dto=dto):
+                with self.assertRaises(ValueError):
+                    Length.from_dto(dto)
+        with self.assertRaises(ValueError):
+            Length.from_json('{"value": NaN, "unit": "meter"}')
+
+    def test_many(self):
+        lengths = [Length.from_meters(value) for value in range(100)]
+        self.assertEqual(loads_many(dumps_many(lengths), Length), lengths)
+        feet = loads_many(dumps_many(lengths, LengthUnits.Foot), Length)
+        for length, foot in zip(lengths, feet):
+            self.assertAlmostEqual(length.meters, foot.meters)
+
+    def test_dumps_many_matches_json(self):
+        lengths = [Length.from_meters(1), Length.from_meters(0.1), Length.from_meters(1e300), Length.from_meters(-0.0)]
+        self.assertEqual(
+            dumps_many(lengths), json.dumps([{"value": length._value, "unit": "Meter"} for length in lengths])
+        )
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_dumps_many_numpy_values(self):
+        lengths = [Length.from_meters(np.float64(1.5)), Length.from_meters(np.float32(2))]
+        self.assertEqual(
+            json.loads(dumps_many(lengths)), [{"value": 1.5, "unit": "Meter"}, {"value": 2, "unit": "Meter"}]
+        )
+
+    def test_loads_many_mixed_units(self):
+        text = '[{"value": 1, "unit": "kilometer"}, {"value": 2, "unit": "Meter"}, {"value": 3, "unit": "meter"}]'
+        self.assertEqual(
+            loads_many(text, Length), [Length.from_kilometers(1), Length.from_meters(2), Length.from_meters(3)]
+        )
+
+    def test_loads_many_invalid(self):
+        for text in ['{"value": 1, "unit": "meter"}', '[{"value": 1, "unit": "kilogram"}]', "[1]"]:
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    loads_many(text, Length)
+        self.assertEqual(len(loads_many('[{"value": 1, "unit": "kilogram"}]', Mass)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import importlib
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+
+import unitsnet_py
+from unitsnet_py import Angle, AngleUnits, Length, LengthUnits, Temperature, TemperatureUnits, Volume, VolumeUnits
+
+
+class TestUnitExact(unittest.TestCase):
+    def test_exact_factors(self):
+        self.assertEqual(Length.convert_exact(1, LengthUnits.UsSurveyFoot, LengthUnits.Meter), Fraction(1200, 3937))
+        self.assertEqual(Length.convert_exact(72, LengthUnits.PrinterPoint, LengthUnits.Inch), Fraction(7200, 7227))
+        self.assertEqual(
+            Temperature.convert_exact(Fraction(212), TemperatureUnits.DegreeFahrenheit, TemperatureUnits.DegreeCelsius),
+            100,
+        )
+
+    def test_decimal_values(self):
+        result = Volume.convert_exact(Decimal("1000"), VolumeUnits.UsGallon, VolumeUnits.Liter)
+        self.assertIsInstance(result, Decimal)
+        self.assertEqual(result, Decimal("3785.411784"))
+
+    def test_from_exact(self):
+        length = Length.from_exact(Decimal("0.1"), LengthUnits.Foot)
+        self.assertEqual(length.to_exact(LengthUnits.Foot), Fraction(1, 10))
+        self.assertEqual(length.to_exact(), Fraction(381, 12500))
+        self.assertEqual(length.base_value, 0.03048)
+        self.assertEqual(length.to_json(), '{"value": 0.03048, "unit": "Meter"}')
+
+    def test_to_exact_of_float_instance(self):
+        self.assertEqual(Length.from_meters(0.5).to_exact(LengthUnits.Foot), Fraction(625, 381))
+
+    def test_round_trip_identity(self):
+        value = Fraction(123456789, 1000)
+        for name, module in unitsnet_py._quantity_modules.items():
+            quantity = getattr(importlib.import_module(f"unitsnet_py.units.{module}"), name)
+            for unit in quantity._affine_to_base:
+                with self.subTest(unit=unit):
+                    base = quantity.convert_exact(value, unit, quantity._base_unit)
+                    self.assertEqual(quantity.convert_exact(base, quantity._base_unit, unit), value)
+                    self.assertEqual(quantity.from_exact(value, unit).to_exact(unit), value)
+
+    def test_non_linear_unit_raises(self):
+        with self.assertRaises(ValueError):
+            Angle.convert_exact(1, AngleUnits.Tilt, AngleUnits.Degree)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,242 @@
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+GENERATOR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "units_generator")
+sys.path.insert(0, GENERATOR)
+
+from common.binary_ids import (  # noqa: E402
+    DEFAULT_BINARY_IDS,
+    MAX_BINARY_ID,
+    assign_binary_ids,
+    load_binary_ids,
+    save_binary_ids,
+)
+from common.definitions_cache import (  # noqa: E402
+    load_manifest,
+    read_cached_definition,
+    save_manifest,
+    sha256_text,
+    write_cached_definition,
+)
+from common.formula_analysis import get_affine_coefficients  # noqa: E402
+from common.incremental import (  # noqa: E402
+    get_definition_hash,
+    load_generation_manifest,
+    needs_render,
+    save_generation_manifest,
+)
+
+try:
+    # Imports the 'requests' HTTP client of the online runs.
+    import common.fetch_units_definitions as fetch
+except ImportError:
+    fetch = None
+
+LENGTH = json.dumps({"Name": "Length", "Units": [{"SingularName": "Meter", "PluralName": "Meters"}]})
+MASS = json.dumps({"Name": "Mass", "Units": [{"SingularName": "Gram", "PluralName": "Grams", "ObsoleteText": "x"}]})
+
+
+class TestUnitDefinitionsCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_dir = self.directory.name
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def fill_cache(self):
+        files = {
+            "Length.json": write_cached_definition(self.cache_dir, "Length.json", LENGTH, "sha-length"),
+            "Mass.json": write_cached_definition(self.cache_dir, "Mass.json", MASS, "sha-mass"),
+        }
+        save_manifest(self.cache_dir, {"source": "angularsen/UnitsNet", "files": files})
+
+    def get_definitions(self, listing=None, texts=None, **kwargs):
+        # Runs get_definitions with the CDN requests answered by 'listing' and 'texts', quietly.
+        texts = texts or {}
+        get_text = mock.Mock(side_effect=lambda url: texts.get(url.rsplit("/", 1)[1]))
+        with mock.patch.object(fetch, "get_json_from_cdn", return_value=listing), mock.patch.object(
+            fetch, "get_text_from_cdn", get_text
+        ), contextlib.redirect_stdout(io.StringIO()):
+            definitions = fetch.get_definitions("angularsen/UnitsNet", cache_dir=self.cache_dir, **kwargs)
+        return definitions, get_text
+
+    def test_write_and_read(self):
+        entry = write_cached_definition(self.cache_dir, "Length.json", LENGTH, "sha-length")
+        self.assertEqual(entry, {"sha256": sha256_text(LENGTH), "git_sha": "sha-length"})
+        self.assertEqual(read_cached_definition(self.cache_dir, "Length.json", entry), LENGTH)
+        self.assertIsNone(read_cached_definition(self.cache_dir, "Mass.json", entry))
+
+    def test_manifest(self):
+        self.assertEqual(load_manifest(self.cache_dir), {"source": None, "files": {}})
+        self.fill_cache()
+        self.assertEqual(sorted(load_manifest(self.cache_dir)["files"]), ["Length.json", "Mass.json"])
+
+    def test_checksum_mismatch(self):
+        entry = write_cached_definition(self.cache_dir, "Length.json", LENGTH, "sha-length")
+        with open(os.path.join(self.cache_dir, "Length.json"), "a", encoding="utf-8") as f:
+            f.write(" ")
+        with self.assertRaisesRegex(ValueError, "does not match its manifest sha256"):
+            read_cached_definition(self.cache_dir, "Length.json", entry)
+
+    @unittest.skipIf(fetch is None, "requests is not installed")
+    def test_offline_hit(self):
+        self.fill_cache()
+        definitions, get_text = self.get_definitions(offline=True)
+        self.assertEqual([definition["Name"] for definition in definitions], ["Length", "Mass"])
+        self.assertEqual([definition["Units"][0]["Deprecated"] for definition in definitions], [False, True])
+        get_text.assert_not_called()
+
+    @unittest.skipIf(fetch is None, "requests is not installed")
+    def test_offline_miss(self):
+        with self.assertRaisesRegex(FileNotFoundError, "No cached units definitions"):
+            self.get_definitions(offline=True)
+        self.fill_cache()
+        os.remove(os.path.join(self.cache_dir, "Mass.json"))
+        with self.assertRaisesRegex(FileNotFoundError, "Mass.json is missing"):
+            self.get_definitions(offline=True)
+
+    @unittest.skipIf(fetch is None, "requests is not installed")
+    def test_offline_checksum_mismatch(self):
+        self.fill_cache()
+        with open(os.path.join(self.cache_dir, "Mass.json"), "w", encoding="utf-8") as f:
+            f.write(LENGTH)
+        with self.assertRaisesRegex(ValueError, "Mass.json does not match"):
+            self.get_definitions(offline=True)
+
+    @unittest.skipIf(fetch is None, "requests is not installed")
+    def test_online_downloads_changed_files_only(self):
+        self.fill_cache()
+        mass = MASS.replace('"x"', '"y"')
+        listing = [{"name": "Length.json", "sha": "sha-length"}, {"name": "Mass.json", "sha": "sha-mass-2"}]
+        definitions, get_text = self.get_definitions(listing, {"Mass.json": mass})
+        self.assertEqual(len(definitions), 2)
+        self.assertEqual([call.args[0].rsplit("/", 1)[1] for call in get_text.call_args_list], ["Mass.json"])
+        manifest = load_manifest(self.cache_dir)
+        self.assertEqual(manifest["files"]["Mass.json"], {"sha256": sha256_text(mass), "git_sha": "sha-mass-2"})
+        self.assertEqual(manifest["files"]["Length.json"]["git_sha"], "sha-length")
+
+    @unittest.skipIf(fetch is None, "requests is not installed")
+    def test_online_downloads_corrupted_and_refreshed_files(self):
+        self.fill_cache()
+        with open(os.path.join(self.cache_dir, "Mass.json"), "w", encoding="utf-8") as f:
+            f.write(LENGTH)
+        listing = [{"name": "Length.json", "sha": "sha-length"}, {"name": "Mass.json", "sha": "sha-mass"}]
+        texts = {"Length.json": LENGTH, "Mass.json": MASS}
+        _, get_text = self.get_definitions(listing, texts)
+        self.assertEqual(get_text.call_count, 1)
+        entry = load_manifest(self.cache_dir)["files"]["Mass.json"]
+        self.assertEqual(read_cached_definition(self.cache_dir, "Mass.json", entry), MASS)
+        _, get_text = self.get_definitions(listing, texts, refresh=True)
+        self.assertEqual(get_text.call_count, 2)
+
+    @unittest.skipIf(fetch is None, "requests is not installed")
+    def test_online_unreachable(self):
+        with self.assertRaisesRegex(ConnectionError, "use --offline"):
+            self.get_definitions(None)
+        with self.assertRaisesRegex(ConnectionError, "Length.json"):
+            self.get_definitions([{"name": "Length.json", "sha": "sha-length"}])
+
+
+class TestUnitIncremental(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.directory.name, "length.py")
+        with open(self.output, "w", encoding="utf-8"):
+            pass
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_definition_hash(self):
+        self.assertEqual(get_definition_hash({"a": 1, "b": [2]}), get_definition_hash({"b": [2], "a": 1}))
+        self.assertNotEqual(get_definition_hash({"a": 1}), get_definition_hash({"a": 2}))
+
+    def test_needs_render(self):
+        generated = {"Length": "hash"}
+        self.assertFalse(needs_render("Length", "hash", generated, [self.output]))
+        self.assertTrue(needs_render("Length", "changed", generated, [self.output]))
+        self.assertTrue(needs_render("Mass", "hash", generated, [self.output]))
+        missing = os.path.join(self.directory.name, "missing.py")
+        self.assertTrue(needs_render("Length", "hash", generated, [self.output, missing]))
+
+    def test_generation_manifest(self):
+        path = os.path.join(self.directory.name, "manifest.json")
+        self.assertEqual(load_generation_manifest(path, "fingerprint"), {})
+        save_generation_manifest(path, "fingerprint", {"Length": "hash"})
+        self.assertEqual(load_generation_manifest(path, "fingerprint"), {"Length": "hash"})
+        # A changed generator regenerates all the quantities.
+        self.assertEqual(load_generation_manifest(path, "other"), {})
+
+
+class TestUnitFormulaAnalysis(unittest.TestCase):
+    def test_affine(self):
+        for formula, coefficients in [
+            ("value", ("1", "0")),
+            ("value * 1e3", ("1000", "0")),
+            ("value * 1e-3", ("1/1000", "0")),
+            ("value / 0.3048", ("1250/381", "0")),
+            ("(value + 459.67) * 5 / 9", ("5/9", "45967/180")),
+            ("value - 273.15", ("1", "-5463/20")),
+            ("math.pow(10, 3) * value", ("1000", "0")),
+            ("value * 180 / math.pi", (repr(180 / 3.141592653589793), "0")),
+        ]:
+            with self.subTest(formula=formula):
+                self.assertEqual(get_affine_coefficients(formula), coefficients)
+
+    def test_not_affine(self):
+        for formula in ["10 * math.log10(value)", "value * value", "math.pow(10, value / 10)", "1 / value"]:
+            with self.subTest(formula=formula):
+                self.assertIsNone(get_affine_coefficients(formula))
+
+
+class TestUnitBinaryIds(unittest.TestCase):
+    def test_assign(self):
+        binary_ids = {}
+        self.assertTrue(assign_binary_ids(binary_ids, {"Length": ["Meter", "Foot"], "Mass": ["Gram"]}))
+        self.assertEqual(
+            binary_ids,
+            {"Length": {"id": 0, "units": {"Meter": 0, "Foot": 1}}, "Mass": {"id": 1, "units": {"Gram": 0}}},
+        )
+
+    def test_ids_are_stable(self):
+        binary_ids = {}
+        assign_binary_ids(binary_ids, {"Length": ["Meter", "Foot", "Inch"], "Mass": ["Gram"]})
+        # Reordered and removed quantities and units keep their ids, the removed ids are not reused.
+        self.assertFalse(assign_binary_ids(binary_ids, {"Mass": ["Gram"], "Length": ["Inch", "Meter"]}))
+        self.assertTrue(assign_binary_ids(binary_ids, {"Length": ["Meter", "Mile"], "Speed": ["MeterPerSecond"]}))
+        self.assertEqual(binary_ids["Length"]["units"], {"Meter": 0, "Foot": 1, "Inch": 2, "Mile": 3})
+        self.assertEqual(binary_ids["Speed"]["id"], 2)
+
+    def test_exhausted_ids(self):
+        binary_ids = {"Length": {"id": 0, "units": {"Meter": MAX_BINARY_ID}}}
+        with self.assertRaises(ValueError):
+            assign_binary_ids(binary_ids, {"Length": ["Foot"]})
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "binary_ids.json")
+            self.assertEqual(load_binary_ids(path), {})
+            binary_ids = {"Length": {"id": 0, "units": {"Meter": 0}}}
+            save_binary_ids(path, binary_ids)
+            self.assertEqual(load_binary_ids(path), binary_ids)
+
+    def test_committed_ids_are_unique(self):
+        binary_ids = load_binary_ids(DEFAULT_BINARY_IDS)
+        quantity_ids = [entry["id"] for entry in binary_ids.values()]
+        self.assertEqual(len(set(quantity_ids)), len(quantity_ids))
+        for name, entry in binary_ids.items():
+            with self.subTest(quantity=name):
+                unit_ids = list(entry["units"].values())
+                self.assertEqual(len(set(unit_ids)), len(unit_ids))
+                self.assertTrue(all(0 <= unit_id <= MAX_BINARY_ID for unit_id in unit_ids))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import functools
+import unittest
+from unitsnet_py import Length, Mass
+
+
+class TestUnitHashing(unittest.TestCase):
+    def test_equal_measures_have_equal_hash(self):
+        self.assertEqual(hash(Length.from_meters(10)), hash(Length.from_decimeters(100)))
+
+    def test_set_members(self):
+        readings = {Length.from_meters(1), Length.from_centimeters(100), Length.from_meters(2)}
+        self.assertEqual(len(readings), 2)
+        self.assertIn(Length.from_millimeters(2000), readings)
+
+    def test_dict_keys(self):
+        labels = {Length.from_meters(1): "short", Mass.from_kilograms(1): "light"}
+        self.assertEqual(labels[Length.from_centimeters(100)], "short")
+        self.assertEqual(labels[Mass.from_grams(1000)], "light")
+
+    def test_lru_cache_hits(self):
+        @functools.lru_cache(maxsize=None)
+        def to_feet(length: Length) -> float:
+            return length.feet
+
+        to_feet(Length.from_meters(1))
+        to_feet(Length.from_centimeters(100))
+        to_feet(Length.from_meters(2))
+
+        info = to_feet.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)
+
+
+class TestUnitImmutability(unittest.TestCase):
+    def test_unit_properties_are_read_only(self):
+        length = Length.from_meters(1)
+        with self.assertRaises(AttributeError):
+            length.meters = 2
+        with self.assertRaises(AttributeError):
+            length.base_value = 2
+        self.assertEqual(length.meters, 1)
+
+    def test_arithmetic_returns_new_objects(self):
+        length1 = Length.from_meters(10)
+        length2 = Length.from_meters(3)
+        result = length1
+        result += length2
+        self.assertIsNot(result, length1)
+        self.assertEqual(length1.meters, 10)
+        self.assertEqual(result.meters, 13)
+        for result in [length1 + length2, length1 - length2, length1 % length2]:
+            self.assertIsNot(result, length1)
+            self.assertIsNot(result, length2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import unitsnet_py
+
+# Regression threshold for the cumulative 'import unitsnet_py' time reported by 'python -X importtime'.
+# Importing all quantity modules eagerly takes ~400ms, the lazy package takes ~5ms.
+IMPORT_TIME_THRESHOLD_US = 50_000
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=PACKAGE_ROOT,
+    )
+
+
+class TestUnitImport(unittest.TestCase):
+    def test_import_time(self):
+        result = run_python("import unitsnet_py", "-X", "importtime")
+        cumulative_us = None
+        for line in result.stderr.splitlines():
+            # Line format: "import time: <self us> | <cumulative us> | <module>"
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative, module = line.split("|")
+            if module.strip() == "unitsnet_py":
+                cumulative_us = int(cumulative)
+        self.assertIsNotNone(cumulative_us)
+        self.assertLess(cumulative_us, IMPORT_TIME_THRESHOLD_US)
+
+    def test_quantity_modules_loaded_on_demand(self):
+        code = (
+            "import sys\n"
+            "import unitsnet_py\n"
+            "print(sum(m.startswith('unitsnet_py.units.') for m in sys.modules))\n"
+            "from unitsnet_py import Length, LengthUnits, Temperature\n"
+            "print(sorted(m for m in sys.modules if m.startswith('unitsnet_py.units.')))\n"
+        )
+        loaded_before, loaded_after = run_python(code).stdout.splitlines()
+        self.assertEqual(loaded_before, "0")
+        self.assertEqual(
+            loaded_after,
+            str(["unitsnet_py.units.length", "unitsnet_py.units.temperature"]),
+        )
+
+    def test_lazy_attributes(self):
+        from unitsnet_py.units.length import Length, LengthUnits
+
+        self.assertIs(unitsnet_py.Length, Length)
+        self.assertIs(unitsnet_py.LengthUnits, LengthUnits)
+        self.assertIn("Pressure", dir(unitsnet_py))
+        with self.assertRaises(AttributeError):
+            unitsnet_py.NotAQuantity
+        with self.assertRaises(ImportError):
+            from unitsnet_py import NotAQuantityUnits  # noqa: F401
+
+    def test_all_exports_resolve(self):
+        for name in unitsnet_py.__all__:
+            with self.subTest(name=name):
+                self.assertTrue(hasattr(unitsnet_py, name))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import unitsnet_py
+from unitsnet_py import Length, LengthUnits, Pressure, PressureUnits, instrumentation
+from unitsnet_py.abstract_unit import AbstractMeasure
+
+
+class TestUnitInstrumentation(unittest.TestCase):
+    def setUp(self):
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled_by_default(self):
+        self.assertFalse(instrumentation.is_enabled())
+        Length.from_feet(3).meters
+        self.assertEqual(unitsnet_py.stats().conversions, {})
+
+    def test_counters(self):
+        instrumentation.enable()
+        length = Length.from_feet(3)
+        length.meters
+        length.meters
+        length.convert(LengthUnits.Inch)
+        Length.convert_many([1, 2, 3], LengthUnits.Foot, LengthUnits.Meter)
+        stats = unitsnet_py.stats()
+        self.assertEqual(stats.constructions, {"Length": 1})
+        self.assertEqual(stats.conversions[("Length", "Foot", "Meter")], 4)
+        self.assertEqual(stats.conversions[("Length", "Meter", "Inch")], 1)
+        self.assertEqual(stats.cache_hits, {("Length", "Meter"): 1})
+        self.assertEqual(stats.cache_misses, {("Length", "Meter"): 1})
+        self.assertEqual(stats.hottest(1), [(("Length", "Foot", "Meter"), 4)])
+        self.assertGreater(stats.time_ns, 0)
+
+    def test_callback(self):
+        events = []
+        instrumentation.enable(lambda event, quantity, from_unit, to_unit, count, elapsed: events.append(
+            (event, quantity, from_unit, to_unit, count)
+        ))
+        Pressure.convert_value(1, PressureUnits.Bar, PressureUnits.Pascal)
+        self.assertEqual(events, [("convert", Pressure, PressureUnits.Bar, PressureUnits.Pascal, 1)])
+
+    def test_disable_restores_methods(self):
+        originals = (Length.__dict__["__init__"], AbstractMeasure.__dict__["_cached_convert"])
+        instrumentation.enable()
+        self.assertIsNot(Length.__dict__["__init__"], originals[0])
+        instrumentation.disable()
+        self.assertEqual((Length.__dict__["__init__"], AbstractMeasure.__dict__["_cached_convert"]), originals)
+        Length.from_meters(1)
+        self.assertEqual(unitsnet_py.stats().constructions, {})
+
+    def test_values_unchanged(self):
+        instrumentation.enable()
+        length = Length.from_feet(3)
+        self.assertAlmostEqual(length.meters, 0.9144)
+        self.assertAlmostEqual(Length.convert_value(1, LengthUnits.Foot, LengthUnits.Inch), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import io
+import pickle
+import unittest
+from unitsnet_py import Area, Length, LengthUnits, Pressure, PressureUnits, TemperatureDelta
+
+try:
+    import numpy as np
+    import pandas as pd
+    from unitsnet_py.pandas import QuantityArray, QuantityDtype
+except ImportError:
+    pd = None
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestUnitPandas(unittest.TestCase):
+    def setUp(self):
+        self.bars = pd.Series([1.5, 2.0, np.nan], dtype="Quantity[Pressure, Bar]")
+
+    def test_dtype(self):
+        dtype = QuantityDtype(Pressure, PressureUnits.Bar)
+        self.assertEqual(dtype.name, "Quantity[Pressure, Bar]")
+        self.assertEqual(dtype, QuantityDtype("Pressure", "Bar"))
+        self.assertEqual(dtype, "Quantity[Pressure, Bar]")
+        self.assertEqual(hash(dtype), hash(QuantityDtype.construct_from_string("Quantity[Pressure, Bar]")))
+        self.assertIs(QuantityDtype(Length).unit, LengthUnits.Meter)
+        self.assertIs(self.bars.dtype.type, Pressure)
+        for name in ["Quantity[Cubit, Meter]", "Quantity[Length, Bar]", "float64"]:
+            with self.subTest(name=name):
+                with self.assertRaises(TypeError):
+                    QuantityDtype.construct_from_string(name)
+        with self.assertRaises(ValueError):
+            QuantityDtype(Length, PressureUnits.Bar)
+
+    def test_items(self):
+        self.assertEqual(self.bars[0], Pressure.from_bars(1.5))
+        self.assertTrue(np.isnan(self.bars[2]))
+        self.assertEqual(self.bars.isna().tolist(), [False, False, True])
+        self.assertEqual(len(self.bars.array), 3)
+        self.assertEqual(self.bars.array.nbytes, 24)
+
+    def test_from_quantities(self):
+        lengths = pd.Series(QuantityArray._from_sequence([Length.from_meters(1), None, Length.from_feet(1)]))
+        self.assertEqual(lengths.dtype, QuantityDtype(Length))
+        np.testing.assert_allclose(lengths.units.to_numpy(), [1, np.nan, 0.3048])
+        kilometers = pd.Series([Length.from_meters(1500)], dtype=QuantityDtype(Length, LengthUnits.Kilometer))
+        self.assertEqual(kilometers.astype(float).tolist(), [1.5])
+        with self.assertRaises(TypeError):
+            pd.Series([Pressure.from_bars(1)], dtype=QuantityDtype(Length))
+
+    def test_convert(self):
+        psi = self.bars.units.convert(PressureUnits.PoundForcePerSquareInch)
+        self.assertEqual(psi.dtype, QuantityDtype(Pressure, PressureUnits.PoundForcePerSquareInch))
+        np.testing.assert_allclose(psi.astype(float), [21.7557, 29.0075, np.nan], rtol=1e-5)
+        self.assertEqual(psi[1], Pressure.from_bars(2))
+        pascals = self.bars.astype("Quantity[Pressure, Pascal]")
+        self.assertEqual(pascals.astype(float).tolist()[:2], [150000, 200000])
+        np.testing.assert_allclose(self.bars.units.to_numpy(PressureUnits.Pascal), [150000, 200000, np.nan])
+        with self.assertRaises(TypeError):
+            self.bars.astype(QuantityDtype(Length))
+
+    def test_quantity_array(self):
+        from unitsnet_py.arrays import PressureArray
+
+        pressures = self.bars.dropna().units.to_quantity_array()
+        self.assertIsInstance(pressures, PressureArray)
+        self.assertEqual(pressures.base_values.tolist(), [150000, 200000])
+        self.assertEqual(pd.Series(QuantityArray._from_sequence(pressures)).tolist(), self.bars.dropna().tolist())
+        with self.assertRaises(ValueError):
+            self.bars.units.to_quantity_array()
+
+    def test_reductions(self):
+        self.assertEqual(self.bars.sum(), Pressure.from_bars(3.5))
+        self.assertEqual(self.bars.mean(), Pressure.from_bars(1.75))
+        self.assertEqual(self.bars.min(), Pressure.from_bars(1.5))
+        self.assertEqual(self.bars.max(), Pressure.from_bars(2))
+        self.assertAlmostEqual(self.bars.std().bars, 0.125 ** 0.5)
+        temperatures = pd.Series([10, 20, 30], dtype="Quantity[Temperature, DegreeCelsius]")
+        self.assertAlmostEqual(temperatures.mean().degrees_celsius, 20)
+        self.assertIsInstance(temperatures.std(), TemperatureDelta)
+        with self.assertRaises(TypeError):
+            temperatures.sum()
+        lengths = pd.Series([1, 3], dtype="Quantity[Length, Kilometer]")
+        self.assertIsInstance(lengths.var(), Area)
+        self.assertAlmostEqual(lengths.var().square_kilometers, 2)
+
+    def test_comparison(self):
+        self.assertEqual((self.bars == Pressure.from_pascals(150000)).tolist(), [True, False, False])
+        pascals = self.bars.units.convert(PressureUnits.Pascal)
+        self.assertEqual((self.bars == pascals).tolist(), [True, True, False])
+        self.assertEqual((self.bars == Length.from_meters(1)).tolist(), [False, False, False])
+
+    def test_concat(self):
+        pascals = pd.Series([100000.0], dtype=QuantityDtype(Pressure))
+        concatenated = pd.concat([self.bars, pascals], ignore_index=True)
+        self.assertEqual(concatenated.dtype, self.bars.dtype)
+        np.testing.assert_allclose(concatenated.astype(float), [1.5, 2, np.nan, 1])
+        self.assertEqual(pd.concat([self.bars, pd.Series([1.0], dtype=QuantityDtype(Length))]).dtype, object)
+
+    def test_groupby(self):
+        frame = pd.DataFrame(
+            {
+                "sensor": ["a", "b", "a", "b"],
+                "pressure": pd.Series([1.0, 3.0, 5.0, np.nan], dtype="Quantity[Pressure, Bar]"),
+                "temperature": pd.Series([10, 20, 30, 40], dtype="Quantity[Temperature, DegreeCelsius]"),
+            }
+        )
+        grouped = frame.groupby("sensor")
+        means = grouped["pressure"].mean()
+        self.assertEqual(means.dtype, QuantityDtype(Pressure, PressureUnits.Bar))
+        self.assertEqual(means.astype(float).tolist(), [3, 3])
+        self.assertEqual(grouped["pressure"].max()["a"], Pressure.from_bars(5))
+        self.assertEqual(grouped["pressure"].sum().astype(float).tolist(), [6, 3])
+        self.assertEqual(grouped["pressure"].count().tolist(), [2, 1])
+        deviations = grouped["temperature"].std()
+        self.assertEqual(deviations.dtype, QuantityDtype(TemperatureDelta))
+        self.assertAlmostEqual(deviations["a"].kelvins, 200 ** 0.5)
+        with self.assertRaises(TypeError):
+            grouped["temperature"].sum()
+
+    def test_frame_operations(self):
+        frame = pd.DataFrame({"key": [1, 2, 3], "pressure": self.bars})
+        self.assertEqual(frame.sort_values("pressure", ascending=False)["key"].tolist(), [2, 1, 3])
+        merged = frame.merge(pd.DataFrame({"key": [2]}))
+        self.assertEqual(merged["pressure"].tolist(), [Pressure.from_bars(2)])
+        filled = self.bars.fillna(Pressure.from_bars(0))
+        self.assertEqual(filled.astype(float).tolist(), [1.5, 2, 0])
+        self.assertEqual(self.bars.shift(1).isna().tolist(), [True, False, False])
+        self.assertEqual(self.bars.value_counts().tolist(), [1, 1])
+        self.assertTrue(pickle.loads(pickle.dumps(self.bars)).equals(self.bars))
+
+    def test_read_csv(self):
+        text = "pressure\n1.5\n2 bar\n100 kPa\n"
+        frame = pd.read_csv(io.StringIO(text), dtype={"pressure": "Quantity[Pressure, Bar]"})
+        np.testing.assert_allclose(frame["pressure"].astype(float), [1.5, 2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
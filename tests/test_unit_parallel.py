@@ -0,0 +1,54 @@
+import unittest
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unitsnet_py import Length, LengthUnits, PowerRatio, PowerRatioUnits, Temperature, TemperatureUnits
+from unitsnet_py.parallel import convert_batches
+
+
+class TestUnitParallel(unittest.TestCase):
+    def test_convert_batches(self):
+        chunks = [array("d", [0, 100]), [-40], range(3)]
+        converted = list(
+            convert_batches(chunks, Temperature, TemperatureUnits.DegreeCelsius, TemperatureUnits.DegreeFahrenheit, 2)
+        )
+        self.assertTrue(all(isinstance(chunk, array) and chunk.typecode == "d" for chunk in converted))
+        self.assertEqual([chunk.tolist() for chunk in converted], [[32, 212], [-40], [32, 33.8, 35.6]])
+
+    def test_order_and_backpressure(self):
+        read = []
+
+        def chunks():
+            for index in range(20):
+                read.append(index)
+                yield [index]
+
+        with ThreadPoolExecutor(2) as executor:
+            batches = convert_batches(
+                chunks(), Length, LengthUnits.Meter, LengthUnits.Meter, workers=2, prefetch=1, executor=executor
+            )
+            self.assertEqual(next(batches).tolist(), [0])
+            # At most workers * prefetch chunks are read ahead.
+            self.assertEqual(len(read), 2)
+            self.assertEqual([chunk[0] for chunk in batches], list(range(1, 20)))
+
+    def test_shared_executor(self):
+        with ProcessPoolExecutor(2) as executor:
+            for _ in range(2):
+                converted = convert_batches(
+                    [[10, 20]],
+                    PowerRatio,
+                    PowerRatioUnits.DecibelWatt,
+                    PowerRatioUnits.DecibelMilliwatt,
+                    executor=executor,
+                )
+                self.assertEqual([chunk.tolist() for chunk in converted], [[40, 50]])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            convert_batches([], Length, LengthUnits.Meter, TemperatureUnits.Kelvin)
+        with self.assertRaises(ValueError):
+            convert_batches([], Length, LengthUnits.Meter, LengthUnits.Foot, workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
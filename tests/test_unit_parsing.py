@@ -0,0 +1,50 @@
+import unittest
+import unitsnet_py
+from unitsnet_py import Angle, AngleUnits, Length, LengthUnits, Temperature
+
+
+class TestUnitParsing(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(Length.parse("12.5 km"), Length.from_kilometers(12.5))
+        self.assertEqual(Length.parse("3 ftUS"), Length.from_us_survey_feet(3))
+
+    def test_parse_formatted_string(self):
+        length = Length.from_inches(-7.25)
+        self.assertEqual(Length.parse(length.to_string(LengthUnits.Inch)), length)
+
+    def test_parse_without_separator(self):
+        self.assertEqual(Length.parse(" 1.5e3mm "), Length.from_meters(1.5))
+        self.assertEqual(Temperature.parse("-40 °F").degrees_celsius, -40)
+
+    def test_parse_invalid_string(self):
+        for text in ["km", "12.5 parsecs", "", "1 kg"]:
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    Length.parse(text)
+                self.assertIsNone(Length.try_parse(text))
+
+    def test_parse_ambiguous_abbreviation(self):
+        with self.assertRaisesRegex(ValueError, "PrinterPoint, DtpPoint"):
+            Length.parse("12 pt")
+
+
+class TestPackageParsing(unittest.TestCase):
+    def test_parse_detects_quantity(self):
+        self.assertEqual(unitsnet_py.parse("12.5 km"), Length.from_kilometers(12.5))
+        self.assertEqual(unitsnet_py.parse("3 ftUS"), Length.from_us_survey_feet(3))
+
+    def test_parse_ambiguous_quantity(self):
+        with self.assertRaisesRegex(ValueError, "Angle.Radian"):
+            unitsnet_py.parse("1 rad")
+        self.assertIsNone(unitsnet_py.try_parse("1 rad"))
+
+    def test_parse_specific_quantity(self):
+        expected = Angle(1, AngleUnits.Radian)
+        self.assertEqual(unitsnet_py.parse("1 rad", Angle), expected)
+        self.assertEqual(unitsnet_py.parse("1 rad", "Angle"), expected)
+        with self.assertRaises(ValueError):
+            unitsnet_py.parse("1 rad", "NotAQuantity")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import itertools
+import math
+import unittest
+from unitsnet_py import Pressure, PressureUnits, Temperature, TemperatureUnits
+from unitsnet_py.stream import convert_values, format_values, parse_units, pipeline, validate_values
+
+
+class TestUnitStream(unittest.TestCase):
+    def test_pipeline(self):
+        feed = [(1, 1, "bar"), (2, "14.5", "psi"), (3, 100000, "Pascal")]
+        result = list(pipeline(feed, Pressure, PressureUnits.Bar))
+        self.assertEqual([item[0] for item in result], [1, 2, 3])
+        self.assertEqual([item[2] for item in result], [PressureUnits.Bar] * 3)
+        self.assertAlmostEqual(result[0][1], 1)
+        self.assertAlmostEqual(result[1][1], Pressure.from_pounds_force_per_square_inch(14.5).bars)
+        self.assertAlmostEqual(result[2][1], 1)
+
+    def test_pipeline_is_lazy(self):
+        feed = ((timestamp, 32, "°F") for timestamp in itertools.count())
+        stream = pipeline(feed, Temperature, TemperatureUnits.DegreeCelsius)
+        self.assertEqual([value for _, value, _ in itertools.islice(stream, 3)], [0, 0, 0])
+
+    def test_format_values(self):
+        feed = [(1, 1.5, "K")]
+        self.assertEqual(
+            list(format_values(parse_units(feed, Temperature), Temperature)),
+            [(1, Temperature.from_kelvins(1.5).to_string(TemperatureUnits.Kelvin))],
+        )
+        result = list(pipeline(feed, Temperature, TemperatureUnits.Kelvin, formatted=True))
+        self.assertEqual(result, [(1, "1.5 K")])
+
+    def test_validate_values(self):
+        items = [(1, 1.0, None), (2, math.nan, None), (3, 3.0, None)]
+        self.assertEqual([item[0] for item in validate_values(items, "drop")], [1, 3])
+        self.assertEqual([item[0] for item in validate_values(items, "keep")], [1, 2, 3])
+        with self.assertRaises(ValueError):
+            list(validate_values(items))
+        with self.assertRaises(ValueError):
+            list(validate_values(items, "ignore"))
+
+    def test_unknown_unit(self):
+        with self.assertRaises(ValueError):
+            list(parse_units([(1, 1, "parsecs")], Pressure))
+
+    def test_converter_resolved_once_per_unit(self):
+        calls = []
+        original = Pressure._get_converter.__func__
+
+        def get_converter(cls, from_unit, to_unit):
+            calls.append(from_unit)
+            return original(cls, from_unit, to_unit)
+
+        Pressure._get_converter = classmethod(get_converter)
+        try:
+            feed = [(timestamp, timestamp, PressureUnits.Bar) for timestamp in range(100)]
+            list(convert_values(feed, Pressure, PressureUnits.Pascal))
+        finally:
+            del Pressure._get_converter
+        self.assertEqual(calls, [PressureUnits.Bar])
+
+
+if __name__ == "__main__":
+    unittest.main()
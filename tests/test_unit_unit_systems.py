@@ -0,0 +1,100 @@
+import unittest
+import unitsnet_py
+from unitsnet_py import (
+    Angle,
+    AngleUnits,
+    Length,
+    LengthUnits,
+    Pressure,
+    PressureUnits,
+    Temperature,
+    TemperatureUnits,
+    Volume,
+    VolumeUnits,
+)
+from unitsnet_py.unit_systems import IMPERIAL, SI, US_CUSTOMARY, Normalizer, UnitSystem
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestUnitSystems(unittest.TestCase):
+    def setUp(self):
+        self.normalizer = Normalizer(
+            {"pressure": Pressure, "temperature": "Temperature", "volume": (Volume, VolumeUnits.Liter)}, US_CUSTOMARY
+        )
+
+    def test_systems(self):
+        self.assertIs(SI.get_unit(Length), LengthUnits.Meter)
+        self.assertIs(SI.get_unit(Angle), AngleUnits.Radian)
+        self.assertIs(US_CUSTOMARY.get_unit(Volume), VolumeUnits.UsGallon)
+        self.assertIs(IMPERIAL.get_unit(Volume), VolumeUnits.ImperialGallon)
+        self.assertIs(IMPERIAL.get_unit(Temperature), TemperatureUnits.DegreeFahrenheit)
+        # Every unit of the systems is a unit of the generated quantities.
+        for system in (SI, US_CUSTOMARY, IMPERIAL):
+            for name in unitsnet_py._quantity_modules:
+                quantity = getattr(unitsnet_py, name)
+                self.assertIsInstance(system.get_unit(quantity), quantity._units)
+        with self.assertRaises(ValueError):
+            UnitSystem("Invalid", {"Length": "Bar"}).get_unit(Length)
+
+    def test_schema(self):
+        self.assertEqual(
+            self.normalizer.units,
+            {
+                "pressure": PressureUnits.PoundForcePerSquareInch,
+                "temperature": TemperatureUnits.DegreeFahrenheit,
+                "volume": VolumeUnits.Liter,
+            },
+        )
+        self.assertIs(Normalizer({"length": Length}).units["length"], LengthUnits.Meter)
+        with self.assertRaises(ValueError):
+            Normalizer({"length": (Length, PressureUnits.Bar)})
+        with self.assertRaises(ValueError):
+            Normalizer({"length": "Cubit"})
+
+    def test_normalize_dict(self):
+        record = {"id": 7, "pressure": (2.5, "bar"), "temperature": (21, "°C"), "volume": (1, VolumeUnits.UsGallon)}
+        normalized = self.normalizer.normalize(record)
+        self.assertEqual(normalized["id"], 7)
+        self.assertAlmostEqual(normalized["pressure"], Pressure.from_bars(2.5).pounds_force_per_square_inch)
+        self.assertAlmostEqual(normalized["temperature"], 69.8)
+        self.assertAlmostEqual(normalized["volume"], 3.785411784)
+        self.assertEqual(self.normalizer.normalize({"pressure": None}), {"pressure": None})
+
+    def test_normalize_tuple(self):
+        normalized = self.normalizer.normalize(((1, PressureUnits.Bar), ("32", "DegreeFahrenheit"), (1, "m³")))
+        self.assertAlmostEqual(normalized[0], Pressure.from_bars(1).pounds_force_per_square_inch)
+        self.assertEqual(normalized[1:], (32, 1000))
+        with self.assertRaises(ValueError):
+            self.normalizer.normalize(((1, "bar"),))
+
+    def test_invalid_units(self):
+        for unit in ["Cubit", LengthUnits.Meter, 3]:
+            with self.subTest(unit=unit):
+                with self.assertRaises(ValueError):
+                    self.normalizer.normalize({"pressure": (1, unit)})
+
+    def test_normalize_many(self):
+        records = ({"temperature": (value, "°C")} for value in range(3))
+        normalized = [record["temperature"] for record in self.normalizer.normalize_many(records)]
+        self.assertEqual(normalized, [32, 33.8, 35.6])
+
+    def test_normalize_columns(self):
+        batch = {"id": [1, 2], "pressure": ([1, 2], "bar"), "temperature": ([0, 100], TemperatureUnits.DegreeCelsius)}
+        normalized = self.normalizer.normalize_columns(batch)
+        self.assertEqual(normalized["id"], [1, 2])
+        self.assertAlmostEqual(normalized["pressure"][1], Pressure.from_bars(2).pounds_force_per_square_inch)
+        self.assertEqual(normalized["temperature"], [32, 212])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_normalize_numpy_columns(self):
+        normalized = self.normalizer.normalize_columns({"temperature": (np.array([0.0, 100.0]), "°C")})
+        self.assertIsInstance(normalized["temperature"], np.ndarray)
+        np.testing.assert_allclose(normalized["temperature"], [32, 212])
+
+
+if __name__ == "__main__":
+    unittest.main()
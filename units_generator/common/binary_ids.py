@@ -0,0 +1,57 @@
+import json
+import os
+from typing import Dict, List
+
+# The pinned binary codec ids of the quantities and their units (see 'unitsnet_py.binary'),
+# committed with the generator.
+# An id is assigned once, on the first generation of its quantity or unit, and is never changed or reused,
+# so the encoded measurements stay decodable when quantities or units are added, removed or reordered.
+DEFAULT_BINARY_IDS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "binary_ids.json")
+
+# The ids are encoded as uint16.
+MAX_BINARY_ID = 0xFFFF
+
+
+def load_binary_ids(path: str) -> Dict[str, Dict]:
+    """
+    Load the quantity name -> {"id": quantity id, "units": {unit name: unit id}} registry.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_binary_ids(path: str, binary_ids: Dict[str, Dict]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(binary_ids, f, indent=2)
+        f.write("\n")
+
+
+def __next_id(ids: List[int]) -> int:
+    next_id = max(ids, default=-1) + 1
+    if next_id > MAX_BINARY_ID:
+        raise ValueError(f"No binary id left, the ids are limited to {MAX_BINARY_ID}")
+    return next_id
+
+
+def assign_binary_ids(binary_ids: Dict[str, Dict], units: Dict[str, List[str]]) -> bool:
+    """
+    Assign ids to the new quantities and units, the ids of the removed ones stay reserved.
+
+    :param binary_ids: The registry, updated in place.
+    :param units: The generated quantity names -> their unit names.
+    :return: Whether any id was assigned.
+    """
+    assigned = False
+    for quantity_name, unit_names in units.items():
+        entry = binary_ids.get(quantity_name)
+        if entry is None:
+            quantity_id = __next_id([entry["id"] for entry in binary_ids.values()])
+            entry = binary_ids[quantity_name] = {"id": quantity_id, "units": {}}
+            assigned = True
+        for unit_name in unit_names:
+            if unit_name not in entry["units"]:
+                entry["units"][unit_name] = __next_id(list(entry["units"].values()))
+                assigned = True
+    return assigned
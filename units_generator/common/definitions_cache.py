@@ -0,0 +1,59 @@
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+# The default on-disk cache of the UnitsNet definition files, local state filled by the online runs (not committed),
+# see 'generate_package.py --offline'. Pass '--cache-dir' to generate from a snapshot kept elsewhere.
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "definitions_cache")
+
+MANIFEST_FILE = "manifest.json"
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def load_manifest(cache_dir: str) -> Dict:
+    """
+    Load the cache manifest, {"source": repo, "files": {file name: {"sha256", "git_sha"}}}.
+    """
+    path = os.path.join(cache_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {"source": None, "files": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(cache_dir: str, manifest: Dict):
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(os.path.join(cache_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def read_cached_definition(cache_dir: str, name: str, entry: Dict) -> Optional[str]:
+    """
+    Read a cached definition file, None when it is missing.
+
+    :raises ValueError: When the file content does not match its manifest sha256.
+    """
+    path = os.path.join(cache_dir, name)
+    if not os.path.exists(path):
+        return None
+    # newline="" keeps the content byte for byte, so the hashes match on every platform.
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        text = f.read()
+    if sha256_text(text) != entry.get("sha256"):
+        raise ValueError(f"Cached definition {path} does not match its manifest sha256, refresh the cache")
+    return text
+
+
+def write_cached_definition(cache_dir: str, name: str, text: str, git_sha: Optional[str]) -> Dict:
+    """
+    Write a definition file to the cache, and get its manifest entry.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(os.path.join(cache_dir, name), "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    return {"sha256": sha256_text(text), "git_sha": git_sha}
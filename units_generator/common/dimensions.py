@@ -0,0 +1,113 @@
+from fractions import Fraction
+from typing import Dict, List, Optional, Tuple
+
+# The SI base dimensions, in the order of the generated dimensions vectors.
+si_dimensions = ("L", "M", "T", "I", "Θ", "N", "J")
+
+# The SI value of the (prefixed) SI base units that may appear in the units definitions BaseUnits.
+base_units_factors = {
+    "Millimeter": Fraction(1, 1000),
+    "Centimeter": Fraction(1, 100),
+    "Decimeter": Fraction(1, 10),
+    "Meter": Fraction(1),
+    "Kilometer": Fraction(1000),
+    "Milligram": Fraction(1, 1000000),
+    "Gram": Fraction(1, 1000),
+    "Kilogram": Fraction(1),
+    "Tonne": Fraction(1000),
+    "Millisecond": Fraction(1, 1000),
+    "Second": Fraction(1),
+    "Minute": Fraction(60),
+    "Hour": Fraction(3600),
+    "Day": Fraction(86400),
+    "Milliampere": Fraction(1, 1000),
+    "Ampere": Fraction(1),
+    "Kelvin": Fraction(1),
+    # As a temperature interval (e.g. in a rate), absolute temperatures are affine and excluded.
+    "DegreeCelsius": Fraction(1),
+    "Millimole": Fraction(1, 1000),
+    "Mole": Fraction(1),
+    "Kilomole": Fraction(1000),
+    "Candela": Fraction(1),
+}
+
+# Quantities of points on an absolute scale (with affine units) -> the quantity of their differences.
+# The differences quantity base unit must be the same as the points quantity base unit.
+delta_quantities = {
+    "Temperature": "TemperatureDelta",
+}
+
+# Quantities sharing the same dimensions, the first listed one is the result of the dimensional arithmetic.
+# Dimensions without a preferred quantity resolve to the first defined quantity.
+preferred_quantities = [
+    "Area",
+    "Density",
+    "ElectricConductance",
+    "ElectricPotential",
+    "Energy",
+    "Force",
+    "ForcePerLength",
+    "Frequency",
+    "HeatFlux",
+    "Illuminance",
+    "LinearPowerDensity",
+    "LuminousIntensity",
+    "MassFlow",
+    "Power",
+    "PowerDensity",
+    "Pressure",
+    "SpecificEnergy",
+    "Speed",
+    "TemperatureDelta",
+]
+
+
+def get_quantity_dimensions(definition: Dict, methods: List[Dict]) -> Tuple[Optional[Tuple[int, ...]], Optional[str]]:
+    """
+    Get the dimensions vector of a quantity and the SI value of its base unit (as a Fraction string).
+
+    Quantities that can not take part in the dimensional arithmetic get (None, None):
+    dimensionless quantities (e.g. Ratio, Level), quantities with affine units (e.g. Temperature)
+    and quantities whose base unit is not defined by (prefixed) SI base units.
+    """
+    base_dimensions = definition.get("BaseDimensions") or {}
+    dimensions = tuple(base_dimensions.get(dimension, 0) for dimension in si_dimensions)
+    if not any(dimensions):
+        return None, None
+
+    # Absolute scales (units with an offset) are not products of dimensions, their differences are.
+    for method in methods:
+        affine_to_base = method["affine_to_base"]
+        if affine_to_base is not None and affine_to_base[1] != "0":
+            return None, None
+
+    base_unit = next(
+        (unit for unit in definition["Units"] if unit.get("SingularName") == definition.get("BaseUnit")), {}
+    )
+    base_units = base_unit.get("BaseUnits") or {}
+    if set(base_units) != {dimension for dimension, exponent in base_dimensions.items() if exponent}:
+        return None, None
+
+    si_scale = Fraction(1)
+    for dimension, unit in base_units.items():
+        factor = base_units_factors.get(unit)
+        if factor is None:
+            return None, None
+        si_scale *= factor ** base_dimensions[dimension]
+
+    return dimensions, str(si_scale)
+
+
+def get_dimensions_index(quantities: List[Dict]) -> Dict[Tuple[int, ...], str]:
+    """
+    Map each dimensions vector to the quantity resulting from the dimensional arithmetic.
+    """
+    index = {}
+    for quantity in sorted(
+        (quantity for quantity in quantities if quantity["dimensions"] is not None),
+        key=lambda quantity: quantity["unit"] not in preferred_quantities,
+    ):
+        index.setdefault(quantity["dimensions"], quantity["unit"])
+    # Keep the definitions order.
+    order = [quantity["unit"] for quantity in quantities]
+    return dict(sorted(index.items(), key=lambda item: order.index(item[1])))
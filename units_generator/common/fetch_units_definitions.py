@@ -1,41 +1,114 @@
-from .utils import get_json_from_cdn
+import json
+from typing import Dict, List
 
+from .definitions_cache import (
+    DEFAULT_CACHE_DIR,
+    load_manifest,
+    read_cached_definition,
+    save_manifest,
+    write_cached_definition,
+)
+from .utils import get_json_from_cdn, get_text_from_cdn
 
-def get_definitions(repo_owner_and_name):
+
+def __mark_deprecated_units(name: str, definition: Dict):
+    for unit in definition["Units"]:
+        markAsDeprecated = False
+        pluralName = unit.get("PluralName")
+        obsoleteText = unit.get("ObsoleteText")
+        if obsoleteText:
+            print(
+                f'[get_definitions] Unit {name}.{pluralName} marked as obsolete, message: "{obsoleteText}"'
+            )
+            markAsDeprecated = True
+
+        if unit.get("SkipConversionGeneration"):
+            print(
+                f"[get_definitions] Unit {name}.{pluralName} marked to be ignored"
+            )
+            markAsDeprecated = True
+
+        unit["Deprecated"] = markAsDeprecated
+
+
+def __load_cached_texts(cache_dir: str) -> Dict[str, str]:
+    manifest = load_manifest(cache_dir)
+    if not manifest["files"]:
+        raise FileNotFoundError(
+            f"No cached units definitions in {cache_dir}, run the generator once online to fill the cache"
+        )
+    texts = {}
+    for name, entry in sorted(manifest["files"].items()):
+        text = read_cached_definition(cache_dir, name, entry)
+        if text is None:
+            raise FileNotFoundError(f"Cached units definition {name} is missing from {cache_dir}")
+        texts[name] = text
+    return texts
+
+
+def __fetch_texts(repo_owner_and_name: str, cache_dir: str, refresh: bool) -> Dict[str, str]:
     directory_url = f"https://api.github.com/repos/{repo_owner_and_name}/contents/Common/UnitDefinitions"
     files_url = f"https://raw.githubusercontent.com/{repo_owner_and_name}/master/Common/UnitDefinitions"
 
     print("[get_definitions] Fetching units files list...")
     directory_files = get_json_from_cdn(directory_url)
+    if directory_files is None:
+        raise ConnectionError("Unable to fetch the units files list, use --offline to generate from the cache")
 
-    print("[get_definitions] Fetching units definitions...")
+    manifest = load_manifest(cache_dir)
+    if manifest.get("source") != repo_owner_and_name:
+        manifest = {"source": repo_owner_and_name, "files": {}}
 
-    definitions = []
+    print("[get_definitions] Fetching changed units definitions...")
+
+    texts = {}
+    files = {}
     for file in directory_files:
         name = file.get("name")
-        definition = get_json_from_cdn(f"{files_url}/{name}")
-
-        for unit in definition["Units"]:
-            markAsDeprecated = False
-            pluralName = unit.get("PluralName")
-            obsoleteText = unit.get("ObsoleteText")
-            if obsoleteText:
-                print(
-                    f'[get_definitions] Unit {name}.{pluralName} marked as obsolete, message: "{obsoleteText}"'
-                )
-                markAsDeprecated = True
-
-            if unit.get("SkipConversionGeneration"):
-                print(
-                    f"[get_definitions] Unit {name}.{pluralName} marked to be ignored"
-                )
-                markAsDeprecated = True
-
-            unit["Deprecated"] = markAsDeprecated
+        # The listing git blob sha identifies the file content, unchanged files are read from the cache.
+        entry = manifest["files"].get(name)
+        text = None
+        if not refresh and entry is not None and entry.get("git_sha") == file.get("sha"):
+            try:
+                text = read_cached_definition(cache_dir, name, entry)
+            except ValueError as e:
+                print(f"[get_definitions] {e}")
+        if text is None:
+            text = get_text_from_cdn(f"{files_url}/{name}")
+            if text is None:
+                raise ConnectionError(f"Unable to fetch the units definition {name}")
+            entry = write_cached_definition(cache_dir, name, text, file.get("sha"))
+            print(f"[get_definitions] Units definition {name} successfully fetched")
+        files[name] = entry
+        texts[name] = text
 
-        definitions.append(definition)
+    save_manifest(cache_dir, {"source": repo_owner_and_name, "files": files})
+    return texts
+
+
+def get_definitions(repo_owner_and_name, cache_dir=DEFAULT_CACHE_DIR, offline=False, refresh=False) -> List[Dict]:
+    """
+    Get the units definitions, through the on-disk cache of the definition files.
 
-        print(f"[get_definitions] Unit {name}.{pluralName} successfully fetched")
+    Online, only the files list is requested, and the files whose content changed since the last run are downloaded.
+    Offline, the definitions are read from the cache only, and each file is verified against its manifest sha256.
+
+    :param repo_owner_and_name: The UnitsNet GitHub repository.
+    :param cache_dir: The definitions cache directory.
+    :param offline: Read the definitions from the cache, without network access.
+    :param refresh: Download all the definition files again.
+    """
+    if offline:
+        print(f"[get_definitions] Reading units definitions from {cache_dir}...")
+        texts = __load_cached_texts(cache_dir)
+    else:
+        texts = __fetch_texts(repo_owner_and_name, cache_dir, refresh)
+
+    definitions = []
+    for name, text in texts.items():
+        definition = json.loads(text)
+        __mark_deprecated_units(name, definition)
+        definitions.append(definition)
 
     print("[get_definitions] Fetching units definitions finished successfully")
 
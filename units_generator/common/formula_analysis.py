@@ -0,0 +1,104 @@
+import ast
+import math
+from fractions import Fraction
+from typing import Optional, Tuple, Union
+
+Number = Union[Fraction, float]
+
+
+# The math functions that may appear in the unit formulas.
+math_functions = {
+    "pow": math.pow,
+    "sqrt": math.sqrt,
+    "sin": math.sin,
+    "asin": math.asin,
+}
+
+
+class NotAffineError(Exception):
+    pass
+
+
+def __evaluate(node: ast.AST, formula: str) -> Tuple[Number, Number]:
+    """
+    Evaluate a formula node to the (scale, offset) coefficients of scale * value + offset.
+
+    Literals are evaluated as exact fractions, only math constants and functions
+    (e.g. math.pi) turn a coefficient to an inexact float.
+    """
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return Fraction(0), Fraction(ast.get_source_segment(formula, node))
+
+    if isinstance(node, ast.Name) and node.id == "value":
+        return Fraction(1), Fraction(0)
+
+    if isinstance(node, ast.Attribute) and node.attr == "pi":
+        return Fraction(0), math.pi
+
+    if isinstance(node, ast.UnaryOp):
+        scale, offset = __evaluate(node.operand, formula)
+        if isinstance(node.op, ast.USub):
+            return -scale, -offset
+        if isinstance(node.op, ast.UAdd):
+            return scale, offset
+
+    if isinstance(node, ast.BinOp):
+        left_scale, left_offset = __evaluate(node.left, formula)
+        right_scale, right_offset = __evaluate(node.right, formula)
+
+        if isinstance(node.op, ast.Add):
+            return left_scale + right_scale, left_offset + right_offset
+        if isinstance(node.op, ast.Sub):
+            return left_scale - right_scale, left_offset - right_offset
+        if isinstance(node.op, ast.Mult):
+            if left_scale == 0:
+                return left_offset * right_scale, left_offset * right_offset
+            if right_scale == 0:
+                return left_scale * right_offset, left_offset * right_offset
+        if isinstance(node.op, ast.Div) and right_scale == 0:
+            return left_scale / right_offset, left_offset / right_offset
+        if isinstance(node.op, ast.Pow) and left_scale == 0 and right_scale == 0:
+            return Fraction(0), left_offset**right_offset
+
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr in math_functions
+    ):
+        args = [__evaluate(arg, formula) for arg in node.args]
+        if all(scale == 0 for scale, _ in args):
+            offsets = [offset for _, offset in args]
+            base, exponent = (offsets + [None])[:2]
+            if (
+                node.func.attr == "pow"
+                and isinstance(base, Fraction)
+                and isinstance(exponent, Fraction)
+                and exponent.denominator == 1
+            ):
+                return Fraction(0), base ** int(exponent)
+            return Fraction(0), math_functions[node.func.attr](*[float(offset) for offset in offsets])
+
+    raise NotAffineError(ast.dump(node))
+
+
+def __format_coefficient(coefficient: Number) -> str:
+    # Exact coefficients are kept as a fraction string, inexact ones as the float representation.
+    if isinstance(coefficient, Fraction) or coefficient == 0:
+        return str(Fraction(coefficient))
+    return repr(float(coefficient))
+
+
+def get_affine_coefficients(formula: str) -> Optional[Tuple[str, str]]:
+    """
+    Get the (scale, offset) coefficients of a python unit formula of 'value'.
+
+    The coefficients are strings that 'fractions.Fraction' parses without loss,
+    e.g. ('5/9', '45967/180') for the Fahrenheit to Kelvin formula.
+
+    :return: The coefficients, or None when the formula is not affine (e.g. logarithmic units).
+    """
+    try:
+        scale, offset = __evaluate(ast.parse(formula, mode="eval").body, formula)
+    except NotAffineError:
+        return None
+    return __format_coefficient(scale), __format_coefficient(offset)
@@ -0,0 +1,60 @@
+import hashlib
+import json
+import os
+from typing import Dict, Iterable
+
+GENERATOR_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The hashes of the last generated quantities, local state of incremental regeneration (not committed).
+DEFAULT_GENERATION_MANIFEST = os.path.join(GENERATOR_DIR, ".generation_manifest.json")
+
+
+def get_generator_fingerprint() -> str:
+    """
+    Hash the generator sources and templates, any change to them regenerates all the quantities.
+    """
+    digest = hashlib.sha256()
+    for directory in ("common", "generators", "templates"):
+        path = os.path.join(GENERATOR_DIR, directory)
+        for name in sorted(os.listdir(path)):
+            if not name.endswith((".py", ".jinja2")):
+                continue
+            digest.update(name.encode("utf-8"))
+            with open(os.path.join(path, name), "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def get_definition_hash(definition: Dict) -> str:
+    return hashlib.sha256(json.dumps(definition, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def needs_render(name: str, definition_hash: str, generated: Dict[str, str], outputs: Iterable[str]) -> bool:
+    """
+    Whether a quantity is rendered: its definition changed since the last generation, or an output file is missing.
+
+    :param name: The quantity name.
+    :param definition_hash: The hash of its current definition, see 'get_definition_hash'.
+    :param generated: The quantity name -> definition hash of the last generation, see 'load_generation_manifest'.
+    :param outputs: The paths of the files generated for the quantity.
+    """
+    return generated.get(name) != definition_hash or not all(os.path.exists(path) for path in outputs)
+
+
+def load_generation_manifest(path: str, fingerprint: str) -> Dict[str, str]:
+    """
+    Load the quantity name -> definition hash of the last generation, empty when the generator changed since.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("fingerprint") != fingerprint:
+        return {}
+    return manifest.get("quantities", {})
+
+
+def save_generation_manifest(path: str, fingerprint: str, quantities: Dict[str, str]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"fingerprint": fingerprint, "quantities": quantities}, f, indent=2, sort_keys=True)
+        f.write("\n")
@@ -3,18 +3,23 @@ import json
 import re
 
 
-def get_json_from_cdn(cdn_url):
+def get_text_from_cdn(cdn_url):
     try:
         response = requests.get(
             cdn_url, headers={"user-agent": "PostmanRuntime/7.20.1"}
         )
         response.raise_for_status()
         # Skip utf-8 BOM char.
-        cleaned_text = response.text.lstrip("\ufeff")
-        json_data = json.loads(cleaned_text)
-        return json_data
+        return response.text.lstrip("\ufeff")
     except requests.exceptions.RequestException as e:
-        print(f"Failed to retrieve JSON from cdn: {e}")
+        print(f"Failed to retrieve text from cdn: {e}")
+
+
+def get_json_from_cdn(cdn_url):
+    cleaned_text = get_text_from_cdn(cdn_url)
+    if cleaned_text is None:
+        return None
+    return json.loads(cleaned_text)
 
 
 def camel_to_snake(name):
@@ -1,21 +1,75 @@
+import argparse
+
+from common.binary_ids import DEFAULT_BINARY_IDS, load_binary_ids, save_binary_ids
+from common.definitions_cache import DEFAULT_CACHE_DIR
 from common.fetch_units_definitions import get_definitions
+from common.incremental import (
+    DEFAULT_GENERATION_MANIFEST,
+    get_definition_hash,
+    get_generator_fingerprint,
+    load_generation_manifest,
+    needs_render,
+    save_generation_manifest,
+)
+from common.utils import camel_to_snake
 from generators.generate_unit_class import unit_class_generator
+from generators.generate_array_class import array_class_generator
 from generators.generate_export import export_generator
+from generators.generate_dimensions import dimensions_generator
 from generators.generate_readme import readme_generator
 
+parser = argparse.ArgumentParser(description="Generate the python units package from the UnitsNet definitions")
+parser.add_argument("--offline", action="store_true", help="Read the definitions from the cache only")
+parser.add_argument("--refresh", action="store_true", help="Download all the definition files again")
+parser.add_argument("--full", action="store_true", help="Regenerate all the quantities, not only the changed ones")
+parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="The definitions cache directory")
+args = parser.parse_args()
+
 print("Starting generating python units...")
 
 # Fetch all units definitions
-definitions = get_definitions(repo_owner_and_name="angularsen/UnitsNet")
+definitions = get_definitions(
+    repo_owner_and_name="angularsen/UnitsNet", cache_dir=args.cache_dir, offline=args.offline, refresh=args.refresh
+)
+
+# Only the quantities whose definition (or the generator itself) changed since the last generation are rendered
+fingerprint = get_generator_fingerprint()
+generated = {} if args.full else load_generation_manifest(DEFAULT_GENERATION_MANIFEST, fingerprint)
+
+# The pinned binary codec ids, the new quantities and units get their ids while generated
+binary_ids = load_binary_ids(DEFAULT_BINARY_IDS)
 
-# Generate python unit class for each unit definition
+# Generate python unit class and NumPy array class for each unit definition
+quantities = []
+hashes = {}
+skipped = 0
 for definition in definitions:
-    unit_class_generator(unit_definition=definition)
+    name = definition.get("Name")
+    hashes[name] = get_definition_hash(definition)
+    module = camel_to_snake(name)
+    render = needs_render(
+        name, hashes[name], generated, [f"unitsnet_py/units/{module}.py", f"unitsnet_py/arrays/{module}.py"]
+    )
+    template_data = unit_class_generator(unit_definition=definition, binary_ids=binary_ids, render=render)
+    if render:
+        array_class_generator(template_data=template_data)
+    else:
+        skipped += 1
+    quantities.append(template_data)
+
+print(f"Rendered {len(definitions) - skipped} quantities, {skipped} unchanged")
+
+save_binary_ids(DEFAULT_BINARY_IDS, binary_ids)
+
+# Generate the dimensions index of the dimensional arithmetic
+dimensions_generator(quantities)
 
 # Generate units package export API
-export_generator(definitions)
+export_generator(definitions, binary_ids)
 
 # Generate README doc file
 readme_generator(definitions)
 
+save_generation_manifest(DEFAULT_GENERATION_MANIFEST, fingerprint, hashes)
+
 print("Generating python units package finished successfully")
@@ -0,0 +1,59 @@
+import re
+from typing import Dict
+
+from jinja2 import Template, StrictUndefined
+from common.utils import camel_to_snake
+from templates import array_class_template
+
+
+# NumPy counterparts of the math functions used by the unit formulas.
+numpy_functions = {
+    "math.pow": "np.power",
+    "math.sqrt": "np.sqrt",
+    "math.sin": "np.sin",
+    "math.asin": "np.arcsin",
+    "math.pi": "np.pi",
+}
+
+
+def __format_array_formula(formula: str) -> str:
+    def replace(match):
+        name = match.group(0)
+        numpy_function = numpy_functions.get(name)
+        if not numpy_function:
+            raise ValueError(f"No NumPy equivalent for '{name}' in formula '{formula}'")
+        return numpy_function
+
+    return re.sub(r"math\.\w+", replace, formula)
+
+
+def array_class_generator(template_data: Dict):
+    unit_name = template_data.get("unit")
+
+    print(f"[array_class_generator] Generating array for {unit_name}...")
+
+    methods = [
+        {
+            **method,
+            "array_formula_from_base": __format_array_formula(method["formula_from_base"]),
+            "array_formula_to_base": __format_array_formula(method["formula_to_base"]),
+        }
+        for method in template_data["methods"]
+    ]
+
+    # Create a Jinja2 template object
+    template = Template(array_class_template, undefined=StrictUndefined)
+
+    # Render the template with the data
+    code = template.render(
+        {**template_data, "module": camel_to_snake(unit_name), "methods": methods}
+    )
+
+    with open(
+        f"unitsnet_py/arrays/{camel_to_snake(unit_name)}.py", "w", encoding="utf-8"
+    ) as f:
+        f.write(code)
+
+    print(
+        f"[array_class_generator] Generating array for {unit_name} finished successfully"
+    )
@@ -0,0 +1,28 @@
+from typing import Dict, List
+
+from jinja2 import Template, StrictUndefined
+from common.dimensions import get_dimensions_index
+from common.utils import camel_to_snake
+from templates import dimensions_template
+
+
+def dimensions_generator(quantities: List[Dict]):
+    index = get_dimensions_index(quantities)
+
+    template_data = {
+        "dimensions": [
+            {"vector": dimensions, "unit": unit, "module": camel_to_snake(unit)}
+            for dimensions, unit in index.items()
+        ]
+    }
+
+    # Create a Jinja2 template object
+    template = Template(dimensions_template, undefined=StrictUndefined)
+
+    # Render the template with the data
+    code = template.render(template_data)
+
+    with open("unitsnet_py/dimensions.py", "w", encoding="utf-8") as f:
+        f.write(code)
+
+    print('[dimensions_generator] Generating "dimensions.py" finished successfully')
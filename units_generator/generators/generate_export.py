@@ -1,11 +1,11 @@
-from typing import List
+from typing import Dict, List
 
 from jinja2 import Template, StrictUndefined
 from common.utils import camel_to_snake
-from templates import export_classes_template
+from templates import export_classes_template, arrays_export_template
 
 
-def export_generator(definitions: List):
+def export_generator(definitions: List, binary_ids: Dict[str, Dict]):
     template_methods = []
 
     for definition in definitions:
@@ -15,6 +15,7 @@ def export_generator(definitions: List):
             {
                 "unit": camel_to_snake(singular_name),
                 "unit_name": singular_name,
+                "binary_id": binary_ids[singular_name]["id"],
             }
         )
 
@@ -30,3 +31,12 @@ def export_generator(definitions: List):
         f.write(code)
 
     print('[export_generator] Generating "__init__.py" finished successfully')
+
+    # Render the NumPy arrays sub-package export API
+    template = Template(arrays_export_template, undefined=StrictUndefined)
+    code = template.render(template_data)
+
+    with open("unitsnet_py/arrays/__init__.py", "w", encoding="utf-8") as f:
+        f.write(code)
+
+    print('[export_generator] Generating "arrays/__init__.py" finished successfully')
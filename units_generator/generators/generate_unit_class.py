@@ -1,7 +1,10 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from jinja2 import Template, StrictUndefined
+from common.binary_ids import assign_binary_ids
 from common.utils import camel_to_snake, prefixes_factor, prefixes_factor_abbreviation, upper_to_lower_camelcase
+from common.formula_analysis import get_affine_coefficients
+from common.dimensions import delta_quantities, get_quantity_dimensions
 from templates import unit_class_template
 
 
@@ -78,7 +81,19 @@ def __get_unit_abbreviation(abbreviation: List) -> str:
     return "" if not len(abbreviations) else abbreviations[0]
 
 
-def unit_class_generator(unit_definition):
+def __get_unit_abbreviations(abbreviation: List) -> Tuple[str, ...]:
+    us_abbreviation = next(
+        filter(lambda x: x.get("Culture") == "en-US", abbreviation), None
+    )
+
+    if not us_abbreviation:
+        return ()
+
+    # Keep the order (the first one is the default abbreviation) but drop duplicates.
+    return tuple(dict.fromkeys(us_abbreviation.get("Abbreviations")))
+
+
+def unit_class_generator(unit_definition, binary_ids, render=True):
     # Filter out all deprecated units
     units = list(filter(lambda x: not x.get("Deprecated"), unit_definition["Units"]))
 
@@ -89,6 +104,10 @@ def unit_class_generator(unit_definition):
     # Add the units prefixes (like MiliXXX or KiloXXX) as unit in the unit units collection.
     all_units = units + __extant_unit_prefixes(units)
 
+    # Pin the binary codec ids of the new units (in place), the existing ones never change.
+    assign_binary_ids(binary_ids, {unit_name: [unit.get("SingularName") for unit in all_units]})
+    quantity_binary_ids = binary_ids[unit_name]
+
     template_methods = []
 
     for unit in all_units:
@@ -97,25 +116,42 @@ def unit_class_generator(unit_definition):
         plural_name = camel_to_snake(unit.get("PluralName"))
         description = unit.get("XmlDocSummary") or ""
 
+        formula_from_base = __format_formula(unit.get("FromBaseToUnitFunc"))
+        formula_to_base = __format_formula(unit.get("FromUnitToBaseFunc"))
+
         template_methods.append(
             {
                 "unit_value": singular_name_camel_case,
                 "name": plural_name,
                 "unit": singular_name,
                 "description": description,
-                "formula_from_base": __format_formula(unit.get("FromBaseToUnitFunc")),
-                "formula_to_base": __format_formula(unit.get("FromUnitToBaseFunc")),
+                "formula_from_base": formula_from_base,
+                "formula_to_base": formula_to_base,
+                "affine_from_base": get_affine_coefficients(formula_from_base),
+                "affine_to_base": get_affine_coefficients(formula_to_base),
                 "abbreviation": __get_unit_abbreviation(unit.get("Localization")),
+                "abbreviations": __get_unit_abbreviations(unit.get("Localization")),
+                "binary_id": quantity_binary_ids["units"][singular_name],
             }
         )
 
+    dimensions, si_scale = get_quantity_dimensions(unit_definition, template_methods)
+
     template_data = {
         "unit": unit_name,
         "base_unit": unit_definition.get("BaseUnit"),
         "description": unit_definition.get("XmlDocSummary"),
         "methods": template_methods,
+        "dimensions": dimensions,
+        "si_scale": si_scale,
+        "delta_quantity": delta_quantities.get(unit_name),
+        "binary_id": quantity_binary_ids["id"],
     }
 
+    if not render:
+        # Unchanged since the last generation, the data is still needed by the package wide generators.
+        return template_data
+
     # Create a Jinja2 template object
     template = Template(unit_class_template, undefined=StrictUndefined)
 
@@ -130,3 +166,5 @@ def unit_class_generator(unit_definition):
     print(
         f"[unit_class_generator] Generating units for {unit_name} finished successfully"
     )
+
+    return template_data
@@ -15,3 +15,18 @@ readme_template = ""
 with open("units_generator/templates/readme_template.jinja2", "r", encoding="utf-8") as f:
     readme_template = f.read()
 
+
+
+array_class_template = ""
+with open("units_generator/templates/array_template.jinja2", "r", encoding="utf-8") as f:
+    array_class_template = f.read()
+
+
+arrays_export_template = ""
+with open("units_generator/templates/arrays_export_template.jinja2", "r", encoding="utf-8") as f:
+    arrays_export_template = f.read()
+
+
+dimensions_template = ""
+with open("units_generator/templates/dimensions_template.jinja2", "r", encoding="utf-8") as f:
+    dimensions_template = f.read()
@@ -1,126 +1,407 @@
-from .units.absorbed_dose_of_ionizing_radiation import AbsorbedDoseOfIonizingRadiation, AbsorbedDoseOfIonizingRadiationUnits
-from .units.acceleration import Acceleration, AccelerationUnits
-from .units.amount_of_substance import AmountOfSubstance, AmountOfSubstanceUnits
-from .units.amplitude_ratio import AmplitudeRatio, AmplitudeRatioUnits
-from .units.angle import Angle, AngleUnits
-from .units.apparent_energy import ApparentEnergy, ApparentEnergyUnits
-from .units.apparent_power import ApparentPower, ApparentPowerUnits
-from .units.area import Area, AreaUnits
-from .units.area_density import AreaDensity, AreaDensityUnits
-from .units.area_moment_of_inertia import AreaMomentOfInertia, AreaMomentOfInertiaUnits
-from .units.bit_rate import BitRate, BitRateUnits
-from .units.brake_specific_fuel_consumption import BrakeSpecificFuelConsumption, BrakeSpecificFuelConsumptionUnits
-from .units.capacitance import Capacitance, CapacitanceUnits
-from .units.coefficient_of_thermal_expansion import CoefficientOfThermalExpansion, CoefficientOfThermalExpansionUnits
-from .units.compressibility import Compressibility, CompressibilityUnits
-from .units.density import Density, DensityUnits
-from .units.duration import Duration, DurationUnits
-from .units.dynamic_viscosity import DynamicViscosity, DynamicViscosityUnits
-from .units.electric_admittance import ElectricAdmittance, ElectricAdmittanceUnits
-from .units.electric_charge import ElectricCharge, ElectricChargeUnits
-from .units.electric_charge_density import ElectricChargeDensity, ElectricChargeDensityUnits
-from .units.electric_conductance import ElectricConductance, ElectricConductanceUnits
-from .units.electric_conductivity import ElectricConductivity, ElectricConductivityUnits
-from .units.electric_current import ElectricCurrent, ElectricCurrentUnits
-from .units.electric_current_density import ElectricCurrentDensity, ElectricCurrentDensityUnits
-from .units.electric_current_gradient import ElectricCurrentGradient, ElectricCurrentGradientUnits
-from .units.electric_field import ElectricField, ElectricFieldUnits
-from .units.electric_inductance import ElectricInductance, ElectricInductanceUnits
-from .units.electric_potential import ElectricPotential, ElectricPotentialUnits
-from .units.electric_potential_ac import ElectricPotentialAc, ElectricPotentialAcUnits
-from .units.electric_potential_change_rate import ElectricPotentialChangeRate, ElectricPotentialChangeRateUnits
-from .units.electric_potential_dc import ElectricPotentialDc, ElectricPotentialDcUnits
-from .units.electric_resistance import ElectricResistance, ElectricResistanceUnits
-from .units.electric_resistivity import ElectricResistivity, ElectricResistivityUnits
-from .units.electric_surface_charge_density import ElectricSurfaceChargeDensity, ElectricSurfaceChargeDensityUnits
-from .units.energy import Energy, EnergyUnits
-from .units.energy_density import EnergyDensity, EnergyDensityUnits
-from .units.entropy import Entropy, EntropyUnits
-from .units.force import Force, ForceUnits
-from .units.force_change_rate import ForceChangeRate, ForceChangeRateUnits
-from .units.force_per_length import ForcePerLength, ForcePerLengthUnits
-from .units.frequency import Frequency, FrequencyUnits
-from .units.fuel_efficiency import FuelEfficiency, FuelEfficiencyUnits
-from .units.heat_flux import HeatFlux, HeatFluxUnits
-from .units.heat_transfer_coefficient import HeatTransferCoefficient, HeatTransferCoefficientUnits
-from .units.illuminance import Illuminance, IlluminanceUnits
-from .units.impulse import Impulse, ImpulseUnits
-from .units.information import Information, InformationUnits
-from .units.irradiance import Irradiance, IrradianceUnits
-from .units.irradiation import Irradiation, IrradiationUnits
-from .units.jerk import Jerk, JerkUnits
-from .units.kinematic_viscosity import KinematicViscosity, KinematicViscosityUnits
-from .units.leak_rate import LeakRate, LeakRateUnits
-from .units.length import Length, LengthUnits
-from .units.level import Level, LevelUnits
-from .units.linear_density import LinearDensity, LinearDensityUnits
-from .units.linear_power_density import LinearPowerDensity, LinearPowerDensityUnits
-from .units.luminance import Luminance, LuminanceUnits
-from .units.luminosity import Luminosity, LuminosityUnits
-from .units.luminous_flux import LuminousFlux, LuminousFluxUnits
-from .units.luminous_intensity import LuminousIntensity, LuminousIntensityUnits
-from .units.magnetic_field import MagneticField, MagneticFieldUnits
-from .units.magnetic_flux import MagneticFlux, MagneticFluxUnits
-from .units.magnetization import Magnetization, MagnetizationUnits
-from .units.mass import Mass, MassUnits
-from .units.mass_concentration import MassConcentration, MassConcentrationUnits
-from .units.mass_flow import MassFlow, MassFlowUnits
-from .units.mass_flux import MassFlux, MassFluxUnits
-from .units.mass_fraction import MassFraction, MassFractionUnits
-from .units.mass_moment_of_inertia import MassMomentOfInertia, MassMomentOfInertiaUnits
-from .units.molar_energy import MolarEnergy, MolarEnergyUnits
-from .units.molar_entropy import MolarEntropy, MolarEntropyUnits
-from .units.molar_flow import MolarFlow, MolarFlowUnits
-from .units.molar_mass import MolarMass, MolarMassUnits
-from .units.molarity import Molarity, MolarityUnits
-from .units.permeability import Permeability, PermeabilityUnits
-from .units.permittivity import Permittivity, PermittivityUnits
-from .units.porous_medium_permeability import PorousMediumPermeability, PorousMediumPermeabilityUnits
-from .units.power import Power, PowerUnits
-from .units.power_density import PowerDensity, PowerDensityUnits
-from .units.power_ratio import PowerRatio, PowerRatioUnits
-from .units.pressure import Pressure, PressureUnits
-from .units.pressure_change_rate import PressureChangeRate, PressureChangeRateUnits
-from .units.ratio import Ratio, RatioUnits
-from .units.ratio_change_rate import RatioChangeRate, RatioChangeRateUnits
-from .units.reactive_energy import ReactiveEnergy, ReactiveEnergyUnits
-from .units.reactive_power import ReactivePower, ReactivePowerUnits
-from .units.reciprocal_area import ReciprocalArea, ReciprocalAreaUnits
-from .units.reciprocal_length import ReciprocalLength, ReciprocalLengthUnits
-from .units.relative_humidity import RelativeHumidity, RelativeHumidityUnits
-from .units.rotational_acceleration import RotationalAcceleration, RotationalAccelerationUnits
-from .units.rotational_speed import RotationalSpeed, RotationalSpeedUnits
-from .units.rotational_stiffness import RotationalStiffness, RotationalStiffnessUnits
-from .units.rotational_stiffness_per_length import RotationalStiffnessPerLength, RotationalStiffnessPerLengthUnits
-from .units.scalar import Scalar, ScalarUnits
-from .units.solid_angle import SolidAngle, SolidAngleUnits
-from .units.specific_energy import SpecificEnergy, SpecificEnergyUnits
-from .units.specific_entropy import SpecificEntropy, SpecificEntropyUnits
-from .units.specific_fuel_consumption import SpecificFuelConsumption, SpecificFuelConsumptionUnits
-from .units.specific_volume import SpecificVolume, SpecificVolumeUnits
-from .units.specific_weight import SpecificWeight, SpecificWeightUnits
-from .units.speed import Speed, SpeedUnits
-from .units.standard_volume_flow import StandardVolumeFlow, StandardVolumeFlowUnits
-from .units.temperature import Temperature, TemperatureUnits
-from .units.temperature_change_rate import TemperatureChangeRate, TemperatureChangeRateUnits
-from .units.temperature_delta import TemperatureDelta, TemperatureDeltaUnits
-from .units.temperature_gradient import TemperatureGradient, TemperatureGradientUnits
-from .units.thermal_conductivity import ThermalConductivity, ThermalConductivityUnits
-from .units.thermal_resistance import ThermalResistance, ThermalResistanceUnits
-from .units.torque import Torque, TorqueUnits
-from .units.torque_per_length import TorquePerLength, TorquePerLengthUnits
-from .units.turbidity import Turbidity, TurbidityUnits
-from .units.vitamin_a import VitaminA, VitaminAUnits
-from .units.volume import Volume, VolumeUnits
-from .units.volume_concentration import VolumeConcentration, VolumeConcentrationUnits
-from .units.volume_flow import VolumeFlow, VolumeFlowUnits
-from .units.volume_flow_per_area import VolumeFlowPerArea, VolumeFlowPerAreaUnits
-from .units.volume_per_length import VolumePerLength, VolumePerLengthUnits
-from .units.volumetric_heat_capacity import VolumetricHeatCapacity, VolumetricHeatCapacityUnits
-from .units.warping_moment_of_inertia import WarpingMomentOfInertia, WarpingMomentOfInertiaUnits
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .instrumentation import stats
+    from .parsing import parse, try_parse
+    from .units.absorbed_dose_of_ionizing_radiation import AbsorbedDoseOfIonizingRadiation, AbsorbedDoseOfIonizingRadiationUnits
+    from .units.acceleration import Acceleration, AccelerationUnits
+    from .units.amount_of_substance import AmountOfSubstance, AmountOfSubstanceUnits
+    from .units.amplitude_ratio import AmplitudeRatio, AmplitudeRatioUnits
+    from .units.angle import Angle, AngleUnits
+    from .units.apparent_energy import ApparentEnergy, ApparentEnergyUnits
+    from .units.apparent_power import ApparentPower, ApparentPowerUnits
+    from .units.area import Area, AreaUnits
+    from .units.area_density import AreaDensity, AreaDensityUnits
+    from .units.area_moment_of_inertia import AreaMomentOfInertia, AreaMomentOfInertiaUnits
+    from .units.bit_rate import BitRate, BitRateUnits
+    from .units.brake_specific_fuel_consumption import BrakeSpecificFuelConsumption, BrakeSpecificFuelConsumptionUnits
+    from .units.capacitance import Capacitance, CapacitanceUnits
+    from .units.coefficient_of_thermal_expansion import CoefficientOfThermalExpansion, CoefficientOfThermalExpansionUnits
+    from .units.compressibility import Compressibility, CompressibilityUnits
+    from .units.density import Density, DensityUnits
+    from .units.duration import Duration, DurationUnits
+    from .units.dynamic_viscosity import DynamicViscosity, DynamicViscosityUnits
+    from .units.electric_admittance import ElectricAdmittance, ElectricAdmittanceUnits
+    from .units.electric_charge import ElectricCharge, ElectricChargeUnits
+    from .units.electric_charge_density import ElectricChargeDensity, ElectricChargeDensityUnits
+    from .units.electric_conductance import ElectricConductance, ElectricConductanceUnits
+    from .units.electric_conductivity import ElectricConductivity, ElectricConductivityUnits
+    from .units.electric_current import ElectricCurrent, ElectricCurrentUnits
+    from .units.electric_current_density import ElectricCurrentDensity, ElectricCurrentDensityUnits
+    from .units.electric_current_gradient import ElectricCurrentGradient, ElectricCurrentGradientUnits
+    from .units.electric_field import ElectricField, ElectricFieldUnits
+    from .units.electric_inductance import ElectricInductance, ElectricInductanceUnits
+    from .units.electric_potential import ElectricPotential, ElectricPotentialUnits
+    from .units.electric_potential_ac import ElectricPotentialAc, ElectricPotentialAcUnits
+    from .units.electric_potential_change_rate import ElectricPotentialChangeRate, ElectricPotentialChangeRateUnits
+    from .units.electric_potential_dc import ElectricPotentialDc, ElectricPotentialDcUnits
+    from .units.electric_resistance import ElectricResistance, ElectricResistanceUnits
+    from .units.electric_resistivity import ElectricResistivity, ElectricResistivityUnits
+    from .units.electric_surface_charge_density import ElectricSurfaceChargeDensity, ElectricSurfaceChargeDensityUnits
+    from .units.energy import Energy, EnergyUnits
+    from .units.energy_density import EnergyDensity, EnergyDensityUnits
+    from .units.entropy import Entropy, EntropyUnits
+    from .units.force import Force, ForceUnits
+    from .units.force_change_rate import ForceChangeRate, ForceChangeRateUnits
+    from .units.force_per_length import ForcePerLength, ForcePerLengthUnits
+    from .units.frequency import Frequency, FrequencyUnits
+    from .units.fuel_efficiency import FuelEfficiency, FuelEfficiencyUnits
+    from .units.heat_flux import HeatFlux, HeatFluxUnits
+    from .units.heat_transfer_coefficient import HeatTransferCoefficient, HeatTransferCoefficientUnits
+    from .units.illuminance import Illuminance, IlluminanceUnits
+    from .units.impulse import Impulse, ImpulseUnits
+    from .units.information import Information, InformationUnits
+    from .units.irradiance import Irradiance, IrradianceUnits
+    from .units.irradiation import Irradiation, IrradiationUnits
+    from .units.jerk import Jerk, JerkUnits
+    from .units.kinematic_viscosity import KinematicViscosity, KinematicViscosityUnits
+    from .units.leak_rate import LeakRate, LeakRateUnits
+    from .units.length import Length, LengthUnits
+    from .units.level import Level, LevelUnits
+    from .units.linear_density import LinearDensity, LinearDensityUnits
+    from .units.linear_power_density import LinearPowerDensity, LinearPowerDensityUnits
+    from .units.luminance import Luminance, LuminanceUnits
+    from .units.luminosity import Luminosity, LuminosityUnits
+    from .units.luminous_flux import LuminousFlux, LuminousFluxUnits
+    from .units.luminous_intensity import LuminousIntensity, LuminousIntensityUnits
+    from .units.magnetic_field import MagneticField, MagneticFieldUnits
+    from .units.magnetic_flux import MagneticFlux, MagneticFluxUnits
+    from .units.magnetization import Magnetization, MagnetizationUnits
+    from .units.mass import Mass, MassUnits
+    from .units.mass_concentration import MassConcentration, MassConcentrationUnits
+    from .units.mass_flow import MassFlow, MassFlowUnits
+    from .units.mass_flux import MassFlux, MassFluxUnits
+    from .units.mass_fraction import MassFraction, MassFractionUnits
+    from .units.mass_moment_of_inertia import MassMomentOfInertia, MassMomentOfInertiaUnits
+    from .units.molar_energy import MolarEnergy, MolarEnergyUnits
+    from .units.molar_entropy import MolarEntropy, MolarEntropyUnits
+    from .units.molar_flow import MolarFlow, MolarFlowUnits
+    from .units.molar_mass import MolarMass, MolarMassUnits
+    from .units.molarity import Molarity, MolarityUnits
+    from .units.permeability import Permeability, PermeabilityUnits
+    from .units.permittivity import Permittivity, PermittivityUnits
+    from .units.porous_medium_permeability import PorousMediumPermeability, PorousMediumPermeabilityUnits
+    from .units.power import Power, PowerUnits
+    from .units.power_density import PowerDensity, PowerDensityUnits
+    from .units.power_ratio import PowerRatio, PowerRatioUnits
+    from .units.pressure import Pressure, PressureUnits
+    from .units.pressure_change_rate import PressureChangeRate, PressureChangeRateUnits
+    from .units.ratio import Ratio, RatioUnits
+    from .units.ratio_change_rate import RatioChangeRate, RatioChangeRateUnits
+    from .units.reactive_energy import ReactiveEnergy, ReactiveEnergyUnits
+    from .units.reactive_power import ReactivePower, ReactivePowerUnits
+    from .units.reciprocal_area import ReciprocalArea, ReciprocalAreaUnits
+    from .units.reciprocal_length import ReciprocalLength, ReciprocalLengthUnits
+    from .units.relative_humidity import RelativeHumidity, RelativeHumidityUnits
+    from .units.rotational_acceleration import RotationalAcceleration, RotationalAccelerationUnits
+    from .units.rotational_speed import RotationalSpeed, RotationalSpeedUnits
+    from .units.rotational_stiffness import RotationalStiffness, RotationalStiffnessUnits
+    from .units.rotational_stiffness_per_length import RotationalStiffnessPerLength, RotationalStiffnessPerLengthUnits
+    from .units.scalar import Scalar, ScalarUnits
+    from .units.solid_angle import SolidAngle, SolidAngleUnits
+    from .units.specific_energy import SpecificEnergy, SpecificEnergyUnits
+    from .units.specific_entropy import SpecificEntropy, SpecificEntropyUnits
+    from .units.specific_fuel_consumption import SpecificFuelConsumption, SpecificFuelConsumptionUnits
+    from .units.specific_volume import SpecificVolume, SpecificVolumeUnits
+    from .units.specific_weight import SpecificWeight, SpecificWeightUnits
+    from .units.speed import Speed, SpeedUnits
+    from .units.standard_volume_flow import StandardVolumeFlow, StandardVolumeFlowUnits
+    from .units.temperature import Temperature, TemperatureUnits
+    from .units.temperature_change_rate import TemperatureChangeRate, TemperatureChangeRateUnits
+    from .units.temperature_delta import TemperatureDelta, TemperatureDeltaUnits
+    from .units.temperature_gradient import TemperatureGradient, TemperatureGradientUnits
+    from .units.thermal_conductivity import ThermalConductivity, ThermalConductivityUnits
+    from .units.thermal_resistance import ThermalResistance, ThermalResistanceUnits
+    from .units.torque import Torque, TorqueUnits
+    from .units.torque_per_length import TorquePerLength, TorquePerLengthUnits
+    from .units.turbidity import Turbidity, TurbidityUnits
+    from .units.vitamin_a import VitaminA, VitaminAUnits
+    from .units.volume import Volume, VolumeUnits
+    from .units.volume_concentration import VolumeConcentration, VolumeConcentrationUnits
+    from .units.volume_flow import VolumeFlow, VolumeFlowUnits
+    from .units.volume_flow_per_area import VolumeFlowPerArea, VolumeFlowPerAreaUnits
+    from .units.volume_per_length import VolumePerLength, VolumePerLengthUnits
+    from .units.volumetric_heat_capacity import VolumetricHeatCapacity, VolumetricHeatCapacityUnits
+    from .units.warping_moment_of_inertia import WarpingMomentOfInertia, WarpingMomentOfInertiaUnits
+
+
+# The quantity modules under 'units', imported on first access to a quantity or its units (PEP 562).
+_quantity_modules = {
+    'AbsorbedDoseOfIonizingRadiation': 'absorbed_dose_of_ionizing_radiation',
+    'Acceleration': 'acceleration',
+    'AmountOfSubstance': 'amount_of_substance',
+    'AmplitudeRatio': 'amplitude_ratio',
+    'Angle': 'angle',
+    'ApparentEnergy': 'apparent_energy',
+    'ApparentPower': 'apparent_power',
+    'Area': 'area',
+    'AreaDensity': 'area_density',
+    'AreaMomentOfInertia': 'area_moment_of_inertia',
+    'BitRate': 'bit_rate',
+    'BrakeSpecificFuelConsumption': 'brake_specific_fuel_consumption',
+    'Capacitance': 'capacitance',
+    'CoefficientOfThermalExpansion': 'coefficient_of_thermal_expansion',
+    'Compressibility': 'compressibility',
+    'Density': 'density',
+    'Duration': 'duration',
+    'DynamicViscosity': 'dynamic_viscosity',
+    'ElectricAdmittance': 'electric_admittance',
+    'ElectricCharge': 'electric_charge',
+    'ElectricChargeDensity': 'electric_charge_density',
+    'ElectricConductance': 'electric_conductance',
+    'ElectricConductivity': 'electric_conductivity',
+    'ElectricCurrent': 'electric_current',
+    'ElectricCurrentDensity': 'electric_current_density',
+    'ElectricCurrentGradient': 'electric_current_gradient',
+    'ElectricField': 'electric_field',
+    'ElectricInductance': 'electric_inductance',
+    'ElectricPotential': 'electric_potential',
+    'ElectricPotentialAc': 'electric_potential_ac',
+    'ElectricPotentialChangeRate': 'electric_potential_change_rate',
+    'ElectricPotentialDc': 'electric_potential_dc',
+    'ElectricResistance': 'electric_resistance',
+    'ElectricResistivity': 'electric_resistivity',
+    'ElectricSurfaceChargeDensity': 'electric_surface_charge_density',
+    'Energy': 'energy',
+    'EnergyDensity': 'energy_density',
+    'Entropy': 'entropy',
+    'Force': 'force',
+    'ForceChangeRate': 'force_change_rate',
+    'ForcePerLength': 'force_per_length',
+    'Frequency': 'frequency',
+    'FuelEfficiency': 'fuel_efficiency',
+    'HeatFlux': 'heat_flux',
+    'HeatTransferCoefficient': 'heat_transfer_coefficient',
+    'Illuminance': 'illuminance',
+    'Impulse': 'impulse',
+    'Information': 'information',
+    'Irradiance': 'irradiance',
+    'Irradiation': 'irradiation',
+    'Jerk': 'jerk',
+    'KinematicViscosity': 'kinematic_viscosity',
+    'LeakRate': 'leak_rate',
+    'Length': 'length',
+    'Level': 'level',
+    'LinearDensity': 'linear_density',
+    'LinearPowerDensity': 'linear_power_density',
+    'Luminance': 'luminance',
+    'Luminosity': 'luminosity',
+    'LuminousFlux': 'luminous_flux',
+    'LuminousIntensity': 'luminous_intensity',
+    'MagneticField': 'magnetic_field',
+    'MagneticFlux': 'magnetic_flux',
+    'Magnetization': 'magnetization',
+    'Mass': 'mass',
+    'MassConcentration': 'mass_concentration',
+    'MassFlow': 'mass_flow',
+    'MassFlux': 'mass_flux',
+    'MassFraction': 'mass_fraction',
+    'MassMomentOfInertia': 'mass_moment_of_inertia',
+    'MolarEnergy': 'molar_energy',
+    'MolarEntropy': 'molar_entropy',
+    'MolarFlow': 'molar_flow',
+    'MolarMass': 'molar_mass',
+    'Molarity': 'molarity',
+    'Permeability': 'permeability',
+    'Permittivity': 'permittivity',
+    'PorousMediumPermeability': 'porous_medium_permeability',
+    'Power': 'power',
+    'PowerDensity': 'power_density',
+    'PowerRatio': 'power_ratio',
+    'Pressure': 'pressure',
+    'PressureChangeRate': 'pressure_change_rate',
+    'Ratio': 'ratio',
+    'RatioChangeRate': 'ratio_change_rate',
+    'ReactiveEnergy': 'reactive_energy',
+    'ReactivePower': 'reactive_power',
+    'ReciprocalArea': 'reciprocal_area',
+    'ReciprocalLength': 'reciprocal_length',
+    'RelativeHumidity': 'relative_humidity',
+    'RotationalAcceleration': 'rotational_acceleration',
+    'RotationalSpeed': 'rotational_speed',
+    'RotationalStiffness': 'rotational_stiffness',
+    'RotationalStiffnessPerLength': 'rotational_stiffness_per_length',
+    'Scalar': 'scalar',
+    'SolidAngle': 'solid_angle',
+    'SpecificEnergy': 'specific_energy',
+    'SpecificEntropy': 'specific_entropy',
+    'SpecificFuelConsumption': 'specific_fuel_consumption',
+    'SpecificVolume': 'specific_volume',
+    'SpecificWeight': 'specific_weight',
+    'Speed': 'speed',
+    'StandardVolumeFlow': 'standard_volume_flow',
+    'Temperature': 'temperature',
+    'TemperatureChangeRate': 'temperature_change_rate',
+    'TemperatureDelta': 'temperature_delta',
+    'TemperatureGradient': 'temperature_gradient',
+    'ThermalConductivity': 'thermal_conductivity',
+    'ThermalResistance': 'thermal_resistance',
+    'Torque': 'torque',
+    'TorquePerLength': 'torque_per_length',
+    'Turbidity': 'turbidity',
+    'VitaminA': 'vitamin_a',
+    'Volume': 'volume',
+    'VolumeConcentration': 'volume_concentration',
+    'VolumeFlow': 'volume_flow',
+    'VolumeFlowPerArea': 'volume_flow_per_area',
+    'VolumePerLength': 'volume_per_length',
+    'VolumetricHeatCapacity': 'volumetric_heat_capacity',
+    'WarpingMomentOfInertia': 'warping_moment_of_inertia',
+}
+
+# The pinned binary codec id of each quantity, see 'unitsnet_py.binary'.
+_quantity_binary_ids = {
+    'AbsorbedDoseOfIonizingRadiation': 0,
+    'Acceleration': 1,
+    'AmountOfSubstance': 2,
+    'AmplitudeRatio': 3,
+    'Angle': 4,
+    'ApparentEnergy': 5,
+    'ApparentPower': 6,
+    'Area': 7,
+    'AreaDensity': 8,
+    'AreaMomentOfInertia': 9,
+    'BitRate': 10,
+    'BrakeSpecificFuelConsumption': 11,
+    'Capacitance': 12,
+    'CoefficientOfThermalExpansion': 13,
+    'Compressibility': 14,
+    'Density': 15,
+    'Duration': 16,
+    'DynamicViscosity': 17,
+    'ElectricAdmittance': 18,
+    'ElectricCharge': 19,
+    'ElectricChargeDensity': 20,
+    'ElectricConductance': 21,
+    'ElectricConductivity': 22,
+    'ElectricCurrent': 23,
+    'ElectricCurrentDensity': 24,
+    'ElectricCurrentGradient': 25,
+    'ElectricField': 26,
+    'ElectricInductance': 27,
+    'ElectricPotential': 28,
+    'ElectricPotentialAc': 29,
+    'ElectricPotentialChangeRate': 30,
+    'ElectricPotentialDc': 31,
+    'ElectricResistance': 32,
+    'ElectricResistivity': 33,
+    'ElectricSurfaceChargeDensity': 34,
+    'Energy': 35,
+    'EnergyDensity': 36,
+    'Entropy': 37,
+    'Force': 38,
+    'ForceChangeRate': 39,
+    'ForcePerLength': 40,
+    'Frequency': 41,
+    'FuelEfficiency': 42,
+    'HeatFlux': 43,
+    'HeatTransferCoefficient': 44,
+    'Illuminance': 45,
+    'Impulse': 46,
+    'Information': 47,
+    'Irradiance': 48,
+    'Irradiation': 49,
+    'Jerk': 50,
+    'KinematicViscosity': 51,
+    'LeakRate': 52,
+    'Length': 53,
+    'Level': 54,
+    'LinearDensity': 55,
+    'LinearPowerDensity': 56,
+    'Luminance': 57,
+    'Luminosity': 58,
+    'LuminousFlux': 59,
+    'LuminousIntensity': 60,
+    'MagneticField': 61,
+    'MagneticFlux': 62,
+    'Magnetization': 63,
+    'Mass': 64,
+    'MassConcentration': 65,
+    'MassFlow': 66,
+    'MassFlux': 67,
+    'MassFraction': 68,
+    'MassMomentOfInertia': 69,
+    'MolarEnergy': 70,
+    'MolarEntropy': 71,
+    'MolarFlow': 72,
+    'MolarMass': 73,
+    'Molarity': 74,
+    'Permeability': 75,
+    'Permittivity': 76,
+    'PorousMediumPermeability': 77,
+    'Power': 78,
+    'PowerDensity': 79,
+    'PowerRatio': 80,
+    'Pressure': 81,
+    'PressureChangeRate': 82,
+    'Ratio': 83,
+    'RatioChangeRate': 84,
+    'ReactiveEnergy': 85,
+    'ReactivePower': 86,
+    'ReciprocalArea': 87,
+    'ReciprocalLength': 88,
+    'RelativeHumidity': 89,
+    'RotationalAcceleration': 90,
+    'RotationalSpeed': 91,
+    'RotationalStiffness': 92,
+    'RotationalStiffnessPerLength': 93,
+    'Scalar': 94,
+    'SolidAngle': 95,
+    'SpecificEnergy': 96,
+    'SpecificEntropy': 97,
+    'SpecificFuelConsumption': 98,
+    'SpecificVolume': 99,
+    'SpecificWeight': 100,
+    'Speed': 101,
+    'StandardVolumeFlow': 102,
+    'Temperature': 103,
+    'TemperatureChangeRate': 104,
+    'TemperatureDelta': 105,
+    'TemperatureGradient': 106,
+    'ThermalConductivity': 107,
+    'ThermalResistance': 108,
+    'Torque': 109,
+    'TorquePerLength': 110,
+    'Turbidity': 111,
+    'VitaminA': 112,
+    'Volume': 113,
+    'VolumeConcentration': 114,
+    'VolumeFlow': 115,
+    'VolumeFlowPerArea': 116,
+    'VolumePerLength': 117,
+    'VolumetricHeatCapacity': 118,
+    'WarpingMomentOfInertia': 119,
+}
+
+# The modules of the package functions, imported on first access.
+_function_modules = {
+    'parse': 'parsing',
+    'try_parse': 'parsing',
+    'stats': 'instrumentation',
+}
+
+
+def __getattr__(name: str):
+    quantity_name = name[:-len("Units")] if name.endswith("Units") else name
+    if quantity_name in _quantity_modules:
+        module_name = f".units.{_quantity_modules[quantity_name]}"
+    elif name in _function_modules:
+        module_name = f".{_function_modules[name]}"
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = [
+ 'parse', 'try_parse', 'stats',
  'AbsorbedDoseOfIonizingRadiation', 'AbsorbedDoseOfIonizingRadiationUnits',
  'Acceleration', 'AccelerationUnits',
  'AmountOfSubstance', 'AmountOfSubstanceUnits',
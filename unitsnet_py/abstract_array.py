@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import importlib
+from typing import Callable, Dict, Iterator
+
+try:
+    import numpy as np
+except ImportError as error:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "Quantity arrays require NumPy, install it using 'pip install numpy'"
+    ) from error
+
+from . import binary
+from .abstract_unit import _REAL_NUMBERS, AbstractMeasure
+
+
+def _get_array_class(quantity: type) -> type:
+    """
+    Get the array class of a quantity, e.g. LengthArray of Length.
+    """
+    module = importlib.import_module(quantity.__module__.replace(".units.", ".arrays."))
+    return getattr(module, f"{quantity.__name__}Array")
+
+
+class AbstractQuantityArray:
+    """
+    Base class of the NumPy backed quantity arrays.
+
+    The values are held as a read-only float64 ndarray in the quantity base unit,
+    conversions are applied as whole-array expressions of the generated formulas.
+    """
+
+    __slots__ = ("_values",)
+
+    # Arrays compare element-wise, same as ndarray they are not hashable.
+    __hash__ = None
+
+    # Make NumPy defer to the reflected operators instead of broadcasting over the items.
+    __array_ufunc__ = None
+
+    _values: np.ndarray
+    _quantity: type
+    _conversions_from_base: Dict[object, Callable[[np.ndarray], np.ndarray]]
+    _conversions_to_base: Dict[object, Callable[[np.ndarray], np.ndarray]]
+
+    def _init_values(self, values, from_unit):
+        values = np.array(values, dtype=np.float64)
+        if np.isnan(values).any():
+            raise ValueError("Invalid unit: values contain NaN")
+        self._values = self._readonly(self._conversions_to_base[from_unit](values))
+
+    @classmethod
+    def _from_base_values(cls, values: np.ndarray):
+        instance = object.__new__(cls)
+        instance._values = cls._readonly(values)
+        return instance
+
+    @staticmethod
+    def _readonly(values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float64)
+        values.flags.writeable = False
+        return values
+
+    @property
+    def base_values(self) -> np.ndarray:
+        return self._values
+
+    def convert(self, unit) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @classmethod
+    def convert_values(cls, values, from_unit, to_unit, out: np.ndarray = None) -> np.ndarray:
+        """
+        Convert raw values from one unit to another, without creating an array instance.
+
+        Affine conversions (e.g. Fahrenheit to Celsius) are collapsed once to a single scale and offset,
+        then applied in place, a multiply and an add pass without temporary arrays.
+
+        :param values: The values, in 'from_unit'.
+        :param from_unit: The unit of the values.
+        :param to_unit: The unit to convert to.
+        :param out: The float64 ndarray to write the result to (may be 'values' itself), by default a new one.
+        :return: The converted values.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        factors = cls._quantity._get_conversion_factors(from_unit, to_unit)
+        if factors is None:
+            result = cls._conversions_from_base[to_unit](cls._conversions_to_base[from_unit](values))
+            if out is None:
+                return np.array(result, dtype=np.float64)
+            out[...] = result
+            return out
+        scale, offset = factors
+        out = np.multiply(values, scale, out=out)
+        if offset:
+            np.add(out, offset, out=out)
+        return out
+
+    def to_binary(self) -> bytes:
+        """
+        Encode the base values to a batch, see 'unitsnet_py.binary'.
+        """
+        return binary.encode_batch(self._values, self._quantity)
+
+    @classmethod
+    def from_binary(cls, data):
+        """
+        Decode a batch of the array quantity, base unit batches reference the data without a copy.
+        """
+        instance = binary.decode_array(data)
+        if not isinstance(instance, cls):
+            raise ValueError(f"Invalid batch data: expected {cls._quantity.__name__}")
+        return instance
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[AbstractMeasure]:
+        from_base = self._quantity._from_base
+        for value in self._values.tolist():
+            yield from_base(value)
+
+    def __getitem__(self, index):
+        values = self._values[index]
+        if np.ndim(values) == 0:
+            return self._quantity._from_base(float(values))
+        return self._from_base_values(values)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._values.tolist()!r})"
+
+    def __other_values(self, other):
+        if isinstance(other, type(self)):
+            return other._values
+        if isinstance(other, self._quantity):
+            return other._value
+        return None
+
+    @staticmethod
+    def __operand(other):
+        if isinstance(other, AbstractQuantityArray):
+            return other._quantity, other._values
+        if isinstance(other, AbstractMeasure):
+            return type(other), other._value
+        return None, None
+
+    def __affine_add(self, other):
+        # Points on an absolute scale only add up with their differences (e.g. Temperature + TemperatureDelta).
+        quantity = self._quantity
+        other_quantity, values = self.__operand(other)
+        if other_quantity is None:
+            return NotImplemented
+        if quantity._delta_quantity is not None:
+            if other_quantity is not quantity._get_delta_quantity():
+                return NotImplemented
+            return self._from_base_values(self._values + values)
+        if other_quantity._delta_quantity is None or other_quantity._get_delta_quantity() is not quantity:
+            return NotImplemented
+        return _get_array_class(other_quantity)._from_base_values(values + self._values)
+
+    def __add__(self, other):
+        values = self.__other_values(other)
+        if values is None or self._quantity._delta_quantity is not None:
+            return self.__affine_add(other)
+        return self._from_base_values(self._values + values)
+
+    def __sub__(self, other):
+        quantity = self._quantity
+        values = self.__other_values(other)
+        if values is None:
+            if quantity._delta_quantity is None:
+                return NotImplemented
+            other_quantity, values = self.__operand(other)
+            if other_quantity is not quantity._get_delta_quantity():
+                return NotImplemented
+            return self._from_base_values(self._values - values)
+        if quantity._delta_quantity is not None:
+            return _get_array_class(quantity._get_delta_quantity())._from_base_values(self._values - values)
+        return self._from_base_values(self._values - values)
+
+    def __dimension_operation(self, other, operator: str, reflected: bool = False):
+        if not isinstance(other, (int, float)) and isinstance(other, _REAL_NUMBERS):
+            other = float(other)
+        if isinstance(other, (int, float)):
+            if reflected and operator == "/":
+                return NotImplemented
+            values = self._values * other if operator == "*" else self._values / other
+            if np.isnan(values).any():
+                raise ValueError("Invalid unit: values contain NaN")
+            return self._from_base_values(values)
+        other_quantity, values = self.__operand(other)
+        if other_quantity is None:
+            return NotImplemented
+        if reflected:
+            result = other_quantity._get_dimension_result(self._quantity, operator)
+            left, right = values, self._values
+        else:
+            result = self._quantity._get_dimension_result(other_quantity, operator)
+            left, right = self._values, values
+        if result is None:
+            # Quantities out of the dimensional arithmetic keep operating as the same quantity.
+            if other_quantity is not self._quantity or self._quantity._dimensions is not None:
+                return NotImplemented
+            return self._from_base_values(left * right if operator == "*" else left / right)
+        quantity, factor = result
+        values = (left * right if operator == "*" else left / right) * factor
+        if quantity is float:
+            return values
+        return _get_array_class(quantity)._from_base_values(values)
+
+    def __mul__(self, other):
+        return self.__dimension_operation(other, "*")
+
+    def __truediv__(self, other):
+        return self.__dimension_operation(other, "/")
+
+    def __radd__(self, other):
+        values = self.__other_values(other)
+        if values is None or self._quantity._delta_quantity is not None:
+            return self.__affine_add(other)
+        return self._from_base_values(values + self._values)
+
+    def __rsub__(self, other):
+        quantity = self._quantity
+        values = self.__other_values(other)
+        if values is None:
+            # delta - point is not defined, point - delta arrays are handled by the points __sub__.
+            other_quantity, values = self.__operand(other)
+            if (
+                other_quantity is None
+                or other_quantity._delta_quantity is None
+                or other_quantity._get_delta_quantity() is not quantity
+            ):
+                return NotImplemented
+            return _get_array_class(other_quantity)._from_base_values(values - self._values)
+        if quantity._delta_quantity is not None:
+            return _get_array_class(quantity._get_delta_quantity())._from_base_values(values - self._values)
+        return self._from_base_values(values - self._values)
+
+    def __rmul__(self, other):
+        return self.__dimension_operation(other, "*", reflected=True)
+
+    def __rtruediv__(self, other):
+        return self.__dimension_operation(other, "/", reflected=True)
+
+    def __mod__(self, other):
+        values = self.__other_values(other)
+        if values is None:
+            return NotImplemented
+        return self._from_base_values(self._values % values)
+
+    def __pow__(self, other):
+        values = self.__other_values(other)
+        if values is None:
+            return NotImplemented
+        return self._from_base_values(self._values ** values)
+
+    def __neg__(self):
+        return self._from_base_values(-self._values)
+
+    def __abs__(self):
+        return self._from_base_values(np.abs(self._values))
+
+    def __eq__(self, other):
+        values = self.__other_values(other)
+        if values is None:
+            return NotImplemented
+        return self._values == values
+
+    def __ne__(self, other):
+        values = self.__other_values(other)
+        if values is None:
+            return NotImplemented
+        return self._values != values
+
+    def __lt__(self, other):
+        values = self.__other_values(other)
+        if values is None:
+            return NotImplemented
+        return self._values < values
+
+    def __le__(self, other):
+        values = self.__other_values(other)
+        if values is None:
+            return NotImplemented
+        return self._values <= values
+
+    def __gt__(self, other):
+        values = self.__other_values(other)
+        if values is None:
+            return NotImplemented
+        return self._values > values
+
+    def __ge__(self, other):
+        values = self.__other_values(other)
+        if values is None:
+            return NotImplemented
+        return self._values >= values
@@ -1,50 +1,522 @@
 from __future__ import annotations
 
+import importlib
+import json
+import numbers
+import re
+from decimal import Decimal
+from enum import Enum
 from functools import total_ordering
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
+
+from . import binary, dto
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
+    ExactValue = Union[Fraction, Decimal, int, str]
+
+
+# Collapsed (scale, offset) per (quantity, from unit, to unit), resolved once on first use.
+# The quantity is part of the key, so the units are validated against each quantity before their first use.
+# Pairs involving a non-affine unit map to None and are converted through the base unit.
+_conversion_factors: Dict[Tuple[type, object, object], Optional[Tuple[float, float]]] = {}
+
+# Exact (scale, offset) Fractions per (quantity, from unit, to unit), parsed once from the generated tables on first use.
+_exact_factors: Dict[Tuple[type, object, object], Tuple[Fraction, Fraction]] = {}
+
+# The exact values types, imported on the first exact conversion (fractions is slow to import).
+_Fraction: Optional[type] = None
+_Decimal: Optional[type] = None
+
+# The instance cache key of the exact base value of the instances created by 'from_exact'.
+_EXACT_BASE_VALUE = "exact_base_value"
+
+# (quantity, other quantity, operator) -> (result quantity, base values factor) of the dimensional arithmetic,
+# resolved once on first use. The result quantity is float for dimensionless results,
+# and the pair maps to None when the operands have no dimensional result.
+_dimension_results: Dict[Tuple[type, type, str], Optional[Tuple[type, float]]] = {}
+
+# Quantity with affine units -> the quantity of its differences (e.g. Temperature -> TemperatureDelta), resolved on first use.
+_delta_quantities: Dict[type, type] = {}
+
+# The quantity classes, in creation order, and the functions called with each new quantity class.
+# Used by 'instrumentation' to swap the methods of the quantities, including the ones imported later.
+_quantity_classes: List[type] = []
+_quantity_class_hooks: List[Callable[[type], None]] = []
+
+# Abbreviation -> units index of each quantity, built on the first parse of the quantity.
+_abbreviation_indexes: Dict[type, Dict[str, Tuple[object, ...]]] = {}
+
+# Fallback for strings that do not separate the value and the abbreviation with a single space.
+_quantity_string_pattern = re.compile(r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(.*?)\s*$")
+
+T = TypeVar("T", bound="AbstractMeasure")
+
+# The scalars of the arithmetic besides int and float (e.g. Fraction), converted to float (Decimal is not Real).
+_REAL_NUMBERS = (numbers.Real, Decimal)
+
+# Allocates instances without __init__, see 'AbstractMeasure._from_base'.
+_new = object.__new__
+
+
+def _get_quantity(quantity: Union[str, Type[AbstractMeasure]]) -> Type[AbstractMeasure]:
+    """
+    Get a quantity class by its name (e.g. "Length"), importing its module on first use.
+    A quantity class is returned as is.
+
+    :raises ValueError: When the quantity is unknown.
+    """
+    if isinstance(quantity, type) and issubclass(quantity, AbstractMeasure):
+        return quantity
+    from . import _quantity_modules
+
+    module_name = _quantity_modules.get(quantity)
+    if module_name is None:
+        raise ValueError(f'Unknown quantity "{quantity}"')
+    return getattr(importlib.import_module(f".units.{module_name}", __package__), quantity)
+
+
+def _split_quantity_string(text: str) -> Tuple[float, str]:
+    """
+    Split a quantity string such as "12.5 km" to its value and unit abbreviation.
+    """
+    value, _, abbreviation = text.partition(" ")
+    try:
+        return float(value), abbreviation.strip()
+    except ValueError:
+        pass
+    match = _quantity_string_pattern.match(text)
+    if match is None:
+        raise ValueError(f'Unable to parse "{text}": expected a value followed by a unit abbreviation')
+    return float(match.group(1)), match.group(2)
 
 
 @total_ordering
 class AbstractMeasure:
+    """
+    Base class of all the quantities.
+
+    Quantities are immutable value objects: the base value is set once on creation,
+    unit properties are read-only and every arithmetic operation returns a new instance.
+    Equal quantities have equal hashes, so they can be used as dict keys and set members.
+    """
+
+    # Instances hold the base value and an optional per-unit conversion cache,
+    # the cache slot is set only on the first property access (see 'unitsnet_py.cache' for the other policies).
+    __slots__ = ("_value", "_cache")
+
     _value: float
+    _cache: Dict[object, float]
+    _units: Type[Enum]
+    _base_unit: Enum
+    _conversions_from_base: Dict[object, Callable[[float], float]]
+    _conversions_to_base: Dict[object, Callable[[float], float]]
+    # Exact (scale, offset) coefficients as 'fractions.Fraction' strings.
+    _affine_from_base: Dict[object, Tuple[str, str]]
+    _affine_to_base: Dict[object, Tuple[str, str]]
+    _abbreviations: Dict[object, Tuple[str, ...]]
+    # SI base dimensions exponents (L, M, T, I, Θ, N, J) and the SI value of one base unit (as a Fraction string),
+    # both None when the quantity does not take part in the dimensional arithmetic.
+    _dimensions: Optional[Tuple[int, ...]]
+    _si_scale: Optional[str]
+    # The name of the quantity of the differences, for quantities of points on an absolute scale (e.g. Temperature).
+    # Such points do not add up: point + delta -> point, point - point -> delta.
+    _delta_quantity: Optional[str]
+    # The pinned binary codec ids of the quantity and of its units, see 'binary'.
+    _binary_id: int
+    _binary_unit_ids: Dict[object, int]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _quantity_classes.append(cls)
+        for hook in _quantity_class_hooks:
+            hook(cls)
+
+    @classmethod
+    def _from_base(cls: Type[T], value: float) -> T:
+        """
+        Create an instance from a value already in the base unit, without the unit conversion.
+        """
+        instance = _new(cls)
+        instance._value = value
+        return instance
+
+    @classmethod
+    def _get_exact_factors(cls, from_unit, to_unit) -> Tuple[Fraction, Fraction]:
+        try:
+            return _exact_factors[cls, from_unit, to_unit]
+        except KeyError:
+            pass
+        from_to_base = cls._affine_to_base.get(from_unit)
+        to_to_base = cls._affine_to_base.get(to_unit)
+        if from_to_base is None or to_to_base is None:
+            raise ValueError(f"{cls.__name__} has no exact conversion from {from_unit} to {to_unit}")
+        global _Fraction, _Decimal
+        from decimal import Decimal as _Decimal
+        from fractions import Fraction as _Fraction
+
+        # Only the to-base coefficients are used, the generated from-base formulas may use rounded inverse
+        # constants (e.g. 180 / math.pi), so each pair is the exact inverse of the reversed pair:
+        # y = (from_scale * x + from_offset - to_offset) / to_scale.
+        from_scale, from_offset = map(_Fraction, from_to_base)
+        to_scale, to_offset = map(_Fraction, to_to_base)
+        factors = (from_scale / to_scale, (from_offset - to_offset) / to_scale)
+        _exact_factors[cls, from_unit, to_unit] = factors
+        return factors
+
+    @classmethod
+    def _resolve_conversion_factors(cls, from_unit, to_unit) -> Optional[Tuple[float, float]]:
+        if from_unit == to_unit:
+            return 1.0, 0.0
+        to_base = cls._affine_to_base.get(from_unit)
+        from_base = cls._affine_from_base.get(to_unit)
+        if to_base is None or from_base is None:
+            return None
+        # Imported here, fractions is only needed once per resolved pair and slow to import.
+        from fractions import Fraction
+
+        # Collapse from_base(to_base(x)) = from_scale * (to_scale * x + to_offset) + from_offset
+        # with exact fractions, so each factor is rounded to float only once.
+        to_scale, to_offset = map(Fraction, to_base)
+        from_scale, from_offset = map(Fraction, from_base)
+        return float(from_scale * to_scale), float(from_scale * to_offset + from_offset)
+
+    @classmethod
+    def _get_conversion_factors(cls, from_unit, to_unit) -> Optional[Tuple[float, float]]:
+        try:
+            return _conversion_factors[cls, from_unit, to_unit]
+        except KeyError:
+            if from_unit not in cls._conversions_to_base or to_unit not in cls._conversions_from_base:
+                raise
+            factors = _conversion_factors[cls, from_unit, to_unit] = cls._resolve_conversion_factors(
+                from_unit, to_unit
+            )
+            return factors
+
+    @classmethod
+    def _convert_exact(cls, value: ExactValue, from_unit, to_unit) -> Union[Fraction, Decimal]:
+        scale, offset = cls._get_exact_factors(from_unit, to_unit)
+        result = (value if type(value) is _Fraction else _Fraction(value)) * scale
+        if offset:
+            result += offset
+        if isinstance(value, _Decimal):
+            return _Decimal(result.numerator) / _Decimal(result.denominator)
+        return result
+
+    @classmethod
+    def _from_exact(cls: Type[T], value: ExactValue, from_unit) -> T:
+        scale, offset = cls._get_exact_factors(from_unit, cls._base_unit)
+        value = (value if type(value) is _Fraction else _Fraction(value)) * scale
+        if offset:
+            value += offset
+        # The float base value keeps every other operation unchanged,
+        # the exact one is kept next to the converted units values.
+        instance = cls._from_base(float(value))
+        instance._cache = {_EXACT_BASE_VALUE: value}
+        return instance
+
+    def _to_exact(self, unit) -> Fraction:
+        scale, offset = self._get_exact_factors(self._base_unit, unit)
+        try:
+            value = self._cache[_EXACT_BASE_VALUE]
+        except (AttributeError, KeyError):
+            value = _Fraction(self._value)
+        value *= scale
+        return value + offset if offset else value
+
+    @classmethod
+    def _convert_value(cls, value: float, from_unit, to_unit) -> float:
+        try:
+            factors = _conversion_factors[cls, from_unit, to_unit]
+        except KeyError:
+            factors = cls._get_conversion_factors(from_unit, to_unit)
+        if factors is None:
+            return cls._conversions_from_base[to_unit](cls._conversions_to_base[from_unit](value))
+        scale, offset = factors
+        return value * scale + offset
+
+    @classmethod
+    def _get_converter(cls, from_unit, to_unit) -> Callable[[float], float]:
+        """
+        Get a function converting a value from one unit to another, resolved once for the pair.
+        """
+        factors = cls._get_conversion_factors(from_unit, to_unit)
+        if factors is None:
+            to_base = cls._conversions_to_base[from_unit]
+            from_base = cls._conversions_from_base[to_unit]
+            return lambda value: from_base(to_base(value))
+        scale, offset = factors
+        if offset == 0:
+            return lambda value: value * scale
+        return lambda value: value * scale + offset
+
+    @classmethod
+    def _convert_many(cls, values: Iterable[float], from_unit, to_unit) -> List[float]:
+        # Resolve the conversion once, then apply it in a single comprehension.
+        factors = cls._get_conversion_factors(from_unit, to_unit)
+        if factors is None:
+            to_base = cls._conversions_to_base[from_unit]
+            from_base = cls._conversions_from_base[to_unit]
+            return [from_base(to_base(value)) for value in values]
+        scale, offset = factors
+        if offset == 0:
+            return [value * scale for value in values]
+        return [value * scale + offset for value in values]
+
+    def _cached_convert(self, unit) -> float:
+        # Written without a lock: concurrent first reads may each convert, the results are equal.
+        try:
+            cache = self._cache
+        except AttributeError:
+            cache = self._cache = {}
+        else:
+            if unit in cache:
+                return cache[unit]
+        value = cache[unit] = self._conversions_from_base[unit](self._value)
+        return value
+
+    @classmethod
+    def _abbreviation_index(cls) -> Dict[str, Tuple[object, ...]]:
+        index = _abbreviation_indexes.get(cls)
+        if index is None:
+            units_by_abbreviation: Dict[str, list] = {}
+            for unit, abbreviations in cls._abbreviations.items():
+                for abbreviation in abbreviations:
+                    units_by_abbreviation.setdefault(abbreviation, []).append(unit)
+            index = _abbreviation_indexes[cls] = {
+                abbreviation: tuple(units) for abbreviation, units in units_by_abbreviation.items()
+            }
+        return index
+
+    @classmethod
+    def _resolve_unit(cls, text: str):
+        """
+        Resolve a unit from its abbreviation (e.g. "psi"), enum value or enum name.
+        """
+        units = cls._abbreviation_index().get(text)
+        if units is not None and len(units) == 1:
+            return units[0]
+        for unit in cls._units:
+            if text == unit.value or text == unit.name:
+                return unit
+        if units is not None:
+            names = ", ".join(unit.name for unit in units)
+            raise ValueError(f'Ambiguous {cls.__name__} unit "{text}" ({names})')
+        raise ValueError(f'Unknown {cls.__name__} unit "{text}"')
+
+    @classmethod
+    def _parse(cls: Type[T], text: str) -> T:
+        value, abbreviation = _split_quantity_string(text)
+        units = cls._abbreviation_index().get(abbreviation)
+        if units is None:
+            raise ValueError(f'Unable to parse "{text}": unknown {cls.__name__} unit "{abbreviation}"')
+        if len(units) > 1:
+            names = ", ".join(unit.name for unit in units)
+            raise ValueError(f'Unable to parse "{text}": ambiguous {cls.__name__} unit "{abbreviation}" ({names})')
+        return cls(value, units[0])
+
+    @classmethod
+    def _try_parse(cls: Type[T], text: str) -> Optional[T]:
+        try:
+            return cls._parse(text)
+        except ValueError:
+            return None
+
+    @classmethod
+    def _resolve_dimension_result(cls, other: type, operator: str) -> Optional[Tuple[type, float]]:
+        if cls._dimensions is None or getattr(other, "_dimensions", None) is None:
+            return None
+        sign = 1 if operator == "*" else -1
+        dimensions = tuple(
+            exponent + sign * other_exponent for exponent, other_exponent in zip(cls._dimensions, other._dimensions)
+        )
+        from fractions import Fraction
+
+        from .dimensions import get_quantity
+
+        # The SI value of the product (or quotient) of the two base values.
+        si_scale = Fraction(cls._si_scale) * Fraction(other._si_scale) ** sign
+        if not any(dimensions):
+            return float, float(si_scale)
+        quantity = get_quantity(dimensions)
+        if quantity is None:
+            return None
+        return quantity, float(si_scale / Fraction(quantity._si_scale))
+
+    @classmethod
+    def _get_dimension_result(cls, other: type, operator: str) -> Optional[Tuple[type, float]]:
+        try:
+            return _dimension_results[cls, other, operator]
+        except KeyError:
+            result = _dimension_results[cls, other, operator] = cls._resolve_dimension_result(other, operator)
+            return result
+
+    @classmethod
+    def _get_delta_quantity(cls) -> type:
+        try:
+            return _delta_quantities[cls]
+        except KeyError:
+            import importlib
+
+            quantity = _delta_quantities[cls] = getattr(importlib.import_module(__package__), cls._delta_quantity)
+            return quantity
+
+    def _to_binary(self, unit=None) -> bytes:
+        return binary.encode(self, unit)
+
+    @classmethod
+    def _from_binary(cls: Type[T], data) -> T:
+        return binary.decode(data, cls)
+
+    def _to_dto(self, hold_in_unit=None) -> Dict[str, object]:
+        return dto.to_dto(self, hold_in_unit)
+
+    def _to_json(self, hold_in_unit=None) -> str:
+        return json.dumps(dto.to_dto(self, hold_in_unit))
+
+    @classmethod
+    def _from_dto(cls: Type[T], data: Dict[str, object]) -> T:
+        return dto.from_dto(data, cls)
+
+    @classmethod
+    def _from_json(cls: Type[T], text: str) -> T:
+        return dto.from_dto(json.loads(text), cls)
 
     def __str__(self):
         return self.to_string()
 
     def __add__(self, other: AbstractMeasure):
-        if not isinstance(other, type(self)):
+        if isinstance(other, type(self)):
+            if self._delta_quantity is not None:
+                return NotImplemented
+        elif self._delta_quantity is None or not isinstance(other, self._get_delta_quantity()):
             return NotImplemented
-        return type(self)(self._value + other._value)
+        value = self._value + other._value
+        if value != value:
+            raise ValueError("Invalid unit: value is NaN")
+        return self._from_base(value)
 
-    def __mul__(self, other: AbstractMeasure):
-        if not isinstance(other, type(self)):
+    def __radd__(self, other: AbstractMeasure):
+        # Only reached for delta + point, same quantities are added by __add__.
+        if self._delta_quantity is None or not isinstance(other, self._get_delta_quantity()):
+            return NotImplemented
+        value = other._value + self._value
+        if value != value:
+            raise ValueError("Invalid unit: value is NaN")
+        return self._from_base(value)
+
+    def __mul__(self, other: Union[AbstractMeasure, float]):
+        if not isinstance(other, (int, float)) and isinstance(other, _REAL_NUMBERS):
+            other = float(other)
+        if isinstance(other, (int, float)):
+            value = self._value * other
+            if value != value:
+                raise ValueError("Invalid unit: value is NaN")
+            return self._from_base(value)
+        if not isinstance(other, AbstractMeasure):
             return NotImplemented
-        return type(self)(self._value * other._value)
+        try:
+            result = _dimension_results[type(self), type(other), "*"]
+        except KeyError:
+            result = self._get_dimension_result(type(other), "*")
+        if result is None:
+            # Quantities out of the dimensional arithmetic (e.g. Ratio) keep multiplying as the same quantity.
+            if type(other) is not type(self) or self._dimensions is not None:
+                return NotImplemented
+            return self._from_base(self._value * other._value)
+        quantity, factor = result
+        value = self._value * other._value * factor
+        return value if quantity is float else quantity._from_base(value)
+
+    def __rmul__(self, other: float):
+        if not isinstance(other, (int, float)):
+            if not isinstance(other, _REAL_NUMBERS):
+                return NotImplemented
+            other = float(other)
+        value = other * self._value
+        if value != value:
+            raise ValueError("Invalid unit: value is NaN")
+        return self._from_base(value)
 
     def __sub__(self, other: AbstractMeasure):
-        if not isinstance(other, type(self)):
+        if isinstance(other, type(self)):
+            value = self._value - other._value
+            if value != value:
+                raise ValueError("Invalid unit: value is NaN")
+            if self._delta_quantity is not None:
+                return self._get_delta_quantity()._from_base(value)
+            return self._from_base(value)
+        if self._delta_quantity is None or not isinstance(other, self._get_delta_quantity()):
             return NotImplemented
-        return type(self)(self._value - other._value)
+        value = self._value - other._value
+        if value != value:
+            raise ValueError("Invalid unit: value is NaN")
+        return self._from_base(value)
 
-    def __truediv__(self, other: AbstractMeasure):
-        if not isinstance(other, type(self)):
+    def __truediv__(self, other: Union[AbstractMeasure, float]):
+        if not isinstance(other, (int, float)) and isinstance(other, _REAL_NUMBERS):
+            other = float(other)
+        if isinstance(other, (int, float)):
+            value = self._value / other
+            if value != value:
+                raise ValueError("Invalid unit: value is NaN")
+            return self._from_base(value)
+        if not isinstance(other, AbstractMeasure):
             return NotImplemented
-        return type(self)(self._value / other._value)
+        try:
+            result = _dimension_results[type(self), type(other), "/"]
+        except KeyError:
+            result = self._get_dimension_result(type(other), "/")
+        if result is None:
+            if type(other) is not type(self) or self._dimensions is not None:
+                return NotImplemented
+            return self._from_base(self._value / other._value)
+        quantity, factor = result
+        value = self._value / other._value * factor
+        return value if quantity is float else quantity._from_base(value)
 
     def __mod__(self, other: AbstractMeasure):
         if not isinstance(other, type(self)):
             return NotImplemented
-        return type(self)(self._value % other._value)
+        value = self._value % other._value
+        if value != value:
+            raise ValueError("Invalid unit: value is NaN")
+        return self._from_base(value)
 
     def __pow__(self, other: AbstractMeasure):
         if not isinstance(other, type(self)):
             return NotImplemented
-        return type(self)(self._value ** other._value)
+        value = self._value ** other._value
+        if value != value:
+            raise ValueError("Invalid unit: value is NaN")
+        return self._from_base(value)
+
+    def __neg__(self):
+        return self._from_base(-self._value)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self._from_base(abs(self._value))
+
+    # Quantities are immutable, the in-place operators bind a new instance (same as the binary operators).
+    __iadd__ = __add__
+    __isub__ = __sub__
+    __imul__ = __mul__
+    __itruediv__ = __truediv__
 
     def __eq__(self, other: AbstractMeasure):
         if not isinstance(other, type(self)):
             return NotImplemented
         return self._value == other._value
 
+    def __hash__(self):
+        # Consistent with __eq__, which compares the base values of the same quantity.
+        return hash(self._value)
+
     def __lt__(self, other: AbstractMeasure):
         if not isinstance(other, type(self)):
             return NotImplemented
@@ -0,0 +1,223 @@
+"""
+Aggregations over collections of measurements of the same quantity.
+
+The functions accept any iterable of measurements, or a quantity array, reduce the raw base values
+and return a single quantity instance (no intermediate instance per item).
+
+    total = aggregate.sum(readings, compensated=True)
+"""
+import builtins
+import math
+from array import array
+from typing import Iterable, Iterator, Tuple, Type, TypeVar, Union
+
+from .abstract_unit import AbstractMeasure
+
+T = TypeVar("T", bound=AbstractMeasure)
+
+_missing = object()
+
+
+class _Values:
+    """
+    A single pass over the base values of measurements, checking on the fly that they are of the same quantity.
+
+    The first measurement is read on creation, to validate it and get the quantity,
+    the count is set once the values are exhausted.
+    """
+
+    __slots__ = ("quantity", "count", "_first", "_measures")
+
+    def __init__(self, measures: Iterable[T]):
+        self._measures = iter(measures)
+        self._first = next(self._measures, _missing)
+        if self._first is _missing:
+            raise ValueError("Can not aggregate an empty sequence")
+        self.quantity = type(self._first)
+        if not issubclass(self.quantity, AbstractMeasure):
+            raise TypeError(f"Can not aggregate {self.quantity.__name__}, expected quantities")
+        self.count = 0
+
+    def __iter__(self) -> Iterator[float]:
+        quantity = self.quantity
+        count = 1
+        yield self._first._value
+        for measure in self._measures:
+            if type(measure) is not quantity:
+                names = ", ".join(sorted({quantity.__name__, type(measure).__name__}))
+                raise TypeError(f"Can not aggregate different quantities ({names})")
+            count += 1
+            yield measure._value
+        self.count = count
+
+
+def __get_array_values(measures: Iterable[T]):
+    """
+    The base values of a quantity array, None for other iterables.
+    """
+    if getattr(measures, "_quantity", None) is None:
+        return None
+    values = measures.base_values
+    if not len(values):
+        raise ValueError("Can not aggregate an empty sequence")
+    return values
+
+
+def __get_values(measures: Iterable[T]) -> Tuple[Type[T], object]:
+    """
+    Get the quantity and the materialized base values (a float64 ndarray for quantity arrays, an array('d') otherwise),
+    for the aggregations that need all the values (the variance and the percentiles).
+    """
+    values = __get_array_values(measures)
+    if values is not None:
+        return measures._quantity, values
+    stream = _Values(measures)
+    return stream.quantity, array("d", stream)
+
+
+def __sum_values(values, compensated: bool) -> float:
+    if compensated:
+        # fsum tracks the exact partial sums, so the result is correctly rounded
+        # (at least as accurate as Kahan/Neumaier summation).
+        return math.fsum(values)
+    if isinstance(values, _Values):
+        return float(builtins.sum(values, 0.0))
+    return float(values.sum())
+
+
+def sum(measures: Iterable[T], compensated: bool = False) -> T:
+    """
+    Sum measurements of the same quantity.
+
+    The measurements are summed in a single pass, without materializing them.
+
+    :param measures: The measurements, or a quantity array.
+    :param compensated: Use compensated summation (math.fsum), to avoid the rounding errors accumulation.
+    :return: The sum.
+    :raises ValueError: When there are no measurements.
+    :raises TypeError: When the measurements are of different quantities,
+        or points on an absolute scale (e.g. Temperature), which do not add up.
+        The points are rejected by the quantity of the first measurement, which is consumed from an iterator.
+    """
+    values = __get_array_values(measures)
+    if values is None:
+        values = _Values(measures)
+        quantity = values.quantity
+    else:
+        quantity = measures._quantity
+    if quantity._delta_quantity is not None:
+        raise TypeError(
+            f"Can not sum {quantity.__name__} points, sum their differences ({quantity._delta_quantity}) instead"
+        )
+    return quantity._from_base(__sum_values(values, compensated))
+
+
+def mean(measures: Iterable[T], compensated: bool = False) -> T:
+    """
+    The arithmetic mean of measurements of the same quantity, see 'sum'.
+
+    Unlike their sum, the mean of points on an absolute scale (e.g. Temperature) is a point of the same scale.
+    """
+    values = __get_array_values(measures)
+    if values is not None:
+        return measures._quantity._from_base(__sum_values(values, compensated) / len(values))
+    values = _Values(measures)
+    total = __sum_values(values, compensated)
+    return values.quantity._from_base(total / values.count)
+
+
+def min(measures: Iterable[T]) -> T:
+    """
+    The smallest of measurements of the same quantity.
+    """
+    values = __get_array_values(measures)
+    if values is not None:
+        return measures._quantity._from_base(float(values.min()))
+    values = _Values(measures)
+    return values.quantity._from_base(float(builtins.min(values)))
+
+
+def max(measures: Iterable[T]) -> T:
+    """
+    The largest of measurements of the same quantity.
+    """
+    values = __get_array_values(measures)
+    if values is not None:
+        return measures._quantity._from_base(float(values.max()))
+    values = _Values(measures)
+    return values.quantity._from_base(float(builtins.max(values)))
+
+
+def __variance(values, ddof: int) -> float:
+    count = len(values)
+    if count - ddof <= 0:
+        raise ValueError(f"Can not compute the variance of {count} measurements with ddof={ddof}")
+    if not isinstance(values, array):
+        return float(values.var(ddof=ddof))
+    # Two passes over the values (mean, then the squared deviations) are stable with large offsets.
+    average = math.fsum(values) / count
+    return math.fsum([(value - average) * (value - average) for value in values]) / (count - ddof)
+
+
+def __get_spread_quantity(quantity: type) -> type:
+    """
+    The quantity of the spread of measurements, the quantity of the differences for points on an absolute scale.
+    """
+    return quantity if quantity._delta_quantity is None else quantity._get_delta_quantity()
+
+
+def variance(measures: Iterable[T], ddof: int = 0) -> Union[AbstractMeasure, float]:
+    """
+    The variance of measurements of the same quantity.
+
+    The variance unit is the square of the quantity unit, so the result is the quantity of the squared dimensions
+    (e.g. Area for Length), or a float in the square of the base unit when there is no such quantity.
+    The variance of points on an absolute scale is the one of their differences
+    (e.g. the square of TemperatureDelta for Temperature, a float in K² as there is no such quantity).
+
+    :param measures: The measurements, or a quantity array.
+    :param ddof: The delta degrees of freedom, 0 for the population variance and 1 for the sample variance.
+    :return: The variance.
+    """
+    quantity, values = __get_values(measures)
+    value = __variance(values, ddof)
+    quantity = __get_spread_quantity(quantity)
+    result = quantity._get_dimension_result(quantity, "*")
+    if result is None or result[0] is float:
+        return value
+    result_quantity, factor = result
+    return result_quantity._from_base(value * factor)
+
+
+def stdev(measures: Iterable[T], ddof: int = 0) -> AbstractMeasure:
+    """
+    The standard deviation of measurements of the same quantity, see 'variance'.
+
+    The standard deviation of points on an absolute scale is a difference (e.g. TemperatureDelta for Temperature).
+    """
+    quantity, values = __get_values(measures)
+    return __get_spread_quantity(quantity)._from_base(math.sqrt(__variance(values, ddof)))
+
+
+def percentile(measures: Iterable[T], q: float) -> T:
+    """
+    The q-th percentile of measurements of the same quantity,
+    interpolated linearly between the closest ranks (the NumPy default method).
+
+    :param measures: The measurements, or a quantity array.
+    :param q: The percentile, between 0 and 100.
+    :return: The percentile.
+    """
+    if not 0 <= q <= 100:
+        raise ValueError(f"Invalid percentile {q}, expected a value between 0 and 100")
+    quantity, values = __get_values(measures)
+    if not isinstance(values, array):
+        import numpy as np
+
+        return quantity._from_base(float(np.percentile(values, q)))
+    values = sorted(values)
+    position = (len(values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = builtins.min(lower + 1, len(values) - 1)
+    value = values[lower] + (values[upper] - values[lower]) * (position - lower)
+    return quantity._from_base(float(value))
@@ -0,0 +1,387 @@
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .absorbed_dose_of_ionizing_radiation import AbsorbedDoseOfIonizingRadiationArray
+    from .acceleration import AccelerationArray
+    from .amount_of_substance import AmountOfSubstanceArray
+    from .amplitude_ratio import AmplitudeRatioArray
+    from .angle import AngleArray
+    from .apparent_energy import ApparentEnergyArray
+    from .apparent_power import ApparentPowerArray
+    from .area import AreaArray
+    from .area_density import AreaDensityArray
+    from .area_moment_of_inertia import AreaMomentOfInertiaArray
+    from .bit_rate import BitRateArray
+    from .brake_specific_fuel_consumption import BrakeSpecificFuelConsumptionArray
+    from .capacitance import CapacitanceArray
+    from .coefficient_of_thermal_expansion import CoefficientOfThermalExpansionArray
+    from .compressibility import CompressibilityArray
+    from .density import DensityArray
+    from .duration import DurationArray
+    from .dynamic_viscosity import DynamicViscosityArray
+    from .electric_admittance import ElectricAdmittanceArray
+    from .electric_charge import ElectricChargeArray
+    from .electric_charge_density import ElectricChargeDensityArray
+    from .electric_conductance import ElectricConductanceArray
+    from .electric_conductivity import ElectricConductivityArray
+    from .electric_current import ElectricCurrentArray
+    from .electric_current_density import ElectricCurrentDensityArray
+    from .electric_current_gradient import ElectricCurrentGradientArray
+    from .electric_field import ElectricFieldArray
+    from .electric_inductance import ElectricInductanceArray
+    from .electric_potential import ElectricPotentialArray
+    from .electric_potential_ac import ElectricPotentialAcArray
+    from .electric_potential_change_rate import ElectricPotentialChangeRateArray
+    from .electric_potential_dc import ElectricPotentialDcArray
+    from .electric_resistance import ElectricResistanceArray
+    from .electric_resistivity import ElectricResistivityArray
+    from .electric_surface_charge_density import ElectricSurfaceChargeDensityArray
+    from .energy import EnergyArray
+    from .energy_density import EnergyDensityArray
+    from .entropy import EntropyArray
+    from .force import ForceArray
+    from .force_change_rate import ForceChangeRateArray
+    from .force_per_length import ForcePerLengthArray
+    from .frequency import FrequencyArray
+    from .fuel_efficiency import FuelEfficiencyArray
+    from .heat_flux import HeatFluxArray
+    from .heat_transfer_coefficient import HeatTransferCoefficientArray
+    from .illuminance import IlluminanceArray
+    from .impulse import ImpulseArray
+    from .information import InformationArray
+    from .irradiance import IrradianceArray
+    from .irradiation import IrradiationArray
+    from .jerk import JerkArray
+    from .kinematic_viscosity import KinematicViscosityArray
+    from .leak_rate import LeakRateArray
+    from .length import LengthArray
+    from .level import LevelArray
+    from .linear_density import LinearDensityArray
+    from .linear_power_density import LinearPowerDensityArray
+    from .luminance import LuminanceArray
+    from .luminosity import LuminosityArray
+    from .luminous_flux import LuminousFluxArray
+    from .luminous_intensity import LuminousIntensityArray
+    from .magnetic_field import MagneticFieldArray
+    from .magnetic_flux import MagneticFluxArray
+    from .magnetization import MagnetizationArray
+    from .mass import MassArray
+    from .mass_concentration import MassConcentrationArray
+    from .mass_flow import MassFlowArray
+    from .mass_flux import MassFluxArray
+    from .mass_fraction import MassFractionArray
+    from .mass_moment_of_inertia import MassMomentOfInertiaArray
+    from .molar_energy import MolarEnergyArray
+    from .molar_entropy import MolarEntropyArray
+    from .molar_flow import MolarFlowArray
+    from .molar_mass import MolarMassArray
+    from .molarity import MolarityArray
+    from .permeability import PermeabilityArray
+    from .permittivity import PermittivityArray
+    from .porous_medium_permeability import PorousMediumPermeabilityArray
+    from .power import PowerArray
+    from .power_density import PowerDensityArray
+    from .power_ratio import PowerRatioArray
+    from .pressure import PressureArray
+    from .pressure_change_rate import PressureChangeRateArray
+    from .ratio import RatioArray
+    from .ratio_change_rate import RatioChangeRateArray
+    from .reactive_energy import ReactiveEnergyArray
+    from .reactive_power import ReactivePowerArray
+    from .reciprocal_area import ReciprocalAreaArray
+    from .reciprocal_length import ReciprocalLengthArray
+    from .relative_humidity import RelativeHumidityArray
+    from .rotational_acceleration import RotationalAccelerationArray
+    from .rotational_speed import RotationalSpeedArray
+    from .rotational_stiffness import RotationalStiffnessArray
+    from .rotational_stiffness_per_length import RotationalStiffnessPerLengthArray
+    from .scalar import ScalarArray
+    from .solid_angle import SolidAngleArray
+    from .specific_energy import SpecificEnergyArray
+    from .specific_entropy import SpecificEntropyArray
+    from .specific_fuel_consumption import SpecificFuelConsumptionArray
+    from .specific_volume import SpecificVolumeArray
+    from .specific_weight import SpecificWeightArray
+    from .speed import SpeedArray
+    from .standard_volume_flow import StandardVolumeFlowArray
+    from .temperature import TemperatureArray
+    from .temperature_change_rate import TemperatureChangeRateArray
+    from .temperature_delta import TemperatureDeltaArray
+    from .temperature_gradient import TemperatureGradientArray
+    from .thermal_conductivity import ThermalConductivityArray
+    from .thermal_resistance import ThermalResistanceArray
+    from .torque import TorqueArray
+    from .torque_per_length import TorquePerLengthArray
+    from .turbidity import TurbidityArray
+    from .vitamin_a import VitaminAArray
+    from .volume import VolumeArray
+    from .volume_concentration import VolumeConcentrationArray
+    from .volume_flow import VolumeFlowArray
+    from .volume_flow_per_area import VolumeFlowPerAreaArray
+    from .volume_per_length import VolumePerLengthArray
+    from .volumetric_heat_capacity import VolumetricHeatCapacityArray
+    from .warping_moment_of_inertia import WarpingMomentOfInertiaArray
+
+
+# The array modules, imported on first access to an array class (PEP 562).
+_array_modules = {
+    'AbsorbedDoseOfIonizingRadiationArray': 'absorbed_dose_of_ionizing_radiation',
+    'AccelerationArray': 'acceleration',
+    'AmountOfSubstanceArray': 'amount_of_substance',
+    'AmplitudeRatioArray': 'amplitude_ratio',
+    'AngleArray': 'angle',
+    'ApparentEnergyArray': 'apparent_energy',
+    'ApparentPowerArray': 'apparent_power',
+    'AreaArray': 'area',
+    'AreaDensityArray': 'area_density',
+    'AreaMomentOfInertiaArray': 'area_moment_of_inertia',
+    'BitRateArray': 'bit_rate',
+    'BrakeSpecificFuelConsumptionArray': 'brake_specific_fuel_consumption',
+    'CapacitanceArray': 'capacitance',
+    'CoefficientOfThermalExpansionArray': 'coefficient_of_thermal_expansion',
+    'CompressibilityArray': 'compressibility',
+    'DensityArray': 'density',
+    'DurationArray': 'duration',
+    'DynamicViscosityArray': 'dynamic_viscosity',
+    'ElectricAdmittanceArray': 'electric_admittance',
+    'ElectricChargeArray': 'electric_charge',
+    'ElectricChargeDensityArray': 'electric_charge_density',
+    'ElectricConductanceArray': 'electric_conductance',
+    'ElectricConductivityArray': 'electric_conductivity',
+    'ElectricCurrentArray': 'electric_current',
+    'ElectricCurrentDensityArray': 'electric_current_density',
+    'ElectricCurrentGradientArray': 'electric_current_gradient',
+    'ElectricFieldArray': 'electric_field',
+    'ElectricInductanceArray': 'electric_inductance',
+    'ElectricPotentialArray': 'electric_potential',
+    'ElectricPotentialAcArray': 'electric_potential_ac',
+    'ElectricPotentialChangeRateArray': 'electric_potential_change_rate',
+    'ElectricPotentialDcArray': 'electric_potential_dc',
+    'ElectricResistanceArray': 'electric_resistance',
+    'ElectricResistivityArray': 'electric_resistivity',
+    'ElectricSurfaceChargeDensityArray': 'electric_surface_charge_density',
+    'EnergyArray': 'energy',
+    'EnergyDensityArray': 'energy_density',
+    'EntropyArray': 'entropy',
+    'ForceArray': 'force',
+    'ForceChangeRateArray': 'force_change_rate',
+    'ForcePerLengthArray': 'force_per_length',
+    'FrequencyArray': 'frequency',
+    'FuelEfficiencyArray': 'fuel_efficiency',
+    'HeatFluxArray': 'heat_flux',
+    'HeatTransferCoefficientArray': 'heat_transfer_coefficient',
+    'IlluminanceArray': 'illuminance',
+    'ImpulseArray': 'impulse',
+    'InformationArray': 'information',
+    'IrradianceArray': 'irradiance',
+    'IrradiationArray': 'irradiation',
+    'JerkArray': 'jerk',
+    'KinematicViscosityArray': 'kinematic_viscosity',
+    'LeakRateArray': 'leak_rate',
+    'LengthArray': 'length',
+    'LevelArray': 'level',
+    'LinearDensityArray': 'linear_density',
+    'LinearPowerDensityArray': 'linear_power_density',
+    'LuminanceArray': 'luminance',
+    'LuminosityArray': 'luminosity',
+    'LuminousFluxArray': 'luminous_flux',
+    'LuminousIntensityArray': 'luminous_intensity',
+    'MagneticFieldArray': 'magnetic_field',
+    'MagneticFluxArray': 'magnetic_flux',
+    'MagnetizationArray': 'magnetization',
+    'MassArray': 'mass',
+    'MassConcentrationArray': 'mass_concentration',
+    'MassFlowArray': 'mass_flow',
+    'MassFluxArray': 'mass_flux',
+    'MassFractionArray': 'mass_fraction',
+    'MassMomentOfInertiaArray': 'mass_moment_of_inertia',
+    'MolarEnergyArray': 'molar_energy',
+    'MolarEntropyArray': 'molar_entropy',
+    'MolarFlowArray': 'molar_flow',
+    'MolarMassArray': 'molar_mass',
+    'MolarityArray': 'molarity',
+    'PermeabilityArray': 'permeability',
+    'PermittivityArray': 'permittivity',
+    'PorousMediumPermeabilityArray': 'porous_medium_permeability',
+    'PowerArray': 'power',
+    'PowerDensityArray': 'power_density',
+    'PowerRatioArray': 'power_ratio',
+    'PressureArray': 'pressure',
+    'PressureChangeRateArray': 'pressure_change_rate',
+    'RatioArray': 'ratio',
+    'RatioChangeRateArray': 'ratio_change_rate',
+    'ReactiveEnergyArray': 'reactive_energy',
+    'ReactivePowerArray': 'reactive_power',
+    'ReciprocalAreaArray': 'reciprocal_area',
+    'ReciprocalLengthArray': 'reciprocal_length',
+    'RelativeHumidityArray': 'relative_humidity',
+    'RotationalAccelerationArray': 'rotational_acceleration',
+    'RotationalSpeedArray': 'rotational_speed',
+    'RotationalStiffnessArray': 'rotational_stiffness',
+    'RotationalStiffnessPerLengthArray': 'rotational_stiffness_per_length',
+    'ScalarArray': 'scalar',
+    'SolidAngleArray': 'solid_angle',
+    'SpecificEnergyArray': 'specific_energy',
+    'SpecificEntropyArray': 'specific_entropy',
+    'SpecificFuelConsumptionArray': 'specific_fuel_consumption',
+    'SpecificVolumeArray': 'specific_volume',
+    'SpecificWeightArray': 'specific_weight',
+    'SpeedArray': 'speed',
+    'StandardVolumeFlowArray': 'standard_volume_flow',
+    'TemperatureArray': 'temperature',
+    'TemperatureChangeRateArray': 'temperature_change_rate',
+    'TemperatureDeltaArray': 'temperature_delta',
+    'TemperatureGradientArray': 'temperature_gradient',
+    'ThermalConductivityArray': 'thermal_conductivity',
+    'ThermalResistanceArray': 'thermal_resistance',
+    'TorqueArray': 'torque',
+    'TorquePerLengthArray': 'torque_per_length',
+    'TurbidityArray': 'turbidity',
+    'VitaminAArray': 'vitamin_a',
+    'VolumeArray': 'volume',
+    'VolumeConcentrationArray': 'volume_concentration',
+    'VolumeFlowArray': 'volume_flow',
+    'VolumeFlowPerAreaArray': 'volume_flow_per_area',
+    'VolumePerLengthArray': 'volume_per_length',
+    'VolumetricHeatCapacityArray': 'volumetric_heat_capacity',
+    'WarpingMomentOfInertiaArray': 'warping_moment_of_inertia',
+}
+
+
+def __getattr__(name: str):
+    module_name = _array_modules.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+__all__ = [
+ 'AbsorbedDoseOfIonizingRadiationArray',
+ 'AccelerationArray',
+ 'AmountOfSubstanceArray',
+ 'AmplitudeRatioArray',
+ 'AngleArray',
+ 'ApparentEnergyArray',
+ 'ApparentPowerArray',
+ 'AreaArray',
+ 'AreaDensityArray',
+ 'AreaMomentOfInertiaArray',
+ 'BitRateArray',
+ 'BrakeSpecificFuelConsumptionArray',
+ 'CapacitanceArray',
+ 'CoefficientOfThermalExpansionArray',
+ 'CompressibilityArray',
+ 'DensityArray',
+ 'DurationArray',
+ 'DynamicViscosityArray',
+ 'ElectricAdmittanceArray',
+ 'ElectricChargeArray',
+ 'ElectricChargeDensityArray',
+ 'ElectricConductanceArray',
+ 'ElectricConductivityArray',
+ 'ElectricCurrentArray',
+ 'ElectricCurrentDensityArray',
+ 'ElectricCurrentGradientArray',
+ 'ElectricFieldArray',
+ 'ElectricInductanceArray',
+ 'ElectricPotentialArray',
+ 'ElectricPotentialAcArray',
+ 'ElectricPotentialChangeRateArray',
+ 'ElectricPotentialDcArray',
+ 'ElectricResistanceArray',
+ 'ElectricResistivityArray',
+ 'ElectricSurfaceChargeDensityArray',
+ 'EnergyArray',
+ 'EnergyDensityArray',
+ 'EntropyArray',
+ 'ForceArray',
+ 'ForceChangeRateArray',
+ 'ForcePerLengthArray',
+ 'FrequencyArray',
+ 'FuelEfficiencyArray',
+ 'HeatFluxArray',
+ 'HeatTransferCoefficientArray',
+ 'IlluminanceArray',
+ 'ImpulseArray',
+ 'InformationArray',
+ 'IrradianceArray',
+ 'IrradiationArray',
+ 'JerkArray',
+ 'KinematicViscosityArray',
+ 'LeakRateArray',
+ 'LengthArray',
+ 'LevelArray',
+ 'LinearDensityArray',
+ 'LinearPowerDensityArray',
+ 'LuminanceArray',
+ 'LuminosityArray',
+ 'LuminousFluxArray',
+ 'LuminousIntensityArray',
+ 'MagneticFieldArray',
+ 'MagneticFluxArray',
+ 'MagnetizationArray',
+ 'MassArray',
+ 'MassConcentrationArray',
+ 'MassFlowArray',
+ 'MassFluxArray',
+ 'MassFractionArray',
+ 'MassMomentOfInertiaArray',
+ 'MolarEnergyArray',
+ 'MolarEntropyArray',
+ 'MolarFlowArray',
+ 'MolarMassArray',
+ 'MolarityArray',
+ 'PermeabilityArray',
+ 'PermittivityArray',
+ 'PorousMediumPermeabilityArray',
+ 'PowerArray',
+ 'PowerDensityArray',
+ 'PowerRatioArray',
+ 'PressureArray',
+ 'PressureChangeRateArray',
+ 'RatioArray',
+ 'RatioChangeRateArray',
+ 'ReactiveEnergyArray',
+ 'ReactivePowerArray',
+ 'ReciprocalAreaArray',
+ 'ReciprocalLengthArray',
+ 'RelativeHumidityArray',
+ 'RotationalAccelerationArray',
+ 'RotationalSpeedArray',
+ 'RotationalStiffnessArray',
+ 'RotationalStiffnessPerLengthArray',
+ 'ScalarArray',
+ 'SolidAngleArray',
+ 'SpecificEnergyArray',
+ 'SpecificEntropyArray',
+ 'SpecificFuelConsumptionArray',
+ 'SpecificVolumeArray',
+ 'SpecificWeightArray',
+ 'SpeedArray',
+ 'StandardVolumeFlowArray',
+ 'TemperatureArray',
+ 'TemperatureChangeRateArray',
+ 'TemperatureDeltaArray',
+ 'TemperatureGradientArray',
+ 'ThermalConductivityArray',
+ 'ThermalResistanceArray',
+ 'TorqueArray',
+ 'TorquePerLengthArray',
+ 'TurbidityArray',
+ 'VitaminAArray',
+ 'VolumeArray',
+ 'VolumeConcentrationArray',
+ 'VolumeFlowArray',
+ 'VolumeFlowPerAreaArray',
+ 'VolumePerLengthArray',
+ 'VolumetricHeatCapacityArray',
+ 'WarpingMomentOfInertiaArray',
+]
\ No newline at end of file
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.absorbed_dose_of_ionizing_radiation import AbsorbedDoseOfIonizingRadiation, AbsorbedDoseOfIonizingRadiationUnits
+
+
+class AbsorbedDoseOfIonizingRadiationArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of AbsorbedDoseOfIonizingRadiation values, held in Gray.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (AbsorbedDoseOfIonizingRadiationUnits): The AbsorbedDoseOfIonizingRadiation unit of the values, The default unit is Gray
+    """
+    __slots__ = ()
+
+    _quantity = AbsorbedDoseOfIonizingRadiation
+
+    # Whole-array variants of the AbsorbedDoseOfIonizingRadiation conversion functions.
+    _conversions_from_base = {
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Gray: lambda value: (value),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Rad: lambda value: (value * 100),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Femtogray: lambda value: ((value) / 1e-15),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Picogray: lambda value: ((value) / 1e-12),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Nanogray: lambda value: ((value) / 1e-09),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Microgray: lambda value: ((value) / 1e-06),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Milligray: lambda value: ((value) / 0.001),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Centigray: lambda value: ((value) / 0.01),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Kilogray: lambda value: ((value) / 1000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Megagray: lambda value: ((value) / 1000000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Gigagray: lambda value: ((value) / 1000000000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Teragray: lambda value: ((value) / 1000000000000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Petagray: lambda value: ((value) / 1000000000000000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Millirad: lambda value: ((value * 100) / 0.001),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Kilorad: lambda value: ((value * 100) / 1000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Megarad: lambda value: ((value * 100) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Gray: lambda value: (value),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Rad: lambda value: (value / 100),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Femtogray: lambda value: ((value) * 1e-15),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Picogray: lambda value: ((value) * 1e-12),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Nanogray: lambda value: ((value) * 1e-09),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Microgray: lambda value: ((value) * 1e-06),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Milligray: lambda value: ((value) * 0.001),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Centigray: lambda value: ((value) * 0.01),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Kilogray: lambda value: ((value) * 1000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Megagray: lambda value: ((value) * 1000000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Gigagray: lambda value: ((value) * 1000000000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Teragray: lambda value: ((value) * 1000000000000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Petagray: lambda value: ((value) * 1000000000000000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Millirad: lambda value: ((value / 100) * 0.001),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Kilorad: lambda value: ((value / 100) * 1000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Megarad: lambda value: ((value / 100) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: AbsorbedDoseOfIonizingRadiationUnits = AbsorbedDoseOfIonizingRadiationUnits.Gray):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: AbsorbedDoseOfIonizingRadiationUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: AbsorbedDoseOfIonizingRadiationUnits = AbsorbedDoseOfIonizingRadiationUnits.Gray) -> AbsorbedDoseOfIonizingRadiationArray:
+        """
+        Create a new instance of AbsorbedDoseOfIonizingRadiationArray from values in the given unit.
+
+        :param values: The AbsorbedDoseOfIonizingRadiation values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: AbsorbedDoseOfIonizingRadiationUnits
+        :return: A new instance of AbsorbedDoseOfIonizingRadiationArray.
+        :rtype: AbsorbedDoseOfIonizingRadiationArray
+        """
+        return AbsorbedDoseOfIonizingRadiationArray(values, unit)
+
+    
+    @property
+    def grays(self) -> np.ndarray:
+        """
+        The gray is the unit of ionizing radiation dose in the SI, defined as the absorption of one joule of radiation energy per kilogram of matter.
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Gray](self._values)
+
+    
+    @property
+    def rads(self) -> np.ndarray:
+        """
+        The rad is a unit of absorbed radiation dose, defined as 1 rad = 0.01 Gy = 0.01 J/kg.
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Rad](self._values)
+
+    
+    @property
+    def femtograys(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Femtogray](self._values)
+
+    
+    @property
+    def picograys(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Picogray](self._values)
+
+    
+    @property
+    def nanograys(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Nanogray](self._values)
+
+    
+    @property
+    def micrograys(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Microgray](self._values)
+
+    
+    @property
+    def milligrays(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Milligray](self._values)
+
+    
+    @property
+    def centigrays(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Centigray](self._values)
+
+    
+    @property
+    def kilograys(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Kilogray](self._values)
+
+    
+    @property
+    def megagrays(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Megagray](self._values)
+
+    
+    @property
+    def gigagrays(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Gigagray](self._values)
+
+    
+    @property
+    def teragrays(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Teragray](self._values)
+
+    
+    @property
+    def petagrays(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Petagray](self._values)
+
+    
+    @property
+    def millirads(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Millirad](self._values)
+
+    
+    @property
+    def kilorads(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Kilorad](self._values)
+
+    
+    @property
+    def megarads(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AbsorbedDoseOfIonizingRadiationUnits.Megarad](self._values)
+
+    
\ No newline at end of file
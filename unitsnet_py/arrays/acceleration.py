@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.acceleration import Acceleration, AccelerationUnits
+
+
+class AccelerationArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Acceleration values, held in MeterPerSecondSquared.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (AccelerationUnits): The Acceleration unit of the values, The default unit is MeterPerSecondSquared
+    """
+    __slots__ = ()
+
+    _quantity = Acceleration
+
+    # Whole-array variants of the Acceleration conversion functions.
+    _conversions_from_base = {
+        
+        AccelerationUnits.MeterPerSecondSquared: lambda value: (value),
+        
+        AccelerationUnits.InchPerSecondSquared: lambda value: (value / 0.0254),
+        
+        AccelerationUnits.FootPerSecondSquared: lambda value: (value / 0.304800),
+        
+        AccelerationUnits.KnotPerSecond: lambda value: (value / 0.5144444444444),
+        
+        AccelerationUnits.KnotPerMinute: lambda value: (value / 0.5144444444444 * 60),
+        
+        AccelerationUnits.KnotPerHour: lambda value: (value / 0.5144444444444 * 3600),
+        
+        AccelerationUnits.StandardGravity: lambda value: (value / 9.80665),
+        
+        AccelerationUnits.NanometerPerSecondSquared: lambda value: ((value) / 1e-09),
+        
+        AccelerationUnits.MicrometerPerSecondSquared: lambda value: ((value) / 1e-06),
+        
+        AccelerationUnits.MillimeterPerSecondSquared: lambda value: ((value) / 0.001),
+        
+        AccelerationUnits.CentimeterPerSecondSquared: lambda value: ((value) / 0.01),
+        
+        AccelerationUnits.DecimeterPerSecondSquared: lambda value: ((value) / 0.1),
+        
+        AccelerationUnits.KilometerPerSecondSquared: lambda value: ((value) / 1000.0),
+        
+        AccelerationUnits.MillistandardGravity: lambda value: ((value / 9.80665) / 0.001),
+        
+    }
+
+    _conversions_to_base = {
+        
+        AccelerationUnits.MeterPerSecondSquared: lambda value: (value),
+        
+        AccelerationUnits.InchPerSecondSquared: lambda value: (value * 0.0254),
+        
+        AccelerationUnits.FootPerSecondSquared: lambda value: (value * 0.304800),
+        
+        AccelerationUnits.KnotPerSecond: lambda value: (value * 0.5144444444444),
+        
+        AccelerationUnits.KnotPerMinute: lambda value: (value * 0.5144444444444 / 60),
+        
+        AccelerationUnits.KnotPerHour: lambda value: (value * 0.5144444444444 / 3600),
+        
+        AccelerationUnits.StandardGravity: lambda value: (value * 9.80665),
+        
+        AccelerationUnits.NanometerPerSecondSquared: lambda value: ((value) * 1e-09),
+        
+        AccelerationUnits.MicrometerPerSecondSquared: lambda value: ((value) * 1e-06),
+        
+        AccelerationUnits.MillimeterPerSecondSquared: lambda value: ((value) * 0.001),
+        
+        AccelerationUnits.CentimeterPerSecondSquared: lambda value: ((value) * 0.01),
+        
+        AccelerationUnits.DecimeterPerSecondSquared: lambda value: ((value) * 0.1),
+        
+        AccelerationUnits.KilometerPerSecondSquared: lambda value: ((value) * 1000.0),
+        
+        AccelerationUnits.MillistandardGravity: lambda value: ((value * 9.80665) * 0.001),
+        
+    }
+
+    def __init__(self, values, from_unit: AccelerationUnits = AccelerationUnits.MeterPerSecondSquared):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: AccelerationUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: AccelerationUnits = AccelerationUnits.MeterPerSecondSquared) -> AccelerationArray:
+        """
+        Create a new instance of AccelerationArray from values in the given unit.
+
+        :param values: The Acceleration values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: AccelerationUnits
+        :return: A new instance of AccelerationArray.
+        :rtype: AccelerationArray
+        """
+        return AccelerationArray(values, unit)
+
+    
+    @property
+    def meters_per_second_squared(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AccelerationUnits.MeterPerSecondSquared](self._values)
+
+    
+    @property
+    def inches_per_second_squared(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AccelerationUnits.InchPerSecondSquared](self._values)
+
+    
+    @property
+    def feet_per_second_squared(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AccelerationUnits.FootPerSecondSquared](self._values)
+
+    
+    @property
+    def knots_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AccelerationUnits.KnotPerSecond](self._values)
+
+    
+    @property
+    def knots_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AccelerationUnits.KnotPerMinute](self._values)
+
+    
+    @property
+    def knots_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AccelerationUnits.KnotPerHour](self._values)
+
+    
+    @property
+    def standard_gravity(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AccelerationUnits.StandardGravity](self._values)
+
+    
+    @property
+    def nanometers_per_second_squared(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AccelerationUnits.NanometerPerSecondSquared](self._values)
+
+    
+    @property
+    def micrometers_per_second_squared(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AccelerationUnits.MicrometerPerSecondSquared](self._values)
+
+    
+    @property
+    def millimeters_per_second_squared(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AccelerationUnits.MillimeterPerSecondSquared](self._values)
+
+    
+    @property
+    def centimeters_per_second_squared(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AccelerationUnits.CentimeterPerSecondSquared](self._values)
+
+    
+    @property
+    def decimeters_per_second_squared(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AccelerationUnits.DecimeterPerSecondSquared](self._values)
+
+    
+    @property
+    def kilometers_per_second_squared(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AccelerationUnits.KilometerPerSecondSquared](self._values)
+
+    
+    @property
+    def millistandard_gravity(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AccelerationUnits.MillistandardGravity](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.amount_of_substance import AmountOfSubstance, AmountOfSubstanceUnits
+
+
+class AmountOfSubstanceArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of AmountOfSubstance values, held in Mole.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (AmountOfSubstanceUnits): The AmountOfSubstance unit of the values, The default unit is Mole
+    """
+    __slots__ = ()
+
+    _quantity = AmountOfSubstance
+
+    # Whole-array variants of the AmountOfSubstance conversion functions.
+    _conversions_from_base = {
+        
+        AmountOfSubstanceUnits.Mole: lambda value: (value),
+        
+        AmountOfSubstanceUnits.PoundMole: lambda value: (value / 453.59237),
+        
+        AmountOfSubstanceUnits.Femtomole: lambda value: ((value) / 1e-15),
+        
+        AmountOfSubstanceUnits.Picomole: lambda value: ((value) / 1e-12),
+        
+        AmountOfSubstanceUnits.Nanomole: lambda value: ((value) / 1e-09),
+        
+        AmountOfSubstanceUnits.Micromole: lambda value: ((value) / 1e-06),
+        
+        AmountOfSubstanceUnits.Millimole: lambda value: ((value) / 0.001),
+        
+        AmountOfSubstanceUnits.Centimole: lambda value: ((value) / 0.01),
+        
+        AmountOfSubstanceUnits.Decimole: lambda value: ((value) / 0.1),
+        
+        AmountOfSubstanceUnits.Kilomole: lambda value: ((value) / 1000.0),
+        
+        AmountOfSubstanceUnits.Megamole: lambda value: ((value) / 1000000.0),
+        
+        AmountOfSubstanceUnits.NanopoundMole: lambda value: ((value / 453.59237) / 1e-09),
+        
+        AmountOfSubstanceUnits.MicropoundMole: lambda value: ((value / 453.59237) / 1e-06),
+        
+        AmountOfSubstanceUnits.MillipoundMole: lambda value: ((value / 453.59237) / 0.001),
+        
+        AmountOfSubstanceUnits.CentipoundMole: lambda value: ((value / 453.59237) / 0.01),
+        
+        AmountOfSubstanceUnits.DecipoundMole: lambda value: ((value / 453.59237) / 0.1),
+        
+        AmountOfSubstanceUnits.KilopoundMole: lambda value: ((value / 453.59237) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        AmountOfSubstanceUnits.Mole: lambda value: (value),
+        
+        AmountOfSubstanceUnits.PoundMole: lambda value: (value * 453.59237),
+        
+        AmountOfSubstanceUnits.Femtomole: lambda value: ((value) * 1e-15),
+        
+        AmountOfSubstanceUnits.Picomole: lambda value: ((value) * 1e-12),
+        
+        AmountOfSubstanceUnits.Nanomole: lambda value: ((value) * 1e-09),
+        
+        AmountOfSubstanceUnits.Micromole: lambda value: ((value) * 1e-06),
+        
+        AmountOfSubstanceUnits.Millimole: lambda value: ((value) * 0.001),
+        
+        AmountOfSubstanceUnits.Centimole: lambda value: ((value) * 0.01),
+        
+        AmountOfSubstanceUnits.Decimole: lambda value: ((value) * 0.1),
+        
+        AmountOfSubstanceUnits.Kilomole: lambda value: ((value) * 1000.0),
+        
+        AmountOfSubstanceUnits.Megamole: lambda value: ((value) * 1000000.0),
+        
+        AmountOfSubstanceUnits.NanopoundMole: lambda value: ((value * 453.59237) * 1e-09),
+        
+        AmountOfSubstanceUnits.MicropoundMole: lambda value: ((value * 453.59237) * 1e-06),
+        
+        AmountOfSubstanceUnits.MillipoundMole: lambda value: ((value * 453.59237) * 0.001),
+        
+        AmountOfSubstanceUnits.CentipoundMole: lambda value: ((value * 453.59237) * 0.01),
+        
+        AmountOfSubstanceUnits.DecipoundMole: lambda value: ((value * 453.59237) * 0.1),
+        
+        AmountOfSubstanceUnits.KilopoundMole: lambda value: ((value * 453.59237) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: AmountOfSubstanceUnits = AmountOfSubstanceUnits.Mole):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: AmountOfSubstanceUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: AmountOfSubstanceUnits = AmountOfSubstanceUnits.Mole) -> AmountOfSubstanceArray:
+        """
+        Create a new instance of AmountOfSubstanceArray from values in the given unit.
+
+        :param values: The AmountOfSubstance values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: AmountOfSubstanceUnits
+        :return: A new instance of AmountOfSubstanceArray.
+        :rtype: AmountOfSubstanceArray
+        """
+        return AmountOfSubstanceArray(values, unit)
+
+    
+    @property
+    def moles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.Mole](self._values)
+
+    
+    @property
+    def pound_moles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.PoundMole](self._values)
+
+    
+    @property
+    def femtomoles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.Femtomole](self._values)
+
+    
+    @property
+    def picomoles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.Picomole](self._values)
+
+    
+    @property
+    def nanomoles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.Nanomole](self._values)
+
+    
+    @property
+    def micromoles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.Micromole](self._values)
+
+    
+    @property
+    def millimoles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.Millimole](self._values)
+
+    
+    @property
+    def centimoles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.Centimole](self._values)
+
+    
+    @property
+    def decimoles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.Decimole](self._values)
+
+    
+    @property
+    def kilomoles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.Kilomole](self._values)
+
+    
+    @property
+    def megamoles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.Megamole](self._values)
+
+    
+    @property
+    def nanopound_moles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.NanopoundMole](self._values)
+
+    
+    @property
+    def micropound_moles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.MicropoundMole](self._values)
+
+    
+    @property
+    def millipound_moles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.MillipoundMole](self._values)
+
+    
+    @property
+    def centipound_moles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.CentipoundMole](self._values)
+
+    
+    @property
+    def decipound_moles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.DecipoundMole](self._values)
+
+    
+    @property
+    def kilopound_moles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmountOfSubstanceUnits.KilopoundMole](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.amplitude_ratio import AmplitudeRatio, AmplitudeRatioUnits
+
+
+class AmplitudeRatioArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of AmplitudeRatio values, held in DecibelVolt.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (AmplitudeRatioUnits): The AmplitudeRatio unit of the values, The default unit is DecibelVolt
+    """
+    __slots__ = ()
+
+    _quantity = AmplitudeRatio
+
+    # Whole-array variants of the AmplitudeRatio conversion functions.
+    _conversions_from_base = {
+        
+        AmplitudeRatioUnits.DecibelVolt: lambda value: (value),
+        
+        AmplitudeRatioUnits.DecibelMicrovolt: lambda value: (value + 120),
+        
+        AmplitudeRatioUnits.DecibelMillivolt: lambda value: (value + 60),
+        
+        AmplitudeRatioUnits.DecibelUnloaded: lambda value: (value + 2.218487499),
+        
+    }
+
+    _conversions_to_base = {
+        
+        AmplitudeRatioUnits.DecibelVolt: lambda value: (value),
+        
+        AmplitudeRatioUnits.DecibelMicrovolt: lambda value: (value - 120),
+        
+        AmplitudeRatioUnits.DecibelMillivolt: lambda value: (value - 60),
+        
+        AmplitudeRatioUnits.DecibelUnloaded: lambda value: (value - 2.218487499),
+        
+    }
+
+    def __init__(self, values, from_unit: AmplitudeRatioUnits = AmplitudeRatioUnits.DecibelVolt):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: AmplitudeRatioUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: AmplitudeRatioUnits = AmplitudeRatioUnits.DecibelVolt) -> AmplitudeRatioArray:
+        """
+        Create a new instance of AmplitudeRatioArray from values in the given unit.
+
+        :param values: The AmplitudeRatio values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: AmplitudeRatioUnits
+        :return: A new instance of AmplitudeRatioArray.
+        :rtype: AmplitudeRatioArray
+        """
+        return AmplitudeRatioArray(values, unit)
+
+    
+    @property
+    def decibel_volts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmplitudeRatioUnits.DecibelVolt](self._values)
+
+    
+    @property
+    def decibel_microvolts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmplitudeRatioUnits.DecibelMicrovolt](self._values)
+
+    
+    @property
+    def decibel_millivolts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmplitudeRatioUnits.DecibelMillivolt](self._values)
+
+    
+    @property
+    def decibels_unloaded(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AmplitudeRatioUnits.DecibelUnloaded](self._values)
+
+    
\ No newline at end of file
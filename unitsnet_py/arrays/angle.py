@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.angle import Angle, AngleUnits
+
+
+class AngleArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Angle values, held in Degree.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (AngleUnits): The Angle unit of the values, The default unit is Degree
+    """
+    __slots__ = ()
+
+    _quantity = Angle
+
+    # Whole-array variants of the Angle conversion functions.
+    _conversions_from_base = {
+        
+        AngleUnits.Radian: lambda value: (value / 180 * np.pi),
+        
+        AngleUnits.Degree: lambda value: (value),
+        
+        AngleUnits.Arcminute: lambda value: (value * 60),
+        
+        AngleUnits.Arcsecond: lambda value: (value * 3600),
+        
+        AngleUnits.Gradian: lambda value: (value / 0.9),
+        
+        AngleUnits.NatoMil: lambda value: (value * 160 / 9),
+        
+        AngleUnits.Revolution: lambda value: (value / 360),
+        
+        AngleUnits.Tilt: lambda value: (np.sin(value / 180 * np.pi)),
+        
+        AngleUnits.Nanoradian: lambda value: ((value / 180 * np.pi) / 1e-09),
+        
+        AngleUnits.Microradian: lambda value: ((value / 180 * np.pi) / 1e-06),
+        
+        AngleUnits.Milliradian: lambda value: ((value / 180 * np.pi) / 0.001),
+        
+        AngleUnits.Centiradian: lambda value: ((value / 180 * np.pi) / 0.01),
+        
+        AngleUnits.Deciradian: lambda value: ((value / 180 * np.pi) / 0.1),
+        
+        AngleUnits.Nanodegree: lambda value: ((value) / 1e-09),
+        
+        AngleUnits.Microdegree: lambda value: ((value) / 1e-06),
+        
+        AngleUnits.Millidegree: lambda value: ((value) / 0.001),
+        
+    }
+
+    _conversions_to_base = {
+        
+        AngleUnits.Radian: lambda value: (value * 180 / np.pi),
+        
+        AngleUnits.Degree: lambda value: (value),
+        
+        AngleUnits.Arcminute: lambda value: (value / 60),
+        
+        AngleUnits.Arcsecond: lambda value: (value / 3600),
+        
+        AngleUnits.Gradian: lambda value: (value * 0.9),
+        
+        AngleUnits.NatoMil: lambda value: (value * 9 / 160),
+        
+        AngleUnits.Revolution: lambda value: (value * 360),
+        
+        AngleUnits.Tilt: lambda value: (np.arcsin(value) * 180 / np.pi),
+        
+        AngleUnits.Nanoradian: lambda value: ((value * 180 / np.pi) * 1e-09),
+        
+        AngleUnits.Microradian: lambda value: ((value * 180 / np.pi) * 1e-06),
+        
+        AngleUnits.Milliradian: lambda value: ((value * 180 / np.pi) * 0.001),
+        
+        AngleUnits.Centiradian: lambda value: ((value * 180 / np.pi) * 0.01),
+        
+        AngleUnits.Deciradian: lambda value: ((value * 180 / np.pi) * 0.1),
+        
+        AngleUnits.Nanodegree: lambda value: ((value) * 1e-09),
+        
+        AngleUnits.Microdegree: lambda value: ((value) * 1e-06),
+        
+        AngleUnits.Millidegree: lambda value: ((value) * 0.001),
+        
+    }
+
+    def __init__(self, values, from_unit: AngleUnits = AngleUnits.Degree):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: AngleUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: AngleUnits = AngleUnits.Degree) -> AngleArray:
+        """
+        Create a new instance of AngleArray from values in the given unit.
+
+        :param values: The Angle values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: AngleUnits
+        :return: A new instance of AngleArray.
+        :rtype: AngleArray
+        """
+        return AngleArray(values, unit)
+
+    
+    @property
+    def radians(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Radian](self._values)
+
+    
+    @property
+    def degrees(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Degree](self._values)
+
+    
+    @property
+    def arcminutes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Arcminute](self._values)
+
+    
+    @property
+    def arcseconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Arcsecond](self._values)
+
+    
+    @property
+    def gradians(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Gradian](self._values)
+
+    
+    @property
+    def nato_mils(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.NatoMil](self._values)
+
+    
+    @property
+    def revolutions(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Revolution](self._values)
+
+    
+    @property
+    def tilt(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Tilt](self._values)
+
+    
+    @property
+    def nanoradians(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Nanoradian](self._values)
+
+    
+    @property
+    def microradians(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Microradian](self._values)
+
+    
+    @property
+    def milliradians(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Milliradian](self._values)
+
+    
+    @property
+    def centiradians(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Centiradian](self._values)
+
+    
+    @property
+    def deciradians(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Deciradian](self._values)
+
+    
+    @property
+    def nanodegrees(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Nanodegree](self._values)
+
+    
+    @property
+    def microdegrees(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Microdegree](self._values)
+
+    
+    @property
+    def millidegrees(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AngleUnits.Millidegree](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.apparent_energy import ApparentEnergy, ApparentEnergyUnits
+
+
+class ApparentEnergyArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ApparentEnergy values, held in VoltampereHour.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ApparentEnergyUnits): The ApparentEnergy unit of the values, The default unit is VoltampereHour
+    """
+    __slots__ = ()
+
+    _quantity = ApparentEnergy
+
+    # Whole-array variants of the ApparentEnergy conversion functions.
+    _conversions_from_base = {
+        
+        ApparentEnergyUnits.VoltampereHour: lambda value: (value),
+        
+        ApparentEnergyUnits.KilovoltampereHour: lambda value: ((value) / 1000.0),
+        
+        ApparentEnergyUnits.MegavoltampereHour: lambda value: ((value) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ApparentEnergyUnits.VoltampereHour: lambda value: (value),
+        
+        ApparentEnergyUnits.KilovoltampereHour: lambda value: ((value) * 1000.0),
+        
+        ApparentEnergyUnits.MegavoltampereHour: lambda value: ((value) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ApparentEnergyUnits = ApparentEnergyUnits.VoltampereHour):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ApparentEnergyUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ApparentEnergyUnits = ApparentEnergyUnits.VoltampereHour) -> ApparentEnergyArray:
+        """
+        Create a new instance of ApparentEnergyArray from values in the given unit.
+
+        :param values: The ApparentEnergy values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ApparentEnergyUnits
+        :return: A new instance of ApparentEnergyArray.
+        :rtype: ApparentEnergyArray
+        """
+        return ApparentEnergyArray(values, unit)
+
+    
+    @property
+    def voltampere_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ApparentEnergyUnits.VoltampereHour](self._values)
+
+    
+    @property
+    def kilovoltampere_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ApparentEnergyUnits.KilovoltampereHour](self._values)
+
+    
+    @property
+    def megavoltampere_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ApparentEnergyUnits.MegavoltampereHour](self._values)
+
+    
\ No newline at end of file
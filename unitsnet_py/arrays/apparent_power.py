@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.apparent_power import ApparentPower, ApparentPowerUnits
+
+
+class ApparentPowerArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ApparentPower values, held in Voltampere.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ApparentPowerUnits): The ApparentPower unit of the values, The default unit is Voltampere
+    """
+    __slots__ = ()
+
+    _quantity = ApparentPower
+
+    # Whole-array variants of the ApparentPower conversion functions.
+    _conversions_from_base = {
+        
+        ApparentPowerUnits.Voltampere: lambda value: (value),
+        
+        ApparentPowerUnits.Microvoltampere: lambda value: ((value) / 1e-06),
+        
+        ApparentPowerUnits.Millivoltampere: lambda value: ((value) / 0.001),
+        
+        ApparentPowerUnits.Kilovoltampere: lambda value: ((value) / 1000.0),
+        
+        ApparentPowerUnits.Megavoltampere: lambda value: ((value) / 1000000.0),
+        
+        ApparentPowerUnits.Gigavoltampere: lambda value: ((value) / 1000000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ApparentPowerUnits.Voltampere: lambda value: (value),
+        
+        ApparentPowerUnits.Microvoltampere: lambda value: ((value) * 1e-06),
+        
+        ApparentPowerUnits.Millivoltampere: lambda value: ((value) * 0.001),
+        
+        ApparentPowerUnits.Kilovoltampere: lambda value: ((value) * 1000.0),
+        
+        ApparentPowerUnits.Megavoltampere: lambda value: ((value) * 1000000.0),
+        
+        ApparentPowerUnits.Gigavoltampere: lambda value: ((value) * 1000000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ApparentPowerUnits = ApparentPowerUnits.Voltampere):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ApparentPowerUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ApparentPowerUnits = ApparentPowerUnits.Voltampere) -> ApparentPowerArray:
+        """
+        Create a new instance of ApparentPowerArray from values in the given unit.
+
+        :param values: The ApparentPower values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ApparentPowerUnits
+        :return: A new instance of ApparentPowerArray.
+        :rtype: ApparentPowerArray
+        """
+        return ApparentPowerArray(values, unit)
+
+    
+    @property
+    def voltamperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ApparentPowerUnits.Voltampere](self._values)
+
+    
+    @property
+    def microvoltamperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ApparentPowerUnits.Microvoltampere](self._values)
+
+    
+    @property
+    def millivoltamperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ApparentPowerUnits.Millivoltampere](self._values)
+
+    
+    @property
+    def kilovoltamperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ApparentPowerUnits.Kilovoltampere](self._values)
+
+    
+    @property
+    def megavoltamperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ApparentPowerUnits.Megavoltampere](self._values)
+
+    
+    @property
+    def gigavoltamperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ApparentPowerUnits.Gigavoltampere](self._values)
+
+    
\ No newline at end of file
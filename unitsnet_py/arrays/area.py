@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.area import Area, AreaUnits
+
+
+class AreaArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Area values, held in SquareMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (AreaUnits): The Area unit of the values, The default unit is SquareMeter
+    """
+    __slots__ = ()
+
+    _quantity = Area
+
+    # Whole-array variants of the Area conversion functions.
+    _conversions_from_base = {
+        
+        AreaUnits.SquareKilometer: lambda value: (value / 1e6),
+        
+        AreaUnits.SquareMeter: lambda value: (value),
+        
+        AreaUnits.SquareDecimeter: lambda value: (value / 1e-2),
+        
+        AreaUnits.SquareCentimeter: lambda value: (value / 1e-4),
+        
+        AreaUnits.SquareMillimeter: lambda value: (value / 1e-6),
+        
+        AreaUnits.SquareMicrometer: lambda value: (value / 1e-12),
+        
+        AreaUnits.SquareMile: lambda value: (value / 1609.344 / 1609.344),
+        
+        AreaUnits.SquareYard: lambda value: (value / 0.9144 / 0.9144),
+        
+        AreaUnits.SquareFoot: lambda value: (value / 9.290304e-2),
+        
+        AreaUnits.UsSurveySquareFoot: lambda value: (value / (1200.0 / 3937.0) / (1200.0 / 3937.0)),
+        
+        AreaUnits.SquareInch: lambda value: (value / 0.00064516),
+        
+        AreaUnits.Acre: lambda value: (value / 4046.8564224),
+        
+        AreaUnits.Hectare: lambda value: (value / 1e4),
+        
+        AreaUnits.SquareNauticalMile: lambda value: (value / 3429904),
+        
+    }
+
+    _conversions_to_base = {
+        
+        AreaUnits.SquareKilometer: lambda value: (value * 1e6),
+        
+        AreaUnits.SquareMeter: lambda value: (value),
+        
+        AreaUnits.SquareDecimeter: lambda value: (value * 1e-2),
+        
+        AreaUnits.SquareCentimeter: lambda value: (value * 1e-4),
+        
+        AreaUnits.SquareMillimeter: lambda value: (value * 1e-6),
+        
+        AreaUnits.SquareMicrometer: lambda value: (value * 1e-12),
+        
+        AreaUnits.SquareMile: lambda value: (value * 1609.344 * 1609.344),
+        
+        AreaUnits.SquareYard: lambda value: (value * 0.9144 * 0.9144),
+        
+        AreaUnits.SquareFoot: lambda value: (value * 9.290304e-2),
+        
+        AreaUnits.UsSurveySquareFoot: lambda value: (value * (1200.0 / 3937.0) * (1200.0 / 3937.0)),
+        
+        AreaUnits.SquareInch: lambda value: (value * 0.00064516),
+        
+        AreaUnits.Acre: lambda value: (value * 4046.8564224),
+        
+        AreaUnits.Hectare: lambda value: (value * 1e4),
+        
+        AreaUnits.SquareNauticalMile: lambda value: (value * 3429904),
+        
+    }
+
+    def __init__(self, values, from_unit: AreaUnits = AreaUnits.SquareMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: AreaUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: AreaUnits = AreaUnits.SquareMeter) -> AreaArray:
+        """
+        Create a new instance of AreaArray from values in the given unit.
+
+        :param values: The Area values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: AreaUnits
+        :return: A new instance of AreaArray.
+        :rtype: AreaArray
+        """
+        return AreaArray(values, unit)
+
+    
+    @property
+    def square_kilometers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaUnits.SquareKilometer](self._values)
+
+    
+    @property
+    def square_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaUnits.SquareMeter](self._values)
+
+    
+    @property
+    def square_decimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaUnits.SquareDecimeter](self._values)
+
+    
+    @property
+    def square_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaUnits.SquareCentimeter](self._values)
+
+    
+    @property
+    def square_millimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaUnits.SquareMillimeter](self._values)
+
+    
+    @property
+    def square_micrometers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaUnits.SquareMicrometer](self._values)
+
+    
+    @property
+    def square_miles(self) -> np.ndarray:
+        """
+        The statute mile was standardised between the British Commonwealth and the United States by an international agreement in 1959, when it was formally redefined with respect to SI units as exactly 1,609.344 metres.
+        """
+        return self._conversions_from_base[AreaUnits.SquareMile](self._values)
+
+    
+    @property
+    def square_yards(self) -> np.ndarray:
+        """
+        The yard (symbol: yd) is an English unit of length in both the British imperial and US customary systems of measurement equalling 3 feet (or 36 inches). Since 1959 the yard has been by international agreement standardized as exactly 0.9144 meter. A distance of 1,760 yards is equal to 1 mile.
+        """
+        return self._conversions_from_base[AreaUnits.SquareYard](self._values)
+
+    
+    @property
+    def square_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaUnits.SquareFoot](self._values)
+
+    
+    @property
+    def us_survey_square_feet(self) -> np.ndarray:
+        """
+        In the United States, the foot was defined as 12 inches, with the inch being defined by the Mendenhall Order of 1893 as 39.37 inches = 1 m. This makes a U.S. survey foot exactly 1200/3937 meters.
+        """
+        return self._conversions_from_base[AreaUnits.UsSurveySquareFoot](self._values)
+
+    
+    @property
+    def square_inches(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaUnits.SquareInch](self._values)
+
+    
+    @property
+    def acres(self) -> np.ndarray:
+        """
+        Based upon the international yard and pound agreement of 1959, an acre may be declared as exactly 4,046.8564224 square metres.
+        """
+        return self._conversions_from_base[AreaUnits.Acre](self._values)
+
+    
+    @property
+    def hectares(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaUnits.Hectare](self._values)
+
+    
+    @property
+    def square_nautical_miles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaUnits.SquareNauticalMile](self._values)
+
+    
\ No newline at end of file
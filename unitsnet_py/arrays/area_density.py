@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.area_density import AreaDensity, AreaDensityUnits
+
+
+class AreaDensityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of AreaDensity values, held in KilogramPerSquareMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (AreaDensityUnits): The AreaDensity unit of the values, The default unit is KilogramPerSquareMeter
+    """
+    __slots__ = ()
+
+    _quantity = AreaDensity
+
+    # Whole-array variants of the AreaDensity conversion functions.
+    _conversions_from_base = {
+        
+        AreaDensityUnits.KilogramPerSquareMeter: lambda value: (value),
+        
+        AreaDensityUnits.GramPerSquareMeter: lambda value: (value * 1000),
+        
+        AreaDensityUnits.MilligramPerSquareMeter: lambda value: (value * 1000000),
+        
+    }
+
+    _conversions_to_base = {
+        
+        AreaDensityUnits.KilogramPerSquareMeter: lambda value: (value),
+        
+        AreaDensityUnits.GramPerSquareMeter: lambda value: (value / 1000),
+        
+        AreaDensityUnits.MilligramPerSquareMeter: lambda value: (value / 1000000),
+        
+    }
+
+    def __init__(self, values, from_unit: AreaDensityUnits = AreaDensityUnits.KilogramPerSquareMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: AreaDensityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: AreaDensityUnits = AreaDensityUnits.KilogramPerSquareMeter) -> AreaDensityArray:
+        """
+        Create a new instance of AreaDensityArray from values in the given unit.
+
+        :param values: The AreaDensity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: AreaDensityUnits
+        :return: A new instance of AreaDensityArray.
+        :rtype: AreaDensityArray
+        """
+        return AreaDensityArray(values, unit)
+
+    
+    @property
+    def kilograms_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaDensityUnits.KilogramPerSquareMeter](self._values)
+
+    
+    @property
+    def grams_per_square_meter(self) -> np.ndarray:
+        """
+        Also known as grammage for paper industry. In fiber industry used with abbreviation 'gsm'.
+        """
+        return self._conversions_from_base[AreaDensityUnits.GramPerSquareMeter](self._values)
+
+    
+    @property
+    def milligrams_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaDensityUnits.MilligramPerSquareMeter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.area_moment_of_inertia import AreaMomentOfInertia, AreaMomentOfInertiaUnits
+
+
+class AreaMomentOfInertiaArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of AreaMomentOfInertia values, held in MeterToTheFourth.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (AreaMomentOfInertiaUnits): The AreaMomentOfInertia unit of the values, The default unit is MeterToTheFourth
+    """
+    __slots__ = ()
+
+    _quantity = AreaMomentOfInertia
+
+    # Whole-array variants of the AreaMomentOfInertia conversion functions.
+    _conversions_from_base = {
+        
+        AreaMomentOfInertiaUnits.MeterToTheFourth: lambda value: (value),
+        
+        AreaMomentOfInertiaUnits.DecimeterToTheFourth: lambda value: (value * 1e4),
+        
+        AreaMomentOfInertiaUnits.CentimeterToTheFourth: lambda value: (value * 1e8),
+        
+        AreaMomentOfInertiaUnits.MillimeterToTheFourth: lambda value: (value * 1e12),
+        
+        AreaMomentOfInertiaUnits.FootToTheFourth: lambda value: (value / np.power(0.3048, 4)),
+        
+        AreaMomentOfInertiaUnits.InchToTheFourth: lambda value: (value / np.power(2.54e-2, 4)),
+        
+    }
+
+    _conversions_to_base = {
+        
+        AreaMomentOfInertiaUnits.MeterToTheFourth: lambda value: (value),
+        
+        AreaMomentOfInertiaUnits.DecimeterToTheFourth: lambda value: (value / 1e4),
+        
+        AreaMomentOfInertiaUnits.CentimeterToTheFourth: lambda value: (value / 1e8),
+        
+        AreaMomentOfInertiaUnits.MillimeterToTheFourth: lambda value: (value / 1e12),
+        
+        AreaMomentOfInertiaUnits.FootToTheFourth: lambda value: (value * np.power(0.3048, 4)),
+        
+        AreaMomentOfInertiaUnits.InchToTheFourth: lambda value: (value * np.power(2.54e-2, 4)),
+        
+    }
+
+    def __init__(self, values, from_unit: AreaMomentOfInertiaUnits = AreaMomentOfInertiaUnits.MeterToTheFourth):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: AreaMomentOfInertiaUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: AreaMomentOfInertiaUnits = AreaMomentOfInertiaUnits.MeterToTheFourth) -> AreaMomentOfInertiaArray:
+        """
+        Create a new instance of AreaMomentOfInertiaArray from values in the given unit.
+
+        :param values: The AreaMomentOfInertia values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: AreaMomentOfInertiaUnits
+        :return: A new instance of AreaMomentOfInertiaArray.
+        :rtype: AreaMomentOfInertiaArray
+        """
+        return AreaMomentOfInertiaArray(values, unit)
+
+    
+    @property
+    def meters_to_the_fourth(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaMomentOfInertiaUnits.MeterToTheFourth](self._values)
+
+    
+    @property
+    def decimeters_to_the_fourth(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaMomentOfInertiaUnits.DecimeterToTheFourth](self._values)
+
+    
+    @property
+    def centimeters_to_the_fourth(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaMomentOfInertiaUnits.CentimeterToTheFourth](self._values)
+
+    
+    @property
+    def millimeters_to_the_fourth(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaMomentOfInertiaUnits.MillimeterToTheFourth](self._values)
+
+    
+    @property
+    def feet_to_the_fourth(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaMomentOfInertiaUnits.FootToTheFourth](self._values)
+
+    
+    @property
+    def inches_to_the_fourth(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[AreaMomentOfInertiaUnits.InchToTheFourth](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.bit_rate import BitRate, BitRateUnits
+
+
+class BitRateArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of BitRate values, held in BitPerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (BitRateUnits): The BitRate unit of the values, The default unit is BitPerSecond
+    """
+    __slots__ = ()
+
+    _quantity = BitRate
+
+    # Whole-array variants of the BitRate conversion functions.
+    _conversions_from_base = {
+        
+        BitRateUnits.BitPerSecond: lambda value: (value),
+        
+        BitRateUnits.BytePerSecond: lambda value: (value / 8),
+        
+        BitRateUnits.KilobitPerSecond: lambda value: ((value) / 1000.0),
+        
+        BitRateUnits.MegabitPerSecond: lambda value: ((value) / 1000000.0),
+        
+        BitRateUnits.GigabitPerSecond: lambda value: ((value) / 1000000000.0),
+        
+        BitRateUnits.TerabitPerSecond: lambda value: ((value) / 1000000000000.0),
+        
+        BitRateUnits.PetabitPerSecond: lambda value: ((value) / 1000000000000000.0),
+        
+        BitRateUnits.ExabitPerSecond: lambda value: ((value) / 1e+18),
+        
+        BitRateUnits.KilobytePerSecond: lambda value: ((value / 8) / 1000.0),
+        
+        BitRateUnits.MegabytePerSecond: lambda value: ((value / 8) / 1000000.0),
+        
+        BitRateUnits.GigabytePerSecond: lambda value: ((value / 8) / 1000000000.0),
+        
+        BitRateUnits.TerabytePerSecond: lambda value: ((value / 8) / 1000000000000.0),
+        
+        BitRateUnits.PetabytePerSecond: lambda value: ((value / 8) / 1000000000000000.0),
+        
+        BitRateUnits.ExabytePerSecond: lambda value: ((value / 8) / 1e+18),
+        
+    }
+
+    _conversions_to_base = {
+        
+        BitRateUnits.BitPerSecond: lambda value: (value),
+        
+        BitRateUnits.BytePerSecond: lambda value: (value * 8),
+        
+        BitRateUnits.KilobitPerSecond: lambda value: ((value) * 1000.0),
+        
+        BitRateUnits.MegabitPerSecond: lambda value: ((value) * 1000000.0),
+        
+        BitRateUnits.GigabitPerSecond: lambda value: ((value) * 1000000000.0),
+        
+        BitRateUnits.TerabitPerSecond: lambda value: ((value) * 1000000000000.0),
+        
+        BitRateUnits.PetabitPerSecond: lambda value: ((value) * 1000000000000000.0),
+        
+        BitRateUnits.ExabitPerSecond: lambda value: ((value) * 1e+18),
+        
+        BitRateUnits.KilobytePerSecond: lambda value: ((value * 8) * 1000.0),
+        
+        BitRateUnits.MegabytePerSecond: lambda value: ((value * 8) * 1000000.0),
+        
+        BitRateUnits.GigabytePerSecond: lambda value: ((value * 8) * 1000000000.0),
+        
+        BitRateUnits.TerabytePerSecond: lambda value: ((value * 8) * 1000000000000.0),
+        
+        BitRateUnits.PetabytePerSecond: lambda value: ((value * 8) * 1000000000000000.0),
+        
+        BitRateUnits.ExabytePerSecond: lambda value: ((value * 8) * 1e+18),
+        
+    }
+
+    def __init__(self, values, from_unit: BitRateUnits = BitRateUnits.BitPerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: BitRateUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: BitRateUnits = BitRateUnits.BitPerSecond) -> BitRateArray:
+        """
+        Create a new instance of BitRateArray from values in the given unit.
+
+        :param values: The BitRate values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: BitRateUnits
+        :return: A new instance of BitRateArray.
+        :rtype: BitRateArray
+        """
+        return BitRateArray(values, unit)
+
+    
+    @property
+    def bits_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BitRateUnits.BitPerSecond](self._values)
+
+    
+    @property
+    def bytes_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BitRateUnits.BytePerSecond](self._values)
+
+    
+    @property
+    def kilobits_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BitRateUnits.KilobitPerSecond](self._values)
+
+    
+    @property
+    def megabits_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BitRateUnits.MegabitPerSecond](self._values)
+
+    
+    @property
+    def gigabits_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BitRateUnits.GigabitPerSecond](self._values)
+
+    
+    @property
+    def terabits_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BitRateUnits.TerabitPerSecond](self._values)
+
+    
+    @property
+    def petabits_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BitRateUnits.PetabitPerSecond](self._values)
+
+    
+    @property
+    def exabits_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BitRateUnits.ExabitPerSecond](self._values)
+
+    
+    @property
+    def kilobytes_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BitRateUnits.KilobytePerSecond](self._values)
+
+    
+    @property
+    def megabytes_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BitRateUnits.MegabytePerSecond](self._values)
+
+    
+    @property
+    def gigabytes_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BitRateUnits.GigabytePerSecond](self._values)
+
+    
+    @property
+    def terabytes_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BitRateUnits.TerabytePerSecond](self._values)
+
+    
+    @property
+    def petabytes_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BitRateUnits.PetabytePerSecond](self._values)
+
+    
+    @property
+    def exabytes_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BitRateUnits.ExabytePerSecond](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.brake_specific_fuel_consumption import BrakeSpecificFuelConsumption, BrakeSpecificFuelConsumptionUnits
+
+
+class BrakeSpecificFuelConsumptionArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of BrakeSpecificFuelConsumption values, held in KilogramPerJoule.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (BrakeSpecificFuelConsumptionUnits): The BrakeSpecificFuelConsumption unit of the values, The default unit is KilogramPerJoule
+    """
+    __slots__ = ()
+
+    _quantity = BrakeSpecificFuelConsumption
+
+    # Whole-array variants of the BrakeSpecificFuelConsumption conversion functions.
+    _conversions_from_base = {
+        
+        BrakeSpecificFuelConsumptionUnits.GramPerKiloWattHour: lambda value: (value * 3.6e9),
+        
+        BrakeSpecificFuelConsumptionUnits.KilogramPerJoule: lambda value: (value),
+        
+        BrakeSpecificFuelConsumptionUnits.PoundPerMechanicalHorsepowerHour: lambda value: (value / 1.689659410672e-7),
+        
+    }
+
+    _conversions_to_base = {
+        
+        BrakeSpecificFuelConsumptionUnits.GramPerKiloWattHour: lambda value: (value / 3.6e9),
+        
+        BrakeSpecificFuelConsumptionUnits.KilogramPerJoule: lambda value: (value),
+        
+        BrakeSpecificFuelConsumptionUnits.PoundPerMechanicalHorsepowerHour: lambda value: (value * 1.689659410672e-7),
+        
+    }
+
+    def __init__(self, values, from_unit: BrakeSpecificFuelConsumptionUnits = BrakeSpecificFuelConsumptionUnits.KilogramPerJoule):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: BrakeSpecificFuelConsumptionUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: BrakeSpecificFuelConsumptionUnits = BrakeSpecificFuelConsumptionUnits.KilogramPerJoule) -> BrakeSpecificFuelConsumptionArray:
+        """
+        Create a new instance of BrakeSpecificFuelConsumptionArray from values in the given unit.
+
+        :param values: The BrakeSpecificFuelConsumption values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: BrakeSpecificFuelConsumptionUnits
+        :return: A new instance of BrakeSpecificFuelConsumptionArray.
+        :rtype: BrakeSpecificFuelConsumptionArray
+        """
+        return BrakeSpecificFuelConsumptionArray(values, unit)
+
+    
+    @property
+    def grams_per_kilo_watt_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BrakeSpecificFuelConsumptionUnits.GramPerKiloWattHour](self._values)
+
+    
+    @property
+    def kilograms_per_joule(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[BrakeSpecificFuelConsumptionUnits.KilogramPerJoule](self._values)
+
+    
+    @property
+    def pounds_per_mechanical_horsepower_hour(self) -> np.ndarray:
+        """
+        The pound per horse power hour uses mechanical horse power and the imperial pound
+        """
+        return self._conversions_from_base[BrakeSpecificFuelConsumptionUnits.PoundPerMechanicalHorsepowerHour](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.capacitance import Capacitance, CapacitanceUnits
+
+
+class CapacitanceArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Capacitance values, held in Farad.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (CapacitanceUnits): The Capacitance unit of the values, The default unit is Farad
+    """
+    __slots__ = ()
+
+    _quantity = Capacitance
+
+    # Whole-array variants of the Capacitance conversion functions.
+    _conversions_from_base = {
+        
+        CapacitanceUnits.Farad: lambda value: (value),
+        
+        CapacitanceUnits.Picofarad: lambda value: ((value) / 1e-12),
+        
+        CapacitanceUnits.Nanofarad: lambda value: ((value) / 1e-09),
+        
+        CapacitanceUnits.Microfarad: lambda value: ((value) / 1e-06),
+        
+        CapacitanceUnits.Millifarad: lambda value: ((value) / 0.001),
+        
+        CapacitanceUnits.Kilofarad: lambda value: ((value) / 1000.0),
+        
+        CapacitanceUnits.Megafarad: lambda value: ((value) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        CapacitanceUnits.Farad: lambda value: (value),
+        
+        CapacitanceUnits.Picofarad: lambda value: ((value) * 1e-12),
+        
+        CapacitanceUnits.Nanofarad: lambda value: ((value) * 1e-09),
+        
+        CapacitanceUnits.Microfarad: lambda value: ((value) * 1e-06),
+        
+        CapacitanceUnits.Millifarad: lambda value: ((value) * 0.001),
+        
+        CapacitanceUnits.Kilofarad: lambda value: ((value) * 1000.0),
+        
+        CapacitanceUnits.Megafarad: lambda value: ((value) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: CapacitanceUnits = CapacitanceUnits.Farad):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: CapacitanceUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: CapacitanceUnits = CapacitanceUnits.Farad) -> CapacitanceArray:
+        """
+        Create a new instance of CapacitanceArray from values in the given unit.
+
+        :param values: The Capacitance values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: CapacitanceUnits
+        :return: A new instance of CapacitanceArray.
+        :rtype: CapacitanceArray
+        """
+        return CapacitanceArray(values, unit)
+
+    
+    @property
+    def farads(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CapacitanceUnits.Farad](self._values)
+
+    
+    @property
+    def picofarads(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CapacitanceUnits.Picofarad](self._values)
+
+    
+    @property
+    def nanofarads(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CapacitanceUnits.Nanofarad](self._values)
+
+    
+    @property
+    def microfarads(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CapacitanceUnits.Microfarad](self._values)
+
+    
+    @property
+    def millifarads(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CapacitanceUnits.Millifarad](self._values)
+
+    
+    @property
+    def kilofarads(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CapacitanceUnits.Kilofarad](self._values)
+
+    
+    @property
+    def megafarads(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CapacitanceUnits.Megafarad](self._values)
+
+    
\ No newline at end of file
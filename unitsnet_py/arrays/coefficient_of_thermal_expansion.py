@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.coefficient_of_thermal_expansion import CoefficientOfThermalExpansion, CoefficientOfThermalExpansionUnits
+
+
+class CoefficientOfThermalExpansionArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of CoefficientOfThermalExpansion values, held in PerKelvin.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (CoefficientOfThermalExpansionUnits): The CoefficientOfThermalExpansion unit of the values, The default unit is PerKelvin
+    """
+    __slots__ = ()
+
+    _quantity = CoefficientOfThermalExpansion
+
+    # Whole-array variants of the CoefficientOfThermalExpansion conversion functions.
+    _conversions_from_base = {
+        
+        CoefficientOfThermalExpansionUnits.PerKelvin: lambda value: (value),
+        
+        CoefficientOfThermalExpansionUnits.PerDegreeCelsius: lambda value: (value),
+        
+        CoefficientOfThermalExpansionUnits.PerDegreeFahrenheit: lambda value: (value * 5 / 9),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerKelvin: lambda value: (value * 1e6),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeCelsius: lambda value: (value * 1e6),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeFahrenheit: lambda value: (value * 5e6 / 9),
+        
+    }
+
+    _conversions_to_base = {
+        
+        CoefficientOfThermalExpansionUnits.PerKelvin: lambda value: (value),
+        
+        CoefficientOfThermalExpansionUnits.PerDegreeCelsius: lambda value: (value),
+        
+        CoefficientOfThermalExpansionUnits.PerDegreeFahrenheit: lambda value: (value * 9 / 5),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerKelvin: lambda value: (value / 1e6),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeCelsius: lambda value: (value / 1e6),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeFahrenheit: lambda value: (value * 9 / 5e6),
+        
+    }
+
+    def __init__(self, values, from_unit: CoefficientOfThermalExpansionUnits = CoefficientOfThermalExpansionUnits.PerKelvin):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: CoefficientOfThermalExpansionUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: CoefficientOfThermalExpansionUnits = CoefficientOfThermalExpansionUnits.PerKelvin) -> CoefficientOfThermalExpansionArray:
+        """
+        Create a new instance of CoefficientOfThermalExpansionArray from values in the given unit.
+
+        :param values: The CoefficientOfThermalExpansion values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: CoefficientOfThermalExpansionUnits
+        :return: A new instance of CoefficientOfThermalExpansionArray.
+        :rtype: CoefficientOfThermalExpansionArray
+        """
+        return CoefficientOfThermalExpansionArray(values, unit)
+
+    
+    @property
+    def per_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CoefficientOfThermalExpansionUnits.PerKelvin](self._values)
+
+    
+    @property
+    def per_degree_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CoefficientOfThermalExpansionUnits.PerDegreeCelsius](self._values)
+
+    
+    @property
+    def per_degree_fahrenheit(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CoefficientOfThermalExpansionUnits.PerDegreeFahrenheit](self._values)
+
+    
+    @property
+    def ppm_per_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CoefficientOfThermalExpansionUnits.PpmPerKelvin](self._values)
+
+    
+    @property
+    def ppm_per_degree_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CoefficientOfThermalExpansionUnits.PpmPerDegreeCelsius](self._values)
+
+    
+    @property
+    def ppm_per_degree_fahrenheit(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CoefficientOfThermalExpansionUnits.PpmPerDegreeFahrenheit](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.compressibility import Compressibility, CompressibilityUnits
+
+
+class CompressibilityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Compressibility values, held in InversePascal.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (CompressibilityUnits): The Compressibility unit of the values, The default unit is InversePascal
+    """
+    __slots__ = ()
+
+    _quantity = Compressibility
+
+    # Whole-array variants of the Compressibility conversion functions.
+    _conversions_from_base = {
+        
+        CompressibilityUnits.InversePascal: lambda value: (value),
+        
+        CompressibilityUnits.InverseKilopascal: lambda value: (value / 1e3),
+        
+        CompressibilityUnits.InverseMegapascal: lambda value: (value / 1e6),
+        
+        CompressibilityUnits.InverseAtmosphere: lambda value: (value / 101325),
+        
+        CompressibilityUnits.InverseMillibar: lambda value: (value / 100),
+        
+        CompressibilityUnits.InverseBar: lambda value: (value / 1e5),
+        
+        CompressibilityUnits.InversePoundForcePerSquareInch: lambda value: (value / 6.894757293168361e3),
+        
+    }
+
+    _conversions_to_base = {
+        
+        CompressibilityUnits.InversePascal: lambda value: (value),
+        
+        CompressibilityUnits.InverseKilopascal: lambda value: (value * 1e3),
+        
+        CompressibilityUnits.InverseMegapascal: lambda value: (value * 1e6),
+        
+        CompressibilityUnits.InverseAtmosphere: lambda value: (value * 101325),
+        
+        CompressibilityUnits.InverseMillibar: lambda value: (value * 100),
+        
+        CompressibilityUnits.InverseBar: lambda value: (value * 1e5),
+        
+        CompressibilityUnits.InversePoundForcePerSquareInch: lambda value: (value * 6.894757293168361e3),
+        
+    }
+
+    def __init__(self, values, from_unit: CompressibilityUnits = CompressibilityUnits.InversePascal):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: CompressibilityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: CompressibilityUnits = CompressibilityUnits.InversePascal) -> CompressibilityArray:
+        """
+        Create a new instance of CompressibilityArray from values in the given unit.
+
+        :param values: The Compressibility values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: CompressibilityUnits
+        :return: A new instance of CompressibilityArray.
+        :rtype: CompressibilityArray
+        """
+        return CompressibilityArray(values, unit)
+
+    
+    @property
+    def inverse_pascals(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CompressibilityUnits.InversePascal](self._values)
+
+    
+    @property
+    def inverse_kilopascals(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CompressibilityUnits.InverseKilopascal](self._values)
+
+    
+    @property
+    def inverse_megapascals(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CompressibilityUnits.InverseMegapascal](self._values)
+
+    
+    @property
+    def inverse_atmospheres(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CompressibilityUnits.InverseAtmosphere](self._values)
+
+    
+    @property
+    def inverse_millibars(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CompressibilityUnits.InverseMillibar](self._values)
+
+    
+    @property
+    def inverse_bars(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CompressibilityUnits.InverseBar](self._values)
+
+    
+    @property
+    def inverse_pounds_force_per_square_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[CompressibilityUnits.InversePoundForcePerSquareInch](self._values)
+
+    
\ No newline at end of file
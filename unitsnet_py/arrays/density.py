@@ -0,0 +1,662 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.density import Density, DensityUnits
+
+
+class DensityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Density values, held in KilogramPerCubicMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (DensityUnits): The Density unit of the values, The default unit is KilogramPerCubicMeter
+    """
+    __slots__ = ()
+
+    _quantity = Density
+
+    # Whole-array variants of the Density conversion functions.
+    _conversions_from_base = {
+        
+        DensityUnits.GramPerCubicMillimeter: lambda value: (value * 1e-6),
+        
+        DensityUnits.GramPerCubicCentimeter: lambda value: (value * 1e-3),
+        
+        DensityUnits.GramPerCubicMeter: lambda value: (value * 1e3),
+        
+        DensityUnits.PoundPerCubicInch: lambda value: (value * 3.6127298147753e-5),
+        
+        DensityUnits.PoundPerCubicFoot: lambda value: (value * 0.062427961),
+        
+        DensityUnits.TonnePerCubicMillimeter: lambda value: (value * 1e-12),
+        
+        DensityUnits.TonnePerCubicCentimeter: lambda value: (value * 1e-9),
+        
+        DensityUnits.TonnePerCubicMeter: lambda value: (value * 0.001),
+        
+        DensityUnits.SlugPerCubicFoot: lambda value: (value * 0.00194032033),
+        
+        DensityUnits.GramPerLiter: lambda value: (value * 1),
+        
+        DensityUnits.GramPerDeciliter: lambda value: (value * 1e-1),
+        
+        DensityUnits.GramPerMilliliter: lambda value: (value * 1e-3),
+        
+        DensityUnits.PoundPerUSGallon: lambda value: (value / 1.19826427e2),
+        
+        DensityUnits.PoundPerImperialGallon: lambda value: (value / 9.9776398e1),
+        
+        DensityUnits.KilogramPerLiter: lambda value: (value / 1e3),
+        
+        DensityUnits.TonnePerCubicFoot: lambda value: (value / 3.53146667214886e4),
+        
+        DensityUnits.TonnePerCubicInch: lambda value: (value / 6.10237440947323e7),
+        
+        DensityUnits.GramPerCubicFoot: lambda value: (value / 0.0353146667214886),
+        
+        DensityUnits.GramPerCubicInch: lambda value: (value / 61.0237440947323),
+        
+        DensityUnits.PoundPerCubicMeter: lambda value: (value * 2.204622621848775),
+        
+        DensityUnits.PoundPerCubicCentimeter: lambda value: (value * 2.204622621848775e-6),
+        
+        DensityUnits.PoundPerCubicMillimeter: lambda value: (value * 2.204622621848775e-9),
+        
+        DensityUnits.SlugPerCubicMeter: lambda value: (value / 14.5939),
+        
+        DensityUnits.SlugPerCubicCentimeter: lambda value: (value / 14593903),
+        
+        DensityUnits.SlugPerCubicMillimeter: lambda value: (value / 14593903000),
+        
+        DensityUnits.SlugPerCubicInch: lambda value: (value / 890574.60201535),
+        
+        DensityUnits.KilogramPerCubicMillimeter: lambda value: ((value * 1e-6) / 1000.0),
+        
+        DensityUnits.KilogramPerCubicCentimeter: lambda value: ((value * 1e-3) / 1000.0),
+        
+        DensityUnits.KilogramPerCubicMeter: lambda value: ((value * 1e3) / 1000.0),
+        
+        DensityUnits.MilligramPerCubicMeter: lambda value: ((value * 1e3) / 0.001),
+        
+        DensityUnits.MicrogramPerCubicMeter: lambda value: ((value * 1e3) / 1e-06),
+        
+        DensityUnits.KilopoundPerCubicInch: lambda value: ((value * 3.6127298147753e-5) / 1000.0),
+        
+        DensityUnits.KilopoundPerCubicFoot: lambda value: ((value * 0.062427961) / 1000.0),
+        
+        DensityUnits.PicogramPerLiter: lambda value: ((value * 1) / 1e-12),
+        
+        DensityUnits.NanogramPerLiter: lambda value: ((value * 1) / 1e-09),
+        
+        DensityUnits.MicrogramPerLiter: lambda value: ((value * 1) / 1e-06),
+        
+        DensityUnits.MilligramPerLiter: lambda value: ((value * 1) / 0.001),
+        
+        DensityUnits.CentigramPerLiter: lambda value: ((value * 1) / 0.01),
+        
+        DensityUnits.DecigramPerLiter: lambda value: ((value * 1) / 0.1),
+        
+        DensityUnits.PicogramPerDeciliter: lambda value: ((value * 1e-1) / 1e-12),
+        
+        DensityUnits.NanogramPerDeciliter: lambda value: ((value * 1e-1) / 1e-09),
+        
+        DensityUnits.MicrogramPerDeciliter: lambda value: ((value * 1e-1) / 1e-06),
+        
+        DensityUnits.MilligramPerDeciliter: lambda value: ((value * 1e-1) / 0.001),
+        
+        DensityUnits.CentigramPerDeciliter: lambda value: ((value * 1e-1) / 0.01),
+        
+        DensityUnits.DecigramPerDeciliter: lambda value: ((value * 1e-1) / 0.1),
+        
+        DensityUnits.PicogramPerMilliliter: lambda value: ((value * 1e-3) / 1e-12),
+        
+        DensityUnits.NanogramPerMilliliter: lambda value: ((value * 1e-3) / 1e-09),
+        
+        DensityUnits.MicrogramPerMilliliter: lambda value: ((value * 1e-3) / 1e-06),
+        
+        DensityUnits.MilligramPerMilliliter: lambda value: ((value * 1e-3) / 0.001),
+        
+        DensityUnits.CentigramPerMilliliter: lambda value: ((value * 1e-3) / 0.01),
+        
+        DensityUnits.DecigramPerMilliliter: lambda value: ((value * 1e-3) / 0.1),
+        
+    }
+
+    _conversions_to_base = {
+        
+        DensityUnits.GramPerCubicMillimeter: lambda value: (value / 1e-6),
+        
+        DensityUnits.GramPerCubicCentimeter: lambda value: (value / 1e-3),
+        
+        DensityUnits.GramPerCubicMeter: lambda value: (value / 1e3),
+        
+        DensityUnits.PoundPerCubicInch: lambda value: (value / 3.6127298147753e-5),
+        
+        DensityUnits.PoundPerCubicFoot: lambda value: (value / 0.062427961),
+        
+        DensityUnits.TonnePerCubicMillimeter: lambda value: (value / 1e-12),
+        
+        DensityUnits.TonnePerCubicCentimeter: lambda value: (value / 1e-9),
+        
+        DensityUnits.TonnePerCubicMeter: lambda value: (value / 0.001),
+        
+        DensityUnits.SlugPerCubicFoot: lambda value: (value * 515.378818),
+        
+        DensityUnits.GramPerLiter: lambda value: (value / 1),
+        
+        DensityUnits.GramPerDeciliter: lambda value: (value / 1e-1),
+        
+        DensityUnits.GramPerMilliliter: lambda value: (value / 1e-3),
+        
+        DensityUnits.PoundPerUSGallon: lambda value: (value * 1.19826427e2),
+        
+        DensityUnits.PoundPerImperialGallon: lambda value: (value * 9.9776398e1),
+        
+        DensityUnits.KilogramPerLiter: lambda value: (value * 1e3),
+        
+        DensityUnits.TonnePerCubicFoot: lambda value: (value * 3.53146667214886e4),
+        
+        DensityUnits.TonnePerCubicInch: lambda value: (value * 6.10237440947323e7),
+        
+        DensityUnits.GramPerCubicFoot: lambda value: (value * 0.0353146667214886),
+        
+        DensityUnits.GramPerCubicInch: lambda value: (value * 61.0237440947323),
+        
+        DensityUnits.PoundPerCubicMeter: lambda value: (value / 2.204622621848775),
+        
+        DensityUnits.PoundPerCubicCentimeter: lambda value: (value / 2.204622621848775e-6),
+        
+        DensityUnits.PoundPerCubicMillimeter: lambda value: (value / 2.204622621848775e-9),
+        
+        DensityUnits.SlugPerCubicMeter: lambda value: (value * 14.5939),
+        
+        DensityUnits.SlugPerCubicCentimeter: lambda value: (value * 14593903),
+        
+        DensityUnits.SlugPerCubicMillimeter: lambda value: (value * 14593903000),
+        
+        DensityUnits.SlugPerCubicInch: lambda value: (value * 890574.60201535),
+        
+        DensityUnits.KilogramPerCubicMillimeter: lambda value: ((value / 1e-6) * 1000.0),
+        
+        DensityUnits.KilogramPerCubicCentimeter: lambda value: ((value / 1e-3) * 1000.0),
+        
+        DensityUnits.KilogramPerCubicMeter: lambda value: ((value / 1e3) * 1000.0),
+        
+        DensityUnits.MilligramPerCubicMeter: lambda value: ((value / 1e3) * 0.001),
+        
+        DensityUnits.MicrogramPerCubicMeter: lambda value: ((value / 1e3) * 1e-06),
+        
+        DensityUnits.KilopoundPerCubicInch: lambda value: ((value / 3.6127298147753e-5) * 1000.0),
+        
+        DensityUnits.KilopoundPerCubicFoot: lambda value: ((value / 0.062427961) * 1000.0),
+        
+        DensityUnits.PicogramPerLiter: lambda value: ((value / 1) * 1e-12),
+        
+        DensityUnits.NanogramPerLiter: lambda value: ((value / 1) * 1e-09),
+        
+        DensityUnits.MicrogramPerLiter: lambda value: ((value / 1) * 1e-06),
+        
+        DensityUnits.MilligramPerLiter: lambda value: ((value / 1) * 0.001),
+        
+        DensityUnits.CentigramPerLiter: lambda value: ((value / 1) * 0.01),
+        
+        DensityUnits.DecigramPerLiter: lambda value: ((value / 1) * 0.1),
+        
+        DensityUnits.PicogramPerDeciliter: lambda value: ((value / 1e-1) * 1e-12),
+        
+        DensityUnits.NanogramPerDeciliter: lambda value: ((value / 1e-1) * 1e-09),
+        
+        DensityUnits.MicrogramPerDeciliter: lambda value: ((value / 1e-1) * 1e-06),
+        
+        DensityUnits.MilligramPerDeciliter: lambda value: ((value / 1e-1) * 0.001),
+        
+        DensityUnits.CentigramPerDeciliter: lambda value: ((value / 1e-1) * 0.01),
+        
+        DensityUnits.DecigramPerDeciliter: lambda value: ((value / 1e-1) * 0.1),
+        
+        DensityUnits.PicogramPerMilliliter: lambda value: ((value / 1e-3) * 1e-12),
+        
+        DensityUnits.NanogramPerMilliliter: lambda value: ((value / 1e-3) * 1e-09),
+        
+        DensityUnits.MicrogramPerMilliliter: lambda value: ((value / 1e-3) * 1e-06),
+        
+        DensityUnits.MilligramPerMilliliter: lambda value: ((value / 1e-3) * 0.001),
+        
+        DensityUnits.CentigramPerMilliliter: lambda value: ((value / 1e-3) * 0.01),
+        
+        DensityUnits.DecigramPerMilliliter: lambda value: ((value / 1e-3) * 0.1),
+        
+    }
+
+    def __init__(self, values, from_unit: DensityUnits = DensityUnits.KilogramPerCubicMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: DensityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: DensityUnits = DensityUnits.KilogramPerCubicMeter) -> DensityArray:
+        """
+        Create a new instance of DensityArray from values in the given unit.
+
+        :param values: The Density values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: DensityUnits
+        :return: A new instance of DensityArray.
+        :rtype: DensityArray
+        """
+        return DensityArray(values, unit)
+
+    
+    @property
+    def grams_per_cubic_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.GramPerCubicMillimeter](self._values)
+
+    
+    @property
+    def grams_per_cubic_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.GramPerCubicCentimeter](self._values)
+
+    
+    @property
+    def grams_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.GramPerCubicMeter](self._values)
+
+    
+    @property
+    def pounds_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.PoundPerCubicInch](self._values)
+
+    
+    @property
+    def pounds_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.PoundPerCubicFoot](self._values)
+
+    
+    @property
+    def tonnes_per_cubic_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.TonnePerCubicMillimeter](self._values)
+
+    
+    @property
+    def tonnes_per_cubic_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.TonnePerCubicCentimeter](self._values)
+
+    
+    @property
+    def tonnes_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.TonnePerCubicMeter](self._values)
+
+    
+    @property
+    def slugs_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.SlugPerCubicFoot](self._values)
+
+    
+    @property
+    def grams_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.GramPerLiter](self._values)
+
+    
+    @property
+    def grams_per_deci_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.GramPerDeciliter](self._values)
+
+    
+    @property
+    def grams_per_milliliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.GramPerMilliliter](self._values)
+
+    
+    @property
+    def pounds_per_us_gallon(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.PoundPerUSGallon](self._values)
+
+    
+    @property
+    def pounds_per_imperial_gallon(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.PoundPerImperialGallon](self._values)
+
+    
+    @property
+    def kilograms_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.KilogramPerLiter](self._values)
+
+    
+    @property
+    def tonnes_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.TonnePerCubicFoot](self._values)
+
+    
+    @property
+    def tonnes_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.TonnePerCubicInch](self._values)
+
+    
+    @property
+    def grams_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.GramPerCubicFoot](self._values)
+
+    
+    @property
+    def grams_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.GramPerCubicInch](self._values)
+
+    
+    @property
+    def pounds_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.PoundPerCubicMeter](self._values)
+
+    
+    @property
+    def pounds_per_cubic_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.PoundPerCubicCentimeter](self._values)
+
+    
+    @property
+    def pounds_per_cubic_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.PoundPerCubicMillimeter](self._values)
+
+    
+    @property
+    def slugs_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.SlugPerCubicMeter](self._values)
+
+    
+    @property
+    def slugs_per_cubic_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.SlugPerCubicCentimeter](self._values)
+
+    
+    @property
+    def slugs_per_cubic_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.SlugPerCubicMillimeter](self._values)
+
+    
+    @property
+    def slugs_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.SlugPerCubicInch](self._values)
+
+    
+    @property
+    def kilograms_per_cubic_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.KilogramPerCubicMillimeter](self._values)
+
+    
+    @property
+    def kilograms_per_cubic_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.KilogramPerCubicCentimeter](self._values)
+
+    
+    @property
+    def kilograms_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.KilogramPerCubicMeter](self._values)
+
+    
+    @property
+    def milligrams_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.MilligramPerCubicMeter](self._values)
+
+    
+    @property
+    def micrograms_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.MicrogramPerCubicMeter](self._values)
+
+    
+    @property
+    def kilopounds_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.KilopoundPerCubicInch](self._values)
+
+    
+    @property
+    def kilopounds_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.KilopoundPerCubicFoot](self._values)
+
+    
+    @property
+    def picograms_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.PicogramPerLiter](self._values)
+
+    
+    @property
+    def nanograms_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.NanogramPerLiter](self._values)
+
+    
+    @property
+    def micrograms_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.MicrogramPerLiter](self._values)
+
+    
+    @property
+    def milligrams_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.MilligramPerLiter](self._values)
+
+    
+    @property
+    def centigrams_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.CentigramPerLiter](self._values)
+
+    
+    @property
+    def decigrams_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.DecigramPerLiter](self._values)
+
+    
+    @property
+    def picograms_per_deci_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.PicogramPerDeciliter](self._values)
+
+    
+    @property
+    def nanograms_per_deci_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.NanogramPerDeciliter](self._values)
+
+    
+    @property
+    def micrograms_per_deci_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.MicrogramPerDeciliter](self._values)
+
+    
+    @property
+    def milligrams_per_deci_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.MilligramPerDeciliter](self._values)
+
+    
+    @property
+    def centigrams_per_deci_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.CentigramPerDeciliter](self._values)
+
+    
+    @property
+    def decigrams_per_deci_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.DecigramPerDeciliter](self._values)
+
+    
+    @property
+    def picograms_per_milliliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.PicogramPerMilliliter](self._values)
+
+    
+    @property
+    def nanograms_per_milliliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.NanogramPerMilliliter](self._values)
+
+    
+    @property
+    def micrograms_per_milliliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.MicrogramPerMilliliter](self._values)
+
+    
+    @property
+    def milligrams_per_milliliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.MilligramPerMilliliter](self._values)
+
+    
+    @property
+    def centigrams_per_milliliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.CentigramPerMilliliter](self._values)
+
+    
+    @property
+    def decigrams_per_milliliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DensityUnits.DecigramPerMilliliter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.duration import Duration, DurationUnits
+
+
+class DurationArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Duration values, held in Second.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (DurationUnits): The Duration unit of the values, The default unit is Second
+    """
+    __slots__ = ()
+
+    _quantity = Duration
+
+    # Whole-array variants of the Duration conversion functions.
+    _conversions_from_base = {
+        
+        DurationUnits.Year365: lambda value: (value / (365 * 24 * 3600)),
+        
+        DurationUnits.Month30: lambda value: (value / (30 * 24 * 3600)),
+        
+        DurationUnits.Week: lambda value: (value / (7 * 24 * 3600)),
+        
+        DurationUnits.Day: lambda value: (value / (24 * 3600)),
+        
+        DurationUnits.Hour: lambda value: (value / 3600),
+        
+        DurationUnits.Minute: lambda value: (value / 60),
+        
+        DurationUnits.Second: lambda value: (value),
+        
+        DurationUnits.JulianYear: lambda value: (value / (365.25 * 24 * 3600)),
+        
+        DurationUnits.Nanosecond: lambda value: ((value) / 1e-09),
+        
+        DurationUnits.Microsecond: lambda value: ((value) / 1e-06),
+        
+        DurationUnits.Millisecond: lambda value: ((value) / 0.001),
+        
+    }
+
+    _conversions_to_base = {
+        
+        DurationUnits.Year365: lambda value: (value * 365 * 24 * 3600),
+        
+        DurationUnits.Month30: lambda value: (value * 30 * 24 * 3600),
+        
+        DurationUnits.Week: lambda value: (value * 7 * 24 * 3600),
+        
+        DurationUnits.Day: lambda value: (value * 24 * 3600),
+        
+        DurationUnits.Hour: lambda value: (value * 3600),
+        
+        DurationUnits.Minute: lambda value: (value * 60),
+        
+        DurationUnits.Second: lambda value: (value),
+        
+        DurationUnits.JulianYear: lambda value: (value * 365.25 * 24 * 3600),
+        
+        DurationUnits.Nanosecond: lambda value: ((value) * 1e-09),
+        
+        DurationUnits.Microsecond: lambda value: ((value) * 1e-06),
+        
+        DurationUnits.Millisecond: lambda value: ((value) * 0.001),
+        
+    }
+
+    def __init__(self, values, from_unit: DurationUnits = DurationUnits.Second):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: DurationUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: DurationUnits = DurationUnits.Second) -> DurationArray:
+        """
+        Create a new instance of DurationArray from values in the given unit.
+
+        :param values: The Duration values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: DurationUnits
+        :return: A new instance of DurationArray.
+        :rtype: DurationArray
+        """
+        return DurationArray(values, unit)
+
+    
+    @property
+    def years365(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DurationUnits.Year365](self._values)
+
+    
+    @property
+    def months30(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DurationUnits.Month30](self._values)
+
+    
+    @property
+    def weeks(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DurationUnits.Week](self._values)
+
+    
+    @property
+    def days(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DurationUnits.Day](self._values)
+
+    
+    @property
+    def hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DurationUnits.Hour](self._values)
+
+    
+    @property
+    def minutes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DurationUnits.Minute](self._values)
+
+    
+    @property
+    def seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DurationUnits.Second](self._values)
+
+    
+    @property
+    def julian_years(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DurationUnits.JulianYear](self._values)
+
+    
+    @property
+    def nanoseconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DurationUnits.Nanosecond](self._values)
+
+    
+    @property
+    def microseconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DurationUnits.Microsecond](self._values)
+
+    
+    @property
+    def milliseconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DurationUnits.Millisecond](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.dynamic_viscosity import DynamicViscosity, DynamicViscosityUnits
+
+
+class DynamicViscosityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of DynamicViscosity values, held in NewtonSecondPerMeterSquared.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (DynamicViscosityUnits): The DynamicViscosity unit of the values, The default unit is NewtonSecondPerMeterSquared
+    """
+    __slots__ = ()
+
+    _quantity = DynamicViscosity
+
+    # Whole-array variants of the DynamicViscosity conversion functions.
+    _conversions_from_base = {
+        
+        DynamicViscosityUnits.NewtonSecondPerMeterSquared: lambda value: (value),
+        
+        DynamicViscosityUnits.PascalSecond: lambda value: (value),
+        
+        DynamicViscosityUnits.Poise: lambda value: (value * 10),
+        
+        DynamicViscosityUnits.Reyn: lambda value: (value / 6.8947572931683613e3),
+        
+        DynamicViscosityUnits.PoundForceSecondPerSquareInch: lambda value: (value / 6.8947572931683613e3),
+        
+        DynamicViscosityUnits.PoundForceSecondPerSquareFoot: lambda value: (value / 4.7880258980335843e1),
+        
+        DynamicViscosityUnits.PoundPerFootSecond: lambda value: (value / 1.4881639),
+        
+        DynamicViscosityUnits.MillipascalSecond: lambda value: ((value) / 0.001),
+        
+        DynamicViscosityUnits.MicropascalSecond: lambda value: ((value) / 1e-06),
+        
+        DynamicViscosityUnits.Centipoise: lambda value: ((value * 10) / 0.01),
+        
+    }
+
+    _conversions_to_base = {
+        
+        DynamicViscosityUnits.NewtonSecondPerMeterSquared: lambda value: (value),
+        
+        DynamicViscosityUnits.PascalSecond: lambda value: (value),
+        
+        DynamicViscosityUnits.Poise: lambda value: (value / 10),
+        
+        DynamicViscosityUnits.Reyn: lambda value: (value * 6.8947572931683613e3),
+        
+        DynamicViscosityUnits.PoundForceSecondPerSquareInch: lambda value: (value * 6.8947572931683613e3),
+        
+        DynamicViscosityUnits.PoundForceSecondPerSquareFoot: lambda value: (value * 4.7880258980335843e1),
+        
+        DynamicViscosityUnits.PoundPerFootSecond: lambda value: (value * 1.4881639),
+        
+        DynamicViscosityUnits.MillipascalSecond: lambda value: ((value) * 0.001),
+        
+        DynamicViscosityUnits.MicropascalSecond: lambda value: ((value) * 1e-06),
+        
+        DynamicViscosityUnits.Centipoise: lambda value: ((value / 10) * 0.01),
+        
+    }
+
+    def __init__(self, values, from_unit: DynamicViscosityUnits = DynamicViscosityUnits.NewtonSecondPerMeterSquared):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: DynamicViscosityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: DynamicViscosityUnits = DynamicViscosityUnits.NewtonSecondPerMeterSquared) -> DynamicViscosityArray:
+        """
+        Create a new instance of DynamicViscosityArray from values in the given unit.
+
+        :param values: The DynamicViscosity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: DynamicViscosityUnits
+        :return: A new instance of DynamicViscosityArray.
+        :rtype: DynamicViscosityArray
+        """
+        return DynamicViscosityArray(values, unit)
+
+    
+    @property
+    def newton_seconds_per_meter_squared(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DynamicViscosityUnits.NewtonSecondPerMeterSquared](self._values)
+
+    
+    @property
+    def pascal_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DynamicViscosityUnits.PascalSecond](self._values)
+
+    
+    @property
+    def poise(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DynamicViscosityUnits.Poise](self._values)
+
+    
+    @property
+    def reyns(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DynamicViscosityUnits.Reyn](self._values)
+
+    
+    @property
+    def pounds_force_second_per_square_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DynamicViscosityUnits.PoundForceSecondPerSquareInch](self._values)
+
+    
+    @property
+    def pounds_force_second_per_square_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DynamicViscosityUnits.PoundForceSecondPerSquareFoot](self._values)
+
+    
+    @property
+    def pounds_per_foot_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DynamicViscosityUnits.PoundPerFootSecond](self._values)
+
+    
+    @property
+    def millipascal_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DynamicViscosityUnits.MillipascalSecond](self._values)
+
+    
+    @property
+    def micropascal_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DynamicViscosityUnits.MicropascalSecond](self._values)
+
+    
+    @property
+    def centipoise(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[DynamicViscosityUnits.Centipoise](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_admittance import ElectricAdmittance, ElectricAdmittanceUnits
+
+
+class ElectricAdmittanceArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricAdmittance values, held in Siemens.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricAdmittanceUnits): The ElectricAdmittance unit of the values, The default unit is Siemens
+    """
+    __slots__ = ()
+
+    _quantity = ElectricAdmittance
+
+    # Whole-array variants of the ElectricAdmittance conversion functions.
+    _conversions_from_base = {
+        
+        ElectricAdmittanceUnits.Siemens: lambda value: (value),
+        
+        ElectricAdmittanceUnits.Nanosiemens: lambda value: ((value) / 1e-09),
+        
+        ElectricAdmittanceUnits.Microsiemens: lambda value: ((value) / 1e-06),
+        
+        ElectricAdmittanceUnits.Millisiemens: lambda value: ((value) / 0.001),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricAdmittanceUnits.Siemens: lambda value: (value),
+        
+        ElectricAdmittanceUnits.Nanosiemens: lambda value: ((value) * 1e-09),
+        
+        ElectricAdmittanceUnits.Microsiemens: lambda value: ((value) * 1e-06),
+        
+        ElectricAdmittanceUnits.Millisiemens: lambda value: ((value) * 0.001),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricAdmittanceUnits = ElectricAdmittanceUnits.Siemens):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricAdmittanceUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricAdmittanceUnits = ElectricAdmittanceUnits.Siemens) -> ElectricAdmittanceArray:
+        """
+        Create a new instance of ElectricAdmittanceArray from values in the given unit.
+
+        :param values: The ElectricAdmittance values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricAdmittanceUnits
+        :return: A new instance of ElectricAdmittanceArray.
+        :rtype: ElectricAdmittanceArray
+        """
+        return ElectricAdmittanceArray(values, unit)
+
+    
+    @property
+    def siemens(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricAdmittanceUnits.Siemens](self._values)
+
+    
+    @property
+    def nanosiemens(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricAdmittanceUnits.Nanosiemens](self._values)
+
+    
+    @property
+    def microsiemens(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricAdmittanceUnits.Microsiemens](self._values)
+
+    
+    @property
+    def millisiemens(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricAdmittanceUnits.Millisiemens](self._values)
+
+    
\ No newline at end of file
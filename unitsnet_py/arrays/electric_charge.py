@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_charge import ElectricCharge, ElectricChargeUnits
+
+
+class ElectricChargeArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricCharge values, held in Coulomb.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricChargeUnits): The ElectricCharge unit of the values, The default unit is Coulomb
+    """
+    __slots__ = ()
+
+    _quantity = ElectricCharge
+
+    # Whole-array variants of the ElectricCharge conversion functions.
+    _conversions_from_base = {
+        
+        ElectricChargeUnits.Coulomb: lambda value: (value),
+        
+        ElectricChargeUnits.AmpereHour: lambda value: (value * 2.77777777777e-4),
+        
+        ElectricChargeUnits.Picocoulomb: lambda value: ((value) / 1e-12),
+        
+        ElectricChargeUnits.Nanocoulomb: lambda value: ((value) / 1e-09),
+        
+        ElectricChargeUnits.Microcoulomb: lambda value: ((value) / 1e-06),
+        
+        ElectricChargeUnits.Millicoulomb: lambda value: ((value) / 0.001),
+        
+        ElectricChargeUnits.Kilocoulomb: lambda value: ((value) / 1000.0),
+        
+        ElectricChargeUnits.Megacoulomb: lambda value: ((value) / 1000000.0),
+        
+        ElectricChargeUnits.MilliampereHour: lambda value: ((value * 2.77777777777e-4) / 0.001),
+        
+        ElectricChargeUnits.KiloampereHour: lambda value: ((value * 2.77777777777e-4) / 1000.0),
+        
+        ElectricChargeUnits.MegaampereHour: lambda value: ((value * 2.77777777777e-4) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricChargeUnits.Coulomb: lambda value: (value),
+        
+        ElectricChargeUnits.AmpereHour: lambda value: (value / 2.77777777777e-4),
+        
+        ElectricChargeUnits.Picocoulomb: lambda value: ((value) * 1e-12),
+        
+        ElectricChargeUnits.Nanocoulomb: lambda value: ((value) * 1e-09),
+        
+        ElectricChargeUnits.Microcoulomb: lambda value: ((value) * 1e-06),
+        
+        ElectricChargeUnits.Millicoulomb: lambda value: ((value) * 0.001),
+        
+        ElectricChargeUnits.Kilocoulomb: lambda value: ((value) * 1000.0),
+        
+        ElectricChargeUnits.Megacoulomb: lambda value: ((value) * 1000000.0),
+        
+        ElectricChargeUnits.MilliampereHour: lambda value: ((value / 2.77777777777e-4) * 0.001),
+        
+        ElectricChargeUnits.KiloampereHour: lambda value: ((value / 2.77777777777e-4) * 1000.0),
+        
+        ElectricChargeUnits.MegaampereHour: lambda value: ((value / 2.77777777777e-4) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricChargeUnits = ElectricChargeUnits.Coulomb):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricChargeUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricChargeUnits = ElectricChargeUnits.Coulomb) -> ElectricChargeArray:
+        """
+        Create a new instance of ElectricChargeArray from values in the given unit.
+
+        :param values: The ElectricCharge values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricChargeUnits
+        :return: A new instance of ElectricChargeArray.
+        :rtype: ElectricChargeArray
+        """
+        return ElectricChargeArray(values, unit)
+
+    
+    @property
+    def coulombs(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricChargeUnits.Coulomb](self._values)
+
+    
+    @property
+    def ampere_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricChargeUnits.AmpereHour](self._values)
+
+    
+    @property
+    def picocoulombs(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricChargeUnits.Picocoulomb](self._values)
+
+    
+    @property
+    def nanocoulombs(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricChargeUnits.Nanocoulomb](self._values)
+
+    
+    @property
+    def microcoulombs(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricChargeUnits.Microcoulomb](self._values)
+
+    
+    @property
+    def millicoulombs(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricChargeUnits.Millicoulomb](self._values)
+
+    
+    @property
+    def kilocoulombs(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricChargeUnits.Kilocoulomb](self._values)
+
+    
+    @property
+    def megacoulombs(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricChargeUnits.Megacoulomb](self._values)
+
+    
+    @property
+    def milliampere_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricChargeUnits.MilliampereHour](self._values)
+
+    
+    @property
+    def kiloampere_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricChargeUnits.KiloampereHour](self._values)
+
+    
+    @property
+    def megaampere_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricChargeUnits.MegaampereHour](self._values)
+
+    
\ No newline at end of file
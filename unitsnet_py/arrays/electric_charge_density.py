@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_charge_density import ElectricChargeDensity, ElectricChargeDensityUnits
+
+
+class ElectricChargeDensityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricChargeDensity values, held in CoulombPerCubicMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricChargeDensityUnits): The ElectricChargeDensity unit of the values, The default unit is CoulombPerCubicMeter
+    """
+    __slots__ = ()
+
+    _quantity = ElectricChargeDensity
+
+    # Whole-array variants of the ElectricChargeDensity conversion functions.
+    _conversions_from_base = {
+        
+        ElectricChargeDensityUnits.CoulombPerCubicMeter: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricChargeDensityUnits.CoulombPerCubicMeter: lambda value: (value),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricChargeDensityUnits = ElectricChargeDensityUnits.CoulombPerCubicMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricChargeDensityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricChargeDensityUnits = ElectricChargeDensityUnits.CoulombPerCubicMeter) -> ElectricChargeDensityArray:
+        """
+        Create a new instance of ElectricChargeDensityArray from values in the given unit.
+
+        :param values: The ElectricChargeDensity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricChargeDensityUnits
+        :return: A new instance of ElectricChargeDensityArray.
+        :rtype: ElectricChargeDensityArray
+        """
+        return ElectricChargeDensityArray(values, unit)
+
+    
+    @property
+    def coulombs_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricChargeDensityUnits.CoulombPerCubicMeter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_conductance import ElectricConductance, ElectricConductanceUnits
+
+
+class ElectricConductanceArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricConductance values, held in Siemens.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricConductanceUnits): The ElectricConductance unit of the values, The default unit is Siemens
+    """
+    __slots__ = ()
+
+    _quantity = ElectricConductance
+
+    # Whole-array variants of the ElectricConductance conversion functions.
+    _conversions_from_base = {
+        
+        ElectricConductanceUnits.Siemens: lambda value: (value),
+        
+        ElectricConductanceUnits.Nanosiemens: lambda value: ((value) / 1e-09),
+        
+        ElectricConductanceUnits.Microsiemens: lambda value: ((value) / 1e-06),
+        
+        ElectricConductanceUnits.Millisiemens: lambda value: ((value) / 0.001),
+        
+        ElectricConductanceUnits.Kilosiemens: lambda value: ((value) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricConductanceUnits.Siemens: lambda value: (value),
+        
+        ElectricConductanceUnits.Nanosiemens: lambda value: ((value) * 1e-09),
+        
+        ElectricConductanceUnits.Microsiemens: lambda value: ((value) * 1e-06),
+        
+        ElectricConductanceUnits.Millisiemens: lambda value: ((value) * 0.001),
+        
+        ElectricConductanceUnits.Kilosiemens: lambda value: ((value) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricConductanceUnits = ElectricConductanceUnits.Siemens):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricConductanceUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricConductanceUnits = ElectricConductanceUnits.Siemens) -> ElectricConductanceArray:
+        """
+        Create a new instance of ElectricConductanceArray from values in the given unit.
+
+        :param values: The ElectricConductance values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricConductanceUnits
+        :return: A new instance of ElectricConductanceArray.
+        :rtype: ElectricConductanceArray
+        """
+        return ElectricConductanceArray(values, unit)
+
+    
+    @property
+    def siemens(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricConductanceUnits.Siemens](self._values)
+
+    
+    @property
+    def nanosiemens(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricConductanceUnits.Nanosiemens](self._values)
+
+    
+    @property
+    def microsiemens(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricConductanceUnits.Microsiemens](self._values)
+
+    
+    @property
+    def millisiemens(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricConductanceUnits.Millisiemens](self._values)
+
+    
+    @property
+    def kilosiemens(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricConductanceUnits.Kilosiemens](self._values)
+
+    
\ No newline at end of file
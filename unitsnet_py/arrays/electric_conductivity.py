@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_conductivity import ElectricConductivity, ElectricConductivityUnits
+
+
+class ElectricConductivityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricConductivity values, held in SiemensPerMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricConductivityUnits): The ElectricConductivity unit of the values, The default unit is SiemensPerMeter
+    """
+    __slots__ = ()
+
+    _quantity = ElectricConductivity
+
+    # Whole-array variants of the ElectricConductivity conversion functions.
+    _conversions_from_base = {
+        
+        ElectricConductivityUnits.SiemensPerMeter: lambda value: (value),
+        
+        ElectricConductivityUnits.SiemensPerInch: lambda value: (value / 3.937007874015748e1),
+        
+        ElectricConductivityUnits.SiemensPerFoot: lambda value: (value / 3.2808398950131234),
+        
+        ElectricConductivityUnits.SiemensPerCentimeter: lambda value: (value / 1e2),
+        
+        ElectricConductivityUnits.MicrosiemensPerCentimeter: lambda value: ((value / 1e2) / 1e-06),
+        
+        ElectricConductivityUnits.MillisiemensPerCentimeter: lambda value: ((value / 1e2) / 0.001),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricConductivityUnits.SiemensPerMeter: lambda value: (value),
+        
+        ElectricConductivityUnits.SiemensPerInch: lambda value: (value * 3.937007874015748e1),
+        
+        ElectricConductivityUnits.SiemensPerFoot: lambda value: (value * 3.2808398950131234),
+        
+        ElectricConductivityUnits.SiemensPerCentimeter: lambda value: (value * 1e2),
+        
+        ElectricConductivityUnits.MicrosiemensPerCentimeter: lambda value: ((value * 1e2) * 1e-06),
+        
+        ElectricConductivityUnits.MillisiemensPerCentimeter: lambda value: ((value * 1e2) * 0.001),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricConductivityUnits = ElectricConductivityUnits.SiemensPerMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricConductivityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricConductivityUnits = ElectricConductivityUnits.SiemensPerMeter) -> ElectricConductivityArray:
+        """
+        Create a new instance of ElectricConductivityArray from values in the given unit.
+
+        :param values: The ElectricConductivity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricConductivityUnits
+        :return: A new instance of ElectricConductivityArray.
+        :rtype: ElectricConductivityArray
+        """
+        return ElectricConductivityArray(values, unit)
+
+    
+    @property
+    def siemens_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricConductivityUnits.SiemensPerMeter](self._values)
+
+    
+    @property
+    def siemens_per_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricConductivityUnits.SiemensPerInch](self._values)
+
+    
+    @property
+    def siemens_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricConductivityUnits.SiemensPerFoot](self._values)
+
+    
+    @property
+    def siemens_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricConductivityUnits.SiemensPerCentimeter](self._values)
+
+    
+    @property
+    def microsiemens_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricConductivityUnits.MicrosiemensPerCentimeter](self._values)
+
+    
+    @property
+    def millisiemens_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricConductivityUnits.MillisiemensPerCentimeter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_current import ElectricCurrent, ElectricCurrentUnits
+
+
+class ElectricCurrentArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricCurrent values, held in Ampere.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricCurrentUnits): The ElectricCurrent unit of the values, The default unit is Ampere
+    """
+    __slots__ = ()
+
+    _quantity = ElectricCurrent
+
+    # Whole-array variants of the ElectricCurrent conversion functions.
+    _conversions_from_base = {
+        
+        ElectricCurrentUnits.Ampere: lambda value: (value),
+        
+        ElectricCurrentUnits.Femtoampere: lambda value: ((value) / 1e-15),
+        
+        ElectricCurrentUnits.Picoampere: lambda value: ((value) / 1e-12),
+        
+        ElectricCurrentUnits.Nanoampere: lambda value: ((value) / 1e-09),
+        
+        ElectricCurrentUnits.Microampere: lambda value: ((value) / 1e-06),
+        
+        ElectricCurrentUnits.Milliampere: lambda value: ((value) / 0.001),
+        
+        ElectricCurrentUnits.Centiampere: lambda value: ((value) / 0.01),
+        
+        ElectricCurrentUnits.Kiloampere: lambda value: ((value) / 1000.0),
+        
+        ElectricCurrentUnits.Megaampere: lambda value: ((value) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricCurrentUnits.Ampere: lambda value: (value),
+        
+        ElectricCurrentUnits.Femtoampere: lambda value: ((value) * 1e-15),
+        
+        ElectricCurrentUnits.Picoampere: lambda value: ((value) * 1e-12),
+        
+        ElectricCurrentUnits.Nanoampere: lambda value: ((value) * 1e-09),
+        
+        ElectricCurrentUnits.Microampere: lambda value: ((value) * 1e-06),
+        
+        ElectricCurrentUnits.Milliampere: lambda value: ((value) * 0.001),
+        
+        ElectricCurrentUnits.Centiampere: lambda value: ((value) * 0.01),
+        
+        ElectricCurrentUnits.Kiloampere: lambda value: ((value) * 1000.0),
+        
+        ElectricCurrentUnits.Megaampere: lambda value: ((value) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricCurrentUnits = ElectricCurrentUnits.Ampere):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricCurrentUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricCurrentUnits = ElectricCurrentUnits.Ampere) -> ElectricCurrentArray:
+        """
+        Create a new instance of ElectricCurrentArray from values in the given unit.
+
+        :param values: The ElectricCurrent values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricCurrentUnits
+        :return: A new instance of ElectricCurrentArray.
+        :rtype: ElectricCurrentArray
+        """
+        return ElectricCurrentArray(values, unit)
+
+    
+    @property
+    def amperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentUnits.Ampere](self._values)
+
+    
+    @property
+    def femtoamperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentUnits.Femtoampere](self._values)
+
+    
+    @property
+    def picoamperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentUnits.Picoampere](self._values)
+
+    
+    @property
+    def nanoamperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentUnits.Nanoampere](self._values)
+
+    
+    @property
+    def microamperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentUnits.Microampere](self._values)
+
+    
+    @property
+    def milliamperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentUnits.Milliampere](self._values)
+
+    
+    @property
+    def centiamperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentUnits.Centiampere](self._values)
+
+    
+    @property
+    def kiloamperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentUnits.Kiloampere](self._values)
+
+    
+    @property
+    def megaamperes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentUnits.Megaampere](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_current_density import ElectricCurrentDensity, ElectricCurrentDensityUnits
+
+
+class ElectricCurrentDensityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricCurrentDensity values, held in AmperePerSquareMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricCurrentDensityUnits): The ElectricCurrentDensity unit of the values, The default unit is AmperePerSquareMeter
+    """
+    __slots__ = ()
+
+    _quantity = ElectricCurrentDensity
+
+    # Whole-array variants of the ElectricCurrentDensity conversion functions.
+    _conversions_from_base = {
+        
+        ElectricCurrentDensityUnits.AmperePerSquareMeter: lambda value: (value),
+        
+        ElectricCurrentDensityUnits.AmperePerSquareInch: lambda value: (value / 1.5500031000062000e3),
+        
+        ElectricCurrentDensityUnits.AmperePerSquareFoot: lambda value: (value / 1.0763910416709722e1),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricCurrentDensityUnits.AmperePerSquareMeter: lambda value: (value),
+        
+        ElectricCurrentDensityUnits.AmperePerSquareInch: lambda value: (value * 1.5500031000062000e3),
+        
+        ElectricCurrentDensityUnits.AmperePerSquareFoot: lambda value: (value * 1.0763910416709722e1),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricCurrentDensityUnits = ElectricCurrentDensityUnits.AmperePerSquareMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricCurrentDensityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricCurrentDensityUnits = ElectricCurrentDensityUnits.AmperePerSquareMeter) -> ElectricCurrentDensityArray:
+        """
+        Create a new instance of ElectricCurrentDensityArray from values in the given unit.
+
+        :param values: The ElectricCurrentDensity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricCurrentDensityUnits
+        :return: A new instance of ElectricCurrentDensityArray.
+        :rtype: ElectricCurrentDensityArray
+        """
+        return ElectricCurrentDensityArray(values, unit)
+
+    
+    @property
+    def amperes_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentDensityUnits.AmperePerSquareMeter](self._values)
+
+    
+    @property
+    def amperes_per_square_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentDensityUnits.AmperePerSquareInch](self._values)
+
+    
+    @property
+    def amperes_per_square_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentDensityUnits.AmperePerSquareFoot](self._values)
+
+    
\ No newline at end of file
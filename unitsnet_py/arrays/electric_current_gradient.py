@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_current_gradient import ElectricCurrentGradient, ElectricCurrentGradientUnits
+
+
+class ElectricCurrentGradientArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricCurrentGradient values, held in AmperePerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricCurrentGradientUnits): The ElectricCurrentGradient unit of the values, The default unit is AmperePerSecond
+    """
+    __slots__ = ()
+
+    _quantity = ElectricCurrentGradient
+
+    # Whole-array variants of the ElectricCurrentGradient conversion functions.
+    _conversions_from_base = {
+        
+        ElectricCurrentGradientUnits.AmperePerSecond: lambda value: (value),
+        
+        ElectricCurrentGradientUnits.AmperePerMinute: lambda value: (value * 60),
+        
+        ElectricCurrentGradientUnits.AmperePerMillisecond: lambda value: (value / 1e3),
+        
+        ElectricCurrentGradientUnits.AmperePerMicrosecond: lambda value: (value / 1e6),
+        
+        ElectricCurrentGradientUnits.AmperePerNanosecond: lambda value: (value / 1e9),
+        
+        ElectricCurrentGradientUnits.MilliamperePerSecond: lambda value: ((value) / 0.001),
+        
+        ElectricCurrentGradientUnits.MilliamperePerMinute: lambda value: ((value * 60) / 0.001),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricCurrentGradientUnits.AmperePerSecond: lambda value: (value),
+        
+        ElectricCurrentGradientUnits.AmperePerMinute: lambda value: (value / 60),
+        
+        ElectricCurrentGradientUnits.AmperePerMillisecond: lambda value: (value * 1e3),
+        
+        ElectricCurrentGradientUnits.AmperePerMicrosecond: lambda value: (value * 1e6),
+        
+        ElectricCurrentGradientUnits.AmperePerNanosecond: lambda value: (value * 1e9),
+        
+        ElectricCurrentGradientUnits.MilliamperePerSecond: lambda value: ((value) * 0.001),
+        
+        ElectricCurrentGradientUnits.MilliamperePerMinute: lambda value: ((value / 60) * 0.001),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricCurrentGradientUnits = ElectricCurrentGradientUnits.AmperePerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricCurrentGradientUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricCurrentGradientUnits = ElectricCurrentGradientUnits.AmperePerSecond) -> ElectricCurrentGradientArray:
+        """
+        Create a new instance of ElectricCurrentGradientArray from values in the given unit.
+
+        :param values: The ElectricCurrentGradient values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricCurrentGradientUnits
+        :return: A new instance of ElectricCurrentGradientArray.
+        :rtype: ElectricCurrentGradientArray
+        """
+        return ElectricCurrentGradientArray(values, unit)
+
+    
+    @property
+    def amperes_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentGradientUnits.AmperePerSecond](self._values)
+
+    
+    @property
+    def amperes_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentGradientUnits.AmperePerMinute](self._values)
+
+    
+    @property
+    def amperes_per_millisecond(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentGradientUnits.AmperePerMillisecond](self._values)
+
+    
+    @property
+    def amperes_per_microsecond(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentGradientUnits.AmperePerMicrosecond](self._values)
+
+    
+    @property
+    def amperes_per_nanosecond(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentGradientUnits.AmperePerNanosecond](self._values)
+
+    
+    @property
+    def milliamperes_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentGradientUnits.MilliamperePerSecond](self._values)
+
+    
+    @property
+    def milliamperes_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricCurrentGradientUnits.MilliamperePerMinute](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_field import ElectricField, ElectricFieldUnits
+
+
+class ElectricFieldArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricField values, held in VoltPerMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricFieldUnits): The ElectricField unit of the values, The default unit is VoltPerMeter
+    """
+    __slots__ = ()
+
+    _quantity = ElectricField
+
+    # Whole-array variants of the ElectricField conversion functions.
+    _conversions_from_base = {
+        
+        ElectricFieldUnits.VoltPerMeter: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricFieldUnits.VoltPerMeter: lambda value: (value),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricFieldUnits = ElectricFieldUnits.VoltPerMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricFieldUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricFieldUnits = ElectricFieldUnits.VoltPerMeter) -> ElectricFieldArray:
+        """
+        Create a new instance of ElectricFieldArray from values in the given unit.
+
+        :param values: The ElectricField values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricFieldUnits
+        :return: A new instance of ElectricFieldArray.
+        :rtype: ElectricFieldArray
+        """
+        return ElectricFieldArray(values, unit)
+
+    
+    @property
+    def volts_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricFieldUnits.VoltPerMeter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_inductance import ElectricInductance, ElectricInductanceUnits
+
+
+class ElectricInductanceArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricInductance values, held in Henry.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricInductanceUnits): The ElectricInductance unit of the values, The default unit is Henry
+    """
+    __slots__ = ()
+
+    _quantity = ElectricInductance
+
+    # Whole-array variants of the ElectricInductance conversion functions.
+    _conversions_from_base = {
+        
+        ElectricInductanceUnits.Henry: lambda value: (value),
+        
+        ElectricInductanceUnits.Picohenry: lambda value: ((value) / 1e-12),
+        
+        ElectricInductanceUnits.Nanohenry: lambda value: ((value) / 1e-09),
+        
+        ElectricInductanceUnits.Microhenry: lambda value: ((value) / 1e-06),
+        
+        ElectricInductanceUnits.Millihenry: lambda value: ((value) / 0.001),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricInductanceUnits.Henry: lambda value: (value),
+        
+        ElectricInductanceUnits.Picohenry: lambda value: ((value) * 1e-12),
+        
+        ElectricInductanceUnits.Nanohenry: lambda value: ((value) * 1e-09),
+        
+        ElectricInductanceUnits.Microhenry: lambda value: ((value) * 1e-06),
+        
+        ElectricInductanceUnits.Millihenry: lambda value: ((value) * 0.001),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricInductanceUnits = ElectricInductanceUnits.Henry):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricInductanceUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricInductanceUnits = ElectricInductanceUnits.Henry) -> ElectricInductanceArray:
+        """
+        Create a new instance of ElectricInductanceArray from values in the given unit.
+
+        :param values: The ElectricInductance values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricInductanceUnits
+        :return: A new instance of ElectricInductanceArray.
+        :rtype: ElectricInductanceArray
+        """
+        return ElectricInductanceArray(values, unit)
+
+    
+    @property
+    def henries(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricInductanceUnits.Henry](self._values)
+
+    
+    @property
+    def picohenries(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricInductanceUnits.Picohenry](self._values)
+
+    
+    @property
+    def nanohenries(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricInductanceUnits.Nanohenry](self._values)
+
+    
+    @property
+    def microhenries(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricInductanceUnits.Microhenry](self._values)
+
+    
+    @property
+    def millihenries(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricInductanceUnits.Millihenry](self._values)
+
+    
\ No newline at end of file
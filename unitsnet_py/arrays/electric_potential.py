@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_potential import ElectricPotential, ElectricPotentialUnits
+
+
+class ElectricPotentialArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricPotential values, held in Volt.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricPotentialUnits): The ElectricPotential unit of the values, The default unit is Volt
+    """
+    __slots__ = ()
+
+    _quantity = ElectricPotential
+
+    # Whole-array variants of the ElectricPotential conversion functions.
+    _conversions_from_base = {
+        
+        ElectricPotentialUnits.Volt: lambda value: (value),
+        
+        ElectricPotentialUnits.Nanovolt: lambda value: ((value) / 1e-09),
+        
+        ElectricPotentialUnits.Microvolt: lambda value: ((value) / 1e-06),
+        
+        ElectricPotentialUnits.Millivolt: lambda value: ((value) / 0.001),
+        
+        ElectricPotentialUnits.Kilovolt: lambda value: ((value) / 1000.0),
+        
+        ElectricPotentialUnits.Megavolt: lambda value: ((value) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricPotentialUnits.Volt: lambda value: (value),
+        
+        ElectricPotentialUnits.Nanovolt: lambda value: ((value) * 1e-09),
+        
+        ElectricPotentialUnits.Microvolt: lambda value: ((value) * 1e-06),
+        
+        ElectricPotentialUnits.Millivolt: lambda value: ((value) * 0.001),
+        
+        ElectricPotentialUnits.Kilovolt: lambda value: ((value) * 1000.0),
+        
+        ElectricPotentialUnits.Megavolt: lambda value: ((value) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricPotentialUnits = ElectricPotentialUnits.Volt):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricPotentialUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricPotentialUnits = ElectricPotentialUnits.Volt) -> ElectricPotentialArray:
+        """
+        Create a new instance of ElectricPotentialArray from values in the given unit.
+
+        :param values: The ElectricPotential values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricPotentialUnits
+        :return: A new instance of ElectricPotentialArray.
+        :rtype: ElectricPotentialArray
+        """
+        return ElectricPotentialArray(values, unit)
+
+    
+    @property
+    def volts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialUnits.Volt](self._values)
+
+    
+    @property
+    def nanovolts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialUnits.Nanovolt](self._values)
+
+    
+    @property
+    def microvolts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialUnits.Microvolt](self._values)
+
+    
+    @property
+    def millivolts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialUnits.Millivolt](self._values)
+
+    
+    @property
+    def kilovolts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialUnits.Kilovolt](self._values)
+
+    
+    @property
+    def megavolts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialUnits.Megavolt](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_potential_ac import ElectricPotentialAc, ElectricPotentialAcUnits
+
+
+class ElectricPotentialAcArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricPotentialAc values, held in VoltAc.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricPotentialAcUnits): The ElectricPotentialAc unit of the values, The default unit is VoltAc
+    """
+    __slots__ = ()
+
+    _quantity = ElectricPotentialAc
+
+    # Whole-array variants of the ElectricPotentialAc conversion functions.
+    _conversions_from_base = {
+        
+        ElectricPotentialAcUnits.VoltAc: lambda value: (value),
+        
+        ElectricPotentialAcUnits.MicrovoltAc: lambda value: ((value) / 1e-06),
+        
+        ElectricPotentialAcUnits.MillivoltAc: lambda value: ((value) / 0.001),
+        
+        ElectricPotentialAcUnits.KilovoltAc: lambda value: ((value) / 1000.0),
+        
+        ElectricPotentialAcUnits.MegavoltAc: lambda value: ((value) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricPotentialAcUnits.VoltAc: lambda value: (value),
+        
+        ElectricPotentialAcUnits.MicrovoltAc: lambda value: ((value) * 1e-06),
+        
+        ElectricPotentialAcUnits.MillivoltAc: lambda value: ((value) * 0.001),
+        
+        ElectricPotentialAcUnits.KilovoltAc: lambda value: ((value) * 1000.0),
+        
+        ElectricPotentialAcUnits.MegavoltAc: lambda value: ((value) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricPotentialAcUnits = ElectricPotentialAcUnits.VoltAc):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricPotentialAcUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricPotentialAcUnits = ElectricPotentialAcUnits.VoltAc) -> ElectricPotentialAcArray:
+        """
+        Create a new instance of ElectricPotentialAcArray from values in the given unit.
+
+        :param values: The ElectricPotentialAc values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricPotentialAcUnits
+        :return: A new instance of ElectricPotentialAcArray.
+        :rtype: ElectricPotentialAcArray
+        """
+        return ElectricPotentialAcArray(values, unit)
+
+    
+    @property
+    def volts_ac(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialAcUnits.VoltAc](self._values)
+
+    
+    @property
+    def microvolts_ac(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialAcUnits.MicrovoltAc](self._values)
+
+    
+    @property
+    def millivolts_ac(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialAcUnits.MillivoltAc](self._values)
+
+    
+    @property
+    def kilovolts_ac(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialAcUnits.KilovoltAc](self._values)
+
+    
+    @property
+    def megavolts_ac(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialAcUnits.MegavoltAc](self._values)
+
+    
\ No newline at end of file
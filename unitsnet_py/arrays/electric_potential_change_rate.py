@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_potential_change_rate import ElectricPotentialChangeRate, ElectricPotentialChangeRateUnits
+
+
+class ElectricPotentialChangeRateArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricPotentialChangeRate values, held in VoltPerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricPotentialChangeRateUnits): The ElectricPotentialChangeRate unit of the values, The default unit is VoltPerSecond
+    """
+    __slots__ = ()
+
+    _quantity = ElectricPotentialChangeRate
+
+    # Whole-array variants of the ElectricPotentialChangeRate conversion functions.
+    _conversions_from_base = {
+        
+        ElectricPotentialChangeRateUnits.VoltPerSecond: lambda value: (value),
+        
+        ElectricPotentialChangeRateUnits.VoltPerMicrosecond: lambda value: (value / 1e6),
+        
+        ElectricPotentialChangeRateUnits.VoltPerMinute: lambda value: (value * 60),
+        
+        ElectricPotentialChangeRateUnits.VoltPerHour: lambda value: (value * 3600),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerSecond: lambda value: ((value) / 1e-06),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerSecond: lambda value: ((value) / 0.001),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerSecond: lambda value: ((value) / 1000.0),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerSecond: lambda value: ((value) / 1000000.0),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerMicrosecond: lambda value: ((value / 1e6) / 1e-06),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerMicrosecond: lambda value: ((value / 1e6) / 0.001),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerMicrosecond: lambda value: ((value / 1e6) / 1000.0),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerMicrosecond: lambda value: ((value / 1e6) / 1000000.0),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerMinute: lambda value: ((value * 60) / 1e-06),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerMinute: lambda value: ((value * 60) / 0.001),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerMinute: lambda value: ((value * 60) / 1000.0),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerMinute: lambda value: ((value * 60) / 1000000.0),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerHour: lambda value: ((value * 3600) / 1e-06),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerHour: lambda value: ((value * 3600) / 0.001),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerHour: lambda value: ((value * 3600) / 1000.0),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerHour: lambda value: ((value * 3600) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricPotentialChangeRateUnits.VoltPerSecond: lambda value: (value),
+        
+        ElectricPotentialChangeRateUnits.VoltPerMicrosecond: lambda value: (value * 1e6),
+        
+        ElectricPotentialChangeRateUnits.VoltPerMinute: lambda value: (value / 60),
+        
+        ElectricPotentialChangeRateUnits.VoltPerHour: lambda value: (value / 3600),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerSecond: lambda value: ((value) * 1e-06),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerSecond: lambda value: ((value) * 0.001),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerSecond: lambda value: ((value) * 1000.0),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerSecond: lambda value: ((value) * 1000000.0),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerMicrosecond: lambda value: ((value * 1e6) * 1e-06),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerMicrosecond: lambda value: ((value * 1e6) * 0.001),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerMicrosecond: lambda value: ((value * 1e6) * 1000.0),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerMicrosecond: lambda value: ((value * 1e6) * 1000000.0),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerMinute: lambda value: ((value / 60) * 1e-06),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerMinute: lambda value: ((value / 60) * 0.001),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerMinute: lambda value: ((value / 60) * 1000.0),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerMinute: lambda value: ((value / 60) * 1000000.0),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerHour: lambda value: ((value / 3600) * 1e-06),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerHour: lambda value: ((value / 3600) * 0.001),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerHour: lambda value: ((value / 3600) * 1000.0),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerHour: lambda value: ((value / 3600) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricPotentialChangeRateUnits = ElectricPotentialChangeRateUnits.VoltPerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricPotentialChangeRateUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricPotentialChangeRateUnits = ElectricPotentialChangeRateUnits.VoltPerSecond) -> ElectricPotentialChangeRateArray:
+        """
+        Create a new instance of ElectricPotentialChangeRateArray from values in the given unit.
+
+        :param values: The ElectricPotentialChangeRate values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricPotentialChangeRateUnits
+        :return: A new instance of ElectricPotentialChangeRateArray.
+        :rtype: ElectricPotentialChangeRateArray
+        """
+        return ElectricPotentialChangeRateArray(values, unit)
+
+    
+    @property
+    def volts_per_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.VoltPerSecond](self._values)
+
+    
+    @property
+    def volts_per_microseconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.VoltPerMicrosecond](self._values)
+
+    
+    @property
+    def volts_per_minutes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.VoltPerMinute](self._values)
+
+    
+    @property
+    def volts_per_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.VoltPerHour](self._values)
+
+    
+    @property
+    def microvolts_per_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.MicrovoltPerSecond](self._values)
+
+    
+    @property
+    def millivolts_per_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.MillivoltPerSecond](self._values)
+
+    
+    @property
+    def kilovolts_per_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.KilovoltPerSecond](self._values)
+
+    
+    @property
+    def megavolts_per_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.MegavoltPerSecond](self._values)
+
+    
+    @property
+    def microvolts_per_microseconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.MicrovoltPerMicrosecond](self._values)
+
+    
+    @property
+    def millivolts_per_microseconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.MillivoltPerMicrosecond](self._values)
+
+    
+    @property
+    def kilovolts_per_microseconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.KilovoltPerMicrosecond](self._values)
+
+    
+    @property
+    def megavolts_per_microseconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.MegavoltPerMicrosecond](self._values)
+
+    
+    @property
+    def microvolts_per_minutes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.MicrovoltPerMinute](self._values)
+
+    
+    @property
+    def millivolts_per_minutes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.MillivoltPerMinute](self._values)
+
+    
+    @property
+    def kilovolts_per_minutes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.KilovoltPerMinute](self._values)
+
+    
+    @property
+    def megavolts_per_minutes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.MegavoltPerMinute](self._values)
+
+    
+    @property
+    def microvolts_per_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.MicrovoltPerHour](self._values)
+
+    
+    @property
+    def millivolts_per_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.MillivoltPerHour](self._values)
+
+    
+    @property
+    def kilovolts_per_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.KilovoltPerHour](self._values)
+
+    
+    @property
+    def megavolts_per_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialChangeRateUnits.MegavoltPerHour](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_potential_dc import ElectricPotentialDc, ElectricPotentialDcUnits
+
+
+class ElectricPotentialDcArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricPotentialDc values, held in VoltDc.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricPotentialDcUnits): The ElectricPotentialDc unit of the values, The default unit is VoltDc
+    """
+    __slots__ = ()
+
+    _quantity = ElectricPotentialDc
+
+    # Whole-array variants of the ElectricPotentialDc conversion functions.
+    _conversions_from_base = {
+        
+        ElectricPotentialDcUnits.VoltDc: lambda value: (value),
+        
+        ElectricPotentialDcUnits.MicrovoltDc: lambda value: ((value) / 1e-06),
+        
+        ElectricPotentialDcUnits.MillivoltDc: lambda value: ((value) / 0.001),
+        
+        ElectricPotentialDcUnits.KilovoltDc: lambda value: ((value) / 1000.0),
+        
+        ElectricPotentialDcUnits.MegavoltDc: lambda value: ((value) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricPotentialDcUnits.VoltDc: lambda value: (value),
+        
+        ElectricPotentialDcUnits.MicrovoltDc: lambda value: ((value) * 1e-06),
+        
+        ElectricPotentialDcUnits.MillivoltDc: lambda value: ((value) * 0.001),
+        
+        ElectricPotentialDcUnits.KilovoltDc: lambda value: ((value) * 1000.0),
+        
+        ElectricPotentialDcUnits.MegavoltDc: lambda value: ((value) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricPotentialDcUnits = ElectricPotentialDcUnits.VoltDc):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricPotentialDcUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricPotentialDcUnits = ElectricPotentialDcUnits.VoltDc) -> ElectricPotentialDcArray:
+        """
+        Create a new instance of ElectricPotentialDcArray from values in the given unit.
+
+        :param values: The ElectricPotentialDc values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricPotentialDcUnits
+        :return: A new instance of ElectricPotentialDcArray.
+        :rtype: ElectricPotentialDcArray
+        """
+        return ElectricPotentialDcArray(values, unit)
+
+    
+    @property
+    def volts_dc(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialDcUnits.VoltDc](self._values)
+
+    
+    @property
+    def microvolts_dc(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialDcUnits.MicrovoltDc](self._values)
+
+    
+    @property
+    def millivolts_dc(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialDcUnits.MillivoltDc](self._values)
+
+    
+    @property
+    def kilovolts_dc(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialDcUnits.KilovoltDc](self._values)
+
+    
+    @property
+    def megavolts_dc(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricPotentialDcUnits.MegavoltDc](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_resistance import ElectricResistance, ElectricResistanceUnits
+
+
+class ElectricResistanceArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricResistance values, held in Ohm.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricResistanceUnits): The ElectricResistance unit of the values, The default unit is Ohm
+    """
+    __slots__ = ()
+
+    _quantity = ElectricResistance
+
+    # Whole-array variants of the ElectricResistance conversion functions.
+    _conversions_from_base = {
+        
+        ElectricResistanceUnits.Ohm: lambda value: (value),
+        
+        ElectricResistanceUnits.Microohm: lambda value: ((value) / 1e-06),
+        
+        ElectricResistanceUnits.Milliohm: lambda value: ((value) / 0.001),
+        
+        ElectricResistanceUnits.Kiloohm: lambda value: ((value) / 1000.0),
+        
+        ElectricResistanceUnits.Megaohm: lambda value: ((value) / 1000000.0),
+        
+        ElectricResistanceUnits.Gigaohm: lambda value: ((value) / 1000000000.0),
+        
+        ElectricResistanceUnits.Teraohm: lambda value: ((value) / 1000000000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricResistanceUnits.Ohm: lambda value: (value),
+        
+        ElectricResistanceUnits.Microohm: lambda value: ((value) * 1e-06),
+        
+        ElectricResistanceUnits.Milliohm: lambda value: ((value) * 0.001),
+        
+        ElectricResistanceUnits.Kiloohm: lambda value: ((value) * 1000.0),
+        
+        ElectricResistanceUnits.Megaohm: lambda value: ((value) * 1000000.0),
+        
+        ElectricResistanceUnits.Gigaohm: lambda value: ((value) * 1000000000.0),
+        
+        ElectricResistanceUnits.Teraohm: lambda value: ((value) * 1000000000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricResistanceUnits = ElectricResistanceUnits.Ohm):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricResistanceUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricResistanceUnits = ElectricResistanceUnits.Ohm) -> ElectricResistanceArray:
+        """
+        Create a new instance of ElectricResistanceArray from values in the given unit.
+
+        :param values: The ElectricResistance values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricResistanceUnits
+        :return: A new instance of ElectricResistanceArray.
+        :rtype: ElectricResistanceArray
+        """
+        return ElectricResistanceArray(values, unit)
+
+    
+    @property
+    def ohms(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistanceUnits.Ohm](self._values)
+
+    
+    @property
+    def microohms(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistanceUnits.Microohm](self._values)
+
+    
+    @property
+    def milliohms(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistanceUnits.Milliohm](self._values)
+
+    
+    @property
+    def kiloohms(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistanceUnits.Kiloohm](self._values)
+
+    
+    @property
+    def megaohms(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistanceUnits.Megaohm](self._values)
+
+    
+    @property
+    def gigaohms(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistanceUnits.Gigaohm](self._values)
+
+    
+    @property
+    def teraohms(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistanceUnits.Teraohm](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_resistivity import ElectricResistivity, ElectricResistivityUnits
+
+
+class ElectricResistivityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricResistivity values, held in OhmMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricResistivityUnits): The ElectricResistivity unit of the values, The default unit is OhmMeter
+    """
+    __slots__ = ()
+
+    _quantity = ElectricResistivity
+
+    # Whole-array variants of the ElectricResistivity conversion functions.
+    _conversions_from_base = {
+        
+        ElectricResistivityUnits.OhmMeter: lambda value: (value),
+        
+        ElectricResistivityUnits.OhmCentimeter: lambda value: (value * 100),
+        
+        ElectricResistivityUnits.PicoohmMeter: lambda value: ((value) / 1e-12),
+        
+        ElectricResistivityUnits.NanoohmMeter: lambda value: ((value) / 1e-09),
+        
+        ElectricResistivityUnits.MicroohmMeter: lambda value: ((value) / 1e-06),
+        
+        ElectricResistivityUnits.MilliohmMeter: lambda value: ((value) / 0.001),
+        
+        ElectricResistivityUnits.KiloohmMeter: lambda value: ((value) / 1000.0),
+        
+        ElectricResistivityUnits.MegaohmMeter: lambda value: ((value) / 1000000.0),
+        
+        ElectricResistivityUnits.PicoohmCentimeter: lambda value: ((value * 100) / 1e-12),
+        
+        ElectricResistivityUnits.NanoohmCentimeter: lambda value: ((value * 100) / 1e-09),
+        
+        ElectricResistivityUnits.MicroohmCentimeter: lambda value: ((value * 100) / 1e-06),
+        
+        ElectricResistivityUnits.MilliohmCentimeter: lambda value: ((value * 100) / 0.001),
+        
+        ElectricResistivityUnits.KiloohmCentimeter: lambda value: ((value * 100) / 1000.0),
+        
+        ElectricResistivityUnits.MegaohmCentimeter: lambda value: ((value * 100) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricResistivityUnits.OhmMeter: lambda value: (value),
+        
+        ElectricResistivityUnits.OhmCentimeter: lambda value: (value / 100),
+        
+        ElectricResistivityUnits.PicoohmMeter: lambda value: ((value) * 1e-12),
+        
+        ElectricResistivityUnits.NanoohmMeter: lambda value: ((value) * 1e-09),
+        
+        ElectricResistivityUnits.MicroohmMeter: lambda value: ((value) * 1e-06),
+        
+        ElectricResistivityUnits.MilliohmMeter: lambda value: ((value) * 0.001),
+        
+        ElectricResistivityUnits.KiloohmMeter: lambda value: ((value) * 1000.0),
+        
+        ElectricResistivityUnits.MegaohmMeter: lambda value: ((value) * 1000000.0),
+        
+        ElectricResistivityUnits.PicoohmCentimeter: lambda value: ((value / 100) * 1e-12),
+        
+        ElectricResistivityUnits.NanoohmCentimeter: lambda value: ((value / 100) * 1e-09),
+        
+        ElectricResistivityUnits.MicroohmCentimeter: lambda value: ((value / 100) * 1e-06),
+        
+        ElectricResistivityUnits.MilliohmCentimeter: lambda value: ((value / 100) * 0.001),
+        
+        ElectricResistivityUnits.KiloohmCentimeter: lambda value: ((value / 100) * 1000.0),
+        
+        ElectricResistivityUnits.MegaohmCentimeter: lambda value: ((value / 100) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricResistivityUnits = ElectricResistivityUnits.OhmMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricResistivityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricResistivityUnits = ElectricResistivityUnits.OhmMeter) -> ElectricResistivityArray:
+        """
+        Create a new instance of ElectricResistivityArray from values in the given unit.
+
+        :param values: The ElectricResistivity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricResistivityUnits
+        :return: A new instance of ElectricResistivityArray.
+        :rtype: ElectricResistivityArray
+        """
+        return ElectricResistivityArray(values, unit)
+
+    
+    @property
+    def ohm_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistivityUnits.OhmMeter](self._values)
+
+    
+    @property
+    def ohms_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistivityUnits.OhmCentimeter](self._values)
+
+    
+    @property
+    def picoohm_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistivityUnits.PicoohmMeter](self._values)
+
+    
+    @property
+    def nanoohm_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistivityUnits.NanoohmMeter](self._values)
+
+    
+    @property
+    def microohm_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistivityUnits.MicroohmMeter](self._values)
+
+    
+    @property
+    def milliohm_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistivityUnits.MilliohmMeter](self._values)
+
+    
+    @property
+    def kiloohm_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistivityUnits.KiloohmMeter](self._values)
+
+    
+    @property
+    def megaohm_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistivityUnits.MegaohmMeter](self._values)
+
+    
+    @property
+    def picoohms_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistivityUnits.PicoohmCentimeter](self._values)
+
+    
+    @property
+    def nanoohms_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistivityUnits.NanoohmCentimeter](self._values)
+
+    
+    @property
+    def microohms_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistivityUnits.MicroohmCentimeter](self._values)
+
+    
+    @property
+    def milliohms_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistivityUnits.MilliohmCentimeter](self._values)
+
+    
+    @property
+    def kiloohms_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistivityUnits.KiloohmCentimeter](self._values)
+
+    
+    @property
+    def megaohms_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricResistivityUnits.MegaohmCentimeter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.electric_surface_charge_density import ElectricSurfaceChargeDensity, ElectricSurfaceChargeDensityUnits
+
+
+class ElectricSurfaceChargeDensityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ElectricSurfaceChargeDensity values, held in CoulombPerSquareMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ElectricSurfaceChargeDensityUnits): The ElectricSurfaceChargeDensity unit of the values, The default unit is CoulombPerSquareMeter
+    """
+    __slots__ = ()
+
+    _quantity = ElectricSurfaceChargeDensity
+
+    # Whole-array variants of the ElectricSurfaceChargeDensity conversion functions.
+    _conversions_from_base = {
+        
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter: lambda value: (value),
+        
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareCentimeter: lambda value: (value / 1.0e4),
+        
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareInch: lambda value: (value / 1.5500031000062000e3),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter: lambda value: (value),
+        
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareCentimeter: lambda value: (value * 1.0e4),
+        
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareInch: lambda value: (value * 1.5500031000062000e3),
+        
+    }
+
+    def __init__(self, values, from_unit: ElectricSurfaceChargeDensityUnits = ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ElectricSurfaceChargeDensityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ElectricSurfaceChargeDensityUnits = ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter) -> ElectricSurfaceChargeDensityArray:
+        """
+        Create a new instance of ElectricSurfaceChargeDensityArray from values in the given unit.
+
+        :param values: The ElectricSurfaceChargeDensity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ElectricSurfaceChargeDensityUnits
+        :return: A new instance of ElectricSurfaceChargeDensityArray.
+        :rtype: ElectricSurfaceChargeDensityArray
+        """
+        return ElectricSurfaceChargeDensityArray(values, unit)
+
+    
+    @property
+    def coulombs_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter](self._values)
+
+    
+    @property
+    def coulombs_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricSurfaceChargeDensityUnits.CoulombPerSquareCentimeter](self._values)
+
+    
+    @property
+    def coulombs_per_square_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ElectricSurfaceChargeDensityUnits.CoulombPerSquareInch](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,506 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.energy import Energy, EnergyUnits
+
+
+class EnergyArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Energy values, held in Joule.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (EnergyUnits): The Energy unit of the values, The default unit is Joule
+    """
+    __slots__ = ()
+
+    _quantity = Energy
+
+    # Whole-array variants of the Energy conversion functions.
+    _conversions_from_base = {
+        
+        EnergyUnits.Joule: lambda value: (value),
+        
+        EnergyUnits.Calorie: lambda value: (value / 4.184),
+        
+        EnergyUnits.BritishThermalUnit: lambda value: (value / 1055.05585262),
+        
+        EnergyUnits.ElectronVolt: lambda value: (value / 1.602176565e-19),
+        
+        EnergyUnits.FootPound: lambda value: (value / 1.355817948),
+        
+        EnergyUnits.Erg: lambda value: (value / 1e-7),
+        
+        EnergyUnits.WattHour: lambda value: (value / 3600),
+        
+        EnergyUnits.WattDay: lambda value: (value / (24 * 3600)),
+        
+        EnergyUnits.ThermEc: lambda value: (value / 1.05505585262e8),
+        
+        EnergyUnits.ThermUs: lambda value: (value / 1.054804e8),
+        
+        EnergyUnits.ThermImperial: lambda value: (value / 1.05505585257348e8),
+        
+        EnergyUnits.HorsepowerHour: lambda value: (value / 2.6845195377e6),
+        
+        EnergyUnits.Millijoule: lambda value: ((value) / 0.001),
+        
+        EnergyUnits.Kilojoule: lambda value: ((value) / 1000.0),
+        
+        EnergyUnits.Megajoule: lambda value: ((value) / 1000000.0),
+        
+        EnergyUnits.Gigajoule: lambda value: ((value) / 1000000000.0),
+        
+        EnergyUnits.Terajoule: lambda value: ((value) / 1000000000000.0),
+        
+        EnergyUnits.Petajoule: lambda value: ((value) / 1000000000000000.0),
+        
+        EnergyUnits.Kilocalorie: lambda value: ((value / 4.184) / 1000.0),
+        
+        EnergyUnits.Megacalorie: lambda value: ((value / 4.184) / 1000000.0),
+        
+        EnergyUnits.KilobritishThermalUnit: lambda value: ((value / 1055.05585262) / 1000.0),
+        
+        EnergyUnits.MegabritishThermalUnit: lambda value: ((value / 1055.05585262) / 1000000.0),
+        
+        EnergyUnits.GigabritishThermalUnit: lambda value: ((value / 1055.05585262) / 1000000000.0),
+        
+        EnergyUnits.KiloelectronVolt: lambda value: ((value / 1.602176565e-19) / 1000.0),
+        
+        EnergyUnits.MegaelectronVolt: lambda value: ((value / 1.602176565e-19) / 1000000.0),
+        
+        EnergyUnits.GigaelectronVolt: lambda value: ((value / 1.602176565e-19) / 1000000000.0),
+        
+        EnergyUnits.TeraelectronVolt: lambda value: ((value / 1.602176565e-19) / 1000000000000.0),
+        
+        EnergyUnits.KilowattHour: lambda value: ((value / 3600) / 1000.0),
+        
+        EnergyUnits.MegawattHour: lambda value: ((value / 3600) / 1000000.0),
+        
+        EnergyUnits.GigawattHour: lambda value: ((value / 3600) / 1000000000.0),
+        
+        EnergyUnits.TerawattHour: lambda value: ((value / 3600) / 1000000000000.0),
+        
+        EnergyUnits.KilowattDay: lambda value: ((value / (24 * 3600)) / 1000.0),
+        
+        EnergyUnits.MegawattDay: lambda value: ((value / (24 * 3600)) / 1000000.0),
+        
+        EnergyUnits.GigawattDay: lambda value: ((value / (24 * 3600)) / 1000000000.0),
+        
+        EnergyUnits.TerawattDay: lambda value: ((value / (24 * 3600)) / 1000000000000.0),
+        
+        EnergyUnits.DecathermEc: lambda value: ((value / 1.05505585262e8) / 10.0),
+        
+        EnergyUnits.DecathermUs: lambda value: ((value / 1.054804e8) / 10.0),
+        
+        EnergyUnits.DecathermImperial: lambda value: ((value / 1.05505585257348e8) / 10.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        EnergyUnits.Joule: lambda value: (value),
+        
+        EnergyUnits.Calorie: lambda value: (value * 4.184),
+        
+        EnergyUnits.BritishThermalUnit: lambda value: (value * 1055.05585262),
+        
+        EnergyUnits.ElectronVolt: lambda value: (value * 1.602176565e-19),
+        
+        EnergyUnits.FootPound: lambda value: (value * 1.355817948),
+        
+        EnergyUnits.Erg: lambda value: (value * 1e-7),
+        
+        EnergyUnits.WattHour: lambda value: (value * 3600),
+        
+        EnergyUnits.WattDay: lambda value: (value * 24 * 3600),
+        
+        EnergyUnits.ThermEc: lambda value: (value * 1.05505585262e8),
+        
+        EnergyUnits.ThermUs: lambda value: (value * 1.054804e8),
+        
+        EnergyUnits.ThermImperial: lambda value: (value * 1.05505585257348e8),
+        
+        EnergyUnits.HorsepowerHour: lambda value: (value * 2.6845195377e6),
+        
+        EnergyUnits.Millijoule: lambda value: ((value) * 0.001),
+        
+        EnergyUnits.Kilojoule: lambda value: ((value) * 1000.0),
+        
+        EnergyUnits.Megajoule: lambda value: ((value) * 1000000.0),
+        
+        EnergyUnits.Gigajoule: lambda value: ((value) * 1000000000.0),
+        
+        EnergyUnits.Terajoule: lambda value: ((value) * 1000000000000.0),
+        
+        EnergyUnits.Petajoule: lambda value: ((value) * 1000000000000000.0),
+        
+        EnergyUnits.Kilocalorie: lambda value: ((value * 4.184) * 1000.0),
+        
+        EnergyUnits.Megacalorie: lambda value: ((value * 4.184) * 1000000.0),
+        
+        EnergyUnits.KilobritishThermalUnit: lambda value: ((value * 1055.05585262) * 1000.0),
+        
+        EnergyUnits.MegabritishThermalUnit: lambda value: ((value * 1055.05585262) * 1000000.0),
+        
+        EnergyUnits.GigabritishThermalUnit: lambda value: ((value * 1055.05585262) * 1000000000.0),
+        
+        EnergyUnits.KiloelectronVolt: lambda value: ((value * 1.602176565e-19) * 1000.0),
+        
+        EnergyUnits.MegaelectronVolt: lambda value: ((value * 1.602176565e-19) * 1000000.0),
+        
+        EnergyUnits.GigaelectronVolt: lambda value: ((value * 1.602176565e-19) * 1000000000.0),
+        
+        EnergyUnits.TeraelectronVolt: lambda value: ((value * 1.602176565e-19) * 1000000000000.0),
+        
+        EnergyUnits.KilowattHour: lambda value: ((value * 3600) * 1000.0),
+        
+        EnergyUnits.MegawattHour: lambda value: ((value * 3600) * 1000000.0),
+        
+        EnergyUnits.GigawattHour: lambda value: ((value * 3600) * 1000000000.0),
+        
+        EnergyUnits.TerawattHour: lambda value: ((value * 3600) * 1000000000000.0),
+        
+        EnergyUnits.KilowattDay: lambda value: ((value * 24 * 3600) * 1000.0),
+        
+        EnergyUnits.MegawattDay: lambda value: ((value * 24 * 3600) * 1000000.0),
+        
+        EnergyUnits.GigawattDay: lambda value: ((value * 24 * 3600) * 1000000000.0),
+        
+        EnergyUnits.TerawattDay: lambda value: ((value * 24 * 3600) * 1000000000000.0),
+        
+        EnergyUnits.DecathermEc: lambda value: ((value * 1.05505585262e8) * 10.0),
+        
+        EnergyUnits.DecathermUs: lambda value: ((value * 1.054804e8) * 10.0),
+        
+        EnergyUnits.DecathermImperial: lambda value: ((value * 1.05505585257348e8) * 10.0),
+        
+    }
+
+    def __init__(self, values, from_unit: EnergyUnits = EnergyUnits.Joule):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: EnergyUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: EnergyUnits = EnergyUnits.Joule) -> EnergyArray:
+        """
+        Create a new instance of EnergyArray from values in the given unit.
+
+        :param values: The Energy values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: EnergyUnits
+        :return: A new instance of EnergyArray.
+        :rtype: EnergyArray
+        """
+        return EnergyArray(values, unit)
+
+    
+    @property
+    def joules(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.Joule](self._values)
+
+    
+    @property
+    def calories(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.Calorie](self._values)
+
+    
+    @property
+    def british_thermal_units(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.BritishThermalUnit](self._values)
+
+    
+    @property
+    def electron_volts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.ElectronVolt](self._values)
+
+    
+    @property
+    def foot_pounds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.FootPound](self._values)
+
+    
+    @property
+    def ergs(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.Erg](self._values)
+
+    
+    @property
+    def watt_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.WattHour](self._values)
+
+    
+    @property
+    def watt_days(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.WattDay](self._values)
+
+    
+    @property
+    def therms_ec(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.ThermEc](self._values)
+
+    
+    @property
+    def therms_us(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.ThermUs](self._values)
+
+    
+    @property
+    def therms_imperial(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.ThermImperial](self._values)
+
+    
+    @property
+    def horsepower_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.HorsepowerHour](self._values)
+
+    
+    @property
+    def millijoules(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.Millijoule](self._values)
+
+    
+    @property
+    def kilojoules(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.Kilojoule](self._values)
+
+    
+    @property
+    def megajoules(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.Megajoule](self._values)
+
+    
+    @property
+    def gigajoules(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.Gigajoule](self._values)
+
+    
+    @property
+    def terajoules(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.Terajoule](self._values)
+
+    
+    @property
+    def petajoules(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.Petajoule](self._values)
+
+    
+    @property
+    def kilocalories(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.Kilocalorie](self._values)
+
+    
+    @property
+    def megacalories(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.Megacalorie](self._values)
+
+    
+    @property
+    def kilobritish_thermal_units(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.KilobritishThermalUnit](self._values)
+
+    
+    @property
+    def megabritish_thermal_units(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.MegabritishThermalUnit](self._values)
+
+    
+    @property
+    def gigabritish_thermal_units(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.GigabritishThermalUnit](self._values)
+
+    
+    @property
+    def kiloelectron_volts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.KiloelectronVolt](self._values)
+
+    
+    @property
+    def megaelectron_volts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.MegaelectronVolt](self._values)
+
+    
+    @property
+    def gigaelectron_volts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.GigaelectronVolt](self._values)
+
+    
+    @property
+    def teraelectron_volts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.TeraelectronVolt](self._values)
+
+    
+    @property
+    def kilowatt_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.KilowattHour](self._values)
+
+    
+    @property
+    def megawatt_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.MegawattHour](self._values)
+
+    
+    @property
+    def gigawatt_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.GigawattHour](self._values)
+
+    
+    @property
+    def terawatt_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.TerawattHour](self._values)
+
+    
+    @property
+    def kilowatt_days(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.KilowattDay](self._values)
+
+    
+    @property
+    def megawatt_days(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.MegawattDay](self._values)
+
+    
+    @property
+    def gigawatt_days(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.GigawattDay](self._values)
+
+    
+    @property
+    def terawatt_days(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.TerawattDay](self._values)
+
+    
+    @property
+    def decatherms_ec(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.DecathermEc](self._values)
+
+    
+    @property
+    def decatherms_us(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.DecathermUs](self._values)
+
+    
+    @property
+    def decatherms_imperial(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyUnits.DecathermImperial](self._values)
+
+    
\ No newline at end of file
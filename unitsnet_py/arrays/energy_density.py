@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.energy_density import EnergyDensity, EnergyDensityUnits
+
+
+class EnergyDensityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of EnergyDensity values, held in JoulePerCubicMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (EnergyDensityUnits): The EnergyDensity unit of the values, The default unit is JoulePerCubicMeter
+    """
+    __slots__ = ()
+
+    _quantity = EnergyDensity
+
+    # Whole-array variants of the EnergyDensity conversion functions.
+    _conversions_from_base = {
+        
+        EnergyDensityUnits.JoulePerCubicMeter: lambda value: (value),
+        
+        EnergyDensityUnits.WattHourPerCubicMeter: lambda value: (value / 3.6e+3),
+        
+        EnergyDensityUnits.KilojoulePerCubicMeter: lambda value: ((value) / 1000.0),
+        
+        EnergyDensityUnits.MegajoulePerCubicMeter: lambda value: ((value) / 1000000.0),
+        
+        EnergyDensityUnits.GigajoulePerCubicMeter: lambda value: ((value) / 1000000000.0),
+        
+        EnergyDensityUnits.TerajoulePerCubicMeter: lambda value: ((value) / 1000000000000.0),
+        
+        EnergyDensityUnits.PetajoulePerCubicMeter: lambda value: ((value) / 1000000000000000.0),
+        
+        EnergyDensityUnits.KilowattHourPerCubicMeter: lambda value: ((value / 3.6e+3) / 1000.0),
+        
+        EnergyDensityUnits.MegawattHourPerCubicMeter: lambda value: ((value / 3.6e+3) / 1000000.0),
+        
+        EnergyDensityUnits.GigawattHourPerCubicMeter: lambda value: ((value / 3.6e+3) / 1000000000.0),
+        
+        EnergyDensityUnits.TerawattHourPerCubicMeter: lambda value: ((value / 3.6e+3) / 1000000000000.0),
+        
+        EnergyDensityUnits.PetawattHourPerCubicMeter: lambda value: ((value / 3.6e+3) / 1000000000000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        EnergyDensityUnits.JoulePerCubicMeter: lambda value: (value),
+        
+        EnergyDensityUnits.WattHourPerCubicMeter: lambda value: (value * 3.6e+3),
+        
+        EnergyDensityUnits.KilojoulePerCubicMeter: lambda value: ((value) * 1000.0),
+        
+        EnergyDensityUnits.MegajoulePerCubicMeter: lambda value: ((value) * 1000000.0),
+        
+        EnergyDensityUnits.GigajoulePerCubicMeter: lambda value: ((value) * 1000000000.0),
+        
+        EnergyDensityUnits.TerajoulePerCubicMeter: lambda value: ((value) * 1000000000000.0),
+        
+        EnergyDensityUnits.PetajoulePerCubicMeter: lambda value: ((value) * 1000000000000000.0),
+        
+        EnergyDensityUnits.KilowattHourPerCubicMeter: lambda value: ((value * 3.6e+3) * 1000.0),
+        
+        EnergyDensityUnits.MegawattHourPerCubicMeter: lambda value: ((value * 3.6e+3) * 1000000.0),
+        
+        EnergyDensityUnits.GigawattHourPerCubicMeter: lambda value: ((value * 3.6e+3) * 1000000000.0),
+        
+        EnergyDensityUnits.TerawattHourPerCubicMeter: lambda value: ((value * 3.6e+3) * 1000000000000.0),
+        
+        EnergyDensityUnits.PetawattHourPerCubicMeter: lambda value: ((value * 3.6e+3) * 1000000000000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: EnergyDensityUnits = EnergyDensityUnits.JoulePerCubicMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: EnergyDensityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: EnergyDensityUnits = EnergyDensityUnits.JoulePerCubicMeter) -> EnergyDensityArray:
+        """
+        Create a new instance of EnergyDensityArray from values in the given unit.
+
+        :param values: The EnergyDensity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: EnergyDensityUnits
+        :return: A new instance of EnergyDensityArray.
+        :rtype: EnergyDensityArray
+        """
+        return EnergyDensityArray(values, unit)
+
+    
+    @property
+    def joules_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyDensityUnits.JoulePerCubicMeter](self._values)
+
+    
+    @property
+    def watt_hours_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyDensityUnits.WattHourPerCubicMeter](self._values)
+
+    
+    @property
+    def kilojoules_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyDensityUnits.KilojoulePerCubicMeter](self._values)
+
+    
+    @property
+    def megajoules_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyDensityUnits.MegajoulePerCubicMeter](self._values)
+
+    
+    @property
+    def gigajoules_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyDensityUnits.GigajoulePerCubicMeter](self._values)
+
+    
+    @property
+    def terajoules_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyDensityUnits.TerajoulePerCubicMeter](self._values)
+
+    
+    @property
+    def petajoules_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyDensityUnits.PetajoulePerCubicMeter](self._values)
+
+    
+    @property
+    def kilowatt_hours_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyDensityUnits.KilowattHourPerCubicMeter](self._values)
+
+    
+    @property
+    def megawatt_hours_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyDensityUnits.MegawattHourPerCubicMeter](self._values)
+
+    
+    @property
+    def gigawatt_hours_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyDensityUnits.GigawattHourPerCubicMeter](self._values)
+
+    
+    @property
+    def terawatt_hours_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyDensityUnits.TerawattHourPerCubicMeter](self._values)
+
+    
+    @property
+    def petawatt_hours_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EnergyDensityUnits.PetawattHourPerCubicMeter](self._values)
+
+    
\ No newline at end of file
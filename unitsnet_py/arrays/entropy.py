@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.entropy import Entropy, EntropyUnits
+
+
+class EntropyArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Entropy values, held in JoulePerKelvin.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (EntropyUnits): The Entropy unit of the values, The default unit is JoulePerKelvin
+    """
+    __slots__ = ()
+
+    _quantity = Entropy
+
+    # Whole-array variants of the Entropy conversion functions.
+    _conversions_from_base = {
+        
+        EntropyUnits.JoulePerKelvin: lambda value: (value),
+        
+        EntropyUnits.CaloriePerKelvin: lambda value: (value / 4.184),
+        
+        EntropyUnits.JoulePerDegreeCelsius: lambda value: (value),
+        
+        EntropyUnits.KilojoulePerKelvin: lambda value: ((value) / 1000.0),
+        
+        EntropyUnits.MegajoulePerKelvin: lambda value: ((value) / 1000000.0),
+        
+        EntropyUnits.KilocaloriePerKelvin: lambda value: ((value / 4.184) / 1000.0),
+        
+        EntropyUnits.KilojoulePerDegreeCelsius: lambda value: ((value) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        EntropyUnits.JoulePerKelvin: lambda value: (value),
+        
+        EntropyUnits.CaloriePerKelvin: lambda value: (value * 4.184),
+        
+        EntropyUnits.JoulePerDegreeCelsius: lambda value: (value),
+        
+        EntropyUnits.KilojoulePerKelvin: lambda value: ((value) * 1000.0),
+        
+        EntropyUnits.MegajoulePerKelvin: lambda value: ((value) * 1000000.0),
+        
+        EntropyUnits.KilocaloriePerKelvin: lambda value: ((value * 4.184) * 1000.0),
+        
+        EntropyUnits.KilojoulePerDegreeCelsius: lambda value: ((value) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: EntropyUnits = EntropyUnits.JoulePerKelvin):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: EntropyUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: EntropyUnits = EntropyUnits.JoulePerKelvin) -> EntropyArray:
+        """
+        Create a new instance of EntropyArray from values in the given unit.
+
+        :param values: The Entropy values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: EntropyUnits
+        :return: A new instance of EntropyArray.
+        :rtype: EntropyArray
+        """
+        return EntropyArray(values, unit)
+
+    
+    @property
+    def joules_per_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EntropyUnits.JoulePerKelvin](self._values)
+
+    
+    @property
+    def calories_per_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EntropyUnits.CaloriePerKelvin](self._values)
+
+    
+    @property
+    def joules_per_degree_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EntropyUnits.JoulePerDegreeCelsius](self._values)
+
+    
+    @property
+    def kilojoules_per_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EntropyUnits.KilojoulePerKelvin](self._values)
+
+    
+    @property
+    def megajoules_per_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EntropyUnits.MegajoulePerKelvin](self._values)
+
+    
+    @property
+    def kilocalories_per_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EntropyUnits.KilocaloriePerKelvin](self._values)
+
+    
+    @property
+    def kilojoules_per_degree_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[EntropyUnits.KilojoulePerDegreeCelsius](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.force import Force, ForceUnits
+
+
+class ForceArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Force values, held in Newton.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ForceUnits): The Force unit of the values, The default unit is Newton
+    """
+    __slots__ = ()
+
+    _quantity = Force
+
+    # Whole-array variants of the Force conversion functions.
+    _conversions_from_base = {
+        
+        ForceUnits.Dyn: lambda value: (value * 1e5),
+        
+        ForceUnits.KilogramForce: lambda value: (value / 9.80665002864),
+        
+        ForceUnits.TonneForce: lambda value: (value / 9.80665002864e3),
+        
+        ForceUnits.Newton: lambda value: (value),
+        
+        ForceUnits.KiloPond: lambda value: (value / 9.80665002864),
+        
+        ForceUnits.Poundal: lambda value: (value / 0.13825502798973041652092282466083),
+        
+        ForceUnits.PoundForce: lambda value: (value / 4.4482216152605095551842641431421),
+        
+        ForceUnits.OunceForce: lambda value: (value / 2.780138509537812e-1),
+        
+        ForceUnits.ShortTonForce: lambda value: (value / 8.896443230521e3),
+        
+        ForceUnits.Micronewton: lambda value: ((value) / 1e-06),
+        
+        ForceUnits.Millinewton: lambda value: ((value) / 0.001),
+        
+        ForceUnits.Decanewton: lambda value: ((value) / 10.0),
+        
+        ForceUnits.Kilonewton: lambda value: ((value) / 1000.0),
+        
+        ForceUnits.Meganewton: lambda value: ((value) / 1000000.0),
+        
+        ForceUnits.KilopoundForce: lambda value: ((value / 4.4482216152605095551842641431421) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ForceUnits.Dyn: lambda value: (value / 1e5),
+        
+        ForceUnits.KilogramForce: lambda value: (value * 9.80665002864),
+        
+        ForceUnits.TonneForce: lambda value: (value * 9.80665002864e3),
+        
+        ForceUnits.Newton: lambda value: (value),
+        
+        ForceUnits.KiloPond: lambda value: (value * 9.80665002864),
+        
+        ForceUnits.Poundal: lambda value: (value * 0.13825502798973041652092282466083),
+        
+        ForceUnits.PoundForce: lambda value: (value * 4.4482216152605095551842641431421),
+        
+        ForceUnits.OunceForce: lambda value: (value * 2.780138509537812e-1),
+        
+        ForceUnits.ShortTonForce: lambda value: (value * 8.896443230521e3),
+        
+        ForceUnits.Micronewton: lambda value: ((value) * 1e-06),
+        
+        ForceUnits.Millinewton: lambda value: ((value) * 0.001),
+        
+        ForceUnits.Decanewton: lambda value: ((value) * 10.0),
+        
+        ForceUnits.Kilonewton: lambda value: ((value) * 1000.0),
+        
+        ForceUnits.Meganewton: lambda value: ((value) * 1000000.0),
+        
+        ForceUnits.KilopoundForce: lambda value: ((value * 4.4482216152605095551842641431421) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ForceUnits = ForceUnits.Newton):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ForceUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ForceUnits = ForceUnits.Newton) -> ForceArray:
+        """
+        Create a new instance of ForceArray from values in the given unit.
+
+        :param values: The Force values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ForceUnits
+        :return: A new instance of ForceArray.
+        :rtype: ForceArray
+        """
+        return ForceArray(values, unit)
+
+    
+    @property
+    def dyne(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceUnits.Dyn](self._values)
+
+    
+    @property
+    def kilograms_force(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceUnits.KilogramForce](self._values)
+
+    
+    @property
+    def tonnes_force(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceUnits.TonneForce](self._values)
+
+    
+    @property
+    def newtons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceUnits.Newton](self._values)
+
+    
+    @property
+    def kilo_ponds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceUnits.KiloPond](self._values)
+
+    
+    @property
+    def poundals(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceUnits.Poundal](self._values)
+
+    
+    @property
+    def pounds_force(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceUnits.PoundForce](self._values)
+
+    
+    @property
+    def ounce_force(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceUnits.OunceForce](self._values)
+
+    
+    @property
+    def short_tons_force(self) -> np.ndarray:
+        """
+        The short ton-force is a unit of force equal to 2,000 pounds-force (907.18474 kgf), that is most commonly used in the United States – known there simply as the ton or US ton.
+        """
+        return self._conversions_from_base[ForceUnits.ShortTonForce](self._values)
+
+    
+    @property
+    def micronewtons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceUnits.Micronewton](self._values)
+
+    
+    @property
+    def millinewtons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceUnits.Millinewton](self._values)
+
+    
+    @property
+    def decanewtons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceUnits.Decanewton](self._values)
+
+    
+    @property
+    def kilonewtons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceUnits.Kilonewton](self._values)
+
+    
+    @property
+    def meganewtons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceUnits.Meganewton](self._values)
+
+    
+    @property
+    def kilopounds_force(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceUnits.KilopoundForce](self._values)
+
+    
\ No newline at end of file
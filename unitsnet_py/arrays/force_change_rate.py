@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.force_change_rate import ForceChangeRate, ForceChangeRateUnits
+
+
+class ForceChangeRateArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ForceChangeRate values, held in NewtonPerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ForceChangeRateUnits): The ForceChangeRate unit of the values, The default unit is NewtonPerSecond
+    """
+    __slots__ = ()
+
+    _quantity = ForceChangeRate
+
+    # Whole-array variants of the ForceChangeRate conversion functions.
+    _conversions_from_base = {
+        
+        ForceChangeRateUnits.NewtonPerMinute: lambda value: (value * 60),
+        
+        ForceChangeRateUnits.NewtonPerSecond: lambda value: (value),
+        
+        ForceChangeRateUnits.PoundForcePerMinute: lambda value: (value / 4.4482216152605095551842641431421 * 60),
+        
+        ForceChangeRateUnits.PoundForcePerSecond: lambda value: (value / 4.4482216152605095551842641431421),
+        
+        ForceChangeRateUnits.DecanewtonPerMinute: lambda value: ((value * 60) / 10.0),
+        
+        ForceChangeRateUnits.KilonewtonPerMinute: lambda value: ((value * 60) / 1000.0),
+        
+        ForceChangeRateUnits.NanonewtonPerSecond: lambda value: ((value) / 1e-09),
+        
+        ForceChangeRateUnits.MicronewtonPerSecond: lambda value: ((value) / 1e-06),
+        
+        ForceChangeRateUnits.MillinewtonPerSecond: lambda value: ((value) / 0.001),
+        
+        ForceChangeRateUnits.CentinewtonPerSecond: lambda value: ((value) / 0.01),
+        
+        ForceChangeRateUnits.DecinewtonPerSecond: lambda value: ((value) / 0.1),
+        
+        ForceChangeRateUnits.DecanewtonPerSecond: lambda value: ((value) / 10.0),
+        
+        ForceChangeRateUnits.KilonewtonPerSecond: lambda value: ((value) / 1000.0),
+        
+        ForceChangeRateUnits.KilopoundForcePerMinute: lambda value: ((value / 4.4482216152605095551842641431421 * 60) / 1000.0),
+        
+        ForceChangeRateUnits.KilopoundForcePerSecond: lambda value: ((value / 4.4482216152605095551842641431421) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ForceChangeRateUnits.NewtonPerMinute: lambda value: (value / 60),
+        
+        ForceChangeRateUnits.NewtonPerSecond: lambda value: (value),
+        
+        ForceChangeRateUnits.PoundForcePerMinute: lambda value: (value * 4.4482216152605095551842641431421 / 60),
+        
+        ForceChangeRateUnits.PoundForcePerSecond: lambda value: (value * 4.4482216152605095551842641431421),
+        
+        ForceChangeRateUnits.DecanewtonPerMinute: lambda value: ((value / 60) * 10.0),
+        
+        ForceChangeRateUnits.KilonewtonPerMinute: lambda value: ((value / 60) * 1000.0),
+        
+        ForceChangeRateUnits.NanonewtonPerSecond: lambda value: ((value) * 1e-09),
+        
+        ForceChangeRateUnits.MicronewtonPerSecond: lambda value: ((value) * 1e-06),
+        
+        ForceChangeRateUnits.MillinewtonPerSecond: lambda value: ((value) * 0.001),
+        
+        ForceChangeRateUnits.CentinewtonPerSecond: lambda value: ((value) * 0.01),
+        
+        ForceChangeRateUnits.DecinewtonPerSecond: lambda value: ((value) * 0.1),
+        
+        ForceChangeRateUnits.DecanewtonPerSecond: lambda value: ((value) * 10.0),
+        
+        ForceChangeRateUnits.KilonewtonPerSecond: lambda value: ((value) * 1000.0),
+        
+        ForceChangeRateUnits.KilopoundForcePerMinute: lambda value: ((value * 4.4482216152605095551842641431421 / 60) * 1000.0),
+        
+        ForceChangeRateUnits.KilopoundForcePerSecond: lambda value: ((value * 4.4482216152605095551842641431421) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ForceChangeRateUnits = ForceChangeRateUnits.NewtonPerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ForceChangeRateUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ForceChangeRateUnits = ForceChangeRateUnits.NewtonPerSecond) -> ForceChangeRateArray:
+        """
+        Create a new instance of ForceChangeRateArray from values in the given unit.
+
+        :param values: The ForceChangeRate values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ForceChangeRateUnits
+        :return: A new instance of ForceChangeRateArray.
+        :rtype: ForceChangeRateArray
+        """
+        return ForceChangeRateArray(values, unit)
+
+    
+    @property
+    def newtons_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.NewtonPerMinute](self._values)
+
+    
+    @property
+    def newtons_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.NewtonPerSecond](self._values)
+
+    
+    @property
+    def pounds_force_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.PoundForcePerMinute](self._values)
+
+    
+    @property
+    def pounds_force_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.PoundForcePerSecond](self._values)
+
+    
+    @property
+    def decanewtons_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.DecanewtonPerMinute](self._values)
+
+    
+    @property
+    def kilonewtons_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.KilonewtonPerMinute](self._values)
+
+    
+    @property
+    def nanonewtons_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.NanonewtonPerSecond](self._values)
+
+    
+    @property
+    def micronewtons_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.MicronewtonPerSecond](self._values)
+
+    
+    @property
+    def millinewtons_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.MillinewtonPerSecond](self._values)
+
+    
+    @property
+    def centinewtons_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.CentinewtonPerSecond](self._values)
+
+    
+    @property
+    def decinewtons_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.DecinewtonPerSecond](self._values)
+
+    
+    @property
+    def decanewtons_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.DecanewtonPerSecond](self._values)
+
+    
+    @property
+    def kilonewtons_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.KilonewtonPerSecond](self._values)
+
+    
+    @property
+    def kilopounds_force_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.KilopoundForcePerMinute](self._values)
+
+    
+    @property
+    def kilopounds_force_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForceChangeRateUnits.KilopoundForcePerSecond](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,506 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.force_per_length import ForcePerLength, ForcePerLengthUnits
+
+
+class ForcePerLengthArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ForcePerLength values, held in NewtonPerMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ForcePerLengthUnits): The ForcePerLength unit of the values, The default unit is NewtonPerMeter
+    """
+    __slots__ = ()
+
+    _quantity = ForcePerLength
+
+    # Whole-array variants of the ForcePerLength conversion functions.
+    _conversions_from_base = {
+        
+        ForcePerLengthUnits.NewtonPerMeter: lambda value: (value),
+        
+        ForcePerLengthUnits.NewtonPerCentimeter: lambda value: (value / 1e2),
+        
+        ForcePerLengthUnits.NewtonPerMillimeter: lambda value: (value / 1e3),
+        
+        ForcePerLengthUnits.KilogramForcePerMeter: lambda value: (value / 9.80665002864),
+        
+        ForcePerLengthUnits.KilogramForcePerCentimeter: lambda value: (value / 980.665002864),
+        
+        ForcePerLengthUnits.KilogramForcePerMillimeter: lambda value: (value / 9.80665002864e3),
+        
+        ForcePerLengthUnits.TonneForcePerMeter: lambda value: (value / 9.80665002864e3),
+        
+        ForcePerLengthUnits.TonneForcePerCentimeter: lambda value: (value / 9.80665002864e5),
+        
+        ForcePerLengthUnits.TonneForcePerMillimeter: lambda value: (value / 9.80665002864e6),
+        
+        ForcePerLengthUnits.PoundForcePerFoot: lambda value: (value / 14.59390292),
+        
+        ForcePerLengthUnits.PoundForcePerInch: lambda value: (value / 1.75126835e2),
+        
+        ForcePerLengthUnits.PoundForcePerYard: lambda value: (value / 4.864634307),
+        
+        ForcePerLengthUnits.KilopoundForcePerFoot: lambda value: (value / 14593.90292),
+        
+        ForcePerLengthUnits.KilopoundForcePerInch: lambda value: (value / 1.75126835e5),
+        
+        ForcePerLengthUnits.NanonewtonPerMeter: lambda value: ((value) / 1e-09),
+        
+        ForcePerLengthUnits.MicronewtonPerMeter: lambda value: ((value) / 1e-06),
+        
+        ForcePerLengthUnits.MillinewtonPerMeter: lambda value: ((value) / 0.001),
+        
+        ForcePerLengthUnits.CentinewtonPerMeter: lambda value: ((value) / 0.01),
+        
+        ForcePerLengthUnits.DecinewtonPerMeter: lambda value: ((value) / 0.1),
+        
+        ForcePerLengthUnits.DecanewtonPerMeter: lambda value: ((value) / 10.0),
+        
+        ForcePerLengthUnits.KilonewtonPerMeter: lambda value: ((value) / 1000.0),
+        
+        ForcePerLengthUnits.MeganewtonPerMeter: lambda value: ((value) / 1000000.0),
+        
+        ForcePerLengthUnits.NanonewtonPerCentimeter: lambda value: ((value / 1e2) / 1e-09),
+        
+        ForcePerLengthUnits.MicronewtonPerCentimeter: lambda value: ((value / 1e2) / 1e-06),
+        
+        ForcePerLengthUnits.MillinewtonPerCentimeter: lambda value: ((value / 1e2) / 0.001),
+        
+        ForcePerLengthUnits.CentinewtonPerCentimeter: lambda value: ((value / 1e2) / 0.01),
+        
+        ForcePerLengthUnits.DecinewtonPerCentimeter: lambda value: ((value / 1e2) / 0.1),
+        
+        ForcePerLengthUnits.DecanewtonPerCentimeter: lambda value: ((value / 1e2) / 10.0),
+        
+        ForcePerLengthUnits.KilonewtonPerCentimeter: lambda value: ((value / 1e2) / 1000.0),
+        
+        ForcePerLengthUnits.MeganewtonPerCentimeter: lambda value: ((value / 1e2) / 1000000.0),
+        
+        ForcePerLengthUnits.NanonewtonPerMillimeter: lambda value: ((value / 1e3) / 1e-09),
+        
+        ForcePerLengthUnits.MicronewtonPerMillimeter: lambda value: ((value / 1e3) / 1e-06),
+        
+        ForcePerLengthUnits.MillinewtonPerMillimeter: lambda value: ((value / 1e3) / 0.001),
+        
+        ForcePerLengthUnits.CentinewtonPerMillimeter: lambda value: ((value / 1e3) / 0.01),
+        
+        ForcePerLengthUnits.DecinewtonPerMillimeter: lambda value: ((value / 1e3) / 0.1),
+        
+        ForcePerLengthUnits.DecanewtonPerMillimeter: lambda value: ((value / 1e3) / 10.0),
+        
+        ForcePerLengthUnits.KilonewtonPerMillimeter: lambda value: ((value / 1e3) / 1000.0),
+        
+        ForcePerLengthUnits.MeganewtonPerMillimeter: lambda value: ((value / 1e3) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ForcePerLengthUnits.NewtonPerMeter: lambda value: (value),
+        
+        ForcePerLengthUnits.NewtonPerCentimeter: lambda value: (value * 1e2),
+        
+        ForcePerLengthUnits.NewtonPerMillimeter: lambda value: (value * 1e3),
+        
+        ForcePerLengthUnits.KilogramForcePerMeter: lambda value: (value * 9.80665002864),
+        
+        ForcePerLengthUnits.KilogramForcePerCentimeter: lambda value: (value * 980.665002864),
+        
+        ForcePerLengthUnits.KilogramForcePerMillimeter: lambda value: (value * 9.80665002864e3),
+        
+        ForcePerLengthUnits.TonneForcePerMeter: lambda value: (value * 9.80665002864e3),
+        
+        ForcePerLengthUnits.TonneForcePerCentimeter: lambda value: (value * 9.80665002864e5),
+        
+        ForcePerLengthUnits.TonneForcePerMillimeter: lambda value: (value * 9.80665002864e6),
+        
+        ForcePerLengthUnits.PoundForcePerFoot: lambda value: (value * 14.59390292),
+        
+        ForcePerLengthUnits.PoundForcePerInch: lambda value: (value * 1.75126835e2),
+        
+        ForcePerLengthUnits.PoundForcePerYard: lambda value: (value * 4.864634307),
+        
+        ForcePerLengthUnits.KilopoundForcePerFoot: lambda value: (value * 14593.90292),
+        
+        ForcePerLengthUnits.KilopoundForcePerInch: lambda value: (value * 1.75126835e5),
+        
+        ForcePerLengthUnits.NanonewtonPerMeter: lambda value: ((value) * 1e-09),
+        
+        ForcePerLengthUnits.MicronewtonPerMeter: lambda value: ((value) * 1e-06),
+        
+        ForcePerLengthUnits.MillinewtonPerMeter: lambda value: ((value) * 0.001),
+        
+        ForcePerLengthUnits.CentinewtonPerMeter: lambda value: ((value) * 0.01),
+        
+        ForcePerLengthUnits.DecinewtonPerMeter: lambda value: ((value) * 0.1),
+        
+        ForcePerLengthUnits.DecanewtonPerMeter: lambda value: ((value) * 10.0),
+        
+        ForcePerLengthUnits.KilonewtonPerMeter: lambda value: ((value) * 1000.0),
+        
+        ForcePerLengthUnits.MeganewtonPerMeter: lambda value: ((value) * 1000000.0),
+        
+        ForcePerLengthUnits.NanonewtonPerCentimeter: lambda value: ((value * 1e2) * 1e-09),
+        
+        ForcePerLengthUnits.MicronewtonPerCentimeter: lambda value: ((value * 1e2) * 1e-06),
+        
+        ForcePerLengthUnits.MillinewtonPerCentimeter: lambda value: ((value * 1e2) * 0.001),
+        
+        ForcePerLengthUnits.CentinewtonPerCentimeter: lambda value: ((value * 1e2) * 0.01),
+        
+        ForcePerLengthUnits.DecinewtonPerCentimeter: lambda value: ((value * 1e2) * 0.1),
+        
+        ForcePerLengthUnits.DecanewtonPerCentimeter: lambda value: ((value * 1e2) * 10.0),
+        
+        ForcePerLengthUnits.KilonewtonPerCentimeter: lambda value: ((value * 1e2) * 1000.0),
+        
+        ForcePerLengthUnits.MeganewtonPerCentimeter: lambda value: ((value * 1e2) * 1000000.0),
+        
+        ForcePerLengthUnits.NanonewtonPerMillimeter: lambda value: ((value * 1e3) * 1e-09),
+        
+        ForcePerLengthUnits.MicronewtonPerMillimeter: lambda value: ((value * 1e3) * 1e-06),
+        
+        ForcePerLengthUnits.MillinewtonPerMillimeter: lambda value: ((value * 1e3) * 0.001),
+        
+        ForcePerLengthUnits.CentinewtonPerMillimeter: lambda value: ((value * 1e3) * 0.01),
+        
+        ForcePerLengthUnits.DecinewtonPerMillimeter: lambda value: ((value * 1e3) * 0.1),
+        
+        ForcePerLengthUnits.DecanewtonPerMillimeter: lambda value: ((value * 1e3) * 10.0),
+        
+        ForcePerLengthUnits.KilonewtonPerMillimeter: lambda value: ((value * 1e3) * 1000.0),
+        
+        ForcePerLengthUnits.MeganewtonPerMillimeter: lambda value: ((value * 1e3) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ForcePerLengthUnits = ForcePerLengthUnits.NewtonPerMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ForcePerLengthUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ForcePerLengthUnits = ForcePerLengthUnits.NewtonPerMeter) -> ForcePerLengthArray:
+        """
+        Create a new instance of ForcePerLengthArray from values in the given unit.
+
+        :param values: The ForcePerLength values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ForcePerLengthUnits
+        :return: A new instance of ForcePerLengthArray.
+        :rtype: ForcePerLengthArray
+        """
+        return ForcePerLengthArray(values, unit)
+
+    
+    @property
+    def newtons_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.NewtonPerMeter](self._values)
+
+    
+    @property
+    def newtons_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.NewtonPerCentimeter](self._values)
+
+    
+    @property
+    def newtons_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.NewtonPerMillimeter](self._values)
+
+    
+    @property
+    def kilograms_force_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.KilogramForcePerMeter](self._values)
+
+    
+    @property
+    def kilograms_force_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.KilogramForcePerCentimeter](self._values)
+
+    
+    @property
+    def kilograms_force_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.KilogramForcePerMillimeter](self._values)
+
+    
+    @property
+    def tonnes_force_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.TonneForcePerMeter](self._values)
+
+    
+    @property
+    def tonnes_force_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.TonneForcePerCentimeter](self._values)
+
+    
+    @property
+    def tonnes_force_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.TonneForcePerMillimeter](self._values)
+
+    
+    @property
+    def pounds_force_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.PoundForcePerFoot](self._values)
+
+    
+    @property
+    def pounds_force_per_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.PoundForcePerInch](self._values)
+
+    
+    @property
+    def pounds_force_per_yard(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.PoundForcePerYard](self._values)
+
+    
+    @property
+    def kilopounds_force_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.KilopoundForcePerFoot](self._values)
+
+    
+    @property
+    def kilopounds_force_per_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.KilopoundForcePerInch](self._values)
+
+    
+    @property
+    def nanonewtons_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.NanonewtonPerMeter](self._values)
+
+    
+    @property
+    def micronewtons_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.MicronewtonPerMeter](self._values)
+
+    
+    @property
+    def millinewtons_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.MillinewtonPerMeter](self._values)
+
+    
+    @property
+    def centinewtons_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.CentinewtonPerMeter](self._values)
+
+    
+    @property
+    def decinewtons_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.DecinewtonPerMeter](self._values)
+
+    
+    @property
+    def decanewtons_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.DecanewtonPerMeter](self._values)
+
+    
+    @property
+    def kilonewtons_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.KilonewtonPerMeter](self._values)
+
+    
+    @property
+    def meganewtons_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.MeganewtonPerMeter](self._values)
+
+    
+    @property
+    def nanonewtons_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.NanonewtonPerCentimeter](self._values)
+
+    
+    @property
+    def micronewtons_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.MicronewtonPerCentimeter](self._values)
+
+    
+    @property
+    def millinewtons_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.MillinewtonPerCentimeter](self._values)
+
+    
+    @property
+    def centinewtons_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.CentinewtonPerCentimeter](self._values)
+
+    
+    @property
+    def decinewtons_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.DecinewtonPerCentimeter](self._values)
+
+    
+    @property
+    def decanewtons_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.DecanewtonPerCentimeter](self._values)
+
+    
+    @property
+    def kilonewtons_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.KilonewtonPerCentimeter](self._values)
+
+    
+    @property
+    def meganewtons_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.MeganewtonPerCentimeter](self._values)
+
+    
+    @property
+    def nanonewtons_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.NanonewtonPerMillimeter](self._values)
+
+    
+    @property
+    def micronewtons_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.MicronewtonPerMillimeter](self._values)
+
+    
+    @property
+    def millinewtons_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.MillinewtonPerMillimeter](self._values)
+
+    
+    @property
+    def centinewtons_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.CentinewtonPerMillimeter](self._values)
+
+    
+    @property
+    def decinewtons_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.DecinewtonPerMillimeter](self._values)
+
+    
+    @property
+    def decanewtons_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.DecanewtonPerMillimeter](self._values)
+
+    
+    @property
+    def kilonewtons_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.KilonewtonPerMillimeter](self._values)
+
+    
+    @property
+    def meganewtons_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ForcePerLengthUnits.MeganewtonPerMillimeter](self._values)
+
+    
\ No newline at end of file
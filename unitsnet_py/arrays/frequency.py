@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.frequency import Frequency, FrequencyUnits
+
+
+class FrequencyArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Frequency values, held in Hertz.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (FrequencyUnits): The Frequency unit of the values, The default unit is Hertz
+    """
+    __slots__ = ()
+
+    _quantity = Frequency
+
+    # Whole-array variants of the Frequency conversion functions.
+    _conversions_from_base = {
+        
+        FrequencyUnits.Hertz: lambda value: (value),
+        
+        FrequencyUnits.RadianPerSecond: lambda value: (value * 6.2831853072),
+        
+        FrequencyUnits.CyclePerMinute: lambda value: (value * 60),
+        
+        FrequencyUnits.CyclePerHour: lambda value: (value * 3600),
+        
+        FrequencyUnits.BeatPerMinute: lambda value: (value * 60),
+        
+        FrequencyUnits.PerSecond: lambda value: (value),
+        
+        FrequencyUnits.BUnit: lambda value: (value * value * 1e-3),
+        
+        FrequencyUnits.Microhertz: lambda value: ((value) / 1e-06),
+        
+        FrequencyUnits.Millihertz: lambda value: ((value) / 0.001),
+        
+        FrequencyUnits.Kilohertz: lambda value: ((value) / 1000.0),
+        
+        FrequencyUnits.Megahertz: lambda value: ((value) / 1000000.0),
+        
+        FrequencyUnits.Gigahertz: lambda value: ((value) / 1000000000.0),
+        
+        FrequencyUnits.Terahertz: lambda value: ((value) / 1000000000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        FrequencyUnits.Hertz: lambda value: (value),
+        
+        FrequencyUnits.RadianPerSecond: lambda value: (value / 6.2831853072),
+        
+        FrequencyUnits.CyclePerMinute: lambda value: (value / 60),
+        
+        FrequencyUnits.CyclePerHour: lambda value: (value / 3600),
+        
+        FrequencyUnits.BeatPerMinute: lambda value: (value / 60),
+        
+        FrequencyUnits.PerSecond: lambda value: (value),
+        
+        FrequencyUnits.BUnit: lambda value: (np.sqrt(value * 1e3)),
+        
+        FrequencyUnits.Microhertz: lambda value: ((value) * 1e-06),
+        
+        FrequencyUnits.Millihertz: lambda value: ((value) * 0.001),
+        
+        FrequencyUnits.Kilohertz: lambda value: ((value) * 1000.0),
+        
+        FrequencyUnits.Megahertz: lambda value: ((value) * 1000000.0),
+        
+        FrequencyUnits.Gigahertz: lambda value: ((value) * 1000000000.0),
+        
+        FrequencyUnits.Terahertz: lambda value: ((value) * 1000000000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: FrequencyUnits = FrequencyUnits.Hertz):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: FrequencyUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: FrequencyUnits = FrequencyUnits.Hertz) -> FrequencyArray:
+        """
+        Create a new instance of FrequencyArray from values in the given unit.
+
+        :param values: The Frequency values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: FrequencyUnits
+        :return: A new instance of FrequencyArray.
+        :rtype: FrequencyArray
+        """
+        return FrequencyArray(values, unit)
+
+    
+    @property
+    def hertz(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FrequencyUnits.Hertz](self._values)
+
+    
+    @property
+    def radians_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FrequencyUnits.RadianPerSecond](self._values)
+
+    
+    @property
+    def cycles_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FrequencyUnits.CyclePerMinute](self._values)
+
+    
+    @property
+    def cycles_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FrequencyUnits.CyclePerHour](self._values)
+
+    
+    @property
+    def beats_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FrequencyUnits.BeatPerMinute](self._values)
+
+    
+    @property
+    def per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FrequencyUnits.PerSecond](self._values)
+
+    
+    @property
+    def b_units(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FrequencyUnits.BUnit](self._values)
+
+    
+    @property
+    def microhertz(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FrequencyUnits.Microhertz](self._values)
+
+    
+    @property
+    def millihertz(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FrequencyUnits.Millihertz](self._values)
+
+    
+    @property
+    def kilohertz(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FrequencyUnits.Kilohertz](self._values)
+
+    
+    @property
+    def megahertz(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FrequencyUnits.Megahertz](self._values)
+
+    
+    @property
+    def gigahertz(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FrequencyUnits.Gigahertz](self._values)
+
+    
+    @property
+    def terahertz(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FrequencyUnits.Terahertz](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.fuel_efficiency import FuelEfficiency, FuelEfficiencyUnits
+
+
+class FuelEfficiencyArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of FuelEfficiency values, held in LiterPer100Kilometers.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (FuelEfficiencyUnits): The FuelEfficiency unit of the values, The default unit is LiterPer100Kilometers
+    """
+    __slots__ = ()
+
+    _quantity = FuelEfficiency
+
+    # Whole-array variants of the FuelEfficiency conversion functions.
+    _conversions_from_base = {
+        
+        FuelEfficiencyUnits.LiterPer100Kilometers: lambda value: (value),
+        
+        FuelEfficiencyUnits.MilePerUsGallon: lambda value: ((100 * 3.785411784) / (1.609344 * value)),
+        
+        FuelEfficiencyUnits.MilePerUkGallon: lambda value: ((100 * 4.54609188) / (1.609344 * value)),
+        
+        FuelEfficiencyUnits.KilometerPerLiter: lambda value: (100 / value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        FuelEfficiencyUnits.LiterPer100Kilometers: lambda value: (value),
+        
+        FuelEfficiencyUnits.MilePerUsGallon: lambda value: ((100 * 3.785411784) / (1.609344 * value)),
+        
+        FuelEfficiencyUnits.MilePerUkGallon: lambda value: ((100 * 4.54609188) / (1.609344 * value)),
+        
+        FuelEfficiencyUnits.KilometerPerLiter: lambda value: (100 / value),
+        
+    }
+
+    def __init__(self, values, from_unit: FuelEfficiencyUnits = FuelEfficiencyUnits.LiterPer100Kilometers):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: FuelEfficiencyUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: FuelEfficiencyUnits = FuelEfficiencyUnits.LiterPer100Kilometers) -> FuelEfficiencyArray:
+        """
+        Create a new instance of FuelEfficiencyArray from values in the given unit.
+
+        :param values: The FuelEfficiency values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: FuelEfficiencyUnits
+        :return: A new instance of FuelEfficiencyArray.
+        :rtype: FuelEfficiencyArray
+        """
+        return FuelEfficiencyArray(values, unit)
+
+    
+    @property
+    def liters_per100_kilometers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FuelEfficiencyUnits.LiterPer100Kilometers](self._values)
+
+    
+    @property
+    def miles_per_us_gallon(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FuelEfficiencyUnits.MilePerUsGallon](self._values)
+
+    
+    @property
+    def miles_per_uk_gallon(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FuelEfficiencyUnits.MilePerUkGallon](self._values)
+
+    
+    @property
+    def kilometers_per_liters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[FuelEfficiencyUnits.KilometerPerLiter](self._values)
+
+    
\ No newline at end of file
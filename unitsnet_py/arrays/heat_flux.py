@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.heat_flux import HeatFlux, HeatFluxUnits
+
+
+class HeatFluxArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of HeatFlux values, held in WattPerSquareMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (HeatFluxUnits): The HeatFlux unit of the values, The default unit is WattPerSquareMeter
+    """
+    __slots__ = ()
+
+    _quantity = HeatFlux
+
+    # Whole-array variants of the HeatFlux conversion functions.
+    _conversions_from_base = {
+        
+        HeatFluxUnits.WattPerSquareMeter: lambda value: (value),
+        
+        HeatFluxUnits.WattPerSquareInch: lambda value: (value / 1.5500031e3),
+        
+        HeatFluxUnits.WattPerSquareFoot: lambda value: (value / 1.07639e1),
+        
+        HeatFluxUnits.BtuPerSecondSquareInch: lambda value: (value / 1.63533984e6),
+        
+        HeatFluxUnits.BtuPerSecondSquareFoot: lambda value: (value / 1.13565267e4),
+        
+        HeatFluxUnits.BtuPerMinuteSquareFoot: lambda value: (value / 1.89275445e2),
+        
+        HeatFluxUnits.BtuPerHourSquareFoot: lambda value: (value / 3.15459075),
+        
+        HeatFluxUnits.CaloriePerSecondSquareCentimeter: lambda value: (value / 4.1868e4),
+        
+        HeatFluxUnits.KilocaloriePerHourSquareMeter: lambda value: (value / 1.163),
+        
+        HeatFluxUnits.PoundForcePerFootSecond: lambda value: (value / 1.459390293720636e1),
+        
+        HeatFluxUnits.PoundPerSecondCubed: lambda value: (value / 4.5359237e-1),
+        
+        HeatFluxUnits.NanowattPerSquareMeter: lambda value: ((value) / 1e-09),
+        
+        HeatFluxUnits.MicrowattPerSquareMeter: lambda value: ((value) / 1e-06),
+        
+        HeatFluxUnits.MilliwattPerSquareMeter: lambda value: ((value) / 0.001),
+        
+        HeatFluxUnits.CentiwattPerSquareMeter: lambda value: ((value) / 0.01),
+        
+        HeatFluxUnits.DeciwattPerSquareMeter: lambda value: ((value) / 0.1),
+        
+        HeatFluxUnits.KilowattPerSquareMeter: lambda value: ((value) / 1000.0),
+        
+        HeatFluxUnits.KilocaloriePerSecondSquareCentimeter: lambda value: ((value / 4.1868e4) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        HeatFluxUnits.WattPerSquareMeter: lambda value: (value),
+        
+        HeatFluxUnits.WattPerSquareInch: lambda value: (value * 1.5500031e3),
+        
+        HeatFluxUnits.WattPerSquareFoot: lambda value: (value * 1.07639e1),
+        
+        HeatFluxUnits.BtuPerSecondSquareInch: lambda value: (value * 1.63533984e6),
+        
+        HeatFluxUnits.BtuPerSecondSquareFoot: lambda value: (value * 1.13565267e4),
+        
+        HeatFluxUnits.BtuPerMinuteSquareFoot: lambda value: (value * 1.89275445e2),
+        
+        HeatFluxUnits.BtuPerHourSquareFoot: lambda value: (value * 3.15459075),
+        
+        HeatFluxUnits.CaloriePerSecondSquareCentimeter: lambda value: (value * 4.1868e4),
+        
+        HeatFluxUnits.KilocaloriePerHourSquareMeter: lambda value: (value * 1.163),
+        
+        HeatFluxUnits.PoundForcePerFootSecond: lambda value: (value * 1.459390293720636e1),
+        
+        HeatFluxUnits.PoundPerSecondCubed: lambda value: (value * 4.5359237e-1),
+        
+        HeatFluxUnits.NanowattPerSquareMeter: lambda value: ((value) * 1e-09),
+        
+        HeatFluxUnits.MicrowattPerSquareMeter: lambda value: ((value) * 1e-06),
+        
+        HeatFluxUnits.MilliwattPerSquareMeter: lambda value: ((value) * 0.001),
+        
+        HeatFluxUnits.CentiwattPerSquareMeter: lambda value: ((value) * 0.01),
+        
+        HeatFluxUnits.DeciwattPerSquareMeter: lambda value: ((value) * 0.1),
+        
+        HeatFluxUnits.KilowattPerSquareMeter: lambda value: ((value) * 1000.0),
+        
+        HeatFluxUnits.KilocaloriePerSecondSquareCentimeter: lambda value: ((value * 4.1868e4) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: HeatFluxUnits = HeatFluxUnits.WattPerSquareMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: HeatFluxUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: HeatFluxUnits = HeatFluxUnits.WattPerSquareMeter) -> HeatFluxArray:
+        """
+        Create a new instance of HeatFluxArray from values in the given unit.
+
+        :param values: The HeatFlux values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: HeatFluxUnits
+        :return: A new instance of HeatFluxArray.
+        :rtype: HeatFluxArray
+        """
+        return HeatFluxArray(values, unit)
+
+    
+    @property
+    def watts_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.WattPerSquareMeter](self._values)
+
+    
+    @property
+    def watts_per_square_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.WattPerSquareInch](self._values)
+
+    
+    @property
+    def watts_per_square_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.WattPerSquareFoot](self._values)
+
+    
+    @property
+    def btus_per_second_square_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.BtuPerSecondSquareInch](self._values)
+
+    
+    @property
+    def btus_per_second_square_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.BtuPerSecondSquareFoot](self._values)
+
+    
+    @property
+    def btus_per_minute_square_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.BtuPerMinuteSquareFoot](self._values)
+
+    
+    @property
+    def btus_per_hour_square_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.BtuPerHourSquareFoot](self._values)
+
+    
+    @property
+    def calories_per_second_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.CaloriePerSecondSquareCentimeter](self._values)
+
+    
+    @property
+    def kilocalories_per_hour_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.KilocaloriePerHourSquareMeter](self._values)
+
+    
+    @property
+    def pounds_force_per_foot_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.PoundForcePerFootSecond](self._values)
+
+    
+    @property
+    def pounds_per_second_cubed(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.PoundPerSecondCubed](self._values)
+
+    
+    @property
+    def nanowatts_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.NanowattPerSquareMeter](self._values)
+
+    
+    @property
+    def microwatts_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.MicrowattPerSquareMeter](self._values)
+
+    
+    @property
+    def milliwatts_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.MilliwattPerSquareMeter](self._values)
+
+    
+    @property
+    def centiwatts_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.CentiwattPerSquareMeter](self._values)
+
+    
+    @property
+    def deciwatts_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.DeciwattPerSquareMeter](self._values)
+
+    
+    @property
+    def kilowatts_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.KilowattPerSquareMeter](self._values)
+
+    
+    @property
+    def kilocalories_per_second_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatFluxUnits.KilocaloriePerSecondSquareCentimeter](self._values)
+
+    
\ No newline at end of file
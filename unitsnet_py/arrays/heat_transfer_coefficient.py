@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.heat_transfer_coefficient import HeatTransferCoefficient, HeatTransferCoefficientUnits
+
+
+class HeatTransferCoefficientArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of HeatTransferCoefficient values, held in WattPerSquareMeterKelvin.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (HeatTransferCoefficientUnits): The HeatTransferCoefficient unit of the values, The default unit is WattPerSquareMeterKelvin
+    """
+    __slots__ = ()
+
+    _quantity = HeatTransferCoefficient
+
+    # Whole-array variants of the HeatTransferCoefficient conversion functions.
+    _conversions_from_base = {
+        
+        HeatTransferCoefficientUnits.WattPerSquareMeterKelvin: lambda value: (value),
+        
+        HeatTransferCoefficientUnits.WattPerSquareMeterCelsius: lambda value: (value),
+        
+        HeatTransferCoefficientUnits.BtuPerHourSquareFootDegreeFahrenheit: lambda value: (value / 5.6782633411134878),
+        
+        HeatTransferCoefficientUnits.CaloriePerHourSquareMeterDegreeCelsius: lambda value: ((value / 4.1868) * 3600),
+        
+        HeatTransferCoefficientUnits.KilocaloriePerHourSquareMeterDegreeCelsius: lambda value: (((value / 4.1868) * 3600) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        HeatTransferCoefficientUnits.WattPerSquareMeterKelvin: lambda value: (value),
+        
+        HeatTransferCoefficientUnits.WattPerSquareMeterCelsius: lambda value: (value),
+        
+        HeatTransferCoefficientUnits.BtuPerHourSquareFootDegreeFahrenheit: lambda value: (value * 5.6782633411134878),
+        
+        HeatTransferCoefficientUnits.CaloriePerHourSquareMeterDegreeCelsius: lambda value: ((value * 4.1868) / 3600),
+        
+        HeatTransferCoefficientUnits.KilocaloriePerHourSquareMeterDegreeCelsius: lambda value: (((value * 4.1868) / 3600) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: HeatTransferCoefficientUnits = HeatTransferCoefficientUnits.WattPerSquareMeterKelvin):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: HeatTransferCoefficientUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: HeatTransferCoefficientUnits = HeatTransferCoefficientUnits.WattPerSquareMeterKelvin) -> HeatTransferCoefficientArray:
+        """
+        Create a new instance of HeatTransferCoefficientArray from values in the given unit.
+
+        :param values: The HeatTransferCoefficient values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: HeatTransferCoefficientUnits
+        :return: A new instance of HeatTransferCoefficientArray.
+        :rtype: HeatTransferCoefficientArray
+        """
+        return HeatTransferCoefficientArray(values, unit)
+
+    
+    @property
+    def watts_per_square_meter_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatTransferCoefficientUnits.WattPerSquareMeterKelvin](self._values)
+
+    
+    @property
+    def watts_per_square_meter_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatTransferCoefficientUnits.WattPerSquareMeterCelsius](self._values)
+
+    
+    @property
+    def btus_per_hour_square_foot_degree_fahrenheit(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatTransferCoefficientUnits.BtuPerHourSquareFootDegreeFahrenheit](self._values)
+
+    
+    @property
+    def calories_per_hour_square_meter_degree_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatTransferCoefficientUnits.CaloriePerHourSquareMeterDegreeCelsius](self._values)
+
+    
+    @property
+    def kilocalories_per_hour_square_meter_degree_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[HeatTransferCoefficientUnits.KilocaloriePerHourSquareMeterDegreeCelsius](self._values)
+
+    
\ No newline at end of file
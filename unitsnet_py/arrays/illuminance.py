@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.illuminance import Illuminance, IlluminanceUnits
+
+
+class IlluminanceArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Illuminance values, held in Lux.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (IlluminanceUnits): The Illuminance unit of the values, The default unit is Lux
+    """
+    __slots__ = ()
+
+    _quantity = Illuminance
+
+    # Whole-array variants of the Illuminance conversion functions.
+    _conversions_from_base = {
+        
+        IlluminanceUnits.Lux: lambda value: (value),
+        
+        IlluminanceUnits.Millilux: lambda value: ((value) / 0.001),
+        
+        IlluminanceUnits.Kilolux: lambda value: ((value) / 1000.0),
+        
+        IlluminanceUnits.Megalux: lambda value: ((value) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        IlluminanceUnits.Lux: lambda value: (value),
+        
+        IlluminanceUnits.Millilux: lambda value: ((value) * 0.001),
+        
+        IlluminanceUnits.Kilolux: lambda value: ((value) * 1000.0),
+        
+        IlluminanceUnits.Megalux: lambda value: ((value) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: IlluminanceUnits = IlluminanceUnits.Lux):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: IlluminanceUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: IlluminanceUnits = IlluminanceUnits.Lux) -> IlluminanceArray:
+        """
+        Create a new instance of IlluminanceArray from values in the given unit.
+
+        :param values: The Illuminance values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: IlluminanceUnits
+        :return: A new instance of IlluminanceArray.
+        :rtype: IlluminanceArray
+        """
+        return IlluminanceArray(values, unit)
+
+    
+    @property
+    def lux(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IlluminanceUnits.Lux](self._values)
+
+    
+    @property
+    def millilux(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IlluminanceUnits.Millilux](self._values)
+
+    
+    @property
+    def kilolux(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IlluminanceUnits.Kilolux](self._values)
+
+    
+    @property
+    def megalux(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IlluminanceUnits.Megalux](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.impulse import Impulse, ImpulseUnits
+
+
+class ImpulseArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Impulse values, held in NewtonSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ImpulseUnits): The Impulse unit of the values, The default unit is NewtonSecond
+    """
+    __slots__ = ()
+
+    _quantity = Impulse
+
+    # Whole-array variants of the Impulse conversion functions.
+    _conversions_from_base = {
+        
+        ImpulseUnits.KilogramMeterPerSecond: lambda value: (value),
+        
+        ImpulseUnits.NewtonSecond: lambda value: (value),
+        
+        ImpulseUnits.PoundFootPerSecond: lambda value: (value * 7.230657989877),
+        
+        ImpulseUnits.PoundForceSecond: lambda value: (value * 0.2248089430997),
+        
+        ImpulseUnits.SlugFootPerSecond: lambda value: (value * 0.224735720691),
+        
+        ImpulseUnits.NanonewtonSecond: lambda value: ((value) / 1e-09),
+        
+        ImpulseUnits.MicronewtonSecond: lambda value: ((value) / 1e-06),
+        
+        ImpulseUnits.MillinewtonSecond: lambda value: ((value) / 0.001),
+        
+        ImpulseUnits.CentinewtonSecond: lambda value: ((value) / 0.01),
+        
+        ImpulseUnits.DecinewtonSecond: lambda value: ((value) / 0.1),
+        
+        ImpulseUnits.DecanewtonSecond: lambda value: ((value) / 10.0),
+        
+        ImpulseUnits.KilonewtonSecond: lambda value: ((value) / 1000.0),
+        
+        ImpulseUnits.MeganewtonSecond: lambda value: ((value) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ImpulseUnits.KilogramMeterPerSecond: lambda value: (value),
+        
+        ImpulseUnits.NewtonSecond: lambda value: (value),
+        
+        ImpulseUnits.PoundFootPerSecond: lambda value: (value / 7.230657989877),
+        
+        ImpulseUnits.PoundForceSecond: lambda value: (value / 0.2248089430997),
+        
+        ImpulseUnits.SlugFootPerSecond: lambda value: (value / 0.224735720691),
+        
+        ImpulseUnits.NanonewtonSecond: lambda value: ((value) * 1e-09),
+        
+        ImpulseUnits.MicronewtonSecond: lambda value: ((value) * 1e-06),
+        
+        ImpulseUnits.MillinewtonSecond: lambda value: ((value) * 0.001),
+        
+        ImpulseUnits.CentinewtonSecond: lambda value: ((value) * 0.01),
+        
+        ImpulseUnits.DecinewtonSecond: lambda value: ((value) * 0.1),
+        
+        ImpulseUnits.DecanewtonSecond: lambda value: ((value) * 10.0),
+        
+        ImpulseUnits.KilonewtonSecond: lambda value: ((value) * 1000.0),
+        
+        ImpulseUnits.MeganewtonSecond: lambda value: ((value) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ImpulseUnits = ImpulseUnits.NewtonSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ImpulseUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ImpulseUnits = ImpulseUnits.NewtonSecond) -> ImpulseArray:
+        """
+        Create a new instance of ImpulseArray from values in the given unit.
+
+        :param values: The Impulse values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ImpulseUnits
+        :return: A new instance of ImpulseArray.
+        :rtype: ImpulseArray
+        """
+        return ImpulseArray(values, unit)
+
+    
+    @property
+    def kilogram_meters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ImpulseUnits.KilogramMeterPerSecond](self._values)
+
+    
+    @property
+    def newton_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ImpulseUnits.NewtonSecond](self._values)
+
+    
+    @property
+    def pound_feet_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ImpulseUnits.PoundFootPerSecond](self._values)
+
+    
+    @property
+    def pound_force_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ImpulseUnits.PoundForceSecond](self._values)
+
+    
+    @property
+    def slug_feet_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ImpulseUnits.SlugFootPerSecond](self._values)
+
+    
+    @property
+    def nanonewton_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ImpulseUnits.NanonewtonSecond](self._values)
+
+    
+    @property
+    def micronewton_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ImpulseUnits.MicronewtonSecond](self._values)
+
+    
+    @property
+    def millinewton_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ImpulseUnits.MillinewtonSecond](self._values)
+
+    
+    @property
+    def centinewton_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ImpulseUnits.CentinewtonSecond](self._values)
+
+    
+    @property
+    def decinewton_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ImpulseUnits.DecinewtonSecond](self._values)
+
+    
+    @property
+    def decanewton_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ImpulseUnits.DecanewtonSecond](self._values)
+
+    
+    @property
+    def kilonewton_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ImpulseUnits.KilonewtonSecond](self._values)
+
+    
+    @property
+    def meganewton_seconds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ImpulseUnits.MeganewtonSecond](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.information import Information, InformationUnits
+
+
+class InformationArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Information values, held in Bit.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (InformationUnits): The Information unit of the values, The default unit is Bit
+    """
+    __slots__ = ()
+
+    _quantity = Information
+
+    # Whole-array variants of the Information conversion functions.
+    _conversions_from_base = {
+        
+        InformationUnits.Byte: lambda value: (value / 8),
+        
+        InformationUnits.Bit: lambda value: (value),
+        
+        InformationUnits.Kilobyte: lambda value: ((value / 8) / 1000.0),
+        
+        InformationUnits.Megabyte: lambda value: ((value / 8) / 1000000.0),
+        
+        InformationUnits.Gigabyte: lambda value: ((value / 8) / 1000000000.0),
+        
+        InformationUnits.Terabyte: lambda value: ((value / 8) / 1000000000000.0),
+        
+        InformationUnits.Petabyte: lambda value: ((value / 8) / 1000000000000000.0),
+        
+        InformationUnits.Exabyte: lambda value: ((value / 8) / 1e+18),
+        
+        InformationUnits.Kilobit: lambda value: ((value) / 1000.0),
+        
+        InformationUnits.Megabit: lambda value: ((value) / 1000000.0),
+        
+        InformationUnits.Gigabit: lambda value: ((value) / 1000000000.0),
+        
+        InformationUnits.Terabit: lambda value: ((value) / 1000000000000.0),
+        
+        InformationUnits.Petabit: lambda value: ((value) / 1000000000000000.0),
+        
+        InformationUnits.Exabit: lambda value: ((value) / 1e+18),
+        
+    }
+
+    _conversions_to_base = {
+        
+        InformationUnits.Byte: lambda value: (value * 8),
+        
+        InformationUnits.Bit: lambda value: (value),
+        
+        InformationUnits.Kilobyte: lambda value: ((value * 8) * 1000.0),
+        
+        InformationUnits.Megabyte: lambda value: ((value * 8) * 1000000.0),
+        
+        InformationUnits.Gigabyte: lambda value: ((value * 8) * 1000000000.0),
+        
+        InformationUnits.Terabyte: lambda value: ((value * 8) * 1000000000000.0),
+        
+        InformationUnits.Petabyte: lambda value: ((value * 8) * 1000000000000000.0),
+        
+        InformationUnits.Exabyte: lambda value: ((value * 8) * 1e+18),
+        
+        InformationUnits.Kilobit: lambda value: ((value) * 1000.0),
+        
+        InformationUnits.Megabit: lambda value: ((value) * 1000000.0),
+        
+        InformationUnits.Gigabit: lambda value: ((value) * 1000000000.0),
+        
+        InformationUnits.Terabit: lambda value: ((value) * 1000000000000.0),
+        
+        InformationUnits.Petabit: lambda value: ((value) * 1000000000000000.0),
+        
+        InformationUnits.Exabit: lambda value: ((value) * 1e+18),
+        
+    }
+
+    def __init__(self, values, from_unit: InformationUnits = InformationUnits.Bit):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: InformationUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: InformationUnits = InformationUnits.Bit) -> InformationArray:
+        """
+        Create a new instance of InformationArray from values in the given unit.
+
+        :param values: The Information values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: InformationUnits
+        :return: A new instance of InformationArray.
+        :rtype: InformationArray
+        """
+        return InformationArray(values, unit)
+
+    
+    @property
+    def bytes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[InformationUnits.Byte](self._values)
+
+    
+    @property
+    def bits(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[InformationUnits.Bit](self._values)
+
+    
+    @property
+    def kilobytes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[InformationUnits.Kilobyte](self._values)
+
+    
+    @property
+    def megabytes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[InformationUnits.Megabyte](self._values)
+
+    
+    @property
+    def gigabytes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[InformationUnits.Gigabyte](self._values)
+
+    
+    @property
+    def terabytes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[InformationUnits.Terabyte](self._values)
+
+    
+    @property
+    def petabytes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[InformationUnits.Petabyte](self._values)
+
+    
+    @property
+    def exabytes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[InformationUnits.Exabyte](self._values)
+
+    
+    @property
+    def kilobits(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[InformationUnits.Kilobit](self._values)
+
+    
+    @property
+    def megabits(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[InformationUnits.Megabit](self._values)
+
+    
+    @property
+    def gigabits(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[InformationUnits.Gigabit](self._values)
+
+    
+    @property
+    def terabits(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[InformationUnits.Terabit](self._values)
+
+    
+    @property
+    def petabits(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[InformationUnits.Petabit](self._values)
+
+    
+    @property
+    def exabits(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[InformationUnits.Exabit](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.irradiance import Irradiance, IrradianceUnits
+
+
+class IrradianceArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Irradiance values, held in WattPerSquareMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (IrradianceUnits): The Irradiance unit of the values, The default unit is WattPerSquareMeter
+    """
+    __slots__ = ()
+
+    _quantity = Irradiance
+
+    # Whole-array variants of the Irradiance conversion functions.
+    _conversions_from_base = {
+        
+        IrradianceUnits.WattPerSquareMeter: lambda value: (value),
+        
+        IrradianceUnits.WattPerSquareCentimeter: lambda value: (value * 0.0001),
+        
+        IrradianceUnits.PicowattPerSquareMeter: lambda value: ((value) / 1e-12),
+        
+        IrradianceUnits.NanowattPerSquareMeter: lambda value: ((value) / 1e-09),
+        
+        IrradianceUnits.MicrowattPerSquareMeter: lambda value: ((value) / 1e-06),
+        
+        IrradianceUnits.MilliwattPerSquareMeter: lambda value: ((value) / 0.001),
+        
+        IrradianceUnits.KilowattPerSquareMeter: lambda value: ((value) / 1000.0),
+        
+        IrradianceUnits.MegawattPerSquareMeter: lambda value: ((value) / 1000000.0),
+        
+        IrradianceUnits.PicowattPerSquareCentimeter: lambda value: ((value * 0.0001) / 1e-12),
+        
+        IrradianceUnits.NanowattPerSquareCentimeter: lambda value: ((value * 0.0001) / 1e-09),
+        
+        IrradianceUnits.MicrowattPerSquareCentimeter: lambda value: ((value * 0.0001) / 1e-06),
+        
+        IrradianceUnits.MilliwattPerSquareCentimeter: lambda value: ((value * 0.0001) / 0.001),
+        
+        IrradianceUnits.KilowattPerSquareCentimeter: lambda value: ((value * 0.0001) / 1000.0),
+        
+        IrradianceUnits.MegawattPerSquareCentimeter: lambda value: ((value * 0.0001) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        IrradianceUnits.WattPerSquareMeter: lambda value: (value),
+        
+        IrradianceUnits.WattPerSquareCentimeter: lambda value: (value * 10000),
+        
+        IrradianceUnits.PicowattPerSquareMeter: lambda value: ((value) * 1e-12),
+        
+        IrradianceUnits.NanowattPerSquareMeter: lambda value: ((value) * 1e-09),
+        
+        IrradianceUnits.MicrowattPerSquareMeter: lambda value: ((value) * 1e-06),
+        
+        IrradianceUnits.MilliwattPerSquareMeter: lambda value: ((value) * 0.001),
+        
+        IrradianceUnits.KilowattPerSquareMeter: lambda value: ((value) * 1000.0),
+        
+        IrradianceUnits.MegawattPerSquareMeter: lambda value: ((value) * 1000000.0),
+        
+        IrradianceUnits.PicowattPerSquareCentimeter: lambda value: ((value * 10000) * 1e-12),
+        
+        IrradianceUnits.NanowattPerSquareCentimeter: lambda value: ((value * 10000) * 1e-09),
+        
+        IrradianceUnits.MicrowattPerSquareCentimeter: lambda value: ((value * 10000) * 1e-06),
+        
+        IrradianceUnits.MilliwattPerSquareCentimeter: lambda value: ((value * 10000) * 0.001),
+        
+        IrradianceUnits.KilowattPerSquareCentimeter: lambda value: ((value * 10000) * 1000.0),
+        
+        IrradianceUnits.MegawattPerSquareCentimeter: lambda value: ((value * 10000) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: IrradianceUnits = IrradianceUnits.WattPerSquareMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: IrradianceUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: IrradianceUnits = IrradianceUnits.WattPerSquareMeter) -> IrradianceArray:
+        """
+        Create a new instance of IrradianceArray from values in the given unit.
+
+        :param values: The Irradiance values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: IrradianceUnits
+        :return: A new instance of IrradianceArray.
+        :rtype: IrradianceArray
+        """
+        return IrradianceArray(values, unit)
+
+    
+    @property
+    def watts_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradianceUnits.WattPerSquareMeter](self._values)
+
+    
+    @property
+    def watts_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradianceUnits.WattPerSquareCentimeter](self._values)
+
+    
+    @property
+    def picowatts_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradianceUnits.PicowattPerSquareMeter](self._values)
+
+    
+    @property
+    def nanowatts_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradianceUnits.NanowattPerSquareMeter](self._values)
+
+    
+    @property
+    def microwatts_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradianceUnits.MicrowattPerSquareMeter](self._values)
+
+    
+    @property
+    def milliwatts_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradianceUnits.MilliwattPerSquareMeter](self._values)
+
+    
+    @property
+    def kilowatts_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradianceUnits.KilowattPerSquareMeter](self._values)
+
+    
+    @property
+    def megawatts_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradianceUnits.MegawattPerSquareMeter](self._values)
+
+    
+    @property
+    def picowatts_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradianceUnits.PicowattPerSquareCentimeter](self._values)
+
+    
+    @property
+    def nanowatts_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradianceUnits.NanowattPerSquareCentimeter](self._values)
+
+    
+    @property
+    def microwatts_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradianceUnits.MicrowattPerSquareCentimeter](self._values)
+
+    
+    @property
+    def milliwatts_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradianceUnits.MilliwattPerSquareCentimeter](self._values)
+
+    
+    @property
+    def kilowatts_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradianceUnits.KilowattPerSquareCentimeter](self._values)
+
+    
+    @property
+    def megawatts_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradianceUnits.MegawattPerSquareCentimeter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.irradiation import Irradiation, IrradiationUnits
+
+
+class IrradiationArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Irradiation values, held in JoulePerSquareMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (IrradiationUnits): The Irradiation unit of the values, The default unit is JoulePerSquareMeter
+    """
+    __slots__ = ()
+
+    _quantity = Irradiation
+
+    # Whole-array variants of the Irradiation conversion functions.
+    _conversions_from_base = {
+        
+        IrradiationUnits.JoulePerSquareMeter: lambda value: (value),
+        
+        IrradiationUnits.JoulePerSquareCentimeter: lambda value: (value / 1e4),
+        
+        IrradiationUnits.JoulePerSquareMillimeter: lambda value: (value / 1e6),
+        
+        IrradiationUnits.WattHourPerSquareMeter: lambda value: (value / 3600),
+        
+        IrradiationUnits.KilojoulePerSquareMeter: lambda value: ((value) / 1000.0),
+        
+        IrradiationUnits.MillijoulePerSquareCentimeter: lambda value: ((value / 1e4) / 0.001),
+        
+        IrradiationUnits.KilowattHourPerSquareMeter: lambda value: ((value / 3600) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        IrradiationUnits.JoulePerSquareMeter: lambda value: (value),
+        
+        IrradiationUnits.JoulePerSquareCentimeter: lambda value: (value * 1e4),
+        
+        IrradiationUnits.JoulePerSquareMillimeter: lambda value: (value * 1e6),
+        
+        IrradiationUnits.WattHourPerSquareMeter: lambda value: (value * 3600),
+        
+        IrradiationUnits.KilojoulePerSquareMeter: lambda value: ((value) * 1000.0),
+        
+        IrradiationUnits.MillijoulePerSquareCentimeter: lambda value: ((value * 1e4) * 0.001),
+        
+        IrradiationUnits.KilowattHourPerSquareMeter: lambda value: ((value * 3600) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: IrradiationUnits = IrradiationUnits.JoulePerSquareMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: IrradiationUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: IrradiationUnits = IrradiationUnits.JoulePerSquareMeter) -> IrradiationArray:
+        """
+        Create a new instance of IrradiationArray from values in the given unit.
+
+        :param values: The Irradiation values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: IrradiationUnits
+        :return: A new instance of IrradiationArray.
+        :rtype: IrradiationArray
+        """
+        return IrradiationArray(values, unit)
+
+    
+    @property
+    def joules_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradiationUnits.JoulePerSquareMeter](self._values)
+
+    
+    @property
+    def joules_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradiationUnits.JoulePerSquareCentimeter](self._values)
+
+    
+    @property
+    def joules_per_square_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradiationUnits.JoulePerSquareMillimeter](self._values)
+
+    
+    @property
+    def watt_hours_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradiationUnits.WattHourPerSquareMeter](self._values)
+
+    
+    @property
+    def kilojoules_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradiationUnits.KilojoulePerSquareMeter](self._values)
+
+    
+    @property
+    def millijoules_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradiationUnits.MillijoulePerSquareCentimeter](self._values)
+
+    
+    @property
+    def kilowatt_hours_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[IrradiationUnits.KilowattHourPerSquareMeter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.jerk import Jerk, JerkUnits
+
+
+class JerkArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Jerk values, held in MeterPerSecondCubed.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (JerkUnits): The Jerk unit of the values, The default unit is MeterPerSecondCubed
+    """
+    __slots__ = ()
+
+    _quantity = Jerk
+
+    # Whole-array variants of the Jerk conversion functions.
+    _conversions_from_base = {
+        
+        JerkUnits.MeterPerSecondCubed: lambda value: (value),
+        
+        JerkUnits.InchPerSecondCubed: lambda value: (value / 0.0254),
+        
+        JerkUnits.FootPerSecondCubed: lambda value: (value / 0.304800),
+        
+        JerkUnits.StandardGravitiesPerSecond: lambda value: (value / 9.80665),
+        
+        JerkUnits.NanometerPerSecondCubed: lambda value: ((value) / 1e-09),
+        
+        JerkUnits.MicrometerPerSecondCubed: lambda value: ((value) / 1e-06),
+        
+        JerkUnits.MillimeterPerSecondCubed: lambda value: ((value) / 0.001),
+        
+        JerkUnits.CentimeterPerSecondCubed: lambda value: ((value) / 0.01),
+        
+        JerkUnits.DecimeterPerSecondCubed: lambda value: ((value) / 0.1),
+        
+        JerkUnits.KilometerPerSecondCubed: lambda value: ((value) / 1000.0),
+        
+        JerkUnits.MillistandardGravitiesPerSecond: lambda value: ((value / 9.80665) / 0.001),
+        
+    }
+
+    _conversions_to_base = {
+        
+        JerkUnits.MeterPerSecondCubed: lambda value: (value),
+        
+        JerkUnits.InchPerSecondCubed: lambda value: (value * 0.0254),
+        
+        JerkUnits.FootPerSecondCubed: lambda value: (value * 0.304800),
+        
+        JerkUnits.StandardGravitiesPerSecond: lambda value: (value * 9.80665),
+        
+        JerkUnits.NanometerPerSecondCubed: lambda value: ((value) * 1e-09),
+        
+        JerkUnits.MicrometerPerSecondCubed: lambda value: ((value) * 1e-06),
+        
+        JerkUnits.MillimeterPerSecondCubed: lambda value: ((value) * 0.001),
+        
+        JerkUnits.CentimeterPerSecondCubed: lambda value: ((value) * 0.01),
+        
+        JerkUnits.DecimeterPerSecondCubed: lambda value: ((value) * 0.1),
+        
+        JerkUnits.KilometerPerSecondCubed: lambda value: ((value) * 1000.0),
+        
+        JerkUnits.MillistandardGravitiesPerSecond: lambda value: ((value * 9.80665) * 0.001),
+        
+    }
+
+    def __init__(self, values, from_unit: JerkUnits = JerkUnits.MeterPerSecondCubed):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: JerkUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: JerkUnits = JerkUnits.MeterPerSecondCubed) -> JerkArray:
+        """
+        Create a new instance of JerkArray from values in the given unit.
+
+        :param values: The Jerk values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: JerkUnits
+        :return: A new instance of JerkArray.
+        :rtype: JerkArray
+        """
+        return JerkArray(values, unit)
+
+    
+    @property
+    def meters_per_second_cubed(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[JerkUnits.MeterPerSecondCubed](self._values)
+
+    
+    @property
+    def inches_per_second_cubed(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[JerkUnits.InchPerSecondCubed](self._values)
+
+    
+    @property
+    def feet_per_second_cubed(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[JerkUnits.FootPerSecondCubed](self._values)
+
+    
+    @property
+    def standard_gravities_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[JerkUnits.StandardGravitiesPerSecond](self._values)
+
+    
+    @property
+    def nanometers_per_second_cubed(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[JerkUnits.NanometerPerSecondCubed](self._values)
+
+    
+    @property
+    def micrometers_per_second_cubed(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[JerkUnits.MicrometerPerSecondCubed](self._values)
+
+    
+    @property
+    def millimeters_per_second_cubed(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[JerkUnits.MillimeterPerSecondCubed](self._values)
+
+    
+    @property
+    def centimeters_per_second_cubed(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[JerkUnits.CentimeterPerSecondCubed](self._values)
+
+    
+    @property
+    def decimeters_per_second_cubed(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[JerkUnits.DecimeterPerSecondCubed](self._values)
+
+    
+    @property
+    def kilometers_per_second_cubed(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[JerkUnits.KilometerPerSecondCubed](self._values)
+
+    
+    @property
+    def millistandard_gravities_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[JerkUnits.MillistandardGravitiesPerSecond](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.kinematic_viscosity import KinematicViscosity, KinematicViscosityUnits
+
+
+class KinematicViscosityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of KinematicViscosity values, held in SquareMeterPerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (KinematicViscosityUnits): The KinematicViscosity unit of the values, The default unit is SquareMeterPerSecond
+    """
+    __slots__ = ()
+
+    _quantity = KinematicViscosity
+
+    # Whole-array variants of the KinematicViscosity conversion functions.
+    _conversions_from_base = {
+        
+        KinematicViscosityUnits.SquareMeterPerSecond: lambda value: (value),
+        
+        KinematicViscosityUnits.Stokes: lambda value: (value * 1e4),
+        
+        KinematicViscosityUnits.SquareFootPerSecond: lambda value: (value * 10.7639),
+        
+        KinematicViscosityUnits.Nanostokes: lambda value: ((value * 1e4) / 1e-09),
+        
+        KinematicViscosityUnits.Microstokes: lambda value: ((value * 1e4) / 1e-06),
+        
+        KinematicViscosityUnits.Millistokes: lambda value: ((value * 1e4) / 0.001),
+        
+        KinematicViscosityUnits.Centistokes: lambda value: ((value * 1e4) / 0.01),
+        
+        KinematicViscosityUnits.Decistokes: lambda value: ((value * 1e4) / 0.1),
+        
+        KinematicViscosityUnits.Kilostokes: lambda value: ((value * 1e4) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        KinematicViscosityUnits.SquareMeterPerSecond: lambda value: (value),
+        
+        KinematicViscosityUnits.Stokes: lambda value: (value / 1e4),
+        
+        KinematicViscosityUnits.SquareFootPerSecond: lambda value: (value / 10.7639),
+        
+        KinematicViscosityUnits.Nanostokes: lambda value: ((value / 1e4) * 1e-09),
+        
+        KinematicViscosityUnits.Microstokes: lambda value: ((value / 1e4) * 1e-06),
+        
+        KinematicViscosityUnits.Millistokes: lambda value: ((value / 1e4) * 0.001),
+        
+        KinematicViscosityUnits.Centistokes: lambda value: ((value / 1e4) * 0.01),
+        
+        KinematicViscosityUnits.Decistokes: lambda value: ((value / 1e4) * 0.1),
+        
+        KinematicViscosityUnits.Kilostokes: lambda value: ((value / 1e4) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: KinematicViscosityUnits = KinematicViscosityUnits.SquareMeterPerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: KinematicViscosityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: KinematicViscosityUnits = KinematicViscosityUnits.SquareMeterPerSecond) -> KinematicViscosityArray:
+        """
+        Create a new instance of KinematicViscosityArray from values in the given unit.
+
+        :param values: The KinematicViscosity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: KinematicViscosityUnits
+        :return: A new instance of KinematicViscosityArray.
+        :rtype: KinematicViscosityArray
+        """
+        return KinematicViscosityArray(values, unit)
+
+    
+    @property
+    def square_meters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[KinematicViscosityUnits.SquareMeterPerSecond](self._values)
+
+    
+    @property
+    def stokes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[KinematicViscosityUnits.Stokes](self._values)
+
+    
+    @property
+    def square_feet_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[KinematicViscosityUnits.SquareFootPerSecond](self._values)
+
+    
+    @property
+    def nanostokes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[KinematicViscosityUnits.Nanostokes](self._values)
+
+    
+    @property
+    def microstokes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[KinematicViscosityUnits.Microstokes](self._values)
+
+    
+    @property
+    def millistokes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[KinematicViscosityUnits.Millistokes](self._values)
+
+    
+    @property
+    def centistokes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[KinematicViscosityUnits.Centistokes](self._values)
+
+    
+    @property
+    def decistokes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[KinematicViscosityUnits.Decistokes](self._values)
+
+    
+    @property
+    def kilostokes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[KinematicViscosityUnits.Kilostokes](self._values)
+
+    
\ No newline at end of file
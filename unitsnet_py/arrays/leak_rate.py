@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.leak_rate import LeakRate, LeakRateUnits
+
+
+class LeakRateArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of LeakRate values, held in PascalCubicMeterPerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (LeakRateUnits): The LeakRate unit of the values, The default unit is PascalCubicMeterPerSecond
+    """
+    __slots__ = ()
+
+    _quantity = LeakRate
+
+    # Whole-array variants of the LeakRate conversion functions.
+    _conversions_from_base = {
+        
+        LeakRateUnits.PascalCubicMeterPerSecond: lambda value: (value),
+        
+        LeakRateUnits.MillibarLiterPerSecond: lambda value: (value * 10),
+        
+        LeakRateUnits.TorrLiterPerSecond: lambda value: (value * 7.5),
+        
+    }
+
+    _conversions_to_base = {
+        
+        LeakRateUnits.PascalCubicMeterPerSecond: lambda value: (value),
+        
+        LeakRateUnits.MillibarLiterPerSecond: lambda value: (value / 10),
+        
+        LeakRateUnits.TorrLiterPerSecond: lambda value: (value / 7.5),
+        
+    }
+
+    def __init__(self, values, from_unit: LeakRateUnits = LeakRateUnits.PascalCubicMeterPerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: LeakRateUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: LeakRateUnits = LeakRateUnits.PascalCubicMeterPerSecond) -> LeakRateArray:
+        """
+        Create a new instance of LeakRateArray from values in the given unit.
+
+        :param values: The LeakRate values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: LeakRateUnits
+        :return: A new instance of LeakRateArray.
+        :rtype: LeakRateArray
+        """
+        return LeakRateArray(values, unit)
+
+    
+    @property
+    def pascal_cubic_meters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LeakRateUnits.PascalCubicMeterPerSecond](self._values)
+
+    
+    @property
+    def millibar_liters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LeakRateUnits.MillibarLiterPerSecond](self._values)
+
+    
+    @property
+    def torr_liters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LeakRateUnits.TorrLiterPerSecond](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,530 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.length import Length, LengthUnits
+
+
+class LengthArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Length values, held in Meter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (LengthUnits): The Length unit of the values, The default unit is Meter
+    """
+    __slots__ = ()
+
+    _quantity = Length
+
+    # Whole-array variants of the Length conversion functions.
+    _conversions_from_base = {
+        
+        LengthUnits.Meter: lambda value: (value),
+        
+        LengthUnits.Mile: lambda value: (value / 1609.344),
+        
+        LengthUnits.Yard: lambda value: (value / 0.9144),
+        
+        LengthUnits.Foot: lambda value: (value / 0.3048),
+        
+        LengthUnits.UsSurveyFoot: lambda value: (value * 3937 / 1200),
+        
+        LengthUnits.Inch: lambda value: (value / 2.54e-2),
+        
+        LengthUnits.Mil: lambda value: (value / 2.54e-5),
+        
+        LengthUnits.NauticalMile: lambda value: (value / 1852),
+        
+        LengthUnits.Fathom: lambda value: (value / 1.8288),
+        
+        LengthUnits.Shackle: lambda value: (value / 27.432),
+        
+        LengthUnits.Microinch: lambda value: (value / 2.54e-8),
+        
+        LengthUnits.PrinterPoint: lambda value: ((value / 2.54e-2) * 72.27),
+        
+        LengthUnits.DtpPoint: lambda value: ((value / 2.54e-2) * 72),
+        
+        LengthUnits.PrinterPica: lambda value: (value * 237.106301584),
+        
+        LengthUnits.DtpPica: lambda value: (value * 236.220472441),
+        
+        LengthUnits.Twip: lambda value: (value * 56692.913385826),
+        
+        LengthUnits.Hand: lambda value: (value / 1.016e-1),
+        
+        LengthUnits.AstronomicalUnit: lambda value: (value / 1.4959787070e11),
+        
+        LengthUnits.Parsec: lambda value: (value / 3.08567758128e16),
+        
+        LengthUnits.LightYear: lambda value: (value / 9.46073047258e15),
+        
+        LengthUnits.SolarRadius: lambda value: (value / 6.95510000e+08),
+        
+        LengthUnits.Chain: lambda value: (value / 20.1168),
+        
+        LengthUnits.Angstrom: lambda value: (value / 1e-10),
+        
+        LengthUnits.DataMile: lambda value: (value / 1828.8),
+        
+        LengthUnits.Femtometer: lambda value: ((value) / 1e-15),
+        
+        LengthUnits.Picometer: lambda value: ((value) / 1e-12),
+        
+        LengthUnits.Nanometer: lambda value: ((value) / 1e-09),
+        
+        LengthUnits.Micrometer: lambda value: ((value) / 1e-06),
+        
+        LengthUnits.Millimeter: lambda value: ((value) / 0.001),
+        
+        LengthUnits.Centimeter: lambda value: ((value) / 0.01),
+        
+        LengthUnits.Decimeter: lambda value: ((value) / 0.1),
+        
+        LengthUnits.Decameter: lambda value: ((value) / 10.0),
+        
+        LengthUnits.Hectometer: lambda value: ((value) / 100.0),
+        
+        LengthUnits.Kilometer: lambda value: ((value) / 1000.0),
+        
+        LengthUnits.Megameter: lambda value: ((value) / 1000000.0),
+        
+        LengthUnits.Kilofoot: lambda value: ((value / 0.3048) / 1000.0),
+        
+        LengthUnits.Kiloparsec: lambda value: ((value / 3.08567758128e16) / 1000.0),
+        
+        LengthUnits.Megaparsec: lambda value: ((value / 3.08567758128e16) / 1000000.0),
+        
+        LengthUnits.KilolightYear: lambda value: ((value / 9.46073047258e15) / 1000.0),
+        
+        LengthUnits.MegalightYear: lambda value: ((value / 9.46073047258e15) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        LengthUnits.Meter: lambda value: (value),
+        
+        LengthUnits.Mile: lambda value: (value * 1609.344),
+        
+        LengthUnits.Yard: lambda value: (value * 0.9144),
+        
+        LengthUnits.Foot: lambda value: (value * 0.3048),
+        
+        LengthUnits.UsSurveyFoot: lambda value: (value * 1200 / 3937),
+        
+        LengthUnits.Inch: lambda value: (value * 2.54e-2),
+        
+        LengthUnits.Mil: lambda value: (value * 2.54e-5),
+        
+        LengthUnits.NauticalMile: lambda value: (value * 1852),
+        
+        LengthUnits.Fathom: lambda value: (value * 1.8288),
+        
+        LengthUnits.Shackle: lambda value: (value * 27.432),
+        
+        LengthUnits.Microinch: lambda value: (value * 2.54e-8),
+        
+        LengthUnits.PrinterPoint: lambda value: ((value / 72.27) * 2.54e-2),
+        
+        LengthUnits.DtpPoint: lambda value: ((value / 72) * 2.54e-2),
+        
+        LengthUnits.PrinterPica: lambda value: (value / 237.106301584),
+        
+        LengthUnits.DtpPica: lambda value: (value / 236.220472441),
+        
+        LengthUnits.Twip: lambda value: (value / 56692.913385826),
+        
+        LengthUnits.Hand: lambda value: (value * 1.016e-1),
+        
+        LengthUnits.AstronomicalUnit: lambda value: (value * 1.4959787070e11),
+        
+        LengthUnits.Parsec: lambda value: (value * 3.08567758128e16),
+        
+        LengthUnits.LightYear: lambda value: (value * 9.46073047258e15),
+        
+        LengthUnits.SolarRadius: lambda value: (value * 6.95510000e+08),
+        
+        LengthUnits.Chain: lambda value: (value * 20.1168),
+        
+        LengthUnits.Angstrom: lambda value: (value * 1e-10),
+        
+        LengthUnits.DataMile: lambda value: (value * 1828.8),
+        
+        LengthUnits.Femtometer: lambda value: ((value) * 1e-15),
+        
+        LengthUnits.Picometer: lambda value: ((value) * 1e-12),
+        
+        LengthUnits.Nanometer: lambda value: ((value) * 1e-09),
+        
+        LengthUnits.Micrometer: lambda value: ((value) * 1e-06),
+        
+        LengthUnits.Millimeter: lambda value: ((value) * 0.001),
+        
+        LengthUnits.Centimeter: lambda value: ((value) * 0.01),
+        
+        LengthUnits.Decimeter: lambda value: ((value) * 0.1),
+        
+        LengthUnits.Decameter: lambda value: ((value) * 10.0),
+        
+        LengthUnits.Hectometer: lambda value: ((value) * 100.0),
+        
+        LengthUnits.Kilometer: lambda value: ((value) * 1000.0),
+        
+        LengthUnits.Megameter: lambda value: ((value) * 1000000.0),
+        
+        LengthUnits.Kilofoot: lambda value: ((value * 0.3048) * 1000.0),
+        
+        LengthUnits.Kiloparsec: lambda value: ((value * 3.08567758128e16) * 1000.0),
+        
+        LengthUnits.Megaparsec: lambda value: ((value * 3.08567758128e16) * 1000000.0),
+        
+        LengthUnits.KilolightYear: lambda value: ((value * 9.46073047258e15) * 1000.0),
+        
+        LengthUnits.MegalightYear: lambda value: ((value * 9.46073047258e15) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: LengthUnits = LengthUnits.Meter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: LengthUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: LengthUnits = LengthUnits.Meter) -> LengthArray:
+        """
+        Create a new instance of LengthArray from values in the given unit.
+
+        :param values: The Length values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: LengthUnits
+        :return: A new instance of LengthArray.
+        :rtype: LengthArray
+        """
+        return LengthArray(values, unit)
+
+    
+    @property
+    def meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Meter](self._values)
+
+    
+    @property
+    def miles(self) -> np.ndarray:
+        """
+        The statute mile was standardised between the British Commonwealth and the United States by an international agreement in 1959, when it was formally redefined with respect to SI units as exactly 1,609.344 metres.
+        """
+        return self._conversions_from_base[LengthUnits.Mile](self._values)
+
+    
+    @property
+    def yards(self) -> np.ndarray:
+        """
+        The yard (symbol: yd) is an English unit of length in both the British imperial and US customary systems of measurement equalling 3 feet (or 36 inches). Since 1959 the yard has been by international agreement standardized as exactly 0.9144 meter. A distance of 1,760 yards is equal to 1 mile.
+        """
+        return self._conversions_from_base[LengthUnits.Yard](self._values)
+
+    
+    @property
+    def feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Foot](self._values)
+
+    
+    @property
+    def us_survey_feet(self) -> np.ndarray:
+        """
+        In the United States, the foot was defined as 12 inches, with the inch being defined by the Mendenhall Order of 1893 as 39.37 inches = 1 m. This makes a U.S. survey foot exactly 1200/3937 meters.
+        """
+        return self._conversions_from_base[LengthUnits.UsSurveyFoot](self._values)
+
+    
+    @property
+    def inches(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Inch](self._values)
+
+    
+    @property
+    def mils(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Mil](self._values)
+
+    
+    @property
+    def nautical_miles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.NauticalMile](self._values)
+
+    
+    @property
+    def fathoms(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Fathom](self._values)
+
+    
+    @property
+    def shackles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Shackle](self._values)
+
+    
+    @property
+    def microinches(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Microinch](self._values)
+
+    
+    @property
+    def printer_points(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.PrinterPoint](self._values)
+
+    
+    @property
+    def dtp_points(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.DtpPoint](self._values)
+
+    
+    @property
+    def printer_picas(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.PrinterPica](self._values)
+
+    
+    @property
+    def dtp_picas(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.DtpPica](self._values)
+
+    
+    @property
+    def twips(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Twip](self._values)
+
+    
+    @property
+    def hands(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Hand](self._values)
+
+    
+    @property
+    def astronomical_units(self) -> np.ndarray:
+        """
+        One Astronomical Unit is the distance from the solar system Star, the sun, to planet Earth.
+        """
+        return self._conversions_from_base[LengthUnits.AstronomicalUnit](self._values)
+
+    
+    @property
+    def parsecs(self) -> np.ndarray:
+        """
+        A parsec is defined as the distance at which one astronomical unit (AU) subtends an angle of one arcsecond.
+        """
+        return self._conversions_from_base[LengthUnits.Parsec](self._values)
+
+    
+    @property
+    def light_years(self) -> np.ndarray:
+        """
+        A Light Year (ly) is the distance that light travel during an Earth year, ie 365 days.
+        """
+        return self._conversions_from_base[LengthUnits.LightYear](self._values)
+
+    
+    @property
+    def solar_radiuses(self) -> np.ndarray:
+        """
+        Solar radius is a ratio unit to the radius of the solar system star, the sun.
+        """
+        return self._conversions_from_base[LengthUnits.SolarRadius](self._values)
+
+    
+    @property
+    def chains(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Chain](self._values)
+
+    
+    @property
+    def angstroms(self) -> np.ndarray:
+        """
+        Angstrom is a metric unit of length equal to 1e-10 meter
+        """
+        return self._conversions_from_base[LengthUnits.Angstrom](self._values)
+
+    
+    @property
+    def data_miles(self) -> np.ndarray:
+        """
+        In radar-related subjects and in JTIDS, a data mile is a unit of distance equal to 6000 feet (1.8288 kilometres or 0.987 nautical miles).
+        """
+        return self._conversions_from_base[LengthUnits.DataMile](self._values)
+
+    
+    @property
+    def femtometers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Femtometer](self._values)
+
+    
+    @property
+    def picometers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Picometer](self._values)
+
+    
+    @property
+    def nanometers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Nanometer](self._values)
+
+    
+    @property
+    def micrometers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Micrometer](self._values)
+
+    
+    @property
+    def millimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Millimeter](self._values)
+
+    
+    @property
+    def centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Centimeter](self._values)
+
+    
+    @property
+    def decimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Decimeter](self._values)
+
+    
+    @property
+    def decameters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Decameter](self._values)
+
+    
+    @property
+    def hectometers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Hectometer](self._values)
+
+    
+    @property
+    def kilometers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Kilometer](self._values)
+
+    
+    @property
+    def megameters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Megameter](self._values)
+
+    
+    @property
+    def kilofeet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Kilofoot](self._values)
+
+    
+    @property
+    def kiloparsecs(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Kiloparsec](self._values)
+
+    
+    @property
+    def megaparsecs(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.Megaparsec](self._values)
+
+    
+    @property
+    def kilolight_years(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.KilolightYear](self._values)
+
+    
+    @property
+    def megalight_years(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LengthUnits.MegalightYear](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.level import Level, LevelUnits
+
+
+class LevelArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Level values, held in Decibel.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (LevelUnits): The Level unit of the values, The default unit is Decibel
+    """
+    __slots__ = ()
+
+    _quantity = Level
+
+    # Whole-array variants of the Level conversion functions.
+    _conversions_from_base = {
+        
+        LevelUnits.Decibel: lambda value: (value),
+        
+        LevelUnits.Neper: lambda value: (0.115129254 * value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        LevelUnits.Decibel: lambda value: (value),
+        
+        LevelUnits.Neper: lambda value: ((1 / 0.115129254) * value),
+        
+    }
+
+    def __init__(self, values, from_unit: LevelUnits = LevelUnits.Decibel):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: LevelUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: LevelUnits = LevelUnits.Decibel) -> LevelArray:
+        """
+        Create a new instance of LevelArray from values in the given unit.
+
+        :param values: The Level values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: LevelUnits
+        :return: A new instance of LevelArray.
+        :rtype: LevelArray
+        """
+        return LevelArray(values, unit)
+
+    
+    @property
+    def decibels(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LevelUnits.Decibel](self._values)
+
+    
+    @property
+    def nepers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LevelUnits.Neper](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.linear_density import LinearDensity, LinearDensityUnits
+
+
+class LinearDensityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of LinearDensity values, held in KilogramPerMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (LinearDensityUnits): The LinearDensity unit of the values, The default unit is KilogramPerMeter
+    """
+    __slots__ = ()
+
+    _quantity = LinearDensity
+
+    # Whole-array variants of the LinearDensity conversion functions.
+    _conversions_from_base = {
+        
+        LinearDensityUnits.GramPerMillimeter: lambda value: (value),
+        
+        LinearDensityUnits.GramPerCentimeter: lambda value: (value / 1e-1),
+        
+        LinearDensityUnits.GramPerMeter: lambda value: (value / 1e-3),
+        
+        LinearDensityUnits.PoundPerInch: lambda value: (value * 5.5997415e-2),
+        
+        LinearDensityUnits.PoundPerFoot: lambda value: (value / 1.48816394),
+        
+        LinearDensityUnits.MicrogramPerMillimeter: lambda value: ((value) / 1e-06),
+        
+        LinearDensityUnits.MilligramPerMillimeter: lambda value: ((value) / 0.001),
+        
+        LinearDensityUnits.KilogramPerMillimeter: lambda value: ((value) / 1000.0),
+        
+        LinearDensityUnits.MicrogramPerCentimeter: lambda value: ((value / 1e-1) / 1e-06),
+        
+        LinearDensityUnits.MilligramPerCentimeter: lambda value: ((value / 1e-1) / 0.001),
+        
+        LinearDensityUnits.KilogramPerCentimeter: lambda value: ((value / 1e-1) / 1000.0),
+        
+        LinearDensityUnits.MicrogramPerMeter: lambda value: ((value / 1e-3) / 1e-06),
+        
+        LinearDensityUnits.MilligramPerMeter: lambda value: ((value / 1e-3) / 0.001),
+        
+        LinearDensityUnits.KilogramPerMeter: lambda value: ((value / 1e-3) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        LinearDensityUnits.GramPerMillimeter: lambda value: (value),
+        
+        LinearDensityUnits.GramPerCentimeter: lambda value: (value * 1e-1),
+        
+        LinearDensityUnits.GramPerMeter: lambda value: (value * 1e-3),
+        
+        LinearDensityUnits.PoundPerInch: lambda value: (value / 5.5997415e-2),
+        
+        LinearDensityUnits.PoundPerFoot: lambda value: (value * 1.48816394),
+        
+        LinearDensityUnits.MicrogramPerMillimeter: lambda value: ((value) * 1e-06),
+        
+        LinearDensityUnits.MilligramPerMillimeter: lambda value: ((value) * 0.001),
+        
+        LinearDensityUnits.KilogramPerMillimeter: lambda value: ((value) * 1000.0),
+        
+        LinearDensityUnits.MicrogramPerCentimeter: lambda value: ((value * 1e-1) * 1e-06),
+        
+        LinearDensityUnits.MilligramPerCentimeter: lambda value: ((value * 1e-1) * 0.001),
+        
+        LinearDensityUnits.KilogramPerCentimeter: lambda value: ((value * 1e-1) * 1000.0),
+        
+        LinearDensityUnits.MicrogramPerMeter: lambda value: ((value * 1e-3) * 1e-06),
+        
+        LinearDensityUnits.MilligramPerMeter: lambda value: ((value * 1e-3) * 0.001),
+        
+        LinearDensityUnits.KilogramPerMeter: lambda value: ((value * 1e-3) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: LinearDensityUnits = LinearDensityUnits.KilogramPerMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: LinearDensityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: LinearDensityUnits = LinearDensityUnits.KilogramPerMeter) -> LinearDensityArray:
+        """
+        Create a new instance of LinearDensityArray from values in the given unit.
+
+        :param values: The LinearDensity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: LinearDensityUnits
+        :return: A new instance of LinearDensityArray.
+        :rtype: LinearDensityArray
+        """
+        return LinearDensityArray(values, unit)
+
+    
+    @property
+    def grams_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearDensityUnits.GramPerMillimeter](self._values)
+
+    
+    @property
+    def grams_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearDensityUnits.GramPerCentimeter](self._values)
+
+    
+    @property
+    def grams_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearDensityUnits.GramPerMeter](self._values)
+
+    
+    @property
+    def pounds_per_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearDensityUnits.PoundPerInch](self._values)
+
+    
+    @property
+    def pounds_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearDensityUnits.PoundPerFoot](self._values)
+
+    
+    @property
+    def micrograms_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearDensityUnits.MicrogramPerMillimeter](self._values)
+
+    
+    @property
+    def milligrams_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearDensityUnits.MilligramPerMillimeter](self._values)
+
+    
+    @property
+    def kilograms_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearDensityUnits.KilogramPerMillimeter](self._values)
+
+    
+    @property
+    def micrograms_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearDensityUnits.MicrogramPerCentimeter](self._values)
+
+    
+    @property
+    def milligrams_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearDensityUnits.MilligramPerCentimeter](self._values)
+
+    
+    @property
+    def kilograms_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearDensityUnits.KilogramPerCentimeter](self._values)
+
+    
+    @property
+    def micrograms_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearDensityUnits.MicrogramPerMeter](self._values)
+
+    
+    @property
+    def milligrams_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearDensityUnits.MilligramPerMeter](self._values)
+
+    
+    @property
+    def kilograms_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearDensityUnits.KilogramPerMeter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.linear_power_density import LinearPowerDensity, LinearPowerDensityUnits
+
+
+class LinearPowerDensityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of LinearPowerDensity values, held in WattPerMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (LinearPowerDensityUnits): The LinearPowerDensity unit of the values, The default unit is WattPerMeter
+    """
+    __slots__ = ()
+
+    _quantity = LinearPowerDensity
+
+    # Whole-array variants of the LinearPowerDensity conversion functions.
+    _conversions_from_base = {
+        
+        LinearPowerDensityUnits.WattPerMeter: lambda value: (value),
+        
+        LinearPowerDensityUnits.WattPerCentimeter: lambda value: (value / 1e2),
+        
+        LinearPowerDensityUnits.WattPerMillimeter: lambda value: (value / 1e3),
+        
+        LinearPowerDensityUnits.WattPerInch: lambda value: (value / 39.37007874),
+        
+        LinearPowerDensityUnits.WattPerFoot: lambda value: (value / 3.280839895),
+        
+        LinearPowerDensityUnits.MilliwattPerMeter: lambda value: ((value) / 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerMeter: lambda value: ((value) / 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerMeter: lambda value: ((value) / 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerMeter: lambda value: ((value) / 1000000000.0),
+        
+        LinearPowerDensityUnits.MilliwattPerCentimeter: lambda value: ((value / 1e2) / 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerCentimeter: lambda value: ((value / 1e2) / 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerCentimeter: lambda value: ((value / 1e2) / 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerCentimeter: lambda value: ((value / 1e2) / 1000000000.0),
+        
+        LinearPowerDensityUnits.MilliwattPerMillimeter: lambda value: ((value / 1e3) / 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerMillimeter: lambda value: ((value / 1e3) / 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerMillimeter: lambda value: ((value / 1e3) / 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerMillimeter: lambda value: ((value / 1e3) / 1000000000.0),
+        
+        LinearPowerDensityUnits.MilliwattPerInch: lambda value: ((value / 39.37007874) / 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerInch: lambda value: ((value / 39.37007874) / 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerInch: lambda value: ((value / 39.37007874) / 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerInch: lambda value: ((value / 39.37007874) / 1000000000.0),
+        
+        LinearPowerDensityUnits.MilliwattPerFoot: lambda value: ((value / 3.280839895) / 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerFoot: lambda value: ((value / 3.280839895) / 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerFoot: lambda value: ((value / 3.280839895) / 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerFoot: lambda value: ((value / 3.280839895) / 1000000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        LinearPowerDensityUnits.WattPerMeter: lambda value: (value),
+        
+        LinearPowerDensityUnits.WattPerCentimeter: lambda value: (value * 1e2),
+        
+        LinearPowerDensityUnits.WattPerMillimeter: lambda value: (value * 1e3),
+        
+        LinearPowerDensityUnits.WattPerInch: lambda value: (value * 39.37007874),
+        
+        LinearPowerDensityUnits.WattPerFoot: lambda value: (value * 3.280839895),
+        
+        LinearPowerDensityUnits.MilliwattPerMeter: lambda value: ((value) * 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerMeter: lambda value: ((value) * 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerMeter: lambda value: ((value) * 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerMeter: lambda value: ((value) * 1000000000.0),
+        
+        LinearPowerDensityUnits.MilliwattPerCentimeter: lambda value: ((value * 1e2) * 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerCentimeter: lambda value: ((value * 1e2) * 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerCentimeter: lambda value: ((value * 1e2) * 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerCentimeter: lambda value: ((value * 1e2) * 1000000000.0),
+        
+        LinearPowerDensityUnits.MilliwattPerMillimeter: lambda value: ((value * 1e3) * 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerMillimeter: lambda value: ((value * 1e3) * 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerMillimeter: lambda value: ((value * 1e3) * 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerMillimeter: lambda value: ((value * 1e3) * 1000000000.0),
+        
+        LinearPowerDensityUnits.MilliwattPerInch: lambda value: ((value * 39.37007874) * 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerInch: lambda value: ((value * 39.37007874) * 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerInch: lambda value: ((value * 39.37007874) * 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerInch: lambda value: ((value * 39.37007874) * 1000000000.0),
+        
+        LinearPowerDensityUnits.MilliwattPerFoot: lambda value: ((value * 3.280839895) * 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerFoot: lambda value: ((value * 3.280839895) * 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerFoot: lambda value: ((value * 3.280839895) * 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerFoot: lambda value: ((value * 3.280839895) * 1000000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: LinearPowerDensityUnits = LinearPowerDensityUnits.WattPerMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: LinearPowerDensityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: LinearPowerDensityUnits = LinearPowerDensityUnits.WattPerMeter) -> LinearPowerDensityArray:
+        """
+        Create a new instance of LinearPowerDensityArray from values in the given unit.
+
+        :param values: The LinearPowerDensity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: LinearPowerDensityUnits
+        :return: A new instance of LinearPowerDensityArray.
+        :rtype: LinearPowerDensityArray
+        """
+        return LinearPowerDensityArray(values, unit)
+
+    
+    @property
+    def watts_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.WattPerMeter](self._values)
+
+    
+    @property
+    def watts_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.WattPerCentimeter](self._values)
+
+    
+    @property
+    def watts_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.WattPerMillimeter](self._values)
+
+    
+    @property
+    def watts_per_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.WattPerInch](self._values)
+
+    
+    @property
+    def watts_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.WattPerFoot](self._values)
+
+    
+    @property
+    def milliwatts_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.MilliwattPerMeter](self._values)
+
+    
+    @property
+    def kilowatts_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.KilowattPerMeter](self._values)
+
+    
+    @property
+    def megawatts_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.MegawattPerMeter](self._values)
+
+    
+    @property
+    def gigawatts_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.GigawattPerMeter](self._values)
+
+    
+    @property
+    def milliwatts_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.MilliwattPerCentimeter](self._values)
+
+    
+    @property
+    def kilowatts_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.KilowattPerCentimeter](self._values)
+
+    
+    @property
+    def megawatts_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.MegawattPerCentimeter](self._values)
+
+    
+    @property
+    def gigawatts_per_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.GigawattPerCentimeter](self._values)
+
+    
+    @property
+    def milliwatts_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.MilliwattPerMillimeter](self._values)
+
+    
+    @property
+    def kilowatts_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.KilowattPerMillimeter](self._values)
+
+    
+    @property
+    def megawatts_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.MegawattPerMillimeter](self._values)
+
+    
+    @property
+    def gigawatts_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.GigawattPerMillimeter](self._values)
+
+    
+    @property
+    def milliwatts_per_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.MilliwattPerInch](self._values)
+
+    
+    @property
+    def kilowatts_per_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.KilowattPerInch](self._values)
+
+    
+    @property
+    def megawatts_per_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.MegawattPerInch](self._values)
+
+    
+    @property
+    def gigawatts_per_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.GigawattPerInch](self._values)
+
+    
+    @property
+    def milliwatts_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.MilliwattPerFoot](self._values)
+
+    
+    @property
+    def kilowatts_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.KilowattPerFoot](self._values)
+
+    
+    @property
+    def megawatts_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.MegawattPerFoot](self._values)
+
+    
+    @property
+    def gigawatts_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LinearPowerDensityUnits.GigawattPerFoot](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.luminance import Luminance, LuminanceUnits
+
+
+class LuminanceArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Luminance values, held in CandelaPerSquareMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (LuminanceUnits): The Luminance unit of the values, The default unit is CandelaPerSquareMeter
+    """
+    __slots__ = ()
+
+    _quantity = Luminance
+
+    # Whole-array variants of the Luminance conversion functions.
+    _conversions_from_base = {
+        
+        LuminanceUnits.CandelaPerSquareMeter: lambda value: (value),
+        
+        LuminanceUnits.CandelaPerSquareFoot: lambda value: (value/ 1.07639e1),
+        
+        LuminanceUnits.CandelaPerSquareInch: lambda value: (value/ 1.5500031e3),
+        
+        LuminanceUnits.Nit: lambda value: (value),
+        
+        LuminanceUnits.NanocandelaPerSquareMeter: lambda value: ((value) / 1e-09),
+        
+        LuminanceUnits.MicrocandelaPerSquareMeter: lambda value: ((value) / 1e-06),
+        
+        LuminanceUnits.MillicandelaPerSquareMeter: lambda value: ((value) / 0.001),
+        
+        LuminanceUnits.CenticandelaPerSquareMeter: lambda value: ((value) / 0.01),
+        
+        LuminanceUnits.DecicandelaPerSquareMeter: lambda value: ((value) / 0.1),
+        
+        LuminanceUnits.KilocandelaPerSquareMeter: lambda value: ((value) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        LuminanceUnits.CandelaPerSquareMeter: lambda value: (value),
+        
+        LuminanceUnits.CandelaPerSquareFoot: lambda value: (value* 1.07639e1),
+        
+        LuminanceUnits.CandelaPerSquareInch: lambda value: (value* 1.5500031e3),
+        
+        LuminanceUnits.Nit: lambda value: (value),
+        
+        LuminanceUnits.NanocandelaPerSquareMeter: lambda value: ((value) * 1e-09),
+        
+        LuminanceUnits.MicrocandelaPerSquareMeter: lambda value: ((value) * 1e-06),
+        
+        LuminanceUnits.MillicandelaPerSquareMeter: lambda value: ((value) * 0.001),
+        
+        LuminanceUnits.CenticandelaPerSquareMeter: lambda value: ((value) * 0.01),
+        
+        LuminanceUnits.DecicandelaPerSquareMeter: lambda value: ((value) * 0.1),
+        
+        LuminanceUnits.KilocandelaPerSquareMeter: lambda value: ((value) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: LuminanceUnits = LuminanceUnits.CandelaPerSquareMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: LuminanceUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: LuminanceUnits = LuminanceUnits.CandelaPerSquareMeter) -> LuminanceArray:
+        """
+        Create a new instance of LuminanceArray from values in the given unit.
+
+        :param values: The Luminance values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: LuminanceUnits
+        :return: A new instance of LuminanceArray.
+        :rtype: LuminanceArray
+        """
+        return LuminanceArray(values, unit)
+
+    
+    @property
+    def candelas_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminanceUnits.CandelaPerSquareMeter](self._values)
+
+    
+    @property
+    def candelas_per_square_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminanceUnits.CandelaPerSquareFoot](self._values)
+
+    
+    @property
+    def candelas_per_square_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminanceUnits.CandelaPerSquareInch](self._values)
+
+    
+    @property
+    def nits(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminanceUnits.Nit](self._values)
+
+    
+    @property
+    def nanocandelas_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminanceUnits.NanocandelaPerSquareMeter](self._values)
+
+    
+    @property
+    def microcandelas_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminanceUnits.MicrocandelaPerSquareMeter](self._values)
+
+    
+    @property
+    def millicandelas_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminanceUnits.MillicandelaPerSquareMeter](self._values)
+
+    
+    @property
+    def centicandelas_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminanceUnits.CenticandelaPerSquareMeter](self._values)
+
+    
+    @property
+    def decicandelas_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminanceUnits.DecicandelaPerSquareMeter](self._values)
+
+    
+    @property
+    def kilocandelas_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminanceUnits.KilocandelaPerSquareMeter](self._values)
+
+    
\ No newline at end of file
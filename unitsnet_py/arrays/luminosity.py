@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.luminosity import Luminosity, LuminosityUnits
+
+
+class LuminosityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Luminosity values, held in Watt.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (LuminosityUnits): The Luminosity unit of the values, The default unit is Watt
+    """
+    __slots__ = ()
+
+    _quantity = Luminosity
+
+    # Whole-array variants of the Luminosity conversion functions.
+    _conversions_from_base = {
+        
+        LuminosityUnits.Watt: lambda value: (value),
+        
+        LuminosityUnits.SolarLuminosity: lambda value: (value / 3.846e26),
+        
+        LuminosityUnits.Femtowatt: lambda value: ((value) / 1e-15),
+        
+        LuminosityUnits.Picowatt: lambda value: ((value) / 1e-12),
+        
+        LuminosityUnits.Nanowatt: lambda value: ((value) / 1e-09),
+        
+        LuminosityUnits.Microwatt: lambda value: ((value) / 1e-06),
+        
+        LuminosityUnits.Milliwatt: lambda value: ((value) / 0.001),
+        
+        LuminosityUnits.Deciwatt: lambda value: ((value) / 0.1),
+        
+        LuminosityUnits.Decawatt: lambda value: ((value) / 10.0),
+        
+        LuminosityUnits.Kilowatt: lambda value: ((value) / 1000.0),
+        
+        LuminosityUnits.Megawatt: lambda value: ((value) / 1000000.0),
+        
+        LuminosityUnits.Gigawatt: lambda value: ((value) / 1000000000.0),
+        
+        LuminosityUnits.Terawatt: lambda value: ((value) / 1000000000000.0),
+        
+        LuminosityUnits.Petawatt: lambda value: ((value) / 1000000000000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        LuminosityUnits.Watt: lambda value: (value),
+        
+        LuminosityUnits.SolarLuminosity: lambda value: (value * 3.846e26),
+        
+        LuminosityUnits.Femtowatt: lambda value: ((value) * 1e-15),
+        
+        LuminosityUnits.Picowatt: lambda value: ((value) * 1e-12),
+        
+        LuminosityUnits.Nanowatt: lambda value: ((value) * 1e-09),
+        
+        LuminosityUnits.Microwatt: lambda value: ((value) * 1e-06),
+        
+        LuminosityUnits.Milliwatt: lambda value: ((value) * 0.001),
+        
+        LuminosityUnits.Deciwatt: lambda value: ((value) * 0.1),
+        
+        LuminosityUnits.Decawatt: lambda value: ((value) * 10.0),
+        
+        LuminosityUnits.Kilowatt: lambda value: ((value) * 1000.0),
+        
+        LuminosityUnits.Megawatt: lambda value: ((value) * 1000000.0),
+        
+        LuminosityUnits.Gigawatt: lambda value: ((value) * 1000000000.0),
+        
+        LuminosityUnits.Terawatt: lambda value: ((value) * 1000000000000.0),
+        
+        LuminosityUnits.Petawatt: lambda value: ((value) * 1000000000000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: LuminosityUnits = LuminosityUnits.Watt):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: LuminosityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: LuminosityUnits = LuminosityUnits.Watt) -> LuminosityArray:
+        """
+        Create a new instance of LuminosityArray from values in the given unit.
+
+        :param values: The Luminosity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: LuminosityUnits
+        :return: A new instance of LuminosityArray.
+        :rtype: LuminosityArray
+        """
+        return LuminosityArray(values, unit)
+
+    
+    @property
+    def watts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminosityUnits.Watt](self._values)
+
+    
+    @property
+    def solar_luminosities(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminosityUnits.SolarLuminosity](self._values)
+
+    
+    @property
+    def femtowatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminosityUnits.Femtowatt](self._values)
+
+    
+    @property
+    def picowatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminosityUnits.Picowatt](self._values)
+
+    
+    @property
+    def nanowatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminosityUnits.Nanowatt](self._values)
+
+    
+    @property
+    def microwatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminosityUnits.Microwatt](self._values)
+
+    
+    @property
+    def milliwatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminosityUnits.Milliwatt](self._values)
+
+    
+    @property
+    def deciwatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminosityUnits.Deciwatt](self._values)
+
+    
+    @property
+    def decawatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminosityUnits.Decawatt](self._values)
+
+    
+    @property
+    def kilowatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminosityUnits.Kilowatt](self._values)
+
+    
+    @property
+    def megawatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminosityUnits.Megawatt](self._values)
+
+    
+    @property
+    def gigawatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminosityUnits.Gigawatt](self._values)
+
+    
+    @property
+    def terawatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminosityUnits.Terawatt](self._values)
+
+    
+    @property
+    def petawatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminosityUnits.Petawatt](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.luminous_flux import LuminousFlux, LuminousFluxUnits
+
+
+class LuminousFluxArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of LuminousFlux values, held in Lumen.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (LuminousFluxUnits): The LuminousFlux unit of the values, The default unit is Lumen
+    """
+    __slots__ = ()
+
+    _quantity = LuminousFlux
+
+    # Whole-array variants of the LuminousFlux conversion functions.
+    _conversions_from_base = {
+        
+        LuminousFluxUnits.Lumen: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        LuminousFluxUnits.Lumen: lambda value: (value),
+        
+    }
+
+    def __init__(self, values, from_unit: LuminousFluxUnits = LuminousFluxUnits.Lumen):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: LuminousFluxUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: LuminousFluxUnits = LuminousFluxUnits.Lumen) -> LuminousFluxArray:
+        """
+        Create a new instance of LuminousFluxArray from values in the given unit.
+
+        :param values: The LuminousFlux values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: LuminousFluxUnits
+        :return: A new instance of LuminousFluxArray.
+        :rtype: LuminousFluxArray
+        """
+        return LuminousFluxArray(values, unit)
+
+    
+    @property
+    def lumens(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminousFluxUnits.Lumen](self._values)
+
+    
\ No newline at end of file
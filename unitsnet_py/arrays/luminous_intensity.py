@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.luminous_intensity import LuminousIntensity, LuminousIntensityUnits
+
+
+class LuminousIntensityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of LuminousIntensity values, held in Candela.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (LuminousIntensityUnits): The LuminousIntensity unit of the values, The default unit is Candela
+    """
+    __slots__ = ()
+
+    _quantity = LuminousIntensity
+
+    # Whole-array variants of the LuminousIntensity conversion functions.
+    _conversions_from_base = {
+        
+        LuminousIntensityUnits.Candela: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        LuminousIntensityUnits.Candela: lambda value: (value),
+        
+    }
+
+    def __init__(self, values, from_unit: LuminousIntensityUnits = LuminousIntensityUnits.Candela):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: LuminousIntensityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: LuminousIntensityUnits = LuminousIntensityUnits.Candela) -> LuminousIntensityArray:
+        """
+        Create a new instance of LuminousIntensityArray from values in the given unit.
+
+        :param values: The LuminousIntensity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: LuminousIntensityUnits
+        :return: A new instance of LuminousIntensityArray.
+        :rtype: LuminousIntensityArray
+        """
+        return LuminousIntensityArray(values, unit)
+
+    
+    @property
+    def candela(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[LuminousIntensityUnits.Candela](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.magnetic_field import MagneticField, MagneticFieldUnits
+
+
+class MagneticFieldArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of MagneticField values, held in Tesla.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (MagneticFieldUnits): The MagneticField unit of the values, The default unit is Tesla
+    """
+    __slots__ = ()
+
+    _quantity = MagneticField
+
+    # Whole-array variants of the MagneticField conversion functions.
+    _conversions_from_base = {
+        
+        MagneticFieldUnits.Tesla: lambda value: (value),
+        
+        MagneticFieldUnits.Gauss: lambda value: (value * 1e4),
+        
+        MagneticFieldUnits.Nanotesla: lambda value: ((value) / 1e-09),
+        
+        MagneticFieldUnits.Microtesla: lambda value: ((value) / 1e-06),
+        
+        MagneticFieldUnits.Millitesla: lambda value: ((value) / 0.001),
+        
+        MagneticFieldUnits.Milligauss: lambda value: ((value * 1e4) / 0.001),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MagneticFieldUnits.Tesla: lambda value: (value),
+        
+        MagneticFieldUnits.Gauss: lambda value: (value / 1e4),
+        
+        MagneticFieldUnits.Nanotesla: lambda value: ((value) * 1e-09),
+        
+        MagneticFieldUnits.Microtesla: lambda value: ((value) * 1e-06),
+        
+        MagneticFieldUnits.Millitesla: lambda value: ((value) * 0.001),
+        
+        MagneticFieldUnits.Milligauss: lambda value: ((value / 1e4) * 0.001),
+        
+    }
+
+    def __init__(self, values, from_unit: MagneticFieldUnits = MagneticFieldUnits.Tesla):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: MagneticFieldUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: MagneticFieldUnits = MagneticFieldUnits.Tesla) -> MagneticFieldArray:
+        """
+        Create a new instance of MagneticFieldArray from values in the given unit.
+
+        :param values: The MagneticField values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: MagneticFieldUnits
+        :return: A new instance of MagneticFieldArray.
+        :rtype: MagneticFieldArray
+        """
+        return MagneticFieldArray(values, unit)
+
+    
+    @property
+    def teslas(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MagneticFieldUnits.Tesla](self._values)
+
+    
+    @property
+    def gausses(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MagneticFieldUnits.Gauss](self._values)
+
+    
+    @property
+    def nanoteslas(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MagneticFieldUnits.Nanotesla](self._values)
+
+    
+    @property
+    def microteslas(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MagneticFieldUnits.Microtesla](self._values)
+
+    
+    @property
+    def milliteslas(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MagneticFieldUnits.Millitesla](self._values)
+
+    
+    @property
+    def milligausses(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MagneticFieldUnits.Milligauss](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.magnetic_flux import MagneticFlux, MagneticFluxUnits
+
+
+class MagneticFluxArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of MagneticFlux values, held in Weber.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (MagneticFluxUnits): The MagneticFlux unit of the values, The default unit is Weber
+    """
+    __slots__ = ()
+
+    _quantity = MagneticFlux
+
+    # Whole-array variants of the MagneticFlux conversion functions.
+    _conversions_from_base = {
+        
+        MagneticFluxUnits.Weber: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MagneticFluxUnits.Weber: lambda value: (value),
+        
+    }
+
+    def __init__(self, values, from_unit: MagneticFluxUnits = MagneticFluxUnits.Weber):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: MagneticFluxUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: MagneticFluxUnits = MagneticFluxUnits.Weber) -> MagneticFluxArray:
+        """
+        Create a new instance of MagneticFluxArray from values in the given unit.
+
+        :param values: The MagneticFlux values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: MagneticFluxUnits
+        :return: A new instance of MagneticFluxArray.
+        :rtype: MagneticFluxArray
+        """
+        return MagneticFluxArray(values, unit)
+
+    
+    @property
+    def webers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MagneticFluxUnits.Weber](self._values)
+
+    
\ No newline at end of file
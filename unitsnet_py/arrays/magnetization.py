@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.magnetization import Magnetization, MagnetizationUnits
+
+
+class MagnetizationArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Magnetization values, held in AmperePerMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (MagnetizationUnits): The Magnetization unit of the values, The default unit is AmperePerMeter
+    """
+    __slots__ = ()
+
+    _quantity = Magnetization
+
+    # Whole-array variants of the Magnetization conversion functions.
+    _conversions_from_base = {
+        
+        MagnetizationUnits.AmperePerMeter: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MagnetizationUnits.AmperePerMeter: lambda value: (value),
+        
+    }
+
+    def __init__(self, values, from_unit: MagnetizationUnits = MagnetizationUnits.AmperePerMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: MagnetizationUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: MagnetizationUnits = MagnetizationUnits.AmperePerMeter) -> MagnetizationArray:
+        """
+        Create a new instance of MagnetizationArray from values in the given unit.
+
+        :param values: The Magnetization values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: MagnetizationUnits
+        :return: A new instance of MagnetizationArray.
+        :rtype: MagnetizationArray
+        """
+        return MagnetizationArray(values, unit)
+
+    
+    @property
+    def amperes_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MagnetizationUnits.AmperePerMeter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.mass import Mass, MassUnits
+
+
+class MassArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Mass values, held in Kilogram.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (MassUnits): The Mass unit of the values, The default unit is Kilogram
+    """
+    __slots__ = ()
+
+    _quantity = Mass
+
+    # Whole-array variants of the Mass conversion functions.
+    _conversions_from_base = {
+        
+        MassUnits.Gram: lambda value: (value * 1e3),
+        
+        MassUnits.Tonne: lambda value: (value / 1e3),
+        
+        MassUnits.ShortTon: lambda value: (value / 9.0718474e2),
+        
+        MassUnits.LongTon: lambda value: (value / 1.0160469088e3),
+        
+        MassUnits.Pound: lambda value: (value / 0.45359237),
+        
+        MassUnits.Ounce: lambda value: (value / 0.028349523125),
+        
+        MassUnits.Slug: lambda value: (value * 6.852176556196105e-2),
+        
+        MassUnits.Stone: lambda value: (value * 0.1574731728702698),
+        
+        MassUnits.ShortHundredweight: lambda value: (value * 0.022046226218487758),
+        
+        MassUnits.LongHundredweight: lambda value: (value * 0.01968413055222121),
+        
+        MassUnits.Grain: lambda value: (value * 15432.358352941431),
+        
+        MassUnits.SolarMass: lambda value: (value / 1.98947e30),
+        
+        MassUnits.EarthMass: lambda value: (value / 5.9722e+24),
+        
+        MassUnits.Femtogram: lambda value: ((value * 1e3) / 1e-15),
+        
+        MassUnits.Picogram: lambda value: ((value * 1e3) / 1e-12),
+        
+        MassUnits.Nanogram: lambda value: ((value * 1e3) / 1e-09),
+        
+        MassUnits.Microgram: lambda value: ((value * 1e3) / 1e-06),
+        
+        MassUnits.Milligram: lambda value: ((value * 1e3) / 0.001),
+        
+        MassUnits.Centigram: lambda value: ((value * 1e3) / 0.01),
+        
+        MassUnits.Decigram: lambda value: ((value * 1e3) / 0.1),
+        
+        MassUnits.Decagram: lambda value: ((value * 1e3) / 10.0),
+        
+        MassUnits.Hectogram: lambda value: ((value * 1e3) / 100.0),
+        
+        MassUnits.Kilogram: lambda value: ((value * 1e3) / 1000.0),
+        
+        MassUnits.Kilotonne: lambda value: ((value / 1e3) / 1000.0),
+        
+        MassUnits.Megatonne: lambda value: ((value / 1e3) / 1000000.0),
+        
+        MassUnits.Kilopound: lambda value: ((value / 0.45359237) / 1000.0),
+        
+        MassUnits.Megapound: lambda value: ((value / 0.45359237) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MassUnits.Gram: lambda value: (value / 1e3),
+        
+        MassUnits.Tonne: lambda value: (value * 1e3),
+        
+        MassUnits.ShortTon: lambda value: (value * 9.0718474e2),
+        
+        MassUnits.LongTon: lambda value: (value * 1.0160469088e3),
+        
+        MassUnits.Pound: lambda value: (value * 0.45359237),
+        
+        MassUnits.Ounce: lambda value: (value * 0.028349523125),
+        
+        MassUnits.Slug: lambda value: (value / 6.852176556196105e-2),
+        
+        MassUnits.Stone: lambda value: (value / 0.1574731728702698),
+        
+        MassUnits.ShortHundredweight: lambda value: (value / 0.022046226218487758),
+        
+        MassUnits.LongHundredweight: lambda value: (value / 0.01968413055222121),
+        
+        MassUnits.Grain: lambda value: (value / 15432.358352941431),
+        
+        MassUnits.SolarMass: lambda value: (value * 1.98947e30),
+        
+        MassUnits.EarthMass: lambda value: (value * 5.9722e+24),
+        
+        MassUnits.Femtogram: lambda value: ((value / 1e3) * 1e-15),
+        
+        MassUnits.Picogram: lambda value: ((value / 1e3) * 1e-12),
+        
+        MassUnits.Nanogram: lambda value: ((value / 1e3) * 1e-09),
+        
+        MassUnits.Microgram: lambda value: ((value / 1e3) * 1e-06),
+        
+        MassUnits.Milligram: lambda value: ((value / 1e3) * 0.001),
+        
+        MassUnits.Centigram: lambda value: ((value / 1e3) * 0.01),
+        
+        MassUnits.Decigram: lambda value: ((value / 1e3) * 0.1),
+        
+        MassUnits.Decagram: lambda value: ((value / 1e3) * 10.0),
+        
+        MassUnits.Hectogram: lambda value: ((value / 1e3) * 100.0),
+        
+        MassUnits.Kilogram: lambda value: ((value / 1e3) * 1000.0),
+        
+        MassUnits.Kilotonne: lambda value: ((value * 1e3) * 1000.0),
+        
+        MassUnits.Megatonne: lambda value: ((value * 1e3) * 1000000.0),
+        
+        MassUnits.Kilopound: lambda value: ((value * 0.45359237) * 1000.0),
+        
+        MassUnits.Megapound: lambda value: ((value * 0.45359237) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: MassUnits = MassUnits.Kilogram):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: MassUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: MassUnits = MassUnits.Kilogram) -> MassArray:
+        """
+        Create a new instance of MassArray from values in the given unit.
+
+        :param values: The Mass values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: MassUnits
+        :return: A new instance of MassArray.
+        :rtype: MassArray
+        """
+        return MassArray(values, unit)
+
+    
+    @property
+    def grams(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Gram](self._values)
+
+    
+    @property
+    def tonnes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Tonne](self._values)
+
+    
+    @property
+    def short_tons(self) -> np.ndarray:
+        """
+        The short ton is a unit of mass equal to 2,000 pounds (907.18474 kg), that is most commonly used in the United States – known there simply as the ton.
+        """
+        return self._conversions_from_base[MassUnits.ShortTon](self._values)
+
+    
+    @property
+    def long_tons(self) -> np.ndarray:
+        """
+        Long ton (weight ton or Imperial ton) is a unit of mass equal to 2,240 pounds (1,016 kg) and is the name for the unit called the "ton" in the avoirdupois or Imperial system of measurements that was used in the United Kingdom and several other Commonwealth countries before metrication.
+        """
+        return self._conversions_from_base[MassUnits.LongTon](self._values)
+
+    
+    @property
+    def pounds(self) -> np.ndarray:
+        """
+        The pound or pound-mass (abbreviations: lb, lbm) is a unit of mass used in the imperial, United States customary and other systems of measurement. A number of different definitions have been used, the most common today being the international avoirdupois pound which is legally defined as exactly 0.45359237 kilograms, and which is divided into 16 avoirdupois ounces.
+        """
+        return self._conversions_from_base[MassUnits.Pound](self._values)
+
+    
+    @property
+    def ounces(self) -> np.ndarray:
+        """
+        The international avoirdupois ounce (abbreviated oz) is defined as exactly 28.349523125 g under the international yard and pound agreement of 1959, signed by the United States and countries of the Commonwealth of Nations. 16 oz make up an avoirdupois pound.
+        """
+        return self._conversions_from_base[MassUnits.Ounce](self._values)
+
+    
+    @property
+    def slugs(self) -> np.ndarray:
+        """
+        The slug (abbreviation slug) is a unit of mass that is accelerated by 1 ft/s² when a force of one pound (lbf) is exerted on it.
+        """
+        return self._conversions_from_base[MassUnits.Slug](self._values)
+
+    
+    @property
+    def stone(self) -> np.ndarray:
+        """
+        The stone (abbreviation st) is a unit of mass equal to 14 pounds avoirdupois (about 6.35 kilograms) used in Great Britain and Ireland for measuring human body weight.
+        """
+        return self._conversions_from_base[MassUnits.Stone](self._values)
+
+    
+    @property
+    def short_hundredweight(self) -> np.ndarray:
+        """
+        The short hundredweight (abbreviation cwt) is a unit of mass equal to 100 pounds in US and Canada. In British English, the short hundredweight is referred to as the "cental".
+        """
+        return self._conversions_from_base[MassUnits.ShortHundredweight](self._values)
+
+    
+    @property
+    def long_hundredweight(self) -> np.ndarray:
+        """
+        The long or imperial hundredweight (abbreviation cwt) is a unit of mass equal to 112 pounds in US and Canada.
+        """
+        return self._conversions_from_base[MassUnits.LongHundredweight](self._values)
+
+    
+    @property
+    def grains(self) -> np.ndarray:
+        """
+        A grain is a unit of measurement of mass, and in the troy weight, avoirdupois, and Apothecaries' system, equal to exactly 64.79891 milligrams.
+        """
+        return self._conversions_from_base[MassUnits.Grain](self._values)
+
+    
+    @property
+    def solar_masses(self) -> np.ndarray:
+        """
+        Solar mass is a ratio unit to the mass of the solar system star, the sun.
+        """
+        return self._conversions_from_base[MassUnits.SolarMass](self._values)
+
+    
+    @property
+    def earth_masses(self) -> np.ndarray:
+        """
+        Earth mass is a ratio unit to the mass of planet Earth.
+        """
+        return self._conversions_from_base[MassUnits.EarthMass](self._values)
+
+    
+    @property
+    def femtograms(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Femtogram](self._values)
+
+    
+    @property
+    def picograms(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Picogram](self._values)
+
+    
+    @property
+    def nanograms(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Nanogram](self._values)
+
+    
+    @property
+    def micrograms(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Microgram](self._values)
+
+    
+    @property
+    def milligrams(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Milligram](self._values)
+
+    
+    @property
+    def centigrams(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Centigram](self._values)
+
+    
+    @property
+    def decigrams(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Decigram](self._values)
+
+    
+    @property
+    def decagrams(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Decagram](self._values)
+
+    
+    @property
+    def hectograms(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Hectogram](self._values)
+
+    
+    @property
+    def kilograms(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Kilogram](self._values)
+
+    
+    @property
+    def kilotonnes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Kilotonne](self._values)
+
+    
+    @property
+    def megatonnes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Megatonne](self._values)
+
+    
+    @property
+    def kilopounds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Kilopound](self._values)
+
+    
+    @property
+    def megapounds(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassUnits.Megapound](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,638 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.mass_concentration import MassConcentration, MassConcentrationUnits
+
+
+class MassConcentrationArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of MassConcentration values, held in KilogramPerCubicMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (MassConcentrationUnits): The MassConcentration unit of the values, The default unit is KilogramPerCubicMeter
+    """
+    __slots__ = ()
+
+    _quantity = MassConcentration
+
+    # Whole-array variants of the MassConcentration conversion functions.
+    _conversions_from_base = {
+        
+        MassConcentrationUnits.GramPerCubicMillimeter: lambda value: (value * 1e-6),
+        
+        MassConcentrationUnits.GramPerCubicCentimeter: lambda value: (value * 1e-3),
+        
+        MassConcentrationUnits.GramPerCubicMeter: lambda value: (value * 1e3),
+        
+        MassConcentrationUnits.GramPerMicroliter: lambda value: (value * 1e-6),
+        
+        MassConcentrationUnits.GramPerMilliliter: lambda value: (value * 1e-3),
+        
+        MassConcentrationUnits.GramPerDeciliter: lambda value: (value * 1e-1),
+        
+        MassConcentrationUnits.GramPerLiter: lambda value: (value),
+        
+        MassConcentrationUnits.TonnePerCubicMillimeter: lambda value: (value * 1e-12),
+        
+        MassConcentrationUnits.TonnePerCubicCentimeter: lambda value: (value * 1e-9),
+        
+        MassConcentrationUnits.TonnePerCubicMeter: lambda value: (value * 0.001),
+        
+        MassConcentrationUnits.PoundPerCubicInch: lambda value: (value * 3.6127298147753e-5),
+        
+        MassConcentrationUnits.PoundPerCubicFoot: lambda value: (value * 0.062427961),
+        
+        MassConcentrationUnits.SlugPerCubicFoot: lambda value: (value * 0.00194032033),
+        
+        MassConcentrationUnits.PoundPerUSGallon: lambda value: (value / 1.19826427e2),
+        
+        MassConcentrationUnits.OuncePerUSGallon: lambda value: (value * 0.1335264711843),
+        
+        MassConcentrationUnits.OuncePerImperialGallon: lambda value: (value * 0.1603586720609),
+        
+        MassConcentrationUnits.PoundPerImperialGallon: lambda value: (value / 9.9776398e1),
+        
+        MassConcentrationUnits.KilogramPerCubicMillimeter: lambda value: ((value * 1e-6) / 1000.0),
+        
+        MassConcentrationUnits.KilogramPerCubicCentimeter: lambda value: ((value * 1e-3) / 1000.0),
+        
+        MassConcentrationUnits.KilogramPerCubicMeter: lambda value: ((value * 1e3) / 1000.0),
+        
+        MassConcentrationUnits.MilligramPerCubicMeter: lambda value: ((value * 1e3) / 0.001),
+        
+        MassConcentrationUnits.MicrogramPerCubicMeter: lambda value: ((value * 1e3) / 1e-06),
+        
+        MassConcentrationUnits.PicogramPerMicroliter: lambda value: ((value * 1e-6) / 1e-12),
+        
+        MassConcentrationUnits.NanogramPerMicroliter: lambda value: ((value * 1e-6) / 1e-09),
+        
+        MassConcentrationUnits.MicrogramPerMicroliter: lambda value: ((value * 1e-6) / 1e-06),
+        
+        MassConcentrationUnits.MilligramPerMicroliter: lambda value: ((value * 1e-6) / 0.001),
+        
+        MassConcentrationUnits.CentigramPerMicroliter: lambda value: ((value * 1e-6) / 0.01),
+        
+        MassConcentrationUnits.DecigramPerMicroliter: lambda value: ((value * 1e-6) / 0.1),
+        
+        MassConcentrationUnits.PicogramPerMilliliter: lambda value: ((value * 1e-3) / 1e-12),
+        
+        MassConcentrationUnits.NanogramPerMilliliter: lambda value: ((value * 1e-3) / 1e-09),
+        
+        MassConcentrationUnits.MicrogramPerMilliliter: lambda value: ((value * 1e-3) / 1e-06),
+        
+        MassConcentrationUnits.MilligramPerMilliliter: lambda value: ((value * 1e-3) / 0.001),
+        
+        MassConcentrationUnits.CentigramPerMilliliter: lambda value: ((value * 1e-3) / 0.01),
+        
+        MassConcentrationUnits.DecigramPerMilliliter: lambda value: ((value * 1e-3) / 0.1),
+        
+        MassConcentrationUnits.PicogramPerDeciliter: lambda value: ((value * 1e-1) / 1e-12),
+        
+        MassConcentrationUnits.NanogramPerDeciliter: lambda value: ((value * 1e-1) / 1e-09),
+        
+        MassConcentrationUnits.MicrogramPerDeciliter: lambda value: ((value * 1e-1) / 1e-06),
+        
+        MassConcentrationUnits.MilligramPerDeciliter: lambda value: ((value * 1e-1) / 0.001),
+        
+        MassConcentrationUnits.CentigramPerDeciliter: lambda value: ((value * 1e-1) / 0.01),
+        
+        MassConcentrationUnits.DecigramPerDeciliter: lambda value: ((value * 1e-1) / 0.1),
+        
+        MassConcentrationUnits.PicogramPerLiter: lambda value: ((value) / 1e-12),
+        
+        MassConcentrationUnits.NanogramPerLiter: lambda value: ((value) / 1e-09),
+        
+        MassConcentrationUnits.MicrogramPerLiter: lambda value: ((value) / 1e-06),
+        
+        MassConcentrationUnits.MilligramPerLiter: lambda value: ((value) / 0.001),
+        
+        MassConcentrationUnits.CentigramPerLiter: lambda value: ((value) / 0.01),
+        
+        MassConcentrationUnits.DecigramPerLiter: lambda value: ((value) / 0.1),
+        
+        MassConcentrationUnits.KilogramPerLiter: lambda value: ((value) / 1000.0),
+        
+        MassConcentrationUnits.KilopoundPerCubicInch: lambda value: ((value * 3.6127298147753e-5) / 1000.0),
+        
+        MassConcentrationUnits.KilopoundPerCubicFoot: lambda value: ((value * 0.062427961) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MassConcentrationUnits.GramPerCubicMillimeter: lambda value: (value / 1e-6),
+        
+        MassConcentrationUnits.GramPerCubicCentimeter: lambda value: (value / 1e-3),
+        
+        MassConcentrationUnits.GramPerCubicMeter: lambda value: (value / 1e3),
+        
+        MassConcentrationUnits.GramPerMicroliter: lambda value: (value / 1e-6),
+        
+        MassConcentrationUnits.GramPerMilliliter: lambda value: (value / 1e-3),
+        
+        MassConcentrationUnits.GramPerDeciliter: lambda value: (value / 1e-1),
+        
+        MassConcentrationUnits.GramPerLiter: lambda value: (value),
+        
+        MassConcentrationUnits.TonnePerCubicMillimeter: lambda value: (value / 1e-12),
+        
+        MassConcentrationUnits.TonnePerCubicCentimeter: lambda value: (value / 1e-9),
+        
+        MassConcentrationUnits.TonnePerCubicMeter: lambda value: (value / 0.001),
+        
+        MassConcentrationUnits.PoundPerCubicInch: lambda value: (value / 3.6127298147753e-5),
+        
+        MassConcentrationUnits.PoundPerCubicFoot: lambda value: (value / 0.062427961),
+        
+        MassConcentrationUnits.SlugPerCubicFoot: lambda value: (value * 515.378818),
+        
+        MassConcentrationUnits.PoundPerUSGallon: lambda value: (value * 1.19826427e2),
+        
+        MassConcentrationUnits.OuncePerUSGallon: lambda value: ( value / 0.1335264711843),
+        
+        MassConcentrationUnits.OuncePerImperialGallon: lambda value: ( value / 0.1603586720609),
+        
+        MassConcentrationUnits.PoundPerImperialGallon: lambda value: (value * 9.9776398e1),
+        
+        MassConcentrationUnits.KilogramPerCubicMillimeter: lambda value: ((value / 1e-6) * 1000.0),
+        
+        MassConcentrationUnits.KilogramPerCubicCentimeter: lambda value: ((value / 1e-3) * 1000.0),
+        
+        MassConcentrationUnits.KilogramPerCubicMeter: lambda value: ((value / 1e3) * 1000.0),
+        
+        MassConcentrationUnits.MilligramPerCubicMeter: lambda value: ((value / 1e3) * 0.001),
+        
+        MassConcentrationUnits.MicrogramPerCubicMeter: lambda value: ((value / 1e3) * 1e-06),
+        
+        MassConcentrationUnits.PicogramPerMicroliter: lambda value: ((value / 1e-6) * 1e-12),
+        
+        MassConcentrationUnits.NanogramPerMicroliter: lambda value: ((value / 1e-6) * 1e-09),
+        
+        MassConcentrationUnits.MicrogramPerMicroliter: lambda value: ((value / 1e-6) * 1e-06),
+        
+        MassConcentrationUnits.MilligramPerMicroliter: lambda value: ((value / 1e-6) * 0.001),
+        
+        MassConcentrationUnits.CentigramPerMicroliter: lambda value: ((value / 1e-6) * 0.01),
+        
+        MassConcentrationUnits.DecigramPerMicroliter: lambda value: ((value / 1e-6) * 0.1),
+        
+        MassConcentrationUnits.PicogramPerMilliliter: lambda value: ((value / 1e-3) * 1e-12),
+        
+        MassConcentrationUnits.NanogramPerMilliliter: lambda value: ((value / 1e-3) * 1e-09),
+        
+        MassConcentrationUnits.MicrogramPerMilliliter: lambda value: ((value / 1e-3) * 1e-06),
+        
+        MassConcentrationUnits.MilligramPerMilliliter: lambda value: ((value / 1e-3) * 0.001),
+        
+        MassConcentrationUnits.CentigramPerMilliliter: lambda value: ((value / 1e-3) * 0.01),
+        
+        MassConcentrationUnits.DecigramPerMilliliter: lambda value: ((value / 1e-3) * 0.1),
+        
+        MassConcentrationUnits.PicogramPerDeciliter: lambda value: ((value / 1e-1) * 1e-12),
+        
+        MassConcentrationUnits.NanogramPerDeciliter: lambda value: ((value / 1e-1) * 1e-09),
+        
+        MassConcentrationUnits.MicrogramPerDeciliter: lambda value: ((value / 1e-1) * 1e-06),
+        
+        MassConcentrationUnits.MilligramPerDeciliter: lambda value: ((value / 1e-1) * 0.001),
+        
+        MassConcentrationUnits.CentigramPerDeciliter: lambda value: ((value / 1e-1) * 0.01),
+        
+        MassConcentrationUnits.DecigramPerDeciliter: lambda value: ((value / 1e-1) * 0.1),
+        
+        MassConcentrationUnits.PicogramPerLiter: lambda value: ((value) * 1e-12),
+        
+        MassConcentrationUnits.NanogramPerLiter: lambda value: ((value) * 1e-09),
+        
+        MassConcentrationUnits.MicrogramPerLiter: lambda value: ((value) * 1e-06),
+        
+        MassConcentrationUnits.MilligramPerLiter: lambda value: ((value) * 0.001),
+        
+        MassConcentrationUnits.CentigramPerLiter: lambda value: ((value) * 0.01),
+        
+        MassConcentrationUnits.DecigramPerLiter: lambda value: ((value) * 0.1),
+        
+        MassConcentrationUnits.KilogramPerLiter: lambda value: ((value) * 1000.0),
+        
+        MassConcentrationUnits.KilopoundPerCubicInch: lambda value: ((value / 3.6127298147753e-5) * 1000.0),
+        
+        MassConcentrationUnits.KilopoundPerCubicFoot: lambda value: ((value / 0.062427961) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: MassConcentrationUnits = MassConcentrationUnits.KilogramPerCubicMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: MassConcentrationUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: MassConcentrationUnits = MassConcentrationUnits.KilogramPerCubicMeter) -> MassConcentrationArray:
+        """
+        Create a new instance of MassConcentrationArray from values in the given unit.
+
+        :param values: The MassConcentration values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: MassConcentrationUnits
+        :return: A new instance of MassConcentrationArray.
+        :rtype: MassConcentrationArray
+        """
+        return MassConcentrationArray(values, unit)
+
+    
+    @property
+    def grams_per_cubic_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.GramPerCubicMillimeter](self._values)
+
+    
+    @property
+    def grams_per_cubic_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.GramPerCubicCentimeter](self._values)
+
+    
+    @property
+    def grams_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.GramPerCubicMeter](self._values)
+
+    
+    @property
+    def grams_per_microliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.GramPerMicroliter](self._values)
+
+    
+    @property
+    def grams_per_milliliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.GramPerMilliliter](self._values)
+
+    
+    @property
+    def grams_per_deciliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.GramPerDeciliter](self._values)
+
+    
+    @property
+    def grams_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.GramPerLiter](self._values)
+
+    
+    @property
+    def tonnes_per_cubic_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.TonnePerCubicMillimeter](self._values)
+
+    
+    @property
+    def tonnes_per_cubic_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.TonnePerCubicCentimeter](self._values)
+
+    
+    @property
+    def tonnes_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.TonnePerCubicMeter](self._values)
+
+    
+    @property
+    def pounds_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.PoundPerCubicInch](self._values)
+
+    
+    @property
+    def pounds_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.PoundPerCubicFoot](self._values)
+
+    
+    @property
+    def slugs_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.SlugPerCubicFoot](self._values)
+
+    
+    @property
+    def pounds_per_us_gallon(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.PoundPerUSGallon](self._values)
+
+    
+    @property
+    def ounces_per_us_gallon(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.OuncePerUSGallon](self._values)
+
+    
+    @property
+    def ounces_per_imperial_gallon(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.OuncePerImperialGallon](self._values)
+
+    
+    @property
+    def pounds_per_imperial_gallon(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.PoundPerImperialGallon](self._values)
+
+    
+    @property
+    def kilograms_per_cubic_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.KilogramPerCubicMillimeter](self._values)
+
+    
+    @property
+    def kilograms_per_cubic_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.KilogramPerCubicCentimeter](self._values)
+
+    
+    @property
+    def kilograms_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.KilogramPerCubicMeter](self._values)
+
+    
+    @property
+    def milligrams_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.MilligramPerCubicMeter](self._values)
+
+    
+    @property
+    def micrograms_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.MicrogramPerCubicMeter](self._values)
+
+    
+    @property
+    def picograms_per_microliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.PicogramPerMicroliter](self._values)
+
+    
+    @property
+    def nanograms_per_microliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.NanogramPerMicroliter](self._values)
+
+    
+    @property
+    def micrograms_per_microliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.MicrogramPerMicroliter](self._values)
+
+    
+    @property
+    def milligrams_per_microliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.MilligramPerMicroliter](self._values)
+
+    
+    @property
+    def centigrams_per_microliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.CentigramPerMicroliter](self._values)
+
+    
+    @property
+    def decigrams_per_microliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.DecigramPerMicroliter](self._values)
+
+    
+    @property
+    def picograms_per_milliliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.PicogramPerMilliliter](self._values)
+
+    
+    @property
+    def nanograms_per_milliliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.NanogramPerMilliliter](self._values)
+
+    
+    @property
+    def micrograms_per_milliliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.MicrogramPerMilliliter](self._values)
+
+    
+    @property
+    def milligrams_per_milliliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.MilligramPerMilliliter](self._values)
+
+    
+    @property
+    def centigrams_per_milliliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.CentigramPerMilliliter](self._values)
+
+    
+    @property
+    def decigrams_per_milliliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.DecigramPerMilliliter](self._values)
+
+    
+    @property
+    def picograms_per_deciliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.PicogramPerDeciliter](self._values)
+
+    
+    @property
+    def nanograms_per_deciliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.NanogramPerDeciliter](self._values)
+
+    
+    @property
+    def micrograms_per_deciliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.MicrogramPerDeciliter](self._values)
+
+    
+    @property
+    def milligrams_per_deciliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.MilligramPerDeciliter](self._values)
+
+    
+    @property
+    def centigrams_per_deciliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.CentigramPerDeciliter](self._values)
+
+    
+    @property
+    def decigrams_per_deciliter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.DecigramPerDeciliter](self._values)
+
+    
+    @property
+    def picograms_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.PicogramPerLiter](self._values)
+
+    
+    @property
+    def nanograms_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.NanogramPerLiter](self._values)
+
+    
+    @property
+    def micrograms_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.MicrogramPerLiter](self._values)
+
+    
+    @property
+    def milligrams_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.MilligramPerLiter](self._values)
+
+    
+    @property
+    def centigrams_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.CentigramPerLiter](self._values)
+
+    
+    @property
+    def decigrams_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.DecigramPerLiter](self._values)
+
+    
+    @property
+    def kilograms_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.KilogramPerLiter](self._values)
+
+    
+    @property
+    def kilopounds_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.KilopoundPerCubicInch](self._values)
+
+    
+    @property
+    def kilopounds_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassConcentrationUnits.KilopoundPerCubicFoot](self._values)
+
+    
\ No newline at end of file
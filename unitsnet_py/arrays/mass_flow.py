@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.mass_flow import MassFlow, MassFlowUnits
+
+
+class MassFlowArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of MassFlow values, held in GramPerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (MassFlowUnits): The MassFlow unit of the values, The default unit is GramPerSecond
+    """
+    __slots__ = ()
+
+    _quantity = MassFlow
+
+    # Whole-array variants of the MassFlow conversion functions.
+    _conversions_from_base = {
+        
+        MassFlowUnits.GramPerSecond: lambda value: (value),
+        
+        MassFlowUnits.GramPerDay: lambda value: (value * 86400),
+        
+        MassFlowUnits.GramPerHour: lambda value: (value * 3600),
+        
+        MassFlowUnits.KilogramPerHour: lambda value: (value * 3.6),
+        
+        MassFlowUnits.KilogramPerMinute: lambda value: (value * 0.06),
+        
+        MassFlowUnits.TonnePerHour: lambda value: (value * 3.6 / 1000),
+        
+        MassFlowUnits.PoundPerDay: lambda value: (value * 190.47936),
+        
+        MassFlowUnits.PoundPerHour: lambda value: (value * 7.93664),
+        
+        MassFlowUnits.PoundPerMinute: lambda value: (value * 0.132277),
+        
+        MassFlowUnits.PoundPerSecond: lambda value: (value / 453.59237),
+        
+        MassFlowUnits.TonnePerDay: lambda value: (value * 0.0864000),
+        
+        MassFlowUnits.ShortTonPerHour: lambda value: (value / 251.9957611),
+        
+        MassFlowUnits.NanogramPerSecond: lambda value: ((value) / 1e-09),
+        
+        MassFlowUnits.MicrogramPerSecond: lambda value: ((value) / 1e-06),
+        
+        MassFlowUnits.MilligramPerSecond: lambda value: ((value) / 0.001),
+        
+        MassFlowUnits.CentigramPerSecond: lambda value: ((value) / 0.01),
+        
+        MassFlowUnits.DecigramPerSecond: lambda value: ((value) / 0.1),
+        
+        MassFlowUnits.DecagramPerSecond: lambda value: ((value) / 10.0),
+        
+        MassFlowUnits.HectogramPerSecond: lambda value: ((value) / 100.0),
+        
+        MassFlowUnits.KilogramPerSecond: lambda value: ((value) / 1000.0),
+        
+        MassFlowUnits.NanogramPerDay: lambda value: ((value * 86400) / 1e-09),
+        
+        MassFlowUnits.MicrogramPerDay: lambda value: ((value * 86400) / 1e-06),
+        
+        MassFlowUnits.MilligramPerDay: lambda value: ((value * 86400) / 0.001),
+        
+        MassFlowUnits.CentigramPerDay: lambda value: ((value * 86400) / 0.01),
+        
+        MassFlowUnits.DecigramPerDay: lambda value: ((value * 86400) / 0.1),
+        
+        MassFlowUnits.DecagramPerDay: lambda value: ((value * 86400) / 10.0),
+        
+        MassFlowUnits.HectogramPerDay: lambda value: ((value * 86400) / 100.0),
+        
+        MassFlowUnits.KilogramPerDay: lambda value: ((value * 86400) / 1000.0),
+        
+        MassFlowUnits.MegagramPerDay: lambda value: ((value * 86400) / 1000000.0),
+        
+        MassFlowUnits.MegapoundPerDay: lambda value: ((value * 190.47936) / 1000000.0),
+        
+        MassFlowUnits.MegapoundPerHour: lambda value: ((value * 7.93664) / 1000000.0),
+        
+        MassFlowUnits.MegapoundPerMinute: lambda value: ((value * 0.132277) / 1000000.0),
+        
+        MassFlowUnits.MegapoundPerSecond: lambda value: ((value / 453.59237) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MassFlowUnits.GramPerSecond: lambda value: (value),
+        
+        MassFlowUnits.GramPerDay: lambda value: (value / 86400),
+        
+        MassFlowUnits.GramPerHour: lambda value: (value / 3600),
+        
+        MassFlowUnits.KilogramPerHour: lambda value: (value / 3.6),
+        
+        MassFlowUnits.KilogramPerMinute: lambda value: (value / 0.06),
+        
+        MassFlowUnits.TonnePerHour: lambda value: (1000 * value / 3.6),
+        
+        MassFlowUnits.PoundPerDay: lambda value: (value / 190.47936),
+        
+        MassFlowUnits.PoundPerHour: lambda value: (value / 7.93664),
+        
+        MassFlowUnits.PoundPerMinute: lambda value: (value / 0.132277),
+        
+        MassFlowUnits.PoundPerSecond: lambda value: (value * 453.59237),
+        
+        MassFlowUnits.TonnePerDay: lambda value: (value / 0.0864000),
+        
+        MassFlowUnits.ShortTonPerHour: lambda value: (value * 251.9957611),
+        
+        MassFlowUnits.NanogramPerSecond: lambda value: ((value) * 1e-09),
+        
+        MassFlowUnits.MicrogramPerSecond: lambda value: ((value) * 1e-06),
+        
+        MassFlowUnits.MilligramPerSecond: lambda value: ((value) * 0.001),
+        
+        MassFlowUnits.CentigramPerSecond: lambda value: ((value) * 0.01),
+        
+        MassFlowUnits.DecigramPerSecond: lambda value: ((value) * 0.1),
+        
+        MassFlowUnits.DecagramPerSecond: lambda value: ((value) * 10.0),
+        
+        MassFlowUnits.HectogramPerSecond: lambda value: ((value) * 100.0),
+        
+        MassFlowUnits.KilogramPerSecond: lambda value: ((value) * 1000.0),
+        
+        MassFlowUnits.NanogramPerDay: lambda value: ((value / 86400) * 1e-09),
+        
+        MassFlowUnits.MicrogramPerDay: lambda value: ((value / 86400) * 1e-06),
+        
+        MassFlowUnits.MilligramPerDay: lambda value: ((value / 86400) * 0.001),
+        
+        MassFlowUnits.CentigramPerDay: lambda value: ((value / 86400) * 0.01),
+        
+        MassFlowUnits.DecigramPerDay: lambda value: ((value / 86400) * 0.1),
+        
+        MassFlowUnits.DecagramPerDay: lambda value: ((value / 86400) * 10.0),
+        
+        MassFlowUnits.HectogramPerDay: lambda value: ((value / 86400) * 100.0),
+        
+        MassFlowUnits.KilogramPerDay: lambda value: ((value / 86400) * 1000.0),
+        
+        MassFlowUnits.MegagramPerDay: lambda value: ((value / 86400) * 1000000.0),
+        
+        MassFlowUnits.MegapoundPerDay: lambda value: ((value / 190.47936) * 1000000.0),
+        
+        MassFlowUnits.MegapoundPerHour: lambda value: ((value / 7.93664) * 1000000.0),
+        
+        MassFlowUnits.MegapoundPerMinute: lambda value: ((value / 0.132277) * 1000000.0),
+        
+        MassFlowUnits.MegapoundPerSecond: lambda value: ((value * 453.59237) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: MassFlowUnits = MassFlowUnits.GramPerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: MassFlowUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: MassFlowUnits = MassFlowUnits.GramPerSecond) -> MassFlowArray:
+        """
+        Create a new instance of MassFlowArray from values in the given unit.
+
+        :param values: The MassFlow values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: MassFlowUnits
+        :return: A new instance of MassFlowArray.
+        :rtype: MassFlowArray
+        """
+        return MassFlowArray(values, unit)
+
+    
+    @property
+    def grams_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.GramPerSecond](self._values)
+
+    
+    @property
+    def grams_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.GramPerDay](self._values)
+
+    
+    @property
+    def grams_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.GramPerHour](self._values)
+
+    
+    @property
+    def kilograms_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.KilogramPerHour](self._values)
+
+    
+    @property
+    def kilograms_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.KilogramPerMinute](self._values)
+
+    
+    @property
+    def tonnes_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.TonnePerHour](self._values)
+
+    
+    @property
+    def pounds_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.PoundPerDay](self._values)
+
+    
+    @property
+    def pounds_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.PoundPerHour](self._values)
+
+    
+    @property
+    def pounds_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.PoundPerMinute](self._values)
+
+    
+    @property
+    def pounds_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.PoundPerSecond](self._values)
+
+    
+    @property
+    def tonnes_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.TonnePerDay](self._values)
+
+    
+    @property
+    def short_tons_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.ShortTonPerHour](self._values)
+
+    
+    @property
+    def nanograms_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.NanogramPerSecond](self._values)
+
+    
+    @property
+    def micrograms_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.MicrogramPerSecond](self._values)
+
+    
+    @property
+    def milligrams_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.MilligramPerSecond](self._values)
+
+    
+    @property
+    def centigrams_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.CentigramPerSecond](self._values)
+
+    
+    @property
+    def decigrams_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.DecigramPerSecond](self._values)
+
+    
+    @property
+    def decagrams_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.DecagramPerSecond](self._values)
+
+    
+    @property
+    def hectograms_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.HectogramPerSecond](self._values)
+
+    
+    @property
+    def kilograms_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.KilogramPerSecond](self._values)
+
+    
+    @property
+    def nanograms_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.NanogramPerDay](self._values)
+
+    
+    @property
+    def micrograms_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.MicrogramPerDay](self._values)
+
+    
+    @property
+    def milligrams_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.MilligramPerDay](self._values)
+
+    
+    @property
+    def centigrams_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.CentigramPerDay](self._values)
+
+    
+    @property
+    def decigrams_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.DecigramPerDay](self._values)
+
+    
+    @property
+    def decagrams_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.DecagramPerDay](self._values)
+
+    
+    @property
+    def hectograms_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.HectogramPerDay](self._values)
+
+    
+    @property
+    def kilograms_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.KilogramPerDay](self._values)
+
+    
+    @property
+    def megagrams_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.MegagramPerDay](self._values)
+
+    
+    @property
+    def megapounds_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.MegapoundPerDay](self._values)
+
+    
+    @property
+    def megapounds_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.MegapoundPerHour](self._values)
+
+    
+    @property
+    def megapounds_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.MegapoundPerMinute](self._values)
+
+    
+    @property
+    def megapounds_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFlowUnits.MegapoundPerSecond](self._values)
+
+    
\ No newline at end of file
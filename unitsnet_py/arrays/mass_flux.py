@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.mass_flux import MassFlux, MassFluxUnits
+
+
+class MassFluxArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of MassFlux values, held in KilogramPerSecondPerSquareMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (MassFluxUnits): The MassFlux unit of the values, The default unit is KilogramPerSecondPerSquareMeter
+    """
+    __slots__ = ()
+
+    _quantity = MassFlux
+
+    # Whole-array variants of the MassFlux conversion functions.
+    _conversions_from_base = {
+        
+        MassFluxUnits.GramPerSecondPerSquareMeter: lambda value: (value * 1e3),
+        
+        MassFluxUnits.GramPerSecondPerSquareCentimeter: lambda value: (value * 1e-1),
+        
+        MassFluxUnits.GramPerSecondPerSquareMillimeter: lambda value: (value * 1e-3),
+        
+        MassFluxUnits.GramPerHourPerSquareMeter: lambda value: (value * 3.6e6),
+        
+        MassFluxUnits.GramPerHourPerSquareCentimeter: lambda value: (value * 3.6e2),
+        
+        MassFluxUnits.GramPerHourPerSquareMillimeter: lambda value: (value * 3.6e0),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareMeter: lambda value: ((value * 1e3) / 1000.0),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareCentimeter: lambda value: ((value * 1e-1) / 1000.0),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareMillimeter: lambda value: ((value * 1e-3) / 1000.0),
+        
+        MassFluxUnits.KilogramPerHourPerSquareMeter: lambda value: ((value * 3.6e6) / 1000.0),
+        
+        MassFluxUnits.KilogramPerHourPerSquareCentimeter: lambda value: ((value * 3.6e2) / 1000.0),
+        
+        MassFluxUnits.KilogramPerHourPerSquareMillimeter: lambda value: ((value * 3.6e0) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MassFluxUnits.GramPerSecondPerSquareMeter: lambda value: (value / 1e3),
+        
+        MassFluxUnits.GramPerSecondPerSquareCentimeter: lambda value: (value / 1e-1),
+        
+        MassFluxUnits.GramPerSecondPerSquareMillimeter: lambda value: (value / 1e-3),
+        
+        MassFluxUnits.GramPerHourPerSquareMeter: lambda value: (value / 3.6e6),
+        
+        MassFluxUnits.GramPerHourPerSquareCentimeter: lambda value: (value / 3.6e2),
+        
+        MassFluxUnits.GramPerHourPerSquareMillimeter: lambda value: (value / 3.6e0),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareMeter: lambda value: ((value / 1e3) * 1000.0),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareCentimeter: lambda value: ((value / 1e-1) * 1000.0),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareMillimeter: lambda value: ((value / 1e-3) * 1000.0),
+        
+        MassFluxUnits.KilogramPerHourPerSquareMeter: lambda value: ((value / 3.6e6) * 1000.0),
+        
+        MassFluxUnits.KilogramPerHourPerSquareCentimeter: lambda value: ((value / 3.6e2) * 1000.0),
+        
+        MassFluxUnits.KilogramPerHourPerSquareMillimeter: lambda value: ((value / 3.6e0) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: MassFluxUnits = MassFluxUnits.KilogramPerSecondPerSquareMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: MassFluxUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: MassFluxUnits = MassFluxUnits.KilogramPerSecondPerSquareMeter) -> MassFluxArray:
+        """
+        Create a new instance of MassFluxArray from values in the given unit.
+
+        :param values: The MassFlux values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: MassFluxUnits
+        :return: A new instance of MassFluxArray.
+        :rtype: MassFluxArray
+        """
+        return MassFluxArray(values, unit)
+
+    
+    @property
+    def grams_per_second_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFluxUnits.GramPerSecondPerSquareMeter](self._values)
+
+    
+    @property
+    def grams_per_second_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFluxUnits.GramPerSecondPerSquareCentimeter](self._values)
+
+    
+    @property
+    def grams_per_second_per_square_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFluxUnits.GramPerSecondPerSquareMillimeter](self._values)
+
+    
+    @property
+    def grams_per_hour_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFluxUnits.GramPerHourPerSquareMeter](self._values)
+
+    
+    @property
+    def grams_per_hour_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFluxUnits.GramPerHourPerSquareCentimeter](self._values)
+
+    
+    @property
+    def grams_per_hour_per_square_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFluxUnits.GramPerHourPerSquareMillimeter](self._values)
+
+    
+    @property
+    def kilograms_per_second_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFluxUnits.KilogramPerSecondPerSquareMeter](self._values)
+
+    
+    @property
+    def kilograms_per_second_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFluxUnits.KilogramPerSecondPerSquareCentimeter](self._values)
+
+    
+    @property
+    def kilograms_per_second_per_square_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFluxUnits.KilogramPerSecondPerSquareMillimeter](self._values)
+
+    
+    @property
+    def kilograms_per_hour_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFluxUnits.KilogramPerHourPerSquareMeter](self._values)
+
+    
+    @property
+    def kilograms_per_hour_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFluxUnits.KilogramPerHourPerSquareCentimeter](self._values)
+
+    
+    @property
+    def kilograms_per_hour_per_square_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFluxUnits.KilogramPerHourPerSquareMillimeter](self._values)
+
+    
\ No newline at end of file
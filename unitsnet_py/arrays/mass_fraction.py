@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.mass_fraction import MassFraction, MassFractionUnits
+
+
+class MassFractionArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of MassFraction values, held in DecimalFraction.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (MassFractionUnits): The MassFraction unit of the values, The default unit is DecimalFraction
+    """
+    __slots__ = ()
+
+    _quantity = MassFraction
+
+    # Whole-array variants of the MassFraction conversion functions.
+    _conversions_from_base = {
+        
+        MassFractionUnits.DecimalFraction: lambda value: (value),
+        
+        MassFractionUnits.GramPerGram: lambda value: (value),
+        
+        MassFractionUnits.GramPerKilogram: lambda value: (value * 1e3),
+        
+        MassFractionUnits.Percent: lambda value: (value * 1e2),
+        
+        MassFractionUnits.PartPerThousand: lambda value: (value * 1e3),
+        
+        MassFractionUnits.PartPerMillion: lambda value: (value * 1e6),
+        
+        MassFractionUnits.PartPerBillion: lambda value: (value * 1e9),
+        
+        MassFractionUnits.PartPerTrillion: lambda value: (value * 1e12),
+        
+        MassFractionUnits.NanogramPerGram: lambda value: ((value) / 1e-09),
+        
+        MassFractionUnits.MicrogramPerGram: lambda value: ((value) / 1e-06),
+        
+        MassFractionUnits.MilligramPerGram: lambda value: ((value) / 0.001),
+        
+        MassFractionUnits.CentigramPerGram: lambda value: ((value) / 0.01),
+        
+        MassFractionUnits.DecigramPerGram: lambda value: ((value) / 0.1),
+        
+        MassFractionUnits.DecagramPerGram: lambda value: ((value) / 10.0),
+        
+        MassFractionUnits.HectogramPerGram: lambda value: ((value) / 100.0),
+        
+        MassFractionUnits.KilogramPerGram: lambda value: ((value) / 1000.0),
+        
+        MassFractionUnits.NanogramPerKilogram: lambda value: ((value * 1e3) / 1e-09),
+        
+        MassFractionUnits.MicrogramPerKilogram: lambda value: ((value * 1e3) / 1e-06),
+        
+        MassFractionUnits.MilligramPerKilogram: lambda value: ((value * 1e3) / 0.001),
+        
+        MassFractionUnits.CentigramPerKilogram: lambda value: ((value * 1e3) / 0.01),
+        
+        MassFractionUnits.DecigramPerKilogram: lambda value: ((value * 1e3) / 0.1),
+        
+        MassFractionUnits.DecagramPerKilogram: lambda value: ((value * 1e3) / 10.0),
+        
+        MassFractionUnits.HectogramPerKilogram: lambda value: ((value * 1e3) / 100.0),
+        
+        MassFractionUnits.KilogramPerKilogram: lambda value: ((value * 1e3) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MassFractionUnits.DecimalFraction: lambda value: (value),
+        
+        MassFractionUnits.GramPerGram: lambda value: (value),
+        
+        MassFractionUnits.GramPerKilogram: lambda value: (value / 1e3),
+        
+        MassFractionUnits.Percent: lambda value: (value / 1e2),
+        
+        MassFractionUnits.PartPerThousand: lambda value: (value / 1e3),
+        
+        MassFractionUnits.PartPerMillion: lambda value: (value / 1e6),
+        
+        MassFractionUnits.PartPerBillion: lambda value: (value / 1e9),
+        
+        MassFractionUnits.PartPerTrillion: lambda value: (value / 1e12),
+        
+        MassFractionUnits.NanogramPerGram: lambda value: ((value) * 1e-09),
+        
+        MassFractionUnits.MicrogramPerGram: lambda value: ((value) * 1e-06),
+        
+        MassFractionUnits.MilligramPerGram: lambda value: ((value) * 0.001),
+        
+        MassFractionUnits.CentigramPerGram: lambda value: ((value) * 0.01),
+        
+        MassFractionUnits.DecigramPerGram: lambda value: ((value) * 0.1),
+        
+        MassFractionUnits.DecagramPerGram: lambda value: ((value) * 10.0),
+        
+        MassFractionUnits.HectogramPerGram: lambda value: ((value) * 100.0),
+        
+        MassFractionUnits.KilogramPerGram: lambda value: ((value) * 1000.0),
+        
+        MassFractionUnits.NanogramPerKilogram: lambda value: ((value / 1e3) * 1e-09),
+        
+        MassFractionUnits.MicrogramPerKilogram: lambda value: ((value / 1e3) * 1e-06),
+        
+        MassFractionUnits.MilligramPerKilogram: lambda value: ((value / 1e3) * 0.001),
+        
+        MassFractionUnits.CentigramPerKilogram: lambda value: ((value / 1e3) * 0.01),
+        
+        MassFractionUnits.DecigramPerKilogram: lambda value: ((value / 1e3) * 0.1),
+        
+        MassFractionUnits.DecagramPerKilogram: lambda value: ((value / 1e3) * 10.0),
+        
+        MassFractionUnits.HectogramPerKilogram: lambda value: ((value / 1e3) * 100.0),
+        
+        MassFractionUnits.KilogramPerKilogram: lambda value: ((value / 1e3) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: MassFractionUnits = MassFractionUnits.DecimalFraction):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: MassFractionUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: MassFractionUnits = MassFractionUnits.DecimalFraction) -> MassFractionArray:
+        """
+        Create a new instance of MassFractionArray from values in the given unit.
+
+        :param values: The MassFraction values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: MassFractionUnits
+        :return: A new instance of MassFractionArray.
+        :rtype: MassFractionArray
+        """
+        return MassFractionArray(values, unit)
+
+    
+    @property
+    def decimal_fractions(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.DecimalFraction](self._values)
+
+    
+    @property
+    def grams_per_gram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.GramPerGram](self._values)
+
+    
+    @property
+    def grams_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.GramPerKilogram](self._values)
+
+    
+    @property
+    def percent(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.Percent](self._values)
+
+    
+    @property
+    def parts_per_thousand(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.PartPerThousand](self._values)
+
+    
+    @property
+    def parts_per_million(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.PartPerMillion](self._values)
+
+    
+    @property
+    def parts_per_billion(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.PartPerBillion](self._values)
+
+    
+    @property
+    def parts_per_trillion(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.PartPerTrillion](self._values)
+
+    
+    @property
+    def nanograms_per_gram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.NanogramPerGram](self._values)
+
+    
+    @property
+    def micrograms_per_gram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.MicrogramPerGram](self._values)
+
+    
+    @property
+    def milligrams_per_gram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.MilligramPerGram](self._values)
+
+    
+    @property
+    def centigrams_per_gram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.CentigramPerGram](self._values)
+
+    
+    @property
+    def decigrams_per_gram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.DecigramPerGram](self._values)
+
+    
+    @property
+    def decagrams_per_gram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.DecagramPerGram](self._values)
+
+    
+    @property
+    def hectograms_per_gram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.HectogramPerGram](self._values)
+
+    
+    @property
+    def kilograms_per_gram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.KilogramPerGram](self._values)
+
+    
+    @property
+    def nanograms_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.NanogramPerKilogram](self._values)
+
+    
+    @property
+    def micrograms_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.MicrogramPerKilogram](self._values)
+
+    
+    @property
+    def milligrams_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.MilligramPerKilogram](self._values)
+
+    
+    @property
+    def centigrams_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.CentigramPerKilogram](self._values)
+
+    
+    @property
+    def decigrams_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.DecigramPerKilogram](self._values)
+
+    
+    @property
+    def decagrams_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.DecagramPerKilogram](self._values)
+
+    
+    @property
+    def hectograms_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.HectogramPerKilogram](self._values)
+
+    
+    @property
+    def kilograms_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassFractionUnits.KilogramPerKilogram](self._values)
+
+    
\ No newline at end of file
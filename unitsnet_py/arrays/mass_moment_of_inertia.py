@@ -0,0 +1,386 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.mass_moment_of_inertia import MassMomentOfInertia, MassMomentOfInertiaUnits
+
+
+class MassMomentOfInertiaArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of MassMomentOfInertia values, held in KilogramSquareMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (MassMomentOfInertiaUnits): The MassMomentOfInertia unit of the values, The default unit is KilogramSquareMeter
+    """
+    __slots__ = ()
+
+    _quantity = MassMomentOfInertia
+
+    # Whole-array variants of the MassMomentOfInertia conversion functions.
+    _conversions_from_base = {
+        
+        MassMomentOfInertiaUnits.GramSquareMeter: lambda value: (value * 1e3),
+        
+        MassMomentOfInertiaUnits.GramSquareDecimeter: lambda value: (value * 1e5),
+        
+        MassMomentOfInertiaUnits.GramSquareCentimeter: lambda value: (value * 1e7),
+        
+        MassMomentOfInertiaUnits.GramSquareMillimeter: lambda value: (value * 1e9),
+        
+        MassMomentOfInertiaUnits.TonneSquareMeter: lambda value: (value * 1e-3),
+        
+        MassMomentOfInertiaUnits.TonneSquareDecimeter: lambda value: (value * 1e-1),
+        
+        MassMomentOfInertiaUnits.TonneSquareCentimeter: lambda value: (value * 1e1),
+        
+        MassMomentOfInertiaUnits.TonneSquareMilimeter: lambda value: (value * 1e3),
+        
+        MassMomentOfInertiaUnits.PoundSquareFoot: lambda value: (value / 4.21401101e-2),
+        
+        MassMomentOfInertiaUnits.PoundSquareInch: lambda value: (value / 2.9263965e-4),
+        
+        MassMomentOfInertiaUnits.SlugSquareFoot: lambda value: (value / 1.3558179619),
+        
+        MassMomentOfInertiaUnits.SlugSquareInch: lambda value: (value / 9.41540242e-3),
+        
+        MassMomentOfInertiaUnits.MilligramSquareMeter: lambda value: ((value * 1e3) / 0.001),
+        
+        MassMomentOfInertiaUnits.KilogramSquareMeter: lambda value: ((value * 1e3) / 1000.0),
+        
+        MassMomentOfInertiaUnits.MilligramSquareDecimeter: lambda value: ((value * 1e5) / 0.001),
+        
+        MassMomentOfInertiaUnits.KilogramSquareDecimeter: lambda value: ((value * 1e5) / 1000.0),
+        
+        MassMomentOfInertiaUnits.MilligramSquareCentimeter: lambda value: ((value * 1e7) / 0.001),
+        
+        MassMomentOfInertiaUnits.KilogramSquareCentimeter: lambda value: ((value * 1e7) / 1000.0),
+        
+        MassMomentOfInertiaUnits.MilligramSquareMillimeter: lambda value: ((value * 1e9) / 0.001),
+        
+        MassMomentOfInertiaUnits.KilogramSquareMillimeter: lambda value: ((value * 1e9) / 1000.0),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareMeter: lambda value: ((value * 1e-3) / 1000.0),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareMeter: lambda value: ((value * 1e-3) / 1000000.0),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareDecimeter: lambda value: ((value * 1e-1) / 1000.0),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareDecimeter: lambda value: ((value * 1e-1) / 1000000.0),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareCentimeter: lambda value: ((value * 1e1) / 1000.0),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareCentimeter: lambda value: ((value * 1e1) / 1000000.0),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareMilimeter: lambda value: ((value * 1e3) / 1000.0),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareMilimeter: lambda value: ((value * 1e3) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MassMomentOfInertiaUnits.GramSquareMeter: lambda value: (value / 1e3),
+        
+        MassMomentOfInertiaUnits.GramSquareDecimeter: lambda value: (value / 1e5),
+        
+        MassMomentOfInertiaUnits.GramSquareCentimeter: lambda value: (value / 1e7),
+        
+        MassMomentOfInertiaUnits.GramSquareMillimeter: lambda value: (value / 1e9),
+        
+        MassMomentOfInertiaUnits.TonneSquareMeter: lambda value: (value / 1e-3),
+        
+        MassMomentOfInertiaUnits.TonneSquareDecimeter: lambda value: (value / 1e-1),
+        
+        MassMomentOfInertiaUnits.TonneSquareCentimeter: lambda value: (value / 1e1),
+        
+        MassMomentOfInertiaUnits.TonneSquareMilimeter: lambda value: (value / 1e3),
+        
+        MassMomentOfInertiaUnits.PoundSquareFoot: lambda value: (value * 4.21401101e-2),
+        
+        MassMomentOfInertiaUnits.PoundSquareInch: lambda value: (value * 2.9263965e-4),
+        
+        MassMomentOfInertiaUnits.SlugSquareFoot: lambda value: (value * 1.3558179619),
+        
+        MassMomentOfInertiaUnits.SlugSquareInch: lambda value: (value * 9.41540242e-3),
+        
+        MassMomentOfInertiaUnits.MilligramSquareMeter: lambda value: ((value / 1e3) * 0.001),
+        
+        MassMomentOfInertiaUnits.KilogramSquareMeter: lambda value: ((value / 1e3) * 1000.0),
+        
+        MassMomentOfInertiaUnits.MilligramSquareDecimeter: lambda value: ((value / 1e5) * 0.001),
+        
+        MassMomentOfInertiaUnits.KilogramSquareDecimeter: lambda value: ((value / 1e5) * 1000.0),
+        
+        MassMomentOfInertiaUnits.MilligramSquareCentimeter: lambda value: ((value / 1e7) * 0.001),
+        
+        MassMomentOfInertiaUnits.KilogramSquareCentimeter: lambda value: ((value / 1e7) * 1000.0),
+        
+        MassMomentOfInertiaUnits.MilligramSquareMillimeter: lambda value: ((value / 1e9) * 0.001),
+        
+        MassMomentOfInertiaUnits.KilogramSquareMillimeter: lambda value: ((value / 1e9) * 1000.0),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareMeter: lambda value: ((value / 1e-3) * 1000.0),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareMeter: lambda value: ((value / 1e-3) * 1000000.0),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareDecimeter: lambda value: ((value / 1e-1) * 1000.0),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareDecimeter: lambda value: ((value / 1e-1) * 1000000.0),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareCentimeter: lambda value: ((value / 1e1) * 1000.0),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareCentimeter: lambda value: ((value / 1e1) * 1000000.0),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareMilimeter: lambda value: ((value / 1e3) * 1000.0),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareMilimeter: lambda value: ((value / 1e3) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: MassMomentOfInertiaUnits = MassMomentOfInertiaUnits.KilogramSquareMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: MassMomentOfInertiaUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: MassMomentOfInertiaUnits = MassMomentOfInertiaUnits.KilogramSquareMeter) -> MassMomentOfInertiaArray:
+        """
+        Create a new instance of MassMomentOfInertiaArray from values in the given unit.
+
+        :param values: The MassMomentOfInertia values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: MassMomentOfInertiaUnits
+        :return: A new instance of MassMomentOfInertiaArray.
+        :rtype: MassMomentOfInertiaArray
+        """
+        return MassMomentOfInertiaArray(values, unit)
+
+    
+    @property
+    def gram_square_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.GramSquareMeter](self._values)
+
+    
+    @property
+    def gram_square_decimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.GramSquareDecimeter](self._values)
+
+    
+    @property
+    def gram_square_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.GramSquareCentimeter](self._values)
+
+    
+    @property
+    def gram_square_millimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.GramSquareMillimeter](self._values)
+
+    
+    @property
+    def tonne_square_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.TonneSquareMeter](self._values)
+
+    
+    @property
+    def tonne_square_decimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.TonneSquareDecimeter](self._values)
+
+    
+    @property
+    def tonne_square_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.TonneSquareCentimeter](self._values)
+
+    
+    @property
+    def tonne_square_milimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.TonneSquareMilimeter](self._values)
+
+    
+    @property
+    def pound_square_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.PoundSquareFoot](self._values)
+
+    
+    @property
+    def pound_square_inches(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.PoundSquareInch](self._values)
+
+    
+    @property
+    def slug_square_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.SlugSquareFoot](self._values)
+
+    
+    @property
+    def slug_square_inches(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.SlugSquareInch](self._values)
+
+    
+    @property
+    def milligram_square_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.MilligramSquareMeter](self._values)
+
+    
+    @property
+    def kilogram_square_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.KilogramSquareMeter](self._values)
+
+    
+    @property
+    def milligram_square_decimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.MilligramSquareDecimeter](self._values)
+
+    
+    @property
+    def kilogram_square_decimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.KilogramSquareDecimeter](self._values)
+
+    
+    @property
+    def milligram_square_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.MilligramSquareCentimeter](self._values)
+
+    
+    @property
+    def kilogram_square_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.KilogramSquareCentimeter](self._values)
+
+    
+    @property
+    def milligram_square_millimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.MilligramSquareMillimeter](self._values)
+
+    
+    @property
+    def kilogram_square_millimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.KilogramSquareMillimeter](self._values)
+
+    
+    @property
+    def kilotonne_square_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.KilotonneSquareMeter](self._values)
+
+    
+    @property
+    def megatonne_square_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.MegatonneSquareMeter](self._values)
+
+    
+    @property
+    def kilotonne_square_decimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.KilotonneSquareDecimeter](self._values)
+
+    
+    @property
+    def megatonne_square_decimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.MegatonneSquareDecimeter](self._values)
+
+    
+    @property
+    def kilotonne_square_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.KilotonneSquareCentimeter](self._values)
+
+    
+    @property
+    def megatonne_square_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.MegatonneSquareCentimeter](self._values)
+
+    
+    @property
+    def kilotonne_square_milimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.KilotonneSquareMilimeter](self._values)
+
+    
+    @property
+    def megatonne_square_milimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MassMomentOfInertiaUnits.MegatonneSquareMilimeter](self._values)
+
+    
\ No newline at end of file
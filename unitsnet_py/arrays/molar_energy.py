@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.molar_energy import MolarEnergy, MolarEnergyUnits
+
+
+class MolarEnergyArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of MolarEnergy values, held in JoulePerMole.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (MolarEnergyUnits): The MolarEnergy unit of the values, The default unit is JoulePerMole
+    """
+    __slots__ = ()
+
+    _quantity = MolarEnergy
+
+    # Whole-array variants of the MolarEnergy conversion functions.
+    _conversions_from_base = {
+        
+        MolarEnergyUnits.JoulePerMole: lambda value: (value),
+        
+        MolarEnergyUnits.KilojoulePerMole: lambda value: ((value) / 1000.0),
+        
+        MolarEnergyUnits.MegajoulePerMole: lambda value: ((value) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MolarEnergyUnits.JoulePerMole: lambda value: (value),
+        
+        MolarEnergyUnits.KilojoulePerMole: lambda value: ((value) * 1000.0),
+        
+        MolarEnergyUnits.MegajoulePerMole: lambda value: ((value) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: MolarEnergyUnits = MolarEnergyUnits.JoulePerMole):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: MolarEnergyUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: MolarEnergyUnits = MolarEnergyUnits.JoulePerMole) -> MolarEnergyArray:
+        """
+        Create a new instance of MolarEnergyArray from values in the given unit.
+
+        :param values: The MolarEnergy values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: MolarEnergyUnits
+        :return: A new instance of MolarEnergyArray.
+        :rtype: MolarEnergyArray
+        """
+        return MolarEnergyArray(values, unit)
+
+    
+    @property
+    def joules_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarEnergyUnits.JoulePerMole](self._values)
+
+    
+    @property
+    def kilojoules_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarEnergyUnits.KilojoulePerMole](self._values)
+
+    
+    @property
+    def megajoules_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarEnergyUnits.MegajoulePerMole](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.molar_entropy import MolarEntropy, MolarEntropyUnits
+
+
+class MolarEntropyArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of MolarEntropy values, held in JoulePerMoleKelvin.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (MolarEntropyUnits): The MolarEntropy unit of the values, The default unit is JoulePerMoleKelvin
+    """
+    __slots__ = ()
+
+    _quantity = MolarEntropy
+
+    # Whole-array variants of the MolarEntropy conversion functions.
+    _conversions_from_base = {
+        
+        MolarEntropyUnits.JoulePerMoleKelvin: lambda value: (value),
+        
+        MolarEntropyUnits.KilojoulePerMoleKelvin: lambda value: ((value) / 1000.0),
+        
+        MolarEntropyUnits.MegajoulePerMoleKelvin: lambda value: ((value) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MolarEntropyUnits.JoulePerMoleKelvin: lambda value: (value),
+        
+        MolarEntropyUnits.KilojoulePerMoleKelvin: lambda value: ((value) * 1000.0),
+        
+        MolarEntropyUnits.MegajoulePerMoleKelvin: lambda value: ((value) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: MolarEntropyUnits = MolarEntropyUnits.JoulePerMoleKelvin):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: MolarEntropyUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: MolarEntropyUnits = MolarEntropyUnits.JoulePerMoleKelvin) -> MolarEntropyArray:
+        """
+        Create a new instance of MolarEntropyArray from values in the given unit.
+
+        :param values: The MolarEntropy values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: MolarEntropyUnits
+        :return: A new instance of MolarEntropyArray.
+        :rtype: MolarEntropyArray
+        """
+        return MolarEntropyArray(values, unit)
+
+    
+    @property
+    def joules_per_mole_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarEntropyUnits.JoulePerMoleKelvin](self._values)
+
+    
+    @property
+    def kilojoules_per_mole_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarEntropyUnits.KilojoulePerMoleKelvin](self._values)
+
+    
+    @property
+    def megajoules_per_mole_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarEntropyUnits.MegajoulePerMoleKelvin](self._values)
+
+    
\ No newline at end of file
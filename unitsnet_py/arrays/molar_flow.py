@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.molar_flow import MolarFlow, MolarFlowUnits
+
+
+class MolarFlowArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of MolarFlow values, held in MolePerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (MolarFlowUnits): The MolarFlow unit of the values, The default unit is MolePerSecond
+    """
+    __slots__ = ()
+
+    _quantity = MolarFlow
+
+    # Whole-array variants of the MolarFlow conversion functions.
+    _conversions_from_base = {
+        
+        MolarFlowUnits.MolePerSecond: lambda value: (value),
+        
+        MolarFlowUnits.MolePerMinute: lambda value: (value * 60),
+        
+        MolarFlowUnits.MolePerHour: lambda value: (value * 3600),
+        
+        MolarFlowUnits.PoundMolePerSecond: lambda value: (value / 453.59237),
+        
+        MolarFlowUnits.PoundMolePerMinute: lambda value: ((value / 453.59237) * 60),
+        
+        MolarFlowUnits.PoundMolePerHour: lambda value: ((value / 453.59237) * 3600),
+        
+        MolarFlowUnits.KilomolePerSecond: lambda value: ((value) / 1000.0),
+        
+        MolarFlowUnits.KilomolePerMinute: lambda value: ((value * 60) / 1000.0),
+        
+        MolarFlowUnits.KilomolePerHour: lambda value: ((value * 3600) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MolarFlowUnits.MolePerSecond: lambda value: (value),
+        
+        MolarFlowUnits.MolePerMinute: lambda value: (value / 60),
+        
+        MolarFlowUnits.MolePerHour: lambda value: (value / 3600),
+        
+        MolarFlowUnits.PoundMolePerSecond: lambda value: (value * 453.59237),
+        
+        MolarFlowUnits.PoundMolePerMinute: lambda value: ((value * 453.59237) / 60),
+        
+        MolarFlowUnits.PoundMolePerHour: lambda value: ((value * 453.59237) / 3600),
+        
+        MolarFlowUnits.KilomolePerSecond: lambda value: ((value) * 1000.0),
+        
+        MolarFlowUnits.KilomolePerMinute: lambda value: ((value / 60) * 1000.0),
+        
+        MolarFlowUnits.KilomolePerHour: lambda value: ((value / 3600) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: MolarFlowUnits = MolarFlowUnits.MolePerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: MolarFlowUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: MolarFlowUnits = MolarFlowUnits.MolePerSecond) -> MolarFlowArray:
+        """
+        Create a new instance of MolarFlowArray from values in the given unit.
+
+        :param values: The MolarFlow values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: MolarFlowUnits
+        :return: A new instance of MolarFlowArray.
+        :rtype: MolarFlowArray
+        """
+        return MolarFlowArray(values, unit)
+
+    
+    @property
+    def moles_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarFlowUnits.MolePerSecond](self._values)
+
+    
+    @property
+    def moles_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarFlowUnits.MolePerMinute](self._values)
+
+    
+    @property
+    def moles_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarFlowUnits.MolePerHour](self._values)
+
+    
+    @property
+    def pound_moles_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarFlowUnits.PoundMolePerSecond](self._values)
+
+    
+    @property
+    def pound_moles_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarFlowUnits.PoundMolePerMinute](self._values)
+
+    
+    @property
+    def pound_moles_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarFlowUnits.PoundMolePerHour](self._values)
+
+    
+    @property
+    def kilomoles_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarFlowUnits.KilomolePerSecond](self._values)
+
+    
+    @property
+    def kilomoles_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarFlowUnits.KilomolePerMinute](self._values)
+
+    
+    @property
+    def kilomoles_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarFlowUnits.KilomolePerHour](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.molar_mass import MolarMass, MolarMassUnits
+
+
+class MolarMassArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of MolarMass values, held in KilogramPerMole.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (MolarMassUnits): The MolarMass unit of the values, The default unit is KilogramPerMole
+    """
+    __slots__ = ()
+
+    _quantity = MolarMass
+
+    # Whole-array variants of the MolarMass conversion functions.
+    _conversions_from_base = {
+        
+        MolarMassUnits.GramPerMole: lambda value: (value * 1e3),
+        
+        MolarMassUnits.KilogramPerKilomole: lambda value: (value * 1e3),
+        
+        MolarMassUnits.PoundPerMole: lambda value: (value / 0.45359237),
+        
+        MolarMassUnits.NanogramPerMole: lambda value: ((value * 1e3) / 1e-09),
+        
+        MolarMassUnits.MicrogramPerMole: lambda value: ((value * 1e3) / 1e-06),
+        
+        MolarMassUnits.MilligramPerMole: lambda value: ((value * 1e3) / 0.001),
+        
+        MolarMassUnits.CentigramPerMole: lambda value: ((value * 1e3) / 0.01),
+        
+        MolarMassUnits.DecigramPerMole: lambda value: ((value * 1e3) / 0.1),
+        
+        MolarMassUnits.DecagramPerMole: lambda value: ((value * 1e3) / 10.0),
+        
+        MolarMassUnits.HectogramPerMole: lambda value: ((value * 1e3) / 100.0),
+        
+        MolarMassUnits.KilogramPerMole: lambda value: ((value * 1e3) / 1000.0),
+        
+        MolarMassUnits.KilopoundPerMole: lambda value: ((value / 0.45359237) / 1000.0),
+        
+        MolarMassUnits.MegapoundPerMole: lambda value: ((value / 0.45359237) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MolarMassUnits.GramPerMole: lambda value: (value / 1e3),
+        
+        MolarMassUnits.KilogramPerKilomole: lambda value: (value / 1e3),
+        
+        MolarMassUnits.PoundPerMole: lambda value: (value * 0.45359237),
+        
+        MolarMassUnits.NanogramPerMole: lambda value: ((value / 1e3) * 1e-09),
+        
+        MolarMassUnits.MicrogramPerMole: lambda value: ((value / 1e3) * 1e-06),
+        
+        MolarMassUnits.MilligramPerMole: lambda value: ((value / 1e3) * 0.001),
+        
+        MolarMassUnits.CentigramPerMole: lambda value: ((value / 1e3) * 0.01),
+        
+        MolarMassUnits.DecigramPerMole: lambda value: ((value / 1e3) * 0.1),
+        
+        MolarMassUnits.DecagramPerMole: lambda value: ((value / 1e3) * 10.0),
+        
+        MolarMassUnits.HectogramPerMole: lambda value: ((value / 1e3) * 100.0),
+        
+        MolarMassUnits.KilogramPerMole: lambda value: ((value / 1e3) * 1000.0),
+        
+        MolarMassUnits.KilopoundPerMole: lambda value: ((value * 0.45359237) * 1000.0),
+        
+        MolarMassUnits.MegapoundPerMole: lambda value: ((value * 0.45359237) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: MolarMassUnits = MolarMassUnits.KilogramPerMole):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: MolarMassUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: MolarMassUnits = MolarMassUnits.KilogramPerMole) -> MolarMassArray:
+        """
+        Create a new instance of MolarMassArray from values in the given unit.
+
+        :param values: The MolarMass values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: MolarMassUnits
+        :return: A new instance of MolarMassArray.
+        :rtype: MolarMassArray
+        """
+        return MolarMassArray(values, unit)
+
+    
+    @property
+    def grams_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarMassUnits.GramPerMole](self._values)
+
+    
+    @property
+    def kilograms_per_kilomole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarMassUnits.KilogramPerKilomole](self._values)
+
+    
+    @property
+    def pounds_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarMassUnits.PoundPerMole](self._values)
+
+    
+    @property
+    def nanograms_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarMassUnits.NanogramPerMole](self._values)
+
+    
+    @property
+    def micrograms_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarMassUnits.MicrogramPerMole](self._values)
+
+    
+    @property
+    def milligrams_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarMassUnits.MilligramPerMole](self._values)
+
+    
+    @property
+    def centigrams_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarMassUnits.CentigramPerMole](self._values)
+
+    
+    @property
+    def decigrams_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarMassUnits.DecigramPerMole](self._values)
+
+    
+    @property
+    def decagrams_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarMassUnits.DecagramPerMole](self._values)
+
+    
+    @property
+    def hectograms_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarMassUnits.HectogramPerMole](self._values)
+
+    
+    @property
+    def kilograms_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarMassUnits.KilogramPerMole](self._values)
+
+    
+    @property
+    def kilopounds_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarMassUnits.KilopoundPerMole](self._values)
+
+    
+    @property
+    def megapounds_per_mole(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarMassUnits.MegapoundPerMole](self._values)
+
+    
\ No newline at end of file
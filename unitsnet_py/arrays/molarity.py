@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.molarity import Molarity, MolarityUnits
+
+
+class MolarityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Molarity values, held in MolePerCubicMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (MolarityUnits): The Molarity unit of the values, The default unit is MolePerCubicMeter
+    """
+    __slots__ = ()
+
+    _quantity = Molarity
+
+    # Whole-array variants of the Molarity conversion functions.
+    _conversions_from_base = {
+        
+        MolarityUnits.MolePerCubicMeter: lambda value: (value),
+        
+        MolarityUnits.MolePerLiter: lambda value: (value * 1e-3),
+        
+        MolarityUnits.PoundMolePerCubicFoot: lambda value: (value * 6.2427960576144611956325455827221e-5),
+        
+        MolarityUnits.KilomolePerCubicMeter: lambda value: ((value) / 1000.0),
+        
+        MolarityUnits.FemtomolePerLiter: lambda value: ((value * 1e-3) / 1e-15),
+        
+        MolarityUnits.PicomolePerLiter: lambda value: ((value * 1e-3) / 1e-12),
+        
+        MolarityUnits.NanomolePerLiter: lambda value: ((value * 1e-3) / 1e-09),
+        
+        MolarityUnits.MicromolePerLiter: lambda value: ((value * 1e-3) / 1e-06),
+        
+        MolarityUnits.MillimolePerLiter: lambda value: ((value * 1e-3) / 0.001),
+        
+        MolarityUnits.CentimolePerLiter: lambda value: ((value * 1e-3) / 0.01),
+        
+        MolarityUnits.DecimolePerLiter: lambda value: ((value * 1e-3) / 0.1),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MolarityUnits.MolePerCubicMeter: lambda value: (value),
+        
+        MolarityUnits.MolePerLiter: lambda value: (value / 1e-3),
+        
+        MolarityUnits.PoundMolePerCubicFoot: lambda value: (value / 6.2427960576144611956325455827221e-5),
+        
+        MolarityUnits.KilomolePerCubicMeter: lambda value: ((value) * 1000.0),
+        
+        MolarityUnits.FemtomolePerLiter: lambda value: ((value / 1e-3) * 1e-15),
+        
+        MolarityUnits.PicomolePerLiter: lambda value: ((value / 1e-3) * 1e-12),
+        
+        MolarityUnits.NanomolePerLiter: lambda value: ((value / 1e-3) * 1e-09),
+        
+        MolarityUnits.MicromolePerLiter: lambda value: ((value / 1e-3) * 1e-06),
+        
+        MolarityUnits.MillimolePerLiter: lambda value: ((value / 1e-3) * 0.001),
+        
+        MolarityUnits.CentimolePerLiter: lambda value: ((value / 1e-3) * 0.01),
+        
+        MolarityUnits.DecimolePerLiter: lambda value: ((value / 1e-3) * 0.1),
+        
+    }
+
+    def __init__(self, values, from_unit: MolarityUnits = MolarityUnits.MolePerCubicMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: MolarityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: MolarityUnits = MolarityUnits.MolePerCubicMeter) -> MolarityArray:
+        """
+        Create a new instance of MolarityArray from values in the given unit.
+
+        :param values: The Molarity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: MolarityUnits
+        :return: A new instance of MolarityArray.
+        :rtype: MolarityArray
+        """
+        return MolarityArray(values, unit)
+
+    
+    @property
+    def moles_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarityUnits.MolePerCubicMeter](self._values)
+
+    
+    @property
+    def moles_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarityUnits.MolePerLiter](self._values)
+
+    
+    @property
+    def pound_moles_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarityUnits.PoundMolePerCubicFoot](self._values)
+
+    
+    @property
+    def kilomoles_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarityUnits.KilomolePerCubicMeter](self._values)
+
+    
+    @property
+    def femtomoles_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarityUnits.FemtomolePerLiter](self._values)
+
+    
+    @property
+    def picomoles_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarityUnits.PicomolePerLiter](self._values)
+
+    
+    @property
+    def nanomoles_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarityUnits.NanomolePerLiter](self._values)
+
+    
+    @property
+    def micromoles_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarityUnits.MicromolePerLiter](self._values)
+
+    
+    @property
+    def millimoles_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarityUnits.MillimolePerLiter](self._values)
+
+    
+    @property
+    def centimoles_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarityUnits.CentimolePerLiter](self._values)
+
+    
+    @property
+    def decimoles_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[MolarityUnits.DecimolePerLiter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.permeability import Permeability, PermeabilityUnits
+
+
+class PermeabilityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Permeability values, held in HenryPerMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (PermeabilityUnits): The Permeability unit of the values, The default unit is HenryPerMeter
+    """
+    __slots__ = ()
+
+    _quantity = Permeability
+
+    # Whole-array variants of the Permeability conversion functions.
+    _conversions_from_base = {
+        
+        PermeabilityUnits.HenryPerMeter: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        PermeabilityUnits.HenryPerMeter: lambda value: (value),
+        
+    }
+
+    def __init__(self, values, from_unit: PermeabilityUnits = PermeabilityUnits.HenryPerMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: PermeabilityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: PermeabilityUnits = PermeabilityUnits.HenryPerMeter) -> PermeabilityArray:
+        """
+        Create a new instance of PermeabilityArray from values in the given unit.
+
+        :param values: The Permeability values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: PermeabilityUnits
+        :return: A new instance of PermeabilityArray.
+        :rtype: PermeabilityArray
+        """
+        return PermeabilityArray(values, unit)
+
+    
+    @property
+    def henries_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PermeabilityUnits.HenryPerMeter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.permittivity import Permittivity, PermittivityUnits
+
+
+class PermittivityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Permittivity values, held in FaradPerMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (PermittivityUnits): The Permittivity unit of the values, The default unit is FaradPerMeter
+    """
+    __slots__ = ()
+
+    _quantity = Permittivity
+
+    # Whole-array variants of the Permittivity conversion functions.
+    _conversions_from_base = {
+        
+        PermittivityUnits.FaradPerMeter: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        PermittivityUnits.FaradPerMeter: lambda value: (value),
+        
+    }
+
+    def __init__(self, values, from_unit: PermittivityUnits = PermittivityUnits.FaradPerMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: PermittivityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: PermittivityUnits = PermittivityUnits.FaradPerMeter) -> PermittivityArray:
+        """
+        Create a new instance of PermittivityArray from values in the given unit.
+
+        :param values: The Permittivity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: PermittivityUnits
+        :return: A new instance of PermittivityArray.
+        :rtype: PermittivityArray
+        """
+        return PermittivityArray(values, unit)
+
+    
+    @property
+    def farads_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PermittivityUnits.FaradPerMeter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.porous_medium_permeability import PorousMediumPermeability, PorousMediumPermeabilityUnits
+
+
+class PorousMediumPermeabilityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of PorousMediumPermeability values, held in SquareMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (PorousMediumPermeabilityUnits): The PorousMediumPermeability unit of the values, The default unit is SquareMeter
+    """
+    __slots__ = ()
+
+    _quantity = PorousMediumPermeability
+
+    # Whole-array variants of the PorousMediumPermeability conversion functions.
+    _conversions_from_base = {
+        
+        PorousMediumPermeabilityUnits.Darcy: lambda value: (value / 9.869233e-13),
+        
+        PorousMediumPermeabilityUnits.SquareMeter: lambda value: (value),
+        
+        PorousMediumPermeabilityUnits.SquareCentimeter: lambda value: (value / 1e-4),
+        
+        PorousMediumPermeabilityUnits.Microdarcy: lambda value: ((value / 9.869233e-13) / 1e-06),
+        
+        PorousMediumPermeabilityUnits.Millidarcy: lambda value: ((value / 9.869233e-13) / 0.001),
+        
+    }
+
+    _conversions_to_base = {
+        
+        PorousMediumPermeabilityUnits.Darcy: lambda value: (value * 9.869233e-13),
+        
+        PorousMediumPermeabilityUnits.SquareMeter: lambda value: (value),
+        
+        PorousMediumPermeabilityUnits.SquareCentimeter: lambda value: (value * 1e-4),
+        
+        PorousMediumPermeabilityUnits.Microdarcy: lambda value: ((value * 9.869233e-13) * 1e-06),
+        
+        PorousMediumPermeabilityUnits.Millidarcy: lambda value: ((value * 9.869233e-13) * 0.001),
+        
+    }
+
+    def __init__(self, values, from_unit: PorousMediumPermeabilityUnits = PorousMediumPermeabilityUnits.SquareMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: PorousMediumPermeabilityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: PorousMediumPermeabilityUnits = PorousMediumPermeabilityUnits.SquareMeter) -> PorousMediumPermeabilityArray:
+        """
+        Create a new instance of PorousMediumPermeabilityArray from values in the given unit.
+
+        :param values: The PorousMediumPermeability values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: PorousMediumPermeabilityUnits
+        :return: A new instance of PorousMediumPermeabilityArray.
+        :rtype: PorousMediumPermeabilityArray
+        """
+        return PorousMediumPermeabilityArray(values, unit)
+
+    
+    @property
+    def darcys(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PorousMediumPermeabilityUnits.Darcy](self._values)
+
+    
+    @property
+    def square_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PorousMediumPermeabilityUnits.SquareMeter](self._values)
+
+    
+    @property
+    def square_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PorousMediumPermeabilityUnits.SquareCentimeter](self._values)
+
+    
+    @property
+    def microdarcys(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PorousMediumPermeabilityUnits.Microdarcy](self._values)
+
+    
+    @property
+    def millidarcys(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PorousMediumPermeabilityUnits.Millidarcy](self._values)
+
+    
\ No newline at end of file
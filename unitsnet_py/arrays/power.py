@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.power import Power, PowerUnits
+
+
+class PowerArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Power values, held in Watt.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (PowerUnits): The Power unit of the values, The default unit is Watt
+    """
+    __slots__ = ()
+
+    _quantity = Power
+
+    # Whole-array variants of the Power conversion functions.
+    _conversions_from_base = {
+        
+        PowerUnits.Watt: lambda value: (value),
+        
+        PowerUnits.MechanicalHorsepower: lambda value: (value / 745.69),
+        
+        PowerUnits.MetricHorsepower: lambda value: (value / 735.49875),
+        
+        PowerUnits.ElectricalHorsepower: lambda value: (value / 746),
+        
+        PowerUnits.BoilerHorsepower: lambda value: (value / 9812.5),
+        
+        PowerUnits.HydraulicHorsepower: lambda value: (value / 745.69988145),
+        
+        PowerUnits.BritishThermalUnitPerHour: lambda value: (value / 0.29307107017),
+        
+        PowerUnits.JoulePerHour: lambda value: (value * 3600),
+        
+        PowerUnits.Femtowatt: lambda value: ((value) / 1e-15),
+        
+        PowerUnits.Picowatt: lambda value: ((value) / 1e-12),
+        
+        PowerUnits.Nanowatt: lambda value: ((value) / 1e-09),
+        
+        PowerUnits.Microwatt: lambda value: ((value) / 1e-06),
+        
+        PowerUnits.Milliwatt: lambda value: ((value) / 0.001),
+        
+        PowerUnits.Deciwatt: lambda value: ((value) / 0.1),
+        
+        PowerUnits.Decawatt: lambda value: ((value) / 10.0),
+        
+        PowerUnits.Kilowatt: lambda value: ((value) / 1000.0),
+        
+        PowerUnits.Megawatt: lambda value: ((value) / 1000000.0),
+        
+        PowerUnits.Gigawatt: lambda value: ((value) / 1000000000.0),
+        
+        PowerUnits.Terawatt: lambda value: ((value) / 1000000000000.0),
+        
+        PowerUnits.Petawatt: lambda value: ((value) / 1000000000000000.0),
+        
+        PowerUnits.KilobritishThermalUnitPerHour: lambda value: ((value / 0.29307107017) / 1000.0),
+        
+        PowerUnits.MegabritishThermalUnitPerHour: lambda value: ((value / 0.29307107017) / 1000000.0),
+        
+        PowerUnits.MillijoulePerHour: lambda value: ((value * 3600) / 0.001),
+        
+        PowerUnits.KilojoulePerHour: lambda value: ((value * 3600) / 1000.0),
+        
+        PowerUnits.MegajoulePerHour: lambda value: ((value * 3600) / 1000000.0),
+        
+        PowerUnits.GigajoulePerHour: lambda value: ((value * 3600) / 1000000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        PowerUnits.Watt: lambda value: (value),
+        
+        PowerUnits.MechanicalHorsepower: lambda value: (value * 745.69),
+        
+        PowerUnits.MetricHorsepower: lambda value: (value * 735.49875),
+        
+        PowerUnits.ElectricalHorsepower: lambda value: (value * 746),
+        
+        PowerUnits.BoilerHorsepower: lambda value: (value * 9812.5),
+        
+        PowerUnits.HydraulicHorsepower: lambda value: (value * 745.69988145),
+        
+        PowerUnits.BritishThermalUnitPerHour: lambda value: (value * 0.29307107017),
+        
+        PowerUnits.JoulePerHour: lambda value: (value / 3600),
+        
+        PowerUnits.Femtowatt: lambda value: ((value) * 1e-15),
+        
+        PowerUnits.Picowatt: lambda value: ((value) * 1e-12),
+        
+        PowerUnits.Nanowatt: lambda value: ((value) * 1e-09),
+        
+        PowerUnits.Microwatt: lambda value: ((value) * 1e-06),
+        
+        PowerUnits.Milliwatt: lambda value: ((value) * 0.001),
+        
+        PowerUnits.Deciwatt: lambda value: ((value) * 0.1),
+        
+        PowerUnits.Decawatt: lambda value: ((value) * 10.0),
+        
+        PowerUnits.Kilowatt: lambda value: ((value) * 1000.0),
+        
+        PowerUnits.Megawatt: lambda value: ((value) * 1000000.0),
+        
+        PowerUnits.Gigawatt: lambda value: ((value) * 1000000000.0),
+        
+        PowerUnits.Terawatt: lambda value: ((value) * 1000000000000.0),
+        
+        PowerUnits.Petawatt: lambda value: ((value) * 1000000000000000.0),
+        
+        PowerUnits.KilobritishThermalUnitPerHour: lambda value: ((value * 0.29307107017) * 1000.0),
+        
+        PowerUnits.MegabritishThermalUnitPerHour: lambda value: ((value * 0.29307107017) * 1000000.0),
+        
+        PowerUnits.MillijoulePerHour: lambda value: ((value / 3600) * 0.001),
+        
+        PowerUnits.KilojoulePerHour: lambda value: ((value / 3600) * 1000.0),
+        
+        PowerUnits.MegajoulePerHour: lambda value: ((value / 3600) * 1000000.0),
+        
+        PowerUnits.GigajoulePerHour: lambda value: ((value / 3600) * 1000000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: PowerUnits = PowerUnits.Watt):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: PowerUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: PowerUnits = PowerUnits.Watt) -> PowerArray:
+        """
+        Create a new instance of PowerArray from values in the given unit.
+
+        :param values: The Power values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: PowerUnits
+        :return: A new instance of PowerArray.
+        :rtype: PowerArray
+        """
+        return PowerArray(values, unit)
+
+    
+    @property
+    def watts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.Watt](self._values)
+
+    
+    @property
+    def mechanical_horsepower(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.MechanicalHorsepower](self._values)
+
+    
+    @property
+    def metric_horsepower(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.MetricHorsepower](self._values)
+
+    
+    @property
+    def electrical_horsepower(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.ElectricalHorsepower](self._values)
+
+    
+    @property
+    def boiler_horsepower(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.BoilerHorsepower](self._values)
+
+    
+    @property
+    def hydraulic_horsepower(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.HydraulicHorsepower](self._values)
+
+    
+    @property
+    def british_thermal_units_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.BritishThermalUnitPerHour](self._values)
+
+    
+    @property
+    def joules_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.JoulePerHour](self._values)
+
+    
+    @property
+    def femtowatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.Femtowatt](self._values)
+
+    
+    @property
+    def picowatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.Picowatt](self._values)
+
+    
+    @property
+    def nanowatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.Nanowatt](self._values)
+
+    
+    @property
+    def microwatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.Microwatt](self._values)
+
+    
+    @property
+    def milliwatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.Milliwatt](self._values)
+
+    
+    @property
+    def deciwatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.Deciwatt](self._values)
+
+    
+    @property
+    def decawatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.Decawatt](self._values)
+
+    
+    @property
+    def kilowatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.Kilowatt](self._values)
+
+    
+    @property
+    def megawatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.Megawatt](self._values)
+
+    
+    @property
+    def gigawatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.Gigawatt](self._values)
+
+    
+    @property
+    def terawatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.Terawatt](self._values)
+
+    
+    @property
+    def petawatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.Petawatt](self._values)
+
+    
+    @property
+    def kilobritish_thermal_units_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.KilobritishThermalUnitPerHour](self._values)
+
+    
+    @property
+    def megabritish_thermal_units_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.MegabritishThermalUnitPerHour](self._values)
+
+    
+    @property
+    def millijoules_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.MillijoulePerHour](self._values)
+
+    
+    @property
+    def kilojoules_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.KilojoulePerHour](self._values)
+
+    
+    @property
+    def megajoules_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.MegajoulePerHour](self._values)
+
+    
+    @property
+    def gigajoules_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerUnits.GigajoulePerHour](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,578 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.power_density import PowerDensity, PowerDensityUnits
+
+
+class PowerDensityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of PowerDensity values, held in WattPerCubicMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (PowerDensityUnits): The PowerDensity unit of the values, The default unit is WattPerCubicMeter
+    """
+    __slots__ = ()
+
+    _quantity = PowerDensity
+
+    # Whole-array variants of the PowerDensity conversion functions.
+    _conversions_from_base = {
+        
+        PowerDensityUnits.WattPerCubicMeter: lambda value: (value),
+        
+        PowerDensityUnits.WattPerCubicInch: lambda value: (value / 6.102374409473228e4),
+        
+        PowerDensityUnits.WattPerCubicFoot: lambda value: (value / 3.531466672148859e1),
+        
+        PowerDensityUnits.WattPerLiter: lambda value: (value / 1.0e3),
+        
+        PowerDensityUnits.PicowattPerCubicMeter: lambda value: ((value) / 1e-12),
+        
+        PowerDensityUnits.NanowattPerCubicMeter: lambda value: ((value) / 1e-09),
+        
+        PowerDensityUnits.MicrowattPerCubicMeter: lambda value: ((value) / 1e-06),
+        
+        PowerDensityUnits.MilliwattPerCubicMeter: lambda value: ((value) / 0.001),
+        
+        PowerDensityUnits.DeciwattPerCubicMeter: lambda value: ((value) / 0.1),
+        
+        PowerDensityUnits.DecawattPerCubicMeter: lambda value: ((value) / 10.0),
+        
+        PowerDensityUnits.KilowattPerCubicMeter: lambda value: ((value) / 1000.0),
+        
+        PowerDensityUnits.MegawattPerCubicMeter: lambda value: ((value) / 1000000.0),
+        
+        PowerDensityUnits.GigawattPerCubicMeter: lambda value: ((value) / 1000000000.0),
+        
+        PowerDensityUnits.TerawattPerCubicMeter: lambda value: ((value) / 1000000000000.0),
+        
+        PowerDensityUnits.PicowattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 1e-12),
+        
+        PowerDensityUnits.NanowattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 1e-09),
+        
+        PowerDensityUnits.MicrowattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 1e-06),
+        
+        PowerDensityUnits.MilliwattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 0.001),
+        
+        PowerDensityUnits.DeciwattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 0.1),
+        
+        PowerDensityUnits.DecawattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 10.0),
+        
+        PowerDensityUnits.KilowattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 1000.0),
+        
+        PowerDensityUnits.MegawattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 1000000.0),
+        
+        PowerDensityUnits.GigawattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 1000000000.0),
+        
+        PowerDensityUnits.TerawattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 1000000000000.0),
+        
+        PowerDensityUnits.PicowattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 1e-12),
+        
+        PowerDensityUnits.NanowattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 1e-09),
+        
+        PowerDensityUnits.MicrowattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 1e-06),
+        
+        PowerDensityUnits.MilliwattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 0.001),
+        
+        PowerDensityUnits.DeciwattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 0.1),
+        
+        PowerDensityUnits.DecawattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 10.0),
+        
+        PowerDensityUnits.KilowattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 1000.0),
+        
+        PowerDensityUnits.MegawattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 1000000.0),
+        
+        PowerDensityUnits.GigawattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 1000000000.0),
+        
+        PowerDensityUnits.TerawattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 1000000000000.0),
+        
+        PowerDensityUnits.PicowattPerLiter: lambda value: ((value / 1.0e3) / 1e-12),
+        
+        PowerDensityUnits.NanowattPerLiter: lambda value: ((value / 1.0e3) / 1e-09),
+        
+        PowerDensityUnits.MicrowattPerLiter: lambda value: ((value / 1.0e3) / 1e-06),
+        
+        PowerDensityUnits.MilliwattPerLiter: lambda value: ((value / 1.0e3) / 0.001),
+        
+        PowerDensityUnits.DeciwattPerLiter: lambda value: ((value / 1.0e3) / 0.1),
+        
+        PowerDensityUnits.DecawattPerLiter: lambda value: ((value / 1.0e3) / 10.0),
+        
+        PowerDensityUnits.KilowattPerLiter: lambda value: ((value / 1.0e3) / 1000.0),
+        
+        PowerDensityUnits.MegawattPerLiter: lambda value: ((value / 1.0e3) / 1000000.0),
+        
+        PowerDensityUnits.GigawattPerLiter: lambda value: ((value / 1.0e3) / 1000000000.0),
+        
+        PowerDensityUnits.TerawattPerLiter: lambda value: ((value / 1.0e3) / 1000000000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        PowerDensityUnits.WattPerCubicMeter: lambda value: (value),
+        
+        PowerDensityUnits.WattPerCubicInch: lambda value: (value * 6.102374409473228e4),
+        
+        PowerDensityUnits.WattPerCubicFoot: lambda value: (value * 3.531466672148859e1),
+        
+        PowerDensityUnits.WattPerLiter: lambda value: (value * 1.0e3),
+        
+        PowerDensityUnits.PicowattPerCubicMeter: lambda value: ((value) * 1e-12),
+        
+        PowerDensityUnits.NanowattPerCubicMeter: lambda value: ((value) * 1e-09),
+        
+        PowerDensityUnits.MicrowattPerCubicMeter: lambda value: ((value) * 1e-06),
+        
+        PowerDensityUnits.MilliwattPerCubicMeter: lambda value: ((value) * 0.001),
+        
+        PowerDensityUnits.DeciwattPerCubicMeter: lambda value: ((value) * 0.1),
+        
+        PowerDensityUnits.DecawattPerCubicMeter: lambda value: ((value) * 10.0),
+        
+        PowerDensityUnits.KilowattPerCubicMeter: lambda value: ((value) * 1000.0),
+        
+        PowerDensityUnits.MegawattPerCubicMeter: lambda value: ((value) * 1000000.0),
+        
+        PowerDensityUnits.GigawattPerCubicMeter: lambda value: ((value) * 1000000000.0),
+        
+        PowerDensityUnits.TerawattPerCubicMeter: lambda value: ((value) * 1000000000000.0),
+        
+        PowerDensityUnits.PicowattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 1e-12),
+        
+        PowerDensityUnits.NanowattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 1e-09),
+        
+        PowerDensityUnits.MicrowattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 1e-06),
+        
+        PowerDensityUnits.MilliwattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 0.001),
+        
+        PowerDensityUnits.DeciwattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 0.1),
+        
+        PowerDensityUnits.DecawattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 10.0),
+        
+        PowerDensityUnits.KilowattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 1000.0),
+        
+        PowerDensityUnits.MegawattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 1000000.0),
+        
+        PowerDensityUnits.GigawattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 1000000000.0),
+        
+        PowerDensityUnits.TerawattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 1000000000000.0),
+        
+        PowerDensityUnits.PicowattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 1e-12),
+        
+        PowerDensityUnits.NanowattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 1e-09),
+        
+        PowerDensityUnits.MicrowattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 1e-06),
+        
+        PowerDensityUnits.MilliwattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 0.001),
+        
+        PowerDensityUnits.DeciwattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 0.1),
+        
+        PowerDensityUnits.DecawattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 10.0),
+        
+        PowerDensityUnits.KilowattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 1000.0),
+        
+        PowerDensityUnits.MegawattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 1000000.0),
+        
+        PowerDensityUnits.GigawattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 1000000000.0),
+        
+        PowerDensityUnits.TerawattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 1000000000000.0),
+        
+        PowerDensityUnits.PicowattPerLiter: lambda value: ((value * 1.0e3) * 1e-12),
+        
+        PowerDensityUnits.NanowattPerLiter: lambda value: ((value * 1.0e3) * 1e-09),
+        
+        PowerDensityUnits.MicrowattPerLiter: lambda value: ((value * 1.0e3) * 1e-06),
+        
+        PowerDensityUnits.MilliwattPerLiter: lambda value: ((value * 1.0e3) * 0.001),
+        
+        PowerDensityUnits.DeciwattPerLiter: lambda value: ((value * 1.0e3) * 0.1),
+        
+        PowerDensityUnits.DecawattPerLiter: lambda value: ((value * 1.0e3) * 10.0),
+        
+        PowerDensityUnits.KilowattPerLiter: lambda value: ((value * 1.0e3) * 1000.0),
+        
+        PowerDensityUnits.MegawattPerLiter: lambda value: ((value * 1.0e3) * 1000000.0),
+        
+        PowerDensityUnits.GigawattPerLiter: lambda value: ((value * 1.0e3) * 1000000000.0),
+        
+        PowerDensityUnits.TerawattPerLiter: lambda value: ((value * 1.0e3) * 1000000000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: PowerDensityUnits = PowerDensityUnits.WattPerCubicMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: PowerDensityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: PowerDensityUnits = PowerDensityUnits.WattPerCubicMeter) -> PowerDensityArray:
+        """
+        Create a new instance of PowerDensityArray from values in the given unit.
+
+        :param values: The PowerDensity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: PowerDensityUnits
+        :return: A new instance of PowerDensityArray.
+        :rtype: PowerDensityArray
+        """
+        return PowerDensityArray(values, unit)
+
+    
+    @property
+    def watts_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.WattPerCubicMeter](self._values)
+
+    
+    @property
+    def watts_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.WattPerCubicInch](self._values)
+
+    
+    @property
+    def watts_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.WattPerCubicFoot](self._values)
+
+    
+    @property
+    def watts_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.WattPerLiter](self._values)
+
+    
+    @property
+    def picowatts_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.PicowattPerCubicMeter](self._values)
+
+    
+    @property
+    def nanowatts_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.NanowattPerCubicMeter](self._values)
+
+    
+    @property
+    def microwatts_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.MicrowattPerCubicMeter](self._values)
+
+    
+    @property
+    def milliwatts_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.MilliwattPerCubicMeter](self._values)
+
+    
+    @property
+    def deciwatts_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.DeciwattPerCubicMeter](self._values)
+
+    
+    @property
+    def decawatts_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.DecawattPerCubicMeter](self._values)
+
+    
+    @property
+    def kilowatts_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.KilowattPerCubicMeter](self._values)
+
+    
+    @property
+    def megawatts_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.MegawattPerCubicMeter](self._values)
+
+    
+    @property
+    def gigawatts_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.GigawattPerCubicMeter](self._values)
+
+    
+    @property
+    def terawatts_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.TerawattPerCubicMeter](self._values)
+
+    
+    @property
+    def picowatts_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.PicowattPerCubicInch](self._values)
+
+    
+    @property
+    def nanowatts_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.NanowattPerCubicInch](self._values)
+
+    
+    @property
+    def microwatts_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.MicrowattPerCubicInch](self._values)
+
+    
+    @property
+    def milliwatts_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.MilliwattPerCubicInch](self._values)
+
+    
+    @property
+    def deciwatts_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.DeciwattPerCubicInch](self._values)
+
+    
+    @property
+    def decawatts_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.DecawattPerCubicInch](self._values)
+
+    
+    @property
+    def kilowatts_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.KilowattPerCubicInch](self._values)
+
+    
+    @property
+    def megawatts_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.MegawattPerCubicInch](self._values)
+
+    
+    @property
+    def gigawatts_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.GigawattPerCubicInch](self._values)
+
+    
+    @property
+    def terawatts_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.TerawattPerCubicInch](self._values)
+
+    
+    @property
+    def picowatts_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.PicowattPerCubicFoot](self._values)
+
+    
+    @property
+    def nanowatts_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.NanowattPerCubicFoot](self._values)
+
+    
+    @property
+    def microwatts_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.MicrowattPerCubicFoot](self._values)
+
+    
+    @property
+    def milliwatts_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.MilliwattPerCubicFoot](self._values)
+
+    
+    @property
+    def deciwatts_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.DeciwattPerCubicFoot](self._values)
+
+    
+    @property
+    def decawatts_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.DecawattPerCubicFoot](self._values)
+
+    
+    @property
+    def kilowatts_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.KilowattPerCubicFoot](self._values)
+
+    
+    @property
+    def megawatts_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.MegawattPerCubicFoot](self._values)
+
+    
+    @property
+    def gigawatts_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.GigawattPerCubicFoot](self._values)
+
+    
+    @property
+    def terawatts_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.TerawattPerCubicFoot](self._values)
+
+    
+    @property
+    def picowatts_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.PicowattPerLiter](self._values)
+
+    
+    @property
+    def nanowatts_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.NanowattPerLiter](self._values)
+
+    
+    @property
+    def microwatts_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.MicrowattPerLiter](self._values)
+
+    
+    @property
+    def milliwatts_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.MilliwattPerLiter](self._values)
+
+    
+    @property
+    def deciwatts_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.DeciwattPerLiter](self._values)
+
+    
+    @property
+    def decawatts_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.DecawattPerLiter](self._values)
+
+    
+    @property
+    def kilowatts_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.KilowattPerLiter](self._values)
+
+    
+    @property
+    def megawatts_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.MegawattPerLiter](self._values)
+
+    
+    @property
+    def gigawatts_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.GigawattPerLiter](self._values)
+
+    
+    @property
+    def terawatts_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerDensityUnits.TerawattPerLiter](self._values)
+
+    
\ No newline at end of file
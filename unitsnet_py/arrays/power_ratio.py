@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.power_ratio import PowerRatio, PowerRatioUnits
+
+
+class PowerRatioArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of PowerRatio values, held in DecibelWatt.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (PowerRatioUnits): The PowerRatio unit of the values, The default unit is DecibelWatt
+    """
+    __slots__ = ()
+
+    _quantity = PowerRatio
+
+    # Whole-array variants of the PowerRatio conversion functions.
+    _conversions_from_base = {
+        
+        PowerRatioUnits.DecibelWatt: lambda value: (value),
+        
+        PowerRatioUnits.DecibelMilliwatt: lambda value: (value + 30),
+        
+    }
+
+    _conversions_to_base = {
+        
+        PowerRatioUnits.DecibelWatt: lambda value: (value),
+        
+        PowerRatioUnits.DecibelMilliwatt: lambda value: (value - 30),
+        
+    }
+
+    def __init__(self, values, from_unit: PowerRatioUnits = PowerRatioUnits.DecibelWatt):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: PowerRatioUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: PowerRatioUnits = PowerRatioUnits.DecibelWatt) -> PowerRatioArray:
+        """
+        Create a new instance of PowerRatioArray from values in the given unit.
+
+        :param values: The PowerRatio values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: PowerRatioUnits
+        :return: A new instance of PowerRatioArray.
+        :rtype: PowerRatioArray
+        """
+        return PowerRatioArray(values, unit)
+
+    
+    @property
+    def decibel_watts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerRatioUnits.DecibelWatt](self._values)
+
+    
+    @property
+    def decibel_milliwatts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PowerRatioUnits.DecibelMilliwatt](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,638 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.pressure import Pressure, PressureUnits
+
+
+class PressureArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Pressure values, held in Pascal.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (PressureUnits): The Pressure unit of the values, The default unit is Pascal
+    """
+    __slots__ = ()
+
+    _quantity = Pressure
+
+    # Whole-array variants of the Pressure conversion functions.
+    _conversions_from_base = {
+        
+        PressureUnits.Pascal: lambda value: (value),
+        
+        PressureUnits.Atmosphere: lambda value: (value / (1.01325 * 1e5)),
+        
+        PressureUnits.Bar: lambda value: (value / 1e5),
+        
+        PressureUnits.KilogramForcePerSquareMeter: lambda value: (value * 0.101971619222242),
+        
+        PressureUnits.KilogramForcePerSquareCentimeter: lambda value: (value / 9.80665e4),
+        
+        PressureUnits.KilogramForcePerSquareMillimeter: lambda value: (value / 9.80665e6),
+        
+        PressureUnits.NewtonPerSquareMeter: lambda value: (value),
+        
+        PressureUnits.NewtonPerSquareCentimeter: lambda value: (value / 1e4),
+        
+        PressureUnits.NewtonPerSquareMillimeter: lambda value: (value / 1e6),
+        
+        PressureUnits.TechnicalAtmosphere: lambda value: (value / (9.80680592331 * 1e4)),
+        
+        PressureUnits.Torr: lambda value: (value / (1.3332266752 * 1e2)),
+        
+        PressureUnits.PoundForcePerSquareInch: lambda value: (value / 6.894757293168361e3),
+        
+        PressureUnits.PoundForcePerSquareMil: lambda value: (value / 6.894757293168361e9),
+        
+        PressureUnits.PoundForcePerSquareFoot: lambda value: (value / 4.788025898033584e1),
+        
+        PressureUnits.TonneForcePerSquareMillimeter: lambda value: (value / 9.80665e9),
+        
+        PressureUnits.TonneForcePerSquareMeter: lambda value: (value / 9.80665e3),
+        
+        PressureUnits.MeterOfHead: lambda value: (value * 0.0001019977334),
+        
+        PressureUnits.TonneForcePerSquareCentimeter: lambda value: (value / 9.80665e7),
+        
+        PressureUnits.FootOfHead: lambda value: (value * 0.000334552565551),
+        
+        PressureUnits.MillimeterOfMercury: lambda value: (value * 7.50061561302643e-3),
+        
+        PressureUnits.InchOfMercury: lambda value: (value * 2.95299830714159e-4),
+        
+        PressureUnits.DynePerSquareCentimeter: lambda value: (value / 1.0e-1),
+        
+        PressureUnits.PoundPerInchSecondSquared: lambda value: (value / 1.785796732283465e1),
+        
+        PressureUnits.MeterOfWaterColumn: lambda value: (value / 9.806650000000272e3),
+        
+        PressureUnits.InchOfWaterColumn: lambda value: (value / 249.08890833333),
+        
+        PressureUnits.MeterOfElevation: lambda value: ((1.0 - np.power(value / 101325.0, 0.190284)) * 44307.69396),
+        
+        PressureUnits.FootOfElevation: lambda value: ((1.0 - np.power(value / 101325.0, 0.190284)) * 145366.45),
+        
+        PressureUnits.Micropascal: lambda value: ((value) / 1e-06),
+        
+        PressureUnits.Millipascal: lambda value: ((value) / 0.001),
+        
+        PressureUnits.Decapascal: lambda value: ((value) / 10.0),
+        
+        PressureUnits.Hectopascal: lambda value: ((value) / 100.0),
+        
+        PressureUnits.Kilopascal: lambda value: ((value) / 1000.0),
+        
+        PressureUnits.Megapascal: lambda value: ((value) / 1000000.0),
+        
+        PressureUnits.Gigapascal: lambda value: ((value) / 1000000000.0),
+        
+        PressureUnits.Microbar: lambda value: ((value / 1e5) / 1e-06),
+        
+        PressureUnits.Millibar: lambda value: ((value / 1e5) / 0.001),
+        
+        PressureUnits.Centibar: lambda value: ((value / 1e5) / 0.01),
+        
+        PressureUnits.Decibar: lambda value: ((value / 1e5) / 0.1),
+        
+        PressureUnits.Kilobar: lambda value: ((value / 1e5) / 1000.0),
+        
+        PressureUnits.Megabar: lambda value: ((value / 1e5) / 1000000.0),
+        
+        PressureUnits.KilonewtonPerSquareMeter: lambda value: ((value) / 1000.0),
+        
+        PressureUnits.MeganewtonPerSquareMeter: lambda value: ((value) / 1000000.0),
+        
+        PressureUnits.KilonewtonPerSquareCentimeter: lambda value: ((value / 1e4) / 1000.0),
+        
+        PressureUnits.KilonewtonPerSquareMillimeter: lambda value: ((value / 1e6) / 1000.0),
+        
+        PressureUnits.KilopoundForcePerSquareInch: lambda value: ((value / 6.894757293168361e3) / 1000.0),
+        
+        PressureUnits.KilopoundForcePerSquareMil: lambda value: ((value / 6.894757293168361e9) / 1000.0),
+        
+        PressureUnits.KilopoundForcePerSquareFoot: lambda value: ((value / 4.788025898033584e1) / 1000.0),
+        
+        PressureUnits.MillimeterOfWaterColumn: lambda value: ((value / 9.806650000000272e3) / 0.001),
+        
+        PressureUnits.CentimeterOfWaterColumn: lambda value: ((value / 9.806650000000272e3) / 0.01),
+        
+    }
+
+    _conversions_to_base = {
+        
+        PressureUnits.Pascal: lambda value: (value),
+        
+        PressureUnits.Atmosphere: lambda value: (value * 1.01325 * 1e5),
+        
+        PressureUnits.Bar: lambda value: (value * 1e5),
+        
+        PressureUnits.KilogramForcePerSquareMeter: lambda value: (value * 9.80665019960652),
+        
+        PressureUnits.KilogramForcePerSquareCentimeter: lambda value: (value * 9.80665e4),
+        
+        PressureUnits.KilogramForcePerSquareMillimeter: lambda value: (value * 9.80665e6),
+        
+        PressureUnits.NewtonPerSquareMeter: lambda value: (value),
+        
+        PressureUnits.NewtonPerSquareCentimeter: lambda value: (value * 1e4),
+        
+        PressureUnits.NewtonPerSquareMillimeter: lambda value: (value * 1e6),
+        
+        PressureUnits.TechnicalAtmosphere: lambda value: (value * 9.80680592331 * 1e4),
+        
+        PressureUnits.Torr: lambda value: (value * 1.3332266752 * 1e2),
+        
+        PressureUnits.PoundForcePerSquareInch: lambda value: (value * 6.894757293168361e3),
+        
+        PressureUnits.PoundForcePerSquareMil: lambda value: (value * 6.894757293168361e9),
+        
+        PressureUnits.PoundForcePerSquareFoot: lambda value: (value * 4.788025898033584e1),
+        
+        PressureUnits.TonneForcePerSquareMillimeter: lambda value: (value * 9.80665e9),
+        
+        PressureUnits.TonneForcePerSquareMeter: lambda value: (value * 9.80665e3),
+        
+        PressureUnits.MeterOfHead: lambda value: (value * 9804.139432),
+        
+        PressureUnits.TonneForcePerSquareCentimeter: lambda value: (value * 9.80665e7),
+        
+        PressureUnits.FootOfHead: lambda value: (value * 2989.0669),
+        
+        PressureUnits.MillimeterOfMercury: lambda value: (value / 7.50061561302643e-3),
+        
+        PressureUnits.InchOfMercury: lambda value: (value / 2.95299830714159e-4),
+        
+        PressureUnits.DynePerSquareCentimeter: lambda value: (value * 1.0e-1),
+        
+        PressureUnits.PoundPerInchSecondSquared: lambda value: (value * 1.785796732283465e1),
+        
+        PressureUnits.MeterOfWaterColumn: lambda value: (value * 9.806650000000272e3),
+        
+        PressureUnits.InchOfWaterColumn: lambda value: (value * 249.08890833333),
+        
+        PressureUnits.MeterOfElevation: lambda value: (np.power(1.0 - (value / 44307.69396), 5.2553026003237266401799415610351) * 101325.0),
+        
+        PressureUnits.FootOfElevation: lambda value: (np.power(1.0 - (value / 145366.45), 5.2553026003237266401799415610351) * 101325.0),
+        
+        PressureUnits.Micropascal: lambda value: ((value) * 1e-06),
+        
+        PressureUnits.Millipascal: lambda value: ((value) * 0.001),
+        
+        PressureUnits.Decapascal: lambda value: ((value) * 10.0),
+        
+        PressureUnits.Hectopascal: lambda value: ((value) * 100.0),
+        
+        PressureUnits.Kilopascal: lambda value: ((value) * 1000.0),
+        
+        PressureUnits.Megapascal: lambda value: ((value) * 1000000.0),
+        
+        PressureUnits.Gigapascal: lambda value: ((value) * 1000000000.0),
+        
+        PressureUnits.Microbar: lambda value: ((value * 1e5) * 1e-06),
+        
+        PressureUnits.Millibar: lambda value: ((value * 1e5) * 0.001),
+        
+        PressureUnits.Centibar: lambda value: ((value * 1e5) * 0.01),
+        
+        PressureUnits.Decibar: lambda value: ((value * 1e5) * 0.1),
+        
+        PressureUnits.Kilobar: lambda value: ((value * 1e5) * 1000.0),
+        
+        PressureUnits.Megabar: lambda value: ((value * 1e5) * 1000000.0),
+        
+        PressureUnits.KilonewtonPerSquareMeter: lambda value: ((value) * 1000.0),
+        
+        PressureUnits.MeganewtonPerSquareMeter: lambda value: ((value) * 1000000.0),
+        
+        PressureUnits.KilonewtonPerSquareCentimeter: lambda value: ((value * 1e4) * 1000.0),
+        
+        PressureUnits.KilonewtonPerSquareMillimeter: lambda value: ((value * 1e6) * 1000.0),
+        
+        PressureUnits.KilopoundForcePerSquareInch: lambda value: ((value * 6.894757293168361e3) * 1000.0),
+        
+        PressureUnits.KilopoundForcePerSquareMil: lambda value: ((value * 6.894757293168361e9) * 1000.0),
+        
+        PressureUnits.KilopoundForcePerSquareFoot: lambda value: ((value * 4.788025898033584e1) * 1000.0),
+        
+        PressureUnits.MillimeterOfWaterColumn: lambda value: ((value * 9.806650000000272e3) * 0.001),
+        
+        PressureUnits.CentimeterOfWaterColumn: lambda value: ((value * 9.806650000000272e3) * 0.01),
+        
+    }
+
+    def __init__(self, values, from_unit: PressureUnits = PressureUnits.Pascal):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: PressureUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: PressureUnits = PressureUnits.Pascal) -> PressureArray:
+        """
+        Create a new instance of PressureArray from values in the given unit.
+
+        :param values: The Pressure values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: PressureUnits
+        :return: A new instance of PressureArray.
+        :rtype: PressureArray
+        """
+        return PressureArray(values, unit)
+
+    
+    @property
+    def pascals(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Pascal](self._values)
+
+    
+    @property
+    def atmospheres(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Atmosphere](self._values)
+
+    
+    @property
+    def bars(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Bar](self._values)
+
+    
+    @property
+    def kilograms_force_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.KilogramForcePerSquareMeter](self._values)
+
+    
+    @property
+    def kilograms_force_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.KilogramForcePerSquareCentimeter](self._values)
+
+    
+    @property
+    def kilograms_force_per_square_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.KilogramForcePerSquareMillimeter](self._values)
+
+    
+    @property
+    def newtons_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.NewtonPerSquareMeter](self._values)
+
+    
+    @property
+    def newtons_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.NewtonPerSquareCentimeter](self._values)
+
+    
+    @property
+    def newtons_per_square_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.NewtonPerSquareMillimeter](self._values)
+
+    
+    @property
+    def technical_atmospheres(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.TechnicalAtmosphere](self._values)
+
+    
+    @property
+    def torrs(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Torr](self._values)
+
+    
+    @property
+    def pounds_force_per_square_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.PoundForcePerSquareInch](self._values)
+
+    
+    @property
+    def pounds_force_per_square_mil(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.PoundForcePerSquareMil](self._values)
+
+    
+    @property
+    def pounds_force_per_square_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.PoundForcePerSquareFoot](self._values)
+
+    
+    @property
+    def tonnes_force_per_square_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.TonneForcePerSquareMillimeter](self._values)
+
+    
+    @property
+    def tonnes_force_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.TonneForcePerSquareMeter](self._values)
+
+    
+    @property
+    def meters_of_head(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.MeterOfHead](self._values)
+
+    
+    @property
+    def tonnes_force_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.TonneForcePerSquareCentimeter](self._values)
+
+    
+    @property
+    def feet_of_head(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.FootOfHead](self._values)
+
+    
+    @property
+    def millimeters_of_mercury(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.MillimeterOfMercury](self._values)
+
+    
+    @property
+    def inches_of_mercury(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.InchOfMercury](self._values)
+
+    
+    @property
+    def dynes_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.DynePerSquareCentimeter](self._values)
+
+    
+    @property
+    def pounds_per_inch_second_squared(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.PoundPerInchSecondSquared](self._values)
+
+    
+    @property
+    def meters_of_water_column(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.MeterOfWaterColumn](self._values)
+
+    
+    @property
+    def inches_of_water_column(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.InchOfWaterColumn](self._values)
+
+    
+    @property
+    def meters_of_elevation(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.MeterOfElevation](self._values)
+
+    
+    @property
+    def feet_of_elevation(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.FootOfElevation](self._values)
+
+    
+    @property
+    def micropascals(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Micropascal](self._values)
+
+    
+    @property
+    def millipascals(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Millipascal](self._values)
+
+    
+    @property
+    def decapascals(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Decapascal](self._values)
+
+    
+    @property
+    def hectopascals(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Hectopascal](self._values)
+
+    
+    @property
+    def kilopascals(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Kilopascal](self._values)
+
+    
+    @property
+    def megapascals(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Megapascal](self._values)
+
+    
+    @property
+    def gigapascals(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Gigapascal](self._values)
+
+    
+    @property
+    def microbars(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Microbar](self._values)
+
+    
+    @property
+    def millibars(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Millibar](self._values)
+
+    
+    @property
+    def centibars(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Centibar](self._values)
+
+    
+    @property
+    def decibars(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Decibar](self._values)
+
+    
+    @property
+    def kilobars(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Kilobar](self._values)
+
+    
+    @property
+    def megabars(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.Megabar](self._values)
+
+    
+    @property
+    def kilonewtons_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.KilonewtonPerSquareMeter](self._values)
+
+    
+    @property
+    def meganewtons_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.MeganewtonPerSquareMeter](self._values)
+
+    
+    @property
+    def kilonewtons_per_square_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.KilonewtonPerSquareCentimeter](self._values)
+
+    
+    @property
+    def kilonewtons_per_square_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.KilonewtonPerSquareMillimeter](self._values)
+
+    
+    @property
+    def kilopounds_force_per_square_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.KilopoundForcePerSquareInch](self._values)
+
+    
+    @property
+    def kilopounds_force_per_square_mil(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.KilopoundForcePerSquareMil](self._values)
+
+    
+    @property
+    def kilopounds_force_per_square_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.KilopoundForcePerSquareFoot](self._values)
+
+    
+    @property
+    def millimeters_of_water_column(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.MillimeterOfWaterColumn](self._values)
+
+    
+    @property
+    def centimeters_of_water_column(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureUnits.CentimeterOfWaterColumn](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.pressure_change_rate import PressureChangeRate, PressureChangeRateUnits
+
+
+class PressureChangeRateArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of PressureChangeRate values, held in PascalPerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (PressureChangeRateUnits): The PressureChangeRate unit of the values, The default unit is PascalPerSecond
+    """
+    __slots__ = ()
+
+    _quantity = PressureChangeRate
+
+    # Whole-array variants of the PressureChangeRate conversion functions.
+    _conversions_from_base = {
+        
+        PressureChangeRateUnits.PascalPerSecond: lambda value: (value),
+        
+        PressureChangeRateUnits.PascalPerMinute: lambda value: (value * 60),
+        
+        PressureChangeRateUnits.MillimeterOfMercuryPerSecond: lambda value: (value / 133.322),
+        
+        PressureChangeRateUnits.AtmospherePerSecond: lambda value: (value / (1.01325 * 1e5)),
+        
+        PressureChangeRateUnits.PoundForcePerSquareInchPerSecond: lambda value: (value / 6.894757293168361e3),
+        
+        PressureChangeRateUnits.PoundForcePerSquareInchPerMinute: lambda value: (value / 6.894757293168361e3 * 60),
+        
+        PressureChangeRateUnits.BarPerSecond: lambda value: (value / 1e5),
+        
+        PressureChangeRateUnits.BarPerMinute: lambda value: (value / 1e5 * 60),
+        
+        PressureChangeRateUnits.KilopascalPerSecond: lambda value: ((value) / 1000.0),
+        
+        PressureChangeRateUnits.MegapascalPerSecond: lambda value: ((value) / 1000000.0),
+        
+        PressureChangeRateUnits.KilopascalPerMinute: lambda value: ((value * 60) / 1000.0),
+        
+        PressureChangeRateUnits.MegapascalPerMinute: lambda value: ((value * 60) / 1000000.0),
+        
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerSecond: lambda value: ((value / 6.894757293168361e3) / 1000.0),
+        
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerSecond: lambda value: ((value / 6.894757293168361e3) / 1000000.0),
+        
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerMinute: lambda value: ((value / 6.894757293168361e3 * 60) / 1000.0),
+        
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerMinute: lambda value: ((value / 6.894757293168361e3 * 60) / 1000000.0),
+        
+        PressureChangeRateUnits.MillibarPerSecond: lambda value: ((value / 1e5) / 0.001),
+        
+        PressureChangeRateUnits.MillibarPerMinute: lambda value: ((value / 1e5 * 60) / 0.001),
+        
+    }
+
+    _conversions_to_base = {
+        
+        PressureChangeRateUnits.PascalPerSecond: lambda value: (value),
+        
+        PressureChangeRateUnits.PascalPerMinute: lambda value: (value / 60),
+        
+        PressureChangeRateUnits.MillimeterOfMercuryPerSecond: lambda value: (value * 133.322),
+        
+        PressureChangeRateUnits.AtmospherePerSecond: lambda value: (value * 1.01325 * 1e5),
+        
+        PressureChangeRateUnits.PoundForcePerSquareInchPerSecond: lambda value: (value * 6.894757293168361e3),
+        
+        PressureChangeRateUnits.PoundForcePerSquareInchPerMinute: lambda value: (value * 6.894757293168361e3 / 60),
+        
+        PressureChangeRateUnits.BarPerSecond: lambda value: (value * 1e5),
+        
+        PressureChangeRateUnits.BarPerMinute: lambda value: (value * 1e5 / 60),
+        
+        PressureChangeRateUnits.KilopascalPerSecond: lambda value: ((value) * 1000.0),
+        
+        PressureChangeRateUnits.MegapascalPerSecond: lambda value: ((value) * 1000000.0),
+        
+        PressureChangeRateUnits.KilopascalPerMinute: lambda value: ((value / 60) * 1000.0),
+        
+        PressureChangeRateUnits.MegapascalPerMinute: lambda value: ((value / 60) * 1000000.0),
+        
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerSecond: lambda value: ((value * 6.894757293168361e3) * 1000.0),
+        
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerSecond: lambda value: ((value * 6.894757293168361e3) * 1000000.0),
+        
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerMinute: lambda value: ((value * 6.894757293168361e3 / 60) * 1000.0),
+        
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerMinute: lambda value: ((value * 6.894757293168361e3 / 60) * 1000000.0),
+        
+        PressureChangeRateUnits.MillibarPerSecond: lambda value: ((value * 1e5) * 0.001),
+        
+        PressureChangeRateUnits.MillibarPerMinute: lambda value: ((value * 1e5 / 60) * 0.001),
+        
+    }
+
+    def __init__(self, values, from_unit: PressureChangeRateUnits = PressureChangeRateUnits.PascalPerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: PressureChangeRateUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: PressureChangeRateUnits = PressureChangeRateUnits.PascalPerSecond) -> PressureChangeRateArray:
+        """
+        Create a new instance of PressureChangeRateArray from values in the given unit.
+
+        :param values: The PressureChangeRate values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: PressureChangeRateUnits
+        :return: A new instance of PressureChangeRateArray.
+        :rtype: PressureChangeRateArray
+        """
+        return PressureChangeRateArray(values, unit)
+
+    
+    @property
+    def pascals_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.PascalPerSecond](self._values)
+
+    
+    @property
+    def pascals_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.PascalPerMinute](self._values)
+
+    
+    @property
+    def millimeters_of_mercury_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.MillimeterOfMercuryPerSecond](self._values)
+
+    
+    @property
+    def atmospheres_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.AtmospherePerSecond](self._values)
+
+    
+    @property
+    def pounds_force_per_square_inch_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.PoundForcePerSquareInchPerSecond](self._values)
+
+    
+    @property
+    def pounds_force_per_square_inch_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.PoundForcePerSquareInchPerMinute](self._values)
+
+    
+    @property
+    def bars_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.BarPerSecond](self._values)
+
+    
+    @property
+    def bars_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.BarPerMinute](self._values)
+
+    
+    @property
+    def kilopascals_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.KilopascalPerSecond](self._values)
+
+    
+    @property
+    def megapascals_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.MegapascalPerSecond](self._values)
+
+    
+    @property
+    def kilopascals_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.KilopascalPerMinute](self._values)
+
+    
+    @property
+    def megapascals_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.MegapascalPerMinute](self._values)
+
+    
+    @property
+    def kilopounds_force_per_square_inch_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.KilopoundForcePerSquareInchPerSecond](self._values)
+
+    
+    @property
+    def megapounds_force_per_square_inch_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.MegapoundForcePerSquareInchPerSecond](self._values)
+
+    
+    @property
+    def kilopounds_force_per_square_inch_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.KilopoundForcePerSquareInchPerMinute](self._values)
+
+    
+    @property
+    def megapounds_force_per_square_inch_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.MegapoundForcePerSquareInchPerMinute](self._values)
+
+    
+    @property
+    def millibars_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.MillibarPerSecond](self._values)
+
+    
+    @property
+    def millibars_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[PressureChangeRateUnits.MillibarPerMinute](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.ratio import Ratio, RatioUnits
+
+
+class RatioArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Ratio values, held in DecimalFraction.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (RatioUnits): The Ratio unit of the values, The default unit is DecimalFraction
+    """
+    __slots__ = ()
+
+    _quantity = Ratio
+
+    # Whole-array variants of the Ratio conversion functions.
+    _conversions_from_base = {
+        
+        RatioUnits.DecimalFraction: lambda value: (value),
+        
+        RatioUnits.Percent: lambda value: (value * 1e2),
+        
+        RatioUnits.PartPerThousand: lambda value: (value * 1e3),
+        
+        RatioUnits.PartPerMillion: lambda value: (value * 1e6),
+        
+        RatioUnits.PartPerBillion: lambda value: (value * 1e9),
+        
+        RatioUnits.PartPerTrillion: lambda value: (value * 1e12),
+        
+    }
+
+    _conversions_to_base = {
+        
+        RatioUnits.DecimalFraction: lambda value: (value),
+        
+        RatioUnits.Percent: lambda value: (value / 1e2),
+        
+        RatioUnits.PartPerThousand: lambda value: (value / 1e3),
+        
+        RatioUnits.PartPerMillion: lambda value: (value / 1e6),
+        
+        RatioUnits.PartPerBillion: lambda value: (value / 1e9),
+        
+        RatioUnits.PartPerTrillion: lambda value: (value / 1e12),
+        
+    }
+
+    def __init__(self, values, from_unit: RatioUnits = RatioUnits.DecimalFraction):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: RatioUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: RatioUnits = RatioUnits.DecimalFraction) -> RatioArray:
+        """
+        Create a new instance of RatioArray from values in the given unit.
+
+        :param values: The Ratio values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: RatioUnits
+        :return: A new instance of RatioArray.
+        :rtype: RatioArray
+        """
+        return RatioArray(values, unit)
+
+    
+    @property
+    def decimal_fractions(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RatioUnits.DecimalFraction](self._values)
+
+    
+    @property
+    def percent(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RatioUnits.Percent](self._values)
+
+    
+    @property
+    def parts_per_thousand(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RatioUnits.PartPerThousand](self._values)
+
+    
+    @property
+    def parts_per_million(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RatioUnits.PartPerMillion](self._values)
+
+    
+    @property
+    def parts_per_billion(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RatioUnits.PartPerBillion](self._values)
+
+    
+    @property
+    def parts_per_trillion(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RatioUnits.PartPerTrillion](self._values)
+
+    
\ No newline at end of file
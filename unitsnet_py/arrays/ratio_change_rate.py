@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.ratio_change_rate import RatioChangeRate, RatioChangeRateUnits
+
+
+class RatioChangeRateArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of RatioChangeRate values, held in DecimalFractionPerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (RatioChangeRateUnits): The RatioChangeRate unit of the values, The default unit is DecimalFractionPerSecond
+    """
+    __slots__ = ()
+
+    _quantity = RatioChangeRate
+
+    # Whole-array variants of the RatioChangeRate conversion functions.
+    _conversions_from_base = {
+        
+        RatioChangeRateUnits.PercentPerSecond: lambda value: (value * 1e2),
+        
+        RatioChangeRateUnits.DecimalFractionPerSecond: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        RatioChangeRateUnits.PercentPerSecond: lambda value: (value / 1e2),
+        
+        RatioChangeRateUnits.DecimalFractionPerSecond: lambda value: (value),
+        
+    }
+
+    def __init__(self, values, from_unit: RatioChangeRateUnits = RatioChangeRateUnits.DecimalFractionPerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: RatioChangeRateUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: RatioChangeRateUnits = RatioChangeRateUnits.DecimalFractionPerSecond) -> RatioChangeRateArray:
+        """
+        Create a new instance of RatioChangeRateArray from values in the given unit.
+
+        :param values: The RatioChangeRate values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: RatioChangeRateUnits
+        :return: A new instance of RatioChangeRateArray.
+        :rtype: RatioChangeRateArray
+        """
+        return RatioChangeRateArray(values, unit)
+
+    
+    @property
+    def percents_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RatioChangeRateUnits.PercentPerSecond](self._values)
+
+    
+    @property
+    def decimal_fractions_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RatioChangeRateUnits.DecimalFractionPerSecond](self._values)
+
+    
\ No newline at end of file
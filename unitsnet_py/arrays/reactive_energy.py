@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.reactive_energy import ReactiveEnergy, ReactiveEnergyUnits
+
+
+class ReactiveEnergyArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ReactiveEnergy values, held in VoltampereReactiveHour.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ReactiveEnergyUnits): The ReactiveEnergy unit of the values, The default unit is VoltampereReactiveHour
+    """
+    __slots__ = ()
+
+    _quantity = ReactiveEnergy
+
+    # Whole-array variants of the ReactiveEnergy conversion functions.
+    _conversions_from_base = {
+        
+        ReactiveEnergyUnits.VoltampereReactiveHour: lambda value: (value),
+        
+        ReactiveEnergyUnits.KilovoltampereReactiveHour: lambda value: ((value) / 1000.0),
+        
+        ReactiveEnergyUnits.MegavoltampereReactiveHour: lambda value: ((value) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ReactiveEnergyUnits.VoltampereReactiveHour: lambda value: (value),
+        
+        ReactiveEnergyUnits.KilovoltampereReactiveHour: lambda value: ((value) * 1000.0),
+        
+        ReactiveEnergyUnits.MegavoltampereReactiveHour: lambda value: ((value) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ReactiveEnergyUnits = ReactiveEnergyUnits.VoltampereReactiveHour):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ReactiveEnergyUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ReactiveEnergyUnits = ReactiveEnergyUnits.VoltampereReactiveHour) -> ReactiveEnergyArray:
+        """
+        Create a new instance of ReactiveEnergyArray from values in the given unit.
+
+        :param values: The ReactiveEnergy values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ReactiveEnergyUnits
+        :return: A new instance of ReactiveEnergyArray.
+        :rtype: ReactiveEnergyArray
+        """
+        return ReactiveEnergyArray(values, unit)
+
+    
+    @property
+    def voltampere_reactive_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReactiveEnergyUnits.VoltampereReactiveHour](self._values)
+
+    
+    @property
+    def kilovoltampere_reactive_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReactiveEnergyUnits.KilovoltampereReactiveHour](self._values)
+
+    
+    @property
+    def megavoltampere_reactive_hours(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReactiveEnergyUnits.MegavoltampereReactiveHour](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.reactive_power import ReactivePower, ReactivePowerUnits
+
+
+class ReactivePowerArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ReactivePower values, held in VoltampereReactive.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ReactivePowerUnits): The ReactivePower unit of the values, The default unit is VoltampereReactive
+    """
+    __slots__ = ()
+
+    _quantity = ReactivePower
+
+    # Whole-array variants of the ReactivePower conversion functions.
+    _conversions_from_base = {
+        
+        ReactivePowerUnits.VoltampereReactive: lambda value: (value),
+        
+        ReactivePowerUnits.KilovoltampereReactive: lambda value: ((value) / 1000.0),
+        
+        ReactivePowerUnits.MegavoltampereReactive: lambda value: ((value) / 1000000.0),
+        
+        ReactivePowerUnits.GigavoltampereReactive: lambda value: ((value) / 1000000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ReactivePowerUnits.VoltampereReactive: lambda value: (value),
+        
+        ReactivePowerUnits.KilovoltampereReactive: lambda value: ((value) * 1000.0),
+        
+        ReactivePowerUnits.MegavoltampereReactive: lambda value: ((value) * 1000000.0),
+        
+        ReactivePowerUnits.GigavoltampereReactive: lambda value: ((value) * 1000000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: ReactivePowerUnits = ReactivePowerUnits.VoltampereReactive):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ReactivePowerUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ReactivePowerUnits = ReactivePowerUnits.VoltampereReactive) -> ReactivePowerArray:
+        """
+        Create a new instance of ReactivePowerArray from values in the given unit.
+
+        :param values: The ReactivePower values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ReactivePowerUnits
+        :return: A new instance of ReactivePowerArray.
+        :rtype: ReactivePowerArray
+        """
+        return ReactivePowerArray(values, unit)
+
+    
+    @property
+    def voltamperes_reactive(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReactivePowerUnits.VoltampereReactive](self._values)
+
+    
+    @property
+    def kilovoltamperes_reactive(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReactivePowerUnits.KilovoltampereReactive](self._values)
+
+    
+    @property
+    def megavoltamperes_reactive(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReactivePowerUnits.MegavoltampereReactive](self._values)
+
+    
+    @property
+    def gigavoltamperes_reactive(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReactivePowerUnits.GigavoltampereReactive](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.reciprocal_area import ReciprocalArea, ReciprocalAreaUnits
+
+
+class ReciprocalAreaArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ReciprocalArea values, held in InverseSquareMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ReciprocalAreaUnits): The ReciprocalArea unit of the values, The default unit is InverseSquareMeter
+    """
+    __slots__ = ()
+
+    _quantity = ReciprocalArea
+
+    # Whole-array variants of the ReciprocalArea conversion functions.
+    _conversions_from_base = {
+        
+        ReciprocalAreaUnits.InverseSquareMeter: lambda value: (value),
+        
+        ReciprocalAreaUnits.InverseSquareKilometer: lambda value: (value * 1e6),
+        
+        ReciprocalAreaUnits.InverseSquareDecimeter: lambda value: (value * 1e-2),
+        
+        ReciprocalAreaUnits.InverseSquareCentimeter: lambda value: (value * 1e-4),
+        
+        ReciprocalAreaUnits.InverseSquareMillimeter: lambda value: (value * 1e-6),
+        
+        ReciprocalAreaUnits.InverseSquareMicrometer: lambda value: (value * 1e-12),
+        
+        ReciprocalAreaUnits.InverseSquareMile: lambda value: (value * 2.59e6),
+        
+        ReciprocalAreaUnits.InverseSquareYard: lambda value: (value * 0.836127),
+        
+        ReciprocalAreaUnits.InverseSquareFoot: lambda value: (value * 0.092903),
+        
+        ReciprocalAreaUnits.InverseUsSurveySquareFoot: lambda value: (value * 0.09290341161),
+        
+        ReciprocalAreaUnits.InverseSquareInch: lambda value: (value * 0.00064516),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ReciprocalAreaUnits.InverseSquareMeter: lambda value: (value),
+        
+        ReciprocalAreaUnits.InverseSquareKilometer: lambda value: (value / 1e6),
+        
+        ReciprocalAreaUnits.InverseSquareDecimeter: lambda value: (value / 1e-2),
+        
+        ReciprocalAreaUnits.InverseSquareCentimeter: lambda value: (value / 1e-4),
+        
+        ReciprocalAreaUnits.InverseSquareMillimeter: lambda value: (value / 1e-6),
+        
+        ReciprocalAreaUnits.InverseSquareMicrometer: lambda value: (value / 1e-12),
+        
+        ReciprocalAreaUnits.InverseSquareMile: lambda value: (value / 2.59e6),
+        
+        ReciprocalAreaUnits.InverseSquareYard: lambda value: (value / 0.836127),
+        
+        ReciprocalAreaUnits.InverseSquareFoot: lambda value: (value / 0.092903),
+        
+        ReciprocalAreaUnits.InverseUsSurveySquareFoot: lambda value: (value / 0.09290341161),
+        
+        ReciprocalAreaUnits.InverseSquareInch: lambda value: (value / 0.00064516),
+        
+    }
+
+    def __init__(self, values, from_unit: ReciprocalAreaUnits = ReciprocalAreaUnits.InverseSquareMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ReciprocalAreaUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ReciprocalAreaUnits = ReciprocalAreaUnits.InverseSquareMeter) -> ReciprocalAreaArray:
+        """
+        Create a new instance of ReciprocalAreaArray from values in the given unit.
+
+        :param values: The ReciprocalArea values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ReciprocalAreaUnits
+        :return: A new instance of ReciprocalAreaArray.
+        :rtype: ReciprocalAreaArray
+        """
+        return ReciprocalAreaArray(values, unit)
+
+    
+    @property
+    def inverse_square_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalAreaUnits.InverseSquareMeter](self._values)
+
+    
+    @property
+    def inverse_square_kilometers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalAreaUnits.InverseSquareKilometer](self._values)
+
+    
+    @property
+    def inverse_square_decimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalAreaUnits.InverseSquareDecimeter](self._values)
+
+    
+    @property
+    def inverse_square_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalAreaUnits.InverseSquareCentimeter](self._values)
+
+    
+    @property
+    def inverse_square_millimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalAreaUnits.InverseSquareMillimeter](self._values)
+
+    
+    @property
+    def inverse_square_micrometers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalAreaUnits.InverseSquareMicrometer](self._values)
+
+    
+    @property
+    def inverse_square_miles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalAreaUnits.InverseSquareMile](self._values)
+
+    
+    @property
+    def inverse_square_yards(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalAreaUnits.InverseSquareYard](self._values)
+
+    
+    @property
+    def inverse_square_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalAreaUnits.InverseSquareFoot](self._values)
+
+    
+    @property
+    def inverse_us_survey_square_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalAreaUnits.InverseUsSurveySquareFoot](self._values)
+
+    
+    @property
+    def inverse_square_inches(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalAreaUnits.InverseSquareInch](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.reciprocal_length import ReciprocalLength, ReciprocalLengthUnits
+
+
+class ReciprocalLengthArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ReciprocalLength values, held in InverseMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ReciprocalLengthUnits): The ReciprocalLength unit of the values, The default unit is InverseMeter
+    """
+    __slots__ = ()
+
+    _quantity = ReciprocalLength
+
+    # Whole-array variants of the ReciprocalLength conversion functions.
+    _conversions_from_base = {
+        
+        ReciprocalLengthUnits.InverseMeter: lambda value: (value),
+        
+        ReciprocalLengthUnits.InverseCentimeter: lambda value: (value / 1e2),
+        
+        ReciprocalLengthUnits.InverseMillimeter: lambda value: (value / 1e3),
+        
+        ReciprocalLengthUnits.InverseMile: lambda value: (value * 1609.344),
+        
+        ReciprocalLengthUnits.InverseYard: lambda value: (value * 0.9144),
+        
+        ReciprocalLengthUnits.InverseFoot: lambda value: (value * 0.3048),
+        
+        ReciprocalLengthUnits.InverseUsSurveyFoot: lambda value: (value * 1200 / 3937),
+        
+        ReciprocalLengthUnits.InverseInch: lambda value: (value * 2.54e-2),
+        
+        ReciprocalLengthUnits.InverseMil: lambda value: (value * 2.54e-5),
+        
+        ReciprocalLengthUnits.InverseMicroinch: lambda value: (value * 2.54e-8),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ReciprocalLengthUnits.InverseMeter: lambda value: (value),
+        
+        ReciprocalLengthUnits.InverseCentimeter: lambda value: (value * 1e2),
+        
+        ReciprocalLengthUnits.InverseMillimeter: lambda value: (value * 1e3),
+        
+        ReciprocalLengthUnits.InverseMile: lambda value: (value / 1609.344),
+        
+        ReciprocalLengthUnits.InverseYard: lambda value: (value / 0.9144),
+        
+        ReciprocalLengthUnits.InverseFoot: lambda value: (value / 0.3048),
+        
+        ReciprocalLengthUnits.InverseUsSurveyFoot: lambda value: (value * 3937 / 1200),
+        
+        ReciprocalLengthUnits.InverseInch: lambda value: (value / 2.54e-2),
+        
+        ReciprocalLengthUnits.InverseMil: lambda value: (value / 2.54e-5),
+        
+        ReciprocalLengthUnits.InverseMicroinch: lambda value: (value / 2.54e-8),
+        
+    }
+
+    def __init__(self, values, from_unit: ReciprocalLengthUnits = ReciprocalLengthUnits.InverseMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ReciprocalLengthUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ReciprocalLengthUnits = ReciprocalLengthUnits.InverseMeter) -> ReciprocalLengthArray:
+        """
+        Create a new instance of ReciprocalLengthArray from values in the given unit.
+
+        :param values: The ReciprocalLength values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ReciprocalLengthUnits
+        :return: A new instance of ReciprocalLengthArray.
+        :rtype: ReciprocalLengthArray
+        """
+        return ReciprocalLengthArray(values, unit)
+
+    
+    @property
+    def inverse_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalLengthUnits.InverseMeter](self._values)
+
+    
+    @property
+    def inverse_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalLengthUnits.InverseCentimeter](self._values)
+
+    
+    @property
+    def inverse_millimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalLengthUnits.InverseMillimeter](self._values)
+
+    
+    @property
+    def inverse_miles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalLengthUnits.InverseMile](self._values)
+
+    
+    @property
+    def inverse_yards(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalLengthUnits.InverseYard](self._values)
+
+    
+    @property
+    def inverse_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalLengthUnits.InverseFoot](self._values)
+
+    
+    @property
+    def inverse_us_survey_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalLengthUnits.InverseUsSurveyFoot](self._values)
+
+    
+    @property
+    def inverse_inches(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalLengthUnits.InverseInch](self._values)
+
+    
+    @property
+    def inverse_mils(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalLengthUnits.InverseMil](self._values)
+
+    
+    @property
+    def inverse_microinches(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ReciprocalLengthUnits.InverseMicroinch](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.relative_humidity import RelativeHumidity, RelativeHumidityUnits
+
+
+class RelativeHumidityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of RelativeHumidity values, held in Percent.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (RelativeHumidityUnits): The RelativeHumidity unit of the values, The default unit is Percent
+    """
+    __slots__ = ()
+
+    _quantity = RelativeHumidity
+
+    # Whole-array variants of the RelativeHumidity conversion functions.
+    _conversions_from_base = {
+        
+        RelativeHumidityUnits.Percent: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        RelativeHumidityUnits.Percent: lambda value: (value),
+        
+    }
+
+    def __init__(self, values, from_unit: RelativeHumidityUnits = RelativeHumidityUnits.Percent):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: RelativeHumidityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: RelativeHumidityUnits = RelativeHumidityUnits.Percent) -> RelativeHumidityArray:
+        """
+        Create a new instance of RelativeHumidityArray from values in the given unit.
+
+        :param values: The RelativeHumidity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: RelativeHumidityUnits
+        :return: A new instance of RelativeHumidityArray.
+        :rtype: RelativeHumidityArray
+        """
+        return RelativeHumidityArray(values, unit)
+
+    
+    @property
+    def percent(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RelativeHumidityUnits.Percent](self._values)
+
+    
\ No newline at end of file
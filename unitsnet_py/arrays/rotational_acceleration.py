@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.rotational_acceleration import RotationalAcceleration, RotationalAccelerationUnits
+
+
+class RotationalAccelerationArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of RotationalAcceleration values, held in RadianPerSecondSquared.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (RotationalAccelerationUnits): The RotationalAcceleration unit of the values, The default unit is RadianPerSecondSquared
+    """
+    __slots__ = ()
+
+    _quantity = RotationalAcceleration
+
+    # Whole-array variants of the RotationalAcceleration conversion functions.
+    _conversions_from_base = {
+        
+        RotationalAccelerationUnits.RadianPerSecondSquared: lambda value: (value),
+        
+        RotationalAccelerationUnits.DegreePerSecondSquared: lambda value: ((180 / np.pi) * value),
+        
+        RotationalAccelerationUnits.RevolutionPerMinutePerSecond: lambda value: ((60 / (2 * np.pi)) * value),
+        
+        RotationalAccelerationUnits.RevolutionPerSecondSquared: lambda value: ((1 / (2 * np.pi)) * value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        RotationalAccelerationUnits.RadianPerSecondSquared: lambda value: (value),
+        
+        RotationalAccelerationUnits.DegreePerSecondSquared: lambda value: ((np.pi / 180) * value),
+        
+        RotationalAccelerationUnits.RevolutionPerMinutePerSecond: lambda value: (((2 * np.pi) / 60) * value),
+        
+        RotationalAccelerationUnits.RevolutionPerSecondSquared: lambda value: ((2 * np.pi) * value),
+        
+    }
+
+    def __init__(self, values, from_unit: RotationalAccelerationUnits = RotationalAccelerationUnits.RadianPerSecondSquared):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: RotationalAccelerationUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: RotationalAccelerationUnits = RotationalAccelerationUnits.RadianPerSecondSquared) -> RotationalAccelerationArray:
+        """
+        Create a new instance of RotationalAccelerationArray from values in the given unit.
+
+        :param values: The RotationalAcceleration values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: RotationalAccelerationUnits
+        :return: A new instance of RotationalAccelerationArray.
+        :rtype: RotationalAccelerationArray
+        """
+        return RotationalAccelerationArray(values, unit)
+
+    
+    @property
+    def radians_per_second_squared(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalAccelerationUnits.RadianPerSecondSquared](self._values)
+
+    
+    @property
+    def degrees_per_second_squared(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalAccelerationUnits.DegreePerSecondSquared](self._values)
+
+    
+    @property
+    def revolutions_per_minute_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalAccelerationUnits.RevolutionPerMinutePerSecond](self._values)
+
+    
+    @property
+    def revolutions_per_second_squared(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalAccelerationUnits.RevolutionPerSecondSquared](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.rotational_speed import RotationalSpeed, RotationalSpeedUnits
+
+
+class RotationalSpeedArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of RotationalSpeed values, held in RadianPerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (RotationalSpeedUnits): The RotationalSpeed unit of the values, The default unit is RadianPerSecond
+    """
+    __slots__ = ()
+
+    _quantity = RotationalSpeed
+
+    # Whole-array variants of the RotationalSpeed conversion functions.
+    _conversions_from_base = {
+        
+        RotationalSpeedUnits.RadianPerSecond: lambda value: (value),
+        
+        RotationalSpeedUnits.DegreePerSecond: lambda value: ((180 / np.pi) * value),
+        
+        RotationalSpeedUnits.DegreePerMinute: lambda value: ((180 * 60 / np.pi) * value),
+        
+        RotationalSpeedUnits.RevolutionPerSecond: lambda value: (value / 6.2831853072),
+        
+        RotationalSpeedUnits.RevolutionPerMinute: lambda value: ((value / 6.2831853072) * 60),
+        
+        RotationalSpeedUnits.NanoradianPerSecond: lambda value: ((value) / 1e-09),
+        
+        RotationalSpeedUnits.MicroradianPerSecond: lambda value: ((value) / 1e-06),
+        
+        RotationalSpeedUnits.MilliradianPerSecond: lambda value: ((value) / 0.001),
+        
+        RotationalSpeedUnits.CentiradianPerSecond: lambda value: ((value) / 0.01),
+        
+        RotationalSpeedUnits.DeciradianPerSecond: lambda value: ((value) / 0.1),
+        
+        RotationalSpeedUnits.NanodegreePerSecond: lambda value: (((180 / np.pi) * value) / 1e-09),
+        
+        RotationalSpeedUnits.MicrodegreePerSecond: lambda value: (((180 / np.pi) * value) / 1e-06),
+        
+        RotationalSpeedUnits.MillidegreePerSecond: lambda value: (((180 / np.pi) * value) / 0.001),
+        
+    }
+
+    _conversions_to_base = {
+        
+        RotationalSpeedUnits.RadianPerSecond: lambda value: (value),
+        
+        RotationalSpeedUnits.DegreePerSecond: lambda value: ((np.pi / 180) * value),
+        
+        RotationalSpeedUnits.DegreePerMinute: lambda value: ((np.pi / (180 * 60)) * value),
+        
+        RotationalSpeedUnits.RevolutionPerSecond: lambda value: (value * 6.2831853072),
+        
+        RotationalSpeedUnits.RevolutionPerMinute: lambda value: ((value * 6.2831853072) / 60),
+        
+        RotationalSpeedUnits.NanoradianPerSecond: lambda value: ((value) * 1e-09),
+        
+        RotationalSpeedUnits.MicroradianPerSecond: lambda value: ((value) * 1e-06),
+        
+        RotationalSpeedUnits.MilliradianPerSecond: lambda value: ((value) * 0.001),
+        
+        RotationalSpeedUnits.CentiradianPerSecond: lambda value: ((value) * 0.01),
+        
+        RotationalSpeedUnits.DeciradianPerSecond: lambda value: ((value) * 0.1),
+        
+        RotationalSpeedUnits.NanodegreePerSecond: lambda value: (((np.pi / 180) * value) * 1e-09),
+        
+        RotationalSpeedUnits.MicrodegreePerSecond: lambda value: (((np.pi / 180) * value) * 1e-06),
+        
+        RotationalSpeedUnits.MillidegreePerSecond: lambda value: (((np.pi / 180) * value) * 0.001),
+        
+    }
+
+    def __init__(self, values, from_unit: RotationalSpeedUnits = RotationalSpeedUnits.RadianPerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: RotationalSpeedUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: RotationalSpeedUnits = RotationalSpeedUnits.RadianPerSecond) -> RotationalSpeedArray:
+        """
+        Create a new instance of RotationalSpeedArray from values in the given unit.
+
+        :param values: The RotationalSpeed values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: RotationalSpeedUnits
+        :return: A new instance of RotationalSpeedArray.
+        :rtype: RotationalSpeedArray
+        """
+        return RotationalSpeedArray(values, unit)
+
+    
+    @property
+    def radians_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalSpeedUnits.RadianPerSecond](self._values)
+
+    
+    @property
+    def degrees_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalSpeedUnits.DegreePerSecond](self._values)
+
+    
+    @property
+    def degrees_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalSpeedUnits.DegreePerMinute](self._values)
+
+    
+    @property
+    def revolutions_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalSpeedUnits.RevolutionPerSecond](self._values)
+
+    
+    @property
+    def revolutions_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalSpeedUnits.RevolutionPerMinute](self._values)
+
+    
+    @property
+    def nanoradians_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalSpeedUnits.NanoradianPerSecond](self._values)
+
+    
+    @property
+    def microradians_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalSpeedUnits.MicroradianPerSecond](self._values)
+
+    
+    @property
+    def milliradians_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalSpeedUnits.MilliradianPerSecond](self._values)
+
+    
+    @property
+    def centiradians_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalSpeedUnits.CentiradianPerSecond](self._values)
+
+    
+    @property
+    def deciradians_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalSpeedUnits.DeciradianPerSecond](self._values)
+
+    
+    @property
+    def nanodegrees_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalSpeedUnits.NanodegreePerSecond](self._values)
+
+    
+    @property
+    def microdegrees_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalSpeedUnits.MicrodegreePerSecond](self._values)
+
+    
+    @property
+    def millidegrees_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalSpeedUnits.MillidegreePerSecond](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.rotational_stiffness import RotationalStiffness, RotationalStiffnessUnits
+
+
+class RotationalStiffnessArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of RotationalStiffness values, held in NewtonMeterPerRadian.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (RotationalStiffnessUnits): The RotationalStiffness unit of the values, The default unit is NewtonMeterPerRadian
+    """
+    __slots__ = ()
+
+    _quantity = RotationalStiffness
+
+    # Whole-array variants of the RotationalStiffness conversion functions.
+    _conversions_from_base = {
+        
+        RotationalStiffnessUnits.NewtonMeterPerRadian: lambda value: (value),
+        
+        RotationalStiffnessUnits.PoundForceFootPerDegrees: lambda value: (value / 77.6826),
+        
+        RotationalStiffnessUnits.KilopoundForceFootPerDegrees: lambda value: (value / 77682.6),
+        
+        RotationalStiffnessUnits.NewtonMillimeterPerDegree: lambda value: (value / 180 * np.pi * 1000),
+        
+        RotationalStiffnessUnits.NewtonMeterPerDegree: lambda value: (value / (180 / np.pi)),
+        
+        RotationalStiffnessUnits.NewtonMillimeterPerRadian: lambda value: (value * 1000),
+        
+        RotationalStiffnessUnits.PoundForceFeetPerRadian: lambda value: (value / 1.3558179483314),
+        
+        RotationalStiffnessUnits.KilonewtonMeterPerRadian: lambda value: ((value) / 1000.0),
+        
+        RotationalStiffnessUnits.MeganewtonMeterPerRadian: lambda value: ((value) / 1000000.0),
+        
+        RotationalStiffnessUnits.NanonewtonMillimeterPerDegree: lambda value: ((value / 180 * np.pi * 1000) / 1e-09),
+        
+        RotationalStiffnessUnits.MicronewtonMillimeterPerDegree: lambda value: ((value / 180 * np.pi * 1000) / 1e-06),
+        
+        RotationalStiffnessUnits.MillinewtonMillimeterPerDegree: lambda value: ((value / 180 * np.pi * 1000) / 0.001),
+        
+        RotationalStiffnessUnits.CentinewtonMillimeterPerDegree: lambda value: ((value / 180 * np.pi * 1000) / 0.01),
+        
+        RotationalStiffnessUnits.DecinewtonMillimeterPerDegree: lambda value: ((value / 180 * np.pi * 1000) / 0.1),
+        
+        RotationalStiffnessUnits.DecanewtonMillimeterPerDegree: lambda value: ((value / 180 * np.pi * 1000) / 10.0),
+        
+        RotationalStiffnessUnits.KilonewtonMillimeterPerDegree: lambda value: ((value / 180 * np.pi * 1000) / 1000.0),
+        
+        RotationalStiffnessUnits.MeganewtonMillimeterPerDegree: lambda value: ((value / 180 * np.pi * 1000) / 1000000.0),
+        
+        RotationalStiffnessUnits.NanonewtonMeterPerDegree: lambda value: ((value / (180 / np.pi)) / 1e-09),
+        
+        RotationalStiffnessUnits.MicronewtonMeterPerDegree: lambda value: ((value / (180 / np.pi)) / 1e-06),
+        
+        RotationalStiffnessUnits.MillinewtonMeterPerDegree: lambda value: ((value / (180 / np.pi)) / 0.001),
+        
+        RotationalStiffnessUnits.CentinewtonMeterPerDegree: lambda value: ((value / (180 / np.pi)) / 0.01),
+        
+        RotationalStiffnessUnits.DecinewtonMeterPerDegree: lambda value: ((value / (180 / np.pi)) / 0.1),
+        
+        RotationalStiffnessUnits.DecanewtonMeterPerDegree: lambda value: ((value / (180 / np.pi)) / 10.0),
+        
+        RotationalStiffnessUnits.KilonewtonMeterPerDegree: lambda value: ((value / (180 / np.pi)) / 1000.0),
+        
+        RotationalStiffnessUnits.MeganewtonMeterPerDegree: lambda value: ((value / (180 / np.pi)) / 1000000.0),
+        
+        RotationalStiffnessUnits.NanonewtonMillimeterPerRadian: lambda value: ((value * 1000) / 1e-09),
+        
+        RotationalStiffnessUnits.MicronewtonMillimeterPerRadian: lambda value: ((value * 1000) / 1e-06),
+        
+        RotationalStiffnessUnits.MillinewtonMillimeterPerRadian: lambda value: ((value * 1000) / 0.001),
+        
+        RotationalStiffnessUnits.CentinewtonMillimeterPerRadian: lambda value: ((value * 1000) / 0.01),
+        
+        RotationalStiffnessUnits.DecinewtonMillimeterPerRadian: lambda value: ((value * 1000) / 0.1),
+        
+        RotationalStiffnessUnits.DecanewtonMillimeterPerRadian: lambda value: ((value * 1000) / 10.0),
+        
+        RotationalStiffnessUnits.KilonewtonMillimeterPerRadian: lambda value: ((value * 1000) / 1000.0),
+        
+        RotationalStiffnessUnits.MeganewtonMillimeterPerRadian: lambda value: ((value * 1000) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        RotationalStiffnessUnits.NewtonMeterPerRadian: lambda value: (value),
+        
+        RotationalStiffnessUnits.PoundForceFootPerDegrees: lambda value: (value * 77.6826),
+        
+        RotationalStiffnessUnits.KilopoundForceFootPerDegrees: lambda value: (value * 77682.6),
+        
+        RotationalStiffnessUnits.NewtonMillimeterPerDegree: lambda value: (value * 180 / np.pi * 0.001),
+        
+        RotationalStiffnessUnits.NewtonMeterPerDegree: lambda value: (value * (180 / np.pi)),
+        
+        RotationalStiffnessUnits.NewtonMillimeterPerRadian: lambda value: (value * 0.001),
+        
+        RotationalStiffnessUnits.PoundForceFeetPerRadian: lambda value: (value * 1.3558179483314),
+        
+        RotationalStiffnessUnits.KilonewtonMeterPerRadian: lambda value: ((value) * 1000.0),
+        
+        RotationalStiffnessUnits.MeganewtonMeterPerRadian: lambda value: ((value) * 1000000.0),
+        
+        RotationalStiffnessUnits.NanonewtonMillimeterPerDegree: lambda value: ((value * 180 / np.pi * 0.001) * 1e-09),
+        
+        RotationalStiffnessUnits.MicronewtonMillimeterPerDegree: lambda value: ((value * 180 / np.pi * 0.001) * 1e-06),
+        
+        RotationalStiffnessUnits.MillinewtonMillimeterPerDegree: lambda value: ((value * 180 / np.pi * 0.001) * 0.001),
+        
+        RotationalStiffnessUnits.CentinewtonMillimeterPerDegree: lambda value: ((value * 180 / np.pi * 0.001) * 0.01),
+        
+        RotationalStiffnessUnits.DecinewtonMillimeterPerDegree: lambda value: ((value * 180 / np.pi * 0.001) * 0.1),
+        
+        RotationalStiffnessUnits.DecanewtonMillimeterPerDegree: lambda value: ((value * 180 / np.pi * 0.001) * 10.0),
+        
+        RotationalStiffnessUnits.KilonewtonMillimeterPerDegree: lambda value: ((value * 180 / np.pi * 0.001) * 1000.0),
+        
+        RotationalStiffnessUnits.MeganewtonMillimeterPerDegree: lambda value: ((value * 180 / np.pi * 0.001) * 1000000.0),
+        
+        RotationalStiffnessUnits.NanonewtonMeterPerDegree: lambda value: ((value * (180 / np.pi)) * 1e-09),
+        
+        RotationalStiffnessUnits.MicronewtonMeterPerDegree: lambda value: ((value * (180 / np.pi)) * 1e-06),
+        
+        RotationalStiffnessUnits.MillinewtonMeterPerDegree: lambda value: ((value * (180 / np.pi)) * 0.001),
+        
+        RotationalStiffnessUnits.CentinewtonMeterPerDegree: lambda value: ((value * (180 / np.pi)) * 0.01),
+        
+        RotationalStiffnessUnits.DecinewtonMeterPerDegree: lambda value: ((value * (180 / np.pi)) * 0.1),
+        
+        RotationalStiffnessUnits.DecanewtonMeterPerDegree: lambda value: ((value * (180 / np.pi)) * 10.0),
+        
+        RotationalStiffnessUnits.KilonewtonMeterPerDegree: lambda value: ((value * (180 / np.pi)) * 1000.0),
+        
+        RotationalStiffnessUnits.MeganewtonMeterPerDegree: lambda value: ((value * (180 / np.pi)) * 1000000.0),
+        
+        RotationalStiffnessUnits.NanonewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 1e-09),
+        
+        RotationalStiffnessUnits.MicronewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 1e-06),
+        
+        RotationalStiffnessUnits.MillinewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 0.001),
+        
+        RotationalStiffnessUnits.CentinewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 0.01),
+        
+        RotationalStiffnessUnits.DecinewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 0.1),
+        
+        RotationalStiffnessUnits.DecanewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 10.0),
+        
+        RotationalStiffnessUnits.KilonewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 1000.0),
+        
+        RotationalStiffnessUnits.MeganewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: RotationalStiffnessUnits = RotationalStiffnessUnits.NewtonMeterPerRadian):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: RotationalStiffnessUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: RotationalStiffnessUnits = RotationalStiffnessUnits.NewtonMeterPerRadian) -> RotationalStiffnessArray:
+        """
+        Create a new instance of RotationalStiffnessArray from values in the given unit.
+
+        :param values: The RotationalStiffness values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: RotationalStiffnessUnits
+        :return: A new instance of RotationalStiffnessArray.
+        :rtype: RotationalStiffnessArray
+        """
+        return RotationalStiffnessArray(values, unit)
+
+    
+    @property
+    def newton_meters_per_radian(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.NewtonMeterPerRadian](self._values)
+
+    
+    @property
+    def pound_force_feet_per_degrees(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.PoundForceFootPerDegrees](self._values)
+
+    
+    @property
+    def kilopound_force_feet_per_degrees(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.KilopoundForceFootPerDegrees](self._values)
+
+    
+    @property
+    def newton_millimeters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.NewtonMillimeterPerDegree](self._values)
+
+    
+    @property
+    def newton_meters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.NewtonMeterPerDegree](self._values)
+
+    
+    @property
+    def newton_millimeters_per_radian(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.NewtonMillimeterPerRadian](self._values)
+
+    
+    @property
+    def pound_force_feet_per_radian(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.PoundForceFeetPerRadian](self._values)
+
+    
+    @property
+    def kilonewton_meters_per_radian(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.KilonewtonMeterPerRadian](self._values)
+
+    
+    @property
+    def meganewton_meters_per_radian(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.MeganewtonMeterPerRadian](self._values)
+
+    
+    @property
+    def nanonewton_millimeters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.NanonewtonMillimeterPerDegree](self._values)
+
+    
+    @property
+    def micronewton_millimeters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.MicronewtonMillimeterPerDegree](self._values)
+
+    
+    @property
+    def millinewton_millimeters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.MillinewtonMillimeterPerDegree](self._values)
+
+    
+    @property
+    def centinewton_millimeters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.CentinewtonMillimeterPerDegree](self._values)
+
+    
+    @property
+    def decinewton_millimeters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.DecinewtonMillimeterPerDegree](self._values)
+
+    
+    @property
+    def decanewton_millimeters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.DecanewtonMillimeterPerDegree](self._values)
+
+    
+    @property
+    def kilonewton_millimeters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.KilonewtonMillimeterPerDegree](self._values)
+
+    
+    @property
+    def meganewton_millimeters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.MeganewtonMillimeterPerDegree](self._values)
+
+    
+    @property
+    def nanonewton_meters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.NanonewtonMeterPerDegree](self._values)
+
+    
+    @property
+    def micronewton_meters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.MicronewtonMeterPerDegree](self._values)
+
+    
+    @property
+    def millinewton_meters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.MillinewtonMeterPerDegree](self._values)
+
+    
+    @property
+    def centinewton_meters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.CentinewtonMeterPerDegree](self._values)
+
+    
+    @property
+    def decinewton_meters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.DecinewtonMeterPerDegree](self._values)
+
+    
+    @property
+    def decanewton_meters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.DecanewtonMeterPerDegree](self._values)
+
+    
+    @property
+    def kilonewton_meters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.KilonewtonMeterPerDegree](self._values)
+
+    
+    @property
+    def meganewton_meters_per_degree(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.MeganewtonMeterPerDegree](self._values)
+
+    
+    @property
+    def nanonewton_millimeters_per_radian(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.NanonewtonMillimeterPerRadian](self._values)
+
+    
+    @property
+    def micronewton_millimeters_per_radian(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.MicronewtonMillimeterPerRadian](self._values)
+
+    
+    @property
+    def millinewton_millimeters_per_radian(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.MillinewtonMillimeterPerRadian](self._values)
+
+    
+    @property
+    def centinewton_millimeters_per_radian(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.CentinewtonMillimeterPerRadian](self._values)
+
+    
+    @property
+    def decinewton_millimeters_per_radian(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.DecinewtonMillimeterPerRadian](self._values)
+
+    
+    @property
+    def decanewton_millimeters_per_radian(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.DecanewtonMillimeterPerRadian](self._values)
+
+    
+    @property
+    def kilonewton_millimeters_per_radian(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.KilonewtonMillimeterPerRadian](self._values)
+
+    
+    @property
+    def meganewton_millimeters_per_radian(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessUnits.MeganewtonMillimeterPerRadian](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.rotational_stiffness_per_length import RotationalStiffnessPerLength, RotationalStiffnessPerLengthUnits
+
+
+class RotationalStiffnessPerLengthArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of RotationalStiffnessPerLength values, held in NewtonMeterPerRadianPerMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (RotationalStiffnessPerLengthUnits): The RotationalStiffnessPerLength unit of the values, The default unit is NewtonMeterPerRadianPerMeter
+    """
+    __slots__ = ()
+
+    _quantity = RotationalStiffnessPerLength
+
+    # Whole-array variants of the RotationalStiffnessPerLength conversion functions.
+    _conversions_from_base = {
+        
+        RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter: lambda value: (value),
+        
+        RotationalStiffnessPerLengthUnits.PoundForceFootPerDegreesPerFoot: lambda value: (value / 254.864324570),
+        
+        RotationalStiffnessPerLengthUnits.KilopoundForceFootPerDegreesPerFoot: lambda value: (value / 254864.324570),
+        
+        RotationalStiffnessPerLengthUnits.KilonewtonMeterPerRadianPerMeter: lambda value: ((value) / 1000.0),
+        
+        RotationalStiffnessPerLengthUnits.MeganewtonMeterPerRadianPerMeter: lambda value: ((value) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter: lambda value: (value),
+        
+        RotationalStiffnessPerLengthUnits.PoundForceFootPerDegreesPerFoot: lambda value: (value * 254.864324570),
+        
+        RotationalStiffnessPerLengthUnits.KilopoundForceFootPerDegreesPerFoot: lambda value: (value * 254864.324570),
+        
+        RotationalStiffnessPerLengthUnits.KilonewtonMeterPerRadianPerMeter: lambda value: ((value) * 1000.0),
+        
+        RotationalStiffnessPerLengthUnits.MeganewtonMeterPerRadianPerMeter: lambda value: ((value) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: RotationalStiffnessPerLengthUnits = RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: RotationalStiffnessPerLengthUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: RotationalStiffnessPerLengthUnits = RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter) -> RotationalStiffnessPerLengthArray:
+        """
+        Create a new instance of RotationalStiffnessPerLengthArray from values in the given unit.
+
+        :param values: The RotationalStiffnessPerLength values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: RotationalStiffnessPerLengthUnits
+        :return: A new instance of RotationalStiffnessPerLengthArray.
+        :rtype: RotationalStiffnessPerLengthArray
+        """
+        return RotationalStiffnessPerLengthArray(values, unit)
+
+    
+    @property
+    def newton_meters_per_radian_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter](self._values)
+
+    
+    @property
+    def pound_force_feet_per_degrees_per_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessPerLengthUnits.PoundForceFootPerDegreesPerFoot](self._values)
+
+    
+    @property
+    def kilopound_force_feet_per_degrees_per_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessPerLengthUnits.KilopoundForceFootPerDegreesPerFoot](self._values)
+
+    
+    @property
+    def kilonewton_meters_per_radian_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessPerLengthUnits.KilonewtonMeterPerRadianPerMeter](self._values)
+
+    
+    @property
+    def meganewton_meters_per_radian_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[RotationalStiffnessPerLengthUnits.MeganewtonMeterPerRadianPerMeter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.scalar import Scalar, ScalarUnits
+
+
+class ScalarArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Scalar values, held in Amount.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ScalarUnits): The Scalar unit of the values, The default unit is Amount
+    """
+    __slots__ = ()
+
+    _quantity = Scalar
+
+    # Whole-array variants of the Scalar conversion functions.
+    _conversions_from_base = {
+        
+        ScalarUnits.Amount: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ScalarUnits.Amount: lambda value: (value),
+        
+    }
+
+    def __init__(self, values, from_unit: ScalarUnits = ScalarUnits.Amount):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ScalarUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ScalarUnits = ScalarUnits.Amount) -> ScalarArray:
+        """
+        Create a new instance of ScalarArray from values in the given unit.
+
+        :param values: The Scalar values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ScalarUnits
+        :return: A new instance of ScalarArray.
+        :rtype: ScalarArray
+        """
+        return ScalarArray(values, unit)
+
+    
+    @property
+    def amount(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ScalarUnits.Amount](self._values)
+
+    
\ No newline at end of file
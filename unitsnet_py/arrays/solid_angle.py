@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.solid_angle import SolidAngle, SolidAngleUnits
+
+
+class SolidAngleArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of SolidAngle values, held in Steradian.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (SolidAngleUnits): The SolidAngle unit of the values, The default unit is Steradian
+    """
+    __slots__ = ()
+
+    _quantity = SolidAngle
+
+    # Whole-array variants of the SolidAngle conversion functions.
+    _conversions_from_base = {
+        
+        SolidAngleUnits.Steradian: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        SolidAngleUnits.Steradian: lambda value: (value),
+        
+    }
+
+    def __init__(self, values, from_unit: SolidAngleUnits = SolidAngleUnits.Steradian):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: SolidAngleUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: SolidAngleUnits = SolidAngleUnits.Steradian) -> SolidAngleArray:
+        """
+        Create a new instance of SolidAngleArray from values in the given unit.
+
+        :param values: The SolidAngle values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: SolidAngleUnits
+        :return: A new instance of SolidAngleArray.
+        :rtype: SolidAngleArray
+        """
+        return SolidAngleArray(values, unit)
+
+    
+    @property
+    def steradians(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SolidAngleUnits.Steradian](self._values)
+
+    
\ No newline at end of file
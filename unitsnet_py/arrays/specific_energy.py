@@ -0,0 +1,410 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.specific_energy import SpecificEnergy, SpecificEnergyUnits
+
+
+class SpecificEnergyArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of SpecificEnergy values, held in JoulePerKilogram.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (SpecificEnergyUnits): The SpecificEnergy unit of the values, The default unit is JoulePerKilogram
+    """
+    __slots__ = ()
+
+    _quantity = SpecificEnergy
+
+    # Whole-array variants of the SpecificEnergy conversion functions.
+    _conversions_from_base = {
+        
+        SpecificEnergyUnits.JoulePerKilogram: lambda value: (value),
+        
+        SpecificEnergyUnits.MegaJoulePerTonne: lambda value: (value / 1e3),
+        
+        SpecificEnergyUnits.CaloriePerGram: lambda value: (value / 4.184e3),
+        
+        SpecificEnergyUnits.WattHourPerKilogram: lambda value: (value / 3.6e3),
+        
+        SpecificEnergyUnits.WattDayPerKilogram: lambda value: (value / (24 * 3.6e3)),
+        
+        SpecificEnergyUnits.WattDayPerTonne: lambda value: (value / ((24 * 3.6e3) / 1e3)),
+        
+        SpecificEnergyUnits.WattDayPerShortTon: lambda value: (value / ((24 * 3.6e3) / 9.0718474e2)),
+        
+        SpecificEnergyUnits.WattHourPerPound: lambda value: (value / 7.93664e3),
+        
+        SpecificEnergyUnits.BtuPerPound: lambda value: (value / 2326.000075362),
+        
+        SpecificEnergyUnits.KilojoulePerKilogram: lambda value: ((value) / 1000.0),
+        
+        SpecificEnergyUnits.MegajoulePerKilogram: lambda value: ((value) / 1000000.0),
+        
+        SpecificEnergyUnits.KilocaloriePerGram: lambda value: ((value / 4.184e3) / 1000.0),
+        
+        SpecificEnergyUnits.KilowattHourPerKilogram: lambda value: ((value / 3.6e3) / 1000.0),
+        
+        SpecificEnergyUnits.MegawattHourPerKilogram: lambda value: ((value / 3.6e3) / 1000000.0),
+        
+        SpecificEnergyUnits.GigawattHourPerKilogram: lambda value: ((value / 3.6e3) / 1000000000.0),
+        
+        SpecificEnergyUnits.KilowattDayPerKilogram: lambda value: ((value / (24 * 3.6e3)) / 1000.0),
+        
+        SpecificEnergyUnits.MegawattDayPerKilogram: lambda value: ((value / (24 * 3.6e3)) / 1000000.0),
+        
+        SpecificEnergyUnits.GigawattDayPerKilogram: lambda value: ((value / (24 * 3.6e3)) / 1000000000.0),
+        
+        SpecificEnergyUnits.TerawattDayPerKilogram: lambda value: ((value / (24 * 3.6e3)) / 1000000000000.0),
+        
+        SpecificEnergyUnits.KilowattDayPerTonne: lambda value: ((value / ((24 * 3.6e3) / 1e3)) / 1000.0),
+        
+        SpecificEnergyUnits.MegawattDayPerTonne: lambda value: ((value / ((24 * 3.6e3) / 1e3)) / 1000000.0),
+        
+        SpecificEnergyUnits.GigawattDayPerTonne: lambda value: ((value / ((24 * 3.6e3) / 1e3)) / 1000000000.0),
+        
+        SpecificEnergyUnits.TerawattDayPerTonne: lambda value: ((value / ((24 * 3.6e3) / 1e3)) / 1000000000000.0),
+        
+        SpecificEnergyUnits.KilowattDayPerShortTon: lambda value: ((value / ((24 * 3.6e3) / 9.0718474e2)) / 1000.0),
+        
+        SpecificEnergyUnits.MegawattDayPerShortTon: lambda value: ((value / ((24 * 3.6e3) / 9.0718474e2)) / 1000000.0),
+        
+        SpecificEnergyUnits.GigawattDayPerShortTon: lambda value: ((value / ((24 * 3.6e3) / 9.0718474e2)) / 1000000000.0),
+        
+        SpecificEnergyUnits.TerawattDayPerShortTon: lambda value: ((value / ((24 * 3.6e3) / 9.0718474e2)) / 1000000000000.0),
+        
+        SpecificEnergyUnits.KilowattHourPerPound: lambda value: ((value / 7.93664e3) / 1000.0),
+        
+        SpecificEnergyUnits.MegawattHourPerPound: lambda value: ((value / 7.93664e3) / 1000000.0),
+        
+        SpecificEnergyUnits.GigawattHourPerPound: lambda value: ((value / 7.93664e3) / 1000000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        SpecificEnergyUnits.JoulePerKilogram: lambda value: (value),
+        
+        SpecificEnergyUnits.MegaJoulePerTonne: lambda value: (value * 1e3),
+        
+        SpecificEnergyUnits.CaloriePerGram: lambda value: (value * 4.184e3),
+        
+        SpecificEnergyUnits.WattHourPerKilogram: lambda value: (value * 3.6e3),
+        
+        SpecificEnergyUnits.WattDayPerKilogram: lambda value: (value * (24 * 3.6e3)),
+        
+        SpecificEnergyUnits.WattDayPerTonne: lambda value: (value * ((24 * 3.6e3) / 1e3)),
+        
+        SpecificEnergyUnits.WattDayPerShortTon: lambda value: (value * ((24 * 3.6e3) / 9.0718474e2)),
+        
+        SpecificEnergyUnits.WattHourPerPound: lambda value: (value * 7.93664e3),
+        
+        SpecificEnergyUnits.BtuPerPound: lambda value: (value * 2326.000075362),
+        
+        SpecificEnergyUnits.KilojoulePerKilogram: lambda value: ((value) * 1000.0),
+        
+        SpecificEnergyUnits.MegajoulePerKilogram: lambda value: ((value) * 1000000.0),
+        
+        SpecificEnergyUnits.KilocaloriePerGram: lambda value: ((value * 4.184e3) * 1000.0),
+        
+        SpecificEnergyUnits.KilowattHourPerKilogram: lambda value: ((value * 3.6e3) * 1000.0),
+        
+        SpecificEnergyUnits.MegawattHourPerKilogram: lambda value: ((value * 3.6e3) * 1000000.0),
+        
+        SpecificEnergyUnits.GigawattHourPerKilogram: lambda value: ((value * 3.6e3) * 1000000000.0),
+        
+        SpecificEnergyUnits.KilowattDayPerKilogram: lambda value: ((value * (24 * 3.6e3)) * 1000.0),
+        
+        SpecificEnergyUnits.MegawattDayPerKilogram: lambda value: ((value * (24 * 3.6e3)) * 1000000.0),
+        
+        SpecificEnergyUnits.GigawattDayPerKilogram: lambda value: ((value * (24 * 3.6e3)) * 1000000000.0),
+        
+        SpecificEnergyUnits.TerawattDayPerKilogram: lambda value: ((value * (24 * 3.6e3)) * 1000000000000.0),
+        
+        SpecificEnergyUnits.KilowattDayPerTonne: lambda value: ((value * ((24 * 3.6e3) / 1e3)) * 1000.0),
+        
+        SpecificEnergyUnits.MegawattDayPerTonne: lambda value: ((value * ((24 * 3.6e3) / 1e3)) * 1000000.0),
+        
+        SpecificEnergyUnits.GigawattDayPerTonne: lambda value: ((value * ((24 * 3.6e3) / 1e3)) * 1000000000.0),
+        
+        SpecificEnergyUnits.TerawattDayPerTonne: lambda value: ((value * ((24 * 3.6e3) / 1e3)) * 1000000000000.0),
+        
+        SpecificEnergyUnits.KilowattDayPerShortTon: lambda value: ((value * ((24 * 3.6e3) / 9.0718474e2)) * 1000.0),
+        
+        SpecificEnergyUnits.MegawattDayPerShortTon: lambda value: ((value * ((24 * 3.6e3) / 9.0718474e2)) * 1000000.0),
+        
+        SpecificEnergyUnits.GigawattDayPerShortTon: lambda value: ((value * ((24 * 3.6e3) / 9.0718474e2)) * 1000000000.0),
+        
+        SpecificEnergyUnits.TerawattDayPerShortTon: lambda value: ((value * ((24 * 3.6e3) / 9.0718474e2)) * 1000000000000.0),
+        
+        SpecificEnergyUnits.KilowattHourPerPound: lambda value: ((value * 7.93664e3) * 1000.0),
+        
+        SpecificEnergyUnits.MegawattHourPerPound: lambda value: ((value * 7.93664e3) * 1000000.0),
+        
+        SpecificEnergyUnits.GigawattHourPerPound: lambda value: ((value * 7.93664e3) * 1000000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: SpecificEnergyUnits = SpecificEnergyUnits.JoulePerKilogram):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: SpecificEnergyUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: SpecificEnergyUnits = SpecificEnergyUnits.JoulePerKilogram) -> SpecificEnergyArray:
+        """
+        Create a new instance of SpecificEnergyArray from values in the given unit.
+
+        :param values: The SpecificEnergy values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: SpecificEnergyUnits
+        :return: A new instance of SpecificEnergyArray.
+        :rtype: SpecificEnergyArray
+        """
+        return SpecificEnergyArray(values, unit)
+
+    
+    @property
+    def joules_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.JoulePerKilogram](self._values)
+
+    
+    @property
+    def mega_joules_per_tonne(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.MegaJoulePerTonne](self._values)
+
+    
+    @property
+    def calories_per_gram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.CaloriePerGram](self._values)
+
+    
+    @property
+    def watt_hours_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.WattHourPerKilogram](self._values)
+
+    
+    @property
+    def watt_days_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.WattDayPerKilogram](self._values)
+
+    
+    @property
+    def watt_days_per_tonne(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.WattDayPerTonne](self._values)
+
+    
+    @property
+    def watt_days_per_short_ton(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.WattDayPerShortTon](self._values)
+
+    
+    @property
+    def watt_hours_per_pound(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.WattHourPerPound](self._values)
+
+    
+    @property
+    def btu_per_pound(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.BtuPerPound](self._values)
+
+    
+    @property
+    def kilojoules_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.KilojoulePerKilogram](self._values)
+
+    
+    @property
+    def megajoules_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.MegajoulePerKilogram](self._values)
+
+    
+    @property
+    def kilocalories_per_gram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.KilocaloriePerGram](self._values)
+
+    
+    @property
+    def kilowatt_hours_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.KilowattHourPerKilogram](self._values)
+
+    
+    @property
+    def megawatt_hours_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.MegawattHourPerKilogram](self._values)
+
+    
+    @property
+    def gigawatt_hours_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.GigawattHourPerKilogram](self._values)
+
+    
+    @property
+    def kilowatt_days_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.KilowattDayPerKilogram](self._values)
+
+    
+    @property
+    def megawatt_days_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.MegawattDayPerKilogram](self._values)
+
+    
+    @property
+    def gigawatt_days_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.GigawattDayPerKilogram](self._values)
+
+    
+    @property
+    def terawatt_days_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.TerawattDayPerKilogram](self._values)
+
+    
+    @property
+    def kilowatt_days_per_tonne(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.KilowattDayPerTonne](self._values)
+
+    
+    @property
+    def megawatt_days_per_tonne(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.MegawattDayPerTonne](self._values)
+
+    
+    @property
+    def gigawatt_days_per_tonne(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.GigawattDayPerTonne](self._values)
+
+    
+    @property
+    def terawatt_days_per_tonne(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.TerawattDayPerTonne](self._values)
+
+    
+    @property
+    def kilowatt_days_per_short_ton(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.KilowattDayPerShortTon](self._values)
+
+    
+    @property
+    def megawatt_days_per_short_ton(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.MegawattDayPerShortTon](self._values)
+
+    
+    @property
+    def gigawatt_days_per_short_ton(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.GigawattDayPerShortTon](self._values)
+
+    
+    @property
+    def terawatt_days_per_short_ton(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.TerawattDayPerShortTon](self._values)
+
+    
+    @property
+    def kilowatt_hours_per_pound(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.KilowattHourPerPound](self._values)
+
+    
+    @property
+    def megawatt_hours_per_pound(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.MegawattHourPerPound](self._values)
+
+    
+    @property
+    def gigawatt_hours_per_pound(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEnergyUnits.GigawattHourPerPound](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.specific_entropy import SpecificEntropy, SpecificEntropyUnits
+
+
+class SpecificEntropyArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of SpecificEntropy values, held in JoulePerKilogramKelvin.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (SpecificEntropyUnits): The SpecificEntropy unit of the values, The default unit is JoulePerKilogramKelvin
+    """
+    __slots__ = ()
+
+    _quantity = SpecificEntropy
+
+    # Whole-array variants of the SpecificEntropy conversion functions.
+    _conversions_from_base = {
+        
+        SpecificEntropyUnits.JoulePerKilogramKelvin: lambda value: (value),
+        
+        SpecificEntropyUnits.JoulePerKilogramDegreeCelsius: lambda value: (value),
+        
+        SpecificEntropyUnits.CaloriePerGramKelvin: lambda value: (value / 4.184e3),
+        
+        SpecificEntropyUnits.BtuPerPoundFahrenheit: lambda value: (value / 4.1868e3),
+        
+        SpecificEntropyUnits.KilojoulePerKilogramKelvin: lambda value: ((value) / 1000.0),
+        
+        SpecificEntropyUnits.MegajoulePerKilogramKelvin: lambda value: ((value) / 1000000.0),
+        
+        SpecificEntropyUnits.KilojoulePerKilogramDegreeCelsius: lambda value: ((value) / 1000.0),
+        
+        SpecificEntropyUnits.MegajoulePerKilogramDegreeCelsius: lambda value: ((value) / 1000000.0),
+        
+        SpecificEntropyUnits.KilocaloriePerGramKelvin: lambda value: ((value / 4.184e3) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        SpecificEntropyUnits.JoulePerKilogramKelvin: lambda value: (value),
+        
+        SpecificEntropyUnits.JoulePerKilogramDegreeCelsius: lambda value: (value),
+        
+        SpecificEntropyUnits.CaloriePerGramKelvin: lambda value: (value * 4.184e3),
+        
+        SpecificEntropyUnits.BtuPerPoundFahrenheit: lambda value: (value * 4.1868e3),
+        
+        SpecificEntropyUnits.KilojoulePerKilogramKelvin: lambda value: ((value) * 1000.0),
+        
+        SpecificEntropyUnits.MegajoulePerKilogramKelvin: lambda value: ((value) * 1000000.0),
+        
+        SpecificEntropyUnits.KilojoulePerKilogramDegreeCelsius: lambda value: ((value) * 1000.0),
+        
+        SpecificEntropyUnits.MegajoulePerKilogramDegreeCelsius: lambda value: ((value) * 1000000.0),
+        
+        SpecificEntropyUnits.KilocaloriePerGramKelvin: lambda value: ((value * 4.184e3) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: SpecificEntropyUnits = SpecificEntropyUnits.JoulePerKilogramKelvin):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: SpecificEntropyUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: SpecificEntropyUnits = SpecificEntropyUnits.JoulePerKilogramKelvin) -> SpecificEntropyArray:
+        """
+        Create a new instance of SpecificEntropyArray from values in the given unit.
+
+        :param values: The SpecificEntropy values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: SpecificEntropyUnits
+        :return: A new instance of SpecificEntropyArray.
+        :rtype: SpecificEntropyArray
+        """
+        return SpecificEntropyArray(values, unit)
+
+    
+    @property
+    def joules_per_kilogram_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEntropyUnits.JoulePerKilogramKelvin](self._values)
+
+    
+    @property
+    def joules_per_kilogram_degree_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEntropyUnits.JoulePerKilogramDegreeCelsius](self._values)
+
+    
+    @property
+    def calories_per_gram_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEntropyUnits.CaloriePerGramKelvin](self._values)
+
+    
+    @property
+    def btus_per_pound_fahrenheit(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEntropyUnits.BtuPerPoundFahrenheit](self._values)
+
+    
+    @property
+    def kilojoules_per_kilogram_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEntropyUnits.KilojoulePerKilogramKelvin](self._values)
+
+    
+    @property
+    def megajoules_per_kilogram_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEntropyUnits.MegajoulePerKilogramKelvin](self._values)
+
+    
+    @property
+    def kilojoules_per_kilogram_degree_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEntropyUnits.KilojoulePerKilogramDegreeCelsius](self._values)
+
+    
+    @property
+    def megajoules_per_kilogram_degree_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEntropyUnits.MegajoulePerKilogramDegreeCelsius](self._values)
+
+    
+    @property
+    def kilocalories_per_gram_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificEntropyUnits.KilocaloriePerGramKelvin](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.specific_fuel_consumption import SpecificFuelConsumption, SpecificFuelConsumptionUnits
+
+
+class SpecificFuelConsumptionArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of SpecificFuelConsumption values, held in GramPerKiloNewtonSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (SpecificFuelConsumptionUnits): The SpecificFuelConsumption unit of the values, The default unit is GramPerKiloNewtonSecond
+    """
+    __slots__ = ()
+
+    _quantity = SpecificFuelConsumption
+
+    # Whole-array variants of the SpecificFuelConsumption conversion functions.
+    _conversions_from_base = {
+        
+        SpecificFuelConsumptionUnits.PoundMassPerPoundForceHour: lambda value: (value / 28.33),
+        
+        SpecificFuelConsumptionUnits.KilogramPerKilogramForceHour: lambda value: (value / 28.33),
+        
+        SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond: lambda value: (value),
+        
+        SpecificFuelConsumptionUnits.KilogramPerKiloNewtonSecond: lambda value: ((value) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        SpecificFuelConsumptionUnits.PoundMassPerPoundForceHour: lambda value: (value * 28.33),
+        
+        SpecificFuelConsumptionUnits.KilogramPerKilogramForceHour: lambda value: (value * 28.33),
+        
+        SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond: lambda value: (value),
+        
+        SpecificFuelConsumptionUnits.KilogramPerKiloNewtonSecond: lambda value: ((value) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: SpecificFuelConsumptionUnits = SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: SpecificFuelConsumptionUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: SpecificFuelConsumptionUnits = SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond) -> SpecificFuelConsumptionArray:
+        """
+        Create a new instance of SpecificFuelConsumptionArray from values in the given unit.
+
+        :param values: The SpecificFuelConsumption values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: SpecificFuelConsumptionUnits
+        :return: A new instance of SpecificFuelConsumptionArray.
+        :rtype: SpecificFuelConsumptionArray
+        """
+        return SpecificFuelConsumptionArray(values, unit)
+
+    
+    @property
+    def pounds_mass_per_pound_force_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificFuelConsumptionUnits.PoundMassPerPoundForceHour](self._values)
+
+    
+    @property
+    def kilograms_per_kilogram_force_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificFuelConsumptionUnits.KilogramPerKilogramForceHour](self._values)
+
+    
+    @property
+    def grams_per_kilo_newton_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond](self._values)
+
+    
+    @property
+    def kilograms_per_kilo_newton_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificFuelConsumptionUnits.KilogramPerKiloNewtonSecond](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.specific_volume import SpecificVolume, SpecificVolumeUnits
+
+
+class SpecificVolumeArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of SpecificVolume values, held in CubicMeterPerKilogram.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (SpecificVolumeUnits): The SpecificVolume unit of the values, The default unit is CubicMeterPerKilogram
+    """
+    __slots__ = ()
+
+    _quantity = SpecificVolume
+
+    # Whole-array variants of the SpecificVolume conversion functions.
+    _conversions_from_base = {
+        
+        SpecificVolumeUnits.CubicMeterPerKilogram: lambda value: (value),
+        
+        SpecificVolumeUnits.CubicFootPerPound: lambda value: (value * 16.01846353),
+        
+        SpecificVolumeUnits.MillicubicMeterPerKilogram: lambda value: ((value) / 0.001),
+        
+    }
+
+    _conversions_to_base = {
+        
+        SpecificVolumeUnits.CubicMeterPerKilogram: lambda value: (value),
+        
+        SpecificVolumeUnits.CubicFootPerPound: lambda value: (value / 16.01846353),
+        
+        SpecificVolumeUnits.MillicubicMeterPerKilogram: lambda value: ((value) * 0.001),
+        
+    }
+
+    def __init__(self, values, from_unit: SpecificVolumeUnits = SpecificVolumeUnits.CubicMeterPerKilogram):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: SpecificVolumeUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: SpecificVolumeUnits = SpecificVolumeUnits.CubicMeterPerKilogram) -> SpecificVolumeArray:
+        """
+        Create a new instance of SpecificVolumeArray from values in the given unit.
+
+        :param values: The SpecificVolume values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: SpecificVolumeUnits
+        :return: A new instance of SpecificVolumeArray.
+        :rtype: SpecificVolumeArray
+        """
+        return SpecificVolumeArray(values, unit)
+
+    
+    @property
+    def cubic_meters_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificVolumeUnits.CubicMeterPerKilogram](self._values)
+
+    
+    @property
+    def cubic_feet_per_pound(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificVolumeUnits.CubicFootPerPound](self._values)
+
+    
+    @property
+    def millicubic_meters_per_kilogram(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificVolumeUnits.MillicubicMeterPerKilogram](self._values)
+
+    
\ No newline at end of file
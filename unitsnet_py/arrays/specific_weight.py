@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.specific_weight import SpecificWeight, SpecificWeightUnits
+
+
+class SpecificWeightArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of SpecificWeight values, held in NewtonPerCubicMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (SpecificWeightUnits): The SpecificWeight unit of the values, The default unit is NewtonPerCubicMeter
+    """
+    __slots__ = ()
+
+    _quantity = SpecificWeight
+
+    # Whole-array variants of the SpecificWeight conversion functions.
+    _conversions_from_base = {
+        
+        SpecificWeightUnits.NewtonPerCubicMillimeter: lambda value: (value * 0.000000001),
+        
+        SpecificWeightUnits.NewtonPerCubicCentimeter: lambda value: (value * 0.000001),
+        
+        SpecificWeightUnits.NewtonPerCubicMeter: lambda value: (value),
+        
+        SpecificWeightUnits.KilogramForcePerCubicMillimeter: lambda value: (value / 9.80665e9),
+        
+        SpecificWeightUnits.KilogramForcePerCubicCentimeter: lambda value: (value / 9.80665e6),
+        
+        SpecificWeightUnits.KilogramForcePerCubicMeter: lambda value: (value / 9.80665),
+        
+        SpecificWeightUnits.PoundForcePerCubicInch: lambda value: (value / 2.714471375263134e5),
+        
+        SpecificWeightUnits.PoundForcePerCubicFoot: lambda value: (value / 1.570874638462462e2),
+        
+        SpecificWeightUnits.TonneForcePerCubicMillimeter: lambda value: (value / 9.80665e12),
+        
+        SpecificWeightUnits.TonneForcePerCubicCentimeter: lambda value: (value / 9.80665e9),
+        
+        SpecificWeightUnits.TonneForcePerCubicMeter: lambda value: (value / 9.80665e3),
+        
+        SpecificWeightUnits.KilonewtonPerCubicMillimeter: lambda value: ((value * 0.000000001) / 1000.0),
+        
+        SpecificWeightUnits.KilonewtonPerCubicCentimeter: lambda value: ((value * 0.000001) / 1000.0),
+        
+        SpecificWeightUnits.KilonewtonPerCubicMeter: lambda value: ((value) / 1000.0),
+        
+        SpecificWeightUnits.MeganewtonPerCubicMeter: lambda value: ((value) / 1000000.0),
+        
+        SpecificWeightUnits.KilopoundForcePerCubicInch: lambda value: ((value / 2.714471375263134e5) / 1000.0),
+        
+        SpecificWeightUnits.KilopoundForcePerCubicFoot: lambda value: ((value / 1.570874638462462e2) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        SpecificWeightUnits.NewtonPerCubicMillimeter: lambda value: (value * 1000000000),
+        
+        SpecificWeightUnits.NewtonPerCubicCentimeter: lambda value: (value * 1000000),
+        
+        SpecificWeightUnits.NewtonPerCubicMeter: lambda value: (value),
+        
+        SpecificWeightUnits.KilogramForcePerCubicMillimeter: lambda value: (value * 9.80665e9),
+        
+        SpecificWeightUnits.KilogramForcePerCubicCentimeter: lambda value: (value * 9.80665e6),
+        
+        SpecificWeightUnits.KilogramForcePerCubicMeter: lambda value: (value * 9.80665),
+        
+        SpecificWeightUnits.PoundForcePerCubicInch: lambda value: (value * 2.714471375263134e5),
+        
+        SpecificWeightUnits.PoundForcePerCubicFoot: lambda value: (value * 1.570874638462462e2),
+        
+        SpecificWeightUnits.TonneForcePerCubicMillimeter: lambda value: (value * 9.80665e12),
+        
+        SpecificWeightUnits.TonneForcePerCubicCentimeter: lambda value: (value * 9.80665e9),
+        
+        SpecificWeightUnits.TonneForcePerCubicMeter: lambda value: (value * 9.80665e3),
+        
+        SpecificWeightUnits.KilonewtonPerCubicMillimeter: lambda value: ((value * 1000000000) * 1000.0),
+        
+        SpecificWeightUnits.KilonewtonPerCubicCentimeter: lambda value: ((value * 1000000) * 1000.0),
+        
+        SpecificWeightUnits.KilonewtonPerCubicMeter: lambda value: ((value) * 1000.0),
+        
+        SpecificWeightUnits.MeganewtonPerCubicMeter: lambda value: ((value) * 1000000.0),
+        
+        SpecificWeightUnits.KilopoundForcePerCubicInch: lambda value: ((value * 2.714471375263134e5) * 1000.0),
+        
+        SpecificWeightUnits.KilopoundForcePerCubicFoot: lambda value: ((value * 1.570874638462462e2) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: SpecificWeightUnits = SpecificWeightUnits.NewtonPerCubicMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: SpecificWeightUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: SpecificWeightUnits = SpecificWeightUnits.NewtonPerCubicMeter) -> SpecificWeightArray:
+        """
+        Create a new instance of SpecificWeightArray from values in the given unit.
+
+        :param values: The SpecificWeight values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: SpecificWeightUnits
+        :return: A new instance of SpecificWeightArray.
+        :rtype: SpecificWeightArray
+        """
+        return SpecificWeightArray(values, unit)
+
+    
+    @property
+    def newtons_per_cubic_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.NewtonPerCubicMillimeter](self._values)
+
+    
+    @property
+    def newtons_per_cubic_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.NewtonPerCubicCentimeter](self._values)
+
+    
+    @property
+    def newtons_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.NewtonPerCubicMeter](self._values)
+
+    
+    @property
+    def kilograms_force_per_cubic_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.KilogramForcePerCubicMillimeter](self._values)
+
+    
+    @property
+    def kilograms_force_per_cubic_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.KilogramForcePerCubicCentimeter](self._values)
+
+    
+    @property
+    def kilograms_force_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.KilogramForcePerCubicMeter](self._values)
+
+    
+    @property
+    def pounds_force_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.PoundForcePerCubicInch](self._values)
+
+    
+    @property
+    def pounds_force_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.PoundForcePerCubicFoot](self._values)
+
+    
+    @property
+    def tonnes_force_per_cubic_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.TonneForcePerCubicMillimeter](self._values)
+
+    
+    @property
+    def tonnes_force_per_cubic_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.TonneForcePerCubicCentimeter](self._values)
+
+    
+    @property
+    def tonnes_force_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.TonneForcePerCubicMeter](self._values)
+
+    
+    @property
+    def kilonewtons_per_cubic_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.KilonewtonPerCubicMillimeter](self._values)
+
+    
+    @property
+    def kilonewtons_per_cubic_centimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.KilonewtonPerCubicCentimeter](self._values)
+
+    
+    @property
+    def kilonewtons_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.KilonewtonPerCubicMeter](self._values)
+
+    
+    @property
+    def meganewtons_per_cubic_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.MeganewtonPerCubicMeter](self._values)
+
+    
+    @property
+    def kilopounds_force_per_cubic_inch(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.KilopoundForcePerCubicInch](self._values)
+
+    
+    @property
+    def kilopounds_force_per_cubic_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpecificWeightUnits.KilopoundForcePerCubicFoot](self._values)
+
+    
\ No newline at end of file
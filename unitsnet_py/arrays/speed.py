@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.speed import Speed, SpeedUnits
+
+
+class SpeedArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Speed values, held in MeterPerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (SpeedUnits): The Speed unit of the values, The default unit is MeterPerSecond
+    """
+    __slots__ = ()
+
+    _quantity = Speed
+
+    # Whole-array variants of the Speed conversion functions.
+    _conversions_from_base = {
+        
+        SpeedUnits.MeterPerSecond: lambda value: (value),
+        
+        SpeedUnits.MeterPerMinute: lambda value: (value * 60),
+        
+        SpeedUnits.MeterPerHour: lambda value: (value * 3600),
+        
+        SpeedUnits.FootPerSecond: lambda value: (value / 0.3048),
+        
+        SpeedUnits.FootPerMinute: lambda value: (value / 0.3048 * 60),
+        
+        SpeedUnits.FootPerHour: lambda value: (value / 0.3048 * 3600),
+        
+        SpeedUnits.UsSurveyFootPerSecond: lambda value: (value * 3937 / 1200),
+        
+        SpeedUnits.UsSurveyFootPerMinute: lambda value: ((value * 3937 / 1200) * 60),
+        
+        SpeedUnits.UsSurveyFootPerHour: lambda value: ((value * 3937 / 1200) * 3600),
+        
+        SpeedUnits.InchPerSecond: lambda value: (value / 2.54e-2),
+        
+        SpeedUnits.InchPerMinute: lambda value: ((value / 2.54e-2) * 60),
+        
+        SpeedUnits.InchPerHour: lambda value: ((value / 2.54e-2) * 3600),
+        
+        SpeedUnits.YardPerSecond: lambda value: (value / 0.9144),
+        
+        SpeedUnits.YardPerMinute: lambda value: (value / 0.9144 * 60),
+        
+        SpeedUnits.YardPerHour: lambda value: (value / 0.9144 * 3600),
+        
+        SpeedUnits.Knot: lambda value: (value / (1852.0 / 3600.0)),
+        
+        SpeedUnits.MilePerHour: lambda value: (value / 0.44704),
+        
+        SpeedUnits.Mach: lambda value: (value / 340.29),
+        
+        SpeedUnits.NanometerPerSecond: lambda value: ((value) / 1e-09),
+        
+        SpeedUnits.MicrometerPerSecond: lambda value: ((value) / 1e-06),
+        
+        SpeedUnits.MillimeterPerSecond: lambda value: ((value) / 0.001),
+        
+        SpeedUnits.CentimeterPerSecond: lambda value: ((value) / 0.01),
+        
+        SpeedUnits.DecimeterPerSecond: lambda value: ((value) / 0.1),
+        
+        SpeedUnits.KilometerPerSecond: lambda value: ((value) / 1000.0),
+        
+        SpeedUnits.NanometerPerMinute: lambda value: ((value * 60) / 1e-09),
+        
+        SpeedUnits.MicrometerPerMinute: lambda value: ((value * 60) / 1e-06),
+        
+        SpeedUnits.MillimeterPerMinute: lambda value: ((value * 60) / 0.001),
+        
+        SpeedUnits.CentimeterPerMinute: lambda value: ((value * 60) / 0.01),
+        
+        SpeedUnits.DecimeterPerMinute: lambda value: ((value * 60) / 0.1),
+        
+        SpeedUnits.KilometerPerMinute: lambda value: ((value * 60) / 1000.0),
+        
+        SpeedUnits.MillimeterPerHour: lambda value: ((value * 3600) / 0.001),
+        
+        SpeedUnits.CentimeterPerHour: lambda value: ((value * 3600) / 0.01),
+        
+        SpeedUnits.KilometerPerHour: lambda value: ((value * 3600) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        SpeedUnits.MeterPerSecond: lambda value: (value),
+        
+        SpeedUnits.MeterPerMinute: lambda value: (value / 60),
+        
+        SpeedUnits.MeterPerHour: lambda value: (value / 3600),
+        
+        SpeedUnits.FootPerSecond: lambda value: (value * 0.3048),
+        
+        SpeedUnits.FootPerMinute: lambda value: (value * 0.3048 / 60),
+        
+        SpeedUnits.FootPerHour: lambda value: (value * 0.3048 / 3600),
+        
+        SpeedUnits.UsSurveyFootPerSecond: lambda value: (value * 1200 / 3937),
+        
+        SpeedUnits.UsSurveyFootPerMinute: lambda value: ((value * 1200 / 3937) / 60),
+        
+        SpeedUnits.UsSurveyFootPerHour: lambda value: ((value * 1200 / 3937) / 3600),
+        
+        SpeedUnits.InchPerSecond: lambda value: (value * 2.54e-2),
+        
+        SpeedUnits.InchPerMinute: lambda value: ((value / 60) * 2.54e-2),
+        
+        SpeedUnits.InchPerHour: lambda value: ((value / 3600) * 2.54e-2),
+        
+        SpeedUnits.YardPerSecond: lambda value: (value * 0.9144),
+        
+        SpeedUnits.YardPerMinute: lambda value: (value * 0.9144 / 60),
+        
+        SpeedUnits.YardPerHour: lambda value: (value * 0.9144 / 3600),
+        
+        SpeedUnits.Knot: lambda value: (value * (1852.0 / 3600.0)),
+        
+        SpeedUnits.MilePerHour: lambda value: (value * 0.44704),
+        
+        SpeedUnits.Mach: lambda value: (value * 340.29),
+        
+        SpeedUnits.NanometerPerSecond: lambda value: ((value) * 1e-09),
+        
+        SpeedUnits.MicrometerPerSecond: lambda value: ((value) * 1e-06),
+        
+        SpeedUnits.MillimeterPerSecond: lambda value: ((value) * 0.001),
+        
+        SpeedUnits.CentimeterPerSecond: lambda value: ((value) * 0.01),
+        
+        SpeedUnits.DecimeterPerSecond: lambda value: ((value) * 0.1),
+        
+        SpeedUnits.KilometerPerSecond: lambda value: ((value) * 1000.0),
+        
+        SpeedUnits.NanometerPerMinute: lambda value: ((value / 60) * 1e-09),
+        
+        SpeedUnits.MicrometerPerMinute: lambda value: ((value / 60) * 1e-06),
+        
+        SpeedUnits.MillimeterPerMinute: lambda value: ((value / 60) * 0.001),
+        
+        SpeedUnits.CentimeterPerMinute: lambda value: ((value / 60) * 0.01),
+        
+        SpeedUnits.DecimeterPerMinute: lambda value: ((value / 60) * 0.1),
+        
+        SpeedUnits.KilometerPerMinute: lambda value: ((value / 60) * 1000.0),
+        
+        SpeedUnits.MillimeterPerHour: lambda value: ((value / 3600) * 0.001),
+        
+        SpeedUnits.CentimeterPerHour: lambda value: ((value / 3600) * 0.01),
+        
+        SpeedUnits.KilometerPerHour: lambda value: ((value / 3600) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: SpeedUnits = SpeedUnits.MeterPerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: SpeedUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: SpeedUnits = SpeedUnits.MeterPerSecond) -> SpeedArray:
+        """
+        Create a new instance of SpeedArray from values in the given unit.
+
+        :param values: The Speed values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: SpeedUnits
+        :return: A new instance of SpeedArray.
+        :rtype: SpeedArray
+        """
+        return SpeedArray(values, unit)
+
+    
+    @property
+    def meters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.MeterPerSecond](self._values)
+
+    
+    @property
+    def meters_per_minutes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.MeterPerMinute](self._values)
+
+    
+    @property
+    def meters_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.MeterPerHour](self._values)
+
+    
+    @property
+    def feet_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.FootPerSecond](self._values)
+
+    
+    @property
+    def feet_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.FootPerMinute](self._values)
+
+    
+    @property
+    def feet_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.FootPerHour](self._values)
+
+    
+    @property
+    def us_survey_feet_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.UsSurveyFootPerSecond](self._values)
+
+    
+    @property
+    def us_survey_feet_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.UsSurveyFootPerMinute](self._values)
+
+    
+    @property
+    def us_survey_feet_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.UsSurveyFootPerHour](self._values)
+
+    
+    @property
+    def inches_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.InchPerSecond](self._values)
+
+    
+    @property
+    def inches_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.InchPerMinute](self._values)
+
+    
+    @property
+    def inches_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.InchPerHour](self._values)
+
+    
+    @property
+    def yards_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.YardPerSecond](self._values)
+
+    
+    @property
+    def yards_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.YardPerMinute](self._values)
+
+    
+    @property
+    def yards_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.YardPerHour](self._values)
+
+    
+    @property
+    def knots(self) -> np.ndarray:
+        """
+        The knot, by definition, is a unit of speed equals to 1 nautical mile per hour, which is exactly 1852.000 metres per hour. The length of the internationally agreed nautical mile is 1852 m. The US adopted the international definition in 1954, the UK adopted the international nautical mile definition in 1970.
+        """
+        return self._conversions_from_base[SpeedUnits.Knot](self._values)
+
+    
+    @property
+    def miles_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.MilePerHour](self._values)
+
+    
+    @property
+    def mach(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.Mach](self._values)
+
+    
+    @property
+    def nanometers_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.NanometerPerSecond](self._values)
+
+    
+    @property
+    def micrometers_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.MicrometerPerSecond](self._values)
+
+    
+    @property
+    def millimeters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.MillimeterPerSecond](self._values)
+
+    
+    @property
+    def centimeters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.CentimeterPerSecond](self._values)
+
+    
+    @property
+    def decimeters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.DecimeterPerSecond](self._values)
+
+    
+    @property
+    def kilometers_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.KilometerPerSecond](self._values)
+
+    
+    @property
+    def nanometers_per_minutes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.NanometerPerMinute](self._values)
+
+    
+    @property
+    def micrometers_per_minutes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.MicrometerPerMinute](self._values)
+
+    
+    @property
+    def millimeters_per_minutes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.MillimeterPerMinute](self._values)
+
+    
+    @property
+    def centimeters_per_minutes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.CentimeterPerMinute](self._values)
+
+    
+    @property
+    def decimeters_per_minutes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.DecimeterPerMinute](self._values)
+
+    
+    @property
+    def kilometers_per_minutes(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.KilometerPerMinute](self._values)
+
+    
+    @property
+    def millimeters_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.MillimeterPerHour](self._values)
+
+    
+    @property
+    def centimeters_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.CentimeterPerHour](self._values)
+
+    
+    @property
+    def kilometers_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[SpeedUnits.KilometerPerHour](self._values)
+
+    
\ No newline at end of file
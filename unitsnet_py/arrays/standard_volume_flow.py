@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.standard_volume_flow import StandardVolumeFlow, StandardVolumeFlowUnits
+
+
+class StandardVolumeFlowArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of StandardVolumeFlow values, held in StandardCubicMeterPerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (StandardVolumeFlowUnits): The StandardVolumeFlow unit of the values, The default unit is StandardCubicMeterPerSecond
+    """
+    __slots__ = ()
+
+    _quantity = StandardVolumeFlow
+
+    # Whole-array variants of the StandardVolumeFlow conversion functions.
+    _conversions_from_base = {
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerSecond: lambda value: (value),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerMinute: lambda value: (value * 60),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerHour: lambda value: (value * 3600),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerDay: lambda value: (value * 86400),
+        
+        StandardVolumeFlowUnits.StandardCubicCentimeterPerMinute: lambda value: (value * 6e7),
+        
+        StandardVolumeFlowUnits.StandardLiterPerMinute: lambda value: (value * 60000),
+        
+        StandardVolumeFlowUnits.StandardCubicFootPerSecond: lambda value: (value * 35.314666721),
+        
+        StandardVolumeFlowUnits.StandardCubicFootPerMinute: lambda value: (value * 2118.88000326),
+        
+        StandardVolumeFlowUnits.StandardCubicFootPerHour: lambda value: (value / 7.8657907199999087346816086183876e-6),
+        
+    }
+
+    _conversions_to_base = {
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerSecond: lambda value: (value),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerMinute: lambda value: (value / 60),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerHour: lambda value: (value / 3600),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerDay: lambda value: (value / 86400),
+        
+        StandardVolumeFlowUnits.StandardCubicCentimeterPerMinute: lambda value: (value / 6e7),
+        
+        StandardVolumeFlowUnits.StandardLiterPerMinute: lambda value: (value / 60000),
+        
+        StandardVolumeFlowUnits.StandardCubicFootPerSecond: lambda value: (value / 35.314666721),
+        
+        StandardVolumeFlowUnits.StandardCubicFootPerMinute: lambda value: (value / 2118.88000326),
+        
+        StandardVolumeFlowUnits.StandardCubicFootPerHour: lambda value: (value * 7.8657907199999087346816086183876e-6),
+        
+    }
+
+    def __init__(self, values, from_unit: StandardVolumeFlowUnits = StandardVolumeFlowUnits.StandardCubicMeterPerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: StandardVolumeFlowUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: StandardVolumeFlowUnits = StandardVolumeFlowUnits.StandardCubicMeterPerSecond) -> StandardVolumeFlowArray:
+        """
+        Create a new instance of StandardVolumeFlowArray from values in the given unit.
+
+        :param values: The StandardVolumeFlow values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: StandardVolumeFlowUnits
+        :return: A new instance of StandardVolumeFlowArray.
+        :rtype: StandardVolumeFlowArray
+        """
+        return StandardVolumeFlowArray(values, unit)
+
+    
+    @property
+    def standard_cubic_meters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[StandardVolumeFlowUnits.StandardCubicMeterPerSecond](self._values)
+
+    
+    @property
+    def standard_cubic_meters_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[StandardVolumeFlowUnits.StandardCubicMeterPerMinute](self._values)
+
+    
+    @property
+    def standard_cubic_meters_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[StandardVolumeFlowUnits.StandardCubicMeterPerHour](self._values)
+
+    
+    @property
+    def standard_cubic_meters_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[StandardVolumeFlowUnits.StandardCubicMeterPerDay](self._values)
+
+    
+    @property
+    def standard_cubic_centimeters_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[StandardVolumeFlowUnits.StandardCubicCentimeterPerMinute](self._values)
+
+    
+    @property
+    def standard_liters_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[StandardVolumeFlowUnits.StandardLiterPerMinute](self._values)
+
+    
+    @property
+    def standard_cubic_feet_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[StandardVolumeFlowUnits.StandardCubicFootPerSecond](self._values)
+
+    
+    @property
+    def standard_cubic_feet_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[StandardVolumeFlowUnits.StandardCubicFootPerMinute](self._values)
+
+    
+    @property
+    def standard_cubic_feet_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[StandardVolumeFlowUnits.StandardCubicFootPerHour](self._values)
+
+    
\ No newline at end of file
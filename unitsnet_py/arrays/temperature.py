@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.temperature import Temperature, TemperatureUnits
+
+
+class TemperatureArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Temperature values, held in Kelvin.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (TemperatureUnits): The Temperature unit of the values, The default unit is Kelvin
+    """
+    __slots__ = ()
+
+    _quantity = Temperature
+
+    # Whole-array variants of the Temperature conversion functions.
+    _conversions_from_base = {
+        
+        TemperatureUnits.Kelvin: lambda value: (value),
+        
+        TemperatureUnits.DegreeCelsius: lambda value: (value - 273.15),
+        
+        TemperatureUnits.MillidegreeCelsius: lambda value: ((value - 273.15) * 1000),
+        
+        TemperatureUnits.DegreeDelisle: lambda value: ((value - 373.15) * -3 / 2),
+        
+        TemperatureUnits.DegreeFahrenheit: lambda value: ((value - 459.67 * 5 / 9) * 9 / 5),
+        
+        TemperatureUnits.DegreeNewton: lambda value: ((value - 273.15) * 33 / 100),
+        
+        TemperatureUnits.DegreeRankine: lambda value: (value * 9 / 5),
+        
+        TemperatureUnits.DegreeReaumur: lambda value: ((value - 273.15) * 4 / 5),
+        
+        TemperatureUnits.DegreeRoemer: lambda value: ((value - (273.15 - 7.5 * 40 / 21)) * 21 / 40),
+        
+        TemperatureUnits.SolarTemperature: lambda value: (value / 5778),
+        
+    }
+
+    _conversions_to_base = {
+        
+        TemperatureUnits.Kelvin: lambda value: (value),
+        
+        TemperatureUnits.DegreeCelsius: lambda value: (value + 273.15),
+        
+        TemperatureUnits.MillidegreeCelsius: lambda value: (value / 1000 + 273.15),
+        
+        TemperatureUnits.DegreeDelisle: lambda value: (value * -2 / 3 + 373.15),
+        
+        TemperatureUnits.DegreeFahrenheit: lambda value: (value * 5 / 9 + 459.67 * 5 / 9),
+        
+        TemperatureUnits.DegreeNewton: lambda value: (value * 100 / 33 + 273.15),
+        
+        TemperatureUnits.DegreeRankine: lambda value: (value * 5 / 9),
+        
+        TemperatureUnits.DegreeReaumur: lambda value: (value * 5 / 4 + 273.15),
+        
+        TemperatureUnits.DegreeRoemer: lambda value: (value * 40 / 21 + 273.15 - 7.5 * 40 / 21),
+        
+        TemperatureUnits.SolarTemperature: lambda value: (value * 5778),
+        
+    }
+
+    def __init__(self, values, from_unit: TemperatureUnits = TemperatureUnits.Kelvin):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: TemperatureUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: TemperatureUnits = TemperatureUnits.Kelvin) -> TemperatureArray:
+        """
+        Create a new instance of TemperatureArray from values in the given unit.
+
+        :param values: The Temperature values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: TemperatureUnits
+        :return: A new instance of TemperatureArray.
+        :rtype: TemperatureArray
+        """
+        return TemperatureArray(values, unit)
+
+    
+    @property
+    def kelvins(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureUnits.Kelvin](self._values)
+
+    
+    @property
+    def degrees_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureUnits.DegreeCelsius](self._values)
+
+    
+    @property
+    def millidegrees_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureUnits.MillidegreeCelsius](self._values)
+
+    
+    @property
+    def degrees_delisle(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureUnits.DegreeDelisle](self._values)
+
+    
+    @property
+    def degrees_fahrenheit(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureUnits.DegreeFahrenheit](self._values)
+
+    
+    @property
+    def degrees_newton(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureUnits.DegreeNewton](self._values)
+
+    
+    @property
+    def degrees_rankine(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureUnits.DegreeRankine](self._values)
+
+    
+    @property
+    def degrees_reaumur(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureUnits.DegreeReaumur](self._values)
+
+    
+    @property
+    def degrees_roemer(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureUnits.DegreeRoemer](self._values)
+
+    
+    @property
+    def solar_temperatures(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureUnits.SolarTemperature](self._values)
+
+    
\ No newline at end of file
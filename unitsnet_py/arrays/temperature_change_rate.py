@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.temperature_change_rate import TemperatureChangeRate, TemperatureChangeRateUnits
+
+
+class TemperatureChangeRateArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of TemperatureChangeRate values, held in DegreeCelsiusPerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (TemperatureChangeRateUnits): The TemperatureChangeRate unit of the values, The default unit is DegreeCelsiusPerSecond
+    """
+    __slots__ = ()
+
+    _quantity = TemperatureChangeRate
+
+    # Whole-array variants of the TemperatureChangeRate conversion functions.
+    _conversions_from_base = {
+        
+        TemperatureChangeRateUnits.DegreeCelsiusPerSecond: lambda value: (value),
+        
+        TemperatureChangeRateUnits.DegreeCelsiusPerMinute: lambda value: (value * 60),
+        
+        TemperatureChangeRateUnits.NanodegreeCelsiusPerSecond: lambda value: ((value) / 1e-09),
+        
+        TemperatureChangeRateUnits.MicrodegreeCelsiusPerSecond: lambda value: ((value) / 1e-06),
+        
+        TemperatureChangeRateUnits.MillidegreeCelsiusPerSecond: lambda value: ((value) / 0.001),
+        
+        TemperatureChangeRateUnits.CentidegreeCelsiusPerSecond: lambda value: ((value) / 0.01),
+        
+        TemperatureChangeRateUnits.DecidegreeCelsiusPerSecond: lambda value: ((value) / 0.1),
+        
+        TemperatureChangeRateUnits.DecadegreeCelsiusPerSecond: lambda value: ((value) / 10.0),
+        
+        TemperatureChangeRateUnits.HectodegreeCelsiusPerSecond: lambda value: ((value) / 100.0),
+        
+        TemperatureChangeRateUnits.KilodegreeCelsiusPerSecond: lambda value: ((value) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        TemperatureChangeRateUnits.DegreeCelsiusPerSecond: lambda value: (value),
+        
+        TemperatureChangeRateUnits.DegreeCelsiusPerMinute: lambda value: (value / 60),
+        
+        TemperatureChangeRateUnits.NanodegreeCelsiusPerSecond: lambda value: ((value) * 1e-09),
+        
+        TemperatureChangeRateUnits.MicrodegreeCelsiusPerSecond: lambda value: ((value) * 1e-06),
+        
+        TemperatureChangeRateUnits.MillidegreeCelsiusPerSecond: lambda value: ((value) * 0.001),
+        
+        TemperatureChangeRateUnits.CentidegreeCelsiusPerSecond: lambda value: ((value) * 0.01),
+        
+        TemperatureChangeRateUnits.DecidegreeCelsiusPerSecond: lambda value: ((value) * 0.1),
+        
+        TemperatureChangeRateUnits.DecadegreeCelsiusPerSecond: lambda value: ((value) * 10.0),
+        
+        TemperatureChangeRateUnits.HectodegreeCelsiusPerSecond: lambda value: ((value) * 100.0),
+        
+        TemperatureChangeRateUnits.KilodegreeCelsiusPerSecond: lambda value: ((value) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: TemperatureChangeRateUnits = TemperatureChangeRateUnits.DegreeCelsiusPerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: TemperatureChangeRateUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: TemperatureChangeRateUnits = TemperatureChangeRateUnits.DegreeCelsiusPerSecond) -> TemperatureChangeRateArray:
+        """
+        Create a new instance of TemperatureChangeRateArray from values in the given unit.
+
+        :param values: The TemperatureChangeRate values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: TemperatureChangeRateUnits
+        :return: A new instance of TemperatureChangeRateArray.
+        :rtype: TemperatureChangeRateArray
+        """
+        return TemperatureChangeRateArray(values, unit)
+
+    
+    @property
+    def degrees_celsius_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureChangeRateUnits.DegreeCelsiusPerSecond](self._values)
+
+    
+    @property
+    def degrees_celsius_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureChangeRateUnits.DegreeCelsiusPerMinute](self._values)
+
+    
+    @property
+    def nanodegrees_celsius_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureChangeRateUnits.NanodegreeCelsiusPerSecond](self._values)
+
+    
+    @property
+    def microdegrees_celsius_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureChangeRateUnits.MicrodegreeCelsiusPerSecond](self._values)
+
+    
+    @property
+    def millidegrees_celsius_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureChangeRateUnits.MillidegreeCelsiusPerSecond](self._values)
+
+    
+    @property
+    def centidegrees_celsius_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureChangeRateUnits.CentidegreeCelsiusPerSecond](self._values)
+
+    
+    @property
+    def decidegrees_celsius_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureChangeRateUnits.DecidegreeCelsiusPerSecond](self._values)
+
+    
+    @property
+    def decadegrees_celsius_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureChangeRateUnits.DecadegreeCelsiusPerSecond](self._values)
+
+    
+    @property
+    def hectodegrees_celsius_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureChangeRateUnits.HectodegreeCelsiusPerSecond](self._values)
+
+    
+    @property
+    def kilodegrees_celsius_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureChangeRateUnits.KilodegreeCelsiusPerSecond](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.temperature_delta import TemperatureDelta, TemperatureDeltaUnits
+
+
+class TemperatureDeltaArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of TemperatureDelta values, held in Kelvin.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (TemperatureDeltaUnits): The TemperatureDelta unit of the values, The default unit is Kelvin
+    """
+    __slots__ = ()
+
+    _quantity = TemperatureDelta
+
+    # Whole-array variants of the TemperatureDelta conversion functions.
+    _conversions_from_base = {
+        
+        TemperatureDeltaUnits.Kelvin: lambda value: (value),
+        
+        TemperatureDeltaUnits.DegreeCelsius: lambda value: (value),
+        
+        TemperatureDeltaUnits.DegreeDelisle: lambda value: (value * -3 / 2),
+        
+        TemperatureDeltaUnits.DegreeFahrenheit: lambda value: (value * 9 / 5),
+        
+        TemperatureDeltaUnits.DegreeNewton: lambda value: (value * 33 / 100),
+        
+        TemperatureDeltaUnits.DegreeRankine: lambda value: (value * 9 / 5),
+        
+        TemperatureDeltaUnits.DegreeReaumur: lambda value: (value * 4 / 5),
+        
+        TemperatureDeltaUnits.DegreeRoemer: lambda value: (value * 21 / 40),
+        
+        TemperatureDeltaUnits.MillidegreeCelsius: lambda value: ((value) / 0.001),
+        
+    }
+
+    _conversions_to_base = {
+        
+        TemperatureDeltaUnits.Kelvin: lambda value: (value),
+        
+        TemperatureDeltaUnits.DegreeCelsius: lambda value: (value),
+        
+        TemperatureDeltaUnits.DegreeDelisle: lambda value: (value * -2 / 3),
+        
+        TemperatureDeltaUnits.DegreeFahrenheit: lambda value: (value * 5 / 9),
+        
+        TemperatureDeltaUnits.DegreeNewton: lambda value: (value * 100 / 33),
+        
+        TemperatureDeltaUnits.DegreeRankine: lambda value: (value * 5 / 9),
+        
+        TemperatureDeltaUnits.DegreeReaumur: lambda value: (value * 5 / 4),
+        
+        TemperatureDeltaUnits.DegreeRoemer: lambda value: (value * 40 / 21),
+        
+        TemperatureDeltaUnits.MillidegreeCelsius: lambda value: ((value) * 0.001),
+        
+    }
+
+    def __init__(self, values, from_unit: TemperatureDeltaUnits = TemperatureDeltaUnits.Kelvin):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: TemperatureDeltaUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: TemperatureDeltaUnits = TemperatureDeltaUnits.Kelvin) -> TemperatureDeltaArray:
+        """
+        Create a new instance of TemperatureDeltaArray from values in the given unit.
+
+        :param values: The TemperatureDelta values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: TemperatureDeltaUnits
+        :return: A new instance of TemperatureDeltaArray.
+        :rtype: TemperatureDeltaArray
+        """
+        return TemperatureDeltaArray(values, unit)
+
+    
+    @property
+    def kelvins(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureDeltaUnits.Kelvin](self._values)
+
+    
+    @property
+    def degrees_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureDeltaUnits.DegreeCelsius](self._values)
+
+    
+    @property
+    def degrees_delisle(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureDeltaUnits.DegreeDelisle](self._values)
+
+    
+    @property
+    def degrees_fahrenheit(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureDeltaUnits.DegreeFahrenheit](self._values)
+
+    
+    @property
+    def degrees_newton(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureDeltaUnits.DegreeNewton](self._values)
+
+    
+    @property
+    def degrees_rankine(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureDeltaUnits.DegreeRankine](self._values)
+
+    
+    @property
+    def degrees_reaumur(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureDeltaUnits.DegreeReaumur](self._values)
+
+    
+    @property
+    def degrees_roemer(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureDeltaUnits.DegreeRoemer](self._values)
+
+    
+    @property
+    def millidegrees_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureDeltaUnits.MillidegreeCelsius](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.temperature_gradient import TemperatureGradient, TemperatureGradientUnits
+
+
+class TemperatureGradientArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of TemperatureGradient values, held in KelvinPerMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (TemperatureGradientUnits): The TemperatureGradient unit of the values, The default unit is KelvinPerMeter
+    """
+    __slots__ = ()
+
+    _quantity = TemperatureGradient
+
+    # Whole-array variants of the TemperatureGradient conversion functions.
+    _conversions_from_base = {
+        
+        TemperatureGradientUnits.KelvinPerMeter: lambda value: (value),
+        
+        TemperatureGradientUnits.DegreeCelsiusPerMeter: lambda value: (value),
+        
+        TemperatureGradientUnits.DegreeFahrenheitPerFoot: lambda value: ((value * 0.3048) * 9 / 5),
+        
+        TemperatureGradientUnits.DegreeCelsiusPerKilometer: lambda value: (value * 1e3),
+        
+    }
+
+    _conversions_to_base = {
+        
+        TemperatureGradientUnits.KelvinPerMeter: lambda value: (value),
+        
+        TemperatureGradientUnits.DegreeCelsiusPerMeter: lambda value: (value),
+        
+        TemperatureGradientUnits.DegreeFahrenheitPerFoot: lambda value: ((value / 0.3048) * 5 / 9),
+        
+        TemperatureGradientUnits.DegreeCelsiusPerKilometer: lambda value: (value / 1e3),
+        
+    }
+
+    def __init__(self, values, from_unit: TemperatureGradientUnits = TemperatureGradientUnits.KelvinPerMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: TemperatureGradientUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: TemperatureGradientUnits = TemperatureGradientUnits.KelvinPerMeter) -> TemperatureGradientArray:
+        """
+        Create a new instance of TemperatureGradientArray from values in the given unit.
+
+        :param values: The TemperatureGradient values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: TemperatureGradientUnits
+        :return: A new instance of TemperatureGradientArray.
+        :rtype: TemperatureGradientArray
+        """
+        return TemperatureGradientArray(values, unit)
+
+    
+    @property
+    def kelvins_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureGradientUnits.KelvinPerMeter](self._values)
+
+    
+    @property
+    def degrees_celcius_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureGradientUnits.DegreeCelsiusPerMeter](self._values)
+
+    
+    @property
+    def degrees_fahrenheit_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureGradientUnits.DegreeFahrenheitPerFoot](self._values)
+
+    
+    @property
+    def degrees_celcius_per_kilometer(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TemperatureGradientUnits.DegreeCelsiusPerKilometer](self._values)
+
+    
\ No newline at end of file
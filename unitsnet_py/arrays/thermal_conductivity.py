@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.thermal_conductivity import ThermalConductivity, ThermalConductivityUnits
+
+
+class ThermalConductivityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ThermalConductivity values, held in WattPerMeterKelvin.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ThermalConductivityUnits): The ThermalConductivity unit of the values, The default unit is WattPerMeterKelvin
+    """
+    __slots__ = ()
+
+    _quantity = ThermalConductivity
+
+    # Whole-array variants of the ThermalConductivity conversion functions.
+    _conversions_from_base = {
+        
+        ThermalConductivityUnits.WattPerMeterKelvin: lambda value: (value),
+        
+        ThermalConductivityUnits.BtuPerHourFootFahrenheit: lambda value: (value / 1.73073467),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ThermalConductivityUnits.WattPerMeterKelvin: lambda value: (value),
+        
+        ThermalConductivityUnits.BtuPerHourFootFahrenheit: lambda value: (value * 1.73073467),
+        
+    }
+
+    def __init__(self, values, from_unit: ThermalConductivityUnits = ThermalConductivityUnits.WattPerMeterKelvin):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ThermalConductivityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ThermalConductivityUnits = ThermalConductivityUnits.WattPerMeterKelvin) -> ThermalConductivityArray:
+        """
+        Create a new instance of ThermalConductivityArray from values in the given unit.
+
+        :param values: The ThermalConductivity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ThermalConductivityUnits
+        :return: A new instance of ThermalConductivityArray.
+        :rtype: ThermalConductivityArray
+        """
+        return ThermalConductivityArray(values, unit)
+
+    
+    @property
+    def watts_per_meter_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ThermalConductivityUnits.WattPerMeterKelvin](self._values)
+
+    
+    @property
+    def btus_per_hour_foot_fahrenheit(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ThermalConductivityUnits.BtuPerHourFootFahrenheit](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.thermal_resistance import ThermalResistance, ThermalResistanceUnits
+
+
+class ThermalResistanceArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of ThermalResistance values, held in SquareMeterKelvinPerKilowatt.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (ThermalResistanceUnits): The ThermalResistance unit of the values, The default unit is SquareMeterKelvinPerKilowatt
+    """
+    __slots__ = ()
+
+    _quantity = ThermalResistance
+
+    # Whole-array variants of the ThermalResistance conversion functions.
+    _conversions_from_base = {
+        
+        ThermalResistanceUnits.SquareMeterKelvinPerKilowatt: lambda value: (value),
+        
+        ThermalResistanceUnits.SquareMeterKelvinPerWatt: lambda value: (value / 1000),
+        
+        ThermalResistanceUnits.SquareMeterDegreeCelsiusPerWatt: lambda value: (value / 1000.0),
+        
+        ThermalResistanceUnits.SquareCentimeterKelvinPerWatt: lambda value: (value / 0.1),
+        
+        ThermalResistanceUnits.SquareCentimeterHourDegreeCelsiusPerKilocalorie: lambda value: (value / 0.0859779507590433),
+        
+        ThermalResistanceUnits.HourSquareFeetDegreeFahrenheitPerBtu: lambda value: (value / 176.1121482159839),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ThermalResistanceUnits.SquareMeterKelvinPerKilowatt: lambda value: (value),
+        
+        ThermalResistanceUnits.SquareMeterKelvinPerWatt: lambda value: (value * 1000),
+        
+        ThermalResistanceUnits.SquareMeterDegreeCelsiusPerWatt: lambda value: (value * 1000.0),
+        
+        ThermalResistanceUnits.SquareCentimeterKelvinPerWatt: lambda value: (value * 0.1),
+        
+        ThermalResistanceUnits.SquareCentimeterHourDegreeCelsiusPerKilocalorie: lambda value: (value * 0.0859779507590433),
+        
+        ThermalResistanceUnits.HourSquareFeetDegreeFahrenheitPerBtu: lambda value: (value * 176.1121482159839),
+        
+    }
+
+    def __init__(self, values, from_unit: ThermalResistanceUnits = ThermalResistanceUnits.SquareMeterKelvinPerKilowatt):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: ThermalResistanceUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: ThermalResistanceUnits = ThermalResistanceUnits.SquareMeterKelvinPerKilowatt) -> ThermalResistanceArray:
+        """
+        Create a new instance of ThermalResistanceArray from values in the given unit.
+
+        :param values: The ThermalResistance values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: ThermalResistanceUnits
+        :return: A new instance of ThermalResistanceArray.
+        :rtype: ThermalResistanceArray
+        """
+        return ThermalResistanceArray(values, unit)
+
+    
+    @property
+    def square_meter_kelvins_per_kilowatt(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ThermalResistanceUnits.SquareMeterKelvinPerKilowatt](self._values)
+
+    
+    @property
+    def square_meter_kelvins_per_watt(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ThermalResistanceUnits.SquareMeterKelvinPerWatt](self._values)
+
+    
+    @property
+    def square_meter_degrees_celsius_per_watt(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ThermalResistanceUnits.SquareMeterDegreeCelsiusPerWatt](self._values)
+
+    
+    @property
+    def square_centimeter_kelvins_per_watt(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ThermalResistanceUnits.SquareCentimeterKelvinPerWatt](self._values)
+
+    
+    @property
+    def square_centimeter_hour_degrees_celsius_per_kilocalorie(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ThermalResistanceUnits.SquareCentimeterHourDegreeCelsiusPerKilocalorie](self._values)
+
+    
+    @property
+    def hour_square_feet_degrees_fahrenheit_per_btu(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[ThermalResistanceUnits.HourSquareFeetDegreeFahrenheitPerBtu](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.torque import Torque, TorqueUnits
+
+
+class TorqueArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Torque values, held in NewtonMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (TorqueUnits): The Torque unit of the values, The default unit is NewtonMeter
+    """
+    __slots__ = ()
+
+    _quantity = Torque
+
+    # Whole-array variants of the Torque conversion functions.
+    _conversions_from_base = {
+        
+        TorqueUnits.NewtonMillimeter: lambda value: (value * 1000),
+        
+        TorqueUnits.NewtonCentimeter: lambda value: (value * 100),
+        
+        TorqueUnits.NewtonMeter: lambda value: (value),
+        
+        TorqueUnits.PoundalFoot: lambda value: (value / 4.21401100938048e-2),
+        
+        TorqueUnits.PoundForceInch: lambda value: (value / 1.129848290276167e-1),
+        
+        TorqueUnits.PoundForceFoot: lambda value: (value / 1.3558179483314),
+        
+        TorqueUnits.GramForceMillimeter: lambda value: (value / 9.80665e-6),
+        
+        TorqueUnits.GramForceCentimeter: lambda value: (value / 9.80665e-5),
+        
+        TorqueUnits.GramForceMeter: lambda value: (value / 9.80665e-3),
+        
+        TorqueUnits.KilogramForceMillimeter: lambda value: (value / 9.80665e-3),
+        
+        TorqueUnits.KilogramForceCentimeter: lambda value: (value / 9.80665e-2),
+        
+        TorqueUnits.KilogramForceMeter: lambda value: (value / 9.80665),
+        
+        TorqueUnits.TonneForceMillimeter: lambda value: (value / 9.80665),
+        
+        TorqueUnits.TonneForceCentimeter: lambda value: (value / 9.80665e1),
+        
+        TorqueUnits.TonneForceMeter: lambda value: (value / 9.80665e3),
+        
+        TorqueUnits.KilonewtonMillimeter: lambda value: ((value * 1000) / 1000.0),
+        
+        TorqueUnits.MeganewtonMillimeter: lambda value: ((value * 1000) / 1000000.0),
+        
+        TorqueUnits.KilonewtonCentimeter: lambda value: ((value * 100) / 1000.0),
+        
+        TorqueUnits.MeganewtonCentimeter: lambda value: ((value * 100) / 1000000.0),
+        
+        TorqueUnits.KilonewtonMeter: lambda value: ((value) / 1000.0),
+        
+        TorqueUnits.MeganewtonMeter: lambda value: ((value) / 1000000.0),
+        
+        TorqueUnits.KilopoundForceInch: lambda value: ((value / 1.129848290276167e-1) / 1000.0),
+        
+        TorqueUnits.MegapoundForceInch: lambda value: ((value / 1.129848290276167e-1) / 1000000.0),
+        
+        TorqueUnits.KilopoundForceFoot: lambda value: ((value / 1.3558179483314) / 1000.0),
+        
+        TorqueUnits.MegapoundForceFoot: lambda value: ((value / 1.3558179483314) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        TorqueUnits.NewtonMillimeter: lambda value: (value * 0.001),
+        
+        TorqueUnits.NewtonCentimeter: lambda value: (value * 0.01),
+        
+        TorqueUnits.NewtonMeter: lambda value: (value),
+        
+        TorqueUnits.PoundalFoot: lambda value: (value * 4.21401100938048e-2),
+        
+        TorqueUnits.PoundForceInch: lambda value: (value * 1.129848290276167e-1),
+        
+        TorqueUnits.PoundForceFoot: lambda value: (value * 1.3558179483314),
+        
+        TorqueUnits.GramForceMillimeter: lambda value: (value * 9.80665e-6),
+        
+        TorqueUnits.GramForceCentimeter: lambda value: (value * 9.80665e-5),
+        
+        TorqueUnits.GramForceMeter: lambda value: (value * 9.80665e-3),
+        
+        TorqueUnits.KilogramForceMillimeter: lambda value: (value * 9.80665e-3),
+        
+        TorqueUnits.KilogramForceCentimeter: lambda value: (value * 9.80665e-2),
+        
+        TorqueUnits.KilogramForceMeter: lambda value: (value * 9.80665),
+        
+        TorqueUnits.TonneForceMillimeter: lambda value: (value * 9.80665),
+        
+        TorqueUnits.TonneForceCentimeter: lambda value: (value * 9.80665e1),
+        
+        TorqueUnits.TonneForceMeter: lambda value: (value * 9.80665e3),
+        
+        TorqueUnits.KilonewtonMillimeter: lambda value: ((value * 0.001) * 1000.0),
+        
+        TorqueUnits.MeganewtonMillimeter: lambda value: ((value * 0.001) * 1000000.0),
+        
+        TorqueUnits.KilonewtonCentimeter: lambda value: ((value * 0.01) * 1000.0),
+        
+        TorqueUnits.MeganewtonCentimeter: lambda value: ((value * 0.01) * 1000000.0),
+        
+        TorqueUnits.KilonewtonMeter: lambda value: ((value) * 1000.0),
+        
+        TorqueUnits.MeganewtonMeter: lambda value: ((value) * 1000000.0),
+        
+        TorqueUnits.KilopoundForceInch: lambda value: ((value * 1.129848290276167e-1) * 1000.0),
+        
+        TorqueUnits.MegapoundForceInch: lambda value: ((value * 1.129848290276167e-1) * 1000000.0),
+        
+        TorqueUnits.KilopoundForceFoot: lambda value: ((value * 1.3558179483314) * 1000.0),
+        
+        TorqueUnits.MegapoundForceFoot: lambda value: ((value * 1.3558179483314) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: TorqueUnits = TorqueUnits.NewtonMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: TorqueUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: TorqueUnits = TorqueUnits.NewtonMeter) -> TorqueArray:
+        """
+        Create a new instance of TorqueArray from values in the given unit.
+
+        :param values: The Torque values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: TorqueUnits
+        :return: A new instance of TorqueArray.
+        :rtype: TorqueArray
+        """
+        return TorqueArray(values, unit)
+
+    
+    @property
+    def newton_millimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.NewtonMillimeter](self._values)
+
+    
+    @property
+    def newton_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.NewtonCentimeter](self._values)
+
+    
+    @property
+    def newton_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.NewtonMeter](self._values)
+
+    
+    @property
+    def poundal_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.PoundalFoot](self._values)
+
+    
+    @property
+    def pound_force_inches(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.PoundForceInch](self._values)
+
+    
+    @property
+    def pound_force_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.PoundForceFoot](self._values)
+
+    
+    @property
+    def gram_force_millimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.GramForceMillimeter](self._values)
+
+    
+    @property
+    def gram_force_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.GramForceCentimeter](self._values)
+
+    
+    @property
+    def gram_force_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.GramForceMeter](self._values)
+
+    
+    @property
+    def kilogram_force_millimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.KilogramForceMillimeter](self._values)
+
+    
+    @property
+    def kilogram_force_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.KilogramForceCentimeter](self._values)
+
+    
+    @property
+    def kilogram_force_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.KilogramForceMeter](self._values)
+
+    
+    @property
+    def tonne_force_millimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.TonneForceMillimeter](self._values)
+
+    
+    @property
+    def tonne_force_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.TonneForceCentimeter](self._values)
+
+    
+    @property
+    def tonne_force_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.TonneForceMeter](self._values)
+
+    
+    @property
+    def kilonewton_millimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.KilonewtonMillimeter](self._values)
+
+    
+    @property
+    def meganewton_millimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.MeganewtonMillimeter](self._values)
+
+    
+    @property
+    def kilonewton_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.KilonewtonCentimeter](self._values)
+
+    
+    @property
+    def meganewton_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.MeganewtonCentimeter](self._values)
+
+    
+    @property
+    def kilonewton_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.KilonewtonMeter](self._values)
+
+    
+    @property
+    def meganewton_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.MeganewtonMeter](self._values)
+
+    
+    @property
+    def kilopound_force_inches(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.KilopoundForceInch](self._values)
+
+    
+    @property
+    def megapound_force_inches(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.MegapoundForceInch](self._values)
+
+    
+    @property
+    def kilopound_force_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.KilopoundForceFoot](self._values)
+
+    
+    @property
+    def megapound_force_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorqueUnits.MegapoundForceFoot](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.torque_per_length import TorquePerLength, TorquePerLengthUnits
+
+
+class TorquePerLengthArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of TorquePerLength values, held in NewtonMeterPerMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (TorquePerLengthUnits): The TorquePerLength unit of the values, The default unit is NewtonMeterPerMeter
+    """
+    __slots__ = ()
+
+    _quantity = TorquePerLength
+
+    # Whole-array variants of the TorquePerLength conversion functions.
+    _conversions_from_base = {
+        
+        TorquePerLengthUnits.NewtonMillimeterPerMeter: lambda value: (value * 1000),
+        
+        TorquePerLengthUnits.NewtonCentimeterPerMeter: lambda value: (value * 100),
+        
+        TorquePerLengthUnits.NewtonMeterPerMeter: lambda value: (value),
+        
+        TorquePerLengthUnits.PoundForceInchPerFoot: lambda value: (value / 0.370685147638),
+        
+        TorquePerLengthUnits.PoundForceFootPerFoot: lambda value: (value / 4.44822161526),
+        
+        TorquePerLengthUnits.KilogramForceMillimeterPerMeter: lambda value: (value * 101.971619222242),
+        
+        TorquePerLengthUnits.KilogramForceCentimeterPerMeter: lambda value: (value * 10.1971619222242),
+        
+        TorquePerLengthUnits.KilogramForceMeterPerMeter: lambda value: (value * 0.101971619222242),
+        
+        TorquePerLengthUnits.TonneForceMillimeterPerMeter: lambda value: (value * 0.101971619222242),
+        
+        TorquePerLengthUnits.TonneForceCentimeterPerMeter: lambda value: (value * 0.0101971619222242),
+        
+        TorquePerLengthUnits.TonneForceMeterPerMeter: lambda value: (value * 0.000101971619222242),
+        
+        TorquePerLengthUnits.KilonewtonMillimeterPerMeter: lambda value: ((value * 1000) / 1000.0),
+        
+        TorquePerLengthUnits.MeganewtonMillimeterPerMeter: lambda value: ((value * 1000) / 1000000.0),
+        
+        TorquePerLengthUnits.KilonewtonCentimeterPerMeter: lambda value: ((value * 100) / 1000.0),
+        
+        TorquePerLengthUnits.MeganewtonCentimeterPerMeter: lambda value: ((value * 100) / 1000000.0),
+        
+        TorquePerLengthUnits.KilonewtonMeterPerMeter: lambda value: ((value) / 1000.0),
+        
+        TorquePerLengthUnits.MeganewtonMeterPerMeter: lambda value: ((value) / 1000000.0),
+        
+        TorquePerLengthUnits.KilopoundForceInchPerFoot: lambda value: ((value / 0.370685147638) / 1000.0),
+        
+        TorquePerLengthUnits.MegapoundForceInchPerFoot: lambda value: ((value / 0.370685147638) / 1000000.0),
+        
+        TorquePerLengthUnits.KilopoundForceFootPerFoot: lambda value: ((value / 4.44822161526) / 1000.0),
+        
+        TorquePerLengthUnits.MegapoundForceFootPerFoot: lambda value: ((value / 4.44822161526) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        TorquePerLengthUnits.NewtonMillimeterPerMeter: lambda value: (value * 0.001),
+        
+        TorquePerLengthUnits.NewtonCentimeterPerMeter: lambda value: (value * 0.01),
+        
+        TorquePerLengthUnits.NewtonMeterPerMeter: lambda value: (value),
+        
+        TorquePerLengthUnits.PoundForceInchPerFoot: lambda value: (value * 0.370685147638),
+        
+        TorquePerLengthUnits.PoundForceFootPerFoot: lambda value: (value * 4.44822161526),
+        
+        TorquePerLengthUnits.KilogramForceMillimeterPerMeter: lambda value: (value * 0.00980665019960652),
+        
+        TorquePerLengthUnits.KilogramForceCentimeterPerMeter: lambda value: (value * 0.0980665019960652),
+        
+        TorquePerLengthUnits.KilogramForceMeterPerMeter: lambda value: (value * 9.80665019960652),
+        
+        TorquePerLengthUnits.TonneForceMillimeterPerMeter: lambda value: (value * 9.80665019960652),
+        
+        TorquePerLengthUnits.TonneForceCentimeterPerMeter: lambda value: (value * 98.0665019960652),
+        
+        TorquePerLengthUnits.TonneForceMeterPerMeter: lambda value: (value * 9806.65019960653),
+        
+        TorquePerLengthUnits.KilonewtonMillimeterPerMeter: lambda value: ((value * 0.001) * 1000.0),
+        
+        TorquePerLengthUnits.MeganewtonMillimeterPerMeter: lambda value: ((value * 0.001) * 1000000.0),
+        
+        TorquePerLengthUnits.KilonewtonCentimeterPerMeter: lambda value: ((value * 0.01) * 1000.0),
+        
+        TorquePerLengthUnits.MeganewtonCentimeterPerMeter: lambda value: ((value * 0.01) * 1000000.0),
+        
+        TorquePerLengthUnits.KilonewtonMeterPerMeter: lambda value: ((value) * 1000.0),
+        
+        TorquePerLengthUnits.MeganewtonMeterPerMeter: lambda value: ((value) * 1000000.0),
+        
+        TorquePerLengthUnits.KilopoundForceInchPerFoot: lambda value: ((value * 0.370685147638) * 1000.0),
+        
+        TorquePerLengthUnits.MegapoundForceInchPerFoot: lambda value: ((value * 0.370685147638) * 1000000.0),
+        
+        TorquePerLengthUnits.KilopoundForceFootPerFoot: lambda value: ((value * 4.44822161526) * 1000.0),
+        
+        TorquePerLengthUnits.MegapoundForceFootPerFoot: lambda value: ((value * 4.44822161526) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: TorquePerLengthUnits = TorquePerLengthUnits.NewtonMeterPerMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: TorquePerLengthUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: TorquePerLengthUnits = TorquePerLengthUnits.NewtonMeterPerMeter) -> TorquePerLengthArray:
+        """
+        Create a new instance of TorquePerLengthArray from values in the given unit.
+
+        :param values: The TorquePerLength values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: TorquePerLengthUnits
+        :return: A new instance of TorquePerLengthArray.
+        :rtype: TorquePerLengthArray
+        """
+        return TorquePerLengthArray(values, unit)
+
+    
+    @property
+    def newton_millimeters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.NewtonMillimeterPerMeter](self._values)
+
+    
+    @property
+    def newton_centimeters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.NewtonCentimeterPerMeter](self._values)
+
+    
+    @property
+    def newton_meters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.NewtonMeterPerMeter](self._values)
+
+    
+    @property
+    def pound_force_inches_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.PoundForceInchPerFoot](self._values)
+
+    
+    @property
+    def pound_force_feet_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.PoundForceFootPerFoot](self._values)
+
+    
+    @property
+    def kilogram_force_millimeters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.KilogramForceMillimeterPerMeter](self._values)
+
+    
+    @property
+    def kilogram_force_centimeters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.KilogramForceCentimeterPerMeter](self._values)
+
+    
+    @property
+    def kilogram_force_meters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.KilogramForceMeterPerMeter](self._values)
+
+    
+    @property
+    def tonne_force_millimeters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.TonneForceMillimeterPerMeter](self._values)
+
+    
+    @property
+    def tonne_force_centimeters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.TonneForceCentimeterPerMeter](self._values)
+
+    
+    @property
+    def tonne_force_meters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.TonneForceMeterPerMeter](self._values)
+
+    
+    @property
+    def kilonewton_millimeters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.KilonewtonMillimeterPerMeter](self._values)
+
+    
+    @property
+    def meganewton_millimeters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.MeganewtonMillimeterPerMeter](self._values)
+
+    
+    @property
+    def kilonewton_centimeters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.KilonewtonCentimeterPerMeter](self._values)
+
+    
+    @property
+    def meganewton_centimeters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.MeganewtonCentimeterPerMeter](self._values)
+
+    
+    @property
+    def kilonewton_meters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.KilonewtonMeterPerMeter](self._values)
+
+    
+    @property
+    def meganewton_meters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.MeganewtonMeterPerMeter](self._values)
+
+    
+    @property
+    def kilopound_force_inches_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.KilopoundForceInchPerFoot](self._values)
+
+    
+    @property
+    def megapound_force_inches_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.MegapoundForceInchPerFoot](self._values)
+
+    
+    @property
+    def kilopound_force_feet_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.KilopoundForceFootPerFoot](self._values)
+
+    
+    @property
+    def megapound_force_feet_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TorquePerLengthUnits.MegapoundForceFootPerFoot](self._values)
+
+    
\ No newline at end of file
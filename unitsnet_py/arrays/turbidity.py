@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.turbidity import Turbidity, TurbidityUnits
+
+
+class TurbidityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Turbidity values, held in NTU.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (TurbidityUnits): The Turbidity unit of the values, The default unit is NTU
+    """
+    __slots__ = ()
+
+    _quantity = Turbidity
+
+    # Whole-array variants of the Turbidity conversion functions.
+    _conversions_from_base = {
+        
+        TurbidityUnits.NTU: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        TurbidityUnits.NTU: lambda value: (value),
+        
+    }
+
+    def __init__(self, values, from_unit: TurbidityUnits = TurbidityUnits.NTU):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: TurbidityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: TurbidityUnits = TurbidityUnits.NTU) -> TurbidityArray:
+        """
+        Create a new instance of TurbidityArray from values in the given unit.
+
+        :param values: The Turbidity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: TurbidityUnits
+        :return: A new instance of TurbidityArray.
+        :rtype: TurbidityArray
+        """
+        return TurbidityArray(values, unit)
+
+    
+    @property
+    def ntu(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[TurbidityUnits.NTU](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.vitamin_a import VitaminA, VitaminAUnits
+
+
+class VitaminAArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of VitaminA values, held in InternationalUnit.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (VitaminAUnits): The VitaminA unit of the values, The default unit is InternationalUnit
+    """
+    __slots__ = ()
+
+    _quantity = VitaminA
+
+    # Whole-array variants of the VitaminA conversion functions.
+    _conversions_from_base = {
+        
+        VitaminAUnits.InternationalUnit: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        VitaminAUnits.InternationalUnit: lambda value: (value),
+        
+    }
+
+    def __init__(self, values, from_unit: VitaminAUnits = VitaminAUnits.InternationalUnit):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: VitaminAUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: VitaminAUnits = VitaminAUnits.InternationalUnit) -> VitaminAArray:
+        """
+        Create a new instance of VitaminAArray from values in the given unit.
+
+        :param values: The VitaminA values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: VitaminAUnits
+        :return: A new instance of VitaminAArray.
+        :rtype: VitaminAArray
+        """
+        return VitaminAArray(values, unit)
+
+    
+    @property
+    def international_units(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VitaminAUnits.InternationalUnit](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,698 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.volume import Volume, VolumeUnits
+
+
+class VolumeArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of Volume values, held in CubicMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (VolumeUnits): The Volume unit of the values, The default unit is CubicMeter
+    """
+    __slots__ = ()
+
+    _quantity = Volume
+
+    # Whole-array variants of the Volume conversion functions.
+    _conversions_from_base = {
+        
+        VolumeUnits.Liter: lambda value: (value * 1e3),
+        
+        VolumeUnits.CubicMeter: lambda value: (value),
+        
+        VolumeUnits.CubicKilometer: lambda value: (value / 1e9),
+        
+        VolumeUnits.CubicHectometer: lambda value: (value / 1e6),
+        
+        VolumeUnits.CubicDecimeter: lambda value: (value * 1e3),
+        
+        VolumeUnits.CubicCentimeter: lambda value: (value * 1e6),
+        
+        VolumeUnits.CubicMillimeter: lambda value: (value * 1e9),
+        
+        VolumeUnits.CubicMicrometer: lambda value: (value * 1e18),
+        
+        VolumeUnits.CubicMile: lambda value: (value / 4.16818182544058e9),
+        
+        VolumeUnits.CubicYard: lambda value: (value / 0.764554858),
+        
+        VolumeUnits.CubicFoot: lambda value: (value / 2.8316846592e-2),
+        
+        VolumeUnits.CubicInch: lambda value: (value / (1.6387 * 1e-5)),
+        
+        VolumeUnits.ImperialGallon: lambda value: (value / 0.00454609),
+        
+        VolumeUnits.ImperialOunce: lambda value: (value / 2.8413062499962901241875439064617e-5),
+        
+        VolumeUnits.UsGallon: lambda value: (value / 0.003785411784),
+        
+        VolumeUnits.UsOunce: lambda value: (value / 2.957352956253760505068307980135e-5),
+        
+        VolumeUnits.UsTablespoon: lambda value: (value / 1.478676478125e-5),
+        
+        VolumeUnits.AuTablespoon: lambda value: (value / 2e-5),
+        
+        VolumeUnits.UkTablespoon: lambda value: (value / 1.5e-5),
+        
+        VolumeUnits.MetricTeaspoon: lambda value: (value / 0.5e-5),
+        
+        VolumeUnits.UsTeaspoon: lambda value: (value / 4.92892159375e-6),
+        
+        VolumeUnits.MetricCup: lambda value: (value / 0.00025),
+        
+        VolumeUnits.UsCustomaryCup: lambda value: (value / 0.0002365882365),
+        
+        VolumeUnits.UsLegalCup: lambda value: (value / 0.00024),
+        
+        VolumeUnits.OilBarrel: lambda value: (value / 0.158987294928),
+        
+        VolumeUnits.UsBeerBarrel: lambda value: (value / 0.1173477658),
+        
+        VolumeUnits.ImperialBeerBarrel: lambda value: (value / 0.16365924),
+        
+        VolumeUnits.UsQuart: lambda value: (value / 9.46352946e-4),
+        
+        VolumeUnits.ImperialQuart: lambda value: (value / 1.1365225e-3),
+        
+        VolumeUnits.UsPint: lambda value: (value / 4.73176473e-4),
+        
+        VolumeUnits.AcreFoot: lambda value: (value * 0.000810714),
+        
+        VolumeUnits.ImperialPint: lambda value: (value / 5.6826125e-4),
+        
+        VolumeUnits.BoardFoot: lambda value: (value / 2.3597372158e-3),
+        
+        VolumeUnits.Nanoliter: lambda value: ((value * 1e3) / 1e-09),
+        
+        VolumeUnits.Microliter: lambda value: ((value * 1e3) / 1e-06),
+        
+        VolumeUnits.Milliliter: lambda value: ((value * 1e3) / 0.001),
+        
+        VolumeUnits.Centiliter: lambda value: ((value * 1e3) / 0.01),
+        
+        VolumeUnits.Deciliter: lambda value: ((value * 1e3) / 0.1),
+        
+        VolumeUnits.Decaliter: lambda value: ((value * 1e3) / 10.0),
+        
+        VolumeUnits.Hectoliter: lambda value: ((value * 1e3) / 100.0),
+        
+        VolumeUnits.Kiloliter: lambda value: ((value * 1e3) / 1000.0),
+        
+        VolumeUnits.Megaliter: lambda value: ((value * 1e3) / 1000000.0),
+        
+        VolumeUnits.HectocubicMeter: lambda value: ((value) / 100.0),
+        
+        VolumeUnits.KilocubicMeter: lambda value: ((value) / 1000.0),
+        
+        VolumeUnits.HectocubicFoot: lambda value: ((value / 2.8316846592e-2) / 100.0),
+        
+        VolumeUnits.KilocubicFoot: lambda value: ((value / 2.8316846592e-2) / 1000.0),
+        
+        VolumeUnits.MegacubicFoot: lambda value: ((value / 2.8316846592e-2) / 1000000.0),
+        
+        VolumeUnits.KiloimperialGallon: lambda value: ((value / 0.00454609) / 1000.0),
+        
+        VolumeUnits.MegaimperialGallon: lambda value: ((value / 0.00454609) / 1000000.0),
+        
+        VolumeUnits.DecausGallon: lambda value: ((value / 0.003785411784) / 10.0),
+        
+        VolumeUnits.DeciusGallon: lambda value: ((value / 0.003785411784) / 0.1),
+        
+        VolumeUnits.HectousGallon: lambda value: ((value / 0.003785411784) / 100.0),
+        
+        VolumeUnits.KilousGallon: lambda value: ((value / 0.003785411784) / 1000.0),
+        
+        VolumeUnits.MegausGallon: lambda value: ((value / 0.003785411784) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        VolumeUnits.Liter: lambda value: (value / 1e3),
+        
+        VolumeUnits.CubicMeter: lambda value: (value),
+        
+        VolumeUnits.CubicKilometer: lambda value: (value * 1e9),
+        
+        VolumeUnits.CubicHectometer: lambda value: (value * 1e6),
+        
+        VolumeUnits.CubicDecimeter: lambda value: (value / 1e3),
+        
+        VolumeUnits.CubicCentimeter: lambda value: (value / 1e6),
+        
+        VolumeUnits.CubicMillimeter: lambda value: (value / 1e9),
+        
+        VolumeUnits.CubicMicrometer: lambda value: (value / 1e18),
+        
+        VolumeUnits.CubicMile: lambda value: (value * 4.16818182544058e9),
+        
+        VolumeUnits.CubicYard: lambda value: (value * 0.764554858),
+        
+        VolumeUnits.CubicFoot: lambda value: (value * 2.8316846592e-2),
+        
+        VolumeUnits.CubicInch: lambda value: (value * 1.6387 * 1e-5),
+        
+        VolumeUnits.ImperialGallon: lambda value: (value * 0.00454609),
+        
+        VolumeUnits.ImperialOunce: lambda value: (value * 2.8413062499962901241875439064617e-5),
+        
+        VolumeUnits.UsGallon: lambda value: (value * 0.003785411784),
+        
+        VolumeUnits.UsOunce: lambda value: (value * 2.957352956253760505068307980135e-5),
+        
+        VolumeUnits.UsTablespoon: lambda value: (value * 1.478676478125e-5),
+        
+        VolumeUnits.AuTablespoon: lambda value: (value * 2e-5),
+        
+        VolumeUnits.UkTablespoon: lambda value: (value * 1.5e-5),
+        
+        VolumeUnits.MetricTeaspoon: lambda value: (value * 0.5e-5),
+        
+        VolumeUnits.UsTeaspoon: lambda value: (value * 4.92892159375e-6),
+        
+        VolumeUnits.MetricCup: lambda value: (value * 0.00025),
+        
+        VolumeUnits.UsCustomaryCup: lambda value: (value * 0.0002365882365),
+        
+        VolumeUnits.UsLegalCup: lambda value: (value * 0.00024),
+        
+        VolumeUnits.OilBarrel: lambda value: (value * 0.158987294928),
+        
+        VolumeUnits.UsBeerBarrel: lambda value: (value * 0.1173477658),
+        
+        VolumeUnits.ImperialBeerBarrel: lambda value: (value * 0.16365924),
+        
+        VolumeUnits.UsQuart: lambda value: (value * 9.46352946e-4),
+        
+        VolumeUnits.ImperialQuart: lambda value: (value * 1.1365225e-3),
+        
+        VolumeUnits.UsPint: lambda value: (value * 4.73176473e-4),
+        
+        VolumeUnits.AcreFoot: lambda value: (value / 0.000810714),
+        
+        VolumeUnits.ImperialPint: lambda value: (value * 5.6826125e-4),
+        
+        VolumeUnits.BoardFoot: lambda value: (value * 2.3597372158e-3),
+        
+        VolumeUnits.Nanoliter: lambda value: ((value / 1e3) * 1e-09),
+        
+        VolumeUnits.Microliter: lambda value: ((value / 1e3) * 1e-06),
+        
+        VolumeUnits.Milliliter: lambda value: ((value / 1e3) * 0.001),
+        
+        VolumeUnits.Centiliter: lambda value: ((value / 1e3) * 0.01),
+        
+        VolumeUnits.Deciliter: lambda value: ((value / 1e3) * 0.1),
+        
+        VolumeUnits.Decaliter: lambda value: ((value / 1e3) * 10.0),
+        
+        VolumeUnits.Hectoliter: lambda value: ((value / 1e3) * 100.0),
+        
+        VolumeUnits.Kiloliter: lambda value: ((value / 1e3) * 1000.0),
+        
+        VolumeUnits.Megaliter: lambda value: ((value / 1e3) * 1000000.0),
+        
+        VolumeUnits.HectocubicMeter: lambda value: ((value) * 100.0),
+        
+        VolumeUnits.KilocubicMeter: lambda value: ((value) * 1000.0),
+        
+        VolumeUnits.HectocubicFoot: lambda value: ((value * 2.8316846592e-2) * 100.0),
+        
+        VolumeUnits.KilocubicFoot: lambda value: ((value * 2.8316846592e-2) * 1000.0),
+        
+        VolumeUnits.MegacubicFoot: lambda value: ((value * 2.8316846592e-2) * 1000000.0),
+        
+        VolumeUnits.KiloimperialGallon: lambda value: ((value * 0.00454609) * 1000.0),
+        
+        VolumeUnits.MegaimperialGallon: lambda value: ((value * 0.00454609) * 1000000.0),
+        
+        VolumeUnits.DecausGallon: lambda value: ((value * 0.003785411784) * 10.0),
+        
+        VolumeUnits.DeciusGallon: lambda value: ((value * 0.003785411784) * 0.1),
+        
+        VolumeUnits.HectousGallon: lambda value: ((value * 0.003785411784) * 100.0),
+        
+        VolumeUnits.KilousGallon: lambda value: ((value * 0.003785411784) * 1000.0),
+        
+        VolumeUnits.MegausGallon: lambda value: ((value * 0.003785411784) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: VolumeUnits = VolumeUnits.CubicMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: VolumeUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: VolumeUnits = VolumeUnits.CubicMeter) -> VolumeArray:
+        """
+        Create a new instance of VolumeArray from values in the given unit.
+
+        :param values: The Volume values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: VolumeUnits
+        :return: A new instance of VolumeArray.
+        :rtype: VolumeArray
+        """
+        return VolumeArray(values, unit)
+
+    
+    @property
+    def liters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.Liter](self._values)
+
+    
+    @property
+    def cubic_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.CubicMeter](self._values)
+
+    
+    @property
+    def cubic_kilometers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.CubicKilometer](self._values)
+
+    
+    @property
+    def cubic_hectometers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.CubicHectometer](self._values)
+
+    
+    @property
+    def cubic_decimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.CubicDecimeter](self._values)
+
+    
+    @property
+    def cubic_centimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.CubicCentimeter](self._values)
+
+    
+    @property
+    def cubic_millimeters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.CubicMillimeter](self._values)
+
+    
+    @property
+    def cubic_micrometers(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.CubicMicrometer](self._values)
+
+    
+    @property
+    def cubic_miles(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.CubicMile](self._values)
+
+    
+    @property
+    def cubic_yards(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.CubicYard](self._values)
+
+    
+    @property
+    def cubic_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.CubicFoot](self._values)
+
+    
+    @property
+    def cubic_inches(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.CubicInch](self._values)
+
+    
+    @property
+    def imperial_gallons(self) -> np.ndarray:
+        """
+        The British imperial gallon (frequently called simply "gallon") is defined as exactly 4.54609 litres.
+        """
+        return self._conversions_from_base[VolumeUnits.ImperialGallon](self._values)
+
+    
+    @property
+    def imperial_ounces(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.ImperialOunce](self._values)
+
+    
+    @property
+    def us_gallons(self) -> np.ndarray:
+        """
+        The US liquid gallon (frequently called simply "gallon") is legally defined as 231 cubic inches, which is exactly 3.785411784 litres.
+        """
+        return self._conversions_from_base[VolumeUnits.UsGallon](self._values)
+
+    
+    @property
+    def us_ounces(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.UsOunce](self._values)
+
+    
+    @property
+    def us_tablespoons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.UsTablespoon](self._values)
+
+    
+    @property
+    def au_tablespoons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.AuTablespoon](self._values)
+
+    
+    @property
+    def uk_tablespoons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.UkTablespoon](self._values)
+
+    
+    @property
+    def metric_teaspoons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.MetricTeaspoon](self._values)
+
+    
+    @property
+    def us_teaspoons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.UsTeaspoon](self._values)
+
+    
+    @property
+    def metric_cups(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.MetricCup](self._values)
+
+    
+    @property
+    def us_customary_cups(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.UsCustomaryCup](self._values)
+
+    
+    @property
+    def us_legal_cups(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.UsLegalCup](self._values)
+
+    
+    @property
+    def oil_barrels(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.OilBarrel](self._values)
+
+    
+    @property
+    def us_beer_barrels(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.UsBeerBarrel](self._values)
+
+    
+    @property
+    def imperial_beer_barrels(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.ImperialBeerBarrel](self._values)
+
+    
+    @property
+    def us_quarts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.UsQuart](self._values)
+
+    
+    @property
+    def imperial_quarts(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.ImperialQuart](self._values)
+
+    
+    @property
+    def us_pints(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.UsPint](self._values)
+
+    
+    @property
+    def acre_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.AcreFoot](self._values)
+
+    
+    @property
+    def imperial_pints(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.ImperialPint](self._values)
+
+    
+    @property
+    def board_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.BoardFoot](self._values)
+
+    
+    @property
+    def nanoliters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.Nanoliter](self._values)
+
+    
+    @property
+    def microliters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.Microliter](self._values)
+
+    
+    @property
+    def milliliters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.Milliliter](self._values)
+
+    
+    @property
+    def centiliters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.Centiliter](self._values)
+
+    
+    @property
+    def deciliters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.Deciliter](self._values)
+
+    
+    @property
+    def decaliters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.Decaliter](self._values)
+
+    
+    @property
+    def hectoliters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.Hectoliter](self._values)
+
+    
+    @property
+    def kiloliters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.Kiloliter](self._values)
+
+    
+    @property
+    def megaliters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.Megaliter](self._values)
+
+    
+    @property
+    def hectocubic_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.HectocubicMeter](self._values)
+
+    
+    @property
+    def kilocubic_meters(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.KilocubicMeter](self._values)
+
+    
+    @property
+    def hectocubic_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.HectocubicFoot](self._values)
+
+    
+    @property
+    def kilocubic_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.KilocubicFoot](self._values)
+
+    
+    @property
+    def megacubic_feet(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.MegacubicFoot](self._values)
+
+    
+    @property
+    def kiloimperial_gallons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.KiloimperialGallon](self._values)
+
+    
+    @property
+    def megaimperial_gallons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.MegaimperialGallon](self._values)
+
+    
+    @property
+    def decaus_gallons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.DecausGallon](self._values)
+
+    
+    @property
+    def decius_gallons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.DeciusGallon](self._values)
+
+    
+    @property
+    def hectous_gallons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.HectousGallon](self._values)
+
+    
+    @property
+    def kilous_gallons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.KilousGallon](self._values)
+
+    
+    @property
+    def megaus_gallons(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeUnits.MegausGallon](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.volume_concentration import VolumeConcentration, VolumeConcentrationUnits
+
+
+class VolumeConcentrationArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of VolumeConcentration values, held in DecimalFraction.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (VolumeConcentrationUnits): The VolumeConcentration unit of the values, The default unit is DecimalFraction
+    """
+    __slots__ = ()
+
+    _quantity = VolumeConcentration
+
+    # Whole-array variants of the VolumeConcentration conversion functions.
+    _conversions_from_base = {
+        
+        VolumeConcentrationUnits.DecimalFraction: lambda value: (value),
+        
+        VolumeConcentrationUnits.LitersPerLiter: lambda value: (value),
+        
+        VolumeConcentrationUnits.LitersPerMililiter: lambda value: (value * 1e-3),
+        
+        VolumeConcentrationUnits.Percent: lambda value: (value * 1e2),
+        
+        VolumeConcentrationUnits.PartPerThousand: lambda value: (value * 1e3),
+        
+        VolumeConcentrationUnits.PartPerMillion: lambda value: (value * 1e6),
+        
+        VolumeConcentrationUnits.PartPerBillion: lambda value: (value * 1e9),
+        
+        VolumeConcentrationUnits.PartPerTrillion: lambda value: (value * 1e12),
+        
+        VolumeConcentrationUnits.PicolitersPerLiter: lambda value: ((value) / 1e-12),
+        
+        VolumeConcentrationUnits.NanolitersPerLiter: lambda value: ((value) / 1e-09),
+        
+        VolumeConcentrationUnits.MicrolitersPerLiter: lambda value: ((value) / 1e-06),
+        
+        VolumeConcentrationUnits.MillilitersPerLiter: lambda value: ((value) / 0.001),
+        
+        VolumeConcentrationUnits.CentilitersPerLiter: lambda value: ((value) / 0.01),
+        
+        VolumeConcentrationUnits.DecilitersPerLiter: lambda value: ((value) / 0.1),
+        
+        VolumeConcentrationUnits.PicolitersPerMililiter: lambda value: ((value * 1e-3) / 1e-12),
+        
+        VolumeConcentrationUnits.NanolitersPerMililiter: lambda value: ((value * 1e-3) / 1e-09),
+        
+        VolumeConcentrationUnits.MicrolitersPerMililiter: lambda value: ((value * 1e-3) / 1e-06),
+        
+        VolumeConcentrationUnits.MillilitersPerMililiter: lambda value: ((value * 1e-3) / 0.001),
+        
+        VolumeConcentrationUnits.CentilitersPerMililiter: lambda value: ((value * 1e-3) / 0.01),
+        
+        VolumeConcentrationUnits.DecilitersPerMililiter: lambda value: ((value * 1e-3) / 0.1),
+        
+    }
+
+    _conversions_to_base = {
+        
+        VolumeConcentrationUnits.DecimalFraction: lambda value: (value),
+        
+        VolumeConcentrationUnits.LitersPerLiter: lambda value: (value),
+        
+        VolumeConcentrationUnits.LitersPerMililiter: lambda value: (value / 1e-3),
+        
+        VolumeConcentrationUnits.Percent: lambda value: (value / 1e2),
+        
+        VolumeConcentrationUnits.PartPerThousand: lambda value: (value / 1e3),
+        
+        VolumeConcentrationUnits.PartPerMillion: lambda value: (value / 1e6),
+        
+        VolumeConcentrationUnits.PartPerBillion: lambda value: (value / 1e9),
+        
+        VolumeConcentrationUnits.PartPerTrillion: lambda value: (value / 1e12),
+        
+        VolumeConcentrationUnits.PicolitersPerLiter: lambda value: ((value) * 1e-12),
+        
+        VolumeConcentrationUnits.NanolitersPerLiter: lambda value: ((value) * 1e-09),
+        
+        VolumeConcentrationUnits.MicrolitersPerLiter: lambda value: ((value) * 1e-06),
+        
+        VolumeConcentrationUnits.MillilitersPerLiter: lambda value: ((value) * 0.001),
+        
+        VolumeConcentrationUnits.CentilitersPerLiter: lambda value: ((value) * 0.01),
+        
+        VolumeConcentrationUnits.DecilitersPerLiter: lambda value: ((value) * 0.1),
+        
+        VolumeConcentrationUnits.PicolitersPerMililiter: lambda value: ((value / 1e-3) * 1e-12),
+        
+        VolumeConcentrationUnits.NanolitersPerMililiter: lambda value: ((value / 1e-3) * 1e-09),
+        
+        VolumeConcentrationUnits.MicrolitersPerMililiter: lambda value: ((value / 1e-3) * 1e-06),
+        
+        VolumeConcentrationUnits.MillilitersPerMililiter: lambda value: ((value / 1e-3) * 0.001),
+        
+        VolumeConcentrationUnits.CentilitersPerMililiter: lambda value: ((value / 1e-3) * 0.01),
+        
+        VolumeConcentrationUnits.DecilitersPerMililiter: lambda value: ((value / 1e-3) * 0.1),
+        
+    }
+
+    def __init__(self, values, from_unit: VolumeConcentrationUnits = VolumeConcentrationUnits.DecimalFraction):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: VolumeConcentrationUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: VolumeConcentrationUnits = VolumeConcentrationUnits.DecimalFraction) -> VolumeConcentrationArray:
+        """
+        Create a new instance of VolumeConcentrationArray from values in the given unit.
+
+        :param values: The VolumeConcentration values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: VolumeConcentrationUnits
+        :return: A new instance of VolumeConcentrationArray.
+        :rtype: VolumeConcentrationArray
+        """
+        return VolumeConcentrationArray(values, unit)
+
+    
+    @property
+    def decimal_fractions(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.DecimalFraction](self._values)
+
+    
+    @property
+    def liters_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.LitersPerLiter](self._values)
+
+    
+    @property
+    def liters_per_mililiter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.LitersPerMililiter](self._values)
+
+    
+    @property
+    def percent(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.Percent](self._values)
+
+    
+    @property
+    def parts_per_thousand(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.PartPerThousand](self._values)
+
+    
+    @property
+    def parts_per_million(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.PartPerMillion](self._values)
+
+    
+    @property
+    def parts_per_billion(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.PartPerBillion](self._values)
+
+    
+    @property
+    def parts_per_trillion(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.PartPerTrillion](self._values)
+
+    
+    @property
+    def picoliters_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.PicolitersPerLiter](self._values)
+
+    
+    @property
+    def nanoliters_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.NanolitersPerLiter](self._values)
+
+    
+    @property
+    def microliters_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.MicrolitersPerLiter](self._values)
+
+    
+    @property
+    def milliliters_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.MillilitersPerLiter](self._values)
+
+    
+    @property
+    def centiliters_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.CentilitersPerLiter](self._values)
+
+    
+    @property
+    def deciliters_per_liter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.DecilitersPerLiter](self._values)
+
+    
+    @property
+    def picoliters_per_mililiter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.PicolitersPerMililiter](self._values)
+
+    
+    @property
+    def nanoliters_per_mililiter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.NanolitersPerMililiter](self._values)
+
+    
+    @property
+    def microliters_per_mililiter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.MicrolitersPerMililiter](self._values)
+
+    
+    @property
+    def milliliters_per_mililiter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.MillilitersPerMililiter](self._values)
+
+    
+    @property
+    def centiliters_per_mililiter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.CentilitersPerMililiter](self._values)
+
+    
+    @property
+    def deciliters_per_mililiter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeConcentrationUnits.DecilitersPerMililiter](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,854 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.volume_flow import VolumeFlow, VolumeFlowUnits
+
+
+class VolumeFlowArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of VolumeFlow values, held in CubicMeterPerSecond.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (VolumeFlowUnits): The VolumeFlow unit of the values, The default unit is CubicMeterPerSecond
+    """
+    __slots__ = ()
+
+    _quantity = VolumeFlow
+
+    # Whole-array variants of the VolumeFlow conversion functions.
+    _conversions_from_base = {
+        
+        VolumeFlowUnits.CubicMeterPerSecond: lambda value: (value),
+        
+        VolumeFlowUnits.CubicMeterPerMinute: lambda value: (value * 60),
+        
+        VolumeFlowUnits.CubicMeterPerHour: lambda value: (value * 3600),
+        
+        VolumeFlowUnits.CubicMeterPerDay: lambda value: (value * 86400),
+        
+        VolumeFlowUnits.CubicFootPerSecond: lambda value: (value * 35.314666721),
+        
+        VolumeFlowUnits.CubicFootPerMinute: lambda value: (value * 2118.88000326),
+        
+        VolumeFlowUnits.CubicFootPerHour: lambda value: (value / 7.8657907199999087346816086183876e-6),
+        
+        VolumeFlowUnits.CubicYardPerSecond: lambda value: (value / 0.764554857984),
+        
+        VolumeFlowUnits.CubicYardPerMinute: lambda value: (value / 0.0127425809664),
+        
+        VolumeFlowUnits.CubicYardPerHour: lambda value: (value / 2.1237634944e-4),
+        
+        VolumeFlowUnits.CubicYardPerDay: lambda value: (value * 113007),
+        
+        VolumeFlowUnits.MillionUsGallonPerDay: lambda value: (value * 22.824465227),
+        
+        VolumeFlowUnits.UsGallonPerDay: lambda value: (value * 22824465.227),
+        
+        VolumeFlowUnits.LiterPerSecond: lambda value: (value * 1000),
+        
+        VolumeFlowUnits.LiterPerMinute: lambda value: (value * 60000.00000),
+        
+        VolumeFlowUnits.LiterPerHour: lambda value: (value * 3600000.000),
+        
+        VolumeFlowUnits.LiterPerDay: lambda value: (value * 86400000),
+        
+        VolumeFlowUnits.UsGallonPerSecond: lambda value: (value * 264.1720523581484),
+        
+        VolumeFlowUnits.UsGallonPerMinute: lambda value: (value * 15850.323141489),
+        
+        VolumeFlowUnits.UkGallonPerDay: lambda value: (value * 19005304),
+        
+        VolumeFlowUnits.UkGallonPerHour: lambda value: (value * 791887.667),
+        
+        VolumeFlowUnits.UkGallonPerMinute: lambda value: (value * 13198.2),
+        
+        VolumeFlowUnits.UkGallonPerSecond: lambda value: (value * 219.969),
+        
+        VolumeFlowUnits.KilousGallonPerMinute: lambda value: (value * 15.850323141489),
+        
+        VolumeFlowUnits.UsGallonPerHour: lambda value: (value * 951019.38848933424),
+        
+        VolumeFlowUnits.CubicDecimeterPerMinute: lambda value: (value * 60000.00000),
+        
+        VolumeFlowUnits.OilBarrelPerDay: lambda value: (value / 1.8401307283333333333333333333333e-6),
+        
+        VolumeFlowUnits.OilBarrelPerMinute: lambda value: (value / 2.64978825e-3),
+        
+        VolumeFlowUnits.OilBarrelPerHour: lambda value: (value / 4.41631375e-5),
+        
+        VolumeFlowUnits.OilBarrelPerSecond: lambda value: (value * 6.28981),
+        
+        VolumeFlowUnits.CubicMillimeterPerSecond: lambda value: (value / 1e-9),
+        
+        VolumeFlowUnits.AcreFootPerSecond: lambda value: (value * 0.000810713194),
+        
+        VolumeFlowUnits.AcreFootPerMinute: lambda value: (value * 0.0486427916),
+        
+        VolumeFlowUnits.AcreFootPerHour: lambda value: (value * 2.91857),
+        
+        VolumeFlowUnits.AcreFootPerDay: lambda value: (value * 70.0457),
+        
+        VolumeFlowUnits.CubicCentimeterPerMinute: lambda value: (value / 1.6666666666667e-8),
+        
+        VolumeFlowUnits.MegausGallonPerDay: lambda value: ((value * 22824465.227) / 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerSecond: lambda value: ((value * 1000) / 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerSecond: lambda value: ((value * 1000) / 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerSecond: lambda value: ((value * 1000) / 0.001),
+        
+        VolumeFlowUnits.CentiliterPerSecond: lambda value: ((value * 1000) / 0.01),
+        
+        VolumeFlowUnits.DeciliterPerSecond: lambda value: ((value * 1000) / 0.1),
+        
+        VolumeFlowUnits.KiloliterPerSecond: lambda value: ((value * 1000) / 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerSecond: lambda value: ((value * 1000) / 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerMinute: lambda value: ((value * 60000.00000) / 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerMinute: lambda value: ((value * 60000.00000) / 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerMinute: lambda value: ((value * 60000.00000) / 0.001),
+        
+        VolumeFlowUnits.CentiliterPerMinute: lambda value: ((value * 60000.00000) / 0.01),
+        
+        VolumeFlowUnits.DeciliterPerMinute: lambda value: ((value * 60000.00000) / 0.1),
+        
+        VolumeFlowUnits.KiloliterPerMinute: lambda value: ((value * 60000.00000) / 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerMinute: lambda value: ((value * 60000.00000) / 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerHour: lambda value: ((value * 3600000.000) / 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerHour: lambda value: ((value * 3600000.000) / 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerHour: lambda value: ((value * 3600000.000) / 0.001),
+        
+        VolumeFlowUnits.CentiliterPerHour: lambda value: ((value * 3600000.000) / 0.01),
+        
+        VolumeFlowUnits.DeciliterPerHour: lambda value: ((value * 3600000.000) / 0.1),
+        
+        VolumeFlowUnits.KiloliterPerHour: lambda value: ((value * 3600000.000) / 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerHour: lambda value: ((value * 3600000.000) / 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerDay: lambda value: ((value * 86400000) / 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerDay: lambda value: ((value * 86400000) / 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerDay: lambda value: ((value * 86400000) / 0.001),
+        
+        VolumeFlowUnits.CentiliterPerDay: lambda value: ((value * 86400000) / 0.01),
+        
+        VolumeFlowUnits.DeciliterPerDay: lambda value: ((value * 86400000) / 0.1),
+        
+        VolumeFlowUnits.KiloliterPerDay: lambda value: ((value * 86400000) / 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerDay: lambda value: ((value * 86400000) / 1000000.0),
+        
+        VolumeFlowUnits.MegaukGallonPerDay: lambda value: ((value * 19005304) / 1000000.0),
+        
+        VolumeFlowUnits.MegaukGallonPerSecond: lambda value: ((value * 219.969) / 1000000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        VolumeFlowUnits.CubicMeterPerSecond: lambda value: (value),
+        
+        VolumeFlowUnits.CubicMeterPerMinute: lambda value: (value / 60),
+        
+        VolumeFlowUnits.CubicMeterPerHour: lambda value: (value / 3600),
+        
+        VolumeFlowUnits.CubicMeterPerDay: lambda value: (value / 86400),
+        
+        VolumeFlowUnits.CubicFootPerSecond: lambda value: (value / 35.314666721),
+        
+        VolumeFlowUnits.CubicFootPerMinute: lambda value: (value / 2118.88000326),
+        
+        VolumeFlowUnits.CubicFootPerHour: lambda value: (value * 7.8657907199999087346816086183876e-6),
+        
+        VolumeFlowUnits.CubicYardPerSecond: lambda value: (value * 0.764554857984),
+        
+        VolumeFlowUnits.CubicYardPerMinute: lambda value: (value * 0.0127425809664),
+        
+        VolumeFlowUnits.CubicYardPerHour: lambda value: (value * 2.1237634944e-4),
+        
+        VolumeFlowUnits.CubicYardPerDay: lambda value: (value / 113007),
+        
+        VolumeFlowUnits.MillionUsGallonPerDay: lambda value: (value / 22.824465227),
+        
+        VolumeFlowUnits.UsGallonPerDay: lambda value: (value / 22824465.227),
+        
+        VolumeFlowUnits.LiterPerSecond: lambda value: (value / 1000),
+        
+        VolumeFlowUnits.LiterPerMinute: lambda value: (value / 60000.00000),
+        
+        VolumeFlowUnits.LiterPerHour: lambda value: (value / 3600000.000),
+        
+        VolumeFlowUnits.LiterPerDay: lambda value: (value / 86400000),
+        
+        VolumeFlowUnits.UsGallonPerSecond: lambda value: (value / 264.1720523581484),
+        
+        VolumeFlowUnits.UsGallonPerMinute: lambda value: (value / 15850.323141489),
+        
+        VolumeFlowUnits.UkGallonPerDay: lambda value: (value / 19005304),
+        
+        VolumeFlowUnits.UkGallonPerHour: lambda value: (value / 791887.667),
+        
+        VolumeFlowUnits.UkGallonPerMinute: lambda value: (value / 13198.2),
+        
+        VolumeFlowUnits.UkGallonPerSecond: lambda value: (value / 219.969),
+        
+        VolumeFlowUnits.KilousGallonPerMinute: lambda value: (value / 15.850323141489),
+        
+        VolumeFlowUnits.UsGallonPerHour: lambda value: (value / 951019.38848933424),
+        
+        VolumeFlowUnits.CubicDecimeterPerMinute: lambda value: (value / 60000.00000),
+        
+        VolumeFlowUnits.OilBarrelPerDay: lambda value: (value * 1.8401307283333333333333333333333e-6),
+        
+        VolumeFlowUnits.OilBarrelPerMinute: lambda value: (value * 2.64978825e-3),
+        
+        VolumeFlowUnits.OilBarrelPerHour: lambda value: (value * 4.41631375e-5),
+        
+        VolumeFlowUnits.OilBarrelPerSecond: lambda value: (value / 6.28981),
+        
+        VolumeFlowUnits.CubicMillimeterPerSecond: lambda value: (value * 1e-9),
+        
+        VolumeFlowUnits.AcreFootPerSecond: lambda value: (value / 0.000810713194),
+        
+        VolumeFlowUnits.AcreFootPerMinute: lambda value: (value / 0.0486427916),
+        
+        VolumeFlowUnits.AcreFootPerHour: lambda value: (value / 2.91857),
+        
+        VolumeFlowUnits.AcreFootPerDay: lambda value: (value / 70.0457),
+        
+        VolumeFlowUnits.CubicCentimeterPerMinute: lambda value: (value * 1.6666666666667e-8),
+        
+        VolumeFlowUnits.MegausGallonPerDay: lambda value: ((value / 22824465.227) * 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerSecond: lambda value: ((value / 1000) * 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerSecond: lambda value: ((value / 1000) * 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerSecond: lambda value: ((value / 1000) * 0.001),
+        
+        VolumeFlowUnits.CentiliterPerSecond: lambda value: ((value / 1000) * 0.01),
+        
+        VolumeFlowUnits.DeciliterPerSecond: lambda value: ((value / 1000) * 0.1),
+        
+        VolumeFlowUnits.KiloliterPerSecond: lambda value: ((value / 1000) * 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerSecond: lambda value: ((value / 1000) * 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerMinute: lambda value: ((value / 60000.00000) * 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerMinute: lambda value: ((value / 60000.00000) * 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerMinute: lambda value: ((value / 60000.00000) * 0.001),
+        
+        VolumeFlowUnits.CentiliterPerMinute: lambda value: ((value / 60000.00000) * 0.01),
+        
+        VolumeFlowUnits.DeciliterPerMinute: lambda value: ((value / 60000.00000) * 0.1),
+        
+        VolumeFlowUnits.KiloliterPerMinute: lambda value: ((value / 60000.00000) * 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerMinute: lambda value: ((value / 60000.00000) * 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerHour: lambda value: ((value / 3600000.000) * 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerHour: lambda value: ((value / 3600000.000) * 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerHour: lambda value: ((value / 3600000.000) * 0.001),
+        
+        VolumeFlowUnits.CentiliterPerHour: lambda value: ((value / 3600000.000) * 0.01),
+        
+        VolumeFlowUnits.DeciliterPerHour: lambda value: ((value / 3600000.000) * 0.1),
+        
+        VolumeFlowUnits.KiloliterPerHour: lambda value: ((value / 3600000.000) * 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerHour: lambda value: ((value / 3600000.000) * 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerDay: lambda value: ((value / 86400000) * 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerDay: lambda value: ((value / 86400000) * 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerDay: lambda value: ((value / 86400000) * 0.001),
+        
+        VolumeFlowUnits.CentiliterPerDay: lambda value: ((value / 86400000) * 0.01),
+        
+        VolumeFlowUnits.DeciliterPerDay: lambda value: ((value / 86400000) * 0.1),
+        
+        VolumeFlowUnits.KiloliterPerDay: lambda value: ((value / 86400000) * 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerDay: lambda value: ((value / 86400000) * 1000000.0),
+        
+        VolumeFlowUnits.MegaukGallonPerDay: lambda value: ((value / 19005304) * 1000000.0),
+        
+        VolumeFlowUnits.MegaukGallonPerSecond: lambda value: ((value / 219.969) * 1000000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: VolumeFlowUnits = VolumeFlowUnits.CubicMeterPerSecond):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: VolumeFlowUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: VolumeFlowUnits = VolumeFlowUnits.CubicMeterPerSecond) -> VolumeFlowArray:
+        """
+        Create a new instance of VolumeFlowArray from values in the given unit.
+
+        :param values: The VolumeFlow values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: VolumeFlowUnits
+        :return: A new instance of VolumeFlowArray.
+        :rtype: VolumeFlowArray
+        """
+        return VolumeFlowArray(values, unit)
+
+    
+    @property
+    def cubic_meters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CubicMeterPerSecond](self._values)
+
+    
+    @property
+    def cubic_meters_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CubicMeterPerMinute](self._values)
+
+    
+    @property
+    def cubic_meters_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CubicMeterPerHour](self._values)
+
+    
+    @property
+    def cubic_meters_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CubicMeterPerDay](self._values)
+
+    
+    @property
+    def cubic_feet_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CubicFootPerSecond](self._values)
+
+    
+    @property
+    def cubic_feet_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CubicFootPerMinute](self._values)
+
+    
+    @property
+    def cubic_feet_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CubicFootPerHour](self._values)
+
+    
+    @property
+    def cubic_yards_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CubicYardPerSecond](self._values)
+
+    
+    @property
+    def cubic_yards_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CubicYardPerMinute](self._values)
+
+    
+    @property
+    def cubic_yards_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CubicYardPerHour](self._values)
+
+    
+    @property
+    def cubic_yards_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CubicYardPerDay](self._values)
+
+    
+    @property
+    def million_us_gallons_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MillionUsGallonPerDay](self._values)
+
+    
+    @property
+    def us_gallons_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.UsGallonPerDay](self._values)
+
+    
+    @property
+    def liters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.LiterPerSecond](self._values)
+
+    
+    @property
+    def liters_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.LiterPerMinute](self._values)
+
+    
+    @property
+    def liters_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.LiterPerHour](self._values)
+
+    
+    @property
+    def liters_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.LiterPerDay](self._values)
+
+    
+    @property
+    def us_gallons_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.UsGallonPerSecond](self._values)
+
+    
+    @property
+    def us_gallons_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.UsGallonPerMinute](self._values)
+
+    
+    @property
+    def uk_gallons_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.UkGallonPerDay](self._values)
+
+    
+    @property
+    def uk_gallons_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.UkGallonPerHour](self._values)
+
+    
+    @property
+    def uk_gallons_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.UkGallonPerMinute](self._values)
+
+    
+    @property
+    def uk_gallons_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.UkGallonPerSecond](self._values)
+
+    
+    @property
+    def kilous_gallons_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.KilousGallonPerMinute](self._values)
+
+    
+    @property
+    def us_gallons_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.UsGallonPerHour](self._values)
+
+    
+    @property
+    def cubic_decimeters_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CubicDecimeterPerMinute](self._values)
+
+    
+    @property
+    def oil_barrels_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.OilBarrelPerDay](self._values)
+
+    
+    @property
+    def oil_barrels_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.OilBarrelPerMinute](self._values)
+
+    
+    @property
+    def oil_barrels_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.OilBarrelPerHour](self._values)
+
+    
+    @property
+    def oil_barrels_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.OilBarrelPerSecond](self._values)
+
+    
+    @property
+    def cubic_millimeters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CubicMillimeterPerSecond](self._values)
+
+    
+    @property
+    def acre_feet_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.AcreFootPerSecond](self._values)
+
+    
+    @property
+    def acre_feet_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.AcreFootPerMinute](self._values)
+
+    
+    @property
+    def acre_feet_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.AcreFootPerHour](self._values)
+
+    
+    @property
+    def acre_feet_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.AcreFootPerDay](self._values)
+
+    
+    @property
+    def cubic_centimeters_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CubicCentimeterPerMinute](self._values)
+
+    
+    @property
+    def megaus_gallons_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MegausGallonPerDay](self._values)
+
+    
+    @property
+    def nanoliters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.NanoliterPerSecond](self._values)
+
+    
+    @property
+    def microliters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MicroliterPerSecond](self._values)
+
+    
+    @property
+    def milliliters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MilliliterPerSecond](self._values)
+
+    
+    @property
+    def centiliters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CentiliterPerSecond](self._values)
+
+    
+    @property
+    def deciliters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.DeciliterPerSecond](self._values)
+
+    
+    @property
+    def kiloliters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.KiloliterPerSecond](self._values)
+
+    
+    @property
+    def megaliters_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MegaliterPerSecond](self._values)
+
+    
+    @property
+    def nanoliters_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.NanoliterPerMinute](self._values)
+
+    
+    @property
+    def microliters_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MicroliterPerMinute](self._values)
+
+    
+    @property
+    def milliliters_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MilliliterPerMinute](self._values)
+
+    
+    @property
+    def centiliters_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CentiliterPerMinute](self._values)
+
+    
+    @property
+    def deciliters_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.DeciliterPerMinute](self._values)
+
+    
+    @property
+    def kiloliters_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.KiloliterPerMinute](self._values)
+
+    
+    @property
+    def megaliters_per_minute(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MegaliterPerMinute](self._values)
+
+    
+    @property
+    def nanoliters_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.NanoliterPerHour](self._values)
+
+    
+    @property
+    def microliters_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MicroliterPerHour](self._values)
+
+    
+    @property
+    def milliliters_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MilliliterPerHour](self._values)
+
+    
+    @property
+    def centiliters_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CentiliterPerHour](self._values)
+
+    
+    @property
+    def deciliters_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.DeciliterPerHour](self._values)
+
+    
+    @property
+    def kiloliters_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.KiloliterPerHour](self._values)
+
+    
+    @property
+    def megaliters_per_hour(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MegaliterPerHour](self._values)
+
+    
+    @property
+    def nanoliters_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.NanoliterPerDay](self._values)
+
+    
+    @property
+    def microliters_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MicroliterPerDay](self._values)
+
+    
+    @property
+    def milliliters_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MilliliterPerDay](self._values)
+
+    
+    @property
+    def centiliters_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.CentiliterPerDay](self._values)
+
+    
+    @property
+    def deciliters_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.DeciliterPerDay](self._values)
+
+    
+    @property
+    def kiloliters_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.KiloliterPerDay](self._values)
+
+    
+    @property
+    def megaliters_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MegaliterPerDay](self._values)
+
+    
+    @property
+    def megauk_gallons_per_day(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MegaukGallonPerDay](self._values)
+
+    
+    @property
+    def megauk_gallons_per_second(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowUnits.MegaukGallonPerSecond](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.volume_flow_per_area import VolumeFlowPerArea, VolumeFlowPerAreaUnits
+
+
+class VolumeFlowPerAreaArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of VolumeFlowPerArea values, held in CubicMeterPerSecondPerSquareMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (VolumeFlowPerAreaUnits): The VolumeFlowPerArea unit of the values, The default unit is CubicMeterPerSecondPerSquareMeter
+    """
+    __slots__ = ()
+
+    _quantity = VolumeFlowPerArea
+
+    # Whole-array variants of the VolumeFlowPerArea conversion functions.
+    _conversions_from_base = {
+        
+        VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter: lambda value: (value),
+        
+        VolumeFlowPerAreaUnits.CubicFootPerMinutePerSquareFoot: lambda value: (value * 196.850394),
+        
+    }
+
+    _conversions_to_base = {
+        
+        VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter: lambda value: (value),
+        
+        VolumeFlowPerAreaUnits.CubicFootPerMinutePerSquareFoot: lambda value: (value / 196.850394),
+        
+    }
+
+    def __init__(self, values, from_unit: VolumeFlowPerAreaUnits = VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: VolumeFlowPerAreaUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: VolumeFlowPerAreaUnits = VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter) -> VolumeFlowPerAreaArray:
+        """
+        Create a new instance of VolumeFlowPerAreaArray from values in the given unit.
+
+        :param values: The VolumeFlowPerArea values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: VolumeFlowPerAreaUnits
+        :return: A new instance of VolumeFlowPerAreaArray.
+        :rtype: VolumeFlowPerAreaArray
+        """
+        return VolumeFlowPerAreaArray(values, unit)
+
+    
+    @property
+    def cubic_meters_per_second_per_square_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter](self._values)
+
+    
+    @property
+    def cubic_feet_per_minute_per_square_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumeFlowPerAreaUnits.CubicFootPerMinutePerSquareFoot](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.volume_per_length import VolumePerLength, VolumePerLengthUnits
+
+
+class VolumePerLengthArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of VolumePerLength values, held in CubicMeterPerMeter.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (VolumePerLengthUnits): The VolumePerLength unit of the values, The default unit is CubicMeterPerMeter
+    """
+    __slots__ = ()
+
+    _quantity = VolumePerLength
+
+    # Whole-array variants of the VolumePerLength conversion functions.
+    _conversions_from_base = {
+        
+        VolumePerLengthUnits.CubicMeterPerMeter: lambda value: (value),
+        
+        VolumePerLengthUnits.LiterPerMeter: lambda value: (value * 1000),
+        
+        VolumePerLengthUnits.LiterPerKilometer: lambda value: (value * 1e6),
+        
+        VolumePerLengthUnits.LiterPerMillimeter: lambda value: (value),
+        
+        VolumePerLengthUnits.OilBarrelPerFoot: lambda value: (value * 1.91713408),
+        
+        VolumePerLengthUnits.CubicYardPerFoot: lambda value: (value / 2.50838208),
+        
+        VolumePerLengthUnits.CubicYardPerUsSurveyFoot: lambda value: (value / 2.50837706323584),
+        
+        VolumePerLengthUnits.UsGallonPerMile: lambda value: (value * (1000 * 1609.344 / 3.785411784)),
+        
+        VolumePerLengthUnits.ImperialGallonPerMile: lambda value: (value * (1000 * 1609.344 / 4.54609)),
+        
+    }
+
+    _conversions_to_base = {
+        
+        VolumePerLengthUnits.CubicMeterPerMeter: lambda value: (value),
+        
+        VolumePerLengthUnits.LiterPerMeter: lambda value: (value / 1000),
+        
+        VolumePerLengthUnits.LiterPerKilometer: lambda value: (value / 1e6),
+        
+        VolumePerLengthUnits.LiterPerMillimeter: lambda value: (value),
+        
+        VolumePerLengthUnits.OilBarrelPerFoot: lambda value: (value / 1.91713408),
+        
+        VolumePerLengthUnits.CubicYardPerFoot: lambda value: (value * 2.50838208),
+        
+        VolumePerLengthUnits.CubicYardPerUsSurveyFoot: lambda value: (value * 2.50837706323584),
+        
+        VolumePerLengthUnits.UsGallonPerMile: lambda value: (value / (1000 * 1609.344 / 3.785411784)),
+        
+        VolumePerLengthUnits.ImperialGallonPerMile: lambda value: (value / (1000 * 1609.344 / 4.54609)),
+        
+    }
+
+    def __init__(self, values, from_unit: VolumePerLengthUnits = VolumePerLengthUnits.CubicMeterPerMeter):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: VolumePerLengthUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: VolumePerLengthUnits = VolumePerLengthUnits.CubicMeterPerMeter) -> VolumePerLengthArray:
+        """
+        Create a new instance of VolumePerLengthArray from values in the given unit.
+
+        :param values: The VolumePerLength values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: VolumePerLengthUnits
+        :return: A new instance of VolumePerLengthArray.
+        :rtype: VolumePerLengthArray
+        """
+        return VolumePerLengthArray(values, unit)
+
+    
+    @property
+    def cubic_meters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumePerLengthUnits.CubicMeterPerMeter](self._values)
+
+    
+    @property
+    def liters_per_meter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumePerLengthUnits.LiterPerMeter](self._values)
+
+    
+    @property
+    def liters_per_kilometer(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumePerLengthUnits.LiterPerKilometer](self._values)
+
+    
+    @property
+    def liters_per_millimeter(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumePerLengthUnits.LiterPerMillimeter](self._values)
+
+    
+    @property
+    def oil_barrels_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumePerLengthUnits.OilBarrelPerFoot](self._values)
+
+    
+    @property
+    def cubic_yards_per_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumePerLengthUnits.CubicYardPerFoot](self._values)
+
+    
+    @property
+    def cubic_yards_per_us_survey_foot(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumePerLengthUnits.CubicYardPerUsSurveyFoot](self._values)
+
+    
+    @property
+    def us_gallons_per_mile(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumePerLengthUnits.UsGallonPerMile](self._values)
+
+    
+    @property
+    def imperial_gallons_per_mile(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumePerLengthUnits.ImperialGallonPerMile](self._values)
+
+    
\ No newline at end of file
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.volumetric_heat_capacity import VolumetricHeatCapacity, VolumetricHeatCapacityUnits
+
+
+class VolumetricHeatCapacityArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of VolumetricHeatCapacity values, held in JoulePerCubicMeterKelvin.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (VolumetricHeatCapacityUnits): The VolumetricHeatCapacity unit of the values, The default unit is JoulePerCubicMeterKelvin
+    """
+    __slots__ = ()
+
+    _quantity = VolumetricHeatCapacity
+
+    # Whole-array variants of the VolumetricHeatCapacity conversion functions.
+    _conversions_from_base = {
+        
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin: lambda value: (value),
+        
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterDegreeCelsius: lambda value: (value),
+        
+        VolumetricHeatCapacityUnits.CaloriePerCubicCentimeterDegreeCelsius: lambda value: (value * 2.388459e-7),
+        
+        VolumetricHeatCapacityUnits.BtuPerCubicFootDegreeFahrenheit: lambda value: (value * 1.4910660e-5),
+        
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterKelvin: lambda value: ((value) / 1000.0),
+        
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterKelvin: lambda value: ((value) / 1000000.0),
+        
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterDegreeCelsius: lambda value: ((value) / 1000.0),
+        
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterDegreeCelsius: lambda value: ((value) / 1000000.0),
+        
+        VolumetricHeatCapacityUnits.KilocaloriePerCubicCentimeterDegreeCelsius: lambda value: ((value * 2.388459e-7) / 1000.0),
+        
+    }
+
+    _conversions_to_base = {
+        
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin: lambda value: (value),
+        
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterDegreeCelsius: lambda value: (value),
+        
+        VolumetricHeatCapacityUnits.CaloriePerCubicCentimeterDegreeCelsius: lambda value: (value / 2.388459e-7),
+        
+        VolumetricHeatCapacityUnits.BtuPerCubicFootDegreeFahrenheit: lambda value: (value / 1.4910660e-5),
+        
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterKelvin: lambda value: ((value) * 1000.0),
+        
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterKelvin: lambda value: ((value) * 1000000.0),
+        
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterDegreeCelsius: lambda value: ((value) * 1000.0),
+        
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterDegreeCelsius: lambda value: ((value) * 1000000.0),
+        
+        VolumetricHeatCapacityUnits.KilocaloriePerCubicCentimeterDegreeCelsius: lambda value: ((value / 2.388459e-7) * 1000.0),
+        
+    }
+
+    def __init__(self, values, from_unit: VolumetricHeatCapacityUnits = VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: VolumetricHeatCapacityUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: VolumetricHeatCapacityUnits = VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin) -> VolumetricHeatCapacityArray:
+        """
+        Create a new instance of VolumetricHeatCapacityArray from values in the given unit.
+
+        :param values: The VolumetricHeatCapacity values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: VolumetricHeatCapacityUnits
+        :return: A new instance of VolumetricHeatCapacityArray.
+        :rtype: VolumetricHeatCapacityArray
+        """
+        return VolumetricHeatCapacityArray(values, unit)
+
+    
+    @property
+    def joules_per_cubic_meter_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin](self._values)
+
+    
+    @property
+    def joules_per_cubic_meter_degree_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumetricHeatCapacityUnits.JoulePerCubicMeterDegreeCelsius](self._values)
+
+    
+    @property
+    def calories_per_cubic_centimeter_degree_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumetricHeatCapacityUnits.CaloriePerCubicCentimeterDegreeCelsius](self._values)
+
+    
+    @property
+    def btus_per_cubic_foot_degree_fahrenheit(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumetricHeatCapacityUnits.BtuPerCubicFootDegreeFahrenheit](self._values)
+
+    
+    @property
+    def kilojoules_per_cubic_meter_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumetricHeatCapacityUnits.KilojoulePerCubicMeterKelvin](self._values)
+
+    
+    @property
+    def megajoules_per_cubic_meter_kelvin(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumetricHeatCapacityUnits.MegajoulePerCubicMeterKelvin](self._values)
+
+    
+    @property
+    def kilojoules_per_cubic_meter_degree_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumetricHeatCapacityUnits.KilojoulePerCubicMeterDegreeCelsius](self._values)
+
+    
+    @property
+    def megajoules_per_cubic_meter_degree_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumetricHeatCapacityUnits.MegajoulePerCubicMeterDegreeCelsius](self._values)
+
+    
+    @property
+    def kilocalories_per_cubic_centimeter_degree_celsius(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[VolumetricHeatCapacityUnits.KilocaloriePerCubicCentimeterDegreeCelsius](self._values)
+
+    
\ No newline at end of file
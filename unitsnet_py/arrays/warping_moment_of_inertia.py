@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ..abstract_array import AbstractQuantityArray
+from ..units.warping_moment_of_inertia import WarpingMomentOfInertia, WarpingMomentOfInertiaUnits
+
+
+class WarpingMomentOfInertiaArray(AbstractQuantityArray):
+    """
+    A NumPy backed array of WarpingMomentOfInertia values, held in MeterToTheSixth.
+
+    Args:
+        values (ArrayLike): The values.
+        from_unit (WarpingMomentOfInertiaUnits): The WarpingMomentOfInertia unit of the values, The default unit is MeterToTheSixth
+    """
+    __slots__ = ()
+
+    _quantity = WarpingMomentOfInertia
+
+    # Whole-array variants of the WarpingMomentOfInertia conversion functions.
+    _conversions_from_base = {
+        
+        WarpingMomentOfInertiaUnits.MeterToTheSixth: lambda value: (value),
+        
+        WarpingMomentOfInertiaUnits.DecimeterToTheSixth: lambda value: (value * 1e6),
+        
+        WarpingMomentOfInertiaUnits.CentimeterToTheSixth: lambda value: (value * 1e12),
+        
+        WarpingMomentOfInertiaUnits.MillimeterToTheSixth: lambda value: (value * 1e18),
+        
+        WarpingMomentOfInertiaUnits.FootToTheSixth: lambda value: (value / np.power(0.3048, 6)),
+        
+        WarpingMomentOfInertiaUnits.InchToTheSixth: lambda value: (value / np.power(2.54e-2, 6)),
+        
+    }
+
+    _conversions_to_base = {
+        
+        WarpingMomentOfInertiaUnits.MeterToTheSixth: lambda value: (value),
+        
+        WarpingMomentOfInertiaUnits.DecimeterToTheSixth: lambda value: (value / 1e6),
+        
+        WarpingMomentOfInertiaUnits.CentimeterToTheSixth: lambda value: (value / 1e12),
+        
+        WarpingMomentOfInertiaUnits.MillimeterToTheSixth: lambda value: (value / 1e18),
+        
+        WarpingMomentOfInertiaUnits.FootToTheSixth: lambda value: (value * np.power(0.3048, 6)),
+        
+        WarpingMomentOfInertiaUnits.InchToTheSixth: lambda value: (value * np.power(2.54e-2, 6)),
+        
+    }
+
+    def __init__(self, values, from_unit: WarpingMomentOfInertiaUnits = WarpingMomentOfInertiaUnits.MeterToTheSixth):
+        self._init_values(values, from_unit)
+
+    def convert(self, unit: WarpingMomentOfInertiaUnits) -> np.ndarray:
+        return self._conversions_from_base[unit](self._values)
+
+    @staticmethod
+    def from_array(values, unit: WarpingMomentOfInertiaUnits = WarpingMomentOfInertiaUnits.MeterToTheSixth) -> WarpingMomentOfInertiaArray:
+        """
+        Create a new instance of WarpingMomentOfInertiaArray from values in the given unit.
+
+        :param values: The WarpingMomentOfInertia values.
+        :type values: ArrayLike
+        :param unit: The unit of the values.
+        :type unit: WarpingMomentOfInertiaUnits
+        :return: A new instance of WarpingMomentOfInertiaArray.
+        :rtype: WarpingMomentOfInertiaArray
+        """
+        return WarpingMomentOfInertiaArray(values, unit)
+
+    
+    @property
+    def meters_to_the_sixth(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[WarpingMomentOfInertiaUnits.MeterToTheSixth](self._values)
+
+    
+    @property
+    def decimeters_to_the_sixth(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[WarpingMomentOfInertiaUnits.DecimeterToTheSixth](self._values)
+
+    
+    @property
+    def centimeters_to_the_sixth(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[WarpingMomentOfInertiaUnits.CentimeterToTheSixth](self._values)
+
+    
+    @property
+    def millimeters_to_the_sixth(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[WarpingMomentOfInertiaUnits.MillimeterToTheSixth](self._values)
+
+    
+    @property
+    def feet_to_the_sixth(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[WarpingMomentOfInertiaUnits.FootToTheSixth](self._values)
+
+    
+    @property
+    def inches_to_the_sixth(self) -> np.ndarray:
+        """
+        
+        """
+        return self._conversions_from_base[WarpingMomentOfInertiaUnits.InchToTheSixth](self._values)
+
+    
\ No newline at end of file
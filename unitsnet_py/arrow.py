@@ -0,0 +1,221 @@
+"""
+Apache Arrow integration: a quantity extension type of float64 columns, kept through Parquet files.
+
+Importing the module registers the "unitsnet.quantity" extension type.
+The quantity name and the unit are stored in the extension type metadata,
+and in the field metadata (see 'quantity_field') for the readers that do not know the extension type.
+
+    table = pa.table({"pressure": to_arrow(PressureArray([1.5, 2], PressureUnits.Bar), PressureUnits.Bar)})
+    pq.write_table(table, "telemetry.parquet")
+    pressures = convert(pq.read_table("telemetry.parquet")["pressure"], PressureUnits.Pascal)
+
+The conversions run on the Arrow buffers (pyarrow.compute), without creating Python objects,
+and the quantity arrays share the Arrow buffers when no conversion is needed.
+"""
+from __future__ import annotations
+
+import json
+from enum import Enum
+from typing import Optional, Type, Union
+
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError as error:  # pragma: no cover - depends on the environment
+    raise ImportError("The Arrow integration requires pyarrow, install it using 'pip install pyarrow'") from error
+
+from .abstract_array import AbstractQuantityArray, _get_array_class
+from .abstract_unit import AbstractMeasure, _get_quantity
+
+EXTENSION_NAME = "unitsnet.quantity"
+
+# The field metadata keys of the quantity name and the unit name.
+QUANTITY_METADATA_KEY = b"unitsnet.quantity"
+UNIT_METADATA_KEY = b"unitsnet.unit"
+
+ArrowValues = Union[pa.Array, pa.ChunkedArray]
+
+
+class QuantityType(pa.ExtensionType):
+    """
+    The Arrow extension type of the float64 values of a quantity, in one of its units.
+
+    Args:
+        quantity (type): The quantity, e.g. Pressure.
+        unit (Enum): The unit of the values, by default the quantity base unit.
+    """
+
+    def __init__(self, quantity: Type[AbstractMeasure], unit: Optional[Enum] = None):
+        if unit is None:
+            unit = quantity._base_unit
+        elif not isinstance(unit, quantity._units):
+            raise ValueError(f"Invalid unit {unit!r} for {quantity.__name__}")
+        self.quantity = quantity
+        self.unit = unit
+        super().__init__(pa.float64(), EXTENSION_NAME)
+
+    def __arrow_ext_serialize__(self) -> bytes:
+        return json.dumps({"quantity": self.quantity.__name__, "unit": self.unit.name}).encode()
+
+    @classmethod
+    def __arrow_ext_deserialize__(cls, storage_type: pa.DataType, serialized: bytes) -> QuantityType:
+        metadata = json.loads(serialized.decode())
+        quantity = _get_quantity(metadata["quantity"])
+        return cls(quantity, quantity._units[metadata["unit"]])
+
+    def __eq__(self, other):
+        # The default equality compares the extension names and storage types only.
+        if isinstance(other, QuantityType):
+            return self.quantity is other.quantity and self.unit is other.unit
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self) -> int:
+        return hash((EXTENSION_NAME, self.quantity, self.unit))
+
+    def __reduce__(self):
+        return type(self), (self.quantity, self.unit)
+
+    def __str__(self) -> str:
+        return f"quantity<{self.quantity.__name__}, {self.unit.name}>"
+
+    def to_pandas_dtype(self):
+        from .pandas import QuantityDtype
+
+        return QuantityDtype(self.quantity, self.unit)
+
+
+pa.register_extension_type(QuantityType(_get_quantity("Length")))
+
+
+def quantity_field(name: str, quantity: Type[AbstractMeasure], unit: Optional[Enum] = None, nullable: bool = True):
+    """
+    Get a field of a quantity column, tagged by the extension type and the field metadata.
+    """
+    quantity_type = QuantityType(quantity, unit)
+    metadata = {
+        QUANTITY_METADATA_KEY: quantity.__name__.encode(),
+        UNIT_METADATA_KEY: quantity_type.unit.name.encode(),
+    }
+    return pa.field(name, quantity_type, nullable=nullable, metadata=metadata)
+
+
+def get_quantity_type(field: pa.Field) -> Optional[QuantityType]:
+    """
+    Get the quantity type of a field, by its extension type or its field metadata, None when it is not a quantity.
+    """
+    if isinstance(field.type, QuantityType):
+        return field.type
+    metadata = field.metadata or {}
+    if QUANTITY_METADATA_KEY not in metadata or not pa.types.is_floating(field.type):
+        return None
+    quantity = _get_quantity(metadata[QUANTITY_METADATA_KEY].decode())
+    return QuantityType(quantity, quantity._units[metadata[UNIT_METADATA_KEY].decode()])
+
+
+def to_arrow(values: AbstractQuantityArray, unit: Optional[Enum] = None) -> pa.ExtensionArray:
+    """
+    Get a quantity array as an Arrow array, in a unit.
+
+    In the base unit (the default), the Arrow array references the quantity array values without a copy.
+    """
+    quantity = values._quantity
+    unit = quantity._base_unit if unit is None else unit
+    raw = values.base_values if unit is quantity._base_unit else values.convert(unit)
+    return pa.ExtensionArray.from_storage(QuantityType(quantity, unit), pa.array(raw, type=pa.float64()))
+
+
+def _storage_values(values: pa.Array) -> np.ndarray:
+    storage = values.storage if isinstance(values, pa.ExtensionArray) else values
+    if storage.null_count:
+        raise ValueError("Can not create a quantity array with missing values")
+    return storage.to_numpy(zero_copy_only=storage.type == pa.float64())
+
+
+def from_arrow(values: ArrowValues, quantity_type: Optional[QuantityType] = None) -> AbstractQuantityArray:
+    """
+    Get an Arrow array of a quantity as the quantity array (e.g. PressureArray).
+
+    Arrays of a single chunk in the base unit are referenced without a copy.
+
+    :param values: The Arrow array or chunked array, of a QuantityType or of float values.
+    :param quantity_type: The quantity type of float values (see 'get_quantity_type').
+    :raises ValueError: When the values are not of a quantity, or contain missing values or NaN.
+    """
+    quantity_type = __get_values_type(values, quantity_type)
+    if isinstance(values, pa.ChunkedArray):
+        chunks = [_storage_values(chunk) for chunk in values.chunks]
+        raw = chunks[0] if len(chunks) == 1 else np.concatenate(chunks) if chunks else np.empty(0)
+    else:
+        raw = _storage_values(values)
+    if np.isnan(raw).any():
+        raise ValueError("Invalid unit: values contain NaN")
+    quantity, unit = quantity_type.quantity, quantity_type.unit
+    array_class = _get_array_class(quantity)
+    if unit is not quantity._base_unit:
+        raw = array_class.convert_values(raw, unit, quantity._base_unit)
+    return array_class._from_base_values(raw)
+
+
+def __get_values_type(values: ArrowValues, quantity_type: Optional[QuantityType]) -> QuantityType:
+    if isinstance(values.type, QuantityType):
+        return values.type
+    if quantity_type is None or not pa.types.is_floating(values.type):
+        raise ValueError(f"Expected values of a quantity type, got {values.type}")
+    return quantity_type
+
+
+def __convert_chunk(chunk: pa.Array, from_unit: Enum, to_unit: Enum, to_type: QuantityType) -> pa.Array:
+    storage = chunk.storage if isinstance(chunk, pa.ExtensionArray) else chunk.cast(pa.float64())
+    quantity = to_type.quantity
+    factors = quantity._get_conversion_factors(from_unit, to_unit)
+    if factors is None:
+        # Non-affine formulas (e.g. logarithmic units) are applied to the buffer by NumPy, the nulls are kept.
+        raw = storage.to_numpy(zero_copy_only=False)
+        converted = _get_array_class(quantity).convert_values(raw, from_unit, to_unit)
+        storage = pa.array(converted, mask=storage.is_null().to_numpy(zero_copy_only=False))
+    else:
+        scale, offset = factors
+        storage = pc.multiply(storage, pa.scalar(scale, pa.float64()))
+        if offset:
+            storage = pc.add(storage, pa.scalar(offset, pa.float64()))
+    return pa.ExtensionArray.from_storage(to_type, storage)
+
+
+def convert(values: ArrowValues, to_unit: Enum, quantity_type: Optional[QuantityType] = None) -> ArrowValues:
+    """
+    Convert an Arrow column of a quantity to another unit, the conversion runs on the Arrow buffers.
+
+    :param values: The Arrow array or chunked array, of a QuantityType or of float values.
+    :param to_unit: The unit to convert to.
+    :param quantity_type: The quantity type of float values (see 'get_quantity_type').
+    :return: The converted values, of the QuantityType of 'to_unit', nulls are kept.
+    """
+    from_type = __get_values_type(values, quantity_type)
+    to_type = QuantityType(from_type.quantity, to_unit)
+    if isinstance(values, pa.ChunkedArray):
+        return pa.chunked_array(
+            [__convert_chunk(chunk, from_type.unit, to_unit, to_type) for chunk in values.chunks], type=to_type
+        )
+    return __convert_chunk(values, from_type.unit, to_unit, to_type)
+
+
+def convert_column(table: pa.Table, name: str, to_unit: Enum) -> pa.Table:
+    """
+    Convert a quantity column of a table to another unit, the column field and its metadata are updated.
+
+    The column is found by its extension type or by its field metadata (e.g. a Parquet file read without the extension).
+    """
+    index = table.schema.get_field_index(name)
+    field = table.schema.field(index)
+    quantity_type = get_quantity_type(field)
+    if quantity_type is None:
+        raise ValueError(f'Column "{name}" is not a quantity column')
+    converted = convert(table.column(index), to_unit, quantity_type)
+    return table.set_column(
+        index, quantity_field(name, quantity_type.quantity, to_unit, nullable=field.nullable), converted
+    )
@@ -0,0 +1,214 @@
+"""
+Compact binary codec for measurements and batches of measurements.
+
+A measurement is encoded to 12 bytes: the quantity id (uint16), the unit id (uint16)
+and the value (float64), little-endian.
+
+A batch is encoded as a 16 bytes header, followed by the packed little-endian float64 values:
+
+    magic (4s) | version (uint8) | pad | quantity id (uint16) | unit id (uint16) | pad (2) | count (uint32)
+
+The quantity and unit ids are pinned by the generator (units_generator/binary_ids.json): an id is assigned once,
+when its quantity or unit is first generated, and is never changed or reused.
+So measurements encoded by one package version are decoded by the later versions,
+adding, removing or reordering quantities and units does not shift the existing ids.
+"""
+import importlib
+import math
+import struct
+import sys
+from array import array
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Iterable, NamedTuple, Optional, Tuple, Type
+
+if TYPE_CHECKING:
+    from .abstract_array import AbstractQuantityArray
+    from .abstract_unit import AbstractMeasure
+
+MEASUREMENT_STRUCT = struct.Struct("<HHd")
+BATCH_HEADER_STRUCT = struct.Struct("<4sBxHHxxI")
+BATCH_MAGIC = b"UNPB"
+BATCH_VERSION = 1
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+# Quantity id -> quantity name, built on first use from the package pinned ids.
+_quantity_names: Optional[Dict[int, str]] = None
+# Unit -> (quantity id, unit id) and (quantity id, unit id) -> (quantity, unit), filled on first use.
+_unit_keys: Dict[Enum, Tuple[int, int]] = {}
+_measurement_types: Dict[Tuple[int, int], Tuple[type, Enum]] = {}
+
+
+class Batch(NamedTuple):
+    """
+    A decoded batch, 'values' is a read-only float64 memoryview over the encoded data.
+    """
+
+    quantity: type
+    unit: Enum
+    values: memoryview
+
+
+def __get_quantity_names() -> Dict[int, str]:
+    global _quantity_names
+    if _quantity_names is None:
+        from . import _quantity_binary_ids
+
+        _quantity_names = {quantity_id: name for name, quantity_id in _quantity_binary_ids.items()}
+    return _quantity_names
+
+
+def __get_unit_key(quantity: type, unit: Enum) -> Tuple[int, int]:
+    # Validated before the cache lookup, the cached keys of a unit are valid for its own quantity only.
+    if not isinstance(unit, quantity._units):
+        raise ValueError(f"Invalid unit {unit!r} for {quantity.__name__}")
+    try:
+        return _unit_keys[unit]
+    except KeyError:
+        pass
+    key = _unit_keys[unit] = (quantity._binary_id, quantity._binary_unit_ids[unit])
+    return key
+
+
+def __get_measurement_type(quantity_id: int, unit_id: int) -> Tuple[type, Enum]:
+    try:
+        return _measurement_types[quantity_id, unit_id]
+    except KeyError:
+        pass
+    from . import _quantity_modules
+
+    name = __get_quantity_names().get(quantity_id)
+    if name is None:
+        raise ValueError(f"Unknown quantity id {quantity_id}")
+    quantity = getattr(importlib.import_module(f".units.{_quantity_modules[name]}", __package__), name)
+    for unit, binary_id in quantity._binary_unit_ids.items():
+        if binary_id == unit_id:
+            break
+    else:
+        raise ValueError(f"Unknown {name} unit id {unit_id}")
+    measurement_type = _measurement_types[quantity_id, unit_id] = (quantity, unit)
+    return measurement_type
+
+
+def encode(measure: "AbstractMeasure", unit: Optional[Enum] = None) -> bytes:
+    """
+    Encode a measurement to 12 bytes.
+
+    :param measure: The measurement to encode.
+    :param unit: The unit to encode the value in, by default the base unit (lossless).
+    :return: The encoded measurement.
+    """
+    quantity = type(measure)
+    if unit is None or unit is quantity._base_unit:
+        return MEASUREMENT_STRUCT.pack(*__get_unit_key(quantity, quantity._base_unit), measure._value)
+    return MEASUREMENT_STRUCT.pack(*__get_unit_key(quantity, unit), measure.convert(unit))
+
+
+def decode(data, quantity: Optional[Type["AbstractMeasure"]] = None) -> "AbstractMeasure":
+    """
+    Decode a measurement encoded by 'encode'.
+
+    :param data: The encoded measurement, any bytes-like object.
+    :param quantity: The expected quantity, by default any quantity is accepted.
+    :return: A new instance of the decoded quantity.
+    :raises ValueError: When the data is not a valid measurement (of the expected quantity).
+    """
+    try:
+        quantity_id, unit_id, value = MEASUREMENT_STRUCT.unpack(data)
+    except struct.error as error:
+        raise ValueError(f"Invalid measurement data: {error}") from None
+    measurement_quantity, unit = __get_measurement_type(quantity_id, unit_id)
+    if quantity is not None and measurement_quantity is not quantity:
+        raise ValueError(f"Invalid measurement data: expected {quantity.__name__}, got {measurement_quantity.__name__}")
+    if unit is measurement_quantity._base_unit:
+        # The base value is decoded as is, the generated base unit formulas may not be exact identities.
+        if math.isnan(value):
+            raise ValueError("Invalid unit: value is NaN")
+        return measurement_quantity._from_base(value)
+    return measurement_quantity(value, unit)
+
+
+def encode_batch(values: Iterable[float], quantity: Type["AbstractMeasure"], unit: Optional[Enum] = None) -> bytes:
+    """
+    Encode a batch of values of the same quantity and unit.
+
+    Buffers of float64 (array('d'), float64 ndarray) are copied as is, other iterables are packed first.
+
+    :param values: The values, in 'unit'.
+    :param quantity: The quantity of the values.
+    :param unit: The unit of the values, by default the quantity base unit.
+    :return: The encoded batch.
+    """
+    quantity_id, unit_id = __get_unit_key(quantity, quantity._base_unit if unit is None else unit)
+    try:
+        view = memoryview(values)
+    except TypeError:
+        view = None
+    if view is None or view.format != "d" or not view.c_contiguous or not _LITTLE_ENDIAN:
+        packed = array("d", values)
+        if not _LITTLE_ENDIAN:
+            packed.byteswap()
+        view = memoryview(packed)
+    count = len(view)
+    header = BATCH_HEADER_STRUCT.pack(BATCH_MAGIC, BATCH_VERSION, quantity_id, unit_id, count)
+    return b"".join((header, view))
+
+
+def __decode_batch_header(data) -> Tuple[type, Enum, int]:
+    try:
+        magic, version, quantity_id, unit_id, count = BATCH_HEADER_STRUCT.unpack_from(data)
+    except struct.error as error:
+        raise ValueError(f"Invalid batch data: {error}") from None
+    if magic != BATCH_MAGIC:
+        raise ValueError("Invalid batch data: bad magic")
+    if version != BATCH_VERSION:
+        raise ValueError(f"Invalid batch data: unsupported version {version}")
+    if memoryview(data).nbytes != BATCH_HEADER_STRUCT.size + count * 8:
+        raise ValueError(f"Invalid batch data: expected {count} values")
+    quantity, unit = __get_measurement_type(quantity_id, unit_id)
+    return quantity, unit, count
+
+
+def decode_batch(data) -> Batch:
+    """
+    Decode a batch encoded by 'encode_batch', without copying the values.
+
+    Note! the values view references the data, and the values are not validated (may contain NaN).
+
+    :param data: The encoded batch, any bytes-like object.
+    :return: The batch quantity, unit and values.
+    :raises ValueError: When the data is not a valid batch.
+    """
+    quantity, unit, _ = __decode_batch_header(data)
+    view = memoryview(data).cast("B")[BATCH_HEADER_STRUCT.size:]
+    if _LITTLE_ENDIAN:
+        values = view.cast("d")
+    else:
+        packed = array("d", view.tobytes())
+        packed.byteswap()
+        values = memoryview(packed)
+    return Batch(quantity, unit, values.toreadonly())
+
+
+def decode_array(data) -> "AbstractQuantityArray":
+    """
+    Decode a batch encoded by 'encode_batch' to a quantity array (requires NumPy).
+
+    When the batch unit is the base unit, the array values reference the data without a copy.
+
+    :param data: The encoded batch, any bytes-like object.
+    :return: A new instance of the quantity array.
+    :raises ValueError: When the data is not a valid batch or contains NaN.
+    """
+    import numpy as np
+
+    from .abstract_array import _get_array_class
+
+    quantity, unit, count = __decode_batch_header(data)
+    array_class = _get_array_class(quantity)
+    values = np.frombuffer(data, dtype="<f8", count=count, offset=BATCH_HEADER_STRUCT.size)
+    if np.isnan(values).any():
+        raise ValueError("Invalid unit: values contain NaN")
+    if unit is not quantity._base_unit:
+        values = array_class._conversions_to_base[unit](values)
+    return array_class._from_base_values(values)
@@ -0,0 +1,119 @@
+"""
+The cache policy of the unit properties (e.g. 'length.meters').
+
+    "instance" (the default): each instance caches its converted values in a dict,
+        allocated on the first property read, so instances that are never converted carry no cache.
+    "shared": a single LRU cache of the converted values, keyed by (base value, unit) and bounded to 'maxsize'
+        entries, for instances read once or few times, or created again and again from the same values.
+    "none": every property read converts the base value, nothing is retained.
+
+    cache.set_policy("shared", maxsize=65536)
+
+Thread-safety: all the policies are safe to use from any thread, the instances may be shared between threads.
+The quantities are immutable, a converted value depends on the base value and the unit only,
+so the caches never need to be invalidated and a value converted twice is converted to the same result.
+    - "instance": the cache is written without a lock, dict reads and writes being atomic.
+      Threads reading the same uncached property concurrently may each convert the value,
+      and the instance may keep the cache dict of one of them only, the values of the others are converted again.
+    - "shared": the LRU cache ('functools.lru_cache') is thread-safe,
+      the same (base value, unit) may be converted concurrently by several threads on a miss.
+The policy itself is process wide: switch it on startup, before the threads use the quantities.
+
+Like the instrumentation, switching the policy swaps the 'AbstractMeasure' conversion method,
+so the policy has no per read overhead. The policy can not be switched while the instrumentation is enabled,
+which counts all the reads of the "shared" and "none" policies as cache misses.
+"""
+from enum import Enum
+from functools import lru_cache
+from typing import Callable, Dict, NamedTuple, Optional
+
+from . import abstract_unit, instrumentation
+from .abstract_unit import AbstractMeasure
+
+POLICIES = ("none", "instance", "shared")
+
+# The default bound of the shared cache entries, under 1 MB.
+DEFAULT_MAXSIZE = 4096
+
+_policy = "instance"
+# The shared LRU cache of (base value, unit) -> converted value, created by 'set_policy'.
+# It is kept when switching to another policy, for the threads still reading through it.
+_shared_convert: Optional[Callable[[float, Enum], float]] = None
+# Unit -> its conversion from the base unit, of all the quantities (the units enums members are distinct).
+_conversions_from_base: Dict[Enum, Callable[[float], float]] = {}
+
+# The original method, also when the module is imported while the instrumentation swapped it.
+_instance_cached_convert = instrumentation._originals.get(
+    (AbstractMeasure, "_cached_convert"), AbstractMeasure.__dict__["_cached_convert"]
+)
+
+
+def _uncached_convert(self, unit: Enum) -> float:
+    return self._conversions_from_base[unit](self._value)
+
+
+def _shared_cached_convert(self, unit: Enum) -> float:
+    return _shared_convert(self._value, unit)
+
+
+def _convert_from_base(value: float, unit: Enum) -> float:
+    return _conversions_from_base[unit](value)
+
+
+def __register_quantity(quantity: type):
+    # Only the generated quantities define their conversions, subclasses of them share the units.
+    if "_conversions_from_base" in quantity.__dict__:
+        _conversions_from_base.update(quantity._conversions_from_base)
+
+
+_CACHED_CONVERTS = {
+    "none": _uncached_convert,
+    "instance": _instance_cached_convert,
+    "shared": _shared_cached_convert,
+}
+
+
+def set_policy(policy: str, maxsize: int = DEFAULT_MAXSIZE):
+    """
+    Switch the cache policy of the unit properties, see 'POLICIES'.
+
+    :param policy: "none", "instance" or "shared".
+    :param maxsize: The bound of the shared cache entries, setting the "shared" policy clears the shared cache.
+    :raises ValueError: When the policy is unknown or 'maxsize' is not positive.
+    :raises RuntimeError: When the instrumentation is enabled.
+    """
+    global _policy, _shared_convert
+    if policy not in POLICIES:
+        raise ValueError(f'Invalid cache policy "{policy}", expected one of {POLICIES}')
+    if instrumentation.is_enabled():
+        raise RuntimeError("The cache policy can not be switched while the instrumentation is enabled")
+    if policy == "shared":
+        if maxsize < 1:
+            raise ValueError(f"Invalid shared cache size {maxsize}, expected a positive size")
+        if __register_quantity not in abstract_unit._quantity_class_hooks:
+            for quantity in abstract_unit._quantity_classes:
+                __register_quantity(quantity)
+            abstract_unit._quantity_class_hooks.append(__register_quantity)
+        # Typed, so the int and float base values of the same number do not share their converted values.
+        _shared_convert = lru_cache(maxsize=maxsize, typed=True)(_convert_from_base)
+    AbstractMeasure._cached_convert = _CACHED_CONVERTS[policy]
+    _policy = policy
+
+
+def get_policy() -> str:
+    return _policy
+
+
+def shared_cache_info() -> Optional[NamedTuple]:
+    """
+    Get the hits, misses, maxsize and current size of the shared cache, None when the policy is not "shared".
+    """
+    return _shared_convert.cache_info() if _policy == "shared" else None
+
+
+def clear_shared_cache():
+    """
+    Clear the shared cache, the per instance caches are released with their instances.
+    """
+    if _shared_convert is not None:
+        _shared_convert.cache_clear()
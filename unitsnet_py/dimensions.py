@@ -0,0 +1,99 @@
+"""
+Index of the dimensional arithmetic, the quantity of each SI base dimensions vector (L, M, T, I, Θ, N, J).
+"""
+import importlib
+from typing import Dict, Optional, Tuple
+
+# Dimensions vector -> (quantity, module), the quantities sharing the same dimensions resolve to the preferred one.
+quantities_by_dimensions: Dict[Tuple[int, ...], Tuple[str, str]] = {
+    (1, 0, -2, 0, 0, 0, 0): ('Acceleration', 'acceleration'),
+    (0, 0, 0, 0, 0, 1, 0): ('AmountOfSubstance', 'amount_of_substance'),
+    (2, 0, 0, 0, 0, 0, 0): ('Area', 'area'),
+    (-2, 1, 0, 0, 0, 0, 0): ('AreaDensity', 'area_density'),
+    (4, 0, 0, 0, 0, 0, 0): ('AreaMomentOfInertia', 'area_moment_of_inertia'),
+    (-2, 0, 2, 0, 0, 0, 0): ('BrakeSpecificFuelConsumption', 'brake_specific_fuel_consumption'),
+    (-2, -1, 4, 2, 0, 0, 0): ('Capacitance', 'capacitance'),
+    (0, 0, 0, 0, -1, 0, 0): ('CoefficientOfThermalExpansion', 'coefficient_of_thermal_expansion'),
+    (1, -1, 2, 0, 0, 0, 0): ('Compressibility', 'compressibility'),
+    (-3, 1, 0, 0, 0, 0, 0): ('Density', 'density'),
+    (0, 0, 1, 0, 0, 0, 0): ('Duration', 'duration'),
+    (-1, 1, -1, 0, 0, 0, 0): ('DynamicViscosity', 'dynamic_viscosity'),
+    (0, 0, 1, 1, 0, 0, 0): ('ElectricCharge', 'electric_charge'),
+    (-3, 0, 1, 1, 0, 0, 0): ('ElectricChargeDensity', 'electric_charge_density'),
+    (-2, -1, 3, 2, 0, 0, 0): ('ElectricConductance', 'electric_conductance'),
+    (-3, -1, 3, 2, 0, 0, 0): ('ElectricConductivity', 'electric_conductivity'),
+    (0, 0, 0, 1, 0, 0, 0): ('ElectricCurrent', 'electric_current'),
+    (-2, 0, 0, 1, 0, 0, 0): ('ElectricCurrentDensity', 'electric_current_density'),
+    (0, 0, -1, 1, 0, 0, 0): ('ElectricCurrentGradient', 'electric_current_gradient'),
+    (1, 1, -3, -1, 0, 0, 0): ('ElectricField', 'electric_field'),
+    (2, 1, -2, -2, 0, 0, 0): ('ElectricInductance', 'electric_inductance'),
+    (2, 1, -3, -1, 0, 0, 0): ('ElectricPotential', 'electric_potential'),
+    (2, 1, -4, -1, 0, 0, 0): ('ElectricPotentialChangeRate', 'electric_potential_change_rate'),
+    (2, 1, -3, -2, 0, 0, 0): ('ElectricResistance', 'electric_resistance'),
+    (3, 1, -3, -2, 0, 0, 0): ('ElectricResistivity', 'electric_resistivity'),
+    (-2, 0, 1, 1, 0, 0, 0): ('ElectricSurfaceChargeDensity', 'electric_surface_charge_density'),
+    (2, 1, -2, 0, 0, 0, 0): ('Energy', 'energy'),
+    (2, 1, -2, 0, -1, 0, 0): ('Entropy', 'entropy'),
+    (1, 1, -2, 0, 0, 0, 0): ('Force', 'force'),
+    (0, 1, -2, 0, 0, 0, 0): ('ForcePerLength', 'force_per_length'),
+    (0, 0, -1, 0, 0, 0, 0): ('Frequency', 'frequency'),
+    (0, 1, -3, 0, 0, 0, 0): ('HeatFlux', 'heat_flux'),
+    (0, 1, -3, 0, -1, 0, 0): ('HeatTransferCoefficient', 'heat_transfer_coefficient'),
+    (-2, 0, 0, 0, 0, 0, 1): ('Illuminance', 'illuminance'),
+    (1, 1, -1, 0, 0, 0, 0): ('Impulse', 'impulse'),
+    (1, 0, -3, 0, 0, 0, 0): ('Jerk', 'jerk'),
+    (2, 0, -1, 0, 0, 0, 0): ('KinematicViscosity', 'kinematic_viscosity'),
+    (1, 0, 0, 0, 0, 0, 0): ('Length', 'length'),
+    (-1, 1, 0, 0, 0, 0, 0): ('LinearDensity', 'linear_density'),
+    (1, 1, -3, 0, 0, 0, 0): ('LinearPowerDensity', 'linear_power_density'),
+    (0, 0, 0, 0, 0, 0, 1): ('LuminousIntensity', 'luminous_intensity'),
+    (0, 1, -2, -1, 0, 0, 0): ('MagneticField', 'magnetic_field'),
+    (2, 1, -2, -1, 0, 0, 0): ('MagneticFlux', 'magnetic_flux'),
+    (-1, 0, 0, 1, 0, 0, 0): ('Magnetization', 'magnetization'),
+    (0, 1, 0, 0, 0, 0, 0): ('Mass', 'mass'),
+    (0, 1, -1, 0, 0, 0, 0): ('MassFlow', 'mass_flow'),
+    (-2, 1, -1, 0, 0, 0, 0): ('MassFlux', 'mass_flux'),
+    (2, 1, 0, 0, 0, 0, 0): ('MassMomentOfInertia', 'mass_moment_of_inertia'),
+    (2, 1, -2, 0, 0, -1, 0): ('MolarEnergy', 'molar_energy'),
+    (2, 1, -2, 0, -1, -1, 0): ('MolarEntropy', 'molar_entropy'),
+    (0, 0, -1, 0, 0, 1, 0): ('MolarFlow', 'molar_flow'),
+    (0, 1, 0, 0, 0, -1, 0): ('MolarMass', 'molar_mass'),
+    (-3, 0, 0, 0, 0, 1, 0): ('Molarity', 'molarity'),
+    (1, 1, -2, -2, 0, 0, 0): ('Permeability', 'permeability'),
+    (-3, -1, 4, 2, 0, 0, 0): ('Permittivity', 'permittivity'),
+    (2, 1, -3, 0, 0, 0, 0): ('Power', 'power'),
+    (-1, 1, -3, 0, 0, 0, 0): ('PowerDensity', 'power_density'),
+    (-1, 1, -2, 0, 0, 0, 0): ('Pressure', 'pressure'),
+    (-2, 0, 0, 0, 0, 0, 0): ('ReciprocalArea', 'reciprocal_area'),
+    (-1, 0, 0, 0, 0, 0, 0): ('ReciprocalLength', 'reciprocal_length'),
+    (0, 0, -2, 0, 0, 0, 0): ('RotationalAcceleration', 'rotational_acceleration'),
+    (2, 0, -2, 0, 0, 0, 0): ('SpecificEnergy', 'specific_energy'),
+    (2, 0, -2, 0, -1, 0, 0): ('SpecificEntropy', 'specific_entropy'),
+    (3, -1, 0, 0, 0, 0, 0): ('SpecificVolume', 'specific_volume'),
+    (-2, 1, -2, 0, 0, 0, 0): ('SpecificWeight', 'specific_weight'),
+    (1, 0, -1, 0, 0, 0, 0): ('Speed', 'speed'),
+    (0, 0, -1, 0, 1, 0, 0): ('TemperatureChangeRate', 'temperature_change_rate'),
+    (0, 0, 0, 0, 1, 0, 0): ('TemperatureDelta', 'temperature_delta'),
+    (-1, 0, 0, 0, 1, 0, 0): ('TemperatureGradient', 'temperature_gradient'),
+    (1, 1, -3, 0, -1, 0, 0): ('ThermalConductivity', 'thermal_conductivity'),
+    (3, 0, 0, 0, 0, 0, 0): ('Volume', 'volume'),
+    (3, 0, -1, 0, 0, 0, 0): ('VolumeFlow', 'volume_flow'),
+    (-1, 1, -2, 0, -1, 0, 0): ('VolumetricHeatCapacity', 'volumetric_heat_capacity'),
+    (6, 0, 0, 0, 0, 0, 0): ('WarpingMomentOfInertia', 'warping_moment_of_inertia'),
+}
+
+
+def get_quantity(dimensions: Tuple[int, ...]) -> Optional[type]:
+    """
+    Get the quantity of a dimensions vector, the quantity module is imported on first use.
+
+    :param dimensions: The SI base dimensions exponents (L, M, T, I, Θ, N, J).
+    :type dimensions: Tuple[int, ...]
+    :return: The quantity class, or None when no quantity has these dimensions.
+    :rtype: type
+    """
+    entry = quantities_by_dimensions.get(tuple(dimensions))
+    if entry is None:
+        return None
+    quantity_name, module_name = entry
+    return getattr(importlib.import_module(f".units.{module_name}", __package__), quantity_name)
\ No newline at end of file
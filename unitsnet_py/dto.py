@@ -0,0 +1,131 @@
+"""
+JSON data transfer objects of the measurements, in the Units.NET/unitsnet-js DTO shape:
+
+    {"value": 1.5, "unit": "Kilometer"}
+
+The unit is the units enum name, as in Units.NET, enum values (e.g. "kilometer") are also accepted when loading.
+The quantity is not part of the DTO, it is known by the reading side.
+"""
+import json
+import math
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Type, Union
+
+if TYPE_CHECKING:
+    from .abstract_unit import AbstractMeasure
+
+# Units enum value, enum name and member -> unit of each quantity, built on first use.
+_unit_indexes: Dict[type, Dict[object, Enum]] = {}
+
+
+def __get_unit_index(quantity: type) -> Dict[object, Enum]:
+    index = _unit_indexes.get(quantity)
+    if index is None:
+        index = {}
+        for unit in quantity._units:
+            index[unit.name] = unit
+            index[unit.value] = unit
+            index[unit] = unit
+        _unit_indexes[quantity] = index
+    return index
+
+
+def __from_value(quantity: type, value: float, unit: Enum) -> "AbstractMeasure":
+    if unit is quantity._base_unit:
+        return quantity._from_base(float(value))
+    return quantity._from_base(quantity._conversions_to_base[unit](value))
+
+
+def to_dto(measure: "AbstractMeasure", hold_in_unit: Optional[Enum] = None) -> Dict[str, object]:
+    """
+    Get the DTO of a measurement.
+
+    :param measure: The measurement.
+    :param hold_in_unit: The unit of the DTO value, by default the quantity base unit.
+    :return: The {"value", "unit"} DTO.
+    """
+    if hold_in_unit is None or hold_in_unit is measure._base_unit:
+        return {"value": measure._value, "unit": measure._base_unit.name}
+    return {"value": measure.convert(hold_in_unit), "unit": hold_in_unit.name}
+
+
+def from_dto(dto: Dict[str, object], quantity: Type["AbstractMeasure"]) -> "AbstractMeasure":
+    """
+    Create a measurement from its DTO.
+
+    :param dto: The {"value", "unit"} DTO.
+    :param quantity: The quantity of the DTO.
+    :return: A new instance of the quantity.
+    :raises ValueError: When the DTO is not valid or its unit is unknown.
+    """
+    index = __get_unit_index(quantity)
+    try:
+        value = dto["value"]
+        unit = index[dto["unit"]]
+        # In the try, a value that is not a number (e.g. None or "1") raises TypeError here.
+        if math.isnan(value):
+            raise ValueError("Invalid unit: value is NaN")
+    except (KeyError, TypeError) as error:
+        raise ValueError(f"Invalid {quantity.__name__} DTO {dto!r}: {error!r}") from None
+    return __from_value(quantity, value, unit)
+
+
+def dumps_many(measures: Iterable["AbstractMeasure"], hold_in_unit: Optional[Enum] = None) -> str:
+    """
+    Serialize measurements to a JSON array of DTOs.
+
+    :param measures: The measurements.
+    :param hold_in_unit: The unit of the DTOs values, by default the base unit of each measurement.
+    :return: The JSON text.
+    """
+    if hold_in_unit is None:
+        values = []
+        units = []
+        for measure in measures:
+            values.append(measure._value)
+            units.append(measure._base_unit)
+    else:
+        values = [measure.convert(hold_in_unit) for measure in measures]
+        units = [hold_in_unit] * len(values)
+    if not all(map(math.isfinite, values)):
+        return json.dumps([{"value": value, "unit": unit.name} for value, unit in zip(values, units)])
+    # Same output as json.dumps, which formats the ints with int.__repr__ and the finite floats with float.__repr__
+    # (not repr, that formats numpy.float64 values as "np.float64(1.5)"), without allocating a dict per measurement.
+    suffixes = {unit: f', "unit": {json.dumps(unit.name)}}}' for unit in set(units)}
+    int_repr = int.__repr__
+    float_repr = float.__repr__
+    numbers = [int_repr(value) if type(value) is int else float_repr(float(value)) for value in values]
+    return "[" + ", ".join(['{"value": ' + number + suffixes[unit] for number, unit in zip(numbers, units)]) + "]"
+
+
+def loads_many(text: Union[str, bytes], quantity: Type["AbstractMeasure"]) -> List["AbstractMeasure"]:
+    """
+    Deserialize a JSON array of DTOs of the same quantity.
+
+    The units are resolved by a prebuilt lookup table, and the conversion function once per distinct unit.
+
+    :param text: The JSON text.
+    :param quantity: The quantity of the DTOs.
+    :return: The measurements.
+    :raises ValueError: When the JSON is not an array of valid DTOs.
+    """
+    dtos = json.loads(text)
+    if not isinstance(dtos, list):
+        raise ValueError(f"Invalid {quantity.__name__} DTOs: expected a JSON array")
+    index = __get_unit_index(quantity)
+    base_unit = quantity._base_unit
+    conversions_to_base = quantity._conversions_to_base
+    from_base = quantity._from_base
+    isnan = math.isnan
+    measures = []
+    append = measures.append
+    try:
+        for dto in dtos:
+            value = dto["value"]
+            unit = index[dto["unit"]]
+            if isnan(value):
+                raise ValueError("Invalid unit: value is NaN")
+            append(from_base(float(value) if unit is base_unit else conversions_to_base[unit](value)))
+    except (KeyError, TypeError) as error:
+        raise ValueError(f"Invalid {quantity.__name__} DTO {dto!r}: {error!r}") from None
+    return measures
@@ -0,0 +1,212 @@
+"""
+Opt-in instrumentation of the conversions, to find the hot quantities and units pairs.
+
+While enabled, the quantities methods are swapped with counting and timing versions:
+construction, 'convert', the unit properties (cache hits and misses), 'convert_value' and 'convert_many'.
+Disabling restores the original methods, so there is no overhead at all when the instrumentation is off.
+Quantities imported while enabled are instrumented on creation.
+
+    instrumentation.enable()
+    ...
+    print(unitsnet_py.stats().hottest(5))
+
+Note! the values converted directly from the conversion tables (arrays, aggregations, serialization)
+are not counted.
+"""
+import threading
+from enum import Enum
+from functools import wraps
+from time import perf_counter_ns
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from . import abstract_unit
+from .abstract_unit import AbstractMeasure
+
+# Called with (event, quantity, from unit, to unit, values count, elapsed ns) of every instrumented call.
+Callback = Callable[[str, type, Enum, Enum, int, int], None]
+
+# The recorded events, the cache hits are the only events that are not conversions.
+EVENTS = ("construct", "convert", "convert_many", "cache_hit", "cache_miss")
+
+# (event, quantity, from unit, to unit) -> [values count, elapsed ns]
+_counters: Dict[Tuple[str, type, Enum, Enum], List[int]] = {}
+_lock = threading.Lock()
+_callback: Optional[Callback] = None
+_enabled = False
+# (owner class, attribute name) -> the original attribute, restored by 'disable'.
+_originals: Dict[Tuple[type, str], object] = {}
+
+
+class Stats(NamedTuple):
+    """
+    A snapshot of the instrumentation counters, keyed by the quantity and units names.
+    """
+
+    # quantity -> instances created from a unit (arithmetic results are not constructions)
+    constructions: Dict[str, int]
+    # (quantity, from unit, to unit) -> converted values, including the constructions and the cache misses
+    conversions: Dict[Tuple[str, str, str], int]
+    # (quantity, from unit, to unit) -> cumulative time of the conversions, in nanoseconds
+    conversions_time_ns: Dict[Tuple[str, str, str], int]
+    # (quantity, unit) -> unit properties read from the instance cache / converted on the first access
+    cache_hits: Dict[Tuple[str, str], int]
+    cache_misses: Dict[Tuple[str, str], int]
+    # Cumulative time of all the instrumented calls, in nanoseconds
+    time_ns: int
+
+    def hottest(self, count: int = 10) -> List[Tuple[Tuple[str, str, str], int]]:
+        """
+        The most converted (quantity, from unit, to unit) pairs, the candidates for precomputation.
+        """
+        return sorted(self.conversions.items(), key=lambda item: item[1], reverse=True)[:count]
+
+
+def _record(event: str, quantity: type, from_unit: Enum, to_unit: Enum, count: int, elapsed: int):
+    key = (event, quantity, from_unit, to_unit)
+    with _lock:
+        counter = _counters.get(key)
+        if counter is None:
+            counter = _counters[key] = [0, 0]
+        counter[0] += count
+        counter[1] += elapsed
+    if _callback is not None:
+        _callback(event, quantity, from_unit, to_unit, count, elapsed)
+
+
+def __swap(owner: type, name: str, replacement: object):
+    _originals[owner, name] = owner.__dict__[name]
+    setattr(owner, name, replacement)
+
+
+def __instrument_quantity(quantity: type):
+    # Only the generated quantities define these, subclasses of them inherit the instrumented versions.
+    if "_units" not in quantity.__dict__ or (quantity, "__init__") in _originals:
+        return
+    init = quantity.__dict__["__init__"]
+    convert = quantity.__dict__["convert"]
+    base_unit = quantity._base_unit
+
+    @wraps(init)
+    def __init__(self, value: float, from_unit: Enum = base_unit):
+        start = perf_counter_ns()
+        init(self, value, from_unit)
+        _record("construct", quantity, from_unit, base_unit, 1, perf_counter_ns() - start)
+
+    @wraps(convert)
+    def instrumented_convert(self, unit: Enum) -> float:
+        start = perf_counter_ns()
+        value = convert(self, unit)
+        _record("convert", quantity, base_unit, unit, 1, perf_counter_ns() - start)
+        return value
+
+    __swap(quantity, "__init__", __init__)
+    __swap(quantity, "convert", instrumented_convert)
+
+
+def __instrument_abstract_measure():
+    cached_convert = AbstractMeasure.__dict__["_cached_convert"]
+    convert_value = AbstractMeasure.__dict__["_convert_value"].__func__
+    convert_many = AbstractMeasure.__dict__["_convert_many"].__func__
+
+    @wraps(cached_convert)
+    def _cached_convert(self, unit: Enum) -> float:
+        try:
+            event = "cache_hit" if unit in self._cache else "cache_miss"
+        except AttributeError:
+            event = "cache_miss"
+        start = perf_counter_ns()
+        value = cached_convert(self, unit)
+        _record(event, type(self), self._base_unit, unit, 1, perf_counter_ns() - start)
+        return value
+
+    @wraps(convert_value)
+    def _convert_value(cls, value: float, from_unit: Enum, to_unit: Enum) -> float:
+        start = perf_counter_ns()
+        result = convert_value(cls, value, from_unit, to_unit)
+        _record("convert", cls, from_unit, to_unit, 1, perf_counter_ns() - start)
+        return result
+
+    @wraps(convert_many)
+    def _convert_many(cls, values, from_unit: Enum, to_unit: Enum) -> List[float]:
+        start = perf_counter_ns()
+        result = convert_many(cls, values, from_unit, to_unit)
+        _record("convert_many", cls, from_unit, to_unit, len(result), perf_counter_ns() - start)
+        return result
+
+    __swap(AbstractMeasure, "_cached_convert", _cached_convert)
+    __swap(AbstractMeasure, "_convert_value", classmethod(_convert_value))
+    __swap(AbstractMeasure, "_convert_many", classmethod(_convert_many))
+
+
+def enable(callback: Optional[Callback] = None):
+    """
+    Enable the instrumentation, the counters keep accumulating until 'reset'.
+
+    :param callback: Optional function called with (event, quantity, from unit, to unit, values count, elapsed ns)
+    of every instrumented call, see 'EVENTS'.
+    """
+    global _enabled, _callback
+    _callback = callback
+    if _enabled:
+        return
+    _enabled = True
+    __instrument_abstract_measure()
+    for quantity in abstract_unit._quantity_classes:
+        __instrument_quantity(quantity)
+    abstract_unit._quantity_class_hooks.append(__instrument_quantity)
+
+
+def disable():
+    """
+    Disable the instrumentation and restore the original methods, the counters are kept.
+    """
+    global _enabled, _callback
+    if not _enabled:
+        return
+    _enabled = False
+    _callback = None
+    abstract_unit._quantity_class_hooks.remove(__instrument_quantity)
+    for (owner, name), original in _originals.items():
+        setattr(owner, name, original)
+    _originals.clear()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    """
+    Clear the counters.
+    """
+    with _lock:
+        _counters.clear()
+
+
+def stats() -> Stats:
+    """
+    Get a snapshot of the instrumentation counters.
+    """
+    with _lock:
+        counters = [(key, tuple(counter)) for key, counter in _counters.items()]
+
+    constructions: Dict[str, int] = {}
+    conversions: Dict[Tuple[str, str, str], int] = {}
+    conversions_time_ns: Dict[Tuple[str, str, str], int] = {}
+    cache_hits: Dict[Tuple[str, str], int] = {}
+    cache_misses: Dict[Tuple[str, str], int] = {}
+    time_ns = 0
+    for (event, quantity, from_unit, to_unit), (count, elapsed) in counters:
+        time_ns += elapsed
+        name = quantity.__name__
+        if event == "construct":
+            constructions[name] = constructions.get(name, 0) + count
+        elif event == "cache_hit":
+            cache_hits[name, to_unit.name] = cache_hits.get((name, to_unit.name), 0) + count
+            continue
+        elif event == "cache_miss":
+            cache_misses[name, to_unit.name] = cache_misses.get((name, to_unit.name), 0) + count
+        pair = (name, from_unit.name, to_unit.name)
+        conversions[pair] = conversions.get(pair, 0) + count
+        conversions_time_ns[pair] = conversions_time_ns.get(pair, 0) + elapsed
+    return Stats(constructions, conversions, conversions_time_ns, cache_hits, cache_misses, time_ns)
@@ -0,0 +1,451 @@
+"""
+pandas integration: a quantity extension dtype, backed by a float64 buffer of the values in the dtype unit.
+
+Importing the module registers the "Quantity[<quantity>, <unit>]" dtype and the Series '.units' accessor.
+
+    import unitsnet_py.pandas
+    from unitsnet_py import PressureUnits
+
+    readings = pd.Series([1.5, 2.0], dtype="Quantity[Pressure, Bar]")
+    readings.units.convert(PressureUnits.PoundForcePerSquareInch)
+
+Missing values are NaN (quantities do not hold NaN, so it is never a measurement).
+Conversions, reductions and group by aggregations run on the whole buffer with the generated conversion formulas,
+the quantity instances are created only when items are read one by one.
+"""
+from __future__ import annotations
+
+import re
+from enum import Enum
+from typing import Any, Optional, Sequence, Type, Union
+
+try:
+    import numpy as np
+    import pandas as pd
+    from pandas.api.extensions import (
+        ExtensionArray,
+        ExtensionDtype,
+        register_extension_dtype,
+        register_series_accessor,
+        take,
+    )
+except ImportError as error:  # pragma: no cover - depends on the environment
+    raise ImportError("The pandas integration requires pandas, install it using 'pip install pandas'") from error
+
+from . import aggregate
+from .abstract_array import AbstractQuantityArray, _get_array_class
+from .abstract_unit import AbstractMeasure, _get_quantity
+
+_dtype_string_pattern = re.compile(r"^Quantity\[\s*(\w+)\s*(?:,\s*(\w+)\s*)?\]$")
+
+# Group by aggregations whose result is in the unit of the values, and the ones resulting in a difference.
+_GROUPBY_SAME_UNIT = {"sum", "cumsum", "mean", "median", "min", "max", "first", "last", "cummin", "cummax"}
+_GROUPBY_SPREAD = {"std", "sem"}
+
+
+@register_extension_dtype
+class QuantityDtype(ExtensionDtype):
+    """
+    The dtype of the values of a quantity, in one of its units.
+
+    Args:
+        quantity (str | type): The quantity class or name, e.g. Pressure or "Pressure".
+        unit (Enum | str): The unit of the values (a units enum member or name), by default the quantity base unit.
+    """
+
+    _metadata = ("quantity", "unit")
+
+    na_value = np.nan
+
+    def __init__(self, quantity: Union[str, Type[AbstractMeasure]], unit: Union[Enum, str, None] = None):
+        quantity = _get_quantity(quantity)
+        if unit is None:
+            unit = quantity._base_unit
+        elif isinstance(unit, str):
+            unit = quantity._resolve_unit(unit)
+        elif not isinstance(unit, quantity._units):
+            raise ValueError(f"Invalid unit {unit!r} for {quantity.__name__}")
+        self.quantity = quantity
+        self.unit = unit
+
+    @property
+    def type(self) -> type:
+        return self.quantity
+
+    @property
+    def name(self) -> str:
+        return f"Quantity[{self.quantity.__name__}, {self.unit.name}]"
+
+    def __repr__(self) -> str:
+        return self.name
+
+    @classmethod
+    def construct_array_type(cls) -> Type[QuantityArray]:
+        return QuantityArray
+
+    @classmethod
+    def construct_from_string(cls, string: str) -> QuantityDtype:
+        if not isinstance(string, str):
+            raise TypeError(f"'construct_from_string' expects a string, got {type(string)}")
+        match = _dtype_string_pattern.match(string)
+        if match is None:
+            raise TypeError(f"Cannot construct a 'QuantityDtype' from '{string}'")
+        try:
+            return cls(match.group(1), match.group(2))
+        except ValueError as error:
+            raise TypeError(f"Cannot construct a 'QuantityDtype' from '{string}': {error}") from None
+
+    def __from_arrow__(self, array) -> QuantityArray:
+        """
+        Create the array of an Arrow (chunked) array of quantity values, see 'unitsnet_py.arrow'.
+        """
+        chunks = array.chunks if hasattr(array, "chunks") else [array]
+        values = []
+        for chunk in chunks:
+            storage = getattr(chunk, "storage", chunk)
+            # The Arrow nulls become NaN.
+            chunk_values = storage.to_numpy(zero_copy_only=False).astype(np.float64, copy=False)
+            chunk_unit = getattr(chunk.type, "unit", self.unit)
+            if chunk_unit is not self.unit:
+                chunk_values = _get_array_class(self.quantity).convert_values(chunk_values, chunk_unit, self.unit)
+            values.append(chunk_values)
+        return QuantityArray(np.concatenate(values) if values else np.empty(0), self)
+
+    def _get_common_dtype(self, dtypes) -> Optional[QuantityDtype]:
+        # The values of the same quantity in different units are concatenated in the unit of the first one.
+        if all(isinstance(dtype, QuantityDtype) and dtype.quantity is self.quantity for dtype in dtypes):
+            return self
+        return None
+
+
+class QuantityArray(ExtensionArray):
+    """
+    A pandas extension array of the values of a quantity, in the unit of its QuantityDtype.
+
+    Args:
+        values (array-like): The float values, in the dtype unit, NaN for the missing values.
+        dtype (QuantityDtype): The quantity and the unit of the values.
+        copy (bool): Copy the values, by default they are referenced when already a float64 ndarray.
+    """
+
+    def __init__(self, values, dtype: QuantityDtype, copy: bool = False):
+        if not isinstance(dtype, QuantityDtype):
+            raise TypeError(f"Expected a QuantityDtype, got {dtype!r}")
+        values = np.array(values, dtype=np.float64, copy=True) if copy else np.asarray(values, dtype=np.float64)
+        if values.ndim != 1:
+            raise ValueError("QuantityArray values must be 1-dimensional")
+        self._data = values
+        self._dtype = dtype
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype: Optional[QuantityDtype] = None, copy: bool = False) -> QuantityArray:
+        if isinstance(dtype, str):
+            dtype = QuantityDtype.construct_from_string(dtype)
+        if isinstance(scalars, QuantityArray):
+            return scalars.astype(dtype or scalars.dtype, copy=copy)
+        if isinstance(scalars, AbstractQuantityArray):
+            dtype = dtype or QuantityDtype(scalars._quantity)
+            return cls(scalars.convert(dtype.unit), dtype)
+        values = scalars if isinstance(scalars, np.ndarray) else np.asarray(scalars)
+        if values.dtype.kind in "fiu":
+            if dtype is None:
+                raise TypeError("The quantity of raw values is unknown, pass a QuantityDtype")
+            return cls(values, dtype, copy=copy)
+        return cls._from_scalars_sequence(values, dtype)
+
+    @classmethod
+    def _from_scalars_sequence(cls, scalars: Sequence, dtype: Optional[QuantityDtype]) -> QuantityArray:
+        scalars = list(scalars)
+        if dtype is None:
+            quantity = next((type(scalar) for scalar in scalars if isinstance(scalar, AbstractMeasure)), None)
+            if quantity is None:
+                raise TypeError("The quantity of raw values is unknown, pass a QuantityDtype")
+            dtype = QuantityDtype(quantity)
+        quantity, unit = dtype.quantity, dtype.unit
+        values = np.empty(len(scalars), dtype=np.float64)
+        for index, scalar in enumerate(scalars):
+            if isinstance(scalar, AbstractMeasure):
+                if type(scalar) is not quantity:
+                    raise TypeError(f"Can not hold {type(scalar).__name__} in a {dtype.name} array")
+                values[index] = scalar._value if unit is quantity._base_unit else scalar.convert(unit)
+            elif scalar is None or scalar is pd.NA or scalar is pd.NaT:
+                values[index] = np.nan
+            else:
+                # Raw numbers are values in the dtype unit.
+                values[index] = scalar
+        return cls(values, dtype)
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, *, dtype: QuantityDtype, copy: bool = False) -> QuantityArray:
+        # Numbers are values in the dtype unit, other strings are parsed with their unit abbreviation (e.g. "1.5 bar").
+        scalars = []
+        for string in strings:
+            try:
+                scalars.append(float(string))
+            except (TypeError, ValueError):
+                scalars.append(dtype.quantity._parse(string))
+        return cls._from_scalars_sequence(scalars, dtype)
+
+    @classmethod
+    def _from_factorized(cls, values, original: QuantityArray) -> QuantityArray:
+        return cls(values, original.dtype)
+
+    @property
+    def dtype(self) -> QuantityDtype:
+        return self._dtype
+
+    @property
+    def quantity(self) -> Type[AbstractMeasure]:
+        return self._dtype.quantity
+
+    @property
+    def unit(self) -> Enum:
+        return self._dtype.unit
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, item):
+        if isinstance(item, tuple) and len(item) == 1:
+            item = item[0]
+        if pd.api.types.is_integer(item):
+            value = self._data[item]
+            if np.isnan(value):
+                return self._dtype.na_value
+            return self.quantity(float(value), self.unit)
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return type(self)(self._data[item], self._dtype)
+
+    def __setitem__(self, key, value):
+        key = pd.api.indexers.check_array_indexer(self, key)
+        if pd.api.types.is_list_like(value) and not isinstance(value, AbstractMeasure):
+            value = type(self)._from_sequence(value, dtype=self._dtype)._data
+        else:
+            value = type(self)._from_scalars_sequence([value], self._dtype)._data[0]
+        self._data[key] = value
+
+    def __iter__(self):
+        quantity, unit = self.quantity, self.unit
+        for value in self._data.tolist():
+            yield self._dtype.na_value if value != value else quantity(value, unit)
+
+    def __eq__(self, other):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if isinstance(other, QuantityArray) and other.quantity is self.quantity:
+            if other.unit is self.unit:
+                return self._data == other._data
+            # Compared in the base unit, same as the quantities.
+            return self.convert_values(self.quantity._base_unit) == other.convert_values(self.quantity._base_unit)
+        if isinstance(other, self.quantity):
+            return self.convert_values(self.quantity._base_unit) == other._value
+        return np.zeros(len(self), dtype=bool)
+
+    def __ne__(self, other):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        return ~self.__eq__(other)
+
+    def isna(self) -> np.ndarray:
+        return np.isnan(self._data)
+
+    def take(self, indices, allow_fill: bool = False, fill_value: Any = None) -> QuantityArray:
+        if allow_fill and fill_value is not None and not pd.isna(fill_value):
+            fill_value = type(self)._from_scalars_sequence([fill_value], self._dtype)._data[0]
+        else:
+            fill_value = np.nan
+        return type(self)(take(self._data, indices, allow_fill=allow_fill, fill_value=fill_value), self._dtype)
+
+    def copy(self) -> QuantityArray:
+        return type(self)(self._data.copy(), self._dtype)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence[QuantityArray]) -> QuantityArray:
+        dtype = to_concat[0].dtype
+        return cls(np.concatenate([array.astype(dtype, copy=False)._data for array in to_concat]), dtype)
+
+    def _values_for_factorize(self):
+        return self._data, np.nan
+
+    def _values_for_argsort(self) -> np.ndarray:
+        return self._data
+
+    def __arrow_array__(self, type=None):
+        """
+        Get the values as an Arrow array of the quantity extension type, see 'unitsnet_py.arrow'.
+        """
+        import pyarrow as pa
+
+        from .arrow import QuantityType
+
+        storage = pa.array(self._data, mask=np.isnan(self._data), type=pa.float64())
+        return pa.ExtensionArray.from_storage(QuantityType(self.quantity, self.unit), storage)
+
+    def _formatter(self, boxed: bool = False):
+        unit = self.unit
+        return lambda value: value.to_string(unit) if isinstance(value, AbstractMeasure) else str(value)
+
+    def convert(self, unit: Enum) -> QuantityArray:
+        """
+        Convert the values to another unit of the quantity, as a new array.
+        """
+        if unit is self.unit:
+            return self.copy()
+        return type(self)(self.convert_values(unit), QuantityDtype(self.quantity, unit))
+
+    def convert_values(self, unit: Enum) -> np.ndarray:
+        """
+        Get the values in another unit of the quantity, as a new float64 ndarray.
+        """
+        if unit is self.unit:
+            return self._data.copy()
+        return _get_array_class(self.quantity).convert_values(self._data, self.unit, unit)
+
+    def to_quantity_array(self) -> AbstractQuantityArray:
+        """
+        Get the values as the quantity array (e.g. PressureArray).
+
+        :raises ValueError: When there are missing values.
+        """
+        if self.isna().any():
+            raise ValueError("Can not create a quantity array with missing values")
+        array_class = _get_array_class(self.quantity)
+        return array_class._from_base_values(self.convert_values(self.quantity._base_unit))
+
+    def astype(self, dtype, copy: bool = True):
+        if isinstance(dtype, str):
+            try:
+                dtype = QuantityDtype.construct_from_string(dtype)
+            except TypeError:
+                pass
+        if isinstance(dtype, QuantityDtype):
+            if dtype.quantity is not self.quantity:
+                raise TypeError(f"Can not convert {self.dtype.name} to {dtype.name}")
+            if dtype.unit is self.unit:
+                return self.copy() if copy else self
+            return type(self)(self.convert_values(dtype.unit), dtype)
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if isinstance(dtype, np.dtype) and dtype.kind == "f":
+            # The raw values, in the dtype unit.
+            return self._data.astype(dtype, copy=copy)
+        return super().astype(dtype, copy=copy)
+
+    def to_numpy(self, dtype=None, copy: bool = False, na_value=pd.api.extensions.no_default) -> np.ndarray:
+        if dtype is not None and np.dtype(dtype).kind == "f":
+            values = self._data.astype(dtype, copy=copy)
+            if na_value is not pd.api.extensions.no_default and not pd.isna(na_value):
+                values = values.copy() if not copy else values
+                values[np.isnan(values)] = na_value
+            return values
+        return super().to_numpy(dtype=dtype, copy=copy, na_value=na_value)
+
+    def _reduce(self, name: str, *, skipna: bool = True, keepdims: bool = False, **kwargs):
+        functions = {
+            "sum": aggregate.sum,
+            "mean": aggregate.mean,
+            "min": aggregate.min,
+            "max": aggregate.max,
+            "median": lambda values: aggregate.percentile(values, 50),
+            "std": lambda values: aggregate.stdev(values, ddof=kwargs.get("ddof", 1)),
+            "var": lambda values: aggregate.variance(values, ddof=kwargs.get("ddof", 1)),
+        }
+        function = functions.get(name)
+        if function is None:
+            return super()._reduce(name, skipna=skipna, keepdims=keepdims, **kwargs)
+        values = self._data
+        missing = np.isnan(values)
+        if missing.any():
+            values = values[~missing] if skipna else values[:0]
+        if len(values) == 0:
+            if name == "sum" and skipna and self.quantity._delta_quantity is None:
+                result = self.quantity._from_base(0.0)
+            else:
+                result = self._dtype.na_value
+        else:
+            array_class = _get_array_class(self.quantity)
+            base_values = array_class.convert_values(values, self.unit, self.quantity._base_unit)
+            try:
+                result = function(array_class._from_base_values(base_values))
+            except ValueError:
+                # Not enough values for the degrees of freedom.
+                result = self._dtype.na_value
+        if not keepdims:
+            return result
+        if isinstance(result, AbstractMeasure):
+            unit = self.unit if type(result) is self.quantity else type(result)._base_unit
+            return type(self)._from_scalars_sequence([result], QuantityDtype(type(result), unit))
+        return np.array([result], dtype=np.float64)
+
+    def _groupby_op(self, *, how: str, has_dropped_na: bool, min_count: int, ngroups: int, ids, **kwargs):
+        quantity = self.quantity
+        if how in ("prod", "cumprod") or (how in ("sum", "cumsum") and quantity._delta_quantity is not None):
+            raise TypeError(f"dtype '{self.dtype}' does not support operation '{how}'")
+        dtype = self._dtype
+        values = self._data
+        factor = 1.0
+        if how in _GROUPBY_SPREAD or how == "var":
+            # Same results as the reductions ('aggregate.stdev' and 'aggregate.variance'), computed in the base unit:
+            # the spread of points is a difference, and the variance is in the quantity of the squared dimensions.
+            values = self.convert_values(quantity._base_unit)
+            spread_quantity = quantity if quantity._delta_quantity is None else quantity._get_delta_quantity()
+            dtype = QuantityDtype(spread_quantity, spread_quantity._base_unit)
+            if how == "var":
+                result = spread_quantity._get_dimension_result(spread_quantity, "*")
+                if result is None or result[0] is float:
+                    dtype = None
+                else:
+                    dtype = QuantityDtype(result[0], result[0]._base_unit)
+                    factor = result[1]
+        # The nullable float arrays implement the group by aggregations of float values, NaN is their missing value.
+        result = pd.array(values, dtype="Float64")._groupby_op(
+            how=how, has_dropped_na=has_dropped_na, min_count=min_count, ngroups=ngroups, ids=ids, **kwargs
+        )
+        if how not in _GROUPBY_SAME_UNIT and how not in _GROUPBY_SPREAD and how != "var":
+            return result
+        values = result.to_numpy(dtype=np.float64, na_value=np.nan)
+        if dtype is None:
+            return values
+        return type(self)(values * factor if factor != 1.0 else values, dtype)
+
+
+@register_series_accessor("units")
+class QuantityAccessor:
+    """
+    The '.units' accessor of the Series of a QuantityDtype.
+    """
+
+    def __init__(self, series: pd.Series):
+        if not isinstance(series.dtype, QuantityDtype):
+            raise AttributeError("Can only use the .units accessor with a QuantityDtype Series")
+        self._series = series
+
+    @property
+    def quantity(self) -> Type[AbstractMeasure]:
+        return self._series.dtype.quantity
+
+    @property
+    def unit(self) -> Enum:
+        return self._series.dtype.unit
+
+    def convert(self, unit: Enum) -> pd.Series:
+        """
+        Convert the Series to another unit of its quantity.
+        """
+        return pd.Series(self._series.array.convert(unit), index=self._series.index, name=self._series.name, copy=False)
+
+    def to_numpy(self, unit: Optional[Enum] = None) -> np.ndarray:
+        """
+        Get the values as a float64 ndarray in a unit, by default the Series unit (NaN for the missing values).
+        """
+        array = self._series.array
+        return array.convert_values(array.unit if unit is None else unit)
+
+    def to_quantity_array(self) -> AbstractQuantityArray:
+        """
+        Get the values as the quantity array (e.g. PressureArray), see 'QuantityArray.to_quantity_array'.
+        """
+        return self._series.array.to_quantity_array()
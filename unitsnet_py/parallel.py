@@ -0,0 +1,95 @@
+"""
+Convert very large datasets in parallel, by chunks of float values converted in worker processes.
+
+The chunks are shipped to the workers as compact 'array("d")' buffers (8 bytes per value, pickled as raw bytes),
+the workers apply the conversion of the quantity and send the converted buffers back.
+The results are yielded in the order of the chunks, and at most 'workers * prefetch' chunks are in flight,
+so the memory use stays bounded whatever the size of the (lazy) input.
+
+    chunks = (array("d", batch.values) for batch in read_batches())
+    for converted in convert_batches(chunks, Pressure, PressureUnits.Bar, PressureUnits.Pascal, workers=8):
+        converted.tofile(output)
+"""
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from enum import Enum
+from typing import Deque, Iterable, Iterator, Optional, Type
+
+from .abstract_unit import AbstractMeasure
+
+# The chunks submitted ahead per worker, keeping the workers busy while the results are consumed.
+DEFAULT_PREFETCH = 2
+
+
+def _convert_chunk(quantity: Type[AbstractMeasure], from_unit: Enum, to_unit: Enum, values: array) -> array:
+    # Runs in the worker processes, the conversion factors are resolved once per worker and units pair.
+    return array("d", quantity._convert_many(values, from_unit, to_unit))
+
+
+def convert_batches(
+    chunks: Iterable[Iterable[float]],
+    quantity: Type[AbstractMeasure],
+    from_unit: Enum,
+    to_unit: Enum,
+    workers: Optional[int] = None,
+    prefetch: int = DEFAULT_PREFETCH,
+    executor: Optional[Executor] = None,
+) -> Iterator[array]:
+    """
+    Convert chunks of values from one unit of a quantity to another, in worker processes.
+
+    Chunks that are not 'array("d")' are copied to one before being shipped,
+    chunks of a few hundred thousand values or more amortize the inter-process transfer.
+
+    :param chunks: The chunks of values in 'from_unit', consumed lazily.
+    :param quantity: The quantity of the values, e.g. Pressure.
+    :param from_unit: The unit of the values.
+    :param to_unit: The unit to convert to.
+    :param workers: The worker processes, by default the CPU count.
+    :param prefetch: The chunks in flight per worker.
+    :param executor: An executor to submit the chunks to, e.g. a process pool shared by several conversions,
+    instead of a pool of 'workers' processes created and shut down by the call.
+    :return: The converted chunks, as 'array("d")', in the order of 'chunks'.
+    :raises ValueError: When a unit is not a unit of the quantity, or 'workers' or 'prefetch' is not positive.
+    """
+    for unit in (from_unit, to_unit):
+        if not isinstance(unit, quantity._units):
+            raise ValueError(f"Invalid unit {unit!r} for {quantity.__name__}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or prefetch < 1:
+        raise ValueError(f"Expected positive workers and prefetch, got {workers} and {prefetch}")
+    return _convert_batches(chunks, quantity, from_unit, to_unit, workers, workers * prefetch, executor)
+
+
+def _convert_batches(
+    chunks: Iterable[Iterable[float]],
+    quantity: Type[AbstractMeasure],
+    from_unit: Enum,
+    to_unit: Enum,
+    workers: int,
+    in_flight: int,
+    executor: Optional[Executor],
+) -> Iterator[array]:
+    owned = executor is None
+    if owned:
+        executor = ProcessPoolExecutor(workers)
+    pending: Deque[Future] = deque()
+    try:
+        for chunk in chunks:
+            if not isinstance(chunk, array) or chunk.typecode != "d":
+                chunk = array("d", chunk)
+            pending.append(executor.submit(_convert_chunk, quantity, from_unit, to_unit, chunk))
+            # Backpressure: wait for the oldest chunk before reading more of the input.
+            if len(pending) >= in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Also reached when the consumer stops early or a conversion fails.
+        for future in pending:
+            future.cancel()
+        if owned:
+            executor.shutdown(wait=True)
@@ -0,0 +1,66 @@
+from typing import Dict, Optional, Tuple, Type, Union
+
+from .abstract_unit import AbstractMeasure, _get_quantity, _split_quantity_string
+
+# Abbreviation -> (quantity, unit) pairs over all quantities, built on the first global parse.
+_abbreviation_index: Optional[Dict[str, Tuple[Tuple[Type[AbstractMeasure], object], ...]]] = None
+
+
+def __load_quantities():
+    from . import _quantity_modules
+
+    return [_get_quantity(quantity_name) for quantity_name in _quantity_modules]
+
+
+def __get_abbreviation_index() -> Dict[str, Tuple[Tuple[Type[AbstractMeasure], object], ...]]:
+    global _abbreviation_index
+    if _abbreviation_index is None:
+        index: Dict[str, list] = {}
+        for quantity in __load_quantities():
+            for abbreviation, units in quantity._abbreviation_index().items():
+                index.setdefault(abbreviation, []).extend((quantity, unit) for unit in units)
+        _abbreviation_index = {abbreviation: tuple(pairs) for abbreviation, pairs in index.items()}
+    return _abbreviation_index
+
+
+def parse(text: str, quantity: Union[Type[AbstractMeasure], str, None] = None) -> AbstractMeasure:
+    """
+    Parse a quantity from a value followed by a unit abbreviation, e.g. "12.5 km".
+
+    Note! the first global parse imports all the quantity modules to build the abbreviations index.
+    To parse a specific quantity set the 'quantity' parameter (a quantity class or name).
+
+    :param text: The string to parse.
+    :type text: str
+    :param quantity: The quantity to parse, by default the quantity is detected by the abbreviation.
+    :type quantity: Type[AbstractMeasure] | str | None
+    :return: A new instance of the parsed quantity.
+    :rtype: AbstractMeasure
+    :raises ValueError: When the string is not valid or its abbreviation is ambiguous.
+    """
+    if quantity is not None:
+        if isinstance(quantity, str):
+            quantity = _get_quantity(quantity)
+        return quantity._parse(text)
+
+    value, abbreviation = _split_quantity_string(text)
+    pairs = __get_abbreviation_index().get(abbreviation)
+    if pairs is None:
+        raise ValueError(f'Unable to parse "{text}": unknown unit "{abbreviation}"')
+    if len(pairs) > 1:
+        names = ", ".join(f"{quantity.__name__}.{unit.name}" for quantity, unit in pairs)
+        raise ValueError(f'Unable to parse "{text}": ambiguous unit "{abbreviation}" ({names})')
+    quantity, unit = pairs[0]
+    return quantity(value, unit)
+
+
+def try_parse(
+    text: str, quantity: Union[Type[AbstractMeasure], str, None] = None
+) -> Optional[AbstractMeasure]:
+    """
+    Same as parse, but returns None when the string can not be parsed.
+    """
+    try:
+        return parse(text, quantity)
+    except ValueError:
+        return None
@@ -0,0 +1,97 @@
+"""
+Composable generator stages to process unbounded streams of measurements lazily.
+
+A stream item is a (timestamp, value, unit) tuple, where the unit is a string
+(an abbreviation such as "psi", or a units enum value/name) until 'parse_units' resolves it.
+Every stage consumes and yields items one at a time, so the memory use is constant,
+and the per-unit work (unit resolution, conversion functions) is done once per distinct unit.
+
+    readings = pipeline(feed, Pressure, PressureUnits.Bar, on_nan="drop")
+"""
+import math
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple, Type
+
+from .abstract_unit import AbstractMeasure
+
+StreamItem = Tuple[Any, float, Any]
+
+# The supported NaN policies of 'validate_values'.
+NAN_POLICIES = ("raise", "drop", "keep")
+
+
+def parse_units(items: Iterable[StreamItem], quantity: Type[AbstractMeasure]) -> Iterator[StreamItem]:
+    """
+    Resolve the unit strings of the items to the quantity units enum, and the values to floats.
+
+    :raises ValueError: When a unit string is unknown or ambiguous for the quantity.
+    """
+    units: Dict[Any, Enum] = {}
+    for timestamp, value, unit_text in items:
+        unit = units.get(unit_text)
+        if unit is None:
+            unit = units[unit_text] = (
+                unit_text if isinstance(unit_text, quantity._units) else quantity._resolve_unit(unit_text)
+            )
+        yield timestamp, float(value), unit
+
+
+def validate_values(items: Iterable[StreamItem], on_nan: str = "raise") -> Iterator[StreamItem]:
+    """
+    Validate the item values, NaN values are handled by the 'on_nan' policy:
+    "raise" a ValueError (same as creating a quantity), "drop" the item or "keep" it.
+    """
+    if on_nan not in NAN_POLICIES:
+        raise ValueError(f'Invalid NaN policy "{on_nan}", expected one of {NAN_POLICIES}')
+    isnan = math.isnan
+    for item in items:
+        if isnan(item[1]):
+            if on_nan == "raise":
+                raise ValueError(f"Invalid unit: value is NaN (timestamp {item[0]})")
+            if on_nan == "drop":
+                continue
+        yield item
+
+
+def convert_values(
+    items: Iterable[StreamItem], quantity: Type[AbstractMeasure], to_unit: Enum
+) -> Iterator[StreamItem]:
+    """
+    Convert the item values to 'to_unit', the items units must be resolved (see 'parse_units').
+    """
+    converters: Dict[Enum, Callable[[float], float]] = {}
+    for timestamp, value, unit in items:
+        converter = converters.get(unit)
+        if converter is None:
+            converter = converters[unit] = quantity._get_converter(unit, to_unit)
+        yield timestamp, converter(value), to_unit
+
+
+def format_values(items: Iterable[StreamItem], quantity: Type[AbstractMeasure]) -> Iterator[Tuple[Any, str]]:
+    """
+    Format the items to (timestamp, string) pairs, the same format as the quantity 'to_string'.
+    """
+    abbreviations: Dict[Enum, str] = {}
+    for timestamp, value, unit in items:
+        abbreviation = abbreviations.get(unit)
+        if abbreviation is None:
+            unit_abbreviations = quantity._abbreviations[unit]
+            abbreviation = abbreviations[unit] = unit_abbreviations[0] if unit_abbreviations else ""
+        yield timestamp, f"{value} {abbreviation}"
+
+
+def pipeline(
+    items: Iterable[StreamItem],
+    quantity: Type[AbstractMeasure],
+    to_unit: Enum,
+    on_nan: str = "raise",
+    formatted: bool = False,
+) -> Iterator[Tuple[Any, ...]]:
+    """
+    Compose the stages: parse the units, validate the values, convert them to 'to_unit'
+    and optionally format them.
+    """
+    stream = convert_values(validate_values(parse_units(items, quantity), on_nan), quantity, to_unit)
+    if formatted:
+        return format_values(stream, quantity)
+    return stream
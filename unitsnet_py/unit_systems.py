@@ -0,0 +1,231 @@
+"""
+Unit systems, and the normalization of heterogeneous records to the target units of a schema.
+
+Ingested records often carry each field in its own unit (psi, bar or kPa, °F or °C, gallons or liters).
+A 'Normalizer' maps each field of a schema to its quantity and target unit, and converts whole records
+(dicts or tuples of (value, unit) pairs) or columnar batches to plain floats in the target units:
+
+    normalizer = Normalizer({"pressure": Pressure, "temperature": Temperature}, US_CUSTOMARY)
+    normalizer.normalize({"id": 7, "pressure": (2.5, "bar"), "temperature": (21, "°C")})
+    # {"id": 7, "pressure": 36.259..., "temperature": 69.800...}
+
+The conversion function of each (field, source unit) pair is resolved once, on the first record using it,
+so a record costs one dict lookup and one multiply-add per field.
+"""
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Type, Union
+
+from .abstract_unit import AbstractMeasure, _get_quantity
+
+# A schema field: its quantity, or its quantity and its target unit.
+FieldSpec = Union[Type[AbstractMeasure], Tuple[Type[AbstractMeasure], Enum]]
+
+
+class UnitSystem:
+    """
+    A system of target units: the unit of each quantity, by the quantity and unit names of the generated classes.
+
+    The quantities the system does not list are expressed in their base unit.
+
+    Args:
+        name (str): The system name, e.g. "SI".
+        units (dict): The quantity name -> the unit name (a member name of the quantity units enum).
+    """
+
+    def __init__(self, name: str, units: Mapping[str, str]):
+        self.name = name
+        self.__unit_names = dict(units)
+
+    def get_unit(self, quantity: Type[AbstractMeasure]) -> Enum:
+        """
+        Get the unit of a quantity in the system.
+
+        :raises ValueError: When the unit listed for the quantity is not one of its units.
+        """
+        unit_name = self.__unit_names.get(quantity.__name__)
+        if unit_name is None:
+            return quantity._base_unit
+        try:
+            return quantity._units[unit_name]
+        except KeyError:
+            raise ValueError(f'Invalid {self.name} unit "{unit_name}" for {quantity.__name__}') from None
+
+    def extend(self, name: str, units: Mapping[str, str]) -> UnitSystem:
+        """
+        Get a new system with the units of this one, and the given units of some quantities.
+        """
+        return UnitSystem(name, {**self.__unit_names, **units})
+
+    def __repr__(self) -> str:
+        return f"UnitSystem({self.name!r})"
+
+
+# The base units of the quantities are SI units, except the ones listed here.
+SI = UnitSystem(
+    "SI",
+    {
+        "Angle": "Radian",
+        "MassFlow": "KilogramPerSecond",
+    },
+)
+
+US_CUSTOMARY = SI.extend(
+    "US customary",
+    {
+        "Acceleration": "FootPerSecondSquared",
+        "Area": "SquareFoot",
+        "Density": "PoundPerCubicFoot",
+        "Energy": "BritishThermalUnit",
+        "Force": "PoundForce",
+        "ForcePerLength": "PoundForcePerFoot",
+        "FuelEfficiency": "MilePerUsGallon",
+        "HeatFlux": "BtuPerHourSquareFoot",
+        "KinematicViscosity": "SquareFootPerSecond",
+        "Length": "Foot",
+        "LinearDensity": "PoundPerFoot",
+        "Mass": "Pound",
+        "MassFlow": "PoundPerHour",
+        "Power": "MechanicalHorsepower",
+        "Pressure": "PoundForcePerSquareInch",
+        "SpecificEnergy": "BtuPerPound",
+        "SpecificWeight": "PoundForcePerCubicFoot",
+        "Speed": "MilePerHour",
+        "Temperature": "DegreeFahrenheit",
+        "TemperatureDelta": "DegreeFahrenheit",
+        "ThermalConductivity": "BtuPerHourFootFahrenheit",
+        "Torque": "PoundForceFoot",
+        "Volume": "UsGallon",
+        "VolumeFlow": "UsGallonPerMinute",
+    },
+)
+
+# The imperial units differ from the US customary ones by the gallon.
+IMPERIAL = US_CUSTOMARY.extend(
+    "Imperial",
+    {
+        "FuelEfficiency": "MilePerUkGallon",
+        "Volume": "ImperialGallon",
+        "VolumeFlow": "UkGallonPerMinute",
+    },
+)
+
+
+class Normalizer:
+    """
+    Normalize records to the target units of a schema.
+
+    A record field is a (value, unit) pair, the unit being a units enum member of the field quantity,
+    or a string resolved as by 'parse_units' of 'unitsnet_py.stream' (an abbreviation such as "psi",
+    a units enum value or name). The normalized fields are floats in the target units.
+
+    Args:
+        schema (dict): The field name -> its quantity (or quantity name), or its (quantity, target unit).
+        system (UnitSystem): The system of the target units of the fields given without one, SI by default.
+    """
+
+    def __init__(self, schema: Mapping[str, FieldSpec], system: Optional[UnitSystem] = None):
+        system = SI if system is None else system
+        self.__fields: Dict[str, Tuple[Type[AbstractMeasure], Enum]] = {}
+        for name, spec in schema.items():
+            quantity, unit = spec if isinstance(spec, tuple) else (spec, None)
+            if isinstance(quantity, str):
+                quantity = _get_quantity(quantity)
+            if unit is None:
+                unit = system.get_unit(quantity)
+            elif not isinstance(unit, quantity._units):
+                raise ValueError(f'Invalid unit {unit!r} for {quantity.__name__} field "{name}"')
+            self.__fields[name] = (quantity, unit)
+        self.__names = tuple(self.__fields)
+        # (field name, source unit as given) -> the conversion function to the field target unit.
+        self.__converters: Dict[Tuple[str, Any], Callable[[float], float]] = {}
+
+    @property
+    def units(self) -> Dict[str, Enum]:
+        """
+        The field name -> its target unit.
+        """
+        return {name: unit for name, (_, unit) in self.__fields.items()}
+
+    def __resolve_unit(self, name: str, unit: Any) -> Tuple[Type[AbstractMeasure], Enum, Enum]:
+        quantity, to_unit = self.__fields[name]
+        if isinstance(unit, quantity._units):
+            return quantity, unit, to_unit
+        if not isinstance(unit, str):
+            raise ValueError(f'Invalid unit {unit!r} for {quantity.__name__} field "{name}"')
+        return quantity, quantity._resolve_unit(unit), to_unit
+
+    def __compile(self, name: str, unit: Any) -> Callable[[float], float]:
+        quantity, from_unit, to_unit = self.__resolve_unit(name, unit)
+        converter = self.__converters[name, unit] = quantity._get_converter(from_unit, to_unit)
+        return converter
+
+    def normalize(self, record: Union[Mapping[str, Any], tuple]) -> Union[Dict[str, Any], tuple]:
+        """
+        Normalize a record.
+
+        A dict record is returned as a new dict: the schema fields are normalized,
+        the other fields are kept as they are, missing and None fields are left untouched.
+        A tuple record holds the (value, unit) pair of each schema field, in the schema order,
+        and is returned as the tuple of the normalized values.
+
+        :raises ValueError: When a unit is unknown or ambiguous for its field quantity.
+        """
+        converters = self.__converters
+        if isinstance(record, tuple):
+            if len(record) != len(self.__names):
+                raise ValueError(f"Expected a record of {len(self.__names)} fields, got {len(record)}")
+            result = []
+            for name, (value, unit) in zip(self.__names, record):
+                converter = converters.get((name, unit))
+                if converter is None:
+                    converter = self.__compile(name, unit)
+                result.append(converter(float(value)))
+            return tuple(result)
+        normalized = dict(record)
+        for name in self.__names:
+            field = record.get(name)
+            if field is None:
+                continue
+            value, unit = field
+            converter = converters.get((name, unit))
+            if converter is None:
+                converter = self.__compile(name, unit)
+            normalized[name] = converter(float(value))
+        return normalized
+
+    def normalize_many(self, records: Iterable[Union[Mapping[str, Any], tuple]]) -> Iterator[Union[Dict, tuple]]:
+        """
+        Normalize records lazily, see 'normalize'.
+        """
+        normalize = self.normalize
+        for record in records:
+            yield normalize(record)
+
+    def normalize_columns(self, batch: Mapping[str, Tuple[Iterable[float], Any]]) -> Dict[str, Any]:
+        """
+        Normalize a columnar batch, each column in a single unit.
+
+        Columns are converted in a single pass: NumPy arrays (or any object with '__array__')
+        by the quantity array class, in a vectorized pass, the other iterables to lists of floats.
+        The columns that are not in the schema are kept as they are.
+
+        :param batch: The field name -> its (values, unit), or its values for the fields not in the schema.
+        :return: The field name -> its normalized values.
+        """
+        normalized = dict(batch)
+        for name in self.__names:
+            column = batch.get(name)
+            if column is None:
+                continue
+            values, unit = column
+            quantity, from_unit, to_unit = self.__resolve_unit(name, unit)
+            if hasattr(values, "__array__"):
+                # Imported here, NumPy is an optional dependency.
+                from .abstract_array import _get_array_class
+
+                normalized[name] = _get_array_class(quantity).convert_values(values, from_unit, to_unit)
+            else:
+                normalized[name] = quantity._convert_many(values, from_unit, to_unit)
+        return normalized
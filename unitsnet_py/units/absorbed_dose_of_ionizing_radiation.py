@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class AbsorbedDoseOfIonizingRadiationUnits(Enum):
         """
             AbsorbedDoseOfIonizingRadiationUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Gray = 'gray'
         """
@@ -99,153 +110,424 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         value (float): The value.
         from_unit (AbsorbedDoseOfIonizingRadiationUnits): The AbsorbedDoseOfIonizingRadiation unit to create from, The default unit is Gray
     """
-    def __init__(self, value: float, from_unit: AbsorbedDoseOfIonizingRadiationUnits = AbsorbedDoseOfIonizingRadiationUnits.Gray):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = AbsorbedDoseOfIonizingRadiationUnits
+
+    _base_unit = AbsorbedDoseOfIonizingRadiationUnits.Gray
+
+    _dimensions = (2, 0, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 0
+
+    _binary_unit_ids = {
         
-        self.__grays = None
+        AbsorbedDoseOfIonizingRadiationUnits.Gray: 0,
         
-        self.__rads = None
+        AbsorbedDoseOfIonizingRadiationUnits.Rad: 1,
         
-        self.__femtograys = None
+        AbsorbedDoseOfIonizingRadiationUnits.Femtogray: 2,
         
-        self.__picograys = None
+        AbsorbedDoseOfIonizingRadiationUnits.Picogray: 3,
         
-        self.__nanograys = None
+        AbsorbedDoseOfIonizingRadiationUnits.Nanogray: 4,
         
-        self.__micrograys = None
+        AbsorbedDoseOfIonizingRadiationUnits.Microgray: 5,
         
-        self.__milligrays = None
+        AbsorbedDoseOfIonizingRadiationUnits.Milligray: 6,
         
-        self.__centigrays = None
+        AbsorbedDoseOfIonizingRadiationUnits.Centigray: 7,
         
-        self.__kilograys = None
+        AbsorbedDoseOfIonizingRadiationUnits.Kilogray: 8,
         
-        self.__megagrays = None
+        AbsorbedDoseOfIonizingRadiationUnits.Megagray: 9,
         
-        self.__gigagrays = None
+        AbsorbedDoseOfIonizingRadiationUnits.Gigagray: 10,
         
-        self.__teragrays = None
+        AbsorbedDoseOfIonizingRadiationUnits.Teragray: 11,
         
-        self.__petagrays = None
+        AbsorbedDoseOfIonizingRadiationUnits.Petagray: 12,
         
-        self.__millirads = None
+        AbsorbedDoseOfIonizingRadiationUnits.Millirad: 13,
         
-        self.__kilorads = None
+        AbsorbedDoseOfIonizingRadiationUnits.Kilorad: 14,
         
-        self.__megarads = None
+        AbsorbedDoseOfIonizingRadiationUnits.Megarad: 15,
         
+    }
 
-    def convert(self, unit: AbsorbedDoseOfIonizingRadiationUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Gray: lambda value: (value),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Rad: lambda value: (value * 100),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Femtogray: lambda value: ((value) / 1e-15),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Picogray: lambda value: ((value) / 1e-12),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Nanogray: lambda value: ((value) / 1e-09),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Microgray: lambda value: ((value) / 1e-06),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Milligray: lambda value: ((value) / 0.001),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Centigray: lambda value: ((value) / 0.01),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Kilogray: lambda value: ((value) / 1000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Megagray: lambda value: ((value) / 1000000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Gigagray: lambda value: ((value) / 1000000000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Teragray: lambda value: ((value) / 1000000000000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Petagray: lambda value: ((value) / 1000000000000000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Millirad: lambda value: ((value * 100) / 0.001),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Kilorad: lambda value: ((value * 100) / 1000.0),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Megarad: lambda value: ((value * 100) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: AbsorbedDoseOfIonizingRadiationUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Gray:
-            return (value)
+        AbsorbedDoseOfIonizingRadiationUnits.Gray: lambda value: (value),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Rad:
-            return (value * 100)
+        AbsorbedDoseOfIonizingRadiationUnits.Rad: lambda value: (value / 100),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Femtogray:
-            return ((value) / 1e-15)
+        AbsorbedDoseOfIonizingRadiationUnits.Femtogray: lambda value: ((value) * 1e-15),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Picogray:
-            return ((value) / 1e-12)
+        AbsorbedDoseOfIonizingRadiationUnits.Picogray: lambda value: ((value) * 1e-12),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Nanogray:
-            return ((value) / 1e-09)
+        AbsorbedDoseOfIonizingRadiationUnits.Nanogray: lambda value: ((value) * 1e-09),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Microgray:
-            return ((value) / 1e-06)
+        AbsorbedDoseOfIonizingRadiationUnits.Microgray: lambda value: ((value) * 1e-06),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Milligray:
-            return ((value) / 0.001)
+        AbsorbedDoseOfIonizingRadiationUnits.Milligray: lambda value: ((value) * 0.001),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Centigray:
-            return ((value) / 0.01)
+        AbsorbedDoseOfIonizingRadiationUnits.Centigray: lambda value: ((value) * 0.01),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Kilogray:
-            return ((value) / 1000.0)
+        AbsorbedDoseOfIonizingRadiationUnits.Kilogray: lambda value: ((value) * 1000.0),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Megagray:
-            return ((value) / 1000000.0)
+        AbsorbedDoseOfIonizingRadiationUnits.Megagray: lambda value: ((value) * 1000000.0),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Gigagray:
-            return ((value) / 1000000000.0)
+        AbsorbedDoseOfIonizingRadiationUnits.Gigagray: lambda value: ((value) * 1000000000.0),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Teragray:
-            return ((value) / 1000000000000.0)
+        AbsorbedDoseOfIonizingRadiationUnits.Teragray: lambda value: ((value) * 1000000000000.0),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Petagray:
-            return ((value) / 1000000000000000.0)
+        AbsorbedDoseOfIonizingRadiationUnits.Petagray: lambda value: ((value) * 1000000000000000.0),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Millirad:
-            return ((value * 100) / 0.001)
+        AbsorbedDoseOfIonizingRadiationUnits.Millirad: lambda value: ((value / 100) * 0.001),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Kilorad:
-            return ((value * 100) / 1000.0)
+        AbsorbedDoseOfIonizingRadiationUnits.Kilorad: lambda value: ((value / 100) * 1000.0),
         
-        if from_unit == AbsorbedDoseOfIonizingRadiationUnits.Megarad:
-            return ((value * 100) / 1000000.0)
+        AbsorbedDoseOfIonizingRadiationUnits.Megarad: lambda value: ((value / 100) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Gray: ('1', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Rad: ('100', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Femtogray: ('1000000000000000', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Picogray: ('1000000000000', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Nanogray: ('1000000000', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Microgray: ('1000000', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Milligray: ('1000', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Centigray: ('100', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Kilogray: ('1/1000', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Megagray: ('1/1000000', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Gigagray: ('1/1000000000', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Teragray: ('1/1000000000000', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Petagray: ('1/1000000000000000', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Millirad: ('100000', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Kilorad: ('1/10', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Megarad: ('1/10000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: AbsorbedDoseOfIonizingRadiationUnits) -> float:
+    _affine_to_base = {
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Gray: ('1', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Rad: ('1/100', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Femtogray: ('1/1000000000000000', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Picogray: ('1/1000000000000', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Nanogray: ('1/1000000000', '0'),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Microgray: ('1/1000000', '0'),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Gray:
-            return (value)
+        AbsorbedDoseOfIonizingRadiationUnits.Milligray: ('1/1000', '0'),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Rad:
-            return (value / 100)
+        AbsorbedDoseOfIonizingRadiationUnits.Centigray: ('1/100', '0'),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Femtogray:
-            return ((value) * 1e-15)
+        AbsorbedDoseOfIonizingRadiationUnits.Kilogray: ('1000', '0'),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Picogray:
-            return ((value) * 1e-12)
+        AbsorbedDoseOfIonizingRadiationUnits.Megagray: ('1000000', '0'),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Nanogray:
-            return ((value) * 1e-09)
+        AbsorbedDoseOfIonizingRadiationUnits.Gigagray: ('1000000000', '0'),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Microgray:
-            return ((value) * 1e-06)
+        AbsorbedDoseOfIonizingRadiationUnits.Teragray: ('1000000000000', '0'),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Milligray:
-            return ((value) * 0.001)
+        AbsorbedDoseOfIonizingRadiationUnits.Petagray: ('1000000000000000', '0'),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Centigray:
-            return ((value) * 0.01)
+        AbsorbedDoseOfIonizingRadiationUnits.Millirad: ('1/100000', '0'),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Kilogray:
-            return ((value) * 1000.0)
+        AbsorbedDoseOfIonizingRadiationUnits.Kilorad: ('10', '0'),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Megagray:
-            return ((value) * 1000000.0)
+        AbsorbedDoseOfIonizingRadiationUnits.Megarad: ('10000', '0'),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Gigagray:
-            return ((value) * 1000000000.0)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Gray: ('Gy',),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Rad: ('rad',),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Femtogray: ('fGy',),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Picogray: ('pGy',),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Nanogray: ('nGy',),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Microgray: ('μGy',),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Milligray: ('mGy',),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Centigray: ('cGy',),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Kilogray: ('kGy',),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Teragray:
-            return ((value) * 1000000000000.0)
+        AbsorbedDoseOfIonizingRadiationUnits.Megagray: ('MGy',),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Petagray:
-            return ((value) * 1000000000000000.0)
+        AbsorbedDoseOfIonizingRadiationUnits.Gigagray: ('GGy',),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Millirad:
-            return ((value / 100) * 0.001)
+        AbsorbedDoseOfIonizingRadiationUnits.Teragray: ('TGy',),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Kilorad:
-            return ((value / 100) * 1000.0)
+        AbsorbedDoseOfIonizingRadiationUnits.Petagray: ('PGy',),
         
-        if to_unit == AbsorbedDoseOfIonizingRadiationUnits.Megarad:
-            return ((value / 100) * 1000000.0)
+        AbsorbedDoseOfIonizingRadiationUnits.Millirad: ('mrad',),
         
-        return None
+        AbsorbedDoseOfIonizingRadiationUnits.Kilorad: ('krad',),
+        
+        AbsorbedDoseOfIonizingRadiationUnits.Megarad: ('Mrad',),
+        
+    }
 
+    def __init__(self, value: float, from_unit: AbsorbedDoseOfIonizingRadiationUnits = AbsorbedDoseOfIonizingRadiationUnits.Gray):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: AbsorbedDoseOfIonizingRadiationUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: AbsorbedDoseOfIonizingRadiationUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: AbsorbedDoseOfIonizingRadiationUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: AbsorbedDoseOfIonizingRadiationUnits, to_unit: AbsorbedDoseOfIonizingRadiationUnits) -> float:
+        """
+        Convert a value from one AbsorbedDoseOfIonizingRadiation unit to another, without creating a AbsorbedDoseOfIonizingRadiation instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: AbsorbedDoseOfIonizingRadiationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AbsorbedDoseOfIonizingRadiationUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return AbsorbedDoseOfIonizingRadiation._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: AbsorbedDoseOfIonizingRadiationUnits, to_unit: AbsorbedDoseOfIonizingRadiationUnits) -> List[float]:
+        """
+        Convert many values from one AbsorbedDoseOfIonizingRadiation unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: AbsorbedDoseOfIonizingRadiationUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: AbsorbedDoseOfIonizingRadiationUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return AbsorbedDoseOfIonizingRadiation._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: AbsorbedDoseOfIonizingRadiationUnits, to_unit: AbsorbedDoseOfIonizingRadiationUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", AbsorbedDoseOfIonizingRadiation._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: AbsorbedDoseOfIonizingRadiationUnits, to_unit: AbsorbedDoseOfIonizingRadiationUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one AbsorbedDoseOfIonizingRadiation unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AbsorbedDoseOfIonizingRadiationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AbsorbedDoseOfIonizingRadiationUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return AbsorbedDoseOfIonizingRadiation._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: AbsorbedDoseOfIonizingRadiationUnits = AbsorbedDoseOfIonizingRadiationUnits.Gray) -> AbsorbedDoseOfIonizingRadiation:
+        """
+        Create a new instance of AbsorbedDoseOfIonizingRadiation holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AbsorbedDoseOfIonizingRadiationUnits
+        :return: A new instance of AbsorbedDoseOfIonizingRadiation.
+        :rtype: AbsorbedDoseOfIonizingRadiation
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return AbsorbedDoseOfIonizingRadiation._from_exact(value, from_unit)
+
+    def to_exact(self, unit: AbsorbedDoseOfIonizingRadiationUnits = AbsorbedDoseOfIonizingRadiationUnits.Gray) -> Fraction:
+        """
+        Get the exact value of the AbsorbedDoseOfIonizingRadiation in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Gray).
+        :type unit: AbsorbedDoseOfIonizingRadiationUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> AbsorbedDoseOfIonizingRadiation:
+        """
+        Parse a AbsorbedDoseOfIonizingRadiation from a value followed by a unit abbreviation, e.g. "1 Gy".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of AbsorbedDoseOfIonizingRadiation.
+        :rtype: AbsorbedDoseOfIonizingRadiation
+        :raises ValueError: When the string is not a valid or an ambiguous AbsorbedDoseOfIonizingRadiation.
+        """
+        return AbsorbedDoseOfIonizingRadiation._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[AbsorbedDoseOfIonizingRadiation]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return AbsorbedDoseOfIonizingRadiation._try_parse(text)
+
+    def to_binary(self, unit: Optional[AbsorbedDoseOfIonizingRadiationUnits] = None) -> bytes:
+        """
+        Encode the AbsorbedDoseOfIonizingRadiation to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: AbsorbedDoseOfIonizingRadiationUnits
+        :return: The encoded AbsorbedDoseOfIonizingRadiation.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> AbsorbedDoseOfIonizingRadiation:
+        """
+        Decode a AbsorbedDoseOfIonizingRadiation encoded by to_binary.
+
+        :param data: The encoded AbsorbedDoseOfIonizingRadiation, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of AbsorbedDoseOfIonizingRadiation.
+        :rtype: AbsorbedDoseOfIonizingRadiation
+        :raises ValueError: When the data is not a valid encoded AbsorbedDoseOfIonizingRadiation.
+        """
+        return AbsorbedDoseOfIonizingRadiation._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[AbsorbedDoseOfIonizingRadiationUnits] = None) -> dict:
+        """
+        Get the AbsorbedDoseOfIonizingRadiation DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Gray).
+        :type hold_in_unit: AbsorbedDoseOfIonizingRadiationUnits
+        :return: The AbsorbedDoseOfIonizingRadiation DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[AbsorbedDoseOfIonizingRadiationUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> AbsorbedDoseOfIonizingRadiation:
+        """
+        Create a new instance of AbsorbedDoseOfIonizingRadiation from its DTO.
+
+        :param dto: The AbsorbedDoseOfIonizingRadiation DTO, the unit is the AbsorbedDoseOfIonizingRadiationUnits value or name.
+        :type dto: dict
+        :return: A new instance of AbsorbedDoseOfIonizingRadiation.
+        :rtype: AbsorbedDoseOfIonizingRadiation
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return AbsorbedDoseOfIonizingRadiation._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> AbsorbedDoseOfIonizingRadiation:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return AbsorbedDoseOfIonizingRadiation._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -497,10 +779,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         The gray is the unit of ionizing radiation dose in the SI, defined as the absorption of one joule of radiation energy per kilogram of matter.
         """
-        if self.__grays != None:
-            return self.__grays
-        self.__grays = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Gray)
-        return self.__grays
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Gray)
 
     
     @property
@@ -508,10 +787,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         The rad is a unit of absorbed radiation dose, defined as 1 rad = 0.01 Gy = 0.01 J/kg.
         """
-        if self.__rads != None:
-            return self.__rads
-        self.__rads = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Rad)
-        return self.__rads
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Rad)
 
     
     @property
@@ -519,10 +795,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         
         """
-        if self.__femtograys != None:
-            return self.__femtograys
-        self.__femtograys = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Femtogray)
-        return self.__femtograys
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Femtogray)
 
     
     @property
@@ -530,10 +803,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         
         """
-        if self.__picograys != None:
-            return self.__picograys
-        self.__picograys = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Picogray)
-        return self.__picograys
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Picogray)
 
     
     @property
@@ -541,10 +811,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         
         """
-        if self.__nanograys != None:
-            return self.__nanograys
-        self.__nanograys = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Nanogray)
-        return self.__nanograys
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Nanogray)
 
     
     @property
@@ -552,10 +819,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         
         """
-        if self.__micrograys != None:
-            return self.__micrograys
-        self.__micrograys = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Microgray)
-        return self.__micrograys
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Microgray)
 
     
     @property
@@ -563,10 +827,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         
         """
-        if self.__milligrays != None:
-            return self.__milligrays
-        self.__milligrays = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Milligray)
-        return self.__milligrays
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Milligray)
 
     
     @property
@@ -574,10 +835,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         
         """
-        if self.__centigrays != None:
-            return self.__centigrays
-        self.__centigrays = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Centigray)
-        return self.__centigrays
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Centigray)
 
     
     @property
@@ -585,10 +843,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         
         """
-        if self.__kilograys != None:
-            return self.__kilograys
-        self.__kilograys = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Kilogray)
-        return self.__kilograys
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Kilogray)
 
     
     @property
@@ -596,10 +851,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         
         """
-        if self.__megagrays != None:
-            return self.__megagrays
-        self.__megagrays = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Megagray)
-        return self.__megagrays
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Megagray)
 
     
     @property
@@ -607,10 +859,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         
         """
-        if self.__gigagrays != None:
-            return self.__gigagrays
-        self.__gigagrays = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Gigagray)
-        return self.__gigagrays
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Gigagray)
 
     
     @property
@@ -618,10 +867,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         
         """
-        if self.__teragrays != None:
-            return self.__teragrays
-        self.__teragrays = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Teragray)
-        return self.__teragrays
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Teragray)
 
     
     @property
@@ -629,10 +875,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         
         """
-        if self.__petagrays != None:
-            return self.__petagrays
-        self.__petagrays = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Petagray)
-        return self.__petagrays
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Petagray)
 
     
     @property
@@ -640,10 +883,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         
         """
-        if self.__millirads != None:
-            return self.__millirads
-        self.__millirads = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Millirad)
-        return self.__millirads
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Millirad)
 
     
     @property
@@ -651,10 +891,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         
         """
-        if self.__kilorads != None:
-            return self.__kilorads
-        self.__kilorads = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Kilorad)
-        return self.__kilorads
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Kilorad)
 
     
     @property
@@ -662,10 +899,7 @@ class AbsorbedDoseOfIonizingRadiation(AbstractMeasure):
         """
         
         """
-        if self.__megarads != None:
-            return self.__megarads
-        self.__megarads = self.__convert_from_base(AbsorbedDoseOfIonizingRadiationUnits.Megarad)
-        return self.__megarads
+        return self._cached_convert(AbsorbedDoseOfIonizingRadiationUnits.Megarad)
 
     
     def to_string(self, unit: AbsorbedDoseOfIonizingRadiationUnits = AbsorbedDoseOfIonizingRadiationUnits.Gray) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class AccelerationUnits(Enum):
         """
             AccelerationUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         MeterPerSecondSquared = 'meter_per_second_squared'
         """
@@ -89,138 +100,401 @@ class Acceleration(AbstractMeasure):
         value (float): The value.
         from_unit (AccelerationUnits): The Acceleration unit to create from, The default unit is MeterPerSecondSquared
     """
-    def __init__(self, value: float, from_unit: AccelerationUnits = AccelerationUnits.MeterPerSecondSquared):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = AccelerationUnits
+
+    _base_unit = AccelerationUnits.MeterPerSecondSquared
+
+    _dimensions = (1, 0, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 1
+
+    _binary_unit_ids = {
         
-        self.__meters_per_second_squared = None
+        AccelerationUnits.MeterPerSecondSquared: 0,
         
-        self.__inches_per_second_squared = None
+        AccelerationUnits.InchPerSecondSquared: 1,
         
-        self.__feet_per_second_squared = None
+        AccelerationUnits.FootPerSecondSquared: 2,
         
-        self.__knots_per_second = None
+        AccelerationUnits.KnotPerSecond: 3,
         
-        self.__knots_per_minute = None
+        AccelerationUnits.KnotPerMinute: 4,
         
-        self.__knots_per_hour = None
+        AccelerationUnits.KnotPerHour: 5,
         
-        self.__standard_gravity = None
+        AccelerationUnits.StandardGravity: 6,
         
-        self.__nanometers_per_second_squared = None
+        AccelerationUnits.NanometerPerSecondSquared: 7,
         
-        self.__micrometers_per_second_squared = None
+        AccelerationUnits.MicrometerPerSecondSquared: 8,
         
-        self.__millimeters_per_second_squared = None
+        AccelerationUnits.MillimeterPerSecondSquared: 9,
         
-        self.__centimeters_per_second_squared = None
+        AccelerationUnits.CentimeterPerSecondSquared: 10,
         
-        self.__decimeters_per_second_squared = None
+        AccelerationUnits.DecimeterPerSecondSquared: 11,
         
-        self.__kilometers_per_second_squared = None
+        AccelerationUnits.KilometerPerSecondSquared: 12,
         
-        self.__millistandard_gravity = None
+        AccelerationUnits.MillistandardGravity: 13,
         
+    }
 
-    def convert(self, unit: AccelerationUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        AccelerationUnits.MeterPerSecondSquared: lambda value: (value),
+        
+        AccelerationUnits.InchPerSecondSquared: lambda value: (value / 0.0254),
+        
+        AccelerationUnits.FootPerSecondSquared: lambda value: (value / 0.304800),
+        
+        AccelerationUnits.KnotPerSecond: lambda value: (value / 0.5144444444444),
+        
+        AccelerationUnits.KnotPerMinute: lambda value: (value / 0.5144444444444 * 60),
+        
+        AccelerationUnits.KnotPerHour: lambda value: (value / 0.5144444444444 * 3600),
+        
+        AccelerationUnits.StandardGravity: lambda value: (value / 9.80665),
+        
+        AccelerationUnits.NanometerPerSecondSquared: lambda value: ((value) / 1e-09),
+        
+        AccelerationUnits.MicrometerPerSecondSquared: lambda value: ((value) / 1e-06),
+        
+        AccelerationUnits.MillimeterPerSecondSquared: lambda value: ((value) / 0.001),
+        
+        AccelerationUnits.CentimeterPerSecondSquared: lambda value: ((value) / 0.01),
+        
+        AccelerationUnits.DecimeterPerSecondSquared: lambda value: ((value) / 0.1),
+        
+        AccelerationUnits.KilometerPerSecondSquared: lambda value: ((value) / 1000.0),
+        
+        AccelerationUnits.MillistandardGravity: lambda value: ((value / 9.80665) / 0.001),
+        
+    }
 
-    def __convert_from_base(self, from_unit: AccelerationUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        AccelerationUnits.MeterPerSecondSquared: lambda value: (value),
+        
+        AccelerationUnits.InchPerSecondSquared: lambda value: (value * 0.0254),
+        
+        AccelerationUnits.FootPerSecondSquared: lambda value: (value * 0.304800),
+        
+        AccelerationUnits.KnotPerSecond: lambda value: (value * 0.5144444444444),
+        
+        AccelerationUnits.KnotPerMinute: lambda value: (value * 0.5144444444444 / 60),
         
-        if from_unit == AccelerationUnits.MeterPerSecondSquared:
-            return (value)
+        AccelerationUnits.KnotPerHour: lambda value: (value * 0.5144444444444 / 3600),
         
-        if from_unit == AccelerationUnits.InchPerSecondSquared:
-            return (value / 0.0254)
+        AccelerationUnits.StandardGravity: lambda value: (value * 9.80665),
         
-        if from_unit == AccelerationUnits.FootPerSecondSquared:
-            return (value / 0.304800)
+        AccelerationUnits.NanometerPerSecondSquared: lambda value: ((value) * 1e-09),
         
-        if from_unit == AccelerationUnits.KnotPerSecond:
-            return (value / 0.5144444444444)
+        AccelerationUnits.MicrometerPerSecondSquared: lambda value: ((value) * 1e-06),
         
-        if from_unit == AccelerationUnits.KnotPerMinute:
-            return (value / 0.5144444444444 * 60)
+        AccelerationUnits.MillimeterPerSecondSquared: lambda value: ((value) * 0.001),
         
-        if from_unit == AccelerationUnits.KnotPerHour:
-            return (value / 0.5144444444444 * 3600)
+        AccelerationUnits.CentimeterPerSecondSquared: lambda value: ((value) * 0.01),
         
-        if from_unit == AccelerationUnits.StandardGravity:
-            return (value / 9.80665)
+        AccelerationUnits.DecimeterPerSecondSquared: lambda value: ((value) * 0.1),
         
-        if from_unit == AccelerationUnits.NanometerPerSecondSquared:
-            return ((value) / 1e-09)
+        AccelerationUnits.KilometerPerSecondSquared: lambda value: ((value) * 1000.0),
         
-        if from_unit == AccelerationUnits.MicrometerPerSecondSquared:
-            return ((value) / 1e-06)
+        AccelerationUnits.MillistandardGravity: lambda value: ((value * 9.80665) * 0.001),
         
-        if from_unit == AccelerationUnits.MillimeterPerSecondSquared:
-            return ((value) / 0.001)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        AccelerationUnits.MeterPerSecondSquared: ('1', '0'),
+        
+        AccelerationUnits.InchPerSecondSquared: ('5000/127', '0'),
+        
+        AccelerationUnits.FootPerSecondSquared: ('1250/381', '0'),
+        
+        AccelerationUnits.KnotPerSecond: ('2500000000000/1286111111111', '0'),
+        
+        AccelerationUnits.KnotPerMinute: ('150000000000000/1286111111111', '0'),
+        
+        AccelerationUnits.KnotPerHour: ('9000000000000000/1286111111111', '0'),
+        
+        AccelerationUnits.StandardGravity: ('20000/196133', '0'),
+        
+        AccelerationUnits.NanometerPerSecondSquared: ('1000000000', '0'),
+        
+        AccelerationUnits.MicrometerPerSecondSquared: ('1000000', '0'),
         
-        if from_unit == AccelerationUnits.CentimeterPerSecondSquared:
-            return ((value) / 0.01)
+        AccelerationUnits.MillimeterPerSecondSquared: ('1000', '0'),
         
-        if from_unit == AccelerationUnits.DecimeterPerSecondSquared:
-            return ((value) / 0.1)
+        AccelerationUnits.CentimeterPerSecondSquared: ('100', '0'),
         
-        if from_unit == AccelerationUnits.KilometerPerSecondSquared:
-            return ((value) / 1000.0)
+        AccelerationUnits.DecimeterPerSecondSquared: ('10', '0'),
         
-        if from_unit == AccelerationUnits.MillistandardGravity:
-            return ((value / 9.80665) / 0.001)
+        AccelerationUnits.KilometerPerSecondSquared: ('1/1000', '0'),
         
-        return None
+        AccelerationUnits.MillistandardGravity: ('20000000/196133', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        AccelerationUnits.MeterPerSecondSquared: ('1', '0'),
+        
+        AccelerationUnits.InchPerSecondSquared: ('127/5000', '0'),
+        
+        AccelerationUnits.FootPerSecondSquared: ('381/1250', '0'),
+        
+        AccelerationUnits.KnotPerSecond: ('1286111111111/2500000000000', '0'),
+        
+        AccelerationUnits.KnotPerMinute: ('1286111111111/150000000000000', '0'),
+        
+        AccelerationUnits.KnotPerHour: ('1286111111111/9000000000000000', '0'),
+        
+        AccelerationUnits.StandardGravity: ('196133/20000', '0'),
+        
+        AccelerationUnits.NanometerPerSecondSquared: ('1/1000000000', '0'),
+        
+        AccelerationUnits.MicrometerPerSecondSquared: ('1/1000000', '0'),
+        
+        AccelerationUnits.MillimeterPerSecondSquared: ('1/1000', '0'),
+        
+        AccelerationUnits.CentimeterPerSecondSquared: ('1/100', '0'),
+        
+        AccelerationUnits.DecimeterPerSecondSquared: ('1/10', '0'),
+        
+        AccelerationUnits.KilometerPerSecondSquared: ('1000', '0'),
+        
+        AccelerationUnits.MillistandardGravity: ('196133/20000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: AccelerationUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == AccelerationUnits.MeterPerSecondSquared:
-            return (value)
+        AccelerationUnits.MeterPerSecondSquared: ('m/s²',),
         
-        if to_unit == AccelerationUnits.InchPerSecondSquared:
-            return (value * 0.0254)
+        AccelerationUnits.InchPerSecondSquared: ('in/s²',),
         
-        if to_unit == AccelerationUnits.FootPerSecondSquared:
-            return (value * 0.304800)
+        AccelerationUnits.FootPerSecondSquared: ('ft/s²',),
         
-        if to_unit == AccelerationUnits.KnotPerSecond:
-            return (value * 0.5144444444444)
+        AccelerationUnits.KnotPerSecond: ('kn/s',),
         
-        if to_unit == AccelerationUnits.KnotPerMinute:
-            return (value * 0.5144444444444 / 60)
+        AccelerationUnits.KnotPerMinute: ('kn/min',),
         
-        if to_unit == AccelerationUnits.KnotPerHour:
-            return (value * 0.5144444444444 / 3600)
+        AccelerationUnits.KnotPerHour: ('kn/h',),
         
-        if to_unit == AccelerationUnits.StandardGravity:
-            return (value * 9.80665)
+        AccelerationUnits.StandardGravity: ('g',),
         
-        if to_unit == AccelerationUnits.NanometerPerSecondSquared:
-            return ((value) * 1e-09)
+        AccelerationUnits.NanometerPerSecondSquared: ('nm/s²',),
         
-        if to_unit == AccelerationUnits.MicrometerPerSecondSquared:
-            return ((value) * 1e-06)
+        AccelerationUnits.MicrometerPerSecondSquared: ('μm/s²',),
         
-        if to_unit == AccelerationUnits.MillimeterPerSecondSquared:
-            return ((value) * 0.001)
+        AccelerationUnits.MillimeterPerSecondSquared: ('mm/s²',),
         
-        if to_unit == AccelerationUnits.CentimeterPerSecondSquared:
-            return ((value) * 0.01)
+        AccelerationUnits.CentimeterPerSecondSquared: ('cm/s²',),
         
-        if to_unit == AccelerationUnits.DecimeterPerSecondSquared:
-            return ((value) * 0.1)
+        AccelerationUnits.DecimeterPerSecondSquared: ('dm/s²',),
         
-        if to_unit == AccelerationUnits.KilometerPerSecondSquared:
-            return ((value) * 1000.0)
+        AccelerationUnits.KilometerPerSecondSquared: ('km/s²',),
         
-        if to_unit == AccelerationUnits.MillistandardGravity:
-            return ((value * 9.80665) * 0.001)
+        AccelerationUnits.MillistandardGravity: ('mg',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: AccelerationUnits = AccelerationUnits.MeterPerSecondSquared):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: AccelerationUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: AccelerationUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
 
 
+    def __convert_to_base(self, value: float, to_unit: AccelerationUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: AccelerationUnits, to_unit: AccelerationUnits) -> float:
+        """
+        Convert a value from one Acceleration unit to another, without creating a Acceleration instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: AccelerationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AccelerationUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Acceleration._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: AccelerationUnits, to_unit: AccelerationUnits) -> List[float]:
+        """
+        Convert many values from one Acceleration unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: AccelerationUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: AccelerationUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Acceleration._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: AccelerationUnits, to_unit: AccelerationUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Acceleration._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: AccelerationUnits, to_unit: AccelerationUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Acceleration unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AccelerationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AccelerationUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Acceleration._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: AccelerationUnits = AccelerationUnits.MeterPerSecondSquared) -> Acceleration:
+        """
+        Create a new instance of Acceleration holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AccelerationUnits
+        :return: A new instance of Acceleration.
+        :rtype: Acceleration
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Acceleration._from_exact(value, from_unit)
+
+    def to_exact(self, unit: AccelerationUnits = AccelerationUnits.MeterPerSecondSquared) -> Fraction:
+        """
+        Get the exact value of the Acceleration in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (MeterPerSecondSquared).
+        :type unit: AccelerationUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Acceleration:
+        """
+        Parse a Acceleration from a value followed by a unit abbreviation, e.g. "1 m/s²".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Acceleration.
+        :rtype: Acceleration
+        :raises ValueError: When the string is not a valid or an ambiguous Acceleration.
+        """
+        return Acceleration._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Acceleration]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Acceleration._try_parse(text)
+
+    def to_binary(self, unit: Optional[AccelerationUnits] = None) -> bytes:
+        """
+        Encode the Acceleration to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: AccelerationUnits
+        :return: The encoded Acceleration.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Acceleration:
+        """
+        Decode a Acceleration encoded by to_binary.
+
+        :param data: The encoded Acceleration, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Acceleration.
+        :rtype: Acceleration
+        :raises ValueError: When the data is not a valid encoded Acceleration.
+        """
+        return Acceleration._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[AccelerationUnits] = None) -> dict:
+        """
+        Get the Acceleration DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (MeterPerSecondSquared).
+        :type hold_in_unit: AccelerationUnits
+        :return: The Acceleration DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[AccelerationUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Acceleration:
+        """
+        Create a new instance of Acceleration from its DTO.
+
+        :param dto: The Acceleration DTO, the unit is the AccelerationUnits value or name.
+        :type dto: dict
+        :return: A new instance of Acceleration.
+        :rtype: Acceleration
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Acceleration._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Acceleration:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Acceleration._from_json(text)
+
     @property
     def base_value(self) -> float:
         return self._value
@@ -441,10 +715,7 @@ class Acceleration(AbstractMeasure):
         """
         
         """
-        if self.__meters_per_second_squared != None:
-            return self.__meters_per_second_squared
-        self.__meters_per_second_squared = self.__convert_from_base(AccelerationUnits.MeterPerSecondSquared)
-        return self.__meters_per_second_squared
+        return self._cached_convert(AccelerationUnits.MeterPerSecondSquared)
 
     
     @property
@@ -452,10 +723,7 @@ class Acceleration(AbstractMeasure):
         """
         
         """
-        if self.__inches_per_second_squared != None:
-            return self.__inches_per_second_squared
-        self.__inches_per_second_squared = self.__convert_from_base(AccelerationUnits.InchPerSecondSquared)
-        return self.__inches_per_second_squared
+        return self._cached_convert(AccelerationUnits.InchPerSecondSquared)
 
     
     @property
@@ -463,10 +731,7 @@ class Acceleration(AbstractMeasure):
         """
         
         """
-        if self.__feet_per_second_squared != None:
-            return self.__feet_per_second_squared
-        self.__feet_per_second_squared = self.__convert_from_base(AccelerationUnits.FootPerSecondSquared)
-        return self.__feet_per_second_squared
+        return self._cached_convert(AccelerationUnits.FootPerSecondSquared)
 
     
     @property
@@ -474,10 +739,7 @@ class Acceleration(AbstractMeasure):
         """
         
         """
-        if self.__knots_per_second != None:
-            return self.__knots_per_second
-        self.__knots_per_second = self.__convert_from_base(AccelerationUnits.KnotPerSecond)
-        return self.__knots_per_second
+        return self._cached_convert(AccelerationUnits.KnotPerSecond)
 
     
     @property
@@ -485,10 +747,7 @@ class Acceleration(AbstractMeasure):
         """
         
         """
-        if self.__knots_per_minute != None:
-            return self.__knots_per_minute
-        self.__knots_per_minute = self.__convert_from_base(AccelerationUnits.KnotPerMinute)
-        return self.__knots_per_minute
+        return self._cached_convert(AccelerationUnits.KnotPerMinute)
 
     
     @property
@@ -496,10 +755,7 @@ class Acceleration(AbstractMeasure):
         """
         
         """
-        if self.__knots_per_hour != None:
-            return self.__knots_per_hour
-        self.__knots_per_hour = self.__convert_from_base(AccelerationUnits.KnotPerHour)
-        return self.__knots_per_hour
+        return self._cached_convert(AccelerationUnits.KnotPerHour)
 
     
     @property
@@ -507,10 +763,7 @@ class Acceleration(AbstractMeasure):
         """
         
         """
-        if self.__standard_gravity != None:
-            return self.__standard_gravity
-        self.__standard_gravity = self.__convert_from_base(AccelerationUnits.StandardGravity)
-        return self.__standard_gravity
+        return self._cached_convert(AccelerationUnits.StandardGravity)
 
     
     @property
@@ -518,10 +771,7 @@ class Acceleration(AbstractMeasure):
         """
         
         """
-        if self.__nanometers_per_second_squared != None:
-            return self.__nanometers_per_second_squared
-        self.__nanometers_per_second_squared = self.__convert_from_base(AccelerationUnits.NanometerPerSecondSquared)
-        return self.__nanometers_per_second_squared
+        return self._cached_convert(AccelerationUnits.NanometerPerSecondSquared)
 
     
     @property
@@ -529,10 +779,7 @@ class Acceleration(AbstractMeasure):
         """
         
         """
-        if self.__micrometers_per_second_squared != None:
-            return self.__micrometers_per_second_squared
-        self.__micrometers_per_second_squared = self.__convert_from_base(AccelerationUnits.MicrometerPerSecondSquared)
-        return self.__micrometers_per_second_squared
+        return self._cached_convert(AccelerationUnits.MicrometerPerSecondSquared)
 
     
     @property
@@ -540,10 +787,7 @@ class Acceleration(AbstractMeasure):
         """
         
         """
-        if self.__millimeters_per_second_squared != None:
-            return self.__millimeters_per_second_squared
-        self.__millimeters_per_second_squared = self.__convert_from_base(AccelerationUnits.MillimeterPerSecondSquared)
-        return self.__millimeters_per_second_squared
+        return self._cached_convert(AccelerationUnits.MillimeterPerSecondSquared)
 
     
     @property
@@ -551,10 +795,7 @@ class Acceleration(AbstractMeasure):
         """
         
         """
-        if self.__centimeters_per_second_squared != None:
-            return self.__centimeters_per_second_squared
-        self.__centimeters_per_second_squared = self.__convert_from_base(AccelerationUnits.CentimeterPerSecondSquared)
-        return self.__centimeters_per_second_squared
+        return self._cached_convert(AccelerationUnits.CentimeterPerSecondSquared)
 
     
     @property
@@ -562,10 +803,7 @@ class Acceleration(AbstractMeasure):
         """
         
         """
-        if self.__decimeters_per_second_squared != None:
-            return self.__decimeters_per_second_squared
-        self.__decimeters_per_second_squared = self.__convert_from_base(AccelerationUnits.DecimeterPerSecondSquared)
-        return self.__decimeters_per_second_squared
+        return self._cached_convert(AccelerationUnits.DecimeterPerSecondSquared)
 
     
     @property
@@ -573,10 +811,7 @@ class Acceleration(AbstractMeasure):
         """
         
         """
-        if self.__kilometers_per_second_squared != None:
-            return self.__kilometers_per_second_squared
-        self.__kilometers_per_second_squared = self.__convert_from_base(AccelerationUnits.KilometerPerSecondSquared)
-        return self.__kilometers_per_second_squared
+        return self._cached_convert(AccelerationUnits.KilometerPerSecondSquared)
 
     
     @property
@@ -584,10 +819,7 @@ class Acceleration(AbstractMeasure):
         """
         
         """
-        if self.__millistandard_gravity != None:
-            return self.__millistandard_gravity
-        self.__millistandard_gravity = self.__convert_from_base(AccelerationUnits.MillistandardGravity)
-        return self.__millistandard_gravity
+        return self._cached_convert(AccelerationUnits.MillistandardGravity)
 
     
     def to_string(self, unit: AccelerationUnits = AccelerationUnits.MeterPerSecondSquared) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class AmountOfSubstanceUnits(Enum):
         """
             AmountOfSubstanceUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Mole = 'mole'
         """
@@ -104,161 +115,436 @@ class AmountOfSubstance(AbstractMeasure):
         value (float): The value.
         from_unit (AmountOfSubstanceUnits): The AmountOfSubstance unit to create from, The default unit is Mole
     """
-    def __init__(self, value: float, from_unit: AmountOfSubstanceUnits = AmountOfSubstanceUnits.Mole):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = AmountOfSubstanceUnits
+
+    _base_unit = AmountOfSubstanceUnits.Mole
+
+    _dimensions = (0, 0, 0, 0, 0, 1, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 2
+
+    _binary_unit_ids = {
         
-        self.__moles = None
+        AmountOfSubstanceUnits.Mole: 0,
         
-        self.__pound_moles = None
+        AmountOfSubstanceUnits.PoundMole: 1,
         
-        self.__femtomoles = None
+        AmountOfSubstanceUnits.Femtomole: 2,
         
-        self.__picomoles = None
+        AmountOfSubstanceUnits.Picomole: 3,
         
-        self.__nanomoles = None
+        AmountOfSubstanceUnits.Nanomole: 4,
         
-        self.__micromoles = None
+        AmountOfSubstanceUnits.Micromole: 5,
         
-        self.__millimoles = None
+        AmountOfSubstanceUnits.Millimole: 6,
         
-        self.__centimoles = None
+        AmountOfSubstanceUnits.Centimole: 7,
         
-        self.__decimoles = None
+        AmountOfSubstanceUnits.Decimole: 8,
         
-        self.__kilomoles = None
+        AmountOfSubstanceUnits.Kilomole: 9,
         
-        self.__megamoles = None
+        AmountOfSubstanceUnits.Megamole: 10,
         
-        self.__nanopound_moles = None
+        AmountOfSubstanceUnits.NanopoundMole: 11,
         
-        self.__micropound_moles = None
+        AmountOfSubstanceUnits.MicropoundMole: 12,
         
-        self.__millipound_moles = None
+        AmountOfSubstanceUnits.MillipoundMole: 13,
         
-        self.__centipound_moles = None
+        AmountOfSubstanceUnits.CentipoundMole: 14,
         
-        self.__decipound_moles = None
+        AmountOfSubstanceUnits.DecipoundMole: 15,
         
-        self.__kilopound_moles = None
+        AmountOfSubstanceUnits.KilopoundMole: 16,
         
+    }
 
-    def convert(self, unit: AmountOfSubstanceUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        AmountOfSubstanceUnits.Mole: lambda value: (value),
+        
+        AmountOfSubstanceUnits.PoundMole: lambda value: (value / 453.59237),
+        
+        AmountOfSubstanceUnits.Femtomole: lambda value: ((value) / 1e-15),
+        
+        AmountOfSubstanceUnits.Picomole: lambda value: ((value) / 1e-12),
+        
+        AmountOfSubstanceUnits.Nanomole: lambda value: ((value) / 1e-09),
+        
+        AmountOfSubstanceUnits.Micromole: lambda value: ((value) / 1e-06),
+        
+        AmountOfSubstanceUnits.Millimole: lambda value: ((value) / 0.001),
+        
+        AmountOfSubstanceUnits.Centimole: lambda value: ((value) / 0.01),
+        
+        AmountOfSubstanceUnits.Decimole: lambda value: ((value) / 0.1),
+        
+        AmountOfSubstanceUnits.Kilomole: lambda value: ((value) / 1000.0),
+        
+        AmountOfSubstanceUnits.Megamole: lambda value: ((value) / 1000000.0),
+        
+        AmountOfSubstanceUnits.NanopoundMole: lambda value: ((value / 453.59237) / 1e-09),
+        
+        AmountOfSubstanceUnits.MicropoundMole: lambda value: ((value / 453.59237) / 1e-06),
+        
+        AmountOfSubstanceUnits.MillipoundMole: lambda value: ((value / 453.59237) / 0.001),
+        
+        AmountOfSubstanceUnits.CentipoundMole: lambda value: ((value / 453.59237) / 0.01),
+        
+        AmountOfSubstanceUnits.DecipoundMole: lambda value: ((value / 453.59237) / 0.1),
+        
+        AmountOfSubstanceUnits.KilopoundMole: lambda value: ((value / 453.59237) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: AmountOfSubstanceUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        AmountOfSubstanceUnits.Mole: lambda value: (value),
+        
+        AmountOfSubstanceUnits.PoundMole: lambda value: (value * 453.59237),
+        
+        AmountOfSubstanceUnits.Femtomole: lambda value: ((value) * 1e-15),
+        
+        AmountOfSubstanceUnits.Picomole: lambda value: ((value) * 1e-12),
         
-        if from_unit == AmountOfSubstanceUnits.Mole:
-            return (value)
+        AmountOfSubstanceUnits.Nanomole: lambda value: ((value) * 1e-09),
         
-        if from_unit == AmountOfSubstanceUnits.PoundMole:
-            return (value / 453.59237)
+        AmountOfSubstanceUnits.Micromole: lambda value: ((value) * 1e-06),
         
-        if from_unit == AmountOfSubstanceUnits.Femtomole:
-            return ((value) / 1e-15)
+        AmountOfSubstanceUnits.Millimole: lambda value: ((value) * 0.001),
         
-        if from_unit == AmountOfSubstanceUnits.Picomole:
-            return ((value) / 1e-12)
+        AmountOfSubstanceUnits.Centimole: lambda value: ((value) * 0.01),
         
-        if from_unit == AmountOfSubstanceUnits.Nanomole:
-            return ((value) / 1e-09)
+        AmountOfSubstanceUnits.Decimole: lambda value: ((value) * 0.1),
         
-        if from_unit == AmountOfSubstanceUnits.Micromole:
-            return ((value) / 1e-06)
+        AmountOfSubstanceUnits.Kilomole: lambda value: ((value) * 1000.0),
         
-        if from_unit == AmountOfSubstanceUnits.Millimole:
-            return ((value) / 0.001)
+        AmountOfSubstanceUnits.Megamole: lambda value: ((value) * 1000000.0),
         
-        if from_unit == AmountOfSubstanceUnits.Centimole:
-            return ((value) / 0.01)
+        AmountOfSubstanceUnits.NanopoundMole: lambda value: ((value * 453.59237) * 1e-09),
         
-        if from_unit == AmountOfSubstanceUnits.Decimole:
-            return ((value) / 0.1)
+        AmountOfSubstanceUnits.MicropoundMole: lambda value: ((value * 453.59237) * 1e-06),
         
-        if from_unit == AmountOfSubstanceUnits.Kilomole:
-            return ((value) / 1000.0)
+        AmountOfSubstanceUnits.MillipoundMole: lambda value: ((value * 453.59237) * 0.001),
         
-        if from_unit == AmountOfSubstanceUnits.Megamole:
-            return ((value) / 1000000.0)
+        AmountOfSubstanceUnits.CentipoundMole: lambda value: ((value * 453.59237) * 0.01),
         
-        if from_unit == AmountOfSubstanceUnits.NanopoundMole:
-            return ((value / 453.59237) / 1e-09)
+        AmountOfSubstanceUnits.DecipoundMole: lambda value: ((value * 453.59237) * 0.1),
         
-        if from_unit == AmountOfSubstanceUnits.MicropoundMole:
-            return ((value / 453.59237) / 1e-06)
+        AmountOfSubstanceUnits.KilopoundMole: lambda value: ((value * 453.59237) * 1000.0),
         
-        if from_unit == AmountOfSubstanceUnits.MillipoundMole:
-            return ((value / 453.59237) / 0.001)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        AmountOfSubstanceUnits.Mole: ('1', '0'),
+        
+        AmountOfSubstanceUnits.PoundMole: ('100000/45359237', '0'),
+        
+        AmountOfSubstanceUnits.Femtomole: ('1000000000000000', '0'),
+        
+        AmountOfSubstanceUnits.Picomole: ('1000000000000', '0'),
+        
+        AmountOfSubstanceUnits.Nanomole: ('1000000000', '0'),
+        
+        AmountOfSubstanceUnits.Micromole: ('1000000', '0'),
+        
+        AmountOfSubstanceUnits.Millimole: ('1000', '0'),
+        
+        AmountOfSubstanceUnits.Centimole: ('100', '0'),
+        
+        AmountOfSubstanceUnits.Decimole: ('10', '0'),
         
-        if from_unit == AmountOfSubstanceUnits.CentipoundMole:
-            return ((value / 453.59237) / 0.01)
+        AmountOfSubstanceUnits.Kilomole: ('1/1000', '0'),
         
-        if from_unit == AmountOfSubstanceUnits.DecipoundMole:
-            return ((value / 453.59237) / 0.1)
+        AmountOfSubstanceUnits.Megamole: ('1/1000000', '0'),
         
-        if from_unit == AmountOfSubstanceUnits.KilopoundMole:
-            return ((value / 453.59237) / 1000.0)
+        AmountOfSubstanceUnits.NanopoundMole: ('100000000000000/45359237', '0'),
         
-        return None
+        AmountOfSubstanceUnits.MicropoundMole: ('100000000000/45359237', '0'),
+        
+        AmountOfSubstanceUnits.MillipoundMole: ('100000000/45359237', '0'),
+        
+        AmountOfSubstanceUnits.CentipoundMole: ('10000000/45359237', '0'),
+        
+        AmountOfSubstanceUnits.DecipoundMole: ('1000000/45359237', '0'),
+        
+        AmountOfSubstanceUnits.KilopoundMole: ('100/45359237', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        AmountOfSubstanceUnits.Mole: ('1', '0'),
+        
+        AmountOfSubstanceUnits.PoundMole: ('45359237/100000', '0'),
+        
+        AmountOfSubstanceUnits.Femtomole: ('1/1000000000000000', '0'),
+        
+        AmountOfSubstanceUnits.Picomole: ('1/1000000000000', '0'),
+        
+        AmountOfSubstanceUnits.Nanomole: ('1/1000000000', '0'),
+        
+        AmountOfSubstanceUnits.Micromole: ('1/1000000', '0'),
+        
+        AmountOfSubstanceUnits.Millimole: ('1/1000', '0'),
+        
+        AmountOfSubstanceUnits.Centimole: ('1/100', '0'),
+        
+        AmountOfSubstanceUnits.Decimole: ('1/10', '0'),
+        
+        AmountOfSubstanceUnits.Kilomole: ('1000', '0'),
+        
+        AmountOfSubstanceUnits.Megamole: ('1000000', '0'),
+        
+        AmountOfSubstanceUnits.NanopoundMole: ('45359237/100000000000000', '0'),
+        
+        AmountOfSubstanceUnits.MicropoundMole: ('45359237/100000000000', '0'),
+        
+        AmountOfSubstanceUnits.MillipoundMole: ('45359237/100000000', '0'),
+        
+        AmountOfSubstanceUnits.CentipoundMole: ('45359237/10000000', '0'),
+        
+        AmountOfSubstanceUnits.DecipoundMole: ('45359237/1000000', '0'),
+        
+        AmountOfSubstanceUnits.KilopoundMole: ('45359237/100', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: AmountOfSubstanceUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == AmountOfSubstanceUnits.Mole:
-            return (value)
+        AmountOfSubstanceUnits.Mole: ('mol',),
         
-        if to_unit == AmountOfSubstanceUnits.PoundMole:
-            return (value * 453.59237)
+        AmountOfSubstanceUnits.PoundMole: ('lbmol',),
         
-        if to_unit == AmountOfSubstanceUnits.Femtomole:
-            return ((value) * 1e-15)
+        AmountOfSubstanceUnits.Femtomole: ('fmol',),
         
-        if to_unit == AmountOfSubstanceUnits.Picomole:
-            return ((value) * 1e-12)
+        AmountOfSubstanceUnits.Picomole: ('pmol',),
         
-        if to_unit == AmountOfSubstanceUnits.Nanomole:
-            return ((value) * 1e-09)
+        AmountOfSubstanceUnits.Nanomole: ('nmol',),
         
-        if to_unit == AmountOfSubstanceUnits.Micromole:
-            return ((value) * 1e-06)
+        AmountOfSubstanceUnits.Micromole: ('μmol',),
         
-        if to_unit == AmountOfSubstanceUnits.Millimole:
-            return ((value) * 0.001)
+        AmountOfSubstanceUnits.Millimole: ('mmol',),
         
-        if to_unit == AmountOfSubstanceUnits.Centimole:
-            return ((value) * 0.01)
+        AmountOfSubstanceUnits.Centimole: ('cmol',),
         
-        if to_unit == AmountOfSubstanceUnits.Decimole:
-            return ((value) * 0.1)
+        AmountOfSubstanceUnits.Decimole: ('dmol',),
         
-        if to_unit == AmountOfSubstanceUnits.Kilomole:
-            return ((value) * 1000.0)
+        AmountOfSubstanceUnits.Kilomole: ('kmol',),
         
-        if to_unit == AmountOfSubstanceUnits.Megamole:
-            return ((value) * 1000000.0)
+        AmountOfSubstanceUnits.Megamole: ('Mmol',),
         
-        if to_unit == AmountOfSubstanceUnits.NanopoundMole:
-            return ((value * 453.59237) * 1e-09)
+        AmountOfSubstanceUnits.NanopoundMole: ('nlbmol',),
         
-        if to_unit == AmountOfSubstanceUnits.MicropoundMole:
-            return ((value * 453.59237) * 1e-06)
+        AmountOfSubstanceUnits.MicropoundMole: ('μlbmol',),
         
-        if to_unit == AmountOfSubstanceUnits.MillipoundMole:
-            return ((value * 453.59237) * 0.001)
+        AmountOfSubstanceUnits.MillipoundMole: ('mlbmol',),
         
-        if to_unit == AmountOfSubstanceUnits.CentipoundMole:
-            return ((value * 453.59237) * 0.01)
+        AmountOfSubstanceUnits.CentipoundMole: ('clbmol',),
         
-        if to_unit == AmountOfSubstanceUnits.DecipoundMole:
-            return ((value * 453.59237) * 0.1)
+        AmountOfSubstanceUnits.DecipoundMole: ('dlbmol',),
         
-        if to_unit == AmountOfSubstanceUnits.KilopoundMole:
-            return ((value * 453.59237) * 1000.0)
+        AmountOfSubstanceUnits.KilopoundMole: ('klbmol',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: AmountOfSubstanceUnits = AmountOfSubstanceUnits.Mole):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
 
+    def convert(self, unit: AmountOfSubstanceUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: AmountOfSubstanceUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: AmountOfSubstanceUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: AmountOfSubstanceUnits, to_unit: AmountOfSubstanceUnits) -> float:
+        """
+        Convert a value from one AmountOfSubstance unit to another, without creating a AmountOfSubstance instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: AmountOfSubstanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AmountOfSubstanceUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return AmountOfSubstance._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: AmountOfSubstanceUnits, to_unit: AmountOfSubstanceUnits) -> List[float]:
+        """
+        Convert many values from one AmountOfSubstance unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: AmountOfSubstanceUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: AmountOfSubstanceUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return AmountOfSubstance._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: AmountOfSubstanceUnits, to_unit: AmountOfSubstanceUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", AmountOfSubstance._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: AmountOfSubstanceUnits, to_unit: AmountOfSubstanceUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one AmountOfSubstance unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AmountOfSubstanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AmountOfSubstanceUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return AmountOfSubstance._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: AmountOfSubstanceUnits = AmountOfSubstanceUnits.Mole) -> AmountOfSubstance:
+        """
+        Create a new instance of AmountOfSubstance holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AmountOfSubstanceUnits
+        :return: A new instance of AmountOfSubstance.
+        :rtype: AmountOfSubstance
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return AmountOfSubstance._from_exact(value, from_unit)
+
+    def to_exact(self, unit: AmountOfSubstanceUnits = AmountOfSubstanceUnits.Mole) -> Fraction:
+        """
+        Get the exact value of the AmountOfSubstance in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Mole).
+        :type unit: AmountOfSubstanceUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> AmountOfSubstance:
+        """
+        Parse a AmountOfSubstance from a value followed by a unit abbreviation, e.g. "1 mol".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of AmountOfSubstance.
+        :rtype: AmountOfSubstance
+        :raises ValueError: When the string is not a valid or an ambiguous AmountOfSubstance.
+        """
+        return AmountOfSubstance._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[AmountOfSubstance]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return AmountOfSubstance._try_parse(text)
+
+    def to_binary(self, unit: Optional[AmountOfSubstanceUnits] = None) -> bytes:
+        """
+        Encode the AmountOfSubstance to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: AmountOfSubstanceUnits
+        :return: The encoded AmountOfSubstance.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> AmountOfSubstance:
+        """
+        Decode a AmountOfSubstance encoded by to_binary.
+
+        :param data: The encoded AmountOfSubstance, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of AmountOfSubstance.
+        :rtype: AmountOfSubstance
+        :raises ValueError: When the data is not a valid encoded AmountOfSubstance.
+        """
+        return AmountOfSubstance._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[AmountOfSubstanceUnits] = None) -> dict:
+        """
+        Get the AmountOfSubstance DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Mole).
+        :type hold_in_unit: AmountOfSubstanceUnits
+        :return: The AmountOfSubstance DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[AmountOfSubstanceUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> AmountOfSubstance:
+        """
+        Create a new instance of AmountOfSubstance from its DTO.
+
+        :param dto: The AmountOfSubstance DTO, the unit is the AmountOfSubstanceUnits value or name.
+        :type dto: dict
+        :return: A new instance of AmountOfSubstance.
+        :rtype: AmountOfSubstance
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return AmountOfSubstance._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> AmountOfSubstance:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return AmountOfSubstance._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -525,10 +811,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__moles != None:
-            return self.__moles
-        self.__moles = self.__convert_from_base(AmountOfSubstanceUnits.Mole)
-        return self.__moles
+        return self._cached_convert(AmountOfSubstanceUnits.Mole)
 
     
     @property
@@ -536,10 +819,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__pound_moles != None:
-            return self.__pound_moles
-        self.__pound_moles = self.__convert_from_base(AmountOfSubstanceUnits.PoundMole)
-        return self.__pound_moles
+        return self._cached_convert(AmountOfSubstanceUnits.PoundMole)
 
     
     @property
@@ -547,10 +827,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__femtomoles != None:
-            return self.__femtomoles
-        self.__femtomoles = self.__convert_from_base(AmountOfSubstanceUnits.Femtomole)
-        return self.__femtomoles
+        return self._cached_convert(AmountOfSubstanceUnits.Femtomole)
 
     
     @property
@@ -558,10 +835,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__picomoles != None:
-            return self.__picomoles
-        self.__picomoles = self.__convert_from_base(AmountOfSubstanceUnits.Picomole)
-        return self.__picomoles
+        return self._cached_convert(AmountOfSubstanceUnits.Picomole)
 
     
     @property
@@ -569,10 +843,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__nanomoles != None:
-            return self.__nanomoles
-        self.__nanomoles = self.__convert_from_base(AmountOfSubstanceUnits.Nanomole)
-        return self.__nanomoles
+        return self._cached_convert(AmountOfSubstanceUnits.Nanomole)
 
     
     @property
@@ -580,10 +851,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__micromoles != None:
-            return self.__micromoles
-        self.__micromoles = self.__convert_from_base(AmountOfSubstanceUnits.Micromole)
-        return self.__micromoles
+        return self._cached_convert(AmountOfSubstanceUnits.Micromole)
 
     
     @property
@@ -591,10 +859,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__millimoles != None:
-            return self.__millimoles
-        self.__millimoles = self.__convert_from_base(AmountOfSubstanceUnits.Millimole)
-        return self.__millimoles
+        return self._cached_convert(AmountOfSubstanceUnits.Millimole)
 
     
     @property
@@ -602,10 +867,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__centimoles != None:
-            return self.__centimoles
-        self.__centimoles = self.__convert_from_base(AmountOfSubstanceUnits.Centimole)
-        return self.__centimoles
+        return self._cached_convert(AmountOfSubstanceUnits.Centimole)
 
     
     @property
@@ -613,10 +875,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__decimoles != None:
-            return self.__decimoles
-        self.__decimoles = self.__convert_from_base(AmountOfSubstanceUnits.Decimole)
-        return self.__decimoles
+        return self._cached_convert(AmountOfSubstanceUnits.Decimole)
 
     
     @property
@@ -624,10 +883,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__kilomoles != None:
-            return self.__kilomoles
-        self.__kilomoles = self.__convert_from_base(AmountOfSubstanceUnits.Kilomole)
-        return self.__kilomoles
+        return self._cached_convert(AmountOfSubstanceUnits.Kilomole)
 
     
     @property
@@ -635,10 +891,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__megamoles != None:
-            return self.__megamoles
-        self.__megamoles = self.__convert_from_base(AmountOfSubstanceUnits.Megamole)
-        return self.__megamoles
+        return self._cached_convert(AmountOfSubstanceUnits.Megamole)
 
     
     @property
@@ -646,10 +899,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__nanopound_moles != None:
-            return self.__nanopound_moles
-        self.__nanopound_moles = self.__convert_from_base(AmountOfSubstanceUnits.NanopoundMole)
-        return self.__nanopound_moles
+        return self._cached_convert(AmountOfSubstanceUnits.NanopoundMole)
 
     
     @property
@@ -657,10 +907,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__micropound_moles != None:
-            return self.__micropound_moles
-        self.__micropound_moles = self.__convert_from_base(AmountOfSubstanceUnits.MicropoundMole)
-        return self.__micropound_moles
+        return self._cached_convert(AmountOfSubstanceUnits.MicropoundMole)
 
     
     @property
@@ -668,10 +915,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__millipound_moles != None:
-            return self.__millipound_moles
-        self.__millipound_moles = self.__convert_from_base(AmountOfSubstanceUnits.MillipoundMole)
-        return self.__millipound_moles
+        return self._cached_convert(AmountOfSubstanceUnits.MillipoundMole)
 
     
     @property
@@ -679,10 +923,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__centipound_moles != None:
-            return self.__centipound_moles
-        self.__centipound_moles = self.__convert_from_base(AmountOfSubstanceUnits.CentipoundMole)
-        return self.__centipound_moles
+        return self._cached_convert(AmountOfSubstanceUnits.CentipoundMole)
 
     
     @property
@@ -690,10 +931,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__decipound_moles != None:
-            return self.__decipound_moles
-        self.__decipound_moles = self.__convert_from_base(AmountOfSubstanceUnits.DecipoundMole)
-        return self.__decipound_moles
+        return self._cached_convert(AmountOfSubstanceUnits.DecipoundMole)
 
     
     @property
@@ -701,10 +939,7 @@ class AmountOfSubstance(AbstractMeasure):
         """
         
         """
-        if self.__kilopound_moles != None:
-            return self.__kilopound_moles
-        self.__kilopound_moles = self.__convert_from_base(AmountOfSubstanceUnits.KilopoundMole)
-        return self.__kilopound_moles
+        return self._cached_convert(AmountOfSubstanceUnits.KilopoundMole)
 
     
     def to_string(self, unit: AmountOfSubstanceUnits = AmountOfSubstanceUnits.Mole) -> str:
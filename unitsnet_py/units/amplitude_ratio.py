@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class AmplitudeRatioUnits(Enum):
         """
             AmplitudeRatioUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         DecibelVolt = 'decibel_volt'
         """
@@ -39,57 +50,280 @@ class AmplitudeRatio(AbstractMeasure):
         value (float): The value.
         from_unit (AmplitudeRatioUnits): The AmplitudeRatio unit to create from, The default unit is DecibelVolt
     """
-    def __init__(self, value: float, from_unit: AmplitudeRatioUnits = AmplitudeRatioUnits.DecibelVolt):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = AmplitudeRatioUnits
+
+    _base_unit = AmplitudeRatioUnits.DecibelVolt
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 3
+
+    _binary_unit_ids = {
         
-        self.__decibel_volts = None
+        AmplitudeRatioUnits.DecibelVolt: 0,
         
-        self.__decibel_microvolts = None
+        AmplitudeRatioUnits.DecibelMicrovolt: 1,
         
-        self.__decibel_millivolts = None
+        AmplitudeRatioUnits.DecibelMillivolt: 2,
         
-        self.__decibels_unloaded = None
+        AmplitudeRatioUnits.DecibelUnloaded: 3,
         
+    }
 
-    def convert(self, unit: AmplitudeRatioUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        AmplitudeRatioUnits.DecibelVolt: lambda value: (value),
+        
+        AmplitudeRatioUnits.DecibelMicrovolt: lambda value: (value + 120),
+        
+        AmplitudeRatioUnits.DecibelMillivolt: lambda value: (value + 60),
+        
+        AmplitudeRatioUnits.DecibelUnloaded: lambda value: (value + 2.218487499),
+        
+    }
 
-    def __convert_from_base(self, from_unit: AmplitudeRatioUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == AmplitudeRatioUnits.DecibelVolt:
-            return (value)
+        AmplitudeRatioUnits.DecibelVolt: lambda value: (value),
         
-        if from_unit == AmplitudeRatioUnits.DecibelMicrovolt:
-            return (value + 120)
+        AmplitudeRatioUnits.DecibelMicrovolt: lambda value: (value - 120),
         
-        if from_unit == AmplitudeRatioUnits.DecibelMillivolt:
-            return (value + 60)
+        AmplitudeRatioUnits.DecibelMillivolt: lambda value: (value - 60),
         
-        if from_unit == AmplitudeRatioUnits.DecibelUnloaded:
-            return (value + 2.218487499)
+        AmplitudeRatioUnits.DecibelUnloaded: lambda value: (value - 2.218487499),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        AmplitudeRatioUnits.DecibelVolt: ('1', '0'),
+        
+        AmplitudeRatioUnits.DecibelMicrovolt: ('1', '120'),
+        
+        AmplitudeRatioUnits.DecibelMillivolt: ('1', '60'),
+        
+        AmplitudeRatioUnits.DecibelUnloaded: ('1', '2218487499/1000000000'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: AmplitudeRatioUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == AmplitudeRatioUnits.DecibelVolt:
-            return (value)
+        AmplitudeRatioUnits.DecibelVolt: ('1', '0'),
         
-        if to_unit == AmplitudeRatioUnits.DecibelMicrovolt:
-            return (value - 120)
+        AmplitudeRatioUnits.DecibelMicrovolt: ('1', '-120'),
         
-        if to_unit == AmplitudeRatioUnits.DecibelMillivolt:
-            return (value - 60)
+        AmplitudeRatioUnits.DecibelMillivolt: ('1', '-60'),
         
-        if to_unit == AmplitudeRatioUnits.DecibelUnloaded:
-            return (value - 2.218487499)
+        AmplitudeRatioUnits.DecibelUnloaded: ('1', '-2218487499/1000000000'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        AmplitudeRatioUnits.DecibelVolt: ('dBV',),
+        
+        AmplitudeRatioUnits.DecibelMicrovolt: ('dBµV',),
+        
+        AmplitudeRatioUnits.DecibelMillivolt: ('dBmV',),
+        
+        AmplitudeRatioUnits.DecibelUnloaded: ('dBu',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: AmplitudeRatioUnits = AmplitudeRatioUnits.DecibelVolt):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: AmplitudeRatioUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: AmplitudeRatioUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: AmplitudeRatioUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: AmplitudeRatioUnits, to_unit: AmplitudeRatioUnits) -> float:
+        """
+        Convert a value from one AmplitudeRatio unit to another, without creating a AmplitudeRatio instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: AmplitudeRatioUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AmplitudeRatioUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return AmplitudeRatio._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: AmplitudeRatioUnits, to_unit: AmplitudeRatioUnits) -> List[float]:
+        """
+        Convert many values from one AmplitudeRatio unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: AmplitudeRatioUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: AmplitudeRatioUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return AmplitudeRatio._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: AmplitudeRatioUnits, to_unit: AmplitudeRatioUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", AmplitudeRatio._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: AmplitudeRatioUnits, to_unit: AmplitudeRatioUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one AmplitudeRatio unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AmplitudeRatioUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AmplitudeRatioUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return AmplitudeRatio._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: AmplitudeRatioUnits = AmplitudeRatioUnits.DecibelVolt) -> AmplitudeRatio:
+        """
+        Create a new instance of AmplitudeRatio holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AmplitudeRatioUnits
+        :return: A new instance of AmplitudeRatio.
+        :rtype: AmplitudeRatio
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return AmplitudeRatio._from_exact(value, from_unit)
+
+    def to_exact(self, unit: AmplitudeRatioUnits = AmplitudeRatioUnits.DecibelVolt) -> Fraction:
+        """
+        Get the exact value of the AmplitudeRatio in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (DecibelVolt).
+        :type unit: AmplitudeRatioUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> AmplitudeRatio:
+        """
+        Parse a AmplitudeRatio from a value followed by a unit abbreviation, e.g. "1 dBV".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of AmplitudeRatio.
+        :rtype: AmplitudeRatio
+        :raises ValueError: When the string is not a valid or an ambiguous AmplitudeRatio.
+        """
+        return AmplitudeRatio._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[AmplitudeRatio]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return AmplitudeRatio._try_parse(text)
+
+    def to_binary(self, unit: Optional[AmplitudeRatioUnits] = None) -> bytes:
+        """
+        Encode the AmplitudeRatio to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: AmplitudeRatioUnits
+        :return: The encoded AmplitudeRatio.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> AmplitudeRatio:
+        """
+        Decode a AmplitudeRatio encoded by to_binary.
+
+        :param data: The encoded AmplitudeRatio, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of AmplitudeRatio.
+        :rtype: AmplitudeRatio
+        :raises ValueError: When the data is not a valid encoded AmplitudeRatio.
+        """
+        return AmplitudeRatio._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[AmplitudeRatioUnits] = None) -> dict:
+        """
+        Get the AmplitudeRatio DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (DecibelVolt).
+        :type hold_in_unit: AmplitudeRatioUnits
+        :return: The AmplitudeRatio DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[AmplitudeRatioUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> AmplitudeRatio:
+        """
+        Create a new instance of AmplitudeRatio from its DTO.
+
+        :param dto: The AmplitudeRatio DTO, the unit is the AmplitudeRatioUnits value or name.
+        :type dto: dict
+        :return: A new instance of AmplitudeRatio.
+        :rtype: AmplitudeRatio
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return AmplitudeRatio._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> AmplitudeRatio:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return AmplitudeRatio._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -161,10 +395,7 @@ class AmplitudeRatio(AbstractMeasure):
         """
         
         """
-        if self.__decibel_volts != None:
-            return self.__decibel_volts
-        self.__decibel_volts = self.__convert_from_base(AmplitudeRatioUnits.DecibelVolt)
-        return self.__decibel_volts
+        return self._cached_convert(AmplitudeRatioUnits.DecibelVolt)
 
     
     @property
@@ -172,10 +403,7 @@ class AmplitudeRatio(AbstractMeasure):
         """
         
         """
-        if self.__decibel_microvolts != None:
-            return self.__decibel_microvolts
-        self.__decibel_microvolts = self.__convert_from_base(AmplitudeRatioUnits.DecibelMicrovolt)
-        return self.__decibel_microvolts
+        return self._cached_convert(AmplitudeRatioUnits.DecibelMicrovolt)
 
     
     @property
@@ -183,10 +411,7 @@ class AmplitudeRatio(AbstractMeasure):
         """
         
         """
-        if self.__decibel_millivolts != None:
-            return self.__decibel_millivolts
-        self.__decibel_millivolts = self.__convert_from_base(AmplitudeRatioUnits.DecibelMillivolt)
-        return self.__decibel_millivolts
+        return self._cached_convert(AmplitudeRatioUnits.DecibelMillivolt)
 
     
     @property
@@ -194,10 +419,7 @@ class AmplitudeRatio(AbstractMeasure):
         """
         
         """
-        if self.__decibels_unloaded != None:
-            return self.__decibels_unloaded
-        self.__decibels_unloaded = self.__convert_from_base(AmplitudeRatioUnits.DecibelUnloaded)
-        return self.__decibels_unloaded
+        return self._cached_convert(AmplitudeRatioUnits.DecibelUnloaded)
 
     
     def to_string(self, unit: AmplitudeRatioUnits = AmplitudeRatioUnits.DecibelVolt) -> str:
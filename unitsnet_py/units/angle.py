@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class AngleUnits(Enum):
         """
             AngleUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Radian = 'radian'
         """
@@ -99,153 +110,420 @@ class Angle(AbstractMeasure):
         value (float): The value.
         from_unit (AngleUnits): The Angle unit to create from, The default unit is Degree
     """
-    def __init__(self, value: float, from_unit: AngleUnits = AngleUnits.Degree):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = AngleUnits
+
+    _base_unit = AngleUnits.Degree
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 4
+
+    _binary_unit_ids = {
         
-        self.__radians = None
+        AngleUnits.Radian: 0,
         
-        self.__degrees = None
+        AngleUnits.Degree: 1,
         
-        self.__arcminutes = None
+        AngleUnits.Arcminute: 2,
         
-        self.__arcseconds = None
+        AngleUnits.Arcsecond: 3,
         
-        self.__gradians = None
+        AngleUnits.Gradian: 4,
         
-        self.__nato_mils = None
+        AngleUnits.NatoMil: 5,
         
-        self.__revolutions = None
+        AngleUnits.Revolution: 6,
         
-        self.__tilt = None
+        AngleUnits.Tilt: 7,
         
-        self.__nanoradians = None
+        AngleUnits.Nanoradian: 8,
         
-        self.__microradians = None
+        AngleUnits.Microradian: 9,
         
-        self.__milliradians = None
+        AngleUnits.Milliradian: 10,
         
-        self.__centiradians = None
+        AngleUnits.Centiradian: 11,
         
-        self.__deciradians = None
+        AngleUnits.Deciradian: 12,
         
-        self.__nanodegrees = None
+        AngleUnits.Nanodegree: 13,
         
-        self.__microdegrees = None
+        AngleUnits.Microdegree: 14,
         
-        self.__millidegrees = None
+        AngleUnits.Millidegree: 15,
         
+    }
 
-    def convert(self, unit: AngleUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        AngleUnits.Radian: lambda value: (value / 180 * math.pi),
+        
+        AngleUnits.Degree: lambda value: (value),
+        
+        AngleUnits.Arcminute: lambda value: (value * 60),
+        
+        AngleUnits.Arcsecond: lambda value: (value * 3600),
+        
+        AngleUnits.Gradian: lambda value: (value / 0.9),
+        
+        AngleUnits.NatoMil: lambda value: (value * 160 / 9),
+        
+        AngleUnits.Revolution: lambda value: (value / 360),
+        
+        AngleUnits.Tilt: lambda value: (math.sin(value / 180 * math.pi)),
+        
+        AngleUnits.Nanoradian: lambda value: ((value / 180 * math.pi) / 1e-09),
+        
+        AngleUnits.Microradian: lambda value: ((value / 180 * math.pi) / 1e-06),
+        
+        AngleUnits.Milliradian: lambda value: ((value / 180 * math.pi) / 0.001),
+        
+        AngleUnits.Centiradian: lambda value: ((value / 180 * math.pi) / 0.01),
+        
+        AngleUnits.Deciradian: lambda value: ((value / 180 * math.pi) / 0.1),
+        
+        AngleUnits.Nanodegree: lambda value: ((value) / 1e-09),
+        
+        AngleUnits.Microdegree: lambda value: ((value) / 1e-06),
+        
+        AngleUnits.Millidegree: lambda value: ((value) / 0.001),
+        
+    }
 
-    def __convert_from_base(self, from_unit: AngleUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        AngleUnits.Radian: lambda value: (value * 180 / math.pi),
+        
+        AngleUnits.Degree: lambda value: (value),
+        
+        AngleUnits.Arcminute: lambda value: (value / 60),
+        
+        AngleUnits.Arcsecond: lambda value: (value / 3600),
         
-        if from_unit == AngleUnits.Radian:
-            return (value / 180 * math.pi)
+        AngleUnits.Gradian: lambda value: (value * 0.9),
         
-        if from_unit == AngleUnits.Degree:
-            return (value)
+        AngleUnits.NatoMil: lambda value: (value * 9 / 160),
         
-        if from_unit == AngleUnits.Arcminute:
-            return (value * 60)
+        AngleUnits.Revolution: lambda value: (value * 360),
         
-        if from_unit == AngleUnits.Arcsecond:
-            return (value * 3600)
+        AngleUnits.Tilt: lambda value: (math.asin(value) * 180 / math.pi),
         
-        if from_unit == AngleUnits.Gradian:
-            return (value / 0.9)
+        AngleUnits.Nanoradian: lambda value: ((value * 180 / math.pi) * 1e-09),
         
-        if from_unit == AngleUnits.NatoMil:
-            return (value * 160 / 9)
+        AngleUnits.Microradian: lambda value: ((value * 180 / math.pi) * 1e-06),
         
-        if from_unit == AngleUnits.Revolution:
-            return (value / 360)
+        AngleUnits.Milliradian: lambda value: ((value * 180 / math.pi) * 0.001),
         
-        if from_unit == AngleUnits.Tilt:
-            return (math.sin(value / 180 * math.pi))
+        AngleUnits.Centiradian: lambda value: ((value * 180 / math.pi) * 0.01),
         
-        if from_unit == AngleUnits.Nanoradian:
-            return ((value / 180 * math.pi) / 1e-09)
+        AngleUnits.Deciradian: lambda value: ((value * 180 / math.pi) * 0.1),
         
-        if from_unit == AngleUnits.Microradian:
-            return ((value / 180 * math.pi) / 1e-06)
+        AngleUnits.Nanodegree: lambda value: ((value) * 1e-09),
         
-        if from_unit == AngleUnits.Milliradian:
-            return ((value / 180 * math.pi) / 0.001)
+        AngleUnits.Microdegree: lambda value: ((value) * 1e-06),
         
-        if from_unit == AngleUnits.Centiradian:
-            return ((value / 180 * math.pi) / 0.01)
+        AngleUnits.Millidegree: lambda value: ((value) * 0.001),
         
-        if from_unit == AngleUnits.Deciradian:
-            return ((value / 180 * math.pi) / 0.1)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        AngleUnits.Radian: ('0.017453292519943295', '0'),
+        
+        AngleUnits.Degree: ('1', '0'),
+        
+        AngleUnits.Arcminute: ('60', '0'),
+        
+        AngleUnits.Arcsecond: ('3600', '0'),
+        
+        AngleUnits.Gradian: ('10/9', '0'),
+        
+        AngleUnits.NatoMil: ('160/9', '0'),
+        
+        AngleUnits.Revolution: ('1/360', '0'),
+        
+        AngleUnits.Nanoradian: ('17453292.519943293', '0'),
+        
+        AngleUnits.Microradian: ('17453.292519943298', '0'),
         
-        if from_unit == AngleUnits.Nanodegree:
-            return ((value) / 1e-09)
+        AngleUnits.Milliradian: ('17.453292519943297', '0'),
         
-        if from_unit == AngleUnits.Microdegree:
-            return ((value) / 1e-06)
+        AngleUnits.Centiradian: ('1.7453292519943295', '0'),
         
-        if from_unit == AngleUnits.Millidegree:
-            return ((value) / 0.001)
+        AngleUnits.Deciradian: ('0.17453292519943295', '0'),
         
-        return None
+        AngleUnits.Nanodegree: ('1000000000', '0'),
+        
+        AngleUnits.Microdegree: ('1000000', '0'),
+        
+        AngleUnits.Millidegree: ('1000', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        AngleUnits.Radian: ('57.29577951308232', '0'),
+        
+        AngleUnits.Degree: ('1', '0'),
+        
+        AngleUnits.Arcminute: ('1/60', '0'),
+        
+        AngleUnits.Arcsecond: ('1/3600', '0'),
+        
+        AngleUnits.Gradian: ('9/10', '0'),
+        
+        AngleUnits.NatoMil: ('9/160', '0'),
+        
+        AngleUnits.Revolution: ('360', '0'),
+        
+        AngleUnits.Nanoradian: ('5.7295779513082324e-08', '0'),
+        
+        AngleUnits.Microradian: ('5.729577951308232e-05', '0'),
+        
+        AngleUnits.Milliradian: ('0.057295779513082325', '0'),
+        
+        AngleUnits.Centiradian: ('0.5729577951308232', '0'),
+        
+        AngleUnits.Deciradian: ('5.729577951308233', '0'),
+        
+        AngleUnits.Nanodegree: ('1/1000000000', '0'),
+        
+        AngleUnits.Microdegree: ('1/1000000', '0'),
+        
+        AngleUnits.Millidegree: ('1/1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: AngleUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == AngleUnits.Radian:
-            return (value * 180 / math.pi)
+        AngleUnits.Radian: ('rad',),
         
-        if to_unit == AngleUnits.Degree:
-            return (value)
+        AngleUnits.Degree: ('°',),
         
-        if to_unit == AngleUnits.Arcminute:
-            return (value / 60)
+        AngleUnits.Arcminute: ("'",),
         
-        if to_unit == AngleUnits.Arcsecond:
-            return (value / 3600)
+        AngleUnits.Arcsecond: ('″',),
         
-        if to_unit == AngleUnits.Gradian:
-            return (value * 0.9)
+        AngleUnits.Gradian: ('g',),
         
-        if to_unit == AngleUnits.NatoMil:
-            return (value * 9 / 160)
+        AngleUnits.NatoMil: ('mil',),
         
-        if to_unit == AngleUnits.Revolution:
-            return (value * 360)
+        AngleUnits.Revolution: ('r',),
         
-        if to_unit == AngleUnits.Tilt:
-            return (math.asin(value) * 180 / math.pi)
+        AngleUnits.Tilt: ('sin(θ)',),
         
-        if to_unit == AngleUnits.Nanoradian:
-            return ((value * 180 / math.pi) * 1e-09)
+        AngleUnits.Nanoradian: ('nrad',),
         
-        if to_unit == AngleUnits.Microradian:
-            return ((value * 180 / math.pi) * 1e-06)
+        AngleUnits.Microradian: ('μrad',),
         
-        if to_unit == AngleUnits.Milliradian:
-            return ((value * 180 / math.pi) * 0.001)
+        AngleUnits.Milliradian: ('mrad',),
         
-        if to_unit == AngleUnits.Centiradian:
-            return ((value * 180 / math.pi) * 0.01)
+        AngleUnits.Centiradian: ('crad',),
         
-        if to_unit == AngleUnits.Deciradian:
-            return ((value * 180 / math.pi) * 0.1)
+        AngleUnits.Deciradian: ('drad',),
         
-        if to_unit == AngleUnits.Nanodegree:
-            return ((value) * 1e-09)
+        AngleUnits.Nanodegree: ('n°',),
         
-        if to_unit == AngleUnits.Microdegree:
-            return ((value) * 1e-06)
+        AngleUnits.Microdegree: ('μ°',),
         
-        if to_unit == AngleUnits.Millidegree:
-            return ((value) * 0.001)
+        AngleUnits.Millidegree: ('m°',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: AngleUnits = AngleUnits.Degree):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: AngleUnits) -> float:
+        return self.__convert_from_base(unit)
 
+    def __convert_from_base(self, from_unit: AngleUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: AngleUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: AngleUnits, to_unit: AngleUnits) -> float:
+        """
+        Convert a value from one Angle unit to another, without creating a Angle instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: AngleUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AngleUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Angle._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: AngleUnits, to_unit: AngleUnits) -> List[float]:
+        """
+        Convert many values from one Angle unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: AngleUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: AngleUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Angle._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: AngleUnits, to_unit: AngleUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Angle._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: AngleUnits, to_unit: AngleUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Angle unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AngleUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AngleUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Angle._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: AngleUnits = AngleUnits.Degree) -> Angle:
+        """
+        Create a new instance of Angle holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AngleUnits
+        :return: A new instance of Angle.
+        :rtype: Angle
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Angle._from_exact(value, from_unit)
+
+    def to_exact(self, unit: AngleUnits = AngleUnits.Degree) -> Fraction:
+        """
+        Get the exact value of the Angle in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Degree).
+        :type unit: AngleUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Angle:
+        """
+        Parse a Angle from a value followed by a unit abbreviation, e.g. "1 rad".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Angle.
+        :rtype: Angle
+        :raises ValueError: When the string is not a valid or an ambiguous Angle.
+        """
+        return Angle._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Angle]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Angle._try_parse(text)
+
+    def to_binary(self, unit: Optional[AngleUnits] = None) -> bytes:
+        """
+        Encode the Angle to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: AngleUnits
+        :return: The encoded Angle.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Angle:
+        """
+        Decode a Angle encoded by to_binary.
+
+        :param data: The encoded Angle, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Angle.
+        :rtype: Angle
+        :raises ValueError: When the data is not a valid encoded Angle.
+        """
+        return Angle._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[AngleUnits] = None) -> dict:
+        """
+        Get the Angle DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Degree).
+        :type hold_in_unit: AngleUnits
+        :return: The Angle DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[AngleUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Angle:
+        """
+        Create a new instance of Angle from its DTO.
+
+        :param dto: The Angle DTO, the unit is the AngleUnits value or name.
+        :type dto: dict
+        :return: A new instance of Angle.
+        :rtype: Angle
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Angle._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Angle:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Angle._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -497,10 +775,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__radians != None:
-            return self.__radians
-        self.__radians = self.__convert_from_base(AngleUnits.Radian)
-        return self.__radians
+        return self._cached_convert(AngleUnits.Radian)
 
     
     @property
@@ -508,10 +783,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__degrees != None:
-            return self.__degrees
-        self.__degrees = self.__convert_from_base(AngleUnits.Degree)
-        return self.__degrees
+        return self._cached_convert(AngleUnits.Degree)
 
     
     @property
@@ -519,10 +791,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__arcminutes != None:
-            return self.__arcminutes
-        self.__arcminutes = self.__convert_from_base(AngleUnits.Arcminute)
-        return self.__arcminutes
+        return self._cached_convert(AngleUnits.Arcminute)
 
     
     @property
@@ -530,10 +799,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__arcseconds != None:
-            return self.__arcseconds
-        self.__arcseconds = self.__convert_from_base(AngleUnits.Arcsecond)
-        return self.__arcseconds
+        return self._cached_convert(AngleUnits.Arcsecond)
 
     
     @property
@@ -541,10 +807,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__gradians != None:
-            return self.__gradians
-        self.__gradians = self.__convert_from_base(AngleUnits.Gradian)
-        return self.__gradians
+        return self._cached_convert(AngleUnits.Gradian)
 
     
     @property
@@ -552,10 +815,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__nato_mils != None:
-            return self.__nato_mils
-        self.__nato_mils = self.__convert_from_base(AngleUnits.NatoMil)
-        return self.__nato_mils
+        return self._cached_convert(AngleUnits.NatoMil)
 
     
     @property
@@ -563,10 +823,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__revolutions != None:
-            return self.__revolutions
-        self.__revolutions = self.__convert_from_base(AngleUnits.Revolution)
-        return self.__revolutions
+        return self._cached_convert(AngleUnits.Revolution)
 
     
     @property
@@ -574,10 +831,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__tilt != None:
-            return self.__tilt
-        self.__tilt = self.__convert_from_base(AngleUnits.Tilt)
-        return self.__tilt
+        return self._cached_convert(AngleUnits.Tilt)
 
     
     @property
@@ -585,10 +839,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__nanoradians != None:
-            return self.__nanoradians
-        self.__nanoradians = self.__convert_from_base(AngleUnits.Nanoradian)
-        return self.__nanoradians
+        return self._cached_convert(AngleUnits.Nanoradian)
 
     
     @property
@@ -596,10 +847,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__microradians != None:
-            return self.__microradians
-        self.__microradians = self.__convert_from_base(AngleUnits.Microradian)
-        return self.__microradians
+        return self._cached_convert(AngleUnits.Microradian)
 
     
     @property
@@ -607,10 +855,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__milliradians != None:
-            return self.__milliradians
-        self.__milliradians = self.__convert_from_base(AngleUnits.Milliradian)
-        return self.__milliradians
+        return self._cached_convert(AngleUnits.Milliradian)
 
     
     @property
@@ -618,10 +863,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__centiradians != None:
-            return self.__centiradians
-        self.__centiradians = self.__convert_from_base(AngleUnits.Centiradian)
-        return self.__centiradians
+        return self._cached_convert(AngleUnits.Centiradian)
 
     
     @property
@@ -629,10 +871,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__deciradians != None:
-            return self.__deciradians
-        self.__deciradians = self.__convert_from_base(AngleUnits.Deciradian)
-        return self.__deciradians
+        return self._cached_convert(AngleUnits.Deciradian)
 
     
     @property
@@ -640,10 +879,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__nanodegrees != None:
-            return self.__nanodegrees
-        self.__nanodegrees = self.__convert_from_base(AngleUnits.Nanodegree)
-        return self.__nanodegrees
+        return self._cached_convert(AngleUnits.Nanodegree)
 
     
     @property
@@ -651,10 +887,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__microdegrees != None:
-            return self.__microdegrees
-        self.__microdegrees = self.__convert_from_base(AngleUnits.Microdegree)
-        return self.__microdegrees
+        return self._cached_convert(AngleUnits.Microdegree)
 
     
     @property
@@ -662,10 +895,7 @@ class Angle(AbstractMeasure):
         """
         
         """
-        if self.__millidegrees != None:
-            return self.__millidegrees
-        self.__millidegrees = self.__convert_from_base(AngleUnits.Millidegree)
-        return self.__millidegrees
+        return self._cached_convert(AngleUnits.Millidegree)
 
     
     def to_string(self, unit: AngleUnits = AngleUnits.Degree) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ApparentEnergyUnits(Enum):
         """
             ApparentEnergyUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         VoltampereHour = 'voltampere_hour'
         """
@@ -34,49 +45,268 @@ class ApparentEnergy(AbstractMeasure):
         value (float): The value.
         from_unit (ApparentEnergyUnits): The ApparentEnergy unit to create from, The default unit is VoltampereHour
     """
-    def __init__(self, value: float, from_unit: ApparentEnergyUnits = ApparentEnergyUnits.VoltampereHour):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ApparentEnergyUnits
+
+    _base_unit = ApparentEnergyUnits.VoltampereHour
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 5
+
+    _binary_unit_ids = {
         
-        self.__voltampere_hours = None
+        ApparentEnergyUnits.VoltampereHour: 0,
         
-        self.__kilovoltampere_hours = None
+        ApparentEnergyUnits.KilovoltampereHour: 1,
         
-        self.__megavoltampere_hours = None
+        ApparentEnergyUnits.MegavoltampereHour: 2,
         
+    }
 
-    def convert(self, unit: ApparentEnergyUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ApparentEnergyUnits.VoltampereHour: lambda value: (value),
+        
+        ApparentEnergyUnits.KilovoltampereHour: lambda value: ((value) / 1000.0),
+        
+        ApparentEnergyUnits.MegavoltampereHour: lambda value: ((value) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ApparentEnergyUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ApparentEnergyUnits.VoltampereHour:
-            return (value)
+        ApparentEnergyUnits.VoltampereHour: lambda value: (value),
         
-        if from_unit == ApparentEnergyUnits.KilovoltampereHour:
-            return ((value) / 1000.0)
+        ApparentEnergyUnits.KilovoltampereHour: lambda value: ((value) * 1000.0),
         
-        if from_unit == ApparentEnergyUnits.MegavoltampereHour:
-            return ((value) / 1000000.0)
+        ApparentEnergyUnits.MegavoltampereHour: lambda value: ((value) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ApparentEnergyUnits.VoltampereHour: ('1', '0'),
+        
+        ApparentEnergyUnits.KilovoltampereHour: ('1/1000', '0'),
+        
+        ApparentEnergyUnits.MegavoltampereHour: ('1/1000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ApparentEnergyUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == ApparentEnergyUnits.VoltampereHour:
-            return (value)
+        ApparentEnergyUnits.VoltampereHour: ('1', '0'),
         
-        if to_unit == ApparentEnergyUnits.KilovoltampereHour:
-            return ((value) * 1000.0)
+        ApparentEnergyUnits.KilovoltampereHour: ('1000', '0'),
+        
+        ApparentEnergyUnits.MegavoltampereHour: ('1000000', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ApparentEnergyUnits.MegavoltampereHour:
-            return ((value) * 1000000.0)
+        ApparentEnergyUnits.VoltampereHour: ('VAh',),
         
-        return None
+        ApparentEnergyUnits.KilovoltampereHour: ('kVAh',),
+        
+        ApparentEnergyUnits.MegavoltampereHour: ('MVAh',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ApparentEnergyUnits = ApparentEnergyUnits.VoltampereHour):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ApparentEnergyUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ApparentEnergyUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ApparentEnergyUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ApparentEnergyUnits, to_unit: ApparentEnergyUnits) -> float:
+        """
+        Convert a value from one ApparentEnergy unit to another, without creating a ApparentEnergy instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ApparentEnergyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ApparentEnergyUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ApparentEnergy._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ApparentEnergyUnits, to_unit: ApparentEnergyUnits) -> List[float]:
+        """
+        Convert many values from one ApparentEnergy unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ApparentEnergyUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ApparentEnergyUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ApparentEnergy._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ApparentEnergyUnits, to_unit: ApparentEnergyUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ApparentEnergy._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ApparentEnergyUnits, to_unit: ApparentEnergyUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ApparentEnergy unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ApparentEnergyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ApparentEnergyUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ApparentEnergy._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ApparentEnergyUnits = ApparentEnergyUnits.VoltampereHour) -> ApparentEnergy:
+        """
+        Create a new instance of ApparentEnergy holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ApparentEnergyUnits
+        :return: A new instance of ApparentEnergy.
+        :rtype: ApparentEnergy
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ApparentEnergy._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ApparentEnergyUnits = ApparentEnergyUnits.VoltampereHour) -> Fraction:
+        """
+        Get the exact value of the ApparentEnergy in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (VoltampereHour).
+        :type unit: ApparentEnergyUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ApparentEnergy:
+        """
+        Parse a ApparentEnergy from a value followed by a unit abbreviation, e.g. "1 VAh".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ApparentEnergy.
+        :rtype: ApparentEnergy
+        :raises ValueError: When the string is not a valid or an ambiguous ApparentEnergy.
+        """
+        return ApparentEnergy._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ApparentEnergy]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ApparentEnergy._try_parse(text)
 
+    def to_binary(self, unit: Optional[ApparentEnergyUnits] = None) -> bytes:
+        """
+        Encode the ApparentEnergy to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ApparentEnergyUnits
+        :return: The encoded ApparentEnergy.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ApparentEnergy:
+        """
+        Decode a ApparentEnergy encoded by to_binary.
+
+        :param data: The encoded ApparentEnergy, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ApparentEnergy.
+        :rtype: ApparentEnergy
+        :raises ValueError: When the data is not a valid encoded ApparentEnergy.
+        """
+        return ApparentEnergy._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ApparentEnergyUnits] = None) -> dict:
+        """
+        Get the ApparentEnergy DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (VoltampereHour).
+        :type hold_in_unit: ApparentEnergyUnits
+        :return: The ApparentEnergy DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ApparentEnergyUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ApparentEnergy:
+        """
+        Create a new instance of ApparentEnergy from its DTO.
+
+        :param dto: The ApparentEnergy DTO, the unit is the ApparentEnergyUnits value or name.
+        :type dto: dict
+        :return: A new instance of ApparentEnergy.
+        :rtype: ApparentEnergy
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ApparentEnergy._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ApparentEnergy:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ApparentEnergy._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -133,10 +363,7 @@ class ApparentEnergy(AbstractMeasure):
         """
         
         """
-        if self.__voltampere_hours != None:
-            return self.__voltampere_hours
-        self.__voltampere_hours = self.__convert_from_base(ApparentEnergyUnits.VoltampereHour)
-        return self.__voltampere_hours
+        return self._cached_convert(ApparentEnergyUnits.VoltampereHour)
 
     
     @property
@@ -144,10 +371,7 @@ class ApparentEnergy(AbstractMeasure):
         """
         
         """
-        if self.__kilovoltampere_hours != None:
-            return self.__kilovoltampere_hours
-        self.__kilovoltampere_hours = self.__convert_from_base(ApparentEnergyUnits.KilovoltampereHour)
-        return self.__kilovoltampere_hours
+        return self._cached_convert(ApparentEnergyUnits.KilovoltampereHour)
 
     
     @property
@@ -155,10 +379,7 @@ class ApparentEnergy(AbstractMeasure):
         """
         
         """
-        if self.__megavoltampere_hours != None:
-            return self.__megavoltampere_hours
-        self.__megavoltampere_hours = self.__convert_from_base(ApparentEnergyUnits.MegavoltampereHour)
-        return self.__megavoltampere_hours
+        return self._cached_convert(ApparentEnergyUnits.MegavoltampereHour)
 
     
     def to_string(self, unit: ApparentEnergyUnits = ApparentEnergyUnits.VoltampereHour) -> str:
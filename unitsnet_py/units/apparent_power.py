@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ApparentPowerUnits(Enum):
         """
             ApparentPowerUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Voltampere = 'voltampere'
         """
@@ -49,73 +60,304 @@ class ApparentPower(AbstractMeasure):
         value (float): The value.
         from_unit (ApparentPowerUnits): The ApparentPower unit to create from, The default unit is Voltampere
     """
-    def __init__(self, value: float, from_unit: ApparentPowerUnits = ApparentPowerUnits.Voltampere):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ApparentPowerUnits
+
+    _base_unit = ApparentPowerUnits.Voltampere
+
+    _dimensions = (2, 1, -3, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 6
+
+    _binary_unit_ids = {
         
-        self.__voltamperes = None
+        ApparentPowerUnits.Voltampere: 0,
         
-        self.__microvoltamperes = None
+        ApparentPowerUnits.Microvoltampere: 1,
         
-        self.__millivoltamperes = None
+        ApparentPowerUnits.Millivoltampere: 2,
         
-        self.__kilovoltamperes = None
+        ApparentPowerUnits.Kilovoltampere: 3,
         
-        self.__megavoltamperes = None
+        ApparentPowerUnits.Megavoltampere: 4,
         
-        self.__gigavoltamperes = None
+        ApparentPowerUnits.Gigavoltampere: 5,
         
+    }
 
-    def convert(self, unit: ApparentPowerUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ApparentPowerUnits.Voltampere: lambda value: (value),
+        
+        ApparentPowerUnits.Microvoltampere: lambda value: ((value) / 1e-06),
+        
+        ApparentPowerUnits.Millivoltampere: lambda value: ((value) / 0.001),
+        
+        ApparentPowerUnits.Kilovoltampere: lambda value: ((value) / 1000.0),
+        
+        ApparentPowerUnits.Megavoltampere: lambda value: ((value) / 1000000.0),
+        
+        ApparentPowerUnits.Gigavoltampere: lambda value: ((value) / 1000000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ApparentPowerUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        ApparentPowerUnits.Voltampere: lambda value: (value),
+        
+        ApparentPowerUnits.Microvoltampere: lambda value: ((value) * 1e-06),
+        
+        ApparentPowerUnits.Millivoltampere: lambda value: ((value) * 0.001),
+        
+        ApparentPowerUnits.Kilovoltampere: lambda value: ((value) * 1000.0),
+        
+        ApparentPowerUnits.Megavoltampere: lambda value: ((value) * 1000000.0),
+        
+        ApparentPowerUnits.Gigavoltampere: lambda value: ((value) * 1000000000.0),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
         
-        if from_unit == ApparentPowerUnits.Voltampere:
-            return (value)
+        ApparentPowerUnits.Voltampere: ('1', '0'),
         
-        if from_unit == ApparentPowerUnits.Microvoltampere:
-            return ((value) / 1e-06)
+        ApparentPowerUnits.Microvoltampere: ('1000000', '0'),
         
-        if from_unit == ApparentPowerUnits.Millivoltampere:
-            return ((value) / 0.001)
+        ApparentPowerUnits.Millivoltampere: ('1000', '0'),
         
-        if from_unit == ApparentPowerUnits.Kilovoltampere:
-            return ((value) / 1000.0)
+        ApparentPowerUnits.Kilovoltampere: ('1/1000', '0'),
         
-        if from_unit == ApparentPowerUnits.Megavoltampere:
-            return ((value) / 1000000.0)
+        ApparentPowerUnits.Megavoltampere: ('1/1000000', '0'),
         
-        if from_unit == ApparentPowerUnits.Gigavoltampere:
-            return ((value) / 1000000000.0)
+        ApparentPowerUnits.Gigavoltampere: ('1/1000000000', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        ApparentPowerUnits.Voltampere: ('1', '0'),
+        
+        ApparentPowerUnits.Microvoltampere: ('1/1000000', '0'),
+        
+        ApparentPowerUnits.Millivoltampere: ('1/1000', '0'),
+        
+        ApparentPowerUnits.Kilovoltampere: ('1000', '0'),
+        
+        ApparentPowerUnits.Megavoltampere: ('1000000', '0'),
+        
+        ApparentPowerUnits.Gigavoltampere: ('1000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ApparentPowerUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ApparentPowerUnits.Voltampere:
-            return (value)
+        ApparentPowerUnits.Voltampere: ('VA',),
         
-        if to_unit == ApparentPowerUnits.Microvoltampere:
-            return ((value) * 1e-06)
+        ApparentPowerUnits.Microvoltampere: ('μVA',),
         
-        if to_unit == ApparentPowerUnits.Millivoltampere:
-            return ((value) * 0.001)
+        ApparentPowerUnits.Millivoltampere: ('mVA',),
         
-        if to_unit == ApparentPowerUnits.Kilovoltampere:
-            return ((value) * 1000.0)
+        ApparentPowerUnits.Kilovoltampere: ('kVA',),
         
-        if to_unit == ApparentPowerUnits.Megavoltampere:
-            return ((value) * 1000000.0)
+        ApparentPowerUnits.Megavoltampere: ('MVA',),
         
-        if to_unit == ApparentPowerUnits.Gigavoltampere:
-            return ((value) * 1000000000.0)
+        ApparentPowerUnits.Gigavoltampere: ('GVA',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: ApparentPowerUnits = ApparentPowerUnits.Voltampere):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ApparentPowerUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ApparentPowerUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ApparentPowerUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ApparentPowerUnits, to_unit: ApparentPowerUnits) -> float:
+        """
+        Convert a value from one ApparentPower unit to another, without creating a ApparentPower instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ApparentPowerUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ApparentPowerUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ApparentPower._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ApparentPowerUnits, to_unit: ApparentPowerUnits) -> List[float]:
+        """
+        Convert many values from one ApparentPower unit to another.
+        The conversion is resolved once and applied to all the values.
 
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ApparentPowerUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ApparentPowerUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ApparentPower._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ApparentPowerUnits, to_unit: ApparentPowerUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ApparentPower._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ApparentPowerUnits, to_unit: ApparentPowerUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ApparentPower unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ApparentPowerUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ApparentPowerUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ApparentPower._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ApparentPowerUnits = ApparentPowerUnits.Voltampere) -> ApparentPower:
+        """
+        Create a new instance of ApparentPower holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ApparentPowerUnits
+        :return: A new instance of ApparentPower.
+        :rtype: ApparentPower
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ApparentPower._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ApparentPowerUnits = ApparentPowerUnits.Voltampere) -> Fraction:
+        """
+        Get the exact value of the ApparentPower in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Voltampere).
+        :type unit: ApparentPowerUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ApparentPower:
+        """
+        Parse a ApparentPower from a value followed by a unit abbreviation, e.g. "1 VA".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ApparentPower.
+        :rtype: ApparentPower
+        :raises ValueError: When the string is not a valid or an ambiguous ApparentPower.
+        """
+        return ApparentPower._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ApparentPower]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ApparentPower._try_parse(text)
+
+    def to_binary(self, unit: Optional[ApparentPowerUnits] = None) -> bytes:
+        """
+        Encode the ApparentPower to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ApparentPowerUnits
+        :return: The encoded ApparentPower.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ApparentPower:
+        """
+        Decode a ApparentPower encoded by to_binary.
+
+        :param data: The encoded ApparentPower, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ApparentPower.
+        :rtype: ApparentPower
+        :raises ValueError: When the data is not a valid encoded ApparentPower.
+        """
+        return ApparentPower._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ApparentPowerUnits] = None) -> dict:
+        """
+        Get the ApparentPower DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Voltampere).
+        :type hold_in_unit: ApparentPowerUnits
+        :return: The ApparentPower DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ApparentPowerUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ApparentPower:
+        """
+        Create a new instance of ApparentPower from its DTO.
+
+        :param dto: The ApparentPower DTO, the unit is the ApparentPowerUnits value or name.
+        :type dto: dict
+        :return: A new instance of ApparentPower.
+        :rtype: ApparentPower
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ApparentPower._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ApparentPower:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ApparentPower._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -217,10 +459,7 @@ class ApparentPower(AbstractMeasure):
         """
         
         """
-        if self.__voltamperes != None:
-            return self.__voltamperes
-        self.__voltamperes = self.__convert_from_base(ApparentPowerUnits.Voltampere)
-        return self.__voltamperes
+        return self._cached_convert(ApparentPowerUnits.Voltampere)
 
     
     @property
@@ -228,10 +467,7 @@ class ApparentPower(AbstractMeasure):
         """
         
         """
-        if self.__microvoltamperes != None:
-            return self.__microvoltamperes
-        self.__microvoltamperes = self.__convert_from_base(ApparentPowerUnits.Microvoltampere)
-        return self.__microvoltamperes
+        return self._cached_convert(ApparentPowerUnits.Microvoltampere)
 
     
     @property
@@ -239,10 +475,7 @@ class ApparentPower(AbstractMeasure):
         """
         
         """
-        if self.__millivoltamperes != None:
-            return self.__millivoltamperes
-        self.__millivoltamperes = self.__convert_from_base(ApparentPowerUnits.Millivoltampere)
-        return self.__millivoltamperes
+        return self._cached_convert(ApparentPowerUnits.Millivoltampere)
 
     
     @property
@@ -250,10 +483,7 @@ class ApparentPower(AbstractMeasure):
         """
         
         """
-        if self.__kilovoltamperes != None:
-            return self.__kilovoltamperes
-        self.__kilovoltamperes = self.__convert_from_base(ApparentPowerUnits.Kilovoltampere)
-        return self.__kilovoltamperes
+        return self._cached_convert(ApparentPowerUnits.Kilovoltampere)
 
     
     @property
@@ -261,10 +491,7 @@ class ApparentPower(AbstractMeasure):
         """
         
         """
-        if self.__megavoltamperes != None:
-            return self.__megavoltamperes
-        self.__megavoltamperes = self.__convert_from_base(ApparentPowerUnits.Megavoltampere)
-        return self.__megavoltamperes
+        return self._cached_convert(ApparentPowerUnits.Megavoltampere)
 
     
     @property
@@ -272,10 +499,7 @@ class ApparentPower(AbstractMeasure):
         """
         
         """
-        if self.__gigavoltamperes != None:
-            return self.__gigavoltamperes
-        self.__gigavoltamperes = self.__convert_from_base(ApparentPowerUnits.Gigavoltampere)
-        return self.__gigavoltamperes
+        return self._cached_convert(ApparentPowerUnits.Gigavoltampere)
 
     
     def to_string(self, unit: ApparentPowerUnits = ApparentPowerUnits.Voltampere) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class AreaUnits(Enum):
         """
             AreaUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         SquareKilometer = 'square_kilometer'
         """
@@ -89,138 +100,401 @@ class Area(AbstractMeasure):
         value (float): The value.
         from_unit (AreaUnits): The Area unit to create from, The default unit is SquareMeter
     """
-    def __init__(self, value: float, from_unit: AreaUnits = AreaUnits.SquareMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = AreaUnits
+
+    _base_unit = AreaUnits.SquareMeter
+
+    _dimensions = (2, 0, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 7
+
+    _binary_unit_ids = {
         
-        self.__square_kilometers = None
+        AreaUnits.SquareKilometer: 0,
         
-        self.__square_meters = None
+        AreaUnits.SquareMeter: 1,
         
-        self.__square_decimeters = None
+        AreaUnits.SquareDecimeter: 2,
         
-        self.__square_centimeters = None
+        AreaUnits.SquareCentimeter: 3,
         
-        self.__square_millimeters = None
+        AreaUnits.SquareMillimeter: 4,
         
-        self.__square_micrometers = None
+        AreaUnits.SquareMicrometer: 5,
         
-        self.__square_miles = None
+        AreaUnits.SquareMile: 6,
         
-        self.__square_yards = None
+        AreaUnits.SquareYard: 7,
         
-        self.__square_feet = None
+        AreaUnits.SquareFoot: 8,
         
-        self.__us_survey_square_feet = None
+        AreaUnits.UsSurveySquareFoot: 9,
         
-        self.__square_inches = None
+        AreaUnits.SquareInch: 10,
         
-        self.__acres = None
+        AreaUnits.Acre: 11,
         
-        self.__hectares = None
+        AreaUnits.Hectare: 12,
         
-        self.__square_nautical_miles = None
+        AreaUnits.SquareNauticalMile: 13,
         
+    }
 
-    def convert(self, unit: AreaUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        AreaUnits.SquareKilometer: lambda value: (value / 1e6),
+        
+        AreaUnits.SquareMeter: lambda value: (value),
+        
+        AreaUnits.SquareDecimeter: lambda value: (value / 1e-2),
+        
+        AreaUnits.SquareCentimeter: lambda value: (value / 1e-4),
+        
+        AreaUnits.SquareMillimeter: lambda value: (value / 1e-6),
+        
+        AreaUnits.SquareMicrometer: lambda value: (value / 1e-12),
+        
+        AreaUnits.SquareMile: lambda value: (value / 1609.344 / 1609.344),
+        
+        AreaUnits.SquareYard: lambda value: (value / 0.9144 / 0.9144),
+        
+        AreaUnits.SquareFoot: lambda value: (value / 9.290304e-2),
+        
+        AreaUnits.UsSurveySquareFoot: lambda value: (value / (1200.0 / 3937.0) / (1200.0 / 3937.0)),
+        
+        AreaUnits.SquareInch: lambda value: (value / 0.00064516),
+        
+        AreaUnits.Acre: lambda value: (value / 4046.8564224),
+        
+        AreaUnits.Hectare: lambda value: (value / 1e4),
+        
+        AreaUnits.SquareNauticalMile: lambda value: (value / 3429904),
+        
+    }
 
-    def __convert_from_base(self, from_unit: AreaUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        AreaUnits.SquareKilometer: lambda value: (value * 1e6),
+        
+        AreaUnits.SquareMeter: lambda value: (value),
+        
+        AreaUnits.SquareDecimeter: lambda value: (value * 1e-2),
+        
+        AreaUnits.SquareCentimeter: lambda value: (value * 1e-4),
+        
+        AreaUnits.SquareMillimeter: lambda value: (value * 1e-6),
         
-        if from_unit == AreaUnits.SquareKilometer:
-            return (value / 1e6)
+        AreaUnits.SquareMicrometer: lambda value: (value * 1e-12),
         
-        if from_unit == AreaUnits.SquareMeter:
-            return (value)
+        AreaUnits.SquareMile: lambda value: (value * 1609.344 * 1609.344),
         
-        if from_unit == AreaUnits.SquareDecimeter:
-            return (value / 1e-2)
+        AreaUnits.SquareYard: lambda value: (value * 0.9144 * 0.9144),
         
-        if from_unit == AreaUnits.SquareCentimeter:
-            return (value / 1e-4)
+        AreaUnits.SquareFoot: lambda value: (value * 9.290304e-2),
         
-        if from_unit == AreaUnits.SquareMillimeter:
-            return (value / 1e-6)
+        AreaUnits.UsSurveySquareFoot: lambda value: (value * (1200.0 / 3937.0) * (1200.0 / 3937.0)),
         
-        if from_unit == AreaUnits.SquareMicrometer:
-            return (value / 1e-12)
+        AreaUnits.SquareInch: lambda value: (value * 0.00064516),
         
-        if from_unit == AreaUnits.SquareMile:
-            return (value / 1609.344 / 1609.344)
+        AreaUnits.Acre: lambda value: (value * 4046.8564224),
         
-        if from_unit == AreaUnits.SquareYard:
-            return (value / 0.9144 / 0.9144)
+        AreaUnits.Hectare: lambda value: (value * 1e4),
         
-        if from_unit == AreaUnits.SquareFoot:
-            return (value / 9.290304e-2)
+        AreaUnits.SquareNauticalMile: lambda value: (value * 3429904),
         
-        if from_unit == AreaUnits.UsSurveySquareFoot:
-            return (value / (1200.0 / 3937.0) / (1200.0 / 3937.0))
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        AreaUnits.SquareKilometer: ('1/1000000', '0'),
+        
+        AreaUnits.SquareMeter: ('1', '0'),
+        
+        AreaUnits.SquareDecimeter: ('100', '0'),
+        
+        AreaUnits.SquareCentimeter: ('10000', '0'),
+        
+        AreaUnits.SquareMillimeter: ('1000000', '0'),
+        
+        AreaUnits.SquareMicrometer: ('1000000000000', '0'),
+        
+        AreaUnits.SquareMile: ('15625/40468564224', '0'),
+        
+        AreaUnits.SquareYard: ('1562500/1306449', '0'),
+        
+        AreaUnits.SquareFoot: ('1562500/145161', '0'),
         
-        if from_unit == AreaUnits.SquareInch:
-            return (value / 0.00064516)
+        AreaUnits.UsSurveySquareFoot: ('15499969/1440000', '0'),
         
-        if from_unit == AreaUnits.Acre:
-            return (value / 4046.8564224)
+        AreaUnits.SquareInch: ('25000000/16129', '0'),
         
-        if from_unit == AreaUnits.Hectare:
-            return (value / 1e4)
+        AreaUnits.Acre: ('78125/316160658', '0'),
         
-        if from_unit == AreaUnits.SquareNauticalMile:
-            return (value / 3429904)
+        AreaUnits.Hectare: ('1/10000', '0'),
         
-        return None
+        AreaUnits.SquareNauticalMile: ('1/3429904', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        AreaUnits.SquareKilometer: ('1000000', '0'),
+        
+        AreaUnits.SquareMeter: ('1', '0'),
+        
+        AreaUnits.SquareDecimeter: ('1/100', '0'),
+        
+        AreaUnits.SquareCentimeter: ('1/10000', '0'),
+        
+        AreaUnits.SquareMillimeter: ('1/1000000', '0'),
+        
+        AreaUnits.SquareMicrometer: ('1/1000000000000', '0'),
+        
+        AreaUnits.SquareMile: ('40468564224/15625', '0'),
+        
+        AreaUnits.SquareYard: ('1306449/1562500', '0'),
+        
+        AreaUnits.SquareFoot: ('145161/1562500', '0'),
+        
+        AreaUnits.UsSurveySquareFoot: ('1440000/15499969', '0'),
+        
+        AreaUnits.SquareInch: ('16129/25000000', '0'),
+        
+        AreaUnits.Acre: ('316160658/78125', '0'),
+        
+        AreaUnits.Hectare: ('10000', '0'),
+        
+        AreaUnits.SquareNauticalMile: ('3429904', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: AreaUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == AreaUnits.SquareKilometer:
-            return (value * 1e6)
+        AreaUnits.SquareKilometer: ('km²',),
         
-        if to_unit == AreaUnits.SquareMeter:
-            return (value)
+        AreaUnits.SquareMeter: ('m²',),
         
-        if to_unit == AreaUnits.SquareDecimeter:
-            return (value * 1e-2)
+        AreaUnits.SquareDecimeter: ('dm²',),
         
-        if to_unit == AreaUnits.SquareCentimeter:
-            return (value * 1e-4)
+        AreaUnits.SquareCentimeter: ('cm²',),
         
-        if to_unit == AreaUnits.SquareMillimeter:
-            return (value * 1e-6)
+        AreaUnits.SquareMillimeter: ('mm²',),
         
-        if to_unit == AreaUnits.SquareMicrometer:
-            return (value * 1e-12)
+        AreaUnits.SquareMicrometer: ('µm²',),
         
-        if to_unit == AreaUnits.SquareMile:
-            return (value * 1609.344 * 1609.344)
+        AreaUnits.SquareMile: ('mi²',),
         
-        if to_unit == AreaUnits.SquareYard:
-            return (value * 0.9144 * 0.9144)
+        AreaUnits.SquareYard: ('yd²',),
         
-        if to_unit == AreaUnits.SquareFoot:
-            return (value * 9.290304e-2)
+        AreaUnits.SquareFoot: ('ft²',),
         
-        if to_unit == AreaUnits.UsSurveySquareFoot:
-            return (value * (1200.0 / 3937.0) * (1200.0 / 3937.0))
+        AreaUnits.UsSurveySquareFoot: ('ft² (US)',),
         
-        if to_unit == AreaUnits.SquareInch:
-            return (value * 0.00064516)
+        AreaUnits.SquareInch: ('in²',),
         
-        if to_unit == AreaUnits.Acre:
-            return (value * 4046.8564224)
+        AreaUnits.Acre: ('ac',),
         
-        if to_unit == AreaUnits.Hectare:
-            return (value * 1e4)
+        AreaUnits.Hectare: ('ha',),
         
-        if to_unit == AreaUnits.SquareNauticalMile:
-            return (value * 3429904)
+        AreaUnits.SquareNauticalMile: ('nmi²',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: AreaUnits = AreaUnits.SquareMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: AreaUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: AreaUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
 
 
+    def __convert_to_base(self, value: float, to_unit: AreaUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: AreaUnits, to_unit: AreaUnits) -> float:
+        """
+        Convert a value from one Area unit to another, without creating a Area instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: AreaUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AreaUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Area._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: AreaUnits, to_unit: AreaUnits) -> List[float]:
+        """
+        Convert many values from one Area unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: AreaUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: AreaUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Area._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: AreaUnits, to_unit: AreaUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Area._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: AreaUnits, to_unit: AreaUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Area unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AreaUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AreaUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Area._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: AreaUnits = AreaUnits.SquareMeter) -> Area:
+        """
+        Create a new instance of Area holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AreaUnits
+        :return: A new instance of Area.
+        :rtype: Area
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Area._from_exact(value, from_unit)
+
+    def to_exact(self, unit: AreaUnits = AreaUnits.SquareMeter) -> Fraction:
+        """
+        Get the exact value of the Area in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (SquareMeter).
+        :type unit: AreaUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Area:
+        """
+        Parse a Area from a value followed by a unit abbreviation, e.g. "1 km²".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Area.
+        :rtype: Area
+        :raises ValueError: When the string is not a valid or an ambiguous Area.
+        """
+        return Area._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Area]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Area._try_parse(text)
+
+    def to_binary(self, unit: Optional[AreaUnits] = None) -> bytes:
+        """
+        Encode the Area to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: AreaUnits
+        :return: The encoded Area.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Area:
+        """
+        Decode a Area encoded by to_binary.
+
+        :param data: The encoded Area, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Area.
+        :rtype: Area
+        :raises ValueError: When the data is not a valid encoded Area.
+        """
+        return Area._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[AreaUnits] = None) -> dict:
+        """
+        Get the Area DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (SquareMeter).
+        :type hold_in_unit: AreaUnits
+        :return: The Area DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[AreaUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Area:
+        """
+        Create a new instance of Area from its DTO.
+
+        :param dto: The Area DTO, the unit is the AreaUnits value or name.
+        :type dto: dict
+        :return: A new instance of Area.
+        :rtype: Area
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Area._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Area:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Area._from_json(text)
+
     @property
     def base_value(self) -> float:
         return self._value
@@ -441,10 +715,7 @@ class Area(AbstractMeasure):
         """
         
         """
-        if self.__square_kilometers != None:
-            return self.__square_kilometers
-        self.__square_kilometers = self.__convert_from_base(AreaUnits.SquareKilometer)
-        return self.__square_kilometers
+        return self._cached_convert(AreaUnits.SquareKilometer)
 
     
     @property
@@ -452,10 +723,7 @@ class Area(AbstractMeasure):
         """
         
         """
-        if self.__square_meters != None:
-            return self.__square_meters
-        self.__square_meters = self.__convert_from_base(AreaUnits.SquareMeter)
-        return self.__square_meters
+        return self._cached_convert(AreaUnits.SquareMeter)
 
     
     @property
@@ -463,10 +731,7 @@ class Area(AbstractMeasure):
         """
         
         """
-        if self.__square_decimeters != None:
-            return self.__square_decimeters
-        self.__square_decimeters = self.__convert_from_base(AreaUnits.SquareDecimeter)
-        return self.__square_decimeters
+        return self._cached_convert(AreaUnits.SquareDecimeter)
 
     
     @property
@@ -474,10 +739,7 @@ class Area(AbstractMeasure):
         """
         
         """
-        if self.__square_centimeters != None:
-            return self.__square_centimeters
-        self.__square_centimeters = self.__convert_from_base(AreaUnits.SquareCentimeter)
-        return self.__square_centimeters
+        return self._cached_convert(AreaUnits.SquareCentimeter)
 
     
     @property
@@ -485,10 +747,7 @@ class Area(AbstractMeasure):
         """
         
         """
-        if self.__square_millimeters != None:
-            return self.__square_millimeters
-        self.__square_millimeters = self.__convert_from_base(AreaUnits.SquareMillimeter)
-        return self.__square_millimeters
+        return self._cached_convert(AreaUnits.SquareMillimeter)
 
     
     @property
@@ -496,10 +755,7 @@ class Area(AbstractMeasure):
         """
         
         """
-        if self.__square_micrometers != None:
-            return self.__square_micrometers
-        self.__square_micrometers = self.__convert_from_base(AreaUnits.SquareMicrometer)
-        return self.__square_micrometers
+        return self._cached_convert(AreaUnits.SquareMicrometer)
 
     
     @property
@@ -507,10 +763,7 @@ class Area(AbstractMeasure):
         """
         The statute mile was standardised between the British Commonwealth and the United States by an international agreement in 1959, when it was formally redefined with respect to SI units as exactly 1,609.344 metres.
         """
-        if self.__square_miles != None:
-            return self.__square_miles
-        self.__square_miles = self.__convert_from_base(AreaUnits.SquareMile)
-        return self.__square_miles
+        return self._cached_convert(AreaUnits.SquareMile)
 
     
     @property
@@ -518,10 +771,7 @@ class Area(AbstractMeasure):
         """
         The yard (symbol: yd) is an English unit of length in both the British imperial and US customary systems of measurement equalling 3 feet (or 36 inches). Since 1959 the yard has been by international agreement standardized as exactly 0.9144 meter. A distance of 1,760 yards is equal to 1 mile.
         """
-        if self.__square_yards != None:
-            return self.__square_yards
-        self.__square_yards = self.__convert_from_base(AreaUnits.SquareYard)
-        return self.__square_yards
+        return self._cached_convert(AreaUnits.SquareYard)
 
     
     @property
@@ -529,10 +779,7 @@ class Area(AbstractMeasure):
         """
         
         """
-        if self.__square_feet != None:
-            return self.__square_feet
-        self.__square_feet = self.__convert_from_base(AreaUnits.SquareFoot)
-        return self.__square_feet
+        return self._cached_convert(AreaUnits.SquareFoot)
 
     
     @property
@@ -540,10 +787,7 @@ class Area(AbstractMeasure):
         """
         In the United States, the foot was defined as 12 inches, with the inch being defined by the Mendenhall Order of 1893 as 39.37 inches = 1 m. This makes a U.S. survey foot exactly 1200/3937 meters.
         """
-        if self.__us_survey_square_feet != None:
-            return self.__us_survey_square_feet
-        self.__us_survey_square_feet = self.__convert_from_base(AreaUnits.UsSurveySquareFoot)
-        return self.__us_survey_square_feet
+        return self._cached_convert(AreaUnits.UsSurveySquareFoot)
 
     
     @property
@@ -551,10 +795,7 @@ class Area(AbstractMeasure):
         """
         
         """
-        if self.__square_inches != None:
-            return self.__square_inches
-        self.__square_inches = self.__convert_from_base(AreaUnits.SquareInch)
-        return self.__square_inches
+        return self._cached_convert(AreaUnits.SquareInch)
 
     
     @property
@@ -562,10 +803,7 @@ class Area(AbstractMeasure):
         """
         Based upon the international yard and pound agreement of 1959, an acre may be declared as exactly 4,046.8564224 square metres.
         """
-        if self.__acres != None:
-            return self.__acres
-        self.__acres = self.__convert_from_base(AreaUnits.Acre)
-        return self.__acres
+        return self._cached_convert(AreaUnits.Acre)
 
     
     @property
@@ -573,10 +811,7 @@ class Area(AbstractMeasure):
         """
         
         """
-        if self.__hectares != None:
-            return self.__hectares
-        self.__hectares = self.__convert_from_base(AreaUnits.Hectare)
-        return self.__hectares
+        return self._cached_convert(AreaUnits.Hectare)
 
     
     @property
@@ -584,10 +819,7 @@ class Area(AbstractMeasure):
         """
         
         """
-        if self.__square_nautical_miles != None:
-            return self.__square_nautical_miles
-        self.__square_nautical_miles = self.__convert_from_base(AreaUnits.SquareNauticalMile)
-        return self.__square_nautical_miles
+        return self._cached_convert(AreaUnits.SquareNauticalMile)
 
     
     def to_string(self, unit: AreaUnits = AreaUnits.SquareMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class AreaDensityUnits(Enum):
         """
             AreaDensityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         KilogramPerSquareMeter = 'kilogram_per_square_meter'
         """
@@ -34,49 +45,268 @@ class AreaDensity(AbstractMeasure):
         value (float): The value.
         from_unit (AreaDensityUnits): The AreaDensity unit to create from, The default unit is KilogramPerSquareMeter
     """
-    def __init__(self, value: float, from_unit: AreaDensityUnits = AreaDensityUnits.KilogramPerSquareMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = AreaDensityUnits
+
+    _base_unit = AreaDensityUnits.KilogramPerSquareMeter
+
+    _dimensions = (-2, 1, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 8
+
+    _binary_unit_ids = {
         
-        self.__kilograms_per_square_meter = None
+        AreaDensityUnits.KilogramPerSquareMeter: 0,
         
-        self.__grams_per_square_meter = None
+        AreaDensityUnits.GramPerSquareMeter: 1,
         
-        self.__milligrams_per_square_meter = None
+        AreaDensityUnits.MilligramPerSquareMeter: 2,
         
+    }
 
-    def convert(self, unit: AreaDensityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        AreaDensityUnits.KilogramPerSquareMeter: lambda value: (value),
+        
+        AreaDensityUnits.GramPerSquareMeter: lambda value: (value * 1000),
+        
+        AreaDensityUnits.MilligramPerSquareMeter: lambda value: (value * 1000000),
+        
+    }
 
-    def __convert_from_base(self, from_unit: AreaDensityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == AreaDensityUnits.KilogramPerSquareMeter:
-            return (value)
+        AreaDensityUnits.KilogramPerSquareMeter: lambda value: (value),
         
-        if from_unit == AreaDensityUnits.GramPerSquareMeter:
-            return (value * 1000)
+        AreaDensityUnits.GramPerSquareMeter: lambda value: (value / 1000),
         
-        if from_unit == AreaDensityUnits.MilligramPerSquareMeter:
-            return (value * 1000000)
+        AreaDensityUnits.MilligramPerSquareMeter: lambda value: (value / 1000000),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        AreaDensityUnits.KilogramPerSquareMeter: ('1', '0'),
+        
+        AreaDensityUnits.GramPerSquareMeter: ('1000', '0'),
+        
+        AreaDensityUnits.MilligramPerSquareMeter: ('1000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: AreaDensityUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == AreaDensityUnits.KilogramPerSquareMeter:
-            return (value)
+        AreaDensityUnits.KilogramPerSquareMeter: ('1', '0'),
         
-        if to_unit == AreaDensityUnits.GramPerSquareMeter:
-            return (value / 1000)
+        AreaDensityUnits.GramPerSquareMeter: ('1/1000', '0'),
+        
+        AreaDensityUnits.MilligramPerSquareMeter: ('1/1000000', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == AreaDensityUnits.MilligramPerSquareMeter:
-            return (value / 1000000)
+        AreaDensityUnits.KilogramPerSquareMeter: ('kg/m²',),
         
-        return None
+        AreaDensityUnits.GramPerSquareMeter: ('g/m²',),
+        
+        AreaDensityUnits.MilligramPerSquareMeter: ('mg/m²',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: AreaDensityUnits = AreaDensityUnits.KilogramPerSquareMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: AreaDensityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: AreaDensityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: AreaDensityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: AreaDensityUnits, to_unit: AreaDensityUnits) -> float:
+        """
+        Convert a value from one AreaDensity unit to another, without creating a AreaDensity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: AreaDensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AreaDensityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return AreaDensity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: AreaDensityUnits, to_unit: AreaDensityUnits) -> List[float]:
+        """
+        Convert many values from one AreaDensity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: AreaDensityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: AreaDensityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return AreaDensity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: AreaDensityUnits, to_unit: AreaDensityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", AreaDensity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: AreaDensityUnits, to_unit: AreaDensityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one AreaDensity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AreaDensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AreaDensityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return AreaDensity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: AreaDensityUnits = AreaDensityUnits.KilogramPerSquareMeter) -> AreaDensity:
+        """
+        Create a new instance of AreaDensity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AreaDensityUnits
+        :return: A new instance of AreaDensity.
+        :rtype: AreaDensity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return AreaDensity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: AreaDensityUnits = AreaDensityUnits.KilogramPerSquareMeter) -> Fraction:
+        """
+        Get the exact value of the AreaDensity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (KilogramPerSquareMeter).
+        :type unit: AreaDensityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> AreaDensity:
+        """
+        Parse a AreaDensity from a value followed by a unit abbreviation, e.g. "1 kg/m²".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of AreaDensity.
+        :rtype: AreaDensity
+        :raises ValueError: When the string is not a valid or an ambiguous AreaDensity.
+        """
+        return AreaDensity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[AreaDensity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return AreaDensity._try_parse(text)
 
+    def to_binary(self, unit: Optional[AreaDensityUnits] = None) -> bytes:
+        """
+        Encode the AreaDensity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: AreaDensityUnits
+        :return: The encoded AreaDensity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> AreaDensity:
+        """
+        Decode a AreaDensity encoded by to_binary.
+
+        :param data: The encoded AreaDensity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of AreaDensity.
+        :rtype: AreaDensity
+        :raises ValueError: When the data is not a valid encoded AreaDensity.
+        """
+        return AreaDensity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[AreaDensityUnits] = None) -> dict:
+        """
+        Get the AreaDensity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (KilogramPerSquareMeter).
+        :type hold_in_unit: AreaDensityUnits
+        :return: The AreaDensity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[AreaDensityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> AreaDensity:
+        """
+        Create a new instance of AreaDensity from its DTO.
+
+        :param dto: The AreaDensity DTO, the unit is the AreaDensityUnits value or name.
+        :type dto: dict
+        :return: A new instance of AreaDensity.
+        :rtype: AreaDensity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return AreaDensity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> AreaDensity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return AreaDensity._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -133,10 +363,7 @@ class AreaDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_square_meter != None:
-            return self.__kilograms_per_square_meter
-        self.__kilograms_per_square_meter = self.__convert_from_base(AreaDensityUnits.KilogramPerSquareMeter)
-        return self.__kilograms_per_square_meter
+        return self._cached_convert(AreaDensityUnits.KilogramPerSquareMeter)
 
     
     @property
@@ -144,10 +371,7 @@ class AreaDensity(AbstractMeasure):
         """
         Also known as grammage for paper industry. In fiber industry used with abbreviation 'gsm'.
         """
-        if self.__grams_per_square_meter != None:
-            return self.__grams_per_square_meter
-        self.__grams_per_square_meter = self.__convert_from_base(AreaDensityUnits.GramPerSquareMeter)
-        return self.__grams_per_square_meter
+        return self._cached_convert(AreaDensityUnits.GramPerSquareMeter)
 
     
     @property
@@ -155,10 +379,7 @@ class AreaDensity(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_square_meter != None:
-            return self.__milligrams_per_square_meter
-        self.__milligrams_per_square_meter = self.__convert_from_base(AreaDensityUnits.MilligramPerSquareMeter)
-        return self.__milligrams_per_square_meter
+        return self._cached_convert(AreaDensityUnits.MilligramPerSquareMeter)
 
     
     def to_string(self, unit: AreaDensityUnits = AreaDensityUnits.KilogramPerSquareMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class AreaMomentOfInertiaUnits(Enum):
         """
             AreaMomentOfInertiaUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         MeterToTheFourth = 'meter_to_the_fourth'
         """
@@ -49,73 +60,304 @@ class AreaMomentOfInertia(AbstractMeasure):
         value (float): The value.
         from_unit (AreaMomentOfInertiaUnits): The AreaMomentOfInertia unit to create from, The default unit is MeterToTheFourth
     """
-    def __init__(self, value: float, from_unit: AreaMomentOfInertiaUnits = AreaMomentOfInertiaUnits.MeterToTheFourth):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = AreaMomentOfInertiaUnits
+
+    _base_unit = AreaMomentOfInertiaUnits.MeterToTheFourth
+
+    _dimensions = (4, 0, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 9
+
+    _binary_unit_ids = {
         
-        self.__meters_to_the_fourth = None
+        AreaMomentOfInertiaUnits.MeterToTheFourth: 0,
         
-        self.__decimeters_to_the_fourth = None
+        AreaMomentOfInertiaUnits.DecimeterToTheFourth: 1,
         
-        self.__centimeters_to_the_fourth = None
+        AreaMomentOfInertiaUnits.CentimeterToTheFourth: 2,
         
-        self.__millimeters_to_the_fourth = None
+        AreaMomentOfInertiaUnits.MillimeterToTheFourth: 3,
         
-        self.__feet_to_the_fourth = None
+        AreaMomentOfInertiaUnits.FootToTheFourth: 4,
         
-        self.__inches_to_the_fourth = None
+        AreaMomentOfInertiaUnits.InchToTheFourth: 5,
         
+    }
 
-    def convert(self, unit: AreaMomentOfInertiaUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        AreaMomentOfInertiaUnits.MeterToTheFourth: lambda value: (value),
+        
+        AreaMomentOfInertiaUnits.DecimeterToTheFourth: lambda value: (value * 1e4),
+        
+        AreaMomentOfInertiaUnits.CentimeterToTheFourth: lambda value: (value * 1e8),
+        
+        AreaMomentOfInertiaUnits.MillimeterToTheFourth: lambda value: (value * 1e12),
+        
+        AreaMomentOfInertiaUnits.FootToTheFourth: lambda value: (value / math.pow(0.3048, 4)),
+        
+        AreaMomentOfInertiaUnits.InchToTheFourth: lambda value: (value / math.pow(2.54e-2, 4)),
+        
+    }
 
-    def __convert_from_base(self, from_unit: AreaMomentOfInertiaUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        AreaMomentOfInertiaUnits.MeterToTheFourth: lambda value: (value),
+        
+        AreaMomentOfInertiaUnits.DecimeterToTheFourth: lambda value: (value / 1e4),
+        
+        AreaMomentOfInertiaUnits.CentimeterToTheFourth: lambda value: (value / 1e8),
+        
+        AreaMomentOfInertiaUnits.MillimeterToTheFourth: lambda value: (value / 1e12),
+        
+        AreaMomentOfInertiaUnits.FootToTheFourth: lambda value: (value * math.pow(0.3048, 4)),
+        
+        AreaMomentOfInertiaUnits.InchToTheFourth: lambda value: (value * math.pow(2.54e-2, 4)),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
         
-        if from_unit == AreaMomentOfInertiaUnits.MeterToTheFourth:
-            return (value)
+        AreaMomentOfInertiaUnits.MeterToTheFourth: ('1', '0'),
         
-        if from_unit == AreaMomentOfInertiaUnits.DecimeterToTheFourth:
-            return (value * 1e4)
+        AreaMomentOfInertiaUnits.DecimeterToTheFourth: ('10000', '0'),
         
-        if from_unit == AreaMomentOfInertiaUnits.CentimeterToTheFourth:
-            return (value * 1e8)
+        AreaMomentOfInertiaUnits.CentimeterToTheFourth: ('100000000', '0'),
         
-        if from_unit == AreaMomentOfInertiaUnits.MillimeterToTheFourth:
-            return (value * 1e12)
+        AreaMomentOfInertiaUnits.MillimeterToTheFourth: ('1000000000000', '0'),
         
-        if from_unit == AreaMomentOfInertiaUnits.FootToTheFourth:
-            return (value / math.pow(0.3048, 4))
+        AreaMomentOfInertiaUnits.FootToTheFourth: ('2441406250000/21071715921', '0'),
         
-        if from_unit == AreaMomentOfInertiaUnits.InchToTheFourth:
-            return (value / math.pow(2.54e-2, 4))
+        AreaMomentOfInertiaUnits.InchToTheFourth: ('625000000000000/260144641', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        AreaMomentOfInertiaUnits.MeterToTheFourth: ('1', '0'),
+        
+        AreaMomentOfInertiaUnits.DecimeterToTheFourth: ('1/10000', '0'),
+        
+        AreaMomentOfInertiaUnits.CentimeterToTheFourth: ('1/100000000', '0'),
+        
+        AreaMomentOfInertiaUnits.MillimeterToTheFourth: ('1/1000000000000', '0'),
+        
+        AreaMomentOfInertiaUnits.FootToTheFourth: ('21071715921/2441406250000', '0'),
+        
+        AreaMomentOfInertiaUnits.InchToTheFourth: ('260144641/625000000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: AreaMomentOfInertiaUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == AreaMomentOfInertiaUnits.MeterToTheFourth:
-            return (value)
+        AreaMomentOfInertiaUnits.MeterToTheFourth: ('m⁴',),
         
-        if to_unit == AreaMomentOfInertiaUnits.DecimeterToTheFourth:
-            return (value / 1e4)
+        AreaMomentOfInertiaUnits.DecimeterToTheFourth: ('dm⁴',),
         
-        if to_unit == AreaMomentOfInertiaUnits.CentimeterToTheFourth:
-            return (value / 1e8)
+        AreaMomentOfInertiaUnits.CentimeterToTheFourth: ('cm⁴',),
         
-        if to_unit == AreaMomentOfInertiaUnits.MillimeterToTheFourth:
-            return (value / 1e12)
+        AreaMomentOfInertiaUnits.MillimeterToTheFourth: ('mm⁴',),
         
-        if to_unit == AreaMomentOfInertiaUnits.FootToTheFourth:
-            return (value * math.pow(0.3048, 4))
+        AreaMomentOfInertiaUnits.FootToTheFourth: ('ft⁴',),
         
-        if to_unit == AreaMomentOfInertiaUnits.InchToTheFourth:
-            return (value * math.pow(2.54e-2, 4))
+        AreaMomentOfInertiaUnits.InchToTheFourth: ('in⁴',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: AreaMomentOfInertiaUnits = AreaMomentOfInertiaUnits.MeterToTheFourth):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: AreaMomentOfInertiaUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: AreaMomentOfInertiaUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: AreaMomentOfInertiaUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: AreaMomentOfInertiaUnits, to_unit: AreaMomentOfInertiaUnits) -> float:
+        """
+        Convert a value from one AreaMomentOfInertia unit to another, without creating a AreaMomentOfInertia instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: AreaMomentOfInertiaUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AreaMomentOfInertiaUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return AreaMomentOfInertia._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: AreaMomentOfInertiaUnits, to_unit: AreaMomentOfInertiaUnits) -> List[float]:
+        """
+        Convert many values from one AreaMomentOfInertia unit to another.
+        The conversion is resolved once and applied to all the values.
 
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: AreaMomentOfInertiaUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: AreaMomentOfInertiaUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return AreaMomentOfInertia._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: AreaMomentOfInertiaUnits, to_unit: AreaMomentOfInertiaUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", AreaMomentOfInertia._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: AreaMomentOfInertiaUnits, to_unit: AreaMomentOfInertiaUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one AreaMomentOfInertia unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AreaMomentOfInertiaUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: AreaMomentOfInertiaUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return AreaMomentOfInertia._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: AreaMomentOfInertiaUnits = AreaMomentOfInertiaUnits.MeterToTheFourth) -> AreaMomentOfInertia:
+        """
+        Create a new instance of AreaMomentOfInertia holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: AreaMomentOfInertiaUnits
+        :return: A new instance of AreaMomentOfInertia.
+        :rtype: AreaMomentOfInertia
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return AreaMomentOfInertia._from_exact(value, from_unit)
+
+    def to_exact(self, unit: AreaMomentOfInertiaUnits = AreaMomentOfInertiaUnits.MeterToTheFourth) -> Fraction:
+        """
+        Get the exact value of the AreaMomentOfInertia in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (MeterToTheFourth).
+        :type unit: AreaMomentOfInertiaUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> AreaMomentOfInertia:
+        """
+        Parse a AreaMomentOfInertia from a value followed by a unit abbreviation, e.g. "1 m⁴".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of AreaMomentOfInertia.
+        :rtype: AreaMomentOfInertia
+        :raises ValueError: When the string is not a valid or an ambiguous AreaMomentOfInertia.
+        """
+        return AreaMomentOfInertia._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[AreaMomentOfInertia]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return AreaMomentOfInertia._try_parse(text)
+
+    def to_binary(self, unit: Optional[AreaMomentOfInertiaUnits] = None) -> bytes:
+        """
+        Encode the AreaMomentOfInertia to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: AreaMomentOfInertiaUnits
+        :return: The encoded AreaMomentOfInertia.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> AreaMomentOfInertia:
+        """
+        Decode a AreaMomentOfInertia encoded by to_binary.
+
+        :param data: The encoded AreaMomentOfInertia, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of AreaMomentOfInertia.
+        :rtype: AreaMomentOfInertia
+        :raises ValueError: When the data is not a valid encoded AreaMomentOfInertia.
+        """
+        return AreaMomentOfInertia._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[AreaMomentOfInertiaUnits] = None) -> dict:
+        """
+        Get the AreaMomentOfInertia DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (MeterToTheFourth).
+        :type hold_in_unit: AreaMomentOfInertiaUnits
+        :return: The AreaMomentOfInertia DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[AreaMomentOfInertiaUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> AreaMomentOfInertia:
+        """
+        Create a new instance of AreaMomentOfInertia from its DTO.
+
+        :param dto: The AreaMomentOfInertia DTO, the unit is the AreaMomentOfInertiaUnits value or name.
+        :type dto: dict
+        :return: A new instance of AreaMomentOfInertia.
+        :rtype: AreaMomentOfInertia
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return AreaMomentOfInertia._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> AreaMomentOfInertia:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return AreaMomentOfInertia._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -217,10 +459,7 @@ class AreaMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__meters_to_the_fourth != None:
-            return self.__meters_to_the_fourth
-        self.__meters_to_the_fourth = self.__convert_from_base(AreaMomentOfInertiaUnits.MeterToTheFourth)
-        return self.__meters_to_the_fourth
+        return self._cached_convert(AreaMomentOfInertiaUnits.MeterToTheFourth)
 
     
     @property
@@ -228,10 +467,7 @@ class AreaMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__decimeters_to_the_fourth != None:
-            return self.__decimeters_to_the_fourth
-        self.__decimeters_to_the_fourth = self.__convert_from_base(AreaMomentOfInertiaUnits.DecimeterToTheFourth)
-        return self.__decimeters_to_the_fourth
+        return self._cached_convert(AreaMomentOfInertiaUnits.DecimeterToTheFourth)
 
     
     @property
@@ -239,10 +475,7 @@ class AreaMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__centimeters_to_the_fourth != None:
-            return self.__centimeters_to_the_fourth
-        self.__centimeters_to_the_fourth = self.__convert_from_base(AreaMomentOfInertiaUnits.CentimeterToTheFourth)
-        return self.__centimeters_to_the_fourth
+        return self._cached_convert(AreaMomentOfInertiaUnits.CentimeterToTheFourth)
 
     
     @property
@@ -250,10 +483,7 @@ class AreaMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__millimeters_to_the_fourth != None:
-            return self.__millimeters_to_the_fourth
-        self.__millimeters_to_the_fourth = self.__convert_from_base(AreaMomentOfInertiaUnits.MillimeterToTheFourth)
-        return self.__millimeters_to_the_fourth
+        return self._cached_convert(AreaMomentOfInertiaUnits.MillimeterToTheFourth)
 
     
     @property
@@ -261,10 +491,7 @@ class AreaMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__feet_to_the_fourth != None:
-            return self.__feet_to_the_fourth
-        self.__feet_to_the_fourth = self.__convert_from_base(AreaMomentOfInertiaUnits.FootToTheFourth)
-        return self.__feet_to_the_fourth
+        return self._cached_convert(AreaMomentOfInertiaUnits.FootToTheFourth)
 
     
     @property
@@ -272,10 +499,7 @@ class AreaMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__inches_to_the_fourth != None:
-            return self.__inches_to_the_fourth
-        self.__inches_to_the_fourth = self.__convert_from_base(AreaMomentOfInertiaUnits.InchToTheFourth)
-        return self.__inches_to_the_fourth
+        return self._cached_convert(AreaMomentOfInertiaUnits.InchToTheFourth)
 
     
     def to_string(self, unit: AreaMomentOfInertiaUnits = AreaMomentOfInertiaUnits.MeterToTheFourth) -> str:
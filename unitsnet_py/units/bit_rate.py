@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class BitRateUnits(Enum):
         """
             BitRateUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         BitPerSecond = 'bit_per_second'
         """
@@ -89,138 +100,401 @@ class BitRate(AbstractMeasure):
         value (float): The value.
         from_unit (BitRateUnits): The BitRate unit to create from, The default unit is BitPerSecond
     """
-    def __init__(self, value: float, from_unit: BitRateUnits = BitRateUnits.BitPerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = BitRateUnits
+
+    _base_unit = BitRateUnits.BitPerSecond
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 10
+
+    _binary_unit_ids = {
         
-        self.__bits_per_second = None
+        BitRateUnits.BitPerSecond: 0,
         
-        self.__bytes_per_second = None
+        BitRateUnits.BytePerSecond: 1,
         
-        self.__kilobits_per_second = None
+        BitRateUnits.KilobitPerSecond: 2,
         
-        self.__megabits_per_second = None
+        BitRateUnits.MegabitPerSecond: 3,
         
-        self.__gigabits_per_second = None
+        BitRateUnits.GigabitPerSecond: 4,
         
-        self.__terabits_per_second = None
+        BitRateUnits.TerabitPerSecond: 5,
         
-        self.__petabits_per_second = None
+        BitRateUnits.PetabitPerSecond: 6,
         
-        self.__exabits_per_second = None
+        BitRateUnits.ExabitPerSecond: 7,
         
-        self.__kilobytes_per_second = None
+        BitRateUnits.KilobytePerSecond: 8,
         
-        self.__megabytes_per_second = None
+        BitRateUnits.MegabytePerSecond: 9,
         
-        self.__gigabytes_per_second = None
+        BitRateUnits.GigabytePerSecond: 10,
         
-        self.__terabytes_per_second = None
+        BitRateUnits.TerabytePerSecond: 11,
         
-        self.__petabytes_per_second = None
+        BitRateUnits.PetabytePerSecond: 12,
         
-        self.__exabytes_per_second = None
+        BitRateUnits.ExabytePerSecond: 13,
         
+    }
 
-    def convert(self, unit: BitRateUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        BitRateUnits.BitPerSecond: lambda value: (value),
+        
+        BitRateUnits.BytePerSecond: lambda value: (value / 8),
+        
+        BitRateUnits.KilobitPerSecond: lambda value: ((value) / 1000.0),
+        
+        BitRateUnits.MegabitPerSecond: lambda value: ((value) / 1000000.0),
+        
+        BitRateUnits.GigabitPerSecond: lambda value: ((value) / 1000000000.0),
+        
+        BitRateUnits.TerabitPerSecond: lambda value: ((value) / 1000000000000.0),
+        
+        BitRateUnits.PetabitPerSecond: lambda value: ((value) / 1000000000000000.0),
+        
+        BitRateUnits.ExabitPerSecond: lambda value: ((value) / 1e+18),
+        
+        BitRateUnits.KilobytePerSecond: lambda value: ((value / 8) / 1000.0),
+        
+        BitRateUnits.MegabytePerSecond: lambda value: ((value / 8) / 1000000.0),
+        
+        BitRateUnits.GigabytePerSecond: lambda value: ((value / 8) / 1000000000.0),
+        
+        BitRateUnits.TerabytePerSecond: lambda value: ((value / 8) / 1000000000000.0),
+        
+        BitRateUnits.PetabytePerSecond: lambda value: ((value / 8) / 1000000000000000.0),
+        
+        BitRateUnits.ExabytePerSecond: lambda value: ((value / 8) / 1e+18),
+        
+    }
 
-    def __convert_from_base(self, from_unit: BitRateUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        BitRateUnits.BitPerSecond: lambda value: (value),
+        
+        BitRateUnits.BytePerSecond: lambda value: (value * 8),
+        
+        BitRateUnits.KilobitPerSecond: lambda value: ((value) * 1000.0),
+        
+        BitRateUnits.MegabitPerSecond: lambda value: ((value) * 1000000.0),
+        
+        BitRateUnits.GigabitPerSecond: lambda value: ((value) * 1000000000.0),
         
-        if from_unit == BitRateUnits.BitPerSecond:
-            return (value)
+        BitRateUnits.TerabitPerSecond: lambda value: ((value) * 1000000000000.0),
         
-        if from_unit == BitRateUnits.BytePerSecond:
-            return (value / 8)
+        BitRateUnits.PetabitPerSecond: lambda value: ((value) * 1000000000000000.0),
         
-        if from_unit == BitRateUnits.KilobitPerSecond:
-            return ((value) / 1000.0)
+        BitRateUnits.ExabitPerSecond: lambda value: ((value) * 1e+18),
         
-        if from_unit == BitRateUnits.MegabitPerSecond:
-            return ((value) / 1000000.0)
+        BitRateUnits.KilobytePerSecond: lambda value: ((value * 8) * 1000.0),
         
-        if from_unit == BitRateUnits.GigabitPerSecond:
-            return ((value) / 1000000000.0)
+        BitRateUnits.MegabytePerSecond: lambda value: ((value * 8) * 1000000.0),
         
-        if from_unit == BitRateUnits.TerabitPerSecond:
-            return ((value) / 1000000000000.0)
+        BitRateUnits.GigabytePerSecond: lambda value: ((value * 8) * 1000000000.0),
         
-        if from_unit == BitRateUnits.PetabitPerSecond:
-            return ((value) / 1000000000000000.0)
+        BitRateUnits.TerabytePerSecond: lambda value: ((value * 8) * 1000000000000.0),
         
-        if from_unit == BitRateUnits.ExabitPerSecond:
-            return ((value) / 1e+18)
+        BitRateUnits.PetabytePerSecond: lambda value: ((value * 8) * 1000000000000000.0),
         
-        if from_unit == BitRateUnits.KilobytePerSecond:
-            return ((value / 8) / 1000.0)
+        BitRateUnits.ExabytePerSecond: lambda value: ((value * 8) * 1e+18),
         
-        if from_unit == BitRateUnits.MegabytePerSecond:
-            return ((value / 8) / 1000000.0)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        BitRateUnits.BitPerSecond: ('1', '0'),
+        
+        BitRateUnits.BytePerSecond: ('1/8', '0'),
+        
+        BitRateUnits.KilobitPerSecond: ('1/1000', '0'),
+        
+        BitRateUnits.MegabitPerSecond: ('1/1000000', '0'),
+        
+        BitRateUnits.GigabitPerSecond: ('1/1000000000', '0'),
+        
+        BitRateUnits.TerabitPerSecond: ('1/1000000000000', '0'),
+        
+        BitRateUnits.PetabitPerSecond: ('1/1000000000000000', '0'),
+        
+        BitRateUnits.ExabitPerSecond: ('1/1000000000000000000', '0'),
+        
+        BitRateUnits.KilobytePerSecond: ('1/8000', '0'),
         
-        if from_unit == BitRateUnits.GigabytePerSecond:
-            return ((value / 8) / 1000000000.0)
+        BitRateUnits.MegabytePerSecond: ('1/8000000', '0'),
         
-        if from_unit == BitRateUnits.TerabytePerSecond:
-            return ((value / 8) / 1000000000000.0)
+        BitRateUnits.GigabytePerSecond: ('1/8000000000', '0'),
         
-        if from_unit == BitRateUnits.PetabytePerSecond:
-            return ((value / 8) / 1000000000000000.0)
+        BitRateUnits.TerabytePerSecond: ('1/8000000000000', '0'),
         
-        if from_unit == BitRateUnits.ExabytePerSecond:
-            return ((value / 8) / 1e+18)
+        BitRateUnits.PetabytePerSecond: ('1/8000000000000000', '0'),
         
-        return None
+        BitRateUnits.ExabytePerSecond: ('1/8000000000000000000', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        BitRateUnits.BitPerSecond: ('1', '0'),
+        
+        BitRateUnits.BytePerSecond: ('8', '0'),
+        
+        BitRateUnits.KilobitPerSecond: ('1000', '0'),
+        
+        BitRateUnits.MegabitPerSecond: ('1000000', '0'),
+        
+        BitRateUnits.GigabitPerSecond: ('1000000000', '0'),
+        
+        BitRateUnits.TerabitPerSecond: ('1000000000000', '0'),
+        
+        BitRateUnits.PetabitPerSecond: ('1000000000000000', '0'),
+        
+        BitRateUnits.ExabitPerSecond: ('1000000000000000000', '0'),
+        
+        BitRateUnits.KilobytePerSecond: ('8000', '0'),
+        
+        BitRateUnits.MegabytePerSecond: ('8000000', '0'),
+        
+        BitRateUnits.GigabytePerSecond: ('8000000000', '0'),
+        
+        BitRateUnits.TerabytePerSecond: ('8000000000000', '0'),
+        
+        BitRateUnits.PetabytePerSecond: ('8000000000000000', '0'),
+        
+        BitRateUnits.ExabytePerSecond: ('8000000000000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: BitRateUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == BitRateUnits.BitPerSecond:
-            return (value)
+        BitRateUnits.BitPerSecond: ('bit/s',),
         
-        if to_unit == BitRateUnits.BytePerSecond:
-            return (value * 8)
+        BitRateUnits.BytePerSecond: ('B/s',),
         
-        if to_unit == BitRateUnits.KilobitPerSecond:
-            return ((value) * 1000.0)
+        BitRateUnits.KilobitPerSecond: ('kbit/s',),
         
-        if to_unit == BitRateUnits.MegabitPerSecond:
-            return ((value) * 1000000.0)
+        BitRateUnits.MegabitPerSecond: ('Mbit/s',),
         
-        if to_unit == BitRateUnits.GigabitPerSecond:
-            return ((value) * 1000000000.0)
+        BitRateUnits.GigabitPerSecond: ('Gbit/s',),
         
-        if to_unit == BitRateUnits.TerabitPerSecond:
-            return ((value) * 1000000000000.0)
+        BitRateUnits.TerabitPerSecond: ('Tbit/s',),
         
-        if to_unit == BitRateUnits.PetabitPerSecond:
-            return ((value) * 1000000000000000.0)
+        BitRateUnits.PetabitPerSecond: ('Pbit/s',),
         
-        if to_unit == BitRateUnits.ExabitPerSecond:
-            return ((value) * 1e+18)
+        BitRateUnits.ExabitPerSecond: ('Ebit/s',),
         
-        if to_unit == BitRateUnits.KilobytePerSecond:
-            return ((value * 8) * 1000.0)
+        BitRateUnits.KilobytePerSecond: ('kB/s',),
         
-        if to_unit == BitRateUnits.MegabytePerSecond:
-            return ((value * 8) * 1000000.0)
+        BitRateUnits.MegabytePerSecond: ('MB/s',),
         
-        if to_unit == BitRateUnits.GigabytePerSecond:
-            return ((value * 8) * 1000000000.0)
+        BitRateUnits.GigabytePerSecond: ('GB/s',),
         
-        if to_unit == BitRateUnits.TerabytePerSecond:
-            return ((value * 8) * 1000000000000.0)
+        BitRateUnits.TerabytePerSecond: ('TB/s',),
         
-        if to_unit == BitRateUnits.PetabytePerSecond:
-            return ((value * 8) * 1000000000000000.0)
+        BitRateUnits.PetabytePerSecond: ('PB/s',),
         
-        if to_unit == BitRateUnits.ExabytePerSecond:
-            return ((value * 8) * 1e+18)
+        BitRateUnits.ExabytePerSecond: ('EB/s',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: BitRateUnits = BitRateUnits.BitPerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: BitRateUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: BitRateUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
 
 
+    def __convert_to_base(self, value: float, to_unit: BitRateUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: BitRateUnits, to_unit: BitRateUnits) -> float:
+        """
+        Convert a value from one BitRate unit to another, without creating a BitRate instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: BitRateUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: BitRateUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return BitRate._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: BitRateUnits, to_unit: BitRateUnits) -> List[float]:
+        """
+        Convert many values from one BitRate unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: BitRateUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: BitRateUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return BitRate._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: BitRateUnits, to_unit: BitRateUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", BitRate._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: BitRateUnits, to_unit: BitRateUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one BitRate unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: BitRateUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: BitRateUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return BitRate._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: BitRateUnits = BitRateUnits.BitPerSecond) -> BitRate:
+        """
+        Create a new instance of BitRate holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: BitRateUnits
+        :return: A new instance of BitRate.
+        :rtype: BitRate
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return BitRate._from_exact(value, from_unit)
+
+    def to_exact(self, unit: BitRateUnits = BitRateUnits.BitPerSecond) -> Fraction:
+        """
+        Get the exact value of the BitRate in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (BitPerSecond).
+        :type unit: BitRateUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> BitRate:
+        """
+        Parse a BitRate from a value followed by a unit abbreviation, e.g. "1 bit/s".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of BitRate.
+        :rtype: BitRate
+        :raises ValueError: When the string is not a valid or an ambiguous BitRate.
+        """
+        return BitRate._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[BitRate]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return BitRate._try_parse(text)
+
+    def to_binary(self, unit: Optional[BitRateUnits] = None) -> bytes:
+        """
+        Encode the BitRate to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: BitRateUnits
+        :return: The encoded BitRate.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> BitRate:
+        """
+        Decode a BitRate encoded by to_binary.
+
+        :param data: The encoded BitRate, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of BitRate.
+        :rtype: BitRate
+        :raises ValueError: When the data is not a valid encoded BitRate.
+        """
+        return BitRate._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[BitRateUnits] = None) -> dict:
+        """
+        Get the BitRate DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (BitPerSecond).
+        :type hold_in_unit: BitRateUnits
+        :return: The BitRate DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[BitRateUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> BitRate:
+        """
+        Create a new instance of BitRate from its DTO.
+
+        :param dto: The BitRate DTO, the unit is the BitRateUnits value or name.
+        :type dto: dict
+        :return: A new instance of BitRate.
+        :rtype: BitRate
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return BitRate._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> BitRate:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return BitRate._from_json(text)
+
     @property
     def base_value(self) -> float:
         return self._value
@@ -441,10 +715,7 @@ class BitRate(AbstractMeasure):
         """
         
         """
-        if self.__bits_per_second != None:
-            return self.__bits_per_second
-        self.__bits_per_second = self.__convert_from_base(BitRateUnits.BitPerSecond)
-        return self.__bits_per_second
+        return self._cached_convert(BitRateUnits.BitPerSecond)
 
     
     @property
@@ -452,10 +723,7 @@ class BitRate(AbstractMeasure):
         """
         
         """
-        if self.__bytes_per_second != None:
-            return self.__bytes_per_second
-        self.__bytes_per_second = self.__convert_from_base(BitRateUnits.BytePerSecond)
-        return self.__bytes_per_second
+        return self._cached_convert(BitRateUnits.BytePerSecond)
 
     
     @property
@@ -463,10 +731,7 @@ class BitRate(AbstractMeasure):
         """
         
         """
-        if self.__kilobits_per_second != None:
-            return self.__kilobits_per_second
-        self.__kilobits_per_second = self.__convert_from_base(BitRateUnits.KilobitPerSecond)
-        return self.__kilobits_per_second
+        return self._cached_convert(BitRateUnits.KilobitPerSecond)
 
     
     @property
@@ -474,10 +739,7 @@ class BitRate(AbstractMeasure):
         """
         
         """
-        if self.__megabits_per_second != None:
-            return self.__megabits_per_second
-        self.__megabits_per_second = self.__convert_from_base(BitRateUnits.MegabitPerSecond)
-        return self.__megabits_per_second
+        return self._cached_convert(BitRateUnits.MegabitPerSecond)
 
     
     @property
@@ -485,10 +747,7 @@ class BitRate(AbstractMeasure):
         """
         
         """
-        if self.__gigabits_per_second != None:
-            return self.__gigabits_per_second
-        self.__gigabits_per_second = self.__convert_from_base(BitRateUnits.GigabitPerSecond)
-        return self.__gigabits_per_second
+        return self._cached_convert(BitRateUnits.GigabitPerSecond)
 
     
     @property
@@ -496,10 +755,7 @@ class BitRate(AbstractMeasure):
         """
         
         """
-        if self.__terabits_per_second != None:
-            return self.__terabits_per_second
-        self.__terabits_per_second = self.__convert_from_base(BitRateUnits.TerabitPerSecond)
-        return self.__terabits_per_second
+        return self._cached_convert(BitRateUnits.TerabitPerSecond)
 
     
     @property
@@ -507,10 +763,7 @@ class BitRate(AbstractMeasure):
         """
         
         """
-        if self.__petabits_per_second != None:
-            return self.__petabits_per_second
-        self.__petabits_per_second = self.__convert_from_base(BitRateUnits.PetabitPerSecond)
-        return self.__petabits_per_second
+        return self._cached_convert(BitRateUnits.PetabitPerSecond)
 
     
     @property
@@ -518,10 +771,7 @@ class BitRate(AbstractMeasure):
         """
         
         """
-        if self.__exabits_per_second != None:
-            return self.__exabits_per_second
-        self.__exabits_per_second = self.__convert_from_base(BitRateUnits.ExabitPerSecond)
-        return self.__exabits_per_second
+        return self._cached_convert(BitRateUnits.ExabitPerSecond)
 
     
     @property
@@ -529,10 +779,7 @@ class BitRate(AbstractMeasure):
         """
         
         """
-        if self.__kilobytes_per_second != None:
-            return self.__kilobytes_per_second
-        self.__kilobytes_per_second = self.__convert_from_base(BitRateUnits.KilobytePerSecond)
-        return self.__kilobytes_per_second
+        return self._cached_convert(BitRateUnits.KilobytePerSecond)
 
     
     @property
@@ -540,10 +787,7 @@ class BitRate(AbstractMeasure):
         """
         
         """
-        if self.__megabytes_per_second != None:
-            return self.__megabytes_per_second
-        self.__megabytes_per_second = self.__convert_from_base(BitRateUnits.MegabytePerSecond)
-        return self.__megabytes_per_second
+        return self._cached_convert(BitRateUnits.MegabytePerSecond)
 
     
     @property
@@ -551,10 +795,7 @@ class BitRate(AbstractMeasure):
         """
         
         """
-        if self.__gigabytes_per_second != None:
-            return self.__gigabytes_per_second
-        self.__gigabytes_per_second = self.__convert_from_base(BitRateUnits.GigabytePerSecond)
-        return self.__gigabytes_per_second
+        return self._cached_convert(BitRateUnits.GigabytePerSecond)
 
     
     @property
@@ -562,10 +803,7 @@ class BitRate(AbstractMeasure):
         """
         
         """
-        if self.__terabytes_per_second != None:
-            return self.__terabytes_per_second
-        self.__terabytes_per_second = self.__convert_from_base(BitRateUnits.TerabytePerSecond)
-        return self.__terabytes_per_second
+        return self._cached_convert(BitRateUnits.TerabytePerSecond)
 
     
     @property
@@ -573,10 +811,7 @@ class BitRate(AbstractMeasure):
         """
         
         """
-        if self.__petabytes_per_second != None:
-            return self.__petabytes_per_second
-        self.__petabytes_per_second = self.__convert_from_base(BitRateUnits.PetabytePerSecond)
-        return self.__petabytes_per_second
+        return self._cached_convert(BitRateUnits.PetabytePerSecond)
 
     
     @property
@@ -584,10 +819,7 @@ class BitRate(AbstractMeasure):
         """
         
         """
-        if self.__exabytes_per_second != None:
-            return self.__exabytes_per_second
-        self.__exabytes_per_second = self.__convert_from_base(BitRateUnits.ExabytePerSecond)
-        return self.__exabytes_per_second
+        return self._cached_convert(BitRateUnits.ExabytePerSecond)
 
     
     def to_string(self, unit: BitRateUnits = BitRateUnits.BitPerSecond) -> str:
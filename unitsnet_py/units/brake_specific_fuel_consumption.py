@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class BrakeSpecificFuelConsumptionUnits(Enum):
         """
             BrakeSpecificFuelConsumptionUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         GramPerKiloWattHour = 'gram_per_kilo_watt_hour'
         """
@@ -34,49 +45,268 @@ class BrakeSpecificFuelConsumption(AbstractMeasure):
         value (float): The value.
         from_unit (BrakeSpecificFuelConsumptionUnits): The BrakeSpecificFuelConsumption unit to create from, The default unit is KilogramPerJoule
     """
-    def __init__(self, value: float, from_unit: BrakeSpecificFuelConsumptionUnits = BrakeSpecificFuelConsumptionUnits.KilogramPerJoule):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = BrakeSpecificFuelConsumptionUnits
+
+    _base_unit = BrakeSpecificFuelConsumptionUnits.KilogramPerJoule
+
+    _dimensions = (-2, 0, 2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 11
+
+    _binary_unit_ids = {
         
-        self.__grams_per_kilo_watt_hour = None
+        BrakeSpecificFuelConsumptionUnits.GramPerKiloWattHour: 0,
         
-        self.__kilograms_per_joule = None
+        BrakeSpecificFuelConsumptionUnits.KilogramPerJoule: 1,
         
-        self.__pounds_per_mechanical_horsepower_hour = None
+        BrakeSpecificFuelConsumptionUnits.PoundPerMechanicalHorsepowerHour: 2,
         
+    }
 
-    def convert(self, unit: BrakeSpecificFuelConsumptionUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        BrakeSpecificFuelConsumptionUnits.GramPerKiloWattHour: lambda value: (value * 3.6e9),
+        
+        BrakeSpecificFuelConsumptionUnits.KilogramPerJoule: lambda value: (value),
+        
+        BrakeSpecificFuelConsumptionUnits.PoundPerMechanicalHorsepowerHour: lambda value: (value / 1.689659410672e-7),
+        
+    }
 
-    def __convert_from_base(self, from_unit: BrakeSpecificFuelConsumptionUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == BrakeSpecificFuelConsumptionUnits.GramPerKiloWattHour:
-            return (value * 3.6e9)
+        BrakeSpecificFuelConsumptionUnits.GramPerKiloWattHour: lambda value: (value / 3.6e9),
         
-        if from_unit == BrakeSpecificFuelConsumptionUnits.KilogramPerJoule:
-            return (value)
+        BrakeSpecificFuelConsumptionUnits.KilogramPerJoule: lambda value: (value),
         
-        if from_unit == BrakeSpecificFuelConsumptionUnits.PoundPerMechanicalHorsepowerHour:
-            return (value / 1.689659410672e-7)
+        BrakeSpecificFuelConsumptionUnits.PoundPerMechanicalHorsepowerHour: lambda value: (value * 1.689659410672e-7),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        BrakeSpecificFuelConsumptionUnits.GramPerKiloWattHour: ('3600000000', '0'),
+        
+        BrakeSpecificFuelConsumptionUnits.KilogramPerJoule: ('1', '0'),
+        
+        BrakeSpecificFuelConsumptionUnits.PoundPerMechanicalHorsepowerHour: ('625000000000000000/105603713167', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: BrakeSpecificFuelConsumptionUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == BrakeSpecificFuelConsumptionUnits.GramPerKiloWattHour:
-            return (value / 3.6e9)
+        BrakeSpecificFuelConsumptionUnits.GramPerKiloWattHour: ('1/3600000000', '0'),
         
-        if to_unit == BrakeSpecificFuelConsumptionUnits.KilogramPerJoule:
-            return (value)
+        BrakeSpecificFuelConsumptionUnits.KilogramPerJoule: ('1', '0'),
+        
+        BrakeSpecificFuelConsumptionUnits.PoundPerMechanicalHorsepowerHour: ('105603713167/625000000000000000', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == BrakeSpecificFuelConsumptionUnits.PoundPerMechanicalHorsepowerHour:
-            return (value * 1.689659410672e-7)
+        BrakeSpecificFuelConsumptionUnits.GramPerKiloWattHour: ('g/kWh',),
         
-        return None
+        BrakeSpecificFuelConsumptionUnits.KilogramPerJoule: ('kg/J',),
+        
+        BrakeSpecificFuelConsumptionUnits.PoundPerMechanicalHorsepowerHour: ('lb/hph',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: BrakeSpecificFuelConsumptionUnits = BrakeSpecificFuelConsumptionUnits.KilogramPerJoule):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: BrakeSpecificFuelConsumptionUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: BrakeSpecificFuelConsumptionUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: BrakeSpecificFuelConsumptionUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: BrakeSpecificFuelConsumptionUnits, to_unit: BrakeSpecificFuelConsumptionUnits) -> float:
+        """
+        Convert a value from one BrakeSpecificFuelConsumption unit to another, without creating a BrakeSpecificFuelConsumption instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: BrakeSpecificFuelConsumptionUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: BrakeSpecificFuelConsumptionUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return BrakeSpecificFuelConsumption._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: BrakeSpecificFuelConsumptionUnits, to_unit: BrakeSpecificFuelConsumptionUnits) -> List[float]:
+        """
+        Convert many values from one BrakeSpecificFuelConsumption unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: BrakeSpecificFuelConsumptionUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: BrakeSpecificFuelConsumptionUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return BrakeSpecificFuelConsumption._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: BrakeSpecificFuelConsumptionUnits, to_unit: BrakeSpecificFuelConsumptionUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", BrakeSpecificFuelConsumption._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: BrakeSpecificFuelConsumptionUnits, to_unit: BrakeSpecificFuelConsumptionUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one BrakeSpecificFuelConsumption unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: BrakeSpecificFuelConsumptionUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: BrakeSpecificFuelConsumptionUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return BrakeSpecificFuelConsumption._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: BrakeSpecificFuelConsumptionUnits = BrakeSpecificFuelConsumptionUnits.KilogramPerJoule) -> BrakeSpecificFuelConsumption:
+        """
+        Create a new instance of BrakeSpecificFuelConsumption holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: BrakeSpecificFuelConsumptionUnits
+        :return: A new instance of BrakeSpecificFuelConsumption.
+        :rtype: BrakeSpecificFuelConsumption
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return BrakeSpecificFuelConsumption._from_exact(value, from_unit)
+
+    def to_exact(self, unit: BrakeSpecificFuelConsumptionUnits = BrakeSpecificFuelConsumptionUnits.KilogramPerJoule) -> Fraction:
+        """
+        Get the exact value of the BrakeSpecificFuelConsumption in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (KilogramPerJoule).
+        :type unit: BrakeSpecificFuelConsumptionUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> BrakeSpecificFuelConsumption:
+        """
+        Parse a BrakeSpecificFuelConsumption from a value followed by a unit abbreviation, e.g. "1 g/kWh".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of BrakeSpecificFuelConsumption.
+        :rtype: BrakeSpecificFuelConsumption
+        :raises ValueError: When the string is not a valid or an ambiguous BrakeSpecificFuelConsumption.
+        """
+        return BrakeSpecificFuelConsumption._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[BrakeSpecificFuelConsumption]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return BrakeSpecificFuelConsumption._try_parse(text)
 
+    def to_binary(self, unit: Optional[BrakeSpecificFuelConsumptionUnits] = None) -> bytes:
+        """
+        Encode the BrakeSpecificFuelConsumption to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: BrakeSpecificFuelConsumptionUnits
+        :return: The encoded BrakeSpecificFuelConsumption.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> BrakeSpecificFuelConsumption:
+        """
+        Decode a BrakeSpecificFuelConsumption encoded by to_binary.
+
+        :param data: The encoded BrakeSpecificFuelConsumption, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of BrakeSpecificFuelConsumption.
+        :rtype: BrakeSpecificFuelConsumption
+        :raises ValueError: When the data is not a valid encoded BrakeSpecificFuelConsumption.
+        """
+        return BrakeSpecificFuelConsumption._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[BrakeSpecificFuelConsumptionUnits] = None) -> dict:
+        """
+        Get the BrakeSpecificFuelConsumption DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (KilogramPerJoule).
+        :type hold_in_unit: BrakeSpecificFuelConsumptionUnits
+        :return: The BrakeSpecificFuelConsumption DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[BrakeSpecificFuelConsumptionUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> BrakeSpecificFuelConsumption:
+        """
+        Create a new instance of BrakeSpecificFuelConsumption from its DTO.
+
+        :param dto: The BrakeSpecificFuelConsumption DTO, the unit is the BrakeSpecificFuelConsumptionUnits value or name.
+        :type dto: dict
+        :return: A new instance of BrakeSpecificFuelConsumption.
+        :rtype: BrakeSpecificFuelConsumption
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return BrakeSpecificFuelConsumption._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> BrakeSpecificFuelConsumption:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return BrakeSpecificFuelConsumption._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -133,10 +363,7 @@ class BrakeSpecificFuelConsumption(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_kilo_watt_hour != None:
-            return self.__grams_per_kilo_watt_hour
-        self.__grams_per_kilo_watt_hour = self.__convert_from_base(BrakeSpecificFuelConsumptionUnits.GramPerKiloWattHour)
-        return self.__grams_per_kilo_watt_hour
+        return self._cached_convert(BrakeSpecificFuelConsumptionUnits.GramPerKiloWattHour)
 
     
     @property
@@ -144,10 +371,7 @@ class BrakeSpecificFuelConsumption(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_joule != None:
-            return self.__kilograms_per_joule
-        self.__kilograms_per_joule = self.__convert_from_base(BrakeSpecificFuelConsumptionUnits.KilogramPerJoule)
-        return self.__kilograms_per_joule
+        return self._cached_convert(BrakeSpecificFuelConsumptionUnits.KilogramPerJoule)
 
     
     @property
@@ -155,10 +379,7 @@ class BrakeSpecificFuelConsumption(AbstractMeasure):
         """
         The pound per horse power hour uses mechanical horse power and the imperial pound
         """
-        if self.__pounds_per_mechanical_horsepower_hour != None:
-            return self.__pounds_per_mechanical_horsepower_hour
-        self.__pounds_per_mechanical_horsepower_hour = self.__convert_from_base(BrakeSpecificFuelConsumptionUnits.PoundPerMechanicalHorsepowerHour)
-        return self.__pounds_per_mechanical_horsepower_hour
+        return self._cached_convert(BrakeSpecificFuelConsumptionUnits.PoundPerMechanicalHorsepowerHour)
 
     
     def to_string(self, unit: BrakeSpecificFuelConsumptionUnits = BrakeSpecificFuelConsumptionUnits.KilogramPerJoule) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class CapacitanceUnits(Enum):
         """
             CapacitanceUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Farad = 'farad'
         """
@@ -54,81 +65,316 @@ class Capacitance(AbstractMeasure):
         value (float): The value.
         from_unit (CapacitanceUnits): The Capacitance unit to create from, The default unit is Farad
     """
-    def __init__(self, value: float, from_unit: CapacitanceUnits = CapacitanceUnits.Farad):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = CapacitanceUnits
+
+    _base_unit = CapacitanceUnits.Farad
+
+    _dimensions = (-2, -1, 4, 2, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 12
+
+    _binary_unit_ids = {
         
-        self.__farads = None
+        CapacitanceUnits.Farad: 0,
         
-        self.__picofarads = None
+        CapacitanceUnits.Picofarad: 1,
         
-        self.__nanofarads = None
+        CapacitanceUnits.Nanofarad: 2,
         
-        self.__microfarads = None
+        CapacitanceUnits.Microfarad: 3,
         
-        self.__millifarads = None
+        CapacitanceUnits.Millifarad: 4,
         
-        self.__kilofarads = None
+        CapacitanceUnits.Kilofarad: 5,
         
-        self.__megafarads = None
+        CapacitanceUnits.Megafarad: 6,
         
+    }
 
-    def convert(self, unit: CapacitanceUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        CapacitanceUnits.Farad: lambda value: (value),
+        
+        CapacitanceUnits.Picofarad: lambda value: ((value) / 1e-12),
+        
+        CapacitanceUnits.Nanofarad: lambda value: ((value) / 1e-09),
+        
+        CapacitanceUnits.Microfarad: lambda value: ((value) / 1e-06),
+        
+        CapacitanceUnits.Millifarad: lambda value: ((value) / 0.001),
+        
+        CapacitanceUnits.Kilofarad: lambda value: ((value) / 1000.0),
+        
+        CapacitanceUnits.Megafarad: lambda value: ((value) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: CapacitanceUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == CapacitanceUnits.Farad:
-            return (value)
+        CapacitanceUnits.Farad: lambda value: (value),
         
-        if from_unit == CapacitanceUnits.Picofarad:
-            return ((value) / 1e-12)
+        CapacitanceUnits.Picofarad: lambda value: ((value) * 1e-12),
         
-        if from_unit == CapacitanceUnits.Nanofarad:
-            return ((value) / 1e-09)
+        CapacitanceUnits.Nanofarad: lambda value: ((value) * 1e-09),
         
-        if from_unit == CapacitanceUnits.Microfarad:
-            return ((value) / 1e-06)
+        CapacitanceUnits.Microfarad: lambda value: ((value) * 1e-06),
         
-        if from_unit == CapacitanceUnits.Millifarad:
-            return ((value) / 0.001)
+        CapacitanceUnits.Millifarad: lambda value: ((value) * 0.001),
         
-        if from_unit == CapacitanceUnits.Kilofarad:
-            return ((value) / 1000.0)
+        CapacitanceUnits.Kilofarad: lambda value: ((value) * 1000.0),
         
-        if from_unit == CapacitanceUnits.Megafarad:
-            return ((value) / 1000000.0)
+        CapacitanceUnits.Megafarad: lambda value: ((value) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        CapacitanceUnits.Farad: ('1', '0'),
+        
+        CapacitanceUnits.Picofarad: ('1000000000000', '0'),
+        
+        CapacitanceUnits.Nanofarad: ('1000000000', '0'),
+        
+        CapacitanceUnits.Microfarad: ('1000000', '0'),
+        
+        CapacitanceUnits.Millifarad: ('1000', '0'),
+        
+        CapacitanceUnits.Kilofarad: ('1/1000', '0'),
+        
+        CapacitanceUnits.Megafarad: ('1/1000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: CapacitanceUnits) -> float:
+    _affine_to_base = {
+        
+        CapacitanceUnits.Farad: ('1', '0'),
+        
+        CapacitanceUnits.Picofarad: ('1/1000000000000', '0'),
+        
+        CapacitanceUnits.Nanofarad: ('1/1000000000', '0'),
+        
+        CapacitanceUnits.Microfarad: ('1/1000000', '0'),
+        
+        CapacitanceUnits.Millifarad: ('1/1000', '0'),
+        
+        CapacitanceUnits.Kilofarad: ('1000', '0'),
         
-        if to_unit == CapacitanceUnits.Farad:
-            return (value)
+        CapacitanceUnits.Megafarad: ('1000000', '0'),
         
-        if to_unit == CapacitanceUnits.Picofarad:
-            return ((value) * 1e-12)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        CapacitanceUnits.Farad: ('F',),
         
-        if to_unit == CapacitanceUnits.Nanofarad:
-            return ((value) * 1e-09)
+        CapacitanceUnits.Picofarad: ('pF',),
         
-        if to_unit == CapacitanceUnits.Microfarad:
-            return ((value) * 1e-06)
+        CapacitanceUnits.Nanofarad: ('nF',),
         
-        if to_unit == CapacitanceUnits.Millifarad:
-            return ((value) * 0.001)
+        CapacitanceUnits.Microfarad: ('μF',),
         
-        if to_unit == CapacitanceUnits.Kilofarad:
-            return ((value) * 1000.0)
+        CapacitanceUnits.Millifarad: ('mF',),
         
-        if to_unit == CapacitanceUnits.Megafarad:
-            return ((value) * 1000000.0)
+        CapacitanceUnits.Kilofarad: ('kF',),
         
-        return None
+        CapacitanceUnits.Megafarad: ('MF',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: CapacitanceUnits = CapacitanceUnits.Farad):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: CapacitanceUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: CapacitanceUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: CapacitanceUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: CapacitanceUnits, to_unit: CapacitanceUnits) -> float:
+        """
+        Convert a value from one Capacitance unit to another, without creating a Capacitance instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: CapacitanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: CapacitanceUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Capacitance._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: CapacitanceUnits, to_unit: CapacitanceUnits) -> List[float]:
+        """
+        Convert many values from one Capacitance unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: CapacitanceUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: CapacitanceUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Capacitance._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: CapacitanceUnits, to_unit: CapacitanceUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Capacitance._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: CapacitanceUnits, to_unit: CapacitanceUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Capacitance unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: CapacitanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: CapacitanceUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Capacitance._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: CapacitanceUnits = CapacitanceUnits.Farad) -> Capacitance:
+        """
+        Create a new instance of Capacitance holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
 
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: CapacitanceUnits
+        :return: A new instance of Capacitance.
+        :rtype: Capacitance
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Capacitance._from_exact(value, from_unit)
+
+    def to_exact(self, unit: CapacitanceUnits = CapacitanceUnits.Farad) -> Fraction:
+        """
+        Get the exact value of the Capacitance in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Farad).
+        :type unit: CapacitanceUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Capacitance:
+        """
+        Parse a Capacitance from a value followed by a unit abbreviation, e.g. "1 F".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Capacitance.
+        :rtype: Capacitance
+        :raises ValueError: When the string is not a valid or an ambiguous Capacitance.
+        """
+        return Capacitance._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Capacitance]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Capacitance._try_parse(text)
+
+    def to_binary(self, unit: Optional[CapacitanceUnits] = None) -> bytes:
+        """
+        Encode the Capacitance to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: CapacitanceUnits
+        :return: The encoded Capacitance.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Capacitance:
+        """
+        Decode a Capacitance encoded by to_binary.
+
+        :param data: The encoded Capacitance, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Capacitance.
+        :rtype: Capacitance
+        :raises ValueError: When the data is not a valid encoded Capacitance.
+        """
+        return Capacitance._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[CapacitanceUnits] = None) -> dict:
+        """
+        Get the Capacitance DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Farad).
+        :type hold_in_unit: CapacitanceUnits
+        :return: The Capacitance DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[CapacitanceUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Capacitance:
+        """
+        Create a new instance of Capacitance from its DTO.
+
+        :param dto: The Capacitance DTO, the unit is the CapacitanceUnits value or name.
+        :type dto: dict
+        :return: A new instance of Capacitance.
+        :rtype: Capacitance
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Capacitance._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Capacitance:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Capacitance._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -245,10 +491,7 @@ class Capacitance(AbstractMeasure):
         """
         
         """
-        if self.__farads != None:
-            return self.__farads
-        self.__farads = self.__convert_from_base(CapacitanceUnits.Farad)
-        return self.__farads
+        return self._cached_convert(CapacitanceUnits.Farad)
 
     
     @property
@@ -256,10 +499,7 @@ class Capacitance(AbstractMeasure):
         """
         
         """
-        if self.__picofarads != None:
-            return self.__picofarads
-        self.__picofarads = self.__convert_from_base(CapacitanceUnits.Picofarad)
-        return self.__picofarads
+        return self._cached_convert(CapacitanceUnits.Picofarad)
 
     
     @property
@@ -267,10 +507,7 @@ class Capacitance(AbstractMeasure):
         """
         
         """
-        if self.__nanofarads != None:
-            return self.__nanofarads
-        self.__nanofarads = self.__convert_from_base(CapacitanceUnits.Nanofarad)
-        return self.__nanofarads
+        return self._cached_convert(CapacitanceUnits.Nanofarad)
 
     
     @property
@@ -278,10 +515,7 @@ class Capacitance(AbstractMeasure):
         """
         
         """
-        if self.__microfarads != None:
-            return self.__microfarads
-        self.__microfarads = self.__convert_from_base(CapacitanceUnits.Microfarad)
-        return self.__microfarads
+        return self._cached_convert(CapacitanceUnits.Microfarad)
 
     
     @property
@@ -289,10 +523,7 @@ class Capacitance(AbstractMeasure):
         """
         
         """
-        if self.__millifarads != None:
-            return self.__millifarads
-        self.__millifarads = self.__convert_from_base(CapacitanceUnits.Millifarad)
-        return self.__millifarads
+        return self._cached_convert(CapacitanceUnits.Millifarad)
 
     
     @property
@@ -300,10 +531,7 @@ class Capacitance(AbstractMeasure):
         """
         
         """
-        if self.__kilofarads != None:
-            return self.__kilofarads
-        self.__kilofarads = self.__convert_from_base(CapacitanceUnits.Kilofarad)
-        return self.__kilofarads
+        return self._cached_convert(CapacitanceUnits.Kilofarad)
 
     
     @property
@@ -311,10 +539,7 @@ class Capacitance(AbstractMeasure):
         """
         
         """
-        if self.__megafarads != None:
-            return self.__megafarads
-        self.__megafarads = self.__convert_from_base(CapacitanceUnits.Megafarad)
-        return self.__megafarads
+        return self._cached_convert(CapacitanceUnits.Megafarad)
 
     
     def to_string(self, unit: CapacitanceUnits = CapacitanceUnits.Farad) -> str:
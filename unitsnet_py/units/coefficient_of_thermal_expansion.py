@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class CoefficientOfThermalExpansionUnits(Enum):
         """
             CoefficientOfThermalExpansionUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         PerKelvin = 'per_kelvin'
         """
@@ -49,73 +60,304 @@ class CoefficientOfThermalExpansion(AbstractMeasure):
         value (float): The value.
         from_unit (CoefficientOfThermalExpansionUnits): The CoefficientOfThermalExpansion unit to create from, The default unit is PerKelvin
     """
-    def __init__(self, value: float, from_unit: CoefficientOfThermalExpansionUnits = CoefficientOfThermalExpansionUnits.PerKelvin):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = CoefficientOfThermalExpansionUnits
+
+    _base_unit = CoefficientOfThermalExpansionUnits.PerKelvin
+
+    _dimensions = (0, 0, 0, 0, -1, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 13
+
+    _binary_unit_ids = {
         
-        self.__per_kelvin = None
+        CoefficientOfThermalExpansionUnits.PerKelvin: 0,
         
-        self.__per_degree_celsius = None
+        CoefficientOfThermalExpansionUnits.PerDegreeCelsius: 1,
         
-        self.__per_degree_fahrenheit = None
+        CoefficientOfThermalExpansionUnits.PerDegreeFahrenheit: 2,
         
-        self.__ppm_per_kelvin = None
+        CoefficientOfThermalExpansionUnits.PpmPerKelvin: 3,
         
-        self.__ppm_per_degree_celsius = None
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeCelsius: 4,
         
-        self.__ppm_per_degree_fahrenheit = None
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeFahrenheit: 5,
         
+    }
 
-    def convert(self, unit: CoefficientOfThermalExpansionUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        CoefficientOfThermalExpansionUnits.PerKelvin: lambda value: (value),
+        
+        CoefficientOfThermalExpansionUnits.PerDegreeCelsius: lambda value: (value),
+        
+        CoefficientOfThermalExpansionUnits.PerDegreeFahrenheit: lambda value: (value * 5 / 9),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerKelvin: lambda value: (value * 1e6),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeCelsius: lambda value: (value * 1e6),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeFahrenheit: lambda value: (value * 5e6 / 9),
+        
+    }
 
-    def __convert_from_base(self, from_unit: CoefficientOfThermalExpansionUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        CoefficientOfThermalExpansionUnits.PerKelvin: lambda value: (value),
+        
+        CoefficientOfThermalExpansionUnits.PerDegreeCelsius: lambda value: (value),
+        
+        CoefficientOfThermalExpansionUnits.PerDegreeFahrenheit: lambda value: (value * 9 / 5),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerKelvin: lambda value: (value / 1e6),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeCelsius: lambda value: (value / 1e6),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeFahrenheit: lambda value: (value * 9 / 5e6),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
         
-        if from_unit == CoefficientOfThermalExpansionUnits.PerKelvin:
-            return (value)
+        CoefficientOfThermalExpansionUnits.PerKelvin: ('1', '0'),
         
-        if from_unit == CoefficientOfThermalExpansionUnits.PerDegreeCelsius:
-            return (value)
+        CoefficientOfThermalExpansionUnits.PerDegreeCelsius: ('1', '0'),
         
-        if from_unit == CoefficientOfThermalExpansionUnits.PerDegreeFahrenheit:
-            return (value * 5 / 9)
+        CoefficientOfThermalExpansionUnits.PerDegreeFahrenheit: ('5/9', '0'),
         
-        if from_unit == CoefficientOfThermalExpansionUnits.PpmPerKelvin:
-            return (value * 1e6)
+        CoefficientOfThermalExpansionUnits.PpmPerKelvin: ('1000000', '0'),
         
-        if from_unit == CoefficientOfThermalExpansionUnits.PpmPerDegreeCelsius:
-            return (value * 1e6)
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeCelsius: ('1000000', '0'),
         
-        if from_unit == CoefficientOfThermalExpansionUnits.PpmPerDegreeFahrenheit:
-            return (value * 5e6 / 9)
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeFahrenheit: ('5000000/9', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        CoefficientOfThermalExpansionUnits.PerKelvin: ('1', '0'),
+        
+        CoefficientOfThermalExpansionUnits.PerDegreeCelsius: ('1', '0'),
+        
+        CoefficientOfThermalExpansionUnits.PerDegreeFahrenheit: ('9/5', '0'),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerKelvin: ('1/1000000', '0'),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeCelsius: ('1/1000000', '0'),
+        
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeFahrenheit: ('9/5000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: CoefficientOfThermalExpansionUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == CoefficientOfThermalExpansionUnits.PerKelvin:
-            return (value)
+        CoefficientOfThermalExpansionUnits.PerKelvin: ('K⁻¹',),
         
-        if to_unit == CoefficientOfThermalExpansionUnits.PerDegreeCelsius:
-            return (value)
+        CoefficientOfThermalExpansionUnits.PerDegreeCelsius: ('°C⁻¹',),
         
-        if to_unit == CoefficientOfThermalExpansionUnits.PerDegreeFahrenheit:
-            return (value * 9 / 5)
+        CoefficientOfThermalExpansionUnits.PerDegreeFahrenheit: ('°F⁻¹',),
         
-        if to_unit == CoefficientOfThermalExpansionUnits.PpmPerKelvin:
-            return (value / 1e6)
+        CoefficientOfThermalExpansionUnits.PpmPerKelvin: ('ppm/K',),
         
-        if to_unit == CoefficientOfThermalExpansionUnits.PpmPerDegreeCelsius:
-            return (value / 1e6)
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeCelsius: ('ppm/°C',),
         
-        if to_unit == CoefficientOfThermalExpansionUnits.PpmPerDegreeFahrenheit:
-            return (value * 9 / 5e6)
+        CoefficientOfThermalExpansionUnits.PpmPerDegreeFahrenheit: ('ppm/°F',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: CoefficientOfThermalExpansionUnits = CoefficientOfThermalExpansionUnits.PerKelvin):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: CoefficientOfThermalExpansionUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: CoefficientOfThermalExpansionUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: CoefficientOfThermalExpansionUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: CoefficientOfThermalExpansionUnits, to_unit: CoefficientOfThermalExpansionUnits) -> float:
+        """
+        Convert a value from one CoefficientOfThermalExpansion unit to another, without creating a CoefficientOfThermalExpansion instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: CoefficientOfThermalExpansionUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: CoefficientOfThermalExpansionUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return CoefficientOfThermalExpansion._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: CoefficientOfThermalExpansionUnits, to_unit: CoefficientOfThermalExpansionUnits) -> List[float]:
+        """
+        Convert many values from one CoefficientOfThermalExpansion unit to another.
+        The conversion is resolved once and applied to all the values.
 
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: CoefficientOfThermalExpansionUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: CoefficientOfThermalExpansionUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return CoefficientOfThermalExpansion._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: CoefficientOfThermalExpansionUnits, to_unit: CoefficientOfThermalExpansionUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", CoefficientOfThermalExpansion._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: CoefficientOfThermalExpansionUnits, to_unit: CoefficientOfThermalExpansionUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one CoefficientOfThermalExpansion unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: CoefficientOfThermalExpansionUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: CoefficientOfThermalExpansionUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return CoefficientOfThermalExpansion._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: CoefficientOfThermalExpansionUnits = CoefficientOfThermalExpansionUnits.PerKelvin) -> CoefficientOfThermalExpansion:
+        """
+        Create a new instance of CoefficientOfThermalExpansion holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: CoefficientOfThermalExpansionUnits
+        :return: A new instance of CoefficientOfThermalExpansion.
+        :rtype: CoefficientOfThermalExpansion
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return CoefficientOfThermalExpansion._from_exact(value, from_unit)
+
+    def to_exact(self, unit: CoefficientOfThermalExpansionUnits = CoefficientOfThermalExpansionUnits.PerKelvin) -> Fraction:
+        """
+        Get the exact value of the CoefficientOfThermalExpansion in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (PerKelvin).
+        :type unit: CoefficientOfThermalExpansionUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> CoefficientOfThermalExpansion:
+        """
+        Parse a CoefficientOfThermalExpansion from a value followed by a unit abbreviation, e.g. "1 K⁻¹".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of CoefficientOfThermalExpansion.
+        :rtype: CoefficientOfThermalExpansion
+        :raises ValueError: When the string is not a valid or an ambiguous CoefficientOfThermalExpansion.
+        """
+        return CoefficientOfThermalExpansion._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[CoefficientOfThermalExpansion]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return CoefficientOfThermalExpansion._try_parse(text)
+
+    def to_binary(self, unit: Optional[CoefficientOfThermalExpansionUnits] = None) -> bytes:
+        """
+        Encode the CoefficientOfThermalExpansion to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: CoefficientOfThermalExpansionUnits
+        :return: The encoded CoefficientOfThermalExpansion.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> CoefficientOfThermalExpansion:
+        """
+        Decode a CoefficientOfThermalExpansion encoded by to_binary.
+
+        :param data: The encoded CoefficientOfThermalExpansion, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of CoefficientOfThermalExpansion.
+        :rtype: CoefficientOfThermalExpansion
+        :raises ValueError: When the data is not a valid encoded CoefficientOfThermalExpansion.
+        """
+        return CoefficientOfThermalExpansion._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[CoefficientOfThermalExpansionUnits] = None) -> dict:
+        """
+        Get the CoefficientOfThermalExpansion DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (PerKelvin).
+        :type hold_in_unit: CoefficientOfThermalExpansionUnits
+        :return: The CoefficientOfThermalExpansion DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[CoefficientOfThermalExpansionUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> CoefficientOfThermalExpansion:
+        """
+        Create a new instance of CoefficientOfThermalExpansion from its DTO.
+
+        :param dto: The CoefficientOfThermalExpansion DTO, the unit is the CoefficientOfThermalExpansionUnits value or name.
+        :type dto: dict
+        :return: A new instance of CoefficientOfThermalExpansion.
+        :rtype: CoefficientOfThermalExpansion
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return CoefficientOfThermalExpansion._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> CoefficientOfThermalExpansion:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return CoefficientOfThermalExpansion._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -217,10 +459,7 @@ class CoefficientOfThermalExpansion(AbstractMeasure):
         """
         
         """
-        if self.__per_kelvin != None:
-            return self.__per_kelvin
-        self.__per_kelvin = self.__convert_from_base(CoefficientOfThermalExpansionUnits.PerKelvin)
-        return self.__per_kelvin
+        return self._cached_convert(CoefficientOfThermalExpansionUnits.PerKelvin)
 
     
     @property
@@ -228,10 +467,7 @@ class CoefficientOfThermalExpansion(AbstractMeasure):
         """
         
         """
-        if self.__per_degree_celsius != None:
-            return self.__per_degree_celsius
-        self.__per_degree_celsius = self.__convert_from_base(CoefficientOfThermalExpansionUnits.PerDegreeCelsius)
-        return self.__per_degree_celsius
+        return self._cached_convert(CoefficientOfThermalExpansionUnits.PerDegreeCelsius)
 
     
     @property
@@ -239,10 +475,7 @@ class CoefficientOfThermalExpansion(AbstractMeasure):
         """
         
         """
-        if self.__per_degree_fahrenheit != None:
-            return self.__per_degree_fahrenheit
-        self.__per_degree_fahrenheit = self.__convert_from_base(CoefficientOfThermalExpansionUnits.PerDegreeFahrenheit)
-        return self.__per_degree_fahrenheit
+        return self._cached_convert(CoefficientOfThermalExpansionUnits.PerDegreeFahrenheit)
 
     
     @property
@@ -250,10 +483,7 @@ class CoefficientOfThermalExpansion(AbstractMeasure):
         """
         
         """
-        if self.__ppm_per_kelvin != None:
-            return self.__ppm_per_kelvin
-        self.__ppm_per_kelvin = self.__convert_from_base(CoefficientOfThermalExpansionUnits.PpmPerKelvin)
-        return self.__ppm_per_kelvin
+        return self._cached_convert(CoefficientOfThermalExpansionUnits.PpmPerKelvin)
 
     
     @property
@@ -261,10 +491,7 @@ class CoefficientOfThermalExpansion(AbstractMeasure):
         """
         
         """
-        if self.__ppm_per_degree_celsius != None:
-            return self.__ppm_per_degree_celsius
-        self.__ppm_per_degree_celsius = self.__convert_from_base(CoefficientOfThermalExpansionUnits.PpmPerDegreeCelsius)
-        return self.__ppm_per_degree_celsius
+        return self._cached_convert(CoefficientOfThermalExpansionUnits.PpmPerDegreeCelsius)
 
     
     @property
@@ -272,10 +499,7 @@ class CoefficientOfThermalExpansion(AbstractMeasure):
         """
         
         """
-        if self.__ppm_per_degree_fahrenheit != None:
-            return self.__ppm_per_degree_fahrenheit
-        self.__ppm_per_degree_fahrenheit = self.__convert_from_base(CoefficientOfThermalExpansionUnits.PpmPerDegreeFahrenheit)
-        return self.__ppm_per_degree_fahrenheit
+        return self._cached_convert(CoefficientOfThermalExpansionUnits.PpmPerDegreeFahrenheit)
 
     
     def to_string(self, unit: CoefficientOfThermalExpansionUnits = CoefficientOfThermalExpansionUnits.PerKelvin) -> str:
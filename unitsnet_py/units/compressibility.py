@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class CompressibilityUnits(Enum):
         """
             CompressibilityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         InversePascal = 'inverse_pascal'
         """
@@ -54,81 +65,316 @@ class Compressibility(AbstractMeasure):
         value (float): The value.
         from_unit (CompressibilityUnits): The Compressibility unit to create from, The default unit is InversePascal
     """
-    def __init__(self, value: float, from_unit: CompressibilityUnits = CompressibilityUnits.InversePascal):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = CompressibilityUnits
+
+    _base_unit = CompressibilityUnits.InversePascal
+
+    _dimensions = (1, -1, 2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 14
+
+    _binary_unit_ids = {
         
-        self.__inverse_pascals = None
+        CompressibilityUnits.InversePascal: 0,
         
-        self.__inverse_kilopascals = None
+        CompressibilityUnits.InverseKilopascal: 1,
         
-        self.__inverse_megapascals = None
+        CompressibilityUnits.InverseMegapascal: 2,
         
-        self.__inverse_atmospheres = None
+        CompressibilityUnits.InverseAtmosphere: 3,
         
-        self.__inverse_millibars = None
+        CompressibilityUnits.InverseMillibar: 4,
         
-        self.__inverse_bars = None
+        CompressibilityUnits.InverseBar: 5,
         
-        self.__inverse_pounds_force_per_square_inch = None
+        CompressibilityUnits.InversePoundForcePerSquareInch: 6,
         
+    }
 
-    def convert(self, unit: CompressibilityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        CompressibilityUnits.InversePascal: lambda value: (value),
+        
+        CompressibilityUnits.InverseKilopascal: lambda value: (value / 1e3),
+        
+        CompressibilityUnits.InverseMegapascal: lambda value: (value / 1e6),
+        
+        CompressibilityUnits.InverseAtmosphere: lambda value: (value / 101325),
+        
+        CompressibilityUnits.InverseMillibar: lambda value: (value / 100),
+        
+        CompressibilityUnits.InverseBar: lambda value: (value / 1e5),
+        
+        CompressibilityUnits.InversePoundForcePerSquareInch: lambda value: (value / 6.894757293168361e3),
+        
+    }
 
-    def __convert_from_base(self, from_unit: CompressibilityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == CompressibilityUnits.InversePascal:
-            return (value)
+        CompressibilityUnits.InversePascal: lambda value: (value),
         
-        if from_unit == CompressibilityUnits.InverseKilopascal:
-            return (value / 1e3)
+        CompressibilityUnits.InverseKilopascal: lambda value: (value * 1e3),
         
-        if from_unit == CompressibilityUnits.InverseMegapascal:
-            return (value / 1e6)
+        CompressibilityUnits.InverseMegapascal: lambda value: (value * 1e6),
         
-        if from_unit == CompressibilityUnits.InverseAtmosphere:
-            return (value / 101325)
+        CompressibilityUnits.InverseAtmosphere: lambda value: (value * 101325),
         
-        if from_unit == CompressibilityUnits.InverseMillibar:
-            return (value / 100)
+        CompressibilityUnits.InverseMillibar: lambda value: (value * 100),
         
-        if from_unit == CompressibilityUnits.InverseBar:
-            return (value / 1e5)
+        CompressibilityUnits.InverseBar: lambda value: (value * 1e5),
         
-        if from_unit == CompressibilityUnits.InversePoundForcePerSquareInch:
-            return (value / 6.894757293168361e3)
+        CompressibilityUnits.InversePoundForcePerSquareInch: lambda value: (value * 6.894757293168361e3),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        CompressibilityUnits.InversePascal: ('1', '0'),
+        
+        CompressibilityUnits.InverseKilopascal: ('1/1000', '0'),
+        
+        CompressibilityUnits.InverseMegapascal: ('1/1000000', '0'),
+        
+        CompressibilityUnits.InverseAtmosphere: ('1/101325', '0'),
+        
+        CompressibilityUnits.InverseMillibar: ('1/100', '0'),
+        
+        CompressibilityUnits.InverseBar: ('1/100000', '0'),
+        
+        CompressibilityUnits.InversePoundForcePerSquareInch: ('1000000000000/6894757293168361', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: CompressibilityUnits) -> float:
+    _affine_to_base = {
+        
+        CompressibilityUnits.InversePascal: ('1', '0'),
+        
+        CompressibilityUnits.InverseKilopascal: ('1000', '0'),
+        
+        CompressibilityUnits.InverseMegapascal: ('1000000', '0'),
+        
+        CompressibilityUnits.InverseAtmosphere: ('101325', '0'),
+        
+        CompressibilityUnits.InverseMillibar: ('100', '0'),
+        
+        CompressibilityUnits.InverseBar: ('100000', '0'),
         
-        if to_unit == CompressibilityUnits.InversePascal:
-            return (value)
+        CompressibilityUnits.InversePoundForcePerSquareInch: ('6894757293168361/1000000000000', '0'),
         
-        if to_unit == CompressibilityUnits.InverseKilopascal:
-            return (value * 1e3)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        CompressibilityUnits.InversePascal: ('Pa⁻¹',),
         
-        if to_unit == CompressibilityUnits.InverseMegapascal:
-            return (value * 1e6)
+        CompressibilityUnits.InverseKilopascal: ('kPa⁻¹',),
         
-        if to_unit == CompressibilityUnits.InverseAtmosphere:
-            return (value * 101325)
+        CompressibilityUnits.InverseMegapascal: ('MPa⁻¹',),
         
-        if to_unit == CompressibilityUnits.InverseMillibar:
-            return (value * 100)
+        CompressibilityUnits.InverseAtmosphere: ('atm⁻¹',),
         
-        if to_unit == CompressibilityUnits.InverseBar:
-            return (value * 1e5)
+        CompressibilityUnits.InverseMillibar: ('mbar⁻¹',),
         
-        if to_unit == CompressibilityUnits.InversePoundForcePerSquareInch:
-            return (value * 6.894757293168361e3)
+        CompressibilityUnits.InverseBar: ('bar⁻¹',),
         
-        return None
+        CompressibilityUnits.InversePoundForcePerSquareInch: ('psi⁻¹',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: CompressibilityUnits = CompressibilityUnits.InversePascal):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: CompressibilityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: CompressibilityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: CompressibilityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: CompressibilityUnits, to_unit: CompressibilityUnits) -> float:
+        """
+        Convert a value from one Compressibility unit to another, without creating a Compressibility instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: CompressibilityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: CompressibilityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Compressibility._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: CompressibilityUnits, to_unit: CompressibilityUnits) -> List[float]:
+        """
+        Convert many values from one Compressibility unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: CompressibilityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: CompressibilityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Compressibility._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: CompressibilityUnits, to_unit: CompressibilityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Compressibility._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: CompressibilityUnits, to_unit: CompressibilityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Compressibility unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: CompressibilityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: CompressibilityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Compressibility._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: CompressibilityUnits = CompressibilityUnits.InversePascal) -> Compressibility:
+        """
+        Create a new instance of Compressibility holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
 
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: CompressibilityUnits
+        :return: A new instance of Compressibility.
+        :rtype: Compressibility
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Compressibility._from_exact(value, from_unit)
+
+    def to_exact(self, unit: CompressibilityUnits = CompressibilityUnits.InversePascal) -> Fraction:
+        """
+        Get the exact value of the Compressibility in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (InversePascal).
+        :type unit: CompressibilityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Compressibility:
+        """
+        Parse a Compressibility from a value followed by a unit abbreviation, e.g. "1 Pa⁻¹".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Compressibility.
+        :rtype: Compressibility
+        :raises ValueError: When the string is not a valid or an ambiguous Compressibility.
+        """
+        return Compressibility._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Compressibility]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Compressibility._try_parse(text)
+
+    def to_binary(self, unit: Optional[CompressibilityUnits] = None) -> bytes:
+        """
+        Encode the Compressibility to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: CompressibilityUnits
+        :return: The encoded Compressibility.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Compressibility:
+        """
+        Decode a Compressibility encoded by to_binary.
+
+        :param data: The encoded Compressibility, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Compressibility.
+        :rtype: Compressibility
+        :raises ValueError: When the data is not a valid encoded Compressibility.
+        """
+        return Compressibility._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[CompressibilityUnits] = None) -> dict:
+        """
+        Get the Compressibility DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (InversePascal).
+        :type hold_in_unit: CompressibilityUnits
+        :return: The Compressibility DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[CompressibilityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Compressibility:
+        """
+        Create a new instance of Compressibility from its DTO.
+
+        :param dto: The Compressibility DTO, the unit is the CompressibilityUnits value or name.
+        :type dto: dict
+        :return: A new instance of Compressibility.
+        :rtype: Compressibility
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Compressibility._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Compressibility:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Compressibility._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -245,10 +491,7 @@ class Compressibility(AbstractMeasure):
         """
         
         """
-        if self.__inverse_pascals != None:
-            return self.__inverse_pascals
-        self.__inverse_pascals = self.__convert_from_base(CompressibilityUnits.InversePascal)
-        return self.__inverse_pascals
+        return self._cached_convert(CompressibilityUnits.InversePascal)
 
     
     @property
@@ -256,10 +499,7 @@ class Compressibility(AbstractMeasure):
         """
         
         """
-        if self.__inverse_kilopascals != None:
-            return self.__inverse_kilopascals
-        self.__inverse_kilopascals = self.__convert_from_base(CompressibilityUnits.InverseKilopascal)
-        return self.__inverse_kilopascals
+        return self._cached_convert(CompressibilityUnits.InverseKilopascal)
 
     
     @property
@@ -267,10 +507,7 @@ class Compressibility(AbstractMeasure):
         """
         
         """
-        if self.__inverse_megapascals != None:
-            return self.__inverse_megapascals
-        self.__inverse_megapascals = self.__convert_from_base(CompressibilityUnits.InverseMegapascal)
-        return self.__inverse_megapascals
+        return self._cached_convert(CompressibilityUnits.InverseMegapascal)
 
     
     @property
@@ -278,10 +515,7 @@ class Compressibility(AbstractMeasure):
         """
         
         """
-        if self.__inverse_atmospheres != None:
-            return self.__inverse_atmospheres
-        self.__inverse_atmospheres = self.__convert_from_base(CompressibilityUnits.InverseAtmosphere)
-        return self.__inverse_atmospheres
+        return self._cached_convert(CompressibilityUnits.InverseAtmosphere)
 
     
     @property
@@ -289,10 +523,7 @@ class Compressibility(AbstractMeasure):
         """
         
         """
-        if self.__inverse_millibars != None:
-            return self.__inverse_millibars
-        self.__inverse_millibars = self.__convert_from_base(CompressibilityUnits.InverseMillibar)
-        return self.__inverse_millibars
+        return self._cached_convert(CompressibilityUnits.InverseMillibar)
 
     
     @property
@@ -300,10 +531,7 @@ class Compressibility(AbstractMeasure):
         """
         
         """
-        if self.__inverse_bars != None:
-            return self.__inverse_bars
-        self.__inverse_bars = self.__convert_from_base(CompressibilityUnits.InverseBar)
-        return self.__inverse_bars
+        return self._cached_convert(CompressibilityUnits.InverseBar)
 
     
     @property
@@ -311,10 +539,7 @@ class Compressibility(AbstractMeasure):
         """
         
         """
-        if self.__inverse_pounds_force_per_square_inch != None:
-            return self.__inverse_pounds_force_per_square_inch
-        self.__inverse_pounds_force_per_square_inch = self.__convert_from_base(CompressibilityUnits.InversePoundForcePerSquareInch)
-        return self.__inverse_pounds_force_per_square_inch
+        return self._cached_convert(CompressibilityUnits.InversePoundForcePerSquareInch)
 
     
     def to_string(self, unit: CompressibilityUnits = CompressibilityUnits.InversePascal) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class DensityUnits(Enum):
         """
             DensityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         GramPerCubicMillimeter = 'gram_per_cubic_millimeter'
         """
@@ -274,433 +285,844 @@ class Density(AbstractMeasure):
         value (float): The value.
         from_unit (DensityUnits): The Density unit to create from, The default unit is KilogramPerCubicMeter
     """
-    def __init__(self, value: float, from_unit: DensityUnits = DensityUnits.KilogramPerCubicMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = DensityUnits
+
+    _base_unit = DensityUnits.KilogramPerCubicMeter
+
+    _dimensions = (-3, 1, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 15
+
+    _binary_unit_ids = {
         
-        self.__grams_per_cubic_millimeter = None
+        DensityUnits.GramPerCubicMillimeter: 0,
         
-        self.__grams_per_cubic_centimeter = None
+        DensityUnits.GramPerCubicCentimeter: 1,
         
-        self.__grams_per_cubic_meter = None
+        DensityUnits.GramPerCubicMeter: 2,
         
-        self.__pounds_per_cubic_inch = None
+        DensityUnits.PoundPerCubicInch: 3,
         
-        self.__pounds_per_cubic_foot = None
+        DensityUnits.PoundPerCubicFoot: 4,
         
-        self.__tonnes_per_cubic_millimeter = None
+        DensityUnits.TonnePerCubicMillimeter: 5,
         
-        self.__tonnes_per_cubic_centimeter = None
+        DensityUnits.TonnePerCubicCentimeter: 6,
         
-        self.__tonnes_per_cubic_meter = None
+        DensityUnits.TonnePerCubicMeter: 7,
         
-        self.__slugs_per_cubic_foot = None
+        DensityUnits.SlugPerCubicFoot: 8,
         
-        self.__grams_per_liter = None
+        DensityUnits.GramPerLiter: 9,
         
-        self.__grams_per_deci_liter = None
+        DensityUnits.GramPerDeciliter: 10,
         
-        self.__grams_per_milliliter = None
+        DensityUnits.GramPerMilliliter: 11,
         
-        self.__pounds_per_us_gallon = None
+        DensityUnits.PoundPerUSGallon: 12,
         
-        self.__pounds_per_imperial_gallon = None
+        DensityUnits.PoundPerImperialGallon: 13,
         
-        self.__kilograms_per_liter = None
+        DensityUnits.KilogramPerLiter: 14,
         
-        self.__tonnes_per_cubic_foot = None
+        DensityUnits.TonnePerCubicFoot: 15,
         
-        self.__tonnes_per_cubic_inch = None
+        DensityUnits.TonnePerCubicInch: 16,
         
-        self.__grams_per_cubic_foot = None
+        DensityUnits.GramPerCubicFoot: 17,
         
-        self.__grams_per_cubic_inch = None
+        DensityUnits.GramPerCubicInch: 18,
         
-        self.__pounds_per_cubic_meter = None
+        DensityUnits.PoundPerCubicMeter: 19,
         
-        self.__pounds_per_cubic_centimeter = None
+        DensityUnits.PoundPerCubicCentimeter: 20,
         
-        self.__pounds_per_cubic_millimeter = None
+        DensityUnits.PoundPerCubicMillimeter: 21,
         
-        self.__slugs_per_cubic_meter = None
+        DensityUnits.SlugPerCubicMeter: 22,
         
-        self.__slugs_per_cubic_centimeter = None
+        DensityUnits.SlugPerCubicCentimeter: 23,
         
-        self.__slugs_per_cubic_millimeter = None
+        DensityUnits.SlugPerCubicMillimeter: 24,
         
-        self.__slugs_per_cubic_inch = None
+        DensityUnits.SlugPerCubicInch: 25,
         
-        self.__kilograms_per_cubic_millimeter = None
+        DensityUnits.KilogramPerCubicMillimeter: 26,
         
-        self.__kilograms_per_cubic_centimeter = None
+        DensityUnits.KilogramPerCubicCentimeter: 27,
         
-        self.__kilograms_per_cubic_meter = None
+        DensityUnits.KilogramPerCubicMeter: 28,
         
-        self.__milligrams_per_cubic_meter = None
+        DensityUnits.MilligramPerCubicMeter: 29,
         
-        self.__micrograms_per_cubic_meter = None
+        DensityUnits.MicrogramPerCubicMeter: 30,
         
-        self.__kilopounds_per_cubic_inch = None
+        DensityUnits.KilopoundPerCubicInch: 31,
         
-        self.__kilopounds_per_cubic_foot = None
+        DensityUnits.KilopoundPerCubicFoot: 32,
         
-        self.__picograms_per_liter = None
+        DensityUnits.PicogramPerLiter: 33,
         
-        self.__nanograms_per_liter = None
+        DensityUnits.NanogramPerLiter: 34,
         
-        self.__micrograms_per_liter = None
+        DensityUnits.MicrogramPerLiter: 35,
         
-        self.__milligrams_per_liter = None
+        DensityUnits.MilligramPerLiter: 36,
         
-        self.__centigrams_per_liter = None
+        DensityUnits.CentigramPerLiter: 37,
         
-        self.__decigrams_per_liter = None
+        DensityUnits.DecigramPerLiter: 38,
         
-        self.__picograms_per_deci_liter = None
+        DensityUnits.PicogramPerDeciliter: 39,
         
-        self.__nanograms_per_deci_liter = None
+        DensityUnits.NanogramPerDeciliter: 40,
         
-        self.__micrograms_per_deci_liter = None
+        DensityUnits.MicrogramPerDeciliter: 41,
         
-        self.__milligrams_per_deci_liter = None
+        DensityUnits.MilligramPerDeciliter: 42,
         
-        self.__centigrams_per_deci_liter = None
+        DensityUnits.CentigramPerDeciliter: 43,
         
-        self.__decigrams_per_deci_liter = None
+        DensityUnits.DecigramPerDeciliter: 44,
         
-        self.__picograms_per_milliliter = None
+        DensityUnits.PicogramPerMilliliter: 45,
         
-        self.__nanograms_per_milliliter = None
+        DensityUnits.NanogramPerMilliliter: 46,
         
-        self.__micrograms_per_milliliter = None
+        DensityUnits.MicrogramPerMilliliter: 47,
         
-        self.__milligrams_per_milliliter = None
+        DensityUnits.MilligramPerMilliliter: 48,
         
-        self.__centigrams_per_milliliter = None
+        DensityUnits.CentigramPerMilliliter: 49,
         
-        self.__decigrams_per_milliliter = None
+        DensityUnits.DecigramPerMilliliter: 50,
         
+    }
 
-    def convert(self, unit: DensityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        DensityUnits.GramPerCubicMillimeter: lambda value: (value * 1e-6),
+        
+        DensityUnits.GramPerCubicCentimeter: lambda value: (value * 1e-3),
+        
+        DensityUnits.GramPerCubicMeter: lambda value: (value * 1e3),
+        
+        DensityUnits.PoundPerCubicInch: lambda value: (value * 3.6127298147753e-5),
+        
+        DensityUnits.PoundPerCubicFoot: lambda value: (value * 0.062427961),
+        
+        DensityUnits.TonnePerCubicMillimeter: lambda value: (value * 1e-12),
+        
+        DensityUnits.TonnePerCubicCentimeter: lambda value: (value * 1e-9),
+        
+        DensityUnits.TonnePerCubicMeter: lambda value: (value * 0.001),
+        
+        DensityUnits.SlugPerCubicFoot: lambda value: (value * 0.00194032033),
+        
+        DensityUnits.GramPerLiter: lambda value: (value * 1),
+        
+        DensityUnits.GramPerDeciliter: lambda value: (value * 1e-1),
+        
+        DensityUnits.GramPerMilliliter: lambda value: (value * 1e-3),
+        
+        DensityUnits.PoundPerUSGallon: lambda value: (value / 1.19826427e2),
+        
+        DensityUnits.PoundPerImperialGallon: lambda value: (value / 9.9776398e1),
+        
+        DensityUnits.KilogramPerLiter: lambda value: (value / 1e3),
+        
+        DensityUnits.TonnePerCubicFoot: lambda value: (value / 3.53146667214886e4),
+        
+        DensityUnits.TonnePerCubicInch: lambda value: (value / 6.10237440947323e7),
+        
+        DensityUnits.GramPerCubicFoot: lambda value: (value / 0.0353146667214886),
+        
+        DensityUnits.GramPerCubicInch: lambda value: (value / 61.0237440947323),
+        
+        DensityUnits.PoundPerCubicMeter: lambda value: (value * 2.204622621848775),
+        
+        DensityUnits.PoundPerCubicCentimeter: lambda value: (value * 2.204622621848775e-6),
+        
+        DensityUnits.PoundPerCubicMillimeter: lambda value: (value * 2.204622621848775e-9),
+        
+        DensityUnits.SlugPerCubicMeter: lambda value: (value / 14.5939),
+        
+        DensityUnits.SlugPerCubicCentimeter: lambda value: (value / 14593903),
+        
+        DensityUnits.SlugPerCubicMillimeter: lambda value: (value / 14593903000),
+        
+        DensityUnits.SlugPerCubicInch: lambda value: (value / 890574.60201535),
+        
+        DensityUnits.KilogramPerCubicMillimeter: lambda value: ((value * 1e-6) / 1000.0),
+        
+        DensityUnits.KilogramPerCubicCentimeter: lambda value: ((value * 1e-3) / 1000.0),
+        
+        DensityUnits.KilogramPerCubicMeter: lambda value: ((value * 1e3) / 1000.0),
+        
+        DensityUnits.MilligramPerCubicMeter: lambda value: ((value * 1e3) / 0.001),
+        
+        DensityUnits.MicrogramPerCubicMeter: lambda value: ((value * 1e3) / 1e-06),
+        
+        DensityUnits.KilopoundPerCubicInch: lambda value: ((value * 3.6127298147753e-5) / 1000.0),
+        
+        DensityUnits.KilopoundPerCubicFoot: lambda value: ((value * 0.062427961) / 1000.0),
+        
+        DensityUnits.PicogramPerLiter: lambda value: ((value * 1) / 1e-12),
+        
+        DensityUnits.NanogramPerLiter: lambda value: ((value * 1) / 1e-09),
+        
+        DensityUnits.MicrogramPerLiter: lambda value: ((value * 1) / 1e-06),
+        
+        DensityUnits.MilligramPerLiter: lambda value: ((value * 1) / 0.001),
+        
+        DensityUnits.CentigramPerLiter: lambda value: ((value * 1) / 0.01),
+        
+        DensityUnits.DecigramPerLiter: lambda value: ((value * 1) / 0.1),
+        
+        DensityUnits.PicogramPerDeciliter: lambda value: ((value * 1e-1) / 1e-12),
+        
+        DensityUnits.NanogramPerDeciliter: lambda value: ((value * 1e-1) / 1e-09),
+        
+        DensityUnits.MicrogramPerDeciliter: lambda value: ((value * 1e-1) / 1e-06),
+        
+        DensityUnits.MilligramPerDeciliter: lambda value: ((value * 1e-1) / 0.001),
+        
+        DensityUnits.CentigramPerDeciliter: lambda value: ((value * 1e-1) / 0.01),
+        
+        DensityUnits.DecigramPerDeciliter: lambda value: ((value * 1e-1) / 0.1),
+        
+        DensityUnits.PicogramPerMilliliter: lambda value: ((value * 1e-3) / 1e-12),
+        
+        DensityUnits.NanogramPerMilliliter: lambda value: ((value * 1e-3) / 1e-09),
+        
+        DensityUnits.MicrogramPerMilliliter: lambda value: ((value * 1e-3) / 1e-06),
+        
+        DensityUnits.MilligramPerMilliliter: lambda value: ((value * 1e-3) / 0.001),
+        
+        DensityUnits.CentigramPerMilliliter: lambda value: ((value * 1e-3) / 0.01),
+        
+        DensityUnits.DecigramPerMilliliter: lambda value: ((value * 1e-3) / 0.1),
+        
+    }
 
-    def __convert_from_base(self, from_unit: DensityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == DensityUnits.GramPerCubicMillimeter:
-            return (value * 1e-6)
+        DensityUnits.GramPerCubicMillimeter: lambda value: (value / 1e-6),
         
-        if from_unit == DensityUnits.GramPerCubicCentimeter:
-            return (value * 1e-3)
+        DensityUnits.GramPerCubicCentimeter: lambda value: (value / 1e-3),
         
-        if from_unit == DensityUnits.GramPerCubicMeter:
-            return (value * 1e3)
+        DensityUnits.GramPerCubicMeter: lambda value: (value / 1e3),
         
-        if from_unit == DensityUnits.PoundPerCubicInch:
-            return (value * 3.6127298147753e-5)
+        DensityUnits.PoundPerCubicInch: lambda value: (value / 3.6127298147753e-5),
         
-        if from_unit == DensityUnits.PoundPerCubicFoot:
-            return (value * 0.062427961)
+        DensityUnits.PoundPerCubicFoot: lambda value: (value / 0.062427961),
         
-        if from_unit == DensityUnits.TonnePerCubicMillimeter:
-            return (value * 1e-12)
+        DensityUnits.TonnePerCubicMillimeter: lambda value: (value / 1e-12),
         
-        if from_unit == DensityUnits.TonnePerCubicCentimeter:
-            return (value * 1e-9)
+        DensityUnits.TonnePerCubicCentimeter: lambda value: (value / 1e-9),
         
-        if from_unit == DensityUnits.TonnePerCubicMeter:
-            return (value * 0.001)
+        DensityUnits.TonnePerCubicMeter: lambda value: (value / 0.001),
         
-        if from_unit == DensityUnits.SlugPerCubicFoot:
-            return (value * 0.00194032033)
+        DensityUnits.SlugPerCubicFoot: lambda value: (value * 515.378818),
         
-        if from_unit == DensityUnits.GramPerLiter:
-            return (value * 1)
+        DensityUnits.GramPerLiter: lambda value: (value / 1),
         
-        if from_unit == DensityUnits.GramPerDeciliter:
-            return (value * 1e-1)
+        DensityUnits.GramPerDeciliter: lambda value: (value / 1e-1),
         
-        if from_unit == DensityUnits.GramPerMilliliter:
-            return (value * 1e-3)
+        DensityUnits.GramPerMilliliter: lambda value: (value / 1e-3),
         
-        if from_unit == DensityUnits.PoundPerUSGallon:
-            return (value / 1.19826427e2)
+        DensityUnits.PoundPerUSGallon: lambda value: (value * 1.19826427e2),
         
-        if from_unit == DensityUnits.PoundPerImperialGallon:
-            return (value / 9.9776398e1)
+        DensityUnits.PoundPerImperialGallon: lambda value: (value * 9.9776398e1),
         
-        if from_unit == DensityUnits.KilogramPerLiter:
-            return (value / 1e3)
+        DensityUnits.KilogramPerLiter: lambda value: (value * 1e3),
         
-        if from_unit == DensityUnits.TonnePerCubicFoot:
-            return (value / 3.53146667214886e4)
+        DensityUnits.TonnePerCubicFoot: lambda value: (value * 3.53146667214886e4),
         
-        if from_unit == DensityUnits.TonnePerCubicInch:
-            return (value / 6.10237440947323e7)
+        DensityUnits.TonnePerCubicInch: lambda value: (value * 6.10237440947323e7),
         
-        if from_unit == DensityUnits.GramPerCubicFoot:
-            return (value / 0.0353146667214886)
+        DensityUnits.GramPerCubicFoot: lambda value: (value * 0.0353146667214886),
         
-        if from_unit == DensityUnits.GramPerCubicInch:
-            return (value / 61.0237440947323)
+        DensityUnits.GramPerCubicInch: lambda value: (value * 61.0237440947323),
         
-        if from_unit == DensityUnits.PoundPerCubicMeter:
-            return (value * 2.204622621848775)
+        DensityUnits.PoundPerCubicMeter: lambda value: (value / 2.204622621848775),
         
-        if from_unit == DensityUnits.PoundPerCubicCentimeter:
-            return (value * 2.204622621848775e-6)
+        DensityUnits.PoundPerCubicCentimeter: lambda value: (value / 2.204622621848775e-6),
         
-        if from_unit == DensityUnits.PoundPerCubicMillimeter:
-            return (value * 2.204622621848775e-9)
+        DensityUnits.PoundPerCubicMillimeter: lambda value: (value / 2.204622621848775e-9),
         
-        if from_unit == DensityUnits.SlugPerCubicMeter:
-            return (value / 14.5939)
+        DensityUnits.SlugPerCubicMeter: lambda value: (value * 14.5939),
         
-        if from_unit == DensityUnits.SlugPerCubicCentimeter:
-            return (value / 14593903)
+        DensityUnits.SlugPerCubicCentimeter: lambda value: (value * 14593903),
         
-        if from_unit == DensityUnits.SlugPerCubicMillimeter:
-            return (value / 14593903000)
+        DensityUnits.SlugPerCubicMillimeter: lambda value: (value * 14593903000),
         
-        if from_unit == DensityUnits.SlugPerCubicInch:
-            return (value / 890574.60201535)
+        DensityUnits.SlugPerCubicInch: lambda value: (value * 890574.60201535),
         
-        if from_unit == DensityUnits.KilogramPerCubicMillimeter:
-            return ((value * 1e-6) / 1000.0)
+        DensityUnits.KilogramPerCubicMillimeter: lambda value: ((value / 1e-6) * 1000.0),
         
-        if from_unit == DensityUnits.KilogramPerCubicCentimeter:
-            return ((value * 1e-3) / 1000.0)
+        DensityUnits.KilogramPerCubicCentimeter: lambda value: ((value / 1e-3) * 1000.0),
         
-        if from_unit == DensityUnits.KilogramPerCubicMeter:
-            return ((value * 1e3) / 1000.0)
+        DensityUnits.KilogramPerCubicMeter: lambda value: ((value / 1e3) * 1000.0),
         
-        if from_unit == DensityUnits.MilligramPerCubicMeter:
-            return ((value * 1e3) / 0.001)
+        DensityUnits.MilligramPerCubicMeter: lambda value: ((value / 1e3) * 0.001),
         
-        if from_unit == DensityUnits.MicrogramPerCubicMeter:
-            return ((value * 1e3) / 1e-06)
+        DensityUnits.MicrogramPerCubicMeter: lambda value: ((value / 1e3) * 1e-06),
         
-        if from_unit == DensityUnits.KilopoundPerCubicInch:
-            return ((value * 3.6127298147753e-5) / 1000.0)
+        DensityUnits.KilopoundPerCubicInch: lambda value: ((value / 3.6127298147753e-5) * 1000.0),
         
-        if from_unit == DensityUnits.KilopoundPerCubicFoot:
-            return ((value * 0.062427961) / 1000.0)
+        DensityUnits.KilopoundPerCubicFoot: lambda value: ((value / 0.062427961) * 1000.0),
         
-        if from_unit == DensityUnits.PicogramPerLiter:
-            return ((value * 1) / 1e-12)
+        DensityUnits.PicogramPerLiter: lambda value: ((value / 1) * 1e-12),
         
-        if from_unit == DensityUnits.NanogramPerLiter:
-            return ((value * 1) / 1e-09)
+        DensityUnits.NanogramPerLiter: lambda value: ((value / 1) * 1e-09),
         
-        if from_unit == DensityUnits.MicrogramPerLiter:
-            return ((value * 1) / 1e-06)
+        DensityUnits.MicrogramPerLiter: lambda value: ((value / 1) * 1e-06),
         
-        if from_unit == DensityUnits.MilligramPerLiter:
-            return ((value * 1) / 0.001)
+        DensityUnits.MilligramPerLiter: lambda value: ((value / 1) * 0.001),
         
-        if from_unit == DensityUnits.CentigramPerLiter:
-            return ((value * 1) / 0.01)
+        DensityUnits.CentigramPerLiter: lambda value: ((value / 1) * 0.01),
         
-        if from_unit == DensityUnits.DecigramPerLiter:
-            return ((value * 1) / 0.1)
+        DensityUnits.DecigramPerLiter: lambda value: ((value / 1) * 0.1),
         
-        if from_unit == DensityUnits.PicogramPerDeciliter:
-            return ((value * 1e-1) / 1e-12)
+        DensityUnits.PicogramPerDeciliter: lambda value: ((value / 1e-1) * 1e-12),
         
-        if from_unit == DensityUnits.NanogramPerDeciliter:
-            return ((value * 1e-1) / 1e-09)
+        DensityUnits.NanogramPerDeciliter: lambda value: ((value / 1e-1) * 1e-09),
         
-        if from_unit == DensityUnits.MicrogramPerDeciliter:
-            return ((value * 1e-1) / 1e-06)
+        DensityUnits.MicrogramPerDeciliter: lambda value: ((value / 1e-1) * 1e-06),
         
-        if from_unit == DensityUnits.MilligramPerDeciliter:
-            return ((value * 1e-1) / 0.001)
+        DensityUnits.MilligramPerDeciliter: lambda value: ((value / 1e-1) * 0.001),
         
-        if from_unit == DensityUnits.CentigramPerDeciliter:
-            return ((value * 1e-1) / 0.01)
+        DensityUnits.CentigramPerDeciliter: lambda value: ((value / 1e-1) * 0.01),
         
-        if from_unit == DensityUnits.DecigramPerDeciliter:
-            return ((value * 1e-1) / 0.1)
+        DensityUnits.DecigramPerDeciliter: lambda value: ((value / 1e-1) * 0.1),
         
-        if from_unit == DensityUnits.PicogramPerMilliliter:
-            return ((value * 1e-3) / 1e-12)
+        DensityUnits.PicogramPerMilliliter: lambda value: ((value / 1e-3) * 1e-12),
         
-        if from_unit == DensityUnits.NanogramPerMilliliter:
-            return ((value * 1e-3) / 1e-09)
+        DensityUnits.NanogramPerMilliliter: lambda value: ((value / 1e-3) * 1e-09),
         
-        if from_unit == DensityUnits.MicrogramPerMilliliter:
-            return ((value * 1e-3) / 1e-06)
+        DensityUnits.MicrogramPerMilliliter: lambda value: ((value / 1e-3) * 1e-06),
         
-        if from_unit == DensityUnits.MilligramPerMilliliter:
-            return ((value * 1e-3) / 0.001)
+        DensityUnits.MilligramPerMilliliter: lambda value: ((value / 1e-3) * 0.001),
         
-        if from_unit == DensityUnits.CentigramPerMilliliter:
-            return ((value * 1e-3) / 0.01)
+        DensityUnits.CentigramPerMilliliter: lambda value: ((value / 1e-3) * 0.01),
         
-        if from_unit == DensityUnits.DecigramPerMilliliter:
-            return ((value * 1e-3) / 0.1)
+        DensityUnits.DecigramPerMilliliter: lambda value: ((value / 1e-3) * 0.1),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        DensityUnits.GramPerCubicMillimeter: ('1/1000000', '0'),
+        
+        DensityUnits.GramPerCubicCentimeter: ('1/1000', '0'),
+        
+        DensityUnits.GramPerCubicMeter: ('1000', '0'),
+        
+        DensityUnits.PoundPerCubicInch: ('36127298147753/1000000000000000000', '0'),
+        
+        DensityUnits.PoundPerCubicFoot: ('62427961/1000000000', '0'),
+        
+        DensityUnits.TonnePerCubicMillimeter: ('1/1000000000000', '0'),
+        
+        DensityUnits.TonnePerCubicCentimeter: ('1/1000000000', '0'),
+        
+        DensityUnits.TonnePerCubicMeter: ('1/1000', '0'),
+        
+        DensityUnits.SlugPerCubicFoot: ('194032033/100000000000', '0'),
+        
+        DensityUnits.GramPerLiter: ('1', '0'),
+        
+        DensityUnits.GramPerDeciliter: ('1/10', '0'),
+        
+        DensityUnits.GramPerMilliliter: ('1/1000', '0'),
+        
+        DensityUnits.PoundPerUSGallon: ('1000000/119826427', '0'),
+        
+        DensityUnits.PoundPerImperialGallon: ('500000/49888199', '0'),
+        
+        DensityUnits.KilogramPerLiter: ('1/1000', '0'),
+        
+        DensityUnits.TonnePerCubicFoot: ('5000000000/176573333607443', '0'),
+        
+        DensityUnits.TonnePerCubicInch: ('10000000/610237440947323', '0'),
+        
+        DensityUnits.GramPerCubicFoot: ('5000000000000000/176573333607443', '0'),
+        
+        DensityUnits.GramPerCubicInch: ('10000000000000/610237440947323', '0'),
+        
+        DensityUnits.PoundPerCubicMeter: ('88184904873951/40000000000000', '0'),
+        
+        DensityUnits.PoundPerCubicCentimeter: ('88184904873951/40000000000000000000', '0'),
+        
+        DensityUnits.PoundPerCubicMillimeter: ('88184904873951/40000000000000000000000', '0'),
+        
+        DensityUnits.SlugPerCubicMeter: ('10000/145939', '0'),
+        
+        DensityUnits.SlugPerCubicCentimeter: ('1/14593903', '0'),
+        
+        DensityUnits.SlugPerCubicMillimeter: ('1/14593903000', '0'),
+        
+        DensityUnits.SlugPerCubicInch: ('20000000/17811492040307', '0'),
+        
+        DensityUnits.KilogramPerCubicMillimeter: ('1/1000000000', '0'),
+        
+        DensityUnits.KilogramPerCubicCentimeter: ('1/1000000', '0'),
+        
+        DensityUnits.KilogramPerCubicMeter: ('1', '0'),
+        
+        DensityUnits.MilligramPerCubicMeter: ('1000000', '0'),
+        
+        DensityUnits.MicrogramPerCubicMeter: ('1000000000', '0'),
+        
+        DensityUnits.KilopoundPerCubicInch: ('36127298147753/1000000000000000000000', '0'),
+        
+        DensityUnits.KilopoundPerCubicFoot: ('62427961/1000000000000', '0'),
+        
+        DensityUnits.PicogramPerLiter: ('1000000000000', '0'),
+        
+        DensityUnits.NanogramPerLiter: ('1000000000', '0'),
+        
+        DensityUnits.MicrogramPerLiter: ('1000000', '0'),
+        
+        DensityUnits.MilligramPerLiter: ('1000', '0'),
+        
+        DensityUnits.CentigramPerLiter: ('100', '0'),
+        
+        DensityUnits.DecigramPerLiter: ('10', '0'),
+        
+        DensityUnits.PicogramPerDeciliter: ('100000000000', '0'),
+        
+        DensityUnits.NanogramPerDeciliter: ('100000000', '0'),
+        
+        DensityUnits.MicrogramPerDeciliter: ('100000', '0'),
+        
+        DensityUnits.MilligramPerDeciliter: ('100', '0'),
+        
+        DensityUnits.CentigramPerDeciliter: ('10', '0'),
+        
+        DensityUnits.DecigramPerDeciliter: ('1', '0'),
+        
+        DensityUnits.PicogramPerMilliliter: ('1000000000', '0'),
+        
+        DensityUnits.NanogramPerMilliliter: ('1000000', '0'),
+        
+        DensityUnits.MicrogramPerMilliliter: ('1000', '0'),
+        
+        DensityUnits.MilligramPerMilliliter: ('1', '0'),
+        
+        DensityUnits.CentigramPerMilliliter: ('1/10', '0'),
+        
+        DensityUnits.DecigramPerMilliliter: ('1/100', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: DensityUnits) -> float:
+    _affine_to_base = {
+        
+        DensityUnits.GramPerCubicMillimeter: ('1000000', '0'),
+        
+        DensityUnits.GramPerCubicCentimeter: ('1000', '0'),
+        
+        DensityUnits.GramPerCubicMeter: ('1/1000', '0'),
+        
+        DensityUnits.PoundPerCubicInch: ('1000000000000000000/36127298147753', '0'),
+        
+        DensityUnits.PoundPerCubicFoot: ('1000000000/62427961', '0'),
+        
+        DensityUnits.TonnePerCubicMillimeter: ('1000000000000', '0'),
+        
+        DensityUnits.TonnePerCubicCentimeter: ('1000000000', '0'),
         
-        if to_unit == DensityUnits.GramPerCubicMillimeter:
-            return (value / 1e-6)
+        DensityUnits.TonnePerCubicMeter: ('1000', '0'),
         
-        if to_unit == DensityUnits.GramPerCubicCentimeter:
-            return (value / 1e-3)
+        DensityUnits.SlugPerCubicFoot: ('257689409/500000', '0'),
         
-        if to_unit == DensityUnits.GramPerCubicMeter:
-            return (value / 1e3)
+        DensityUnits.GramPerLiter: ('1', '0'),
         
-        if to_unit == DensityUnits.PoundPerCubicInch:
-            return (value / 3.6127298147753e-5)
+        DensityUnits.GramPerDeciliter: ('10', '0'),
         
-        if to_unit == DensityUnits.PoundPerCubicFoot:
-            return (value / 0.062427961)
+        DensityUnits.GramPerMilliliter: ('1000', '0'),
         
-        if to_unit == DensityUnits.TonnePerCubicMillimeter:
-            return (value / 1e-12)
+        DensityUnits.PoundPerUSGallon: ('119826427/1000000', '0'),
         
-        if to_unit == DensityUnits.TonnePerCubicCentimeter:
-            return (value / 1e-9)
+        DensityUnits.PoundPerImperialGallon: ('49888199/500000', '0'),
         
-        if to_unit == DensityUnits.TonnePerCubicMeter:
-            return (value / 0.001)
+        DensityUnits.KilogramPerLiter: ('1000', '0'),
         
-        if to_unit == DensityUnits.SlugPerCubicFoot:
-            return (value * 515.378818)
+        DensityUnits.TonnePerCubicFoot: ('176573333607443/5000000000', '0'),
         
-        if to_unit == DensityUnits.GramPerLiter:
-            return (value / 1)
+        DensityUnits.TonnePerCubicInch: ('610237440947323/10000000', '0'),
         
-        if to_unit == DensityUnits.GramPerDeciliter:
-            return (value / 1e-1)
+        DensityUnits.GramPerCubicFoot: ('176573333607443/5000000000000000', '0'),
         
-        if to_unit == DensityUnits.GramPerMilliliter:
-            return (value / 1e-3)
+        DensityUnits.GramPerCubicInch: ('610237440947323/10000000000000', '0'),
         
-        if to_unit == DensityUnits.PoundPerUSGallon:
-            return (value * 1.19826427e2)
+        DensityUnits.PoundPerCubicMeter: ('40000000000000/88184904873951', '0'),
         
-        if to_unit == DensityUnits.PoundPerImperialGallon:
-            return (value * 9.9776398e1)
+        DensityUnits.PoundPerCubicCentimeter: ('40000000000000000000/88184904873951', '0'),
         
-        if to_unit == DensityUnits.KilogramPerLiter:
-            return (value * 1e3)
+        DensityUnits.PoundPerCubicMillimeter: ('40000000000000000000000/88184904873951', '0'),
         
-        if to_unit == DensityUnits.TonnePerCubicFoot:
-            return (value * 3.53146667214886e4)
+        DensityUnits.SlugPerCubicMeter: ('145939/10000', '0'),
         
-        if to_unit == DensityUnits.TonnePerCubicInch:
-            return (value * 6.10237440947323e7)
+        DensityUnits.SlugPerCubicCentimeter: ('14593903', '0'),
         
-        if to_unit == DensityUnits.GramPerCubicFoot:
-            return (value * 0.0353146667214886)
+        DensityUnits.SlugPerCubicMillimeter: ('14593903000', '0'),
         
-        if to_unit == DensityUnits.GramPerCubicInch:
-            return (value * 61.0237440947323)
+        DensityUnits.SlugPerCubicInch: ('17811492040307/20000000', '0'),
         
-        if to_unit == DensityUnits.PoundPerCubicMeter:
-            return (value / 2.204622621848775)
+        DensityUnits.KilogramPerCubicMillimeter: ('1000000000', '0'),
         
-        if to_unit == DensityUnits.PoundPerCubicCentimeter:
-            return (value / 2.204622621848775e-6)
+        DensityUnits.KilogramPerCubicCentimeter: ('1000000', '0'),
         
-        if to_unit == DensityUnits.PoundPerCubicMillimeter:
-            return (value / 2.204622621848775e-9)
+        DensityUnits.KilogramPerCubicMeter: ('1', '0'),
         
-        if to_unit == DensityUnits.SlugPerCubicMeter:
-            return (value * 14.5939)
+        DensityUnits.MilligramPerCubicMeter: ('1/1000000', '0'),
         
-        if to_unit == DensityUnits.SlugPerCubicCentimeter:
-            return (value * 14593903)
+        DensityUnits.MicrogramPerCubicMeter: ('1/1000000000', '0'),
         
-        if to_unit == DensityUnits.SlugPerCubicMillimeter:
-            return (value * 14593903000)
+        DensityUnits.KilopoundPerCubicInch: ('1000000000000000000000/36127298147753', '0'),
         
-        if to_unit == DensityUnits.SlugPerCubicInch:
-            return (value * 890574.60201535)
+        DensityUnits.KilopoundPerCubicFoot: ('1000000000000/62427961', '0'),
         
-        if to_unit == DensityUnits.KilogramPerCubicMillimeter:
-            return ((value / 1e-6) * 1000.0)
+        DensityUnits.PicogramPerLiter: ('1/1000000000000', '0'),
         
-        if to_unit == DensityUnits.KilogramPerCubicCentimeter:
-            return ((value / 1e-3) * 1000.0)
+        DensityUnits.NanogramPerLiter: ('1/1000000000', '0'),
         
-        if to_unit == DensityUnits.KilogramPerCubicMeter:
-            return ((value / 1e3) * 1000.0)
+        DensityUnits.MicrogramPerLiter: ('1/1000000', '0'),
         
-        if to_unit == DensityUnits.MilligramPerCubicMeter:
-            return ((value / 1e3) * 0.001)
+        DensityUnits.MilligramPerLiter: ('1/1000', '0'),
         
-        if to_unit == DensityUnits.MicrogramPerCubicMeter:
-            return ((value / 1e3) * 1e-06)
+        DensityUnits.CentigramPerLiter: ('1/100', '0'),
         
-        if to_unit == DensityUnits.KilopoundPerCubicInch:
-            return ((value / 3.6127298147753e-5) * 1000.0)
+        DensityUnits.DecigramPerLiter: ('1/10', '0'),
         
-        if to_unit == DensityUnits.KilopoundPerCubicFoot:
-            return ((value / 0.062427961) * 1000.0)
+        DensityUnits.PicogramPerDeciliter: ('1/100000000000', '0'),
         
-        if to_unit == DensityUnits.PicogramPerLiter:
-            return ((value / 1) * 1e-12)
+        DensityUnits.NanogramPerDeciliter: ('1/100000000', '0'),
         
-        if to_unit == DensityUnits.NanogramPerLiter:
-            return ((value / 1) * 1e-09)
+        DensityUnits.MicrogramPerDeciliter: ('1/100000', '0'),
         
-        if to_unit == DensityUnits.MicrogramPerLiter:
-            return ((value / 1) * 1e-06)
+        DensityUnits.MilligramPerDeciliter: ('1/100', '0'),
         
-        if to_unit == DensityUnits.MilligramPerLiter:
-            return ((value / 1) * 0.001)
+        DensityUnits.CentigramPerDeciliter: ('1/10', '0'),
         
-        if to_unit == DensityUnits.CentigramPerLiter:
-            return ((value / 1) * 0.01)
+        DensityUnits.DecigramPerDeciliter: ('1', '0'),
         
-        if to_unit == DensityUnits.DecigramPerLiter:
-            return ((value / 1) * 0.1)
+        DensityUnits.PicogramPerMilliliter: ('1/1000000000', '0'),
         
-        if to_unit == DensityUnits.PicogramPerDeciliter:
-            return ((value / 1e-1) * 1e-12)
+        DensityUnits.NanogramPerMilliliter: ('1/1000000', '0'),
         
-        if to_unit == DensityUnits.NanogramPerDeciliter:
-            return ((value / 1e-1) * 1e-09)
+        DensityUnits.MicrogramPerMilliliter: ('1/1000', '0'),
         
-        if to_unit == DensityUnits.MicrogramPerDeciliter:
-            return ((value / 1e-1) * 1e-06)
+        DensityUnits.MilligramPerMilliliter: ('1', '0'),
         
-        if to_unit == DensityUnits.MilligramPerDeciliter:
-            return ((value / 1e-1) * 0.001)
+        DensityUnits.CentigramPerMilliliter: ('10', '0'),
         
-        if to_unit == DensityUnits.CentigramPerDeciliter:
-            return ((value / 1e-1) * 0.01)
+        DensityUnits.DecigramPerMilliliter: ('100', '0'),
         
-        if to_unit == DensityUnits.DecigramPerDeciliter:
-            return ((value / 1e-1) * 0.1)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        DensityUnits.GramPerCubicMillimeter: ('g/mm³',),
+        
+        DensityUnits.GramPerCubicCentimeter: ('g/cm³',),
+        
+        DensityUnits.GramPerCubicMeter: ('g/m³',),
+        
+        DensityUnits.PoundPerCubicInch: ('lb/in³',),
+        
+        DensityUnits.PoundPerCubicFoot: ('lb/ft³',),
+        
+        DensityUnits.TonnePerCubicMillimeter: ('t/mm³',),
+        
+        DensityUnits.TonnePerCubicCentimeter: ('t/cm³',),
+        
+        DensityUnits.TonnePerCubicMeter: ('t/m³',),
+        
+        DensityUnits.SlugPerCubicFoot: ('slug/ft³',),
+        
+        DensityUnits.GramPerLiter: ('g/L',),
+        
+        DensityUnits.GramPerDeciliter: ('g/dl',),
+        
+        DensityUnits.GramPerMilliliter: ('g/ml',),
+        
+        DensityUnits.PoundPerUSGallon: ('ppg (U.S.)',),
+        
+        DensityUnits.PoundPerImperialGallon: ('ppg (imp.)',),
+        
+        DensityUnits.KilogramPerLiter: ('kg/l',),
+        
+        DensityUnits.TonnePerCubicFoot: ('t/ft³',),
+        
+        DensityUnits.TonnePerCubicInch: ('t/in³',),
+        
+        DensityUnits.GramPerCubicFoot: ('g/ft³',),
+        
+        DensityUnits.GramPerCubicInch: ('g/in³',),
+        
+        DensityUnits.PoundPerCubicMeter: ('lb/m³',),
+        
+        DensityUnits.PoundPerCubicCentimeter: ('lb/cm³',),
+        
+        DensityUnits.PoundPerCubicMillimeter: ('lb/mm³',),
+        
+        DensityUnits.SlugPerCubicMeter: ('slug/m³',),
+        
+        DensityUnits.SlugPerCubicCentimeter: ('slug/cm³',),
+        
+        DensityUnits.SlugPerCubicMillimeter: ('slug/mm³',),
+        
+        DensityUnits.SlugPerCubicInch: ('slug/in³',),
+        
+        DensityUnits.KilogramPerCubicMillimeter: ('kg/mm³',),
+        
+        DensityUnits.KilogramPerCubicCentimeter: ('kg/cm³',),
+        
+        DensityUnits.KilogramPerCubicMeter: ('kg/m³',),
+        
+        DensityUnits.MilligramPerCubicMeter: ('mg/m³',),
+        
+        DensityUnits.MicrogramPerCubicMeter: ('μg/m³',),
+        
+        DensityUnits.KilopoundPerCubicInch: ('klb/in³',),
         
-        if to_unit == DensityUnits.PicogramPerMilliliter:
-            return ((value / 1e-3) * 1e-12)
+        DensityUnits.KilopoundPerCubicFoot: ('klb/ft³',),
         
-        if to_unit == DensityUnits.NanogramPerMilliliter:
-            return ((value / 1e-3) * 1e-09)
+        DensityUnits.PicogramPerLiter: ('pg/L',),
         
-        if to_unit == DensityUnits.MicrogramPerMilliliter:
-            return ((value / 1e-3) * 1e-06)
+        DensityUnits.NanogramPerLiter: ('ng/L',),
         
-        if to_unit == DensityUnits.MilligramPerMilliliter:
-            return ((value / 1e-3) * 0.001)
+        DensityUnits.MicrogramPerLiter: ('μg/L',),
         
-        if to_unit == DensityUnits.CentigramPerMilliliter:
-            return ((value / 1e-3) * 0.01)
+        DensityUnits.MilligramPerLiter: ('mg/L',),
         
-        if to_unit == DensityUnits.DecigramPerMilliliter:
-            return ((value / 1e-3) * 0.1)
+        DensityUnits.CentigramPerLiter: ('cg/L',),
         
-        return None
+        DensityUnits.DecigramPerLiter: ('dg/L',),
+        
+        DensityUnits.PicogramPerDeciliter: ('pg/dl',),
+        
+        DensityUnits.NanogramPerDeciliter: ('ng/dl',),
+        
+        DensityUnits.MicrogramPerDeciliter: ('μg/dl',),
+        
+        DensityUnits.MilligramPerDeciliter: ('mg/dl',),
+        
+        DensityUnits.CentigramPerDeciliter: ('cg/dl',),
+        
+        DensityUnits.DecigramPerDeciliter: ('dg/dl',),
+        
+        DensityUnits.PicogramPerMilliliter: ('pg/ml',),
+        
+        DensityUnits.NanogramPerMilliliter: ('ng/ml',),
+        
+        DensityUnits.MicrogramPerMilliliter: ('μg/ml',),
+        
+        DensityUnits.MilligramPerMilliliter: ('mg/ml',),
+        
+        DensityUnits.CentigramPerMilliliter: ('cg/ml',),
+        
+        DensityUnits.DecigramPerMilliliter: ('dg/ml',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: DensityUnits = DensityUnits.KilogramPerCubicMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: DensityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: DensityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: DensityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: DensityUnits, to_unit: DensityUnits) -> float:
+        """
+        Convert a value from one Density unit to another, without creating a Density instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: DensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: DensityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Density._convert_value(value, from_unit, to_unit)
 
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: DensityUnits, to_unit: DensityUnits) -> List[float]:
+        """
+        Convert many values from one Density unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: DensityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: DensityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Density._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: DensityUnits, to_unit: DensityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Density._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: DensityUnits, to_unit: DensityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Density unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: DensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: DensityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Density._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: DensityUnits = DensityUnits.KilogramPerCubicMeter) -> Density:
+        """
+        Create a new instance of Density holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: DensityUnits
+        :return: A new instance of Density.
+        :rtype: Density
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Density._from_exact(value, from_unit)
+
+    def to_exact(self, unit: DensityUnits = DensityUnits.KilogramPerCubicMeter) -> Fraction:
+        """
+        Get the exact value of the Density in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (KilogramPerCubicMeter).
+        :type unit: DensityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Density:
+        """
+        Parse a Density from a value followed by a unit abbreviation, e.g. "1 g/mm³".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Density.
+        :rtype: Density
+        :raises ValueError: When the string is not a valid or an ambiguous Density.
+        """
+        return Density._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Density]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Density._try_parse(text)
+
+    def to_binary(self, unit: Optional[DensityUnits] = None) -> bytes:
+        """
+        Encode the Density to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: DensityUnits
+        :return: The encoded Density.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Density:
+        """
+        Decode a Density encoded by to_binary.
+
+        :param data: The encoded Density, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Density.
+        :rtype: Density
+        :raises ValueError: When the data is not a valid encoded Density.
+        """
+        return Density._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[DensityUnits] = None) -> dict:
+        """
+        Get the Density DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (KilogramPerCubicMeter).
+        :type hold_in_unit: DensityUnits
+        :return: The Density DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[DensityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Density:
+        """
+        Create a new instance of Density from its DTO.
+
+        :param dto: The Density DTO, the unit is the DensityUnits value or name.
+        :type dto: dict
+        :return: A new instance of Density.
+        :rtype: Density
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Density._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Density:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Density._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -1477,10 +1899,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_cubic_millimeter != None:
-            return self.__grams_per_cubic_millimeter
-        self.__grams_per_cubic_millimeter = self.__convert_from_base(DensityUnits.GramPerCubicMillimeter)
-        return self.__grams_per_cubic_millimeter
+        return self._cached_convert(DensityUnits.GramPerCubicMillimeter)
 
     
     @property
@@ -1488,10 +1907,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_cubic_centimeter != None:
-            return self.__grams_per_cubic_centimeter
-        self.__grams_per_cubic_centimeter = self.__convert_from_base(DensityUnits.GramPerCubicCentimeter)
-        return self.__grams_per_cubic_centimeter
+        return self._cached_convert(DensityUnits.GramPerCubicCentimeter)
 
     
     @property
@@ -1499,10 +1915,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_cubic_meter != None:
-            return self.__grams_per_cubic_meter
-        self.__grams_per_cubic_meter = self.__convert_from_base(DensityUnits.GramPerCubicMeter)
-        return self.__grams_per_cubic_meter
+        return self._cached_convert(DensityUnits.GramPerCubicMeter)
 
     
     @property
@@ -1510,10 +1923,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_cubic_inch != None:
-            return self.__pounds_per_cubic_inch
-        self.__pounds_per_cubic_inch = self.__convert_from_base(DensityUnits.PoundPerCubicInch)
-        return self.__pounds_per_cubic_inch
+        return self._cached_convert(DensityUnits.PoundPerCubicInch)
 
     
     @property
@@ -1521,10 +1931,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_cubic_foot != None:
-            return self.__pounds_per_cubic_foot
-        self.__pounds_per_cubic_foot = self.__convert_from_base(DensityUnits.PoundPerCubicFoot)
-        return self.__pounds_per_cubic_foot
+        return self._cached_convert(DensityUnits.PoundPerCubicFoot)
 
     
     @property
@@ -1532,10 +1939,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_per_cubic_millimeter != None:
-            return self.__tonnes_per_cubic_millimeter
-        self.__tonnes_per_cubic_millimeter = self.__convert_from_base(DensityUnits.TonnePerCubicMillimeter)
-        return self.__tonnes_per_cubic_millimeter
+        return self._cached_convert(DensityUnits.TonnePerCubicMillimeter)
 
     
     @property
@@ -1543,10 +1947,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_per_cubic_centimeter != None:
-            return self.__tonnes_per_cubic_centimeter
-        self.__tonnes_per_cubic_centimeter = self.__convert_from_base(DensityUnits.TonnePerCubicCentimeter)
-        return self.__tonnes_per_cubic_centimeter
+        return self._cached_convert(DensityUnits.TonnePerCubicCentimeter)
 
     
     @property
@@ -1554,10 +1955,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_per_cubic_meter != None:
-            return self.__tonnes_per_cubic_meter
-        self.__tonnes_per_cubic_meter = self.__convert_from_base(DensityUnits.TonnePerCubicMeter)
-        return self.__tonnes_per_cubic_meter
+        return self._cached_convert(DensityUnits.TonnePerCubicMeter)
 
     
     @property
@@ -1565,10 +1963,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__slugs_per_cubic_foot != None:
-            return self.__slugs_per_cubic_foot
-        self.__slugs_per_cubic_foot = self.__convert_from_base(DensityUnits.SlugPerCubicFoot)
-        return self.__slugs_per_cubic_foot
+        return self._cached_convert(DensityUnits.SlugPerCubicFoot)
 
     
     @property
@@ -1576,10 +1971,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_liter != None:
-            return self.__grams_per_liter
-        self.__grams_per_liter = self.__convert_from_base(DensityUnits.GramPerLiter)
-        return self.__grams_per_liter
+        return self._cached_convert(DensityUnits.GramPerLiter)
 
     
     @property
@@ -1587,10 +1979,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_deci_liter != None:
-            return self.__grams_per_deci_liter
-        self.__grams_per_deci_liter = self.__convert_from_base(DensityUnits.GramPerDeciliter)
-        return self.__grams_per_deci_liter
+        return self._cached_convert(DensityUnits.GramPerDeciliter)
 
     
     @property
@@ -1598,10 +1987,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_milliliter != None:
-            return self.__grams_per_milliliter
-        self.__grams_per_milliliter = self.__convert_from_base(DensityUnits.GramPerMilliliter)
-        return self.__grams_per_milliliter
+        return self._cached_convert(DensityUnits.GramPerMilliliter)
 
     
     @property
@@ -1609,10 +1995,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_us_gallon != None:
-            return self.__pounds_per_us_gallon
-        self.__pounds_per_us_gallon = self.__convert_from_base(DensityUnits.PoundPerUSGallon)
-        return self.__pounds_per_us_gallon
+        return self._cached_convert(DensityUnits.PoundPerUSGallon)
 
     
     @property
@@ -1620,10 +2003,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_imperial_gallon != None:
-            return self.__pounds_per_imperial_gallon
-        self.__pounds_per_imperial_gallon = self.__convert_from_base(DensityUnits.PoundPerImperialGallon)
-        return self.__pounds_per_imperial_gallon
+        return self._cached_convert(DensityUnits.PoundPerImperialGallon)
 
     
     @property
@@ -1631,10 +2011,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_liter != None:
-            return self.__kilograms_per_liter
-        self.__kilograms_per_liter = self.__convert_from_base(DensityUnits.KilogramPerLiter)
-        return self.__kilograms_per_liter
+        return self._cached_convert(DensityUnits.KilogramPerLiter)
 
     
     @property
@@ -1642,10 +2019,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_per_cubic_foot != None:
-            return self.__tonnes_per_cubic_foot
-        self.__tonnes_per_cubic_foot = self.__convert_from_base(DensityUnits.TonnePerCubicFoot)
-        return self.__tonnes_per_cubic_foot
+        return self._cached_convert(DensityUnits.TonnePerCubicFoot)
 
     
     @property
@@ -1653,10 +2027,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_per_cubic_inch != None:
-            return self.__tonnes_per_cubic_inch
-        self.__tonnes_per_cubic_inch = self.__convert_from_base(DensityUnits.TonnePerCubicInch)
-        return self.__tonnes_per_cubic_inch
+        return self._cached_convert(DensityUnits.TonnePerCubicInch)
 
     
     @property
@@ -1664,10 +2035,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_cubic_foot != None:
-            return self.__grams_per_cubic_foot
-        self.__grams_per_cubic_foot = self.__convert_from_base(DensityUnits.GramPerCubicFoot)
-        return self.__grams_per_cubic_foot
+        return self._cached_convert(DensityUnits.GramPerCubicFoot)
 
     
     @property
@@ -1675,10 +2043,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_cubic_inch != None:
-            return self.__grams_per_cubic_inch
-        self.__grams_per_cubic_inch = self.__convert_from_base(DensityUnits.GramPerCubicInch)
-        return self.__grams_per_cubic_inch
+        return self._cached_convert(DensityUnits.GramPerCubicInch)
 
     
     @property
@@ -1686,10 +2051,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_cubic_meter != None:
-            return self.__pounds_per_cubic_meter
-        self.__pounds_per_cubic_meter = self.__convert_from_base(DensityUnits.PoundPerCubicMeter)
-        return self.__pounds_per_cubic_meter
+        return self._cached_convert(DensityUnits.PoundPerCubicMeter)
 
     
     @property
@@ -1697,10 +2059,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_cubic_centimeter != None:
-            return self.__pounds_per_cubic_centimeter
-        self.__pounds_per_cubic_centimeter = self.__convert_from_base(DensityUnits.PoundPerCubicCentimeter)
-        return self.__pounds_per_cubic_centimeter
+        return self._cached_convert(DensityUnits.PoundPerCubicCentimeter)
 
     
     @property
@@ -1708,10 +2067,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_cubic_millimeter != None:
-            return self.__pounds_per_cubic_millimeter
-        self.__pounds_per_cubic_millimeter = self.__convert_from_base(DensityUnits.PoundPerCubicMillimeter)
-        return self.__pounds_per_cubic_millimeter
+        return self._cached_convert(DensityUnits.PoundPerCubicMillimeter)
 
     
     @property
@@ -1719,10 +2075,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__slugs_per_cubic_meter != None:
-            return self.__slugs_per_cubic_meter
-        self.__slugs_per_cubic_meter = self.__convert_from_base(DensityUnits.SlugPerCubicMeter)
-        return self.__slugs_per_cubic_meter
+        return self._cached_convert(DensityUnits.SlugPerCubicMeter)
 
     
     @property
@@ -1730,10 +2083,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__slugs_per_cubic_centimeter != None:
-            return self.__slugs_per_cubic_centimeter
-        self.__slugs_per_cubic_centimeter = self.__convert_from_base(DensityUnits.SlugPerCubicCentimeter)
-        return self.__slugs_per_cubic_centimeter
+        return self._cached_convert(DensityUnits.SlugPerCubicCentimeter)
 
     
     @property
@@ -1741,10 +2091,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__slugs_per_cubic_millimeter != None:
-            return self.__slugs_per_cubic_millimeter
-        self.__slugs_per_cubic_millimeter = self.__convert_from_base(DensityUnits.SlugPerCubicMillimeter)
-        return self.__slugs_per_cubic_millimeter
+        return self._cached_convert(DensityUnits.SlugPerCubicMillimeter)
 
     
     @property
@@ -1752,10 +2099,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__slugs_per_cubic_inch != None:
-            return self.__slugs_per_cubic_inch
-        self.__slugs_per_cubic_inch = self.__convert_from_base(DensityUnits.SlugPerCubicInch)
-        return self.__slugs_per_cubic_inch
+        return self._cached_convert(DensityUnits.SlugPerCubicInch)
 
     
     @property
@@ -1763,10 +2107,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_cubic_millimeter != None:
-            return self.__kilograms_per_cubic_millimeter
-        self.__kilograms_per_cubic_millimeter = self.__convert_from_base(DensityUnits.KilogramPerCubicMillimeter)
-        return self.__kilograms_per_cubic_millimeter
+        return self._cached_convert(DensityUnits.KilogramPerCubicMillimeter)
 
     
     @property
@@ -1774,10 +2115,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_cubic_centimeter != None:
-            return self.__kilograms_per_cubic_centimeter
-        self.__kilograms_per_cubic_centimeter = self.__convert_from_base(DensityUnits.KilogramPerCubicCentimeter)
-        return self.__kilograms_per_cubic_centimeter
+        return self._cached_convert(DensityUnits.KilogramPerCubicCentimeter)
 
     
     @property
@@ -1785,10 +2123,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_cubic_meter != None:
-            return self.__kilograms_per_cubic_meter
-        self.__kilograms_per_cubic_meter = self.__convert_from_base(DensityUnits.KilogramPerCubicMeter)
-        return self.__kilograms_per_cubic_meter
+        return self._cached_convert(DensityUnits.KilogramPerCubicMeter)
 
     
     @property
@@ -1796,10 +2131,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_cubic_meter != None:
-            return self.__milligrams_per_cubic_meter
-        self.__milligrams_per_cubic_meter = self.__convert_from_base(DensityUnits.MilligramPerCubicMeter)
-        return self.__milligrams_per_cubic_meter
+        return self._cached_convert(DensityUnits.MilligramPerCubicMeter)
 
     
     @property
@@ -1807,10 +2139,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_cubic_meter != None:
-            return self.__micrograms_per_cubic_meter
-        self.__micrograms_per_cubic_meter = self.__convert_from_base(DensityUnits.MicrogramPerCubicMeter)
-        return self.__micrograms_per_cubic_meter
+        return self._cached_convert(DensityUnits.MicrogramPerCubicMeter)
 
     
     @property
@@ -1818,10 +2147,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_per_cubic_inch != None:
-            return self.__kilopounds_per_cubic_inch
-        self.__kilopounds_per_cubic_inch = self.__convert_from_base(DensityUnits.KilopoundPerCubicInch)
-        return self.__kilopounds_per_cubic_inch
+        return self._cached_convert(DensityUnits.KilopoundPerCubicInch)
 
     
     @property
@@ -1829,10 +2155,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_per_cubic_foot != None:
-            return self.__kilopounds_per_cubic_foot
-        self.__kilopounds_per_cubic_foot = self.__convert_from_base(DensityUnits.KilopoundPerCubicFoot)
-        return self.__kilopounds_per_cubic_foot
+        return self._cached_convert(DensityUnits.KilopoundPerCubicFoot)
 
     
     @property
@@ -1840,10 +2163,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__picograms_per_liter != None:
-            return self.__picograms_per_liter
-        self.__picograms_per_liter = self.__convert_from_base(DensityUnits.PicogramPerLiter)
-        return self.__picograms_per_liter
+        return self._cached_convert(DensityUnits.PicogramPerLiter)
 
     
     @property
@@ -1851,10 +2171,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__nanograms_per_liter != None:
-            return self.__nanograms_per_liter
-        self.__nanograms_per_liter = self.__convert_from_base(DensityUnits.NanogramPerLiter)
-        return self.__nanograms_per_liter
+        return self._cached_convert(DensityUnits.NanogramPerLiter)
 
     
     @property
@@ -1862,10 +2179,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_liter != None:
-            return self.__micrograms_per_liter
-        self.__micrograms_per_liter = self.__convert_from_base(DensityUnits.MicrogramPerLiter)
-        return self.__micrograms_per_liter
+        return self._cached_convert(DensityUnits.MicrogramPerLiter)
 
     
     @property
@@ -1873,10 +2187,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_liter != None:
-            return self.__milligrams_per_liter
-        self.__milligrams_per_liter = self.__convert_from_base(DensityUnits.MilligramPerLiter)
-        return self.__milligrams_per_liter
+        return self._cached_convert(DensityUnits.MilligramPerLiter)
 
     
     @property
@@ -1884,10 +2195,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__centigrams_per_liter != None:
-            return self.__centigrams_per_liter
-        self.__centigrams_per_liter = self.__convert_from_base(DensityUnits.CentigramPerLiter)
-        return self.__centigrams_per_liter
+        return self._cached_convert(DensityUnits.CentigramPerLiter)
 
     
     @property
@@ -1895,10 +2203,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__decigrams_per_liter != None:
-            return self.__decigrams_per_liter
-        self.__decigrams_per_liter = self.__convert_from_base(DensityUnits.DecigramPerLiter)
-        return self.__decigrams_per_liter
+        return self._cached_convert(DensityUnits.DecigramPerLiter)
 
     
     @property
@@ -1906,10 +2211,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__picograms_per_deci_liter != None:
-            return self.__picograms_per_deci_liter
-        self.__picograms_per_deci_liter = self.__convert_from_base(DensityUnits.PicogramPerDeciliter)
-        return self.__picograms_per_deci_liter
+        return self._cached_convert(DensityUnits.PicogramPerDeciliter)
 
     
     @property
@@ -1917,10 +2219,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__nanograms_per_deci_liter != None:
-            return self.__nanograms_per_deci_liter
-        self.__nanograms_per_deci_liter = self.__convert_from_base(DensityUnits.NanogramPerDeciliter)
-        return self.__nanograms_per_deci_liter
+        return self._cached_convert(DensityUnits.NanogramPerDeciliter)
 
     
     @property
@@ -1928,10 +2227,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_deci_liter != None:
-            return self.__micrograms_per_deci_liter
-        self.__micrograms_per_deci_liter = self.__convert_from_base(DensityUnits.MicrogramPerDeciliter)
-        return self.__micrograms_per_deci_liter
+        return self._cached_convert(DensityUnits.MicrogramPerDeciliter)
 
     
     @property
@@ -1939,10 +2235,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_deci_liter != None:
-            return self.__milligrams_per_deci_liter
-        self.__milligrams_per_deci_liter = self.__convert_from_base(DensityUnits.MilligramPerDeciliter)
-        return self.__milligrams_per_deci_liter
+        return self._cached_convert(DensityUnits.MilligramPerDeciliter)
 
     
     @property
@@ -1950,10 +2243,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__centigrams_per_deci_liter != None:
-            return self.__centigrams_per_deci_liter
-        self.__centigrams_per_deci_liter = self.__convert_from_base(DensityUnits.CentigramPerDeciliter)
-        return self.__centigrams_per_deci_liter
+        return self._cached_convert(DensityUnits.CentigramPerDeciliter)
 
     
     @property
@@ -1961,10 +2251,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__decigrams_per_deci_liter != None:
-            return self.__decigrams_per_deci_liter
-        self.__decigrams_per_deci_liter = self.__convert_from_base(DensityUnits.DecigramPerDeciliter)
-        return self.__decigrams_per_deci_liter
+        return self._cached_convert(DensityUnits.DecigramPerDeciliter)
 
     
     @property
@@ -1972,10 +2259,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__picograms_per_milliliter != None:
-            return self.__picograms_per_milliliter
-        self.__picograms_per_milliliter = self.__convert_from_base(DensityUnits.PicogramPerMilliliter)
-        return self.__picograms_per_milliliter
+        return self._cached_convert(DensityUnits.PicogramPerMilliliter)
 
     
     @property
@@ -1983,10 +2267,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__nanograms_per_milliliter != None:
-            return self.__nanograms_per_milliliter
-        self.__nanograms_per_milliliter = self.__convert_from_base(DensityUnits.NanogramPerMilliliter)
-        return self.__nanograms_per_milliliter
+        return self._cached_convert(DensityUnits.NanogramPerMilliliter)
 
     
     @property
@@ -1994,10 +2275,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_milliliter != None:
-            return self.__micrograms_per_milliliter
-        self.__micrograms_per_milliliter = self.__convert_from_base(DensityUnits.MicrogramPerMilliliter)
-        return self.__micrograms_per_milliliter
+        return self._cached_convert(DensityUnits.MicrogramPerMilliliter)
 
     
     @property
@@ -2005,10 +2283,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_milliliter != None:
-            return self.__milligrams_per_milliliter
-        self.__milligrams_per_milliliter = self.__convert_from_base(DensityUnits.MilligramPerMilliliter)
-        return self.__milligrams_per_milliliter
+        return self._cached_convert(DensityUnits.MilligramPerMilliliter)
 
     
     @property
@@ -2016,10 +2291,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__centigrams_per_milliliter != None:
-            return self.__centigrams_per_milliliter
-        self.__centigrams_per_milliliter = self.__convert_from_base(DensityUnits.CentigramPerMilliliter)
-        return self.__centigrams_per_milliliter
+        return self._cached_convert(DensityUnits.CentigramPerMilliliter)
 
     
     @property
@@ -2027,10 +2299,7 @@ class Density(AbstractMeasure):
         """
         
         """
-        if self.__decigrams_per_milliliter != None:
-            return self.__decigrams_per_milliliter
-        self.__decigrams_per_milliliter = self.__convert_from_base(DensityUnits.DecigramPerMilliliter)
-        return self.__decigrams_per_milliliter
+        return self._cached_convert(DensityUnits.DecigramPerMilliliter)
 
     
     def to_string(self, unit: DensityUnits = DensityUnits.KilogramPerCubicMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class DurationUnits(Enum):
         """
             DurationUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Year365 = 'year365'
         """
@@ -74,113 +85,364 @@ class Duration(AbstractMeasure):
         value (float): The value.
         from_unit (DurationUnits): The Duration unit to create from, The default unit is Second
     """
-    def __init__(self, value: float, from_unit: DurationUnits = DurationUnits.Second):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = DurationUnits
+
+    _base_unit = DurationUnits.Second
+
+    _dimensions = (0, 0, 1, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 16
+
+    _binary_unit_ids = {
         
-        self.__years365 = None
+        DurationUnits.Year365: 0,
         
-        self.__months30 = None
+        DurationUnits.Month30: 1,
         
-        self.__weeks = None
+        DurationUnits.Week: 2,
         
-        self.__days = None
+        DurationUnits.Day: 3,
         
-        self.__hours = None
+        DurationUnits.Hour: 4,
         
-        self.__minutes = None
+        DurationUnits.Minute: 5,
         
-        self.__seconds = None
+        DurationUnits.Second: 6,
         
-        self.__julian_years = None
+        DurationUnits.JulianYear: 7,
         
-        self.__nanoseconds = None
+        DurationUnits.Nanosecond: 8,
         
-        self.__microseconds = None
+        DurationUnits.Microsecond: 9,
         
-        self.__milliseconds = None
+        DurationUnits.Millisecond: 10,
         
+    }
 
-    def convert(self, unit: DurationUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        DurationUnits.Year365: lambda value: (value / (365 * 24 * 3600)),
+        
+        DurationUnits.Month30: lambda value: (value / (30 * 24 * 3600)),
+        
+        DurationUnits.Week: lambda value: (value / (7 * 24 * 3600)),
+        
+        DurationUnits.Day: lambda value: (value / (24 * 3600)),
+        
+        DurationUnits.Hour: lambda value: (value / 3600),
+        
+        DurationUnits.Minute: lambda value: (value / 60),
+        
+        DurationUnits.Second: lambda value: (value),
+        
+        DurationUnits.JulianYear: lambda value: (value / (365.25 * 24 * 3600)),
+        
+        DurationUnits.Nanosecond: lambda value: ((value) / 1e-09),
+        
+        DurationUnits.Microsecond: lambda value: ((value) / 1e-06),
+        
+        DurationUnits.Millisecond: lambda value: ((value) / 0.001),
+        
+    }
 
-    def __convert_from_base(self, from_unit: DurationUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == DurationUnits.Year365:
-            return (value / (365 * 24 * 3600))
+        DurationUnits.Year365: lambda value: (value * 365 * 24 * 3600),
         
-        if from_unit == DurationUnits.Month30:
-            return (value / (30 * 24 * 3600))
+        DurationUnits.Month30: lambda value: (value * 30 * 24 * 3600),
         
-        if from_unit == DurationUnits.Week:
-            return (value / (7 * 24 * 3600))
+        DurationUnits.Week: lambda value: (value * 7 * 24 * 3600),
         
-        if from_unit == DurationUnits.Day:
-            return (value / (24 * 3600))
+        DurationUnits.Day: lambda value: (value * 24 * 3600),
         
-        if from_unit == DurationUnits.Hour:
-            return (value / 3600)
+        DurationUnits.Hour: lambda value: (value * 3600),
         
-        if from_unit == DurationUnits.Minute:
-            return (value / 60)
+        DurationUnits.Minute: lambda value: (value * 60),
         
-        if from_unit == DurationUnits.Second:
-            return (value)
+        DurationUnits.Second: lambda value: (value),
         
-        if from_unit == DurationUnits.JulianYear:
-            return (value / (365.25 * 24 * 3600))
+        DurationUnits.JulianYear: lambda value: (value * 365.25 * 24 * 3600),
         
-        if from_unit == DurationUnits.Nanosecond:
-            return ((value) / 1e-09)
+        DurationUnits.Nanosecond: lambda value: ((value) * 1e-09),
         
-        if from_unit == DurationUnits.Microsecond:
-            return ((value) / 1e-06)
+        DurationUnits.Microsecond: lambda value: ((value) * 1e-06),
         
-        if from_unit == DurationUnits.Millisecond:
-            return ((value) / 0.001)
+        DurationUnits.Millisecond: lambda value: ((value) * 0.001),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        DurationUnits.Year365: ('1/31536000', '0'),
+        
+        DurationUnits.Month30: ('1/2592000', '0'),
+        
+        DurationUnits.Week: ('1/604800', '0'),
+        
+        DurationUnits.Day: ('1/86400', '0'),
+        
+        DurationUnits.Hour: ('1/3600', '0'),
+        
+        DurationUnits.Minute: ('1/60', '0'),
+        
+        DurationUnits.Second: ('1', '0'),
+        
+        DurationUnits.JulianYear: ('1/31557600', '0'),
+        
+        DurationUnits.Nanosecond: ('1000000000', '0'),
+        
+        DurationUnits.Microsecond: ('1000000', '0'),
+        
+        DurationUnits.Millisecond: ('1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: DurationUnits) -> float:
+    _affine_to_base = {
+        
+        DurationUnits.Year365: ('31536000', '0'),
+        
+        DurationUnits.Month30: ('2592000', '0'),
+        
+        DurationUnits.Week: ('604800', '0'),
+        
+        DurationUnits.Day: ('86400', '0'),
+        
+        DurationUnits.Hour: ('3600', '0'),
+        
+        DurationUnits.Minute: ('60', '0'),
+        
+        DurationUnits.Second: ('1', '0'),
+        
+        DurationUnits.JulianYear: ('31557600', '0'),
+        
+        DurationUnits.Nanosecond: ('1/1000000000', '0'),
+        
+        DurationUnits.Microsecond: ('1/1000000', '0'),
         
-        if to_unit == DurationUnits.Year365:
-            return (value * 365 * 24 * 3600)
+        DurationUnits.Millisecond: ('1/1000', '0'),
         
-        if to_unit == DurationUnits.Month30:
-            return (value * 30 * 24 * 3600)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        DurationUnits.Year365: ('yr',),
+        
+        DurationUnits.Month30: ('mo',),
         
-        if to_unit == DurationUnits.Week:
-            return (value * 7 * 24 * 3600)
+        DurationUnits.Week: ('wk',),
         
-        if to_unit == DurationUnits.Day:
-            return (value * 24 * 3600)
+        DurationUnits.Day: ('d',),
         
-        if to_unit == DurationUnits.Hour:
-            return (value * 3600)
+        DurationUnits.Hour: ('h',),
         
-        if to_unit == DurationUnits.Minute:
-            return (value * 60)
+        DurationUnits.Minute: ('m',),
         
-        if to_unit == DurationUnits.Second:
-            return (value)
+        DurationUnits.Second: ('s',),
         
-        if to_unit == DurationUnits.JulianYear:
-            return (value * 365.25 * 24 * 3600)
+        DurationUnits.JulianYear: ('jyr',),
         
-        if to_unit == DurationUnits.Nanosecond:
-            return ((value) * 1e-09)
+        DurationUnits.Nanosecond: ('ns',),
         
-        if to_unit == DurationUnits.Microsecond:
-            return ((value) * 1e-06)
+        DurationUnits.Microsecond: ('μs',),
         
-        if to_unit == DurationUnits.Millisecond:
-            return ((value) * 0.001)
+        DurationUnits.Millisecond: ('ms',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: DurationUnits = DurationUnits.Second):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: DurationUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: DurationUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: DurationUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
 
+    @staticmethod
+    def convert_value(value: float, from_unit: DurationUnits, to_unit: DurationUnits) -> float:
+        """
+        Convert a value from one Duration unit to another, without creating a Duration instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: DurationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: DurationUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Duration._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: DurationUnits, to_unit: DurationUnits) -> List[float]:
+        """
+        Convert many values from one Duration unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: DurationUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: DurationUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Duration._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: DurationUnits, to_unit: DurationUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Duration._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: DurationUnits, to_unit: DurationUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Duration unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: DurationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: DurationUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Duration._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: DurationUnits = DurationUnits.Second) -> Duration:
+        """
+        Create a new instance of Duration holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: DurationUnits
+        :return: A new instance of Duration.
+        :rtype: Duration
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Duration._from_exact(value, from_unit)
+
+    def to_exact(self, unit: DurationUnits = DurationUnits.Second) -> Fraction:
+        """
+        Get the exact value of the Duration in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Second).
+        :type unit: DurationUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Duration:
+        """
+        Parse a Duration from a value followed by a unit abbreviation, e.g. "1 yr".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Duration.
+        :rtype: Duration
+        :raises ValueError: When the string is not a valid or an ambiguous Duration.
+        """
+        return Duration._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Duration]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Duration._try_parse(text)
+
+    def to_binary(self, unit: Optional[DurationUnits] = None) -> bytes:
+        """
+        Encode the Duration to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: DurationUnits
+        :return: The encoded Duration.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Duration:
+        """
+        Decode a Duration encoded by to_binary.
+
+        :param data: The encoded Duration, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Duration.
+        :rtype: Duration
+        :raises ValueError: When the data is not a valid encoded Duration.
+        """
+        return Duration._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[DurationUnits] = None) -> dict:
+        """
+        Get the Duration DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Second).
+        :type hold_in_unit: DurationUnits
+        :return: The Duration DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[DurationUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Duration:
+        """
+        Create a new instance of Duration from its DTO.
+
+        :param dto: The Duration DTO, the unit is the DurationUnits value or name.
+        :type dto: dict
+        :return: A new instance of Duration.
+        :rtype: Duration
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Duration._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Duration:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Duration._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -357,10 +619,7 @@ class Duration(AbstractMeasure):
         """
         
         """
-        if self.__years365 != None:
-            return self.__years365
-        self.__years365 = self.__convert_from_base(DurationUnits.Year365)
-        return self.__years365
+        return self._cached_convert(DurationUnits.Year365)
 
     
     @property
@@ -368,10 +627,7 @@ class Duration(AbstractMeasure):
         """
         
         """
-        if self.__months30 != None:
-            return self.__months30
-        self.__months30 = self.__convert_from_base(DurationUnits.Month30)
-        return self.__months30
+        return self._cached_convert(DurationUnits.Month30)
 
     
     @property
@@ -379,10 +635,7 @@ class Duration(AbstractMeasure):
         """
         
         """
-        if self.__weeks != None:
-            return self.__weeks
-        self.__weeks = self.__convert_from_base(DurationUnits.Week)
-        return self.__weeks
+        return self._cached_convert(DurationUnits.Week)
 
     
     @property
@@ -390,10 +643,7 @@ class Duration(AbstractMeasure):
         """
         
         """
-        if self.__days != None:
-            return self.__days
-        self.__days = self.__convert_from_base(DurationUnits.Day)
-        return self.__days
+        return self._cached_convert(DurationUnits.Day)
 
     
     @property
@@ -401,10 +651,7 @@ class Duration(AbstractMeasure):
         """
         
         """
-        if self.__hours != None:
-            return self.__hours
-        self.__hours = self.__convert_from_base(DurationUnits.Hour)
-        return self.__hours
+        return self._cached_convert(DurationUnits.Hour)
 
     
     @property
@@ -412,10 +659,7 @@ class Duration(AbstractMeasure):
         """
         
         """
-        if self.__minutes != None:
-            return self.__minutes
-        self.__minutes = self.__convert_from_base(DurationUnits.Minute)
-        return self.__minutes
+        return self._cached_convert(DurationUnits.Minute)
 
     
     @property
@@ -423,10 +667,7 @@ class Duration(AbstractMeasure):
         """
         
         """
-        if self.__seconds != None:
-            return self.__seconds
-        self.__seconds = self.__convert_from_base(DurationUnits.Second)
-        return self.__seconds
+        return self._cached_convert(DurationUnits.Second)
 
     
     @property
@@ -434,10 +675,7 @@ class Duration(AbstractMeasure):
         """
         
         """
-        if self.__julian_years != None:
-            return self.__julian_years
-        self.__julian_years = self.__convert_from_base(DurationUnits.JulianYear)
-        return self.__julian_years
+        return self._cached_convert(DurationUnits.JulianYear)
 
     
     @property
@@ -445,10 +683,7 @@ class Duration(AbstractMeasure):
         """
         
         """
-        if self.__nanoseconds != None:
-            return self.__nanoseconds
-        self.__nanoseconds = self.__convert_from_base(DurationUnits.Nanosecond)
-        return self.__nanoseconds
+        return self._cached_convert(DurationUnits.Nanosecond)
 
     
     @property
@@ -456,10 +691,7 @@ class Duration(AbstractMeasure):
         """
         
         """
-        if self.__microseconds != None:
-            return self.__microseconds
-        self.__microseconds = self.__convert_from_base(DurationUnits.Microsecond)
-        return self.__microseconds
+        return self._cached_convert(DurationUnits.Microsecond)
 
     
     @property
@@ -467,10 +699,7 @@ class Duration(AbstractMeasure):
         """
         
         """
-        if self.__milliseconds != None:
-            return self.__milliseconds
-        self.__milliseconds = self.__convert_from_base(DurationUnits.Millisecond)
-        return self.__milliseconds
+        return self._cached_convert(DurationUnits.Millisecond)
 
     
     def to_string(self, unit: DurationUnits = DurationUnits.Second) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class DynamicViscosityUnits(Enum):
         """
             DynamicViscosityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         NewtonSecondPerMeterSquared = 'newton_second_per_meter_squared'
         """
@@ -69,105 +80,352 @@ class DynamicViscosity(AbstractMeasure):
         value (float): The value.
         from_unit (DynamicViscosityUnits): The DynamicViscosity unit to create from, The default unit is NewtonSecondPerMeterSquared
     """
-    def __init__(self, value: float, from_unit: DynamicViscosityUnits = DynamicViscosityUnits.NewtonSecondPerMeterSquared):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = DynamicViscosityUnits
+
+    _base_unit = DynamicViscosityUnits.NewtonSecondPerMeterSquared
+
+    _dimensions = (-1, 1, -1, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 17
+
+    _binary_unit_ids = {
         
-        self.__newton_seconds_per_meter_squared = None
+        DynamicViscosityUnits.NewtonSecondPerMeterSquared: 0,
         
-        self.__pascal_seconds = None
+        DynamicViscosityUnits.PascalSecond: 1,
         
-        self.__poise = None
+        DynamicViscosityUnits.Poise: 2,
         
-        self.__reyns = None
+        DynamicViscosityUnits.Reyn: 3,
         
-        self.__pounds_force_second_per_square_inch = None
+        DynamicViscosityUnits.PoundForceSecondPerSquareInch: 4,
         
-        self.__pounds_force_second_per_square_foot = None
+        DynamicViscosityUnits.PoundForceSecondPerSquareFoot: 5,
         
-        self.__pounds_per_foot_second = None
+        DynamicViscosityUnits.PoundPerFootSecond: 6,
         
-        self.__millipascal_seconds = None
+        DynamicViscosityUnits.MillipascalSecond: 7,
         
-        self.__micropascal_seconds = None
+        DynamicViscosityUnits.MicropascalSecond: 8,
         
-        self.__centipoise = None
+        DynamicViscosityUnits.Centipoise: 9,
         
+    }
 
-    def convert(self, unit: DynamicViscosityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        DynamicViscosityUnits.NewtonSecondPerMeterSquared: lambda value: (value),
+        
+        DynamicViscosityUnits.PascalSecond: lambda value: (value),
+        
+        DynamicViscosityUnits.Poise: lambda value: (value * 10),
+        
+        DynamicViscosityUnits.Reyn: lambda value: (value / 6.8947572931683613e3),
+        
+        DynamicViscosityUnits.PoundForceSecondPerSquareInch: lambda value: (value / 6.8947572931683613e3),
+        
+        DynamicViscosityUnits.PoundForceSecondPerSquareFoot: lambda value: (value / 4.7880258980335843e1),
+        
+        DynamicViscosityUnits.PoundPerFootSecond: lambda value: (value / 1.4881639),
+        
+        DynamicViscosityUnits.MillipascalSecond: lambda value: ((value) / 0.001),
+        
+        DynamicViscosityUnits.MicropascalSecond: lambda value: ((value) / 1e-06),
+        
+        DynamicViscosityUnits.Centipoise: lambda value: ((value * 10) / 0.01),
+        
+    }
 
-    def __convert_from_base(self, from_unit: DynamicViscosityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        DynamicViscosityUnits.NewtonSecondPerMeterSquared: lambda value: (value),
+        
+        DynamicViscosityUnits.PascalSecond: lambda value: (value),
+        
+        DynamicViscosityUnits.Poise: lambda value: (value / 10),
+        
+        DynamicViscosityUnits.Reyn: lambda value: (value * 6.8947572931683613e3),
+        
+        DynamicViscosityUnits.PoundForceSecondPerSquareInch: lambda value: (value * 6.8947572931683613e3),
+        
+        DynamicViscosityUnits.PoundForceSecondPerSquareFoot: lambda value: (value * 4.7880258980335843e1),
         
-        if from_unit == DynamicViscosityUnits.NewtonSecondPerMeterSquared:
-            return (value)
+        DynamicViscosityUnits.PoundPerFootSecond: lambda value: (value * 1.4881639),
         
-        if from_unit == DynamicViscosityUnits.PascalSecond:
-            return (value)
+        DynamicViscosityUnits.MillipascalSecond: lambda value: ((value) * 0.001),
         
-        if from_unit == DynamicViscosityUnits.Poise:
-            return (value * 10)
+        DynamicViscosityUnits.MicropascalSecond: lambda value: ((value) * 1e-06),
         
-        if from_unit == DynamicViscosityUnits.Reyn:
-            return (value / 6.8947572931683613e3)
+        DynamicViscosityUnits.Centipoise: lambda value: ((value / 10) * 0.01),
         
-        if from_unit == DynamicViscosityUnits.PoundForceSecondPerSquareInch:
-            return (value / 6.8947572931683613e3)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        DynamicViscosityUnits.NewtonSecondPerMeterSquared: ('1', '0'),
+        
+        DynamicViscosityUnits.PascalSecond: ('1', '0'),
+        
+        DynamicViscosityUnits.Poise: ('10', '0'),
+        
+        DynamicViscosityUnits.Reyn: ('10000000000000/68947572931683613', '0'),
         
-        if from_unit == DynamicViscosityUnits.PoundForceSecondPerSquareFoot:
-            return (value / 4.7880258980335843e1)
+        DynamicViscosityUnits.PoundForceSecondPerSquareInch: ('10000000000000/68947572931683613', '0'),
         
-        if from_unit == DynamicViscosityUnits.PoundPerFootSecond:
-            return (value / 1.4881639)
+        DynamicViscosityUnits.PoundForceSecondPerSquareFoot: ('1000000000000000/47880258980335843', '0'),
         
-        if from_unit == DynamicViscosityUnits.MillipascalSecond:
-            return ((value) / 0.001)
+        DynamicViscosityUnits.PoundPerFootSecond: ('10000000/14881639', '0'),
         
-        if from_unit == DynamicViscosityUnits.MicropascalSecond:
-            return ((value) / 1e-06)
+        DynamicViscosityUnits.MillipascalSecond: ('1000', '0'),
         
-        if from_unit == DynamicViscosityUnits.Centipoise:
-            return ((value * 10) / 0.01)
+        DynamicViscosityUnits.MicropascalSecond: ('1000000', '0'),
         
-        return None
+        DynamicViscosityUnits.Centipoise: ('1000', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        DynamicViscosityUnits.NewtonSecondPerMeterSquared: ('1', '0'),
+        
+        DynamicViscosityUnits.PascalSecond: ('1', '0'),
+        
+        DynamicViscosityUnits.Poise: ('1/10', '0'),
+        
+        DynamicViscosityUnits.Reyn: ('68947572931683613/10000000000000', '0'),
+        
+        DynamicViscosityUnits.PoundForceSecondPerSquareInch: ('68947572931683613/10000000000000', '0'),
+        
+        DynamicViscosityUnits.PoundForceSecondPerSquareFoot: ('47880258980335843/1000000000000000', '0'),
+        
+        DynamicViscosityUnits.PoundPerFootSecond: ('14881639/10000000', '0'),
+        
+        DynamicViscosityUnits.MillipascalSecond: ('1/1000', '0'),
+        
+        DynamicViscosityUnits.MicropascalSecond: ('1/1000000', '0'),
+        
+        DynamicViscosityUnits.Centipoise: ('1/1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: DynamicViscosityUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == DynamicViscosityUnits.NewtonSecondPerMeterSquared:
-            return (value)
+        DynamicViscosityUnits.NewtonSecondPerMeterSquared: ('Ns/m²',),
         
-        if to_unit == DynamicViscosityUnits.PascalSecond:
-            return (value)
+        DynamicViscosityUnits.PascalSecond: ('Pa·s',),
         
-        if to_unit == DynamicViscosityUnits.Poise:
-            return (value / 10)
+        DynamicViscosityUnits.Poise: ('P',),
         
-        if to_unit == DynamicViscosityUnits.Reyn:
-            return (value * 6.8947572931683613e3)
+        DynamicViscosityUnits.Reyn: ('reyn',),
         
-        if to_unit == DynamicViscosityUnits.PoundForceSecondPerSquareInch:
-            return (value * 6.8947572931683613e3)
+        DynamicViscosityUnits.PoundForceSecondPerSquareInch: ('lbf·s/in²',),
         
-        if to_unit == DynamicViscosityUnits.PoundForceSecondPerSquareFoot:
-            return (value * 4.7880258980335843e1)
+        DynamicViscosityUnits.PoundForceSecondPerSquareFoot: ('lbf·s/ft²',),
         
-        if to_unit == DynamicViscosityUnits.PoundPerFootSecond:
-            return (value * 1.4881639)
+        DynamicViscosityUnits.PoundPerFootSecond: ('lb/ft·s',),
         
-        if to_unit == DynamicViscosityUnits.MillipascalSecond:
-            return ((value) * 0.001)
+        DynamicViscosityUnits.MillipascalSecond: ('mPa·s',),
         
-        if to_unit == DynamicViscosityUnits.MicropascalSecond:
-            return ((value) * 1e-06)
+        DynamicViscosityUnits.MicropascalSecond: ('μPa·s',),
         
-        if to_unit == DynamicViscosityUnits.Centipoise:
-            return ((value / 10) * 0.01)
+        DynamicViscosityUnits.Centipoise: ('cP',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: DynamicViscosityUnits = DynamicViscosityUnits.NewtonSecondPerMeterSquared):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: DynamicViscosityUnits) -> float:
+        return self.__convert_from_base(unit)
 
+    def __convert_from_base(self, from_unit: DynamicViscosityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: DynamicViscosityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: DynamicViscosityUnits, to_unit: DynamicViscosityUnits) -> float:
+        """
+        Convert a value from one DynamicViscosity unit to another, without creating a DynamicViscosity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: DynamicViscosityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: DynamicViscosityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return DynamicViscosity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: DynamicViscosityUnits, to_unit: DynamicViscosityUnits) -> List[float]:
+        """
+        Convert many values from one DynamicViscosity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: DynamicViscosityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: DynamicViscosityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return DynamicViscosity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: DynamicViscosityUnits, to_unit: DynamicViscosityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", DynamicViscosity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: DynamicViscosityUnits, to_unit: DynamicViscosityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one DynamicViscosity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: DynamicViscosityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: DynamicViscosityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return DynamicViscosity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: DynamicViscosityUnits = DynamicViscosityUnits.NewtonSecondPerMeterSquared) -> DynamicViscosity:
+        """
+        Create a new instance of DynamicViscosity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: DynamicViscosityUnits
+        :return: A new instance of DynamicViscosity.
+        :rtype: DynamicViscosity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return DynamicViscosity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: DynamicViscosityUnits = DynamicViscosityUnits.NewtonSecondPerMeterSquared) -> Fraction:
+        """
+        Get the exact value of the DynamicViscosity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (NewtonSecondPerMeterSquared).
+        :type unit: DynamicViscosityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> DynamicViscosity:
+        """
+        Parse a DynamicViscosity from a value followed by a unit abbreviation, e.g. "1 Ns/m²".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of DynamicViscosity.
+        :rtype: DynamicViscosity
+        :raises ValueError: When the string is not a valid or an ambiguous DynamicViscosity.
+        """
+        return DynamicViscosity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[DynamicViscosity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return DynamicViscosity._try_parse(text)
+
+    def to_binary(self, unit: Optional[DynamicViscosityUnits] = None) -> bytes:
+        """
+        Encode the DynamicViscosity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: DynamicViscosityUnits
+        :return: The encoded DynamicViscosity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> DynamicViscosity:
+        """
+        Decode a DynamicViscosity encoded by to_binary.
+
+        :param data: The encoded DynamicViscosity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of DynamicViscosity.
+        :rtype: DynamicViscosity
+        :raises ValueError: When the data is not a valid encoded DynamicViscosity.
+        """
+        return DynamicViscosity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[DynamicViscosityUnits] = None) -> dict:
+        """
+        Get the DynamicViscosity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (NewtonSecondPerMeterSquared).
+        :type hold_in_unit: DynamicViscosityUnits
+        :return: The DynamicViscosity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[DynamicViscosityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> DynamicViscosity:
+        """
+        Create a new instance of DynamicViscosity from its DTO.
+
+        :param dto: The DynamicViscosity DTO, the unit is the DynamicViscosityUnits value or name.
+        :type dto: dict
+        :return: A new instance of DynamicViscosity.
+        :rtype: DynamicViscosity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return DynamicViscosity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> DynamicViscosity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return DynamicViscosity._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -329,10 +587,7 @@ class DynamicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__newton_seconds_per_meter_squared != None:
-            return self.__newton_seconds_per_meter_squared
-        self.__newton_seconds_per_meter_squared = self.__convert_from_base(DynamicViscosityUnits.NewtonSecondPerMeterSquared)
-        return self.__newton_seconds_per_meter_squared
+        return self._cached_convert(DynamicViscosityUnits.NewtonSecondPerMeterSquared)
 
     
     @property
@@ -340,10 +595,7 @@ class DynamicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__pascal_seconds != None:
-            return self.__pascal_seconds
-        self.__pascal_seconds = self.__convert_from_base(DynamicViscosityUnits.PascalSecond)
-        return self.__pascal_seconds
+        return self._cached_convert(DynamicViscosityUnits.PascalSecond)
 
     
     @property
@@ -351,10 +603,7 @@ class DynamicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__poise != None:
-            return self.__poise
-        self.__poise = self.__convert_from_base(DynamicViscosityUnits.Poise)
-        return self.__poise
+        return self._cached_convert(DynamicViscosityUnits.Poise)
 
     
     @property
@@ -362,10 +611,7 @@ class DynamicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__reyns != None:
-            return self.__reyns
-        self.__reyns = self.__convert_from_base(DynamicViscosityUnits.Reyn)
-        return self.__reyns
+        return self._cached_convert(DynamicViscosityUnits.Reyn)
 
     
     @property
@@ -373,10 +619,7 @@ class DynamicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_second_per_square_inch != None:
-            return self.__pounds_force_second_per_square_inch
-        self.__pounds_force_second_per_square_inch = self.__convert_from_base(DynamicViscosityUnits.PoundForceSecondPerSquareInch)
-        return self.__pounds_force_second_per_square_inch
+        return self._cached_convert(DynamicViscosityUnits.PoundForceSecondPerSquareInch)
 
     
     @property
@@ -384,10 +627,7 @@ class DynamicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_second_per_square_foot != None:
-            return self.__pounds_force_second_per_square_foot
-        self.__pounds_force_second_per_square_foot = self.__convert_from_base(DynamicViscosityUnits.PoundForceSecondPerSquareFoot)
-        return self.__pounds_force_second_per_square_foot
+        return self._cached_convert(DynamicViscosityUnits.PoundForceSecondPerSquareFoot)
 
     
     @property
@@ -395,10 +635,7 @@ class DynamicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_foot_second != None:
-            return self.__pounds_per_foot_second
-        self.__pounds_per_foot_second = self.__convert_from_base(DynamicViscosityUnits.PoundPerFootSecond)
-        return self.__pounds_per_foot_second
+        return self._cached_convert(DynamicViscosityUnits.PoundPerFootSecond)
 
     
     @property
@@ -406,10 +643,7 @@ class DynamicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__millipascal_seconds != None:
-            return self.__millipascal_seconds
-        self.__millipascal_seconds = self.__convert_from_base(DynamicViscosityUnits.MillipascalSecond)
-        return self.__millipascal_seconds
+        return self._cached_convert(DynamicViscosityUnits.MillipascalSecond)
 
     
     @property
@@ -417,10 +651,7 @@ class DynamicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__micropascal_seconds != None:
-            return self.__micropascal_seconds
-        self.__micropascal_seconds = self.__convert_from_base(DynamicViscosityUnits.MicropascalSecond)
-        return self.__micropascal_seconds
+        return self._cached_convert(DynamicViscosityUnits.MicropascalSecond)
 
     
     @property
@@ -428,10 +659,7 @@ class DynamicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__centipoise != None:
-            return self.__centipoise
-        self.__centipoise = self.__convert_from_base(DynamicViscosityUnits.Centipoise)
-        return self.__centipoise
+        return self._cached_convert(DynamicViscosityUnits.Centipoise)
 
     
     def to_string(self, unit: DynamicViscosityUnits = DynamicViscosityUnits.NewtonSecondPerMeterSquared) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricAdmittanceUnits(Enum):
         """
             ElectricAdmittanceUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Siemens = 'siemens'
         """
@@ -39,57 +50,280 @@ class ElectricAdmittance(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricAdmittanceUnits): The ElectricAdmittance unit to create from, The default unit is Siemens
     """
-    def __init__(self, value: float, from_unit: ElectricAdmittanceUnits = ElectricAdmittanceUnits.Siemens):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricAdmittanceUnits
+
+    _base_unit = ElectricAdmittanceUnits.Siemens
+
+    _dimensions = (-2, -1, 3, 2, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 18
+
+    _binary_unit_ids = {
         
-        self.__siemens = None
+        ElectricAdmittanceUnits.Siemens: 0,
         
-        self.__nanosiemens = None
+        ElectricAdmittanceUnits.Nanosiemens: 1,
         
-        self.__microsiemens = None
+        ElectricAdmittanceUnits.Microsiemens: 2,
         
-        self.__millisiemens = None
+        ElectricAdmittanceUnits.Millisiemens: 3,
         
+    }
 
-    def convert(self, unit: ElectricAdmittanceUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricAdmittanceUnits.Siemens: lambda value: (value),
+        
+        ElectricAdmittanceUnits.Nanosiemens: lambda value: ((value) / 1e-09),
+        
+        ElectricAdmittanceUnits.Microsiemens: lambda value: ((value) / 1e-06),
+        
+        ElectricAdmittanceUnits.Millisiemens: lambda value: ((value) / 0.001),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricAdmittanceUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ElectricAdmittanceUnits.Siemens:
-            return (value)
+        ElectricAdmittanceUnits.Siemens: lambda value: (value),
         
-        if from_unit == ElectricAdmittanceUnits.Nanosiemens:
-            return ((value) / 1e-09)
+        ElectricAdmittanceUnits.Nanosiemens: lambda value: ((value) * 1e-09),
         
-        if from_unit == ElectricAdmittanceUnits.Microsiemens:
-            return ((value) / 1e-06)
+        ElectricAdmittanceUnits.Microsiemens: lambda value: ((value) * 1e-06),
         
-        if from_unit == ElectricAdmittanceUnits.Millisiemens:
-            return ((value) / 0.001)
+        ElectricAdmittanceUnits.Millisiemens: lambda value: ((value) * 0.001),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ElectricAdmittanceUnits.Siemens: ('1', '0'),
+        
+        ElectricAdmittanceUnits.Nanosiemens: ('1000000000', '0'),
+        
+        ElectricAdmittanceUnits.Microsiemens: ('1000000', '0'),
+        
+        ElectricAdmittanceUnits.Millisiemens: ('1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricAdmittanceUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == ElectricAdmittanceUnits.Siemens:
-            return (value)
+        ElectricAdmittanceUnits.Siemens: ('1', '0'),
         
-        if to_unit == ElectricAdmittanceUnits.Nanosiemens:
-            return ((value) * 1e-09)
+        ElectricAdmittanceUnits.Nanosiemens: ('1/1000000000', '0'),
         
-        if to_unit == ElectricAdmittanceUnits.Microsiemens:
-            return ((value) * 1e-06)
+        ElectricAdmittanceUnits.Microsiemens: ('1/1000000', '0'),
         
-        if to_unit == ElectricAdmittanceUnits.Millisiemens:
-            return ((value) * 0.001)
+        ElectricAdmittanceUnits.Millisiemens: ('1/1000', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        ElectricAdmittanceUnits.Siemens: ('S',),
+        
+        ElectricAdmittanceUnits.Nanosiemens: ('nS',),
+        
+        ElectricAdmittanceUnits.Microsiemens: ('μS',),
+        
+        ElectricAdmittanceUnits.Millisiemens: ('mS',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ElectricAdmittanceUnits = ElectricAdmittanceUnits.Siemens):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricAdmittanceUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricAdmittanceUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ElectricAdmittanceUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricAdmittanceUnits, to_unit: ElectricAdmittanceUnits) -> float:
+        """
+        Convert a value from one ElectricAdmittance unit to another, without creating a ElectricAdmittance instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricAdmittanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricAdmittanceUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricAdmittance._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricAdmittanceUnits, to_unit: ElectricAdmittanceUnits) -> List[float]:
+        """
+        Convert many values from one ElectricAdmittance unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricAdmittanceUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricAdmittanceUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricAdmittance._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricAdmittanceUnits, to_unit: ElectricAdmittanceUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricAdmittance._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricAdmittanceUnits, to_unit: ElectricAdmittanceUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricAdmittance unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricAdmittanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricAdmittanceUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricAdmittance._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricAdmittanceUnits = ElectricAdmittanceUnits.Siemens) -> ElectricAdmittance:
+        """
+        Create a new instance of ElectricAdmittance holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricAdmittanceUnits
+        :return: A new instance of ElectricAdmittance.
+        :rtype: ElectricAdmittance
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricAdmittance._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricAdmittanceUnits = ElectricAdmittanceUnits.Siemens) -> Fraction:
+        """
+        Get the exact value of the ElectricAdmittance in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Siemens).
+        :type unit: ElectricAdmittanceUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricAdmittance:
+        """
+        Parse a ElectricAdmittance from a value followed by a unit abbreviation, e.g. "1 S".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricAdmittance.
+        :rtype: ElectricAdmittance
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricAdmittance.
+        """
+        return ElectricAdmittance._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricAdmittance]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricAdmittance._try_parse(text)
+
+    def to_binary(self, unit: Optional[ElectricAdmittanceUnits] = None) -> bytes:
+        """
+        Encode the ElectricAdmittance to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricAdmittanceUnits
+        :return: The encoded ElectricAdmittance.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricAdmittance:
+        """
+        Decode a ElectricAdmittance encoded by to_binary.
+
+        :param data: The encoded ElectricAdmittance, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricAdmittance.
+        :rtype: ElectricAdmittance
+        :raises ValueError: When the data is not a valid encoded ElectricAdmittance.
+        """
+        return ElectricAdmittance._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricAdmittanceUnits] = None) -> dict:
+        """
+        Get the ElectricAdmittance DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Siemens).
+        :type hold_in_unit: ElectricAdmittanceUnits
+        :return: The ElectricAdmittance DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricAdmittanceUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricAdmittance:
+        """
+        Create a new instance of ElectricAdmittance from its DTO.
+
+        :param dto: The ElectricAdmittance DTO, the unit is the ElectricAdmittanceUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricAdmittance.
+        :rtype: ElectricAdmittance
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricAdmittance._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricAdmittance:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricAdmittance._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -161,10 +395,7 @@ class ElectricAdmittance(AbstractMeasure):
         """
         
         """
-        if self.__siemens != None:
-            return self.__siemens
-        self.__siemens = self.__convert_from_base(ElectricAdmittanceUnits.Siemens)
-        return self.__siemens
+        return self._cached_convert(ElectricAdmittanceUnits.Siemens)
 
     
     @property
@@ -172,10 +403,7 @@ class ElectricAdmittance(AbstractMeasure):
         """
         
         """
-        if self.__nanosiemens != None:
-            return self.__nanosiemens
-        self.__nanosiemens = self.__convert_from_base(ElectricAdmittanceUnits.Nanosiemens)
-        return self.__nanosiemens
+        return self._cached_convert(ElectricAdmittanceUnits.Nanosiemens)
 
     
     @property
@@ -183,10 +411,7 @@ class ElectricAdmittance(AbstractMeasure):
         """
         
         """
-        if self.__microsiemens != None:
-            return self.__microsiemens
-        self.__microsiemens = self.__convert_from_base(ElectricAdmittanceUnits.Microsiemens)
-        return self.__microsiemens
+        return self._cached_convert(ElectricAdmittanceUnits.Microsiemens)
 
     
     @property
@@ -194,10 +419,7 @@ class ElectricAdmittance(AbstractMeasure):
         """
         
         """
-        if self.__millisiemens != None:
-            return self.__millisiemens
-        self.__millisiemens = self.__convert_from_base(ElectricAdmittanceUnits.Millisiemens)
-        return self.__millisiemens
+        return self._cached_convert(ElectricAdmittanceUnits.Millisiemens)
 
     
     def to_string(self, unit: ElectricAdmittanceUnits = ElectricAdmittanceUnits.Siemens) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricChargeUnits(Enum):
         """
             ElectricChargeUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Coulomb = 'coulomb'
         """
@@ -74,113 +85,364 @@ class ElectricCharge(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricChargeUnits): The ElectricCharge unit to create from, The default unit is Coulomb
     """
-    def __init__(self, value: float, from_unit: ElectricChargeUnits = ElectricChargeUnits.Coulomb):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricChargeUnits
+
+    _base_unit = ElectricChargeUnits.Coulomb
+
+    _dimensions = (0, 0, 1, 1, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 19
+
+    _binary_unit_ids = {
         
-        self.__coulombs = None
+        ElectricChargeUnits.Coulomb: 0,
         
-        self.__ampere_hours = None
+        ElectricChargeUnits.AmpereHour: 1,
         
-        self.__picocoulombs = None
+        ElectricChargeUnits.Picocoulomb: 2,
         
-        self.__nanocoulombs = None
+        ElectricChargeUnits.Nanocoulomb: 3,
         
-        self.__microcoulombs = None
+        ElectricChargeUnits.Microcoulomb: 4,
         
-        self.__millicoulombs = None
+        ElectricChargeUnits.Millicoulomb: 5,
         
-        self.__kilocoulombs = None
+        ElectricChargeUnits.Kilocoulomb: 6,
         
-        self.__megacoulombs = None
+        ElectricChargeUnits.Megacoulomb: 7,
         
-        self.__milliampere_hours = None
+        ElectricChargeUnits.MilliampereHour: 8,
         
-        self.__kiloampere_hours = None
+        ElectricChargeUnits.KiloampereHour: 9,
         
-        self.__megaampere_hours = None
+        ElectricChargeUnits.MegaampereHour: 10,
         
+    }
 
-    def convert(self, unit: ElectricChargeUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricChargeUnits.Coulomb: lambda value: (value),
+        
+        ElectricChargeUnits.AmpereHour: lambda value: (value * 2.77777777777e-4),
+        
+        ElectricChargeUnits.Picocoulomb: lambda value: ((value) / 1e-12),
+        
+        ElectricChargeUnits.Nanocoulomb: lambda value: ((value) / 1e-09),
+        
+        ElectricChargeUnits.Microcoulomb: lambda value: ((value) / 1e-06),
+        
+        ElectricChargeUnits.Millicoulomb: lambda value: ((value) / 0.001),
+        
+        ElectricChargeUnits.Kilocoulomb: lambda value: ((value) / 1000.0),
+        
+        ElectricChargeUnits.Megacoulomb: lambda value: ((value) / 1000000.0),
+        
+        ElectricChargeUnits.MilliampereHour: lambda value: ((value * 2.77777777777e-4) / 0.001),
+        
+        ElectricChargeUnits.KiloampereHour: lambda value: ((value * 2.77777777777e-4) / 1000.0),
+        
+        ElectricChargeUnits.MegaampereHour: lambda value: ((value * 2.77777777777e-4) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricChargeUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ElectricChargeUnits.Coulomb:
-            return (value)
+        ElectricChargeUnits.Coulomb: lambda value: (value),
         
-        if from_unit == ElectricChargeUnits.AmpereHour:
-            return (value * 2.77777777777e-4)
+        ElectricChargeUnits.AmpereHour: lambda value: (value / 2.77777777777e-4),
         
-        if from_unit == ElectricChargeUnits.Picocoulomb:
-            return ((value) / 1e-12)
+        ElectricChargeUnits.Picocoulomb: lambda value: ((value) * 1e-12),
         
-        if from_unit == ElectricChargeUnits.Nanocoulomb:
-            return ((value) / 1e-09)
+        ElectricChargeUnits.Nanocoulomb: lambda value: ((value) * 1e-09),
         
-        if from_unit == ElectricChargeUnits.Microcoulomb:
-            return ((value) / 1e-06)
+        ElectricChargeUnits.Microcoulomb: lambda value: ((value) * 1e-06),
         
-        if from_unit == ElectricChargeUnits.Millicoulomb:
-            return ((value) / 0.001)
+        ElectricChargeUnits.Millicoulomb: lambda value: ((value) * 0.001),
         
-        if from_unit == ElectricChargeUnits.Kilocoulomb:
-            return ((value) / 1000.0)
+        ElectricChargeUnits.Kilocoulomb: lambda value: ((value) * 1000.0),
         
-        if from_unit == ElectricChargeUnits.Megacoulomb:
-            return ((value) / 1000000.0)
+        ElectricChargeUnits.Megacoulomb: lambda value: ((value) * 1000000.0),
         
-        if from_unit == ElectricChargeUnits.MilliampereHour:
-            return ((value * 2.77777777777e-4) / 0.001)
+        ElectricChargeUnits.MilliampereHour: lambda value: ((value / 2.77777777777e-4) * 0.001),
         
-        if from_unit == ElectricChargeUnits.KiloampereHour:
-            return ((value * 2.77777777777e-4) / 1000.0)
+        ElectricChargeUnits.KiloampereHour: lambda value: ((value / 2.77777777777e-4) * 1000.0),
         
-        if from_unit == ElectricChargeUnits.MegaampereHour:
-            return ((value * 2.77777777777e-4) / 1000000.0)
+        ElectricChargeUnits.MegaampereHour: lambda value: ((value / 2.77777777777e-4) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ElectricChargeUnits.Coulomb: ('1', '0'),
+        
+        ElectricChargeUnits.AmpereHour: ('277777777777/1000000000000000', '0'),
+        
+        ElectricChargeUnits.Picocoulomb: ('1000000000000', '0'),
+        
+        ElectricChargeUnits.Nanocoulomb: ('1000000000', '0'),
+        
+        ElectricChargeUnits.Microcoulomb: ('1000000', '0'),
+        
+        ElectricChargeUnits.Millicoulomb: ('1000', '0'),
+        
+        ElectricChargeUnits.Kilocoulomb: ('1/1000', '0'),
+        
+        ElectricChargeUnits.Megacoulomb: ('1/1000000', '0'),
+        
+        ElectricChargeUnits.MilliampereHour: ('277777777777/1000000000000', '0'),
+        
+        ElectricChargeUnits.KiloampereHour: ('277777777777/1000000000000000000', '0'),
+        
+        ElectricChargeUnits.MegaampereHour: ('277777777777/1000000000000000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricChargeUnits) -> float:
+    _affine_to_base = {
+        
+        ElectricChargeUnits.Coulomb: ('1', '0'),
+        
+        ElectricChargeUnits.AmpereHour: ('1000000000000000/277777777777', '0'),
+        
+        ElectricChargeUnits.Picocoulomb: ('1/1000000000000', '0'),
+        
+        ElectricChargeUnits.Nanocoulomb: ('1/1000000000', '0'),
+        
+        ElectricChargeUnits.Microcoulomb: ('1/1000000', '0'),
+        
+        ElectricChargeUnits.Millicoulomb: ('1/1000', '0'),
+        
+        ElectricChargeUnits.Kilocoulomb: ('1000', '0'),
+        
+        ElectricChargeUnits.Megacoulomb: ('1000000', '0'),
+        
+        ElectricChargeUnits.MilliampereHour: ('1000000000000/277777777777', '0'),
+        
+        ElectricChargeUnits.KiloampereHour: ('1000000000000000000/277777777777', '0'),
         
-        if to_unit == ElectricChargeUnits.Coulomb:
-            return (value)
+        ElectricChargeUnits.MegaampereHour: ('1000000000000000000000/277777777777', '0'),
         
-        if to_unit == ElectricChargeUnits.AmpereHour:
-            return (value / 2.77777777777e-4)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        ElectricChargeUnits.Coulomb: ('C',),
+        
+        ElectricChargeUnits.AmpereHour: ('A-h',),
         
-        if to_unit == ElectricChargeUnits.Picocoulomb:
-            return ((value) * 1e-12)
+        ElectricChargeUnits.Picocoulomb: ('pC',),
         
-        if to_unit == ElectricChargeUnits.Nanocoulomb:
-            return ((value) * 1e-09)
+        ElectricChargeUnits.Nanocoulomb: ('nC',),
         
-        if to_unit == ElectricChargeUnits.Microcoulomb:
-            return ((value) * 1e-06)
+        ElectricChargeUnits.Microcoulomb: ('μC',),
         
-        if to_unit == ElectricChargeUnits.Millicoulomb:
-            return ((value) * 0.001)
+        ElectricChargeUnits.Millicoulomb: ('mC',),
         
-        if to_unit == ElectricChargeUnits.Kilocoulomb:
-            return ((value) * 1000.0)
+        ElectricChargeUnits.Kilocoulomb: ('kC',),
         
-        if to_unit == ElectricChargeUnits.Megacoulomb:
-            return ((value) * 1000000.0)
+        ElectricChargeUnits.Megacoulomb: ('MC',),
         
-        if to_unit == ElectricChargeUnits.MilliampereHour:
-            return ((value / 2.77777777777e-4) * 0.001)
+        ElectricChargeUnits.MilliampereHour: ('mA-h',),
         
-        if to_unit == ElectricChargeUnits.KiloampereHour:
-            return ((value / 2.77777777777e-4) * 1000.0)
+        ElectricChargeUnits.KiloampereHour: ('kA-h',),
         
-        if to_unit == ElectricChargeUnits.MegaampereHour:
-            return ((value / 2.77777777777e-4) * 1000000.0)
+        ElectricChargeUnits.MegaampereHour: ('MA-h',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: ElectricChargeUnits = ElectricChargeUnits.Coulomb):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricChargeUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricChargeUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ElectricChargeUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
 
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricChargeUnits, to_unit: ElectricChargeUnits) -> float:
+        """
+        Convert a value from one ElectricCharge unit to another, without creating a ElectricCharge instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricChargeUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricChargeUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricCharge._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricChargeUnits, to_unit: ElectricChargeUnits) -> List[float]:
+        """
+        Convert many values from one ElectricCharge unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricChargeUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricChargeUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricCharge._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricChargeUnits, to_unit: ElectricChargeUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricCharge._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricChargeUnits, to_unit: ElectricChargeUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricCharge unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricChargeUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricChargeUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricCharge._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricChargeUnits = ElectricChargeUnits.Coulomb) -> ElectricCharge:
+        """
+        Create a new instance of ElectricCharge holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricChargeUnits
+        :return: A new instance of ElectricCharge.
+        :rtype: ElectricCharge
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricCharge._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricChargeUnits = ElectricChargeUnits.Coulomb) -> Fraction:
+        """
+        Get the exact value of the ElectricCharge in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Coulomb).
+        :type unit: ElectricChargeUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricCharge:
+        """
+        Parse a ElectricCharge from a value followed by a unit abbreviation, e.g. "1 C".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricCharge.
+        :rtype: ElectricCharge
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricCharge.
+        """
+        return ElectricCharge._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricCharge]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricCharge._try_parse(text)
+
+    def to_binary(self, unit: Optional[ElectricChargeUnits] = None) -> bytes:
+        """
+        Encode the ElectricCharge to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricChargeUnits
+        :return: The encoded ElectricCharge.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricCharge:
+        """
+        Decode a ElectricCharge encoded by to_binary.
+
+        :param data: The encoded ElectricCharge, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricCharge.
+        :rtype: ElectricCharge
+        :raises ValueError: When the data is not a valid encoded ElectricCharge.
+        """
+        return ElectricCharge._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricChargeUnits] = None) -> dict:
+        """
+        Get the ElectricCharge DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Coulomb).
+        :type hold_in_unit: ElectricChargeUnits
+        :return: The ElectricCharge DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricChargeUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricCharge:
+        """
+        Create a new instance of ElectricCharge from its DTO.
+
+        :param dto: The ElectricCharge DTO, the unit is the ElectricChargeUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricCharge.
+        :rtype: ElectricCharge
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricCharge._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricCharge:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricCharge._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -357,10 +619,7 @@ class ElectricCharge(AbstractMeasure):
         """
         
         """
-        if self.__coulombs != None:
-            return self.__coulombs
-        self.__coulombs = self.__convert_from_base(ElectricChargeUnits.Coulomb)
-        return self.__coulombs
+        return self._cached_convert(ElectricChargeUnits.Coulomb)
 
     
     @property
@@ -368,10 +627,7 @@ class ElectricCharge(AbstractMeasure):
         """
         
         """
-        if self.__ampere_hours != None:
-            return self.__ampere_hours
-        self.__ampere_hours = self.__convert_from_base(ElectricChargeUnits.AmpereHour)
-        return self.__ampere_hours
+        return self._cached_convert(ElectricChargeUnits.AmpereHour)
 
     
     @property
@@ -379,10 +635,7 @@ class ElectricCharge(AbstractMeasure):
         """
         
         """
-        if self.__picocoulombs != None:
-            return self.__picocoulombs
-        self.__picocoulombs = self.__convert_from_base(ElectricChargeUnits.Picocoulomb)
-        return self.__picocoulombs
+        return self._cached_convert(ElectricChargeUnits.Picocoulomb)
 
     
     @property
@@ -390,10 +643,7 @@ class ElectricCharge(AbstractMeasure):
         """
         
         """
-        if self.__nanocoulombs != None:
-            return self.__nanocoulombs
-        self.__nanocoulombs = self.__convert_from_base(ElectricChargeUnits.Nanocoulomb)
-        return self.__nanocoulombs
+        return self._cached_convert(ElectricChargeUnits.Nanocoulomb)
 
     
     @property
@@ -401,10 +651,7 @@ class ElectricCharge(AbstractMeasure):
         """
         
         """
-        if self.__microcoulombs != None:
-            return self.__microcoulombs
-        self.__microcoulombs = self.__convert_from_base(ElectricChargeUnits.Microcoulomb)
-        return self.__microcoulombs
+        return self._cached_convert(ElectricChargeUnits.Microcoulomb)
 
     
     @property
@@ -412,10 +659,7 @@ class ElectricCharge(AbstractMeasure):
         """
         
         """
-        if self.__millicoulombs != None:
-            return self.__millicoulombs
-        self.__millicoulombs = self.__convert_from_base(ElectricChargeUnits.Millicoulomb)
-        return self.__millicoulombs
+        return self._cached_convert(ElectricChargeUnits.Millicoulomb)
 
     
     @property
@@ -423,10 +667,7 @@ class ElectricCharge(AbstractMeasure):
         """
         
         """
-        if self.__kilocoulombs != None:
-            return self.__kilocoulombs
-        self.__kilocoulombs = self.__convert_from_base(ElectricChargeUnits.Kilocoulomb)
-        return self.__kilocoulombs
+        return self._cached_convert(ElectricChargeUnits.Kilocoulomb)
 
     
     @property
@@ -434,10 +675,7 @@ class ElectricCharge(AbstractMeasure):
         """
         
         """
-        if self.__megacoulombs != None:
-            return self.__megacoulombs
-        self.__megacoulombs = self.__convert_from_base(ElectricChargeUnits.Megacoulomb)
-        return self.__megacoulombs
+        return self._cached_convert(ElectricChargeUnits.Megacoulomb)
 
     
     @property
@@ -445,10 +683,7 @@ class ElectricCharge(AbstractMeasure):
         """
         
         """
-        if self.__milliampere_hours != None:
-            return self.__milliampere_hours
-        self.__milliampere_hours = self.__convert_from_base(ElectricChargeUnits.MilliampereHour)
-        return self.__milliampere_hours
+        return self._cached_convert(ElectricChargeUnits.MilliampereHour)
 
     
     @property
@@ -456,10 +691,7 @@ class ElectricCharge(AbstractMeasure):
         """
         
         """
-        if self.__kiloampere_hours != None:
-            return self.__kiloampere_hours
-        self.__kiloampere_hours = self.__convert_from_base(ElectricChargeUnits.KiloampereHour)
-        return self.__kiloampere_hours
+        return self._cached_convert(ElectricChargeUnits.KiloampereHour)
 
     
     @property
@@ -467,10 +699,7 @@ class ElectricCharge(AbstractMeasure):
         """
         
         """
-        if self.__megaampere_hours != None:
-            return self.__megaampere_hours
-        self.__megaampere_hours = self.__convert_from_base(ElectricChargeUnits.MegaampereHour)
-        return self.__megaampere_hours
+        return self._cached_convert(ElectricChargeUnits.MegaampereHour)
 
     
     def to_string(self, unit: ElectricChargeUnits = ElectricChargeUnits.Coulomb) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricConductanceUnits(Enum):
         """
             ElectricConductanceUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Siemens = 'siemens'
         """
@@ -44,65 +55,292 @@ class ElectricConductance(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricConductanceUnits): The ElectricConductance unit to create from, The default unit is Siemens
     """
-    def __init__(self, value: float, from_unit: ElectricConductanceUnits = ElectricConductanceUnits.Siemens):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricConductanceUnits
+
+    _base_unit = ElectricConductanceUnits.Siemens
+
+    _dimensions = (-2, -1, 3, 2, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 21
+
+    _binary_unit_ids = {
         
-        self.__siemens = None
+        ElectricConductanceUnits.Siemens: 0,
         
-        self.__nanosiemens = None
+        ElectricConductanceUnits.Nanosiemens: 1,
         
-        self.__microsiemens = None
+        ElectricConductanceUnits.Microsiemens: 2,
         
-        self.__millisiemens = None
+        ElectricConductanceUnits.Millisiemens: 3,
         
-        self.__kilosiemens = None
+        ElectricConductanceUnits.Kilosiemens: 4,
         
+    }
 
-    def convert(self, unit: ElectricConductanceUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricConductanceUnits.Siemens: lambda value: (value),
+        
+        ElectricConductanceUnits.Nanosiemens: lambda value: ((value) / 1e-09),
+        
+        ElectricConductanceUnits.Microsiemens: lambda value: ((value) / 1e-06),
+        
+        ElectricConductanceUnits.Millisiemens: lambda value: ((value) / 0.001),
+        
+        ElectricConductanceUnits.Kilosiemens: lambda value: ((value) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricConductanceUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ElectricConductanceUnits.Siemens:
-            return (value)
+        ElectricConductanceUnits.Siemens: lambda value: (value),
         
-        if from_unit == ElectricConductanceUnits.Nanosiemens:
-            return ((value) / 1e-09)
+        ElectricConductanceUnits.Nanosiemens: lambda value: ((value) * 1e-09),
         
-        if from_unit == ElectricConductanceUnits.Microsiemens:
-            return ((value) / 1e-06)
+        ElectricConductanceUnits.Microsiemens: lambda value: ((value) * 1e-06),
         
-        if from_unit == ElectricConductanceUnits.Millisiemens:
-            return ((value) / 0.001)
+        ElectricConductanceUnits.Millisiemens: lambda value: ((value) * 0.001),
         
-        if from_unit == ElectricConductanceUnits.Kilosiemens:
-            return ((value) / 1000.0)
+        ElectricConductanceUnits.Kilosiemens: lambda value: ((value) * 1000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ElectricConductanceUnits.Siemens: ('1', '0'),
+        
+        ElectricConductanceUnits.Nanosiemens: ('1000000000', '0'),
+        
+        ElectricConductanceUnits.Microsiemens: ('1000000', '0'),
+        
+        ElectricConductanceUnits.Millisiemens: ('1000', '0'),
+        
+        ElectricConductanceUnits.Kilosiemens: ('1/1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricConductanceUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == ElectricConductanceUnits.Siemens:
-            return (value)
+        ElectricConductanceUnits.Siemens: ('1', '0'),
         
-        if to_unit == ElectricConductanceUnits.Nanosiemens:
-            return ((value) * 1e-09)
+        ElectricConductanceUnits.Nanosiemens: ('1/1000000000', '0'),
         
-        if to_unit == ElectricConductanceUnits.Microsiemens:
-            return ((value) * 1e-06)
+        ElectricConductanceUnits.Microsiemens: ('1/1000000', '0'),
         
-        if to_unit == ElectricConductanceUnits.Millisiemens:
-            return ((value) * 0.001)
+        ElectricConductanceUnits.Millisiemens: ('1/1000', '0'),
         
-        if to_unit == ElectricConductanceUnits.Kilosiemens:
-            return ((value) * 1000.0)
+        ElectricConductanceUnits.Kilosiemens: ('1000', '0'),
         
-        return None
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        ElectricConductanceUnits.Siemens: ('S',),
+        
+        ElectricConductanceUnits.Nanosiemens: ('nS',),
+        
+        ElectricConductanceUnits.Microsiemens: ('μS',),
+        
+        ElectricConductanceUnits.Millisiemens: ('mS',),
+        
+        ElectricConductanceUnits.Kilosiemens: ('kS',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ElectricConductanceUnits = ElectricConductanceUnits.Siemens):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricConductanceUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricConductanceUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ElectricConductanceUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricConductanceUnits, to_unit: ElectricConductanceUnits) -> float:
+        """
+        Convert a value from one ElectricConductance unit to another, without creating a ElectricConductance instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricConductanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricConductanceUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricConductance._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricConductanceUnits, to_unit: ElectricConductanceUnits) -> List[float]:
+        """
+        Convert many values from one ElectricConductance unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricConductanceUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricConductanceUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricConductance._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricConductanceUnits, to_unit: ElectricConductanceUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricConductance._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricConductanceUnits, to_unit: ElectricConductanceUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricConductance unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricConductanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricConductanceUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricConductance._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricConductanceUnits = ElectricConductanceUnits.Siemens) -> ElectricConductance:
+        """
+        Create a new instance of ElectricConductance holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricConductanceUnits
+        :return: A new instance of ElectricConductance.
+        :rtype: ElectricConductance
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricConductance._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricConductanceUnits = ElectricConductanceUnits.Siemens) -> Fraction:
+        """
+        Get the exact value of the ElectricConductance in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Siemens).
+        :type unit: ElectricConductanceUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricConductance:
+        """
+        Parse a ElectricConductance from a value followed by a unit abbreviation, e.g. "1 S".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricConductance.
+        :rtype: ElectricConductance
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricConductance.
+        """
+        return ElectricConductance._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricConductance]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricConductance._try_parse(text)
+
+    def to_binary(self, unit: Optional[ElectricConductanceUnits] = None) -> bytes:
+        """
+        Encode the ElectricConductance to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricConductanceUnits
+        :return: The encoded ElectricConductance.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricConductance:
+        """
+        Decode a ElectricConductance encoded by to_binary.
+
+        :param data: The encoded ElectricConductance, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricConductance.
+        :rtype: ElectricConductance
+        :raises ValueError: When the data is not a valid encoded ElectricConductance.
+        """
+        return ElectricConductance._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricConductanceUnits] = None) -> dict:
+        """
+        Get the ElectricConductance DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
 
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Siemens).
+        :type hold_in_unit: ElectricConductanceUnits
+        :return: The ElectricConductance DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricConductanceUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricConductance:
+        """
+        Create a new instance of ElectricConductance from its DTO.
+
+        :param dto: The ElectricConductance DTO, the unit is the ElectricConductanceUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricConductance.
+        :rtype: ElectricConductance
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricConductance._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricConductance:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricConductance._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -189,10 +427,7 @@ class ElectricConductance(AbstractMeasure):
         """
         
         """
-        if self.__siemens != None:
-            return self.__siemens
-        self.__siemens = self.__convert_from_base(ElectricConductanceUnits.Siemens)
-        return self.__siemens
+        return self._cached_convert(ElectricConductanceUnits.Siemens)
 
     
     @property
@@ -200,10 +435,7 @@ class ElectricConductance(AbstractMeasure):
         """
         
         """
-        if self.__nanosiemens != None:
-            return self.__nanosiemens
-        self.__nanosiemens = self.__convert_from_base(ElectricConductanceUnits.Nanosiemens)
-        return self.__nanosiemens
+        return self._cached_convert(ElectricConductanceUnits.Nanosiemens)
 
     
     @property
@@ -211,10 +443,7 @@ class ElectricConductance(AbstractMeasure):
         """
         
         """
-        if self.__microsiemens != None:
-            return self.__microsiemens
-        self.__microsiemens = self.__convert_from_base(ElectricConductanceUnits.Microsiemens)
-        return self.__microsiemens
+        return self._cached_convert(ElectricConductanceUnits.Microsiemens)
 
     
     @property
@@ -222,10 +451,7 @@ class ElectricConductance(AbstractMeasure):
         """
         
         """
-        if self.__millisiemens != None:
-            return self.__millisiemens
-        self.__millisiemens = self.__convert_from_base(ElectricConductanceUnits.Millisiemens)
-        return self.__millisiemens
+        return self._cached_convert(ElectricConductanceUnits.Millisiemens)
 
     
     @property
@@ -233,10 +459,7 @@ class ElectricConductance(AbstractMeasure):
         """
         
         """
-        if self.__kilosiemens != None:
-            return self.__kilosiemens
-        self.__kilosiemens = self.__convert_from_base(ElectricConductanceUnits.Kilosiemens)
-        return self.__kilosiemens
+        return self._cached_convert(ElectricConductanceUnits.Kilosiemens)
 
     
     def to_string(self, unit: ElectricConductanceUnits = ElectricConductanceUnits.Siemens) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricConductivityUnits(Enum):
         """
             ElectricConductivityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         SiemensPerMeter = 'siemens_per_meter'
         """
@@ -49,73 +60,304 @@ class ElectricConductivity(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricConductivityUnits): The ElectricConductivity unit to create from, The default unit is SiemensPerMeter
     """
-    def __init__(self, value: float, from_unit: ElectricConductivityUnits = ElectricConductivityUnits.SiemensPerMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricConductivityUnits
+
+    _base_unit = ElectricConductivityUnits.SiemensPerMeter
+
+    _dimensions = (-3, -1, 3, 2, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 22
+
+    _binary_unit_ids = {
         
-        self.__siemens_per_meter = None
+        ElectricConductivityUnits.SiemensPerMeter: 0,
         
-        self.__siemens_per_inch = None
+        ElectricConductivityUnits.SiemensPerInch: 1,
         
-        self.__siemens_per_foot = None
+        ElectricConductivityUnits.SiemensPerFoot: 2,
         
-        self.__siemens_per_centimeter = None
+        ElectricConductivityUnits.SiemensPerCentimeter: 3,
         
-        self.__microsiemens_per_centimeter = None
+        ElectricConductivityUnits.MicrosiemensPerCentimeter: 4,
         
-        self.__millisiemens_per_centimeter = None
+        ElectricConductivityUnits.MillisiemensPerCentimeter: 5,
         
+    }
 
-    def convert(self, unit: ElectricConductivityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricConductivityUnits.SiemensPerMeter: lambda value: (value),
+        
+        ElectricConductivityUnits.SiemensPerInch: lambda value: (value / 3.937007874015748e1),
+        
+        ElectricConductivityUnits.SiemensPerFoot: lambda value: (value / 3.2808398950131234),
+        
+        ElectricConductivityUnits.SiemensPerCentimeter: lambda value: (value / 1e2),
+        
+        ElectricConductivityUnits.MicrosiemensPerCentimeter: lambda value: ((value / 1e2) / 1e-06),
+        
+        ElectricConductivityUnits.MillisiemensPerCentimeter: lambda value: ((value / 1e2) / 0.001),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricConductivityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        ElectricConductivityUnits.SiemensPerMeter: lambda value: (value),
+        
+        ElectricConductivityUnits.SiemensPerInch: lambda value: (value * 3.937007874015748e1),
+        
+        ElectricConductivityUnits.SiemensPerFoot: lambda value: (value * 3.2808398950131234),
+        
+        ElectricConductivityUnits.SiemensPerCentimeter: lambda value: (value * 1e2),
+        
+        ElectricConductivityUnits.MicrosiemensPerCentimeter: lambda value: ((value * 1e2) * 1e-06),
+        
+        ElectricConductivityUnits.MillisiemensPerCentimeter: lambda value: ((value * 1e2) * 0.001),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
         
-        if from_unit == ElectricConductivityUnits.SiemensPerMeter:
-            return (value)
+        ElectricConductivityUnits.SiemensPerMeter: ('1', '0'),
         
-        if from_unit == ElectricConductivityUnits.SiemensPerInch:
-            return (value / 3.937007874015748e1)
+        ElectricConductivityUnits.SiemensPerInch: ('25000000000000/984251968503937', '0'),
         
-        if from_unit == ElectricConductivityUnits.SiemensPerFoot:
-            return (value / 3.2808398950131234)
+        ElectricConductivityUnits.SiemensPerFoot: ('5000000000000000/16404199475065617', '0'),
         
-        if from_unit == ElectricConductivityUnits.SiemensPerCentimeter:
-            return (value / 1e2)
+        ElectricConductivityUnits.SiemensPerCentimeter: ('1/100', '0'),
         
-        if from_unit == ElectricConductivityUnits.MicrosiemensPerCentimeter:
-            return ((value / 1e2) / 1e-06)
+        ElectricConductivityUnits.MicrosiemensPerCentimeter: ('10000', '0'),
         
-        if from_unit == ElectricConductivityUnits.MillisiemensPerCentimeter:
-            return ((value / 1e2) / 0.001)
+        ElectricConductivityUnits.MillisiemensPerCentimeter: ('10', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        ElectricConductivityUnits.SiemensPerMeter: ('1', '0'),
+        
+        ElectricConductivityUnits.SiemensPerInch: ('984251968503937/25000000000000', '0'),
+        
+        ElectricConductivityUnits.SiemensPerFoot: ('16404199475065617/5000000000000000', '0'),
+        
+        ElectricConductivityUnits.SiemensPerCentimeter: ('100', '0'),
+        
+        ElectricConductivityUnits.MicrosiemensPerCentimeter: ('1/10000', '0'),
+        
+        ElectricConductivityUnits.MillisiemensPerCentimeter: ('1/10', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricConductivityUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ElectricConductivityUnits.SiemensPerMeter:
-            return (value)
+        ElectricConductivityUnits.SiemensPerMeter: ('S/m',),
         
-        if to_unit == ElectricConductivityUnits.SiemensPerInch:
-            return (value * 3.937007874015748e1)
+        ElectricConductivityUnits.SiemensPerInch: ('S/in',),
         
-        if to_unit == ElectricConductivityUnits.SiemensPerFoot:
-            return (value * 3.2808398950131234)
+        ElectricConductivityUnits.SiemensPerFoot: ('S/ft',),
         
-        if to_unit == ElectricConductivityUnits.SiemensPerCentimeter:
-            return (value * 1e2)
+        ElectricConductivityUnits.SiemensPerCentimeter: ('S/cm',),
         
-        if to_unit == ElectricConductivityUnits.MicrosiemensPerCentimeter:
-            return ((value * 1e2) * 1e-06)
+        ElectricConductivityUnits.MicrosiemensPerCentimeter: ('μS/cm',),
         
-        if to_unit == ElectricConductivityUnits.MillisiemensPerCentimeter:
-            return ((value * 1e2) * 0.001)
+        ElectricConductivityUnits.MillisiemensPerCentimeter: ('mS/cm',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: ElectricConductivityUnits = ElectricConductivityUnits.SiemensPerMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricConductivityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricConductivityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ElectricConductivityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricConductivityUnits, to_unit: ElectricConductivityUnits) -> float:
+        """
+        Convert a value from one ElectricConductivity unit to another, without creating a ElectricConductivity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricConductivityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricConductivityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricConductivity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricConductivityUnits, to_unit: ElectricConductivityUnits) -> List[float]:
+        """
+        Convert many values from one ElectricConductivity unit to another.
+        The conversion is resolved once and applied to all the values.
 
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricConductivityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricConductivityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricConductivity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricConductivityUnits, to_unit: ElectricConductivityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricConductivity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricConductivityUnits, to_unit: ElectricConductivityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricConductivity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricConductivityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricConductivityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricConductivity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricConductivityUnits = ElectricConductivityUnits.SiemensPerMeter) -> ElectricConductivity:
+        """
+        Create a new instance of ElectricConductivity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricConductivityUnits
+        :return: A new instance of ElectricConductivity.
+        :rtype: ElectricConductivity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricConductivity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricConductivityUnits = ElectricConductivityUnits.SiemensPerMeter) -> Fraction:
+        """
+        Get the exact value of the ElectricConductivity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (SiemensPerMeter).
+        :type unit: ElectricConductivityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricConductivity:
+        """
+        Parse a ElectricConductivity from a value followed by a unit abbreviation, e.g. "1 S/m".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricConductivity.
+        :rtype: ElectricConductivity
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricConductivity.
+        """
+        return ElectricConductivity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricConductivity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricConductivity._try_parse(text)
+
+    def to_binary(self, unit: Optional[ElectricConductivityUnits] = None) -> bytes:
+        """
+        Encode the ElectricConductivity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricConductivityUnits
+        :return: The encoded ElectricConductivity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricConductivity:
+        """
+        Decode a ElectricConductivity encoded by to_binary.
+
+        :param data: The encoded ElectricConductivity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricConductivity.
+        :rtype: ElectricConductivity
+        :raises ValueError: When the data is not a valid encoded ElectricConductivity.
+        """
+        return ElectricConductivity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricConductivityUnits] = None) -> dict:
+        """
+        Get the ElectricConductivity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (SiemensPerMeter).
+        :type hold_in_unit: ElectricConductivityUnits
+        :return: The ElectricConductivity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricConductivityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricConductivity:
+        """
+        Create a new instance of ElectricConductivity from its DTO.
+
+        :param dto: The ElectricConductivity DTO, the unit is the ElectricConductivityUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricConductivity.
+        :rtype: ElectricConductivity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricConductivity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricConductivity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricConductivity._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -217,10 +459,7 @@ class ElectricConductivity(AbstractMeasure):
         """
         
         """
-        if self.__siemens_per_meter != None:
-            return self.__siemens_per_meter
-        self.__siemens_per_meter = self.__convert_from_base(ElectricConductivityUnits.SiemensPerMeter)
-        return self.__siemens_per_meter
+        return self._cached_convert(ElectricConductivityUnits.SiemensPerMeter)
 
     
     @property
@@ -228,10 +467,7 @@ class ElectricConductivity(AbstractMeasure):
         """
         
         """
-        if self.__siemens_per_inch != None:
-            return self.__siemens_per_inch
-        self.__siemens_per_inch = self.__convert_from_base(ElectricConductivityUnits.SiemensPerInch)
-        return self.__siemens_per_inch
+        return self._cached_convert(ElectricConductivityUnits.SiemensPerInch)
 
     
     @property
@@ -239,10 +475,7 @@ class ElectricConductivity(AbstractMeasure):
         """
         
         """
-        if self.__siemens_per_foot != None:
-            return self.__siemens_per_foot
-        self.__siemens_per_foot = self.__convert_from_base(ElectricConductivityUnits.SiemensPerFoot)
-        return self.__siemens_per_foot
+        return self._cached_convert(ElectricConductivityUnits.SiemensPerFoot)
 
     
     @property
@@ -250,10 +483,7 @@ class ElectricConductivity(AbstractMeasure):
         """
         
         """
-        if self.__siemens_per_centimeter != None:
-            return self.__siemens_per_centimeter
-        self.__siemens_per_centimeter = self.__convert_from_base(ElectricConductivityUnits.SiemensPerCentimeter)
-        return self.__siemens_per_centimeter
+        return self._cached_convert(ElectricConductivityUnits.SiemensPerCentimeter)
 
     
     @property
@@ -261,10 +491,7 @@ class ElectricConductivity(AbstractMeasure):
         """
         
         """
-        if self.__microsiemens_per_centimeter != None:
-            return self.__microsiemens_per_centimeter
-        self.__microsiemens_per_centimeter = self.__convert_from_base(ElectricConductivityUnits.MicrosiemensPerCentimeter)
-        return self.__microsiemens_per_centimeter
+        return self._cached_convert(ElectricConductivityUnits.MicrosiemensPerCentimeter)
 
     
     @property
@@ -272,10 +499,7 @@ class ElectricConductivity(AbstractMeasure):
         """
         
         """
-        if self.__millisiemens_per_centimeter != None:
-            return self.__millisiemens_per_centimeter
-        self.__millisiemens_per_centimeter = self.__convert_from_base(ElectricConductivityUnits.MillisiemensPerCentimeter)
-        return self.__millisiemens_per_centimeter
+        return self._cached_convert(ElectricConductivityUnits.MillisiemensPerCentimeter)
 
     
     def to_string(self, unit: ElectricConductivityUnits = ElectricConductivityUnits.SiemensPerMeter) -> str:
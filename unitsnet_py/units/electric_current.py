@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricCurrentUnits(Enum):
         """
             ElectricCurrentUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Ampere = 'ampere'
         """
@@ -64,97 +75,340 @@ class ElectricCurrent(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricCurrentUnits): The ElectricCurrent unit to create from, The default unit is Ampere
     """
-    def __init__(self, value: float, from_unit: ElectricCurrentUnits = ElectricCurrentUnits.Ampere):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricCurrentUnits
+
+    _base_unit = ElectricCurrentUnits.Ampere
+
+    _dimensions = (0, 0, 0, 1, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 23
+
+    _binary_unit_ids = {
         
-        self.__amperes = None
+        ElectricCurrentUnits.Ampere: 0,
         
-        self.__femtoamperes = None
+        ElectricCurrentUnits.Femtoampere: 1,
         
-        self.__picoamperes = None
+        ElectricCurrentUnits.Picoampere: 2,
         
-        self.__nanoamperes = None
+        ElectricCurrentUnits.Nanoampere: 3,
         
-        self.__microamperes = None
+        ElectricCurrentUnits.Microampere: 4,
         
-        self.__milliamperes = None
+        ElectricCurrentUnits.Milliampere: 5,
         
-        self.__centiamperes = None
+        ElectricCurrentUnits.Centiampere: 6,
         
-        self.__kiloamperes = None
+        ElectricCurrentUnits.Kiloampere: 7,
         
-        self.__megaamperes = None
+        ElectricCurrentUnits.Megaampere: 8,
         
+    }
 
-    def convert(self, unit: ElectricCurrentUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricCurrentUnits.Ampere: lambda value: (value),
+        
+        ElectricCurrentUnits.Femtoampere: lambda value: ((value) / 1e-15),
+        
+        ElectricCurrentUnits.Picoampere: lambda value: ((value) / 1e-12),
+        
+        ElectricCurrentUnits.Nanoampere: lambda value: ((value) / 1e-09),
+        
+        ElectricCurrentUnits.Microampere: lambda value: ((value) / 1e-06),
+        
+        ElectricCurrentUnits.Milliampere: lambda value: ((value) / 0.001),
+        
+        ElectricCurrentUnits.Centiampere: lambda value: ((value) / 0.01),
+        
+        ElectricCurrentUnits.Kiloampere: lambda value: ((value) / 1000.0),
+        
+        ElectricCurrentUnits.Megaampere: lambda value: ((value) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricCurrentUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        ElectricCurrentUnits.Ampere: lambda value: (value),
+        
+        ElectricCurrentUnits.Femtoampere: lambda value: ((value) * 1e-15),
+        
+        ElectricCurrentUnits.Picoampere: lambda value: ((value) * 1e-12),
+        
+        ElectricCurrentUnits.Nanoampere: lambda value: ((value) * 1e-09),
+        
+        ElectricCurrentUnits.Microampere: lambda value: ((value) * 1e-06),
+        
+        ElectricCurrentUnits.Milliampere: lambda value: ((value) * 0.001),
         
-        if from_unit == ElectricCurrentUnits.Ampere:
-            return (value)
+        ElectricCurrentUnits.Centiampere: lambda value: ((value) * 0.01),
         
-        if from_unit == ElectricCurrentUnits.Femtoampere:
-            return ((value) / 1e-15)
+        ElectricCurrentUnits.Kiloampere: lambda value: ((value) * 1000.0),
         
-        if from_unit == ElectricCurrentUnits.Picoampere:
-            return ((value) / 1e-12)
+        ElectricCurrentUnits.Megaampere: lambda value: ((value) * 1000000.0),
         
-        if from_unit == ElectricCurrentUnits.Nanoampere:
-            return ((value) / 1e-09)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ElectricCurrentUnits.Ampere: ('1', '0'),
+        
+        ElectricCurrentUnits.Femtoampere: ('1000000000000000', '0'),
+        
+        ElectricCurrentUnits.Picoampere: ('1000000000000', '0'),
+        
+        ElectricCurrentUnits.Nanoampere: ('1000000000', '0'),
         
-        if from_unit == ElectricCurrentUnits.Microampere:
-            return ((value) / 1e-06)
+        ElectricCurrentUnits.Microampere: ('1000000', '0'),
         
-        if from_unit == ElectricCurrentUnits.Milliampere:
-            return ((value) / 0.001)
+        ElectricCurrentUnits.Milliampere: ('1000', '0'),
         
-        if from_unit == ElectricCurrentUnits.Centiampere:
-            return ((value) / 0.01)
+        ElectricCurrentUnits.Centiampere: ('100', '0'),
         
-        if from_unit == ElectricCurrentUnits.Kiloampere:
-            return ((value) / 1000.0)
+        ElectricCurrentUnits.Kiloampere: ('1/1000', '0'),
         
-        if from_unit == ElectricCurrentUnits.Megaampere:
-            return ((value) / 1000000.0)
+        ElectricCurrentUnits.Megaampere: ('1/1000000', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        ElectricCurrentUnits.Ampere: ('1', '0'),
+        
+        ElectricCurrentUnits.Femtoampere: ('1/1000000000000000', '0'),
+        
+        ElectricCurrentUnits.Picoampere: ('1/1000000000000', '0'),
+        
+        ElectricCurrentUnits.Nanoampere: ('1/1000000000', '0'),
+        
+        ElectricCurrentUnits.Microampere: ('1/1000000', '0'),
+        
+        ElectricCurrentUnits.Milliampere: ('1/1000', '0'),
+        
+        ElectricCurrentUnits.Centiampere: ('1/100', '0'),
+        
+        ElectricCurrentUnits.Kiloampere: ('1000', '0'),
+        
+        ElectricCurrentUnits.Megaampere: ('1000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricCurrentUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ElectricCurrentUnits.Ampere:
-            return (value)
+        ElectricCurrentUnits.Ampere: ('A',),
         
-        if to_unit == ElectricCurrentUnits.Femtoampere:
-            return ((value) * 1e-15)
+        ElectricCurrentUnits.Femtoampere: ('fA',),
         
-        if to_unit == ElectricCurrentUnits.Picoampere:
-            return ((value) * 1e-12)
+        ElectricCurrentUnits.Picoampere: ('pA',),
         
-        if to_unit == ElectricCurrentUnits.Nanoampere:
-            return ((value) * 1e-09)
+        ElectricCurrentUnits.Nanoampere: ('nA',),
         
-        if to_unit == ElectricCurrentUnits.Microampere:
-            return ((value) * 1e-06)
+        ElectricCurrentUnits.Microampere: ('μA',),
         
-        if to_unit == ElectricCurrentUnits.Milliampere:
-            return ((value) * 0.001)
+        ElectricCurrentUnits.Milliampere: ('mA',),
         
-        if to_unit == ElectricCurrentUnits.Centiampere:
-            return ((value) * 0.01)
+        ElectricCurrentUnits.Centiampere: ('cA',),
         
-        if to_unit == ElectricCurrentUnits.Kiloampere:
-            return ((value) * 1000.0)
+        ElectricCurrentUnits.Kiloampere: ('kA',),
         
-        if to_unit == ElectricCurrentUnits.Megaampere:
-            return ((value) * 1000000.0)
+        ElectricCurrentUnits.Megaampere: ('MA',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: ElectricCurrentUnits = ElectricCurrentUnits.Ampere):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricCurrentUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricCurrentUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ElectricCurrentUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricCurrentUnits, to_unit: ElectricCurrentUnits) -> float:
+        """
+        Convert a value from one ElectricCurrent unit to another, without creating a ElectricCurrent instance.
 
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricCurrentUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricCurrentUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricCurrent._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricCurrentUnits, to_unit: ElectricCurrentUnits) -> List[float]:
+        """
+        Convert many values from one ElectricCurrent unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricCurrentUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricCurrentUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricCurrent._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricCurrentUnits, to_unit: ElectricCurrentUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricCurrent._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricCurrentUnits, to_unit: ElectricCurrentUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricCurrent unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricCurrentUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricCurrentUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricCurrent._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricCurrentUnits = ElectricCurrentUnits.Ampere) -> ElectricCurrent:
+        """
+        Create a new instance of ElectricCurrent holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricCurrentUnits
+        :return: A new instance of ElectricCurrent.
+        :rtype: ElectricCurrent
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricCurrent._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricCurrentUnits = ElectricCurrentUnits.Ampere) -> Fraction:
+        """
+        Get the exact value of the ElectricCurrent in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Ampere).
+        :type unit: ElectricCurrentUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricCurrent:
+        """
+        Parse a ElectricCurrent from a value followed by a unit abbreviation, e.g. "1 A".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricCurrent.
+        :rtype: ElectricCurrent
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricCurrent.
+        """
+        return ElectricCurrent._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricCurrent]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricCurrent._try_parse(text)
+
+    def to_binary(self, unit: Optional[ElectricCurrentUnits] = None) -> bytes:
+        """
+        Encode the ElectricCurrent to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricCurrentUnits
+        :return: The encoded ElectricCurrent.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricCurrent:
+        """
+        Decode a ElectricCurrent encoded by to_binary.
+
+        :param data: The encoded ElectricCurrent, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricCurrent.
+        :rtype: ElectricCurrent
+        :raises ValueError: When the data is not a valid encoded ElectricCurrent.
+        """
+        return ElectricCurrent._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricCurrentUnits] = None) -> dict:
+        """
+        Get the ElectricCurrent DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Ampere).
+        :type hold_in_unit: ElectricCurrentUnits
+        :return: The ElectricCurrent DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricCurrentUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricCurrent:
+        """
+        Create a new instance of ElectricCurrent from its DTO.
+
+        :param dto: The ElectricCurrent DTO, the unit is the ElectricCurrentUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricCurrent.
+        :rtype: ElectricCurrent
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricCurrent._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricCurrent:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricCurrent._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -301,10 +555,7 @@ class ElectricCurrent(AbstractMeasure):
         """
         
         """
-        if self.__amperes != None:
-            return self.__amperes
-        self.__amperes = self.__convert_from_base(ElectricCurrentUnits.Ampere)
-        return self.__amperes
+        return self._cached_convert(ElectricCurrentUnits.Ampere)
 
     
     @property
@@ -312,10 +563,7 @@ class ElectricCurrent(AbstractMeasure):
         """
         
         """
-        if self.__femtoamperes != None:
-            return self.__femtoamperes
-        self.__femtoamperes = self.__convert_from_base(ElectricCurrentUnits.Femtoampere)
-        return self.__femtoamperes
+        return self._cached_convert(ElectricCurrentUnits.Femtoampere)
 
     
     @property
@@ -323,10 +571,7 @@ class ElectricCurrent(AbstractMeasure):
         """
         
         """
-        if self.__picoamperes != None:
-            return self.__picoamperes
-        self.__picoamperes = self.__convert_from_base(ElectricCurrentUnits.Picoampere)
-        return self.__picoamperes
+        return self._cached_convert(ElectricCurrentUnits.Picoampere)
 
     
     @property
@@ -334,10 +579,7 @@ class ElectricCurrent(AbstractMeasure):
         """
         
         """
-        if self.__nanoamperes != None:
-            return self.__nanoamperes
-        self.__nanoamperes = self.__convert_from_base(ElectricCurrentUnits.Nanoampere)
-        return self.__nanoamperes
+        return self._cached_convert(ElectricCurrentUnits.Nanoampere)
 
     
     @property
@@ -345,10 +587,7 @@ class ElectricCurrent(AbstractMeasure):
         """
         
         """
-        if self.__microamperes != None:
-            return self.__microamperes
-        self.__microamperes = self.__convert_from_base(ElectricCurrentUnits.Microampere)
-        return self.__microamperes
+        return self._cached_convert(ElectricCurrentUnits.Microampere)
 
     
     @property
@@ -356,10 +595,7 @@ class ElectricCurrent(AbstractMeasure):
         """
         
         """
-        if self.__milliamperes != None:
-            return self.__milliamperes
-        self.__milliamperes = self.__convert_from_base(ElectricCurrentUnits.Milliampere)
-        return self.__milliamperes
+        return self._cached_convert(ElectricCurrentUnits.Milliampere)
 
     
     @property
@@ -367,10 +603,7 @@ class ElectricCurrent(AbstractMeasure):
         """
         
         """
-        if self.__centiamperes != None:
-            return self.__centiamperes
-        self.__centiamperes = self.__convert_from_base(ElectricCurrentUnits.Centiampere)
-        return self.__centiamperes
+        return self._cached_convert(ElectricCurrentUnits.Centiampere)
 
     
     @property
@@ -378,10 +611,7 @@ class ElectricCurrent(AbstractMeasure):
         """
         
         """
-        if self.__kiloamperes != None:
-            return self.__kiloamperes
-        self.__kiloamperes = self.__convert_from_base(ElectricCurrentUnits.Kiloampere)
-        return self.__kiloamperes
+        return self._cached_convert(ElectricCurrentUnits.Kiloampere)
 
     
     @property
@@ -389,10 +619,7 @@ class ElectricCurrent(AbstractMeasure):
         """
         
         """
-        if self.__megaamperes != None:
-            return self.__megaamperes
-        self.__megaamperes = self.__convert_from_base(ElectricCurrentUnits.Megaampere)
-        return self.__megaamperes
+        return self._cached_convert(ElectricCurrentUnits.Megaampere)
 
     
     def to_string(self, unit: ElectricCurrentUnits = ElectricCurrentUnits.Ampere) -> str:
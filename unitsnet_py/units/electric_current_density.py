@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricCurrentDensityUnits(Enum):
         """
             ElectricCurrentDensityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         AmperePerSquareMeter = 'ampere_per_square_meter'
         """
@@ -34,49 +45,268 @@ class ElectricCurrentDensity(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricCurrentDensityUnits): The ElectricCurrentDensity unit to create from, The default unit is AmperePerSquareMeter
     """
-    def __init__(self, value: float, from_unit: ElectricCurrentDensityUnits = ElectricCurrentDensityUnits.AmperePerSquareMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricCurrentDensityUnits
+
+    _base_unit = ElectricCurrentDensityUnits.AmperePerSquareMeter
+
+    _dimensions = (-2, 0, 0, 1, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 24
+
+    _binary_unit_ids = {
         
-        self.__amperes_per_square_meter = None
+        ElectricCurrentDensityUnits.AmperePerSquareMeter: 0,
         
-        self.__amperes_per_square_inch = None
+        ElectricCurrentDensityUnits.AmperePerSquareInch: 1,
         
-        self.__amperes_per_square_foot = None
+        ElectricCurrentDensityUnits.AmperePerSquareFoot: 2,
         
+    }
 
-    def convert(self, unit: ElectricCurrentDensityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricCurrentDensityUnits.AmperePerSquareMeter: lambda value: (value),
+        
+        ElectricCurrentDensityUnits.AmperePerSquareInch: lambda value: (value / 1.5500031000062000e3),
+        
+        ElectricCurrentDensityUnits.AmperePerSquareFoot: lambda value: (value / 1.0763910416709722e1),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricCurrentDensityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ElectricCurrentDensityUnits.AmperePerSquareMeter:
-            return (value)
+        ElectricCurrentDensityUnits.AmperePerSquareMeter: lambda value: (value),
         
-        if from_unit == ElectricCurrentDensityUnits.AmperePerSquareInch:
-            return (value / 1.5500031000062000e3)
+        ElectricCurrentDensityUnits.AmperePerSquareInch: lambda value: (value * 1.5500031000062000e3),
         
-        if from_unit == ElectricCurrentDensityUnits.AmperePerSquareFoot:
-            return (value / 1.0763910416709722e1)
+        ElectricCurrentDensityUnits.AmperePerSquareFoot: lambda value: (value * 1.0763910416709722e1),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ElectricCurrentDensityUnits.AmperePerSquareMeter: ('1', '0'),
+        
+        ElectricCurrentDensityUnits.AmperePerSquareInch: ('5000000000/7750015500031', '0'),
+        
+        ElectricCurrentDensityUnits.AmperePerSquareFoot: ('500000000000000/5381955208354861', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricCurrentDensityUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == ElectricCurrentDensityUnits.AmperePerSquareMeter:
-            return (value)
+        ElectricCurrentDensityUnits.AmperePerSquareMeter: ('1', '0'),
         
-        if to_unit == ElectricCurrentDensityUnits.AmperePerSquareInch:
-            return (value * 1.5500031000062000e3)
+        ElectricCurrentDensityUnits.AmperePerSquareInch: ('7750015500031/5000000000', '0'),
+        
+        ElectricCurrentDensityUnits.AmperePerSquareFoot: ('5381955208354861/500000000000000', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ElectricCurrentDensityUnits.AmperePerSquareFoot:
-            return (value * 1.0763910416709722e1)
+        ElectricCurrentDensityUnits.AmperePerSquareMeter: ('A/m²',),
         
-        return None
+        ElectricCurrentDensityUnits.AmperePerSquareInch: ('A/in²',),
+        
+        ElectricCurrentDensityUnits.AmperePerSquareFoot: ('A/ft²',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ElectricCurrentDensityUnits = ElectricCurrentDensityUnits.AmperePerSquareMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricCurrentDensityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricCurrentDensityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ElectricCurrentDensityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricCurrentDensityUnits, to_unit: ElectricCurrentDensityUnits) -> float:
+        """
+        Convert a value from one ElectricCurrentDensity unit to another, without creating a ElectricCurrentDensity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricCurrentDensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricCurrentDensityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricCurrentDensity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricCurrentDensityUnits, to_unit: ElectricCurrentDensityUnits) -> List[float]:
+        """
+        Convert many values from one ElectricCurrentDensity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricCurrentDensityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricCurrentDensityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricCurrentDensity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricCurrentDensityUnits, to_unit: ElectricCurrentDensityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricCurrentDensity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricCurrentDensityUnits, to_unit: ElectricCurrentDensityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricCurrentDensity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricCurrentDensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricCurrentDensityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricCurrentDensity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricCurrentDensityUnits = ElectricCurrentDensityUnits.AmperePerSquareMeter) -> ElectricCurrentDensity:
+        """
+        Create a new instance of ElectricCurrentDensity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricCurrentDensityUnits
+        :return: A new instance of ElectricCurrentDensity.
+        :rtype: ElectricCurrentDensity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricCurrentDensity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricCurrentDensityUnits = ElectricCurrentDensityUnits.AmperePerSquareMeter) -> Fraction:
+        """
+        Get the exact value of the ElectricCurrentDensity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (AmperePerSquareMeter).
+        :type unit: ElectricCurrentDensityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricCurrentDensity:
+        """
+        Parse a ElectricCurrentDensity from a value followed by a unit abbreviation, e.g. "1 A/m²".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricCurrentDensity.
+        :rtype: ElectricCurrentDensity
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricCurrentDensity.
+        """
+        return ElectricCurrentDensity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricCurrentDensity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricCurrentDensity._try_parse(text)
 
+    def to_binary(self, unit: Optional[ElectricCurrentDensityUnits] = None) -> bytes:
+        """
+        Encode the ElectricCurrentDensity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricCurrentDensityUnits
+        :return: The encoded ElectricCurrentDensity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricCurrentDensity:
+        """
+        Decode a ElectricCurrentDensity encoded by to_binary.
+
+        :param data: The encoded ElectricCurrentDensity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricCurrentDensity.
+        :rtype: ElectricCurrentDensity
+        :raises ValueError: When the data is not a valid encoded ElectricCurrentDensity.
+        """
+        return ElectricCurrentDensity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricCurrentDensityUnits] = None) -> dict:
+        """
+        Get the ElectricCurrentDensity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (AmperePerSquareMeter).
+        :type hold_in_unit: ElectricCurrentDensityUnits
+        :return: The ElectricCurrentDensity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricCurrentDensityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricCurrentDensity:
+        """
+        Create a new instance of ElectricCurrentDensity from its DTO.
+
+        :param dto: The ElectricCurrentDensity DTO, the unit is the ElectricCurrentDensityUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricCurrentDensity.
+        :rtype: ElectricCurrentDensity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricCurrentDensity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricCurrentDensity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricCurrentDensity._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -133,10 +363,7 @@ class ElectricCurrentDensity(AbstractMeasure):
         """
         
         """
-        if self.__amperes_per_square_meter != None:
-            return self.__amperes_per_square_meter
-        self.__amperes_per_square_meter = self.__convert_from_base(ElectricCurrentDensityUnits.AmperePerSquareMeter)
-        return self.__amperes_per_square_meter
+        return self._cached_convert(ElectricCurrentDensityUnits.AmperePerSquareMeter)
 
     
     @property
@@ -144,10 +371,7 @@ class ElectricCurrentDensity(AbstractMeasure):
         """
         
         """
-        if self.__amperes_per_square_inch != None:
-            return self.__amperes_per_square_inch
-        self.__amperes_per_square_inch = self.__convert_from_base(ElectricCurrentDensityUnits.AmperePerSquareInch)
-        return self.__amperes_per_square_inch
+        return self._cached_convert(ElectricCurrentDensityUnits.AmperePerSquareInch)
 
     
     @property
@@ -155,10 +379,7 @@ class ElectricCurrentDensity(AbstractMeasure):
         """
         
         """
-        if self.__amperes_per_square_foot != None:
-            return self.__amperes_per_square_foot
-        self.__amperes_per_square_foot = self.__convert_from_base(ElectricCurrentDensityUnits.AmperePerSquareFoot)
-        return self.__amperes_per_square_foot
+        return self._cached_convert(ElectricCurrentDensityUnits.AmperePerSquareFoot)
 
     
     def to_string(self, unit: ElectricCurrentDensityUnits = ElectricCurrentDensityUnits.AmperePerSquareMeter) -> str:
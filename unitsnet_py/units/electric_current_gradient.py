@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricCurrentGradientUnits(Enum):
         """
             ElectricCurrentGradientUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         AmperePerSecond = 'ampere_per_second'
         """
@@ -54,81 +65,316 @@ class ElectricCurrentGradient(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricCurrentGradientUnits): The ElectricCurrentGradient unit to create from, The default unit is AmperePerSecond
     """
-    def __init__(self, value: float, from_unit: ElectricCurrentGradientUnits = ElectricCurrentGradientUnits.AmperePerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricCurrentGradientUnits
+
+    _base_unit = ElectricCurrentGradientUnits.AmperePerSecond
+
+    _dimensions = (0, 0, -1, 1, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 25
+
+    _binary_unit_ids = {
         
-        self.__amperes_per_second = None
+        ElectricCurrentGradientUnits.AmperePerSecond: 0,
         
-        self.__amperes_per_minute = None
+        ElectricCurrentGradientUnits.AmperePerMinute: 1,
         
-        self.__amperes_per_millisecond = None
+        ElectricCurrentGradientUnits.AmperePerMillisecond: 2,
         
-        self.__amperes_per_microsecond = None
+        ElectricCurrentGradientUnits.AmperePerMicrosecond: 3,
         
-        self.__amperes_per_nanosecond = None
+        ElectricCurrentGradientUnits.AmperePerNanosecond: 4,
         
-        self.__milliamperes_per_second = None
+        ElectricCurrentGradientUnits.MilliamperePerSecond: 5,
         
-        self.__milliamperes_per_minute = None
+        ElectricCurrentGradientUnits.MilliamperePerMinute: 6,
         
+    }
 
-    def convert(self, unit: ElectricCurrentGradientUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricCurrentGradientUnits.AmperePerSecond: lambda value: (value),
+        
+        ElectricCurrentGradientUnits.AmperePerMinute: lambda value: (value * 60),
+        
+        ElectricCurrentGradientUnits.AmperePerMillisecond: lambda value: (value / 1e3),
+        
+        ElectricCurrentGradientUnits.AmperePerMicrosecond: lambda value: (value / 1e6),
+        
+        ElectricCurrentGradientUnits.AmperePerNanosecond: lambda value: (value / 1e9),
+        
+        ElectricCurrentGradientUnits.MilliamperePerSecond: lambda value: ((value) / 0.001),
+        
+        ElectricCurrentGradientUnits.MilliamperePerMinute: lambda value: ((value * 60) / 0.001),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricCurrentGradientUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ElectricCurrentGradientUnits.AmperePerSecond:
-            return (value)
+        ElectricCurrentGradientUnits.AmperePerSecond: lambda value: (value),
         
-        if from_unit == ElectricCurrentGradientUnits.AmperePerMinute:
-            return (value * 60)
+        ElectricCurrentGradientUnits.AmperePerMinute: lambda value: (value / 60),
         
-        if from_unit == ElectricCurrentGradientUnits.AmperePerMillisecond:
-            return (value / 1e3)
+        ElectricCurrentGradientUnits.AmperePerMillisecond: lambda value: (value * 1e3),
         
-        if from_unit == ElectricCurrentGradientUnits.AmperePerMicrosecond:
-            return (value / 1e6)
+        ElectricCurrentGradientUnits.AmperePerMicrosecond: lambda value: (value * 1e6),
         
-        if from_unit == ElectricCurrentGradientUnits.AmperePerNanosecond:
-            return (value / 1e9)
+        ElectricCurrentGradientUnits.AmperePerNanosecond: lambda value: (value * 1e9),
         
-        if from_unit == ElectricCurrentGradientUnits.MilliamperePerSecond:
-            return ((value) / 0.001)
+        ElectricCurrentGradientUnits.MilliamperePerSecond: lambda value: ((value) * 0.001),
         
-        if from_unit == ElectricCurrentGradientUnits.MilliamperePerMinute:
-            return ((value * 60) / 0.001)
+        ElectricCurrentGradientUnits.MilliamperePerMinute: lambda value: ((value / 60) * 0.001),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ElectricCurrentGradientUnits.AmperePerSecond: ('1', '0'),
+        
+        ElectricCurrentGradientUnits.AmperePerMinute: ('60', '0'),
+        
+        ElectricCurrentGradientUnits.AmperePerMillisecond: ('1/1000', '0'),
+        
+        ElectricCurrentGradientUnits.AmperePerMicrosecond: ('1/1000000', '0'),
+        
+        ElectricCurrentGradientUnits.AmperePerNanosecond: ('1/1000000000', '0'),
+        
+        ElectricCurrentGradientUnits.MilliamperePerSecond: ('1000', '0'),
+        
+        ElectricCurrentGradientUnits.MilliamperePerMinute: ('60000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricCurrentGradientUnits) -> float:
+    _affine_to_base = {
+        
+        ElectricCurrentGradientUnits.AmperePerSecond: ('1', '0'),
+        
+        ElectricCurrentGradientUnits.AmperePerMinute: ('1/60', '0'),
+        
+        ElectricCurrentGradientUnits.AmperePerMillisecond: ('1000', '0'),
+        
+        ElectricCurrentGradientUnits.AmperePerMicrosecond: ('1000000', '0'),
+        
+        ElectricCurrentGradientUnits.AmperePerNanosecond: ('1000000000', '0'),
+        
+        ElectricCurrentGradientUnits.MilliamperePerSecond: ('1/1000', '0'),
         
-        if to_unit == ElectricCurrentGradientUnits.AmperePerSecond:
-            return (value)
+        ElectricCurrentGradientUnits.MilliamperePerMinute: ('1/60000', '0'),
         
-        if to_unit == ElectricCurrentGradientUnits.AmperePerMinute:
-            return (value / 60)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        ElectricCurrentGradientUnits.AmperePerSecond: ('A/s',),
         
-        if to_unit == ElectricCurrentGradientUnits.AmperePerMillisecond:
-            return (value * 1e3)
+        ElectricCurrentGradientUnits.AmperePerMinute: ('A/min',),
         
-        if to_unit == ElectricCurrentGradientUnits.AmperePerMicrosecond:
-            return (value * 1e6)
+        ElectricCurrentGradientUnits.AmperePerMillisecond: ('A/ms',),
         
-        if to_unit == ElectricCurrentGradientUnits.AmperePerNanosecond:
-            return (value * 1e9)
+        ElectricCurrentGradientUnits.AmperePerMicrosecond: ('A/μs',),
         
-        if to_unit == ElectricCurrentGradientUnits.MilliamperePerSecond:
-            return ((value) * 0.001)
+        ElectricCurrentGradientUnits.AmperePerNanosecond: ('A/ns',),
         
-        if to_unit == ElectricCurrentGradientUnits.MilliamperePerMinute:
-            return ((value / 60) * 0.001)
+        ElectricCurrentGradientUnits.MilliamperePerSecond: ('mA/s',),
         
-        return None
+        ElectricCurrentGradientUnits.MilliamperePerMinute: ('mA/min',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ElectricCurrentGradientUnits = ElectricCurrentGradientUnits.AmperePerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricCurrentGradientUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricCurrentGradientUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ElectricCurrentGradientUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricCurrentGradientUnits, to_unit: ElectricCurrentGradientUnits) -> float:
+        """
+        Convert a value from one ElectricCurrentGradient unit to another, without creating a ElectricCurrentGradient instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricCurrentGradientUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricCurrentGradientUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricCurrentGradient._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricCurrentGradientUnits, to_unit: ElectricCurrentGradientUnits) -> List[float]:
+        """
+        Convert many values from one ElectricCurrentGradient unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricCurrentGradientUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricCurrentGradientUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricCurrentGradient._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricCurrentGradientUnits, to_unit: ElectricCurrentGradientUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricCurrentGradient._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricCurrentGradientUnits, to_unit: ElectricCurrentGradientUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricCurrentGradient unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricCurrentGradientUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricCurrentGradientUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricCurrentGradient._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricCurrentGradientUnits = ElectricCurrentGradientUnits.AmperePerSecond) -> ElectricCurrentGradient:
+        """
+        Create a new instance of ElectricCurrentGradient holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
 
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricCurrentGradientUnits
+        :return: A new instance of ElectricCurrentGradient.
+        :rtype: ElectricCurrentGradient
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricCurrentGradient._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricCurrentGradientUnits = ElectricCurrentGradientUnits.AmperePerSecond) -> Fraction:
+        """
+        Get the exact value of the ElectricCurrentGradient in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (AmperePerSecond).
+        :type unit: ElectricCurrentGradientUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricCurrentGradient:
+        """
+        Parse a ElectricCurrentGradient from a value followed by a unit abbreviation, e.g. "1 A/s".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricCurrentGradient.
+        :rtype: ElectricCurrentGradient
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricCurrentGradient.
+        """
+        return ElectricCurrentGradient._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricCurrentGradient]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricCurrentGradient._try_parse(text)
+
+    def to_binary(self, unit: Optional[ElectricCurrentGradientUnits] = None) -> bytes:
+        """
+        Encode the ElectricCurrentGradient to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricCurrentGradientUnits
+        :return: The encoded ElectricCurrentGradient.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricCurrentGradient:
+        """
+        Decode a ElectricCurrentGradient encoded by to_binary.
+
+        :param data: The encoded ElectricCurrentGradient, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricCurrentGradient.
+        :rtype: ElectricCurrentGradient
+        :raises ValueError: When the data is not a valid encoded ElectricCurrentGradient.
+        """
+        return ElectricCurrentGradient._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricCurrentGradientUnits] = None) -> dict:
+        """
+        Get the ElectricCurrentGradient DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (AmperePerSecond).
+        :type hold_in_unit: ElectricCurrentGradientUnits
+        :return: The ElectricCurrentGradient DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricCurrentGradientUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricCurrentGradient:
+        """
+        Create a new instance of ElectricCurrentGradient from its DTO.
+
+        :param dto: The ElectricCurrentGradient DTO, the unit is the ElectricCurrentGradientUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricCurrentGradient.
+        :rtype: ElectricCurrentGradient
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricCurrentGradient._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricCurrentGradient:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricCurrentGradient._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -245,10 +491,7 @@ class ElectricCurrentGradient(AbstractMeasure):
         """
         
         """
-        if self.__amperes_per_second != None:
-            return self.__amperes_per_second
-        self.__amperes_per_second = self.__convert_from_base(ElectricCurrentGradientUnits.AmperePerSecond)
-        return self.__amperes_per_second
+        return self._cached_convert(ElectricCurrentGradientUnits.AmperePerSecond)
 
     
     @property
@@ -256,10 +499,7 @@ class ElectricCurrentGradient(AbstractMeasure):
         """
         
         """
-        if self.__amperes_per_minute != None:
-            return self.__amperes_per_minute
-        self.__amperes_per_minute = self.__convert_from_base(ElectricCurrentGradientUnits.AmperePerMinute)
-        return self.__amperes_per_minute
+        return self._cached_convert(ElectricCurrentGradientUnits.AmperePerMinute)
 
     
     @property
@@ -267,10 +507,7 @@ class ElectricCurrentGradient(AbstractMeasure):
         """
         
         """
-        if self.__amperes_per_millisecond != None:
-            return self.__amperes_per_millisecond
-        self.__amperes_per_millisecond = self.__convert_from_base(ElectricCurrentGradientUnits.AmperePerMillisecond)
-        return self.__amperes_per_millisecond
+        return self._cached_convert(ElectricCurrentGradientUnits.AmperePerMillisecond)
 
     
     @property
@@ -278,10 +515,7 @@ class ElectricCurrentGradient(AbstractMeasure):
         """
         
         """
-        if self.__amperes_per_microsecond != None:
-            return self.__amperes_per_microsecond
-        self.__amperes_per_microsecond = self.__convert_from_base(ElectricCurrentGradientUnits.AmperePerMicrosecond)
-        return self.__amperes_per_microsecond
+        return self._cached_convert(ElectricCurrentGradientUnits.AmperePerMicrosecond)
 
     
     @property
@@ -289,10 +523,7 @@ class ElectricCurrentGradient(AbstractMeasure):
         """
         
         """
-        if self.__amperes_per_nanosecond != None:
-            return self.__amperes_per_nanosecond
-        self.__amperes_per_nanosecond = self.__convert_from_base(ElectricCurrentGradientUnits.AmperePerNanosecond)
-        return self.__amperes_per_nanosecond
+        return self._cached_convert(ElectricCurrentGradientUnits.AmperePerNanosecond)
 
     
     @property
@@ -300,10 +531,7 @@ class ElectricCurrentGradient(AbstractMeasure):
         """
         
         """
-        if self.__milliamperes_per_second != None:
-            return self.__milliamperes_per_second
-        self.__milliamperes_per_second = self.__convert_from_base(ElectricCurrentGradientUnits.MilliamperePerSecond)
-        return self.__milliamperes_per_second
+        return self._cached_convert(ElectricCurrentGradientUnits.MilliamperePerSecond)
 
     
     @property
@@ -311,10 +539,7 @@ class ElectricCurrentGradient(AbstractMeasure):
         """
         
         """
-        if self.__milliamperes_per_minute != None:
-            return self.__milliamperes_per_minute
-        self.__milliamperes_per_minute = self.__convert_from_base(ElectricCurrentGradientUnits.MilliamperePerMinute)
-        return self.__milliamperes_per_minute
+        return self._cached_convert(ElectricCurrentGradientUnits.MilliamperePerMinute)
 
     
     def to_string(self, unit: ElectricCurrentGradientUnits = ElectricCurrentGradientUnits.AmperePerSecond) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricFieldUnits(Enum):
         """
             ElectricFieldUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         VoltPerMeter = 'volt_per_meter'
         """
@@ -24,33 +35,244 @@ class ElectricField(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricFieldUnits): The ElectricField unit to create from, The default unit is VoltPerMeter
     """
+    __slots__ = ()
+
+    _units = ElectricFieldUnits
+
+    _base_unit = ElectricFieldUnits.VoltPerMeter
+
+    _dimensions = (1, 1, -3, -1, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 26
+
+    _binary_unit_ids = {
+        
+        ElectricFieldUnits.VoltPerMeter: 0,
+        
+    }
+
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricFieldUnits.VoltPerMeter: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        ElectricFieldUnits.VoltPerMeter: lambda value: (value),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ElectricFieldUnits.VoltPerMeter: ('1', '0'),
+        
+    }
+
+    _affine_to_base = {
+        
+        ElectricFieldUnits.VoltPerMeter: ('1', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        ElectricFieldUnits.VoltPerMeter: ('V/m',),
+        
+    }
+
     def __init__(self, value: float, from_unit: ElectricFieldUnits = ElectricFieldUnits.VoltPerMeter):
         if math.isnan(value):
             raise ValueError('Invalid unit: value is NaN')
         self._value = self.__convert_to_base(value, from_unit)
-        
-        self.__volts_per_meter = None
-        
 
     def convert(self, unit: ElectricFieldUnits) -> float:
         return self.__convert_from_base(unit)
 
     def __convert_from_base(self, from_unit: ElectricFieldUnits) -> float:
-        value = self._value
-        
-        if from_unit == ElectricFieldUnits.VoltPerMeter:
-            return (value)
-        
-        return None
+        return self._conversions_from_base[from_unit](self._value)
 
 
     def __convert_to_base(self, value: float, to_unit: ElectricFieldUnits) -> float:
-        
-        if to_unit == ElectricFieldUnits.VoltPerMeter:
-            return (value)
-        
-        return None
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricFieldUnits, to_unit: ElectricFieldUnits) -> float:
+        """
+        Convert a value from one ElectricField unit to another, without creating a ElectricField instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricFieldUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricFieldUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricField._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricFieldUnits, to_unit: ElectricFieldUnits) -> List[float]:
+        """
+        Convert many values from one ElectricField unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricFieldUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricFieldUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricField._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricFieldUnits, to_unit: ElectricFieldUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricField._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricFieldUnits, to_unit: ElectricFieldUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricField unit to another exactly, using rational conversion factors.
 
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricFieldUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricFieldUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricField._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricFieldUnits = ElectricFieldUnits.VoltPerMeter) -> ElectricField:
+        """
+        Create a new instance of ElectricField holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricFieldUnits
+        :return: A new instance of ElectricField.
+        :rtype: ElectricField
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricField._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricFieldUnits = ElectricFieldUnits.VoltPerMeter) -> Fraction:
+        """
+        Get the exact value of the ElectricField in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (VoltPerMeter).
+        :type unit: ElectricFieldUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricField:
+        """
+        Parse a ElectricField from a value followed by a unit abbreviation, e.g. "1 V/m".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricField.
+        :rtype: ElectricField
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricField.
+        """
+        return ElectricField._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricField]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricField._try_parse(text)
+
+    def to_binary(self, unit: Optional[ElectricFieldUnits] = None) -> bytes:
+        """
+        Encode the ElectricField to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricFieldUnits
+        :return: The encoded ElectricField.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricField:
+        """
+        Decode a ElectricField encoded by to_binary.
+
+        :param data: The encoded ElectricField, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricField.
+        :rtype: ElectricField
+        :raises ValueError: When the data is not a valid encoded ElectricField.
+        """
+        return ElectricField._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricFieldUnits] = None) -> dict:
+        """
+        Get the ElectricField DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (VoltPerMeter).
+        :type hold_in_unit: ElectricFieldUnits
+        :return: The ElectricField DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricFieldUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricField:
+        """
+        Create a new instance of ElectricField from its DTO.
+
+        :param dto: The ElectricField DTO, the unit is the ElectricFieldUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricField.
+        :rtype: ElectricField
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricField._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricField:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricField._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -77,10 +299,7 @@ class ElectricField(AbstractMeasure):
         """
         
         """
-        if self.__volts_per_meter != None:
-            return self.__volts_per_meter
-        self.__volts_per_meter = self.__convert_from_base(ElectricFieldUnits.VoltPerMeter)
-        return self.__volts_per_meter
+        return self._cached_convert(ElectricFieldUnits.VoltPerMeter)
 
     
     def to_string(self, unit: ElectricFieldUnits = ElectricFieldUnits.VoltPerMeter) -> str:
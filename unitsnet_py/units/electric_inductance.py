@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricInductanceUnits(Enum):
         """
             ElectricInductanceUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Henry = 'henry'
         """
@@ -44,65 +55,292 @@ class ElectricInductance(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricInductanceUnits): The ElectricInductance unit to create from, The default unit is Henry
     """
-    def __init__(self, value: float, from_unit: ElectricInductanceUnits = ElectricInductanceUnits.Henry):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricInductanceUnits
+
+    _base_unit = ElectricInductanceUnits.Henry
+
+    _dimensions = (2, 1, -2, -2, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 27
+
+    _binary_unit_ids = {
         
-        self.__henries = None
+        ElectricInductanceUnits.Henry: 0,
         
-        self.__picohenries = None
+        ElectricInductanceUnits.Picohenry: 1,
         
-        self.__nanohenries = None
+        ElectricInductanceUnits.Nanohenry: 2,
         
-        self.__microhenries = None
+        ElectricInductanceUnits.Microhenry: 3,
         
-        self.__millihenries = None
+        ElectricInductanceUnits.Millihenry: 4,
         
+    }
 
-    def convert(self, unit: ElectricInductanceUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricInductanceUnits.Henry: lambda value: (value),
+        
+        ElectricInductanceUnits.Picohenry: lambda value: ((value) / 1e-12),
+        
+        ElectricInductanceUnits.Nanohenry: lambda value: ((value) / 1e-09),
+        
+        ElectricInductanceUnits.Microhenry: lambda value: ((value) / 1e-06),
+        
+        ElectricInductanceUnits.Millihenry: lambda value: ((value) / 0.001),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricInductanceUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ElectricInductanceUnits.Henry:
-            return (value)
+        ElectricInductanceUnits.Henry: lambda value: (value),
         
-        if from_unit == ElectricInductanceUnits.Picohenry:
-            return ((value) / 1e-12)
+        ElectricInductanceUnits.Picohenry: lambda value: ((value) * 1e-12),
         
-        if from_unit == ElectricInductanceUnits.Nanohenry:
-            return ((value) / 1e-09)
+        ElectricInductanceUnits.Nanohenry: lambda value: ((value) * 1e-09),
         
-        if from_unit == ElectricInductanceUnits.Microhenry:
-            return ((value) / 1e-06)
+        ElectricInductanceUnits.Microhenry: lambda value: ((value) * 1e-06),
         
-        if from_unit == ElectricInductanceUnits.Millihenry:
-            return ((value) / 0.001)
+        ElectricInductanceUnits.Millihenry: lambda value: ((value) * 0.001),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ElectricInductanceUnits.Henry: ('1', '0'),
+        
+        ElectricInductanceUnits.Picohenry: ('1000000000000', '0'),
+        
+        ElectricInductanceUnits.Nanohenry: ('1000000000', '0'),
+        
+        ElectricInductanceUnits.Microhenry: ('1000000', '0'),
+        
+        ElectricInductanceUnits.Millihenry: ('1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricInductanceUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == ElectricInductanceUnits.Henry:
-            return (value)
+        ElectricInductanceUnits.Henry: ('1', '0'),
         
-        if to_unit == ElectricInductanceUnits.Picohenry:
-            return ((value) * 1e-12)
+        ElectricInductanceUnits.Picohenry: ('1/1000000000000', '0'),
         
-        if to_unit == ElectricInductanceUnits.Nanohenry:
-            return ((value) * 1e-09)
+        ElectricInductanceUnits.Nanohenry: ('1/1000000000', '0'),
         
-        if to_unit == ElectricInductanceUnits.Microhenry:
-            return ((value) * 1e-06)
+        ElectricInductanceUnits.Microhenry: ('1/1000000', '0'),
         
-        if to_unit == ElectricInductanceUnits.Millihenry:
-            return ((value) * 0.001)
+        ElectricInductanceUnits.Millihenry: ('1/1000', '0'),
         
-        return None
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        ElectricInductanceUnits.Henry: ('H',),
+        
+        ElectricInductanceUnits.Picohenry: ('pH',),
+        
+        ElectricInductanceUnits.Nanohenry: ('nH',),
+        
+        ElectricInductanceUnits.Microhenry: ('μH',),
+        
+        ElectricInductanceUnits.Millihenry: ('mH',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ElectricInductanceUnits = ElectricInductanceUnits.Henry):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricInductanceUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricInductanceUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ElectricInductanceUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricInductanceUnits, to_unit: ElectricInductanceUnits) -> float:
+        """
+        Convert a value from one ElectricInductance unit to another, without creating a ElectricInductance instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricInductanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricInductanceUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricInductance._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricInductanceUnits, to_unit: ElectricInductanceUnits) -> List[float]:
+        """
+        Convert many values from one ElectricInductance unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricInductanceUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricInductanceUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricInductance._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricInductanceUnits, to_unit: ElectricInductanceUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricInductance._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricInductanceUnits, to_unit: ElectricInductanceUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricInductance unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricInductanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricInductanceUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricInductance._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricInductanceUnits = ElectricInductanceUnits.Henry) -> ElectricInductance:
+        """
+        Create a new instance of ElectricInductance holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricInductanceUnits
+        :return: A new instance of ElectricInductance.
+        :rtype: ElectricInductance
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricInductance._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricInductanceUnits = ElectricInductanceUnits.Henry) -> Fraction:
+        """
+        Get the exact value of the ElectricInductance in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Henry).
+        :type unit: ElectricInductanceUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricInductance:
+        """
+        Parse a ElectricInductance from a value followed by a unit abbreviation, e.g. "1 H".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricInductance.
+        :rtype: ElectricInductance
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricInductance.
+        """
+        return ElectricInductance._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricInductance]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricInductance._try_parse(text)
+
+    def to_binary(self, unit: Optional[ElectricInductanceUnits] = None) -> bytes:
+        """
+        Encode the ElectricInductance to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricInductanceUnits
+        :return: The encoded ElectricInductance.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricInductance:
+        """
+        Decode a ElectricInductance encoded by to_binary.
+
+        :param data: The encoded ElectricInductance, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricInductance.
+        :rtype: ElectricInductance
+        :raises ValueError: When the data is not a valid encoded ElectricInductance.
+        """
+        return ElectricInductance._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricInductanceUnits] = None) -> dict:
+        """
+        Get the ElectricInductance DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
 
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Henry).
+        :type hold_in_unit: ElectricInductanceUnits
+        :return: The ElectricInductance DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricInductanceUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricInductance:
+        """
+        Create a new instance of ElectricInductance from its DTO.
+
+        :param dto: The ElectricInductance DTO, the unit is the ElectricInductanceUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricInductance.
+        :rtype: ElectricInductance
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricInductance._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricInductance:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricInductance._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -189,10 +427,7 @@ class ElectricInductance(AbstractMeasure):
         """
         
         """
-        if self.__henries != None:
-            return self.__henries
-        self.__henries = self.__convert_from_base(ElectricInductanceUnits.Henry)
-        return self.__henries
+        return self._cached_convert(ElectricInductanceUnits.Henry)
 
     
     @property
@@ -200,10 +435,7 @@ class ElectricInductance(AbstractMeasure):
         """
         
         """
-        if self.__picohenries != None:
-            return self.__picohenries
-        self.__picohenries = self.__convert_from_base(ElectricInductanceUnits.Picohenry)
-        return self.__picohenries
+        return self._cached_convert(ElectricInductanceUnits.Picohenry)
 
     
     @property
@@ -211,10 +443,7 @@ class ElectricInductance(AbstractMeasure):
         """
         
         """
-        if self.__nanohenries != None:
-            return self.__nanohenries
-        self.__nanohenries = self.__convert_from_base(ElectricInductanceUnits.Nanohenry)
-        return self.__nanohenries
+        return self._cached_convert(ElectricInductanceUnits.Nanohenry)
 
     
     @property
@@ -222,10 +451,7 @@ class ElectricInductance(AbstractMeasure):
         """
         
         """
-        if self.__microhenries != None:
-            return self.__microhenries
-        self.__microhenries = self.__convert_from_base(ElectricInductanceUnits.Microhenry)
-        return self.__microhenries
+        return self._cached_convert(ElectricInductanceUnits.Microhenry)
 
     
     @property
@@ -233,10 +459,7 @@ class ElectricInductance(AbstractMeasure):
         """
         
         """
-        if self.__millihenries != None:
-            return self.__millihenries
-        self.__millihenries = self.__convert_from_base(ElectricInductanceUnits.Millihenry)
-        return self.__millihenries
+        return self._cached_convert(ElectricInductanceUnits.Millihenry)
 
     
     def to_string(self, unit: ElectricInductanceUnits = ElectricInductanceUnits.Henry) -> str:
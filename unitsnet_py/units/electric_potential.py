@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricPotentialUnits(Enum):
         """
             ElectricPotentialUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Volt = 'volt'
         """
@@ -49,73 +60,304 @@ class ElectricPotential(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricPotentialUnits): The ElectricPotential unit to create from, The default unit is Volt
     """
-    def __init__(self, value: float, from_unit: ElectricPotentialUnits = ElectricPotentialUnits.Volt):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricPotentialUnits
+
+    _base_unit = ElectricPotentialUnits.Volt
+
+    _dimensions = (2, 1, -3, -1, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 28
+
+    _binary_unit_ids = {
         
-        self.__volts = None
+        ElectricPotentialUnits.Volt: 0,
         
-        self.__nanovolts = None
+        ElectricPotentialUnits.Nanovolt: 1,
         
-        self.__microvolts = None
+        ElectricPotentialUnits.Microvolt: 2,
         
-        self.__millivolts = None
+        ElectricPotentialUnits.Millivolt: 3,
         
-        self.__kilovolts = None
+        ElectricPotentialUnits.Kilovolt: 4,
         
-        self.__megavolts = None
+        ElectricPotentialUnits.Megavolt: 5,
         
+    }
 
-    def convert(self, unit: ElectricPotentialUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricPotentialUnits.Volt: lambda value: (value),
+        
+        ElectricPotentialUnits.Nanovolt: lambda value: ((value) / 1e-09),
+        
+        ElectricPotentialUnits.Microvolt: lambda value: ((value) / 1e-06),
+        
+        ElectricPotentialUnits.Millivolt: lambda value: ((value) / 0.001),
+        
+        ElectricPotentialUnits.Kilovolt: lambda value: ((value) / 1000.0),
+        
+        ElectricPotentialUnits.Megavolt: lambda value: ((value) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricPotentialUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        ElectricPotentialUnits.Volt: lambda value: (value),
+        
+        ElectricPotentialUnits.Nanovolt: lambda value: ((value) * 1e-09),
+        
+        ElectricPotentialUnits.Microvolt: lambda value: ((value) * 1e-06),
+        
+        ElectricPotentialUnits.Millivolt: lambda value: ((value) * 0.001),
+        
+        ElectricPotentialUnits.Kilovolt: lambda value: ((value) * 1000.0),
+        
+        ElectricPotentialUnits.Megavolt: lambda value: ((value) * 1000000.0),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
         
-        if from_unit == ElectricPotentialUnits.Volt:
-            return (value)
+        ElectricPotentialUnits.Volt: ('1', '0'),
         
-        if from_unit == ElectricPotentialUnits.Nanovolt:
-            return ((value) / 1e-09)
+        ElectricPotentialUnits.Nanovolt: ('1000000000', '0'),
         
-        if from_unit == ElectricPotentialUnits.Microvolt:
-            return ((value) / 1e-06)
+        ElectricPotentialUnits.Microvolt: ('1000000', '0'),
         
-        if from_unit == ElectricPotentialUnits.Millivolt:
-            return ((value) / 0.001)
+        ElectricPotentialUnits.Millivolt: ('1000', '0'),
         
-        if from_unit == ElectricPotentialUnits.Kilovolt:
-            return ((value) / 1000.0)
+        ElectricPotentialUnits.Kilovolt: ('1/1000', '0'),
         
-        if from_unit == ElectricPotentialUnits.Megavolt:
-            return ((value) / 1000000.0)
+        ElectricPotentialUnits.Megavolt: ('1/1000000', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        ElectricPotentialUnits.Volt: ('1', '0'),
+        
+        ElectricPotentialUnits.Nanovolt: ('1/1000000000', '0'),
+        
+        ElectricPotentialUnits.Microvolt: ('1/1000000', '0'),
+        
+        ElectricPotentialUnits.Millivolt: ('1/1000', '0'),
+        
+        ElectricPotentialUnits.Kilovolt: ('1000', '0'),
+        
+        ElectricPotentialUnits.Megavolt: ('1000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricPotentialUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ElectricPotentialUnits.Volt:
-            return (value)
+        ElectricPotentialUnits.Volt: ('V',),
         
-        if to_unit == ElectricPotentialUnits.Nanovolt:
-            return ((value) * 1e-09)
+        ElectricPotentialUnits.Nanovolt: ('nV',),
         
-        if to_unit == ElectricPotentialUnits.Microvolt:
-            return ((value) * 1e-06)
+        ElectricPotentialUnits.Microvolt: ('μV',),
         
-        if to_unit == ElectricPotentialUnits.Millivolt:
-            return ((value) * 0.001)
+        ElectricPotentialUnits.Millivolt: ('mV',),
         
-        if to_unit == ElectricPotentialUnits.Kilovolt:
-            return ((value) * 1000.0)
+        ElectricPotentialUnits.Kilovolt: ('kV',),
         
-        if to_unit == ElectricPotentialUnits.Megavolt:
-            return ((value) * 1000000.0)
+        ElectricPotentialUnits.Megavolt: ('MV',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: ElectricPotentialUnits = ElectricPotentialUnits.Volt):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricPotentialUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricPotentialUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ElectricPotentialUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricPotentialUnits, to_unit: ElectricPotentialUnits) -> float:
+        """
+        Convert a value from one ElectricPotential unit to another, without creating a ElectricPotential instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricPotentialUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricPotentialUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricPotential._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricPotentialUnits, to_unit: ElectricPotentialUnits) -> List[float]:
+        """
+        Convert many values from one ElectricPotential unit to another.
+        The conversion is resolved once and applied to all the values.
 
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricPotentialUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricPotentialUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricPotential._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricPotentialUnits, to_unit: ElectricPotentialUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricPotential._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricPotentialUnits, to_unit: ElectricPotentialUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricPotential unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricPotentialUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricPotentialUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricPotential._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricPotentialUnits = ElectricPotentialUnits.Volt) -> ElectricPotential:
+        """
+        Create a new instance of ElectricPotential holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricPotentialUnits
+        :return: A new instance of ElectricPotential.
+        :rtype: ElectricPotential
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricPotential._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricPotentialUnits = ElectricPotentialUnits.Volt) -> Fraction:
+        """
+        Get the exact value of the ElectricPotential in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Volt).
+        :type unit: ElectricPotentialUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricPotential:
+        """
+        Parse a ElectricPotential from a value followed by a unit abbreviation, e.g. "1 V".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricPotential.
+        :rtype: ElectricPotential
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricPotential.
+        """
+        return ElectricPotential._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricPotential]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricPotential._try_parse(text)
+
+    def to_binary(self, unit: Optional[ElectricPotentialUnits] = None) -> bytes:
+        """
+        Encode the ElectricPotential to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricPotentialUnits
+        :return: The encoded ElectricPotential.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricPotential:
+        """
+        Decode a ElectricPotential encoded by to_binary.
+
+        :param data: The encoded ElectricPotential, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricPotential.
+        :rtype: ElectricPotential
+        :raises ValueError: When the data is not a valid encoded ElectricPotential.
+        """
+        return ElectricPotential._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricPotentialUnits] = None) -> dict:
+        """
+        Get the ElectricPotential DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Volt).
+        :type hold_in_unit: ElectricPotentialUnits
+        :return: The ElectricPotential DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricPotentialUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricPotential:
+        """
+        Create a new instance of ElectricPotential from its DTO.
+
+        :param dto: The ElectricPotential DTO, the unit is the ElectricPotentialUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricPotential.
+        :rtype: ElectricPotential
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricPotential._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricPotential:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricPotential._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -217,10 +459,7 @@ class ElectricPotential(AbstractMeasure):
         """
         
         """
-        if self.__volts != None:
-            return self.__volts
-        self.__volts = self.__convert_from_base(ElectricPotentialUnits.Volt)
-        return self.__volts
+        return self._cached_convert(ElectricPotentialUnits.Volt)
 
     
     @property
@@ -228,10 +467,7 @@ class ElectricPotential(AbstractMeasure):
         """
         
         """
-        if self.__nanovolts != None:
-            return self.__nanovolts
-        self.__nanovolts = self.__convert_from_base(ElectricPotentialUnits.Nanovolt)
-        return self.__nanovolts
+        return self._cached_convert(ElectricPotentialUnits.Nanovolt)
 
     
     @property
@@ -239,10 +475,7 @@ class ElectricPotential(AbstractMeasure):
         """
         
         """
-        if self.__microvolts != None:
-            return self.__microvolts
-        self.__microvolts = self.__convert_from_base(ElectricPotentialUnits.Microvolt)
-        return self.__microvolts
+        return self._cached_convert(ElectricPotentialUnits.Microvolt)
 
     
     @property
@@ -250,10 +483,7 @@ class ElectricPotential(AbstractMeasure):
         """
         
         """
-        if self.__millivolts != None:
-            return self.__millivolts
-        self.__millivolts = self.__convert_from_base(ElectricPotentialUnits.Millivolt)
-        return self.__millivolts
+        return self._cached_convert(ElectricPotentialUnits.Millivolt)
 
     
     @property
@@ -261,10 +491,7 @@ class ElectricPotential(AbstractMeasure):
         """
         
         """
-        if self.__kilovolts != None:
-            return self.__kilovolts
-        self.__kilovolts = self.__convert_from_base(ElectricPotentialUnits.Kilovolt)
-        return self.__kilovolts
+        return self._cached_convert(ElectricPotentialUnits.Kilovolt)
 
     
     @property
@@ -272,10 +499,7 @@ class ElectricPotential(AbstractMeasure):
         """
         
         """
-        if self.__megavolts != None:
-            return self.__megavolts
-        self.__megavolts = self.__convert_from_base(ElectricPotentialUnits.Megavolt)
-        return self.__megavolts
+        return self._cached_convert(ElectricPotentialUnits.Megavolt)
 
     
     def to_string(self, unit: ElectricPotentialUnits = ElectricPotentialUnits.Volt) -> str:
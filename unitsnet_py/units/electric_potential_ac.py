@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricPotentialAcUnits(Enum):
         """
             ElectricPotentialAcUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         VoltAc = 'volt_ac'
         """
@@ -44,65 +55,292 @@ class ElectricPotentialAc(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricPotentialAcUnits): The ElectricPotentialAc unit to create from, The default unit is VoltAc
     """
-    def __init__(self, value: float, from_unit: ElectricPotentialAcUnits = ElectricPotentialAcUnits.VoltAc):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricPotentialAcUnits
+
+    _base_unit = ElectricPotentialAcUnits.VoltAc
+
+    _dimensions = (2, 1, -3, -1, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 29
+
+    _binary_unit_ids = {
         
-        self.__volts_ac = None
+        ElectricPotentialAcUnits.VoltAc: 0,
         
-        self.__microvolts_ac = None
+        ElectricPotentialAcUnits.MicrovoltAc: 1,
         
-        self.__millivolts_ac = None
+        ElectricPotentialAcUnits.MillivoltAc: 2,
         
-        self.__kilovolts_ac = None
+        ElectricPotentialAcUnits.KilovoltAc: 3,
         
-        self.__megavolts_ac = None
+        ElectricPotentialAcUnits.MegavoltAc: 4,
         
+    }
 
-    def convert(self, unit: ElectricPotentialAcUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricPotentialAcUnits.VoltAc: lambda value: (value),
+        
+        ElectricPotentialAcUnits.MicrovoltAc: lambda value: ((value) / 1e-06),
+        
+        ElectricPotentialAcUnits.MillivoltAc: lambda value: ((value) / 0.001),
+        
+        ElectricPotentialAcUnits.KilovoltAc: lambda value: ((value) / 1000.0),
+        
+        ElectricPotentialAcUnits.MegavoltAc: lambda value: ((value) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricPotentialAcUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ElectricPotentialAcUnits.VoltAc:
-            return (value)
+        ElectricPotentialAcUnits.VoltAc: lambda value: (value),
         
-        if from_unit == ElectricPotentialAcUnits.MicrovoltAc:
-            return ((value) / 1e-06)
+        ElectricPotentialAcUnits.MicrovoltAc: lambda value: ((value) * 1e-06),
         
-        if from_unit == ElectricPotentialAcUnits.MillivoltAc:
-            return ((value) / 0.001)
+        ElectricPotentialAcUnits.MillivoltAc: lambda value: ((value) * 0.001),
         
-        if from_unit == ElectricPotentialAcUnits.KilovoltAc:
-            return ((value) / 1000.0)
+        ElectricPotentialAcUnits.KilovoltAc: lambda value: ((value) * 1000.0),
         
-        if from_unit == ElectricPotentialAcUnits.MegavoltAc:
-            return ((value) / 1000000.0)
+        ElectricPotentialAcUnits.MegavoltAc: lambda value: ((value) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ElectricPotentialAcUnits.VoltAc: ('1', '0'),
+        
+        ElectricPotentialAcUnits.MicrovoltAc: ('1000000', '0'),
+        
+        ElectricPotentialAcUnits.MillivoltAc: ('1000', '0'),
+        
+        ElectricPotentialAcUnits.KilovoltAc: ('1/1000', '0'),
+        
+        ElectricPotentialAcUnits.MegavoltAc: ('1/1000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricPotentialAcUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == ElectricPotentialAcUnits.VoltAc:
-            return (value)
+        ElectricPotentialAcUnits.VoltAc: ('1', '0'),
         
-        if to_unit == ElectricPotentialAcUnits.MicrovoltAc:
-            return ((value) * 1e-06)
+        ElectricPotentialAcUnits.MicrovoltAc: ('1/1000000', '0'),
         
-        if to_unit == ElectricPotentialAcUnits.MillivoltAc:
-            return ((value) * 0.001)
+        ElectricPotentialAcUnits.MillivoltAc: ('1/1000', '0'),
         
-        if to_unit == ElectricPotentialAcUnits.KilovoltAc:
-            return ((value) * 1000.0)
+        ElectricPotentialAcUnits.KilovoltAc: ('1000', '0'),
         
-        if to_unit == ElectricPotentialAcUnits.MegavoltAc:
-            return ((value) * 1000000.0)
+        ElectricPotentialAcUnits.MegavoltAc: ('1000000', '0'),
         
-        return None
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        ElectricPotentialAcUnits.VoltAc: ('Vac',),
+        
+        ElectricPotentialAcUnits.MicrovoltAc: ('μVac',),
+        
+        ElectricPotentialAcUnits.MillivoltAc: ('mVac',),
+        
+        ElectricPotentialAcUnits.KilovoltAc: ('kVac',),
+        
+        ElectricPotentialAcUnits.MegavoltAc: ('MVac',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ElectricPotentialAcUnits = ElectricPotentialAcUnits.VoltAc):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricPotentialAcUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricPotentialAcUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ElectricPotentialAcUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricPotentialAcUnits, to_unit: ElectricPotentialAcUnits) -> float:
+        """
+        Convert a value from one ElectricPotentialAc unit to another, without creating a ElectricPotentialAc instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricPotentialAcUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricPotentialAcUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricPotentialAc._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricPotentialAcUnits, to_unit: ElectricPotentialAcUnits) -> List[float]:
+        """
+        Convert many values from one ElectricPotentialAc unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricPotentialAcUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricPotentialAcUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricPotentialAc._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricPotentialAcUnits, to_unit: ElectricPotentialAcUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricPotentialAc._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricPotentialAcUnits, to_unit: ElectricPotentialAcUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricPotentialAc unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricPotentialAcUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricPotentialAcUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricPotentialAc._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricPotentialAcUnits = ElectricPotentialAcUnits.VoltAc) -> ElectricPotentialAc:
+        """
+        Create a new instance of ElectricPotentialAc holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricPotentialAcUnits
+        :return: A new instance of ElectricPotentialAc.
+        :rtype: ElectricPotentialAc
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricPotentialAc._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricPotentialAcUnits = ElectricPotentialAcUnits.VoltAc) -> Fraction:
+        """
+        Get the exact value of the ElectricPotentialAc in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (VoltAc).
+        :type unit: ElectricPotentialAcUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricPotentialAc:
+        """
+        Parse a ElectricPotentialAc from a value followed by a unit abbreviation, e.g. "1 Vac".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricPotentialAc.
+        :rtype: ElectricPotentialAc
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricPotentialAc.
+        """
+        return ElectricPotentialAc._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricPotentialAc]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricPotentialAc._try_parse(text)
+
+    def to_binary(self, unit: Optional[ElectricPotentialAcUnits] = None) -> bytes:
+        """
+        Encode the ElectricPotentialAc to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricPotentialAcUnits
+        :return: The encoded ElectricPotentialAc.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricPotentialAc:
+        """
+        Decode a ElectricPotentialAc encoded by to_binary.
+
+        :param data: The encoded ElectricPotentialAc, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricPotentialAc.
+        :rtype: ElectricPotentialAc
+        :raises ValueError: When the data is not a valid encoded ElectricPotentialAc.
+        """
+        return ElectricPotentialAc._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricPotentialAcUnits] = None) -> dict:
+        """
+        Get the ElectricPotentialAc DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
 
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (VoltAc).
+        :type hold_in_unit: ElectricPotentialAcUnits
+        :return: The ElectricPotentialAc DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricPotentialAcUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricPotentialAc:
+        """
+        Create a new instance of ElectricPotentialAc from its DTO.
+
+        :param dto: The ElectricPotentialAc DTO, the unit is the ElectricPotentialAcUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricPotentialAc.
+        :rtype: ElectricPotentialAc
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricPotentialAc._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricPotentialAc:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricPotentialAc._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -189,10 +427,7 @@ class ElectricPotentialAc(AbstractMeasure):
         """
         
         """
-        if self.__volts_ac != None:
-            return self.__volts_ac
-        self.__volts_ac = self.__convert_from_base(ElectricPotentialAcUnits.VoltAc)
-        return self.__volts_ac
+        return self._cached_convert(ElectricPotentialAcUnits.VoltAc)
 
     
     @property
@@ -200,10 +435,7 @@ class ElectricPotentialAc(AbstractMeasure):
         """
         
         """
-        if self.__microvolts_ac != None:
-            return self.__microvolts_ac
-        self.__microvolts_ac = self.__convert_from_base(ElectricPotentialAcUnits.MicrovoltAc)
-        return self.__microvolts_ac
+        return self._cached_convert(ElectricPotentialAcUnits.MicrovoltAc)
 
     
     @property
@@ -211,10 +443,7 @@ class ElectricPotentialAc(AbstractMeasure):
         """
         
         """
-        if self.__millivolts_ac != None:
-            return self.__millivolts_ac
-        self.__millivolts_ac = self.__convert_from_base(ElectricPotentialAcUnits.MillivoltAc)
-        return self.__millivolts_ac
+        return self._cached_convert(ElectricPotentialAcUnits.MillivoltAc)
 
     
     @property
@@ -222,10 +451,7 @@ class ElectricPotentialAc(AbstractMeasure):
         """
         
         """
-        if self.__kilovolts_ac != None:
-            return self.__kilovolts_ac
-        self.__kilovolts_ac = self.__convert_from_base(ElectricPotentialAcUnits.KilovoltAc)
-        return self.__kilovolts_ac
+        return self._cached_convert(ElectricPotentialAcUnits.KilovoltAc)
 
     
     @property
@@ -233,10 +459,7 @@ class ElectricPotentialAc(AbstractMeasure):
         """
         
         """
-        if self.__megavolts_ac != None:
-            return self.__megavolts_ac
-        self.__megavolts_ac = self.__convert_from_base(ElectricPotentialAcUnits.MegavoltAc)
-        return self.__megavolts_ac
+        return self._cached_convert(ElectricPotentialAcUnits.MegavoltAc)
 
     
     def to_string(self, unit: ElectricPotentialAcUnits = ElectricPotentialAcUnits.VoltAc) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricPotentialChangeRateUnits(Enum):
         """
             ElectricPotentialChangeRateUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         VoltPerSecond = 'volt_per_second'
         """
@@ -119,185 +130,472 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricPotentialChangeRateUnits): The ElectricPotentialChangeRate unit to create from, The default unit is VoltPerSecond
     """
-    def __init__(self, value: float, from_unit: ElectricPotentialChangeRateUnits = ElectricPotentialChangeRateUnits.VoltPerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricPotentialChangeRateUnits
+
+    _base_unit = ElectricPotentialChangeRateUnits.VoltPerSecond
+
+    _dimensions = (2, 1, -4, -1, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 30
+
+    _binary_unit_ids = {
         
-        self.__volts_per_seconds = None
+        ElectricPotentialChangeRateUnits.VoltPerSecond: 0,
         
-        self.__volts_per_microseconds = None
+        ElectricPotentialChangeRateUnits.VoltPerMicrosecond: 1,
         
-        self.__volts_per_minutes = None
+        ElectricPotentialChangeRateUnits.VoltPerMinute: 2,
         
-        self.__volts_per_hours = None
+        ElectricPotentialChangeRateUnits.VoltPerHour: 3,
         
-        self.__microvolts_per_seconds = None
+        ElectricPotentialChangeRateUnits.MicrovoltPerSecond: 4,
         
-        self.__millivolts_per_seconds = None
+        ElectricPotentialChangeRateUnits.MillivoltPerSecond: 5,
         
-        self.__kilovolts_per_seconds = None
+        ElectricPotentialChangeRateUnits.KilovoltPerSecond: 6,
         
-        self.__megavolts_per_seconds = None
+        ElectricPotentialChangeRateUnits.MegavoltPerSecond: 7,
         
-        self.__microvolts_per_microseconds = None
+        ElectricPotentialChangeRateUnits.MicrovoltPerMicrosecond: 8,
         
-        self.__millivolts_per_microseconds = None
+        ElectricPotentialChangeRateUnits.MillivoltPerMicrosecond: 9,
         
-        self.__kilovolts_per_microseconds = None
+        ElectricPotentialChangeRateUnits.KilovoltPerMicrosecond: 10,
         
-        self.__megavolts_per_microseconds = None
+        ElectricPotentialChangeRateUnits.MegavoltPerMicrosecond: 11,
         
-        self.__microvolts_per_minutes = None
+        ElectricPotentialChangeRateUnits.MicrovoltPerMinute: 12,
         
-        self.__millivolts_per_minutes = None
+        ElectricPotentialChangeRateUnits.MillivoltPerMinute: 13,
         
-        self.__kilovolts_per_minutes = None
+        ElectricPotentialChangeRateUnits.KilovoltPerMinute: 14,
         
-        self.__megavolts_per_minutes = None
+        ElectricPotentialChangeRateUnits.MegavoltPerMinute: 15,
         
-        self.__microvolts_per_hours = None
+        ElectricPotentialChangeRateUnits.MicrovoltPerHour: 16,
         
-        self.__millivolts_per_hours = None
+        ElectricPotentialChangeRateUnits.MillivoltPerHour: 17,
         
-        self.__kilovolts_per_hours = None
+        ElectricPotentialChangeRateUnits.KilovoltPerHour: 18,
         
-        self.__megavolts_per_hours = None
+        ElectricPotentialChangeRateUnits.MegavoltPerHour: 19,
         
+    }
 
-    def convert(self, unit: ElectricPotentialChangeRateUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricPotentialChangeRateUnits.VoltPerSecond: lambda value: (value),
+        
+        ElectricPotentialChangeRateUnits.VoltPerMicrosecond: lambda value: (value / 1e6),
+        
+        ElectricPotentialChangeRateUnits.VoltPerMinute: lambda value: (value * 60),
+        
+        ElectricPotentialChangeRateUnits.VoltPerHour: lambda value: (value * 3600),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerSecond: lambda value: ((value) / 1e-06),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerSecond: lambda value: ((value) / 0.001),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerSecond: lambda value: ((value) / 1000.0),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerSecond: lambda value: ((value) / 1000000.0),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerMicrosecond: lambda value: ((value / 1e6) / 1e-06),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerMicrosecond: lambda value: ((value / 1e6) / 0.001),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerMicrosecond: lambda value: ((value / 1e6) / 1000.0),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerMicrosecond: lambda value: ((value / 1e6) / 1000000.0),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerMinute: lambda value: ((value * 60) / 1e-06),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerMinute: lambda value: ((value * 60) / 0.001),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerMinute: lambda value: ((value * 60) / 1000.0),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerMinute: lambda value: ((value * 60) / 1000000.0),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerHour: lambda value: ((value * 3600) / 1e-06),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerHour: lambda value: ((value * 3600) / 0.001),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerHour: lambda value: ((value * 3600) / 1000.0),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerHour: lambda value: ((value * 3600) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricPotentialChangeRateUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ElectricPotentialChangeRateUnits.VoltPerSecond:
-            return (value)
+        ElectricPotentialChangeRateUnits.VoltPerSecond: lambda value: (value),
         
-        if from_unit == ElectricPotentialChangeRateUnits.VoltPerMicrosecond:
-            return (value / 1e6)
+        ElectricPotentialChangeRateUnits.VoltPerMicrosecond: lambda value: (value * 1e6),
         
-        if from_unit == ElectricPotentialChangeRateUnits.VoltPerMinute:
-            return (value * 60)
+        ElectricPotentialChangeRateUnits.VoltPerMinute: lambda value: (value / 60),
         
-        if from_unit == ElectricPotentialChangeRateUnits.VoltPerHour:
-            return (value * 3600)
+        ElectricPotentialChangeRateUnits.VoltPerHour: lambda value: (value / 3600),
         
-        if from_unit == ElectricPotentialChangeRateUnits.MicrovoltPerSecond:
-            return ((value) / 1e-06)
+        ElectricPotentialChangeRateUnits.MicrovoltPerSecond: lambda value: ((value) * 1e-06),
         
-        if from_unit == ElectricPotentialChangeRateUnits.MillivoltPerSecond:
-            return ((value) / 0.001)
+        ElectricPotentialChangeRateUnits.MillivoltPerSecond: lambda value: ((value) * 0.001),
         
-        if from_unit == ElectricPotentialChangeRateUnits.KilovoltPerSecond:
-            return ((value) / 1000.0)
+        ElectricPotentialChangeRateUnits.KilovoltPerSecond: lambda value: ((value) * 1000.0),
         
-        if from_unit == ElectricPotentialChangeRateUnits.MegavoltPerSecond:
-            return ((value) / 1000000.0)
+        ElectricPotentialChangeRateUnits.MegavoltPerSecond: lambda value: ((value) * 1000000.0),
         
-        if from_unit == ElectricPotentialChangeRateUnits.MicrovoltPerMicrosecond:
-            return ((value / 1e6) / 1e-06)
+        ElectricPotentialChangeRateUnits.MicrovoltPerMicrosecond: lambda value: ((value * 1e6) * 1e-06),
         
-        if from_unit == ElectricPotentialChangeRateUnits.MillivoltPerMicrosecond:
-            return ((value / 1e6) / 0.001)
+        ElectricPotentialChangeRateUnits.MillivoltPerMicrosecond: lambda value: ((value * 1e6) * 0.001),
         
-        if from_unit == ElectricPotentialChangeRateUnits.KilovoltPerMicrosecond:
-            return ((value / 1e6) / 1000.0)
+        ElectricPotentialChangeRateUnits.KilovoltPerMicrosecond: lambda value: ((value * 1e6) * 1000.0),
         
-        if from_unit == ElectricPotentialChangeRateUnits.MegavoltPerMicrosecond:
-            return ((value / 1e6) / 1000000.0)
+        ElectricPotentialChangeRateUnits.MegavoltPerMicrosecond: lambda value: ((value * 1e6) * 1000000.0),
         
-        if from_unit == ElectricPotentialChangeRateUnits.MicrovoltPerMinute:
-            return ((value * 60) / 1e-06)
+        ElectricPotentialChangeRateUnits.MicrovoltPerMinute: lambda value: ((value / 60) * 1e-06),
         
-        if from_unit == ElectricPotentialChangeRateUnits.MillivoltPerMinute:
-            return ((value * 60) / 0.001)
+        ElectricPotentialChangeRateUnits.MillivoltPerMinute: lambda value: ((value / 60) * 0.001),
         
-        if from_unit == ElectricPotentialChangeRateUnits.KilovoltPerMinute:
-            return ((value * 60) / 1000.0)
+        ElectricPotentialChangeRateUnits.KilovoltPerMinute: lambda value: ((value / 60) * 1000.0),
         
-        if from_unit == ElectricPotentialChangeRateUnits.MegavoltPerMinute:
-            return ((value * 60) / 1000000.0)
+        ElectricPotentialChangeRateUnits.MegavoltPerMinute: lambda value: ((value / 60) * 1000000.0),
         
-        if from_unit == ElectricPotentialChangeRateUnits.MicrovoltPerHour:
-            return ((value * 3600) / 1e-06)
+        ElectricPotentialChangeRateUnits.MicrovoltPerHour: lambda value: ((value / 3600) * 1e-06),
         
-        if from_unit == ElectricPotentialChangeRateUnits.MillivoltPerHour:
-            return ((value * 3600) / 0.001)
+        ElectricPotentialChangeRateUnits.MillivoltPerHour: lambda value: ((value / 3600) * 0.001),
         
-        if from_unit == ElectricPotentialChangeRateUnits.KilovoltPerHour:
-            return ((value * 3600) / 1000.0)
+        ElectricPotentialChangeRateUnits.KilovoltPerHour: lambda value: ((value / 3600) * 1000.0),
         
-        if from_unit == ElectricPotentialChangeRateUnits.MegavoltPerHour:
-            return ((value * 3600) / 1000000.0)
+        ElectricPotentialChangeRateUnits.MegavoltPerHour: lambda value: ((value / 3600) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ElectricPotentialChangeRateUnits.VoltPerSecond: ('1', '0'),
+        
+        ElectricPotentialChangeRateUnits.VoltPerMicrosecond: ('1/1000000', '0'),
+        
+        ElectricPotentialChangeRateUnits.VoltPerMinute: ('60', '0'),
+        
+        ElectricPotentialChangeRateUnits.VoltPerHour: ('3600', '0'),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerSecond: ('1000000', '0'),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerSecond: ('1000', '0'),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerSecond: ('1/1000', '0'),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerSecond: ('1/1000000', '0'),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerMicrosecond: ('1', '0'),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerMicrosecond: ('1/1000', '0'),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerMicrosecond: ('1/1000000000', '0'),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerMicrosecond: ('1/1000000000000', '0'),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerMinute: ('60000000', '0'),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerMinute: ('60000', '0'),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerMinute: ('3/50', '0'),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerMinute: ('3/50000', '0'),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerHour: ('3600000000', '0'),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerHour: ('3600000', '0'),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerHour: ('18/5', '0'),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerHour: ('9/2500', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricPotentialChangeRateUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == ElectricPotentialChangeRateUnits.VoltPerSecond:
-            return (value)
+        ElectricPotentialChangeRateUnits.VoltPerSecond: ('1', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.VoltPerMicrosecond:
-            return (value * 1e6)
+        ElectricPotentialChangeRateUnits.VoltPerMicrosecond: ('1000000', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.VoltPerMinute:
-            return (value / 60)
+        ElectricPotentialChangeRateUnits.VoltPerMinute: ('1/60', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.VoltPerHour:
-            return (value / 3600)
+        ElectricPotentialChangeRateUnits.VoltPerHour: ('1/3600', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.MicrovoltPerSecond:
-            return ((value) * 1e-06)
+        ElectricPotentialChangeRateUnits.MicrovoltPerSecond: ('1/1000000', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.MillivoltPerSecond:
-            return ((value) * 0.001)
+        ElectricPotentialChangeRateUnits.MillivoltPerSecond: ('1/1000', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.KilovoltPerSecond:
-            return ((value) * 1000.0)
+        ElectricPotentialChangeRateUnits.KilovoltPerSecond: ('1000', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.MegavoltPerSecond:
-            return ((value) * 1000000.0)
+        ElectricPotentialChangeRateUnits.MegavoltPerSecond: ('1000000', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.MicrovoltPerMicrosecond:
-            return ((value * 1e6) * 1e-06)
+        ElectricPotentialChangeRateUnits.MicrovoltPerMicrosecond: ('1', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.MillivoltPerMicrosecond:
-            return ((value * 1e6) * 0.001)
+        ElectricPotentialChangeRateUnits.MillivoltPerMicrosecond: ('1000', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.KilovoltPerMicrosecond:
-            return ((value * 1e6) * 1000.0)
+        ElectricPotentialChangeRateUnits.KilovoltPerMicrosecond: ('1000000000', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.MegavoltPerMicrosecond:
-            return ((value * 1e6) * 1000000.0)
+        ElectricPotentialChangeRateUnits.MegavoltPerMicrosecond: ('1000000000000', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.MicrovoltPerMinute:
-            return ((value / 60) * 1e-06)
+        ElectricPotentialChangeRateUnits.MicrovoltPerMinute: ('1/60000000', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.MillivoltPerMinute:
-            return ((value / 60) * 0.001)
+        ElectricPotentialChangeRateUnits.MillivoltPerMinute: ('1/60000', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.KilovoltPerMinute:
-            return ((value / 60) * 1000.0)
+        ElectricPotentialChangeRateUnits.KilovoltPerMinute: ('50/3', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.MegavoltPerMinute:
-            return ((value / 60) * 1000000.0)
+        ElectricPotentialChangeRateUnits.MegavoltPerMinute: ('50000/3', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.MicrovoltPerHour:
-            return ((value / 3600) * 1e-06)
+        ElectricPotentialChangeRateUnits.MicrovoltPerHour: ('1/3600000000', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.MillivoltPerHour:
-            return ((value / 3600) * 0.001)
+        ElectricPotentialChangeRateUnits.MillivoltPerHour: ('1/3600000', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.KilovoltPerHour:
-            return ((value / 3600) * 1000.0)
+        ElectricPotentialChangeRateUnits.KilovoltPerHour: ('5/18', '0'),
         
-        if to_unit == ElectricPotentialChangeRateUnits.MegavoltPerHour:
-            return ((value / 3600) * 1000000.0)
+        ElectricPotentialChangeRateUnits.MegavoltPerHour: ('2500/9', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        ElectricPotentialChangeRateUnits.VoltPerSecond: ('V/s',),
+        
+        ElectricPotentialChangeRateUnits.VoltPerMicrosecond: ('V/μs',),
+        
+        ElectricPotentialChangeRateUnits.VoltPerMinute: ('V/min',),
+        
+        ElectricPotentialChangeRateUnits.VoltPerHour: ('V/h',),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerSecond: ('μV/s',),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerSecond: ('mV/s',),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerSecond: ('kV/s',),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerSecond: ('MV/s',),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerMicrosecond: ('μV/μs',),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerMicrosecond: ('mV/μs',),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerMicrosecond: ('kV/μs',),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerMicrosecond: ('MV/μs',),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerMinute: ('μV/min',),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerMinute: ('mV/min',),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerMinute: ('kV/min',),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerMinute: ('MV/min',),
+        
+        ElectricPotentialChangeRateUnits.MicrovoltPerHour: ('μV/h',),
+        
+        ElectricPotentialChangeRateUnits.MillivoltPerHour: ('mV/h',),
+        
+        ElectricPotentialChangeRateUnits.KilovoltPerHour: ('kV/h',),
+        
+        ElectricPotentialChangeRateUnits.MegavoltPerHour: ('MV/h',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ElectricPotentialChangeRateUnits = ElectricPotentialChangeRateUnits.VoltPerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricPotentialChangeRateUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricPotentialChangeRateUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ElectricPotentialChangeRateUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricPotentialChangeRateUnits, to_unit: ElectricPotentialChangeRateUnits) -> float:
+        """
+        Convert a value from one ElectricPotentialChangeRate unit to another, without creating a ElectricPotentialChangeRate instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricPotentialChangeRateUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricPotentialChangeRateUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricPotentialChangeRate._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricPotentialChangeRateUnits, to_unit: ElectricPotentialChangeRateUnits) -> List[float]:
+        """
+        Convert many values from one ElectricPotentialChangeRate unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricPotentialChangeRateUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricPotentialChangeRateUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricPotentialChangeRate._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricPotentialChangeRateUnits, to_unit: ElectricPotentialChangeRateUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricPotentialChangeRate._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricPotentialChangeRateUnits, to_unit: ElectricPotentialChangeRateUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricPotentialChangeRate unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricPotentialChangeRateUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricPotentialChangeRateUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricPotentialChangeRate._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricPotentialChangeRateUnits = ElectricPotentialChangeRateUnits.VoltPerSecond) -> ElectricPotentialChangeRate:
+        """
+        Create a new instance of ElectricPotentialChangeRate holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricPotentialChangeRateUnits
+        :return: A new instance of ElectricPotentialChangeRate.
+        :rtype: ElectricPotentialChangeRate
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricPotentialChangeRate._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricPotentialChangeRateUnits = ElectricPotentialChangeRateUnits.VoltPerSecond) -> Fraction:
+        """
+        Get the exact value of the ElectricPotentialChangeRate in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (VoltPerSecond).
+        :type unit: ElectricPotentialChangeRateUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricPotentialChangeRate:
+        """
+        Parse a ElectricPotentialChangeRate from a value followed by a unit abbreviation, e.g. "1 V/s".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricPotentialChangeRate.
+        :rtype: ElectricPotentialChangeRate
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricPotentialChangeRate.
+        """
+        return ElectricPotentialChangeRate._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricPotentialChangeRate]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricPotentialChangeRate._try_parse(text)
+
+    def to_binary(self, unit: Optional[ElectricPotentialChangeRateUnits] = None) -> bytes:
+        """
+        Encode the ElectricPotentialChangeRate to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricPotentialChangeRateUnits
+        :return: The encoded ElectricPotentialChangeRate.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricPotentialChangeRate:
+        """
+        Decode a ElectricPotentialChangeRate encoded by to_binary.
+
+        :param data: The encoded ElectricPotentialChangeRate, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricPotentialChangeRate.
+        :rtype: ElectricPotentialChangeRate
+        :raises ValueError: When the data is not a valid encoded ElectricPotentialChangeRate.
+        """
+        return ElectricPotentialChangeRate._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricPotentialChangeRateUnits] = None) -> dict:
+        """
+        Get the ElectricPotentialChangeRate DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (VoltPerSecond).
+        :type hold_in_unit: ElectricPotentialChangeRateUnits
+        :return: The ElectricPotentialChangeRate DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricPotentialChangeRateUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricPotentialChangeRate:
+        """
+        Create a new instance of ElectricPotentialChangeRate from its DTO.
+
+        :param dto: The ElectricPotentialChangeRate DTO, the unit is the ElectricPotentialChangeRateUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricPotentialChangeRate.
+        :rtype: ElectricPotentialChangeRate
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricPotentialChangeRate._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricPotentialChangeRate:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricPotentialChangeRate._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -609,10 +907,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__volts_per_seconds != None:
-            return self.__volts_per_seconds
-        self.__volts_per_seconds = self.__convert_from_base(ElectricPotentialChangeRateUnits.VoltPerSecond)
-        return self.__volts_per_seconds
+        return self._cached_convert(ElectricPotentialChangeRateUnits.VoltPerSecond)
 
     
     @property
@@ -620,10 +915,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__volts_per_microseconds != None:
-            return self.__volts_per_microseconds
-        self.__volts_per_microseconds = self.__convert_from_base(ElectricPotentialChangeRateUnits.VoltPerMicrosecond)
-        return self.__volts_per_microseconds
+        return self._cached_convert(ElectricPotentialChangeRateUnits.VoltPerMicrosecond)
 
     
     @property
@@ -631,10 +923,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__volts_per_minutes != None:
-            return self.__volts_per_minutes
-        self.__volts_per_minutes = self.__convert_from_base(ElectricPotentialChangeRateUnits.VoltPerMinute)
-        return self.__volts_per_minutes
+        return self._cached_convert(ElectricPotentialChangeRateUnits.VoltPerMinute)
 
     
     @property
@@ -642,10 +931,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__volts_per_hours != None:
-            return self.__volts_per_hours
-        self.__volts_per_hours = self.__convert_from_base(ElectricPotentialChangeRateUnits.VoltPerHour)
-        return self.__volts_per_hours
+        return self._cached_convert(ElectricPotentialChangeRateUnits.VoltPerHour)
 
     
     @property
@@ -653,10 +939,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__microvolts_per_seconds != None:
-            return self.__microvolts_per_seconds
-        self.__microvolts_per_seconds = self.__convert_from_base(ElectricPotentialChangeRateUnits.MicrovoltPerSecond)
-        return self.__microvolts_per_seconds
+        return self._cached_convert(ElectricPotentialChangeRateUnits.MicrovoltPerSecond)
 
     
     @property
@@ -664,10 +947,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__millivolts_per_seconds != None:
-            return self.__millivolts_per_seconds
-        self.__millivolts_per_seconds = self.__convert_from_base(ElectricPotentialChangeRateUnits.MillivoltPerSecond)
-        return self.__millivolts_per_seconds
+        return self._cached_convert(ElectricPotentialChangeRateUnits.MillivoltPerSecond)
 
     
     @property
@@ -675,10 +955,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__kilovolts_per_seconds != None:
-            return self.__kilovolts_per_seconds
-        self.__kilovolts_per_seconds = self.__convert_from_base(ElectricPotentialChangeRateUnits.KilovoltPerSecond)
-        return self.__kilovolts_per_seconds
+        return self._cached_convert(ElectricPotentialChangeRateUnits.KilovoltPerSecond)
 
     
     @property
@@ -686,10 +963,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__megavolts_per_seconds != None:
-            return self.__megavolts_per_seconds
-        self.__megavolts_per_seconds = self.__convert_from_base(ElectricPotentialChangeRateUnits.MegavoltPerSecond)
-        return self.__megavolts_per_seconds
+        return self._cached_convert(ElectricPotentialChangeRateUnits.MegavoltPerSecond)
 
     
     @property
@@ -697,10 +971,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__microvolts_per_microseconds != None:
-            return self.__microvolts_per_microseconds
-        self.__microvolts_per_microseconds = self.__convert_from_base(ElectricPotentialChangeRateUnits.MicrovoltPerMicrosecond)
-        return self.__microvolts_per_microseconds
+        return self._cached_convert(ElectricPotentialChangeRateUnits.MicrovoltPerMicrosecond)
 
     
     @property
@@ -708,10 +979,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__millivolts_per_microseconds != None:
-            return self.__millivolts_per_microseconds
-        self.__millivolts_per_microseconds = self.__convert_from_base(ElectricPotentialChangeRateUnits.MillivoltPerMicrosecond)
-        return self.__millivolts_per_microseconds
+        return self._cached_convert(ElectricPotentialChangeRateUnits.MillivoltPerMicrosecond)
 
     
     @property
@@ -719,10 +987,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__kilovolts_per_microseconds != None:
-            return self.__kilovolts_per_microseconds
-        self.__kilovolts_per_microseconds = self.__convert_from_base(ElectricPotentialChangeRateUnits.KilovoltPerMicrosecond)
-        return self.__kilovolts_per_microseconds
+        return self._cached_convert(ElectricPotentialChangeRateUnits.KilovoltPerMicrosecond)
 
     
     @property
@@ -730,10 +995,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__megavolts_per_microseconds != None:
-            return self.__megavolts_per_microseconds
-        self.__megavolts_per_microseconds = self.__convert_from_base(ElectricPotentialChangeRateUnits.MegavoltPerMicrosecond)
-        return self.__megavolts_per_microseconds
+        return self._cached_convert(ElectricPotentialChangeRateUnits.MegavoltPerMicrosecond)
 
     
     @property
@@ -741,10 +1003,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__microvolts_per_minutes != None:
-            return self.__microvolts_per_minutes
-        self.__microvolts_per_minutes = self.__convert_from_base(ElectricPotentialChangeRateUnits.MicrovoltPerMinute)
-        return self.__microvolts_per_minutes
+        return self._cached_convert(ElectricPotentialChangeRateUnits.MicrovoltPerMinute)
 
     
     @property
@@ -752,10 +1011,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__millivolts_per_minutes != None:
-            return self.__millivolts_per_minutes
-        self.__millivolts_per_minutes = self.__convert_from_base(ElectricPotentialChangeRateUnits.MillivoltPerMinute)
-        return self.__millivolts_per_minutes
+        return self._cached_convert(ElectricPotentialChangeRateUnits.MillivoltPerMinute)
 
     
     @property
@@ -763,10 +1019,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__kilovolts_per_minutes != None:
-            return self.__kilovolts_per_minutes
-        self.__kilovolts_per_minutes = self.__convert_from_base(ElectricPotentialChangeRateUnits.KilovoltPerMinute)
-        return self.__kilovolts_per_minutes
+        return self._cached_convert(ElectricPotentialChangeRateUnits.KilovoltPerMinute)
 
     
     @property
@@ -774,10 +1027,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__megavolts_per_minutes != None:
-            return self.__megavolts_per_minutes
-        self.__megavolts_per_minutes = self.__convert_from_base(ElectricPotentialChangeRateUnits.MegavoltPerMinute)
-        return self.__megavolts_per_minutes
+        return self._cached_convert(ElectricPotentialChangeRateUnits.MegavoltPerMinute)
 
     
     @property
@@ -785,10 +1035,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__microvolts_per_hours != None:
-            return self.__microvolts_per_hours
-        self.__microvolts_per_hours = self.__convert_from_base(ElectricPotentialChangeRateUnits.MicrovoltPerHour)
-        return self.__microvolts_per_hours
+        return self._cached_convert(ElectricPotentialChangeRateUnits.MicrovoltPerHour)
 
     
     @property
@@ -796,10 +1043,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__millivolts_per_hours != None:
-            return self.__millivolts_per_hours
-        self.__millivolts_per_hours = self.__convert_from_base(ElectricPotentialChangeRateUnits.MillivoltPerHour)
-        return self.__millivolts_per_hours
+        return self._cached_convert(ElectricPotentialChangeRateUnits.MillivoltPerHour)
 
     
     @property
@@ -807,10 +1051,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__kilovolts_per_hours != None:
-            return self.__kilovolts_per_hours
-        self.__kilovolts_per_hours = self.__convert_from_base(ElectricPotentialChangeRateUnits.KilovoltPerHour)
-        return self.__kilovolts_per_hours
+        return self._cached_convert(ElectricPotentialChangeRateUnits.KilovoltPerHour)
 
     
     @property
@@ -818,10 +1059,7 @@ class ElectricPotentialChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__megavolts_per_hours != None:
-            return self.__megavolts_per_hours
-        self.__megavolts_per_hours = self.__convert_from_base(ElectricPotentialChangeRateUnits.MegavoltPerHour)
-        return self.__megavolts_per_hours
+        return self._cached_convert(ElectricPotentialChangeRateUnits.MegavoltPerHour)
 
     
     def to_string(self, unit: ElectricPotentialChangeRateUnits = ElectricPotentialChangeRateUnits.VoltPerSecond) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricPotentialDcUnits(Enum):
         """
             ElectricPotentialDcUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         VoltDc = 'volt_dc'
         """
@@ -44,65 +55,292 @@ class ElectricPotentialDc(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricPotentialDcUnits): The ElectricPotentialDc unit to create from, The default unit is VoltDc
     """
-    def __init__(self, value: float, from_unit: ElectricPotentialDcUnits = ElectricPotentialDcUnits.VoltDc):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricPotentialDcUnits
+
+    _base_unit = ElectricPotentialDcUnits.VoltDc
+
+    _dimensions = (2, 1, -3, -1, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 31
+
+    _binary_unit_ids = {
         
-        self.__volts_dc = None
+        ElectricPotentialDcUnits.VoltDc: 0,
         
-        self.__microvolts_dc = None
+        ElectricPotentialDcUnits.MicrovoltDc: 1,
         
-        self.__millivolts_dc = None
+        ElectricPotentialDcUnits.MillivoltDc: 2,
         
-        self.__kilovolts_dc = None
+        ElectricPotentialDcUnits.KilovoltDc: 3,
         
-        self.__megavolts_dc = None
+        ElectricPotentialDcUnits.MegavoltDc: 4,
         
+    }
 
-    def convert(self, unit: ElectricPotentialDcUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricPotentialDcUnits.VoltDc: lambda value: (value),
+        
+        ElectricPotentialDcUnits.MicrovoltDc: lambda value: ((value) / 1e-06),
+        
+        ElectricPotentialDcUnits.MillivoltDc: lambda value: ((value) / 0.001),
+        
+        ElectricPotentialDcUnits.KilovoltDc: lambda value: ((value) / 1000.0),
+        
+        ElectricPotentialDcUnits.MegavoltDc: lambda value: ((value) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricPotentialDcUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ElectricPotentialDcUnits.VoltDc:
-            return (value)
+        ElectricPotentialDcUnits.VoltDc: lambda value: (value),
         
-        if from_unit == ElectricPotentialDcUnits.MicrovoltDc:
-            return ((value) / 1e-06)
+        ElectricPotentialDcUnits.MicrovoltDc: lambda value: ((value) * 1e-06),
         
-        if from_unit == ElectricPotentialDcUnits.MillivoltDc:
-            return ((value) / 0.001)
+        ElectricPotentialDcUnits.MillivoltDc: lambda value: ((value) * 0.001),
         
-        if from_unit == ElectricPotentialDcUnits.KilovoltDc:
-            return ((value) / 1000.0)
+        ElectricPotentialDcUnits.KilovoltDc: lambda value: ((value) * 1000.0),
         
-        if from_unit == ElectricPotentialDcUnits.MegavoltDc:
-            return ((value) / 1000000.0)
+        ElectricPotentialDcUnits.MegavoltDc: lambda value: ((value) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ElectricPotentialDcUnits.VoltDc: ('1', '0'),
+        
+        ElectricPotentialDcUnits.MicrovoltDc: ('1000000', '0'),
+        
+        ElectricPotentialDcUnits.MillivoltDc: ('1000', '0'),
+        
+        ElectricPotentialDcUnits.KilovoltDc: ('1/1000', '0'),
+        
+        ElectricPotentialDcUnits.MegavoltDc: ('1/1000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricPotentialDcUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == ElectricPotentialDcUnits.VoltDc:
-            return (value)
+        ElectricPotentialDcUnits.VoltDc: ('1', '0'),
         
-        if to_unit == ElectricPotentialDcUnits.MicrovoltDc:
-            return ((value) * 1e-06)
+        ElectricPotentialDcUnits.MicrovoltDc: ('1/1000000', '0'),
         
-        if to_unit == ElectricPotentialDcUnits.MillivoltDc:
-            return ((value) * 0.001)
+        ElectricPotentialDcUnits.MillivoltDc: ('1/1000', '0'),
         
-        if to_unit == ElectricPotentialDcUnits.KilovoltDc:
-            return ((value) * 1000.0)
+        ElectricPotentialDcUnits.KilovoltDc: ('1000', '0'),
         
-        if to_unit == ElectricPotentialDcUnits.MegavoltDc:
-            return ((value) * 1000000.0)
+        ElectricPotentialDcUnits.MegavoltDc: ('1000000', '0'),
         
-        return None
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        ElectricPotentialDcUnits.VoltDc: ('Vdc',),
+        
+        ElectricPotentialDcUnits.MicrovoltDc: ('μVdc',),
+        
+        ElectricPotentialDcUnits.MillivoltDc: ('mVdc',),
+        
+        ElectricPotentialDcUnits.KilovoltDc: ('kVdc',),
+        
+        ElectricPotentialDcUnits.MegavoltDc: ('MVdc',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ElectricPotentialDcUnits = ElectricPotentialDcUnits.VoltDc):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricPotentialDcUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricPotentialDcUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ElectricPotentialDcUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricPotentialDcUnits, to_unit: ElectricPotentialDcUnits) -> float:
+        """
+        Convert a value from one ElectricPotentialDc unit to another, without creating a ElectricPotentialDc instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricPotentialDcUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricPotentialDcUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricPotentialDc._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricPotentialDcUnits, to_unit: ElectricPotentialDcUnits) -> List[float]:
+        """
+        Convert many values from one ElectricPotentialDc unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricPotentialDcUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricPotentialDcUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricPotentialDc._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricPotentialDcUnits, to_unit: ElectricPotentialDcUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricPotentialDc._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricPotentialDcUnits, to_unit: ElectricPotentialDcUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricPotentialDc unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricPotentialDcUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricPotentialDcUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricPotentialDc._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricPotentialDcUnits = ElectricPotentialDcUnits.VoltDc) -> ElectricPotentialDc:
+        """
+        Create a new instance of ElectricPotentialDc holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricPotentialDcUnits
+        :return: A new instance of ElectricPotentialDc.
+        :rtype: ElectricPotentialDc
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricPotentialDc._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricPotentialDcUnits = ElectricPotentialDcUnits.VoltDc) -> Fraction:
+        """
+        Get the exact value of the ElectricPotentialDc in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (VoltDc).
+        :type unit: ElectricPotentialDcUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricPotentialDc:
+        """
+        Parse a ElectricPotentialDc from a value followed by a unit abbreviation, e.g. "1 Vdc".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricPotentialDc.
+        :rtype: ElectricPotentialDc
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricPotentialDc.
+        """
+        return ElectricPotentialDc._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricPotentialDc]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricPotentialDc._try_parse(text)
+
+    def to_binary(self, unit: Optional[ElectricPotentialDcUnits] = None) -> bytes:
+        """
+        Encode the ElectricPotentialDc to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricPotentialDcUnits
+        :return: The encoded ElectricPotentialDc.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricPotentialDc:
+        """
+        Decode a ElectricPotentialDc encoded by to_binary.
+
+        :param data: The encoded ElectricPotentialDc, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricPotentialDc.
+        :rtype: ElectricPotentialDc
+        :raises ValueError: When the data is not a valid encoded ElectricPotentialDc.
+        """
+        return ElectricPotentialDc._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricPotentialDcUnits] = None) -> dict:
+        """
+        Get the ElectricPotentialDc DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
 
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (VoltDc).
+        :type hold_in_unit: ElectricPotentialDcUnits
+        :return: The ElectricPotentialDc DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricPotentialDcUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricPotentialDc:
+        """
+        Create a new instance of ElectricPotentialDc from its DTO.
+
+        :param dto: The ElectricPotentialDc DTO, the unit is the ElectricPotentialDcUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricPotentialDc.
+        :rtype: ElectricPotentialDc
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricPotentialDc._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricPotentialDc:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricPotentialDc._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -189,10 +427,7 @@ class ElectricPotentialDc(AbstractMeasure):
         """
         
         """
-        if self.__volts_dc != None:
-            return self.__volts_dc
-        self.__volts_dc = self.__convert_from_base(ElectricPotentialDcUnits.VoltDc)
-        return self.__volts_dc
+        return self._cached_convert(ElectricPotentialDcUnits.VoltDc)
 
     
     @property
@@ -200,10 +435,7 @@ class ElectricPotentialDc(AbstractMeasure):
         """
         
         """
-        if self.__microvolts_dc != None:
-            return self.__microvolts_dc
-        self.__microvolts_dc = self.__convert_from_base(ElectricPotentialDcUnits.MicrovoltDc)
-        return self.__microvolts_dc
+        return self._cached_convert(ElectricPotentialDcUnits.MicrovoltDc)
 
     
     @property
@@ -211,10 +443,7 @@ class ElectricPotentialDc(AbstractMeasure):
         """
         
         """
-        if self.__millivolts_dc != None:
-            return self.__millivolts_dc
-        self.__millivolts_dc = self.__convert_from_base(ElectricPotentialDcUnits.MillivoltDc)
-        return self.__millivolts_dc
+        return self._cached_convert(ElectricPotentialDcUnits.MillivoltDc)
 
     
     @property
@@ -222,10 +451,7 @@ class ElectricPotentialDc(AbstractMeasure):
         """
         
         """
-        if self.__kilovolts_dc != None:
-            return self.__kilovolts_dc
-        self.__kilovolts_dc = self.__convert_from_base(ElectricPotentialDcUnits.KilovoltDc)
-        return self.__kilovolts_dc
+        return self._cached_convert(ElectricPotentialDcUnits.KilovoltDc)
 
     
     @property
@@ -233,10 +459,7 @@ class ElectricPotentialDc(AbstractMeasure):
         """
         
         """
-        if self.__megavolts_dc != None:
-            return self.__megavolts_dc
-        self.__megavolts_dc = self.__convert_from_base(ElectricPotentialDcUnits.MegavoltDc)
-        return self.__megavolts_dc
+        return self._cached_convert(ElectricPotentialDcUnits.MegavoltDc)
 
     
     def to_string(self, unit: ElectricPotentialDcUnits = ElectricPotentialDcUnits.VoltDc) -> str:
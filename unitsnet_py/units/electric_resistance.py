@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricResistanceUnits(Enum):
         """
             ElectricResistanceUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Ohm = 'ohm'
         """
@@ -54,81 +65,316 @@ class ElectricResistance(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricResistanceUnits): The ElectricResistance unit to create from, The default unit is Ohm
     """
-    def __init__(self, value: float, from_unit: ElectricResistanceUnits = ElectricResistanceUnits.Ohm):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricResistanceUnits
+
+    _base_unit = ElectricResistanceUnits.Ohm
+
+    _dimensions = (2, 1, -3, -2, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 32
+
+    _binary_unit_ids = {
         
-        self.__ohms = None
+        ElectricResistanceUnits.Ohm: 0,
         
-        self.__microohms = None
+        ElectricResistanceUnits.Microohm: 1,
         
-        self.__milliohms = None
+        ElectricResistanceUnits.Milliohm: 2,
         
-        self.__kiloohms = None
+        ElectricResistanceUnits.Kiloohm: 3,
         
-        self.__megaohms = None
+        ElectricResistanceUnits.Megaohm: 4,
         
-        self.__gigaohms = None
+        ElectricResistanceUnits.Gigaohm: 5,
         
-        self.__teraohms = None
+        ElectricResistanceUnits.Teraohm: 6,
         
+    }
 
-    def convert(self, unit: ElectricResistanceUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricResistanceUnits.Ohm: lambda value: (value),
+        
+        ElectricResistanceUnits.Microohm: lambda value: ((value) / 1e-06),
+        
+        ElectricResistanceUnits.Milliohm: lambda value: ((value) / 0.001),
+        
+        ElectricResistanceUnits.Kiloohm: lambda value: ((value) / 1000.0),
+        
+        ElectricResistanceUnits.Megaohm: lambda value: ((value) / 1000000.0),
+        
+        ElectricResistanceUnits.Gigaohm: lambda value: ((value) / 1000000000.0),
+        
+        ElectricResistanceUnits.Teraohm: lambda value: ((value) / 1000000000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricResistanceUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ElectricResistanceUnits.Ohm:
-            return (value)
+        ElectricResistanceUnits.Ohm: lambda value: (value),
         
-        if from_unit == ElectricResistanceUnits.Microohm:
-            return ((value) / 1e-06)
+        ElectricResistanceUnits.Microohm: lambda value: ((value) * 1e-06),
         
-        if from_unit == ElectricResistanceUnits.Milliohm:
-            return ((value) / 0.001)
+        ElectricResistanceUnits.Milliohm: lambda value: ((value) * 0.001),
         
-        if from_unit == ElectricResistanceUnits.Kiloohm:
-            return ((value) / 1000.0)
+        ElectricResistanceUnits.Kiloohm: lambda value: ((value) * 1000.0),
         
-        if from_unit == ElectricResistanceUnits.Megaohm:
-            return ((value) / 1000000.0)
+        ElectricResistanceUnits.Megaohm: lambda value: ((value) * 1000000.0),
         
-        if from_unit == ElectricResistanceUnits.Gigaohm:
-            return ((value) / 1000000000.0)
+        ElectricResistanceUnits.Gigaohm: lambda value: ((value) * 1000000000.0),
         
-        if from_unit == ElectricResistanceUnits.Teraohm:
-            return ((value) / 1000000000000.0)
+        ElectricResistanceUnits.Teraohm: lambda value: ((value) * 1000000000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ElectricResistanceUnits.Ohm: ('1', '0'),
+        
+        ElectricResistanceUnits.Microohm: ('1000000', '0'),
+        
+        ElectricResistanceUnits.Milliohm: ('1000', '0'),
+        
+        ElectricResistanceUnits.Kiloohm: ('1/1000', '0'),
+        
+        ElectricResistanceUnits.Megaohm: ('1/1000000', '0'),
+        
+        ElectricResistanceUnits.Gigaohm: ('1/1000000000', '0'),
+        
+        ElectricResistanceUnits.Teraohm: ('1/1000000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricResistanceUnits) -> float:
+    _affine_to_base = {
+        
+        ElectricResistanceUnits.Ohm: ('1', '0'),
+        
+        ElectricResistanceUnits.Microohm: ('1/1000000', '0'),
+        
+        ElectricResistanceUnits.Milliohm: ('1/1000', '0'),
+        
+        ElectricResistanceUnits.Kiloohm: ('1000', '0'),
+        
+        ElectricResistanceUnits.Megaohm: ('1000000', '0'),
+        
+        ElectricResistanceUnits.Gigaohm: ('1000000000', '0'),
         
-        if to_unit == ElectricResistanceUnits.Ohm:
-            return (value)
+        ElectricResistanceUnits.Teraohm: ('1000000000000', '0'),
         
-        if to_unit == ElectricResistanceUnits.Microohm:
-            return ((value) * 1e-06)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        ElectricResistanceUnits.Ohm: ('Ω',),
         
-        if to_unit == ElectricResistanceUnits.Milliohm:
-            return ((value) * 0.001)
+        ElectricResistanceUnits.Microohm: ('μΩ',),
         
-        if to_unit == ElectricResistanceUnits.Kiloohm:
-            return ((value) * 1000.0)
+        ElectricResistanceUnits.Milliohm: ('mΩ',),
         
-        if to_unit == ElectricResistanceUnits.Megaohm:
-            return ((value) * 1000000.0)
+        ElectricResistanceUnits.Kiloohm: ('kΩ',),
         
-        if to_unit == ElectricResistanceUnits.Gigaohm:
-            return ((value) * 1000000000.0)
+        ElectricResistanceUnits.Megaohm: ('MΩ',),
         
-        if to_unit == ElectricResistanceUnits.Teraohm:
-            return ((value) * 1000000000000.0)
+        ElectricResistanceUnits.Gigaohm: ('GΩ',),
         
-        return None
+        ElectricResistanceUnits.Teraohm: ('TΩ',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ElectricResistanceUnits = ElectricResistanceUnits.Ohm):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricResistanceUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricResistanceUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ElectricResistanceUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricResistanceUnits, to_unit: ElectricResistanceUnits) -> float:
+        """
+        Convert a value from one ElectricResistance unit to another, without creating a ElectricResistance instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricResistanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricResistanceUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricResistance._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricResistanceUnits, to_unit: ElectricResistanceUnits) -> List[float]:
+        """
+        Convert many values from one ElectricResistance unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricResistanceUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricResistanceUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricResistance._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricResistanceUnits, to_unit: ElectricResistanceUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricResistance._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricResistanceUnits, to_unit: ElectricResistanceUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricResistance unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricResistanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricResistanceUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricResistance._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricResistanceUnits = ElectricResistanceUnits.Ohm) -> ElectricResistance:
+        """
+        Create a new instance of ElectricResistance holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
 
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricResistanceUnits
+        :return: A new instance of ElectricResistance.
+        :rtype: ElectricResistance
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricResistance._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricResistanceUnits = ElectricResistanceUnits.Ohm) -> Fraction:
+        """
+        Get the exact value of the ElectricResistance in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Ohm).
+        :type unit: ElectricResistanceUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricResistance:
+        """
+        Parse a ElectricResistance from a value followed by a unit abbreviation, e.g. "1 Ω".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricResistance.
+        :rtype: ElectricResistance
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricResistance.
+        """
+        return ElectricResistance._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricResistance]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricResistance._try_parse(text)
+
+    def to_binary(self, unit: Optional[ElectricResistanceUnits] = None) -> bytes:
+        """
+        Encode the ElectricResistance to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricResistanceUnits
+        :return: The encoded ElectricResistance.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricResistance:
+        """
+        Decode a ElectricResistance encoded by to_binary.
+
+        :param data: The encoded ElectricResistance, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricResistance.
+        :rtype: ElectricResistance
+        :raises ValueError: When the data is not a valid encoded ElectricResistance.
+        """
+        return ElectricResistance._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricResistanceUnits] = None) -> dict:
+        """
+        Get the ElectricResistance DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Ohm).
+        :type hold_in_unit: ElectricResistanceUnits
+        :return: The ElectricResistance DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricResistanceUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricResistance:
+        """
+        Create a new instance of ElectricResistance from its DTO.
+
+        :param dto: The ElectricResistance DTO, the unit is the ElectricResistanceUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricResistance.
+        :rtype: ElectricResistance
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricResistance._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricResistance:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricResistance._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -245,10 +491,7 @@ class ElectricResistance(AbstractMeasure):
         """
         
         """
-        if self.__ohms != None:
-            return self.__ohms
-        self.__ohms = self.__convert_from_base(ElectricResistanceUnits.Ohm)
-        return self.__ohms
+        return self._cached_convert(ElectricResistanceUnits.Ohm)
 
     
     @property
@@ -256,10 +499,7 @@ class ElectricResistance(AbstractMeasure):
         """
         
         """
-        if self.__microohms != None:
-            return self.__microohms
-        self.__microohms = self.__convert_from_base(ElectricResistanceUnits.Microohm)
-        return self.__microohms
+        return self._cached_convert(ElectricResistanceUnits.Microohm)
 
     
     @property
@@ -267,10 +507,7 @@ class ElectricResistance(AbstractMeasure):
         """
         
         """
-        if self.__milliohms != None:
-            return self.__milliohms
-        self.__milliohms = self.__convert_from_base(ElectricResistanceUnits.Milliohm)
-        return self.__milliohms
+        return self._cached_convert(ElectricResistanceUnits.Milliohm)
 
     
     @property
@@ -278,10 +515,7 @@ class ElectricResistance(AbstractMeasure):
         """
         
         """
-        if self.__kiloohms != None:
-            return self.__kiloohms
-        self.__kiloohms = self.__convert_from_base(ElectricResistanceUnits.Kiloohm)
-        return self.__kiloohms
+        return self._cached_convert(ElectricResistanceUnits.Kiloohm)
 
     
     @property
@@ -289,10 +523,7 @@ class ElectricResistance(AbstractMeasure):
         """
         
         """
-        if self.__megaohms != None:
-            return self.__megaohms
-        self.__megaohms = self.__convert_from_base(ElectricResistanceUnits.Megaohm)
-        return self.__megaohms
+        return self._cached_convert(ElectricResistanceUnits.Megaohm)
 
     
     @property
@@ -300,10 +531,7 @@ class ElectricResistance(AbstractMeasure):
         """
         
         """
-        if self.__gigaohms != None:
-            return self.__gigaohms
-        self.__gigaohms = self.__convert_from_base(ElectricResistanceUnits.Gigaohm)
-        return self.__gigaohms
+        return self._cached_convert(ElectricResistanceUnits.Gigaohm)
 
     
     @property
@@ -311,10 +539,7 @@ class ElectricResistance(AbstractMeasure):
         """
         
         """
-        if self.__teraohms != None:
-            return self.__teraohms
-        self.__teraohms = self.__convert_from_base(ElectricResistanceUnits.Teraohm)
-        return self.__teraohms
+        return self._cached_convert(ElectricResistanceUnits.Teraohm)
 
     
     def to_string(self, unit: ElectricResistanceUnits = ElectricResistanceUnits.Ohm) -> str:
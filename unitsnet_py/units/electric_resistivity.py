@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricResistivityUnits(Enum):
         """
             ElectricResistivityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         OhmMeter = 'ohm_meter'
         """
@@ -89,138 +100,401 @@ class ElectricResistivity(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricResistivityUnits): The ElectricResistivity unit to create from, The default unit is OhmMeter
     """
-    def __init__(self, value: float, from_unit: ElectricResistivityUnits = ElectricResistivityUnits.OhmMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricResistivityUnits
+
+    _base_unit = ElectricResistivityUnits.OhmMeter
+
+    _dimensions = (3, 1, -3, -2, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 33
+
+    _binary_unit_ids = {
         
-        self.__ohm_meters = None
+        ElectricResistivityUnits.OhmMeter: 0,
         
-        self.__ohms_centimeter = None
+        ElectricResistivityUnits.OhmCentimeter: 1,
         
-        self.__picoohm_meters = None
+        ElectricResistivityUnits.PicoohmMeter: 2,
         
-        self.__nanoohm_meters = None
+        ElectricResistivityUnits.NanoohmMeter: 3,
         
-        self.__microohm_meters = None
+        ElectricResistivityUnits.MicroohmMeter: 4,
         
-        self.__milliohm_meters = None
+        ElectricResistivityUnits.MilliohmMeter: 5,
         
-        self.__kiloohm_meters = None
+        ElectricResistivityUnits.KiloohmMeter: 6,
         
-        self.__megaohm_meters = None
+        ElectricResistivityUnits.MegaohmMeter: 7,
         
-        self.__picoohms_centimeter = None
+        ElectricResistivityUnits.PicoohmCentimeter: 8,
         
-        self.__nanoohms_centimeter = None
+        ElectricResistivityUnits.NanoohmCentimeter: 9,
         
-        self.__microohms_centimeter = None
+        ElectricResistivityUnits.MicroohmCentimeter: 10,
         
-        self.__milliohms_centimeter = None
+        ElectricResistivityUnits.MilliohmCentimeter: 11,
         
-        self.__kiloohms_centimeter = None
+        ElectricResistivityUnits.KiloohmCentimeter: 12,
         
-        self.__megaohms_centimeter = None
+        ElectricResistivityUnits.MegaohmCentimeter: 13,
         
+    }
 
-    def convert(self, unit: ElectricResistivityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricResistivityUnits.OhmMeter: lambda value: (value),
+        
+        ElectricResistivityUnits.OhmCentimeter: lambda value: (value * 100),
+        
+        ElectricResistivityUnits.PicoohmMeter: lambda value: ((value) / 1e-12),
+        
+        ElectricResistivityUnits.NanoohmMeter: lambda value: ((value) / 1e-09),
+        
+        ElectricResistivityUnits.MicroohmMeter: lambda value: ((value) / 1e-06),
+        
+        ElectricResistivityUnits.MilliohmMeter: lambda value: ((value) / 0.001),
+        
+        ElectricResistivityUnits.KiloohmMeter: lambda value: ((value) / 1000.0),
+        
+        ElectricResistivityUnits.MegaohmMeter: lambda value: ((value) / 1000000.0),
+        
+        ElectricResistivityUnits.PicoohmCentimeter: lambda value: ((value * 100) / 1e-12),
+        
+        ElectricResistivityUnits.NanoohmCentimeter: lambda value: ((value * 100) / 1e-09),
+        
+        ElectricResistivityUnits.MicroohmCentimeter: lambda value: ((value * 100) / 1e-06),
+        
+        ElectricResistivityUnits.MilliohmCentimeter: lambda value: ((value * 100) / 0.001),
+        
+        ElectricResistivityUnits.KiloohmCentimeter: lambda value: ((value * 100) / 1000.0),
+        
+        ElectricResistivityUnits.MegaohmCentimeter: lambda value: ((value * 100) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricResistivityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        ElectricResistivityUnits.OhmMeter: lambda value: (value),
+        
+        ElectricResistivityUnits.OhmCentimeter: lambda value: (value / 100),
+        
+        ElectricResistivityUnits.PicoohmMeter: lambda value: ((value) * 1e-12),
+        
+        ElectricResistivityUnits.NanoohmMeter: lambda value: ((value) * 1e-09),
+        
+        ElectricResistivityUnits.MicroohmMeter: lambda value: ((value) * 1e-06),
         
-        if from_unit == ElectricResistivityUnits.OhmMeter:
-            return (value)
+        ElectricResistivityUnits.MilliohmMeter: lambda value: ((value) * 0.001),
         
-        if from_unit == ElectricResistivityUnits.OhmCentimeter:
-            return (value * 100)
+        ElectricResistivityUnits.KiloohmMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == ElectricResistivityUnits.PicoohmMeter:
-            return ((value) / 1e-12)
+        ElectricResistivityUnits.MegaohmMeter: lambda value: ((value) * 1000000.0),
         
-        if from_unit == ElectricResistivityUnits.NanoohmMeter:
-            return ((value) / 1e-09)
+        ElectricResistivityUnits.PicoohmCentimeter: lambda value: ((value / 100) * 1e-12),
         
-        if from_unit == ElectricResistivityUnits.MicroohmMeter:
-            return ((value) / 1e-06)
+        ElectricResistivityUnits.NanoohmCentimeter: lambda value: ((value / 100) * 1e-09),
         
-        if from_unit == ElectricResistivityUnits.MilliohmMeter:
-            return ((value) / 0.001)
+        ElectricResistivityUnits.MicroohmCentimeter: lambda value: ((value / 100) * 1e-06),
         
-        if from_unit == ElectricResistivityUnits.KiloohmMeter:
-            return ((value) / 1000.0)
+        ElectricResistivityUnits.MilliohmCentimeter: lambda value: ((value / 100) * 0.001),
         
-        if from_unit == ElectricResistivityUnits.MegaohmMeter:
-            return ((value) / 1000000.0)
+        ElectricResistivityUnits.KiloohmCentimeter: lambda value: ((value / 100) * 1000.0),
         
-        if from_unit == ElectricResistivityUnits.PicoohmCentimeter:
-            return ((value * 100) / 1e-12)
+        ElectricResistivityUnits.MegaohmCentimeter: lambda value: ((value / 100) * 1000000.0),
         
-        if from_unit == ElectricResistivityUnits.NanoohmCentimeter:
-            return ((value * 100) / 1e-09)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ElectricResistivityUnits.OhmMeter: ('1', '0'),
+        
+        ElectricResistivityUnits.OhmCentimeter: ('100', '0'),
+        
+        ElectricResistivityUnits.PicoohmMeter: ('1000000000000', '0'),
+        
+        ElectricResistivityUnits.NanoohmMeter: ('1000000000', '0'),
+        
+        ElectricResistivityUnits.MicroohmMeter: ('1000000', '0'),
+        
+        ElectricResistivityUnits.MilliohmMeter: ('1000', '0'),
+        
+        ElectricResistivityUnits.KiloohmMeter: ('1/1000', '0'),
+        
+        ElectricResistivityUnits.MegaohmMeter: ('1/1000000', '0'),
+        
+        ElectricResistivityUnits.PicoohmCentimeter: ('100000000000000', '0'),
         
-        if from_unit == ElectricResistivityUnits.MicroohmCentimeter:
-            return ((value * 100) / 1e-06)
+        ElectricResistivityUnits.NanoohmCentimeter: ('100000000000', '0'),
         
-        if from_unit == ElectricResistivityUnits.MilliohmCentimeter:
-            return ((value * 100) / 0.001)
+        ElectricResistivityUnits.MicroohmCentimeter: ('100000000', '0'),
         
-        if from_unit == ElectricResistivityUnits.KiloohmCentimeter:
-            return ((value * 100) / 1000.0)
+        ElectricResistivityUnits.MilliohmCentimeter: ('100000', '0'),
         
-        if from_unit == ElectricResistivityUnits.MegaohmCentimeter:
-            return ((value * 100) / 1000000.0)
+        ElectricResistivityUnits.KiloohmCentimeter: ('1/10', '0'),
         
-        return None
+        ElectricResistivityUnits.MegaohmCentimeter: ('1/10000', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        ElectricResistivityUnits.OhmMeter: ('1', '0'),
+        
+        ElectricResistivityUnits.OhmCentimeter: ('1/100', '0'),
+        
+        ElectricResistivityUnits.PicoohmMeter: ('1/1000000000000', '0'),
+        
+        ElectricResistivityUnits.NanoohmMeter: ('1/1000000000', '0'),
+        
+        ElectricResistivityUnits.MicroohmMeter: ('1/1000000', '0'),
+        
+        ElectricResistivityUnits.MilliohmMeter: ('1/1000', '0'),
+        
+        ElectricResistivityUnits.KiloohmMeter: ('1000', '0'),
+        
+        ElectricResistivityUnits.MegaohmMeter: ('1000000', '0'),
+        
+        ElectricResistivityUnits.PicoohmCentimeter: ('1/100000000000000', '0'),
+        
+        ElectricResistivityUnits.NanoohmCentimeter: ('1/100000000000', '0'),
+        
+        ElectricResistivityUnits.MicroohmCentimeter: ('1/100000000', '0'),
+        
+        ElectricResistivityUnits.MilliohmCentimeter: ('1/100000', '0'),
+        
+        ElectricResistivityUnits.KiloohmCentimeter: ('10', '0'),
+        
+        ElectricResistivityUnits.MegaohmCentimeter: ('10000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricResistivityUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ElectricResistivityUnits.OhmMeter:
-            return (value)
+        ElectricResistivityUnits.OhmMeter: ('Ω·m',),
         
-        if to_unit == ElectricResistivityUnits.OhmCentimeter:
-            return (value / 100)
+        ElectricResistivityUnits.OhmCentimeter: ('Ω·cm',),
         
-        if to_unit == ElectricResistivityUnits.PicoohmMeter:
-            return ((value) * 1e-12)
+        ElectricResistivityUnits.PicoohmMeter: ('pΩ·m',),
         
-        if to_unit == ElectricResistivityUnits.NanoohmMeter:
-            return ((value) * 1e-09)
+        ElectricResistivityUnits.NanoohmMeter: ('nΩ·m',),
         
-        if to_unit == ElectricResistivityUnits.MicroohmMeter:
-            return ((value) * 1e-06)
+        ElectricResistivityUnits.MicroohmMeter: ('μΩ·m',),
         
-        if to_unit == ElectricResistivityUnits.MilliohmMeter:
-            return ((value) * 0.001)
+        ElectricResistivityUnits.MilliohmMeter: ('mΩ·m',),
         
-        if to_unit == ElectricResistivityUnits.KiloohmMeter:
-            return ((value) * 1000.0)
+        ElectricResistivityUnits.KiloohmMeter: ('kΩ·m',),
         
-        if to_unit == ElectricResistivityUnits.MegaohmMeter:
-            return ((value) * 1000000.0)
+        ElectricResistivityUnits.MegaohmMeter: ('MΩ·m',),
         
-        if to_unit == ElectricResistivityUnits.PicoohmCentimeter:
-            return ((value / 100) * 1e-12)
+        ElectricResistivityUnits.PicoohmCentimeter: ('pΩ·cm',),
         
-        if to_unit == ElectricResistivityUnits.NanoohmCentimeter:
-            return ((value / 100) * 1e-09)
+        ElectricResistivityUnits.NanoohmCentimeter: ('nΩ·cm',),
         
-        if to_unit == ElectricResistivityUnits.MicroohmCentimeter:
-            return ((value / 100) * 1e-06)
+        ElectricResistivityUnits.MicroohmCentimeter: ('μΩ·cm',),
         
-        if to_unit == ElectricResistivityUnits.MilliohmCentimeter:
-            return ((value / 100) * 0.001)
+        ElectricResistivityUnits.MilliohmCentimeter: ('mΩ·cm',),
         
-        if to_unit == ElectricResistivityUnits.KiloohmCentimeter:
-            return ((value / 100) * 1000.0)
+        ElectricResistivityUnits.KiloohmCentimeter: ('kΩ·cm',),
         
-        if to_unit == ElectricResistivityUnits.MegaohmCentimeter:
-            return ((value / 100) * 1000000.0)
+        ElectricResistivityUnits.MegaohmCentimeter: ('MΩ·cm',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: ElectricResistivityUnits = ElectricResistivityUnits.OhmMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricResistivityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricResistivityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
 
 
+    def __convert_to_base(self, value: float, to_unit: ElectricResistivityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricResistivityUnits, to_unit: ElectricResistivityUnits) -> float:
+        """
+        Convert a value from one ElectricResistivity unit to another, without creating a ElectricResistivity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricResistivityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricResistivityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricResistivity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricResistivityUnits, to_unit: ElectricResistivityUnits) -> List[float]:
+        """
+        Convert many values from one ElectricResistivity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricResistivityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricResistivityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricResistivity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricResistivityUnits, to_unit: ElectricResistivityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricResistivity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricResistivityUnits, to_unit: ElectricResistivityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricResistivity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricResistivityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricResistivityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricResistivity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricResistivityUnits = ElectricResistivityUnits.OhmMeter) -> ElectricResistivity:
+        """
+        Create a new instance of ElectricResistivity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricResistivityUnits
+        :return: A new instance of ElectricResistivity.
+        :rtype: ElectricResistivity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricResistivity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricResistivityUnits = ElectricResistivityUnits.OhmMeter) -> Fraction:
+        """
+        Get the exact value of the ElectricResistivity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (OhmMeter).
+        :type unit: ElectricResistivityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricResistivity:
+        """
+        Parse a ElectricResistivity from a value followed by a unit abbreviation, e.g. "1 Ω·m".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricResistivity.
+        :rtype: ElectricResistivity
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricResistivity.
+        """
+        return ElectricResistivity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricResistivity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricResistivity._try_parse(text)
+
+    def to_binary(self, unit: Optional[ElectricResistivityUnits] = None) -> bytes:
+        """
+        Encode the ElectricResistivity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricResistivityUnits
+        :return: The encoded ElectricResistivity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricResistivity:
+        """
+        Decode a ElectricResistivity encoded by to_binary.
+
+        :param data: The encoded ElectricResistivity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricResistivity.
+        :rtype: ElectricResistivity
+        :raises ValueError: When the data is not a valid encoded ElectricResistivity.
+        """
+        return ElectricResistivity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricResistivityUnits] = None) -> dict:
+        """
+        Get the ElectricResistivity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (OhmMeter).
+        :type hold_in_unit: ElectricResistivityUnits
+        :return: The ElectricResistivity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricResistivityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricResistivity:
+        """
+        Create a new instance of ElectricResistivity from its DTO.
+
+        :param dto: The ElectricResistivity DTO, the unit is the ElectricResistivityUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricResistivity.
+        :rtype: ElectricResistivity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricResistivity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricResistivity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricResistivity._from_json(text)
+
     @property
     def base_value(self) -> float:
         return self._value
@@ -441,10 +715,7 @@ class ElectricResistivity(AbstractMeasure):
         """
         
         """
-        if self.__ohm_meters != None:
-            return self.__ohm_meters
-        self.__ohm_meters = self.__convert_from_base(ElectricResistivityUnits.OhmMeter)
-        return self.__ohm_meters
+        return self._cached_convert(ElectricResistivityUnits.OhmMeter)
 
     
     @property
@@ -452,10 +723,7 @@ class ElectricResistivity(AbstractMeasure):
         """
         
         """
-        if self.__ohms_centimeter != None:
-            return self.__ohms_centimeter
-        self.__ohms_centimeter = self.__convert_from_base(ElectricResistivityUnits.OhmCentimeter)
-        return self.__ohms_centimeter
+        return self._cached_convert(ElectricResistivityUnits.OhmCentimeter)
 
     
     @property
@@ -463,10 +731,7 @@ class ElectricResistivity(AbstractMeasure):
         """
         
         """
-        if self.__picoohm_meters != None:
-            return self.__picoohm_meters
-        self.__picoohm_meters = self.__convert_from_base(ElectricResistivityUnits.PicoohmMeter)
-        return self.__picoohm_meters
+        return self._cached_convert(ElectricResistivityUnits.PicoohmMeter)
 
     
     @property
@@ -474,10 +739,7 @@ class ElectricResistivity(AbstractMeasure):
         """
         
         """
-        if self.__nanoohm_meters != None:
-            return self.__nanoohm_meters
-        self.__nanoohm_meters = self.__convert_from_base(ElectricResistivityUnits.NanoohmMeter)
-        return self.__nanoohm_meters
+        return self._cached_convert(ElectricResistivityUnits.NanoohmMeter)
 
     
     @property
@@ -485,10 +747,7 @@ class ElectricResistivity(AbstractMeasure):
         """
         
         """
-        if self.__microohm_meters != None:
-            return self.__microohm_meters
-        self.__microohm_meters = self.__convert_from_base(ElectricResistivityUnits.MicroohmMeter)
-        return self.__microohm_meters
+        return self._cached_convert(ElectricResistivityUnits.MicroohmMeter)
 
     
     @property
@@ -496,10 +755,7 @@ class ElectricResistivity(AbstractMeasure):
         """
         
         """
-        if self.__milliohm_meters != None:
-            return self.__milliohm_meters
-        self.__milliohm_meters = self.__convert_from_base(ElectricResistivityUnits.MilliohmMeter)
-        return self.__milliohm_meters
+        return self._cached_convert(ElectricResistivityUnits.MilliohmMeter)
 
     
     @property
@@ -507,10 +763,7 @@ class ElectricResistivity(AbstractMeasure):
         """
         
         """
-        if self.__kiloohm_meters != None:
-            return self.__kiloohm_meters
-        self.__kiloohm_meters = self.__convert_from_base(ElectricResistivityUnits.KiloohmMeter)
-        return self.__kiloohm_meters
+        return self._cached_convert(ElectricResistivityUnits.KiloohmMeter)
 
     
     @property
@@ -518,10 +771,7 @@ class ElectricResistivity(AbstractMeasure):
         """
         
         """
-        if self.__megaohm_meters != None:
-            return self.__megaohm_meters
-        self.__megaohm_meters = self.__convert_from_base(ElectricResistivityUnits.MegaohmMeter)
-        return self.__megaohm_meters
+        return self._cached_convert(ElectricResistivityUnits.MegaohmMeter)
 
     
     @property
@@ -529,10 +779,7 @@ class ElectricResistivity(AbstractMeasure):
         """
         
         """
-        if self.__picoohms_centimeter != None:
-            return self.__picoohms_centimeter
-        self.__picoohms_centimeter = self.__convert_from_base(ElectricResistivityUnits.PicoohmCentimeter)
-        return self.__picoohms_centimeter
+        return self._cached_convert(ElectricResistivityUnits.PicoohmCentimeter)
 
     
     @property
@@ -540,10 +787,7 @@ class ElectricResistivity(AbstractMeasure):
         """
         
         """
-        if self.__nanoohms_centimeter != None:
-            return self.__nanoohms_centimeter
-        self.__nanoohms_centimeter = self.__convert_from_base(ElectricResistivityUnits.NanoohmCentimeter)
-        return self.__nanoohms_centimeter
+        return self._cached_convert(ElectricResistivityUnits.NanoohmCentimeter)
 
     
     @property
@@ -551,10 +795,7 @@ class ElectricResistivity(AbstractMeasure):
         """
         
         """
-        if self.__microohms_centimeter != None:
-            return self.__microohms_centimeter
-        self.__microohms_centimeter = self.__convert_from_base(ElectricResistivityUnits.MicroohmCentimeter)
-        return self.__microohms_centimeter
+        return self._cached_convert(ElectricResistivityUnits.MicroohmCentimeter)
 
     
     @property
@@ -562,10 +803,7 @@ class ElectricResistivity(AbstractMeasure):
         """
         
         """
-        if self.__milliohms_centimeter != None:
-            return self.__milliohms_centimeter
-        self.__milliohms_centimeter = self.__convert_from_base(ElectricResistivityUnits.MilliohmCentimeter)
-        return self.__milliohms_centimeter
+        return self._cached_convert(ElectricResistivityUnits.MilliohmCentimeter)
 
     
     @property
@@ -573,10 +811,7 @@ class ElectricResistivity(AbstractMeasure):
         """
         
         """
-        if self.__kiloohms_centimeter != None:
-            return self.__kiloohms_centimeter
-        self.__kiloohms_centimeter = self.__convert_from_base(ElectricResistivityUnits.KiloohmCentimeter)
-        return self.__kiloohms_centimeter
+        return self._cached_convert(ElectricResistivityUnits.KiloohmCentimeter)
 
     
     @property
@@ -584,10 +819,7 @@ class ElectricResistivity(AbstractMeasure):
         """
         
         """
-        if self.__megaohms_centimeter != None:
-            return self.__megaohms_centimeter
-        self.__megaohms_centimeter = self.__convert_from_base(ElectricResistivityUnits.MegaohmCentimeter)
-        return self.__megaohms_centimeter
+        return self._cached_convert(ElectricResistivityUnits.MegaohmCentimeter)
 
     
     def to_string(self, unit: ElectricResistivityUnits = ElectricResistivityUnits.OhmMeter) -> str:
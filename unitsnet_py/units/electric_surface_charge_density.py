@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ElectricSurfaceChargeDensityUnits(Enum):
         """
             ElectricSurfaceChargeDensityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         CoulombPerSquareMeter = 'coulomb_per_square_meter'
         """
@@ -34,49 +45,268 @@ class ElectricSurfaceChargeDensity(AbstractMeasure):
         value (float): The value.
         from_unit (ElectricSurfaceChargeDensityUnits): The ElectricSurfaceChargeDensity unit to create from, The default unit is CoulombPerSquareMeter
     """
-    def __init__(self, value: float, from_unit: ElectricSurfaceChargeDensityUnits = ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ElectricSurfaceChargeDensityUnits
+
+    _base_unit = ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter
+
+    _dimensions = (-2, 0, 1, 1, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 34
+
+    _binary_unit_ids = {
         
-        self.__coulombs_per_square_meter = None
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter: 0,
         
-        self.__coulombs_per_square_centimeter = None
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareCentimeter: 1,
         
-        self.__coulombs_per_square_inch = None
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareInch: 2,
         
+    }
 
-    def convert(self, unit: ElectricSurfaceChargeDensityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter: lambda value: (value),
+        
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareCentimeter: lambda value: (value / 1.0e4),
+        
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareInch: lambda value: (value / 1.5500031000062000e3),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ElectricSurfaceChargeDensityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter:
-            return (value)
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter: lambda value: (value),
         
-        if from_unit == ElectricSurfaceChargeDensityUnits.CoulombPerSquareCentimeter:
-            return (value / 1.0e4)
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareCentimeter: lambda value: (value * 1.0e4),
         
-        if from_unit == ElectricSurfaceChargeDensityUnits.CoulombPerSquareInch:
-            return (value / 1.5500031000062000e3)
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareInch: lambda value: (value * 1.5500031000062000e3),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter: ('1', '0'),
+        
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareCentimeter: ('1/10000', '0'),
+        
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareInch: ('5000000000/7750015500031', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ElectricSurfaceChargeDensityUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter:
-            return (value)
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter: ('1', '0'),
         
-        if to_unit == ElectricSurfaceChargeDensityUnits.CoulombPerSquareCentimeter:
-            return (value * 1.0e4)
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareCentimeter: ('10000', '0'),
+        
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareInch: ('7750015500031/5000000000', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ElectricSurfaceChargeDensityUnits.CoulombPerSquareInch:
-            return (value * 1.5500031000062000e3)
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter: ('C/m²',),
         
-        return None
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareCentimeter: ('C/cm²',),
+        
+        ElectricSurfaceChargeDensityUnits.CoulombPerSquareInch: ('C/in²',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ElectricSurfaceChargeDensityUnits = ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ElectricSurfaceChargeDensityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ElectricSurfaceChargeDensityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ElectricSurfaceChargeDensityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ElectricSurfaceChargeDensityUnits, to_unit: ElectricSurfaceChargeDensityUnits) -> float:
+        """
+        Convert a value from one ElectricSurfaceChargeDensity unit to another, without creating a ElectricSurfaceChargeDensity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricSurfaceChargeDensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricSurfaceChargeDensityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ElectricSurfaceChargeDensity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ElectricSurfaceChargeDensityUnits, to_unit: ElectricSurfaceChargeDensityUnits) -> List[float]:
+        """
+        Convert many values from one ElectricSurfaceChargeDensity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ElectricSurfaceChargeDensityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ElectricSurfaceChargeDensityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ElectricSurfaceChargeDensity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ElectricSurfaceChargeDensityUnits, to_unit: ElectricSurfaceChargeDensityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ElectricSurfaceChargeDensity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ElectricSurfaceChargeDensityUnits, to_unit: ElectricSurfaceChargeDensityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ElectricSurfaceChargeDensity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricSurfaceChargeDensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ElectricSurfaceChargeDensityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ElectricSurfaceChargeDensity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ElectricSurfaceChargeDensityUnits = ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter) -> ElectricSurfaceChargeDensity:
+        """
+        Create a new instance of ElectricSurfaceChargeDensity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ElectricSurfaceChargeDensityUnits
+        :return: A new instance of ElectricSurfaceChargeDensity.
+        :rtype: ElectricSurfaceChargeDensity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ElectricSurfaceChargeDensity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ElectricSurfaceChargeDensityUnits = ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter) -> Fraction:
+        """
+        Get the exact value of the ElectricSurfaceChargeDensity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (CoulombPerSquareMeter).
+        :type unit: ElectricSurfaceChargeDensityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ElectricSurfaceChargeDensity:
+        """
+        Parse a ElectricSurfaceChargeDensity from a value followed by a unit abbreviation, e.g. "1 C/m²".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ElectricSurfaceChargeDensity.
+        :rtype: ElectricSurfaceChargeDensity
+        :raises ValueError: When the string is not a valid or an ambiguous ElectricSurfaceChargeDensity.
+        """
+        return ElectricSurfaceChargeDensity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ElectricSurfaceChargeDensity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ElectricSurfaceChargeDensity._try_parse(text)
 
+    def to_binary(self, unit: Optional[ElectricSurfaceChargeDensityUnits] = None) -> bytes:
+        """
+        Encode the ElectricSurfaceChargeDensity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ElectricSurfaceChargeDensityUnits
+        :return: The encoded ElectricSurfaceChargeDensity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ElectricSurfaceChargeDensity:
+        """
+        Decode a ElectricSurfaceChargeDensity encoded by to_binary.
+
+        :param data: The encoded ElectricSurfaceChargeDensity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ElectricSurfaceChargeDensity.
+        :rtype: ElectricSurfaceChargeDensity
+        :raises ValueError: When the data is not a valid encoded ElectricSurfaceChargeDensity.
+        """
+        return ElectricSurfaceChargeDensity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ElectricSurfaceChargeDensityUnits] = None) -> dict:
+        """
+        Get the ElectricSurfaceChargeDensity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (CoulombPerSquareMeter).
+        :type hold_in_unit: ElectricSurfaceChargeDensityUnits
+        :return: The ElectricSurfaceChargeDensity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ElectricSurfaceChargeDensityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ElectricSurfaceChargeDensity:
+        """
+        Create a new instance of ElectricSurfaceChargeDensity from its DTO.
+
+        :param dto: The ElectricSurfaceChargeDensity DTO, the unit is the ElectricSurfaceChargeDensityUnits value or name.
+        :type dto: dict
+        :return: A new instance of ElectricSurfaceChargeDensity.
+        :rtype: ElectricSurfaceChargeDensity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ElectricSurfaceChargeDensity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ElectricSurfaceChargeDensity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ElectricSurfaceChargeDensity._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -133,10 +363,7 @@ class ElectricSurfaceChargeDensity(AbstractMeasure):
         """
         
         """
-        if self.__coulombs_per_square_meter != None:
-            return self.__coulombs_per_square_meter
-        self.__coulombs_per_square_meter = self.__convert_from_base(ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter)
-        return self.__coulombs_per_square_meter
+        return self._cached_convert(ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter)
 
     
     @property
@@ -144,10 +371,7 @@ class ElectricSurfaceChargeDensity(AbstractMeasure):
         """
         
         """
-        if self.__coulombs_per_square_centimeter != None:
-            return self.__coulombs_per_square_centimeter
-        self.__coulombs_per_square_centimeter = self.__convert_from_base(ElectricSurfaceChargeDensityUnits.CoulombPerSquareCentimeter)
-        return self.__coulombs_per_square_centimeter
+        return self._cached_convert(ElectricSurfaceChargeDensityUnits.CoulombPerSquareCentimeter)
 
     
     @property
@@ -155,10 +379,7 @@ class ElectricSurfaceChargeDensity(AbstractMeasure):
         """
         
         """
-        if self.__coulombs_per_square_inch != None:
-            return self.__coulombs_per_square_inch
-        self.__coulombs_per_square_inch = self.__convert_from_base(ElectricSurfaceChargeDensityUnits.CoulombPerSquareInch)
-        return self.__coulombs_per_square_inch
+        return self._cached_convert(ElectricSurfaceChargeDensityUnits.CoulombPerSquareInch)
 
     
     def to_string(self, unit: ElectricSurfaceChargeDensityUnits = ElectricSurfaceChargeDensityUnits.CoulombPerSquareMeter) -> str:
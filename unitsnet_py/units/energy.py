@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class EnergyUnits(Enum):
         """
             EnergyUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Joule = 'joule'
         """
@@ -209,329 +220,688 @@ class Energy(AbstractMeasure):
         value (float): The value.
         from_unit (EnergyUnits): The Energy unit to create from, The default unit is Joule
     """
-    def __init__(self, value: float, from_unit: EnergyUnits = EnergyUnits.Joule):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = EnergyUnits
+
+    _base_unit = EnergyUnits.Joule
+
+    _dimensions = (2, 1, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 35
+
+    _binary_unit_ids = {
         
-        self.__joules = None
+        EnergyUnits.Joule: 0,
         
-        self.__calories = None
+        EnergyUnits.Calorie: 1,
         
-        self.__british_thermal_units = None
+        EnergyUnits.BritishThermalUnit: 2,
         
-        self.__electron_volts = None
+        EnergyUnits.ElectronVolt: 3,
         
-        self.__foot_pounds = None
+        EnergyUnits.FootPound: 4,
         
-        self.__ergs = None
+        EnergyUnits.Erg: 5,
         
-        self.__watt_hours = None
+        EnergyUnits.WattHour: 6,
         
-        self.__watt_days = None
+        EnergyUnits.WattDay: 7,
         
-        self.__therms_ec = None
+        EnergyUnits.ThermEc: 8,
         
-        self.__therms_us = None
+        EnergyUnits.ThermUs: 9,
         
-        self.__therms_imperial = None
+        EnergyUnits.ThermImperial: 10,
         
-        self.__horsepower_hours = None
+        EnergyUnits.HorsepowerHour: 11,
         
-        self.__millijoules = None
+        EnergyUnits.Millijoule: 12,
         
-        self.__kilojoules = None
+        EnergyUnits.Kilojoule: 13,
         
-        self.__megajoules = None
+        EnergyUnits.Megajoule: 14,
         
-        self.__gigajoules = None
+        EnergyUnits.Gigajoule: 15,
         
-        self.__terajoules = None
+        EnergyUnits.Terajoule: 16,
         
-        self.__petajoules = None
+        EnergyUnits.Petajoule: 17,
         
-        self.__kilocalories = None
+        EnergyUnits.Kilocalorie: 18,
         
-        self.__megacalories = None
+        EnergyUnits.Megacalorie: 19,
         
-        self.__kilobritish_thermal_units = None
+        EnergyUnits.KilobritishThermalUnit: 20,
         
-        self.__megabritish_thermal_units = None
+        EnergyUnits.MegabritishThermalUnit: 21,
         
-        self.__gigabritish_thermal_units = None
+        EnergyUnits.GigabritishThermalUnit: 22,
         
-        self.__kiloelectron_volts = None
+        EnergyUnits.KiloelectronVolt: 23,
         
-        self.__megaelectron_volts = None
+        EnergyUnits.MegaelectronVolt: 24,
         
-        self.__gigaelectron_volts = None
+        EnergyUnits.GigaelectronVolt: 25,
         
-        self.__teraelectron_volts = None
+        EnergyUnits.TeraelectronVolt: 26,
         
-        self.__kilowatt_hours = None
+        EnergyUnits.KilowattHour: 27,
         
-        self.__megawatt_hours = None
+        EnergyUnits.MegawattHour: 28,
         
-        self.__gigawatt_hours = None
+        EnergyUnits.GigawattHour: 29,
         
-        self.__terawatt_hours = None
+        EnergyUnits.TerawattHour: 30,
         
-        self.__kilowatt_days = None
+        EnergyUnits.KilowattDay: 31,
         
-        self.__megawatt_days = None
+        EnergyUnits.MegawattDay: 32,
         
-        self.__gigawatt_days = None
+        EnergyUnits.GigawattDay: 33,
         
-        self.__terawatt_days = None
+        EnergyUnits.TerawattDay: 34,
         
-        self.__decatherms_ec = None
+        EnergyUnits.DecathermEc: 35,
         
-        self.__decatherms_us = None
+        EnergyUnits.DecathermUs: 36,
         
-        self.__decatherms_imperial = None
+        EnergyUnits.DecathermImperial: 37,
         
+    }
 
-    def convert(self, unit: EnergyUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        EnergyUnits.Joule: lambda value: (value),
+        
+        EnergyUnits.Calorie: lambda value: (value / 4.184),
+        
+        EnergyUnits.BritishThermalUnit: lambda value: (value / 1055.05585262),
+        
+        EnergyUnits.ElectronVolt: lambda value: (value / 1.602176565e-19),
+        
+        EnergyUnits.FootPound: lambda value: (value / 1.355817948),
+        
+        EnergyUnits.Erg: lambda value: (value / 1e-7),
+        
+        EnergyUnits.WattHour: lambda value: (value / 3600),
+        
+        EnergyUnits.WattDay: lambda value: (value / (24 * 3600)),
+        
+        EnergyUnits.ThermEc: lambda value: (value / 1.05505585262e8),
+        
+        EnergyUnits.ThermUs: lambda value: (value / 1.054804e8),
+        
+        EnergyUnits.ThermImperial: lambda value: (value / 1.05505585257348e8),
+        
+        EnergyUnits.HorsepowerHour: lambda value: (value / 2.6845195377e6),
+        
+        EnergyUnits.Millijoule: lambda value: ((value) / 0.001),
+        
+        EnergyUnits.Kilojoule: lambda value: ((value) / 1000.0),
+        
+        EnergyUnits.Megajoule: lambda value: ((value) / 1000000.0),
+        
+        EnergyUnits.Gigajoule: lambda value: ((value) / 1000000000.0),
+        
+        EnergyUnits.Terajoule: lambda value: ((value) / 1000000000000.0),
+        
+        EnergyUnits.Petajoule: lambda value: ((value) / 1000000000000000.0),
+        
+        EnergyUnits.Kilocalorie: lambda value: ((value / 4.184) / 1000.0),
+        
+        EnergyUnits.Megacalorie: lambda value: ((value / 4.184) / 1000000.0),
+        
+        EnergyUnits.KilobritishThermalUnit: lambda value: ((value / 1055.05585262) / 1000.0),
+        
+        EnergyUnits.MegabritishThermalUnit: lambda value: ((value / 1055.05585262) / 1000000.0),
+        
+        EnergyUnits.GigabritishThermalUnit: lambda value: ((value / 1055.05585262) / 1000000000.0),
+        
+        EnergyUnits.KiloelectronVolt: lambda value: ((value / 1.602176565e-19) / 1000.0),
+        
+        EnergyUnits.MegaelectronVolt: lambda value: ((value / 1.602176565e-19) / 1000000.0),
+        
+        EnergyUnits.GigaelectronVolt: lambda value: ((value / 1.602176565e-19) / 1000000000.0),
+        
+        EnergyUnits.TeraelectronVolt: lambda value: ((value / 1.602176565e-19) / 1000000000000.0),
+        
+        EnergyUnits.KilowattHour: lambda value: ((value / 3600) / 1000.0),
+        
+        EnergyUnits.MegawattHour: lambda value: ((value / 3600) / 1000000.0),
+        
+        EnergyUnits.GigawattHour: lambda value: ((value / 3600) / 1000000000.0),
+        
+        EnergyUnits.TerawattHour: lambda value: ((value / 3600) / 1000000000000.0),
+        
+        EnergyUnits.KilowattDay: lambda value: ((value / (24 * 3600)) / 1000.0),
+        
+        EnergyUnits.MegawattDay: lambda value: ((value / (24 * 3600)) / 1000000.0),
+        
+        EnergyUnits.GigawattDay: lambda value: ((value / (24 * 3600)) / 1000000000.0),
+        
+        EnergyUnits.TerawattDay: lambda value: ((value / (24 * 3600)) / 1000000000000.0),
+        
+        EnergyUnits.DecathermEc: lambda value: ((value / 1.05505585262e8) / 10.0),
+        
+        EnergyUnits.DecathermUs: lambda value: ((value / 1.054804e8) / 10.0),
+        
+        EnergyUnits.DecathermImperial: lambda value: ((value / 1.05505585257348e8) / 10.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: EnergyUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == EnergyUnits.Joule:
-            return (value)
+        EnergyUnits.Joule: lambda value: (value),
         
-        if from_unit == EnergyUnits.Calorie:
-            return (value / 4.184)
+        EnergyUnits.Calorie: lambda value: (value * 4.184),
         
-        if from_unit == EnergyUnits.BritishThermalUnit:
-            return (value / 1055.05585262)
+        EnergyUnits.BritishThermalUnit: lambda value: (value * 1055.05585262),
         
-        if from_unit == EnergyUnits.ElectronVolt:
-            return (value / 1.602176565e-19)
+        EnergyUnits.ElectronVolt: lambda value: (value * 1.602176565e-19),
         
-        if from_unit == EnergyUnits.FootPound:
-            return (value / 1.355817948)
+        EnergyUnits.FootPound: lambda value: (value * 1.355817948),
         
-        if from_unit == EnergyUnits.Erg:
-            return (value / 1e-7)
+        EnergyUnits.Erg: lambda value: (value * 1e-7),
         
-        if from_unit == EnergyUnits.WattHour:
-            return (value / 3600)
+        EnergyUnits.WattHour: lambda value: (value * 3600),
         
-        if from_unit == EnergyUnits.WattDay:
-            return (value / (24 * 3600))
+        EnergyUnits.WattDay: lambda value: (value * 24 * 3600),
         
-        if from_unit == EnergyUnits.ThermEc:
-            return (value / 1.05505585262e8)
+        EnergyUnits.ThermEc: lambda value: (value * 1.05505585262e8),
         
-        if from_unit == EnergyUnits.ThermUs:
-            return (value / 1.054804e8)
+        EnergyUnits.ThermUs: lambda value: (value * 1.054804e8),
         
-        if from_unit == EnergyUnits.ThermImperial:
-            return (value / 1.05505585257348e8)
+        EnergyUnits.ThermImperial: lambda value: (value * 1.05505585257348e8),
         
-        if from_unit == EnergyUnits.HorsepowerHour:
-            return (value / 2.6845195377e6)
+        EnergyUnits.HorsepowerHour: lambda value: (value * 2.6845195377e6),
         
-        if from_unit == EnergyUnits.Millijoule:
-            return ((value) / 0.001)
+        EnergyUnits.Millijoule: lambda value: ((value) * 0.001),
         
-        if from_unit == EnergyUnits.Kilojoule:
-            return ((value) / 1000.0)
+        EnergyUnits.Kilojoule: lambda value: ((value) * 1000.0),
         
-        if from_unit == EnergyUnits.Megajoule:
-            return ((value) / 1000000.0)
+        EnergyUnits.Megajoule: lambda value: ((value) * 1000000.0),
         
-        if from_unit == EnergyUnits.Gigajoule:
-            return ((value) / 1000000000.0)
+        EnergyUnits.Gigajoule: lambda value: ((value) * 1000000000.0),
         
-        if from_unit == EnergyUnits.Terajoule:
-            return ((value) / 1000000000000.0)
+        EnergyUnits.Terajoule: lambda value: ((value) * 1000000000000.0),
         
-        if from_unit == EnergyUnits.Petajoule:
-            return ((value) / 1000000000000000.0)
+        EnergyUnits.Petajoule: lambda value: ((value) * 1000000000000000.0),
         
-        if from_unit == EnergyUnits.Kilocalorie:
-            return ((value / 4.184) / 1000.0)
+        EnergyUnits.Kilocalorie: lambda value: ((value * 4.184) * 1000.0),
         
-        if from_unit == EnergyUnits.Megacalorie:
-            return ((value / 4.184) / 1000000.0)
+        EnergyUnits.Megacalorie: lambda value: ((value * 4.184) * 1000000.0),
         
-        if from_unit == EnergyUnits.KilobritishThermalUnit:
-            return ((value / 1055.05585262) / 1000.0)
+        EnergyUnits.KilobritishThermalUnit: lambda value: ((value * 1055.05585262) * 1000.0),
         
-        if from_unit == EnergyUnits.MegabritishThermalUnit:
-            return ((value / 1055.05585262) / 1000000.0)
+        EnergyUnits.MegabritishThermalUnit: lambda value: ((value * 1055.05585262) * 1000000.0),
         
-        if from_unit == EnergyUnits.GigabritishThermalUnit:
-            return ((value / 1055.05585262) / 1000000000.0)
+        EnergyUnits.GigabritishThermalUnit: lambda value: ((value * 1055.05585262) * 1000000000.0),
         
-        if from_unit == EnergyUnits.KiloelectronVolt:
-            return ((value / 1.602176565e-19) / 1000.0)
+        EnergyUnits.KiloelectronVolt: lambda value: ((value * 1.602176565e-19) * 1000.0),
         
-        if from_unit == EnergyUnits.MegaelectronVolt:
-            return ((value / 1.602176565e-19) / 1000000.0)
+        EnergyUnits.MegaelectronVolt: lambda value: ((value * 1.602176565e-19) * 1000000.0),
         
-        if from_unit == EnergyUnits.GigaelectronVolt:
-            return ((value / 1.602176565e-19) / 1000000000.0)
+        EnergyUnits.GigaelectronVolt: lambda value: ((value * 1.602176565e-19) * 1000000000.0),
         
-        if from_unit == EnergyUnits.TeraelectronVolt:
-            return ((value / 1.602176565e-19) / 1000000000000.0)
+        EnergyUnits.TeraelectronVolt: lambda value: ((value * 1.602176565e-19) * 1000000000000.0),
         
-        if from_unit == EnergyUnits.KilowattHour:
-            return ((value / 3600) / 1000.0)
+        EnergyUnits.KilowattHour: lambda value: ((value * 3600) * 1000.0),
         
-        if from_unit == EnergyUnits.MegawattHour:
-            return ((value / 3600) / 1000000.0)
+        EnergyUnits.MegawattHour: lambda value: ((value * 3600) * 1000000.0),
         
-        if from_unit == EnergyUnits.GigawattHour:
-            return ((value / 3600) / 1000000000.0)
+        EnergyUnits.GigawattHour: lambda value: ((value * 3600) * 1000000000.0),
         
-        if from_unit == EnergyUnits.TerawattHour:
-            return ((value / 3600) / 1000000000000.0)
+        EnergyUnits.TerawattHour: lambda value: ((value * 3600) * 1000000000000.0),
         
-        if from_unit == EnergyUnits.KilowattDay:
-            return ((value / (24 * 3600)) / 1000.0)
+        EnergyUnits.KilowattDay: lambda value: ((value * 24 * 3600) * 1000.0),
         
-        if from_unit == EnergyUnits.MegawattDay:
-            return ((value / (24 * 3600)) / 1000000.0)
+        EnergyUnits.MegawattDay: lambda value: ((value * 24 * 3600) * 1000000.0),
         
-        if from_unit == EnergyUnits.GigawattDay:
-            return ((value / (24 * 3600)) / 1000000000.0)
+        EnergyUnits.GigawattDay: lambda value: ((value * 24 * 3600) * 1000000000.0),
         
-        if from_unit == EnergyUnits.TerawattDay:
-            return ((value / (24 * 3600)) / 1000000000000.0)
+        EnergyUnits.TerawattDay: lambda value: ((value * 24 * 3600) * 1000000000000.0),
         
-        if from_unit == EnergyUnits.DecathermEc:
-            return ((value / 1.05505585262e8) / 10.0)
+        EnergyUnits.DecathermEc: lambda value: ((value * 1.05505585262e8) * 10.0),
         
-        if from_unit == EnergyUnits.DecathermUs:
-            return ((value / 1.054804e8) / 10.0)
+        EnergyUnits.DecathermUs: lambda value: ((value * 1.054804e8) * 10.0),
         
-        if from_unit == EnergyUnits.DecathermImperial:
-            return ((value / 1.05505585257348e8) / 10.0)
+        EnergyUnits.DecathermImperial: lambda value: ((value * 1.05505585257348e8) * 10.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        EnergyUnits.Joule: ('1', '0'),
+        
+        EnergyUnits.Calorie: ('125/523', '0'),
+        
+        EnergyUnits.BritishThermalUnit: ('50000000/52752792631', '0'),
+        
+        EnergyUnits.ElectronVolt: ('2000000000000000000000000000/320435313', '0'),
+        
+        EnergyUnits.FootPound: ('250000000/338954487', '0'),
+        
+        EnergyUnits.Erg: ('10000000', '0'),
+        
+        EnergyUnits.WattHour: ('1/3600', '0'),
+        
+        EnergyUnits.WattDay: ('1/86400', '0'),
+        
+        EnergyUnits.ThermEc: ('500/52752792631', '0'),
+        
+        EnergyUnits.ThermUs: ('1/105480400', '0'),
+        
+        EnergyUnits.ThermImperial: ('250000/26376396314337', '0'),
+        
+        EnergyUnits.HorsepowerHour: ('10000/26845195377', '0'),
+        
+        EnergyUnits.Millijoule: ('1000', '0'),
+        
+        EnergyUnits.Kilojoule: ('1/1000', '0'),
+        
+        EnergyUnits.Megajoule: ('1/1000000', '0'),
+        
+        EnergyUnits.Gigajoule: ('1/1000000000', '0'),
+        
+        EnergyUnits.Terajoule: ('1/1000000000000', '0'),
+        
+        EnergyUnits.Petajoule: ('1/1000000000000000', '0'),
+        
+        EnergyUnits.Kilocalorie: ('1/4184', '0'),
+        
+        EnergyUnits.Megacalorie: ('1/4184000', '0'),
+        
+        EnergyUnits.KilobritishThermalUnit: ('50000/52752792631', '0'),
+        
+        EnergyUnits.MegabritishThermalUnit: ('50/52752792631', '0'),
+        
+        EnergyUnits.GigabritishThermalUnit: ('1/1055055852620', '0'),
+        
+        EnergyUnits.KiloelectronVolt: ('2000000000000000000000000/320435313', '0'),
+        
+        EnergyUnits.MegaelectronVolt: ('2000000000000000000000/320435313', '0'),
+        
+        EnergyUnits.GigaelectronVolt: ('2000000000000000000/320435313', '0'),
+        
+        EnergyUnits.TeraelectronVolt: ('2000000000000000/320435313', '0'),
+        
+        EnergyUnits.KilowattHour: ('1/3600000', '0'),
+        
+        EnergyUnits.MegawattHour: ('1/3600000000', '0'),
+        
+        EnergyUnits.GigawattHour: ('1/3600000000000', '0'),
+        
+        EnergyUnits.TerawattHour: ('1/3600000000000000', '0'),
+        
+        EnergyUnits.KilowattDay: ('1/86400000', '0'),
+        
+        EnergyUnits.MegawattDay: ('1/86400000000', '0'),
+        
+        EnergyUnits.GigawattDay: ('1/86400000000000', '0'),
+        
+        EnergyUnits.TerawattDay: ('1/86400000000000000', '0'),
+        
+        EnergyUnits.DecathermEc: ('50/52752792631', '0'),
+        
+        EnergyUnits.DecathermUs: ('1/1054804000', '0'),
+        
+        EnergyUnits.DecathermImperial: ('25000/26376396314337', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: EnergyUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == EnergyUnits.Joule:
-            return (value)
+        EnergyUnits.Joule: ('1', '0'),
         
-        if to_unit == EnergyUnits.Calorie:
-            return (value * 4.184)
+        EnergyUnits.Calorie: ('523/125', '0'),
         
-        if to_unit == EnergyUnits.BritishThermalUnit:
-            return (value * 1055.05585262)
+        EnergyUnits.BritishThermalUnit: ('52752792631/50000000', '0'),
         
-        if to_unit == EnergyUnits.ElectronVolt:
-            return (value * 1.602176565e-19)
+        EnergyUnits.ElectronVolt: ('320435313/2000000000000000000000000000', '0'),
         
-        if to_unit == EnergyUnits.FootPound:
-            return (value * 1.355817948)
+        EnergyUnits.FootPound: ('338954487/250000000', '0'),
         
-        if to_unit == EnergyUnits.Erg:
-            return (value * 1e-7)
+        EnergyUnits.Erg: ('1/10000000', '0'),
         
-        if to_unit == EnergyUnits.WattHour:
-            return (value * 3600)
+        EnergyUnits.WattHour: ('3600', '0'),
         
-        if to_unit == EnergyUnits.WattDay:
-            return (value * 24 * 3600)
+        EnergyUnits.WattDay: ('86400', '0'),
         
-        if to_unit == EnergyUnits.ThermEc:
-            return (value * 1.05505585262e8)
+        EnergyUnits.ThermEc: ('52752792631/500', '0'),
         
-        if to_unit == EnergyUnits.ThermUs:
-            return (value * 1.054804e8)
+        EnergyUnits.ThermUs: ('105480400', '0'),
         
-        if to_unit == EnergyUnits.ThermImperial:
-            return (value * 1.05505585257348e8)
+        EnergyUnits.ThermImperial: ('26376396314337/250000', '0'),
         
-        if to_unit == EnergyUnits.HorsepowerHour:
-            return (value * 2.6845195377e6)
+        EnergyUnits.HorsepowerHour: ('26845195377/10000', '0'),
         
-        if to_unit == EnergyUnits.Millijoule:
-            return ((value) * 0.001)
+        EnergyUnits.Millijoule: ('1/1000', '0'),
         
-        if to_unit == EnergyUnits.Kilojoule:
-            return ((value) * 1000.0)
+        EnergyUnits.Kilojoule: ('1000', '0'),
         
-        if to_unit == EnergyUnits.Megajoule:
-            return ((value) * 1000000.0)
+        EnergyUnits.Megajoule: ('1000000', '0'),
         
-        if to_unit == EnergyUnits.Gigajoule:
-            return ((value) * 1000000000.0)
+        EnergyUnits.Gigajoule: ('1000000000', '0'),
         
-        if to_unit == EnergyUnits.Terajoule:
-            return ((value) * 1000000000000.0)
+        EnergyUnits.Terajoule: ('1000000000000', '0'),
         
-        if to_unit == EnergyUnits.Petajoule:
-            return ((value) * 1000000000000000.0)
+        EnergyUnits.Petajoule: ('1000000000000000', '0'),
         
-        if to_unit == EnergyUnits.Kilocalorie:
-            return ((value * 4.184) * 1000.0)
+        EnergyUnits.Kilocalorie: ('4184', '0'),
         
-        if to_unit == EnergyUnits.Megacalorie:
-            return ((value * 4.184) * 1000000.0)
+        EnergyUnits.Megacalorie: ('4184000', '0'),
         
-        if to_unit == EnergyUnits.KilobritishThermalUnit:
-            return ((value * 1055.05585262) * 1000.0)
+        EnergyUnits.KilobritishThermalUnit: ('52752792631/50000', '0'),
         
-        if to_unit == EnergyUnits.MegabritishThermalUnit:
-            return ((value * 1055.05585262) * 1000000.0)
+        EnergyUnits.MegabritishThermalUnit: ('52752792631/50', '0'),
         
-        if to_unit == EnergyUnits.GigabritishThermalUnit:
-            return ((value * 1055.05585262) * 1000000000.0)
+        EnergyUnits.GigabritishThermalUnit: ('1055055852620', '0'),
         
-        if to_unit == EnergyUnits.KiloelectronVolt:
-            return ((value * 1.602176565e-19) * 1000.0)
+        EnergyUnits.KiloelectronVolt: ('320435313/2000000000000000000000000', '0'),
         
-        if to_unit == EnergyUnits.MegaelectronVolt:
-            return ((value * 1.602176565e-19) * 1000000.0)
+        EnergyUnits.MegaelectronVolt: ('320435313/2000000000000000000000', '0'),
         
-        if to_unit == EnergyUnits.GigaelectronVolt:
-            return ((value * 1.602176565e-19) * 1000000000.0)
+        EnergyUnits.GigaelectronVolt: ('320435313/2000000000000000000', '0'),
         
-        if to_unit == EnergyUnits.TeraelectronVolt:
-            return ((value * 1.602176565e-19) * 1000000000000.0)
+        EnergyUnits.TeraelectronVolt: ('320435313/2000000000000000', '0'),
         
-        if to_unit == EnergyUnits.KilowattHour:
-            return ((value * 3600) * 1000.0)
+        EnergyUnits.KilowattHour: ('3600000', '0'),
         
-        if to_unit == EnergyUnits.MegawattHour:
-            return ((value * 3600) * 1000000.0)
+        EnergyUnits.MegawattHour: ('3600000000', '0'),
         
-        if to_unit == EnergyUnits.GigawattHour:
-            return ((value * 3600) * 1000000000.0)
+        EnergyUnits.GigawattHour: ('3600000000000', '0'),
         
-        if to_unit == EnergyUnits.TerawattHour:
-            return ((value * 3600) * 1000000000000.0)
+        EnergyUnits.TerawattHour: ('3600000000000000', '0'),
         
-        if to_unit == EnergyUnits.KilowattDay:
-            return ((value * 24 * 3600) * 1000.0)
+        EnergyUnits.KilowattDay: ('86400000', '0'),
         
-        if to_unit == EnergyUnits.MegawattDay:
-            return ((value * 24 * 3600) * 1000000.0)
+        EnergyUnits.MegawattDay: ('86400000000', '0'),
         
-        if to_unit == EnergyUnits.GigawattDay:
-            return ((value * 24 * 3600) * 1000000000.0)
+        EnergyUnits.GigawattDay: ('86400000000000', '0'),
         
-        if to_unit == EnergyUnits.TerawattDay:
-            return ((value * 24 * 3600) * 1000000000000.0)
+        EnergyUnits.TerawattDay: ('86400000000000000', '0'),
         
-        if to_unit == EnergyUnits.DecathermEc:
-            return ((value * 1.05505585262e8) * 10.0)
+        EnergyUnits.DecathermEc: ('52752792631/50', '0'),
         
-        if to_unit == EnergyUnits.DecathermUs:
-            return ((value * 1.054804e8) * 10.0)
+        EnergyUnits.DecathermUs: ('1054804000', '0'),
         
-        if to_unit == EnergyUnits.DecathermImperial:
-            return ((value * 1.05505585257348e8) * 10.0)
+        EnergyUnits.DecathermImperial: ('26376396314337/25000', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        EnergyUnits.Joule: ('J',),
+        
+        EnergyUnits.Calorie: ('cal',),
+        
+        EnergyUnits.BritishThermalUnit: ('BTU',),
+        
+        EnergyUnits.ElectronVolt: ('eV',),
+        
+        EnergyUnits.FootPound: ('ft·lb',),
+        
+        EnergyUnits.Erg: ('erg',),
+        
+        EnergyUnits.WattHour: ('Wh',),
+        
+        EnergyUnits.WattDay: ('Wd',),
+        
+        EnergyUnits.ThermEc: ('th (E.C.)',),
+        
+        EnergyUnits.ThermUs: ('th (U.S.)',),
+        
+        EnergyUnits.ThermImperial: ('th (imp.)',),
+        
+        EnergyUnits.HorsepowerHour: ('hp·h',),
+        
+        EnergyUnits.Millijoule: ('mJ',),
+        
+        EnergyUnits.Kilojoule: ('kJ',),
+        
+        EnergyUnits.Megajoule: ('MJ',),
+        
+        EnergyUnits.Gigajoule: ('GJ',),
+        
+        EnergyUnits.Terajoule: ('TJ',),
+        
+        EnergyUnits.Petajoule: ('PJ',),
+        
+        EnergyUnits.Kilocalorie: ('kcal',),
+        
+        EnergyUnits.Megacalorie: ('Mcal',),
+        
+        EnergyUnits.KilobritishThermalUnit: ('kBTU',),
+        
+        EnergyUnits.MegabritishThermalUnit: ('MBTU',),
+        
+        EnergyUnits.GigabritishThermalUnit: ('GBTU',),
+        
+        EnergyUnits.KiloelectronVolt: ('keV',),
+        
+        EnergyUnits.MegaelectronVolt: ('MeV',),
+        
+        EnergyUnits.GigaelectronVolt: ('GeV',),
+        
+        EnergyUnits.TeraelectronVolt: ('TeV',),
+        
+        EnergyUnits.KilowattHour: ('kWh',),
+        
+        EnergyUnits.MegawattHour: ('MWh',),
+        
+        EnergyUnits.GigawattHour: ('GWh',),
+        
+        EnergyUnits.TerawattHour: ('TWh',),
+        
+        EnergyUnits.KilowattDay: ('kWd',),
+        
+        EnergyUnits.MegawattDay: ('MWd',),
+        
+        EnergyUnits.GigawattDay: ('GWd',),
+        
+        EnergyUnits.TerawattDay: ('TWd',),
+        
+        EnergyUnits.DecathermEc: ('dath (E.C.)',),
+        
+        EnergyUnits.DecathermUs: ('dath (U.S.)',),
+        
+        EnergyUnits.DecathermImperial: ('dath (imp.)',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: EnergyUnits = EnergyUnits.Joule):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: EnergyUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: EnergyUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: EnergyUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: EnergyUnits, to_unit: EnergyUnits) -> float:
+        """
+        Convert a value from one Energy unit to another, without creating a Energy instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: EnergyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: EnergyUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Energy._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: EnergyUnits, to_unit: EnergyUnits) -> List[float]:
+        """
+        Convert many values from one Energy unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: EnergyUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: EnergyUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Energy._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: EnergyUnits, to_unit: EnergyUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Energy._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: EnergyUnits, to_unit: EnergyUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Energy unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: EnergyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: EnergyUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Energy._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: EnergyUnits = EnergyUnits.Joule) -> Energy:
+        """
+        Create a new instance of Energy holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: EnergyUnits
+        :return: A new instance of Energy.
+        :rtype: Energy
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Energy._from_exact(value, from_unit)
+
+    def to_exact(self, unit: EnergyUnits = EnergyUnits.Joule) -> Fraction:
+        """
+        Get the exact value of the Energy in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Joule).
+        :type unit: EnergyUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Energy:
+        """
+        Parse a Energy from a value followed by a unit abbreviation, e.g. "1 J".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Energy.
+        :rtype: Energy
+        :raises ValueError: When the string is not a valid or an ambiguous Energy.
+        """
+        return Energy._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Energy]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Energy._try_parse(text)
+
+    def to_binary(self, unit: Optional[EnergyUnits] = None) -> bytes:
+        """
+        Encode the Energy to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: EnergyUnits
+        :return: The encoded Energy.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Energy:
+        """
+        Decode a Energy encoded by to_binary.
+
+        :param data: The encoded Energy, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Energy.
+        :rtype: Energy
+        :raises ValueError: When the data is not a valid encoded Energy.
+        """
+        return Energy._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[EnergyUnits] = None) -> dict:
+        """
+        Get the Energy DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Joule).
+        :type hold_in_unit: EnergyUnits
+        :return: The Energy DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[EnergyUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Energy:
+        """
+        Create a new instance of Energy from its DTO.
+
+        :param dto: The Energy DTO, the unit is the EnergyUnits value or name.
+        :type dto: dict
+        :return: A new instance of Energy.
+        :rtype: Energy
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Energy._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Energy:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Energy._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -1113,10 +1483,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__joules != None:
-            return self.__joules
-        self.__joules = self.__convert_from_base(EnergyUnits.Joule)
-        return self.__joules
+        return self._cached_convert(EnergyUnits.Joule)
 
     
     @property
@@ -1124,10 +1491,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__calories != None:
-            return self.__calories
-        self.__calories = self.__convert_from_base(EnergyUnits.Calorie)
-        return self.__calories
+        return self._cached_convert(EnergyUnits.Calorie)
 
     
     @property
@@ -1135,10 +1499,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__british_thermal_units != None:
-            return self.__british_thermal_units
-        self.__british_thermal_units = self.__convert_from_base(EnergyUnits.BritishThermalUnit)
-        return self.__british_thermal_units
+        return self._cached_convert(EnergyUnits.BritishThermalUnit)
 
     
     @property
@@ -1146,10 +1507,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__electron_volts != None:
-            return self.__electron_volts
-        self.__electron_volts = self.__convert_from_base(EnergyUnits.ElectronVolt)
-        return self.__electron_volts
+        return self._cached_convert(EnergyUnits.ElectronVolt)
 
     
     @property
@@ -1157,10 +1515,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__foot_pounds != None:
-            return self.__foot_pounds
-        self.__foot_pounds = self.__convert_from_base(EnergyUnits.FootPound)
-        return self.__foot_pounds
+        return self._cached_convert(EnergyUnits.FootPound)
 
     
     @property
@@ -1168,10 +1523,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__ergs != None:
-            return self.__ergs
-        self.__ergs = self.__convert_from_base(EnergyUnits.Erg)
-        return self.__ergs
+        return self._cached_convert(EnergyUnits.Erg)
 
     
     @property
@@ -1179,10 +1531,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__watt_hours != None:
-            return self.__watt_hours
-        self.__watt_hours = self.__convert_from_base(EnergyUnits.WattHour)
-        return self.__watt_hours
+        return self._cached_convert(EnergyUnits.WattHour)
 
     
     @property
@@ -1190,10 +1539,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__watt_days != None:
-            return self.__watt_days
-        self.__watt_days = self.__convert_from_base(EnergyUnits.WattDay)
-        return self.__watt_days
+        return self._cached_convert(EnergyUnits.WattDay)
 
     
     @property
@@ -1201,10 +1547,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__therms_ec != None:
-            return self.__therms_ec
-        self.__therms_ec = self.__convert_from_base(EnergyUnits.ThermEc)
-        return self.__therms_ec
+        return self._cached_convert(EnergyUnits.ThermEc)
 
     
     @property
@@ -1212,10 +1555,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__therms_us != None:
-            return self.__therms_us
-        self.__therms_us = self.__convert_from_base(EnergyUnits.ThermUs)
-        return self.__therms_us
+        return self._cached_convert(EnergyUnits.ThermUs)
 
     
     @property
@@ -1223,10 +1563,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__therms_imperial != None:
-            return self.__therms_imperial
-        self.__therms_imperial = self.__convert_from_base(EnergyUnits.ThermImperial)
-        return self.__therms_imperial
+        return self._cached_convert(EnergyUnits.ThermImperial)
 
     
     @property
@@ -1234,10 +1571,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__horsepower_hours != None:
-            return self.__horsepower_hours
-        self.__horsepower_hours = self.__convert_from_base(EnergyUnits.HorsepowerHour)
-        return self.__horsepower_hours
+        return self._cached_convert(EnergyUnits.HorsepowerHour)
 
     
     @property
@@ -1245,10 +1579,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__millijoules != None:
-            return self.__millijoules
-        self.__millijoules = self.__convert_from_base(EnergyUnits.Millijoule)
-        return self.__millijoules
+        return self._cached_convert(EnergyUnits.Millijoule)
 
     
     @property
@@ -1256,10 +1587,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__kilojoules != None:
-            return self.__kilojoules
-        self.__kilojoules = self.__convert_from_base(EnergyUnits.Kilojoule)
-        return self.__kilojoules
+        return self._cached_convert(EnergyUnits.Kilojoule)
 
     
     @property
@@ -1267,10 +1595,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__megajoules != None:
-            return self.__megajoules
-        self.__megajoules = self.__convert_from_base(EnergyUnits.Megajoule)
-        return self.__megajoules
+        return self._cached_convert(EnergyUnits.Megajoule)
 
     
     @property
@@ -1278,10 +1603,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__gigajoules != None:
-            return self.__gigajoules
-        self.__gigajoules = self.__convert_from_base(EnergyUnits.Gigajoule)
-        return self.__gigajoules
+        return self._cached_convert(EnergyUnits.Gigajoule)
 
     
     @property
@@ -1289,10 +1611,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__terajoules != None:
-            return self.__terajoules
-        self.__terajoules = self.__convert_from_base(EnergyUnits.Terajoule)
-        return self.__terajoules
+        return self._cached_convert(EnergyUnits.Terajoule)
 
     
     @property
@@ -1300,10 +1619,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__petajoules != None:
-            return self.__petajoules
-        self.__petajoules = self.__convert_from_base(EnergyUnits.Petajoule)
-        return self.__petajoules
+        return self._cached_convert(EnergyUnits.Petajoule)
 
     
     @property
@@ -1311,10 +1627,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__kilocalories != None:
-            return self.__kilocalories
-        self.__kilocalories = self.__convert_from_base(EnergyUnits.Kilocalorie)
-        return self.__kilocalories
+        return self._cached_convert(EnergyUnits.Kilocalorie)
 
     
     @property
@@ -1322,10 +1635,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__megacalories != None:
-            return self.__megacalories
-        self.__megacalories = self.__convert_from_base(EnergyUnits.Megacalorie)
-        return self.__megacalories
+        return self._cached_convert(EnergyUnits.Megacalorie)
 
     
     @property
@@ -1333,10 +1643,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__kilobritish_thermal_units != None:
-            return self.__kilobritish_thermal_units
-        self.__kilobritish_thermal_units = self.__convert_from_base(EnergyUnits.KilobritishThermalUnit)
-        return self.__kilobritish_thermal_units
+        return self._cached_convert(EnergyUnits.KilobritishThermalUnit)
 
     
     @property
@@ -1344,10 +1651,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__megabritish_thermal_units != None:
-            return self.__megabritish_thermal_units
-        self.__megabritish_thermal_units = self.__convert_from_base(EnergyUnits.MegabritishThermalUnit)
-        return self.__megabritish_thermal_units
+        return self._cached_convert(EnergyUnits.MegabritishThermalUnit)
 
     
     @property
@@ -1355,10 +1659,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__gigabritish_thermal_units != None:
-            return self.__gigabritish_thermal_units
-        self.__gigabritish_thermal_units = self.__convert_from_base(EnergyUnits.GigabritishThermalUnit)
-        return self.__gigabritish_thermal_units
+        return self._cached_convert(EnergyUnits.GigabritishThermalUnit)
 
     
     @property
@@ -1366,10 +1667,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__kiloelectron_volts != None:
-            return self.__kiloelectron_volts
-        self.__kiloelectron_volts = self.__convert_from_base(EnergyUnits.KiloelectronVolt)
-        return self.__kiloelectron_volts
+        return self._cached_convert(EnergyUnits.KiloelectronVolt)
 
     
     @property
@@ -1377,10 +1675,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__megaelectron_volts != None:
-            return self.__megaelectron_volts
-        self.__megaelectron_volts = self.__convert_from_base(EnergyUnits.MegaelectronVolt)
-        return self.__megaelectron_volts
+        return self._cached_convert(EnergyUnits.MegaelectronVolt)
 
     
     @property
@@ -1388,10 +1683,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__gigaelectron_volts != None:
-            return self.__gigaelectron_volts
-        self.__gigaelectron_volts = self.__convert_from_base(EnergyUnits.GigaelectronVolt)
-        return self.__gigaelectron_volts
+        return self._cached_convert(EnergyUnits.GigaelectronVolt)
 
     
     @property
@@ -1399,10 +1691,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__teraelectron_volts != None:
-            return self.__teraelectron_volts
-        self.__teraelectron_volts = self.__convert_from_base(EnergyUnits.TeraelectronVolt)
-        return self.__teraelectron_volts
+        return self._cached_convert(EnergyUnits.TeraelectronVolt)
 
     
     @property
@@ -1410,10 +1699,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__kilowatt_hours != None:
-            return self.__kilowatt_hours
-        self.__kilowatt_hours = self.__convert_from_base(EnergyUnits.KilowattHour)
-        return self.__kilowatt_hours
+        return self._cached_convert(EnergyUnits.KilowattHour)
 
     
     @property
@@ -1421,10 +1707,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__megawatt_hours != None:
-            return self.__megawatt_hours
-        self.__megawatt_hours = self.__convert_from_base(EnergyUnits.MegawattHour)
-        return self.__megawatt_hours
+        return self._cached_convert(EnergyUnits.MegawattHour)
 
     
     @property
@@ -1432,10 +1715,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__gigawatt_hours != None:
-            return self.__gigawatt_hours
-        self.__gigawatt_hours = self.__convert_from_base(EnergyUnits.GigawattHour)
-        return self.__gigawatt_hours
+        return self._cached_convert(EnergyUnits.GigawattHour)
 
     
     @property
@@ -1443,10 +1723,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__terawatt_hours != None:
-            return self.__terawatt_hours
-        self.__terawatt_hours = self.__convert_from_base(EnergyUnits.TerawattHour)
-        return self.__terawatt_hours
+        return self._cached_convert(EnergyUnits.TerawattHour)
 
     
     @property
@@ -1454,10 +1731,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__kilowatt_days != None:
-            return self.__kilowatt_days
-        self.__kilowatt_days = self.__convert_from_base(EnergyUnits.KilowattDay)
-        return self.__kilowatt_days
+        return self._cached_convert(EnergyUnits.KilowattDay)
 
     
     @property
@@ -1465,10 +1739,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__megawatt_days != None:
-            return self.__megawatt_days
-        self.__megawatt_days = self.__convert_from_base(EnergyUnits.MegawattDay)
-        return self.__megawatt_days
+        return self._cached_convert(EnergyUnits.MegawattDay)
 
     
     @property
@@ -1476,10 +1747,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__gigawatt_days != None:
-            return self.__gigawatt_days
-        self.__gigawatt_days = self.__convert_from_base(EnergyUnits.GigawattDay)
-        return self.__gigawatt_days
+        return self._cached_convert(EnergyUnits.GigawattDay)
 
     
     @property
@@ -1487,10 +1755,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__terawatt_days != None:
-            return self.__terawatt_days
-        self.__terawatt_days = self.__convert_from_base(EnergyUnits.TerawattDay)
-        return self.__terawatt_days
+        return self._cached_convert(EnergyUnits.TerawattDay)
 
     
     @property
@@ -1498,10 +1763,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__decatherms_ec != None:
-            return self.__decatherms_ec
-        self.__decatherms_ec = self.__convert_from_base(EnergyUnits.DecathermEc)
-        return self.__decatherms_ec
+        return self._cached_convert(EnergyUnits.DecathermEc)
 
     
     @property
@@ -1509,10 +1771,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__decatherms_us != None:
-            return self.__decatherms_us
-        self.__decatherms_us = self.__convert_from_base(EnergyUnits.DecathermUs)
-        return self.__decatherms_us
+        return self._cached_convert(EnergyUnits.DecathermUs)
 
     
     @property
@@ -1520,10 +1779,7 @@ class Energy(AbstractMeasure):
         """
         
         """
-        if self.__decatherms_imperial != None:
-            return self.__decatherms_imperial
-        self.__decatherms_imperial = self.__convert_from_base(EnergyUnits.DecathermImperial)
-        return self.__decatherms_imperial
+        return self._cached_convert(EnergyUnits.DecathermImperial)
 
     
     def to_string(self, unit: EnergyUnits = EnergyUnits.Joule) -> str:
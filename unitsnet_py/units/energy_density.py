@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class EnergyDensityUnits(Enum):
         """
             EnergyDensityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         JoulePerCubicMeter = 'joule_per_cubic_meter'
         """
@@ -79,122 +90,377 @@ class EnergyDensity(AbstractMeasure):
         value (float): The value.
         from_unit (EnergyDensityUnits): The EnergyDensity unit to create from, The default unit is JoulePerCubicMeter
     """
-    def __init__(self, value: float, from_unit: EnergyDensityUnits = EnergyDensityUnits.JoulePerCubicMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = EnergyDensityUnits
+
+    _base_unit = EnergyDensityUnits.JoulePerCubicMeter
+
+    _dimensions = (-1, 1, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 36
+
+    _binary_unit_ids = {
         
-        self.__joules_per_cubic_meter = None
+        EnergyDensityUnits.JoulePerCubicMeter: 0,
         
-        self.__watt_hours_per_cubic_meter = None
+        EnergyDensityUnits.WattHourPerCubicMeter: 1,
         
-        self.__kilojoules_per_cubic_meter = None
+        EnergyDensityUnits.KilojoulePerCubicMeter: 2,
         
-        self.__megajoules_per_cubic_meter = None
+        EnergyDensityUnits.MegajoulePerCubicMeter: 3,
         
-        self.__gigajoules_per_cubic_meter = None
+        EnergyDensityUnits.GigajoulePerCubicMeter: 4,
         
-        self.__terajoules_per_cubic_meter = None
+        EnergyDensityUnits.TerajoulePerCubicMeter: 5,
         
-        self.__petajoules_per_cubic_meter = None
+        EnergyDensityUnits.PetajoulePerCubicMeter: 6,
         
-        self.__kilowatt_hours_per_cubic_meter = None
+        EnergyDensityUnits.KilowattHourPerCubicMeter: 7,
         
-        self.__megawatt_hours_per_cubic_meter = None
+        EnergyDensityUnits.MegawattHourPerCubicMeter: 8,
         
-        self.__gigawatt_hours_per_cubic_meter = None
+        EnergyDensityUnits.GigawattHourPerCubicMeter: 9,
         
-        self.__terawatt_hours_per_cubic_meter = None
+        EnergyDensityUnits.TerawattHourPerCubicMeter: 10,
         
-        self.__petawatt_hours_per_cubic_meter = None
+        EnergyDensityUnits.PetawattHourPerCubicMeter: 11,
         
+    }
 
-    def convert(self, unit: EnergyDensityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        EnergyDensityUnits.JoulePerCubicMeter: lambda value: (value),
+        
+        EnergyDensityUnits.WattHourPerCubicMeter: lambda value: (value / 3.6e+3),
+        
+        EnergyDensityUnits.KilojoulePerCubicMeter: lambda value: ((value) / 1000.0),
+        
+        EnergyDensityUnits.MegajoulePerCubicMeter: lambda value: ((value) / 1000000.0),
+        
+        EnergyDensityUnits.GigajoulePerCubicMeter: lambda value: ((value) / 1000000000.0),
+        
+        EnergyDensityUnits.TerajoulePerCubicMeter: lambda value: ((value) / 1000000000000.0),
+        
+        EnergyDensityUnits.PetajoulePerCubicMeter: lambda value: ((value) / 1000000000000000.0),
+        
+        EnergyDensityUnits.KilowattHourPerCubicMeter: lambda value: ((value / 3.6e+3) / 1000.0),
+        
+        EnergyDensityUnits.MegawattHourPerCubicMeter: lambda value: ((value / 3.6e+3) / 1000000.0),
+        
+        EnergyDensityUnits.GigawattHourPerCubicMeter: lambda value: ((value / 3.6e+3) / 1000000000.0),
+        
+        EnergyDensityUnits.TerawattHourPerCubicMeter: lambda value: ((value / 3.6e+3) / 1000000000000.0),
+        
+        EnergyDensityUnits.PetawattHourPerCubicMeter: lambda value: ((value / 3.6e+3) / 1000000000000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: EnergyDensityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == EnergyDensityUnits.JoulePerCubicMeter:
-            return (value)
+        EnergyDensityUnits.JoulePerCubicMeter: lambda value: (value),
         
-        if from_unit == EnergyDensityUnits.WattHourPerCubicMeter:
-            return (value / 3.6e+3)
+        EnergyDensityUnits.WattHourPerCubicMeter: lambda value: (value * 3.6e+3),
         
-        if from_unit == EnergyDensityUnits.KilojoulePerCubicMeter:
-            return ((value) / 1000.0)
+        EnergyDensityUnits.KilojoulePerCubicMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == EnergyDensityUnits.MegajoulePerCubicMeter:
-            return ((value) / 1000000.0)
+        EnergyDensityUnits.MegajoulePerCubicMeter: lambda value: ((value) * 1000000.0),
         
-        if from_unit == EnergyDensityUnits.GigajoulePerCubicMeter:
-            return ((value) / 1000000000.0)
+        EnergyDensityUnits.GigajoulePerCubicMeter: lambda value: ((value) * 1000000000.0),
         
-        if from_unit == EnergyDensityUnits.TerajoulePerCubicMeter:
-            return ((value) / 1000000000000.0)
+        EnergyDensityUnits.TerajoulePerCubicMeter: lambda value: ((value) * 1000000000000.0),
         
-        if from_unit == EnergyDensityUnits.PetajoulePerCubicMeter:
-            return ((value) / 1000000000000000.0)
+        EnergyDensityUnits.PetajoulePerCubicMeter: lambda value: ((value) * 1000000000000000.0),
         
-        if from_unit == EnergyDensityUnits.KilowattHourPerCubicMeter:
-            return ((value / 3.6e+3) / 1000.0)
+        EnergyDensityUnits.KilowattHourPerCubicMeter: lambda value: ((value * 3.6e+3) * 1000.0),
         
-        if from_unit == EnergyDensityUnits.MegawattHourPerCubicMeter:
-            return ((value / 3.6e+3) / 1000000.0)
+        EnergyDensityUnits.MegawattHourPerCubicMeter: lambda value: ((value * 3.6e+3) * 1000000.0),
         
-        if from_unit == EnergyDensityUnits.GigawattHourPerCubicMeter:
-            return ((value / 3.6e+3) / 1000000000.0)
+        EnergyDensityUnits.GigawattHourPerCubicMeter: lambda value: ((value * 3.6e+3) * 1000000000.0),
         
-        if from_unit == EnergyDensityUnits.TerawattHourPerCubicMeter:
-            return ((value / 3.6e+3) / 1000000000000.0)
+        EnergyDensityUnits.TerawattHourPerCubicMeter: lambda value: ((value * 3.6e+3) * 1000000000000.0),
         
-        if from_unit == EnergyDensityUnits.PetawattHourPerCubicMeter:
-            return ((value / 3.6e+3) / 1000000000000000.0)
+        EnergyDensityUnits.PetawattHourPerCubicMeter: lambda value: ((value * 3.6e+3) * 1000000000000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        EnergyDensityUnits.JoulePerCubicMeter: ('1', '0'),
+        
+        EnergyDensityUnits.WattHourPerCubicMeter: ('1/3600', '0'),
+        
+        EnergyDensityUnits.KilojoulePerCubicMeter: ('1/1000', '0'),
+        
+        EnergyDensityUnits.MegajoulePerCubicMeter: ('1/1000000', '0'),
+        
+        EnergyDensityUnits.GigajoulePerCubicMeter: ('1/1000000000', '0'),
+        
+        EnergyDensityUnits.TerajoulePerCubicMeter: ('1/1000000000000', '0'),
+        
+        EnergyDensityUnits.PetajoulePerCubicMeter: ('1/1000000000000000', '0'),
+        
+        EnergyDensityUnits.KilowattHourPerCubicMeter: ('1/3600000', '0'),
+        
+        EnergyDensityUnits.MegawattHourPerCubicMeter: ('1/3600000000', '0'),
+        
+        EnergyDensityUnits.GigawattHourPerCubicMeter: ('1/3600000000000', '0'),
+        
+        EnergyDensityUnits.TerawattHourPerCubicMeter: ('1/3600000000000000', '0'),
+        
+        EnergyDensityUnits.PetawattHourPerCubicMeter: ('1/3600000000000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: EnergyDensityUnits) -> float:
+    _affine_to_base = {
+        
+        EnergyDensityUnits.JoulePerCubicMeter: ('1', '0'),
         
-        if to_unit == EnergyDensityUnits.JoulePerCubicMeter:
-            return (value)
+        EnergyDensityUnits.WattHourPerCubicMeter: ('3600', '0'),
         
-        if to_unit == EnergyDensityUnits.WattHourPerCubicMeter:
-            return (value * 3.6e+3)
+        EnergyDensityUnits.KilojoulePerCubicMeter: ('1000', '0'),
         
-        if to_unit == EnergyDensityUnits.KilojoulePerCubicMeter:
-            return ((value) * 1000.0)
+        EnergyDensityUnits.MegajoulePerCubicMeter: ('1000000', '0'),
         
-        if to_unit == EnergyDensityUnits.MegajoulePerCubicMeter:
-            return ((value) * 1000000.0)
+        EnergyDensityUnits.GigajoulePerCubicMeter: ('1000000000', '0'),
+        
+        EnergyDensityUnits.TerajoulePerCubicMeter: ('1000000000000', '0'),
+        
+        EnergyDensityUnits.PetajoulePerCubicMeter: ('1000000000000000', '0'),
+        
+        EnergyDensityUnits.KilowattHourPerCubicMeter: ('3600000', '0'),
+        
+        EnergyDensityUnits.MegawattHourPerCubicMeter: ('3600000000', '0'),
+        
+        EnergyDensityUnits.GigawattHourPerCubicMeter: ('3600000000000', '0'),
+        
+        EnergyDensityUnits.TerawattHourPerCubicMeter: ('3600000000000000', '0'),
+        
+        EnergyDensityUnits.PetawattHourPerCubicMeter: ('3600000000000000000', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == EnergyDensityUnits.GigajoulePerCubicMeter:
-            return ((value) * 1000000000.0)
+        EnergyDensityUnits.JoulePerCubicMeter: ('J/m³',),
         
-        if to_unit == EnergyDensityUnits.TerajoulePerCubicMeter:
-            return ((value) * 1000000000000.0)
+        EnergyDensityUnits.WattHourPerCubicMeter: ('Wh/m³',),
         
-        if to_unit == EnergyDensityUnits.PetajoulePerCubicMeter:
-            return ((value) * 1000000000000000.0)
+        EnergyDensityUnits.KilojoulePerCubicMeter: ('kJ/m³',),
         
-        if to_unit == EnergyDensityUnits.KilowattHourPerCubicMeter:
-            return ((value * 3.6e+3) * 1000.0)
+        EnergyDensityUnits.MegajoulePerCubicMeter: ('MJ/m³',),
         
-        if to_unit == EnergyDensityUnits.MegawattHourPerCubicMeter:
-            return ((value * 3.6e+3) * 1000000.0)
+        EnergyDensityUnits.GigajoulePerCubicMeter: ('GJ/m³',),
         
-        if to_unit == EnergyDensityUnits.GigawattHourPerCubicMeter:
-            return ((value * 3.6e+3) * 1000000000.0)
+        EnergyDensityUnits.TerajoulePerCubicMeter: ('TJ/m³',),
         
-        if to_unit == EnergyDensityUnits.TerawattHourPerCubicMeter:
-            return ((value * 3.6e+3) * 1000000000000.0)
+        EnergyDensityUnits.PetajoulePerCubicMeter: ('PJ/m³',),
         
-        if to_unit == EnergyDensityUnits.PetawattHourPerCubicMeter:
-            return ((value * 3.6e+3) * 1000000000000000.0)
+        EnergyDensityUnits.KilowattHourPerCubicMeter: ('kWh/m³',),
         
-        return None
+        EnergyDensityUnits.MegawattHourPerCubicMeter: ('MWh/m³',),
+        
+        EnergyDensityUnits.GigawattHourPerCubicMeter: ('GWh/m³',),
+        
+        EnergyDensityUnits.TerawattHourPerCubicMeter: ('TWh/m³',),
+        
+        EnergyDensityUnits.PetawattHourPerCubicMeter: ('PWh/m³',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: EnergyDensityUnits = EnergyDensityUnits.JoulePerCubicMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: EnergyDensityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: EnergyDensityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: EnergyDensityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
 
 
+    @staticmethod
+    def convert_value(value: float, from_unit: EnergyDensityUnits, to_unit: EnergyDensityUnits) -> float:
+        """
+        Convert a value from one EnergyDensity unit to another, without creating a EnergyDensity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: EnergyDensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: EnergyDensityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return EnergyDensity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: EnergyDensityUnits, to_unit: EnergyDensityUnits) -> List[float]:
+        """
+        Convert many values from one EnergyDensity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: EnergyDensityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: EnergyDensityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return EnergyDensity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: EnergyDensityUnits, to_unit: EnergyDensityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", EnergyDensity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: EnergyDensityUnits, to_unit: EnergyDensityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one EnergyDensity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: EnergyDensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: EnergyDensityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return EnergyDensity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: EnergyDensityUnits = EnergyDensityUnits.JoulePerCubicMeter) -> EnergyDensity:
+        """
+        Create a new instance of EnergyDensity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: EnergyDensityUnits
+        :return: A new instance of EnergyDensity.
+        :rtype: EnergyDensity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return EnergyDensity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: EnergyDensityUnits = EnergyDensityUnits.JoulePerCubicMeter) -> Fraction:
+        """
+        Get the exact value of the EnergyDensity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (JoulePerCubicMeter).
+        :type unit: EnergyDensityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> EnergyDensity:
+        """
+        Parse a EnergyDensity from a value followed by a unit abbreviation, e.g. "1 J/m³".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of EnergyDensity.
+        :rtype: EnergyDensity
+        :raises ValueError: When the string is not a valid or an ambiguous EnergyDensity.
+        """
+        return EnergyDensity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[EnergyDensity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return EnergyDensity._try_parse(text)
+
+    def to_binary(self, unit: Optional[EnergyDensityUnits] = None) -> bytes:
+        """
+        Encode the EnergyDensity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: EnergyDensityUnits
+        :return: The encoded EnergyDensity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> EnergyDensity:
+        """
+        Decode a EnergyDensity encoded by to_binary.
+
+        :param data: The encoded EnergyDensity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of EnergyDensity.
+        :rtype: EnergyDensity
+        :raises ValueError: When the data is not a valid encoded EnergyDensity.
+        """
+        return EnergyDensity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[EnergyDensityUnits] = None) -> dict:
+        """
+        Get the EnergyDensity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (JoulePerCubicMeter).
+        :type hold_in_unit: EnergyDensityUnits
+        :return: The EnergyDensity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[EnergyDensityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> EnergyDensity:
+        """
+        Create a new instance of EnergyDensity from its DTO.
+
+        :param dto: The EnergyDensity DTO, the unit is the EnergyDensityUnits value or name.
+        :type dto: dict
+        :return: A new instance of EnergyDensity.
+        :rtype: EnergyDensity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return EnergyDensity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> EnergyDensity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return EnergyDensity._from_json(text)
+
     @property
     def base_value(self) -> float:
         return self._value
@@ -385,10 +651,7 @@ class EnergyDensity(AbstractMeasure):
         """
         
         """
-        if self.__joules_per_cubic_meter != None:
-            return self.__joules_per_cubic_meter
-        self.__joules_per_cubic_meter = self.__convert_from_base(EnergyDensityUnits.JoulePerCubicMeter)
-        return self.__joules_per_cubic_meter
+        return self._cached_convert(EnergyDensityUnits.JoulePerCubicMeter)
 
     
     @property
@@ -396,10 +659,7 @@ class EnergyDensity(AbstractMeasure):
         """
         
         """
-        if self.__watt_hours_per_cubic_meter != None:
-            return self.__watt_hours_per_cubic_meter
-        self.__watt_hours_per_cubic_meter = self.__convert_from_base(EnergyDensityUnits.WattHourPerCubicMeter)
-        return self.__watt_hours_per_cubic_meter
+        return self._cached_convert(EnergyDensityUnits.WattHourPerCubicMeter)
 
     
     @property
@@ -407,10 +667,7 @@ class EnergyDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilojoules_per_cubic_meter != None:
-            return self.__kilojoules_per_cubic_meter
-        self.__kilojoules_per_cubic_meter = self.__convert_from_base(EnergyDensityUnits.KilojoulePerCubicMeter)
-        return self.__kilojoules_per_cubic_meter
+        return self._cached_convert(EnergyDensityUnits.KilojoulePerCubicMeter)
 
     
     @property
@@ -418,10 +675,7 @@ class EnergyDensity(AbstractMeasure):
         """
         
         """
-        if self.__megajoules_per_cubic_meter != None:
-            return self.__megajoules_per_cubic_meter
-        self.__megajoules_per_cubic_meter = self.__convert_from_base(EnergyDensityUnits.MegajoulePerCubicMeter)
-        return self.__megajoules_per_cubic_meter
+        return self._cached_convert(EnergyDensityUnits.MegajoulePerCubicMeter)
 
     
     @property
@@ -429,10 +683,7 @@ class EnergyDensity(AbstractMeasure):
         """
         
         """
-        if self.__gigajoules_per_cubic_meter != None:
-            return self.__gigajoules_per_cubic_meter
-        self.__gigajoules_per_cubic_meter = self.__convert_from_base(EnergyDensityUnits.GigajoulePerCubicMeter)
-        return self.__gigajoules_per_cubic_meter
+        return self._cached_convert(EnergyDensityUnits.GigajoulePerCubicMeter)
 
     
     @property
@@ -440,10 +691,7 @@ class EnergyDensity(AbstractMeasure):
         """
         
         """
-        if self.__terajoules_per_cubic_meter != None:
-            return self.__terajoules_per_cubic_meter
-        self.__terajoules_per_cubic_meter = self.__convert_from_base(EnergyDensityUnits.TerajoulePerCubicMeter)
-        return self.__terajoules_per_cubic_meter
+        return self._cached_convert(EnergyDensityUnits.TerajoulePerCubicMeter)
 
     
     @property
@@ -451,10 +699,7 @@ class EnergyDensity(AbstractMeasure):
         """
         
         """
-        if self.__petajoules_per_cubic_meter != None:
-            return self.__petajoules_per_cubic_meter
-        self.__petajoules_per_cubic_meter = self.__convert_from_base(EnergyDensityUnits.PetajoulePerCubicMeter)
-        return self.__petajoules_per_cubic_meter
+        return self._cached_convert(EnergyDensityUnits.PetajoulePerCubicMeter)
 
     
     @property
@@ -462,10 +707,7 @@ class EnergyDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilowatt_hours_per_cubic_meter != None:
-            return self.__kilowatt_hours_per_cubic_meter
-        self.__kilowatt_hours_per_cubic_meter = self.__convert_from_base(EnergyDensityUnits.KilowattHourPerCubicMeter)
-        return self.__kilowatt_hours_per_cubic_meter
+        return self._cached_convert(EnergyDensityUnits.KilowattHourPerCubicMeter)
 
     
     @property
@@ -473,10 +715,7 @@ class EnergyDensity(AbstractMeasure):
         """
         
         """
-        if self.__megawatt_hours_per_cubic_meter != None:
-            return self.__megawatt_hours_per_cubic_meter
-        self.__megawatt_hours_per_cubic_meter = self.__convert_from_base(EnergyDensityUnits.MegawattHourPerCubicMeter)
-        return self.__megawatt_hours_per_cubic_meter
+        return self._cached_convert(EnergyDensityUnits.MegawattHourPerCubicMeter)
 
     
     @property
@@ -484,10 +723,7 @@ class EnergyDensity(AbstractMeasure):
         """
         
         """
-        if self.__gigawatt_hours_per_cubic_meter != None:
-            return self.__gigawatt_hours_per_cubic_meter
-        self.__gigawatt_hours_per_cubic_meter = self.__convert_from_base(EnergyDensityUnits.GigawattHourPerCubicMeter)
-        return self.__gigawatt_hours_per_cubic_meter
+        return self._cached_convert(EnergyDensityUnits.GigawattHourPerCubicMeter)
 
     
     @property
@@ -495,10 +731,7 @@ class EnergyDensity(AbstractMeasure):
         """
         
         """
-        if self.__terawatt_hours_per_cubic_meter != None:
-            return self.__terawatt_hours_per_cubic_meter
-        self.__terawatt_hours_per_cubic_meter = self.__convert_from_base(EnergyDensityUnits.TerawattHourPerCubicMeter)
-        return self.__terawatt_hours_per_cubic_meter
+        return self._cached_convert(EnergyDensityUnits.TerawattHourPerCubicMeter)
 
     
     @property
@@ -506,10 +739,7 @@ class EnergyDensity(AbstractMeasure):
         """
         
         """
-        if self.__petawatt_hours_per_cubic_meter != None:
-            return self.__petawatt_hours_per_cubic_meter
-        self.__petawatt_hours_per_cubic_meter = self.__convert_from_base(EnergyDensityUnits.PetawattHourPerCubicMeter)
-        return self.__petawatt_hours_per_cubic_meter
+        return self._cached_convert(EnergyDensityUnits.PetawattHourPerCubicMeter)
 
     
     def to_string(self, unit: EnergyDensityUnits = EnergyDensityUnits.JoulePerCubicMeter) -> str:
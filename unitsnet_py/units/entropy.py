@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class EntropyUnits(Enum):
         """
             EntropyUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         JoulePerKelvin = 'joule_per_kelvin'
         """
@@ -54,81 +65,316 @@ class Entropy(AbstractMeasure):
         value (float): The value.
         from_unit (EntropyUnits): The Entropy unit to create from, The default unit is JoulePerKelvin
     """
-    def __init__(self, value: float, from_unit: EntropyUnits = EntropyUnits.JoulePerKelvin):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = EntropyUnits
+
+    _base_unit = EntropyUnits.JoulePerKelvin
+
+    _dimensions = (2, 1, -2, 0, -1, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 37
+
+    _binary_unit_ids = {
         
-        self.__joules_per_kelvin = None
+        EntropyUnits.JoulePerKelvin: 0,
         
-        self.__calories_per_kelvin = None
+        EntropyUnits.CaloriePerKelvin: 1,
         
-        self.__joules_per_degree_celsius = None
+        EntropyUnits.JoulePerDegreeCelsius: 2,
         
-        self.__kilojoules_per_kelvin = None
+        EntropyUnits.KilojoulePerKelvin: 3,
         
-        self.__megajoules_per_kelvin = None
+        EntropyUnits.MegajoulePerKelvin: 4,
         
-        self.__kilocalories_per_kelvin = None
+        EntropyUnits.KilocaloriePerKelvin: 5,
         
-        self.__kilojoules_per_degree_celsius = None
+        EntropyUnits.KilojoulePerDegreeCelsius: 6,
         
+    }
 
-    def convert(self, unit: EntropyUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        EntropyUnits.JoulePerKelvin: lambda value: (value),
+        
+        EntropyUnits.CaloriePerKelvin: lambda value: (value / 4.184),
+        
+        EntropyUnits.JoulePerDegreeCelsius: lambda value: (value),
+        
+        EntropyUnits.KilojoulePerKelvin: lambda value: ((value) / 1000.0),
+        
+        EntropyUnits.MegajoulePerKelvin: lambda value: ((value) / 1000000.0),
+        
+        EntropyUnits.KilocaloriePerKelvin: lambda value: ((value / 4.184) / 1000.0),
+        
+        EntropyUnits.KilojoulePerDegreeCelsius: lambda value: ((value) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: EntropyUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == EntropyUnits.JoulePerKelvin:
-            return (value)
+        EntropyUnits.JoulePerKelvin: lambda value: (value),
         
-        if from_unit == EntropyUnits.CaloriePerKelvin:
-            return (value / 4.184)
+        EntropyUnits.CaloriePerKelvin: lambda value: (value * 4.184),
         
-        if from_unit == EntropyUnits.JoulePerDegreeCelsius:
-            return (value)
+        EntropyUnits.JoulePerDegreeCelsius: lambda value: (value),
         
-        if from_unit == EntropyUnits.KilojoulePerKelvin:
-            return ((value) / 1000.0)
+        EntropyUnits.KilojoulePerKelvin: lambda value: ((value) * 1000.0),
         
-        if from_unit == EntropyUnits.MegajoulePerKelvin:
-            return ((value) / 1000000.0)
+        EntropyUnits.MegajoulePerKelvin: lambda value: ((value) * 1000000.0),
         
-        if from_unit == EntropyUnits.KilocaloriePerKelvin:
-            return ((value / 4.184) / 1000.0)
+        EntropyUnits.KilocaloriePerKelvin: lambda value: ((value * 4.184) * 1000.0),
         
-        if from_unit == EntropyUnits.KilojoulePerDegreeCelsius:
-            return ((value) / 1000.0)
+        EntropyUnits.KilojoulePerDegreeCelsius: lambda value: ((value) * 1000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        EntropyUnits.JoulePerKelvin: ('1', '0'),
+        
+        EntropyUnits.CaloriePerKelvin: ('125/523', '0'),
+        
+        EntropyUnits.JoulePerDegreeCelsius: ('1', '0'),
+        
+        EntropyUnits.KilojoulePerKelvin: ('1/1000', '0'),
+        
+        EntropyUnits.MegajoulePerKelvin: ('1/1000000', '0'),
+        
+        EntropyUnits.KilocaloriePerKelvin: ('1/4184', '0'),
+        
+        EntropyUnits.KilojoulePerDegreeCelsius: ('1/1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: EntropyUnits) -> float:
+    _affine_to_base = {
+        
+        EntropyUnits.JoulePerKelvin: ('1', '0'),
+        
+        EntropyUnits.CaloriePerKelvin: ('523/125', '0'),
+        
+        EntropyUnits.JoulePerDegreeCelsius: ('1', '0'),
+        
+        EntropyUnits.KilojoulePerKelvin: ('1000', '0'),
+        
+        EntropyUnits.MegajoulePerKelvin: ('1000000', '0'),
+        
+        EntropyUnits.KilocaloriePerKelvin: ('4184', '0'),
         
-        if to_unit == EntropyUnits.JoulePerKelvin:
-            return (value)
+        EntropyUnits.KilojoulePerDegreeCelsius: ('1000', '0'),
         
-        if to_unit == EntropyUnits.CaloriePerKelvin:
-            return (value * 4.184)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        EntropyUnits.JoulePerKelvin: ('J/K',),
         
-        if to_unit == EntropyUnits.JoulePerDegreeCelsius:
-            return (value)
+        EntropyUnits.CaloriePerKelvin: ('cal/K',),
         
-        if to_unit == EntropyUnits.KilojoulePerKelvin:
-            return ((value) * 1000.0)
+        EntropyUnits.JoulePerDegreeCelsius: ('J/C',),
         
-        if to_unit == EntropyUnits.MegajoulePerKelvin:
-            return ((value) * 1000000.0)
+        EntropyUnits.KilojoulePerKelvin: ('kJ/K',),
         
-        if to_unit == EntropyUnits.KilocaloriePerKelvin:
-            return ((value * 4.184) * 1000.0)
+        EntropyUnits.MegajoulePerKelvin: ('MJ/K',),
         
-        if to_unit == EntropyUnits.KilojoulePerDegreeCelsius:
-            return ((value) * 1000.0)
+        EntropyUnits.KilocaloriePerKelvin: ('kcal/K',),
         
-        return None
+        EntropyUnits.KilojoulePerDegreeCelsius: ('kJ/C',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: EntropyUnits = EntropyUnits.JoulePerKelvin):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: EntropyUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: EntropyUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: EntropyUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: EntropyUnits, to_unit: EntropyUnits) -> float:
+        """
+        Convert a value from one Entropy unit to another, without creating a Entropy instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: EntropyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: EntropyUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Entropy._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: EntropyUnits, to_unit: EntropyUnits) -> List[float]:
+        """
+        Convert many values from one Entropy unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: EntropyUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: EntropyUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Entropy._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: EntropyUnits, to_unit: EntropyUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Entropy._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: EntropyUnits, to_unit: EntropyUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Entropy unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: EntropyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: EntropyUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Entropy._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: EntropyUnits = EntropyUnits.JoulePerKelvin) -> Entropy:
+        """
+        Create a new instance of Entropy holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
 
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: EntropyUnits
+        :return: A new instance of Entropy.
+        :rtype: Entropy
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Entropy._from_exact(value, from_unit)
+
+    def to_exact(self, unit: EntropyUnits = EntropyUnits.JoulePerKelvin) -> Fraction:
+        """
+        Get the exact value of the Entropy in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (JoulePerKelvin).
+        :type unit: EntropyUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Entropy:
+        """
+        Parse a Entropy from a value followed by a unit abbreviation, e.g. "1 J/K".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Entropy.
+        :rtype: Entropy
+        :raises ValueError: When the string is not a valid or an ambiguous Entropy.
+        """
+        return Entropy._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Entropy]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Entropy._try_parse(text)
+
+    def to_binary(self, unit: Optional[EntropyUnits] = None) -> bytes:
+        """
+        Encode the Entropy to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: EntropyUnits
+        :return: The encoded Entropy.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Entropy:
+        """
+        Decode a Entropy encoded by to_binary.
+
+        :param data: The encoded Entropy, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Entropy.
+        :rtype: Entropy
+        :raises ValueError: When the data is not a valid encoded Entropy.
+        """
+        return Entropy._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[EntropyUnits] = None) -> dict:
+        """
+        Get the Entropy DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (JoulePerKelvin).
+        :type hold_in_unit: EntropyUnits
+        :return: The Entropy DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[EntropyUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Entropy:
+        """
+        Create a new instance of Entropy from its DTO.
+
+        :param dto: The Entropy DTO, the unit is the EntropyUnits value or name.
+        :type dto: dict
+        :return: A new instance of Entropy.
+        :rtype: Entropy
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Entropy._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Entropy:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Entropy._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -245,10 +491,7 @@ class Entropy(AbstractMeasure):
         """
         
         """
-        if self.__joules_per_kelvin != None:
-            return self.__joules_per_kelvin
-        self.__joules_per_kelvin = self.__convert_from_base(EntropyUnits.JoulePerKelvin)
-        return self.__joules_per_kelvin
+        return self._cached_convert(EntropyUnits.JoulePerKelvin)
 
     
     @property
@@ -256,10 +499,7 @@ class Entropy(AbstractMeasure):
         """
         
         """
-        if self.__calories_per_kelvin != None:
-            return self.__calories_per_kelvin
-        self.__calories_per_kelvin = self.__convert_from_base(EntropyUnits.CaloriePerKelvin)
-        return self.__calories_per_kelvin
+        return self._cached_convert(EntropyUnits.CaloriePerKelvin)
 
     
     @property
@@ -267,10 +507,7 @@ class Entropy(AbstractMeasure):
         """
         
         """
-        if self.__joules_per_degree_celsius != None:
-            return self.__joules_per_degree_celsius
-        self.__joules_per_degree_celsius = self.__convert_from_base(EntropyUnits.JoulePerDegreeCelsius)
-        return self.__joules_per_degree_celsius
+        return self._cached_convert(EntropyUnits.JoulePerDegreeCelsius)
 
     
     @property
@@ -278,10 +515,7 @@ class Entropy(AbstractMeasure):
         """
         
         """
-        if self.__kilojoules_per_kelvin != None:
-            return self.__kilojoules_per_kelvin
-        self.__kilojoules_per_kelvin = self.__convert_from_base(EntropyUnits.KilojoulePerKelvin)
-        return self.__kilojoules_per_kelvin
+        return self._cached_convert(EntropyUnits.KilojoulePerKelvin)
 
     
     @property
@@ -289,10 +523,7 @@ class Entropy(AbstractMeasure):
         """
         
         """
-        if self.__megajoules_per_kelvin != None:
-            return self.__megajoules_per_kelvin
-        self.__megajoules_per_kelvin = self.__convert_from_base(EntropyUnits.MegajoulePerKelvin)
-        return self.__megajoules_per_kelvin
+        return self._cached_convert(EntropyUnits.MegajoulePerKelvin)
 
     
     @property
@@ -300,10 +531,7 @@ class Entropy(AbstractMeasure):
         """
         
         """
-        if self.__kilocalories_per_kelvin != None:
-            return self.__kilocalories_per_kelvin
-        self.__kilocalories_per_kelvin = self.__convert_from_base(EntropyUnits.KilocaloriePerKelvin)
-        return self.__kilocalories_per_kelvin
+        return self._cached_convert(EntropyUnits.KilocaloriePerKelvin)
 
     
     @property
@@ -311,10 +539,7 @@ class Entropy(AbstractMeasure):
         """
         
         """
-        if self.__kilojoules_per_degree_celsius != None:
-            return self.__kilojoules_per_degree_celsius
-        self.__kilojoules_per_degree_celsius = self.__convert_from_base(EntropyUnits.KilojoulePerDegreeCelsius)
-        return self.__kilojoules_per_degree_celsius
+        return self._cached_convert(EntropyUnits.KilojoulePerDegreeCelsius)
 
     
     def to_string(self, unit: EntropyUnits = EntropyUnits.JoulePerKelvin) -> str:
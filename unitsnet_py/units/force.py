@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ForceUnits(Enum):
         """
             ForceUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Dyn = 'dyn'
         """
@@ -94,145 +105,412 @@ class Force(AbstractMeasure):
         value (float): The value.
         from_unit (ForceUnits): The Force unit to create from, The default unit is Newton
     """
-    def __init__(self, value: float, from_unit: ForceUnits = ForceUnits.Newton):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ForceUnits
+
+    _base_unit = ForceUnits.Newton
+
+    _dimensions = (1, 1, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 38
+
+    _binary_unit_ids = {
         
-        self.__dyne = None
+        ForceUnits.Dyn: 0,
         
-        self.__kilograms_force = None
+        ForceUnits.KilogramForce: 1,
         
-        self.__tonnes_force = None
+        ForceUnits.TonneForce: 2,
         
-        self.__newtons = None
+        ForceUnits.Newton: 3,
         
-        self.__kilo_ponds = None
+        ForceUnits.KiloPond: 4,
         
-        self.__poundals = None
+        ForceUnits.Poundal: 5,
         
-        self.__pounds_force = None
+        ForceUnits.PoundForce: 6,
         
-        self.__ounce_force = None
+        ForceUnits.OunceForce: 7,
         
-        self.__short_tons_force = None
+        ForceUnits.ShortTonForce: 8,
         
-        self.__micronewtons = None
+        ForceUnits.Micronewton: 9,
         
-        self.__millinewtons = None
+        ForceUnits.Millinewton: 10,
         
-        self.__decanewtons = None
+        ForceUnits.Decanewton: 11,
         
-        self.__kilonewtons = None
+        ForceUnits.Kilonewton: 12,
         
-        self.__meganewtons = None
+        ForceUnits.Meganewton: 13,
         
-        self.__kilopounds_force = None
+        ForceUnits.KilopoundForce: 14,
         
+    }
 
-    def convert(self, unit: ForceUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ForceUnits.Dyn: lambda value: (value * 1e5),
+        
+        ForceUnits.KilogramForce: lambda value: (value / 9.80665002864),
+        
+        ForceUnits.TonneForce: lambda value: (value / 9.80665002864e3),
+        
+        ForceUnits.Newton: lambda value: (value),
+        
+        ForceUnits.KiloPond: lambda value: (value / 9.80665002864),
+        
+        ForceUnits.Poundal: lambda value: (value / 0.13825502798973041652092282466083),
+        
+        ForceUnits.PoundForce: lambda value: (value / 4.4482216152605095551842641431421),
+        
+        ForceUnits.OunceForce: lambda value: (value / 2.780138509537812e-1),
+        
+        ForceUnits.ShortTonForce: lambda value: (value / 8.896443230521e3),
+        
+        ForceUnits.Micronewton: lambda value: ((value) / 1e-06),
+        
+        ForceUnits.Millinewton: lambda value: ((value) / 0.001),
+        
+        ForceUnits.Decanewton: lambda value: ((value) / 10.0),
+        
+        ForceUnits.Kilonewton: lambda value: ((value) / 1000.0),
+        
+        ForceUnits.Meganewton: lambda value: ((value) / 1000000.0),
+        
+        ForceUnits.KilopoundForce: lambda value: ((value / 4.4482216152605095551842641431421) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ForceUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ForceUnits.Dyn:
-            return (value * 1e5)
+        ForceUnits.Dyn: lambda value: (value / 1e5),
         
-        if from_unit == ForceUnits.KilogramForce:
-            return (value / 9.80665002864)
+        ForceUnits.KilogramForce: lambda value: (value * 9.80665002864),
         
-        if from_unit == ForceUnits.TonneForce:
-            return (value / 9.80665002864e3)
+        ForceUnits.TonneForce: lambda value: (value * 9.80665002864e3),
         
-        if from_unit == ForceUnits.Newton:
-            return (value)
+        ForceUnits.Newton: lambda value: (value),
         
-        if from_unit == ForceUnits.KiloPond:
-            return (value / 9.80665002864)
+        ForceUnits.KiloPond: lambda value: (value * 9.80665002864),
         
-        if from_unit == ForceUnits.Poundal:
-            return (value / 0.13825502798973041652092282466083)
+        ForceUnits.Poundal: lambda value: (value * 0.13825502798973041652092282466083),
         
-        if from_unit == ForceUnits.PoundForce:
-            return (value / 4.4482216152605095551842641431421)
+        ForceUnits.PoundForce: lambda value: (value * 4.4482216152605095551842641431421),
         
-        if from_unit == ForceUnits.OunceForce:
-            return (value / 2.780138509537812e-1)
+        ForceUnits.OunceForce: lambda value: (value * 2.780138509537812e-1),
         
-        if from_unit == ForceUnits.ShortTonForce:
-            return (value / 8.896443230521e3)
+        ForceUnits.ShortTonForce: lambda value: (value * 8.896443230521e3),
         
-        if from_unit == ForceUnits.Micronewton:
-            return ((value) / 1e-06)
+        ForceUnits.Micronewton: lambda value: ((value) * 1e-06),
         
-        if from_unit == ForceUnits.Millinewton:
-            return ((value) / 0.001)
+        ForceUnits.Millinewton: lambda value: ((value) * 0.001),
         
-        if from_unit == ForceUnits.Decanewton:
-            return ((value) / 10.0)
+        ForceUnits.Decanewton: lambda value: ((value) * 10.0),
         
-        if from_unit == ForceUnits.Kilonewton:
-            return ((value) / 1000.0)
+        ForceUnits.Kilonewton: lambda value: ((value) * 1000.0),
         
-        if from_unit == ForceUnits.Meganewton:
-            return ((value) / 1000000.0)
+        ForceUnits.Meganewton: lambda value: ((value) * 1000000.0),
         
-        if from_unit == ForceUnits.KilopoundForce:
-            return ((value / 4.4482216152605095551842641431421) / 1000.0)
+        ForceUnits.KilopoundForce: lambda value: ((value * 4.4482216152605095551842641431421) * 1000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ForceUnits.Dyn: ('100000', '0'),
+        
+        ForceUnits.KilogramForce: ('6250000000/61291562679', '0'),
+        
+        ForceUnits.TonneForce: ('6250000/61291562679', '0'),
+        
+        ForceUnits.Newton: ('1', '0'),
+        
+        ForceUnits.KiloPond: ('6250000000/61291562679', '0'),
+        
+        ForceUnits.Poundal: ('100000000000000000000000000000000/13825502798973041652092282466083', '0'),
+        
+        ForceUnits.PoundForce: ('10000000000000000000000000000000/44482216152605095551842641431421', '0'),
+        
+        ForceUnits.OunceForce: ('2500000000000000/695034627384453', '0'),
+        
+        ForceUnits.ShortTonForce: ('1000000000/8896443230521', '0'),
+        
+        ForceUnits.Micronewton: ('1000000', '0'),
+        
+        ForceUnits.Millinewton: ('1000', '0'),
+        
+        ForceUnits.Decanewton: ('1/10', '0'),
+        
+        ForceUnits.Kilonewton: ('1/1000', '0'),
+        
+        ForceUnits.Meganewton: ('1/1000000', '0'),
+        
+        ForceUnits.KilopoundForce: ('10000000000000000000000000000/44482216152605095551842641431421', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ForceUnits) -> float:
+    _affine_to_base = {
+        
+        ForceUnits.Dyn: ('1/100000', '0'),
+        
+        ForceUnits.KilogramForce: ('61291562679/6250000000', '0'),
+        
+        ForceUnits.TonneForce: ('61291562679/6250000', '0'),
         
-        if to_unit == ForceUnits.Dyn:
-            return (value / 1e5)
+        ForceUnits.Newton: ('1', '0'),
         
-        if to_unit == ForceUnits.KilogramForce:
-            return (value * 9.80665002864)
+        ForceUnits.KiloPond: ('61291562679/6250000000', '0'),
         
-        if to_unit == ForceUnits.TonneForce:
-            return (value * 9.80665002864e3)
+        ForceUnits.Poundal: ('13825502798973041652092282466083/100000000000000000000000000000000', '0'),
         
-        if to_unit == ForceUnits.Newton:
-            return (value)
+        ForceUnits.PoundForce: ('44482216152605095551842641431421/10000000000000000000000000000000', '0'),
         
-        if to_unit == ForceUnits.KiloPond:
-            return (value * 9.80665002864)
+        ForceUnits.OunceForce: ('695034627384453/2500000000000000', '0'),
         
-        if to_unit == ForceUnits.Poundal:
-            return (value * 0.13825502798973041652092282466083)
+        ForceUnits.ShortTonForce: ('8896443230521/1000000000', '0'),
         
-        if to_unit == ForceUnits.PoundForce:
-            return (value * 4.4482216152605095551842641431421)
+        ForceUnits.Micronewton: ('1/1000000', '0'),
         
-        if to_unit == ForceUnits.OunceForce:
-            return (value * 2.780138509537812e-1)
+        ForceUnits.Millinewton: ('1/1000', '0'),
         
-        if to_unit == ForceUnits.ShortTonForce:
-            return (value * 8.896443230521e3)
+        ForceUnits.Decanewton: ('10', '0'),
         
-        if to_unit == ForceUnits.Micronewton:
-            return ((value) * 1e-06)
+        ForceUnits.Kilonewton: ('1000', '0'),
+        
+        ForceUnits.Meganewton: ('1000000', '0'),
+        
+        ForceUnits.KilopoundForce: ('44482216152605095551842641431421/10000000000000000000000000000', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ForceUnits.Millinewton:
-            return ((value) * 0.001)
+        ForceUnits.Dyn: ('dyn',),
         
-        if to_unit == ForceUnits.Decanewton:
-            return ((value) * 10.0)
+        ForceUnits.KilogramForce: ('kgf',),
         
-        if to_unit == ForceUnits.Kilonewton:
-            return ((value) * 1000.0)
+        ForceUnits.TonneForce: ('tf',),
         
-        if to_unit == ForceUnits.Meganewton:
-            return ((value) * 1000000.0)
+        ForceUnits.Newton: ('N',),
         
-        if to_unit == ForceUnits.KilopoundForce:
-            return ((value * 4.4482216152605095551842641431421) * 1000.0)
+        ForceUnits.KiloPond: ('kp',),
         
-        return None
+        ForceUnits.Poundal: ('pdl',),
+        
+        ForceUnits.PoundForce: ('lbf',),
+        
+        ForceUnits.OunceForce: ('ozf',),
+        
+        ForceUnits.ShortTonForce: ('tf (short)',),
+        
+        ForceUnits.Micronewton: ('μN',),
+        
+        ForceUnits.Millinewton: ('mN',),
+        
+        ForceUnits.Decanewton: ('daN',),
+        
+        ForceUnits.Kilonewton: ('kN',),
+        
+        ForceUnits.Meganewton: ('MN',),
+        
+        ForceUnits.KilopoundForce: ('klbf',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ForceUnits = ForceUnits.Newton):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ForceUnits) -> float:
+        return self.__convert_from_base(unit)
 
+    def __convert_from_base(self, from_unit: ForceUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ForceUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ForceUnits, to_unit: ForceUnits) -> float:
+        """
+        Convert a value from one Force unit to another, without creating a Force instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ForceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ForceUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Force._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ForceUnits, to_unit: ForceUnits) -> List[float]:
+        """
+        Convert many values from one Force unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ForceUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ForceUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Force._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ForceUnits, to_unit: ForceUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Force._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ForceUnits, to_unit: ForceUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Force unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ForceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ForceUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Force._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ForceUnits = ForceUnits.Newton) -> Force:
+        """
+        Create a new instance of Force holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ForceUnits
+        :return: A new instance of Force.
+        :rtype: Force
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Force._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ForceUnits = ForceUnits.Newton) -> Fraction:
+        """
+        Get the exact value of the Force in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Newton).
+        :type unit: ForceUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Force:
+        """
+        Parse a Force from a value followed by a unit abbreviation, e.g. "1 dyn".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Force.
+        :rtype: Force
+        :raises ValueError: When the string is not a valid or an ambiguous Force.
+        """
+        return Force._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Force]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Force._try_parse(text)
+
+    def to_binary(self, unit: Optional[ForceUnits] = None) -> bytes:
+        """
+        Encode the Force to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ForceUnits
+        :return: The encoded Force.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Force:
+        """
+        Decode a Force encoded by to_binary.
+
+        :param data: The encoded Force, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Force.
+        :rtype: Force
+        :raises ValueError: When the data is not a valid encoded Force.
+        """
+        return Force._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ForceUnits] = None) -> dict:
+        """
+        Get the Force DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Newton).
+        :type hold_in_unit: ForceUnits
+        :return: The Force DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ForceUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Force:
+        """
+        Create a new instance of Force from its DTO.
+
+        :param dto: The Force DTO, the unit is the ForceUnits value or name.
+        :type dto: dict
+        :return: A new instance of Force.
+        :rtype: Force
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Force._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Force:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Force._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -469,10 +747,7 @@ class Force(AbstractMeasure):
         """
         
         """
-        if self.__dyne != None:
-            return self.__dyne
-        self.__dyne = self.__convert_from_base(ForceUnits.Dyn)
-        return self.__dyne
+        return self._cached_convert(ForceUnits.Dyn)
 
     
     @property
@@ -480,10 +755,7 @@ class Force(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_force != None:
-            return self.__kilograms_force
-        self.__kilograms_force = self.__convert_from_base(ForceUnits.KilogramForce)
-        return self.__kilograms_force
+        return self._cached_convert(ForceUnits.KilogramForce)
 
     
     @property
@@ -491,10 +763,7 @@ class Force(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_force != None:
-            return self.__tonnes_force
-        self.__tonnes_force = self.__convert_from_base(ForceUnits.TonneForce)
-        return self.__tonnes_force
+        return self._cached_convert(ForceUnits.TonneForce)
 
     
     @property
@@ -502,10 +771,7 @@ class Force(AbstractMeasure):
         """
         
         """
-        if self.__newtons != None:
-            return self.__newtons
-        self.__newtons = self.__convert_from_base(ForceUnits.Newton)
-        return self.__newtons
+        return self._cached_convert(ForceUnits.Newton)
 
     
     @property
@@ -513,10 +779,7 @@ class Force(AbstractMeasure):
         """
         
         """
-        if self.__kilo_ponds != None:
-            return self.__kilo_ponds
-        self.__kilo_ponds = self.__convert_from_base(ForceUnits.KiloPond)
-        return self.__kilo_ponds
+        return self._cached_convert(ForceUnits.KiloPond)
 
     
     @property
@@ -524,10 +787,7 @@ class Force(AbstractMeasure):
         """
         
         """
-        if self.__poundals != None:
-            return self.__poundals
-        self.__poundals = self.__convert_from_base(ForceUnits.Poundal)
-        return self.__poundals
+        return self._cached_convert(ForceUnits.Poundal)
 
     
     @property
@@ -535,10 +795,7 @@ class Force(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force != None:
-            return self.__pounds_force
-        self.__pounds_force = self.__convert_from_base(ForceUnits.PoundForce)
-        return self.__pounds_force
+        return self._cached_convert(ForceUnits.PoundForce)
 
     
     @property
@@ -546,10 +803,7 @@ class Force(AbstractMeasure):
         """
         
         """
-        if self.__ounce_force != None:
-            return self.__ounce_force
-        self.__ounce_force = self.__convert_from_base(ForceUnits.OunceForce)
-        return self.__ounce_force
+        return self._cached_convert(ForceUnits.OunceForce)
 
     
     @property
@@ -557,10 +811,7 @@ class Force(AbstractMeasure):
         """
         The short ton-force is a unit of force equal to 2,000 pounds-force (907.18474 kgf), that is most commonly used in the United States – known there simply as the ton or US ton.
         """
-        if self.__short_tons_force != None:
-            return self.__short_tons_force
-        self.__short_tons_force = self.__convert_from_base(ForceUnits.ShortTonForce)
-        return self.__short_tons_force
+        return self._cached_convert(ForceUnits.ShortTonForce)
 
     
     @property
@@ -568,10 +819,7 @@ class Force(AbstractMeasure):
         """
         
         """
-        if self.__micronewtons != None:
-            return self.__micronewtons
-        self.__micronewtons = self.__convert_from_base(ForceUnits.Micronewton)
-        return self.__micronewtons
+        return self._cached_convert(ForceUnits.Micronewton)
 
     
     @property
@@ -579,10 +827,7 @@ class Force(AbstractMeasure):
         """
         
         """
-        if self.__millinewtons != None:
-            return self.__millinewtons
-        self.__millinewtons = self.__convert_from_base(ForceUnits.Millinewton)
-        return self.__millinewtons
+        return self._cached_convert(ForceUnits.Millinewton)
 
     
     @property
@@ -590,10 +835,7 @@ class Force(AbstractMeasure):
         """
         
         """
-        if self.__decanewtons != None:
-            return self.__decanewtons
-        self.__decanewtons = self.__convert_from_base(ForceUnits.Decanewton)
-        return self.__decanewtons
+        return self._cached_convert(ForceUnits.Decanewton)
 
     
     @property
@@ -601,10 +843,7 @@ class Force(AbstractMeasure):
         """
         
         """
-        if self.__kilonewtons != None:
-            return self.__kilonewtons
-        self.__kilonewtons = self.__convert_from_base(ForceUnits.Kilonewton)
-        return self.__kilonewtons
+        return self._cached_convert(ForceUnits.Kilonewton)
 
     
     @property
@@ -612,10 +851,7 @@ class Force(AbstractMeasure):
         """
         
         """
-        if self.__meganewtons != None:
-            return self.__meganewtons
-        self.__meganewtons = self.__convert_from_base(ForceUnits.Meganewton)
-        return self.__meganewtons
+        return self._cached_convert(ForceUnits.Meganewton)
 
     
     @property
@@ -623,10 +859,7 @@ class Force(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_force != None:
-            return self.__kilopounds_force
-        self.__kilopounds_force = self.__convert_from_base(ForceUnits.KilopoundForce)
-        return self.__kilopounds_force
+        return self._cached_convert(ForceUnits.KilopoundForce)
 
     
     def to_string(self, unit: ForceUnits = ForceUnits.Newton) -> str:
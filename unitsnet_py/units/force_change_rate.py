@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ForceChangeRateUnits(Enum):
         """
             ForceChangeRateUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         NewtonPerMinute = 'newton_per_minute'
         """
@@ -94,145 +105,412 @@ class ForceChangeRate(AbstractMeasure):
         value (float): The value.
         from_unit (ForceChangeRateUnits): The ForceChangeRate unit to create from, The default unit is NewtonPerSecond
     """
-    def __init__(self, value: float, from_unit: ForceChangeRateUnits = ForceChangeRateUnits.NewtonPerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ForceChangeRateUnits
+
+    _base_unit = ForceChangeRateUnits.NewtonPerSecond
+
+    _dimensions = (1, 1, -3, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 39
+
+    _binary_unit_ids = {
         
-        self.__newtons_per_minute = None
+        ForceChangeRateUnits.NewtonPerMinute: 0,
         
-        self.__newtons_per_second = None
+        ForceChangeRateUnits.NewtonPerSecond: 1,
         
-        self.__pounds_force_per_minute = None
+        ForceChangeRateUnits.PoundForcePerMinute: 2,
         
-        self.__pounds_force_per_second = None
+        ForceChangeRateUnits.PoundForcePerSecond: 3,
         
-        self.__decanewtons_per_minute = None
+        ForceChangeRateUnits.DecanewtonPerMinute: 4,
         
-        self.__kilonewtons_per_minute = None
+        ForceChangeRateUnits.KilonewtonPerMinute: 5,
         
-        self.__nanonewtons_per_second = None
+        ForceChangeRateUnits.NanonewtonPerSecond: 6,
         
-        self.__micronewtons_per_second = None
+        ForceChangeRateUnits.MicronewtonPerSecond: 7,
         
-        self.__millinewtons_per_second = None
+        ForceChangeRateUnits.MillinewtonPerSecond: 8,
         
-        self.__centinewtons_per_second = None
+        ForceChangeRateUnits.CentinewtonPerSecond: 9,
         
-        self.__decinewtons_per_second = None
+        ForceChangeRateUnits.DecinewtonPerSecond: 10,
         
-        self.__decanewtons_per_second = None
+        ForceChangeRateUnits.DecanewtonPerSecond: 11,
         
-        self.__kilonewtons_per_second = None
+        ForceChangeRateUnits.KilonewtonPerSecond: 12,
         
-        self.__kilopounds_force_per_minute = None
+        ForceChangeRateUnits.KilopoundForcePerMinute: 13,
         
-        self.__kilopounds_force_per_second = None
+        ForceChangeRateUnits.KilopoundForcePerSecond: 14,
         
+    }
 
-    def convert(self, unit: ForceChangeRateUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ForceChangeRateUnits.NewtonPerMinute: lambda value: (value * 60),
+        
+        ForceChangeRateUnits.NewtonPerSecond: lambda value: (value),
+        
+        ForceChangeRateUnits.PoundForcePerMinute: lambda value: (value / 4.4482216152605095551842641431421 * 60),
+        
+        ForceChangeRateUnits.PoundForcePerSecond: lambda value: (value / 4.4482216152605095551842641431421),
+        
+        ForceChangeRateUnits.DecanewtonPerMinute: lambda value: ((value * 60) / 10.0),
+        
+        ForceChangeRateUnits.KilonewtonPerMinute: lambda value: ((value * 60) / 1000.0),
+        
+        ForceChangeRateUnits.NanonewtonPerSecond: lambda value: ((value) / 1e-09),
+        
+        ForceChangeRateUnits.MicronewtonPerSecond: lambda value: ((value) / 1e-06),
+        
+        ForceChangeRateUnits.MillinewtonPerSecond: lambda value: ((value) / 0.001),
+        
+        ForceChangeRateUnits.CentinewtonPerSecond: lambda value: ((value) / 0.01),
+        
+        ForceChangeRateUnits.DecinewtonPerSecond: lambda value: ((value) / 0.1),
+        
+        ForceChangeRateUnits.DecanewtonPerSecond: lambda value: ((value) / 10.0),
+        
+        ForceChangeRateUnits.KilonewtonPerSecond: lambda value: ((value) / 1000.0),
+        
+        ForceChangeRateUnits.KilopoundForcePerMinute: lambda value: ((value / 4.4482216152605095551842641431421 * 60) / 1000.0),
+        
+        ForceChangeRateUnits.KilopoundForcePerSecond: lambda value: ((value / 4.4482216152605095551842641431421) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ForceChangeRateUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ForceChangeRateUnits.NewtonPerMinute:
-            return (value * 60)
+        ForceChangeRateUnits.NewtonPerMinute: lambda value: (value / 60),
         
-        if from_unit == ForceChangeRateUnits.NewtonPerSecond:
-            return (value)
+        ForceChangeRateUnits.NewtonPerSecond: lambda value: (value),
         
-        if from_unit == ForceChangeRateUnits.PoundForcePerMinute:
-            return (value / 4.4482216152605095551842641431421 * 60)
+        ForceChangeRateUnits.PoundForcePerMinute: lambda value: (value * 4.4482216152605095551842641431421 / 60),
         
-        if from_unit == ForceChangeRateUnits.PoundForcePerSecond:
-            return (value / 4.4482216152605095551842641431421)
+        ForceChangeRateUnits.PoundForcePerSecond: lambda value: (value * 4.4482216152605095551842641431421),
         
-        if from_unit == ForceChangeRateUnits.DecanewtonPerMinute:
-            return ((value * 60) / 10.0)
+        ForceChangeRateUnits.DecanewtonPerMinute: lambda value: ((value / 60) * 10.0),
         
-        if from_unit == ForceChangeRateUnits.KilonewtonPerMinute:
-            return ((value * 60) / 1000.0)
+        ForceChangeRateUnits.KilonewtonPerMinute: lambda value: ((value / 60) * 1000.0),
         
-        if from_unit == ForceChangeRateUnits.NanonewtonPerSecond:
-            return ((value) / 1e-09)
+        ForceChangeRateUnits.NanonewtonPerSecond: lambda value: ((value) * 1e-09),
         
-        if from_unit == ForceChangeRateUnits.MicronewtonPerSecond:
-            return ((value) / 1e-06)
+        ForceChangeRateUnits.MicronewtonPerSecond: lambda value: ((value) * 1e-06),
         
-        if from_unit == ForceChangeRateUnits.MillinewtonPerSecond:
-            return ((value) / 0.001)
+        ForceChangeRateUnits.MillinewtonPerSecond: lambda value: ((value) * 0.001),
         
-        if from_unit == ForceChangeRateUnits.CentinewtonPerSecond:
-            return ((value) / 0.01)
+        ForceChangeRateUnits.CentinewtonPerSecond: lambda value: ((value) * 0.01),
         
-        if from_unit == ForceChangeRateUnits.DecinewtonPerSecond:
-            return ((value) / 0.1)
+        ForceChangeRateUnits.DecinewtonPerSecond: lambda value: ((value) * 0.1),
         
-        if from_unit == ForceChangeRateUnits.DecanewtonPerSecond:
-            return ((value) / 10.0)
+        ForceChangeRateUnits.DecanewtonPerSecond: lambda value: ((value) * 10.0),
         
-        if from_unit == ForceChangeRateUnits.KilonewtonPerSecond:
-            return ((value) / 1000.0)
+        ForceChangeRateUnits.KilonewtonPerSecond: lambda value: ((value) * 1000.0),
         
-        if from_unit == ForceChangeRateUnits.KilopoundForcePerMinute:
-            return ((value / 4.4482216152605095551842641431421 * 60) / 1000.0)
+        ForceChangeRateUnits.KilopoundForcePerMinute: lambda value: ((value * 4.4482216152605095551842641431421 / 60) * 1000.0),
         
-        if from_unit == ForceChangeRateUnits.KilopoundForcePerSecond:
-            return ((value / 4.4482216152605095551842641431421) / 1000.0)
+        ForceChangeRateUnits.KilopoundForcePerSecond: lambda value: ((value * 4.4482216152605095551842641431421) * 1000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ForceChangeRateUnits.NewtonPerMinute: ('60', '0'),
+        
+        ForceChangeRateUnits.NewtonPerSecond: ('1', '0'),
+        
+        ForceChangeRateUnits.PoundForcePerMinute: ('600000000000000000000000000000000/44482216152605095551842641431421', '0'),
+        
+        ForceChangeRateUnits.PoundForcePerSecond: ('10000000000000000000000000000000/44482216152605095551842641431421', '0'),
+        
+        ForceChangeRateUnits.DecanewtonPerMinute: ('6', '0'),
+        
+        ForceChangeRateUnits.KilonewtonPerMinute: ('3/50', '0'),
+        
+        ForceChangeRateUnits.NanonewtonPerSecond: ('1000000000', '0'),
+        
+        ForceChangeRateUnits.MicronewtonPerSecond: ('1000000', '0'),
+        
+        ForceChangeRateUnits.MillinewtonPerSecond: ('1000', '0'),
+        
+        ForceChangeRateUnits.CentinewtonPerSecond: ('100', '0'),
+        
+        ForceChangeRateUnits.DecinewtonPerSecond: ('10', '0'),
+        
+        ForceChangeRateUnits.DecanewtonPerSecond: ('1/10', '0'),
+        
+        ForceChangeRateUnits.KilonewtonPerSecond: ('1/1000', '0'),
+        
+        ForceChangeRateUnits.KilopoundForcePerMinute: ('600000000000000000000000000000/44482216152605095551842641431421', '0'),
+        
+        ForceChangeRateUnits.KilopoundForcePerSecond: ('10000000000000000000000000000/44482216152605095551842641431421', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ForceChangeRateUnits) -> float:
+    _affine_to_base = {
+        
+        ForceChangeRateUnits.NewtonPerMinute: ('1/60', '0'),
+        
+        ForceChangeRateUnits.NewtonPerSecond: ('1', '0'),
+        
+        ForceChangeRateUnits.PoundForcePerMinute: ('44482216152605095551842641431421/600000000000000000000000000000000', '0'),
         
-        if to_unit == ForceChangeRateUnits.NewtonPerMinute:
-            return (value / 60)
+        ForceChangeRateUnits.PoundForcePerSecond: ('44482216152605095551842641431421/10000000000000000000000000000000', '0'),
         
-        if to_unit == ForceChangeRateUnits.NewtonPerSecond:
-            return (value)
+        ForceChangeRateUnits.DecanewtonPerMinute: ('1/6', '0'),
         
-        if to_unit == ForceChangeRateUnits.PoundForcePerMinute:
-            return (value * 4.4482216152605095551842641431421 / 60)
+        ForceChangeRateUnits.KilonewtonPerMinute: ('50/3', '0'),
         
-        if to_unit == ForceChangeRateUnits.PoundForcePerSecond:
-            return (value * 4.4482216152605095551842641431421)
+        ForceChangeRateUnits.NanonewtonPerSecond: ('1/1000000000', '0'),
         
-        if to_unit == ForceChangeRateUnits.DecanewtonPerMinute:
-            return ((value / 60) * 10.0)
+        ForceChangeRateUnits.MicronewtonPerSecond: ('1/1000000', '0'),
         
-        if to_unit == ForceChangeRateUnits.KilonewtonPerMinute:
-            return ((value / 60) * 1000.0)
+        ForceChangeRateUnits.MillinewtonPerSecond: ('1/1000', '0'),
         
-        if to_unit == ForceChangeRateUnits.NanonewtonPerSecond:
-            return ((value) * 1e-09)
+        ForceChangeRateUnits.CentinewtonPerSecond: ('1/100', '0'),
         
-        if to_unit == ForceChangeRateUnits.MicronewtonPerSecond:
-            return ((value) * 1e-06)
+        ForceChangeRateUnits.DecinewtonPerSecond: ('1/10', '0'),
         
-        if to_unit == ForceChangeRateUnits.MillinewtonPerSecond:
-            return ((value) * 0.001)
+        ForceChangeRateUnits.DecanewtonPerSecond: ('10', '0'),
         
-        if to_unit == ForceChangeRateUnits.CentinewtonPerSecond:
-            return ((value) * 0.01)
+        ForceChangeRateUnits.KilonewtonPerSecond: ('1000', '0'),
+        
+        ForceChangeRateUnits.KilopoundForcePerMinute: ('44482216152605095551842641431421/600000000000000000000000000000', '0'),
+        
+        ForceChangeRateUnits.KilopoundForcePerSecond: ('44482216152605095551842641431421/10000000000000000000000000000', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ForceChangeRateUnits.DecinewtonPerSecond:
-            return ((value) * 0.1)
+        ForceChangeRateUnits.NewtonPerMinute: ('N/min',),
         
-        if to_unit == ForceChangeRateUnits.DecanewtonPerSecond:
-            return ((value) * 10.0)
+        ForceChangeRateUnits.NewtonPerSecond: ('N/s',),
         
-        if to_unit == ForceChangeRateUnits.KilonewtonPerSecond:
-            return ((value) * 1000.0)
+        ForceChangeRateUnits.PoundForcePerMinute: ('lbf/min',),
         
-        if to_unit == ForceChangeRateUnits.KilopoundForcePerMinute:
-            return ((value * 4.4482216152605095551842641431421 / 60) * 1000.0)
+        ForceChangeRateUnits.PoundForcePerSecond: ('lbf/s',),
         
-        if to_unit == ForceChangeRateUnits.KilopoundForcePerSecond:
-            return ((value * 4.4482216152605095551842641431421) * 1000.0)
+        ForceChangeRateUnits.DecanewtonPerMinute: ('daN/min',),
         
-        return None
+        ForceChangeRateUnits.KilonewtonPerMinute: ('kN/min',),
+        
+        ForceChangeRateUnits.NanonewtonPerSecond: ('nN/s',),
+        
+        ForceChangeRateUnits.MicronewtonPerSecond: ('μN/s',),
+        
+        ForceChangeRateUnits.MillinewtonPerSecond: ('mN/s',),
+        
+        ForceChangeRateUnits.CentinewtonPerSecond: ('cN/s',),
+        
+        ForceChangeRateUnits.DecinewtonPerSecond: ('dN/s',),
+        
+        ForceChangeRateUnits.DecanewtonPerSecond: ('daN/s',),
+        
+        ForceChangeRateUnits.KilonewtonPerSecond: ('kN/s',),
+        
+        ForceChangeRateUnits.KilopoundForcePerMinute: ('klbf/min',),
+        
+        ForceChangeRateUnits.KilopoundForcePerSecond: ('klbf/s',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ForceChangeRateUnits = ForceChangeRateUnits.NewtonPerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ForceChangeRateUnits) -> float:
+        return self.__convert_from_base(unit)
 
+    def __convert_from_base(self, from_unit: ForceChangeRateUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ForceChangeRateUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ForceChangeRateUnits, to_unit: ForceChangeRateUnits) -> float:
+        """
+        Convert a value from one ForceChangeRate unit to another, without creating a ForceChangeRate instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ForceChangeRateUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ForceChangeRateUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ForceChangeRate._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ForceChangeRateUnits, to_unit: ForceChangeRateUnits) -> List[float]:
+        """
+        Convert many values from one ForceChangeRate unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ForceChangeRateUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ForceChangeRateUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ForceChangeRate._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ForceChangeRateUnits, to_unit: ForceChangeRateUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ForceChangeRate._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ForceChangeRateUnits, to_unit: ForceChangeRateUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ForceChangeRate unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ForceChangeRateUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ForceChangeRateUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ForceChangeRate._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ForceChangeRateUnits = ForceChangeRateUnits.NewtonPerSecond) -> ForceChangeRate:
+        """
+        Create a new instance of ForceChangeRate holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ForceChangeRateUnits
+        :return: A new instance of ForceChangeRate.
+        :rtype: ForceChangeRate
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ForceChangeRate._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ForceChangeRateUnits = ForceChangeRateUnits.NewtonPerSecond) -> Fraction:
+        """
+        Get the exact value of the ForceChangeRate in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (NewtonPerSecond).
+        :type unit: ForceChangeRateUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ForceChangeRate:
+        """
+        Parse a ForceChangeRate from a value followed by a unit abbreviation, e.g. "1 N/min".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ForceChangeRate.
+        :rtype: ForceChangeRate
+        :raises ValueError: When the string is not a valid or an ambiguous ForceChangeRate.
+        """
+        return ForceChangeRate._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ForceChangeRate]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ForceChangeRate._try_parse(text)
+
+    def to_binary(self, unit: Optional[ForceChangeRateUnits] = None) -> bytes:
+        """
+        Encode the ForceChangeRate to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ForceChangeRateUnits
+        :return: The encoded ForceChangeRate.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ForceChangeRate:
+        """
+        Decode a ForceChangeRate encoded by to_binary.
+
+        :param data: The encoded ForceChangeRate, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ForceChangeRate.
+        :rtype: ForceChangeRate
+        :raises ValueError: When the data is not a valid encoded ForceChangeRate.
+        """
+        return ForceChangeRate._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ForceChangeRateUnits] = None) -> dict:
+        """
+        Get the ForceChangeRate DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (NewtonPerSecond).
+        :type hold_in_unit: ForceChangeRateUnits
+        :return: The ForceChangeRate DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ForceChangeRateUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ForceChangeRate:
+        """
+        Create a new instance of ForceChangeRate from its DTO.
+
+        :param dto: The ForceChangeRate DTO, the unit is the ForceChangeRateUnits value or name.
+        :type dto: dict
+        :return: A new instance of ForceChangeRate.
+        :rtype: ForceChangeRate
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ForceChangeRate._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ForceChangeRate:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ForceChangeRate._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -469,10 +747,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__newtons_per_minute != None:
-            return self.__newtons_per_minute
-        self.__newtons_per_minute = self.__convert_from_base(ForceChangeRateUnits.NewtonPerMinute)
-        return self.__newtons_per_minute
+        return self._cached_convert(ForceChangeRateUnits.NewtonPerMinute)
 
     
     @property
@@ -480,10 +755,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__newtons_per_second != None:
-            return self.__newtons_per_second
-        self.__newtons_per_second = self.__convert_from_base(ForceChangeRateUnits.NewtonPerSecond)
-        return self.__newtons_per_second
+        return self._cached_convert(ForceChangeRateUnits.NewtonPerSecond)
 
     
     @property
@@ -491,10 +763,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_per_minute != None:
-            return self.__pounds_force_per_minute
-        self.__pounds_force_per_minute = self.__convert_from_base(ForceChangeRateUnits.PoundForcePerMinute)
-        return self.__pounds_force_per_minute
+        return self._cached_convert(ForceChangeRateUnits.PoundForcePerMinute)
 
     
     @property
@@ -502,10 +771,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_per_second != None:
-            return self.__pounds_force_per_second
-        self.__pounds_force_per_second = self.__convert_from_base(ForceChangeRateUnits.PoundForcePerSecond)
-        return self.__pounds_force_per_second
+        return self._cached_convert(ForceChangeRateUnits.PoundForcePerSecond)
 
     
     @property
@@ -513,10 +779,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__decanewtons_per_minute != None:
-            return self.__decanewtons_per_minute
-        self.__decanewtons_per_minute = self.__convert_from_base(ForceChangeRateUnits.DecanewtonPerMinute)
-        return self.__decanewtons_per_minute
+        return self._cached_convert(ForceChangeRateUnits.DecanewtonPerMinute)
 
     
     @property
@@ -524,10 +787,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__kilonewtons_per_minute != None:
-            return self.__kilonewtons_per_minute
-        self.__kilonewtons_per_minute = self.__convert_from_base(ForceChangeRateUnits.KilonewtonPerMinute)
-        return self.__kilonewtons_per_minute
+        return self._cached_convert(ForceChangeRateUnits.KilonewtonPerMinute)
 
     
     @property
@@ -535,10 +795,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__nanonewtons_per_second != None:
-            return self.__nanonewtons_per_second
-        self.__nanonewtons_per_second = self.__convert_from_base(ForceChangeRateUnits.NanonewtonPerSecond)
-        return self.__nanonewtons_per_second
+        return self._cached_convert(ForceChangeRateUnits.NanonewtonPerSecond)
 
     
     @property
@@ -546,10 +803,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__micronewtons_per_second != None:
-            return self.__micronewtons_per_second
-        self.__micronewtons_per_second = self.__convert_from_base(ForceChangeRateUnits.MicronewtonPerSecond)
-        return self.__micronewtons_per_second
+        return self._cached_convert(ForceChangeRateUnits.MicronewtonPerSecond)
 
     
     @property
@@ -557,10 +811,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__millinewtons_per_second != None:
-            return self.__millinewtons_per_second
-        self.__millinewtons_per_second = self.__convert_from_base(ForceChangeRateUnits.MillinewtonPerSecond)
-        return self.__millinewtons_per_second
+        return self._cached_convert(ForceChangeRateUnits.MillinewtonPerSecond)
 
     
     @property
@@ -568,10 +819,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__centinewtons_per_second != None:
-            return self.__centinewtons_per_second
-        self.__centinewtons_per_second = self.__convert_from_base(ForceChangeRateUnits.CentinewtonPerSecond)
-        return self.__centinewtons_per_second
+        return self._cached_convert(ForceChangeRateUnits.CentinewtonPerSecond)
 
     
     @property
@@ -579,10 +827,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__decinewtons_per_second != None:
-            return self.__decinewtons_per_second
-        self.__decinewtons_per_second = self.__convert_from_base(ForceChangeRateUnits.DecinewtonPerSecond)
-        return self.__decinewtons_per_second
+        return self._cached_convert(ForceChangeRateUnits.DecinewtonPerSecond)
 
     
     @property
@@ -590,10 +835,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__decanewtons_per_second != None:
-            return self.__decanewtons_per_second
-        self.__decanewtons_per_second = self.__convert_from_base(ForceChangeRateUnits.DecanewtonPerSecond)
-        return self.__decanewtons_per_second
+        return self._cached_convert(ForceChangeRateUnits.DecanewtonPerSecond)
 
     
     @property
@@ -601,10 +843,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__kilonewtons_per_second != None:
-            return self.__kilonewtons_per_second
-        self.__kilonewtons_per_second = self.__convert_from_base(ForceChangeRateUnits.KilonewtonPerSecond)
-        return self.__kilonewtons_per_second
+        return self._cached_convert(ForceChangeRateUnits.KilonewtonPerSecond)
 
     
     @property
@@ -612,10 +851,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_force_per_minute != None:
-            return self.__kilopounds_force_per_minute
-        self.__kilopounds_force_per_minute = self.__convert_from_base(ForceChangeRateUnits.KilopoundForcePerMinute)
-        return self.__kilopounds_force_per_minute
+        return self._cached_convert(ForceChangeRateUnits.KilopoundForcePerMinute)
 
     
     @property
@@ -623,10 +859,7 @@ class ForceChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_force_per_second != None:
-            return self.__kilopounds_force_per_second
-        self.__kilopounds_force_per_second = self.__convert_from_base(ForceChangeRateUnits.KilopoundForcePerSecond)
-        return self.__kilopounds_force_per_second
+        return self._cached_convert(ForceChangeRateUnits.KilopoundForcePerSecond)
 
     
     def to_string(self, unit: ForceChangeRateUnits = ForceChangeRateUnits.NewtonPerSecond) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ForcePerLengthUnits(Enum):
         """
             ForcePerLengthUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         NewtonPerMeter = 'newton_per_meter'
         """
@@ -209,329 +220,688 @@ class ForcePerLength(AbstractMeasure):
         value (float): The value.
         from_unit (ForcePerLengthUnits): The ForcePerLength unit to create from, The default unit is NewtonPerMeter
     """
-    def __init__(self, value: float, from_unit: ForcePerLengthUnits = ForcePerLengthUnits.NewtonPerMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ForcePerLengthUnits
+
+    _base_unit = ForcePerLengthUnits.NewtonPerMeter
+
+    _dimensions = (0, 1, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 40
+
+    _binary_unit_ids = {
         
-        self.__newtons_per_meter = None
+        ForcePerLengthUnits.NewtonPerMeter: 0,
         
-        self.__newtons_per_centimeter = None
+        ForcePerLengthUnits.NewtonPerCentimeter: 1,
         
-        self.__newtons_per_millimeter = None
+        ForcePerLengthUnits.NewtonPerMillimeter: 2,
         
-        self.__kilograms_force_per_meter = None
+        ForcePerLengthUnits.KilogramForcePerMeter: 3,
         
-        self.__kilograms_force_per_centimeter = None
+        ForcePerLengthUnits.KilogramForcePerCentimeter: 4,
         
-        self.__kilograms_force_per_millimeter = None
+        ForcePerLengthUnits.KilogramForcePerMillimeter: 5,
         
-        self.__tonnes_force_per_meter = None
+        ForcePerLengthUnits.TonneForcePerMeter: 6,
         
-        self.__tonnes_force_per_centimeter = None
+        ForcePerLengthUnits.TonneForcePerCentimeter: 7,
         
-        self.__tonnes_force_per_millimeter = None
+        ForcePerLengthUnits.TonneForcePerMillimeter: 8,
         
-        self.__pounds_force_per_foot = None
+        ForcePerLengthUnits.PoundForcePerFoot: 9,
         
-        self.__pounds_force_per_inch = None
+        ForcePerLengthUnits.PoundForcePerInch: 10,
         
-        self.__pounds_force_per_yard = None
+        ForcePerLengthUnits.PoundForcePerYard: 11,
         
-        self.__kilopounds_force_per_foot = None
+        ForcePerLengthUnits.KilopoundForcePerFoot: 12,
         
-        self.__kilopounds_force_per_inch = None
+        ForcePerLengthUnits.KilopoundForcePerInch: 13,
         
-        self.__nanonewtons_per_meter = None
+        ForcePerLengthUnits.NanonewtonPerMeter: 14,
         
-        self.__micronewtons_per_meter = None
+        ForcePerLengthUnits.MicronewtonPerMeter: 15,
         
-        self.__millinewtons_per_meter = None
+        ForcePerLengthUnits.MillinewtonPerMeter: 16,
         
-        self.__centinewtons_per_meter = None
+        ForcePerLengthUnits.CentinewtonPerMeter: 17,
         
-        self.__decinewtons_per_meter = None
+        ForcePerLengthUnits.DecinewtonPerMeter: 18,
         
-        self.__decanewtons_per_meter = None
+        ForcePerLengthUnits.DecanewtonPerMeter: 19,
         
-        self.__kilonewtons_per_meter = None
+        ForcePerLengthUnits.KilonewtonPerMeter: 20,
         
-        self.__meganewtons_per_meter = None
+        ForcePerLengthUnits.MeganewtonPerMeter: 21,
         
-        self.__nanonewtons_per_centimeter = None
+        ForcePerLengthUnits.NanonewtonPerCentimeter: 22,
         
-        self.__micronewtons_per_centimeter = None
+        ForcePerLengthUnits.MicronewtonPerCentimeter: 23,
         
-        self.__millinewtons_per_centimeter = None
+        ForcePerLengthUnits.MillinewtonPerCentimeter: 24,
         
-        self.__centinewtons_per_centimeter = None
+        ForcePerLengthUnits.CentinewtonPerCentimeter: 25,
         
-        self.__decinewtons_per_centimeter = None
+        ForcePerLengthUnits.DecinewtonPerCentimeter: 26,
         
-        self.__decanewtons_per_centimeter = None
+        ForcePerLengthUnits.DecanewtonPerCentimeter: 27,
         
-        self.__kilonewtons_per_centimeter = None
+        ForcePerLengthUnits.KilonewtonPerCentimeter: 28,
         
-        self.__meganewtons_per_centimeter = None
+        ForcePerLengthUnits.MeganewtonPerCentimeter: 29,
         
-        self.__nanonewtons_per_millimeter = None
+        ForcePerLengthUnits.NanonewtonPerMillimeter: 30,
         
-        self.__micronewtons_per_millimeter = None
+        ForcePerLengthUnits.MicronewtonPerMillimeter: 31,
         
-        self.__millinewtons_per_millimeter = None
+        ForcePerLengthUnits.MillinewtonPerMillimeter: 32,
         
-        self.__centinewtons_per_millimeter = None
+        ForcePerLengthUnits.CentinewtonPerMillimeter: 33,
         
-        self.__decinewtons_per_millimeter = None
+        ForcePerLengthUnits.DecinewtonPerMillimeter: 34,
         
-        self.__decanewtons_per_millimeter = None
+        ForcePerLengthUnits.DecanewtonPerMillimeter: 35,
         
-        self.__kilonewtons_per_millimeter = None
+        ForcePerLengthUnits.KilonewtonPerMillimeter: 36,
         
-        self.__meganewtons_per_millimeter = None
+        ForcePerLengthUnits.MeganewtonPerMillimeter: 37,
         
+    }
 
-    def convert(self, unit: ForcePerLengthUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ForcePerLengthUnits.NewtonPerMeter: lambda value: (value),
+        
+        ForcePerLengthUnits.NewtonPerCentimeter: lambda value: (value / 1e2),
+        
+        ForcePerLengthUnits.NewtonPerMillimeter: lambda value: (value / 1e3),
+        
+        ForcePerLengthUnits.KilogramForcePerMeter: lambda value: (value / 9.80665002864),
+        
+        ForcePerLengthUnits.KilogramForcePerCentimeter: lambda value: (value / 980.665002864),
+        
+        ForcePerLengthUnits.KilogramForcePerMillimeter: lambda value: (value / 9.80665002864e3),
+        
+        ForcePerLengthUnits.TonneForcePerMeter: lambda value: (value / 9.80665002864e3),
+        
+        ForcePerLengthUnits.TonneForcePerCentimeter: lambda value: (value / 9.80665002864e5),
+        
+        ForcePerLengthUnits.TonneForcePerMillimeter: lambda value: (value / 9.80665002864e6),
+        
+        ForcePerLengthUnits.PoundForcePerFoot: lambda value: (value / 14.59390292),
+        
+        ForcePerLengthUnits.PoundForcePerInch: lambda value: (value / 1.75126835e2),
+        
+        ForcePerLengthUnits.PoundForcePerYard: lambda value: (value / 4.864634307),
+        
+        ForcePerLengthUnits.KilopoundForcePerFoot: lambda value: (value / 14593.90292),
+        
+        ForcePerLengthUnits.KilopoundForcePerInch: lambda value: (value / 1.75126835e5),
+        
+        ForcePerLengthUnits.NanonewtonPerMeter: lambda value: ((value) / 1e-09),
+        
+        ForcePerLengthUnits.MicronewtonPerMeter: lambda value: ((value) / 1e-06),
+        
+        ForcePerLengthUnits.MillinewtonPerMeter: lambda value: ((value) / 0.001),
+        
+        ForcePerLengthUnits.CentinewtonPerMeter: lambda value: ((value) / 0.01),
+        
+        ForcePerLengthUnits.DecinewtonPerMeter: lambda value: ((value) / 0.1),
+        
+        ForcePerLengthUnits.DecanewtonPerMeter: lambda value: ((value) / 10.0),
+        
+        ForcePerLengthUnits.KilonewtonPerMeter: lambda value: ((value) / 1000.0),
+        
+        ForcePerLengthUnits.MeganewtonPerMeter: lambda value: ((value) / 1000000.0),
+        
+        ForcePerLengthUnits.NanonewtonPerCentimeter: lambda value: ((value / 1e2) / 1e-09),
+        
+        ForcePerLengthUnits.MicronewtonPerCentimeter: lambda value: ((value / 1e2) / 1e-06),
+        
+        ForcePerLengthUnits.MillinewtonPerCentimeter: lambda value: ((value / 1e2) / 0.001),
+        
+        ForcePerLengthUnits.CentinewtonPerCentimeter: lambda value: ((value / 1e2) / 0.01),
+        
+        ForcePerLengthUnits.DecinewtonPerCentimeter: lambda value: ((value / 1e2) / 0.1),
+        
+        ForcePerLengthUnits.DecanewtonPerCentimeter: lambda value: ((value / 1e2) / 10.0),
+        
+        ForcePerLengthUnits.KilonewtonPerCentimeter: lambda value: ((value / 1e2) / 1000.0),
+        
+        ForcePerLengthUnits.MeganewtonPerCentimeter: lambda value: ((value / 1e2) / 1000000.0),
+        
+        ForcePerLengthUnits.NanonewtonPerMillimeter: lambda value: ((value / 1e3) / 1e-09),
+        
+        ForcePerLengthUnits.MicronewtonPerMillimeter: lambda value: ((value / 1e3) / 1e-06),
+        
+        ForcePerLengthUnits.MillinewtonPerMillimeter: lambda value: ((value / 1e3) / 0.001),
+        
+        ForcePerLengthUnits.CentinewtonPerMillimeter: lambda value: ((value / 1e3) / 0.01),
+        
+        ForcePerLengthUnits.DecinewtonPerMillimeter: lambda value: ((value / 1e3) / 0.1),
+        
+        ForcePerLengthUnits.DecanewtonPerMillimeter: lambda value: ((value / 1e3) / 10.0),
+        
+        ForcePerLengthUnits.KilonewtonPerMillimeter: lambda value: ((value / 1e3) / 1000.0),
+        
+        ForcePerLengthUnits.MeganewtonPerMillimeter: lambda value: ((value / 1e3) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ForcePerLengthUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ForcePerLengthUnits.NewtonPerMeter:
-            return (value)
+        ForcePerLengthUnits.NewtonPerMeter: lambda value: (value),
         
-        if from_unit == ForcePerLengthUnits.NewtonPerCentimeter:
-            return (value / 1e2)
+        ForcePerLengthUnits.NewtonPerCentimeter: lambda value: (value * 1e2),
         
-        if from_unit == ForcePerLengthUnits.NewtonPerMillimeter:
-            return (value / 1e3)
+        ForcePerLengthUnits.NewtonPerMillimeter: lambda value: (value * 1e3),
         
-        if from_unit == ForcePerLengthUnits.KilogramForcePerMeter:
-            return (value / 9.80665002864)
+        ForcePerLengthUnits.KilogramForcePerMeter: lambda value: (value * 9.80665002864),
         
-        if from_unit == ForcePerLengthUnits.KilogramForcePerCentimeter:
-            return (value / 980.665002864)
+        ForcePerLengthUnits.KilogramForcePerCentimeter: lambda value: (value * 980.665002864),
         
-        if from_unit == ForcePerLengthUnits.KilogramForcePerMillimeter:
-            return (value / 9.80665002864e3)
+        ForcePerLengthUnits.KilogramForcePerMillimeter: lambda value: (value * 9.80665002864e3),
         
-        if from_unit == ForcePerLengthUnits.TonneForcePerMeter:
-            return (value / 9.80665002864e3)
+        ForcePerLengthUnits.TonneForcePerMeter: lambda value: (value * 9.80665002864e3),
         
-        if from_unit == ForcePerLengthUnits.TonneForcePerCentimeter:
-            return (value / 9.80665002864e5)
+        ForcePerLengthUnits.TonneForcePerCentimeter: lambda value: (value * 9.80665002864e5),
         
-        if from_unit == ForcePerLengthUnits.TonneForcePerMillimeter:
-            return (value / 9.80665002864e6)
+        ForcePerLengthUnits.TonneForcePerMillimeter: lambda value: (value * 9.80665002864e6),
         
-        if from_unit == ForcePerLengthUnits.PoundForcePerFoot:
-            return (value / 14.59390292)
+        ForcePerLengthUnits.PoundForcePerFoot: lambda value: (value * 14.59390292),
         
-        if from_unit == ForcePerLengthUnits.PoundForcePerInch:
-            return (value / 1.75126835e2)
+        ForcePerLengthUnits.PoundForcePerInch: lambda value: (value * 1.75126835e2),
         
-        if from_unit == ForcePerLengthUnits.PoundForcePerYard:
-            return (value / 4.864634307)
+        ForcePerLengthUnits.PoundForcePerYard: lambda value: (value * 4.864634307),
         
-        if from_unit == ForcePerLengthUnits.KilopoundForcePerFoot:
-            return (value / 14593.90292)
+        ForcePerLengthUnits.KilopoundForcePerFoot: lambda value: (value * 14593.90292),
         
-        if from_unit == ForcePerLengthUnits.KilopoundForcePerInch:
-            return (value / 1.75126835e5)
+        ForcePerLengthUnits.KilopoundForcePerInch: lambda value: (value * 1.75126835e5),
         
-        if from_unit == ForcePerLengthUnits.NanonewtonPerMeter:
-            return ((value) / 1e-09)
+        ForcePerLengthUnits.NanonewtonPerMeter: lambda value: ((value) * 1e-09),
         
-        if from_unit == ForcePerLengthUnits.MicronewtonPerMeter:
-            return ((value) / 1e-06)
+        ForcePerLengthUnits.MicronewtonPerMeter: lambda value: ((value) * 1e-06),
         
-        if from_unit == ForcePerLengthUnits.MillinewtonPerMeter:
-            return ((value) / 0.001)
+        ForcePerLengthUnits.MillinewtonPerMeter: lambda value: ((value) * 0.001),
         
-        if from_unit == ForcePerLengthUnits.CentinewtonPerMeter:
-            return ((value) / 0.01)
+        ForcePerLengthUnits.CentinewtonPerMeter: lambda value: ((value) * 0.01),
         
-        if from_unit == ForcePerLengthUnits.DecinewtonPerMeter:
-            return ((value) / 0.1)
+        ForcePerLengthUnits.DecinewtonPerMeter: lambda value: ((value) * 0.1),
         
-        if from_unit == ForcePerLengthUnits.DecanewtonPerMeter:
-            return ((value) / 10.0)
+        ForcePerLengthUnits.DecanewtonPerMeter: lambda value: ((value) * 10.0),
         
-        if from_unit == ForcePerLengthUnits.KilonewtonPerMeter:
-            return ((value) / 1000.0)
+        ForcePerLengthUnits.KilonewtonPerMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == ForcePerLengthUnits.MeganewtonPerMeter:
-            return ((value) / 1000000.0)
+        ForcePerLengthUnits.MeganewtonPerMeter: lambda value: ((value) * 1000000.0),
         
-        if from_unit == ForcePerLengthUnits.NanonewtonPerCentimeter:
-            return ((value / 1e2) / 1e-09)
+        ForcePerLengthUnits.NanonewtonPerCentimeter: lambda value: ((value * 1e2) * 1e-09),
         
-        if from_unit == ForcePerLengthUnits.MicronewtonPerCentimeter:
-            return ((value / 1e2) / 1e-06)
+        ForcePerLengthUnits.MicronewtonPerCentimeter: lambda value: ((value * 1e2) * 1e-06),
         
-        if from_unit == ForcePerLengthUnits.MillinewtonPerCentimeter:
-            return ((value / 1e2) / 0.001)
+        ForcePerLengthUnits.MillinewtonPerCentimeter: lambda value: ((value * 1e2) * 0.001),
         
-        if from_unit == ForcePerLengthUnits.CentinewtonPerCentimeter:
-            return ((value / 1e2) / 0.01)
+        ForcePerLengthUnits.CentinewtonPerCentimeter: lambda value: ((value * 1e2) * 0.01),
         
-        if from_unit == ForcePerLengthUnits.DecinewtonPerCentimeter:
-            return ((value / 1e2) / 0.1)
+        ForcePerLengthUnits.DecinewtonPerCentimeter: lambda value: ((value * 1e2) * 0.1),
         
-        if from_unit == ForcePerLengthUnits.DecanewtonPerCentimeter:
-            return ((value / 1e2) / 10.0)
+        ForcePerLengthUnits.DecanewtonPerCentimeter: lambda value: ((value * 1e2) * 10.0),
         
-        if from_unit == ForcePerLengthUnits.KilonewtonPerCentimeter:
-            return ((value / 1e2) / 1000.0)
+        ForcePerLengthUnits.KilonewtonPerCentimeter: lambda value: ((value * 1e2) * 1000.0),
         
-        if from_unit == ForcePerLengthUnits.MeganewtonPerCentimeter:
-            return ((value / 1e2) / 1000000.0)
+        ForcePerLengthUnits.MeganewtonPerCentimeter: lambda value: ((value * 1e2) * 1000000.0),
         
-        if from_unit == ForcePerLengthUnits.NanonewtonPerMillimeter:
-            return ((value / 1e3) / 1e-09)
+        ForcePerLengthUnits.NanonewtonPerMillimeter: lambda value: ((value * 1e3) * 1e-09),
         
-        if from_unit == ForcePerLengthUnits.MicronewtonPerMillimeter:
-            return ((value / 1e3) / 1e-06)
+        ForcePerLengthUnits.MicronewtonPerMillimeter: lambda value: ((value * 1e3) * 1e-06),
         
-        if from_unit == ForcePerLengthUnits.MillinewtonPerMillimeter:
-            return ((value / 1e3) / 0.001)
+        ForcePerLengthUnits.MillinewtonPerMillimeter: lambda value: ((value * 1e3) * 0.001),
         
-        if from_unit == ForcePerLengthUnits.CentinewtonPerMillimeter:
-            return ((value / 1e3) / 0.01)
+        ForcePerLengthUnits.CentinewtonPerMillimeter: lambda value: ((value * 1e3) * 0.01),
         
-        if from_unit == ForcePerLengthUnits.DecinewtonPerMillimeter:
-            return ((value / 1e3) / 0.1)
+        ForcePerLengthUnits.DecinewtonPerMillimeter: lambda value: ((value * 1e3) * 0.1),
         
-        if from_unit == ForcePerLengthUnits.DecanewtonPerMillimeter:
-            return ((value / 1e3) / 10.0)
+        ForcePerLengthUnits.DecanewtonPerMillimeter: lambda value: ((value * 1e3) * 10.0),
         
-        if from_unit == ForcePerLengthUnits.KilonewtonPerMillimeter:
-            return ((value / 1e3) / 1000.0)
+        ForcePerLengthUnits.KilonewtonPerMillimeter: lambda value: ((value * 1e3) * 1000.0),
         
-        if from_unit == ForcePerLengthUnits.MeganewtonPerMillimeter:
-            return ((value / 1e3) / 1000000.0)
+        ForcePerLengthUnits.MeganewtonPerMillimeter: lambda value: ((value * 1e3) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ForcePerLengthUnits.NewtonPerMeter: ('1', '0'),
+        
+        ForcePerLengthUnits.NewtonPerCentimeter: ('1/100', '0'),
+        
+        ForcePerLengthUnits.NewtonPerMillimeter: ('1/1000', '0'),
+        
+        ForcePerLengthUnits.KilogramForcePerMeter: ('6250000000/61291562679', '0'),
+        
+        ForcePerLengthUnits.KilogramForcePerCentimeter: ('62500000/61291562679', '0'),
+        
+        ForcePerLengthUnits.KilogramForcePerMillimeter: ('6250000/61291562679', '0'),
+        
+        ForcePerLengthUnits.TonneForcePerMeter: ('6250000/61291562679', '0'),
+        
+        ForcePerLengthUnits.TonneForcePerCentimeter: ('62500/61291562679', '0'),
+        
+        ForcePerLengthUnits.TonneForcePerMillimeter: ('6250/61291562679', '0'),
+        
+        ForcePerLengthUnits.PoundForcePerFoot: ('25000000/364847573', '0'),
+        
+        ForcePerLengthUnits.PoundForcePerInch: ('200000/35025367', '0'),
+        
+        ForcePerLengthUnits.PoundForcePerYard: ('1000000000/4864634307', '0'),
+        
+        ForcePerLengthUnits.KilopoundForcePerFoot: ('25000/364847573', '0'),
+        
+        ForcePerLengthUnits.KilopoundForcePerInch: ('200/35025367', '0'),
+        
+        ForcePerLengthUnits.NanonewtonPerMeter: ('1000000000', '0'),
+        
+        ForcePerLengthUnits.MicronewtonPerMeter: ('1000000', '0'),
+        
+        ForcePerLengthUnits.MillinewtonPerMeter: ('1000', '0'),
+        
+        ForcePerLengthUnits.CentinewtonPerMeter: ('100', '0'),
+        
+        ForcePerLengthUnits.DecinewtonPerMeter: ('10', '0'),
+        
+        ForcePerLengthUnits.DecanewtonPerMeter: ('1/10', '0'),
+        
+        ForcePerLengthUnits.KilonewtonPerMeter: ('1/1000', '0'),
+        
+        ForcePerLengthUnits.MeganewtonPerMeter: ('1/1000000', '0'),
+        
+        ForcePerLengthUnits.NanonewtonPerCentimeter: ('10000000', '0'),
+        
+        ForcePerLengthUnits.MicronewtonPerCentimeter: ('10000', '0'),
+        
+        ForcePerLengthUnits.MillinewtonPerCentimeter: ('10', '0'),
+        
+        ForcePerLengthUnits.CentinewtonPerCentimeter: ('1', '0'),
+        
+        ForcePerLengthUnits.DecinewtonPerCentimeter: ('1/10', '0'),
+        
+        ForcePerLengthUnits.DecanewtonPerCentimeter: ('1/1000', '0'),
+        
+        ForcePerLengthUnits.KilonewtonPerCentimeter: ('1/100000', '0'),
+        
+        ForcePerLengthUnits.MeganewtonPerCentimeter: ('1/100000000', '0'),
+        
+        ForcePerLengthUnits.NanonewtonPerMillimeter: ('1000000', '0'),
+        
+        ForcePerLengthUnits.MicronewtonPerMillimeter: ('1000', '0'),
+        
+        ForcePerLengthUnits.MillinewtonPerMillimeter: ('1', '0'),
+        
+        ForcePerLengthUnits.CentinewtonPerMillimeter: ('1/10', '0'),
+        
+        ForcePerLengthUnits.DecinewtonPerMillimeter: ('1/100', '0'),
+        
+        ForcePerLengthUnits.DecanewtonPerMillimeter: ('1/10000', '0'),
+        
+        ForcePerLengthUnits.KilonewtonPerMillimeter: ('1/1000000', '0'),
+        
+        ForcePerLengthUnits.MeganewtonPerMillimeter: ('1/1000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ForcePerLengthUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == ForcePerLengthUnits.NewtonPerMeter:
-            return (value)
+        ForcePerLengthUnits.NewtonPerMeter: ('1', '0'),
         
-        if to_unit == ForcePerLengthUnits.NewtonPerCentimeter:
-            return (value * 1e2)
+        ForcePerLengthUnits.NewtonPerCentimeter: ('100', '0'),
         
-        if to_unit == ForcePerLengthUnits.NewtonPerMillimeter:
-            return (value * 1e3)
+        ForcePerLengthUnits.NewtonPerMillimeter: ('1000', '0'),
         
-        if to_unit == ForcePerLengthUnits.KilogramForcePerMeter:
-            return (value * 9.80665002864)
+        ForcePerLengthUnits.KilogramForcePerMeter: ('61291562679/6250000000', '0'),
         
-        if to_unit == ForcePerLengthUnits.KilogramForcePerCentimeter:
-            return (value * 980.665002864)
+        ForcePerLengthUnits.KilogramForcePerCentimeter: ('61291562679/62500000', '0'),
         
-        if to_unit == ForcePerLengthUnits.KilogramForcePerMillimeter:
-            return (value * 9.80665002864e3)
+        ForcePerLengthUnits.KilogramForcePerMillimeter: ('61291562679/6250000', '0'),
         
-        if to_unit == ForcePerLengthUnits.TonneForcePerMeter:
-            return (value * 9.80665002864e3)
+        ForcePerLengthUnits.TonneForcePerMeter: ('61291562679/6250000', '0'),
         
-        if to_unit == ForcePerLengthUnits.TonneForcePerCentimeter:
-            return (value * 9.80665002864e5)
+        ForcePerLengthUnits.TonneForcePerCentimeter: ('61291562679/62500', '0'),
         
-        if to_unit == ForcePerLengthUnits.TonneForcePerMillimeter:
-            return (value * 9.80665002864e6)
+        ForcePerLengthUnits.TonneForcePerMillimeter: ('61291562679/6250', '0'),
         
-        if to_unit == ForcePerLengthUnits.PoundForcePerFoot:
-            return (value * 14.59390292)
+        ForcePerLengthUnits.PoundForcePerFoot: ('364847573/25000000', '0'),
         
-        if to_unit == ForcePerLengthUnits.PoundForcePerInch:
-            return (value * 1.75126835e2)
+        ForcePerLengthUnits.PoundForcePerInch: ('35025367/200000', '0'),
         
-        if to_unit == ForcePerLengthUnits.PoundForcePerYard:
-            return (value * 4.864634307)
+        ForcePerLengthUnits.PoundForcePerYard: ('4864634307/1000000000', '0'),
         
-        if to_unit == ForcePerLengthUnits.KilopoundForcePerFoot:
-            return (value * 14593.90292)
+        ForcePerLengthUnits.KilopoundForcePerFoot: ('364847573/25000', '0'),
         
-        if to_unit == ForcePerLengthUnits.KilopoundForcePerInch:
-            return (value * 1.75126835e5)
+        ForcePerLengthUnits.KilopoundForcePerInch: ('35025367/200', '0'),
         
-        if to_unit == ForcePerLengthUnits.NanonewtonPerMeter:
-            return ((value) * 1e-09)
+        ForcePerLengthUnits.NanonewtonPerMeter: ('1/1000000000', '0'),
         
-        if to_unit == ForcePerLengthUnits.MicronewtonPerMeter:
-            return ((value) * 1e-06)
+        ForcePerLengthUnits.MicronewtonPerMeter: ('1/1000000', '0'),
         
-        if to_unit == ForcePerLengthUnits.MillinewtonPerMeter:
-            return ((value) * 0.001)
+        ForcePerLengthUnits.MillinewtonPerMeter: ('1/1000', '0'),
         
-        if to_unit == ForcePerLengthUnits.CentinewtonPerMeter:
-            return ((value) * 0.01)
+        ForcePerLengthUnits.CentinewtonPerMeter: ('1/100', '0'),
         
-        if to_unit == ForcePerLengthUnits.DecinewtonPerMeter:
-            return ((value) * 0.1)
+        ForcePerLengthUnits.DecinewtonPerMeter: ('1/10', '0'),
         
-        if to_unit == ForcePerLengthUnits.DecanewtonPerMeter:
-            return ((value) * 10.0)
+        ForcePerLengthUnits.DecanewtonPerMeter: ('10', '0'),
         
-        if to_unit == ForcePerLengthUnits.KilonewtonPerMeter:
-            return ((value) * 1000.0)
+        ForcePerLengthUnits.KilonewtonPerMeter: ('1000', '0'),
         
-        if to_unit == ForcePerLengthUnits.MeganewtonPerMeter:
-            return ((value) * 1000000.0)
+        ForcePerLengthUnits.MeganewtonPerMeter: ('1000000', '0'),
         
-        if to_unit == ForcePerLengthUnits.NanonewtonPerCentimeter:
-            return ((value * 1e2) * 1e-09)
+        ForcePerLengthUnits.NanonewtonPerCentimeter: ('1/10000000', '0'),
         
-        if to_unit == ForcePerLengthUnits.MicronewtonPerCentimeter:
-            return ((value * 1e2) * 1e-06)
+        ForcePerLengthUnits.MicronewtonPerCentimeter: ('1/10000', '0'),
         
-        if to_unit == ForcePerLengthUnits.MillinewtonPerCentimeter:
-            return ((value * 1e2) * 0.001)
+        ForcePerLengthUnits.MillinewtonPerCentimeter: ('1/10', '0'),
         
-        if to_unit == ForcePerLengthUnits.CentinewtonPerCentimeter:
-            return ((value * 1e2) * 0.01)
+        ForcePerLengthUnits.CentinewtonPerCentimeter: ('1', '0'),
         
-        if to_unit == ForcePerLengthUnits.DecinewtonPerCentimeter:
-            return ((value * 1e2) * 0.1)
+        ForcePerLengthUnits.DecinewtonPerCentimeter: ('10', '0'),
         
-        if to_unit == ForcePerLengthUnits.DecanewtonPerCentimeter:
-            return ((value * 1e2) * 10.0)
+        ForcePerLengthUnits.DecanewtonPerCentimeter: ('1000', '0'),
         
-        if to_unit == ForcePerLengthUnits.KilonewtonPerCentimeter:
-            return ((value * 1e2) * 1000.0)
+        ForcePerLengthUnits.KilonewtonPerCentimeter: ('100000', '0'),
         
-        if to_unit == ForcePerLengthUnits.MeganewtonPerCentimeter:
-            return ((value * 1e2) * 1000000.0)
+        ForcePerLengthUnits.MeganewtonPerCentimeter: ('100000000', '0'),
         
-        if to_unit == ForcePerLengthUnits.NanonewtonPerMillimeter:
-            return ((value * 1e3) * 1e-09)
+        ForcePerLengthUnits.NanonewtonPerMillimeter: ('1/1000000', '0'),
         
-        if to_unit == ForcePerLengthUnits.MicronewtonPerMillimeter:
-            return ((value * 1e3) * 1e-06)
+        ForcePerLengthUnits.MicronewtonPerMillimeter: ('1/1000', '0'),
         
-        if to_unit == ForcePerLengthUnits.MillinewtonPerMillimeter:
-            return ((value * 1e3) * 0.001)
+        ForcePerLengthUnits.MillinewtonPerMillimeter: ('1', '0'),
         
-        if to_unit == ForcePerLengthUnits.CentinewtonPerMillimeter:
-            return ((value * 1e3) * 0.01)
+        ForcePerLengthUnits.CentinewtonPerMillimeter: ('10', '0'),
         
-        if to_unit == ForcePerLengthUnits.DecinewtonPerMillimeter:
-            return ((value * 1e3) * 0.1)
+        ForcePerLengthUnits.DecinewtonPerMillimeter: ('100', '0'),
         
-        if to_unit == ForcePerLengthUnits.DecanewtonPerMillimeter:
-            return ((value * 1e3) * 10.0)
+        ForcePerLengthUnits.DecanewtonPerMillimeter: ('10000', '0'),
         
-        if to_unit == ForcePerLengthUnits.KilonewtonPerMillimeter:
-            return ((value * 1e3) * 1000.0)
+        ForcePerLengthUnits.KilonewtonPerMillimeter: ('1000000', '0'),
         
-        if to_unit == ForcePerLengthUnits.MeganewtonPerMillimeter:
-            return ((value * 1e3) * 1000000.0)
+        ForcePerLengthUnits.MeganewtonPerMillimeter: ('1000000000', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        ForcePerLengthUnits.NewtonPerMeter: ('N/m',),
+        
+        ForcePerLengthUnits.NewtonPerCentimeter: ('N/cm',),
+        
+        ForcePerLengthUnits.NewtonPerMillimeter: ('N/mm',),
+        
+        ForcePerLengthUnits.KilogramForcePerMeter: ('kgf/m',),
+        
+        ForcePerLengthUnits.KilogramForcePerCentimeter: ('kgf/cm',),
+        
+        ForcePerLengthUnits.KilogramForcePerMillimeter: ('kgf/mm',),
+        
+        ForcePerLengthUnits.TonneForcePerMeter: ('tf/m',),
+        
+        ForcePerLengthUnits.TonneForcePerCentimeter: ('tf/cm',),
+        
+        ForcePerLengthUnits.TonneForcePerMillimeter: ('tf/mm',),
+        
+        ForcePerLengthUnits.PoundForcePerFoot: ('lbf/ft',),
+        
+        ForcePerLengthUnits.PoundForcePerInch: ('lbf/in',),
+        
+        ForcePerLengthUnits.PoundForcePerYard: ('lbf/yd',),
+        
+        ForcePerLengthUnits.KilopoundForcePerFoot: ('kipf/ft',),
+        
+        ForcePerLengthUnits.KilopoundForcePerInch: ('kipf/in',),
+        
+        ForcePerLengthUnits.NanonewtonPerMeter: ('nN/m',),
+        
+        ForcePerLengthUnits.MicronewtonPerMeter: ('μN/m',),
+        
+        ForcePerLengthUnits.MillinewtonPerMeter: ('mN/m',),
+        
+        ForcePerLengthUnits.CentinewtonPerMeter: ('cN/m',),
+        
+        ForcePerLengthUnits.DecinewtonPerMeter: ('dN/m',),
+        
+        ForcePerLengthUnits.DecanewtonPerMeter: ('daN/m',),
+        
+        ForcePerLengthUnits.KilonewtonPerMeter: ('kN/m',),
+        
+        ForcePerLengthUnits.MeganewtonPerMeter: ('MN/m',),
+        
+        ForcePerLengthUnits.NanonewtonPerCentimeter: ('nN/cm',),
+        
+        ForcePerLengthUnits.MicronewtonPerCentimeter: ('μN/cm',),
+        
+        ForcePerLengthUnits.MillinewtonPerCentimeter: ('mN/cm',),
+        
+        ForcePerLengthUnits.CentinewtonPerCentimeter: ('cN/cm',),
+        
+        ForcePerLengthUnits.DecinewtonPerCentimeter: ('dN/cm',),
+        
+        ForcePerLengthUnits.DecanewtonPerCentimeter: ('daN/cm',),
+        
+        ForcePerLengthUnits.KilonewtonPerCentimeter: ('kN/cm',),
+        
+        ForcePerLengthUnits.MeganewtonPerCentimeter: ('MN/cm',),
+        
+        ForcePerLengthUnits.NanonewtonPerMillimeter: ('nN/mm',),
+        
+        ForcePerLengthUnits.MicronewtonPerMillimeter: ('μN/mm',),
+        
+        ForcePerLengthUnits.MillinewtonPerMillimeter: ('mN/mm',),
+        
+        ForcePerLengthUnits.CentinewtonPerMillimeter: ('cN/mm',),
+        
+        ForcePerLengthUnits.DecinewtonPerMillimeter: ('dN/mm',),
+        
+        ForcePerLengthUnits.DecanewtonPerMillimeter: ('daN/mm',),
+        
+        ForcePerLengthUnits.KilonewtonPerMillimeter: ('kN/mm',),
+        
+        ForcePerLengthUnits.MeganewtonPerMillimeter: ('MN/mm',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ForcePerLengthUnits = ForcePerLengthUnits.NewtonPerMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ForcePerLengthUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ForcePerLengthUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ForcePerLengthUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ForcePerLengthUnits, to_unit: ForcePerLengthUnits) -> float:
+        """
+        Convert a value from one ForcePerLength unit to another, without creating a ForcePerLength instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ForcePerLengthUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ForcePerLengthUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ForcePerLength._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ForcePerLengthUnits, to_unit: ForcePerLengthUnits) -> List[float]:
+        """
+        Convert many values from one ForcePerLength unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ForcePerLengthUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ForcePerLengthUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ForcePerLength._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ForcePerLengthUnits, to_unit: ForcePerLengthUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ForcePerLength._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ForcePerLengthUnits, to_unit: ForcePerLengthUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ForcePerLength unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ForcePerLengthUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ForcePerLengthUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ForcePerLength._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ForcePerLengthUnits = ForcePerLengthUnits.NewtonPerMeter) -> ForcePerLength:
+        """
+        Create a new instance of ForcePerLength holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ForcePerLengthUnits
+        :return: A new instance of ForcePerLength.
+        :rtype: ForcePerLength
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ForcePerLength._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ForcePerLengthUnits = ForcePerLengthUnits.NewtonPerMeter) -> Fraction:
+        """
+        Get the exact value of the ForcePerLength in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (NewtonPerMeter).
+        :type unit: ForcePerLengthUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ForcePerLength:
+        """
+        Parse a ForcePerLength from a value followed by a unit abbreviation, e.g. "1 N/m".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ForcePerLength.
+        :rtype: ForcePerLength
+        :raises ValueError: When the string is not a valid or an ambiguous ForcePerLength.
+        """
+        return ForcePerLength._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ForcePerLength]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ForcePerLength._try_parse(text)
+
+    def to_binary(self, unit: Optional[ForcePerLengthUnits] = None) -> bytes:
+        """
+        Encode the ForcePerLength to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ForcePerLengthUnits
+        :return: The encoded ForcePerLength.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ForcePerLength:
+        """
+        Decode a ForcePerLength encoded by to_binary.
+
+        :param data: The encoded ForcePerLength, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ForcePerLength.
+        :rtype: ForcePerLength
+        :raises ValueError: When the data is not a valid encoded ForcePerLength.
+        """
+        return ForcePerLength._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ForcePerLengthUnits] = None) -> dict:
+        """
+        Get the ForcePerLength DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (NewtonPerMeter).
+        :type hold_in_unit: ForcePerLengthUnits
+        :return: The ForcePerLength DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ForcePerLengthUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ForcePerLength:
+        """
+        Create a new instance of ForcePerLength from its DTO.
+
+        :param dto: The ForcePerLength DTO, the unit is the ForcePerLengthUnits value or name.
+        :type dto: dict
+        :return: A new instance of ForcePerLength.
+        :rtype: ForcePerLength
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ForcePerLength._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ForcePerLength:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ForcePerLength._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -1113,10 +1483,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__newtons_per_meter != None:
-            return self.__newtons_per_meter
-        self.__newtons_per_meter = self.__convert_from_base(ForcePerLengthUnits.NewtonPerMeter)
-        return self.__newtons_per_meter
+        return self._cached_convert(ForcePerLengthUnits.NewtonPerMeter)
 
     
     @property
@@ -1124,10 +1491,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__newtons_per_centimeter != None:
-            return self.__newtons_per_centimeter
-        self.__newtons_per_centimeter = self.__convert_from_base(ForcePerLengthUnits.NewtonPerCentimeter)
-        return self.__newtons_per_centimeter
+        return self._cached_convert(ForcePerLengthUnits.NewtonPerCentimeter)
 
     
     @property
@@ -1135,10 +1499,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__newtons_per_millimeter != None:
-            return self.__newtons_per_millimeter
-        self.__newtons_per_millimeter = self.__convert_from_base(ForcePerLengthUnits.NewtonPerMillimeter)
-        return self.__newtons_per_millimeter
+        return self._cached_convert(ForcePerLengthUnits.NewtonPerMillimeter)
 
     
     @property
@@ -1146,10 +1507,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_force_per_meter != None:
-            return self.__kilograms_force_per_meter
-        self.__kilograms_force_per_meter = self.__convert_from_base(ForcePerLengthUnits.KilogramForcePerMeter)
-        return self.__kilograms_force_per_meter
+        return self._cached_convert(ForcePerLengthUnits.KilogramForcePerMeter)
 
     
     @property
@@ -1157,10 +1515,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_force_per_centimeter != None:
-            return self.__kilograms_force_per_centimeter
-        self.__kilograms_force_per_centimeter = self.__convert_from_base(ForcePerLengthUnits.KilogramForcePerCentimeter)
-        return self.__kilograms_force_per_centimeter
+        return self._cached_convert(ForcePerLengthUnits.KilogramForcePerCentimeter)
 
     
     @property
@@ -1168,10 +1523,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_force_per_millimeter != None:
-            return self.__kilograms_force_per_millimeter
-        self.__kilograms_force_per_millimeter = self.__convert_from_base(ForcePerLengthUnits.KilogramForcePerMillimeter)
-        return self.__kilograms_force_per_millimeter
+        return self._cached_convert(ForcePerLengthUnits.KilogramForcePerMillimeter)
 
     
     @property
@@ -1179,10 +1531,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_force_per_meter != None:
-            return self.__tonnes_force_per_meter
-        self.__tonnes_force_per_meter = self.__convert_from_base(ForcePerLengthUnits.TonneForcePerMeter)
-        return self.__tonnes_force_per_meter
+        return self._cached_convert(ForcePerLengthUnits.TonneForcePerMeter)
 
     
     @property
@@ -1190,10 +1539,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_force_per_centimeter != None:
-            return self.__tonnes_force_per_centimeter
-        self.__tonnes_force_per_centimeter = self.__convert_from_base(ForcePerLengthUnits.TonneForcePerCentimeter)
-        return self.__tonnes_force_per_centimeter
+        return self._cached_convert(ForcePerLengthUnits.TonneForcePerCentimeter)
 
     
     @property
@@ -1201,10 +1547,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_force_per_millimeter != None:
-            return self.__tonnes_force_per_millimeter
-        self.__tonnes_force_per_millimeter = self.__convert_from_base(ForcePerLengthUnits.TonneForcePerMillimeter)
-        return self.__tonnes_force_per_millimeter
+        return self._cached_convert(ForcePerLengthUnits.TonneForcePerMillimeter)
 
     
     @property
@@ -1212,10 +1555,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_per_foot != None:
-            return self.__pounds_force_per_foot
-        self.__pounds_force_per_foot = self.__convert_from_base(ForcePerLengthUnits.PoundForcePerFoot)
-        return self.__pounds_force_per_foot
+        return self._cached_convert(ForcePerLengthUnits.PoundForcePerFoot)
 
     
     @property
@@ -1223,10 +1563,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_per_inch != None:
-            return self.__pounds_force_per_inch
-        self.__pounds_force_per_inch = self.__convert_from_base(ForcePerLengthUnits.PoundForcePerInch)
-        return self.__pounds_force_per_inch
+        return self._cached_convert(ForcePerLengthUnits.PoundForcePerInch)
 
     
     @property
@@ -1234,10 +1571,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_per_yard != None:
-            return self.__pounds_force_per_yard
-        self.__pounds_force_per_yard = self.__convert_from_base(ForcePerLengthUnits.PoundForcePerYard)
-        return self.__pounds_force_per_yard
+        return self._cached_convert(ForcePerLengthUnits.PoundForcePerYard)
 
     
     @property
@@ -1245,10 +1579,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_force_per_foot != None:
-            return self.__kilopounds_force_per_foot
-        self.__kilopounds_force_per_foot = self.__convert_from_base(ForcePerLengthUnits.KilopoundForcePerFoot)
-        return self.__kilopounds_force_per_foot
+        return self._cached_convert(ForcePerLengthUnits.KilopoundForcePerFoot)
 
     
     @property
@@ -1256,10 +1587,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_force_per_inch != None:
-            return self.__kilopounds_force_per_inch
-        self.__kilopounds_force_per_inch = self.__convert_from_base(ForcePerLengthUnits.KilopoundForcePerInch)
-        return self.__kilopounds_force_per_inch
+        return self._cached_convert(ForcePerLengthUnits.KilopoundForcePerInch)
 
     
     @property
@@ -1267,10 +1595,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__nanonewtons_per_meter != None:
-            return self.__nanonewtons_per_meter
-        self.__nanonewtons_per_meter = self.__convert_from_base(ForcePerLengthUnits.NanonewtonPerMeter)
-        return self.__nanonewtons_per_meter
+        return self._cached_convert(ForcePerLengthUnits.NanonewtonPerMeter)
 
     
     @property
@@ -1278,10 +1603,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__micronewtons_per_meter != None:
-            return self.__micronewtons_per_meter
-        self.__micronewtons_per_meter = self.__convert_from_base(ForcePerLengthUnits.MicronewtonPerMeter)
-        return self.__micronewtons_per_meter
+        return self._cached_convert(ForcePerLengthUnits.MicronewtonPerMeter)
 
     
     @property
@@ -1289,10 +1611,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__millinewtons_per_meter != None:
-            return self.__millinewtons_per_meter
-        self.__millinewtons_per_meter = self.__convert_from_base(ForcePerLengthUnits.MillinewtonPerMeter)
-        return self.__millinewtons_per_meter
+        return self._cached_convert(ForcePerLengthUnits.MillinewtonPerMeter)
 
     
     @property
@@ -1300,10 +1619,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__centinewtons_per_meter != None:
-            return self.__centinewtons_per_meter
-        self.__centinewtons_per_meter = self.__convert_from_base(ForcePerLengthUnits.CentinewtonPerMeter)
-        return self.__centinewtons_per_meter
+        return self._cached_convert(ForcePerLengthUnits.CentinewtonPerMeter)
 
     
     @property
@@ -1311,10 +1627,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__decinewtons_per_meter != None:
-            return self.__decinewtons_per_meter
-        self.__decinewtons_per_meter = self.__convert_from_base(ForcePerLengthUnits.DecinewtonPerMeter)
-        return self.__decinewtons_per_meter
+        return self._cached_convert(ForcePerLengthUnits.DecinewtonPerMeter)
 
     
     @property
@@ -1322,10 +1635,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__decanewtons_per_meter != None:
-            return self.__decanewtons_per_meter
-        self.__decanewtons_per_meter = self.__convert_from_base(ForcePerLengthUnits.DecanewtonPerMeter)
-        return self.__decanewtons_per_meter
+        return self._cached_convert(ForcePerLengthUnits.DecanewtonPerMeter)
 
     
     @property
@@ -1333,10 +1643,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilonewtons_per_meter != None:
-            return self.__kilonewtons_per_meter
-        self.__kilonewtons_per_meter = self.__convert_from_base(ForcePerLengthUnits.KilonewtonPerMeter)
-        return self.__kilonewtons_per_meter
+        return self._cached_convert(ForcePerLengthUnits.KilonewtonPerMeter)
 
     
     @property
@@ -1344,10 +1651,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__meganewtons_per_meter != None:
-            return self.__meganewtons_per_meter
-        self.__meganewtons_per_meter = self.__convert_from_base(ForcePerLengthUnits.MeganewtonPerMeter)
-        return self.__meganewtons_per_meter
+        return self._cached_convert(ForcePerLengthUnits.MeganewtonPerMeter)
 
     
     @property
@@ -1355,10 +1659,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__nanonewtons_per_centimeter != None:
-            return self.__nanonewtons_per_centimeter
-        self.__nanonewtons_per_centimeter = self.__convert_from_base(ForcePerLengthUnits.NanonewtonPerCentimeter)
-        return self.__nanonewtons_per_centimeter
+        return self._cached_convert(ForcePerLengthUnits.NanonewtonPerCentimeter)
 
     
     @property
@@ -1366,10 +1667,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__micronewtons_per_centimeter != None:
-            return self.__micronewtons_per_centimeter
-        self.__micronewtons_per_centimeter = self.__convert_from_base(ForcePerLengthUnits.MicronewtonPerCentimeter)
-        return self.__micronewtons_per_centimeter
+        return self._cached_convert(ForcePerLengthUnits.MicronewtonPerCentimeter)
 
     
     @property
@@ -1377,10 +1675,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__millinewtons_per_centimeter != None:
-            return self.__millinewtons_per_centimeter
-        self.__millinewtons_per_centimeter = self.__convert_from_base(ForcePerLengthUnits.MillinewtonPerCentimeter)
-        return self.__millinewtons_per_centimeter
+        return self._cached_convert(ForcePerLengthUnits.MillinewtonPerCentimeter)
 
     
     @property
@@ -1388,10 +1683,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__centinewtons_per_centimeter != None:
-            return self.__centinewtons_per_centimeter
-        self.__centinewtons_per_centimeter = self.__convert_from_base(ForcePerLengthUnits.CentinewtonPerCentimeter)
-        return self.__centinewtons_per_centimeter
+        return self._cached_convert(ForcePerLengthUnits.CentinewtonPerCentimeter)
 
     
     @property
@@ -1399,10 +1691,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__decinewtons_per_centimeter != None:
-            return self.__decinewtons_per_centimeter
-        self.__decinewtons_per_centimeter = self.__convert_from_base(ForcePerLengthUnits.DecinewtonPerCentimeter)
-        return self.__decinewtons_per_centimeter
+        return self._cached_convert(ForcePerLengthUnits.DecinewtonPerCentimeter)
 
     
     @property
@@ -1410,10 +1699,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__decanewtons_per_centimeter != None:
-            return self.__decanewtons_per_centimeter
-        self.__decanewtons_per_centimeter = self.__convert_from_base(ForcePerLengthUnits.DecanewtonPerCentimeter)
-        return self.__decanewtons_per_centimeter
+        return self._cached_convert(ForcePerLengthUnits.DecanewtonPerCentimeter)
 
     
     @property
@@ -1421,10 +1707,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilonewtons_per_centimeter != None:
-            return self.__kilonewtons_per_centimeter
-        self.__kilonewtons_per_centimeter = self.__convert_from_base(ForcePerLengthUnits.KilonewtonPerCentimeter)
-        return self.__kilonewtons_per_centimeter
+        return self._cached_convert(ForcePerLengthUnits.KilonewtonPerCentimeter)
 
     
     @property
@@ -1432,10 +1715,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__meganewtons_per_centimeter != None:
-            return self.__meganewtons_per_centimeter
-        self.__meganewtons_per_centimeter = self.__convert_from_base(ForcePerLengthUnits.MeganewtonPerCentimeter)
-        return self.__meganewtons_per_centimeter
+        return self._cached_convert(ForcePerLengthUnits.MeganewtonPerCentimeter)
 
     
     @property
@@ -1443,10 +1723,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__nanonewtons_per_millimeter != None:
-            return self.__nanonewtons_per_millimeter
-        self.__nanonewtons_per_millimeter = self.__convert_from_base(ForcePerLengthUnits.NanonewtonPerMillimeter)
-        return self.__nanonewtons_per_millimeter
+        return self._cached_convert(ForcePerLengthUnits.NanonewtonPerMillimeter)
 
     
     @property
@@ -1454,10 +1731,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__micronewtons_per_millimeter != None:
-            return self.__micronewtons_per_millimeter
-        self.__micronewtons_per_millimeter = self.__convert_from_base(ForcePerLengthUnits.MicronewtonPerMillimeter)
-        return self.__micronewtons_per_millimeter
+        return self._cached_convert(ForcePerLengthUnits.MicronewtonPerMillimeter)
 
     
     @property
@@ -1465,10 +1739,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__millinewtons_per_millimeter != None:
-            return self.__millinewtons_per_millimeter
-        self.__millinewtons_per_millimeter = self.__convert_from_base(ForcePerLengthUnits.MillinewtonPerMillimeter)
-        return self.__millinewtons_per_millimeter
+        return self._cached_convert(ForcePerLengthUnits.MillinewtonPerMillimeter)
 
     
     @property
@@ -1476,10 +1747,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__centinewtons_per_millimeter != None:
-            return self.__centinewtons_per_millimeter
-        self.__centinewtons_per_millimeter = self.__convert_from_base(ForcePerLengthUnits.CentinewtonPerMillimeter)
-        return self.__centinewtons_per_millimeter
+        return self._cached_convert(ForcePerLengthUnits.CentinewtonPerMillimeter)
 
     
     @property
@@ -1487,10 +1755,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__decinewtons_per_millimeter != None:
-            return self.__decinewtons_per_millimeter
-        self.__decinewtons_per_millimeter = self.__convert_from_base(ForcePerLengthUnits.DecinewtonPerMillimeter)
-        return self.__decinewtons_per_millimeter
+        return self._cached_convert(ForcePerLengthUnits.DecinewtonPerMillimeter)
 
     
     @property
@@ -1498,10 +1763,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__decanewtons_per_millimeter != None:
-            return self.__decanewtons_per_millimeter
-        self.__decanewtons_per_millimeter = self.__convert_from_base(ForcePerLengthUnits.DecanewtonPerMillimeter)
-        return self.__decanewtons_per_millimeter
+        return self._cached_convert(ForcePerLengthUnits.DecanewtonPerMillimeter)
 
     
     @property
@@ -1509,10 +1771,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilonewtons_per_millimeter != None:
-            return self.__kilonewtons_per_millimeter
-        self.__kilonewtons_per_millimeter = self.__convert_from_base(ForcePerLengthUnits.KilonewtonPerMillimeter)
-        return self.__kilonewtons_per_millimeter
+        return self._cached_convert(ForcePerLengthUnits.KilonewtonPerMillimeter)
 
     
     @property
@@ -1520,10 +1779,7 @@ class ForcePerLength(AbstractMeasure):
         """
         
         """
-        if self.__meganewtons_per_millimeter != None:
-            return self.__meganewtons_per_millimeter
-        self.__meganewtons_per_millimeter = self.__convert_from_base(ForcePerLengthUnits.MeganewtonPerMillimeter)
-        return self.__meganewtons_per_millimeter
+        return self._cached_convert(ForcePerLengthUnits.MeganewtonPerMillimeter)
 
     
     def to_string(self, unit: ForcePerLengthUnits = ForcePerLengthUnits.NewtonPerMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class FrequencyUnits(Enum):
         """
             FrequencyUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Hertz = 'hertz'
         """
@@ -84,129 +95,384 @@ class Frequency(AbstractMeasure):
         value (float): The value.
         from_unit (FrequencyUnits): The Frequency unit to create from, The default unit is Hertz
     """
-    def __init__(self, value: float, from_unit: FrequencyUnits = FrequencyUnits.Hertz):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = FrequencyUnits
+
+    _base_unit = FrequencyUnits.Hertz
+
+    _dimensions = (0, 0, -1, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 41
+
+    _binary_unit_ids = {
         
-        self.__hertz = None
+        FrequencyUnits.Hertz: 0,
         
-        self.__radians_per_second = None
+        FrequencyUnits.RadianPerSecond: 1,
         
-        self.__cycles_per_minute = None
+        FrequencyUnits.CyclePerMinute: 2,
         
-        self.__cycles_per_hour = None
+        FrequencyUnits.CyclePerHour: 3,
         
-        self.__beats_per_minute = None
+        FrequencyUnits.BeatPerMinute: 4,
         
-        self.__per_second = None
+        FrequencyUnits.PerSecond: 5,
         
-        self.__b_units = None
+        FrequencyUnits.BUnit: 6,
         
-        self.__microhertz = None
+        FrequencyUnits.Microhertz: 7,
         
-        self.__millihertz = None
+        FrequencyUnits.Millihertz: 8,
         
-        self.__kilohertz = None
+        FrequencyUnits.Kilohertz: 9,
         
-        self.__megahertz = None
+        FrequencyUnits.Megahertz: 10,
         
-        self.__gigahertz = None
+        FrequencyUnits.Gigahertz: 11,
         
-        self.__terahertz = None
+        FrequencyUnits.Terahertz: 12,
         
+    }
 
-    def convert(self, unit: FrequencyUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        FrequencyUnits.Hertz: lambda value: (value),
+        
+        FrequencyUnits.RadianPerSecond: lambda value: (value * 6.2831853072),
+        
+        FrequencyUnits.CyclePerMinute: lambda value: (value * 60),
+        
+        FrequencyUnits.CyclePerHour: lambda value: (value * 3600),
+        
+        FrequencyUnits.BeatPerMinute: lambda value: (value * 60),
+        
+        FrequencyUnits.PerSecond: lambda value: (value),
+        
+        FrequencyUnits.BUnit: lambda value: (value * value * 1e-3),
+        
+        FrequencyUnits.Microhertz: lambda value: ((value) / 1e-06),
+        
+        FrequencyUnits.Millihertz: lambda value: ((value) / 0.001),
+        
+        FrequencyUnits.Kilohertz: lambda value: ((value) / 1000.0),
+        
+        FrequencyUnits.Megahertz: lambda value: ((value) / 1000000.0),
+        
+        FrequencyUnits.Gigahertz: lambda value: ((value) / 1000000000.0),
+        
+        FrequencyUnits.Terahertz: lambda value: ((value) / 1000000000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: FrequencyUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == FrequencyUnits.Hertz:
-            return (value)
+        FrequencyUnits.Hertz: lambda value: (value),
         
-        if from_unit == FrequencyUnits.RadianPerSecond:
-            return (value * 6.2831853072)
+        FrequencyUnits.RadianPerSecond: lambda value: (value / 6.2831853072),
         
-        if from_unit == FrequencyUnits.CyclePerMinute:
-            return (value * 60)
+        FrequencyUnits.CyclePerMinute: lambda value: (value / 60),
         
-        if from_unit == FrequencyUnits.CyclePerHour:
-            return (value * 3600)
+        FrequencyUnits.CyclePerHour: lambda value: (value / 3600),
         
-        if from_unit == FrequencyUnits.BeatPerMinute:
-            return (value * 60)
+        FrequencyUnits.BeatPerMinute: lambda value: (value / 60),
         
-        if from_unit == FrequencyUnits.PerSecond:
-            return (value)
+        FrequencyUnits.PerSecond: lambda value: (value),
         
-        if from_unit == FrequencyUnits.BUnit:
-            return (value * value * 1e-3)
+        FrequencyUnits.BUnit: lambda value: (math.sqrt(value * 1e3)),
         
-        if from_unit == FrequencyUnits.Microhertz:
-            return ((value) / 1e-06)
+        FrequencyUnits.Microhertz: lambda value: ((value) * 1e-06),
         
-        if from_unit == FrequencyUnits.Millihertz:
-            return ((value) / 0.001)
+        FrequencyUnits.Millihertz: lambda value: ((value) * 0.001),
         
-        if from_unit == FrequencyUnits.Kilohertz:
-            return ((value) / 1000.0)
+        FrequencyUnits.Kilohertz: lambda value: ((value) * 1000.0),
         
-        if from_unit == FrequencyUnits.Megahertz:
-            return ((value) / 1000000.0)
+        FrequencyUnits.Megahertz: lambda value: ((value) * 1000000.0),
         
-        if from_unit == FrequencyUnits.Gigahertz:
-            return ((value) / 1000000000.0)
+        FrequencyUnits.Gigahertz: lambda value: ((value) * 1000000000.0),
         
-        if from_unit == FrequencyUnits.Terahertz:
-            return ((value) / 1000000000000.0)
+        FrequencyUnits.Terahertz: lambda value: ((value) * 1000000000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        FrequencyUnits.Hertz: ('1', '0'),
+        
+        FrequencyUnits.RadianPerSecond: ('3926990817/625000000', '0'),
+        
+        FrequencyUnits.CyclePerMinute: ('60', '0'),
+        
+        FrequencyUnits.CyclePerHour: ('3600', '0'),
+        
+        FrequencyUnits.BeatPerMinute: ('60', '0'),
+        
+        FrequencyUnits.PerSecond: ('1', '0'),
+        
+        FrequencyUnits.Microhertz: ('1000000', '0'),
+        
+        FrequencyUnits.Millihertz: ('1000', '0'),
+        
+        FrequencyUnits.Kilohertz: ('1/1000', '0'),
+        
+        FrequencyUnits.Megahertz: ('1/1000000', '0'),
+        
+        FrequencyUnits.Gigahertz: ('1/1000000000', '0'),
+        
+        FrequencyUnits.Terahertz: ('1/1000000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: FrequencyUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == FrequencyUnits.Hertz:
-            return (value)
+        FrequencyUnits.Hertz: ('1', '0'),
         
-        if to_unit == FrequencyUnits.RadianPerSecond:
-            return (value / 6.2831853072)
+        FrequencyUnits.RadianPerSecond: ('625000000/3926990817', '0'),
         
-        if to_unit == FrequencyUnits.CyclePerMinute:
-            return (value / 60)
+        FrequencyUnits.CyclePerMinute: ('1/60', '0'),
         
-        if to_unit == FrequencyUnits.CyclePerHour:
-            return (value / 3600)
+        FrequencyUnits.CyclePerHour: ('1/3600', '0'),
         
-        if to_unit == FrequencyUnits.BeatPerMinute:
-            return (value / 60)
+        FrequencyUnits.BeatPerMinute: ('1/60', '0'),
+        
+        FrequencyUnits.PerSecond: ('1', '0'),
+        
+        FrequencyUnits.Microhertz: ('1/1000000', '0'),
+        
+        FrequencyUnits.Millihertz: ('1/1000', '0'),
+        
+        FrequencyUnits.Kilohertz: ('1000', '0'),
+        
+        FrequencyUnits.Megahertz: ('1000000', '0'),
+        
+        FrequencyUnits.Gigahertz: ('1000000000', '0'),
+        
+        FrequencyUnits.Terahertz: ('1000000000000', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == FrequencyUnits.PerSecond:
-            return (value)
+        FrequencyUnits.Hertz: ('Hz',),
         
-        if to_unit == FrequencyUnits.BUnit:
-            return (math.sqrt(value * 1e3))
+        FrequencyUnits.RadianPerSecond: ('rad/s',),
         
-        if to_unit == FrequencyUnits.Microhertz:
-            return ((value) * 1e-06)
+        FrequencyUnits.CyclePerMinute: ('cpm',),
         
-        if to_unit == FrequencyUnits.Millihertz:
-            return ((value) * 0.001)
+        FrequencyUnits.CyclePerHour: ('cph',),
         
-        if to_unit == FrequencyUnits.Kilohertz:
-            return ((value) * 1000.0)
+        FrequencyUnits.BeatPerMinute: ('bpm',),
         
-        if to_unit == FrequencyUnits.Megahertz:
-            return ((value) * 1000000.0)
+        FrequencyUnits.PerSecond: ('s⁻¹',),
         
-        if to_unit == FrequencyUnits.Gigahertz:
-            return ((value) * 1000000000.0)
+        FrequencyUnits.BUnit: ('B Units',),
         
-        if to_unit == FrequencyUnits.Terahertz:
-            return ((value) * 1000000000000.0)
+        FrequencyUnits.Microhertz: ('μHz',),
         
-        return None
+        FrequencyUnits.Millihertz: ('mHz',),
+        
+        FrequencyUnits.Kilohertz: ('kHz',),
+        
+        FrequencyUnits.Megahertz: ('MHz',),
+        
+        FrequencyUnits.Gigahertz: ('GHz',),
+        
+        FrequencyUnits.Terahertz: ('THz',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: FrequencyUnits = FrequencyUnits.Hertz):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: FrequencyUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: FrequencyUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: FrequencyUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: FrequencyUnits, to_unit: FrequencyUnits) -> float:
+        """
+        Convert a value from one Frequency unit to another, without creating a Frequency instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: FrequencyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: FrequencyUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Frequency._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: FrequencyUnits, to_unit: FrequencyUnits) -> List[float]:
+        """
+        Convert many values from one Frequency unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: FrequencyUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: FrequencyUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Frequency._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: FrequencyUnits, to_unit: FrequencyUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Frequency._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: FrequencyUnits, to_unit: FrequencyUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Frequency unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: FrequencyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: FrequencyUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Frequency._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: FrequencyUnits = FrequencyUnits.Hertz) -> Frequency:
+        """
+        Create a new instance of Frequency holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: FrequencyUnits
+        :return: A new instance of Frequency.
+        :rtype: Frequency
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Frequency._from_exact(value, from_unit)
+
+    def to_exact(self, unit: FrequencyUnits = FrequencyUnits.Hertz) -> Fraction:
+        """
+        Get the exact value of the Frequency in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Hertz).
+        :type unit: FrequencyUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
 
+    @staticmethod
+    def parse(text: str) -> Frequency:
+        """
+        Parse a Frequency from a value followed by a unit abbreviation, e.g. "1 Hz".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Frequency.
+        :rtype: Frequency
+        :raises ValueError: When the string is not a valid or an ambiguous Frequency.
+        """
+        return Frequency._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Frequency]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Frequency._try_parse(text)
+
+    def to_binary(self, unit: Optional[FrequencyUnits] = None) -> bytes:
+        """
+        Encode the Frequency to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: FrequencyUnits
+        :return: The encoded Frequency.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Frequency:
+        """
+        Decode a Frequency encoded by to_binary.
+
+        :param data: The encoded Frequency, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Frequency.
+        :rtype: Frequency
+        :raises ValueError: When the data is not a valid encoded Frequency.
+        """
+        return Frequency._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[FrequencyUnits] = None) -> dict:
+        """
+        Get the Frequency DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Hertz).
+        :type hold_in_unit: FrequencyUnits
+        :return: The Frequency DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[FrequencyUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Frequency:
+        """
+        Create a new instance of Frequency from its DTO.
+
+        :param dto: The Frequency DTO, the unit is the FrequencyUnits value or name.
+        :type dto: dict
+        :return: A new instance of Frequency.
+        :rtype: Frequency
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Frequency._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Frequency:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Frequency._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -413,10 +679,7 @@ class Frequency(AbstractMeasure):
         """
         
         """
-        if self.__hertz != None:
-            return self.__hertz
-        self.__hertz = self.__convert_from_base(FrequencyUnits.Hertz)
-        return self.__hertz
+        return self._cached_convert(FrequencyUnits.Hertz)
 
     
     @property
@@ -424,10 +687,7 @@ class Frequency(AbstractMeasure):
         """
         
         """
-        if self.__radians_per_second != None:
-            return self.__radians_per_second
-        self.__radians_per_second = self.__convert_from_base(FrequencyUnits.RadianPerSecond)
-        return self.__radians_per_second
+        return self._cached_convert(FrequencyUnits.RadianPerSecond)
 
     
     @property
@@ -435,10 +695,7 @@ class Frequency(AbstractMeasure):
         """
         
         """
-        if self.__cycles_per_minute != None:
-            return self.__cycles_per_minute
-        self.__cycles_per_minute = self.__convert_from_base(FrequencyUnits.CyclePerMinute)
-        return self.__cycles_per_minute
+        return self._cached_convert(FrequencyUnits.CyclePerMinute)
 
     
     @property
@@ -446,10 +703,7 @@ class Frequency(AbstractMeasure):
         """
         
         """
-        if self.__cycles_per_hour != None:
-            return self.__cycles_per_hour
-        self.__cycles_per_hour = self.__convert_from_base(FrequencyUnits.CyclePerHour)
-        return self.__cycles_per_hour
+        return self._cached_convert(FrequencyUnits.CyclePerHour)
 
     
     @property
@@ -457,10 +711,7 @@ class Frequency(AbstractMeasure):
         """
         
         """
-        if self.__beats_per_minute != None:
-            return self.__beats_per_minute
-        self.__beats_per_minute = self.__convert_from_base(FrequencyUnits.BeatPerMinute)
-        return self.__beats_per_minute
+        return self._cached_convert(FrequencyUnits.BeatPerMinute)
 
     
     @property
@@ -468,10 +719,7 @@ class Frequency(AbstractMeasure):
         """
         
         """
-        if self.__per_second != None:
-            return self.__per_second
-        self.__per_second = self.__convert_from_base(FrequencyUnits.PerSecond)
-        return self.__per_second
+        return self._cached_convert(FrequencyUnits.PerSecond)
 
     
     @property
@@ -479,10 +727,7 @@ class Frequency(AbstractMeasure):
         """
         
         """
-        if self.__b_units != None:
-            return self.__b_units
-        self.__b_units = self.__convert_from_base(FrequencyUnits.BUnit)
-        return self.__b_units
+        return self._cached_convert(FrequencyUnits.BUnit)
 
     
     @property
@@ -490,10 +735,7 @@ class Frequency(AbstractMeasure):
         """
         
         """
-        if self.__microhertz != None:
-            return self.__microhertz
-        self.__microhertz = self.__convert_from_base(FrequencyUnits.Microhertz)
-        return self.__microhertz
+        return self._cached_convert(FrequencyUnits.Microhertz)
 
     
     @property
@@ -501,10 +743,7 @@ class Frequency(AbstractMeasure):
         """
         
         """
-        if self.__millihertz != None:
-            return self.__millihertz
-        self.__millihertz = self.__convert_from_base(FrequencyUnits.Millihertz)
-        return self.__millihertz
+        return self._cached_convert(FrequencyUnits.Millihertz)
 
     
     @property
@@ -512,10 +751,7 @@ class Frequency(AbstractMeasure):
         """
         
         """
-        if self.__kilohertz != None:
-            return self.__kilohertz
-        self.__kilohertz = self.__convert_from_base(FrequencyUnits.Kilohertz)
-        return self.__kilohertz
+        return self._cached_convert(FrequencyUnits.Kilohertz)
 
     
     @property
@@ -523,10 +759,7 @@ class Frequency(AbstractMeasure):
         """
         
         """
-        if self.__megahertz != None:
-            return self.__megahertz
-        self.__megahertz = self.__convert_from_base(FrequencyUnits.Megahertz)
-        return self.__megahertz
+        return self._cached_convert(FrequencyUnits.Megahertz)
 
     
     @property
@@ -534,10 +767,7 @@ class Frequency(AbstractMeasure):
         """
         
         """
-        if self.__gigahertz != None:
-            return self.__gigahertz
-        self.__gigahertz = self.__convert_from_base(FrequencyUnits.Gigahertz)
-        return self.__gigahertz
+        return self._cached_convert(FrequencyUnits.Gigahertz)
 
     
     @property
@@ -545,10 +775,7 @@ class Frequency(AbstractMeasure):
         """
         
         """
-        if self.__terahertz != None:
-            return self.__terahertz
-        self.__terahertz = self.__convert_from_base(FrequencyUnits.Terahertz)
-        return self.__terahertz
+        return self._cached_convert(FrequencyUnits.Terahertz)
 
     
     def to_string(self, unit: FrequencyUnits = FrequencyUnits.Hertz) -> str:
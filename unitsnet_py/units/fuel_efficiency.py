@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class FuelEfficiencyUnits(Enum):
         """
             FuelEfficiencyUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         LiterPer100Kilometers = 'liter_per100_kilometers'
         """
@@ -39,57 +50,268 @@ class FuelEfficiency(AbstractMeasure):
         value (float): The value.
         from_unit (FuelEfficiencyUnits): The FuelEfficiency unit to create from, The default unit is LiterPer100Kilometers
     """
-    def __init__(self, value: float, from_unit: FuelEfficiencyUnits = FuelEfficiencyUnits.LiterPer100Kilometers):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = FuelEfficiencyUnits
+
+    _base_unit = FuelEfficiencyUnits.LiterPer100Kilometers
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 42
+
+    _binary_unit_ids = {
         
-        self.__liters_per100_kilometers = None
+        FuelEfficiencyUnits.LiterPer100Kilometers: 0,
         
-        self.__miles_per_us_gallon = None
+        FuelEfficiencyUnits.MilePerUsGallon: 1,
         
-        self.__miles_per_uk_gallon = None
+        FuelEfficiencyUnits.MilePerUkGallon: 2,
         
-        self.__kilometers_per_liters = None
+        FuelEfficiencyUnits.KilometerPerLiter: 3,
         
+    }
 
-    def convert(self, unit: FuelEfficiencyUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        FuelEfficiencyUnits.LiterPer100Kilometers: lambda value: (value),
+        
+        FuelEfficiencyUnits.MilePerUsGallon: lambda value: ((100 * 3.785411784) / (1.609344 * value)),
+        
+        FuelEfficiencyUnits.MilePerUkGallon: lambda value: ((100 * 4.54609188) / (1.609344 * value)),
+        
+        FuelEfficiencyUnits.KilometerPerLiter: lambda value: (100 / value),
+        
+    }
 
-    def __convert_from_base(self, from_unit: FuelEfficiencyUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == FuelEfficiencyUnits.LiterPer100Kilometers:
-            return (value)
+        FuelEfficiencyUnits.LiterPer100Kilometers: lambda value: (value),
         
-        if from_unit == FuelEfficiencyUnits.MilePerUsGallon:
-            return ((100 * 3.785411784) / (1.609344 * value))
+        FuelEfficiencyUnits.MilePerUsGallon: lambda value: ((100 * 3.785411784) / (1.609344 * value)),
         
-        if from_unit == FuelEfficiencyUnits.MilePerUkGallon:
-            return ((100 * 4.54609188) / (1.609344 * value))
+        FuelEfficiencyUnits.MilePerUkGallon: lambda value: ((100 * 4.54609188) / (1.609344 * value)),
         
-        if from_unit == FuelEfficiencyUnits.KilometerPerLiter:
-            return (100 / value)
+        FuelEfficiencyUnits.KilometerPerLiter: lambda value: (100 / value),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        FuelEfficiencyUnits.LiterPer100Kilometers: ('1', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: FuelEfficiencyUnits) -> float:
+    _affine_to_base = {
+        
+        FuelEfficiencyUnits.LiterPer100Kilometers: ('1', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == FuelEfficiencyUnits.LiterPer100Kilometers:
-            return (value)
+        FuelEfficiencyUnits.LiterPer100Kilometers: ('L/100km',),
         
-        if to_unit == FuelEfficiencyUnits.MilePerUsGallon:
-            return ((100 * 3.785411784) / (1.609344 * value))
+        FuelEfficiencyUnits.MilePerUsGallon: ('mpg (U.S.)',),
         
-        if to_unit == FuelEfficiencyUnits.MilePerUkGallon:
-            return ((100 * 4.54609188) / (1.609344 * value))
+        FuelEfficiencyUnits.MilePerUkGallon: ('mpg (imp.)',),
         
-        if to_unit == FuelEfficiencyUnits.KilometerPerLiter:
-            return (100 / value)
+        FuelEfficiencyUnits.KilometerPerLiter: ('km/L',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: FuelEfficiencyUnits = FuelEfficiencyUnits.LiterPer100Kilometers):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: FuelEfficiencyUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: FuelEfficiencyUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: FuelEfficiencyUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: FuelEfficiencyUnits, to_unit: FuelEfficiencyUnits) -> float:
+        """
+        Convert a value from one FuelEfficiency unit to another, without creating a FuelEfficiency instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: FuelEfficiencyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: FuelEfficiencyUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return FuelEfficiency._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: FuelEfficiencyUnits, to_unit: FuelEfficiencyUnits) -> List[float]:
+        """
+        Convert many values from one FuelEfficiency unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: FuelEfficiencyUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: FuelEfficiencyUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return FuelEfficiency._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: FuelEfficiencyUnits, to_unit: FuelEfficiencyUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", FuelEfficiency._convert_many(values, from_unit, to_unit))
 
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: FuelEfficiencyUnits, to_unit: FuelEfficiencyUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one FuelEfficiency unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: FuelEfficiencyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: FuelEfficiencyUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return FuelEfficiency._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: FuelEfficiencyUnits = FuelEfficiencyUnits.LiterPer100Kilometers) -> FuelEfficiency:
+        """
+        Create a new instance of FuelEfficiency holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: FuelEfficiencyUnits
+        :return: A new instance of FuelEfficiency.
+        :rtype: FuelEfficiency
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return FuelEfficiency._from_exact(value, from_unit)
+
+    def to_exact(self, unit: FuelEfficiencyUnits = FuelEfficiencyUnits.LiterPer100Kilometers) -> Fraction:
+        """
+        Get the exact value of the FuelEfficiency in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (LiterPer100Kilometers).
+        :type unit: FuelEfficiencyUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> FuelEfficiency:
+        """
+        Parse a FuelEfficiency from a value followed by a unit abbreviation, e.g. "1 L/100km".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of FuelEfficiency.
+        :rtype: FuelEfficiency
+        :raises ValueError: When the string is not a valid or an ambiguous FuelEfficiency.
+        """
+        return FuelEfficiency._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[FuelEfficiency]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return FuelEfficiency._try_parse(text)
+
+    def to_binary(self, unit: Optional[FuelEfficiencyUnits] = None) -> bytes:
+        """
+        Encode the FuelEfficiency to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: FuelEfficiencyUnits
+        :return: The encoded FuelEfficiency.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> FuelEfficiency:
+        """
+        Decode a FuelEfficiency encoded by to_binary.
+
+        :param data: The encoded FuelEfficiency, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of FuelEfficiency.
+        :rtype: FuelEfficiency
+        :raises ValueError: When the data is not a valid encoded FuelEfficiency.
+        """
+        return FuelEfficiency._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[FuelEfficiencyUnits] = None) -> dict:
+        """
+        Get the FuelEfficiency DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (LiterPer100Kilometers).
+        :type hold_in_unit: FuelEfficiencyUnits
+        :return: The FuelEfficiency DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[FuelEfficiencyUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> FuelEfficiency:
+        """
+        Create a new instance of FuelEfficiency from its DTO.
+
+        :param dto: The FuelEfficiency DTO, the unit is the FuelEfficiencyUnits value or name.
+        :type dto: dict
+        :return: A new instance of FuelEfficiency.
+        :rtype: FuelEfficiency
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return FuelEfficiency._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> FuelEfficiency:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return FuelEfficiency._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -161,10 +383,7 @@ class FuelEfficiency(AbstractMeasure):
         """
         
         """
-        if self.__liters_per100_kilometers != None:
-            return self.__liters_per100_kilometers
-        self.__liters_per100_kilometers = self.__convert_from_base(FuelEfficiencyUnits.LiterPer100Kilometers)
-        return self.__liters_per100_kilometers
+        return self._cached_convert(FuelEfficiencyUnits.LiterPer100Kilometers)
 
     
     @property
@@ -172,10 +391,7 @@ class FuelEfficiency(AbstractMeasure):
         """
         
         """
-        if self.__miles_per_us_gallon != None:
-            return self.__miles_per_us_gallon
-        self.__miles_per_us_gallon = self.__convert_from_base(FuelEfficiencyUnits.MilePerUsGallon)
-        return self.__miles_per_us_gallon
+        return self._cached_convert(FuelEfficiencyUnits.MilePerUsGallon)
 
     
     @property
@@ -183,10 +399,7 @@ class FuelEfficiency(AbstractMeasure):
         """
         
         """
-        if self.__miles_per_uk_gallon != None:
-            return self.__miles_per_uk_gallon
-        self.__miles_per_uk_gallon = self.__convert_from_base(FuelEfficiencyUnits.MilePerUkGallon)
-        return self.__miles_per_uk_gallon
+        return self._cached_convert(FuelEfficiencyUnits.MilePerUkGallon)
 
     
     @property
@@ -194,10 +407,7 @@ class FuelEfficiency(AbstractMeasure):
         """
         
         """
-        if self.__kilometers_per_liters != None:
-            return self.__kilometers_per_liters
-        self.__kilometers_per_liters = self.__convert_from_base(FuelEfficiencyUnits.KilometerPerLiter)
-        return self.__kilometers_per_liters
+        return self._cached_convert(FuelEfficiencyUnits.KilometerPerLiter)
 
     
     def to_string(self, unit: FuelEfficiencyUnits = FuelEfficiencyUnits.LiterPer100Kilometers) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class HeatFluxUnits(Enum):
         """
             HeatFluxUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         WattPerSquareMeter = 'watt_per_square_meter'
         """
@@ -109,169 +120,448 @@ class HeatFlux(AbstractMeasure):
         value (float): The value.
         from_unit (HeatFluxUnits): The HeatFlux unit to create from, The default unit is WattPerSquareMeter
     """
-    def __init__(self, value: float, from_unit: HeatFluxUnits = HeatFluxUnits.WattPerSquareMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = HeatFluxUnits
+
+    _base_unit = HeatFluxUnits.WattPerSquareMeter
+
+    _dimensions = (0, 1, -3, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 43
+
+    _binary_unit_ids = {
         
-        self.__watts_per_square_meter = None
+        HeatFluxUnits.WattPerSquareMeter: 0,
         
-        self.__watts_per_square_inch = None
+        HeatFluxUnits.WattPerSquareInch: 1,
         
-        self.__watts_per_square_foot = None
+        HeatFluxUnits.WattPerSquareFoot: 2,
         
-        self.__btus_per_second_square_inch = None
+        HeatFluxUnits.BtuPerSecondSquareInch: 3,
         
-        self.__btus_per_second_square_foot = None
+        HeatFluxUnits.BtuPerSecondSquareFoot: 4,
         
-        self.__btus_per_minute_square_foot = None
+        HeatFluxUnits.BtuPerMinuteSquareFoot: 5,
         
-        self.__btus_per_hour_square_foot = None
+        HeatFluxUnits.BtuPerHourSquareFoot: 6,
         
-        self.__calories_per_second_square_centimeter = None
+        HeatFluxUnits.CaloriePerSecondSquareCentimeter: 7,
         
-        self.__kilocalories_per_hour_square_meter = None
+        HeatFluxUnits.KilocaloriePerHourSquareMeter: 8,
         
-        self.__pounds_force_per_foot_second = None
+        HeatFluxUnits.PoundForcePerFootSecond: 9,
         
-        self.__pounds_per_second_cubed = None
+        HeatFluxUnits.PoundPerSecondCubed: 10,
         
-        self.__nanowatts_per_square_meter = None
+        HeatFluxUnits.NanowattPerSquareMeter: 11,
         
-        self.__microwatts_per_square_meter = None
+        HeatFluxUnits.MicrowattPerSquareMeter: 12,
         
-        self.__milliwatts_per_square_meter = None
+        HeatFluxUnits.MilliwattPerSquareMeter: 13,
         
-        self.__centiwatts_per_square_meter = None
+        HeatFluxUnits.CentiwattPerSquareMeter: 14,
         
-        self.__deciwatts_per_square_meter = None
+        HeatFluxUnits.DeciwattPerSquareMeter: 15,
         
-        self.__kilowatts_per_square_meter = None
+        HeatFluxUnits.KilowattPerSquareMeter: 16,
         
-        self.__kilocalories_per_second_square_centimeter = None
+        HeatFluxUnits.KilocaloriePerSecondSquareCentimeter: 17,
         
+    }
 
-    def convert(self, unit: HeatFluxUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        HeatFluxUnits.WattPerSquareMeter: lambda value: (value),
+        
+        HeatFluxUnits.WattPerSquareInch: lambda value: (value / 1.5500031e3),
+        
+        HeatFluxUnits.WattPerSquareFoot: lambda value: (value / 1.07639e1),
+        
+        HeatFluxUnits.BtuPerSecondSquareInch: lambda value: (value / 1.63533984e6),
+        
+        HeatFluxUnits.BtuPerSecondSquareFoot: lambda value: (value / 1.13565267e4),
+        
+        HeatFluxUnits.BtuPerMinuteSquareFoot: lambda value: (value / 1.89275445e2),
+        
+        HeatFluxUnits.BtuPerHourSquareFoot: lambda value: (value / 3.15459075),
+        
+        HeatFluxUnits.CaloriePerSecondSquareCentimeter: lambda value: (value / 4.1868e4),
+        
+        HeatFluxUnits.KilocaloriePerHourSquareMeter: lambda value: (value / 1.163),
+        
+        HeatFluxUnits.PoundForcePerFootSecond: lambda value: (value / 1.459390293720636e1),
+        
+        HeatFluxUnits.PoundPerSecondCubed: lambda value: (value / 4.5359237e-1),
+        
+        HeatFluxUnits.NanowattPerSquareMeter: lambda value: ((value) / 1e-09),
+        
+        HeatFluxUnits.MicrowattPerSquareMeter: lambda value: ((value) / 1e-06),
+        
+        HeatFluxUnits.MilliwattPerSquareMeter: lambda value: ((value) / 0.001),
+        
+        HeatFluxUnits.CentiwattPerSquareMeter: lambda value: ((value) / 0.01),
+        
+        HeatFluxUnits.DeciwattPerSquareMeter: lambda value: ((value) / 0.1),
+        
+        HeatFluxUnits.KilowattPerSquareMeter: lambda value: ((value) / 1000.0),
+        
+        HeatFluxUnits.KilocaloriePerSecondSquareCentimeter: lambda value: ((value / 4.1868e4) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: HeatFluxUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        HeatFluxUnits.WattPerSquareMeter: lambda value: (value),
+        
+        HeatFluxUnits.WattPerSquareInch: lambda value: (value * 1.5500031e3),
+        
+        HeatFluxUnits.WattPerSquareFoot: lambda value: (value * 1.07639e1),
+        
+        HeatFluxUnits.BtuPerSecondSquareInch: lambda value: (value * 1.63533984e6),
         
-        if from_unit == HeatFluxUnits.WattPerSquareMeter:
-            return (value)
+        HeatFluxUnits.BtuPerSecondSquareFoot: lambda value: (value * 1.13565267e4),
         
-        if from_unit == HeatFluxUnits.WattPerSquareInch:
-            return (value / 1.5500031e3)
+        HeatFluxUnits.BtuPerMinuteSquareFoot: lambda value: (value * 1.89275445e2),
         
-        if from_unit == HeatFluxUnits.WattPerSquareFoot:
-            return (value / 1.07639e1)
+        HeatFluxUnits.BtuPerHourSquareFoot: lambda value: (value * 3.15459075),
         
-        if from_unit == HeatFluxUnits.BtuPerSecondSquareInch:
-            return (value / 1.63533984e6)
+        HeatFluxUnits.CaloriePerSecondSquareCentimeter: lambda value: (value * 4.1868e4),
         
-        if from_unit == HeatFluxUnits.BtuPerSecondSquareFoot:
-            return (value / 1.13565267e4)
+        HeatFluxUnits.KilocaloriePerHourSquareMeter: lambda value: (value * 1.163),
         
-        if from_unit == HeatFluxUnits.BtuPerMinuteSquareFoot:
-            return (value / 1.89275445e2)
+        HeatFluxUnits.PoundForcePerFootSecond: lambda value: (value * 1.459390293720636e1),
         
-        if from_unit == HeatFluxUnits.BtuPerHourSquareFoot:
-            return (value / 3.15459075)
+        HeatFluxUnits.PoundPerSecondCubed: lambda value: (value * 4.5359237e-1),
         
-        if from_unit == HeatFluxUnits.CaloriePerSecondSquareCentimeter:
-            return (value / 4.1868e4)
+        HeatFluxUnits.NanowattPerSquareMeter: lambda value: ((value) * 1e-09),
         
-        if from_unit == HeatFluxUnits.KilocaloriePerHourSquareMeter:
-            return (value / 1.163)
+        HeatFluxUnits.MicrowattPerSquareMeter: lambda value: ((value) * 1e-06),
         
-        if from_unit == HeatFluxUnits.PoundForcePerFootSecond:
-            return (value / 1.459390293720636e1)
+        HeatFluxUnits.MilliwattPerSquareMeter: lambda value: ((value) * 0.001),
         
-        if from_unit == HeatFluxUnits.PoundPerSecondCubed:
-            return (value / 4.5359237e-1)
+        HeatFluxUnits.CentiwattPerSquareMeter: lambda value: ((value) * 0.01),
         
-        if from_unit == HeatFluxUnits.NanowattPerSquareMeter:
-            return ((value) / 1e-09)
+        HeatFluxUnits.DeciwattPerSquareMeter: lambda value: ((value) * 0.1),
         
-        if from_unit == HeatFluxUnits.MicrowattPerSquareMeter:
-            return ((value) / 1e-06)
+        HeatFluxUnits.KilowattPerSquareMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == HeatFluxUnits.MilliwattPerSquareMeter:
-            return ((value) / 0.001)
+        HeatFluxUnits.KilocaloriePerSecondSquareCentimeter: lambda value: ((value * 4.1868e4) * 1000.0),
         
-        if from_unit == HeatFluxUnits.CentiwattPerSquareMeter:
-            return ((value) / 0.01)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        HeatFluxUnits.WattPerSquareMeter: ('1', '0'),
+        
+        HeatFluxUnits.WattPerSquareInch: ('10000/15500031', '0'),
+        
+        HeatFluxUnits.WattPerSquareFoot: ('10000/107639', '0'),
+        
+        HeatFluxUnits.BtuPerSecondSquareInch: ('25/40883496', '0'),
+        
+        HeatFluxUnits.BtuPerSecondSquareFoot: ('10000/113565267', '0'),
+        
+        HeatFluxUnits.BtuPerMinuteSquareFoot: ('200000/37855089', '0'),
+        
+        HeatFluxUnits.BtuPerHourSquareFoot: ('4000000/12618363', '0'),
+        
+        HeatFluxUnits.CaloriePerSecondSquareCentimeter: ('1/41868', '0'),
+        
+        HeatFluxUnits.KilocaloriePerHourSquareMeter: ('1000/1163', '0'),
         
-        if from_unit == HeatFluxUnits.DeciwattPerSquareMeter:
-            return ((value) / 0.1)
+        HeatFluxUnits.PoundForcePerFootSecond: ('25000000000000/364847573430159', '0'),
         
-        if from_unit == HeatFluxUnits.KilowattPerSquareMeter:
-            return ((value) / 1000.0)
+        HeatFluxUnits.PoundPerSecondCubed: ('100000000/45359237', '0'),
         
-        if from_unit == HeatFluxUnits.KilocaloriePerSecondSquareCentimeter:
-            return ((value / 4.1868e4) / 1000.0)
+        HeatFluxUnits.NanowattPerSquareMeter: ('1000000000', '0'),
         
-        return None
+        HeatFluxUnits.MicrowattPerSquareMeter: ('1000000', '0'),
+        
+        HeatFluxUnits.MilliwattPerSquareMeter: ('1000', '0'),
+        
+        HeatFluxUnits.CentiwattPerSquareMeter: ('100', '0'),
+        
+        HeatFluxUnits.DeciwattPerSquareMeter: ('10', '0'),
+        
+        HeatFluxUnits.KilowattPerSquareMeter: ('1/1000', '0'),
+        
+        HeatFluxUnits.KilocaloriePerSecondSquareCentimeter: ('1/41868000', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        HeatFluxUnits.WattPerSquareMeter: ('1', '0'),
+        
+        HeatFluxUnits.WattPerSquareInch: ('15500031/10000', '0'),
+        
+        HeatFluxUnits.WattPerSquareFoot: ('107639/10000', '0'),
+        
+        HeatFluxUnits.BtuPerSecondSquareInch: ('40883496/25', '0'),
+        
+        HeatFluxUnits.BtuPerSecondSquareFoot: ('113565267/10000', '0'),
+        
+        HeatFluxUnits.BtuPerMinuteSquareFoot: ('37855089/200000', '0'),
+        
+        HeatFluxUnits.BtuPerHourSquareFoot: ('12618363/4000000', '0'),
+        
+        HeatFluxUnits.CaloriePerSecondSquareCentimeter: ('41868', '0'),
+        
+        HeatFluxUnits.KilocaloriePerHourSquareMeter: ('1163/1000', '0'),
+        
+        HeatFluxUnits.PoundForcePerFootSecond: ('364847573430159/25000000000000', '0'),
+        
+        HeatFluxUnits.PoundPerSecondCubed: ('45359237/100000000', '0'),
+        
+        HeatFluxUnits.NanowattPerSquareMeter: ('1/1000000000', '0'),
+        
+        HeatFluxUnits.MicrowattPerSquareMeter: ('1/1000000', '0'),
+        
+        HeatFluxUnits.MilliwattPerSquareMeter: ('1/1000', '0'),
+        
+        HeatFluxUnits.CentiwattPerSquareMeter: ('1/100', '0'),
+        
+        HeatFluxUnits.DeciwattPerSquareMeter: ('1/10', '0'),
+        
+        HeatFluxUnits.KilowattPerSquareMeter: ('1000', '0'),
+        
+        HeatFluxUnits.KilocaloriePerSecondSquareCentimeter: ('41868000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: HeatFluxUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == HeatFluxUnits.WattPerSquareMeter:
-            return (value)
+        HeatFluxUnits.WattPerSquareMeter: ('W/m²',),
         
-        if to_unit == HeatFluxUnits.WattPerSquareInch:
-            return (value * 1.5500031e3)
+        HeatFluxUnits.WattPerSquareInch: ('W/in²',),
         
-        if to_unit == HeatFluxUnits.WattPerSquareFoot:
-            return (value * 1.07639e1)
+        HeatFluxUnits.WattPerSquareFoot: ('W/ft²',),
         
-        if to_unit == HeatFluxUnits.BtuPerSecondSquareInch:
-            return (value * 1.63533984e6)
+        HeatFluxUnits.BtuPerSecondSquareInch: ('BTU/s·in²',),
         
-        if to_unit == HeatFluxUnits.BtuPerSecondSquareFoot:
-            return (value * 1.13565267e4)
+        HeatFluxUnits.BtuPerSecondSquareFoot: ('BTU/s·ft²',),
         
-        if to_unit == HeatFluxUnits.BtuPerMinuteSquareFoot:
-            return (value * 1.89275445e2)
+        HeatFluxUnits.BtuPerMinuteSquareFoot: ('BTU/min·ft²',),
         
-        if to_unit == HeatFluxUnits.BtuPerHourSquareFoot:
-            return (value * 3.15459075)
+        HeatFluxUnits.BtuPerHourSquareFoot: ('BTU/h·ft²',),
         
-        if to_unit == HeatFluxUnits.CaloriePerSecondSquareCentimeter:
-            return (value * 4.1868e4)
+        HeatFluxUnits.CaloriePerSecondSquareCentimeter: ('cal/s·cm²',),
         
-        if to_unit == HeatFluxUnits.KilocaloriePerHourSquareMeter:
-            return (value * 1.163)
+        HeatFluxUnits.KilocaloriePerHourSquareMeter: ('kcal/h·m²',),
         
-        if to_unit == HeatFluxUnits.PoundForcePerFootSecond:
-            return (value * 1.459390293720636e1)
+        HeatFluxUnits.PoundForcePerFootSecond: ('lbf/(ft·s)',),
         
-        if to_unit == HeatFluxUnits.PoundPerSecondCubed:
-            return (value * 4.5359237e-1)
+        HeatFluxUnits.PoundPerSecondCubed: ('lb/s³',),
         
-        if to_unit == HeatFluxUnits.NanowattPerSquareMeter:
-            return ((value) * 1e-09)
+        HeatFluxUnits.NanowattPerSquareMeter: ('nW/m²',),
         
-        if to_unit == HeatFluxUnits.MicrowattPerSquareMeter:
-            return ((value) * 1e-06)
+        HeatFluxUnits.MicrowattPerSquareMeter: ('μW/m²',),
         
-        if to_unit == HeatFluxUnits.MilliwattPerSquareMeter:
-            return ((value) * 0.001)
+        HeatFluxUnits.MilliwattPerSquareMeter: ('mW/m²',),
         
-        if to_unit == HeatFluxUnits.CentiwattPerSquareMeter:
-            return ((value) * 0.01)
+        HeatFluxUnits.CentiwattPerSquareMeter: ('cW/m²',),
         
-        if to_unit == HeatFluxUnits.DeciwattPerSquareMeter:
-            return ((value) * 0.1)
+        HeatFluxUnits.DeciwattPerSquareMeter: ('dW/m²',),
         
-        if to_unit == HeatFluxUnits.KilowattPerSquareMeter:
-            return ((value) * 1000.0)
+        HeatFluxUnits.KilowattPerSquareMeter: ('kW/m²',),
         
-        if to_unit == HeatFluxUnits.KilocaloriePerSecondSquareCentimeter:
-            return ((value * 4.1868e4) * 1000.0)
+        HeatFluxUnits.KilocaloriePerSecondSquareCentimeter: ('kcal/s·cm²',),
         
-        return None
+    }
 
+    def __init__(self, value: float, from_unit: HeatFluxUnits = HeatFluxUnits.WattPerSquareMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: HeatFluxUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: HeatFluxUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: HeatFluxUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: HeatFluxUnits, to_unit: HeatFluxUnits) -> float:
+        """
+        Convert a value from one HeatFlux unit to another, without creating a HeatFlux instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: HeatFluxUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: HeatFluxUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return HeatFlux._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: HeatFluxUnits, to_unit: HeatFluxUnits) -> List[float]:
+        """
+        Convert many values from one HeatFlux unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: HeatFluxUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: HeatFluxUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return HeatFlux._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: HeatFluxUnits, to_unit: HeatFluxUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", HeatFlux._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: HeatFluxUnits, to_unit: HeatFluxUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one HeatFlux unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: HeatFluxUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: HeatFluxUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return HeatFlux._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: HeatFluxUnits = HeatFluxUnits.WattPerSquareMeter) -> HeatFlux:
+        """
+        Create a new instance of HeatFlux holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: HeatFluxUnits
+        :return: A new instance of HeatFlux.
+        :rtype: HeatFlux
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return HeatFlux._from_exact(value, from_unit)
+
+    def to_exact(self, unit: HeatFluxUnits = HeatFluxUnits.WattPerSquareMeter) -> Fraction:
+        """
+        Get the exact value of the HeatFlux in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (WattPerSquareMeter).
+        :type unit: HeatFluxUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> HeatFlux:
+        """
+        Parse a HeatFlux from a value followed by a unit abbreviation, e.g. "1 W/m²".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of HeatFlux.
+        :rtype: HeatFlux
+        :raises ValueError: When the string is not a valid or an ambiguous HeatFlux.
+        """
+        return HeatFlux._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[HeatFlux]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return HeatFlux._try_parse(text)
+
+    def to_binary(self, unit: Optional[HeatFluxUnits] = None) -> bytes:
+        """
+        Encode the HeatFlux to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: HeatFluxUnits
+        :return: The encoded HeatFlux.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> HeatFlux:
+        """
+        Decode a HeatFlux encoded by to_binary.
+
+        :param data: The encoded HeatFlux, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of HeatFlux.
+        :rtype: HeatFlux
+        :raises ValueError: When the data is not a valid encoded HeatFlux.
+        """
+        return HeatFlux._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[HeatFluxUnits] = None) -> dict:
+        """
+        Get the HeatFlux DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (WattPerSquareMeter).
+        :type hold_in_unit: HeatFluxUnits
+        :return: The HeatFlux DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[HeatFluxUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> HeatFlux:
+        """
+        Create a new instance of HeatFlux from its DTO.
+
+        :param dto: The HeatFlux DTO, the unit is the HeatFluxUnits value or name.
+        :type dto: dict
+        :return: A new instance of HeatFlux.
+        :rtype: HeatFlux
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return HeatFlux._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> HeatFlux:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return HeatFlux._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -553,10 +843,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_square_meter != None:
-            return self.__watts_per_square_meter
-        self.__watts_per_square_meter = self.__convert_from_base(HeatFluxUnits.WattPerSquareMeter)
-        return self.__watts_per_square_meter
+        return self._cached_convert(HeatFluxUnits.WattPerSquareMeter)
 
     
     @property
@@ -564,10 +851,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_square_inch != None:
-            return self.__watts_per_square_inch
-        self.__watts_per_square_inch = self.__convert_from_base(HeatFluxUnits.WattPerSquareInch)
-        return self.__watts_per_square_inch
+        return self._cached_convert(HeatFluxUnits.WattPerSquareInch)
 
     
     @property
@@ -575,10 +859,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_square_foot != None:
-            return self.__watts_per_square_foot
-        self.__watts_per_square_foot = self.__convert_from_base(HeatFluxUnits.WattPerSquareFoot)
-        return self.__watts_per_square_foot
+        return self._cached_convert(HeatFluxUnits.WattPerSquareFoot)
 
     
     @property
@@ -586,10 +867,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__btus_per_second_square_inch != None:
-            return self.__btus_per_second_square_inch
-        self.__btus_per_second_square_inch = self.__convert_from_base(HeatFluxUnits.BtuPerSecondSquareInch)
-        return self.__btus_per_second_square_inch
+        return self._cached_convert(HeatFluxUnits.BtuPerSecondSquareInch)
 
     
     @property
@@ -597,10 +875,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__btus_per_second_square_foot != None:
-            return self.__btus_per_second_square_foot
-        self.__btus_per_second_square_foot = self.__convert_from_base(HeatFluxUnits.BtuPerSecondSquareFoot)
-        return self.__btus_per_second_square_foot
+        return self._cached_convert(HeatFluxUnits.BtuPerSecondSquareFoot)
 
     
     @property
@@ -608,10 +883,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__btus_per_minute_square_foot != None:
-            return self.__btus_per_minute_square_foot
-        self.__btus_per_minute_square_foot = self.__convert_from_base(HeatFluxUnits.BtuPerMinuteSquareFoot)
-        return self.__btus_per_minute_square_foot
+        return self._cached_convert(HeatFluxUnits.BtuPerMinuteSquareFoot)
 
     
     @property
@@ -619,10 +891,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__btus_per_hour_square_foot != None:
-            return self.__btus_per_hour_square_foot
-        self.__btus_per_hour_square_foot = self.__convert_from_base(HeatFluxUnits.BtuPerHourSquareFoot)
-        return self.__btus_per_hour_square_foot
+        return self._cached_convert(HeatFluxUnits.BtuPerHourSquareFoot)
 
     
     @property
@@ -630,10 +899,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__calories_per_second_square_centimeter != None:
-            return self.__calories_per_second_square_centimeter
-        self.__calories_per_second_square_centimeter = self.__convert_from_base(HeatFluxUnits.CaloriePerSecondSquareCentimeter)
-        return self.__calories_per_second_square_centimeter
+        return self._cached_convert(HeatFluxUnits.CaloriePerSecondSquareCentimeter)
 
     
     @property
@@ -641,10 +907,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__kilocalories_per_hour_square_meter != None:
-            return self.__kilocalories_per_hour_square_meter
-        self.__kilocalories_per_hour_square_meter = self.__convert_from_base(HeatFluxUnits.KilocaloriePerHourSquareMeter)
-        return self.__kilocalories_per_hour_square_meter
+        return self._cached_convert(HeatFluxUnits.KilocaloriePerHourSquareMeter)
 
     
     @property
@@ -652,10 +915,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_per_foot_second != None:
-            return self.__pounds_force_per_foot_second
-        self.__pounds_force_per_foot_second = self.__convert_from_base(HeatFluxUnits.PoundForcePerFootSecond)
-        return self.__pounds_force_per_foot_second
+        return self._cached_convert(HeatFluxUnits.PoundForcePerFootSecond)
 
     
     @property
@@ -663,10 +923,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_second_cubed != None:
-            return self.__pounds_per_second_cubed
-        self.__pounds_per_second_cubed = self.__convert_from_base(HeatFluxUnits.PoundPerSecondCubed)
-        return self.__pounds_per_second_cubed
+        return self._cached_convert(HeatFluxUnits.PoundPerSecondCubed)
 
     
     @property
@@ -674,10 +931,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__nanowatts_per_square_meter != None:
-            return self.__nanowatts_per_square_meter
-        self.__nanowatts_per_square_meter = self.__convert_from_base(HeatFluxUnits.NanowattPerSquareMeter)
-        return self.__nanowatts_per_square_meter
+        return self._cached_convert(HeatFluxUnits.NanowattPerSquareMeter)
 
     
     @property
@@ -685,10 +939,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__microwatts_per_square_meter != None:
-            return self.__microwatts_per_square_meter
-        self.__microwatts_per_square_meter = self.__convert_from_base(HeatFluxUnits.MicrowattPerSquareMeter)
-        return self.__microwatts_per_square_meter
+        return self._cached_convert(HeatFluxUnits.MicrowattPerSquareMeter)
 
     
     @property
@@ -696,10 +947,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__milliwatts_per_square_meter != None:
-            return self.__milliwatts_per_square_meter
-        self.__milliwatts_per_square_meter = self.__convert_from_base(HeatFluxUnits.MilliwattPerSquareMeter)
-        return self.__milliwatts_per_square_meter
+        return self._cached_convert(HeatFluxUnits.MilliwattPerSquareMeter)
 
     
     @property
@@ -707,10 +955,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__centiwatts_per_square_meter != None:
-            return self.__centiwatts_per_square_meter
-        self.__centiwatts_per_square_meter = self.__convert_from_base(HeatFluxUnits.CentiwattPerSquareMeter)
-        return self.__centiwatts_per_square_meter
+        return self._cached_convert(HeatFluxUnits.CentiwattPerSquareMeter)
 
     
     @property
@@ -718,10 +963,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__deciwatts_per_square_meter != None:
-            return self.__deciwatts_per_square_meter
-        self.__deciwatts_per_square_meter = self.__convert_from_base(HeatFluxUnits.DeciwattPerSquareMeter)
-        return self.__deciwatts_per_square_meter
+        return self._cached_convert(HeatFluxUnits.DeciwattPerSquareMeter)
 
     
     @property
@@ -729,10 +971,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__kilowatts_per_square_meter != None:
-            return self.__kilowatts_per_square_meter
-        self.__kilowatts_per_square_meter = self.__convert_from_base(HeatFluxUnits.KilowattPerSquareMeter)
-        return self.__kilowatts_per_square_meter
+        return self._cached_convert(HeatFluxUnits.KilowattPerSquareMeter)
 
     
     @property
@@ -740,10 +979,7 @@ class HeatFlux(AbstractMeasure):
         """
         
         """
-        if self.__kilocalories_per_second_square_centimeter != None:
-            return self.__kilocalories_per_second_square_centimeter
-        self.__kilocalories_per_second_square_centimeter = self.__convert_from_base(HeatFluxUnits.KilocaloriePerSecondSquareCentimeter)
-        return self.__kilocalories_per_second_square_centimeter
+        return self._cached_convert(HeatFluxUnits.KilocaloriePerSecondSquareCentimeter)
 
     
     def to_string(self, unit: HeatFluxUnits = HeatFluxUnits.WattPerSquareMeter) -> str:
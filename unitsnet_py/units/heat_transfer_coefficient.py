@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class HeatTransferCoefficientUnits(Enum):
         """
             HeatTransferCoefficientUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         WattPerSquareMeterKelvin = 'watt_per_square_meter_kelvin'
         """
@@ -44,65 +55,292 @@ class HeatTransferCoefficient(AbstractMeasure):
         value (float): The value.
         from_unit (HeatTransferCoefficientUnits): The HeatTransferCoefficient unit to create from, The default unit is WattPerSquareMeterKelvin
     """
-    def __init__(self, value: float, from_unit: HeatTransferCoefficientUnits = HeatTransferCoefficientUnits.WattPerSquareMeterKelvin):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = HeatTransferCoefficientUnits
+
+    _base_unit = HeatTransferCoefficientUnits.WattPerSquareMeterKelvin
+
+    _dimensions = (0, 1, -3, 0, -1, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 44
+
+    _binary_unit_ids = {
         
-        self.__watts_per_square_meter_kelvin = None
+        HeatTransferCoefficientUnits.WattPerSquareMeterKelvin: 0,
         
-        self.__watts_per_square_meter_celsius = None
+        HeatTransferCoefficientUnits.WattPerSquareMeterCelsius: 1,
         
-        self.__btus_per_hour_square_foot_degree_fahrenheit = None
+        HeatTransferCoefficientUnits.BtuPerHourSquareFootDegreeFahrenheit: 2,
         
-        self.__calories_per_hour_square_meter_degree_celsius = None
+        HeatTransferCoefficientUnits.CaloriePerHourSquareMeterDegreeCelsius: 3,
         
-        self.__kilocalories_per_hour_square_meter_degree_celsius = None
+        HeatTransferCoefficientUnits.KilocaloriePerHourSquareMeterDegreeCelsius: 4,
         
+    }
 
-    def convert(self, unit: HeatTransferCoefficientUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        HeatTransferCoefficientUnits.WattPerSquareMeterKelvin: lambda value: (value),
+        
+        HeatTransferCoefficientUnits.WattPerSquareMeterCelsius: lambda value: (value),
+        
+        HeatTransferCoefficientUnits.BtuPerHourSquareFootDegreeFahrenheit: lambda value: (value / 5.6782633411134878),
+        
+        HeatTransferCoefficientUnits.CaloriePerHourSquareMeterDegreeCelsius: lambda value: ((value / 4.1868) * 3600),
+        
+        HeatTransferCoefficientUnits.KilocaloriePerHourSquareMeterDegreeCelsius: lambda value: (((value / 4.1868) * 3600) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: HeatTransferCoefficientUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == HeatTransferCoefficientUnits.WattPerSquareMeterKelvin:
-            return (value)
+        HeatTransferCoefficientUnits.WattPerSquareMeterKelvin: lambda value: (value),
         
-        if from_unit == HeatTransferCoefficientUnits.WattPerSquareMeterCelsius:
-            return (value)
+        HeatTransferCoefficientUnits.WattPerSquareMeterCelsius: lambda value: (value),
         
-        if from_unit == HeatTransferCoefficientUnits.BtuPerHourSquareFootDegreeFahrenheit:
-            return (value / 5.6782633411134878)
+        HeatTransferCoefficientUnits.BtuPerHourSquareFootDegreeFahrenheit: lambda value: (value * 5.6782633411134878),
         
-        if from_unit == HeatTransferCoefficientUnits.CaloriePerHourSquareMeterDegreeCelsius:
-            return ((value / 4.1868) * 3600)
+        HeatTransferCoefficientUnits.CaloriePerHourSquareMeterDegreeCelsius: lambda value: ((value * 4.1868) / 3600),
         
-        if from_unit == HeatTransferCoefficientUnits.KilocaloriePerHourSquareMeterDegreeCelsius:
-            return (((value / 4.1868) * 3600) / 1000.0)
+        HeatTransferCoefficientUnits.KilocaloriePerHourSquareMeterDegreeCelsius: lambda value: (((value * 4.1868) / 3600) * 1000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        HeatTransferCoefficientUnits.WattPerSquareMeterKelvin: ('1', '0'),
+        
+        HeatTransferCoefficientUnits.WattPerSquareMeterCelsius: ('1', '0'),
+        
+        HeatTransferCoefficientUnits.BtuPerHourSquareFootDegreeFahrenheit: ('5000000000000000/28391316705567439', '0'),
+        
+        HeatTransferCoefficientUnits.CaloriePerHourSquareMeterDegreeCelsius: ('1000000/1163', '0'),
+        
+        HeatTransferCoefficientUnits.KilocaloriePerHourSquareMeterDegreeCelsius: ('1000/1163', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: HeatTransferCoefficientUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == HeatTransferCoefficientUnits.WattPerSquareMeterKelvin:
-            return (value)
+        HeatTransferCoefficientUnits.WattPerSquareMeterKelvin: ('1', '0'),
         
-        if to_unit == HeatTransferCoefficientUnits.WattPerSquareMeterCelsius:
-            return (value)
+        HeatTransferCoefficientUnits.WattPerSquareMeterCelsius: ('1', '0'),
         
-        if to_unit == HeatTransferCoefficientUnits.BtuPerHourSquareFootDegreeFahrenheit:
-            return (value * 5.6782633411134878)
+        HeatTransferCoefficientUnits.BtuPerHourSquareFootDegreeFahrenheit: ('28391316705567439/5000000000000000', '0'),
         
-        if to_unit == HeatTransferCoefficientUnits.CaloriePerHourSquareMeterDegreeCelsius:
-            return ((value * 4.1868) / 3600)
+        HeatTransferCoefficientUnits.CaloriePerHourSquareMeterDegreeCelsius: ('1163/1000000', '0'),
         
-        if to_unit == HeatTransferCoefficientUnits.KilocaloriePerHourSquareMeterDegreeCelsius:
-            return (((value * 4.1868) / 3600) * 1000.0)
+        HeatTransferCoefficientUnits.KilocaloriePerHourSquareMeterDegreeCelsius: ('1163/1000', '0'),
         
-        return None
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        HeatTransferCoefficientUnits.WattPerSquareMeterKelvin: ('W/m²·K',),
+        
+        HeatTransferCoefficientUnits.WattPerSquareMeterCelsius: ('W/m²·°C',),
+        
+        HeatTransferCoefficientUnits.BtuPerHourSquareFootDegreeFahrenheit: ('Btu/h·ft²·°F',),
+        
+        HeatTransferCoefficientUnits.CaloriePerHourSquareMeterDegreeCelsius: ('kcal/h·m²·°C',),
+        
+        HeatTransferCoefficientUnits.KilocaloriePerHourSquareMeterDegreeCelsius: ('kkcal/h·m²·°C',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: HeatTransferCoefficientUnits = HeatTransferCoefficientUnits.WattPerSquareMeterKelvin):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: HeatTransferCoefficientUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: HeatTransferCoefficientUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: HeatTransferCoefficientUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: HeatTransferCoefficientUnits, to_unit: HeatTransferCoefficientUnits) -> float:
+        """
+        Convert a value from one HeatTransferCoefficient unit to another, without creating a HeatTransferCoefficient instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: HeatTransferCoefficientUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: HeatTransferCoefficientUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return HeatTransferCoefficient._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: HeatTransferCoefficientUnits, to_unit: HeatTransferCoefficientUnits) -> List[float]:
+        """
+        Convert many values from one HeatTransferCoefficient unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: HeatTransferCoefficientUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: HeatTransferCoefficientUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return HeatTransferCoefficient._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: HeatTransferCoefficientUnits, to_unit: HeatTransferCoefficientUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", HeatTransferCoefficient._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: HeatTransferCoefficientUnits, to_unit: HeatTransferCoefficientUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one HeatTransferCoefficient unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: HeatTransferCoefficientUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: HeatTransferCoefficientUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return HeatTransferCoefficient._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: HeatTransferCoefficientUnits = HeatTransferCoefficientUnits.WattPerSquareMeterKelvin) -> HeatTransferCoefficient:
+        """
+        Create a new instance of HeatTransferCoefficient holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: HeatTransferCoefficientUnits
+        :return: A new instance of HeatTransferCoefficient.
+        :rtype: HeatTransferCoefficient
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return HeatTransferCoefficient._from_exact(value, from_unit)
+
+    def to_exact(self, unit: HeatTransferCoefficientUnits = HeatTransferCoefficientUnits.WattPerSquareMeterKelvin) -> Fraction:
+        """
+        Get the exact value of the HeatTransferCoefficient in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (WattPerSquareMeterKelvin).
+        :type unit: HeatTransferCoefficientUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> HeatTransferCoefficient:
+        """
+        Parse a HeatTransferCoefficient from a value followed by a unit abbreviation, e.g. "1 W/m²·K".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of HeatTransferCoefficient.
+        :rtype: HeatTransferCoefficient
+        :raises ValueError: When the string is not a valid or an ambiguous HeatTransferCoefficient.
+        """
+        return HeatTransferCoefficient._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[HeatTransferCoefficient]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return HeatTransferCoefficient._try_parse(text)
+
+    def to_binary(self, unit: Optional[HeatTransferCoefficientUnits] = None) -> bytes:
+        """
+        Encode the HeatTransferCoefficient to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: HeatTransferCoefficientUnits
+        :return: The encoded HeatTransferCoefficient.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> HeatTransferCoefficient:
+        """
+        Decode a HeatTransferCoefficient encoded by to_binary.
+
+        :param data: The encoded HeatTransferCoefficient, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of HeatTransferCoefficient.
+        :rtype: HeatTransferCoefficient
+        :raises ValueError: When the data is not a valid encoded HeatTransferCoefficient.
+        """
+        return HeatTransferCoefficient._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[HeatTransferCoefficientUnits] = None) -> dict:
+        """
+        Get the HeatTransferCoefficient DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
 
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (WattPerSquareMeterKelvin).
+        :type hold_in_unit: HeatTransferCoefficientUnits
+        :return: The HeatTransferCoefficient DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[HeatTransferCoefficientUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> HeatTransferCoefficient:
+        """
+        Create a new instance of HeatTransferCoefficient from its DTO.
+
+        :param dto: The HeatTransferCoefficient DTO, the unit is the HeatTransferCoefficientUnits value or name.
+        :type dto: dict
+        :return: A new instance of HeatTransferCoefficient.
+        :rtype: HeatTransferCoefficient
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return HeatTransferCoefficient._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> HeatTransferCoefficient:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return HeatTransferCoefficient._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -189,10 +427,7 @@ class HeatTransferCoefficient(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_square_meter_kelvin != None:
-            return self.__watts_per_square_meter_kelvin
-        self.__watts_per_square_meter_kelvin = self.__convert_from_base(HeatTransferCoefficientUnits.WattPerSquareMeterKelvin)
-        return self.__watts_per_square_meter_kelvin
+        return self._cached_convert(HeatTransferCoefficientUnits.WattPerSquareMeterKelvin)
 
     
     @property
@@ -200,10 +435,7 @@ class HeatTransferCoefficient(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_square_meter_celsius != None:
-            return self.__watts_per_square_meter_celsius
-        self.__watts_per_square_meter_celsius = self.__convert_from_base(HeatTransferCoefficientUnits.WattPerSquareMeterCelsius)
-        return self.__watts_per_square_meter_celsius
+        return self._cached_convert(HeatTransferCoefficientUnits.WattPerSquareMeterCelsius)
 
     
     @property
@@ -211,10 +443,7 @@ class HeatTransferCoefficient(AbstractMeasure):
         """
         
         """
-        if self.__btus_per_hour_square_foot_degree_fahrenheit != None:
-            return self.__btus_per_hour_square_foot_degree_fahrenheit
-        self.__btus_per_hour_square_foot_degree_fahrenheit = self.__convert_from_base(HeatTransferCoefficientUnits.BtuPerHourSquareFootDegreeFahrenheit)
-        return self.__btus_per_hour_square_foot_degree_fahrenheit
+        return self._cached_convert(HeatTransferCoefficientUnits.BtuPerHourSquareFootDegreeFahrenheit)
 
     
     @property
@@ -222,10 +451,7 @@ class HeatTransferCoefficient(AbstractMeasure):
         """
         
         """
-        if self.__calories_per_hour_square_meter_degree_celsius != None:
-            return self.__calories_per_hour_square_meter_degree_celsius
-        self.__calories_per_hour_square_meter_degree_celsius = self.__convert_from_base(HeatTransferCoefficientUnits.CaloriePerHourSquareMeterDegreeCelsius)
-        return self.__calories_per_hour_square_meter_degree_celsius
+        return self._cached_convert(HeatTransferCoefficientUnits.CaloriePerHourSquareMeterDegreeCelsius)
 
     
     @property
@@ -233,10 +459,7 @@ class HeatTransferCoefficient(AbstractMeasure):
         """
         
         """
-        if self.__kilocalories_per_hour_square_meter_degree_celsius != None:
-            return self.__kilocalories_per_hour_square_meter_degree_celsius
-        self.__kilocalories_per_hour_square_meter_degree_celsius = self.__convert_from_base(HeatTransferCoefficientUnits.KilocaloriePerHourSquareMeterDegreeCelsius)
-        return self.__kilocalories_per_hour_square_meter_degree_celsius
+        return self._cached_convert(HeatTransferCoefficientUnits.KilocaloriePerHourSquareMeterDegreeCelsius)
 
     
     def to_string(self, unit: HeatTransferCoefficientUnits = HeatTransferCoefficientUnits.WattPerSquareMeterKelvin) -> str:
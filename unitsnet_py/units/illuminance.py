@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class IlluminanceUnits(Enum):
         """
             IlluminanceUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Lux = 'lux'
         """
@@ -39,57 +50,280 @@ class Illuminance(AbstractMeasure):
         value (float): The value.
         from_unit (IlluminanceUnits): The Illuminance unit to create from, The default unit is Lux
     """
-    def __init__(self, value: float, from_unit: IlluminanceUnits = IlluminanceUnits.Lux):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = IlluminanceUnits
+
+    _base_unit = IlluminanceUnits.Lux
+
+    _dimensions = (-2, 0, 0, 0, 0, 0, 1)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 45
+
+    _binary_unit_ids = {
         
-        self.__lux = None
+        IlluminanceUnits.Lux: 0,
         
-        self.__millilux = None
+        IlluminanceUnits.Millilux: 1,
         
-        self.__kilolux = None
+        IlluminanceUnits.Kilolux: 2,
         
-        self.__megalux = None
+        IlluminanceUnits.Megalux: 3,
         
+    }
 
-    def convert(self, unit: IlluminanceUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        IlluminanceUnits.Lux: lambda value: (value),
+        
+        IlluminanceUnits.Millilux: lambda value: ((value) / 0.001),
+        
+        IlluminanceUnits.Kilolux: lambda value: ((value) / 1000.0),
+        
+        IlluminanceUnits.Megalux: lambda value: ((value) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: IlluminanceUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == IlluminanceUnits.Lux:
-            return (value)
+        IlluminanceUnits.Lux: lambda value: (value),
         
-        if from_unit == IlluminanceUnits.Millilux:
-            return ((value) / 0.001)
+        IlluminanceUnits.Millilux: lambda value: ((value) * 0.001),
         
-        if from_unit == IlluminanceUnits.Kilolux:
-            return ((value) / 1000.0)
+        IlluminanceUnits.Kilolux: lambda value: ((value) * 1000.0),
         
-        if from_unit == IlluminanceUnits.Megalux:
-            return ((value) / 1000000.0)
+        IlluminanceUnits.Megalux: lambda value: ((value) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        IlluminanceUnits.Lux: ('1', '0'),
+        
+        IlluminanceUnits.Millilux: ('1000', '0'),
+        
+        IlluminanceUnits.Kilolux: ('1/1000', '0'),
+        
+        IlluminanceUnits.Megalux: ('1/1000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: IlluminanceUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == IlluminanceUnits.Lux:
-            return (value)
+        IlluminanceUnits.Lux: ('1', '0'),
         
-        if to_unit == IlluminanceUnits.Millilux:
-            return ((value) * 0.001)
+        IlluminanceUnits.Millilux: ('1/1000', '0'),
         
-        if to_unit == IlluminanceUnits.Kilolux:
-            return ((value) * 1000.0)
+        IlluminanceUnits.Kilolux: ('1000', '0'),
         
-        if to_unit == IlluminanceUnits.Megalux:
-            return ((value) * 1000000.0)
+        IlluminanceUnits.Megalux: ('1000000', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        IlluminanceUnits.Lux: ('lx',),
+        
+        IlluminanceUnits.Millilux: ('mlx',),
+        
+        IlluminanceUnits.Kilolux: ('klx',),
+        
+        IlluminanceUnits.Megalux: ('Mlx',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: IlluminanceUnits = IlluminanceUnits.Lux):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: IlluminanceUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: IlluminanceUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: IlluminanceUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: IlluminanceUnits, to_unit: IlluminanceUnits) -> float:
+        """
+        Convert a value from one Illuminance unit to another, without creating a Illuminance instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: IlluminanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: IlluminanceUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Illuminance._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: IlluminanceUnits, to_unit: IlluminanceUnits) -> List[float]:
+        """
+        Convert many values from one Illuminance unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: IlluminanceUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: IlluminanceUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Illuminance._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: IlluminanceUnits, to_unit: IlluminanceUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Illuminance._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: IlluminanceUnits, to_unit: IlluminanceUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Illuminance unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: IlluminanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: IlluminanceUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Illuminance._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: IlluminanceUnits = IlluminanceUnits.Lux) -> Illuminance:
+        """
+        Create a new instance of Illuminance holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: IlluminanceUnits
+        :return: A new instance of Illuminance.
+        :rtype: Illuminance
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Illuminance._from_exact(value, from_unit)
+
+    def to_exact(self, unit: IlluminanceUnits = IlluminanceUnits.Lux) -> Fraction:
+        """
+        Get the exact value of the Illuminance in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Lux).
+        :type unit: IlluminanceUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Illuminance:
+        """
+        Parse a Illuminance from a value followed by a unit abbreviation, e.g. "1 lx".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Illuminance.
+        :rtype: Illuminance
+        :raises ValueError: When the string is not a valid or an ambiguous Illuminance.
+        """
+        return Illuminance._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Illuminance]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Illuminance._try_parse(text)
+
+    def to_binary(self, unit: Optional[IlluminanceUnits] = None) -> bytes:
+        """
+        Encode the Illuminance to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: IlluminanceUnits
+        :return: The encoded Illuminance.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Illuminance:
+        """
+        Decode a Illuminance encoded by to_binary.
+
+        :param data: The encoded Illuminance, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Illuminance.
+        :rtype: Illuminance
+        :raises ValueError: When the data is not a valid encoded Illuminance.
+        """
+        return Illuminance._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[IlluminanceUnits] = None) -> dict:
+        """
+        Get the Illuminance DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Lux).
+        :type hold_in_unit: IlluminanceUnits
+        :return: The Illuminance DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[IlluminanceUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Illuminance:
+        """
+        Create a new instance of Illuminance from its DTO.
+
+        :param dto: The Illuminance DTO, the unit is the IlluminanceUnits value or name.
+        :type dto: dict
+        :return: A new instance of Illuminance.
+        :rtype: Illuminance
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Illuminance._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Illuminance:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Illuminance._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -161,10 +395,7 @@ class Illuminance(AbstractMeasure):
         """
         
         """
-        if self.__lux != None:
-            return self.__lux
-        self.__lux = self.__convert_from_base(IlluminanceUnits.Lux)
-        return self.__lux
+        return self._cached_convert(IlluminanceUnits.Lux)
 
     
     @property
@@ -172,10 +403,7 @@ class Illuminance(AbstractMeasure):
         """
         
         """
-        if self.__millilux != None:
-            return self.__millilux
-        self.__millilux = self.__convert_from_base(IlluminanceUnits.Millilux)
-        return self.__millilux
+        return self._cached_convert(IlluminanceUnits.Millilux)
 
     
     @property
@@ -183,10 +411,7 @@ class Illuminance(AbstractMeasure):
         """
         
         """
-        if self.__kilolux != None:
-            return self.__kilolux
-        self.__kilolux = self.__convert_from_base(IlluminanceUnits.Kilolux)
-        return self.__kilolux
+        return self._cached_convert(IlluminanceUnits.Kilolux)
 
     
     @property
@@ -194,10 +419,7 @@ class Illuminance(AbstractMeasure):
         """
         
         """
-        if self.__megalux != None:
-            return self.__megalux
-        self.__megalux = self.__convert_from_base(IlluminanceUnits.Megalux)
-        return self.__megalux
+        return self._cached_convert(IlluminanceUnits.Megalux)
 
     
     def to_string(self, unit: IlluminanceUnits = IlluminanceUnits.Lux) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ImpulseUnits(Enum):
         """
             ImpulseUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         KilogramMeterPerSecond = 'kilogram_meter_per_second'
         """
@@ -84,129 +95,388 @@ class Impulse(AbstractMeasure):
         value (float): The value.
         from_unit (ImpulseUnits): The Impulse unit to create from, The default unit is NewtonSecond
     """
-    def __init__(self, value: float, from_unit: ImpulseUnits = ImpulseUnits.NewtonSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ImpulseUnits
+
+    _base_unit = ImpulseUnits.NewtonSecond
+
+    _dimensions = (1, 1, -1, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 46
+
+    _binary_unit_ids = {
         
-        self.__kilogram_meters_per_second = None
+        ImpulseUnits.KilogramMeterPerSecond: 0,
         
-        self.__newton_seconds = None
+        ImpulseUnits.NewtonSecond: 1,
         
-        self.__pound_feet_per_second = None
+        ImpulseUnits.PoundFootPerSecond: 2,
         
-        self.__pound_force_seconds = None
+        ImpulseUnits.PoundForceSecond: 3,
         
-        self.__slug_feet_per_second = None
+        ImpulseUnits.SlugFootPerSecond: 4,
         
-        self.__nanonewton_seconds = None
+        ImpulseUnits.NanonewtonSecond: 5,
         
-        self.__micronewton_seconds = None
+        ImpulseUnits.MicronewtonSecond: 6,
         
-        self.__millinewton_seconds = None
+        ImpulseUnits.MillinewtonSecond: 7,
         
-        self.__centinewton_seconds = None
+        ImpulseUnits.CentinewtonSecond: 8,
         
-        self.__decinewton_seconds = None
+        ImpulseUnits.DecinewtonSecond: 9,
         
-        self.__decanewton_seconds = None
+        ImpulseUnits.DecanewtonSecond: 10,
         
-        self.__kilonewton_seconds = None
+        ImpulseUnits.KilonewtonSecond: 11,
         
-        self.__meganewton_seconds = None
+        ImpulseUnits.MeganewtonSecond: 12,
         
+    }
 
-    def convert(self, unit: ImpulseUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ImpulseUnits.KilogramMeterPerSecond: lambda value: (value),
+        
+        ImpulseUnits.NewtonSecond: lambda value: (value),
+        
+        ImpulseUnits.PoundFootPerSecond: lambda value: (value * 7.230657989877),
+        
+        ImpulseUnits.PoundForceSecond: lambda value: (value * 0.2248089430997),
+        
+        ImpulseUnits.SlugFootPerSecond: lambda value: (value * 0.224735720691),
+        
+        ImpulseUnits.NanonewtonSecond: lambda value: ((value) / 1e-09),
+        
+        ImpulseUnits.MicronewtonSecond: lambda value: ((value) / 1e-06),
+        
+        ImpulseUnits.MillinewtonSecond: lambda value: ((value) / 0.001),
+        
+        ImpulseUnits.CentinewtonSecond: lambda value: ((value) / 0.01),
+        
+        ImpulseUnits.DecinewtonSecond: lambda value: ((value) / 0.1),
+        
+        ImpulseUnits.DecanewtonSecond: lambda value: ((value) / 10.0),
+        
+        ImpulseUnits.KilonewtonSecond: lambda value: ((value) / 1000.0),
+        
+        ImpulseUnits.MeganewtonSecond: lambda value: ((value) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ImpulseUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        ImpulseUnits.KilogramMeterPerSecond: lambda value: (value),
+        
+        ImpulseUnits.NewtonSecond: lambda value: (value),
+        
+        ImpulseUnits.PoundFootPerSecond: lambda value: (value / 7.230657989877),
+        
+        ImpulseUnits.PoundForceSecond: lambda value: (value / 0.2248089430997),
+        
+        ImpulseUnits.SlugFootPerSecond: lambda value: (value / 0.224735720691),
         
-        if from_unit == ImpulseUnits.KilogramMeterPerSecond:
-            return (value)
+        ImpulseUnits.NanonewtonSecond: lambda value: ((value) * 1e-09),
         
-        if from_unit == ImpulseUnits.NewtonSecond:
-            return (value)
+        ImpulseUnits.MicronewtonSecond: lambda value: ((value) * 1e-06),
         
-        if from_unit == ImpulseUnits.PoundFootPerSecond:
-            return (value * 7.230657989877)
+        ImpulseUnits.MillinewtonSecond: lambda value: ((value) * 0.001),
         
-        if from_unit == ImpulseUnits.PoundForceSecond:
-            return (value * 0.2248089430997)
+        ImpulseUnits.CentinewtonSecond: lambda value: ((value) * 0.01),
         
-        if from_unit == ImpulseUnits.SlugFootPerSecond:
-            return (value * 0.224735720691)
+        ImpulseUnits.DecinewtonSecond: lambda value: ((value) * 0.1),
         
-        if from_unit == ImpulseUnits.NanonewtonSecond:
-            return ((value) / 1e-09)
+        ImpulseUnits.DecanewtonSecond: lambda value: ((value) * 10.0),
         
-        if from_unit == ImpulseUnits.MicronewtonSecond:
-            return ((value) / 1e-06)
+        ImpulseUnits.KilonewtonSecond: lambda value: ((value) * 1000.0),
         
-        if from_unit == ImpulseUnits.MillinewtonSecond:
-            return ((value) / 0.001)
+        ImpulseUnits.MeganewtonSecond: lambda value: ((value) * 1000000.0),
         
-        if from_unit == ImpulseUnits.CentinewtonSecond:
-            return ((value) / 0.01)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ImpulseUnits.KilogramMeterPerSecond: ('1', '0'),
+        
+        ImpulseUnits.NewtonSecond: ('1', '0'),
+        
+        ImpulseUnits.PoundFootPerSecond: ('7230657989877/1000000000000', '0'),
+        
+        ImpulseUnits.PoundForceSecond: ('2248089430997/10000000000000', '0'),
+        
+        ImpulseUnits.SlugFootPerSecond: ('224735720691/1000000000000', '0'),
+        
+        ImpulseUnits.NanonewtonSecond: ('1000000000', '0'),
+        
+        ImpulseUnits.MicronewtonSecond: ('1000000', '0'),
+        
+        ImpulseUnits.MillinewtonSecond: ('1000', '0'),
         
-        if from_unit == ImpulseUnits.DecinewtonSecond:
-            return ((value) / 0.1)
+        ImpulseUnits.CentinewtonSecond: ('100', '0'),
         
-        if from_unit == ImpulseUnits.DecanewtonSecond:
-            return ((value) / 10.0)
+        ImpulseUnits.DecinewtonSecond: ('10', '0'),
         
-        if from_unit == ImpulseUnits.KilonewtonSecond:
-            return ((value) / 1000.0)
+        ImpulseUnits.DecanewtonSecond: ('1/10', '0'),
         
-        if from_unit == ImpulseUnits.MeganewtonSecond:
-            return ((value) / 1000000.0)
+        ImpulseUnits.KilonewtonSecond: ('1/1000', '0'),
         
-        return None
+        ImpulseUnits.MeganewtonSecond: ('1/1000000', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        ImpulseUnits.KilogramMeterPerSecond: ('1', '0'),
+        
+        ImpulseUnits.NewtonSecond: ('1', '0'),
+        
+        ImpulseUnits.PoundFootPerSecond: ('1000000000000/7230657989877', '0'),
+        
+        ImpulseUnits.PoundForceSecond: ('10000000000000/2248089430997', '0'),
+        
+        ImpulseUnits.SlugFootPerSecond: ('1000000000000/224735720691', '0'),
+        
+        ImpulseUnits.NanonewtonSecond: ('1/1000000000', '0'),
+        
+        ImpulseUnits.MicronewtonSecond: ('1/1000000', '0'),
+        
+        ImpulseUnits.MillinewtonSecond: ('1/1000', '0'),
+        
+        ImpulseUnits.CentinewtonSecond: ('1/100', '0'),
+        
+        ImpulseUnits.DecinewtonSecond: ('1/10', '0'),
+        
+        ImpulseUnits.DecanewtonSecond: ('10', '0'),
+        
+        ImpulseUnits.KilonewtonSecond: ('1000', '0'),
+        
+        ImpulseUnits.MeganewtonSecond: ('1000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ImpulseUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ImpulseUnits.KilogramMeterPerSecond:
-            return (value)
+        ImpulseUnits.KilogramMeterPerSecond: ('kg·m/s',),
         
-        if to_unit == ImpulseUnits.NewtonSecond:
-            return (value)
+        ImpulseUnits.NewtonSecond: ('N·s',),
         
-        if to_unit == ImpulseUnits.PoundFootPerSecond:
-            return (value / 7.230657989877)
+        ImpulseUnits.PoundFootPerSecond: ('lb·ft/s',),
         
-        if to_unit == ImpulseUnits.PoundForceSecond:
-            return (value / 0.2248089430997)
+        ImpulseUnits.PoundForceSecond: ('lbf·s',),
         
-        if to_unit == ImpulseUnits.SlugFootPerSecond:
-            return (value / 0.224735720691)
+        ImpulseUnits.SlugFootPerSecond: ('slug·ft/s',),
         
-        if to_unit == ImpulseUnits.NanonewtonSecond:
-            return ((value) * 1e-09)
+        ImpulseUnits.NanonewtonSecond: ('nN·s',),
         
-        if to_unit == ImpulseUnits.MicronewtonSecond:
-            return ((value) * 1e-06)
+        ImpulseUnits.MicronewtonSecond: ('μN·s',),
         
-        if to_unit == ImpulseUnits.MillinewtonSecond:
-            return ((value) * 0.001)
+        ImpulseUnits.MillinewtonSecond: ('mN·s',),
         
-        if to_unit == ImpulseUnits.CentinewtonSecond:
-            return ((value) * 0.01)
+        ImpulseUnits.CentinewtonSecond: ('cN·s',),
         
-        if to_unit == ImpulseUnits.DecinewtonSecond:
-            return ((value) * 0.1)
+        ImpulseUnits.DecinewtonSecond: ('dN·s',),
         
-        if to_unit == ImpulseUnits.DecanewtonSecond:
-            return ((value) * 10.0)
+        ImpulseUnits.DecanewtonSecond: ('daN·s',),
         
-        if to_unit == ImpulseUnits.KilonewtonSecond:
-            return ((value) * 1000.0)
+        ImpulseUnits.KilonewtonSecond: ('kN·s',),
         
-        if to_unit == ImpulseUnits.MeganewtonSecond:
-            return ((value) * 1000000.0)
+        ImpulseUnits.MeganewtonSecond: ('MN·s',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: ImpulseUnits = ImpulseUnits.NewtonSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ImpulseUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ImpulseUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
 
+    def __convert_to_base(self, value: float, to_unit: ImpulseUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ImpulseUnits, to_unit: ImpulseUnits) -> float:
+        """
+        Convert a value from one Impulse unit to another, without creating a Impulse instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ImpulseUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ImpulseUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Impulse._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ImpulseUnits, to_unit: ImpulseUnits) -> List[float]:
+        """
+        Convert many values from one Impulse unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ImpulseUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ImpulseUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Impulse._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ImpulseUnits, to_unit: ImpulseUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Impulse._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ImpulseUnits, to_unit: ImpulseUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Impulse unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ImpulseUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ImpulseUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Impulse._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ImpulseUnits = ImpulseUnits.NewtonSecond) -> Impulse:
+        """
+        Create a new instance of Impulse holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ImpulseUnits
+        :return: A new instance of Impulse.
+        :rtype: Impulse
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Impulse._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ImpulseUnits = ImpulseUnits.NewtonSecond) -> Fraction:
+        """
+        Get the exact value of the Impulse in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (NewtonSecond).
+        :type unit: ImpulseUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Impulse:
+        """
+        Parse a Impulse from a value followed by a unit abbreviation, e.g. "1 kg·m/s".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Impulse.
+        :rtype: Impulse
+        :raises ValueError: When the string is not a valid or an ambiguous Impulse.
+        """
+        return Impulse._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Impulse]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Impulse._try_parse(text)
+
+    def to_binary(self, unit: Optional[ImpulseUnits] = None) -> bytes:
+        """
+        Encode the Impulse to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ImpulseUnits
+        :return: The encoded Impulse.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Impulse:
+        """
+        Decode a Impulse encoded by to_binary.
+
+        :param data: The encoded Impulse, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Impulse.
+        :rtype: Impulse
+        :raises ValueError: When the data is not a valid encoded Impulse.
+        """
+        return Impulse._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ImpulseUnits] = None) -> dict:
+        """
+        Get the Impulse DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (NewtonSecond).
+        :type hold_in_unit: ImpulseUnits
+        :return: The Impulse DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ImpulseUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Impulse:
+        """
+        Create a new instance of Impulse from its DTO.
+
+        :param dto: The Impulse DTO, the unit is the ImpulseUnits value or name.
+        :type dto: dict
+        :return: A new instance of Impulse.
+        :rtype: Impulse
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Impulse._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Impulse:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Impulse._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -413,10 +683,7 @@ class Impulse(AbstractMeasure):
         """
         
         """
-        if self.__kilogram_meters_per_second != None:
-            return self.__kilogram_meters_per_second
-        self.__kilogram_meters_per_second = self.__convert_from_base(ImpulseUnits.KilogramMeterPerSecond)
-        return self.__kilogram_meters_per_second
+        return self._cached_convert(ImpulseUnits.KilogramMeterPerSecond)
 
     
     @property
@@ -424,10 +691,7 @@ class Impulse(AbstractMeasure):
         """
         
         """
-        if self.__newton_seconds != None:
-            return self.__newton_seconds
-        self.__newton_seconds = self.__convert_from_base(ImpulseUnits.NewtonSecond)
-        return self.__newton_seconds
+        return self._cached_convert(ImpulseUnits.NewtonSecond)
 
     
     @property
@@ -435,10 +699,7 @@ class Impulse(AbstractMeasure):
         """
         
         """
-        if self.__pound_feet_per_second != None:
-            return self.__pound_feet_per_second
-        self.__pound_feet_per_second = self.__convert_from_base(ImpulseUnits.PoundFootPerSecond)
-        return self.__pound_feet_per_second
+        return self._cached_convert(ImpulseUnits.PoundFootPerSecond)
 
     
     @property
@@ -446,10 +707,7 @@ class Impulse(AbstractMeasure):
         """
         
         """
-        if self.__pound_force_seconds != None:
-            return self.__pound_force_seconds
-        self.__pound_force_seconds = self.__convert_from_base(ImpulseUnits.PoundForceSecond)
-        return self.__pound_force_seconds
+        return self._cached_convert(ImpulseUnits.PoundForceSecond)
 
     
     @property
@@ -457,10 +715,7 @@ class Impulse(AbstractMeasure):
         """
         
         """
-        if self.__slug_feet_per_second != None:
-            return self.__slug_feet_per_second
-        self.__slug_feet_per_second = self.__convert_from_base(ImpulseUnits.SlugFootPerSecond)
-        return self.__slug_feet_per_second
+        return self._cached_convert(ImpulseUnits.SlugFootPerSecond)
 
     
     @property
@@ -468,10 +723,7 @@ class Impulse(AbstractMeasure):
         """
         
         """
-        if self.__nanonewton_seconds != None:
-            return self.__nanonewton_seconds
-        self.__nanonewton_seconds = self.__convert_from_base(ImpulseUnits.NanonewtonSecond)
-        return self.__nanonewton_seconds
+        return self._cached_convert(ImpulseUnits.NanonewtonSecond)
 
     
     @property
@@ -479,10 +731,7 @@ class Impulse(AbstractMeasure):
         """
         
         """
-        if self.__micronewton_seconds != None:
-            return self.__micronewton_seconds
-        self.__micronewton_seconds = self.__convert_from_base(ImpulseUnits.MicronewtonSecond)
-        return self.__micronewton_seconds
+        return self._cached_convert(ImpulseUnits.MicronewtonSecond)
 
     
     @property
@@ -490,10 +739,7 @@ class Impulse(AbstractMeasure):
         """
         
         """
-        if self.__millinewton_seconds != None:
-            return self.__millinewton_seconds
-        self.__millinewton_seconds = self.__convert_from_base(ImpulseUnits.MillinewtonSecond)
-        return self.__millinewton_seconds
+        return self._cached_convert(ImpulseUnits.MillinewtonSecond)
 
     
     @property
@@ -501,10 +747,7 @@ class Impulse(AbstractMeasure):
         """
         
         """
-        if self.__centinewton_seconds != None:
-            return self.__centinewton_seconds
-        self.__centinewton_seconds = self.__convert_from_base(ImpulseUnits.CentinewtonSecond)
-        return self.__centinewton_seconds
+        return self._cached_convert(ImpulseUnits.CentinewtonSecond)
 
     
     @property
@@ -512,10 +755,7 @@ class Impulse(AbstractMeasure):
         """
         
         """
-        if self.__decinewton_seconds != None:
-            return self.__decinewton_seconds
-        self.__decinewton_seconds = self.__convert_from_base(ImpulseUnits.DecinewtonSecond)
-        return self.__decinewton_seconds
+        return self._cached_convert(ImpulseUnits.DecinewtonSecond)
 
     
     @property
@@ -523,10 +763,7 @@ class Impulse(AbstractMeasure):
         """
         
         """
-        if self.__decanewton_seconds != None:
-            return self.__decanewton_seconds
-        self.__decanewton_seconds = self.__convert_from_base(ImpulseUnits.DecanewtonSecond)
-        return self.__decanewton_seconds
+        return self._cached_convert(ImpulseUnits.DecanewtonSecond)
 
     
     @property
@@ -534,10 +771,7 @@ class Impulse(AbstractMeasure):
         """
         
         """
-        if self.__kilonewton_seconds != None:
-            return self.__kilonewton_seconds
-        self.__kilonewton_seconds = self.__convert_from_base(ImpulseUnits.KilonewtonSecond)
-        return self.__kilonewton_seconds
+        return self._cached_convert(ImpulseUnits.KilonewtonSecond)
 
     
     @property
@@ -545,10 +779,7 @@ class Impulse(AbstractMeasure):
         """
         
         """
-        if self.__meganewton_seconds != None:
-            return self.__meganewton_seconds
-        self.__meganewton_seconds = self.__convert_from_base(ImpulseUnits.MeganewtonSecond)
-        return self.__meganewton_seconds
+        return self._cached_convert(ImpulseUnits.MeganewtonSecond)
 
     
     def to_string(self, unit: ImpulseUnits = ImpulseUnits.NewtonSecond) -> str:
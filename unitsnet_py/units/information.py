@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class InformationUnits(Enum):
         """
             InformationUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Byte = 'byte'
         """
@@ -89,138 +100,401 @@ class Information(AbstractMeasure):
         value (float): The value.
         from_unit (InformationUnits): The Information unit to create from, The default unit is Bit
     """
-    def __init__(self, value: float, from_unit: InformationUnits = InformationUnits.Bit):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = InformationUnits
+
+    _base_unit = InformationUnits.Bit
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 47
+
+    _binary_unit_ids = {
         
-        self.__bytes = None
+        InformationUnits.Byte: 0,
         
-        self.__bits = None
+        InformationUnits.Bit: 1,
         
-        self.__kilobytes = None
+        InformationUnits.Kilobyte: 2,
         
-        self.__megabytes = None
+        InformationUnits.Megabyte: 3,
         
-        self.__gigabytes = None
+        InformationUnits.Gigabyte: 4,
         
-        self.__terabytes = None
+        InformationUnits.Terabyte: 5,
         
-        self.__petabytes = None
+        InformationUnits.Petabyte: 6,
         
-        self.__exabytes = None
+        InformationUnits.Exabyte: 7,
         
-        self.__kilobits = None
+        InformationUnits.Kilobit: 8,
         
-        self.__megabits = None
+        InformationUnits.Megabit: 9,
         
-        self.__gigabits = None
+        InformationUnits.Gigabit: 10,
         
-        self.__terabits = None
+        InformationUnits.Terabit: 11,
         
-        self.__petabits = None
+        InformationUnits.Petabit: 12,
         
-        self.__exabits = None
+        InformationUnits.Exabit: 13,
         
+    }
 
-    def convert(self, unit: InformationUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        InformationUnits.Byte: lambda value: (value / 8),
+        
+        InformationUnits.Bit: lambda value: (value),
+        
+        InformationUnits.Kilobyte: lambda value: ((value / 8) / 1000.0),
+        
+        InformationUnits.Megabyte: lambda value: ((value / 8) / 1000000.0),
+        
+        InformationUnits.Gigabyte: lambda value: ((value / 8) / 1000000000.0),
+        
+        InformationUnits.Terabyte: lambda value: ((value / 8) / 1000000000000.0),
+        
+        InformationUnits.Petabyte: lambda value: ((value / 8) / 1000000000000000.0),
+        
+        InformationUnits.Exabyte: lambda value: ((value / 8) / 1e+18),
+        
+        InformationUnits.Kilobit: lambda value: ((value) / 1000.0),
+        
+        InformationUnits.Megabit: lambda value: ((value) / 1000000.0),
+        
+        InformationUnits.Gigabit: lambda value: ((value) / 1000000000.0),
+        
+        InformationUnits.Terabit: lambda value: ((value) / 1000000000000.0),
+        
+        InformationUnits.Petabit: lambda value: ((value) / 1000000000000000.0),
+        
+        InformationUnits.Exabit: lambda value: ((value) / 1e+18),
+        
+    }
 
-    def __convert_from_base(self, from_unit: InformationUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        InformationUnits.Byte: lambda value: (value * 8),
+        
+        InformationUnits.Bit: lambda value: (value),
+        
+        InformationUnits.Kilobyte: lambda value: ((value * 8) * 1000.0),
+        
+        InformationUnits.Megabyte: lambda value: ((value * 8) * 1000000.0),
+        
+        InformationUnits.Gigabyte: lambda value: ((value * 8) * 1000000000.0),
         
-        if from_unit == InformationUnits.Byte:
-            return (value / 8)
+        InformationUnits.Terabyte: lambda value: ((value * 8) * 1000000000000.0),
         
-        if from_unit == InformationUnits.Bit:
-            return (value)
+        InformationUnits.Petabyte: lambda value: ((value * 8) * 1000000000000000.0),
         
-        if from_unit == InformationUnits.Kilobyte:
-            return ((value / 8) / 1000.0)
+        InformationUnits.Exabyte: lambda value: ((value * 8) * 1e+18),
         
-        if from_unit == InformationUnits.Megabyte:
-            return ((value / 8) / 1000000.0)
+        InformationUnits.Kilobit: lambda value: ((value) * 1000.0),
         
-        if from_unit == InformationUnits.Gigabyte:
-            return ((value / 8) / 1000000000.0)
+        InformationUnits.Megabit: lambda value: ((value) * 1000000.0),
         
-        if from_unit == InformationUnits.Terabyte:
-            return ((value / 8) / 1000000000000.0)
+        InformationUnits.Gigabit: lambda value: ((value) * 1000000000.0),
         
-        if from_unit == InformationUnits.Petabyte:
-            return ((value / 8) / 1000000000000000.0)
+        InformationUnits.Terabit: lambda value: ((value) * 1000000000000.0),
         
-        if from_unit == InformationUnits.Exabyte:
-            return ((value / 8) / 1e+18)
+        InformationUnits.Petabit: lambda value: ((value) * 1000000000000000.0),
         
-        if from_unit == InformationUnits.Kilobit:
-            return ((value) / 1000.0)
+        InformationUnits.Exabit: lambda value: ((value) * 1e+18),
         
-        if from_unit == InformationUnits.Megabit:
-            return ((value) / 1000000.0)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        InformationUnits.Byte: ('1/8', '0'),
+        
+        InformationUnits.Bit: ('1', '0'),
+        
+        InformationUnits.Kilobyte: ('1/8000', '0'),
+        
+        InformationUnits.Megabyte: ('1/8000000', '0'),
+        
+        InformationUnits.Gigabyte: ('1/8000000000', '0'),
+        
+        InformationUnits.Terabyte: ('1/8000000000000', '0'),
+        
+        InformationUnits.Petabyte: ('1/8000000000000000', '0'),
+        
+        InformationUnits.Exabyte: ('1/8000000000000000000', '0'),
+        
+        InformationUnits.Kilobit: ('1/1000', '0'),
         
-        if from_unit == InformationUnits.Gigabit:
-            return ((value) / 1000000000.0)
+        InformationUnits.Megabit: ('1/1000000', '0'),
         
-        if from_unit == InformationUnits.Terabit:
-            return ((value) / 1000000000000.0)
+        InformationUnits.Gigabit: ('1/1000000000', '0'),
         
-        if from_unit == InformationUnits.Petabit:
-            return ((value) / 1000000000000000.0)
+        InformationUnits.Terabit: ('1/1000000000000', '0'),
         
-        if from_unit == InformationUnits.Exabit:
-            return ((value) / 1e+18)
+        InformationUnits.Petabit: ('1/1000000000000000', '0'),
         
-        return None
+        InformationUnits.Exabit: ('1/1000000000000000000', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        InformationUnits.Byte: ('8', '0'),
+        
+        InformationUnits.Bit: ('1', '0'),
+        
+        InformationUnits.Kilobyte: ('8000', '0'),
+        
+        InformationUnits.Megabyte: ('8000000', '0'),
+        
+        InformationUnits.Gigabyte: ('8000000000', '0'),
+        
+        InformationUnits.Terabyte: ('8000000000000', '0'),
+        
+        InformationUnits.Petabyte: ('8000000000000000', '0'),
+        
+        InformationUnits.Exabyte: ('8000000000000000000', '0'),
+        
+        InformationUnits.Kilobit: ('1000', '0'),
+        
+        InformationUnits.Megabit: ('1000000', '0'),
+        
+        InformationUnits.Gigabit: ('1000000000', '0'),
+        
+        InformationUnits.Terabit: ('1000000000000', '0'),
+        
+        InformationUnits.Petabit: ('1000000000000000', '0'),
+        
+        InformationUnits.Exabit: ('1000000000000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: InformationUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == InformationUnits.Byte:
-            return (value * 8)
+        InformationUnits.Byte: ('B',),
         
-        if to_unit == InformationUnits.Bit:
-            return (value)
+        InformationUnits.Bit: ('b',),
         
-        if to_unit == InformationUnits.Kilobyte:
-            return ((value * 8) * 1000.0)
+        InformationUnits.Kilobyte: ('kB',),
         
-        if to_unit == InformationUnits.Megabyte:
-            return ((value * 8) * 1000000.0)
+        InformationUnits.Megabyte: ('MB',),
         
-        if to_unit == InformationUnits.Gigabyte:
-            return ((value * 8) * 1000000000.0)
+        InformationUnits.Gigabyte: ('GB',),
         
-        if to_unit == InformationUnits.Terabyte:
-            return ((value * 8) * 1000000000000.0)
+        InformationUnits.Terabyte: ('TB',),
         
-        if to_unit == InformationUnits.Petabyte:
-            return ((value * 8) * 1000000000000000.0)
+        InformationUnits.Petabyte: ('PB',),
         
-        if to_unit == InformationUnits.Exabyte:
-            return ((value * 8) * 1e+18)
+        InformationUnits.Exabyte: ('EB',),
         
-        if to_unit == InformationUnits.Kilobit:
-            return ((value) * 1000.0)
+        InformationUnits.Kilobit: ('kb',),
         
-        if to_unit == InformationUnits.Megabit:
-            return ((value) * 1000000.0)
+        InformationUnits.Megabit: ('Mb',),
         
-        if to_unit == InformationUnits.Gigabit:
-            return ((value) * 1000000000.0)
+        InformationUnits.Gigabit: ('Gb',),
         
-        if to_unit == InformationUnits.Terabit:
-            return ((value) * 1000000000000.0)
+        InformationUnits.Terabit: ('Tb',),
         
-        if to_unit == InformationUnits.Petabit:
-            return ((value) * 1000000000000000.0)
+        InformationUnits.Petabit: ('Pb',),
         
-        if to_unit == InformationUnits.Exabit:
-            return ((value) * 1e+18)
+        InformationUnits.Exabit: ('Eb',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: InformationUnits = InformationUnits.Bit):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: InformationUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: InformationUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
 
 
+    def __convert_to_base(self, value: float, to_unit: InformationUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: InformationUnits, to_unit: InformationUnits) -> float:
+        """
+        Convert a value from one Information unit to another, without creating a Information instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: InformationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: InformationUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Information._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: InformationUnits, to_unit: InformationUnits) -> List[float]:
+        """
+        Convert many values from one Information unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: InformationUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: InformationUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Information._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: InformationUnits, to_unit: InformationUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Information._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: InformationUnits, to_unit: InformationUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Information unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: InformationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: InformationUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Information._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: InformationUnits = InformationUnits.Bit) -> Information:
+        """
+        Create a new instance of Information holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: InformationUnits
+        :return: A new instance of Information.
+        :rtype: Information
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Information._from_exact(value, from_unit)
+
+    def to_exact(self, unit: InformationUnits = InformationUnits.Bit) -> Fraction:
+        """
+        Get the exact value of the Information in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Bit).
+        :type unit: InformationUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Information:
+        """
+        Parse a Information from a value followed by a unit abbreviation, e.g. "1 B".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Information.
+        :rtype: Information
+        :raises ValueError: When the string is not a valid or an ambiguous Information.
+        """
+        return Information._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Information]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Information._try_parse(text)
+
+    def to_binary(self, unit: Optional[InformationUnits] = None) -> bytes:
+        """
+        Encode the Information to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: InformationUnits
+        :return: The encoded Information.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Information:
+        """
+        Decode a Information encoded by to_binary.
+
+        :param data: The encoded Information, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Information.
+        :rtype: Information
+        :raises ValueError: When the data is not a valid encoded Information.
+        """
+        return Information._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[InformationUnits] = None) -> dict:
+        """
+        Get the Information DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Bit).
+        :type hold_in_unit: InformationUnits
+        :return: The Information DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[InformationUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Information:
+        """
+        Create a new instance of Information from its DTO.
+
+        :param dto: The Information DTO, the unit is the InformationUnits value or name.
+        :type dto: dict
+        :return: A new instance of Information.
+        :rtype: Information
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Information._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Information:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Information._from_json(text)
+
     @property
     def base_value(self) -> float:
         return self._value
@@ -441,10 +715,7 @@ class Information(AbstractMeasure):
         """
         
         """
-        if self.__bytes != None:
-            return self.__bytes
-        self.__bytes = self.__convert_from_base(InformationUnits.Byte)
-        return self.__bytes
+        return self._cached_convert(InformationUnits.Byte)
 
     
     @property
@@ -452,10 +723,7 @@ class Information(AbstractMeasure):
         """
         
         """
-        if self.__bits != None:
-            return self.__bits
-        self.__bits = self.__convert_from_base(InformationUnits.Bit)
-        return self.__bits
+        return self._cached_convert(InformationUnits.Bit)
 
     
     @property
@@ -463,10 +731,7 @@ class Information(AbstractMeasure):
         """
         
         """
-        if self.__kilobytes != None:
-            return self.__kilobytes
-        self.__kilobytes = self.__convert_from_base(InformationUnits.Kilobyte)
-        return self.__kilobytes
+        return self._cached_convert(InformationUnits.Kilobyte)
 
     
     @property
@@ -474,10 +739,7 @@ class Information(AbstractMeasure):
         """
         
         """
-        if self.__megabytes != None:
-            return self.__megabytes
-        self.__megabytes = self.__convert_from_base(InformationUnits.Megabyte)
-        return self.__megabytes
+        return self._cached_convert(InformationUnits.Megabyte)
 
     
     @property
@@ -485,10 +747,7 @@ class Information(AbstractMeasure):
         """
         
         """
-        if self.__gigabytes != None:
-            return self.__gigabytes
-        self.__gigabytes = self.__convert_from_base(InformationUnits.Gigabyte)
-        return self.__gigabytes
+        return self._cached_convert(InformationUnits.Gigabyte)
 
     
     @property
@@ -496,10 +755,7 @@ class Information(AbstractMeasure):
         """
         
         """
-        if self.__terabytes != None:
-            return self.__terabytes
-        self.__terabytes = self.__convert_from_base(InformationUnits.Terabyte)
-        return self.__terabytes
+        return self._cached_convert(InformationUnits.Terabyte)
 
     
     @property
@@ -507,10 +763,7 @@ class Information(AbstractMeasure):
         """
         
         """
-        if self.__petabytes != None:
-            return self.__petabytes
-        self.__petabytes = self.__convert_from_base(InformationUnits.Petabyte)
-        return self.__petabytes
+        return self._cached_convert(InformationUnits.Petabyte)
 
     
     @property
@@ -518,10 +771,7 @@ class Information(AbstractMeasure):
         """
         
         """
-        if self.__exabytes != None:
-            return self.__exabytes
-        self.__exabytes = self.__convert_from_base(InformationUnits.Exabyte)
-        return self.__exabytes
+        return self._cached_convert(InformationUnits.Exabyte)
 
     
     @property
@@ -529,10 +779,7 @@ class Information(AbstractMeasure):
         """
         
         """
-        if self.__kilobits != None:
-            return self.__kilobits
-        self.__kilobits = self.__convert_from_base(InformationUnits.Kilobit)
-        return self.__kilobits
+        return self._cached_convert(InformationUnits.Kilobit)
 
     
     @property
@@ -540,10 +787,7 @@ class Information(AbstractMeasure):
         """
         
         """
-        if self.__megabits != None:
-            return self.__megabits
-        self.__megabits = self.__convert_from_base(InformationUnits.Megabit)
-        return self.__megabits
+        return self._cached_convert(InformationUnits.Megabit)
 
     
     @property
@@ -551,10 +795,7 @@ class Information(AbstractMeasure):
         """
         
         """
-        if self.__gigabits != None:
-            return self.__gigabits
-        self.__gigabits = self.__convert_from_base(InformationUnits.Gigabit)
-        return self.__gigabits
+        return self._cached_convert(InformationUnits.Gigabit)
 
     
     @property
@@ -562,10 +803,7 @@ class Information(AbstractMeasure):
         """
         
         """
-        if self.__terabits != None:
-            return self.__terabits
-        self.__terabits = self.__convert_from_base(InformationUnits.Terabit)
-        return self.__terabits
+        return self._cached_convert(InformationUnits.Terabit)
 
     
     @property
@@ -573,10 +811,7 @@ class Information(AbstractMeasure):
         """
         
         """
-        if self.__petabits != None:
-            return self.__petabits
-        self.__petabits = self.__convert_from_base(InformationUnits.Petabit)
-        return self.__petabits
+        return self._cached_convert(InformationUnits.Petabit)
 
     
     @property
@@ -584,10 +819,7 @@ class Information(AbstractMeasure):
         """
         
         """
-        if self.__exabits != None:
-            return self.__exabits
-        self.__exabits = self.__convert_from_base(InformationUnits.Exabit)
-        return self.__exabits
+        return self._cached_convert(InformationUnits.Exabit)
 
     
     def to_string(self, unit: InformationUnits = InformationUnits.Bit) -> str:
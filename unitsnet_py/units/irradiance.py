@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class IrradianceUnits(Enum):
         """
             IrradianceUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         WattPerSquareMeter = 'watt_per_square_meter'
         """
@@ -89,138 +100,401 @@ class Irradiance(AbstractMeasure):
         value (float): The value.
         from_unit (IrradianceUnits): The Irradiance unit to create from, The default unit is WattPerSquareMeter
     """
-    def __init__(self, value: float, from_unit: IrradianceUnits = IrradianceUnits.WattPerSquareMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = IrradianceUnits
+
+    _base_unit = IrradianceUnits.WattPerSquareMeter
+
+    _dimensions = (0, 1, -3, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 48
+
+    _binary_unit_ids = {
         
-        self.__watts_per_square_meter = None
+        IrradianceUnits.WattPerSquareMeter: 0,
         
-        self.__watts_per_square_centimeter = None
+        IrradianceUnits.WattPerSquareCentimeter: 1,
         
-        self.__picowatts_per_square_meter = None
+        IrradianceUnits.PicowattPerSquareMeter: 2,
         
-        self.__nanowatts_per_square_meter = None
+        IrradianceUnits.NanowattPerSquareMeter: 3,
         
-        self.__microwatts_per_square_meter = None
+        IrradianceUnits.MicrowattPerSquareMeter: 4,
         
-        self.__milliwatts_per_square_meter = None
+        IrradianceUnits.MilliwattPerSquareMeter: 5,
         
-        self.__kilowatts_per_square_meter = None
+        IrradianceUnits.KilowattPerSquareMeter: 6,
         
-        self.__megawatts_per_square_meter = None
+        IrradianceUnits.MegawattPerSquareMeter: 7,
         
-        self.__picowatts_per_square_centimeter = None
+        IrradianceUnits.PicowattPerSquareCentimeter: 8,
         
-        self.__nanowatts_per_square_centimeter = None
+        IrradianceUnits.NanowattPerSquareCentimeter: 9,
         
-        self.__microwatts_per_square_centimeter = None
+        IrradianceUnits.MicrowattPerSquareCentimeter: 10,
         
-        self.__milliwatts_per_square_centimeter = None
+        IrradianceUnits.MilliwattPerSquareCentimeter: 11,
         
-        self.__kilowatts_per_square_centimeter = None
+        IrradianceUnits.KilowattPerSquareCentimeter: 12,
         
-        self.__megawatts_per_square_centimeter = None
+        IrradianceUnits.MegawattPerSquareCentimeter: 13,
         
+    }
 
-    def convert(self, unit: IrradianceUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        IrradianceUnits.WattPerSquareMeter: lambda value: (value),
+        
+        IrradianceUnits.WattPerSquareCentimeter: lambda value: (value * 0.0001),
+        
+        IrradianceUnits.PicowattPerSquareMeter: lambda value: ((value) / 1e-12),
+        
+        IrradianceUnits.NanowattPerSquareMeter: lambda value: ((value) / 1e-09),
+        
+        IrradianceUnits.MicrowattPerSquareMeter: lambda value: ((value) / 1e-06),
+        
+        IrradianceUnits.MilliwattPerSquareMeter: lambda value: ((value) / 0.001),
+        
+        IrradianceUnits.KilowattPerSquareMeter: lambda value: ((value) / 1000.0),
+        
+        IrradianceUnits.MegawattPerSquareMeter: lambda value: ((value) / 1000000.0),
+        
+        IrradianceUnits.PicowattPerSquareCentimeter: lambda value: ((value * 0.0001) / 1e-12),
+        
+        IrradianceUnits.NanowattPerSquareCentimeter: lambda value: ((value * 0.0001) / 1e-09),
+        
+        IrradianceUnits.MicrowattPerSquareCentimeter: lambda value: ((value * 0.0001) / 1e-06),
+        
+        IrradianceUnits.MilliwattPerSquareCentimeter: lambda value: ((value * 0.0001) / 0.001),
+        
+        IrradianceUnits.KilowattPerSquareCentimeter: lambda value: ((value * 0.0001) / 1000.0),
+        
+        IrradianceUnits.MegawattPerSquareCentimeter: lambda value: ((value * 0.0001) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: IrradianceUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        IrradianceUnits.WattPerSquareMeter: lambda value: (value),
+        
+        IrradianceUnits.WattPerSquareCentimeter: lambda value: (value * 10000),
+        
+        IrradianceUnits.PicowattPerSquareMeter: lambda value: ((value) * 1e-12),
+        
+        IrradianceUnits.NanowattPerSquareMeter: lambda value: ((value) * 1e-09),
+        
+        IrradianceUnits.MicrowattPerSquareMeter: lambda value: ((value) * 1e-06),
         
-        if from_unit == IrradianceUnits.WattPerSquareMeter:
-            return (value)
+        IrradianceUnits.MilliwattPerSquareMeter: lambda value: ((value) * 0.001),
         
-        if from_unit == IrradianceUnits.WattPerSquareCentimeter:
-            return (value * 0.0001)
+        IrradianceUnits.KilowattPerSquareMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == IrradianceUnits.PicowattPerSquareMeter:
-            return ((value) / 1e-12)
+        IrradianceUnits.MegawattPerSquareMeter: lambda value: ((value) * 1000000.0),
         
-        if from_unit == IrradianceUnits.NanowattPerSquareMeter:
-            return ((value) / 1e-09)
+        IrradianceUnits.PicowattPerSquareCentimeter: lambda value: ((value * 10000) * 1e-12),
         
-        if from_unit == IrradianceUnits.MicrowattPerSquareMeter:
-            return ((value) / 1e-06)
+        IrradianceUnits.NanowattPerSquareCentimeter: lambda value: ((value * 10000) * 1e-09),
         
-        if from_unit == IrradianceUnits.MilliwattPerSquareMeter:
-            return ((value) / 0.001)
+        IrradianceUnits.MicrowattPerSquareCentimeter: lambda value: ((value * 10000) * 1e-06),
         
-        if from_unit == IrradianceUnits.KilowattPerSquareMeter:
-            return ((value) / 1000.0)
+        IrradianceUnits.MilliwattPerSquareCentimeter: lambda value: ((value * 10000) * 0.001),
         
-        if from_unit == IrradianceUnits.MegawattPerSquareMeter:
-            return ((value) / 1000000.0)
+        IrradianceUnits.KilowattPerSquareCentimeter: lambda value: ((value * 10000) * 1000.0),
         
-        if from_unit == IrradianceUnits.PicowattPerSquareCentimeter:
-            return ((value * 0.0001) / 1e-12)
+        IrradianceUnits.MegawattPerSquareCentimeter: lambda value: ((value * 10000) * 1000000.0),
         
-        if from_unit == IrradianceUnits.NanowattPerSquareCentimeter:
-            return ((value * 0.0001) / 1e-09)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        IrradianceUnits.WattPerSquareMeter: ('1', '0'),
+        
+        IrradianceUnits.WattPerSquareCentimeter: ('1/10000', '0'),
+        
+        IrradianceUnits.PicowattPerSquareMeter: ('1000000000000', '0'),
+        
+        IrradianceUnits.NanowattPerSquareMeter: ('1000000000', '0'),
+        
+        IrradianceUnits.MicrowattPerSquareMeter: ('1000000', '0'),
+        
+        IrradianceUnits.MilliwattPerSquareMeter: ('1000', '0'),
+        
+        IrradianceUnits.KilowattPerSquareMeter: ('1/1000', '0'),
+        
+        IrradianceUnits.MegawattPerSquareMeter: ('1/1000000', '0'),
+        
+        IrradianceUnits.PicowattPerSquareCentimeter: ('100000000', '0'),
         
-        if from_unit == IrradianceUnits.MicrowattPerSquareCentimeter:
-            return ((value * 0.0001) / 1e-06)
+        IrradianceUnits.NanowattPerSquareCentimeter: ('100000', '0'),
         
-        if from_unit == IrradianceUnits.MilliwattPerSquareCentimeter:
-            return ((value * 0.0001) / 0.001)
+        IrradianceUnits.MicrowattPerSquareCentimeter: ('100', '0'),
         
-        if from_unit == IrradianceUnits.KilowattPerSquareCentimeter:
-            return ((value * 0.0001) / 1000.0)
+        IrradianceUnits.MilliwattPerSquareCentimeter: ('1/10', '0'),
         
-        if from_unit == IrradianceUnits.MegawattPerSquareCentimeter:
-            return ((value * 0.0001) / 1000000.0)
+        IrradianceUnits.KilowattPerSquareCentimeter: ('1/10000000', '0'),
         
-        return None
+        IrradianceUnits.MegawattPerSquareCentimeter: ('1/10000000000', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        IrradianceUnits.WattPerSquareMeter: ('1', '0'),
+        
+        IrradianceUnits.WattPerSquareCentimeter: ('10000', '0'),
+        
+        IrradianceUnits.PicowattPerSquareMeter: ('1/1000000000000', '0'),
+        
+        IrradianceUnits.NanowattPerSquareMeter: ('1/1000000000', '0'),
+        
+        IrradianceUnits.MicrowattPerSquareMeter: ('1/1000000', '0'),
+        
+        IrradianceUnits.MilliwattPerSquareMeter: ('1/1000', '0'),
+        
+        IrradianceUnits.KilowattPerSquareMeter: ('1000', '0'),
+        
+        IrradianceUnits.MegawattPerSquareMeter: ('1000000', '0'),
+        
+        IrradianceUnits.PicowattPerSquareCentimeter: ('1/100000000', '0'),
+        
+        IrradianceUnits.NanowattPerSquareCentimeter: ('1/100000', '0'),
+        
+        IrradianceUnits.MicrowattPerSquareCentimeter: ('1/100', '0'),
+        
+        IrradianceUnits.MilliwattPerSquareCentimeter: ('10', '0'),
+        
+        IrradianceUnits.KilowattPerSquareCentimeter: ('10000000', '0'),
+        
+        IrradianceUnits.MegawattPerSquareCentimeter: ('10000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: IrradianceUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == IrradianceUnits.WattPerSquareMeter:
-            return (value)
+        IrradianceUnits.WattPerSquareMeter: ('W/m²',),
         
-        if to_unit == IrradianceUnits.WattPerSquareCentimeter:
-            return (value * 10000)
+        IrradianceUnits.WattPerSquareCentimeter: ('W/cm²',),
         
-        if to_unit == IrradianceUnits.PicowattPerSquareMeter:
-            return ((value) * 1e-12)
+        IrradianceUnits.PicowattPerSquareMeter: ('pW/m²',),
         
-        if to_unit == IrradianceUnits.NanowattPerSquareMeter:
-            return ((value) * 1e-09)
+        IrradianceUnits.NanowattPerSquareMeter: ('nW/m²',),
         
-        if to_unit == IrradianceUnits.MicrowattPerSquareMeter:
-            return ((value) * 1e-06)
+        IrradianceUnits.MicrowattPerSquareMeter: ('μW/m²',),
         
-        if to_unit == IrradianceUnits.MilliwattPerSquareMeter:
-            return ((value) * 0.001)
+        IrradianceUnits.MilliwattPerSquareMeter: ('mW/m²',),
         
-        if to_unit == IrradianceUnits.KilowattPerSquareMeter:
-            return ((value) * 1000.0)
+        IrradianceUnits.KilowattPerSquareMeter: ('kW/m²',),
         
-        if to_unit == IrradianceUnits.MegawattPerSquareMeter:
-            return ((value) * 1000000.0)
+        IrradianceUnits.MegawattPerSquareMeter: ('MW/m²',),
         
-        if to_unit == IrradianceUnits.PicowattPerSquareCentimeter:
-            return ((value * 10000) * 1e-12)
+        IrradianceUnits.PicowattPerSquareCentimeter: ('pW/cm²',),
         
-        if to_unit == IrradianceUnits.NanowattPerSquareCentimeter:
-            return ((value * 10000) * 1e-09)
+        IrradianceUnits.NanowattPerSquareCentimeter: ('nW/cm²',),
         
-        if to_unit == IrradianceUnits.MicrowattPerSquareCentimeter:
-            return ((value * 10000) * 1e-06)
+        IrradianceUnits.MicrowattPerSquareCentimeter: ('μW/cm²',),
         
-        if to_unit == IrradianceUnits.MilliwattPerSquareCentimeter:
-            return ((value * 10000) * 0.001)
+        IrradianceUnits.MilliwattPerSquareCentimeter: ('mW/cm²',),
         
-        if to_unit == IrradianceUnits.KilowattPerSquareCentimeter:
-            return ((value * 10000) * 1000.0)
+        IrradianceUnits.KilowattPerSquareCentimeter: ('kW/cm²',),
         
-        if to_unit == IrradianceUnits.MegawattPerSquareCentimeter:
-            return ((value * 10000) * 1000000.0)
+        IrradianceUnits.MegawattPerSquareCentimeter: ('MW/cm²',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: IrradianceUnits = IrradianceUnits.WattPerSquareMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: IrradianceUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: IrradianceUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
 
 
+    def __convert_to_base(self, value: float, to_unit: IrradianceUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: IrradianceUnits, to_unit: IrradianceUnits) -> float:
+        """
+        Convert a value from one Irradiance unit to another, without creating a Irradiance instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: IrradianceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: IrradianceUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Irradiance._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: IrradianceUnits, to_unit: IrradianceUnits) -> List[float]:
+        """
+        Convert many values from one Irradiance unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: IrradianceUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: IrradianceUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Irradiance._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: IrradianceUnits, to_unit: IrradianceUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Irradiance._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: IrradianceUnits, to_unit: IrradianceUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Irradiance unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: IrradianceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: IrradianceUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Irradiance._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: IrradianceUnits = IrradianceUnits.WattPerSquareMeter) -> Irradiance:
+        """
+        Create a new instance of Irradiance holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: IrradianceUnits
+        :return: A new instance of Irradiance.
+        :rtype: Irradiance
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Irradiance._from_exact(value, from_unit)
+
+    def to_exact(self, unit: IrradianceUnits = IrradianceUnits.WattPerSquareMeter) -> Fraction:
+        """
+        Get the exact value of the Irradiance in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (WattPerSquareMeter).
+        :type unit: IrradianceUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Irradiance:
+        """
+        Parse a Irradiance from a value followed by a unit abbreviation, e.g. "1 W/m²".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Irradiance.
+        :rtype: Irradiance
+        :raises ValueError: When the string is not a valid or an ambiguous Irradiance.
+        """
+        return Irradiance._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Irradiance]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Irradiance._try_parse(text)
+
+    def to_binary(self, unit: Optional[IrradianceUnits] = None) -> bytes:
+        """
+        Encode the Irradiance to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: IrradianceUnits
+        :return: The encoded Irradiance.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Irradiance:
+        """
+        Decode a Irradiance encoded by to_binary.
+
+        :param data: The encoded Irradiance, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Irradiance.
+        :rtype: Irradiance
+        :raises ValueError: When the data is not a valid encoded Irradiance.
+        """
+        return Irradiance._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[IrradianceUnits] = None) -> dict:
+        """
+        Get the Irradiance DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (WattPerSquareMeter).
+        :type hold_in_unit: IrradianceUnits
+        :return: The Irradiance DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[IrradianceUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Irradiance:
+        """
+        Create a new instance of Irradiance from its DTO.
+
+        :param dto: The Irradiance DTO, the unit is the IrradianceUnits value or name.
+        :type dto: dict
+        :return: A new instance of Irradiance.
+        :rtype: Irradiance
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Irradiance._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Irradiance:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Irradiance._from_json(text)
+
     @property
     def base_value(self) -> float:
         return self._value
@@ -441,10 +715,7 @@ class Irradiance(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_square_meter != None:
-            return self.__watts_per_square_meter
-        self.__watts_per_square_meter = self.__convert_from_base(IrradianceUnits.WattPerSquareMeter)
-        return self.__watts_per_square_meter
+        return self._cached_convert(IrradianceUnits.WattPerSquareMeter)
 
     
     @property
@@ -452,10 +723,7 @@ class Irradiance(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_square_centimeter != None:
-            return self.__watts_per_square_centimeter
-        self.__watts_per_square_centimeter = self.__convert_from_base(IrradianceUnits.WattPerSquareCentimeter)
-        return self.__watts_per_square_centimeter
+        return self._cached_convert(IrradianceUnits.WattPerSquareCentimeter)
 
     
     @property
@@ -463,10 +731,7 @@ class Irradiance(AbstractMeasure):
         """
         
         """
-        if self.__picowatts_per_square_meter != None:
-            return self.__picowatts_per_square_meter
-        self.__picowatts_per_square_meter = self.__convert_from_base(IrradianceUnits.PicowattPerSquareMeter)
-        return self.__picowatts_per_square_meter
+        return self._cached_convert(IrradianceUnits.PicowattPerSquareMeter)
 
     
     @property
@@ -474,10 +739,7 @@ class Irradiance(AbstractMeasure):
         """
         
         """
-        if self.__nanowatts_per_square_meter != None:
-            return self.__nanowatts_per_square_meter
-        self.__nanowatts_per_square_meter = self.__convert_from_base(IrradianceUnits.NanowattPerSquareMeter)
-        return self.__nanowatts_per_square_meter
+        return self._cached_convert(IrradianceUnits.NanowattPerSquareMeter)
 
     
     @property
@@ -485,10 +747,7 @@ class Irradiance(AbstractMeasure):
         """
         
         """
-        if self.__microwatts_per_square_meter != None:
-            return self.__microwatts_per_square_meter
-        self.__microwatts_per_square_meter = self.__convert_from_base(IrradianceUnits.MicrowattPerSquareMeter)
-        return self.__microwatts_per_square_meter
+        return self._cached_convert(IrradianceUnits.MicrowattPerSquareMeter)
 
     
     @property
@@ -496,10 +755,7 @@ class Irradiance(AbstractMeasure):
         """
         
         """
-        if self.__milliwatts_per_square_meter != None:
-            return self.__milliwatts_per_square_meter
-        self.__milliwatts_per_square_meter = self.__convert_from_base(IrradianceUnits.MilliwattPerSquareMeter)
-        return self.__milliwatts_per_square_meter
+        return self._cached_convert(IrradianceUnits.MilliwattPerSquareMeter)
 
     
     @property
@@ -507,10 +763,7 @@ class Irradiance(AbstractMeasure):
         """
         
         """
-        if self.__kilowatts_per_square_meter != None:
-            return self.__kilowatts_per_square_meter
-        self.__kilowatts_per_square_meter = self.__convert_from_base(IrradianceUnits.KilowattPerSquareMeter)
-        return self.__kilowatts_per_square_meter
+        return self._cached_convert(IrradianceUnits.KilowattPerSquareMeter)
 
     
     @property
@@ -518,10 +771,7 @@ class Irradiance(AbstractMeasure):
         """
         
         """
-        if self.__megawatts_per_square_meter != None:
-            return self.__megawatts_per_square_meter
-        self.__megawatts_per_square_meter = self.__convert_from_base(IrradianceUnits.MegawattPerSquareMeter)
-        return self.__megawatts_per_square_meter
+        return self._cached_convert(IrradianceUnits.MegawattPerSquareMeter)
 
     
     @property
@@ -529,10 +779,7 @@ class Irradiance(AbstractMeasure):
         """
         
         """
-        if self.__picowatts_per_square_centimeter != None:
-            return self.__picowatts_per_square_centimeter
-        self.__picowatts_per_square_centimeter = self.__convert_from_base(IrradianceUnits.PicowattPerSquareCentimeter)
-        return self.__picowatts_per_square_centimeter
+        return self._cached_convert(IrradianceUnits.PicowattPerSquareCentimeter)
 
     
     @property
@@ -540,10 +787,7 @@ class Irradiance(AbstractMeasure):
         """
         
         """
-        if self.__nanowatts_per_square_centimeter != None:
-            return self.__nanowatts_per_square_centimeter
-        self.__nanowatts_per_square_centimeter = self.__convert_from_base(IrradianceUnits.NanowattPerSquareCentimeter)
-        return self.__nanowatts_per_square_centimeter
+        return self._cached_convert(IrradianceUnits.NanowattPerSquareCentimeter)
 
     
     @property
@@ -551,10 +795,7 @@ class Irradiance(AbstractMeasure):
         """
         
         """
-        if self.__microwatts_per_square_centimeter != None:
-            return self.__microwatts_per_square_centimeter
-        self.__microwatts_per_square_centimeter = self.__convert_from_base(IrradianceUnits.MicrowattPerSquareCentimeter)
-        return self.__microwatts_per_square_centimeter
+        return self._cached_convert(IrradianceUnits.MicrowattPerSquareCentimeter)
 
     
     @property
@@ -562,10 +803,7 @@ class Irradiance(AbstractMeasure):
         """
         
         """
-        if self.__milliwatts_per_square_centimeter != None:
-            return self.__milliwatts_per_square_centimeter
-        self.__milliwatts_per_square_centimeter = self.__convert_from_base(IrradianceUnits.MilliwattPerSquareCentimeter)
-        return self.__milliwatts_per_square_centimeter
+        return self._cached_convert(IrradianceUnits.MilliwattPerSquareCentimeter)
 
     
     @property
@@ -573,10 +811,7 @@ class Irradiance(AbstractMeasure):
         """
         
         """
-        if self.__kilowatts_per_square_centimeter != None:
-            return self.__kilowatts_per_square_centimeter
-        self.__kilowatts_per_square_centimeter = self.__convert_from_base(IrradianceUnits.KilowattPerSquareCentimeter)
-        return self.__kilowatts_per_square_centimeter
+        return self._cached_convert(IrradianceUnits.KilowattPerSquareCentimeter)
 
     
     @property
@@ -584,10 +819,7 @@ class Irradiance(AbstractMeasure):
         """
         
         """
-        if self.__megawatts_per_square_centimeter != None:
-            return self.__megawatts_per_square_centimeter
-        self.__megawatts_per_square_centimeter = self.__convert_from_base(IrradianceUnits.MegawattPerSquareCentimeter)
-        return self.__megawatts_per_square_centimeter
+        return self._cached_convert(IrradianceUnits.MegawattPerSquareCentimeter)
 
     
     def to_string(self, unit: IrradianceUnits = IrradianceUnits.WattPerSquareMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class IrradiationUnits(Enum):
         """
             IrradiationUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         JoulePerSquareMeter = 'joule_per_square_meter'
         """
@@ -54,81 +65,316 @@ class Irradiation(AbstractMeasure):
         value (float): The value.
         from_unit (IrradiationUnits): The Irradiation unit to create from, The default unit is JoulePerSquareMeter
     """
-    def __init__(self, value: float, from_unit: IrradiationUnits = IrradiationUnits.JoulePerSquareMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = IrradiationUnits
+
+    _base_unit = IrradiationUnits.JoulePerSquareMeter
+
+    _dimensions = (0, 1, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 49
+
+    _binary_unit_ids = {
         
-        self.__joules_per_square_meter = None
+        IrradiationUnits.JoulePerSquareMeter: 0,
         
-        self.__joules_per_square_centimeter = None
+        IrradiationUnits.JoulePerSquareCentimeter: 1,
         
-        self.__joules_per_square_millimeter = None
+        IrradiationUnits.JoulePerSquareMillimeter: 2,
         
-        self.__watt_hours_per_square_meter = None
+        IrradiationUnits.WattHourPerSquareMeter: 3,
         
-        self.__kilojoules_per_square_meter = None
+        IrradiationUnits.KilojoulePerSquareMeter: 4,
         
-        self.__millijoules_per_square_centimeter = None
+        IrradiationUnits.MillijoulePerSquareCentimeter: 5,
         
-        self.__kilowatt_hours_per_square_meter = None
+        IrradiationUnits.KilowattHourPerSquareMeter: 6,
         
+    }
 
-    def convert(self, unit: IrradiationUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        IrradiationUnits.JoulePerSquareMeter: lambda value: (value),
+        
+        IrradiationUnits.JoulePerSquareCentimeter: lambda value: (value / 1e4),
+        
+        IrradiationUnits.JoulePerSquareMillimeter: lambda value: (value / 1e6),
+        
+        IrradiationUnits.WattHourPerSquareMeter: lambda value: (value / 3600),
+        
+        IrradiationUnits.KilojoulePerSquareMeter: lambda value: ((value) / 1000.0),
+        
+        IrradiationUnits.MillijoulePerSquareCentimeter: lambda value: ((value / 1e4) / 0.001),
+        
+        IrradiationUnits.KilowattHourPerSquareMeter: lambda value: ((value / 3600) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: IrradiationUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == IrradiationUnits.JoulePerSquareMeter:
-            return (value)
+        IrradiationUnits.JoulePerSquareMeter: lambda value: (value),
         
-        if from_unit == IrradiationUnits.JoulePerSquareCentimeter:
-            return (value / 1e4)
+        IrradiationUnits.JoulePerSquareCentimeter: lambda value: (value * 1e4),
         
-        if from_unit == IrradiationUnits.JoulePerSquareMillimeter:
-            return (value / 1e6)
+        IrradiationUnits.JoulePerSquareMillimeter: lambda value: (value * 1e6),
         
-        if from_unit == IrradiationUnits.WattHourPerSquareMeter:
-            return (value / 3600)
+        IrradiationUnits.WattHourPerSquareMeter: lambda value: (value * 3600),
         
-        if from_unit == IrradiationUnits.KilojoulePerSquareMeter:
-            return ((value) / 1000.0)
+        IrradiationUnits.KilojoulePerSquareMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == IrradiationUnits.MillijoulePerSquareCentimeter:
-            return ((value / 1e4) / 0.001)
+        IrradiationUnits.MillijoulePerSquareCentimeter: lambda value: ((value * 1e4) * 0.001),
         
-        if from_unit == IrradiationUnits.KilowattHourPerSquareMeter:
-            return ((value / 3600) / 1000.0)
+        IrradiationUnits.KilowattHourPerSquareMeter: lambda value: ((value * 3600) * 1000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        IrradiationUnits.JoulePerSquareMeter: ('1', '0'),
+        
+        IrradiationUnits.JoulePerSquareCentimeter: ('1/10000', '0'),
+        
+        IrradiationUnits.JoulePerSquareMillimeter: ('1/1000000', '0'),
+        
+        IrradiationUnits.WattHourPerSquareMeter: ('1/3600', '0'),
+        
+        IrradiationUnits.KilojoulePerSquareMeter: ('1/1000', '0'),
+        
+        IrradiationUnits.MillijoulePerSquareCentimeter: ('1/10', '0'),
+        
+        IrradiationUnits.KilowattHourPerSquareMeter: ('1/3600000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: IrradiationUnits) -> float:
+    _affine_to_base = {
+        
+        IrradiationUnits.JoulePerSquareMeter: ('1', '0'),
+        
+        IrradiationUnits.JoulePerSquareCentimeter: ('10000', '0'),
+        
+        IrradiationUnits.JoulePerSquareMillimeter: ('1000000', '0'),
+        
+        IrradiationUnits.WattHourPerSquareMeter: ('3600', '0'),
+        
+        IrradiationUnits.KilojoulePerSquareMeter: ('1000', '0'),
+        
+        IrradiationUnits.MillijoulePerSquareCentimeter: ('10', '0'),
         
-        if to_unit == IrradiationUnits.JoulePerSquareMeter:
-            return (value)
+        IrradiationUnits.KilowattHourPerSquareMeter: ('3600000', '0'),
         
-        if to_unit == IrradiationUnits.JoulePerSquareCentimeter:
-            return (value * 1e4)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        IrradiationUnits.JoulePerSquareMeter: ('J/m²',),
         
-        if to_unit == IrradiationUnits.JoulePerSquareMillimeter:
-            return (value * 1e6)
+        IrradiationUnits.JoulePerSquareCentimeter: ('J/cm²',),
         
-        if to_unit == IrradiationUnits.WattHourPerSquareMeter:
-            return (value * 3600)
+        IrradiationUnits.JoulePerSquareMillimeter: ('J/mm²',),
         
-        if to_unit == IrradiationUnits.KilojoulePerSquareMeter:
-            return ((value) * 1000.0)
+        IrradiationUnits.WattHourPerSquareMeter: ('Wh/m²',),
         
-        if to_unit == IrradiationUnits.MillijoulePerSquareCentimeter:
-            return ((value * 1e4) * 0.001)
+        IrradiationUnits.KilojoulePerSquareMeter: ('kJ/m²',),
         
-        if to_unit == IrradiationUnits.KilowattHourPerSquareMeter:
-            return ((value * 3600) * 1000.0)
+        IrradiationUnits.MillijoulePerSquareCentimeter: ('mJ/cm²',),
         
-        return None
+        IrradiationUnits.KilowattHourPerSquareMeter: ('kWh/m²',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: IrradiationUnits = IrradiationUnits.JoulePerSquareMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: IrradiationUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: IrradiationUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: IrradiationUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: IrradiationUnits, to_unit: IrradiationUnits) -> float:
+        """
+        Convert a value from one Irradiation unit to another, without creating a Irradiation instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: IrradiationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: IrradiationUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Irradiation._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: IrradiationUnits, to_unit: IrradiationUnits) -> List[float]:
+        """
+        Convert many values from one Irradiation unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: IrradiationUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: IrradiationUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Irradiation._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: IrradiationUnits, to_unit: IrradiationUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Irradiation._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: IrradiationUnits, to_unit: IrradiationUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Irradiation unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: IrradiationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: IrradiationUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Irradiation._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: IrradiationUnits = IrradiationUnits.JoulePerSquareMeter) -> Irradiation:
+        """
+        Create a new instance of Irradiation holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
 
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: IrradiationUnits
+        :return: A new instance of Irradiation.
+        :rtype: Irradiation
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Irradiation._from_exact(value, from_unit)
+
+    def to_exact(self, unit: IrradiationUnits = IrradiationUnits.JoulePerSquareMeter) -> Fraction:
+        """
+        Get the exact value of the Irradiation in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (JoulePerSquareMeter).
+        :type unit: IrradiationUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Irradiation:
+        """
+        Parse a Irradiation from a value followed by a unit abbreviation, e.g. "1 J/m²".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Irradiation.
+        :rtype: Irradiation
+        :raises ValueError: When the string is not a valid or an ambiguous Irradiation.
+        """
+        return Irradiation._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Irradiation]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Irradiation._try_parse(text)
+
+    def to_binary(self, unit: Optional[IrradiationUnits] = None) -> bytes:
+        """
+        Encode the Irradiation to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: IrradiationUnits
+        :return: The encoded Irradiation.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Irradiation:
+        """
+        Decode a Irradiation encoded by to_binary.
+
+        :param data: The encoded Irradiation, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Irradiation.
+        :rtype: Irradiation
+        :raises ValueError: When the data is not a valid encoded Irradiation.
+        """
+        return Irradiation._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[IrradiationUnits] = None) -> dict:
+        """
+        Get the Irradiation DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (JoulePerSquareMeter).
+        :type hold_in_unit: IrradiationUnits
+        :return: The Irradiation DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[IrradiationUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Irradiation:
+        """
+        Create a new instance of Irradiation from its DTO.
+
+        :param dto: The Irradiation DTO, the unit is the IrradiationUnits value or name.
+        :type dto: dict
+        :return: A new instance of Irradiation.
+        :rtype: Irradiation
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Irradiation._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Irradiation:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Irradiation._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -245,10 +491,7 @@ class Irradiation(AbstractMeasure):
         """
         
         """
-        if self.__joules_per_square_meter != None:
-            return self.__joules_per_square_meter
-        self.__joules_per_square_meter = self.__convert_from_base(IrradiationUnits.JoulePerSquareMeter)
-        return self.__joules_per_square_meter
+        return self._cached_convert(IrradiationUnits.JoulePerSquareMeter)
 
     
     @property
@@ -256,10 +499,7 @@ class Irradiation(AbstractMeasure):
         """
         
         """
-        if self.__joules_per_square_centimeter != None:
-            return self.__joules_per_square_centimeter
-        self.__joules_per_square_centimeter = self.__convert_from_base(IrradiationUnits.JoulePerSquareCentimeter)
-        return self.__joules_per_square_centimeter
+        return self._cached_convert(IrradiationUnits.JoulePerSquareCentimeter)
 
     
     @property
@@ -267,10 +507,7 @@ class Irradiation(AbstractMeasure):
         """
         
         """
-        if self.__joules_per_square_millimeter != None:
-            return self.__joules_per_square_millimeter
-        self.__joules_per_square_millimeter = self.__convert_from_base(IrradiationUnits.JoulePerSquareMillimeter)
-        return self.__joules_per_square_millimeter
+        return self._cached_convert(IrradiationUnits.JoulePerSquareMillimeter)
 
     
     @property
@@ -278,10 +515,7 @@ class Irradiation(AbstractMeasure):
         """
         
         """
-        if self.__watt_hours_per_square_meter != None:
-            return self.__watt_hours_per_square_meter
-        self.__watt_hours_per_square_meter = self.__convert_from_base(IrradiationUnits.WattHourPerSquareMeter)
-        return self.__watt_hours_per_square_meter
+        return self._cached_convert(IrradiationUnits.WattHourPerSquareMeter)
 
     
     @property
@@ -289,10 +523,7 @@ class Irradiation(AbstractMeasure):
         """
         
         """
-        if self.__kilojoules_per_square_meter != None:
-            return self.__kilojoules_per_square_meter
-        self.__kilojoules_per_square_meter = self.__convert_from_base(IrradiationUnits.KilojoulePerSquareMeter)
-        return self.__kilojoules_per_square_meter
+        return self._cached_convert(IrradiationUnits.KilojoulePerSquareMeter)
 
     
     @property
@@ -300,10 +531,7 @@ class Irradiation(AbstractMeasure):
         """
         
         """
-        if self.__millijoules_per_square_centimeter != None:
-            return self.__millijoules_per_square_centimeter
-        self.__millijoules_per_square_centimeter = self.__convert_from_base(IrradiationUnits.MillijoulePerSquareCentimeter)
-        return self.__millijoules_per_square_centimeter
+        return self._cached_convert(IrradiationUnits.MillijoulePerSquareCentimeter)
 
     
     @property
@@ -311,10 +539,7 @@ class Irradiation(AbstractMeasure):
         """
         
         """
-        if self.__kilowatt_hours_per_square_meter != None:
-            return self.__kilowatt_hours_per_square_meter
-        self.__kilowatt_hours_per_square_meter = self.__convert_from_base(IrradiationUnits.KilowattHourPerSquareMeter)
-        return self.__kilowatt_hours_per_square_meter
+        return self._cached_convert(IrradiationUnits.KilowattHourPerSquareMeter)
 
     
     def to_string(self, unit: IrradiationUnits = IrradiationUnits.JoulePerSquareMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class JerkUnits(Enum):
         """
             JerkUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         MeterPerSecondCubed = 'meter_per_second_cubed'
         """
@@ -74,113 +85,364 @@ class Jerk(AbstractMeasure):
         value (float): The value.
         from_unit (JerkUnits): The Jerk unit to create from, The default unit is MeterPerSecondCubed
     """
-    def __init__(self, value: float, from_unit: JerkUnits = JerkUnits.MeterPerSecondCubed):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = JerkUnits
+
+    _base_unit = JerkUnits.MeterPerSecondCubed
+
+    _dimensions = (1, 0, -3, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 50
+
+    _binary_unit_ids = {
         
-        self.__meters_per_second_cubed = None
+        JerkUnits.MeterPerSecondCubed: 0,
         
-        self.__inches_per_second_cubed = None
+        JerkUnits.InchPerSecondCubed: 1,
         
-        self.__feet_per_second_cubed = None
+        JerkUnits.FootPerSecondCubed: 2,
         
-        self.__standard_gravities_per_second = None
+        JerkUnits.StandardGravitiesPerSecond: 3,
         
-        self.__nanometers_per_second_cubed = None
+        JerkUnits.NanometerPerSecondCubed: 4,
         
-        self.__micrometers_per_second_cubed = None
+        JerkUnits.MicrometerPerSecondCubed: 5,
         
-        self.__millimeters_per_second_cubed = None
+        JerkUnits.MillimeterPerSecondCubed: 6,
         
-        self.__centimeters_per_second_cubed = None
+        JerkUnits.CentimeterPerSecondCubed: 7,
         
-        self.__decimeters_per_second_cubed = None
+        JerkUnits.DecimeterPerSecondCubed: 8,
         
-        self.__kilometers_per_second_cubed = None
+        JerkUnits.KilometerPerSecondCubed: 9,
         
-        self.__millistandard_gravities_per_second = None
+        JerkUnits.MillistandardGravitiesPerSecond: 10,
         
+    }
 
-    def convert(self, unit: JerkUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        JerkUnits.MeterPerSecondCubed: lambda value: (value),
+        
+        JerkUnits.InchPerSecondCubed: lambda value: (value / 0.0254),
+        
+        JerkUnits.FootPerSecondCubed: lambda value: (value / 0.304800),
+        
+        JerkUnits.StandardGravitiesPerSecond: lambda value: (value / 9.80665),
+        
+        JerkUnits.NanometerPerSecondCubed: lambda value: ((value) / 1e-09),
+        
+        JerkUnits.MicrometerPerSecondCubed: lambda value: ((value) / 1e-06),
+        
+        JerkUnits.MillimeterPerSecondCubed: lambda value: ((value) / 0.001),
+        
+        JerkUnits.CentimeterPerSecondCubed: lambda value: ((value) / 0.01),
+        
+        JerkUnits.DecimeterPerSecondCubed: lambda value: ((value) / 0.1),
+        
+        JerkUnits.KilometerPerSecondCubed: lambda value: ((value) / 1000.0),
+        
+        JerkUnits.MillistandardGravitiesPerSecond: lambda value: ((value / 9.80665) / 0.001),
+        
+    }
 
-    def __convert_from_base(self, from_unit: JerkUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == JerkUnits.MeterPerSecondCubed:
-            return (value)
+        JerkUnits.MeterPerSecondCubed: lambda value: (value),
         
-        if from_unit == JerkUnits.InchPerSecondCubed:
-            return (value / 0.0254)
+        JerkUnits.InchPerSecondCubed: lambda value: (value * 0.0254),
         
-        if from_unit == JerkUnits.FootPerSecondCubed:
-            return (value / 0.304800)
+        JerkUnits.FootPerSecondCubed: lambda value: (value * 0.304800),
         
-        if from_unit == JerkUnits.StandardGravitiesPerSecond:
-            return (value / 9.80665)
+        JerkUnits.StandardGravitiesPerSecond: lambda value: (value * 9.80665),
         
-        if from_unit == JerkUnits.NanometerPerSecondCubed:
-            return ((value) / 1e-09)
+        JerkUnits.NanometerPerSecondCubed: lambda value: ((value) * 1e-09),
         
-        if from_unit == JerkUnits.MicrometerPerSecondCubed:
-            return ((value) / 1e-06)
+        JerkUnits.MicrometerPerSecondCubed: lambda value: ((value) * 1e-06),
         
-        if from_unit == JerkUnits.MillimeterPerSecondCubed:
-            return ((value) / 0.001)
+        JerkUnits.MillimeterPerSecondCubed: lambda value: ((value) * 0.001),
         
-        if from_unit == JerkUnits.CentimeterPerSecondCubed:
-            return ((value) / 0.01)
+        JerkUnits.CentimeterPerSecondCubed: lambda value: ((value) * 0.01),
         
-        if from_unit == JerkUnits.DecimeterPerSecondCubed:
-            return ((value) / 0.1)
+        JerkUnits.DecimeterPerSecondCubed: lambda value: ((value) * 0.1),
         
-        if from_unit == JerkUnits.KilometerPerSecondCubed:
-            return ((value) / 1000.0)
+        JerkUnits.KilometerPerSecondCubed: lambda value: ((value) * 1000.0),
         
-        if from_unit == JerkUnits.MillistandardGravitiesPerSecond:
-            return ((value / 9.80665) / 0.001)
+        JerkUnits.MillistandardGravitiesPerSecond: lambda value: ((value * 9.80665) * 0.001),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        JerkUnits.MeterPerSecondCubed: ('1', '0'),
+        
+        JerkUnits.InchPerSecondCubed: ('5000/127', '0'),
+        
+        JerkUnits.FootPerSecondCubed: ('1250/381', '0'),
+        
+        JerkUnits.StandardGravitiesPerSecond: ('20000/196133', '0'),
+        
+        JerkUnits.NanometerPerSecondCubed: ('1000000000', '0'),
+        
+        JerkUnits.MicrometerPerSecondCubed: ('1000000', '0'),
+        
+        JerkUnits.MillimeterPerSecondCubed: ('1000', '0'),
+        
+        JerkUnits.CentimeterPerSecondCubed: ('100', '0'),
+        
+        JerkUnits.DecimeterPerSecondCubed: ('10', '0'),
+        
+        JerkUnits.KilometerPerSecondCubed: ('1/1000', '0'),
+        
+        JerkUnits.MillistandardGravitiesPerSecond: ('20000000/196133', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: JerkUnits) -> float:
+    _affine_to_base = {
+        
+        JerkUnits.MeterPerSecondCubed: ('1', '0'),
+        
+        JerkUnits.InchPerSecondCubed: ('127/5000', '0'),
+        
+        JerkUnits.FootPerSecondCubed: ('381/1250', '0'),
+        
+        JerkUnits.StandardGravitiesPerSecond: ('196133/20000', '0'),
+        
+        JerkUnits.NanometerPerSecondCubed: ('1/1000000000', '0'),
+        
+        JerkUnits.MicrometerPerSecondCubed: ('1/1000000', '0'),
+        
+        JerkUnits.MillimeterPerSecondCubed: ('1/1000', '0'),
+        
+        JerkUnits.CentimeterPerSecondCubed: ('1/100', '0'),
+        
+        JerkUnits.DecimeterPerSecondCubed: ('1/10', '0'),
+        
+        JerkUnits.KilometerPerSecondCubed: ('1000', '0'),
         
-        if to_unit == JerkUnits.MeterPerSecondCubed:
-            return (value)
+        JerkUnits.MillistandardGravitiesPerSecond: ('196133/20000000', '0'),
         
-        if to_unit == JerkUnits.InchPerSecondCubed:
-            return (value * 0.0254)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        JerkUnits.MeterPerSecondCubed: ('m/s³',),
+        
+        JerkUnits.InchPerSecondCubed: ('in/s³',),
         
-        if to_unit == JerkUnits.FootPerSecondCubed:
-            return (value * 0.304800)
+        JerkUnits.FootPerSecondCubed: ('ft/s³',),
         
-        if to_unit == JerkUnits.StandardGravitiesPerSecond:
-            return (value * 9.80665)
+        JerkUnits.StandardGravitiesPerSecond: ('g/s',),
         
-        if to_unit == JerkUnits.NanometerPerSecondCubed:
-            return ((value) * 1e-09)
+        JerkUnits.NanometerPerSecondCubed: ('nm/s³',),
         
-        if to_unit == JerkUnits.MicrometerPerSecondCubed:
-            return ((value) * 1e-06)
+        JerkUnits.MicrometerPerSecondCubed: ('μm/s³',),
         
-        if to_unit == JerkUnits.MillimeterPerSecondCubed:
-            return ((value) * 0.001)
+        JerkUnits.MillimeterPerSecondCubed: ('mm/s³',),
         
-        if to_unit == JerkUnits.CentimeterPerSecondCubed:
-            return ((value) * 0.01)
+        JerkUnits.CentimeterPerSecondCubed: ('cm/s³',),
         
-        if to_unit == JerkUnits.DecimeterPerSecondCubed:
-            return ((value) * 0.1)
+        JerkUnits.DecimeterPerSecondCubed: ('dm/s³',),
         
-        if to_unit == JerkUnits.KilometerPerSecondCubed:
-            return ((value) * 1000.0)
+        JerkUnits.KilometerPerSecondCubed: ('km/s³',),
         
-        if to_unit == JerkUnits.MillistandardGravitiesPerSecond:
-            return ((value * 9.80665) * 0.001)
+        JerkUnits.MillistandardGravitiesPerSecond: ('mg/s',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: JerkUnits = JerkUnits.MeterPerSecondCubed):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: JerkUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: JerkUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: JerkUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
 
+    @staticmethod
+    def convert_value(value: float, from_unit: JerkUnits, to_unit: JerkUnits) -> float:
+        """
+        Convert a value from one Jerk unit to another, without creating a Jerk instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: JerkUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: JerkUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Jerk._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: JerkUnits, to_unit: JerkUnits) -> List[float]:
+        """
+        Convert many values from one Jerk unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: JerkUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: JerkUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Jerk._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: JerkUnits, to_unit: JerkUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Jerk._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: JerkUnits, to_unit: JerkUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Jerk unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: JerkUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: JerkUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Jerk._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: JerkUnits = JerkUnits.MeterPerSecondCubed) -> Jerk:
+        """
+        Create a new instance of Jerk holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: JerkUnits
+        :return: A new instance of Jerk.
+        :rtype: Jerk
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Jerk._from_exact(value, from_unit)
+
+    def to_exact(self, unit: JerkUnits = JerkUnits.MeterPerSecondCubed) -> Fraction:
+        """
+        Get the exact value of the Jerk in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (MeterPerSecondCubed).
+        :type unit: JerkUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Jerk:
+        """
+        Parse a Jerk from a value followed by a unit abbreviation, e.g. "1 m/s³".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Jerk.
+        :rtype: Jerk
+        :raises ValueError: When the string is not a valid or an ambiguous Jerk.
+        """
+        return Jerk._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Jerk]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Jerk._try_parse(text)
+
+    def to_binary(self, unit: Optional[JerkUnits] = None) -> bytes:
+        """
+        Encode the Jerk to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: JerkUnits
+        :return: The encoded Jerk.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Jerk:
+        """
+        Decode a Jerk encoded by to_binary.
+
+        :param data: The encoded Jerk, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Jerk.
+        :rtype: Jerk
+        :raises ValueError: When the data is not a valid encoded Jerk.
+        """
+        return Jerk._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[JerkUnits] = None) -> dict:
+        """
+        Get the Jerk DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (MeterPerSecondCubed).
+        :type hold_in_unit: JerkUnits
+        :return: The Jerk DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[JerkUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Jerk:
+        """
+        Create a new instance of Jerk from its DTO.
+
+        :param dto: The Jerk DTO, the unit is the JerkUnits value or name.
+        :type dto: dict
+        :return: A new instance of Jerk.
+        :rtype: Jerk
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Jerk._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Jerk:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Jerk._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -357,10 +619,7 @@ class Jerk(AbstractMeasure):
         """
         
         """
-        if self.__meters_per_second_cubed != None:
-            return self.__meters_per_second_cubed
-        self.__meters_per_second_cubed = self.__convert_from_base(JerkUnits.MeterPerSecondCubed)
-        return self.__meters_per_second_cubed
+        return self._cached_convert(JerkUnits.MeterPerSecondCubed)
 
     
     @property
@@ -368,10 +627,7 @@ class Jerk(AbstractMeasure):
         """
         
         """
-        if self.__inches_per_second_cubed != None:
-            return self.__inches_per_second_cubed
-        self.__inches_per_second_cubed = self.__convert_from_base(JerkUnits.InchPerSecondCubed)
-        return self.__inches_per_second_cubed
+        return self._cached_convert(JerkUnits.InchPerSecondCubed)
 
     
     @property
@@ -379,10 +635,7 @@ class Jerk(AbstractMeasure):
         """
         
         """
-        if self.__feet_per_second_cubed != None:
-            return self.__feet_per_second_cubed
-        self.__feet_per_second_cubed = self.__convert_from_base(JerkUnits.FootPerSecondCubed)
-        return self.__feet_per_second_cubed
+        return self._cached_convert(JerkUnits.FootPerSecondCubed)
 
     
     @property
@@ -390,10 +643,7 @@ class Jerk(AbstractMeasure):
         """
         
         """
-        if self.__standard_gravities_per_second != None:
-            return self.__standard_gravities_per_second
-        self.__standard_gravities_per_second = self.__convert_from_base(JerkUnits.StandardGravitiesPerSecond)
-        return self.__standard_gravities_per_second
+        return self._cached_convert(JerkUnits.StandardGravitiesPerSecond)
 
     
     @property
@@ -401,10 +651,7 @@ class Jerk(AbstractMeasure):
         """
         
         """
-        if self.__nanometers_per_second_cubed != None:
-            return self.__nanometers_per_second_cubed
-        self.__nanometers_per_second_cubed = self.__convert_from_base(JerkUnits.NanometerPerSecondCubed)
-        return self.__nanometers_per_second_cubed
+        return self._cached_convert(JerkUnits.NanometerPerSecondCubed)
 
     
     @property
@@ -412,10 +659,7 @@ class Jerk(AbstractMeasure):
         """
         
         """
-        if self.__micrometers_per_second_cubed != None:
-            return self.__micrometers_per_second_cubed
-        self.__micrometers_per_second_cubed = self.__convert_from_base(JerkUnits.MicrometerPerSecondCubed)
-        return self.__micrometers_per_second_cubed
+        return self._cached_convert(JerkUnits.MicrometerPerSecondCubed)
 
     
     @property
@@ -423,10 +667,7 @@ class Jerk(AbstractMeasure):
         """
         
         """
-        if self.__millimeters_per_second_cubed != None:
-            return self.__millimeters_per_second_cubed
-        self.__millimeters_per_second_cubed = self.__convert_from_base(JerkUnits.MillimeterPerSecondCubed)
-        return self.__millimeters_per_second_cubed
+        return self._cached_convert(JerkUnits.MillimeterPerSecondCubed)
 
     
     @property
@@ -434,10 +675,7 @@ class Jerk(AbstractMeasure):
         """
         
         """
-        if self.__centimeters_per_second_cubed != None:
-            return self.__centimeters_per_second_cubed
-        self.__centimeters_per_second_cubed = self.__convert_from_base(JerkUnits.CentimeterPerSecondCubed)
-        return self.__centimeters_per_second_cubed
+        return self._cached_convert(JerkUnits.CentimeterPerSecondCubed)
 
     
     @property
@@ -445,10 +683,7 @@ class Jerk(AbstractMeasure):
         """
         
         """
-        if self.__decimeters_per_second_cubed != None:
-            return self.__decimeters_per_second_cubed
-        self.__decimeters_per_second_cubed = self.__convert_from_base(JerkUnits.DecimeterPerSecondCubed)
-        return self.__decimeters_per_second_cubed
+        return self._cached_convert(JerkUnits.DecimeterPerSecondCubed)
 
     
     @property
@@ -456,10 +691,7 @@ class Jerk(AbstractMeasure):
         """
         
         """
-        if self.__kilometers_per_second_cubed != None:
-            return self.__kilometers_per_second_cubed
-        self.__kilometers_per_second_cubed = self.__convert_from_base(JerkUnits.KilometerPerSecondCubed)
-        return self.__kilometers_per_second_cubed
+        return self._cached_convert(JerkUnits.KilometerPerSecondCubed)
 
     
     @property
@@ -467,10 +699,7 @@ class Jerk(AbstractMeasure):
         """
         
         """
-        if self.__millistandard_gravities_per_second != None:
-            return self.__millistandard_gravities_per_second
-        self.__millistandard_gravities_per_second = self.__convert_from_base(JerkUnits.MillistandardGravitiesPerSecond)
-        return self.__millistandard_gravities_per_second
+        return self._cached_convert(JerkUnits.MillistandardGravitiesPerSecond)
 
     
     def to_string(self, unit: JerkUnits = JerkUnits.MeterPerSecondCubed) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class KinematicViscosityUnits(Enum):
         """
             KinematicViscosityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         SquareMeterPerSecond = 'square_meter_per_second'
         """
@@ -64,97 +75,340 @@ class KinematicViscosity(AbstractMeasure):
         value (float): The value.
         from_unit (KinematicViscosityUnits): The KinematicViscosity unit to create from, The default unit is SquareMeterPerSecond
     """
-    def __init__(self, value: float, from_unit: KinematicViscosityUnits = KinematicViscosityUnits.SquareMeterPerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = KinematicViscosityUnits
+
+    _base_unit = KinematicViscosityUnits.SquareMeterPerSecond
+
+    _dimensions = (2, 0, -1, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 51
+
+    _binary_unit_ids = {
         
-        self.__square_meters_per_second = None
+        KinematicViscosityUnits.SquareMeterPerSecond: 0,
         
-        self.__stokes = None
+        KinematicViscosityUnits.Stokes: 1,
         
-        self.__square_feet_per_second = None
+        KinematicViscosityUnits.SquareFootPerSecond: 2,
         
-        self.__nanostokes = None
+        KinematicViscosityUnits.Nanostokes: 3,
         
-        self.__microstokes = None
+        KinematicViscosityUnits.Microstokes: 4,
         
-        self.__millistokes = None
+        KinematicViscosityUnits.Millistokes: 5,
         
-        self.__centistokes = None
+        KinematicViscosityUnits.Centistokes: 6,
         
-        self.__decistokes = None
+        KinematicViscosityUnits.Decistokes: 7,
         
-        self.__kilostokes = None
+        KinematicViscosityUnits.Kilostokes: 8,
         
+    }
 
-    def convert(self, unit: KinematicViscosityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        KinematicViscosityUnits.SquareMeterPerSecond: lambda value: (value),
+        
+        KinematicViscosityUnits.Stokes: lambda value: (value * 1e4),
+        
+        KinematicViscosityUnits.SquareFootPerSecond: lambda value: (value * 10.7639),
+        
+        KinematicViscosityUnits.Nanostokes: lambda value: ((value * 1e4) / 1e-09),
+        
+        KinematicViscosityUnits.Microstokes: lambda value: ((value * 1e4) / 1e-06),
+        
+        KinematicViscosityUnits.Millistokes: lambda value: ((value * 1e4) / 0.001),
+        
+        KinematicViscosityUnits.Centistokes: lambda value: ((value * 1e4) / 0.01),
+        
+        KinematicViscosityUnits.Decistokes: lambda value: ((value * 1e4) / 0.1),
+        
+        KinematicViscosityUnits.Kilostokes: lambda value: ((value * 1e4) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: KinematicViscosityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        KinematicViscosityUnits.SquareMeterPerSecond: lambda value: (value),
+        
+        KinematicViscosityUnits.Stokes: lambda value: (value / 1e4),
+        
+        KinematicViscosityUnits.SquareFootPerSecond: lambda value: (value / 10.7639),
+        
+        KinematicViscosityUnits.Nanostokes: lambda value: ((value / 1e4) * 1e-09),
+        
+        KinematicViscosityUnits.Microstokes: lambda value: ((value / 1e4) * 1e-06),
+        
+        KinematicViscosityUnits.Millistokes: lambda value: ((value / 1e4) * 0.001),
         
-        if from_unit == KinematicViscosityUnits.SquareMeterPerSecond:
-            return (value)
+        KinematicViscosityUnits.Centistokes: lambda value: ((value / 1e4) * 0.01),
         
-        if from_unit == KinematicViscosityUnits.Stokes:
-            return (value * 1e4)
+        KinematicViscosityUnits.Decistokes: lambda value: ((value / 1e4) * 0.1),
         
-        if from_unit == KinematicViscosityUnits.SquareFootPerSecond:
-            return (value * 10.7639)
+        KinematicViscosityUnits.Kilostokes: lambda value: ((value / 1e4) * 1000.0),
         
-        if from_unit == KinematicViscosityUnits.Nanostokes:
-            return ((value * 1e4) / 1e-09)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        KinematicViscosityUnits.SquareMeterPerSecond: ('1', '0'),
+        
+        KinematicViscosityUnits.Stokes: ('10000', '0'),
+        
+        KinematicViscosityUnits.SquareFootPerSecond: ('107639/10000', '0'),
+        
+        KinematicViscosityUnits.Nanostokes: ('10000000000000', '0'),
         
-        if from_unit == KinematicViscosityUnits.Microstokes:
-            return ((value * 1e4) / 1e-06)
+        KinematicViscosityUnits.Microstokes: ('10000000000', '0'),
         
-        if from_unit == KinematicViscosityUnits.Millistokes:
-            return ((value * 1e4) / 0.001)
+        KinematicViscosityUnits.Millistokes: ('10000000', '0'),
         
-        if from_unit == KinematicViscosityUnits.Centistokes:
-            return ((value * 1e4) / 0.01)
+        KinematicViscosityUnits.Centistokes: ('1000000', '0'),
         
-        if from_unit == KinematicViscosityUnits.Decistokes:
-            return ((value * 1e4) / 0.1)
+        KinematicViscosityUnits.Decistokes: ('100000', '0'),
         
-        if from_unit == KinematicViscosityUnits.Kilostokes:
-            return ((value * 1e4) / 1000.0)
+        KinematicViscosityUnits.Kilostokes: ('10', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        KinematicViscosityUnits.SquareMeterPerSecond: ('1', '0'),
+        
+        KinematicViscosityUnits.Stokes: ('1/10000', '0'),
+        
+        KinematicViscosityUnits.SquareFootPerSecond: ('10000/107639', '0'),
+        
+        KinematicViscosityUnits.Nanostokes: ('1/10000000000000', '0'),
+        
+        KinematicViscosityUnits.Microstokes: ('1/10000000000', '0'),
+        
+        KinematicViscosityUnits.Millistokes: ('1/10000000', '0'),
+        
+        KinematicViscosityUnits.Centistokes: ('1/1000000', '0'),
+        
+        KinematicViscosityUnits.Decistokes: ('1/100000', '0'),
+        
+        KinematicViscosityUnits.Kilostokes: ('1/10', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: KinematicViscosityUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == KinematicViscosityUnits.SquareMeterPerSecond:
-            return (value)
+        KinematicViscosityUnits.SquareMeterPerSecond: ('m²/s',),
         
-        if to_unit == KinematicViscosityUnits.Stokes:
-            return (value / 1e4)
+        KinematicViscosityUnits.Stokes: ('St',),
         
-        if to_unit == KinematicViscosityUnits.SquareFootPerSecond:
-            return (value / 10.7639)
+        KinematicViscosityUnits.SquareFootPerSecond: ('ft²/s',),
         
-        if to_unit == KinematicViscosityUnits.Nanostokes:
-            return ((value / 1e4) * 1e-09)
+        KinematicViscosityUnits.Nanostokes: ('nSt',),
         
-        if to_unit == KinematicViscosityUnits.Microstokes:
-            return ((value / 1e4) * 1e-06)
+        KinematicViscosityUnits.Microstokes: ('μSt',),
         
-        if to_unit == KinematicViscosityUnits.Millistokes:
-            return ((value / 1e4) * 0.001)
+        KinematicViscosityUnits.Millistokes: ('mSt',),
         
-        if to_unit == KinematicViscosityUnits.Centistokes:
-            return ((value / 1e4) * 0.01)
+        KinematicViscosityUnits.Centistokes: ('cSt',),
         
-        if to_unit == KinematicViscosityUnits.Decistokes:
-            return ((value / 1e4) * 0.1)
+        KinematicViscosityUnits.Decistokes: ('dSt',),
         
-        if to_unit == KinematicViscosityUnits.Kilostokes:
-            return ((value / 1e4) * 1000.0)
+        KinematicViscosityUnits.Kilostokes: ('kSt',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: KinematicViscosityUnits = KinematicViscosityUnits.SquareMeterPerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: KinematicViscosityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: KinematicViscosityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: KinematicViscosityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: KinematicViscosityUnits, to_unit: KinematicViscosityUnits) -> float:
+        """
+        Convert a value from one KinematicViscosity unit to another, without creating a KinematicViscosity instance.
 
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: KinematicViscosityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: KinematicViscosityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return KinematicViscosity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: KinematicViscosityUnits, to_unit: KinematicViscosityUnits) -> List[float]:
+        """
+        Convert many values from one KinematicViscosity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: KinematicViscosityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: KinematicViscosityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return KinematicViscosity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: KinematicViscosityUnits, to_unit: KinematicViscosityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", KinematicViscosity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: KinematicViscosityUnits, to_unit: KinematicViscosityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one KinematicViscosity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: KinematicViscosityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: KinematicViscosityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return KinematicViscosity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: KinematicViscosityUnits = KinematicViscosityUnits.SquareMeterPerSecond) -> KinematicViscosity:
+        """
+        Create a new instance of KinematicViscosity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: KinematicViscosityUnits
+        :return: A new instance of KinematicViscosity.
+        :rtype: KinematicViscosity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return KinematicViscosity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: KinematicViscosityUnits = KinematicViscosityUnits.SquareMeterPerSecond) -> Fraction:
+        """
+        Get the exact value of the KinematicViscosity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (SquareMeterPerSecond).
+        :type unit: KinematicViscosityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> KinematicViscosity:
+        """
+        Parse a KinematicViscosity from a value followed by a unit abbreviation, e.g. "1 m²/s".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of KinematicViscosity.
+        :rtype: KinematicViscosity
+        :raises ValueError: When the string is not a valid or an ambiguous KinematicViscosity.
+        """
+        return KinematicViscosity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[KinematicViscosity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return KinematicViscosity._try_parse(text)
+
+    def to_binary(self, unit: Optional[KinematicViscosityUnits] = None) -> bytes:
+        """
+        Encode the KinematicViscosity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: KinematicViscosityUnits
+        :return: The encoded KinematicViscosity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> KinematicViscosity:
+        """
+        Decode a KinematicViscosity encoded by to_binary.
+
+        :param data: The encoded KinematicViscosity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of KinematicViscosity.
+        :rtype: KinematicViscosity
+        :raises ValueError: When the data is not a valid encoded KinematicViscosity.
+        """
+        return KinematicViscosity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[KinematicViscosityUnits] = None) -> dict:
+        """
+        Get the KinematicViscosity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (SquareMeterPerSecond).
+        :type hold_in_unit: KinematicViscosityUnits
+        :return: The KinematicViscosity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[KinematicViscosityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> KinematicViscosity:
+        """
+        Create a new instance of KinematicViscosity from its DTO.
+
+        :param dto: The KinematicViscosity DTO, the unit is the KinematicViscosityUnits value or name.
+        :type dto: dict
+        :return: A new instance of KinematicViscosity.
+        :rtype: KinematicViscosity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return KinematicViscosity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> KinematicViscosity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return KinematicViscosity._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -301,10 +555,7 @@ class KinematicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__square_meters_per_second != None:
-            return self.__square_meters_per_second
-        self.__square_meters_per_second = self.__convert_from_base(KinematicViscosityUnits.SquareMeterPerSecond)
-        return self.__square_meters_per_second
+        return self._cached_convert(KinematicViscosityUnits.SquareMeterPerSecond)
 
     
     @property
@@ -312,10 +563,7 @@ class KinematicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__stokes != None:
-            return self.__stokes
-        self.__stokes = self.__convert_from_base(KinematicViscosityUnits.Stokes)
-        return self.__stokes
+        return self._cached_convert(KinematicViscosityUnits.Stokes)
 
     
     @property
@@ -323,10 +571,7 @@ class KinematicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__square_feet_per_second != None:
-            return self.__square_feet_per_second
-        self.__square_feet_per_second = self.__convert_from_base(KinematicViscosityUnits.SquareFootPerSecond)
-        return self.__square_feet_per_second
+        return self._cached_convert(KinematicViscosityUnits.SquareFootPerSecond)
 
     
     @property
@@ -334,10 +579,7 @@ class KinematicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__nanostokes != None:
-            return self.__nanostokes
-        self.__nanostokes = self.__convert_from_base(KinematicViscosityUnits.Nanostokes)
-        return self.__nanostokes
+        return self._cached_convert(KinematicViscosityUnits.Nanostokes)
 
     
     @property
@@ -345,10 +587,7 @@ class KinematicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__microstokes != None:
-            return self.__microstokes
-        self.__microstokes = self.__convert_from_base(KinematicViscosityUnits.Microstokes)
-        return self.__microstokes
+        return self._cached_convert(KinematicViscosityUnits.Microstokes)
 
     
     @property
@@ -356,10 +595,7 @@ class KinematicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__millistokes != None:
-            return self.__millistokes
-        self.__millistokes = self.__convert_from_base(KinematicViscosityUnits.Millistokes)
-        return self.__millistokes
+        return self._cached_convert(KinematicViscosityUnits.Millistokes)
 
     
     @property
@@ -367,10 +603,7 @@ class KinematicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__centistokes != None:
-            return self.__centistokes
-        self.__centistokes = self.__convert_from_base(KinematicViscosityUnits.Centistokes)
-        return self.__centistokes
+        return self._cached_convert(KinematicViscosityUnits.Centistokes)
 
     
     @property
@@ -378,10 +611,7 @@ class KinematicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__decistokes != None:
-            return self.__decistokes
-        self.__decistokes = self.__convert_from_base(KinematicViscosityUnits.Decistokes)
-        return self.__decistokes
+        return self._cached_convert(KinematicViscosityUnits.Decistokes)
 
     
     @property
@@ -389,10 +619,7 @@ class KinematicViscosity(AbstractMeasure):
         """
         
         """
-        if self.__kilostokes != None:
-            return self.__kilostokes
-        self.__kilostokes = self.__convert_from_base(KinematicViscosityUnits.Kilostokes)
-        return self.__kilostokes
+        return self._cached_convert(KinematicViscosityUnits.Kilostokes)
 
     
     def to_string(self, unit: KinematicViscosityUnits = KinematicViscosityUnits.SquareMeterPerSecond) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class LeakRateUnits(Enum):
         """
             LeakRateUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         PascalCubicMeterPerSecond = 'pascal_cubic_meter_per_second'
         """
@@ -34,49 +45,268 @@ class LeakRate(AbstractMeasure):
         value (float): The value.
         from_unit (LeakRateUnits): The LeakRate unit to create from, The default unit is PascalCubicMeterPerSecond
     """
-    def __init__(self, value: float, from_unit: LeakRateUnits = LeakRateUnits.PascalCubicMeterPerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = LeakRateUnits
+
+    _base_unit = LeakRateUnits.PascalCubicMeterPerSecond
+
+    _dimensions = (2, 1, -3, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 52
+
+    _binary_unit_ids = {
         
-        self.__pascal_cubic_meters_per_second = None
+        LeakRateUnits.PascalCubicMeterPerSecond: 0,
         
-        self.__millibar_liters_per_second = None
+        LeakRateUnits.MillibarLiterPerSecond: 1,
         
-        self.__torr_liters_per_second = None
+        LeakRateUnits.TorrLiterPerSecond: 2,
         
+    }
 
-    def convert(self, unit: LeakRateUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        LeakRateUnits.PascalCubicMeterPerSecond: lambda value: (value),
+        
+        LeakRateUnits.MillibarLiterPerSecond: lambda value: (value * 10),
+        
+        LeakRateUnits.TorrLiterPerSecond: lambda value: (value * 7.5),
+        
+    }
 
-    def __convert_from_base(self, from_unit: LeakRateUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == LeakRateUnits.PascalCubicMeterPerSecond:
-            return (value)
+        LeakRateUnits.PascalCubicMeterPerSecond: lambda value: (value),
         
-        if from_unit == LeakRateUnits.MillibarLiterPerSecond:
-            return (value * 10)
+        LeakRateUnits.MillibarLiterPerSecond: lambda value: (value / 10),
         
-        if from_unit == LeakRateUnits.TorrLiterPerSecond:
-            return (value * 7.5)
+        LeakRateUnits.TorrLiterPerSecond: lambda value: (value / 7.5),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        LeakRateUnits.PascalCubicMeterPerSecond: ('1', '0'),
+        
+        LeakRateUnits.MillibarLiterPerSecond: ('10', '0'),
+        
+        LeakRateUnits.TorrLiterPerSecond: ('15/2', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: LeakRateUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == LeakRateUnits.PascalCubicMeterPerSecond:
-            return (value)
+        LeakRateUnits.PascalCubicMeterPerSecond: ('1', '0'),
         
-        if to_unit == LeakRateUnits.MillibarLiterPerSecond:
-            return (value / 10)
+        LeakRateUnits.MillibarLiterPerSecond: ('1/10', '0'),
+        
+        LeakRateUnits.TorrLiterPerSecond: ('2/15', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == LeakRateUnits.TorrLiterPerSecond:
-            return (value / 7.5)
+        LeakRateUnits.PascalCubicMeterPerSecond: ('Pa·m³/s',),
         
-        return None
+        LeakRateUnits.MillibarLiterPerSecond: ('mbar·l/s',),
+        
+        LeakRateUnits.TorrLiterPerSecond: ('Torr·l/s',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: LeakRateUnits = LeakRateUnits.PascalCubicMeterPerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: LeakRateUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: LeakRateUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: LeakRateUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: LeakRateUnits, to_unit: LeakRateUnits) -> float:
+        """
+        Convert a value from one LeakRate unit to another, without creating a LeakRate instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: LeakRateUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LeakRateUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return LeakRate._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: LeakRateUnits, to_unit: LeakRateUnits) -> List[float]:
+        """
+        Convert many values from one LeakRate unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: LeakRateUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: LeakRateUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return LeakRate._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: LeakRateUnits, to_unit: LeakRateUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", LeakRate._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: LeakRateUnits, to_unit: LeakRateUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one LeakRate unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LeakRateUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LeakRateUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return LeakRate._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: LeakRateUnits = LeakRateUnits.PascalCubicMeterPerSecond) -> LeakRate:
+        """
+        Create a new instance of LeakRate holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LeakRateUnits
+        :return: A new instance of LeakRate.
+        :rtype: LeakRate
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return LeakRate._from_exact(value, from_unit)
+
+    def to_exact(self, unit: LeakRateUnits = LeakRateUnits.PascalCubicMeterPerSecond) -> Fraction:
+        """
+        Get the exact value of the LeakRate in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (PascalCubicMeterPerSecond).
+        :type unit: LeakRateUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> LeakRate:
+        """
+        Parse a LeakRate from a value followed by a unit abbreviation, e.g. "1 Pa·m³/s".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of LeakRate.
+        :rtype: LeakRate
+        :raises ValueError: When the string is not a valid or an ambiguous LeakRate.
+        """
+        return LeakRate._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[LeakRate]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return LeakRate._try_parse(text)
 
+    def to_binary(self, unit: Optional[LeakRateUnits] = None) -> bytes:
+        """
+        Encode the LeakRate to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: LeakRateUnits
+        :return: The encoded LeakRate.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> LeakRate:
+        """
+        Decode a LeakRate encoded by to_binary.
+
+        :param data: The encoded LeakRate, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of LeakRate.
+        :rtype: LeakRate
+        :raises ValueError: When the data is not a valid encoded LeakRate.
+        """
+        return LeakRate._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[LeakRateUnits] = None) -> dict:
+        """
+        Get the LeakRate DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (PascalCubicMeterPerSecond).
+        :type hold_in_unit: LeakRateUnits
+        :return: The LeakRate DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[LeakRateUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> LeakRate:
+        """
+        Create a new instance of LeakRate from its DTO.
+
+        :param dto: The LeakRate DTO, the unit is the LeakRateUnits value or name.
+        :type dto: dict
+        :return: A new instance of LeakRate.
+        :rtype: LeakRate
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return LeakRate._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> LeakRate:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return LeakRate._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -133,10 +363,7 @@ class LeakRate(AbstractMeasure):
         """
         
         """
-        if self.__pascal_cubic_meters_per_second != None:
-            return self.__pascal_cubic_meters_per_second
-        self.__pascal_cubic_meters_per_second = self.__convert_from_base(LeakRateUnits.PascalCubicMeterPerSecond)
-        return self.__pascal_cubic_meters_per_second
+        return self._cached_convert(LeakRateUnits.PascalCubicMeterPerSecond)
 
     
     @property
@@ -144,10 +371,7 @@ class LeakRate(AbstractMeasure):
         """
         
         """
-        if self.__millibar_liters_per_second != None:
-            return self.__millibar_liters_per_second
-        self.__millibar_liters_per_second = self.__convert_from_base(LeakRateUnits.MillibarLiterPerSecond)
-        return self.__millibar_liters_per_second
+        return self._cached_convert(LeakRateUnits.MillibarLiterPerSecond)
 
     
     @property
@@ -155,10 +379,7 @@ class LeakRate(AbstractMeasure):
         """
         
         """
-        if self.__torr_liters_per_second != None:
-            return self.__torr_liters_per_second
-        self.__torr_liters_per_second = self.__convert_from_base(LeakRateUnits.TorrLiterPerSecond)
-        return self.__torr_liters_per_second
+        return self._cached_convert(LeakRateUnits.TorrLiterPerSecond)
 
     
     def to_string(self, unit: LeakRateUnits = LeakRateUnits.PascalCubicMeterPerSecond) -> str:
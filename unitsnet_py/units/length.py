@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class LengthUnits(Enum):
         """
             LengthUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Meter = 'meter'
         """
@@ -219,345 +230,712 @@ class Length(AbstractMeasure):
         value (float): The value.
         from_unit (LengthUnits): The Length unit to create from, The default unit is Meter
     """
-    def __init__(self, value: float, from_unit: LengthUnits = LengthUnits.Meter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = LengthUnits
+
+    _base_unit = LengthUnits.Meter
+
+    _dimensions = (1, 0, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 53
+
+    _binary_unit_ids = {
         
-        self.__meters = None
+        LengthUnits.Meter: 0,
         
-        self.__miles = None
+        LengthUnits.Mile: 1,
         
-        self.__yards = None
+        LengthUnits.Yard: 2,
         
-        self.__feet = None
+        LengthUnits.Foot: 3,
         
-        self.__us_survey_feet = None
+        LengthUnits.UsSurveyFoot: 4,
         
-        self.__inches = None
+        LengthUnits.Inch: 5,
         
-        self.__mils = None
+        LengthUnits.Mil: 6,
         
-        self.__nautical_miles = None
+        LengthUnits.NauticalMile: 7,
         
-        self.__fathoms = None
+        LengthUnits.Fathom: 8,
         
-        self.__shackles = None
+        LengthUnits.Shackle: 9,
         
-        self.__microinches = None
+        LengthUnits.Microinch: 10,
         
-        self.__printer_points = None
+        LengthUnits.PrinterPoint: 11,
         
-        self.__dtp_points = None
+        LengthUnits.DtpPoint: 12,
         
-        self.__printer_picas = None
+        LengthUnits.PrinterPica: 13,
         
-        self.__dtp_picas = None
+        LengthUnits.DtpPica: 14,
         
-        self.__twips = None
+        LengthUnits.Twip: 15,
         
-        self.__hands = None
+        LengthUnits.Hand: 16,
         
-        self.__astronomical_units = None
+        LengthUnits.AstronomicalUnit: 17,
         
-        self.__parsecs = None
+        LengthUnits.Parsec: 18,
         
-        self.__light_years = None
+        LengthUnits.LightYear: 19,
         
-        self.__solar_radiuses = None
+        LengthUnits.SolarRadius: 20,
         
-        self.__chains = None
+        LengthUnits.Chain: 21,
         
-        self.__angstroms = None
+        LengthUnits.Angstrom: 22,
         
-        self.__data_miles = None
+        LengthUnits.DataMile: 23,
         
-        self.__femtometers = None
+        LengthUnits.Femtometer: 24,
         
-        self.__picometers = None
+        LengthUnits.Picometer: 25,
         
-        self.__nanometers = None
+        LengthUnits.Nanometer: 26,
         
-        self.__micrometers = None
+        LengthUnits.Micrometer: 27,
         
-        self.__millimeters = None
+        LengthUnits.Millimeter: 28,
         
-        self.__centimeters = None
+        LengthUnits.Centimeter: 29,
         
-        self.__decimeters = None
+        LengthUnits.Decimeter: 30,
         
-        self.__decameters = None
+        LengthUnits.Decameter: 31,
         
-        self.__hectometers = None
+        LengthUnits.Hectometer: 32,
         
-        self.__kilometers = None
+        LengthUnits.Kilometer: 33,
         
-        self.__megameters = None
+        LengthUnits.Megameter: 34,
         
-        self.__kilofeet = None
+        LengthUnits.Kilofoot: 35,
         
-        self.__kiloparsecs = None
+        LengthUnits.Kiloparsec: 36,
         
-        self.__megaparsecs = None
+        LengthUnits.Megaparsec: 37,
         
-        self.__kilolight_years = None
+        LengthUnits.KilolightYear: 38,
         
-        self.__megalight_years = None
+        LengthUnits.MegalightYear: 39,
         
+    }
 
-    def convert(self, unit: LengthUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        LengthUnits.Meter: lambda value: (value),
+        
+        LengthUnits.Mile: lambda value: (value / 1609.344),
+        
+        LengthUnits.Yard: lambda value: (value / 0.9144),
+        
+        LengthUnits.Foot: lambda value: (value / 0.3048),
+        
+        LengthUnits.UsSurveyFoot: lambda value: (value * 3937 / 1200),
+        
+        LengthUnits.Inch: lambda value: (value / 2.54e-2),
+        
+        LengthUnits.Mil: lambda value: (value / 2.54e-5),
+        
+        LengthUnits.NauticalMile: lambda value: (value / 1852),
+        
+        LengthUnits.Fathom: lambda value: (value / 1.8288),
+        
+        LengthUnits.Shackle: lambda value: (value / 27.432),
+        
+        LengthUnits.Microinch: lambda value: (value / 2.54e-8),
+        
+        LengthUnits.PrinterPoint: lambda value: ((value / 2.54e-2) * 72.27),
+        
+        LengthUnits.DtpPoint: lambda value: ((value / 2.54e-2) * 72),
+        
+        LengthUnits.PrinterPica: lambda value: (value * 237.106301584),
+        
+        LengthUnits.DtpPica: lambda value: (value * 236.220472441),
+        
+        LengthUnits.Twip: lambda value: (value * 56692.913385826),
+        
+        LengthUnits.Hand: lambda value: (value / 1.016e-1),
+        
+        LengthUnits.AstronomicalUnit: lambda value: (value / 1.4959787070e11),
+        
+        LengthUnits.Parsec: lambda value: (value / 3.08567758128e16),
+        
+        LengthUnits.LightYear: lambda value: (value / 9.46073047258e15),
+        
+        LengthUnits.SolarRadius: lambda value: (value / 6.95510000e+08),
+        
+        LengthUnits.Chain: lambda value: (value / 20.1168),
+        
+        LengthUnits.Angstrom: lambda value: (value / 1e-10),
+        
+        LengthUnits.DataMile: lambda value: (value / 1828.8),
+        
+        LengthUnits.Femtometer: lambda value: ((value) / 1e-15),
+        
+        LengthUnits.Picometer: lambda value: ((value) / 1e-12),
+        
+        LengthUnits.Nanometer: lambda value: ((value) / 1e-09),
+        
+        LengthUnits.Micrometer: lambda value: ((value) / 1e-06),
+        
+        LengthUnits.Millimeter: lambda value: ((value) / 0.001),
+        
+        LengthUnits.Centimeter: lambda value: ((value) / 0.01),
+        
+        LengthUnits.Decimeter: lambda value: ((value) / 0.1),
+        
+        LengthUnits.Decameter: lambda value: ((value) / 10.0),
+        
+        LengthUnits.Hectometer: lambda value: ((value) / 100.0),
+        
+        LengthUnits.Kilometer: lambda value: ((value) / 1000.0),
+        
+        LengthUnits.Megameter: lambda value: ((value) / 1000000.0),
+        
+        LengthUnits.Kilofoot: lambda value: ((value / 0.3048) / 1000.0),
+        
+        LengthUnits.Kiloparsec: lambda value: ((value / 3.08567758128e16) / 1000.0),
+        
+        LengthUnits.Megaparsec: lambda value: ((value / 3.08567758128e16) / 1000000.0),
+        
+        LengthUnits.KilolightYear: lambda value: ((value / 9.46073047258e15) / 1000.0),
+        
+        LengthUnits.MegalightYear: lambda value: ((value / 9.46073047258e15) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: LengthUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == LengthUnits.Meter:
-            return (value)
+        LengthUnits.Meter: lambda value: (value),
         
-        if from_unit == LengthUnits.Mile:
-            return (value / 1609.344)
+        LengthUnits.Mile: lambda value: (value * 1609.344),
         
-        if from_unit == LengthUnits.Yard:
-            return (value / 0.9144)
+        LengthUnits.Yard: lambda value: (value * 0.9144),
         
-        if from_unit == LengthUnits.Foot:
-            return (value / 0.3048)
+        LengthUnits.Foot: lambda value: (value * 0.3048),
         
-        if from_unit == LengthUnits.UsSurveyFoot:
-            return (value * 3937 / 1200)
+        LengthUnits.UsSurveyFoot: lambda value: (value * 1200 / 3937),
         
-        if from_unit == LengthUnits.Inch:
-            return (value / 2.54e-2)
+        LengthUnits.Inch: lambda value: (value * 2.54e-2),
         
-        if from_unit == LengthUnits.Mil:
-            return (value / 2.54e-5)
+        LengthUnits.Mil: lambda value: (value * 2.54e-5),
         
-        if from_unit == LengthUnits.NauticalMile:
-            return (value / 1852)
+        LengthUnits.NauticalMile: lambda value: (value * 1852),
         
-        if from_unit == LengthUnits.Fathom:
-            return (value / 1.8288)
+        LengthUnits.Fathom: lambda value: (value * 1.8288),
         
-        if from_unit == LengthUnits.Shackle:
-            return (value / 27.432)
+        LengthUnits.Shackle: lambda value: (value * 27.432),
         
-        if from_unit == LengthUnits.Microinch:
-            return (value / 2.54e-8)
+        LengthUnits.Microinch: lambda value: (value * 2.54e-8),
         
-        if from_unit == LengthUnits.PrinterPoint:
-            return ((value / 2.54e-2) * 72.27)
+        LengthUnits.PrinterPoint: lambda value: ((value / 72.27) * 2.54e-2),
         
-        if from_unit == LengthUnits.DtpPoint:
-            return ((value / 2.54e-2) * 72)
+        LengthUnits.DtpPoint: lambda value: ((value / 72) * 2.54e-2),
         
-        if from_unit == LengthUnits.PrinterPica:
-            return (value * 237.106301584)
+        LengthUnits.PrinterPica: lambda value: (value / 237.106301584),
         
-        if from_unit == LengthUnits.DtpPica:
-            return (value * 236.220472441)
+        LengthUnits.DtpPica: lambda value: (value / 236.220472441),
         
-        if from_unit == LengthUnits.Twip:
-            return (value * 56692.913385826)
+        LengthUnits.Twip: lambda value: (value / 56692.913385826),
         
-        if from_unit == LengthUnits.Hand:
-            return (value / 1.016e-1)
+        LengthUnits.Hand: lambda value: (value * 1.016e-1),
         
-        if from_unit == LengthUnits.AstronomicalUnit:
-            return (value / 1.4959787070e11)
+        LengthUnits.AstronomicalUnit: lambda value: (value * 1.4959787070e11),
         
-        if from_unit == LengthUnits.Parsec:
-            return (value / 3.08567758128e16)
+        LengthUnits.Parsec: lambda value: (value * 3.08567758128e16),
         
-        if from_unit == LengthUnits.LightYear:
-            return (value / 9.46073047258e15)
+        LengthUnits.LightYear: lambda value: (value * 9.46073047258e15),
         
-        if from_unit == LengthUnits.SolarRadius:
-            return (value / 6.95510000e+08)
+        LengthUnits.SolarRadius: lambda value: (value * 6.95510000e+08),
         
-        if from_unit == LengthUnits.Chain:
-            return (value / 20.1168)
+        LengthUnits.Chain: lambda value: (value * 20.1168),
         
-        if from_unit == LengthUnits.Angstrom:
-            return (value / 1e-10)
+        LengthUnits.Angstrom: lambda value: (value * 1e-10),
         
-        if from_unit == LengthUnits.DataMile:
-            return (value / 1828.8)
+        LengthUnits.DataMile: lambda value: (value * 1828.8),
         
-        if from_unit == LengthUnits.Femtometer:
-            return ((value) / 1e-15)
+        LengthUnits.Femtometer: lambda value: ((value) * 1e-15),
         
-        if from_unit == LengthUnits.Picometer:
-            return ((value) / 1e-12)
+        LengthUnits.Picometer: lambda value: ((value) * 1e-12),
         
-        if from_unit == LengthUnits.Nanometer:
-            return ((value) / 1e-09)
+        LengthUnits.Nanometer: lambda value: ((value) * 1e-09),
         
-        if from_unit == LengthUnits.Micrometer:
-            return ((value) / 1e-06)
+        LengthUnits.Micrometer: lambda value: ((value) * 1e-06),
         
-        if from_unit == LengthUnits.Millimeter:
-            return ((value) / 0.001)
+        LengthUnits.Millimeter: lambda value: ((value) * 0.001),
         
-        if from_unit == LengthUnits.Centimeter:
-            return ((value) / 0.01)
+        LengthUnits.Centimeter: lambda value: ((value) * 0.01),
         
-        if from_unit == LengthUnits.Decimeter:
-            return ((value) / 0.1)
+        LengthUnits.Decimeter: lambda value: ((value) * 0.1),
         
-        if from_unit == LengthUnits.Decameter:
-            return ((value) / 10.0)
+        LengthUnits.Decameter: lambda value: ((value) * 10.0),
         
-        if from_unit == LengthUnits.Hectometer:
-            return ((value) / 100.0)
+        LengthUnits.Hectometer: lambda value: ((value) * 100.0),
         
-        if from_unit == LengthUnits.Kilometer:
-            return ((value) / 1000.0)
+        LengthUnits.Kilometer: lambda value: ((value) * 1000.0),
         
-        if from_unit == LengthUnits.Megameter:
-            return ((value) / 1000000.0)
+        LengthUnits.Megameter: lambda value: ((value) * 1000000.0),
         
-        if from_unit == LengthUnits.Kilofoot:
-            return ((value / 0.3048) / 1000.0)
+        LengthUnits.Kilofoot: lambda value: ((value * 0.3048) * 1000.0),
         
-        if from_unit == LengthUnits.Kiloparsec:
-            return ((value / 3.08567758128e16) / 1000.0)
+        LengthUnits.Kiloparsec: lambda value: ((value * 3.08567758128e16) * 1000.0),
         
-        if from_unit == LengthUnits.Megaparsec:
-            return ((value / 3.08567758128e16) / 1000000.0)
+        LengthUnits.Megaparsec: lambda value: ((value * 3.08567758128e16) * 1000000.0),
         
-        if from_unit == LengthUnits.KilolightYear:
-            return ((value / 9.46073047258e15) / 1000.0)
+        LengthUnits.KilolightYear: lambda value: ((value * 9.46073047258e15) * 1000.0),
         
-        if from_unit == LengthUnits.MegalightYear:
-            return ((value / 9.46073047258e15) / 1000000.0)
+        LengthUnits.MegalightYear: lambda value: ((value * 9.46073047258e15) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        LengthUnits.Meter: ('1', '0'),
+        
+        LengthUnits.Mile: ('125/201168', '0'),
+        
+        LengthUnits.Yard: ('1250/1143', '0'),
+        
+        LengthUnits.Foot: ('1250/381', '0'),
+        
+        LengthUnits.UsSurveyFoot: ('3937/1200', '0'),
+        
+        LengthUnits.Inch: ('5000/127', '0'),
+        
+        LengthUnits.Mil: ('5000000/127', '0'),
+        
+        LengthUnits.NauticalMile: ('1/1852', '0'),
+        
+        LengthUnits.Fathom: ('625/1143', '0'),
+        
+        LengthUnits.Shackle: ('125/3429', '0'),
+        
+        LengthUnits.Microinch: ('5000000000/127', '0'),
+        
+        LengthUnits.PrinterPoint: ('361350/127', '0'),
+        
+        LengthUnits.DtpPoint: ('360000/127', '0'),
+        
+        LengthUnits.PrinterPica: ('14819143849/62500000', '0'),
+        
+        LengthUnits.DtpPica: ('236220472441/1000000000', '0'),
+        
+        LengthUnits.Twip: ('28346456692913/500000000', '0'),
+        
+        LengthUnits.Hand: ('1250/127', '0'),
+        
+        LengthUnits.AstronomicalUnit: ('1/149597870700', '0'),
+        
+        LengthUnits.Parsec: ('1/30856775812800000', '0'),
+        
+        LengthUnits.LightYear: ('1/9460730472580000', '0'),
+        
+        LengthUnits.SolarRadius: ('1/695510000', '0'),
+        
+        LengthUnits.Chain: ('625/12573', '0'),
+        
+        LengthUnits.Angstrom: ('10000000000', '0'),
+        
+        LengthUnits.DataMile: ('5/9144', '0'),
+        
+        LengthUnits.Femtometer: ('1000000000000000', '0'),
+        
+        LengthUnits.Picometer: ('1000000000000', '0'),
+        
+        LengthUnits.Nanometer: ('1000000000', '0'),
+        
+        LengthUnits.Micrometer: ('1000000', '0'),
+        
+        LengthUnits.Millimeter: ('1000', '0'),
+        
+        LengthUnits.Centimeter: ('100', '0'),
+        
+        LengthUnits.Decimeter: ('10', '0'),
+        
+        LengthUnits.Decameter: ('1/10', '0'),
+        
+        LengthUnits.Hectometer: ('1/100', '0'),
+        
+        LengthUnits.Kilometer: ('1/1000', '0'),
+        
+        LengthUnits.Megameter: ('1/1000000', '0'),
+        
+        LengthUnits.Kilofoot: ('5/1524', '0'),
+        
+        LengthUnits.Kiloparsec: ('1/30856775812800000000', '0'),
+        
+        LengthUnits.Megaparsec: ('1/30856775812800000000000', '0'),
+        
+        LengthUnits.KilolightYear: ('1/9460730472580000000', '0'),
+        
+        LengthUnits.MegalightYear: ('1/9460730472580000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: LengthUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == LengthUnits.Meter:
-            return (value)
+        LengthUnits.Meter: ('1', '0'),
         
-        if to_unit == LengthUnits.Mile:
-            return (value * 1609.344)
+        LengthUnits.Mile: ('201168/125', '0'),
         
-        if to_unit == LengthUnits.Yard:
-            return (value * 0.9144)
+        LengthUnits.Yard: ('1143/1250', '0'),
         
-        if to_unit == LengthUnits.Foot:
-            return (value * 0.3048)
+        LengthUnits.Foot: ('381/1250', '0'),
         
-        if to_unit == LengthUnits.UsSurveyFoot:
-            return (value * 1200 / 3937)
+        LengthUnits.UsSurveyFoot: ('1200/3937', '0'),
         
-        if to_unit == LengthUnits.Inch:
-            return (value * 2.54e-2)
+        LengthUnits.Inch: ('127/5000', '0'),
         
-        if to_unit == LengthUnits.Mil:
-            return (value * 2.54e-5)
+        LengthUnits.Mil: ('127/5000000', '0'),
         
-        if to_unit == LengthUnits.NauticalMile:
-            return (value * 1852)
+        LengthUnits.NauticalMile: ('1852', '0'),
         
-        if to_unit == LengthUnits.Fathom:
-            return (value * 1.8288)
+        LengthUnits.Fathom: ('1143/625', '0'),
         
-        if to_unit == LengthUnits.Shackle:
-            return (value * 27.432)
+        LengthUnits.Shackle: ('3429/125', '0'),
         
-        if to_unit == LengthUnits.Microinch:
-            return (value * 2.54e-8)
+        LengthUnits.Microinch: ('127/5000000000', '0'),
         
-        if to_unit == LengthUnits.PrinterPoint:
-            return ((value / 72.27) * 2.54e-2)
+        LengthUnits.PrinterPoint: ('127/361350', '0'),
         
-        if to_unit == LengthUnits.DtpPoint:
-            return ((value / 72) * 2.54e-2)
+        LengthUnits.DtpPoint: ('127/360000', '0'),
         
-        if to_unit == LengthUnits.PrinterPica:
-            return (value / 237.106301584)
+        LengthUnits.PrinterPica: ('62500000/14819143849', '0'),
         
-        if to_unit == LengthUnits.DtpPica:
-            return (value / 236.220472441)
+        LengthUnits.DtpPica: ('1000000000/236220472441', '0'),
         
-        if to_unit == LengthUnits.Twip:
-            return (value / 56692.913385826)
+        LengthUnits.Twip: ('500000000/28346456692913', '0'),
         
-        if to_unit == LengthUnits.Hand:
-            return (value * 1.016e-1)
+        LengthUnits.Hand: ('127/1250', '0'),
         
-        if to_unit == LengthUnits.AstronomicalUnit:
-            return (value * 1.4959787070e11)
+        LengthUnits.AstronomicalUnit: ('149597870700', '0'),
         
-        if to_unit == LengthUnits.Parsec:
-            return (value * 3.08567758128e16)
+        LengthUnits.Parsec: ('30856775812800000', '0'),
         
-        if to_unit == LengthUnits.LightYear:
-            return (value * 9.46073047258e15)
+        LengthUnits.LightYear: ('9460730472580000', '0'),
         
-        if to_unit == LengthUnits.SolarRadius:
-            return (value * 6.95510000e+08)
+        LengthUnits.SolarRadius: ('695510000', '0'),
         
-        if to_unit == LengthUnits.Chain:
-            return (value * 20.1168)
+        LengthUnits.Chain: ('12573/625', '0'),
         
-        if to_unit == LengthUnits.Angstrom:
-            return (value * 1e-10)
+        LengthUnits.Angstrom: ('1/10000000000', '0'),
         
-        if to_unit == LengthUnits.DataMile:
-            return (value * 1828.8)
+        LengthUnits.DataMile: ('9144/5', '0'),
         
-        if to_unit == LengthUnits.Femtometer:
-            return ((value) * 1e-15)
+        LengthUnits.Femtometer: ('1/1000000000000000', '0'),
         
-        if to_unit == LengthUnits.Picometer:
-            return ((value) * 1e-12)
+        LengthUnits.Picometer: ('1/1000000000000', '0'),
         
-        if to_unit == LengthUnits.Nanometer:
-            return ((value) * 1e-09)
+        LengthUnits.Nanometer: ('1/1000000000', '0'),
         
-        if to_unit == LengthUnits.Micrometer:
-            return ((value) * 1e-06)
+        LengthUnits.Micrometer: ('1/1000000', '0'),
         
-        if to_unit == LengthUnits.Millimeter:
-            return ((value) * 0.001)
+        LengthUnits.Millimeter: ('1/1000', '0'),
         
-        if to_unit == LengthUnits.Centimeter:
-            return ((value) * 0.01)
+        LengthUnits.Centimeter: ('1/100', '0'),
         
-        if to_unit == LengthUnits.Decimeter:
-            return ((value) * 0.1)
+        LengthUnits.Decimeter: ('1/10', '0'),
         
-        if to_unit == LengthUnits.Decameter:
-            return ((value) * 10.0)
+        LengthUnits.Decameter: ('10', '0'),
         
-        if to_unit == LengthUnits.Hectometer:
-            return ((value) * 100.0)
+        LengthUnits.Hectometer: ('100', '0'),
         
-        if to_unit == LengthUnits.Kilometer:
-            return ((value) * 1000.0)
+        LengthUnits.Kilometer: ('1000', '0'),
         
-        if to_unit == LengthUnits.Megameter:
-            return ((value) * 1000000.0)
+        LengthUnits.Megameter: ('1000000', '0'),
         
-        if to_unit == LengthUnits.Kilofoot:
-            return ((value * 0.3048) * 1000.0)
+        LengthUnits.Kilofoot: ('1524/5', '0'),
         
-        if to_unit == LengthUnits.Kiloparsec:
-            return ((value * 3.08567758128e16) * 1000.0)
+        LengthUnits.Kiloparsec: ('30856775812800000000', '0'),
         
-        if to_unit == LengthUnits.Megaparsec:
-            return ((value * 3.08567758128e16) * 1000000.0)
+        LengthUnits.Megaparsec: ('30856775812800000000000', '0'),
         
-        if to_unit == LengthUnits.KilolightYear:
-            return ((value * 9.46073047258e15) * 1000.0)
+        LengthUnits.KilolightYear: ('9460730472580000000', '0'),
         
-        if to_unit == LengthUnits.MegalightYear:
-            return ((value * 9.46073047258e15) * 1000000.0)
+        LengthUnits.MegalightYear: ('9460730472580000000000', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        LengthUnits.Meter: ('m',),
+        
+        LengthUnits.Mile: ('mi',),
+        
+        LengthUnits.Yard: ('yd',),
+        
+        LengthUnits.Foot: ('ft',),
+        
+        LengthUnits.UsSurveyFoot: ('ftUS',),
+        
+        LengthUnits.Inch: ('in',),
+        
+        LengthUnits.Mil: ('mil',),
+        
+        LengthUnits.NauticalMile: ('NM',),
+        
+        LengthUnits.Fathom: ('fathom',),
+        
+        LengthUnits.Shackle: ('shackle',),
+        
+        LengthUnits.Microinch: ('µin',),
+        
+        LengthUnits.PrinterPoint: ('pt',),
+        
+        LengthUnits.DtpPoint: ('pt',),
+        
+        LengthUnits.PrinterPica: ('pica',),
+        
+        LengthUnits.DtpPica: ('pica',),
+        
+        LengthUnits.Twip: ('twip',),
+        
+        LengthUnits.Hand: ('h',),
+        
+        LengthUnits.AstronomicalUnit: ('au',),
+        
+        LengthUnits.Parsec: ('pc',),
+        
+        LengthUnits.LightYear: ('ly',),
+        
+        LengthUnits.SolarRadius: ('R⊙',),
+        
+        LengthUnits.Chain: ('ch',),
+        
+        LengthUnits.Angstrom: ('Å',),
+        
+        LengthUnits.DataMile: ('DM',),
+        
+        LengthUnits.Femtometer: ('fm',),
+        
+        LengthUnits.Picometer: ('pm',),
+        
+        LengthUnits.Nanometer: ('nm',),
+        
+        LengthUnits.Micrometer: ('μm',),
+        
+        LengthUnits.Millimeter: ('mm',),
+        
+        LengthUnits.Centimeter: ('cm',),
+        
+        LengthUnits.Decimeter: ('dm',),
+        
+        LengthUnits.Decameter: ('dam',),
+        
+        LengthUnits.Hectometer: ('hm',),
+        
+        LengthUnits.Kilometer: ('km',),
+        
+        LengthUnits.Megameter: ('Mm',),
+        
+        LengthUnits.Kilofoot: ('kft',),
+        
+        LengthUnits.Kiloparsec: ('kpc',),
+        
+        LengthUnits.Megaparsec: ('Mpc',),
+        
+        LengthUnits.KilolightYear: ('kly',),
+        
+        LengthUnits.MegalightYear: ('Mly',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: LengthUnits = LengthUnits.Meter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: LengthUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: LengthUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: LengthUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: LengthUnits, to_unit: LengthUnits) -> float:
+        """
+        Convert a value from one Length unit to another, without creating a Length instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: LengthUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LengthUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Length._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: LengthUnits, to_unit: LengthUnits) -> List[float]:
+        """
+        Convert many values from one Length unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: LengthUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: LengthUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Length._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: LengthUnits, to_unit: LengthUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Length._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: LengthUnits, to_unit: LengthUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Length unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LengthUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LengthUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Length._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: LengthUnits = LengthUnits.Meter) -> Length:
+        """
+        Create a new instance of Length holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LengthUnits
+        :return: A new instance of Length.
+        :rtype: Length
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Length._from_exact(value, from_unit)
+
+    def to_exact(self, unit: LengthUnits = LengthUnits.Meter) -> Fraction:
+        """
+        Get the exact value of the Length in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Meter).
+        :type unit: LengthUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Length:
+        """
+        Parse a Length from a value followed by a unit abbreviation, e.g. "1 m".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Length.
+        :rtype: Length
+        :raises ValueError: When the string is not a valid or an ambiguous Length.
+        """
+        return Length._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Length]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Length._try_parse(text)
+
+    def to_binary(self, unit: Optional[LengthUnits] = None) -> bytes:
+        """
+        Encode the Length to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: LengthUnits
+        :return: The encoded Length.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Length:
+        """
+        Decode a Length encoded by to_binary.
+
+        :param data: The encoded Length, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Length.
+        :rtype: Length
+        :raises ValueError: When the data is not a valid encoded Length.
+        """
+        return Length._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[LengthUnits] = None) -> dict:
+        """
+        Get the Length DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Meter).
+        :type hold_in_unit: LengthUnits
+        :return: The Length DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[LengthUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Length:
+        """
+        Create a new instance of Length from its DTO.
+
+        :param dto: The Length DTO, the unit is the LengthUnits value or name.
+        :type dto: dict
+        :return: A new instance of Length.
+        :rtype: Length
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Length._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Length:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Length._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -1169,10 +1547,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__meters != None:
-            return self.__meters
-        self.__meters = self.__convert_from_base(LengthUnits.Meter)
-        return self.__meters
+        return self._cached_convert(LengthUnits.Meter)
 
     
     @property
@@ -1180,10 +1555,7 @@ class Length(AbstractMeasure):
         """
         The statute mile was standardised between the British Commonwealth and the United States by an international agreement in 1959, when it was formally redefined with respect to SI units as exactly 1,609.344 metres.
         """
-        if self.__miles != None:
-            return self.__miles
-        self.__miles = self.__convert_from_base(LengthUnits.Mile)
-        return self.__miles
+        return self._cached_convert(LengthUnits.Mile)
 
     
     @property
@@ -1191,10 +1563,7 @@ class Length(AbstractMeasure):
         """
         The yard (symbol: yd) is an English unit of length in both the British imperial and US customary systems of measurement equalling 3 feet (or 36 inches). Since 1959 the yard has been by international agreement standardized as exactly 0.9144 meter. A distance of 1,760 yards is equal to 1 mile.
         """
-        if self.__yards != None:
-            return self.__yards
-        self.__yards = self.__convert_from_base(LengthUnits.Yard)
-        return self.__yards
+        return self._cached_convert(LengthUnits.Yard)
 
     
     @property
@@ -1202,10 +1571,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__feet != None:
-            return self.__feet
-        self.__feet = self.__convert_from_base(LengthUnits.Foot)
-        return self.__feet
+        return self._cached_convert(LengthUnits.Foot)
 
     
     @property
@@ -1213,10 +1579,7 @@ class Length(AbstractMeasure):
         """
         In the United States, the foot was defined as 12 inches, with the inch being defined by the Mendenhall Order of 1893 as 39.37 inches = 1 m. This makes a U.S. survey foot exactly 1200/3937 meters.
         """
-        if self.__us_survey_feet != None:
-            return self.__us_survey_feet
-        self.__us_survey_feet = self.__convert_from_base(LengthUnits.UsSurveyFoot)
-        return self.__us_survey_feet
+        return self._cached_convert(LengthUnits.UsSurveyFoot)
 
     
     @property
@@ -1224,10 +1587,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__inches != None:
-            return self.__inches
-        self.__inches = self.__convert_from_base(LengthUnits.Inch)
-        return self.__inches
+        return self._cached_convert(LengthUnits.Inch)
 
     
     @property
@@ -1235,10 +1595,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__mils != None:
-            return self.__mils
-        self.__mils = self.__convert_from_base(LengthUnits.Mil)
-        return self.__mils
+        return self._cached_convert(LengthUnits.Mil)
 
     
     @property
@@ -1246,10 +1603,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__nautical_miles != None:
-            return self.__nautical_miles
-        self.__nautical_miles = self.__convert_from_base(LengthUnits.NauticalMile)
-        return self.__nautical_miles
+        return self._cached_convert(LengthUnits.NauticalMile)
 
     
     @property
@@ -1257,10 +1611,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__fathoms != None:
-            return self.__fathoms
-        self.__fathoms = self.__convert_from_base(LengthUnits.Fathom)
-        return self.__fathoms
+        return self._cached_convert(LengthUnits.Fathom)
 
     
     @property
@@ -1268,10 +1619,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__shackles != None:
-            return self.__shackles
-        self.__shackles = self.__convert_from_base(LengthUnits.Shackle)
-        return self.__shackles
+        return self._cached_convert(LengthUnits.Shackle)
 
     
     @property
@@ -1279,10 +1627,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__microinches != None:
-            return self.__microinches
-        self.__microinches = self.__convert_from_base(LengthUnits.Microinch)
-        return self.__microinches
+        return self._cached_convert(LengthUnits.Microinch)
 
     
     @property
@@ -1290,10 +1635,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__printer_points != None:
-            return self.__printer_points
-        self.__printer_points = self.__convert_from_base(LengthUnits.PrinterPoint)
-        return self.__printer_points
+        return self._cached_convert(LengthUnits.PrinterPoint)
 
     
     @property
@@ -1301,10 +1643,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__dtp_points != None:
-            return self.__dtp_points
-        self.__dtp_points = self.__convert_from_base(LengthUnits.DtpPoint)
-        return self.__dtp_points
+        return self._cached_convert(LengthUnits.DtpPoint)
 
     
     @property
@@ -1312,10 +1651,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__printer_picas != None:
-            return self.__printer_picas
-        self.__printer_picas = self.__convert_from_base(LengthUnits.PrinterPica)
-        return self.__printer_picas
+        return self._cached_convert(LengthUnits.PrinterPica)
 
     
     @property
@@ -1323,10 +1659,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__dtp_picas != None:
-            return self.__dtp_picas
-        self.__dtp_picas = self.__convert_from_base(LengthUnits.DtpPica)
-        return self.__dtp_picas
+        return self._cached_convert(LengthUnits.DtpPica)
 
     
     @property
@@ -1334,10 +1667,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__twips != None:
-            return self.__twips
-        self.__twips = self.__convert_from_base(LengthUnits.Twip)
-        return self.__twips
+        return self._cached_convert(LengthUnits.Twip)
 
     
     @property
@@ -1345,10 +1675,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__hands != None:
-            return self.__hands
-        self.__hands = self.__convert_from_base(LengthUnits.Hand)
-        return self.__hands
+        return self._cached_convert(LengthUnits.Hand)
 
     
     @property
@@ -1356,10 +1683,7 @@ class Length(AbstractMeasure):
         """
         One Astronomical Unit is the distance from the solar system Star, the sun, to planet Earth.
         """
-        if self.__astronomical_units != None:
-            return self.__astronomical_units
-        self.__astronomical_units = self.__convert_from_base(LengthUnits.AstronomicalUnit)
-        return self.__astronomical_units
+        return self._cached_convert(LengthUnits.AstronomicalUnit)
 
     
     @property
@@ -1367,10 +1691,7 @@ class Length(AbstractMeasure):
         """
         A parsec is defined as the distance at which one astronomical unit (AU) subtends an angle of one arcsecond.
         """
-        if self.__parsecs != None:
-            return self.__parsecs
-        self.__parsecs = self.__convert_from_base(LengthUnits.Parsec)
-        return self.__parsecs
+        return self._cached_convert(LengthUnits.Parsec)
 
     
     @property
@@ -1378,10 +1699,7 @@ class Length(AbstractMeasure):
         """
         A Light Year (ly) is the distance that light travel during an Earth year, ie 365 days.
         """
-        if self.__light_years != None:
-            return self.__light_years
-        self.__light_years = self.__convert_from_base(LengthUnits.LightYear)
-        return self.__light_years
+        return self._cached_convert(LengthUnits.LightYear)
 
     
     @property
@@ -1389,10 +1707,7 @@ class Length(AbstractMeasure):
         """
         Solar radius is a ratio unit to the radius of the solar system star, the sun.
         """
-        if self.__solar_radiuses != None:
-            return self.__solar_radiuses
-        self.__solar_radiuses = self.__convert_from_base(LengthUnits.SolarRadius)
-        return self.__solar_radiuses
+        return self._cached_convert(LengthUnits.SolarRadius)
 
     
     @property
@@ -1400,10 +1715,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__chains != None:
-            return self.__chains
-        self.__chains = self.__convert_from_base(LengthUnits.Chain)
-        return self.__chains
+        return self._cached_convert(LengthUnits.Chain)
 
     
     @property
@@ -1411,10 +1723,7 @@ class Length(AbstractMeasure):
         """
         Angstrom is a metric unit of length equal to 1e-10 meter
         """
-        if self.__angstroms != None:
-            return self.__angstroms
-        self.__angstroms = self.__convert_from_base(LengthUnits.Angstrom)
-        return self.__angstroms
+        return self._cached_convert(LengthUnits.Angstrom)
 
     
     @property
@@ -1422,10 +1731,7 @@ class Length(AbstractMeasure):
         """
         In radar-related subjects and in JTIDS, a data mile is a unit of distance equal to 6000 feet (1.8288 kilometres or 0.987 nautical miles).
         """
-        if self.__data_miles != None:
-            return self.__data_miles
-        self.__data_miles = self.__convert_from_base(LengthUnits.DataMile)
-        return self.__data_miles
+        return self._cached_convert(LengthUnits.DataMile)
 
     
     @property
@@ -1433,10 +1739,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__femtometers != None:
-            return self.__femtometers
-        self.__femtometers = self.__convert_from_base(LengthUnits.Femtometer)
-        return self.__femtometers
+        return self._cached_convert(LengthUnits.Femtometer)
 
     
     @property
@@ -1444,10 +1747,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__picometers != None:
-            return self.__picometers
-        self.__picometers = self.__convert_from_base(LengthUnits.Picometer)
-        return self.__picometers
+        return self._cached_convert(LengthUnits.Picometer)
 
     
     @property
@@ -1455,10 +1755,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__nanometers != None:
-            return self.__nanometers
-        self.__nanometers = self.__convert_from_base(LengthUnits.Nanometer)
-        return self.__nanometers
+        return self._cached_convert(LengthUnits.Nanometer)
 
     
     @property
@@ -1466,10 +1763,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__micrometers != None:
-            return self.__micrometers
-        self.__micrometers = self.__convert_from_base(LengthUnits.Micrometer)
-        return self.__micrometers
+        return self._cached_convert(LengthUnits.Micrometer)
 
     
     @property
@@ -1477,10 +1771,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__millimeters != None:
-            return self.__millimeters
-        self.__millimeters = self.__convert_from_base(LengthUnits.Millimeter)
-        return self.__millimeters
+        return self._cached_convert(LengthUnits.Millimeter)
 
     
     @property
@@ -1488,10 +1779,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__centimeters != None:
-            return self.__centimeters
-        self.__centimeters = self.__convert_from_base(LengthUnits.Centimeter)
-        return self.__centimeters
+        return self._cached_convert(LengthUnits.Centimeter)
 
     
     @property
@@ -1499,10 +1787,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__decimeters != None:
-            return self.__decimeters
-        self.__decimeters = self.__convert_from_base(LengthUnits.Decimeter)
-        return self.__decimeters
+        return self._cached_convert(LengthUnits.Decimeter)
 
     
     @property
@@ -1510,10 +1795,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__decameters != None:
-            return self.__decameters
-        self.__decameters = self.__convert_from_base(LengthUnits.Decameter)
-        return self.__decameters
+        return self._cached_convert(LengthUnits.Decameter)
 
     
     @property
@@ -1521,10 +1803,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__hectometers != None:
-            return self.__hectometers
-        self.__hectometers = self.__convert_from_base(LengthUnits.Hectometer)
-        return self.__hectometers
+        return self._cached_convert(LengthUnits.Hectometer)
 
     
     @property
@@ -1532,10 +1811,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__kilometers != None:
-            return self.__kilometers
-        self.__kilometers = self.__convert_from_base(LengthUnits.Kilometer)
-        return self.__kilometers
+        return self._cached_convert(LengthUnits.Kilometer)
 
     
     @property
@@ -1543,10 +1819,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__megameters != None:
-            return self.__megameters
-        self.__megameters = self.__convert_from_base(LengthUnits.Megameter)
-        return self.__megameters
+        return self._cached_convert(LengthUnits.Megameter)
 
     
     @property
@@ -1554,10 +1827,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__kilofeet != None:
-            return self.__kilofeet
-        self.__kilofeet = self.__convert_from_base(LengthUnits.Kilofoot)
-        return self.__kilofeet
+        return self._cached_convert(LengthUnits.Kilofoot)
 
     
     @property
@@ -1565,10 +1835,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__kiloparsecs != None:
-            return self.__kiloparsecs
-        self.__kiloparsecs = self.__convert_from_base(LengthUnits.Kiloparsec)
-        return self.__kiloparsecs
+        return self._cached_convert(LengthUnits.Kiloparsec)
 
     
     @property
@@ -1576,10 +1843,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__megaparsecs != None:
-            return self.__megaparsecs
-        self.__megaparsecs = self.__convert_from_base(LengthUnits.Megaparsec)
-        return self.__megaparsecs
+        return self._cached_convert(LengthUnits.Megaparsec)
 
     
     @property
@@ -1587,10 +1851,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__kilolight_years != None:
-            return self.__kilolight_years
-        self.__kilolight_years = self.__convert_from_base(LengthUnits.KilolightYear)
-        return self.__kilolight_years
+        return self._cached_convert(LengthUnits.KilolightYear)
 
     
     @property
@@ -1598,10 +1859,7 @@ class Length(AbstractMeasure):
         """
         
         """
-        if self.__megalight_years != None:
-            return self.__megalight_years
-        self.__megalight_years = self.__convert_from_base(LengthUnits.MegalightYear)
-        return self.__megalight_years
+        return self._cached_convert(LengthUnits.MegalightYear)
 
     
     def to_string(self, unit: LengthUnits = LengthUnits.Meter) -> str:
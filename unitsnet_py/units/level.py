@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class LevelUnits(Enum):
         """
             LevelUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Decibel = 'decibel'
         """
@@ -29,41 +40,256 @@ class Level(AbstractMeasure):
         value (float): The value.
         from_unit (LevelUnits): The Level unit to create from, The default unit is Decibel
     """
-    def __init__(self, value: float, from_unit: LevelUnits = LevelUnits.Decibel):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = LevelUnits
+
+    _base_unit = LevelUnits.Decibel
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 54
+
+    _binary_unit_ids = {
         
-        self.__decibels = None
+        LevelUnits.Decibel: 0,
         
-        self.__nepers = None
+        LevelUnits.Neper: 1,
         
+    }
 
-    def convert(self, unit: LevelUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        LevelUnits.Decibel: lambda value: (value),
+        
+        LevelUnits.Neper: lambda value: (0.115129254 * value),
+        
+    }
 
-    def __convert_from_base(self, from_unit: LevelUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        LevelUnits.Decibel: lambda value: (value),
         
-        if from_unit == LevelUnits.Decibel:
-            return (value)
+        LevelUnits.Neper: lambda value: ((1 / 0.115129254) * value),
         
-        if from_unit == LevelUnits.Neper:
-            return (0.115129254 * value)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        LevelUnits.Decibel: ('1', '0'),
         
-        return None
+        LevelUnits.Neper: ('57564627/500000000', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        LevelUnits.Decibel: ('1', '0'),
+        
+        LevelUnits.Neper: ('500000000/57564627', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: LevelUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == LevelUnits.Decibel:
-            return (value)
+        LevelUnits.Decibel: ('dB',),
         
-        if to_unit == LevelUnits.Neper:
-            return ((1 / 0.115129254) * value)
+        LevelUnits.Neper: ('Np',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: LevelUnits = LevelUnits.Decibel):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: LevelUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: LevelUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: LevelUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: LevelUnits, to_unit: LevelUnits) -> float:
+        """
+        Convert a value from one Level unit to another, without creating a Level instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: LevelUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LevelUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Level._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: LevelUnits, to_unit: LevelUnits) -> List[float]:
+        """
+        Convert many values from one Level unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: LevelUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: LevelUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Level._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: LevelUnits, to_unit: LevelUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Level._convert_many(values, from_unit, to_unit))
 
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: LevelUnits, to_unit: LevelUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Level unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LevelUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LevelUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Level._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: LevelUnits = LevelUnits.Decibel) -> Level:
+        """
+        Create a new instance of Level holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LevelUnits
+        :return: A new instance of Level.
+        :rtype: Level
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Level._from_exact(value, from_unit)
+
+    def to_exact(self, unit: LevelUnits = LevelUnits.Decibel) -> Fraction:
+        """
+        Get the exact value of the Level in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Decibel).
+        :type unit: LevelUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Level:
+        """
+        Parse a Level from a value followed by a unit abbreviation, e.g. "1 dB".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Level.
+        :rtype: Level
+        :raises ValueError: When the string is not a valid or an ambiguous Level.
+        """
+        return Level._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Level]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Level._try_parse(text)
+
+    def to_binary(self, unit: Optional[LevelUnits] = None) -> bytes:
+        """
+        Encode the Level to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: LevelUnits
+        :return: The encoded Level.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Level:
+        """
+        Decode a Level encoded by to_binary.
+
+        :param data: The encoded Level, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Level.
+        :rtype: Level
+        :raises ValueError: When the data is not a valid encoded Level.
+        """
+        return Level._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[LevelUnits] = None) -> dict:
+        """
+        Get the Level DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Decibel).
+        :type hold_in_unit: LevelUnits
+        :return: The Level DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[LevelUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Level:
+        """
+        Create a new instance of Level from its DTO.
+
+        :param dto: The Level DTO, the unit is the LevelUnits value or name.
+        :type dto: dict
+        :return: A new instance of Level.
+        :rtype: Level
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Level._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Level:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Level._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -105,10 +331,7 @@ class Level(AbstractMeasure):
         """
         
         """
-        if self.__decibels != None:
-            return self.__decibels
-        self.__decibels = self.__convert_from_base(LevelUnits.Decibel)
-        return self.__decibels
+        return self._cached_convert(LevelUnits.Decibel)
 
     
     @property
@@ -116,10 +339,7 @@ class Level(AbstractMeasure):
         """
         
         """
-        if self.__nepers != None:
-            return self.__nepers
-        self.__nepers = self.__convert_from_base(LevelUnits.Neper)
-        return self.__nepers
+        return self._cached_convert(LevelUnits.Neper)
 
     
     def to_string(self, unit: LevelUnits = LevelUnits.Decibel) -> str:
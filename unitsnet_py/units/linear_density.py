@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class LinearDensityUnits(Enum):
         """
             LinearDensityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         GramPerMillimeter = 'gram_per_millimeter'
         """
@@ -89,138 +100,401 @@ class LinearDensity(AbstractMeasure):
         value (float): The value.
         from_unit (LinearDensityUnits): The LinearDensity unit to create from, The default unit is KilogramPerMeter
     """
-    def __init__(self, value: float, from_unit: LinearDensityUnits = LinearDensityUnits.KilogramPerMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = LinearDensityUnits
+
+    _base_unit = LinearDensityUnits.KilogramPerMeter
+
+    _dimensions = (-1, 1, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 55
+
+    _binary_unit_ids = {
         
-        self.__grams_per_millimeter = None
+        LinearDensityUnits.GramPerMillimeter: 0,
         
-        self.__grams_per_centimeter = None
+        LinearDensityUnits.GramPerCentimeter: 1,
         
-        self.__grams_per_meter = None
+        LinearDensityUnits.GramPerMeter: 2,
         
-        self.__pounds_per_inch = None
+        LinearDensityUnits.PoundPerInch: 3,
         
-        self.__pounds_per_foot = None
+        LinearDensityUnits.PoundPerFoot: 4,
         
-        self.__micrograms_per_millimeter = None
+        LinearDensityUnits.MicrogramPerMillimeter: 5,
         
-        self.__milligrams_per_millimeter = None
+        LinearDensityUnits.MilligramPerMillimeter: 6,
         
-        self.__kilograms_per_millimeter = None
+        LinearDensityUnits.KilogramPerMillimeter: 7,
         
-        self.__micrograms_per_centimeter = None
+        LinearDensityUnits.MicrogramPerCentimeter: 8,
         
-        self.__milligrams_per_centimeter = None
+        LinearDensityUnits.MilligramPerCentimeter: 9,
         
-        self.__kilograms_per_centimeter = None
+        LinearDensityUnits.KilogramPerCentimeter: 10,
         
-        self.__micrograms_per_meter = None
+        LinearDensityUnits.MicrogramPerMeter: 11,
         
-        self.__milligrams_per_meter = None
+        LinearDensityUnits.MilligramPerMeter: 12,
         
-        self.__kilograms_per_meter = None
+        LinearDensityUnits.KilogramPerMeter: 13,
         
+    }
 
-    def convert(self, unit: LinearDensityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        LinearDensityUnits.GramPerMillimeter: lambda value: (value),
+        
+        LinearDensityUnits.GramPerCentimeter: lambda value: (value / 1e-1),
+        
+        LinearDensityUnits.GramPerMeter: lambda value: (value / 1e-3),
+        
+        LinearDensityUnits.PoundPerInch: lambda value: (value * 5.5997415e-2),
+        
+        LinearDensityUnits.PoundPerFoot: lambda value: (value / 1.48816394),
+        
+        LinearDensityUnits.MicrogramPerMillimeter: lambda value: ((value) / 1e-06),
+        
+        LinearDensityUnits.MilligramPerMillimeter: lambda value: ((value) / 0.001),
+        
+        LinearDensityUnits.KilogramPerMillimeter: lambda value: ((value) / 1000.0),
+        
+        LinearDensityUnits.MicrogramPerCentimeter: lambda value: ((value / 1e-1) / 1e-06),
+        
+        LinearDensityUnits.MilligramPerCentimeter: lambda value: ((value / 1e-1) / 0.001),
+        
+        LinearDensityUnits.KilogramPerCentimeter: lambda value: ((value / 1e-1) / 1000.0),
+        
+        LinearDensityUnits.MicrogramPerMeter: lambda value: ((value / 1e-3) / 1e-06),
+        
+        LinearDensityUnits.MilligramPerMeter: lambda value: ((value / 1e-3) / 0.001),
+        
+        LinearDensityUnits.KilogramPerMeter: lambda value: ((value / 1e-3) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: LinearDensityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        LinearDensityUnits.GramPerMillimeter: lambda value: (value),
+        
+        LinearDensityUnits.GramPerCentimeter: lambda value: (value * 1e-1),
+        
+        LinearDensityUnits.GramPerMeter: lambda value: (value * 1e-3),
+        
+        LinearDensityUnits.PoundPerInch: lambda value: (value / 5.5997415e-2),
+        
+        LinearDensityUnits.PoundPerFoot: lambda value: (value * 1.48816394),
         
-        if from_unit == LinearDensityUnits.GramPerMillimeter:
-            return (value)
+        LinearDensityUnits.MicrogramPerMillimeter: lambda value: ((value) * 1e-06),
         
-        if from_unit == LinearDensityUnits.GramPerCentimeter:
-            return (value / 1e-1)
+        LinearDensityUnits.MilligramPerMillimeter: lambda value: ((value) * 0.001),
         
-        if from_unit == LinearDensityUnits.GramPerMeter:
-            return (value / 1e-3)
+        LinearDensityUnits.KilogramPerMillimeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == LinearDensityUnits.PoundPerInch:
-            return (value * 5.5997415e-2)
+        LinearDensityUnits.MicrogramPerCentimeter: lambda value: ((value * 1e-1) * 1e-06),
         
-        if from_unit == LinearDensityUnits.PoundPerFoot:
-            return (value / 1.48816394)
+        LinearDensityUnits.MilligramPerCentimeter: lambda value: ((value * 1e-1) * 0.001),
         
-        if from_unit == LinearDensityUnits.MicrogramPerMillimeter:
-            return ((value) / 1e-06)
+        LinearDensityUnits.KilogramPerCentimeter: lambda value: ((value * 1e-1) * 1000.0),
         
-        if from_unit == LinearDensityUnits.MilligramPerMillimeter:
-            return ((value) / 0.001)
+        LinearDensityUnits.MicrogramPerMeter: lambda value: ((value * 1e-3) * 1e-06),
         
-        if from_unit == LinearDensityUnits.KilogramPerMillimeter:
-            return ((value) / 1000.0)
+        LinearDensityUnits.MilligramPerMeter: lambda value: ((value * 1e-3) * 0.001),
         
-        if from_unit == LinearDensityUnits.MicrogramPerCentimeter:
-            return ((value / 1e-1) / 1e-06)
+        LinearDensityUnits.KilogramPerMeter: lambda value: ((value * 1e-3) * 1000.0),
         
-        if from_unit == LinearDensityUnits.MilligramPerCentimeter:
-            return ((value / 1e-1) / 0.001)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        LinearDensityUnits.GramPerMillimeter: ('1', '0'),
+        
+        LinearDensityUnits.GramPerCentimeter: ('10', '0'),
+        
+        LinearDensityUnits.GramPerMeter: ('1000', '0'),
+        
+        LinearDensityUnits.PoundPerInch: ('11199483/200000000', '0'),
+        
+        LinearDensityUnits.PoundPerFoot: ('50000000/74408197', '0'),
+        
+        LinearDensityUnits.MicrogramPerMillimeter: ('1000000', '0'),
+        
+        LinearDensityUnits.MilligramPerMillimeter: ('1000', '0'),
+        
+        LinearDensityUnits.KilogramPerMillimeter: ('1/1000', '0'),
+        
+        LinearDensityUnits.MicrogramPerCentimeter: ('10000000', '0'),
         
-        if from_unit == LinearDensityUnits.KilogramPerCentimeter:
-            return ((value / 1e-1) / 1000.0)
+        LinearDensityUnits.MilligramPerCentimeter: ('10000', '0'),
         
-        if from_unit == LinearDensityUnits.MicrogramPerMeter:
-            return ((value / 1e-3) / 1e-06)
+        LinearDensityUnits.KilogramPerCentimeter: ('1/100', '0'),
         
-        if from_unit == LinearDensityUnits.MilligramPerMeter:
-            return ((value / 1e-3) / 0.001)
+        LinearDensityUnits.MicrogramPerMeter: ('1000000000', '0'),
         
-        if from_unit == LinearDensityUnits.KilogramPerMeter:
-            return ((value / 1e-3) / 1000.0)
+        LinearDensityUnits.MilligramPerMeter: ('1000000', '0'),
         
-        return None
+        LinearDensityUnits.KilogramPerMeter: ('1', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        LinearDensityUnits.GramPerMillimeter: ('1', '0'),
+        
+        LinearDensityUnits.GramPerCentimeter: ('1/10', '0'),
+        
+        LinearDensityUnits.GramPerMeter: ('1/1000', '0'),
+        
+        LinearDensityUnits.PoundPerInch: ('200000000/11199483', '0'),
+        
+        LinearDensityUnits.PoundPerFoot: ('74408197/50000000', '0'),
+        
+        LinearDensityUnits.MicrogramPerMillimeter: ('1/1000000', '0'),
+        
+        LinearDensityUnits.MilligramPerMillimeter: ('1/1000', '0'),
+        
+        LinearDensityUnits.KilogramPerMillimeter: ('1000', '0'),
+        
+        LinearDensityUnits.MicrogramPerCentimeter: ('1/10000000', '0'),
+        
+        LinearDensityUnits.MilligramPerCentimeter: ('1/10000', '0'),
+        
+        LinearDensityUnits.KilogramPerCentimeter: ('100', '0'),
+        
+        LinearDensityUnits.MicrogramPerMeter: ('1/1000000000', '0'),
+        
+        LinearDensityUnits.MilligramPerMeter: ('1/1000000', '0'),
+        
+        LinearDensityUnits.KilogramPerMeter: ('1', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: LinearDensityUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == LinearDensityUnits.GramPerMillimeter:
-            return (value)
+        LinearDensityUnits.GramPerMillimeter: ('g/mm',),
         
-        if to_unit == LinearDensityUnits.GramPerCentimeter:
-            return (value * 1e-1)
+        LinearDensityUnits.GramPerCentimeter: ('g/cm',),
         
-        if to_unit == LinearDensityUnits.GramPerMeter:
-            return (value * 1e-3)
+        LinearDensityUnits.GramPerMeter: ('g/m',),
         
-        if to_unit == LinearDensityUnits.PoundPerInch:
-            return (value / 5.5997415e-2)
+        LinearDensityUnits.PoundPerInch: ('lb/in',),
         
-        if to_unit == LinearDensityUnits.PoundPerFoot:
-            return (value * 1.48816394)
+        LinearDensityUnits.PoundPerFoot: ('lb/ft',),
         
-        if to_unit == LinearDensityUnits.MicrogramPerMillimeter:
-            return ((value) * 1e-06)
+        LinearDensityUnits.MicrogramPerMillimeter: ('μg/mm',),
         
-        if to_unit == LinearDensityUnits.MilligramPerMillimeter:
-            return ((value) * 0.001)
+        LinearDensityUnits.MilligramPerMillimeter: ('mg/mm',),
         
-        if to_unit == LinearDensityUnits.KilogramPerMillimeter:
-            return ((value) * 1000.0)
+        LinearDensityUnits.KilogramPerMillimeter: ('kg/mm',),
         
-        if to_unit == LinearDensityUnits.MicrogramPerCentimeter:
-            return ((value * 1e-1) * 1e-06)
+        LinearDensityUnits.MicrogramPerCentimeter: ('μg/cm',),
         
-        if to_unit == LinearDensityUnits.MilligramPerCentimeter:
-            return ((value * 1e-1) * 0.001)
+        LinearDensityUnits.MilligramPerCentimeter: ('mg/cm',),
         
-        if to_unit == LinearDensityUnits.KilogramPerCentimeter:
-            return ((value * 1e-1) * 1000.0)
+        LinearDensityUnits.KilogramPerCentimeter: ('kg/cm',),
         
-        if to_unit == LinearDensityUnits.MicrogramPerMeter:
-            return ((value * 1e-3) * 1e-06)
+        LinearDensityUnits.MicrogramPerMeter: ('μg/m',),
         
-        if to_unit == LinearDensityUnits.MilligramPerMeter:
-            return ((value * 1e-3) * 0.001)
+        LinearDensityUnits.MilligramPerMeter: ('mg/m',),
         
-        if to_unit == LinearDensityUnits.KilogramPerMeter:
-            return ((value * 1e-3) * 1000.0)
+        LinearDensityUnits.KilogramPerMeter: ('kg/m',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: LinearDensityUnits = LinearDensityUnits.KilogramPerMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: LinearDensityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: LinearDensityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
 
 
+    def __convert_to_base(self, value: float, to_unit: LinearDensityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: LinearDensityUnits, to_unit: LinearDensityUnits) -> float:
+        """
+        Convert a value from one LinearDensity unit to another, without creating a LinearDensity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: LinearDensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LinearDensityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return LinearDensity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: LinearDensityUnits, to_unit: LinearDensityUnits) -> List[float]:
+        """
+        Convert many values from one LinearDensity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: LinearDensityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: LinearDensityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return LinearDensity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: LinearDensityUnits, to_unit: LinearDensityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", LinearDensity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: LinearDensityUnits, to_unit: LinearDensityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one LinearDensity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LinearDensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LinearDensityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return LinearDensity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: LinearDensityUnits = LinearDensityUnits.KilogramPerMeter) -> LinearDensity:
+        """
+        Create a new instance of LinearDensity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LinearDensityUnits
+        :return: A new instance of LinearDensity.
+        :rtype: LinearDensity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return LinearDensity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: LinearDensityUnits = LinearDensityUnits.KilogramPerMeter) -> Fraction:
+        """
+        Get the exact value of the LinearDensity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (KilogramPerMeter).
+        :type unit: LinearDensityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> LinearDensity:
+        """
+        Parse a LinearDensity from a value followed by a unit abbreviation, e.g. "1 g/mm".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of LinearDensity.
+        :rtype: LinearDensity
+        :raises ValueError: When the string is not a valid or an ambiguous LinearDensity.
+        """
+        return LinearDensity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[LinearDensity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return LinearDensity._try_parse(text)
+
+    def to_binary(self, unit: Optional[LinearDensityUnits] = None) -> bytes:
+        """
+        Encode the LinearDensity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: LinearDensityUnits
+        :return: The encoded LinearDensity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> LinearDensity:
+        """
+        Decode a LinearDensity encoded by to_binary.
+
+        :param data: The encoded LinearDensity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of LinearDensity.
+        :rtype: LinearDensity
+        :raises ValueError: When the data is not a valid encoded LinearDensity.
+        """
+        return LinearDensity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[LinearDensityUnits] = None) -> dict:
+        """
+        Get the LinearDensity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (KilogramPerMeter).
+        :type hold_in_unit: LinearDensityUnits
+        :return: The LinearDensity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[LinearDensityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> LinearDensity:
+        """
+        Create a new instance of LinearDensity from its DTO.
+
+        :param dto: The LinearDensity DTO, the unit is the LinearDensityUnits value or name.
+        :type dto: dict
+        :return: A new instance of LinearDensity.
+        :rtype: LinearDensity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return LinearDensity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> LinearDensity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return LinearDensity._from_json(text)
+
     @property
     def base_value(self) -> float:
         return self._value
@@ -441,10 +715,7 @@ class LinearDensity(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_millimeter != None:
-            return self.__grams_per_millimeter
-        self.__grams_per_millimeter = self.__convert_from_base(LinearDensityUnits.GramPerMillimeter)
-        return self.__grams_per_millimeter
+        return self._cached_convert(LinearDensityUnits.GramPerMillimeter)
 
     
     @property
@@ -452,10 +723,7 @@ class LinearDensity(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_centimeter != None:
-            return self.__grams_per_centimeter
-        self.__grams_per_centimeter = self.__convert_from_base(LinearDensityUnits.GramPerCentimeter)
-        return self.__grams_per_centimeter
+        return self._cached_convert(LinearDensityUnits.GramPerCentimeter)
 
     
     @property
@@ -463,10 +731,7 @@ class LinearDensity(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_meter != None:
-            return self.__grams_per_meter
-        self.__grams_per_meter = self.__convert_from_base(LinearDensityUnits.GramPerMeter)
-        return self.__grams_per_meter
+        return self._cached_convert(LinearDensityUnits.GramPerMeter)
 
     
     @property
@@ -474,10 +739,7 @@ class LinearDensity(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_inch != None:
-            return self.__pounds_per_inch
-        self.__pounds_per_inch = self.__convert_from_base(LinearDensityUnits.PoundPerInch)
-        return self.__pounds_per_inch
+        return self._cached_convert(LinearDensityUnits.PoundPerInch)
 
     
     @property
@@ -485,10 +747,7 @@ class LinearDensity(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_foot != None:
-            return self.__pounds_per_foot
-        self.__pounds_per_foot = self.__convert_from_base(LinearDensityUnits.PoundPerFoot)
-        return self.__pounds_per_foot
+        return self._cached_convert(LinearDensityUnits.PoundPerFoot)
 
     
     @property
@@ -496,10 +755,7 @@ class LinearDensity(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_millimeter != None:
-            return self.__micrograms_per_millimeter
-        self.__micrograms_per_millimeter = self.__convert_from_base(LinearDensityUnits.MicrogramPerMillimeter)
-        return self.__micrograms_per_millimeter
+        return self._cached_convert(LinearDensityUnits.MicrogramPerMillimeter)
 
     
     @property
@@ -507,10 +763,7 @@ class LinearDensity(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_millimeter != None:
-            return self.__milligrams_per_millimeter
-        self.__milligrams_per_millimeter = self.__convert_from_base(LinearDensityUnits.MilligramPerMillimeter)
-        return self.__milligrams_per_millimeter
+        return self._cached_convert(LinearDensityUnits.MilligramPerMillimeter)
 
     
     @property
@@ -518,10 +771,7 @@ class LinearDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_millimeter != None:
-            return self.__kilograms_per_millimeter
-        self.__kilograms_per_millimeter = self.__convert_from_base(LinearDensityUnits.KilogramPerMillimeter)
-        return self.__kilograms_per_millimeter
+        return self._cached_convert(LinearDensityUnits.KilogramPerMillimeter)
 
     
     @property
@@ -529,10 +779,7 @@ class LinearDensity(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_centimeter != None:
-            return self.__micrograms_per_centimeter
-        self.__micrograms_per_centimeter = self.__convert_from_base(LinearDensityUnits.MicrogramPerCentimeter)
-        return self.__micrograms_per_centimeter
+        return self._cached_convert(LinearDensityUnits.MicrogramPerCentimeter)
 
     
     @property
@@ -540,10 +787,7 @@ class LinearDensity(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_centimeter != None:
-            return self.__milligrams_per_centimeter
-        self.__milligrams_per_centimeter = self.__convert_from_base(LinearDensityUnits.MilligramPerCentimeter)
-        return self.__milligrams_per_centimeter
+        return self._cached_convert(LinearDensityUnits.MilligramPerCentimeter)
 
     
     @property
@@ -551,10 +795,7 @@ class LinearDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_centimeter != None:
-            return self.__kilograms_per_centimeter
-        self.__kilograms_per_centimeter = self.__convert_from_base(LinearDensityUnits.KilogramPerCentimeter)
-        return self.__kilograms_per_centimeter
+        return self._cached_convert(LinearDensityUnits.KilogramPerCentimeter)
 
     
     @property
@@ -562,10 +803,7 @@ class LinearDensity(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_meter != None:
-            return self.__micrograms_per_meter
-        self.__micrograms_per_meter = self.__convert_from_base(LinearDensityUnits.MicrogramPerMeter)
-        return self.__micrograms_per_meter
+        return self._cached_convert(LinearDensityUnits.MicrogramPerMeter)
 
     
     @property
@@ -573,10 +811,7 @@ class LinearDensity(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_meter != None:
-            return self.__milligrams_per_meter
-        self.__milligrams_per_meter = self.__convert_from_base(LinearDensityUnits.MilligramPerMeter)
-        return self.__milligrams_per_meter
+        return self._cached_convert(LinearDensityUnits.MilligramPerMeter)
 
     
     @property
@@ -584,10 +819,7 @@ class LinearDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_meter != None:
-            return self.__kilograms_per_meter
-        self.__kilograms_per_meter = self.__convert_from_base(LinearDensityUnits.KilogramPerMeter)
-        return self.__kilograms_per_meter
+        return self._cached_convert(LinearDensityUnits.KilogramPerMeter)
 
     
     def to_string(self, unit: LinearDensityUnits = LinearDensityUnits.KilogramPerMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class LinearPowerDensityUnits(Enum):
         """
             LinearPowerDensityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         WattPerMeter = 'watt_per_meter'
         """
@@ -144,225 +155,532 @@ class LinearPowerDensity(AbstractMeasure):
         value (float): The value.
         from_unit (LinearPowerDensityUnits): The LinearPowerDensity unit to create from, The default unit is WattPerMeter
     """
-    def __init__(self, value: float, from_unit: LinearPowerDensityUnits = LinearPowerDensityUnits.WattPerMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = LinearPowerDensityUnits
+
+    _base_unit = LinearPowerDensityUnits.WattPerMeter
+
+    _dimensions = (1, 1, -3, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 56
+
+    _binary_unit_ids = {
         
-        self.__watts_per_meter = None
+        LinearPowerDensityUnits.WattPerMeter: 0,
         
-        self.__watts_per_centimeter = None
+        LinearPowerDensityUnits.WattPerCentimeter: 1,
         
-        self.__watts_per_millimeter = None
+        LinearPowerDensityUnits.WattPerMillimeter: 2,
         
-        self.__watts_per_inch = None
+        LinearPowerDensityUnits.WattPerInch: 3,
         
-        self.__watts_per_foot = None
+        LinearPowerDensityUnits.WattPerFoot: 4,
         
-        self.__milliwatts_per_meter = None
+        LinearPowerDensityUnits.MilliwattPerMeter: 5,
         
-        self.__kilowatts_per_meter = None
+        LinearPowerDensityUnits.KilowattPerMeter: 6,
         
-        self.__megawatts_per_meter = None
+        LinearPowerDensityUnits.MegawattPerMeter: 7,
         
-        self.__gigawatts_per_meter = None
+        LinearPowerDensityUnits.GigawattPerMeter: 8,
         
-        self.__milliwatts_per_centimeter = None
+        LinearPowerDensityUnits.MilliwattPerCentimeter: 9,
         
-        self.__kilowatts_per_centimeter = None
+        LinearPowerDensityUnits.KilowattPerCentimeter: 10,
         
-        self.__megawatts_per_centimeter = None
+        LinearPowerDensityUnits.MegawattPerCentimeter: 11,
         
-        self.__gigawatts_per_centimeter = None
+        LinearPowerDensityUnits.GigawattPerCentimeter: 12,
         
-        self.__milliwatts_per_millimeter = None
+        LinearPowerDensityUnits.MilliwattPerMillimeter: 13,
         
-        self.__kilowatts_per_millimeter = None
+        LinearPowerDensityUnits.KilowattPerMillimeter: 14,
         
-        self.__megawatts_per_millimeter = None
+        LinearPowerDensityUnits.MegawattPerMillimeter: 15,
         
-        self.__gigawatts_per_millimeter = None
+        LinearPowerDensityUnits.GigawattPerMillimeter: 16,
         
-        self.__milliwatts_per_inch = None
+        LinearPowerDensityUnits.MilliwattPerInch: 17,
         
-        self.__kilowatts_per_inch = None
+        LinearPowerDensityUnits.KilowattPerInch: 18,
         
-        self.__megawatts_per_inch = None
+        LinearPowerDensityUnits.MegawattPerInch: 19,
         
-        self.__gigawatts_per_inch = None
+        LinearPowerDensityUnits.GigawattPerInch: 20,
         
-        self.__milliwatts_per_foot = None
+        LinearPowerDensityUnits.MilliwattPerFoot: 21,
         
-        self.__kilowatts_per_foot = None
+        LinearPowerDensityUnits.KilowattPerFoot: 22,
         
-        self.__megawatts_per_foot = None
+        LinearPowerDensityUnits.MegawattPerFoot: 23,
         
-        self.__gigawatts_per_foot = None
+        LinearPowerDensityUnits.GigawattPerFoot: 24,
         
+    }
 
-    def convert(self, unit: LinearPowerDensityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        LinearPowerDensityUnits.WattPerMeter: lambda value: (value),
+        
+        LinearPowerDensityUnits.WattPerCentimeter: lambda value: (value / 1e2),
+        
+        LinearPowerDensityUnits.WattPerMillimeter: lambda value: (value / 1e3),
+        
+        LinearPowerDensityUnits.WattPerInch: lambda value: (value / 39.37007874),
+        
+        LinearPowerDensityUnits.WattPerFoot: lambda value: (value / 3.280839895),
+        
+        LinearPowerDensityUnits.MilliwattPerMeter: lambda value: ((value) / 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerMeter: lambda value: ((value) / 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerMeter: lambda value: ((value) / 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerMeter: lambda value: ((value) / 1000000000.0),
+        
+        LinearPowerDensityUnits.MilliwattPerCentimeter: lambda value: ((value / 1e2) / 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerCentimeter: lambda value: ((value / 1e2) / 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerCentimeter: lambda value: ((value / 1e2) / 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerCentimeter: lambda value: ((value / 1e2) / 1000000000.0),
+        
+        LinearPowerDensityUnits.MilliwattPerMillimeter: lambda value: ((value / 1e3) / 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerMillimeter: lambda value: ((value / 1e3) / 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerMillimeter: lambda value: ((value / 1e3) / 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerMillimeter: lambda value: ((value / 1e3) / 1000000000.0),
+        
+        LinearPowerDensityUnits.MilliwattPerInch: lambda value: ((value / 39.37007874) / 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerInch: lambda value: ((value / 39.37007874) / 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerInch: lambda value: ((value / 39.37007874) / 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerInch: lambda value: ((value / 39.37007874) / 1000000000.0),
+        
+        LinearPowerDensityUnits.MilliwattPerFoot: lambda value: ((value / 3.280839895) / 0.001),
+        
+        LinearPowerDensityUnits.KilowattPerFoot: lambda value: ((value / 3.280839895) / 1000.0),
+        
+        LinearPowerDensityUnits.MegawattPerFoot: lambda value: ((value / 3.280839895) / 1000000.0),
+        
+        LinearPowerDensityUnits.GigawattPerFoot: lambda value: ((value / 3.280839895) / 1000000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: LinearPowerDensityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == LinearPowerDensityUnits.WattPerMeter:
-            return (value)
+        LinearPowerDensityUnits.WattPerMeter: lambda value: (value),
         
-        if from_unit == LinearPowerDensityUnits.WattPerCentimeter:
-            return (value / 1e2)
+        LinearPowerDensityUnits.WattPerCentimeter: lambda value: (value * 1e2),
         
-        if from_unit == LinearPowerDensityUnits.WattPerMillimeter:
-            return (value / 1e3)
+        LinearPowerDensityUnits.WattPerMillimeter: lambda value: (value * 1e3),
         
-        if from_unit == LinearPowerDensityUnits.WattPerInch:
-            return (value / 39.37007874)
+        LinearPowerDensityUnits.WattPerInch: lambda value: (value * 39.37007874),
         
-        if from_unit == LinearPowerDensityUnits.WattPerFoot:
-            return (value / 3.280839895)
+        LinearPowerDensityUnits.WattPerFoot: lambda value: (value * 3.280839895),
         
-        if from_unit == LinearPowerDensityUnits.MilliwattPerMeter:
-            return ((value) / 0.001)
+        LinearPowerDensityUnits.MilliwattPerMeter: lambda value: ((value) * 0.001),
         
-        if from_unit == LinearPowerDensityUnits.KilowattPerMeter:
-            return ((value) / 1000.0)
+        LinearPowerDensityUnits.KilowattPerMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == LinearPowerDensityUnits.MegawattPerMeter:
-            return ((value) / 1000000.0)
+        LinearPowerDensityUnits.MegawattPerMeter: lambda value: ((value) * 1000000.0),
         
-        if from_unit == LinearPowerDensityUnits.GigawattPerMeter:
-            return ((value) / 1000000000.0)
+        LinearPowerDensityUnits.GigawattPerMeter: lambda value: ((value) * 1000000000.0),
         
-        if from_unit == LinearPowerDensityUnits.MilliwattPerCentimeter:
-            return ((value / 1e2) / 0.001)
+        LinearPowerDensityUnits.MilliwattPerCentimeter: lambda value: ((value * 1e2) * 0.001),
         
-        if from_unit == LinearPowerDensityUnits.KilowattPerCentimeter:
-            return ((value / 1e2) / 1000.0)
+        LinearPowerDensityUnits.KilowattPerCentimeter: lambda value: ((value * 1e2) * 1000.0),
         
-        if from_unit == LinearPowerDensityUnits.MegawattPerCentimeter:
-            return ((value / 1e2) / 1000000.0)
+        LinearPowerDensityUnits.MegawattPerCentimeter: lambda value: ((value * 1e2) * 1000000.0),
         
-        if from_unit == LinearPowerDensityUnits.GigawattPerCentimeter:
-            return ((value / 1e2) / 1000000000.0)
+        LinearPowerDensityUnits.GigawattPerCentimeter: lambda value: ((value * 1e2) * 1000000000.0),
         
-        if from_unit == LinearPowerDensityUnits.MilliwattPerMillimeter:
-            return ((value / 1e3) / 0.001)
+        LinearPowerDensityUnits.MilliwattPerMillimeter: lambda value: ((value * 1e3) * 0.001),
         
-        if from_unit == LinearPowerDensityUnits.KilowattPerMillimeter:
-            return ((value / 1e3) / 1000.0)
+        LinearPowerDensityUnits.KilowattPerMillimeter: lambda value: ((value * 1e3) * 1000.0),
         
-        if from_unit == LinearPowerDensityUnits.MegawattPerMillimeter:
-            return ((value / 1e3) / 1000000.0)
+        LinearPowerDensityUnits.MegawattPerMillimeter: lambda value: ((value * 1e3) * 1000000.0),
         
-        if from_unit == LinearPowerDensityUnits.GigawattPerMillimeter:
-            return ((value / 1e3) / 1000000000.0)
+        LinearPowerDensityUnits.GigawattPerMillimeter: lambda value: ((value * 1e3) * 1000000000.0),
         
-        if from_unit == LinearPowerDensityUnits.MilliwattPerInch:
-            return ((value / 39.37007874) / 0.001)
+        LinearPowerDensityUnits.MilliwattPerInch: lambda value: ((value * 39.37007874) * 0.001),
         
-        if from_unit == LinearPowerDensityUnits.KilowattPerInch:
-            return ((value / 39.37007874) / 1000.0)
+        LinearPowerDensityUnits.KilowattPerInch: lambda value: ((value * 39.37007874) * 1000.0),
         
-        if from_unit == LinearPowerDensityUnits.MegawattPerInch:
-            return ((value / 39.37007874) / 1000000.0)
+        LinearPowerDensityUnits.MegawattPerInch: lambda value: ((value * 39.37007874) * 1000000.0),
         
-        if from_unit == LinearPowerDensityUnits.GigawattPerInch:
-            return ((value / 39.37007874) / 1000000000.0)
+        LinearPowerDensityUnits.GigawattPerInch: lambda value: ((value * 39.37007874) * 1000000000.0),
         
-        if from_unit == LinearPowerDensityUnits.MilliwattPerFoot:
-            return ((value / 3.280839895) / 0.001)
+        LinearPowerDensityUnits.MilliwattPerFoot: lambda value: ((value * 3.280839895) * 0.001),
         
-        if from_unit == LinearPowerDensityUnits.KilowattPerFoot:
-            return ((value / 3.280839895) / 1000.0)
+        LinearPowerDensityUnits.KilowattPerFoot: lambda value: ((value * 3.280839895) * 1000.0),
         
-        if from_unit == LinearPowerDensityUnits.MegawattPerFoot:
-            return ((value / 3.280839895) / 1000000.0)
+        LinearPowerDensityUnits.MegawattPerFoot: lambda value: ((value * 3.280839895) * 1000000.0),
         
-        if from_unit == LinearPowerDensityUnits.GigawattPerFoot:
-            return ((value / 3.280839895) / 1000000000.0)
+        LinearPowerDensityUnits.GigawattPerFoot: lambda value: ((value * 3.280839895) * 1000000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        LinearPowerDensityUnits.WattPerMeter: ('1', '0'),
+        
+        LinearPowerDensityUnits.WattPerCentimeter: ('1/100', '0'),
+        
+        LinearPowerDensityUnits.WattPerMillimeter: ('1/1000', '0'),
+        
+        LinearPowerDensityUnits.WattPerInch: ('50000000/1968503937', '0'),
+        
+        LinearPowerDensityUnits.WattPerFoot: ('200000000/656167979', '0'),
+        
+        LinearPowerDensityUnits.MilliwattPerMeter: ('1000', '0'),
+        
+        LinearPowerDensityUnits.KilowattPerMeter: ('1/1000', '0'),
+        
+        LinearPowerDensityUnits.MegawattPerMeter: ('1/1000000', '0'),
+        
+        LinearPowerDensityUnits.GigawattPerMeter: ('1/1000000000', '0'),
+        
+        LinearPowerDensityUnits.MilliwattPerCentimeter: ('10', '0'),
+        
+        LinearPowerDensityUnits.KilowattPerCentimeter: ('1/100000', '0'),
+        
+        LinearPowerDensityUnits.MegawattPerCentimeter: ('1/100000000', '0'),
+        
+        LinearPowerDensityUnits.GigawattPerCentimeter: ('1/100000000000', '0'),
+        
+        LinearPowerDensityUnits.MilliwattPerMillimeter: ('1', '0'),
+        
+        LinearPowerDensityUnits.KilowattPerMillimeter: ('1/1000000', '0'),
+        
+        LinearPowerDensityUnits.MegawattPerMillimeter: ('1/1000000000', '0'),
+        
+        LinearPowerDensityUnits.GigawattPerMillimeter: ('1/1000000000000', '0'),
+        
+        LinearPowerDensityUnits.MilliwattPerInch: ('50000000000/1968503937', '0'),
+        
+        LinearPowerDensityUnits.KilowattPerInch: ('50000/1968503937', '0'),
+        
+        LinearPowerDensityUnits.MegawattPerInch: ('50/1968503937', '0'),
+        
+        LinearPowerDensityUnits.GigawattPerInch: ('1/39370078740', '0'),
+        
+        LinearPowerDensityUnits.MilliwattPerFoot: ('200000000000/656167979', '0'),
+        
+        LinearPowerDensityUnits.KilowattPerFoot: ('200000/656167979', '0'),
+        
+        LinearPowerDensityUnits.MegawattPerFoot: ('200/656167979', '0'),
+        
+        LinearPowerDensityUnits.GigawattPerFoot: ('1/3280839895', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: LinearPowerDensityUnits) -> float:
+    _affine_to_base = {
+        
+        LinearPowerDensityUnits.WattPerMeter: ('1', '0'),
+        
+        LinearPowerDensityUnits.WattPerCentimeter: ('100', '0'),
+        
+        LinearPowerDensityUnits.WattPerMillimeter: ('1000', '0'),
+        
+        LinearPowerDensityUnits.WattPerInch: ('1968503937/50000000', '0'),
+        
+        LinearPowerDensityUnits.WattPerFoot: ('656167979/200000000', '0'),
+        
+        LinearPowerDensityUnits.MilliwattPerMeter: ('1/1000', '0'),
+        
+        LinearPowerDensityUnits.KilowattPerMeter: ('1000', '0'),
+        
+        LinearPowerDensityUnits.MegawattPerMeter: ('1000000', '0'),
+        
+        LinearPowerDensityUnits.GigawattPerMeter: ('1000000000', '0'),
+        
+        LinearPowerDensityUnits.MilliwattPerCentimeter: ('1/10', '0'),
+        
+        LinearPowerDensityUnits.KilowattPerCentimeter: ('100000', '0'),
+        
+        LinearPowerDensityUnits.MegawattPerCentimeter: ('100000000', '0'),
+        
+        LinearPowerDensityUnits.GigawattPerCentimeter: ('100000000000', '0'),
+        
+        LinearPowerDensityUnits.MilliwattPerMillimeter: ('1', '0'),
+        
+        LinearPowerDensityUnits.KilowattPerMillimeter: ('1000000', '0'),
+        
+        LinearPowerDensityUnits.MegawattPerMillimeter: ('1000000000', '0'),
+        
+        LinearPowerDensityUnits.GigawattPerMillimeter: ('1000000000000', '0'),
+        
+        LinearPowerDensityUnits.MilliwattPerInch: ('1968503937/50000000000', '0'),
+        
+        LinearPowerDensityUnits.KilowattPerInch: ('1968503937/50000', '0'),
+        
+        LinearPowerDensityUnits.MegawattPerInch: ('1968503937/50', '0'),
         
-        if to_unit == LinearPowerDensityUnits.WattPerMeter:
-            return (value)
+        LinearPowerDensityUnits.GigawattPerInch: ('39370078740', '0'),
         
-        if to_unit == LinearPowerDensityUnits.WattPerCentimeter:
-            return (value * 1e2)
+        LinearPowerDensityUnits.MilliwattPerFoot: ('656167979/200000000000', '0'),
         
-        if to_unit == LinearPowerDensityUnits.WattPerMillimeter:
-            return (value * 1e3)
+        LinearPowerDensityUnits.KilowattPerFoot: ('656167979/200000', '0'),
         
-        if to_unit == LinearPowerDensityUnits.WattPerInch:
-            return (value * 39.37007874)
+        LinearPowerDensityUnits.MegawattPerFoot: ('656167979/200', '0'),
         
-        if to_unit == LinearPowerDensityUnits.WattPerFoot:
-            return (value * 3.280839895)
+        LinearPowerDensityUnits.GigawattPerFoot: ('3280839895', '0'),
         
-        if to_unit == LinearPowerDensityUnits.MilliwattPerMeter:
-            return ((value) * 0.001)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        LinearPowerDensityUnits.WattPerMeter: ('W/m',),
+        
+        LinearPowerDensityUnits.WattPerCentimeter: ('W/cm',),
+        
+        LinearPowerDensityUnits.WattPerMillimeter: ('W/mm',),
+        
+        LinearPowerDensityUnits.WattPerInch: ('W/in',),
+        
+        LinearPowerDensityUnits.WattPerFoot: ('W/ft',),
         
-        if to_unit == LinearPowerDensityUnits.KilowattPerMeter:
-            return ((value) * 1000.0)
+        LinearPowerDensityUnits.MilliwattPerMeter: ('mW/m',),
         
-        if to_unit == LinearPowerDensityUnits.MegawattPerMeter:
-            return ((value) * 1000000.0)
+        LinearPowerDensityUnits.KilowattPerMeter: ('kW/m',),
         
-        if to_unit == LinearPowerDensityUnits.GigawattPerMeter:
-            return ((value) * 1000000000.0)
+        LinearPowerDensityUnits.MegawattPerMeter: ('MW/m',),
         
-        if to_unit == LinearPowerDensityUnits.MilliwattPerCentimeter:
-            return ((value * 1e2) * 0.001)
+        LinearPowerDensityUnits.GigawattPerMeter: ('GW/m',),
         
-        if to_unit == LinearPowerDensityUnits.KilowattPerCentimeter:
-            return ((value * 1e2) * 1000.0)
+        LinearPowerDensityUnits.MilliwattPerCentimeter: ('mW/cm',),
         
-        if to_unit == LinearPowerDensityUnits.MegawattPerCentimeter:
-            return ((value * 1e2) * 1000000.0)
+        LinearPowerDensityUnits.KilowattPerCentimeter: ('kW/cm',),
         
-        if to_unit == LinearPowerDensityUnits.GigawattPerCentimeter:
-            return ((value * 1e2) * 1000000000.0)
+        LinearPowerDensityUnits.MegawattPerCentimeter: ('MW/cm',),
         
-        if to_unit == LinearPowerDensityUnits.MilliwattPerMillimeter:
-            return ((value * 1e3) * 0.001)
+        LinearPowerDensityUnits.GigawattPerCentimeter: ('GW/cm',),
         
-        if to_unit == LinearPowerDensityUnits.KilowattPerMillimeter:
-            return ((value * 1e3) * 1000.0)
+        LinearPowerDensityUnits.MilliwattPerMillimeter: ('mW/mm',),
         
-        if to_unit == LinearPowerDensityUnits.MegawattPerMillimeter:
-            return ((value * 1e3) * 1000000.0)
+        LinearPowerDensityUnits.KilowattPerMillimeter: ('kW/mm',),
         
-        if to_unit == LinearPowerDensityUnits.GigawattPerMillimeter:
-            return ((value * 1e3) * 1000000000.0)
+        LinearPowerDensityUnits.MegawattPerMillimeter: ('MW/mm',),
         
-        if to_unit == LinearPowerDensityUnits.MilliwattPerInch:
-            return ((value * 39.37007874) * 0.001)
+        LinearPowerDensityUnits.GigawattPerMillimeter: ('GW/mm',),
         
-        if to_unit == LinearPowerDensityUnits.KilowattPerInch:
-            return ((value * 39.37007874) * 1000.0)
+        LinearPowerDensityUnits.MilliwattPerInch: ('mW/in',),
         
-        if to_unit == LinearPowerDensityUnits.MegawattPerInch:
-            return ((value * 39.37007874) * 1000000.0)
+        LinearPowerDensityUnits.KilowattPerInch: ('kW/in',),
         
-        if to_unit == LinearPowerDensityUnits.GigawattPerInch:
-            return ((value * 39.37007874) * 1000000000.0)
+        LinearPowerDensityUnits.MegawattPerInch: ('MW/in',),
         
-        if to_unit == LinearPowerDensityUnits.MilliwattPerFoot:
-            return ((value * 3.280839895) * 0.001)
+        LinearPowerDensityUnits.GigawattPerInch: ('GW/in',),
         
-        if to_unit == LinearPowerDensityUnits.KilowattPerFoot:
-            return ((value * 3.280839895) * 1000.0)
+        LinearPowerDensityUnits.MilliwattPerFoot: ('mW/ft',),
         
-        if to_unit == LinearPowerDensityUnits.MegawattPerFoot:
-            return ((value * 3.280839895) * 1000000.0)
+        LinearPowerDensityUnits.KilowattPerFoot: ('kW/ft',),
         
-        if to_unit == LinearPowerDensityUnits.GigawattPerFoot:
-            return ((value * 3.280839895) * 1000000000.0)
+        LinearPowerDensityUnits.MegawattPerFoot: ('MW/ft',),
         
-        return None
+        LinearPowerDensityUnits.GigawattPerFoot: ('GW/ft',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: LinearPowerDensityUnits = LinearPowerDensityUnits.WattPerMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: LinearPowerDensityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: LinearPowerDensityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: LinearPowerDensityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: LinearPowerDensityUnits, to_unit: LinearPowerDensityUnits) -> float:
+        """
+        Convert a value from one LinearPowerDensity unit to another, without creating a LinearPowerDensity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: LinearPowerDensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LinearPowerDensityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return LinearPowerDensity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: LinearPowerDensityUnits, to_unit: LinearPowerDensityUnits) -> List[float]:
+        """
+        Convert many values from one LinearPowerDensity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: LinearPowerDensityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: LinearPowerDensityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return LinearPowerDensity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: LinearPowerDensityUnits, to_unit: LinearPowerDensityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", LinearPowerDensity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: LinearPowerDensityUnits, to_unit: LinearPowerDensityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one LinearPowerDensity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LinearPowerDensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LinearPowerDensityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return LinearPowerDensity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: LinearPowerDensityUnits = LinearPowerDensityUnits.WattPerMeter) -> LinearPowerDensity:
+        """
+        Create a new instance of LinearPowerDensity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LinearPowerDensityUnits
+        :return: A new instance of LinearPowerDensity.
+        :rtype: LinearPowerDensity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return LinearPowerDensity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: LinearPowerDensityUnits = LinearPowerDensityUnits.WattPerMeter) -> Fraction:
+        """
+        Get the exact value of the LinearPowerDensity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (WattPerMeter).
+        :type unit: LinearPowerDensityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
 
+    @staticmethod
+    def parse(text: str) -> LinearPowerDensity:
+        """
+        Parse a LinearPowerDensity from a value followed by a unit abbreviation, e.g. "1 W/m".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of LinearPowerDensity.
+        :rtype: LinearPowerDensity
+        :raises ValueError: When the string is not a valid or an ambiguous LinearPowerDensity.
+        """
+        return LinearPowerDensity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[LinearPowerDensity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return LinearPowerDensity._try_parse(text)
+
+    def to_binary(self, unit: Optional[LinearPowerDensityUnits] = None) -> bytes:
+        """
+        Encode the LinearPowerDensity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: LinearPowerDensityUnits
+        :return: The encoded LinearPowerDensity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> LinearPowerDensity:
+        """
+        Decode a LinearPowerDensity encoded by to_binary.
+
+        :param data: The encoded LinearPowerDensity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of LinearPowerDensity.
+        :rtype: LinearPowerDensity
+        :raises ValueError: When the data is not a valid encoded LinearPowerDensity.
+        """
+        return LinearPowerDensity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[LinearPowerDensityUnits] = None) -> dict:
+        """
+        Get the LinearPowerDensity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (WattPerMeter).
+        :type hold_in_unit: LinearPowerDensityUnits
+        :return: The LinearPowerDensity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[LinearPowerDensityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> LinearPowerDensity:
+        """
+        Create a new instance of LinearPowerDensity from its DTO.
+
+        :param dto: The LinearPowerDensity DTO, the unit is the LinearPowerDensityUnits value or name.
+        :type dto: dict
+        :return: A new instance of LinearPowerDensity.
+        :rtype: LinearPowerDensity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return LinearPowerDensity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> LinearPowerDensity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return LinearPowerDensity._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -749,10 +1067,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_meter != None:
-            return self.__watts_per_meter
-        self.__watts_per_meter = self.__convert_from_base(LinearPowerDensityUnits.WattPerMeter)
-        return self.__watts_per_meter
+        return self._cached_convert(LinearPowerDensityUnits.WattPerMeter)
 
     
     @property
@@ -760,10 +1075,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_centimeter != None:
-            return self.__watts_per_centimeter
-        self.__watts_per_centimeter = self.__convert_from_base(LinearPowerDensityUnits.WattPerCentimeter)
-        return self.__watts_per_centimeter
+        return self._cached_convert(LinearPowerDensityUnits.WattPerCentimeter)
 
     
     @property
@@ -771,10 +1083,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_millimeter != None:
-            return self.__watts_per_millimeter
-        self.__watts_per_millimeter = self.__convert_from_base(LinearPowerDensityUnits.WattPerMillimeter)
-        return self.__watts_per_millimeter
+        return self._cached_convert(LinearPowerDensityUnits.WattPerMillimeter)
 
     
     @property
@@ -782,10 +1091,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_inch != None:
-            return self.__watts_per_inch
-        self.__watts_per_inch = self.__convert_from_base(LinearPowerDensityUnits.WattPerInch)
-        return self.__watts_per_inch
+        return self._cached_convert(LinearPowerDensityUnits.WattPerInch)
 
     
     @property
@@ -793,10 +1099,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_foot != None:
-            return self.__watts_per_foot
-        self.__watts_per_foot = self.__convert_from_base(LinearPowerDensityUnits.WattPerFoot)
-        return self.__watts_per_foot
+        return self._cached_convert(LinearPowerDensityUnits.WattPerFoot)
 
     
     @property
@@ -804,10 +1107,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__milliwatts_per_meter != None:
-            return self.__milliwatts_per_meter
-        self.__milliwatts_per_meter = self.__convert_from_base(LinearPowerDensityUnits.MilliwattPerMeter)
-        return self.__milliwatts_per_meter
+        return self._cached_convert(LinearPowerDensityUnits.MilliwattPerMeter)
 
     
     @property
@@ -815,10 +1115,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilowatts_per_meter != None:
-            return self.__kilowatts_per_meter
-        self.__kilowatts_per_meter = self.__convert_from_base(LinearPowerDensityUnits.KilowattPerMeter)
-        return self.__kilowatts_per_meter
+        return self._cached_convert(LinearPowerDensityUnits.KilowattPerMeter)
 
     
     @property
@@ -826,10 +1123,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__megawatts_per_meter != None:
-            return self.__megawatts_per_meter
-        self.__megawatts_per_meter = self.__convert_from_base(LinearPowerDensityUnits.MegawattPerMeter)
-        return self.__megawatts_per_meter
+        return self._cached_convert(LinearPowerDensityUnits.MegawattPerMeter)
 
     
     @property
@@ -837,10 +1131,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__gigawatts_per_meter != None:
-            return self.__gigawatts_per_meter
-        self.__gigawatts_per_meter = self.__convert_from_base(LinearPowerDensityUnits.GigawattPerMeter)
-        return self.__gigawatts_per_meter
+        return self._cached_convert(LinearPowerDensityUnits.GigawattPerMeter)
 
     
     @property
@@ -848,10 +1139,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__milliwatts_per_centimeter != None:
-            return self.__milliwatts_per_centimeter
-        self.__milliwatts_per_centimeter = self.__convert_from_base(LinearPowerDensityUnits.MilliwattPerCentimeter)
-        return self.__milliwatts_per_centimeter
+        return self._cached_convert(LinearPowerDensityUnits.MilliwattPerCentimeter)
 
     
     @property
@@ -859,10 +1147,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilowatts_per_centimeter != None:
-            return self.__kilowatts_per_centimeter
-        self.__kilowatts_per_centimeter = self.__convert_from_base(LinearPowerDensityUnits.KilowattPerCentimeter)
-        return self.__kilowatts_per_centimeter
+        return self._cached_convert(LinearPowerDensityUnits.KilowattPerCentimeter)
 
     
     @property
@@ -870,10 +1155,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__megawatts_per_centimeter != None:
-            return self.__megawatts_per_centimeter
-        self.__megawatts_per_centimeter = self.__convert_from_base(LinearPowerDensityUnits.MegawattPerCentimeter)
-        return self.__megawatts_per_centimeter
+        return self._cached_convert(LinearPowerDensityUnits.MegawattPerCentimeter)
 
     
     @property
@@ -881,10 +1163,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__gigawatts_per_centimeter != None:
-            return self.__gigawatts_per_centimeter
-        self.__gigawatts_per_centimeter = self.__convert_from_base(LinearPowerDensityUnits.GigawattPerCentimeter)
-        return self.__gigawatts_per_centimeter
+        return self._cached_convert(LinearPowerDensityUnits.GigawattPerCentimeter)
 
     
     @property
@@ -892,10 +1171,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__milliwatts_per_millimeter != None:
-            return self.__milliwatts_per_millimeter
-        self.__milliwatts_per_millimeter = self.__convert_from_base(LinearPowerDensityUnits.MilliwattPerMillimeter)
-        return self.__milliwatts_per_millimeter
+        return self._cached_convert(LinearPowerDensityUnits.MilliwattPerMillimeter)
 
     
     @property
@@ -903,10 +1179,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilowatts_per_millimeter != None:
-            return self.__kilowatts_per_millimeter
-        self.__kilowatts_per_millimeter = self.__convert_from_base(LinearPowerDensityUnits.KilowattPerMillimeter)
-        return self.__kilowatts_per_millimeter
+        return self._cached_convert(LinearPowerDensityUnits.KilowattPerMillimeter)
 
     
     @property
@@ -914,10 +1187,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__megawatts_per_millimeter != None:
-            return self.__megawatts_per_millimeter
-        self.__megawatts_per_millimeter = self.__convert_from_base(LinearPowerDensityUnits.MegawattPerMillimeter)
-        return self.__megawatts_per_millimeter
+        return self._cached_convert(LinearPowerDensityUnits.MegawattPerMillimeter)
 
     
     @property
@@ -925,10 +1195,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__gigawatts_per_millimeter != None:
-            return self.__gigawatts_per_millimeter
-        self.__gigawatts_per_millimeter = self.__convert_from_base(LinearPowerDensityUnits.GigawattPerMillimeter)
-        return self.__gigawatts_per_millimeter
+        return self._cached_convert(LinearPowerDensityUnits.GigawattPerMillimeter)
 
     
     @property
@@ -936,10 +1203,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__milliwatts_per_inch != None:
-            return self.__milliwatts_per_inch
-        self.__milliwatts_per_inch = self.__convert_from_base(LinearPowerDensityUnits.MilliwattPerInch)
-        return self.__milliwatts_per_inch
+        return self._cached_convert(LinearPowerDensityUnits.MilliwattPerInch)
 
     
     @property
@@ -947,10 +1211,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilowatts_per_inch != None:
-            return self.__kilowatts_per_inch
-        self.__kilowatts_per_inch = self.__convert_from_base(LinearPowerDensityUnits.KilowattPerInch)
-        return self.__kilowatts_per_inch
+        return self._cached_convert(LinearPowerDensityUnits.KilowattPerInch)
 
     
     @property
@@ -958,10 +1219,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__megawatts_per_inch != None:
-            return self.__megawatts_per_inch
-        self.__megawatts_per_inch = self.__convert_from_base(LinearPowerDensityUnits.MegawattPerInch)
-        return self.__megawatts_per_inch
+        return self._cached_convert(LinearPowerDensityUnits.MegawattPerInch)
 
     
     @property
@@ -969,10 +1227,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__gigawatts_per_inch != None:
-            return self.__gigawatts_per_inch
-        self.__gigawatts_per_inch = self.__convert_from_base(LinearPowerDensityUnits.GigawattPerInch)
-        return self.__gigawatts_per_inch
+        return self._cached_convert(LinearPowerDensityUnits.GigawattPerInch)
 
     
     @property
@@ -980,10 +1235,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__milliwatts_per_foot != None:
-            return self.__milliwatts_per_foot
-        self.__milliwatts_per_foot = self.__convert_from_base(LinearPowerDensityUnits.MilliwattPerFoot)
-        return self.__milliwatts_per_foot
+        return self._cached_convert(LinearPowerDensityUnits.MilliwattPerFoot)
 
     
     @property
@@ -991,10 +1243,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilowatts_per_foot != None:
-            return self.__kilowatts_per_foot
-        self.__kilowatts_per_foot = self.__convert_from_base(LinearPowerDensityUnits.KilowattPerFoot)
-        return self.__kilowatts_per_foot
+        return self._cached_convert(LinearPowerDensityUnits.KilowattPerFoot)
 
     
     @property
@@ -1002,10 +1251,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__megawatts_per_foot != None:
-            return self.__megawatts_per_foot
-        self.__megawatts_per_foot = self.__convert_from_base(LinearPowerDensityUnits.MegawattPerFoot)
-        return self.__megawatts_per_foot
+        return self._cached_convert(LinearPowerDensityUnits.MegawattPerFoot)
 
     
     @property
@@ -1013,10 +1259,7 @@ class LinearPowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__gigawatts_per_foot != None:
-            return self.__gigawatts_per_foot
-        self.__gigawatts_per_foot = self.__convert_from_base(LinearPowerDensityUnits.GigawattPerFoot)
-        return self.__gigawatts_per_foot
+        return self._cached_convert(LinearPowerDensityUnits.GigawattPerFoot)
 
     
     def to_string(self, unit: LinearPowerDensityUnits = LinearPowerDensityUnits.WattPerMeter) -> str:
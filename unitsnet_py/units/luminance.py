@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class LuminanceUnits(Enum):
         """
             LuminanceUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         CandelaPerSquareMeter = 'candela_per_square_meter'
         """
@@ -69,105 +80,352 @@ class Luminance(AbstractMeasure):
         value (float): The value.
         from_unit (LuminanceUnits): The Luminance unit to create from, The default unit is CandelaPerSquareMeter
     """
-    def __init__(self, value: float, from_unit: LuminanceUnits = LuminanceUnits.CandelaPerSquareMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = LuminanceUnits
+
+    _base_unit = LuminanceUnits.CandelaPerSquareMeter
+
+    _dimensions = (-2, 0, 0, 0, 0, 0, 1)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 57
+
+    _binary_unit_ids = {
         
-        self.__candelas_per_square_meter = None
+        LuminanceUnits.CandelaPerSquareMeter: 0,
         
-        self.__candelas_per_square_foot = None
+        LuminanceUnits.CandelaPerSquareFoot: 1,
         
-        self.__candelas_per_square_inch = None
+        LuminanceUnits.CandelaPerSquareInch: 2,
         
-        self.__nits = None
+        LuminanceUnits.Nit: 3,
         
-        self.__nanocandelas_per_square_meter = None
+        LuminanceUnits.NanocandelaPerSquareMeter: 4,
         
-        self.__microcandelas_per_square_meter = None
+        LuminanceUnits.MicrocandelaPerSquareMeter: 5,
         
-        self.__millicandelas_per_square_meter = None
+        LuminanceUnits.MillicandelaPerSquareMeter: 6,
         
-        self.__centicandelas_per_square_meter = None
+        LuminanceUnits.CenticandelaPerSquareMeter: 7,
         
-        self.__decicandelas_per_square_meter = None
+        LuminanceUnits.DecicandelaPerSquareMeter: 8,
         
-        self.__kilocandelas_per_square_meter = None
+        LuminanceUnits.KilocandelaPerSquareMeter: 9,
         
+    }
 
-    def convert(self, unit: LuminanceUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        LuminanceUnits.CandelaPerSquareMeter: lambda value: (value),
+        
+        LuminanceUnits.CandelaPerSquareFoot: lambda value: (value/ 1.07639e1),
+        
+        LuminanceUnits.CandelaPerSquareInch: lambda value: (value/ 1.5500031e3),
+        
+        LuminanceUnits.Nit: lambda value: (value),
+        
+        LuminanceUnits.NanocandelaPerSquareMeter: lambda value: ((value) / 1e-09),
+        
+        LuminanceUnits.MicrocandelaPerSquareMeter: lambda value: ((value) / 1e-06),
+        
+        LuminanceUnits.MillicandelaPerSquareMeter: lambda value: ((value) / 0.001),
+        
+        LuminanceUnits.CenticandelaPerSquareMeter: lambda value: ((value) / 0.01),
+        
+        LuminanceUnits.DecicandelaPerSquareMeter: lambda value: ((value) / 0.1),
+        
+        LuminanceUnits.KilocandelaPerSquareMeter: lambda value: ((value) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: LuminanceUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        LuminanceUnits.CandelaPerSquareMeter: lambda value: (value),
+        
+        LuminanceUnits.CandelaPerSquareFoot: lambda value: (value* 1.07639e1),
+        
+        LuminanceUnits.CandelaPerSquareInch: lambda value: (value* 1.5500031e3),
+        
+        LuminanceUnits.Nit: lambda value: (value),
+        
+        LuminanceUnits.NanocandelaPerSquareMeter: lambda value: ((value) * 1e-09),
+        
+        LuminanceUnits.MicrocandelaPerSquareMeter: lambda value: ((value) * 1e-06),
         
-        if from_unit == LuminanceUnits.CandelaPerSquareMeter:
-            return (value)
+        LuminanceUnits.MillicandelaPerSquareMeter: lambda value: ((value) * 0.001),
         
-        if from_unit == LuminanceUnits.CandelaPerSquareFoot:
-            return (value/ 1.07639e1)
+        LuminanceUnits.CenticandelaPerSquareMeter: lambda value: ((value) * 0.01),
         
-        if from_unit == LuminanceUnits.CandelaPerSquareInch:
-            return (value/ 1.5500031e3)
+        LuminanceUnits.DecicandelaPerSquareMeter: lambda value: ((value) * 0.1),
         
-        if from_unit == LuminanceUnits.Nit:
-            return (value)
+        LuminanceUnits.KilocandelaPerSquareMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == LuminanceUnits.NanocandelaPerSquareMeter:
-            return ((value) / 1e-09)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        LuminanceUnits.CandelaPerSquareMeter: ('1', '0'),
+        
+        LuminanceUnits.CandelaPerSquareFoot: ('10000/107639', '0'),
+        
+        LuminanceUnits.CandelaPerSquareInch: ('10000/15500031', '0'),
+        
+        LuminanceUnits.Nit: ('1', '0'),
         
-        if from_unit == LuminanceUnits.MicrocandelaPerSquareMeter:
-            return ((value) / 1e-06)
+        LuminanceUnits.NanocandelaPerSquareMeter: ('1000000000', '0'),
         
-        if from_unit == LuminanceUnits.MillicandelaPerSquareMeter:
-            return ((value) / 0.001)
+        LuminanceUnits.MicrocandelaPerSquareMeter: ('1000000', '0'),
         
-        if from_unit == LuminanceUnits.CenticandelaPerSquareMeter:
-            return ((value) / 0.01)
+        LuminanceUnits.MillicandelaPerSquareMeter: ('1000', '0'),
         
-        if from_unit == LuminanceUnits.DecicandelaPerSquareMeter:
-            return ((value) / 0.1)
+        LuminanceUnits.CenticandelaPerSquareMeter: ('100', '0'),
         
-        if from_unit == LuminanceUnits.KilocandelaPerSquareMeter:
-            return ((value) / 1000.0)
+        LuminanceUnits.DecicandelaPerSquareMeter: ('10', '0'),
         
-        return None
+        LuminanceUnits.KilocandelaPerSquareMeter: ('1/1000', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        LuminanceUnits.CandelaPerSquareMeter: ('1', '0'),
+        
+        LuminanceUnits.CandelaPerSquareFoot: ('107639/10000', '0'),
+        
+        LuminanceUnits.CandelaPerSquareInch: ('15500031/10000', '0'),
+        
+        LuminanceUnits.Nit: ('1', '0'),
+        
+        LuminanceUnits.NanocandelaPerSquareMeter: ('1/1000000000', '0'),
+        
+        LuminanceUnits.MicrocandelaPerSquareMeter: ('1/1000000', '0'),
+        
+        LuminanceUnits.MillicandelaPerSquareMeter: ('1/1000', '0'),
+        
+        LuminanceUnits.CenticandelaPerSquareMeter: ('1/100', '0'),
+        
+        LuminanceUnits.DecicandelaPerSquareMeter: ('1/10', '0'),
+        
+        LuminanceUnits.KilocandelaPerSquareMeter: ('1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: LuminanceUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == LuminanceUnits.CandelaPerSquareMeter:
-            return (value)
+        LuminanceUnits.CandelaPerSquareMeter: ('Cd/m²',),
         
-        if to_unit == LuminanceUnits.CandelaPerSquareFoot:
-            return (value* 1.07639e1)
+        LuminanceUnits.CandelaPerSquareFoot: ('Cd/ft²',),
         
-        if to_unit == LuminanceUnits.CandelaPerSquareInch:
-            return (value* 1.5500031e3)
+        LuminanceUnits.CandelaPerSquareInch: ('Cd/in²',),
         
-        if to_unit == LuminanceUnits.Nit:
-            return (value)
+        LuminanceUnits.Nit: ('nt',),
         
-        if to_unit == LuminanceUnits.NanocandelaPerSquareMeter:
-            return ((value) * 1e-09)
+        LuminanceUnits.NanocandelaPerSquareMeter: ('nCd/m²',),
         
-        if to_unit == LuminanceUnits.MicrocandelaPerSquareMeter:
-            return ((value) * 1e-06)
+        LuminanceUnits.MicrocandelaPerSquareMeter: ('μCd/m²',),
         
-        if to_unit == LuminanceUnits.MillicandelaPerSquareMeter:
-            return ((value) * 0.001)
+        LuminanceUnits.MillicandelaPerSquareMeter: ('mCd/m²',),
         
-        if to_unit == LuminanceUnits.CenticandelaPerSquareMeter:
-            return ((value) * 0.01)
+        LuminanceUnits.CenticandelaPerSquareMeter: ('cCd/m²',),
         
-        if to_unit == LuminanceUnits.DecicandelaPerSquareMeter:
-            return ((value) * 0.1)
+        LuminanceUnits.DecicandelaPerSquareMeter: ('dCd/m²',),
         
-        if to_unit == LuminanceUnits.KilocandelaPerSquareMeter:
-            return ((value) * 1000.0)
+        LuminanceUnits.KilocandelaPerSquareMeter: ('kCd/m²',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: LuminanceUnits = LuminanceUnits.CandelaPerSquareMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: LuminanceUnits) -> float:
+        return self.__convert_from_base(unit)
 
+    def __convert_from_base(self, from_unit: LuminanceUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: LuminanceUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: LuminanceUnits, to_unit: LuminanceUnits) -> float:
+        """
+        Convert a value from one Luminance unit to another, without creating a Luminance instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: LuminanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LuminanceUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Luminance._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: LuminanceUnits, to_unit: LuminanceUnits) -> List[float]:
+        """
+        Convert many values from one Luminance unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: LuminanceUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: LuminanceUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Luminance._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: LuminanceUnits, to_unit: LuminanceUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Luminance._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: LuminanceUnits, to_unit: LuminanceUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Luminance unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LuminanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LuminanceUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Luminance._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: LuminanceUnits = LuminanceUnits.CandelaPerSquareMeter) -> Luminance:
+        """
+        Create a new instance of Luminance holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LuminanceUnits
+        :return: A new instance of Luminance.
+        :rtype: Luminance
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Luminance._from_exact(value, from_unit)
+
+    def to_exact(self, unit: LuminanceUnits = LuminanceUnits.CandelaPerSquareMeter) -> Fraction:
+        """
+        Get the exact value of the Luminance in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (CandelaPerSquareMeter).
+        :type unit: LuminanceUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Luminance:
+        """
+        Parse a Luminance from a value followed by a unit abbreviation, e.g. "1 Cd/m²".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Luminance.
+        :rtype: Luminance
+        :raises ValueError: When the string is not a valid or an ambiguous Luminance.
+        """
+        return Luminance._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Luminance]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Luminance._try_parse(text)
+
+    def to_binary(self, unit: Optional[LuminanceUnits] = None) -> bytes:
+        """
+        Encode the Luminance to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: LuminanceUnits
+        :return: The encoded Luminance.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Luminance:
+        """
+        Decode a Luminance encoded by to_binary.
+
+        :param data: The encoded Luminance, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Luminance.
+        :rtype: Luminance
+        :raises ValueError: When the data is not a valid encoded Luminance.
+        """
+        return Luminance._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[LuminanceUnits] = None) -> dict:
+        """
+        Get the Luminance DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (CandelaPerSquareMeter).
+        :type hold_in_unit: LuminanceUnits
+        :return: The Luminance DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[LuminanceUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Luminance:
+        """
+        Create a new instance of Luminance from its DTO.
+
+        :param dto: The Luminance DTO, the unit is the LuminanceUnits value or name.
+        :type dto: dict
+        :return: A new instance of Luminance.
+        :rtype: Luminance
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Luminance._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Luminance:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Luminance._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -329,10 +587,7 @@ class Luminance(AbstractMeasure):
         """
         
         """
-        if self.__candelas_per_square_meter != None:
-            return self.__candelas_per_square_meter
-        self.__candelas_per_square_meter = self.__convert_from_base(LuminanceUnits.CandelaPerSquareMeter)
-        return self.__candelas_per_square_meter
+        return self._cached_convert(LuminanceUnits.CandelaPerSquareMeter)
 
     
     @property
@@ -340,10 +595,7 @@ class Luminance(AbstractMeasure):
         """
         
         """
-        if self.__candelas_per_square_foot != None:
-            return self.__candelas_per_square_foot
-        self.__candelas_per_square_foot = self.__convert_from_base(LuminanceUnits.CandelaPerSquareFoot)
-        return self.__candelas_per_square_foot
+        return self._cached_convert(LuminanceUnits.CandelaPerSquareFoot)
 
     
     @property
@@ -351,10 +603,7 @@ class Luminance(AbstractMeasure):
         """
         
         """
-        if self.__candelas_per_square_inch != None:
-            return self.__candelas_per_square_inch
-        self.__candelas_per_square_inch = self.__convert_from_base(LuminanceUnits.CandelaPerSquareInch)
-        return self.__candelas_per_square_inch
+        return self._cached_convert(LuminanceUnits.CandelaPerSquareInch)
 
     
     @property
@@ -362,10 +611,7 @@ class Luminance(AbstractMeasure):
         """
         
         """
-        if self.__nits != None:
-            return self.__nits
-        self.__nits = self.__convert_from_base(LuminanceUnits.Nit)
-        return self.__nits
+        return self._cached_convert(LuminanceUnits.Nit)
 
     
     @property
@@ -373,10 +619,7 @@ class Luminance(AbstractMeasure):
         """
         
         """
-        if self.__nanocandelas_per_square_meter != None:
-            return self.__nanocandelas_per_square_meter
-        self.__nanocandelas_per_square_meter = self.__convert_from_base(LuminanceUnits.NanocandelaPerSquareMeter)
-        return self.__nanocandelas_per_square_meter
+        return self._cached_convert(LuminanceUnits.NanocandelaPerSquareMeter)
 
     
     @property
@@ -384,10 +627,7 @@ class Luminance(AbstractMeasure):
         """
         
         """
-        if self.__microcandelas_per_square_meter != None:
-            return self.__microcandelas_per_square_meter
-        self.__microcandelas_per_square_meter = self.__convert_from_base(LuminanceUnits.MicrocandelaPerSquareMeter)
-        return self.__microcandelas_per_square_meter
+        return self._cached_convert(LuminanceUnits.MicrocandelaPerSquareMeter)
 
     
     @property
@@ -395,10 +635,7 @@ class Luminance(AbstractMeasure):
         """
         
         """
-        if self.__millicandelas_per_square_meter != None:
-            return self.__millicandelas_per_square_meter
-        self.__millicandelas_per_square_meter = self.__convert_from_base(LuminanceUnits.MillicandelaPerSquareMeter)
-        return self.__millicandelas_per_square_meter
+        return self._cached_convert(LuminanceUnits.MillicandelaPerSquareMeter)
 
     
     @property
@@ -406,10 +643,7 @@ class Luminance(AbstractMeasure):
         """
         
         """
-        if self.__centicandelas_per_square_meter != None:
-            return self.__centicandelas_per_square_meter
-        self.__centicandelas_per_square_meter = self.__convert_from_base(LuminanceUnits.CenticandelaPerSquareMeter)
-        return self.__centicandelas_per_square_meter
+        return self._cached_convert(LuminanceUnits.CenticandelaPerSquareMeter)
 
     
     @property
@@ -417,10 +651,7 @@ class Luminance(AbstractMeasure):
         """
         
         """
-        if self.__decicandelas_per_square_meter != None:
-            return self.__decicandelas_per_square_meter
-        self.__decicandelas_per_square_meter = self.__convert_from_base(LuminanceUnits.DecicandelaPerSquareMeter)
-        return self.__decicandelas_per_square_meter
+        return self._cached_convert(LuminanceUnits.DecicandelaPerSquareMeter)
 
     
     @property
@@ -428,10 +659,7 @@ class Luminance(AbstractMeasure):
         """
         
         """
-        if self.__kilocandelas_per_square_meter != None:
-            return self.__kilocandelas_per_square_meter
-        self.__kilocandelas_per_square_meter = self.__convert_from_base(LuminanceUnits.KilocandelaPerSquareMeter)
-        return self.__kilocandelas_per_square_meter
+        return self._cached_convert(LuminanceUnits.KilocandelaPerSquareMeter)
 
     
     def to_string(self, unit: LuminanceUnits = LuminanceUnits.CandelaPerSquareMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class LuminosityUnits(Enum):
         """
             LuminosityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Watt = 'watt'
         """
@@ -89,138 +100,401 @@ class Luminosity(AbstractMeasure):
         value (float): The value.
         from_unit (LuminosityUnits): The Luminosity unit to create from, The default unit is Watt
     """
-    def __init__(self, value: float, from_unit: LuminosityUnits = LuminosityUnits.Watt):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = LuminosityUnits
+
+    _base_unit = LuminosityUnits.Watt
+
+    _dimensions = (2, 1, -3, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 58
+
+    _binary_unit_ids = {
         
-        self.__watts = None
+        LuminosityUnits.Watt: 0,
         
-        self.__solar_luminosities = None
+        LuminosityUnits.SolarLuminosity: 1,
         
-        self.__femtowatts = None
+        LuminosityUnits.Femtowatt: 2,
         
-        self.__picowatts = None
+        LuminosityUnits.Picowatt: 3,
         
-        self.__nanowatts = None
+        LuminosityUnits.Nanowatt: 4,
         
-        self.__microwatts = None
+        LuminosityUnits.Microwatt: 5,
         
-        self.__milliwatts = None
+        LuminosityUnits.Milliwatt: 6,
         
-        self.__deciwatts = None
+        LuminosityUnits.Deciwatt: 7,
         
-        self.__decawatts = None
+        LuminosityUnits.Decawatt: 8,
         
-        self.__kilowatts = None
+        LuminosityUnits.Kilowatt: 9,
         
-        self.__megawatts = None
+        LuminosityUnits.Megawatt: 10,
         
-        self.__gigawatts = None
+        LuminosityUnits.Gigawatt: 11,
         
-        self.__terawatts = None
+        LuminosityUnits.Terawatt: 12,
         
-        self.__petawatts = None
+        LuminosityUnits.Petawatt: 13,
         
+    }
 
-    def convert(self, unit: LuminosityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        LuminosityUnits.Watt: lambda value: (value),
+        
+        LuminosityUnits.SolarLuminosity: lambda value: (value / 3.846e26),
+        
+        LuminosityUnits.Femtowatt: lambda value: ((value) / 1e-15),
+        
+        LuminosityUnits.Picowatt: lambda value: ((value) / 1e-12),
+        
+        LuminosityUnits.Nanowatt: lambda value: ((value) / 1e-09),
+        
+        LuminosityUnits.Microwatt: lambda value: ((value) / 1e-06),
+        
+        LuminosityUnits.Milliwatt: lambda value: ((value) / 0.001),
+        
+        LuminosityUnits.Deciwatt: lambda value: ((value) / 0.1),
+        
+        LuminosityUnits.Decawatt: lambda value: ((value) / 10.0),
+        
+        LuminosityUnits.Kilowatt: lambda value: ((value) / 1000.0),
+        
+        LuminosityUnits.Megawatt: lambda value: ((value) / 1000000.0),
+        
+        LuminosityUnits.Gigawatt: lambda value: ((value) / 1000000000.0),
+        
+        LuminosityUnits.Terawatt: lambda value: ((value) / 1000000000000.0),
+        
+        LuminosityUnits.Petawatt: lambda value: ((value) / 1000000000000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: LuminosityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        LuminosityUnits.Watt: lambda value: (value),
+        
+        LuminosityUnits.SolarLuminosity: lambda value: (value * 3.846e26),
+        
+        LuminosityUnits.Femtowatt: lambda value: ((value) * 1e-15),
+        
+        LuminosityUnits.Picowatt: lambda value: ((value) * 1e-12),
+        
+        LuminosityUnits.Nanowatt: lambda value: ((value) * 1e-09),
         
-        if from_unit == LuminosityUnits.Watt:
-            return (value)
+        LuminosityUnits.Microwatt: lambda value: ((value) * 1e-06),
         
-        if from_unit == LuminosityUnits.SolarLuminosity:
-            return (value / 3.846e26)
+        LuminosityUnits.Milliwatt: lambda value: ((value) * 0.001),
         
-        if from_unit == LuminosityUnits.Femtowatt:
-            return ((value) / 1e-15)
+        LuminosityUnits.Deciwatt: lambda value: ((value) * 0.1),
         
-        if from_unit == LuminosityUnits.Picowatt:
-            return ((value) / 1e-12)
+        LuminosityUnits.Decawatt: lambda value: ((value) * 10.0),
         
-        if from_unit == LuminosityUnits.Nanowatt:
-            return ((value) / 1e-09)
+        LuminosityUnits.Kilowatt: lambda value: ((value) * 1000.0),
         
-        if from_unit == LuminosityUnits.Microwatt:
-            return ((value) / 1e-06)
+        LuminosityUnits.Megawatt: lambda value: ((value) * 1000000.0),
         
-        if from_unit == LuminosityUnits.Milliwatt:
-            return ((value) / 0.001)
+        LuminosityUnits.Gigawatt: lambda value: ((value) * 1000000000.0),
         
-        if from_unit == LuminosityUnits.Deciwatt:
-            return ((value) / 0.1)
+        LuminosityUnits.Terawatt: lambda value: ((value) * 1000000000000.0),
         
-        if from_unit == LuminosityUnits.Decawatt:
-            return ((value) / 10.0)
+        LuminosityUnits.Petawatt: lambda value: ((value) * 1000000000000000.0),
         
-        if from_unit == LuminosityUnits.Kilowatt:
-            return ((value) / 1000.0)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        LuminosityUnits.Watt: ('1', '0'),
+        
+        LuminosityUnits.SolarLuminosity: ('1/384600000000000000000000000', '0'),
+        
+        LuminosityUnits.Femtowatt: ('1000000000000000', '0'),
+        
+        LuminosityUnits.Picowatt: ('1000000000000', '0'),
+        
+        LuminosityUnits.Nanowatt: ('1000000000', '0'),
+        
+        LuminosityUnits.Microwatt: ('1000000', '0'),
+        
+        LuminosityUnits.Milliwatt: ('1000', '0'),
+        
+        LuminosityUnits.Deciwatt: ('10', '0'),
+        
+        LuminosityUnits.Decawatt: ('1/10', '0'),
         
-        if from_unit == LuminosityUnits.Megawatt:
-            return ((value) / 1000000.0)
+        LuminosityUnits.Kilowatt: ('1/1000', '0'),
         
-        if from_unit == LuminosityUnits.Gigawatt:
-            return ((value) / 1000000000.0)
+        LuminosityUnits.Megawatt: ('1/1000000', '0'),
         
-        if from_unit == LuminosityUnits.Terawatt:
-            return ((value) / 1000000000000.0)
+        LuminosityUnits.Gigawatt: ('1/1000000000', '0'),
         
-        if from_unit == LuminosityUnits.Petawatt:
-            return ((value) / 1000000000000000.0)
+        LuminosityUnits.Terawatt: ('1/1000000000000', '0'),
         
-        return None
+        LuminosityUnits.Petawatt: ('1/1000000000000000', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        LuminosityUnits.Watt: ('1', '0'),
+        
+        LuminosityUnits.SolarLuminosity: ('384600000000000000000000000', '0'),
+        
+        LuminosityUnits.Femtowatt: ('1/1000000000000000', '0'),
+        
+        LuminosityUnits.Picowatt: ('1/1000000000000', '0'),
+        
+        LuminosityUnits.Nanowatt: ('1/1000000000', '0'),
+        
+        LuminosityUnits.Microwatt: ('1/1000000', '0'),
+        
+        LuminosityUnits.Milliwatt: ('1/1000', '0'),
+        
+        LuminosityUnits.Deciwatt: ('1/10', '0'),
+        
+        LuminosityUnits.Decawatt: ('10', '0'),
+        
+        LuminosityUnits.Kilowatt: ('1000', '0'),
+        
+        LuminosityUnits.Megawatt: ('1000000', '0'),
+        
+        LuminosityUnits.Gigawatt: ('1000000000', '0'),
+        
+        LuminosityUnits.Terawatt: ('1000000000000', '0'),
+        
+        LuminosityUnits.Petawatt: ('1000000000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: LuminosityUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == LuminosityUnits.Watt:
-            return (value)
+        LuminosityUnits.Watt: ('W',),
         
-        if to_unit == LuminosityUnits.SolarLuminosity:
-            return (value * 3.846e26)
+        LuminosityUnits.SolarLuminosity: ('L⊙',),
         
-        if to_unit == LuminosityUnits.Femtowatt:
-            return ((value) * 1e-15)
+        LuminosityUnits.Femtowatt: ('fW',),
         
-        if to_unit == LuminosityUnits.Picowatt:
-            return ((value) * 1e-12)
+        LuminosityUnits.Picowatt: ('pW',),
         
-        if to_unit == LuminosityUnits.Nanowatt:
-            return ((value) * 1e-09)
+        LuminosityUnits.Nanowatt: ('nW',),
         
-        if to_unit == LuminosityUnits.Microwatt:
-            return ((value) * 1e-06)
+        LuminosityUnits.Microwatt: ('μW',),
         
-        if to_unit == LuminosityUnits.Milliwatt:
-            return ((value) * 0.001)
+        LuminosityUnits.Milliwatt: ('mW',),
         
-        if to_unit == LuminosityUnits.Deciwatt:
-            return ((value) * 0.1)
+        LuminosityUnits.Deciwatt: ('dW',),
         
-        if to_unit == LuminosityUnits.Decawatt:
-            return ((value) * 10.0)
+        LuminosityUnits.Decawatt: ('daW',),
         
-        if to_unit == LuminosityUnits.Kilowatt:
-            return ((value) * 1000.0)
+        LuminosityUnits.Kilowatt: ('kW',),
         
-        if to_unit == LuminosityUnits.Megawatt:
-            return ((value) * 1000000.0)
+        LuminosityUnits.Megawatt: ('MW',),
         
-        if to_unit == LuminosityUnits.Gigawatt:
-            return ((value) * 1000000000.0)
+        LuminosityUnits.Gigawatt: ('GW',),
         
-        if to_unit == LuminosityUnits.Terawatt:
-            return ((value) * 1000000000000.0)
+        LuminosityUnits.Terawatt: ('TW',),
         
-        if to_unit == LuminosityUnits.Petawatt:
-            return ((value) * 1000000000000000.0)
+        LuminosityUnits.Petawatt: ('PW',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: LuminosityUnits = LuminosityUnits.Watt):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: LuminosityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: LuminosityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
 
 
+    def __convert_to_base(self, value: float, to_unit: LuminosityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: LuminosityUnits, to_unit: LuminosityUnits) -> float:
+        """
+        Convert a value from one Luminosity unit to another, without creating a Luminosity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: LuminosityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LuminosityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Luminosity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: LuminosityUnits, to_unit: LuminosityUnits) -> List[float]:
+        """
+        Convert many values from one Luminosity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: LuminosityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: LuminosityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Luminosity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: LuminosityUnits, to_unit: LuminosityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Luminosity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: LuminosityUnits, to_unit: LuminosityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Luminosity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LuminosityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LuminosityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Luminosity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: LuminosityUnits = LuminosityUnits.Watt) -> Luminosity:
+        """
+        Create a new instance of Luminosity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LuminosityUnits
+        :return: A new instance of Luminosity.
+        :rtype: Luminosity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Luminosity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: LuminosityUnits = LuminosityUnits.Watt) -> Fraction:
+        """
+        Get the exact value of the Luminosity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Watt).
+        :type unit: LuminosityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Luminosity:
+        """
+        Parse a Luminosity from a value followed by a unit abbreviation, e.g. "1 W".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Luminosity.
+        :rtype: Luminosity
+        :raises ValueError: When the string is not a valid or an ambiguous Luminosity.
+        """
+        return Luminosity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Luminosity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Luminosity._try_parse(text)
+
+    def to_binary(self, unit: Optional[LuminosityUnits] = None) -> bytes:
+        """
+        Encode the Luminosity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: LuminosityUnits
+        :return: The encoded Luminosity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Luminosity:
+        """
+        Decode a Luminosity encoded by to_binary.
+
+        :param data: The encoded Luminosity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Luminosity.
+        :rtype: Luminosity
+        :raises ValueError: When the data is not a valid encoded Luminosity.
+        """
+        return Luminosity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[LuminosityUnits] = None) -> dict:
+        """
+        Get the Luminosity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Watt).
+        :type hold_in_unit: LuminosityUnits
+        :return: The Luminosity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[LuminosityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Luminosity:
+        """
+        Create a new instance of Luminosity from its DTO.
+
+        :param dto: The Luminosity DTO, the unit is the LuminosityUnits value or name.
+        :type dto: dict
+        :return: A new instance of Luminosity.
+        :rtype: Luminosity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Luminosity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Luminosity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Luminosity._from_json(text)
+
     @property
     def base_value(self) -> float:
         return self._value
@@ -441,10 +715,7 @@ class Luminosity(AbstractMeasure):
         """
         
         """
-        if self.__watts != None:
-            return self.__watts
-        self.__watts = self.__convert_from_base(LuminosityUnits.Watt)
-        return self.__watts
+        return self._cached_convert(LuminosityUnits.Watt)
 
     
     @property
@@ -452,10 +723,7 @@ class Luminosity(AbstractMeasure):
         """
         
         """
-        if self.__solar_luminosities != None:
-            return self.__solar_luminosities
-        self.__solar_luminosities = self.__convert_from_base(LuminosityUnits.SolarLuminosity)
-        return self.__solar_luminosities
+        return self._cached_convert(LuminosityUnits.SolarLuminosity)
 
     
     @property
@@ -463,10 +731,7 @@ class Luminosity(AbstractMeasure):
         """
         
         """
-        if self.__femtowatts != None:
-            return self.__femtowatts
-        self.__femtowatts = self.__convert_from_base(LuminosityUnits.Femtowatt)
-        return self.__femtowatts
+        return self._cached_convert(LuminosityUnits.Femtowatt)
 
     
     @property
@@ -474,10 +739,7 @@ class Luminosity(AbstractMeasure):
         """
         
         """
-        if self.__picowatts != None:
-            return self.__picowatts
-        self.__picowatts = self.__convert_from_base(LuminosityUnits.Picowatt)
-        return self.__picowatts
+        return self._cached_convert(LuminosityUnits.Picowatt)
 
     
     @property
@@ -485,10 +747,7 @@ class Luminosity(AbstractMeasure):
         """
         
         """
-        if self.__nanowatts != None:
-            return self.__nanowatts
-        self.__nanowatts = self.__convert_from_base(LuminosityUnits.Nanowatt)
-        return self.__nanowatts
+        return self._cached_convert(LuminosityUnits.Nanowatt)
 
     
     @property
@@ -496,10 +755,7 @@ class Luminosity(AbstractMeasure):
         """
         
         """
-        if self.__microwatts != None:
-            return self.__microwatts
-        self.__microwatts = self.__convert_from_base(LuminosityUnits.Microwatt)
-        return self.__microwatts
+        return self._cached_convert(LuminosityUnits.Microwatt)
 
     
     @property
@@ -507,10 +763,7 @@ class Luminosity(AbstractMeasure):
         """
         
         """
-        if self.__milliwatts != None:
-            return self.__milliwatts
-        self.__milliwatts = self.__convert_from_base(LuminosityUnits.Milliwatt)
-        return self.__milliwatts
+        return self._cached_convert(LuminosityUnits.Milliwatt)
 
     
     @property
@@ -518,10 +771,7 @@ class Luminosity(AbstractMeasure):
         """
         
         """
-        if self.__deciwatts != None:
-            return self.__deciwatts
-        self.__deciwatts = self.__convert_from_base(LuminosityUnits.Deciwatt)
-        return self.__deciwatts
+        return self._cached_convert(LuminosityUnits.Deciwatt)
 
     
     @property
@@ -529,10 +779,7 @@ class Luminosity(AbstractMeasure):
         """
         
         """
-        if self.__decawatts != None:
-            return self.__decawatts
-        self.__decawatts = self.__convert_from_base(LuminosityUnits.Decawatt)
-        return self.__decawatts
+        return self._cached_convert(LuminosityUnits.Decawatt)
 
     
     @property
@@ -540,10 +787,7 @@ class Luminosity(AbstractMeasure):
         """
         
         """
-        if self.__kilowatts != None:
-            return self.__kilowatts
-        self.__kilowatts = self.__convert_from_base(LuminosityUnits.Kilowatt)
-        return self.__kilowatts
+        return self._cached_convert(LuminosityUnits.Kilowatt)
 
     
     @property
@@ -551,10 +795,7 @@ class Luminosity(AbstractMeasure):
         """
         
         """
-        if self.__megawatts != None:
-            return self.__megawatts
-        self.__megawatts = self.__convert_from_base(LuminosityUnits.Megawatt)
-        return self.__megawatts
+        return self._cached_convert(LuminosityUnits.Megawatt)
 
     
     @property
@@ -562,10 +803,7 @@ class Luminosity(AbstractMeasure):
         """
         
         """
-        if self.__gigawatts != None:
-            return self.__gigawatts
-        self.__gigawatts = self.__convert_from_base(LuminosityUnits.Gigawatt)
-        return self.__gigawatts
+        return self._cached_convert(LuminosityUnits.Gigawatt)
 
     
     @property
@@ -573,10 +811,7 @@ class Luminosity(AbstractMeasure):
         """
         
         """
-        if self.__terawatts != None:
-            return self.__terawatts
-        self.__terawatts = self.__convert_from_base(LuminosityUnits.Terawatt)
-        return self.__terawatts
+        return self._cached_convert(LuminosityUnits.Terawatt)
 
     
     @property
@@ -584,10 +819,7 @@ class Luminosity(AbstractMeasure):
         """
         
         """
-        if self.__petawatts != None:
-            return self.__petawatts
-        self.__petawatts = self.__convert_from_base(LuminosityUnits.Petawatt)
-        return self.__petawatts
+        return self._cached_convert(LuminosityUnits.Petawatt)
 
     
     def to_string(self, unit: LuminosityUnits = LuminosityUnits.Watt) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class LuminousFluxUnits(Enum):
         """
             LuminousFluxUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Lumen = 'lumen'
         """
@@ -24,33 +35,244 @@ class LuminousFlux(AbstractMeasure):
         value (float): The value.
         from_unit (LuminousFluxUnits): The LuminousFlux unit to create from, The default unit is Lumen
     """
+    __slots__ = ()
+
+    _units = LuminousFluxUnits
+
+    _base_unit = LuminousFluxUnits.Lumen
+
+    _dimensions = (0, 0, 0, 0, 0, 0, 1)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 59
+
+    _binary_unit_ids = {
+        
+        LuminousFluxUnits.Lumen: 0,
+        
+    }
+
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        LuminousFluxUnits.Lumen: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        LuminousFluxUnits.Lumen: lambda value: (value),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        LuminousFluxUnits.Lumen: ('1', '0'),
+        
+    }
+
+    _affine_to_base = {
+        
+        LuminousFluxUnits.Lumen: ('1', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        LuminousFluxUnits.Lumen: ('lm',),
+        
+    }
+
     def __init__(self, value: float, from_unit: LuminousFluxUnits = LuminousFluxUnits.Lumen):
         if math.isnan(value):
             raise ValueError('Invalid unit: value is NaN')
         self._value = self.__convert_to_base(value, from_unit)
-        
-        self.__lumens = None
-        
 
     def convert(self, unit: LuminousFluxUnits) -> float:
         return self.__convert_from_base(unit)
 
     def __convert_from_base(self, from_unit: LuminousFluxUnits) -> float:
-        value = self._value
-        
-        if from_unit == LuminousFluxUnits.Lumen:
-            return (value)
-        
-        return None
+        return self._conversions_from_base[from_unit](self._value)
 
 
     def __convert_to_base(self, value: float, to_unit: LuminousFluxUnits) -> float:
-        
-        if to_unit == LuminousFluxUnits.Lumen:
-            return (value)
-        
-        return None
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: LuminousFluxUnits, to_unit: LuminousFluxUnits) -> float:
+        """
+        Convert a value from one LuminousFlux unit to another, without creating a LuminousFlux instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: LuminousFluxUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LuminousFluxUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return LuminousFlux._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: LuminousFluxUnits, to_unit: LuminousFluxUnits) -> List[float]:
+        """
+        Convert many values from one LuminousFlux unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: LuminousFluxUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: LuminousFluxUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return LuminousFlux._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: LuminousFluxUnits, to_unit: LuminousFluxUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", LuminousFlux._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: LuminousFluxUnits, to_unit: LuminousFluxUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one LuminousFlux unit to another exactly, using rational conversion factors.
 
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LuminousFluxUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: LuminousFluxUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return LuminousFlux._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: LuminousFluxUnits = LuminousFluxUnits.Lumen) -> LuminousFlux:
+        """
+        Create a new instance of LuminousFlux holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: LuminousFluxUnits
+        :return: A new instance of LuminousFlux.
+        :rtype: LuminousFlux
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return LuminousFlux._from_exact(value, from_unit)
+
+    def to_exact(self, unit: LuminousFluxUnits = LuminousFluxUnits.Lumen) -> Fraction:
+        """
+        Get the exact value of the LuminousFlux in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Lumen).
+        :type unit: LuminousFluxUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> LuminousFlux:
+        """
+        Parse a LuminousFlux from a value followed by a unit abbreviation, e.g. "1 lm".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of LuminousFlux.
+        :rtype: LuminousFlux
+        :raises ValueError: When the string is not a valid or an ambiguous LuminousFlux.
+        """
+        return LuminousFlux._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[LuminousFlux]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return LuminousFlux._try_parse(text)
+
+    def to_binary(self, unit: Optional[LuminousFluxUnits] = None) -> bytes:
+        """
+        Encode the LuminousFlux to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: LuminousFluxUnits
+        :return: The encoded LuminousFlux.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> LuminousFlux:
+        """
+        Decode a LuminousFlux encoded by to_binary.
+
+        :param data: The encoded LuminousFlux, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of LuminousFlux.
+        :rtype: LuminousFlux
+        :raises ValueError: When the data is not a valid encoded LuminousFlux.
+        """
+        return LuminousFlux._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[LuminousFluxUnits] = None) -> dict:
+        """
+        Get the LuminousFlux DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Lumen).
+        :type hold_in_unit: LuminousFluxUnits
+        :return: The LuminousFlux DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[LuminousFluxUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> LuminousFlux:
+        """
+        Create a new instance of LuminousFlux from its DTO.
+
+        :param dto: The LuminousFlux DTO, the unit is the LuminousFluxUnits value or name.
+        :type dto: dict
+        :return: A new instance of LuminousFlux.
+        :rtype: LuminousFlux
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return LuminousFlux._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> LuminousFlux:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return LuminousFlux._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -77,10 +299,7 @@ class LuminousFlux(AbstractMeasure):
         """
         
         """
-        if self.__lumens != None:
-            return self.__lumens
-        self.__lumens = self.__convert_from_base(LuminousFluxUnits.Lumen)
-        return self.__lumens
+        return self._cached_convert(LuminousFluxUnits.Lumen)
 
     
     def to_string(self, unit: LuminousFluxUnits = LuminousFluxUnits.Lumen) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class MagneticFieldUnits(Enum):
         """
             MagneticFieldUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Tesla = 'tesla'
         """
@@ -49,73 +60,304 @@ class MagneticField(AbstractMeasure):
         value (float): The value.
         from_unit (MagneticFieldUnits): The MagneticField unit to create from, The default unit is Tesla
     """
-    def __init__(self, value: float, from_unit: MagneticFieldUnits = MagneticFieldUnits.Tesla):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = MagneticFieldUnits
+
+    _base_unit = MagneticFieldUnits.Tesla
+
+    _dimensions = (0, 1, -2, -1, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 61
+
+    _binary_unit_ids = {
         
-        self.__teslas = None
+        MagneticFieldUnits.Tesla: 0,
         
-        self.__gausses = None
+        MagneticFieldUnits.Gauss: 1,
         
-        self.__nanoteslas = None
+        MagneticFieldUnits.Nanotesla: 2,
         
-        self.__microteslas = None
+        MagneticFieldUnits.Microtesla: 3,
         
-        self.__milliteslas = None
+        MagneticFieldUnits.Millitesla: 4,
         
-        self.__milligausses = None
+        MagneticFieldUnits.Milligauss: 5,
         
+    }
 
-    def convert(self, unit: MagneticFieldUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        MagneticFieldUnits.Tesla: lambda value: (value),
+        
+        MagneticFieldUnits.Gauss: lambda value: (value * 1e4),
+        
+        MagneticFieldUnits.Nanotesla: lambda value: ((value) / 1e-09),
+        
+        MagneticFieldUnits.Microtesla: lambda value: ((value) / 1e-06),
+        
+        MagneticFieldUnits.Millitesla: lambda value: ((value) / 0.001),
+        
+        MagneticFieldUnits.Milligauss: lambda value: ((value * 1e4) / 0.001),
+        
+    }
 
-    def __convert_from_base(self, from_unit: MagneticFieldUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        MagneticFieldUnits.Tesla: lambda value: (value),
+        
+        MagneticFieldUnits.Gauss: lambda value: (value / 1e4),
+        
+        MagneticFieldUnits.Nanotesla: lambda value: ((value) * 1e-09),
+        
+        MagneticFieldUnits.Microtesla: lambda value: ((value) * 1e-06),
+        
+        MagneticFieldUnits.Millitesla: lambda value: ((value) * 0.001),
+        
+        MagneticFieldUnits.Milligauss: lambda value: ((value / 1e4) * 0.001),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
         
-        if from_unit == MagneticFieldUnits.Tesla:
-            return (value)
+        MagneticFieldUnits.Tesla: ('1', '0'),
         
-        if from_unit == MagneticFieldUnits.Gauss:
-            return (value * 1e4)
+        MagneticFieldUnits.Gauss: ('10000', '0'),
         
-        if from_unit == MagneticFieldUnits.Nanotesla:
-            return ((value) / 1e-09)
+        MagneticFieldUnits.Nanotesla: ('1000000000', '0'),
         
-        if from_unit == MagneticFieldUnits.Microtesla:
-            return ((value) / 1e-06)
+        MagneticFieldUnits.Microtesla: ('1000000', '0'),
         
-        if from_unit == MagneticFieldUnits.Millitesla:
-            return ((value) / 0.001)
+        MagneticFieldUnits.Millitesla: ('1000', '0'),
         
-        if from_unit == MagneticFieldUnits.Milligauss:
-            return ((value * 1e4) / 0.001)
+        MagneticFieldUnits.Milligauss: ('10000000', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        MagneticFieldUnits.Tesla: ('1', '0'),
+        
+        MagneticFieldUnits.Gauss: ('1/10000', '0'),
+        
+        MagneticFieldUnits.Nanotesla: ('1/1000000000', '0'),
+        
+        MagneticFieldUnits.Microtesla: ('1/1000000', '0'),
+        
+        MagneticFieldUnits.Millitesla: ('1/1000', '0'),
+        
+        MagneticFieldUnits.Milligauss: ('1/10000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: MagneticFieldUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == MagneticFieldUnits.Tesla:
-            return (value)
+        MagneticFieldUnits.Tesla: ('T',),
         
-        if to_unit == MagneticFieldUnits.Gauss:
-            return (value / 1e4)
+        MagneticFieldUnits.Gauss: ('G',),
         
-        if to_unit == MagneticFieldUnits.Nanotesla:
-            return ((value) * 1e-09)
+        MagneticFieldUnits.Nanotesla: ('nT',),
         
-        if to_unit == MagneticFieldUnits.Microtesla:
-            return ((value) * 1e-06)
+        MagneticFieldUnits.Microtesla: ('μT',),
         
-        if to_unit == MagneticFieldUnits.Millitesla:
-            return ((value) * 0.001)
+        MagneticFieldUnits.Millitesla: ('mT',),
         
-        if to_unit == MagneticFieldUnits.Milligauss:
-            return ((value / 1e4) * 0.001)
+        MagneticFieldUnits.Milligauss: ('mG',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: MagneticFieldUnits = MagneticFieldUnits.Tesla):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: MagneticFieldUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: MagneticFieldUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: MagneticFieldUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: MagneticFieldUnits, to_unit: MagneticFieldUnits) -> float:
+        """
+        Convert a value from one MagneticField unit to another, without creating a MagneticField instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: MagneticFieldUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MagneticFieldUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return MagneticField._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: MagneticFieldUnits, to_unit: MagneticFieldUnits) -> List[float]:
+        """
+        Convert many values from one MagneticField unit to another.
+        The conversion is resolved once and applied to all the values.
 
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: MagneticFieldUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: MagneticFieldUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return MagneticField._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: MagneticFieldUnits, to_unit: MagneticFieldUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", MagneticField._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: MagneticFieldUnits, to_unit: MagneticFieldUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one MagneticField unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MagneticFieldUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MagneticFieldUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return MagneticField._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: MagneticFieldUnits = MagneticFieldUnits.Tesla) -> MagneticField:
+        """
+        Create a new instance of MagneticField holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MagneticFieldUnits
+        :return: A new instance of MagneticField.
+        :rtype: MagneticField
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return MagneticField._from_exact(value, from_unit)
+
+    def to_exact(self, unit: MagneticFieldUnits = MagneticFieldUnits.Tesla) -> Fraction:
+        """
+        Get the exact value of the MagneticField in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Tesla).
+        :type unit: MagneticFieldUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> MagneticField:
+        """
+        Parse a MagneticField from a value followed by a unit abbreviation, e.g. "1 T".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of MagneticField.
+        :rtype: MagneticField
+        :raises ValueError: When the string is not a valid or an ambiguous MagneticField.
+        """
+        return MagneticField._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[MagneticField]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return MagneticField._try_parse(text)
+
+    def to_binary(self, unit: Optional[MagneticFieldUnits] = None) -> bytes:
+        """
+        Encode the MagneticField to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: MagneticFieldUnits
+        :return: The encoded MagneticField.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> MagneticField:
+        """
+        Decode a MagneticField encoded by to_binary.
+
+        :param data: The encoded MagneticField, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of MagneticField.
+        :rtype: MagneticField
+        :raises ValueError: When the data is not a valid encoded MagneticField.
+        """
+        return MagneticField._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[MagneticFieldUnits] = None) -> dict:
+        """
+        Get the MagneticField DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Tesla).
+        :type hold_in_unit: MagneticFieldUnits
+        :return: The MagneticField DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[MagneticFieldUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> MagneticField:
+        """
+        Create a new instance of MagneticField from its DTO.
+
+        :param dto: The MagneticField DTO, the unit is the MagneticFieldUnits value or name.
+        :type dto: dict
+        :return: A new instance of MagneticField.
+        :rtype: MagneticField
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return MagneticField._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> MagneticField:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return MagneticField._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -217,10 +459,7 @@ class MagneticField(AbstractMeasure):
         """
         
         """
-        if self.__teslas != None:
-            return self.__teslas
-        self.__teslas = self.__convert_from_base(MagneticFieldUnits.Tesla)
-        return self.__teslas
+        return self._cached_convert(MagneticFieldUnits.Tesla)
 
     
     @property
@@ -228,10 +467,7 @@ class MagneticField(AbstractMeasure):
         """
         
         """
-        if self.__gausses != None:
-            return self.__gausses
-        self.__gausses = self.__convert_from_base(MagneticFieldUnits.Gauss)
-        return self.__gausses
+        return self._cached_convert(MagneticFieldUnits.Gauss)
 
     
     @property
@@ -239,10 +475,7 @@ class MagneticField(AbstractMeasure):
         """
         
         """
-        if self.__nanoteslas != None:
-            return self.__nanoteslas
-        self.__nanoteslas = self.__convert_from_base(MagneticFieldUnits.Nanotesla)
-        return self.__nanoteslas
+        return self._cached_convert(MagneticFieldUnits.Nanotesla)
 
     
     @property
@@ -250,10 +483,7 @@ class MagneticField(AbstractMeasure):
         """
         
         """
-        if self.__microteslas != None:
-            return self.__microteslas
-        self.__microteslas = self.__convert_from_base(MagneticFieldUnits.Microtesla)
-        return self.__microteslas
+        return self._cached_convert(MagneticFieldUnits.Microtesla)
 
     
     @property
@@ -261,10 +491,7 @@ class MagneticField(AbstractMeasure):
         """
         
         """
-        if self.__milliteslas != None:
-            return self.__milliteslas
-        self.__milliteslas = self.__convert_from_base(MagneticFieldUnits.Millitesla)
-        return self.__milliteslas
+        return self._cached_convert(MagneticFieldUnits.Millitesla)
 
     
     @property
@@ -272,10 +499,7 @@ class MagneticField(AbstractMeasure):
         """
         
         """
-        if self.__milligausses != None:
-            return self.__milligausses
-        self.__milligausses = self.__convert_from_base(MagneticFieldUnits.Milligauss)
-        return self.__milligausses
+        return self._cached_convert(MagneticFieldUnits.Milligauss)
 
     
     def to_string(self, unit: MagneticFieldUnits = MagneticFieldUnits.Tesla) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class MagneticFluxUnits(Enum):
         """
             MagneticFluxUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Weber = 'weber'
         """
@@ -24,33 +35,244 @@ class MagneticFlux(AbstractMeasure):
         value (float): The value.
         from_unit (MagneticFluxUnits): The MagneticFlux unit to create from, The default unit is Weber
     """
+    __slots__ = ()
+
+    _units = MagneticFluxUnits
+
+    _base_unit = MagneticFluxUnits.Weber
+
+    _dimensions = (2, 1, -2, -1, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 62
+
+    _binary_unit_ids = {
+        
+        MagneticFluxUnits.Weber: 0,
+        
+    }
+
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        MagneticFluxUnits.Weber: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        MagneticFluxUnits.Weber: lambda value: (value),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        MagneticFluxUnits.Weber: ('1', '0'),
+        
+    }
+
+    _affine_to_base = {
+        
+        MagneticFluxUnits.Weber: ('1', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        MagneticFluxUnits.Weber: ('Wb',),
+        
+    }
+
     def __init__(self, value: float, from_unit: MagneticFluxUnits = MagneticFluxUnits.Weber):
         if math.isnan(value):
             raise ValueError('Invalid unit: value is NaN')
         self._value = self.__convert_to_base(value, from_unit)
-        
-        self.__webers = None
-        
 
     def convert(self, unit: MagneticFluxUnits) -> float:
         return self.__convert_from_base(unit)
 
     def __convert_from_base(self, from_unit: MagneticFluxUnits) -> float:
-        value = self._value
-        
-        if from_unit == MagneticFluxUnits.Weber:
-            return (value)
-        
-        return None
+        return self._conversions_from_base[from_unit](self._value)
 
 
     def __convert_to_base(self, value: float, to_unit: MagneticFluxUnits) -> float:
-        
-        if to_unit == MagneticFluxUnits.Weber:
-            return (value)
-        
-        return None
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: MagneticFluxUnits, to_unit: MagneticFluxUnits) -> float:
+        """
+        Convert a value from one MagneticFlux unit to another, without creating a MagneticFlux instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: MagneticFluxUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MagneticFluxUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return MagneticFlux._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: MagneticFluxUnits, to_unit: MagneticFluxUnits) -> List[float]:
+        """
+        Convert many values from one MagneticFlux unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: MagneticFluxUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: MagneticFluxUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return MagneticFlux._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: MagneticFluxUnits, to_unit: MagneticFluxUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", MagneticFlux._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: MagneticFluxUnits, to_unit: MagneticFluxUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one MagneticFlux unit to another exactly, using rational conversion factors.
 
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MagneticFluxUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MagneticFluxUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return MagneticFlux._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: MagneticFluxUnits = MagneticFluxUnits.Weber) -> MagneticFlux:
+        """
+        Create a new instance of MagneticFlux holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MagneticFluxUnits
+        :return: A new instance of MagneticFlux.
+        :rtype: MagneticFlux
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return MagneticFlux._from_exact(value, from_unit)
+
+    def to_exact(self, unit: MagneticFluxUnits = MagneticFluxUnits.Weber) -> Fraction:
+        """
+        Get the exact value of the MagneticFlux in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Weber).
+        :type unit: MagneticFluxUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> MagneticFlux:
+        """
+        Parse a MagneticFlux from a value followed by a unit abbreviation, e.g. "1 Wb".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of MagneticFlux.
+        :rtype: MagneticFlux
+        :raises ValueError: When the string is not a valid or an ambiguous MagneticFlux.
+        """
+        return MagneticFlux._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[MagneticFlux]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return MagneticFlux._try_parse(text)
+
+    def to_binary(self, unit: Optional[MagneticFluxUnits] = None) -> bytes:
+        """
+        Encode the MagneticFlux to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: MagneticFluxUnits
+        :return: The encoded MagneticFlux.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> MagneticFlux:
+        """
+        Decode a MagneticFlux encoded by to_binary.
+
+        :param data: The encoded MagneticFlux, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of MagneticFlux.
+        :rtype: MagneticFlux
+        :raises ValueError: When the data is not a valid encoded MagneticFlux.
+        """
+        return MagneticFlux._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[MagneticFluxUnits] = None) -> dict:
+        """
+        Get the MagneticFlux DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Weber).
+        :type hold_in_unit: MagneticFluxUnits
+        :return: The MagneticFlux DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[MagneticFluxUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> MagneticFlux:
+        """
+        Create a new instance of MagneticFlux from its DTO.
+
+        :param dto: The MagneticFlux DTO, the unit is the MagneticFluxUnits value or name.
+        :type dto: dict
+        :return: A new instance of MagneticFlux.
+        :rtype: MagneticFlux
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return MagneticFlux._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> MagneticFlux:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return MagneticFlux._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -77,10 +299,7 @@ class MagneticFlux(AbstractMeasure):
         """
         
         """
-        if self.__webers != None:
-            return self.__webers
-        self.__webers = self.__convert_from_base(MagneticFluxUnits.Weber)
-        return self.__webers
+        return self._cached_convert(MagneticFluxUnits.Weber)
 
     
     def to_string(self, unit: MagneticFluxUnits = MagneticFluxUnits.Weber) -> str:
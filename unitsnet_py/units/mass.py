@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class MassUnits(Enum):
         """
             MassUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Gram = 'gram'
         """
@@ -154,241 +165,556 @@ class Mass(AbstractMeasure):
         value (float): The value.
         from_unit (MassUnits): The Mass unit to create from, The default unit is Kilogram
     """
-    def __init__(self, value: float, from_unit: MassUnits = MassUnits.Kilogram):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = MassUnits
+
+    _base_unit = MassUnits.Kilogram
+
+    _dimensions = (0, 1, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 64
+
+    _binary_unit_ids = {
         
-        self.__grams = None
+        MassUnits.Gram: 0,
         
-        self.__tonnes = None
+        MassUnits.Tonne: 1,
         
-        self.__short_tons = None
+        MassUnits.ShortTon: 2,
         
-        self.__long_tons = None
+        MassUnits.LongTon: 3,
         
-        self.__pounds = None
+        MassUnits.Pound: 4,
         
-        self.__ounces = None
+        MassUnits.Ounce: 5,
         
-        self.__slugs = None
+        MassUnits.Slug: 6,
         
-        self.__stone = None
+        MassUnits.Stone: 7,
         
-        self.__short_hundredweight = None
+        MassUnits.ShortHundredweight: 8,
         
-        self.__long_hundredweight = None
+        MassUnits.LongHundredweight: 9,
         
-        self.__grains = None
+        MassUnits.Grain: 10,
         
-        self.__solar_masses = None
+        MassUnits.SolarMass: 11,
         
-        self.__earth_masses = None
+        MassUnits.EarthMass: 12,
         
-        self.__femtograms = None
+        MassUnits.Femtogram: 13,
         
-        self.__picograms = None
+        MassUnits.Picogram: 14,
         
-        self.__nanograms = None
+        MassUnits.Nanogram: 15,
         
-        self.__micrograms = None
+        MassUnits.Microgram: 16,
         
-        self.__milligrams = None
+        MassUnits.Milligram: 17,
         
-        self.__centigrams = None
+        MassUnits.Centigram: 18,
         
-        self.__decigrams = None
+        MassUnits.Decigram: 19,
         
-        self.__decagrams = None
+        MassUnits.Decagram: 20,
         
-        self.__hectograms = None
+        MassUnits.Hectogram: 21,
         
-        self.__kilograms = None
+        MassUnits.Kilogram: 22,
         
-        self.__kilotonnes = None
+        MassUnits.Kilotonne: 23,
         
-        self.__megatonnes = None
+        MassUnits.Megatonne: 24,
         
-        self.__kilopounds = None
+        MassUnits.Kilopound: 25,
         
-        self.__megapounds = None
+        MassUnits.Megapound: 26,
         
+    }
 
-    def convert(self, unit: MassUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        MassUnits.Gram: lambda value: (value * 1e3),
+        
+        MassUnits.Tonne: lambda value: (value / 1e3),
+        
+        MassUnits.ShortTon: lambda value: (value / 9.0718474e2),
+        
+        MassUnits.LongTon: lambda value: (value / 1.0160469088e3),
+        
+        MassUnits.Pound: lambda value: (value / 0.45359237),
+        
+        MassUnits.Ounce: lambda value: (value / 0.028349523125),
+        
+        MassUnits.Slug: lambda value: (value * 6.852176556196105e-2),
+        
+        MassUnits.Stone: lambda value: (value * 0.1574731728702698),
+        
+        MassUnits.ShortHundredweight: lambda value: (value * 0.022046226218487758),
+        
+        MassUnits.LongHundredweight: lambda value: (value * 0.01968413055222121),
+        
+        MassUnits.Grain: lambda value: (value * 15432.358352941431),
+        
+        MassUnits.SolarMass: lambda value: (value / 1.98947e30),
+        
+        MassUnits.EarthMass: lambda value: (value / 5.9722e+24),
+        
+        MassUnits.Femtogram: lambda value: ((value * 1e3) / 1e-15),
+        
+        MassUnits.Picogram: lambda value: ((value * 1e3) / 1e-12),
+        
+        MassUnits.Nanogram: lambda value: ((value * 1e3) / 1e-09),
+        
+        MassUnits.Microgram: lambda value: ((value * 1e3) / 1e-06),
+        
+        MassUnits.Milligram: lambda value: ((value * 1e3) / 0.001),
+        
+        MassUnits.Centigram: lambda value: ((value * 1e3) / 0.01),
+        
+        MassUnits.Decigram: lambda value: ((value * 1e3) / 0.1),
+        
+        MassUnits.Decagram: lambda value: ((value * 1e3) / 10.0),
+        
+        MassUnits.Hectogram: lambda value: ((value * 1e3) / 100.0),
+        
+        MassUnits.Kilogram: lambda value: ((value * 1e3) / 1000.0),
+        
+        MassUnits.Kilotonne: lambda value: ((value / 1e3) / 1000.0),
+        
+        MassUnits.Megatonne: lambda value: ((value / 1e3) / 1000000.0),
+        
+        MassUnits.Kilopound: lambda value: ((value / 0.45359237) / 1000.0),
+        
+        MassUnits.Megapound: lambda value: ((value / 0.45359237) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: MassUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == MassUnits.Gram:
-            return (value * 1e3)
+        MassUnits.Gram: lambda value: (value / 1e3),
         
-        if from_unit == MassUnits.Tonne:
-            return (value / 1e3)
+        MassUnits.Tonne: lambda value: (value * 1e3),
         
-        if from_unit == MassUnits.ShortTon:
-            return (value / 9.0718474e2)
+        MassUnits.ShortTon: lambda value: (value * 9.0718474e2),
         
-        if from_unit == MassUnits.LongTon:
-            return (value / 1.0160469088e3)
+        MassUnits.LongTon: lambda value: (value * 1.0160469088e3),
         
-        if from_unit == MassUnits.Pound:
-            return (value / 0.45359237)
+        MassUnits.Pound: lambda value: (value * 0.45359237),
         
-        if from_unit == MassUnits.Ounce:
-            return (value / 0.028349523125)
+        MassUnits.Ounce: lambda value: (value * 0.028349523125),
         
-        if from_unit == MassUnits.Slug:
-            return (value * 6.852176556196105e-2)
+        MassUnits.Slug: lambda value: (value / 6.852176556196105e-2),
         
-        if from_unit == MassUnits.Stone:
-            return (value * 0.1574731728702698)
+        MassUnits.Stone: lambda value: (value / 0.1574731728702698),
         
-        if from_unit == MassUnits.ShortHundredweight:
-            return (value * 0.022046226218487758)
+        MassUnits.ShortHundredweight: lambda value: (value / 0.022046226218487758),
         
-        if from_unit == MassUnits.LongHundredweight:
-            return (value * 0.01968413055222121)
+        MassUnits.LongHundredweight: lambda value: (value / 0.01968413055222121),
         
-        if from_unit == MassUnits.Grain:
-            return (value * 15432.358352941431)
+        MassUnits.Grain: lambda value: (value / 15432.358352941431),
         
-        if from_unit == MassUnits.SolarMass:
-            return (value / 1.98947e30)
+        MassUnits.SolarMass: lambda value: (value * 1.98947e30),
         
-        if from_unit == MassUnits.EarthMass:
-            return (value / 5.9722e+24)
+        MassUnits.EarthMass: lambda value: (value * 5.9722e+24),
         
-        if from_unit == MassUnits.Femtogram:
-            return ((value * 1e3) / 1e-15)
+        MassUnits.Femtogram: lambda value: ((value / 1e3) * 1e-15),
         
-        if from_unit == MassUnits.Picogram:
-            return ((value * 1e3) / 1e-12)
+        MassUnits.Picogram: lambda value: ((value / 1e3) * 1e-12),
         
-        if from_unit == MassUnits.Nanogram:
-            return ((value * 1e3) / 1e-09)
+        MassUnits.Nanogram: lambda value: ((value / 1e3) * 1e-09),
         
-        if from_unit == MassUnits.Microgram:
-            return ((value * 1e3) / 1e-06)
+        MassUnits.Microgram: lambda value: ((value / 1e3) * 1e-06),
         
-        if from_unit == MassUnits.Milligram:
-            return ((value * 1e3) / 0.001)
+        MassUnits.Milligram: lambda value: ((value / 1e3) * 0.001),
         
-        if from_unit == MassUnits.Centigram:
-            return ((value * 1e3) / 0.01)
+        MassUnits.Centigram: lambda value: ((value / 1e3) * 0.01),
         
-        if from_unit == MassUnits.Decigram:
-            return ((value * 1e3) / 0.1)
+        MassUnits.Decigram: lambda value: ((value / 1e3) * 0.1),
         
-        if from_unit == MassUnits.Decagram:
-            return ((value * 1e3) / 10.0)
+        MassUnits.Decagram: lambda value: ((value / 1e3) * 10.0),
         
-        if from_unit == MassUnits.Hectogram:
-            return ((value * 1e3) / 100.0)
+        MassUnits.Hectogram: lambda value: ((value / 1e3) * 100.0),
         
-        if from_unit == MassUnits.Kilogram:
-            return ((value * 1e3) / 1000.0)
+        MassUnits.Kilogram: lambda value: ((value / 1e3) * 1000.0),
         
-        if from_unit == MassUnits.Kilotonne:
-            return ((value / 1e3) / 1000.0)
+        MassUnits.Kilotonne: lambda value: ((value * 1e3) * 1000.0),
         
-        if from_unit == MassUnits.Megatonne:
-            return ((value / 1e3) / 1000000.0)
+        MassUnits.Megatonne: lambda value: ((value * 1e3) * 1000000.0),
         
-        if from_unit == MassUnits.Kilopound:
-            return ((value / 0.45359237) / 1000.0)
+        MassUnits.Kilopound: lambda value: ((value * 0.45359237) * 1000.0),
         
-        if from_unit == MassUnits.Megapound:
-            return ((value / 0.45359237) / 1000000.0)
+        MassUnits.Megapound: lambda value: ((value * 0.45359237) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        MassUnits.Gram: ('1000', '0'),
+        
+        MassUnits.Tonne: ('1/1000', '0'),
+        
+        MassUnits.ShortTon: ('50000/45359237', '0'),
+        
+        MassUnits.LongTon: ('312500/317514659', '0'),
+        
+        MassUnits.Pound: ('100000000/45359237', '0'),
+        
+        MassUnits.Ounce: ('1600000000/45359237', '0'),
+        
+        MassUnits.Slug: ('1370435311239221/20000000000000000', '0'),
+        
+        MassUnits.Stone: ('787365864351349/5000000000000000', '0'),
+        
+        MassUnits.ShortHundredweight: ('11023113109243879/500000000000000000', '0'),
+        
+        MassUnits.LongHundredweight: ('1968413055222121/100000000000000000', '0'),
+        
+        MassUnits.Grain: ('15432358352941431/1000000000000', '0'),
+        
+        MassUnits.SolarMass: ('1/1989470000000000000000000000000', '0'),
+        
+        MassUnits.EarthMass: ('1/5972200000000000000000000', '0'),
+        
+        MassUnits.Femtogram: ('1000000000000000000', '0'),
+        
+        MassUnits.Picogram: ('1000000000000000', '0'),
+        
+        MassUnits.Nanogram: ('1000000000000', '0'),
+        
+        MassUnits.Microgram: ('1000000000', '0'),
+        
+        MassUnits.Milligram: ('1000000', '0'),
+        
+        MassUnits.Centigram: ('100000', '0'),
+        
+        MassUnits.Decigram: ('10000', '0'),
+        
+        MassUnits.Decagram: ('100', '0'),
+        
+        MassUnits.Hectogram: ('10', '0'),
+        
+        MassUnits.Kilogram: ('1', '0'),
+        
+        MassUnits.Kilotonne: ('1/1000000', '0'),
+        
+        MassUnits.Megatonne: ('1/1000000000', '0'),
+        
+        MassUnits.Kilopound: ('100000/45359237', '0'),
+        
+        MassUnits.Megapound: ('100/45359237', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: MassUnits) -> float:
+    _affine_to_base = {
+        
+        MassUnits.Gram: ('1/1000', '0'),
+        
+        MassUnits.Tonne: ('1000', '0'),
+        
+        MassUnits.ShortTon: ('45359237/50000', '0'),
+        
+        MassUnits.LongTon: ('317514659/312500', '0'),
+        
+        MassUnits.Pound: ('45359237/100000000', '0'),
+        
+        MassUnits.Ounce: ('45359237/1600000000', '0'),
+        
+        MassUnits.Slug: ('20000000000000000/1370435311239221', '0'),
+        
+        MassUnits.Stone: ('5000000000000000/787365864351349', '0'),
+        
+        MassUnits.ShortHundredweight: ('500000000000000000/11023113109243879', '0'),
+        
+        MassUnits.LongHundredweight: ('100000000000000000/1968413055222121', '0'),
+        
+        MassUnits.Grain: ('1000000000000/15432358352941431', '0'),
+        
+        MassUnits.SolarMass: ('1989470000000000000000000000000', '0'),
+        
+        MassUnits.EarthMass: ('5972200000000000000000000', '0'),
+        
+        MassUnits.Femtogram: ('1/1000000000000000000', '0'),
+        
+        MassUnits.Picogram: ('1/1000000000000000', '0'),
+        
+        MassUnits.Nanogram: ('1/1000000000000', '0'),
+        
+        MassUnits.Microgram: ('1/1000000000', '0'),
+        
+        MassUnits.Milligram: ('1/1000000', '0'),
+        
+        MassUnits.Centigram: ('1/100000', '0'),
         
-        if to_unit == MassUnits.Gram:
-            return (value / 1e3)
+        MassUnits.Decigram: ('1/10000', '0'),
         
-        if to_unit == MassUnits.Tonne:
-            return (value * 1e3)
+        MassUnits.Decagram: ('1/100', '0'),
         
-        if to_unit == MassUnits.ShortTon:
-            return (value * 9.0718474e2)
+        MassUnits.Hectogram: ('1/10', '0'),
         
-        if to_unit == MassUnits.LongTon:
-            return (value * 1.0160469088e3)
+        MassUnits.Kilogram: ('1', '0'),
         
-        if to_unit == MassUnits.Pound:
-            return (value * 0.45359237)
+        MassUnits.Kilotonne: ('1000000', '0'),
         
-        if to_unit == MassUnits.Ounce:
-            return (value * 0.028349523125)
+        MassUnits.Megatonne: ('1000000000', '0'),
         
-        if to_unit == MassUnits.Slug:
-            return (value / 6.852176556196105e-2)
+        MassUnits.Kilopound: ('45359237/100000', '0'),
         
-        if to_unit == MassUnits.Stone:
-            return (value / 0.1574731728702698)
+        MassUnits.Megapound: ('45359237/100', '0'),
         
-        if to_unit == MassUnits.ShortHundredweight:
-            return (value / 0.022046226218487758)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        MassUnits.Gram: ('g',),
+        
+        MassUnits.Tonne: ('t',),
+        
+        MassUnits.ShortTon: ('t (short)',),
+        
+        MassUnits.LongTon: ('long tn',),
+        
+        MassUnits.Pound: ('lb',),
         
-        if to_unit == MassUnits.LongHundredweight:
-            return (value / 0.01968413055222121)
+        MassUnits.Ounce: ('oz',),
         
-        if to_unit == MassUnits.Grain:
-            return (value / 15432.358352941431)
+        MassUnits.Slug: ('slug',),
         
-        if to_unit == MassUnits.SolarMass:
-            return (value * 1.98947e30)
+        MassUnits.Stone: ('st',),
         
-        if to_unit == MassUnits.EarthMass:
-            return (value * 5.9722e+24)
+        MassUnits.ShortHundredweight: ('cwt',),
         
-        if to_unit == MassUnits.Femtogram:
-            return ((value / 1e3) * 1e-15)
+        MassUnits.LongHundredweight: ('cwt',),
         
-        if to_unit == MassUnits.Picogram:
-            return ((value / 1e3) * 1e-12)
+        MassUnits.Grain: ('gr',),
         
-        if to_unit == MassUnits.Nanogram:
-            return ((value / 1e3) * 1e-09)
+        MassUnits.SolarMass: ('M☉',),
         
-        if to_unit == MassUnits.Microgram:
-            return ((value / 1e3) * 1e-06)
+        MassUnits.EarthMass: ('em',),
         
-        if to_unit == MassUnits.Milligram:
-            return ((value / 1e3) * 0.001)
+        MassUnits.Femtogram: ('fg',),
         
-        if to_unit == MassUnits.Centigram:
-            return ((value / 1e3) * 0.01)
+        MassUnits.Picogram: ('pg',),
         
-        if to_unit == MassUnits.Decigram:
-            return ((value / 1e3) * 0.1)
+        MassUnits.Nanogram: ('ng',),
         
-        if to_unit == MassUnits.Decagram:
-            return ((value / 1e3) * 10.0)
+        MassUnits.Microgram: ('μg',),
         
-        if to_unit == MassUnits.Hectogram:
-            return ((value / 1e3) * 100.0)
+        MassUnits.Milligram: ('mg',),
         
-        if to_unit == MassUnits.Kilogram:
-            return ((value / 1e3) * 1000.0)
+        MassUnits.Centigram: ('cg',),
         
-        if to_unit == MassUnits.Kilotonne:
-            return ((value * 1e3) * 1000.0)
+        MassUnits.Decigram: ('dg',),
         
-        if to_unit == MassUnits.Megatonne:
-            return ((value * 1e3) * 1000000.0)
+        MassUnits.Decagram: ('dag',),
         
-        if to_unit == MassUnits.Kilopound:
-            return ((value * 0.45359237) * 1000.0)
+        MassUnits.Hectogram: ('hg',),
         
-        if to_unit == MassUnits.Megapound:
-            return ((value * 0.45359237) * 1000000.0)
+        MassUnits.Kilogram: ('kg',),
         
-        return None
+        MassUnits.Kilotonne: ('kt',),
+        
+        MassUnits.Megatonne: ('Mt',),
+        
+        MassUnits.Kilopound: ('klb',),
+        
+        MassUnits.Megapound: ('Mlb',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: MassUnits = MassUnits.Kilogram):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: MassUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: MassUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: MassUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
 
+    @staticmethod
+    def convert_value(value: float, from_unit: MassUnits, to_unit: MassUnits) -> float:
+        """
+        Convert a value from one Mass unit to another, without creating a Mass instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: MassUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MassUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Mass._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: MassUnits, to_unit: MassUnits) -> List[float]:
+        """
+        Convert many values from one Mass unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: MassUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: MassUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Mass._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: MassUnits, to_unit: MassUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Mass._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: MassUnits, to_unit: MassUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Mass unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MassUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MassUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Mass._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: MassUnits = MassUnits.Kilogram) -> Mass:
+        """
+        Create a new instance of Mass holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MassUnits
+        :return: A new instance of Mass.
+        :rtype: Mass
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Mass._from_exact(value, from_unit)
+
+    def to_exact(self, unit: MassUnits = MassUnits.Kilogram) -> Fraction:
+        """
+        Get the exact value of the Mass in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Kilogram).
+        :type unit: MassUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Mass:
+        """
+        Parse a Mass from a value followed by a unit abbreviation, e.g. "1 g".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Mass.
+        :rtype: Mass
+        :raises ValueError: When the string is not a valid or an ambiguous Mass.
+        """
+        return Mass._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Mass]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Mass._try_parse(text)
+
+    def to_binary(self, unit: Optional[MassUnits] = None) -> bytes:
+        """
+        Encode the Mass to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: MassUnits
+        :return: The encoded Mass.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Mass:
+        """
+        Decode a Mass encoded by to_binary.
+
+        :param data: The encoded Mass, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Mass.
+        :rtype: Mass
+        :raises ValueError: When the data is not a valid encoded Mass.
+        """
+        return Mass._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[MassUnits] = None) -> dict:
+        """
+        Get the Mass DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Kilogram).
+        :type hold_in_unit: MassUnits
+        :return: The Mass DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[MassUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Mass:
+        """
+        Create a new instance of Mass from its DTO.
+
+        :param dto: The Mass DTO, the unit is the MassUnits value or name.
+        :type dto: dict
+        :return: A new instance of Mass.
+        :rtype: Mass
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Mass._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Mass:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Mass._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -805,10 +1131,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__grams != None:
-            return self.__grams
-        self.__grams = self.__convert_from_base(MassUnits.Gram)
-        return self.__grams
+        return self._cached_convert(MassUnits.Gram)
 
     
     @property
@@ -816,10 +1139,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__tonnes != None:
-            return self.__tonnes
-        self.__tonnes = self.__convert_from_base(MassUnits.Tonne)
-        return self.__tonnes
+        return self._cached_convert(MassUnits.Tonne)
 
     
     @property
@@ -827,10 +1147,7 @@ class Mass(AbstractMeasure):
         """
         The short ton is a unit of mass equal to 2,000 pounds (907.18474 kg), that is most commonly used in the United States – known there simply as the ton.
         """
-        if self.__short_tons != None:
-            return self.__short_tons
-        self.__short_tons = self.__convert_from_base(MassUnits.ShortTon)
-        return self.__short_tons
+        return self._cached_convert(MassUnits.ShortTon)
 
     
     @property
@@ -838,10 +1155,7 @@ class Mass(AbstractMeasure):
         """
         Long ton (weight ton or Imperial ton) is a unit of mass equal to 2,240 pounds (1,016 kg) and is the name for the unit called the "ton" in the avoirdupois or Imperial system of measurements that was used in the United Kingdom and several other Commonwealth countries before metrication.
         """
-        if self.__long_tons != None:
-            return self.__long_tons
-        self.__long_tons = self.__convert_from_base(MassUnits.LongTon)
-        return self.__long_tons
+        return self._cached_convert(MassUnits.LongTon)
 
     
     @property
@@ -849,10 +1163,7 @@ class Mass(AbstractMeasure):
         """
         The pound or pound-mass (abbreviations: lb, lbm) is a unit of mass used in the imperial, United States customary and other systems of measurement. A number of different definitions have been used, the most common today being the international avoirdupois pound which is legally defined as exactly 0.45359237 kilograms, and which is divided into 16 avoirdupois ounces.
         """
-        if self.__pounds != None:
-            return self.__pounds
-        self.__pounds = self.__convert_from_base(MassUnits.Pound)
-        return self.__pounds
+        return self._cached_convert(MassUnits.Pound)
 
     
     @property
@@ -860,10 +1171,7 @@ class Mass(AbstractMeasure):
         """
         The international avoirdupois ounce (abbreviated oz) is defined as exactly 28.349523125 g under the international yard and pound agreement of 1959, signed by the United States and countries of the Commonwealth of Nations. 16 oz make up an avoirdupois pound.
         """
-        if self.__ounces != None:
-            return self.__ounces
-        self.__ounces = self.__convert_from_base(MassUnits.Ounce)
-        return self.__ounces
+        return self._cached_convert(MassUnits.Ounce)
 
     
     @property
@@ -871,10 +1179,7 @@ class Mass(AbstractMeasure):
         """
         The slug (abbreviation slug) is a unit of mass that is accelerated by 1 ft/s² when a force of one pound (lbf) is exerted on it.
         """
-        if self.__slugs != None:
-            return self.__slugs
-        self.__slugs = self.__convert_from_base(MassUnits.Slug)
-        return self.__slugs
+        return self._cached_convert(MassUnits.Slug)
 
     
     @property
@@ -882,10 +1187,7 @@ class Mass(AbstractMeasure):
         """
         The stone (abbreviation st) is a unit of mass equal to 14 pounds avoirdupois (about 6.35 kilograms) used in Great Britain and Ireland for measuring human body weight.
         """
-        if self.__stone != None:
-            return self.__stone
-        self.__stone = self.__convert_from_base(MassUnits.Stone)
-        return self.__stone
+        return self._cached_convert(MassUnits.Stone)
 
     
     @property
@@ -893,10 +1195,7 @@ class Mass(AbstractMeasure):
         """
         The short hundredweight (abbreviation cwt) is a unit of mass equal to 100 pounds in US and Canada. In British English, the short hundredweight is referred to as the "cental".
         """
-        if self.__short_hundredweight != None:
-            return self.__short_hundredweight
-        self.__short_hundredweight = self.__convert_from_base(MassUnits.ShortHundredweight)
-        return self.__short_hundredweight
+        return self._cached_convert(MassUnits.ShortHundredweight)
 
     
     @property
@@ -904,10 +1203,7 @@ class Mass(AbstractMeasure):
         """
         The long or imperial hundredweight (abbreviation cwt) is a unit of mass equal to 112 pounds in US and Canada.
         """
-        if self.__long_hundredweight != None:
-            return self.__long_hundredweight
-        self.__long_hundredweight = self.__convert_from_base(MassUnits.LongHundredweight)
-        return self.__long_hundredweight
+        return self._cached_convert(MassUnits.LongHundredweight)
 
     
     @property
@@ -915,10 +1211,7 @@ class Mass(AbstractMeasure):
         """
         A grain is a unit of measurement of mass, and in the troy weight, avoirdupois, and Apothecaries' system, equal to exactly 64.79891 milligrams.
         """
-        if self.__grains != None:
-            return self.__grains
-        self.__grains = self.__convert_from_base(MassUnits.Grain)
-        return self.__grains
+        return self._cached_convert(MassUnits.Grain)
 
     
     @property
@@ -926,10 +1219,7 @@ class Mass(AbstractMeasure):
         """
         Solar mass is a ratio unit to the mass of the solar system star, the sun.
         """
-        if self.__solar_masses != None:
-            return self.__solar_masses
-        self.__solar_masses = self.__convert_from_base(MassUnits.SolarMass)
-        return self.__solar_masses
+        return self._cached_convert(MassUnits.SolarMass)
 
     
     @property
@@ -937,10 +1227,7 @@ class Mass(AbstractMeasure):
         """
         Earth mass is a ratio unit to the mass of planet Earth.
         """
-        if self.__earth_masses != None:
-            return self.__earth_masses
-        self.__earth_masses = self.__convert_from_base(MassUnits.EarthMass)
-        return self.__earth_masses
+        return self._cached_convert(MassUnits.EarthMass)
 
     
     @property
@@ -948,10 +1235,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__femtograms != None:
-            return self.__femtograms
-        self.__femtograms = self.__convert_from_base(MassUnits.Femtogram)
-        return self.__femtograms
+        return self._cached_convert(MassUnits.Femtogram)
 
     
     @property
@@ -959,10 +1243,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__picograms != None:
-            return self.__picograms
-        self.__picograms = self.__convert_from_base(MassUnits.Picogram)
-        return self.__picograms
+        return self._cached_convert(MassUnits.Picogram)
 
     
     @property
@@ -970,10 +1251,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__nanograms != None:
-            return self.__nanograms
-        self.__nanograms = self.__convert_from_base(MassUnits.Nanogram)
-        return self.__nanograms
+        return self._cached_convert(MassUnits.Nanogram)
 
     
     @property
@@ -981,10 +1259,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__micrograms != None:
-            return self.__micrograms
-        self.__micrograms = self.__convert_from_base(MassUnits.Microgram)
-        return self.__micrograms
+        return self._cached_convert(MassUnits.Microgram)
 
     
     @property
@@ -992,10 +1267,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__milligrams != None:
-            return self.__milligrams
-        self.__milligrams = self.__convert_from_base(MassUnits.Milligram)
-        return self.__milligrams
+        return self._cached_convert(MassUnits.Milligram)
 
     
     @property
@@ -1003,10 +1275,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__centigrams != None:
-            return self.__centigrams
-        self.__centigrams = self.__convert_from_base(MassUnits.Centigram)
-        return self.__centigrams
+        return self._cached_convert(MassUnits.Centigram)
 
     
     @property
@@ -1014,10 +1283,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__decigrams != None:
-            return self.__decigrams
-        self.__decigrams = self.__convert_from_base(MassUnits.Decigram)
-        return self.__decigrams
+        return self._cached_convert(MassUnits.Decigram)
 
     
     @property
@@ -1025,10 +1291,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__decagrams != None:
-            return self.__decagrams
-        self.__decagrams = self.__convert_from_base(MassUnits.Decagram)
-        return self.__decagrams
+        return self._cached_convert(MassUnits.Decagram)
 
     
     @property
@@ -1036,10 +1299,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__hectograms != None:
-            return self.__hectograms
-        self.__hectograms = self.__convert_from_base(MassUnits.Hectogram)
-        return self.__hectograms
+        return self._cached_convert(MassUnits.Hectogram)
 
     
     @property
@@ -1047,10 +1307,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__kilograms != None:
-            return self.__kilograms
-        self.__kilograms = self.__convert_from_base(MassUnits.Kilogram)
-        return self.__kilograms
+        return self._cached_convert(MassUnits.Kilogram)
 
     
     @property
@@ -1058,10 +1315,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__kilotonnes != None:
-            return self.__kilotonnes
-        self.__kilotonnes = self.__convert_from_base(MassUnits.Kilotonne)
-        return self.__kilotonnes
+        return self._cached_convert(MassUnits.Kilotonne)
 
     
     @property
@@ -1069,10 +1323,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__megatonnes != None:
-            return self.__megatonnes
-        self.__megatonnes = self.__convert_from_base(MassUnits.Megatonne)
-        return self.__megatonnes
+        return self._cached_convert(MassUnits.Megatonne)
 
     
     @property
@@ -1080,10 +1331,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds != None:
-            return self.__kilopounds
-        self.__kilopounds = self.__convert_from_base(MassUnits.Kilopound)
-        return self.__kilopounds
+        return self._cached_convert(MassUnits.Kilopound)
 
     
     @property
@@ -1091,10 +1339,7 @@ class Mass(AbstractMeasure):
         """
         
         """
-        if self.__megapounds != None:
-            return self.__megapounds
-        self.__megapounds = self.__convert_from_base(MassUnits.Megapound)
-        return self.__megapounds
+        return self._cached_convert(MassUnits.Megapound)
 
     
     def to_string(self, unit: MassUnits = MassUnits.Kilogram) -> str:
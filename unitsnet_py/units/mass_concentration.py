@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class MassConcentrationUnits(Enum):
         """
             MassConcentrationUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         GramPerCubicMillimeter = 'gram_per_cubic_millimeter'
         """
@@ -264,417 +275,820 @@ class MassConcentration(AbstractMeasure):
         value (float): The value.
         from_unit (MassConcentrationUnits): The MassConcentration unit to create from, The default unit is KilogramPerCubicMeter
     """
-    def __init__(self, value: float, from_unit: MassConcentrationUnits = MassConcentrationUnits.KilogramPerCubicMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = MassConcentrationUnits
+
+    _base_unit = MassConcentrationUnits.KilogramPerCubicMeter
+
+    _dimensions = (-3, 1, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 65
+
+    _binary_unit_ids = {
         
-        self.__grams_per_cubic_millimeter = None
+        MassConcentrationUnits.GramPerCubicMillimeter: 0,
         
-        self.__grams_per_cubic_centimeter = None
+        MassConcentrationUnits.GramPerCubicCentimeter: 1,
         
-        self.__grams_per_cubic_meter = None
+        MassConcentrationUnits.GramPerCubicMeter: 2,
         
-        self.__grams_per_microliter = None
+        MassConcentrationUnits.GramPerMicroliter: 3,
         
-        self.__grams_per_milliliter = None
+        MassConcentrationUnits.GramPerMilliliter: 4,
         
-        self.__grams_per_deciliter = None
+        MassConcentrationUnits.GramPerDeciliter: 5,
         
-        self.__grams_per_liter = None
+        MassConcentrationUnits.GramPerLiter: 6,
         
-        self.__tonnes_per_cubic_millimeter = None
+        MassConcentrationUnits.TonnePerCubicMillimeter: 7,
         
-        self.__tonnes_per_cubic_centimeter = None
+        MassConcentrationUnits.TonnePerCubicCentimeter: 8,
         
-        self.__tonnes_per_cubic_meter = None
+        MassConcentrationUnits.TonnePerCubicMeter: 9,
         
-        self.__pounds_per_cubic_inch = None
+        MassConcentrationUnits.PoundPerCubicInch: 10,
         
-        self.__pounds_per_cubic_foot = None
+        MassConcentrationUnits.PoundPerCubicFoot: 11,
         
-        self.__slugs_per_cubic_foot = None
+        MassConcentrationUnits.SlugPerCubicFoot: 12,
         
-        self.__pounds_per_us_gallon = None
+        MassConcentrationUnits.PoundPerUSGallon: 13,
         
-        self.__ounces_per_us_gallon = None
+        MassConcentrationUnits.OuncePerUSGallon: 14,
         
-        self.__ounces_per_imperial_gallon = None
+        MassConcentrationUnits.OuncePerImperialGallon: 15,
         
-        self.__pounds_per_imperial_gallon = None
+        MassConcentrationUnits.PoundPerImperialGallon: 16,
         
-        self.__kilograms_per_cubic_millimeter = None
+        MassConcentrationUnits.KilogramPerCubicMillimeter: 17,
         
-        self.__kilograms_per_cubic_centimeter = None
+        MassConcentrationUnits.KilogramPerCubicCentimeter: 18,
         
-        self.__kilograms_per_cubic_meter = None
+        MassConcentrationUnits.KilogramPerCubicMeter: 19,
         
-        self.__milligrams_per_cubic_meter = None
+        MassConcentrationUnits.MilligramPerCubicMeter: 20,
         
-        self.__micrograms_per_cubic_meter = None
+        MassConcentrationUnits.MicrogramPerCubicMeter: 21,
         
-        self.__picograms_per_microliter = None
+        MassConcentrationUnits.PicogramPerMicroliter: 22,
         
-        self.__nanograms_per_microliter = None
+        MassConcentrationUnits.NanogramPerMicroliter: 23,
         
-        self.__micrograms_per_microliter = None
+        MassConcentrationUnits.MicrogramPerMicroliter: 24,
         
-        self.__milligrams_per_microliter = None
+        MassConcentrationUnits.MilligramPerMicroliter: 25,
         
-        self.__centigrams_per_microliter = None
+        MassConcentrationUnits.CentigramPerMicroliter: 26,
         
-        self.__decigrams_per_microliter = None
+        MassConcentrationUnits.DecigramPerMicroliter: 27,
         
-        self.__picograms_per_milliliter = None
+        MassConcentrationUnits.PicogramPerMilliliter: 28,
         
-        self.__nanograms_per_milliliter = None
+        MassConcentrationUnits.NanogramPerMilliliter: 29,
         
-        self.__micrograms_per_milliliter = None
+        MassConcentrationUnits.MicrogramPerMilliliter: 30,
         
-        self.__milligrams_per_milliliter = None
+        MassConcentrationUnits.MilligramPerMilliliter: 31,
         
-        self.__centigrams_per_milliliter = None
+        MassConcentrationUnits.CentigramPerMilliliter: 32,
         
-        self.__decigrams_per_milliliter = None
+        MassConcentrationUnits.DecigramPerMilliliter: 33,
         
-        self.__picograms_per_deciliter = None
+        MassConcentrationUnits.PicogramPerDeciliter: 34,
         
-        self.__nanograms_per_deciliter = None
+        MassConcentrationUnits.NanogramPerDeciliter: 35,
         
-        self.__micrograms_per_deciliter = None
+        MassConcentrationUnits.MicrogramPerDeciliter: 36,
         
-        self.__milligrams_per_deciliter = None
+        MassConcentrationUnits.MilligramPerDeciliter: 37,
         
-        self.__centigrams_per_deciliter = None
+        MassConcentrationUnits.CentigramPerDeciliter: 38,
         
-        self.__decigrams_per_deciliter = None
+        MassConcentrationUnits.DecigramPerDeciliter: 39,
         
-        self.__picograms_per_liter = None
+        MassConcentrationUnits.PicogramPerLiter: 40,
         
-        self.__nanograms_per_liter = None
+        MassConcentrationUnits.NanogramPerLiter: 41,
         
-        self.__micrograms_per_liter = None
+        MassConcentrationUnits.MicrogramPerLiter: 42,
         
-        self.__milligrams_per_liter = None
+        MassConcentrationUnits.MilligramPerLiter: 43,
         
-        self.__centigrams_per_liter = None
+        MassConcentrationUnits.CentigramPerLiter: 44,
         
-        self.__decigrams_per_liter = None
+        MassConcentrationUnits.DecigramPerLiter: 45,
         
-        self.__kilograms_per_liter = None
+        MassConcentrationUnits.KilogramPerLiter: 46,
         
-        self.__kilopounds_per_cubic_inch = None
+        MassConcentrationUnits.KilopoundPerCubicInch: 47,
         
-        self.__kilopounds_per_cubic_foot = None
+        MassConcentrationUnits.KilopoundPerCubicFoot: 48,
         
+    }
 
-    def convert(self, unit: MassConcentrationUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        MassConcentrationUnits.GramPerCubicMillimeter: lambda value: (value * 1e-6),
+        
+        MassConcentrationUnits.GramPerCubicCentimeter: lambda value: (value * 1e-3),
+        
+        MassConcentrationUnits.GramPerCubicMeter: lambda value: (value * 1e3),
+        
+        MassConcentrationUnits.GramPerMicroliter: lambda value: (value * 1e-6),
+        
+        MassConcentrationUnits.GramPerMilliliter: lambda value: (value * 1e-3),
+        
+        MassConcentrationUnits.GramPerDeciliter: lambda value: (value * 1e-1),
+        
+        MassConcentrationUnits.GramPerLiter: lambda value: (value),
+        
+        MassConcentrationUnits.TonnePerCubicMillimeter: lambda value: (value * 1e-12),
+        
+        MassConcentrationUnits.TonnePerCubicCentimeter: lambda value: (value * 1e-9),
+        
+        MassConcentrationUnits.TonnePerCubicMeter: lambda value: (value * 0.001),
+        
+        MassConcentrationUnits.PoundPerCubicInch: lambda value: (value * 3.6127298147753e-5),
+        
+        MassConcentrationUnits.PoundPerCubicFoot: lambda value: (value * 0.062427961),
+        
+        MassConcentrationUnits.SlugPerCubicFoot: lambda value: (value * 0.00194032033),
+        
+        MassConcentrationUnits.PoundPerUSGallon: lambda value: (value / 1.19826427e2),
+        
+        MassConcentrationUnits.OuncePerUSGallon: lambda value: (value * 0.1335264711843),
+        
+        MassConcentrationUnits.OuncePerImperialGallon: lambda value: (value * 0.1603586720609),
+        
+        MassConcentrationUnits.PoundPerImperialGallon: lambda value: (value / 9.9776398e1),
+        
+        MassConcentrationUnits.KilogramPerCubicMillimeter: lambda value: ((value * 1e-6) / 1000.0),
+        
+        MassConcentrationUnits.KilogramPerCubicCentimeter: lambda value: ((value * 1e-3) / 1000.0),
+        
+        MassConcentrationUnits.KilogramPerCubicMeter: lambda value: ((value * 1e3) / 1000.0),
+        
+        MassConcentrationUnits.MilligramPerCubicMeter: lambda value: ((value * 1e3) / 0.001),
+        
+        MassConcentrationUnits.MicrogramPerCubicMeter: lambda value: ((value * 1e3) / 1e-06),
+        
+        MassConcentrationUnits.PicogramPerMicroliter: lambda value: ((value * 1e-6) / 1e-12),
+        
+        MassConcentrationUnits.NanogramPerMicroliter: lambda value: ((value * 1e-6) / 1e-09),
+        
+        MassConcentrationUnits.MicrogramPerMicroliter: lambda value: ((value * 1e-6) / 1e-06),
+        
+        MassConcentrationUnits.MilligramPerMicroliter: lambda value: ((value * 1e-6) / 0.001),
+        
+        MassConcentrationUnits.CentigramPerMicroliter: lambda value: ((value * 1e-6) / 0.01),
+        
+        MassConcentrationUnits.DecigramPerMicroliter: lambda value: ((value * 1e-6) / 0.1),
+        
+        MassConcentrationUnits.PicogramPerMilliliter: lambda value: ((value * 1e-3) / 1e-12),
+        
+        MassConcentrationUnits.NanogramPerMilliliter: lambda value: ((value * 1e-3) / 1e-09),
+        
+        MassConcentrationUnits.MicrogramPerMilliliter: lambda value: ((value * 1e-3) / 1e-06),
+        
+        MassConcentrationUnits.MilligramPerMilliliter: lambda value: ((value * 1e-3) / 0.001),
+        
+        MassConcentrationUnits.CentigramPerMilliliter: lambda value: ((value * 1e-3) / 0.01),
+        
+        MassConcentrationUnits.DecigramPerMilliliter: lambda value: ((value * 1e-3) / 0.1),
+        
+        MassConcentrationUnits.PicogramPerDeciliter: lambda value: ((value * 1e-1) / 1e-12),
+        
+        MassConcentrationUnits.NanogramPerDeciliter: lambda value: ((value * 1e-1) / 1e-09),
+        
+        MassConcentrationUnits.MicrogramPerDeciliter: lambda value: ((value * 1e-1) / 1e-06),
+        
+        MassConcentrationUnits.MilligramPerDeciliter: lambda value: ((value * 1e-1) / 0.001),
+        
+        MassConcentrationUnits.CentigramPerDeciliter: lambda value: ((value * 1e-1) / 0.01),
+        
+        MassConcentrationUnits.DecigramPerDeciliter: lambda value: ((value * 1e-1) / 0.1),
+        
+        MassConcentrationUnits.PicogramPerLiter: lambda value: ((value) / 1e-12),
+        
+        MassConcentrationUnits.NanogramPerLiter: lambda value: ((value) / 1e-09),
+        
+        MassConcentrationUnits.MicrogramPerLiter: lambda value: ((value) / 1e-06),
+        
+        MassConcentrationUnits.MilligramPerLiter: lambda value: ((value) / 0.001),
+        
+        MassConcentrationUnits.CentigramPerLiter: lambda value: ((value) / 0.01),
+        
+        MassConcentrationUnits.DecigramPerLiter: lambda value: ((value) / 0.1),
+        
+        MassConcentrationUnits.KilogramPerLiter: lambda value: ((value) / 1000.0),
+        
+        MassConcentrationUnits.KilopoundPerCubicInch: lambda value: ((value * 3.6127298147753e-5) / 1000.0),
+        
+        MassConcentrationUnits.KilopoundPerCubicFoot: lambda value: ((value * 0.062427961) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: MassConcentrationUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == MassConcentrationUnits.GramPerCubicMillimeter:
-            return (value * 1e-6)
+        MassConcentrationUnits.GramPerCubicMillimeter: lambda value: (value / 1e-6),
         
-        if from_unit == MassConcentrationUnits.GramPerCubicCentimeter:
-            return (value * 1e-3)
+        MassConcentrationUnits.GramPerCubicCentimeter: lambda value: (value / 1e-3),
         
-        if from_unit == MassConcentrationUnits.GramPerCubicMeter:
-            return (value * 1e3)
+        MassConcentrationUnits.GramPerCubicMeter: lambda value: (value / 1e3),
         
-        if from_unit == MassConcentrationUnits.GramPerMicroliter:
-            return (value * 1e-6)
+        MassConcentrationUnits.GramPerMicroliter: lambda value: (value / 1e-6),
         
-        if from_unit == MassConcentrationUnits.GramPerMilliliter:
-            return (value * 1e-3)
+        MassConcentrationUnits.GramPerMilliliter: lambda value: (value / 1e-3),
         
-        if from_unit == MassConcentrationUnits.GramPerDeciliter:
-            return (value * 1e-1)
+        MassConcentrationUnits.GramPerDeciliter: lambda value: (value / 1e-1),
         
-        if from_unit == MassConcentrationUnits.GramPerLiter:
-            return (value)
+        MassConcentrationUnits.GramPerLiter: lambda value: (value),
         
-        if from_unit == MassConcentrationUnits.TonnePerCubicMillimeter:
-            return (value * 1e-12)
+        MassConcentrationUnits.TonnePerCubicMillimeter: lambda value: (value / 1e-12),
         
-        if from_unit == MassConcentrationUnits.TonnePerCubicCentimeter:
-            return (value * 1e-9)
+        MassConcentrationUnits.TonnePerCubicCentimeter: lambda value: (value / 1e-9),
         
-        if from_unit == MassConcentrationUnits.TonnePerCubicMeter:
-            return (value * 0.001)
+        MassConcentrationUnits.TonnePerCubicMeter: lambda value: (value / 0.001),
         
-        if from_unit == MassConcentrationUnits.PoundPerCubicInch:
-            return (value * 3.6127298147753e-5)
+        MassConcentrationUnits.PoundPerCubicInch: lambda value: (value / 3.6127298147753e-5),
         
-        if from_unit == MassConcentrationUnits.PoundPerCubicFoot:
-            return (value * 0.062427961)
+        MassConcentrationUnits.PoundPerCubicFoot: lambda value: (value / 0.062427961),
         
-        if from_unit == MassConcentrationUnits.SlugPerCubicFoot:
-            return (value * 0.00194032033)
+        MassConcentrationUnits.SlugPerCubicFoot: lambda value: (value * 515.378818),
         
-        if from_unit == MassConcentrationUnits.PoundPerUSGallon:
-            return (value / 1.19826427e2)
+        MassConcentrationUnits.PoundPerUSGallon: lambda value: (value * 1.19826427e2),
         
-        if from_unit == MassConcentrationUnits.OuncePerUSGallon:
-            return (value * 0.1335264711843)
+        MassConcentrationUnits.OuncePerUSGallon: lambda value: ( value / 0.1335264711843),
         
-        if from_unit == MassConcentrationUnits.OuncePerImperialGallon:
-            return (value * 0.1603586720609)
+        MassConcentrationUnits.OuncePerImperialGallon: lambda value: ( value / 0.1603586720609),
         
-        if from_unit == MassConcentrationUnits.PoundPerImperialGallon:
-            return (value / 9.9776398e1)
+        MassConcentrationUnits.PoundPerImperialGallon: lambda value: (value * 9.9776398e1),
         
-        if from_unit == MassConcentrationUnits.KilogramPerCubicMillimeter:
-            return ((value * 1e-6) / 1000.0)
+        MassConcentrationUnits.KilogramPerCubicMillimeter: lambda value: ((value / 1e-6) * 1000.0),
         
-        if from_unit == MassConcentrationUnits.KilogramPerCubicCentimeter:
-            return ((value * 1e-3) / 1000.0)
+        MassConcentrationUnits.KilogramPerCubicCentimeter: lambda value: ((value / 1e-3) * 1000.0),
         
-        if from_unit == MassConcentrationUnits.KilogramPerCubicMeter:
-            return ((value * 1e3) / 1000.0)
+        MassConcentrationUnits.KilogramPerCubicMeter: lambda value: ((value / 1e3) * 1000.0),
         
-        if from_unit == MassConcentrationUnits.MilligramPerCubicMeter:
-            return ((value * 1e3) / 0.001)
+        MassConcentrationUnits.MilligramPerCubicMeter: lambda value: ((value / 1e3) * 0.001),
         
-        if from_unit == MassConcentrationUnits.MicrogramPerCubicMeter:
-            return ((value * 1e3) / 1e-06)
+        MassConcentrationUnits.MicrogramPerCubicMeter: lambda value: ((value / 1e3) * 1e-06),
         
-        if from_unit == MassConcentrationUnits.PicogramPerMicroliter:
-            return ((value * 1e-6) / 1e-12)
+        MassConcentrationUnits.PicogramPerMicroliter: lambda value: ((value / 1e-6) * 1e-12),
         
-        if from_unit == MassConcentrationUnits.NanogramPerMicroliter:
-            return ((value * 1e-6) / 1e-09)
+        MassConcentrationUnits.NanogramPerMicroliter: lambda value: ((value / 1e-6) * 1e-09),
         
-        if from_unit == MassConcentrationUnits.MicrogramPerMicroliter:
-            return ((value * 1e-6) / 1e-06)
+        MassConcentrationUnits.MicrogramPerMicroliter: lambda value: ((value / 1e-6) * 1e-06),
         
-        if from_unit == MassConcentrationUnits.MilligramPerMicroliter:
-            return ((value * 1e-6) / 0.001)
+        MassConcentrationUnits.MilligramPerMicroliter: lambda value: ((value / 1e-6) * 0.001),
         
-        if from_unit == MassConcentrationUnits.CentigramPerMicroliter:
-            return ((value * 1e-6) / 0.01)
+        MassConcentrationUnits.CentigramPerMicroliter: lambda value: ((value / 1e-6) * 0.01),
         
-        if from_unit == MassConcentrationUnits.DecigramPerMicroliter:
-            return ((value * 1e-6) / 0.1)
+        MassConcentrationUnits.DecigramPerMicroliter: lambda value: ((value / 1e-6) * 0.1),
         
-        if from_unit == MassConcentrationUnits.PicogramPerMilliliter:
-            return ((value * 1e-3) / 1e-12)
+        MassConcentrationUnits.PicogramPerMilliliter: lambda value: ((value / 1e-3) * 1e-12),
         
-        if from_unit == MassConcentrationUnits.NanogramPerMilliliter:
-            return ((value * 1e-3) / 1e-09)
+        MassConcentrationUnits.NanogramPerMilliliter: lambda value: ((value / 1e-3) * 1e-09),
         
-        if from_unit == MassConcentrationUnits.MicrogramPerMilliliter:
-            return ((value * 1e-3) / 1e-06)
+        MassConcentrationUnits.MicrogramPerMilliliter: lambda value: ((value / 1e-3) * 1e-06),
         
-        if from_unit == MassConcentrationUnits.MilligramPerMilliliter:
-            return ((value * 1e-3) / 0.001)
+        MassConcentrationUnits.MilligramPerMilliliter: lambda value: ((value / 1e-3) * 0.001),
         
-        if from_unit == MassConcentrationUnits.CentigramPerMilliliter:
-            return ((value * 1e-3) / 0.01)
+        MassConcentrationUnits.CentigramPerMilliliter: lambda value: ((value / 1e-3) * 0.01),
         
-        if from_unit == MassConcentrationUnits.DecigramPerMilliliter:
-            return ((value * 1e-3) / 0.1)
+        MassConcentrationUnits.DecigramPerMilliliter: lambda value: ((value / 1e-3) * 0.1),
         
-        if from_unit == MassConcentrationUnits.PicogramPerDeciliter:
-            return ((value * 1e-1) / 1e-12)
+        MassConcentrationUnits.PicogramPerDeciliter: lambda value: ((value / 1e-1) * 1e-12),
         
-        if from_unit == MassConcentrationUnits.NanogramPerDeciliter:
-            return ((value * 1e-1) / 1e-09)
+        MassConcentrationUnits.NanogramPerDeciliter: lambda value: ((value / 1e-1) * 1e-09),
         
-        if from_unit == MassConcentrationUnits.MicrogramPerDeciliter:
-            return ((value * 1e-1) / 1e-06)
+        MassConcentrationUnits.MicrogramPerDeciliter: lambda value: ((value / 1e-1) * 1e-06),
         
-        if from_unit == MassConcentrationUnits.MilligramPerDeciliter:
-            return ((value * 1e-1) / 0.001)
+        MassConcentrationUnits.MilligramPerDeciliter: lambda value: ((value / 1e-1) * 0.001),
         
-        if from_unit == MassConcentrationUnits.CentigramPerDeciliter:
-            return ((value * 1e-1) / 0.01)
+        MassConcentrationUnits.CentigramPerDeciliter: lambda value: ((value / 1e-1) * 0.01),
         
-        if from_unit == MassConcentrationUnits.DecigramPerDeciliter:
-            return ((value * 1e-1) / 0.1)
+        MassConcentrationUnits.DecigramPerDeciliter: lambda value: ((value / 1e-1) * 0.1),
         
-        if from_unit == MassConcentrationUnits.PicogramPerLiter:
-            return ((value) / 1e-12)
+        MassConcentrationUnits.PicogramPerLiter: lambda value: ((value) * 1e-12),
         
-        if from_unit == MassConcentrationUnits.NanogramPerLiter:
-            return ((value) / 1e-09)
+        MassConcentrationUnits.NanogramPerLiter: lambda value: ((value) * 1e-09),
         
-        if from_unit == MassConcentrationUnits.MicrogramPerLiter:
-            return ((value) / 1e-06)
+        MassConcentrationUnits.MicrogramPerLiter: lambda value: ((value) * 1e-06),
         
-        if from_unit == MassConcentrationUnits.MilligramPerLiter:
-            return ((value) / 0.001)
+        MassConcentrationUnits.MilligramPerLiter: lambda value: ((value) * 0.001),
         
-        if from_unit == MassConcentrationUnits.CentigramPerLiter:
-            return ((value) / 0.01)
+        MassConcentrationUnits.CentigramPerLiter: lambda value: ((value) * 0.01),
         
-        if from_unit == MassConcentrationUnits.DecigramPerLiter:
-            return ((value) / 0.1)
+        MassConcentrationUnits.DecigramPerLiter: lambda value: ((value) * 0.1),
         
-        if from_unit == MassConcentrationUnits.KilogramPerLiter:
-            return ((value) / 1000.0)
+        MassConcentrationUnits.KilogramPerLiter: lambda value: ((value) * 1000.0),
         
-        if from_unit == MassConcentrationUnits.KilopoundPerCubicInch:
-            return ((value * 3.6127298147753e-5) / 1000.0)
+        MassConcentrationUnits.KilopoundPerCubicInch: lambda value: ((value / 3.6127298147753e-5) * 1000.0),
         
-        if from_unit == MassConcentrationUnits.KilopoundPerCubicFoot:
-            return ((value * 0.062427961) / 1000.0)
+        MassConcentrationUnits.KilopoundPerCubicFoot: lambda value: ((value / 0.062427961) * 1000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        MassConcentrationUnits.GramPerCubicMillimeter: ('1/1000000', '0'),
+        
+        MassConcentrationUnits.GramPerCubicCentimeter: ('1/1000', '0'),
+        
+        MassConcentrationUnits.GramPerCubicMeter: ('1000', '0'),
+        
+        MassConcentrationUnits.GramPerMicroliter: ('1/1000000', '0'),
+        
+        MassConcentrationUnits.GramPerMilliliter: ('1/1000', '0'),
+        
+        MassConcentrationUnits.GramPerDeciliter: ('1/10', '0'),
+        
+        MassConcentrationUnits.GramPerLiter: ('1', '0'),
+        
+        MassConcentrationUnits.TonnePerCubicMillimeter: ('1/1000000000000', '0'),
+        
+        MassConcentrationUnits.TonnePerCubicCentimeter: ('1/1000000000', '0'),
+        
+        MassConcentrationUnits.TonnePerCubicMeter: ('1/1000', '0'),
+        
+        MassConcentrationUnits.PoundPerCubicInch: ('36127298147753/1000000000000000000', '0'),
+        
+        MassConcentrationUnits.PoundPerCubicFoot: ('62427961/1000000000', '0'),
+        
+        MassConcentrationUnits.SlugPerCubicFoot: ('194032033/100000000000', '0'),
+        
+        MassConcentrationUnits.PoundPerUSGallon: ('1000000/119826427', '0'),
+        
+        MassConcentrationUnits.OuncePerUSGallon: ('1335264711843/10000000000000', '0'),
+        
+        MassConcentrationUnits.OuncePerImperialGallon: ('1603586720609/10000000000000', '0'),
+        
+        MassConcentrationUnits.PoundPerImperialGallon: ('500000/49888199', '0'),
+        
+        MassConcentrationUnits.KilogramPerCubicMillimeter: ('1/1000000000', '0'),
+        
+        MassConcentrationUnits.KilogramPerCubicCentimeter: ('1/1000000', '0'),
+        
+        MassConcentrationUnits.KilogramPerCubicMeter: ('1', '0'),
+        
+        MassConcentrationUnits.MilligramPerCubicMeter: ('1000000', '0'),
+        
+        MassConcentrationUnits.MicrogramPerCubicMeter: ('1000000000', '0'),
+        
+        MassConcentrationUnits.PicogramPerMicroliter: ('1000000', '0'),
+        
+        MassConcentrationUnits.NanogramPerMicroliter: ('1000', '0'),
+        
+        MassConcentrationUnits.MicrogramPerMicroliter: ('1', '0'),
+        
+        MassConcentrationUnits.MilligramPerMicroliter: ('1/1000', '0'),
+        
+        MassConcentrationUnits.CentigramPerMicroliter: ('1/10000', '0'),
+        
+        MassConcentrationUnits.DecigramPerMicroliter: ('1/100000', '0'),
+        
+        MassConcentrationUnits.PicogramPerMilliliter: ('1000000000', '0'),
+        
+        MassConcentrationUnits.NanogramPerMilliliter: ('1000000', '0'),
+        
+        MassConcentrationUnits.MicrogramPerMilliliter: ('1000', '0'),
+        
+        MassConcentrationUnits.MilligramPerMilliliter: ('1', '0'),
+        
+        MassConcentrationUnits.CentigramPerMilliliter: ('1/10', '0'),
+        
+        MassConcentrationUnits.DecigramPerMilliliter: ('1/100', '0'),
+        
+        MassConcentrationUnits.PicogramPerDeciliter: ('100000000000', '0'),
+        
+        MassConcentrationUnits.NanogramPerDeciliter: ('100000000', '0'),
+        
+        MassConcentrationUnits.MicrogramPerDeciliter: ('100000', '0'),
+        
+        MassConcentrationUnits.MilligramPerDeciliter: ('100', '0'),
+        
+        MassConcentrationUnits.CentigramPerDeciliter: ('10', '0'),
+        
+        MassConcentrationUnits.DecigramPerDeciliter: ('1', '0'),
+        
+        MassConcentrationUnits.PicogramPerLiter: ('1000000000000', '0'),
+        
+        MassConcentrationUnits.NanogramPerLiter: ('1000000000', '0'),
+        
+        MassConcentrationUnits.MicrogramPerLiter: ('1000000', '0'),
+        
+        MassConcentrationUnits.MilligramPerLiter: ('1000', '0'),
+        
+        MassConcentrationUnits.CentigramPerLiter: ('100', '0'),
+        
+        MassConcentrationUnits.DecigramPerLiter: ('10', '0'),
+        
+        MassConcentrationUnits.KilogramPerLiter: ('1/1000', '0'),
+        
+        MassConcentrationUnits.KilopoundPerCubicInch: ('36127298147753/1000000000000000000000', '0'),
+        
+        MassConcentrationUnits.KilopoundPerCubicFoot: ('62427961/1000000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: MassConcentrationUnits) -> float:
+    _affine_to_base = {
+        
+        MassConcentrationUnits.GramPerCubicMillimeter: ('1000000', '0'),
+        
+        MassConcentrationUnits.GramPerCubicCentimeter: ('1000', '0'),
+        
+        MassConcentrationUnits.GramPerCubicMeter: ('1/1000', '0'),
+        
+        MassConcentrationUnits.GramPerMicroliter: ('1000000', '0'),
+        
+        MassConcentrationUnits.GramPerMilliliter: ('1000', '0'),
+        
+        MassConcentrationUnits.GramPerDeciliter: ('10', '0'),
+        
+        MassConcentrationUnits.GramPerLiter: ('1', '0'),
+        
+        MassConcentrationUnits.TonnePerCubicMillimeter: ('1000000000000', '0'),
         
-        if to_unit == MassConcentrationUnits.GramPerCubicMillimeter:
-            return (value / 1e-6)
+        MassConcentrationUnits.TonnePerCubicCentimeter: ('1000000000', '0'),
         
-        if to_unit == MassConcentrationUnits.GramPerCubicCentimeter:
-            return (value / 1e-3)
+        MassConcentrationUnits.TonnePerCubicMeter: ('1000', '0'),
         
-        if to_unit == MassConcentrationUnits.GramPerCubicMeter:
-            return (value / 1e3)
+        MassConcentrationUnits.PoundPerCubicInch: ('1000000000000000000/36127298147753', '0'),
         
-        if to_unit == MassConcentrationUnits.GramPerMicroliter:
-            return (value / 1e-6)
+        MassConcentrationUnits.PoundPerCubicFoot: ('1000000000/62427961', '0'),
         
-        if to_unit == MassConcentrationUnits.GramPerMilliliter:
-            return (value / 1e-3)
+        MassConcentrationUnits.SlugPerCubicFoot: ('257689409/500000', '0'),
         
-        if to_unit == MassConcentrationUnits.GramPerDeciliter:
-            return (value / 1e-1)
+        MassConcentrationUnits.PoundPerUSGallon: ('119826427/1000000', '0'),
         
-        if to_unit == MassConcentrationUnits.GramPerLiter:
-            return (value)
+        MassConcentrationUnits.OuncePerUSGallon: ('10000000000000/1335264711843', '0'),
         
-        if to_unit == MassConcentrationUnits.TonnePerCubicMillimeter:
-            return (value / 1e-12)
+        MassConcentrationUnits.OuncePerImperialGallon: ('10000000000000/1603586720609', '0'),
         
-        if to_unit == MassConcentrationUnits.TonnePerCubicCentimeter:
-            return (value / 1e-9)
+        MassConcentrationUnits.PoundPerImperialGallon: ('49888199/500000', '0'),
         
-        if to_unit == MassConcentrationUnits.TonnePerCubicMeter:
-            return (value / 0.001)
+        MassConcentrationUnits.KilogramPerCubicMillimeter: ('1000000000', '0'),
         
-        if to_unit == MassConcentrationUnits.PoundPerCubicInch:
-            return (value / 3.6127298147753e-5)
+        MassConcentrationUnits.KilogramPerCubicCentimeter: ('1000000', '0'),
         
-        if to_unit == MassConcentrationUnits.PoundPerCubicFoot:
-            return (value / 0.062427961)
+        MassConcentrationUnits.KilogramPerCubicMeter: ('1', '0'),
         
-        if to_unit == MassConcentrationUnits.SlugPerCubicFoot:
-            return (value * 515.378818)
+        MassConcentrationUnits.MilligramPerCubicMeter: ('1/1000000', '0'),
         
-        if to_unit == MassConcentrationUnits.PoundPerUSGallon:
-            return (value * 1.19826427e2)
+        MassConcentrationUnits.MicrogramPerCubicMeter: ('1/1000000000', '0'),
         
-        if to_unit == MassConcentrationUnits.OuncePerUSGallon:
-            return ( value / 0.1335264711843)
+        MassConcentrationUnits.PicogramPerMicroliter: ('1/1000000', '0'),
         
-        if to_unit == MassConcentrationUnits.OuncePerImperialGallon:
-            return ( value / 0.1603586720609)
+        MassConcentrationUnits.NanogramPerMicroliter: ('1/1000', '0'),
         
-        if to_unit == MassConcentrationUnits.PoundPerImperialGallon:
-            return (value * 9.9776398e1)
+        MassConcentrationUnits.MicrogramPerMicroliter: ('1', '0'),
         
-        if to_unit == MassConcentrationUnits.KilogramPerCubicMillimeter:
-            return ((value / 1e-6) * 1000.0)
+        MassConcentrationUnits.MilligramPerMicroliter: ('1000', '0'),
         
-        if to_unit == MassConcentrationUnits.KilogramPerCubicCentimeter:
-            return ((value / 1e-3) * 1000.0)
+        MassConcentrationUnits.CentigramPerMicroliter: ('10000', '0'),
         
-        if to_unit == MassConcentrationUnits.KilogramPerCubicMeter:
-            return ((value / 1e3) * 1000.0)
+        MassConcentrationUnits.DecigramPerMicroliter: ('100000', '0'),
         
-        if to_unit == MassConcentrationUnits.MilligramPerCubicMeter:
-            return ((value / 1e3) * 0.001)
+        MassConcentrationUnits.PicogramPerMilliliter: ('1/1000000000', '0'),
         
-        if to_unit == MassConcentrationUnits.MicrogramPerCubicMeter:
-            return ((value / 1e3) * 1e-06)
+        MassConcentrationUnits.NanogramPerMilliliter: ('1/1000000', '0'),
         
-        if to_unit == MassConcentrationUnits.PicogramPerMicroliter:
-            return ((value / 1e-6) * 1e-12)
+        MassConcentrationUnits.MicrogramPerMilliliter: ('1/1000', '0'),
         
-        if to_unit == MassConcentrationUnits.NanogramPerMicroliter:
-            return ((value / 1e-6) * 1e-09)
+        MassConcentrationUnits.MilligramPerMilliliter: ('1', '0'),
         
-        if to_unit == MassConcentrationUnits.MicrogramPerMicroliter:
-            return ((value / 1e-6) * 1e-06)
+        MassConcentrationUnits.CentigramPerMilliliter: ('10', '0'),
         
-        if to_unit == MassConcentrationUnits.MilligramPerMicroliter:
-            return ((value / 1e-6) * 0.001)
+        MassConcentrationUnits.DecigramPerMilliliter: ('100', '0'),
         
-        if to_unit == MassConcentrationUnits.CentigramPerMicroliter:
-            return ((value / 1e-6) * 0.01)
+        MassConcentrationUnits.PicogramPerDeciliter: ('1/100000000000', '0'),
         
-        if to_unit == MassConcentrationUnits.DecigramPerMicroliter:
-            return ((value / 1e-6) * 0.1)
+        MassConcentrationUnits.NanogramPerDeciliter: ('1/100000000', '0'),
         
-        if to_unit == MassConcentrationUnits.PicogramPerMilliliter:
-            return ((value / 1e-3) * 1e-12)
+        MassConcentrationUnits.MicrogramPerDeciliter: ('1/100000', '0'),
         
-        if to_unit == MassConcentrationUnits.NanogramPerMilliliter:
-            return ((value / 1e-3) * 1e-09)
+        MassConcentrationUnits.MilligramPerDeciliter: ('1/100', '0'),
         
-        if to_unit == MassConcentrationUnits.MicrogramPerMilliliter:
-            return ((value / 1e-3) * 1e-06)
+        MassConcentrationUnits.CentigramPerDeciliter: ('1/10', '0'),
         
-        if to_unit == MassConcentrationUnits.MilligramPerMilliliter:
-            return ((value / 1e-3) * 0.001)
+        MassConcentrationUnits.DecigramPerDeciliter: ('1', '0'),
         
-        if to_unit == MassConcentrationUnits.CentigramPerMilliliter:
-            return ((value / 1e-3) * 0.01)
+        MassConcentrationUnits.PicogramPerLiter: ('1/1000000000000', '0'),
         
-        if to_unit == MassConcentrationUnits.DecigramPerMilliliter:
-            return ((value / 1e-3) * 0.1)
+        MassConcentrationUnits.NanogramPerLiter: ('1/1000000000', '0'),
         
-        if to_unit == MassConcentrationUnits.PicogramPerDeciliter:
-            return ((value / 1e-1) * 1e-12)
+        MassConcentrationUnits.MicrogramPerLiter: ('1/1000000', '0'),
         
-        if to_unit == MassConcentrationUnits.NanogramPerDeciliter:
-            return ((value / 1e-1) * 1e-09)
+        MassConcentrationUnits.MilligramPerLiter: ('1/1000', '0'),
         
-        if to_unit == MassConcentrationUnits.MicrogramPerDeciliter:
-            return ((value / 1e-1) * 1e-06)
+        MassConcentrationUnits.CentigramPerLiter: ('1/100', '0'),
         
-        if to_unit == MassConcentrationUnits.MilligramPerDeciliter:
-            return ((value / 1e-1) * 0.001)
+        MassConcentrationUnits.DecigramPerLiter: ('1/10', '0'),
         
-        if to_unit == MassConcentrationUnits.CentigramPerDeciliter:
-            return ((value / 1e-1) * 0.01)
+        MassConcentrationUnits.KilogramPerLiter: ('1000', '0'),
         
-        if to_unit == MassConcentrationUnits.DecigramPerDeciliter:
-            return ((value / 1e-1) * 0.1)
+        MassConcentrationUnits.KilopoundPerCubicInch: ('1000000000000000000000/36127298147753', '0'),
         
-        if to_unit == MassConcentrationUnits.PicogramPerLiter:
-            return ((value) * 1e-12)
+        MassConcentrationUnits.KilopoundPerCubicFoot: ('1000000000000/62427961', '0'),
         
-        if to_unit == MassConcentrationUnits.NanogramPerLiter:
-            return ((value) * 1e-09)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        MassConcentrationUnits.GramPerCubicMillimeter: ('g/mm³',),
+        
+        MassConcentrationUnits.GramPerCubicCentimeter: ('g/cm³',),
+        
+        MassConcentrationUnits.GramPerCubicMeter: ('g/m³',),
+        
+        MassConcentrationUnits.GramPerMicroliter: ('g/μL',),
+        
+        MassConcentrationUnits.GramPerMilliliter: ('g/mL',),
+        
+        MassConcentrationUnits.GramPerDeciliter: ('g/dL',),
+        
+        MassConcentrationUnits.GramPerLiter: ('g/L',),
+        
+        MassConcentrationUnits.TonnePerCubicMillimeter: ('t/mm³',),
+        
+        MassConcentrationUnits.TonnePerCubicCentimeter: ('t/cm³',),
+        
+        MassConcentrationUnits.TonnePerCubicMeter: ('t/m³',),
+        
+        MassConcentrationUnits.PoundPerCubicInch: ('lb/in³',),
+        
+        MassConcentrationUnits.PoundPerCubicFoot: ('lb/ft³',),
+        
+        MassConcentrationUnits.SlugPerCubicFoot: ('slug/ft³',),
+        
+        MassConcentrationUnits.PoundPerUSGallon: ('ppg (U.S.)',),
+        
+        MassConcentrationUnits.OuncePerUSGallon: ('oz/gal (U.S.)',),
+        
+        MassConcentrationUnits.OuncePerImperialGallon: ('oz/gal (imp.)',),
+        
+        MassConcentrationUnits.PoundPerImperialGallon: ('ppg (imp.)',),
+        
+        MassConcentrationUnits.KilogramPerCubicMillimeter: ('kg/mm³',),
+        
+        MassConcentrationUnits.KilogramPerCubicCentimeter: ('kg/cm³',),
+        
+        MassConcentrationUnits.KilogramPerCubicMeter: ('kg/m³',),
+        
+        MassConcentrationUnits.MilligramPerCubicMeter: ('mg/m³',),
+        
+        MassConcentrationUnits.MicrogramPerCubicMeter: ('μg/m³',),
+        
+        MassConcentrationUnits.PicogramPerMicroliter: ('pg/μL',),
+        
+        MassConcentrationUnits.NanogramPerMicroliter: ('ng/μL',),
+        
+        MassConcentrationUnits.MicrogramPerMicroliter: ('μg/μL',),
+        
+        MassConcentrationUnits.MilligramPerMicroliter: ('mg/μL',),
+        
+        MassConcentrationUnits.CentigramPerMicroliter: ('cg/μL',),
+        
+        MassConcentrationUnits.DecigramPerMicroliter: ('dg/μL',),
+        
+        MassConcentrationUnits.PicogramPerMilliliter: ('pg/mL',),
+        
+        MassConcentrationUnits.NanogramPerMilliliter: ('ng/mL',),
+        
+        MassConcentrationUnits.MicrogramPerMilliliter: ('μg/mL',),
         
-        if to_unit == MassConcentrationUnits.MicrogramPerLiter:
-            return ((value) * 1e-06)
+        MassConcentrationUnits.MilligramPerMilliliter: ('mg/mL',),
         
-        if to_unit == MassConcentrationUnits.MilligramPerLiter:
-            return ((value) * 0.001)
+        MassConcentrationUnits.CentigramPerMilliliter: ('cg/mL',),
         
-        if to_unit == MassConcentrationUnits.CentigramPerLiter:
-            return ((value) * 0.01)
+        MassConcentrationUnits.DecigramPerMilliliter: ('dg/mL',),
         
-        if to_unit == MassConcentrationUnits.DecigramPerLiter:
-            return ((value) * 0.1)
+        MassConcentrationUnits.PicogramPerDeciliter: ('pg/dL',),
         
-        if to_unit == MassConcentrationUnits.KilogramPerLiter:
-            return ((value) * 1000.0)
+        MassConcentrationUnits.NanogramPerDeciliter: ('ng/dL',),
         
-        if to_unit == MassConcentrationUnits.KilopoundPerCubicInch:
-            return ((value / 3.6127298147753e-5) * 1000.0)
+        MassConcentrationUnits.MicrogramPerDeciliter: ('μg/dL',),
         
-        if to_unit == MassConcentrationUnits.KilopoundPerCubicFoot:
-            return ((value / 0.062427961) * 1000.0)
+        MassConcentrationUnits.MilligramPerDeciliter: ('mg/dL',),
         
-        return None
+        MassConcentrationUnits.CentigramPerDeciliter: ('cg/dL',),
+        
+        MassConcentrationUnits.DecigramPerDeciliter: ('dg/dL',),
+        
+        MassConcentrationUnits.PicogramPerLiter: ('pg/L',),
+        
+        MassConcentrationUnits.NanogramPerLiter: ('ng/L',),
+        
+        MassConcentrationUnits.MicrogramPerLiter: ('μg/L',),
+        
+        MassConcentrationUnits.MilligramPerLiter: ('mg/L',),
+        
+        MassConcentrationUnits.CentigramPerLiter: ('cg/L',),
+        
+        MassConcentrationUnits.DecigramPerLiter: ('dg/L',),
+        
+        MassConcentrationUnits.KilogramPerLiter: ('kg/L',),
+        
+        MassConcentrationUnits.KilopoundPerCubicInch: ('klb/in³',),
+        
+        MassConcentrationUnits.KilopoundPerCubicFoot: ('klb/ft³',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: MassConcentrationUnits = MassConcentrationUnits.KilogramPerCubicMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: MassConcentrationUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: MassConcentrationUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: MassConcentrationUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: MassConcentrationUnits, to_unit: MassConcentrationUnits) -> float:
+        """
+        Convert a value from one MassConcentration unit to another, without creating a MassConcentration instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: MassConcentrationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MassConcentrationUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return MassConcentration._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: MassConcentrationUnits, to_unit: MassConcentrationUnits) -> List[float]:
+        """
+        Convert many values from one MassConcentration unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: MassConcentrationUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: MassConcentrationUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return MassConcentration._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: MassConcentrationUnits, to_unit: MassConcentrationUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", MassConcentration._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: MassConcentrationUnits, to_unit: MassConcentrationUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one MassConcentration unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MassConcentrationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MassConcentrationUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return MassConcentration._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: MassConcentrationUnits = MassConcentrationUnits.KilogramPerCubicMeter) -> MassConcentration:
+        """
+        Create a new instance of MassConcentration holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
 
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MassConcentrationUnits
+        :return: A new instance of MassConcentration.
+        :rtype: MassConcentration
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return MassConcentration._from_exact(value, from_unit)
+
+    def to_exact(self, unit: MassConcentrationUnits = MassConcentrationUnits.KilogramPerCubicMeter) -> Fraction:
+        """
+        Get the exact value of the MassConcentration in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (KilogramPerCubicMeter).
+        :type unit: MassConcentrationUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> MassConcentration:
+        """
+        Parse a MassConcentration from a value followed by a unit abbreviation, e.g. "1 g/mm³".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of MassConcentration.
+        :rtype: MassConcentration
+        :raises ValueError: When the string is not a valid or an ambiguous MassConcentration.
+        """
+        return MassConcentration._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[MassConcentration]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return MassConcentration._try_parse(text)
+
+    def to_binary(self, unit: Optional[MassConcentrationUnits] = None) -> bytes:
+        """
+        Encode the MassConcentration to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: MassConcentrationUnits
+        :return: The encoded MassConcentration.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> MassConcentration:
+        """
+        Decode a MassConcentration encoded by to_binary.
+
+        :param data: The encoded MassConcentration, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of MassConcentration.
+        :rtype: MassConcentration
+        :raises ValueError: When the data is not a valid encoded MassConcentration.
+        """
+        return MassConcentration._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[MassConcentrationUnits] = None) -> dict:
+        """
+        Get the MassConcentration DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (KilogramPerCubicMeter).
+        :type hold_in_unit: MassConcentrationUnits
+        :return: The MassConcentration DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[MassConcentrationUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> MassConcentration:
+        """
+        Create a new instance of MassConcentration from its DTO.
+
+        :param dto: The MassConcentration DTO, the unit is the MassConcentrationUnits value or name.
+        :type dto: dict
+        :return: A new instance of MassConcentration.
+        :rtype: MassConcentration
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return MassConcentration._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> MassConcentration:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return MassConcentration._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -1421,10 +1835,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_cubic_millimeter != None:
-            return self.__grams_per_cubic_millimeter
-        self.__grams_per_cubic_millimeter = self.__convert_from_base(MassConcentrationUnits.GramPerCubicMillimeter)
-        return self.__grams_per_cubic_millimeter
+        return self._cached_convert(MassConcentrationUnits.GramPerCubicMillimeter)
 
     
     @property
@@ -1432,10 +1843,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_cubic_centimeter != None:
-            return self.__grams_per_cubic_centimeter
-        self.__grams_per_cubic_centimeter = self.__convert_from_base(MassConcentrationUnits.GramPerCubicCentimeter)
-        return self.__grams_per_cubic_centimeter
+        return self._cached_convert(MassConcentrationUnits.GramPerCubicCentimeter)
 
     
     @property
@@ -1443,10 +1851,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_cubic_meter != None:
-            return self.__grams_per_cubic_meter
-        self.__grams_per_cubic_meter = self.__convert_from_base(MassConcentrationUnits.GramPerCubicMeter)
-        return self.__grams_per_cubic_meter
+        return self._cached_convert(MassConcentrationUnits.GramPerCubicMeter)
 
     
     @property
@@ -1454,10 +1859,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_microliter != None:
-            return self.__grams_per_microliter
-        self.__grams_per_microliter = self.__convert_from_base(MassConcentrationUnits.GramPerMicroliter)
-        return self.__grams_per_microliter
+        return self._cached_convert(MassConcentrationUnits.GramPerMicroliter)
 
     
     @property
@@ -1465,10 +1867,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_milliliter != None:
-            return self.__grams_per_milliliter
-        self.__grams_per_milliliter = self.__convert_from_base(MassConcentrationUnits.GramPerMilliliter)
-        return self.__grams_per_milliliter
+        return self._cached_convert(MassConcentrationUnits.GramPerMilliliter)
 
     
     @property
@@ -1476,10 +1875,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_deciliter != None:
-            return self.__grams_per_deciliter
-        self.__grams_per_deciliter = self.__convert_from_base(MassConcentrationUnits.GramPerDeciliter)
-        return self.__grams_per_deciliter
+        return self._cached_convert(MassConcentrationUnits.GramPerDeciliter)
 
     
     @property
@@ -1487,10 +1883,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_liter != None:
-            return self.__grams_per_liter
-        self.__grams_per_liter = self.__convert_from_base(MassConcentrationUnits.GramPerLiter)
-        return self.__grams_per_liter
+        return self._cached_convert(MassConcentrationUnits.GramPerLiter)
 
     
     @property
@@ -1498,10 +1891,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_per_cubic_millimeter != None:
-            return self.__tonnes_per_cubic_millimeter
-        self.__tonnes_per_cubic_millimeter = self.__convert_from_base(MassConcentrationUnits.TonnePerCubicMillimeter)
-        return self.__tonnes_per_cubic_millimeter
+        return self._cached_convert(MassConcentrationUnits.TonnePerCubicMillimeter)
 
     
     @property
@@ -1509,10 +1899,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_per_cubic_centimeter != None:
-            return self.__tonnes_per_cubic_centimeter
-        self.__tonnes_per_cubic_centimeter = self.__convert_from_base(MassConcentrationUnits.TonnePerCubicCentimeter)
-        return self.__tonnes_per_cubic_centimeter
+        return self._cached_convert(MassConcentrationUnits.TonnePerCubicCentimeter)
 
     
     @property
@@ -1520,10 +1907,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_per_cubic_meter != None:
-            return self.__tonnes_per_cubic_meter
-        self.__tonnes_per_cubic_meter = self.__convert_from_base(MassConcentrationUnits.TonnePerCubicMeter)
-        return self.__tonnes_per_cubic_meter
+        return self._cached_convert(MassConcentrationUnits.TonnePerCubicMeter)
 
     
     @property
@@ -1531,10 +1915,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_cubic_inch != None:
-            return self.__pounds_per_cubic_inch
-        self.__pounds_per_cubic_inch = self.__convert_from_base(MassConcentrationUnits.PoundPerCubicInch)
-        return self.__pounds_per_cubic_inch
+        return self._cached_convert(MassConcentrationUnits.PoundPerCubicInch)
 
     
     @property
@@ -1542,10 +1923,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_cubic_foot != None:
-            return self.__pounds_per_cubic_foot
-        self.__pounds_per_cubic_foot = self.__convert_from_base(MassConcentrationUnits.PoundPerCubicFoot)
-        return self.__pounds_per_cubic_foot
+        return self._cached_convert(MassConcentrationUnits.PoundPerCubicFoot)
 
     
     @property
@@ -1553,10 +1931,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__slugs_per_cubic_foot != None:
-            return self.__slugs_per_cubic_foot
-        self.__slugs_per_cubic_foot = self.__convert_from_base(MassConcentrationUnits.SlugPerCubicFoot)
-        return self.__slugs_per_cubic_foot
+        return self._cached_convert(MassConcentrationUnits.SlugPerCubicFoot)
 
     
     @property
@@ -1564,10 +1939,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_us_gallon != None:
-            return self.__pounds_per_us_gallon
-        self.__pounds_per_us_gallon = self.__convert_from_base(MassConcentrationUnits.PoundPerUSGallon)
-        return self.__pounds_per_us_gallon
+        return self._cached_convert(MassConcentrationUnits.PoundPerUSGallon)
 
     
     @property
@@ -1575,10 +1947,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__ounces_per_us_gallon != None:
-            return self.__ounces_per_us_gallon
-        self.__ounces_per_us_gallon = self.__convert_from_base(MassConcentrationUnits.OuncePerUSGallon)
-        return self.__ounces_per_us_gallon
+        return self._cached_convert(MassConcentrationUnits.OuncePerUSGallon)
 
     
     @property
@@ -1586,10 +1955,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__ounces_per_imperial_gallon != None:
-            return self.__ounces_per_imperial_gallon
-        self.__ounces_per_imperial_gallon = self.__convert_from_base(MassConcentrationUnits.OuncePerImperialGallon)
-        return self.__ounces_per_imperial_gallon
+        return self._cached_convert(MassConcentrationUnits.OuncePerImperialGallon)
 
     
     @property
@@ -1597,10 +1963,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_imperial_gallon != None:
-            return self.__pounds_per_imperial_gallon
-        self.__pounds_per_imperial_gallon = self.__convert_from_base(MassConcentrationUnits.PoundPerImperialGallon)
-        return self.__pounds_per_imperial_gallon
+        return self._cached_convert(MassConcentrationUnits.PoundPerImperialGallon)
 
     
     @property
@@ -1608,10 +1971,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_cubic_millimeter != None:
-            return self.__kilograms_per_cubic_millimeter
-        self.__kilograms_per_cubic_millimeter = self.__convert_from_base(MassConcentrationUnits.KilogramPerCubicMillimeter)
-        return self.__kilograms_per_cubic_millimeter
+        return self._cached_convert(MassConcentrationUnits.KilogramPerCubicMillimeter)
 
     
     @property
@@ -1619,10 +1979,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_cubic_centimeter != None:
-            return self.__kilograms_per_cubic_centimeter
-        self.__kilograms_per_cubic_centimeter = self.__convert_from_base(MassConcentrationUnits.KilogramPerCubicCentimeter)
-        return self.__kilograms_per_cubic_centimeter
+        return self._cached_convert(MassConcentrationUnits.KilogramPerCubicCentimeter)
 
     
     @property
@@ -1630,10 +1987,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_cubic_meter != None:
-            return self.__kilograms_per_cubic_meter
-        self.__kilograms_per_cubic_meter = self.__convert_from_base(MassConcentrationUnits.KilogramPerCubicMeter)
-        return self.__kilograms_per_cubic_meter
+        return self._cached_convert(MassConcentrationUnits.KilogramPerCubicMeter)
 
     
     @property
@@ -1641,10 +1995,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_cubic_meter != None:
-            return self.__milligrams_per_cubic_meter
-        self.__milligrams_per_cubic_meter = self.__convert_from_base(MassConcentrationUnits.MilligramPerCubicMeter)
-        return self.__milligrams_per_cubic_meter
+        return self._cached_convert(MassConcentrationUnits.MilligramPerCubicMeter)
 
     
     @property
@@ -1652,10 +2003,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_cubic_meter != None:
-            return self.__micrograms_per_cubic_meter
-        self.__micrograms_per_cubic_meter = self.__convert_from_base(MassConcentrationUnits.MicrogramPerCubicMeter)
-        return self.__micrograms_per_cubic_meter
+        return self._cached_convert(MassConcentrationUnits.MicrogramPerCubicMeter)
 
     
     @property
@@ -1663,10 +2011,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__picograms_per_microliter != None:
-            return self.__picograms_per_microliter
-        self.__picograms_per_microliter = self.__convert_from_base(MassConcentrationUnits.PicogramPerMicroliter)
-        return self.__picograms_per_microliter
+        return self._cached_convert(MassConcentrationUnits.PicogramPerMicroliter)
 
     
     @property
@@ -1674,10 +2019,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__nanograms_per_microliter != None:
-            return self.__nanograms_per_microliter
-        self.__nanograms_per_microliter = self.__convert_from_base(MassConcentrationUnits.NanogramPerMicroliter)
-        return self.__nanograms_per_microliter
+        return self._cached_convert(MassConcentrationUnits.NanogramPerMicroliter)
 
     
     @property
@@ -1685,10 +2027,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_microliter != None:
-            return self.__micrograms_per_microliter
-        self.__micrograms_per_microliter = self.__convert_from_base(MassConcentrationUnits.MicrogramPerMicroliter)
-        return self.__micrograms_per_microliter
+        return self._cached_convert(MassConcentrationUnits.MicrogramPerMicroliter)
 
     
     @property
@@ -1696,10 +2035,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_microliter != None:
-            return self.__milligrams_per_microliter
-        self.__milligrams_per_microliter = self.__convert_from_base(MassConcentrationUnits.MilligramPerMicroliter)
-        return self.__milligrams_per_microliter
+        return self._cached_convert(MassConcentrationUnits.MilligramPerMicroliter)
 
     
     @property
@@ -1707,10 +2043,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__centigrams_per_microliter != None:
-            return self.__centigrams_per_microliter
-        self.__centigrams_per_microliter = self.__convert_from_base(MassConcentrationUnits.CentigramPerMicroliter)
-        return self.__centigrams_per_microliter
+        return self._cached_convert(MassConcentrationUnits.CentigramPerMicroliter)
 
     
     @property
@@ -1718,10 +2051,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__decigrams_per_microliter != None:
-            return self.__decigrams_per_microliter
-        self.__decigrams_per_microliter = self.__convert_from_base(MassConcentrationUnits.DecigramPerMicroliter)
-        return self.__decigrams_per_microliter
+        return self._cached_convert(MassConcentrationUnits.DecigramPerMicroliter)
 
     
     @property
@@ -1729,10 +2059,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__picograms_per_milliliter != None:
-            return self.__picograms_per_milliliter
-        self.__picograms_per_milliliter = self.__convert_from_base(MassConcentrationUnits.PicogramPerMilliliter)
-        return self.__picograms_per_milliliter
+        return self._cached_convert(MassConcentrationUnits.PicogramPerMilliliter)
 
     
     @property
@@ -1740,10 +2067,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__nanograms_per_milliliter != None:
-            return self.__nanograms_per_milliliter
-        self.__nanograms_per_milliliter = self.__convert_from_base(MassConcentrationUnits.NanogramPerMilliliter)
-        return self.__nanograms_per_milliliter
+        return self._cached_convert(MassConcentrationUnits.NanogramPerMilliliter)
 
     
     @property
@@ -1751,10 +2075,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_milliliter != None:
-            return self.__micrograms_per_milliliter
-        self.__micrograms_per_milliliter = self.__convert_from_base(MassConcentrationUnits.MicrogramPerMilliliter)
-        return self.__micrograms_per_milliliter
+        return self._cached_convert(MassConcentrationUnits.MicrogramPerMilliliter)
 
     
     @property
@@ -1762,10 +2083,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_milliliter != None:
-            return self.__milligrams_per_milliliter
-        self.__milligrams_per_milliliter = self.__convert_from_base(MassConcentrationUnits.MilligramPerMilliliter)
-        return self.__milligrams_per_milliliter
+        return self._cached_convert(MassConcentrationUnits.MilligramPerMilliliter)
 
     
     @property
@@ -1773,10 +2091,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__centigrams_per_milliliter != None:
-            return self.__centigrams_per_milliliter
-        self.__centigrams_per_milliliter = self.__convert_from_base(MassConcentrationUnits.CentigramPerMilliliter)
-        return self.__centigrams_per_milliliter
+        return self._cached_convert(MassConcentrationUnits.CentigramPerMilliliter)
 
     
     @property
@@ -1784,10 +2099,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__decigrams_per_milliliter != None:
-            return self.__decigrams_per_milliliter
-        self.__decigrams_per_milliliter = self.__convert_from_base(MassConcentrationUnits.DecigramPerMilliliter)
-        return self.__decigrams_per_milliliter
+        return self._cached_convert(MassConcentrationUnits.DecigramPerMilliliter)
 
     
     @property
@@ -1795,10 +2107,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__picograms_per_deciliter != None:
-            return self.__picograms_per_deciliter
-        self.__picograms_per_deciliter = self.__convert_from_base(MassConcentrationUnits.PicogramPerDeciliter)
-        return self.__picograms_per_deciliter
+        return self._cached_convert(MassConcentrationUnits.PicogramPerDeciliter)
 
     
     @property
@@ -1806,10 +2115,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__nanograms_per_deciliter != None:
-            return self.__nanograms_per_deciliter
-        self.__nanograms_per_deciliter = self.__convert_from_base(MassConcentrationUnits.NanogramPerDeciliter)
-        return self.__nanograms_per_deciliter
+        return self._cached_convert(MassConcentrationUnits.NanogramPerDeciliter)
 
     
     @property
@@ -1817,10 +2123,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_deciliter != None:
-            return self.__micrograms_per_deciliter
-        self.__micrograms_per_deciliter = self.__convert_from_base(MassConcentrationUnits.MicrogramPerDeciliter)
-        return self.__micrograms_per_deciliter
+        return self._cached_convert(MassConcentrationUnits.MicrogramPerDeciliter)
 
     
     @property
@@ -1828,10 +2131,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_deciliter != None:
-            return self.__milligrams_per_deciliter
-        self.__milligrams_per_deciliter = self.__convert_from_base(MassConcentrationUnits.MilligramPerDeciliter)
-        return self.__milligrams_per_deciliter
+        return self._cached_convert(MassConcentrationUnits.MilligramPerDeciliter)
 
     
     @property
@@ -1839,10 +2139,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__centigrams_per_deciliter != None:
-            return self.__centigrams_per_deciliter
-        self.__centigrams_per_deciliter = self.__convert_from_base(MassConcentrationUnits.CentigramPerDeciliter)
-        return self.__centigrams_per_deciliter
+        return self._cached_convert(MassConcentrationUnits.CentigramPerDeciliter)
 
     
     @property
@@ -1850,10 +2147,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__decigrams_per_deciliter != None:
-            return self.__decigrams_per_deciliter
-        self.__decigrams_per_deciliter = self.__convert_from_base(MassConcentrationUnits.DecigramPerDeciliter)
-        return self.__decigrams_per_deciliter
+        return self._cached_convert(MassConcentrationUnits.DecigramPerDeciliter)
 
     
     @property
@@ -1861,10 +2155,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__picograms_per_liter != None:
-            return self.__picograms_per_liter
-        self.__picograms_per_liter = self.__convert_from_base(MassConcentrationUnits.PicogramPerLiter)
-        return self.__picograms_per_liter
+        return self._cached_convert(MassConcentrationUnits.PicogramPerLiter)
 
     
     @property
@@ -1872,10 +2163,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__nanograms_per_liter != None:
-            return self.__nanograms_per_liter
-        self.__nanograms_per_liter = self.__convert_from_base(MassConcentrationUnits.NanogramPerLiter)
-        return self.__nanograms_per_liter
+        return self._cached_convert(MassConcentrationUnits.NanogramPerLiter)
 
     
     @property
@@ -1883,10 +2171,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_liter != None:
-            return self.__micrograms_per_liter
-        self.__micrograms_per_liter = self.__convert_from_base(MassConcentrationUnits.MicrogramPerLiter)
-        return self.__micrograms_per_liter
+        return self._cached_convert(MassConcentrationUnits.MicrogramPerLiter)
 
     
     @property
@@ -1894,10 +2179,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_liter != None:
-            return self.__milligrams_per_liter
-        self.__milligrams_per_liter = self.__convert_from_base(MassConcentrationUnits.MilligramPerLiter)
-        return self.__milligrams_per_liter
+        return self._cached_convert(MassConcentrationUnits.MilligramPerLiter)
 
     
     @property
@@ -1905,10 +2187,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__centigrams_per_liter != None:
-            return self.__centigrams_per_liter
-        self.__centigrams_per_liter = self.__convert_from_base(MassConcentrationUnits.CentigramPerLiter)
-        return self.__centigrams_per_liter
+        return self._cached_convert(MassConcentrationUnits.CentigramPerLiter)
 
     
     @property
@@ -1916,10 +2195,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__decigrams_per_liter != None:
-            return self.__decigrams_per_liter
-        self.__decigrams_per_liter = self.__convert_from_base(MassConcentrationUnits.DecigramPerLiter)
-        return self.__decigrams_per_liter
+        return self._cached_convert(MassConcentrationUnits.DecigramPerLiter)
 
     
     @property
@@ -1927,10 +2203,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_liter != None:
-            return self.__kilograms_per_liter
-        self.__kilograms_per_liter = self.__convert_from_base(MassConcentrationUnits.KilogramPerLiter)
-        return self.__kilograms_per_liter
+        return self._cached_convert(MassConcentrationUnits.KilogramPerLiter)
 
     
     @property
@@ -1938,10 +2211,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_per_cubic_inch != None:
-            return self.__kilopounds_per_cubic_inch
-        self.__kilopounds_per_cubic_inch = self.__convert_from_base(MassConcentrationUnits.KilopoundPerCubicInch)
-        return self.__kilopounds_per_cubic_inch
+        return self._cached_convert(MassConcentrationUnits.KilopoundPerCubicInch)
 
     
     @property
@@ -1949,10 +2219,7 @@ class MassConcentration(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_per_cubic_foot != None:
-            return self.__kilopounds_per_cubic_foot
-        self.__kilopounds_per_cubic_foot = self.__convert_from_base(MassConcentrationUnits.KilopoundPerCubicFoot)
-        return self.__kilopounds_per_cubic_foot
+        return self._cached_convert(MassConcentrationUnits.KilopoundPerCubicFoot)
 
     
     def to_string(self, unit: MassConcentrationUnits = MassConcentrationUnits.KilogramPerCubicMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class MassFlowUnits(Enum):
         """
             MassFlowUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         GramPerSecond = 'gram_per_second'
         """
@@ -184,289 +195,628 @@ class MassFlow(AbstractMeasure):
         value (float): The value.
         from_unit (MassFlowUnits): The MassFlow unit to create from, The default unit is GramPerSecond
     """
-    def __init__(self, value: float, from_unit: MassFlowUnits = MassFlowUnits.GramPerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = MassFlowUnits
+
+    _base_unit = MassFlowUnits.GramPerSecond
+
+    _dimensions = (0, 1, -1, 0, 0, 0, 0)
+
+    _si_scale = '1/1000'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 66
+
+    _binary_unit_ids = {
         
-        self.__grams_per_second = None
+        MassFlowUnits.GramPerSecond: 0,
         
-        self.__grams_per_day = None
+        MassFlowUnits.GramPerDay: 1,
         
-        self.__grams_per_hour = None
+        MassFlowUnits.GramPerHour: 2,
         
-        self.__kilograms_per_hour = None
+        MassFlowUnits.KilogramPerHour: 3,
         
-        self.__kilograms_per_minute = None
+        MassFlowUnits.KilogramPerMinute: 4,
         
-        self.__tonnes_per_hour = None
+        MassFlowUnits.TonnePerHour: 5,
         
-        self.__pounds_per_day = None
+        MassFlowUnits.PoundPerDay: 6,
         
-        self.__pounds_per_hour = None
+        MassFlowUnits.PoundPerHour: 7,
         
-        self.__pounds_per_minute = None
+        MassFlowUnits.PoundPerMinute: 8,
         
-        self.__pounds_per_second = None
+        MassFlowUnits.PoundPerSecond: 9,
         
-        self.__tonnes_per_day = None
+        MassFlowUnits.TonnePerDay: 10,
         
-        self.__short_tons_per_hour = None
+        MassFlowUnits.ShortTonPerHour: 11,
         
-        self.__nanograms_per_second = None
+        MassFlowUnits.NanogramPerSecond: 12,
         
-        self.__micrograms_per_second = None
+        MassFlowUnits.MicrogramPerSecond: 13,
         
-        self.__milligrams_per_second = None
+        MassFlowUnits.MilligramPerSecond: 14,
         
-        self.__centigrams_per_second = None
+        MassFlowUnits.CentigramPerSecond: 15,
         
-        self.__decigrams_per_second = None
+        MassFlowUnits.DecigramPerSecond: 16,
         
-        self.__decagrams_per_second = None
+        MassFlowUnits.DecagramPerSecond: 17,
         
-        self.__hectograms_per_second = None
+        MassFlowUnits.HectogramPerSecond: 18,
         
-        self.__kilograms_per_second = None
+        MassFlowUnits.KilogramPerSecond: 19,
         
-        self.__nanograms_per_day = None
+        MassFlowUnits.NanogramPerDay: 20,
         
-        self.__micrograms_per_day = None
+        MassFlowUnits.MicrogramPerDay: 21,
         
-        self.__milligrams_per_day = None
+        MassFlowUnits.MilligramPerDay: 22,
         
-        self.__centigrams_per_day = None
+        MassFlowUnits.CentigramPerDay: 23,
         
-        self.__decigrams_per_day = None
+        MassFlowUnits.DecigramPerDay: 24,
         
-        self.__decagrams_per_day = None
+        MassFlowUnits.DecagramPerDay: 25,
         
-        self.__hectograms_per_day = None
+        MassFlowUnits.HectogramPerDay: 26,
         
-        self.__kilograms_per_day = None
+        MassFlowUnits.KilogramPerDay: 27,
         
-        self.__megagrams_per_day = None
+        MassFlowUnits.MegagramPerDay: 28,
         
-        self.__megapounds_per_day = None
+        MassFlowUnits.MegapoundPerDay: 29,
         
-        self.__megapounds_per_hour = None
+        MassFlowUnits.MegapoundPerHour: 30,
         
-        self.__megapounds_per_minute = None
+        MassFlowUnits.MegapoundPerMinute: 31,
         
-        self.__megapounds_per_second = None
+        MassFlowUnits.MegapoundPerSecond: 32,
         
+    }
 
-    def convert(self, unit: MassFlowUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        MassFlowUnits.GramPerSecond: lambda value: (value),
+        
+        MassFlowUnits.GramPerDay: lambda value: (value * 86400),
+        
+        MassFlowUnits.GramPerHour: lambda value: (value * 3600),
+        
+        MassFlowUnits.KilogramPerHour: lambda value: (value * 3.6),
+        
+        MassFlowUnits.KilogramPerMinute: lambda value: (value * 0.06),
+        
+        MassFlowUnits.TonnePerHour: lambda value: (value * 3.6 / 1000),
+        
+        MassFlowUnits.PoundPerDay: lambda value: (value * 190.47936),
+        
+        MassFlowUnits.PoundPerHour: lambda value: (value * 7.93664),
+        
+        MassFlowUnits.PoundPerMinute: lambda value: (value * 0.132277),
+        
+        MassFlowUnits.PoundPerSecond: lambda value: (value / 453.59237),
+        
+        MassFlowUnits.TonnePerDay: lambda value: (value * 0.0864000),
+        
+        MassFlowUnits.ShortTonPerHour: lambda value: (value / 251.9957611),
+        
+        MassFlowUnits.NanogramPerSecond: lambda value: ((value) / 1e-09),
+        
+        MassFlowUnits.MicrogramPerSecond: lambda value: ((value) / 1e-06),
+        
+        MassFlowUnits.MilligramPerSecond: lambda value: ((value) / 0.001),
+        
+        MassFlowUnits.CentigramPerSecond: lambda value: ((value) / 0.01),
+        
+        MassFlowUnits.DecigramPerSecond: lambda value: ((value) / 0.1),
+        
+        MassFlowUnits.DecagramPerSecond: lambda value: ((value) / 10.0),
+        
+        MassFlowUnits.HectogramPerSecond: lambda value: ((value) / 100.0),
+        
+        MassFlowUnits.KilogramPerSecond: lambda value: ((value) / 1000.0),
+        
+        MassFlowUnits.NanogramPerDay: lambda value: ((value * 86400) / 1e-09),
+        
+        MassFlowUnits.MicrogramPerDay: lambda value: ((value * 86400) / 1e-06),
+        
+        MassFlowUnits.MilligramPerDay: lambda value: ((value * 86400) / 0.001),
+        
+        MassFlowUnits.CentigramPerDay: lambda value: ((value * 86400) / 0.01),
+        
+        MassFlowUnits.DecigramPerDay: lambda value: ((value * 86400) / 0.1),
+        
+        MassFlowUnits.DecagramPerDay: lambda value: ((value * 86400) / 10.0),
+        
+        MassFlowUnits.HectogramPerDay: lambda value: ((value * 86400) / 100.0),
+        
+        MassFlowUnits.KilogramPerDay: lambda value: ((value * 86400) / 1000.0),
+        
+        MassFlowUnits.MegagramPerDay: lambda value: ((value * 86400) / 1000000.0),
+        
+        MassFlowUnits.MegapoundPerDay: lambda value: ((value * 190.47936) / 1000000.0),
+        
+        MassFlowUnits.MegapoundPerHour: lambda value: ((value * 7.93664) / 1000000.0),
+        
+        MassFlowUnits.MegapoundPerMinute: lambda value: ((value * 0.132277) / 1000000.0),
+        
+        MassFlowUnits.MegapoundPerSecond: lambda value: ((value / 453.59237) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: MassFlowUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == MassFlowUnits.GramPerSecond:
-            return (value)
+        MassFlowUnits.GramPerSecond: lambda value: (value),
         
-        if from_unit == MassFlowUnits.GramPerDay:
-            return (value * 86400)
+        MassFlowUnits.GramPerDay: lambda value: (value / 86400),
         
-        if from_unit == MassFlowUnits.GramPerHour:
-            return (value * 3600)
+        MassFlowUnits.GramPerHour: lambda value: (value / 3600),
         
-        if from_unit == MassFlowUnits.KilogramPerHour:
-            return (value * 3.6)
+        MassFlowUnits.KilogramPerHour: lambda value: (value / 3.6),
         
-        if from_unit == MassFlowUnits.KilogramPerMinute:
-            return (value * 0.06)
+        MassFlowUnits.KilogramPerMinute: lambda value: (value / 0.06),
         
-        if from_unit == MassFlowUnits.TonnePerHour:
-            return (value * 3.6 / 1000)
+        MassFlowUnits.TonnePerHour: lambda value: (1000 * value / 3.6),
         
-        if from_unit == MassFlowUnits.PoundPerDay:
-            return (value * 190.47936)
+        MassFlowUnits.PoundPerDay: lambda value: (value / 190.47936),
         
-        if from_unit == MassFlowUnits.PoundPerHour:
-            return (value * 7.93664)
+        MassFlowUnits.PoundPerHour: lambda value: (value / 7.93664),
         
-        if from_unit == MassFlowUnits.PoundPerMinute:
-            return (value * 0.132277)
+        MassFlowUnits.PoundPerMinute: lambda value: (value / 0.132277),
         
-        if from_unit == MassFlowUnits.PoundPerSecond:
-            return (value / 453.59237)
+        MassFlowUnits.PoundPerSecond: lambda value: (value * 453.59237),
         
-        if from_unit == MassFlowUnits.TonnePerDay:
-            return (value * 0.0864000)
+        MassFlowUnits.TonnePerDay: lambda value: (value / 0.0864000),
         
-        if from_unit == MassFlowUnits.ShortTonPerHour:
-            return (value / 251.9957611)
+        MassFlowUnits.ShortTonPerHour: lambda value: (value * 251.9957611),
         
-        if from_unit == MassFlowUnits.NanogramPerSecond:
-            return ((value) / 1e-09)
+        MassFlowUnits.NanogramPerSecond: lambda value: ((value) * 1e-09),
         
-        if from_unit == MassFlowUnits.MicrogramPerSecond:
-            return ((value) / 1e-06)
+        MassFlowUnits.MicrogramPerSecond: lambda value: ((value) * 1e-06),
         
-        if from_unit == MassFlowUnits.MilligramPerSecond:
-            return ((value) / 0.001)
+        MassFlowUnits.MilligramPerSecond: lambda value: ((value) * 0.001),
         
-        if from_unit == MassFlowUnits.CentigramPerSecond:
-            return ((value) / 0.01)
+        MassFlowUnits.CentigramPerSecond: lambda value: ((value) * 0.01),
         
-        if from_unit == MassFlowUnits.DecigramPerSecond:
-            return ((value) / 0.1)
+        MassFlowUnits.DecigramPerSecond: lambda value: ((value) * 0.1),
         
-        if from_unit == MassFlowUnits.DecagramPerSecond:
-            return ((value) / 10.0)
+        MassFlowUnits.DecagramPerSecond: lambda value: ((value) * 10.0),
         
-        if from_unit == MassFlowUnits.HectogramPerSecond:
-            return ((value) / 100.0)
+        MassFlowUnits.HectogramPerSecond: lambda value: ((value) * 100.0),
         
-        if from_unit == MassFlowUnits.KilogramPerSecond:
-            return ((value) / 1000.0)
+        MassFlowUnits.KilogramPerSecond: lambda value: ((value) * 1000.0),
         
-        if from_unit == MassFlowUnits.NanogramPerDay:
-            return ((value * 86400) / 1e-09)
+        MassFlowUnits.NanogramPerDay: lambda value: ((value / 86400) * 1e-09),
         
-        if from_unit == MassFlowUnits.MicrogramPerDay:
-            return ((value * 86400) / 1e-06)
+        MassFlowUnits.MicrogramPerDay: lambda value: ((value / 86400) * 1e-06),
         
-        if from_unit == MassFlowUnits.MilligramPerDay:
-            return ((value * 86400) / 0.001)
+        MassFlowUnits.MilligramPerDay: lambda value: ((value / 86400) * 0.001),
         
-        if from_unit == MassFlowUnits.CentigramPerDay:
-            return ((value * 86400) / 0.01)
+        MassFlowUnits.CentigramPerDay: lambda value: ((value / 86400) * 0.01),
         
-        if from_unit == MassFlowUnits.DecigramPerDay:
-            return ((value * 86400) / 0.1)
+        MassFlowUnits.DecigramPerDay: lambda value: ((value / 86400) * 0.1),
         
-        if from_unit == MassFlowUnits.DecagramPerDay:
-            return ((value * 86400) / 10.0)
+        MassFlowUnits.DecagramPerDay: lambda value: ((value / 86400) * 10.0),
         
-        if from_unit == MassFlowUnits.HectogramPerDay:
-            return ((value * 86400) / 100.0)
+        MassFlowUnits.HectogramPerDay: lambda value: ((value / 86400) * 100.0),
         
-        if from_unit == MassFlowUnits.KilogramPerDay:
-            return ((value * 86400) / 1000.0)
+        MassFlowUnits.KilogramPerDay: lambda value: ((value / 86400) * 1000.0),
         
-        if from_unit == MassFlowUnits.MegagramPerDay:
-            return ((value * 86400) / 1000000.0)
+        MassFlowUnits.MegagramPerDay: lambda value: ((value / 86400) * 1000000.0),
         
-        if from_unit == MassFlowUnits.MegapoundPerDay:
-            return ((value * 190.47936) / 1000000.0)
+        MassFlowUnits.MegapoundPerDay: lambda value: ((value / 190.47936) * 1000000.0),
         
-        if from_unit == MassFlowUnits.MegapoundPerHour:
-            return ((value * 7.93664) / 1000000.0)
+        MassFlowUnits.MegapoundPerHour: lambda value: ((value / 7.93664) * 1000000.0),
         
-        if from_unit == MassFlowUnits.MegapoundPerMinute:
-            return ((value * 0.132277) / 1000000.0)
+        MassFlowUnits.MegapoundPerMinute: lambda value: ((value / 0.132277) * 1000000.0),
         
-        if from_unit == MassFlowUnits.MegapoundPerSecond:
-            return ((value / 453.59237) / 1000000.0)
+        MassFlowUnits.MegapoundPerSecond: lambda value: ((value * 453.59237) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        MassFlowUnits.GramPerSecond: ('1', '0'),
+        
+        MassFlowUnits.GramPerDay: ('86400', '0'),
+        
+        MassFlowUnits.GramPerHour: ('3600', '0'),
+        
+        MassFlowUnits.KilogramPerHour: ('18/5', '0'),
+        
+        MassFlowUnits.KilogramPerMinute: ('3/50', '0'),
+        
+        MassFlowUnits.TonnePerHour: ('9/2500', '0'),
+        
+        MassFlowUnits.PoundPerDay: ('595248/3125', '0'),
+        
+        MassFlowUnits.PoundPerHour: ('24802/3125', '0'),
+        
+        MassFlowUnits.PoundPerMinute: ('132277/1000000', '0'),
+        
+        MassFlowUnits.PoundPerSecond: ('100000/45359237', '0'),
+        
+        MassFlowUnits.TonnePerDay: ('54/625', '0'),
+        
+        MassFlowUnits.ShortTonPerHour: ('10000000/2519957611', '0'),
+        
+        MassFlowUnits.NanogramPerSecond: ('1000000000', '0'),
+        
+        MassFlowUnits.MicrogramPerSecond: ('1000000', '0'),
+        
+        MassFlowUnits.MilligramPerSecond: ('1000', '0'),
+        
+        MassFlowUnits.CentigramPerSecond: ('100', '0'),
+        
+        MassFlowUnits.DecigramPerSecond: ('10', '0'),
+        
+        MassFlowUnits.DecagramPerSecond: ('1/10', '0'),
+        
+        MassFlowUnits.HectogramPerSecond: ('1/100', '0'),
+        
+        MassFlowUnits.KilogramPerSecond: ('1/1000', '0'),
+        
+        MassFlowUnits.NanogramPerDay: ('86400000000000', '0'),
+        
+        MassFlowUnits.MicrogramPerDay: ('86400000000', '0'),
+        
+        MassFlowUnits.MilligramPerDay: ('86400000', '0'),
+        
+        MassFlowUnits.CentigramPerDay: ('8640000', '0'),
+        
+        MassFlowUnits.DecigramPerDay: ('864000', '0'),
+        
+        MassFlowUnits.DecagramPerDay: ('8640', '0'),
+        
+        MassFlowUnits.HectogramPerDay: ('864', '0'),
+        
+        MassFlowUnits.KilogramPerDay: ('432/5', '0'),
+        
+        MassFlowUnits.MegagramPerDay: ('54/625', '0'),
+        
+        MassFlowUnits.MegapoundPerDay: ('37203/195312500', '0'),
+        
+        MassFlowUnits.MegapoundPerHour: ('12401/1562500000', '0'),
+        
+        MassFlowUnits.MegapoundPerMinute: ('132277/1000000000000', '0'),
+        
+        MassFlowUnits.MegapoundPerSecond: ('1/453592370', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: MassFlowUnits) -> float:
+    _affine_to_base = {
+        
+        MassFlowUnits.GramPerSecond: ('1', '0'),
+        
+        MassFlowUnits.GramPerDay: ('1/86400', '0'),
+        
+        MassFlowUnits.GramPerHour: ('1/3600', '0'),
+        
+        MassFlowUnits.KilogramPerHour: ('5/18', '0'),
+        
+        MassFlowUnits.KilogramPerMinute: ('50/3', '0'),
+        
+        MassFlowUnits.TonnePerHour: ('2500/9', '0'),
+        
+        MassFlowUnits.PoundPerDay: ('3125/595248', '0'),
+        
+        MassFlowUnits.PoundPerHour: ('3125/24802', '0'),
+        
+        MassFlowUnits.PoundPerMinute: ('1000000/132277', '0'),
+        
+        MassFlowUnits.PoundPerSecond: ('45359237/100000', '0'),
+        
+        MassFlowUnits.TonnePerDay: ('625/54', '0'),
+        
+        MassFlowUnits.ShortTonPerHour: ('2519957611/10000000', '0'),
+        
+        MassFlowUnits.NanogramPerSecond: ('1/1000000000', '0'),
+        
+        MassFlowUnits.MicrogramPerSecond: ('1/1000000', '0'),
+        
+        MassFlowUnits.MilligramPerSecond: ('1/1000', '0'),
+        
+        MassFlowUnits.CentigramPerSecond: ('1/100', '0'),
         
-        if to_unit == MassFlowUnits.GramPerSecond:
-            return (value)
+        MassFlowUnits.DecigramPerSecond: ('1/10', '0'),
         
-        if to_unit == MassFlowUnits.GramPerDay:
-            return (value / 86400)
+        MassFlowUnits.DecagramPerSecond: ('10', '0'),
         
-        if to_unit == MassFlowUnits.GramPerHour:
-            return (value / 3600)
+        MassFlowUnits.HectogramPerSecond: ('100', '0'),
         
-        if to_unit == MassFlowUnits.KilogramPerHour:
-            return (value / 3.6)
+        MassFlowUnits.KilogramPerSecond: ('1000', '0'),
         
-        if to_unit == MassFlowUnits.KilogramPerMinute:
-            return (value / 0.06)
+        MassFlowUnits.NanogramPerDay: ('1/86400000000000', '0'),
         
-        if to_unit == MassFlowUnits.TonnePerHour:
-            return (1000 * value / 3.6)
+        MassFlowUnits.MicrogramPerDay: ('1/86400000000', '0'),
         
-        if to_unit == MassFlowUnits.PoundPerDay:
-            return (value / 190.47936)
+        MassFlowUnits.MilligramPerDay: ('1/86400000', '0'),
         
-        if to_unit == MassFlowUnits.PoundPerHour:
-            return (value / 7.93664)
+        MassFlowUnits.CentigramPerDay: ('1/8640000', '0'),
         
-        if to_unit == MassFlowUnits.PoundPerMinute:
-            return (value / 0.132277)
+        MassFlowUnits.DecigramPerDay: ('1/864000', '0'),
         
-        if to_unit == MassFlowUnits.PoundPerSecond:
-            return (value * 453.59237)
+        MassFlowUnits.DecagramPerDay: ('1/8640', '0'),
         
-        if to_unit == MassFlowUnits.TonnePerDay:
-            return (value / 0.0864000)
+        MassFlowUnits.HectogramPerDay: ('1/864', '0'),
         
-        if to_unit == MassFlowUnits.ShortTonPerHour:
-            return (value * 251.9957611)
+        MassFlowUnits.KilogramPerDay: ('5/432', '0'),
         
-        if to_unit == MassFlowUnits.NanogramPerSecond:
-            return ((value) * 1e-09)
+        MassFlowUnits.MegagramPerDay: ('625/54', '0'),
         
-        if to_unit == MassFlowUnits.MicrogramPerSecond:
-            return ((value) * 1e-06)
+        MassFlowUnits.MegapoundPerDay: ('195312500/37203', '0'),
         
-        if to_unit == MassFlowUnits.MilligramPerSecond:
-            return ((value) * 0.001)
+        MassFlowUnits.MegapoundPerHour: ('1562500000/12401', '0'),
         
-        if to_unit == MassFlowUnits.CentigramPerSecond:
-            return ((value) * 0.01)
+        MassFlowUnits.MegapoundPerMinute: ('1000000000000/132277', '0'),
         
-        if to_unit == MassFlowUnits.DecigramPerSecond:
-            return ((value) * 0.1)
+        MassFlowUnits.MegapoundPerSecond: ('453592370', '0'),
         
-        if to_unit == MassFlowUnits.DecagramPerSecond:
-            return ((value) * 10.0)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        MassFlowUnits.GramPerSecond: ('g/s',),
+        
+        MassFlowUnits.GramPerDay: ('g/d',),
+        
+        MassFlowUnits.GramPerHour: ('g/h',),
+        
+        MassFlowUnits.KilogramPerHour: ('kg/h',),
+        
+        MassFlowUnits.KilogramPerMinute: ('kg/min',),
+        
+        MassFlowUnits.TonnePerHour: ('t/h',),
+        
+        MassFlowUnits.PoundPerDay: ('lb/d',),
+        
+        MassFlowUnits.PoundPerHour: ('lb/h',),
+        
+        MassFlowUnits.PoundPerMinute: ('lb/min',),
+        
+        MassFlowUnits.PoundPerSecond: ('lb/s',),
+        
+        MassFlowUnits.TonnePerDay: ('t/d',),
+        
+        MassFlowUnits.ShortTonPerHour: ('short tn/h',),
         
-        if to_unit == MassFlowUnits.HectogramPerSecond:
-            return ((value) * 100.0)
+        MassFlowUnits.NanogramPerSecond: ('ng/s',),
         
-        if to_unit == MassFlowUnits.KilogramPerSecond:
-            return ((value) * 1000.0)
+        MassFlowUnits.MicrogramPerSecond: ('μg/s',),
         
-        if to_unit == MassFlowUnits.NanogramPerDay:
-            return ((value / 86400) * 1e-09)
+        MassFlowUnits.MilligramPerSecond: ('mg/s',),
         
-        if to_unit == MassFlowUnits.MicrogramPerDay:
-            return ((value / 86400) * 1e-06)
+        MassFlowUnits.CentigramPerSecond: ('cg/s',),
         
-        if to_unit == MassFlowUnits.MilligramPerDay:
-            return ((value / 86400) * 0.001)
+        MassFlowUnits.DecigramPerSecond: ('dg/s',),
         
-        if to_unit == MassFlowUnits.CentigramPerDay:
-            return ((value / 86400) * 0.01)
+        MassFlowUnits.DecagramPerSecond: ('dag/s',),
         
-        if to_unit == MassFlowUnits.DecigramPerDay:
-            return ((value / 86400) * 0.1)
+        MassFlowUnits.HectogramPerSecond: ('hg/s',),
         
-        if to_unit == MassFlowUnits.DecagramPerDay:
-            return ((value / 86400) * 10.0)
+        MassFlowUnits.KilogramPerSecond: ('kg/s',),
         
-        if to_unit == MassFlowUnits.HectogramPerDay:
-            return ((value / 86400) * 100.0)
+        MassFlowUnits.NanogramPerDay: ('ng/d',),
         
-        if to_unit == MassFlowUnits.KilogramPerDay:
-            return ((value / 86400) * 1000.0)
+        MassFlowUnits.MicrogramPerDay: ('μg/d',),
         
-        if to_unit == MassFlowUnits.MegagramPerDay:
-            return ((value / 86400) * 1000000.0)
+        MassFlowUnits.MilligramPerDay: ('mg/d',),
         
-        if to_unit == MassFlowUnits.MegapoundPerDay:
-            return ((value / 190.47936) * 1000000.0)
+        MassFlowUnits.CentigramPerDay: ('cg/d',),
         
-        if to_unit == MassFlowUnits.MegapoundPerHour:
-            return ((value / 7.93664) * 1000000.0)
+        MassFlowUnits.DecigramPerDay: ('dg/d',),
         
-        if to_unit == MassFlowUnits.MegapoundPerMinute:
-            return ((value / 0.132277) * 1000000.0)
+        MassFlowUnits.DecagramPerDay: ('dag/d',),
         
-        if to_unit == MassFlowUnits.MegapoundPerSecond:
-            return ((value * 453.59237) * 1000000.0)
+        MassFlowUnits.HectogramPerDay: ('hg/d',),
         
-        return None
+        MassFlowUnits.KilogramPerDay: ('kg/d',),
+        
+        MassFlowUnits.MegagramPerDay: ('Mg/d',),
+        
+        MassFlowUnits.MegapoundPerDay: ('Mlb/d',),
+        
+        MassFlowUnits.MegapoundPerHour: ('Mlb/h',),
+        
+        MassFlowUnits.MegapoundPerMinute: ('Mlb/min',),
+        
+        MassFlowUnits.MegapoundPerSecond: ('Mlb/s',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: MassFlowUnits = MassFlowUnits.GramPerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: MassFlowUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: MassFlowUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: MassFlowUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: MassFlowUnits, to_unit: MassFlowUnits) -> float:
+        """
+        Convert a value from one MassFlow unit to another, without creating a MassFlow instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: MassFlowUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MassFlowUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return MassFlow._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: MassFlowUnits, to_unit: MassFlowUnits) -> List[float]:
+        """
+        Convert many values from one MassFlow unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: MassFlowUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: MassFlowUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return MassFlow._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: MassFlowUnits, to_unit: MassFlowUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", MassFlow._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: MassFlowUnits, to_unit: MassFlowUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one MassFlow unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MassFlowUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MassFlowUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return MassFlow._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: MassFlowUnits = MassFlowUnits.GramPerSecond) -> MassFlow:
+        """
+        Create a new instance of MassFlow holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MassFlowUnits
+        :return: A new instance of MassFlow.
+        :rtype: MassFlow
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return MassFlow._from_exact(value, from_unit)
+
+    def to_exact(self, unit: MassFlowUnits = MassFlowUnits.GramPerSecond) -> Fraction:
+        """
+        Get the exact value of the MassFlow in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (GramPerSecond).
+        :type unit: MassFlowUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> MassFlow:
+        """
+        Parse a MassFlow from a value followed by a unit abbreviation, e.g. "1 g/s".
 
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of MassFlow.
+        :rtype: MassFlow
+        :raises ValueError: When the string is not a valid or an ambiguous MassFlow.
+        """
+        return MassFlow._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[MassFlow]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return MassFlow._try_parse(text)
+
+    def to_binary(self, unit: Optional[MassFlowUnits] = None) -> bytes:
+        """
+        Encode the MassFlow to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: MassFlowUnits
+        :return: The encoded MassFlow.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> MassFlow:
+        """
+        Decode a MassFlow encoded by to_binary.
+
+        :param data: The encoded MassFlow, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of MassFlow.
+        :rtype: MassFlow
+        :raises ValueError: When the data is not a valid encoded MassFlow.
+        """
+        return MassFlow._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[MassFlowUnits] = None) -> dict:
+        """
+        Get the MassFlow DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (GramPerSecond).
+        :type hold_in_unit: MassFlowUnits
+        :return: The MassFlow DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[MassFlowUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> MassFlow:
+        """
+        Create a new instance of MassFlow from its DTO.
+
+        :param dto: The MassFlow DTO, the unit is the MassFlowUnits value or name.
+        :type dto: dict
+        :return: A new instance of MassFlow.
+        :rtype: MassFlow
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return MassFlow._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> MassFlow:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return MassFlow._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -973,10 +1323,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_second != None:
-            return self.__grams_per_second
-        self.__grams_per_second = self.__convert_from_base(MassFlowUnits.GramPerSecond)
-        return self.__grams_per_second
+        return self._cached_convert(MassFlowUnits.GramPerSecond)
 
     
     @property
@@ -984,10 +1331,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_day != None:
-            return self.__grams_per_day
-        self.__grams_per_day = self.__convert_from_base(MassFlowUnits.GramPerDay)
-        return self.__grams_per_day
+        return self._cached_convert(MassFlowUnits.GramPerDay)
 
     
     @property
@@ -995,10 +1339,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_hour != None:
-            return self.__grams_per_hour
-        self.__grams_per_hour = self.__convert_from_base(MassFlowUnits.GramPerHour)
-        return self.__grams_per_hour
+        return self._cached_convert(MassFlowUnits.GramPerHour)
 
     
     @property
@@ -1006,10 +1347,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_hour != None:
-            return self.__kilograms_per_hour
-        self.__kilograms_per_hour = self.__convert_from_base(MassFlowUnits.KilogramPerHour)
-        return self.__kilograms_per_hour
+        return self._cached_convert(MassFlowUnits.KilogramPerHour)
 
     
     @property
@@ -1017,10 +1355,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_minute != None:
-            return self.__kilograms_per_minute
-        self.__kilograms_per_minute = self.__convert_from_base(MassFlowUnits.KilogramPerMinute)
-        return self.__kilograms_per_minute
+        return self._cached_convert(MassFlowUnits.KilogramPerMinute)
 
     
     @property
@@ -1028,10 +1363,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_per_hour != None:
-            return self.__tonnes_per_hour
-        self.__tonnes_per_hour = self.__convert_from_base(MassFlowUnits.TonnePerHour)
-        return self.__tonnes_per_hour
+        return self._cached_convert(MassFlowUnits.TonnePerHour)
 
     
     @property
@@ -1039,10 +1371,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_day != None:
-            return self.__pounds_per_day
-        self.__pounds_per_day = self.__convert_from_base(MassFlowUnits.PoundPerDay)
-        return self.__pounds_per_day
+        return self._cached_convert(MassFlowUnits.PoundPerDay)
 
     
     @property
@@ -1050,10 +1379,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_hour != None:
-            return self.__pounds_per_hour
-        self.__pounds_per_hour = self.__convert_from_base(MassFlowUnits.PoundPerHour)
-        return self.__pounds_per_hour
+        return self._cached_convert(MassFlowUnits.PoundPerHour)
 
     
     @property
@@ -1061,10 +1387,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_minute != None:
-            return self.__pounds_per_minute
-        self.__pounds_per_minute = self.__convert_from_base(MassFlowUnits.PoundPerMinute)
-        return self.__pounds_per_minute
+        return self._cached_convert(MassFlowUnits.PoundPerMinute)
 
     
     @property
@@ -1072,10 +1395,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_second != None:
-            return self.__pounds_per_second
-        self.__pounds_per_second = self.__convert_from_base(MassFlowUnits.PoundPerSecond)
-        return self.__pounds_per_second
+        return self._cached_convert(MassFlowUnits.PoundPerSecond)
 
     
     @property
@@ -1083,10 +1403,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_per_day != None:
-            return self.__tonnes_per_day
-        self.__tonnes_per_day = self.__convert_from_base(MassFlowUnits.TonnePerDay)
-        return self.__tonnes_per_day
+        return self._cached_convert(MassFlowUnits.TonnePerDay)
 
     
     @property
@@ -1094,10 +1411,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__short_tons_per_hour != None:
-            return self.__short_tons_per_hour
-        self.__short_tons_per_hour = self.__convert_from_base(MassFlowUnits.ShortTonPerHour)
-        return self.__short_tons_per_hour
+        return self._cached_convert(MassFlowUnits.ShortTonPerHour)
 
     
     @property
@@ -1105,10 +1419,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__nanograms_per_second != None:
-            return self.__nanograms_per_second
-        self.__nanograms_per_second = self.__convert_from_base(MassFlowUnits.NanogramPerSecond)
-        return self.__nanograms_per_second
+        return self._cached_convert(MassFlowUnits.NanogramPerSecond)
 
     
     @property
@@ -1116,10 +1427,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_second != None:
-            return self.__micrograms_per_second
-        self.__micrograms_per_second = self.__convert_from_base(MassFlowUnits.MicrogramPerSecond)
-        return self.__micrograms_per_second
+        return self._cached_convert(MassFlowUnits.MicrogramPerSecond)
 
     
     @property
@@ -1127,10 +1435,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_second != None:
-            return self.__milligrams_per_second
-        self.__milligrams_per_second = self.__convert_from_base(MassFlowUnits.MilligramPerSecond)
-        return self.__milligrams_per_second
+        return self._cached_convert(MassFlowUnits.MilligramPerSecond)
 
     
     @property
@@ -1138,10 +1443,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__centigrams_per_second != None:
-            return self.__centigrams_per_second
-        self.__centigrams_per_second = self.__convert_from_base(MassFlowUnits.CentigramPerSecond)
-        return self.__centigrams_per_second
+        return self._cached_convert(MassFlowUnits.CentigramPerSecond)
 
     
     @property
@@ -1149,10 +1451,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__decigrams_per_second != None:
-            return self.__decigrams_per_second
-        self.__decigrams_per_second = self.__convert_from_base(MassFlowUnits.DecigramPerSecond)
-        return self.__decigrams_per_second
+        return self._cached_convert(MassFlowUnits.DecigramPerSecond)
 
     
     @property
@@ -1160,10 +1459,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__decagrams_per_second != None:
-            return self.__decagrams_per_second
-        self.__decagrams_per_second = self.__convert_from_base(MassFlowUnits.DecagramPerSecond)
-        return self.__decagrams_per_second
+        return self._cached_convert(MassFlowUnits.DecagramPerSecond)
 
     
     @property
@@ -1171,10 +1467,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__hectograms_per_second != None:
-            return self.__hectograms_per_second
-        self.__hectograms_per_second = self.__convert_from_base(MassFlowUnits.HectogramPerSecond)
-        return self.__hectograms_per_second
+        return self._cached_convert(MassFlowUnits.HectogramPerSecond)
 
     
     @property
@@ -1182,10 +1475,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_second != None:
-            return self.__kilograms_per_second
-        self.__kilograms_per_second = self.__convert_from_base(MassFlowUnits.KilogramPerSecond)
-        return self.__kilograms_per_second
+        return self._cached_convert(MassFlowUnits.KilogramPerSecond)
 
     
     @property
@@ -1193,10 +1483,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__nanograms_per_day != None:
-            return self.__nanograms_per_day
-        self.__nanograms_per_day = self.__convert_from_base(MassFlowUnits.NanogramPerDay)
-        return self.__nanograms_per_day
+        return self._cached_convert(MassFlowUnits.NanogramPerDay)
 
     
     @property
@@ -1204,10 +1491,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_day != None:
-            return self.__micrograms_per_day
-        self.__micrograms_per_day = self.__convert_from_base(MassFlowUnits.MicrogramPerDay)
-        return self.__micrograms_per_day
+        return self._cached_convert(MassFlowUnits.MicrogramPerDay)
 
     
     @property
@@ -1215,10 +1499,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_day != None:
-            return self.__milligrams_per_day
-        self.__milligrams_per_day = self.__convert_from_base(MassFlowUnits.MilligramPerDay)
-        return self.__milligrams_per_day
+        return self._cached_convert(MassFlowUnits.MilligramPerDay)
 
     
     @property
@@ -1226,10 +1507,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__centigrams_per_day != None:
-            return self.__centigrams_per_day
-        self.__centigrams_per_day = self.__convert_from_base(MassFlowUnits.CentigramPerDay)
-        return self.__centigrams_per_day
+        return self._cached_convert(MassFlowUnits.CentigramPerDay)
 
     
     @property
@@ -1237,10 +1515,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__decigrams_per_day != None:
-            return self.__decigrams_per_day
-        self.__decigrams_per_day = self.__convert_from_base(MassFlowUnits.DecigramPerDay)
-        return self.__decigrams_per_day
+        return self._cached_convert(MassFlowUnits.DecigramPerDay)
 
     
     @property
@@ -1248,10 +1523,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__decagrams_per_day != None:
-            return self.__decagrams_per_day
-        self.__decagrams_per_day = self.__convert_from_base(MassFlowUnits.DecagramPerDay)
-        return self.__decagrams_per_day
+        return self._cached_convert(MassFlowUnits.DecagramPerDay)
 
     
     @property
@@ -1259,10 +1531,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__hectograms_per_day != None:
-            return self.__hectograms_per_day
-        self.__hectograms_per_day = self.__convert_from_base(MassFlowUnits.HectogramPerDay)
-        return self.__hectograms_per_day
+        return self._cached_convert(MassFlowUnits.HectogramPerDay)
 
     
     @property
@@ -1270,10 +1539,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_day != None:
-            return self.__kilograms_per_day
-        self.__kilograms_per_day = self.__convert_from_base(MassFlowUnits.KilogramPerDay)
-        return self.__kilograms_per_day
+        return self._cached_convert(MassFlowUnits.KilogramPerDay)
 
     
     @property
@@ -1281,10 +1547,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__megagrams_per_day != None:
-            return self.__megagrams_per_day
-        self.__megagrams_per_day = self.__convert_from_base(MassFlowUnits.MegagramPerDay)
-        return self.__megagrams_per_day
+        return self._cached_convert(MassFlowUnits.MegagramPerDay)
 
     
     @property
@@ -1292,10 +1555,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__megapounds_per_day != None:
-            return self.__megapounds_per_day
-        self.__megapounds_per_day = self.__convert_from_base(MassFlowUnits.MegapoundPerDay)
-        return self.__megapounds_per_day
+        return self._cached_convert(MassFlowUnits.MegapoundPerDay)
 
     
     @property
@@ -1303,10 +1563,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__megapounds_per_hour != None:
-            return self.__megapounds_per_hour
-        self.__megapounds_per_hour = self.__convert_from_base(MassFlowUnits.MegapoundPerHour)
-        return self.__megapounds_per_hour
+        return self._cached_convert(MassFlowUnits.MegapoundPerHour)
 
     
     @property
@@ -1314,10 +1571,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__megapounds_per_minute != None:
-            return self.__megapounds_per_minute
-        self.__megapounds_per_minute = self.__convert_from_base(MassFlowUnits.MegapoundPerMinute)
-        return self.__megapounds_per_minute
+        return self._cached_convert(MassFlowUnits.MegapoundPerMinute)
 
     
     @property
@@ -1325,10 +1579,7 @@ class MassFlow(AbstractMeasure):
         """
         
         """
-        if self.__megapounds_per_second != None:
-            return self.__megapounds_per_second
-        self.__megapounds_per_second = self.__convert_from_base(MassFlowUnits.MegapoundPerSecond)
-        return self.__megapounds_per_second
+        return self._cached_convert(MassFlowUnits.MegapoundPerSecond)
 
     
     def to_string(self, unit: MassFlowUnits = MassFlowUnits.GramPerSecond) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class MassFluxUnits(Enum):
         """
             MassFluxUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         GramPerSecondPerSquareMeter = 'gram_per_second_per_square_meter'
         """
@@ -79,122 +90,377 @@ class MassFlux(AbstractMeasure):
         value (float): The value.
         from_unit (MassFluxUnits): The MassFlux unit to create from, The default unit is KilogramPerSecondPerSquareMeter
     """
-    def __init__(self, value: float, from_unit: MassFluxUnits = MassFluxUnits.KilogramPerSecondPerSquareMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = MassFluxUnits
+
+    _base_unit = MassFluxUnits.KilogramPerSecondPerSquareMeter
+
+    _dimensions = (-2, 1, -1, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 67
+
+    _binary_unit_ids = {
         
-        self.__grams_per_second_per_square_meter = None
+        MassFluxUnits.GramPerSecondPerSquareMeter: 0,
         
-        self.__grams_per_second_per_square_centimeter = None
+        MassFluxUnits.GramPerSecondPerSquareCentimeter: 1,
         
-        self.__grams_per_second_per_square_millimeter = None
+        MassFluxUnits.GramPerSecondPerSquareMillimeter: 2,
         
-        self.__grams_per_hour_per_square_meter = None
+        MassFluxUnits.GramPerHourPerSquareMeter: 3,
         
-        self.__grams_per_hour_per_square_centimeter = None
+        MassFluxUnits.GramPerHourPerSquareCentimeter: 4,
         
-        self.__grams_per_hour_per_square_millimeter = None
+        MassFluxUnits.GramPerHourPerSquareMillimeter: 5,
         
-        self.__kilograms_per_second_per_square_meter = None
+        MassFluxUnits.KilogramPerSecondPerSquareMeter: 6,
         
-        self.__kilograms_per_second_per_square_centimeter = None
+        MassFluxUnits.KilogramPerSecondPerSquareCentimeter: 7,
         
-        self.__kilograms_per_second_per_square_millimeter = None
+        MassFluxUnits.KilogramPerSecondPerSquareMillimeter: 8,
         
-        self.__kilograms_per_hour_per_square_meter = None
+        MassFluxUnits.KilogramPerHourPerSquareMeter: 9,
         
-        self.__kilograms_per_hour_per_square_centimeter = None
+        MassFluxUnits.KilogramPerHourPerSquareCentimeter: 10,
         
-        self.__kilograms_per_hour_per_square_millimeter = None
+        MassFluxUnits.KilogramPerHourPerSquareMillimeter: 11,
         
+    }
 
-    def convert(self, unit: MassFluxUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        MassFluxUnits.GramPerSecondPerSquareMeter: lambda value: (value * 1e3),
+        
+        MassFluxUnits.GramPerSecondPerSquareCentimeter: lambda value: (value * 1e-1),
+        
+        MassFluxUnits.GramPerSecondPerSquareMillimeter: lambda value: (value * 1e-3),
+        
+        MassFluxUnits.GramPerHourPerSquareMeter: lambda value: (value * 3.6e6),
+        
+        MassFluxUnits.GramPerHourPerSquareCentimeter: lambda value: (value * 3.6e2),
+        
+        MassFluxUnits.GramPerHourPerSquareMillimeter: lambda value: (value * 3.6e0),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareMeter: lambda value: ((value * 1e3) / 1000.0),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareCentimeter: lambda value: ((value * 1e-1) / 1000.0),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareMillimeter: lambda value: ((value * 1e-3) / 1000.0),
+        
+        MassFluxUnits.KilogramPerHourPerSquareMeter: lambda value: ((value * 3.6e6) / 1000.0),
+        
+        MassFluxUnits.KilogramPerHourPerSquareCentimeter: lambda value: ((value * 3.6e2) / 1000.0),
+        
+        MassFluxUnits.KilogramPerHourPerSquareMillimeter: lambda value: ((value * 3.6e0) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: MassFluxUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == MassFluxUnits.GramPerSecondPerSquareMeter:
-            return (value * 1e3)
+        MassFluxUnits.GramPerSecondPerSquareMeter: lambda value: (value / 1e3),
         
-        if from_unit == MassFluxUnits.GramPerSecondPerSquareCentimeter:
-            return (value * 1e-1)
+        MassFluxUnits.GramPerSecondPerSquareCentimeter: lambda value: (value / 1e-1),
         
-        if from_unit == MassFluxUnits.GramPerSecondPerSquareMillimeter:
-            return (value * 1e-3)
+        MassFluxUnits.GramPerSecondPerSquareMillimeter: lambda value: (value / 1e-3),
         
-        if from_unit == MassFluxUnits.GramPerHourPerSquareMeter:
-            return (value * 3.6e6)
+        MassFluxUnits.GramPerHourPerSquareMeter: lambda value: (value / 3.6e6),
         
-        if from_unit == MassFluxUnits.GramPerHourPerSquareCentimeter:
-            return (value * 3.6e2)
+        MassFluxUnits.GramPerHourPerSquareCentimeter: lambda value: (value / 3.6e2),
         
-        if from_unit == MassFluxUnits.GramPerHourPerSquareMillimeter:
-            return (value * 3.6e0)
+        MassFluxUnits.GramPerHourPerSquareMillimeter: lambda value: (value / 3.6e0),
         
-        if from_unit == MassFluxUnits.KilogramPerSecondPerSquareMeter:
-            return ((value * 1e3) / 1000.0)
+        MassFluxUnits.KilogramPerSecondPerSquareMeter: lambda value: ((value / 1e3) * 1000.0),
         
-        if from_unit == MassFluxUnits.KilogramPerSecondPerSquareCentimeter:
-            return ((value * 1e-1) / 1000.0)
+        MassFluxUnits.KilogramPerSecondPerSquareCentimeter: lambda value: ((value / 1e-1) * 1000.0),
         
-        if from_unit == MassFluxUnits.KilogramPerSecondPerSquareMillimeter:
-            return ((value * 1e-3) / 1000.0)
+        MassFluxUnits.KilogramPerSecondPerSquareMillimeter: lambda value: ((value / 1e-3) * 1000.0),
         
-        if from_unit == MassFluxUnits.KilogramPerHourPerSquareMeter:
-            return ((value * 3.6e6) / 1000.0)
+        MassFluxUnits.KilogramPerHourPerSquareMeter: lambda value: ((value / 3.6e6) * 1000.0),
         
-        if from_unit == MassFluxUnits.KilogramPerHourPerSquareCentimeter:
-            return ((value * 3.6e2) / 1000.0)
+        MassFluxUnits.KilogramPerHourPerSquareCentimeter: lambda value: ((value / 3.6e2) * 1000.0),
         
-        if from_unit == MassFluxUnits.KilogramPerHourPerSquareMillimeter:
-            return ((value * 3.6e0) / 1000.0)
+        MassFluxUnits.KilogramPerHourPerSquareMillimeter: lambda value: ((value / 3.6e0) * 1000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        MassFluxUnits.GramPerSecondPerSquareMeter: ('1000', '0'),
+        
+        MassFluxUnits.GramPerSecondPerSquareCentimeter: ('1/10', '0'),
+        
+        MassFluxUnits.GramPerSecondPerSquareMillimeter: ('1/1000', '0'),
+        
+        MassFluxUnits.GramPerHourPerSquareMeter: ('3600000', '0'),
+        
+        MassFluxUnits.GramPerHourPerSquareCentimeter: ('360', '0'),
+        
+        MassFluxUnits.GramPerHourPerSquareMillimeter: ('18/5', '0'),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareMeter: ('1', '0'),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareCentimeter: ('1/10000', '0'),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareMillimeter: ('1/1000000', '0'),
+        
+        MassFluxUnits.KilogramPerHourPerSquareMeter: ('3600', '0'),
+        
+        MassFluxUnits.KilogramPerHourPerSquareCentimeter: ('9/25', '0'),
+        
+        MassFluxUnits.KilogramPerHourPerSquareMillimeter: ('9/2500', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: MassFluxUnits) -> float:
+    _affine_to_base = {
+        
+        MassFluxUnits.GramPerSecondPerSquareMeter: ('1/1000', '0'),
         
-        if to_unit == MassFluxUnits.GramPerSecondPerSquareMeter:
-            return (value / 1e3)
+        MassFluxUnits.GramPerSecondPerSquareCentimeter: ('10', '0'),
         
-        if to_unit == MassFluxUnits.GramPerSecondPerSquareCentimeter:
-            return (value / 1e-1)
+        MassFluxUnits.GramPerSecondPerSquareMillimeter: ('1000', '0'),
         
-        if to_unit == MassFluxUnits.GramPerSecondPerSquareMillimeter:
-            return (value / 1e-3)
+        MassFluxUnits.GramPerHourPerSquareMeter: ('1/3600000', '0'),
         
-        if to_unit == MassFluxUnits.GramPerHourPerSquareMeter:
-            return (value / 3.6e6)
+        MassFluxUnits.GramPerHourPerSquareCentimeter: ('1/360', '0'),
+        
+        MassFluxUnits.GramPerHourPerSquareMillimeter: ('5/18', '0'),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareMeter: ('1', '0'),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareCentimeter: ('10000', '0'),
+        
+        MassFluxUnits.KilogramPerSecondPerSquareMillimeter: ('1000000', '0'),
+        
+        MassFluxUnits.KilogramPerHourPerSquareMeter: ('1/3600', '0'),
+        
+        MassFluxUnits.KilogramPerHourPerSquareCentimeter: ('25/9', '0'),
+        
+        MassFluxUnits.KilogramPerHourPerSquareMillimeter: ('2500/9', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == MassFluxUnits.GramPerHourPerSquareCentimeter:
-            return (value / 3.6e2)
+        MassFluxUnits.GramPerSecondPerSquareMeter: ('g·s⁻¹·m⁻²',),
         
-        if to_unit == MassFluxUnits.GramPerHourPerSquareMillimeter:
-            return (value / 3.6e0)
+        MassFluxUnits.GramPerSecondPerSquareCentimeter: ('g·s⁻¹·cm⁻²',),
         
-        if to_unit == MassFluxUnits.KilogramPerSecondPerSquareMeter:
-            return ((value / 1e3) * 1000.0)
+        MassFluxUnits.GramPerSecondPerSquareMillimeter: ('g·s⁻¹·mm⁻²',),
         
-        if to_unit == MassFluxUnits.KilogramPerSecondPerSquareCentimeter:
-            return ((value / 1e-1) * 1000.0)
+        MassFluxUnits.GramPerHourPerSquareMeter: ('g·h⁻¹·m⁻²',),
         
-        if to_unit == MassFluxUnits.KilogramPerSecondPerSquareMillimeter:
-            return ((value / 1e-3) * 1000.0)
+        MassFluxUnits.GramPerHourPerSquareCentimeter: ('g·h⁻¹·cm⁻²',),
         
-        if to_unit == MassFluxUnits.KilogramPerHourPerSquareMeter:
-            return ((value / 3.6e6) * 1000.0)
+        MassFluxUnits.GramPerHourPerSquareMillimeter: ('g·h⁻¹·mm⁻²',),
         
-        if to_unit == MassFluxUnits.KilogramPerHourPerSquareCentimeter:
-            return ((value / 3.6e2) * 1000.0)
+        MassFluxUnits.KilogramPerSecondPerSquareMeter: ('kg·s⁻¹·m⁻²',),
         
-        if to_unit == MassFluxUnits.KilogramPerHourPerSquareMillimeter:
-            return ((value / 3.6e0) * 1000.0)
+        MassFluxUnits.KilogramPerSecondPerSquareCentimeter: ('kg·s⁻¹·cm⁻²',),
         
-        return None
+        MassFluxUnits.KilogramPerSecondPerSquareMillimeter: ('kg·s⁻¹·mm⁻²',),
+        
+        MassFluxUnits.KilogramPerHourPerSquareMeter: ('kg·h⁻¹·m⁻²',),
+        
+        MassFluxUnits.KilogramPerHourPerSquareCentimeter: ('kg·h⁻¹·cm⁻²',),
+        
+        MassFluxUnits.KilogramPerHourPerSquareMillimeter: ('kg·h⁻¹·mm⁻²',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: MassFluxUnits = MassFluxUnits.KilogramPerSecondPerSquareMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: MassFluxUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: MassFluxUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: MassFluxUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
 
 
+    @staticmethod
+    def convert_value(value: float, from_unit: MassFluxUnits, to_unit: MassFluxUnits) -> float:
+        """
+        Convert a value from one MassFlux unit to another, without creating a MassFlux instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: MassFluxUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MassFluxUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return MassFlux._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: MassFluxUnits, to_unit: MassFluxUnits) -> List[float]:
+        """
+        Convert many values from one MassFlux unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: MassFluxUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: MassFluxUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return MassFlux._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: MassFluxUnits, to_unit: MassFluxUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", MassFlux._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: MassFluxUnits, to_unit: MassFluxUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one MassFlux unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MassFluxUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MassFluxUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return MassFlux._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: MassFluxUnits = MassFluxUnits.KilogramPerSecondPerSquareMeter) -> MassFlux:
+        """
+        Create a new instance of MassFlux holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MassFluxUnits
+        :return: A new instance of MassFlux.
+        :rtype: MassFlux
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return MassFlux._from_exact(value, from_unit)
+
+    def to_exact(self, unit: MassFluxUnits = MassFluxUnits.KilogramPerSecondPerSquareMeter) -> Fraction:
+        """
+        Get the exact value of the MassFlux in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (KilogramPerSecondPerSquareMeter).
+        :type unit: MassFluxUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> MassFlux:
+        """
+        Parse a MassFlux from a value followed by a unit abbreviation, e.g. "1 g·s⁻¹·m⁻²".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of MassFlux.
+        :rtype: MassFlux
+        :raises ValueError: When the string is not a valid or an ambiguous MassFlux.
+        """
+        return MassFlux._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[MassFlux]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return MassFlux._try_parse(text)
+
+    def to_binary(self, unit: Optional[MassFluxUnits] = None) -> bytes:
+        """
+        Encode the MassFlux to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: MassFluxUnits
+        :return: The encoded MassFlux.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> MassFlux:
+        """
+        Decode a MassFlux encoded by to_binary.
+
+        :param data: The encoded MassFlux, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of MassFlux.
+        :rtype: MassFlux
+        :raises ValueError: When the data is not a valid encoded MassFlux.
+        """
+        return MassFlux._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[MassFluxUnits] = None) -> dict:
+        """
+        Get the MassFlux DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (KilogramPerSecondPerSquareMeter).
+        :type hold_in_unit: MassFluxUnits
+        :return: The MassFlux DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[MassFluxUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> MassFlux:
+        """
+        Create a new instance of MassFlux from its DTO.
+
+        :param dto: The MassFlux DTO, the unit is the MassFluxUnits value or name.
+        :type dto: dict
+        :return: A new instance of MassFlux.
+        :rtype: MassFlux
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return MassFlux._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> MassFlux:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return MassFlux._from_json(text)
+
     @property
     def base_value(self) -> float:
         return self._value
@@ -385,10 +651,7 @@ class MassFlux(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_second_per_square_meter != None:
-            return self.__grams_per_second_per_square_meter
-        self.__grams_per_second_per_square_meter = self.__convert_from_base(MassFluxUnits.GramPerSecondPerSquareMeter)
-        return self.__grams_per_second_per_square_meter
+        return self._cached_convert(MassFluxUnits.GramPerSecondPerSquareMeter)
 
     
     @property
@@ -396,10 +659,7 @@ class MassFlux(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_second_per_square_centimeter != None:
-            return self.__grams_per_second_per_square_centimeter
-        self.__grams_per_second_per_square_centimeter = self.__convert_from_base(MassFluxUnits.GramPerSecondPerSquareCentimeter)
-        return self.__grams_per_second_per_square_centimeter
+        return self._cached_convert(MassFluxUnits.GramPerSecondPerSquareCentimeter)
 
     
     @property
@@ -407,10 +667,7 @@ class MassFlux(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_second_per_square_millimeter != None:
-            return self.__grams_per_second_per_square_millimeter
-        self.__grams_per_second_per_square_millimeter = self.__convert_from_base(MassFluxUnits.GramPerSecondPerSquareMillimeter)
-        return self.__grams_per_second_per_square_millimeter
+        return self._cached_convert(MassFluxUnits.GramPerSecondPerSquareMillimeter)
 
     
     @property
@@ -418,10 +675,7 @@ class MassFlux(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_hour_per_square_meter != None:
-            return self.__grams_per_hour_per_square_meter
-        self.__grams_per_hour_per_square_meter = self.__convert_from_base(MassFluxUnits.GramPerHourPerSquareMeter)
-        return self.__grams_per_hour_per_square_meter
+        return self._cached_convert(MassFluxUnits.GramPerHourPerSquareMeter)
 
     
     @property
@@ -429,10 +683,7 @@ class MassFlux(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_hour_per_square_centimeter != None:
-            return self.__grams_per_hour_per_square_centimeter
-        self.__grams_per_hour_per_square_centimeter = self.__convert_from_base(MassFluxUnits.GramPerHourPerSquareCentimeter)
-        return self.__grams_per_hour_per_square_centimeter
+        return self._cached_convert(MassFluxUnits.GramPerHourPerSquareCentimeter)
 
     
     @property
@@ -440,10 +691,7 @@ class MassFlux(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_hour_per_square_millimeter != None:
-            return self.__grams_per_hour_per_square_millimeter
-        self.__grams_per_hour_per_square_millimeter = self.__convert_from_base(MassFluxUnits.GramPerHourPerSquareMillimeter)
-        return self.__grams_per_hour_per_square_millimeter
+        return self._cached_convert(MassFluxUnits.GramPerHourPerSquareMillimeter)
 
     
     @property
@@ -451,10 +699,7 @@ class MassFlux(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_second_per_square_meter != None:
-            return self.__kilograms_per_second_per_square_meter
-        self.__kilograms_per_second_per_square_meter = self.__convert_from_base(MassFluxUnits.KilogramPerSecondPerSquareMeter)
-        return self.__kilograms_per_second_per_square_meter
+        return self._cached_convert(MassFluxUnits.KilogramPerSecondPerSquareMeter)
 
     
     @property
@@ -462,10 +707,7 @@ class MassFlux(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_second_per_square_centimeter != None:
-            return self.__kilograms_per_second_per_square_centimeter
-        self.__kilograms_per_second_per_square_centimeter = self.__convert_from_base(MassFluxUnits.KilogramPerSecondPerSquareCentimeter)
-        return self.__kilograms_per_second_per_square_centimeter
+        return self._cached_convert(MassFluxUnits.KilogramPerSecondPerSquareCentimeter)
 
     
     @property
@@ -473,10 +715,7 @@ class MassFlux(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_second_per_square_millimeter != None:
-            return self.__kilograms_per_second_per_square_millimeter
-        self.__kilograms_per_second_per_square_millimeter = self.__convert_from_base(MassFluxUnits.KilogramPerSecondPerSquareMillimeter)
-        return self.__kilograms_per_second_per_square_millimeter
+        return self._cached_convert(MassFluxUnits.KilogramPerSecondPerSquareMillimeter)
 
     
     @property
@@ -484,10 +723,7 @@ class MassFlux(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_hour_per_square_meter != None:
-            return self.__kilograms_per_hour_per_square_meter
-        self.__kilograms_per_hour_per_square_meter = self.__convert_from_base(MassFluxUnits.KilogramPerHourPerSquareMeter)
-        return self.__kilograms_per_hour_per_square_meter
+        return self._cached_convert(MassFluxUnits.KilogramPerHourPerSquareMeter)
 
     
     @property
@@ -495,10 +731,7 @@ class MassFlux(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_hour_per_square_centimeter != None:
-            return self.__kilograms_per_hour_per_square_centimeter
-        self.__kilograms_per_hour_per_square_centimeter = self.__convert_from_base(MassFluxUnits.KilogramPerHourPerSquareCentimeter)
-        return self.__kilograms_per_hour_per_square_centimeter
+        return self._cached_convert(MassFluxUnits.KilogramPerHourPerSquareCentimeter)
 
     
     @property
@@ -506,10 +739,7 @@ class MassFlux(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_hour_per_square_millimeter != None:
-            return self.__kilograms_per_hour_per_square_millimeter
-        self.__kilograms_per_hour_per_square_millimeter = self.__convert_from_base(MassFluxUnits.KilogramPerHourPerSquareMillimeter)
-        return self.__kilograms_per_hour_per_square_millimeter
+        return self._cached_convert(MassFluxUnits.KilogramPerHourPerSquareMillimeter)
 
     
     def to_string(self, unit: MassFluxUnits = MassFluxUnits.KilogramPerSecondPerSquareMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class MassFractionUnits(Enum):
         """
             MassFractionUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         DecimalFraction = 'decimal_fraction'
         """
@@ -139,217 +150,520 @@ class MassFraction(AbstractMeasure):
         value (float): The value.
         from_unit (MassFractionUnits): The MassFraction unit to create from, The default unit is DecimalFraction
     """
-    def __init__(self, value: float, from_unit: MassFractionUnits = MassFractionUnits.DecimalFraction):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = MassFractionUnits
+
+    _base_unit = MassFractionUnits.DecimalFraction
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 68
+
+    _binary_unit_ids = {
         
-        self.__decimal_fractions = None
+        MassFractionUnits.DecimalFraction: 0,
         
-        self.__grams_per_gram = None
+        MassFractionUnits.GramPerGram: 1,
         
-        self.__grams_per_kilogram = None
+        MassFractionUnits.GramPerKilogram: 2,
         
-        self.__percent = None
+        MassFractionUnits.Percent: 3,
         
-        self.__parts_per_thousand = None
+        MassFractionUnits.PartPerThousand: 4,
         
-        self.__parts_per_million = None
+        MassFractionUnits.PartPerMillion: 5,
         
-        self.__parts_per_billion = None
+        MassFractionUnits.PartPerBillion: 6,
         
-        self.__parts_per_trillion = None
+        MassFractionUnits.PartPerTrillion: 7,
         
-        self.__nanograms_per_gram = None
+        MassFractionUnits.NanogramPerGram: 8,
         
-        self.__micrograms_per_gram = None
+        MassFractionUnits.MicrogramPerGram: 9,
         
-        self.__milligrams_per_gram = None
+        MassFractionUnits.MilligramPerGram: 10,
         
-        self.__centigrams_per_gram = None
+        MassFractionUnits.CentigramPerGram: 11,
         
-        self.__decigrams_per_gram = None
+        MassFractionUnits.DecigramPerGram: 12,
         
-        self.__decagrams_per_gram = None
+        MassFractionUnits.DecagramPerGram: 13,
         
-        self.__hectograms_per_gram = None
+        MassFractionUnits.HectogramPerGram: 14,
         
-        self.__kilograms_per_gram = None
+        MassFractionUnits.KilogramPerGram: 15,
         
-        self.__nanograms_per_kilogram = None
+        MassFractionUnits.NanogramPerKilogram: 16,
         
-        self.__micrograms_per_kilogram = None
+        MassFractionUnits.MicrogramPerKilogram: 17,
         
-        self.__milligrams_per_kilogram = None
+        MassFractionUnits.MilligramPerKilogram: 18,
         
-        self.__centigrams_per_kilogram = None
+        MassFractionUnits.CentigramPerKilogram: 19,
         
-        self.__decigrams_per_kilogram = None
+        MassFractionUnits.DecigramPerKilogram: 20,
         
-        self.__decagrams_per_kilogram = None
+        MassFractionUnits.DecagramPerKilogram: 21,
         
-        self.__hectograms_per_kilogram = None
+        MassFractionUnits.HectogramPerKilogram: 22,
         
-        self.__kilograms_per_kilogram = None
+        MassFractionUnits.KilogramPerKilogram: 23,
         
+    }
 
-    def convert(self, unit: MassFractionUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        MassFractionUnits.DecimalFraction: lambda value: (value),
+        
+        MassFractionUnits.GramPerGram: lambda value: (value),
+        
+        MassFractionUnits.GramPerKilogram: lambda value: (value * 1e3),
+        
+        MassFractionUnits.Percent: lambda value: (value * 1e2),
+        
+        MassFractionUnits.PartPerThousand: lambda value: (value * 1e3),
+        
+        MassFractionUnits.PartPerMillion: lambda value: (value * 1e6),
+        
+        MassFractionUnits.PartPerBillion: lambda value: (value * 1e9),
+        
+        MassFractionUnits.PartPerTrillion: lambda value: (value * 1e12),
+        
+        MassFractionUnits.NanogramPerGram: lambda value: ((value) / 1e-09),
+        
+        MassFractionUnits.MicrogramPerGram: lambda value: ((value) / 1e-06),
+        
+        MassFractionUnits.MilligramPerGram: lambda value: ((value) / 0.001),
+        
+        MassFractionUnits.CentigramPerGram: lambda value: ((value) / 0.01),
+        
+        MassFractionUnits.DecigramPerGram: lambda value: ((value) / 0.1),
+        
+        MassFractionUnits.DecagramPerGram: lambda value: ((value) / 10.0),
+        
+        MassFractionUnits.HectogramPerGram: lambda value: ((value) / 100.0),
+        
+        MassFractionUnits.KilogramPerGram: lambda value: ((value) / 1000.0),
+        
+        MassFractionUnits.NanogramPerKilogram: lambda value: ((value * 1e3) / 1e-09),
+        
+        MassFractionUnits.MicrogramPerKilogram: lambda value: ((value * 1e3) / 1e-06),
+        
+        MassFractionUnits.MilligramPerKilogram: lambda value: ((value * 1e3) / 0.001),
+        
+        MassFractionUnits.CentigramPerKilogram: lambda value: ((value * 1e3) / 0.01),
+        
+        MassFractionUnits.DecigramPerKilogram: lambda value: ((value * 1e3) / 0.1),
+        
+        MassFractionUnits.DecagramPerKilogram: lambda value: ((value * 1e3) / 10.0),
+        
+        MassFractionUnits.HectogramPerKilogram: lambda value: ((value * 1e3) / 100.0),
+        
+        MassFractionUnits.KilogramPerKilogram: lambda value: ((value * 1e3) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: MassFractionUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == MassFractionUnits.DecimalFraction:
-            return (value)
+        MassFractionUnits.DecimalFraction: lambda value: (value),
         
-        if from_unit == MassFractionUnits.GramPerGram:
-            return (value)
+        MassFractionUnits.GramPerGram: lambda value: (value),
         
-        if from_unit == MassFractionUnits.GramPerKilogram:
-            return (value * 1e3)
+        MassFractionUnits.GramPerKilogram: lambda value: (value / 1e3),
         
-        if from_unit == MassFractionUnits.Percent:
-            return (value * 1e2)
+        MassFractionUnits.Percent: lambda value: (value / 1e2),
         
-        if from_unit == MassFractionUnits.PartPerThousand:
-            return (value * 1e3)
+        MassFractionUnits.PartPerThousand: lambda value: (value / 1e3),
         
-        if from_unit == MassFractionUnits.PartPerMillion:
-            return (value * 1e6)
+        MassFractionUnits.PartPerMillion: lambda value: (value / 1e6),
         
-        if from_unit == MassFractionUnits.PartPerBillion:
-            return (value * 1e9)
+        MassFractionUnits.PartPerBillion: lambda value: (value / 1e9),
         
-        if from_unit == MassFractionUnits.PartPerTrillion:
-            return (value * 1e12)
+        MassFractionUnits.PartPerTrillion: lambda value: (value / 1e12),
         
-        if from_unit == MassFractionUnits.NanogramPerGram:
-            return ((value) / 1e-09)
+        MassFractionUnits.NanogramPerGram: lambda value: ((value) * 1e-09),
         
-        if from_unit == MassFractionUnits.MicrogramPerGram:
-            return ((value) / 1e-06)
+        MassFractionUnits.MicrogramPerGram: lambda value: ((value) * 1e-06),
         
-        if from_unit == MassFractionUnits.MilligramPerGram:
-            return ((value) / 0.001)
+        MassFractionUnits.MilligramPerGram: lambda value: ((value) * 0.001),
         
-        if from_unit == MassFractionUnits.CentigramPerGram:
-            return ((value) / 0.01)
+        MassFractionUnits.CentigramPerGram: lambda value: ((value) * 0.01),
         
-        if from_unit == MassFractionUnits.DecigramPerGram:
-            return ((value) / 0.1)
+        MassFractionUnits.DecigramPerGram: lambda value: ((value) * 0.1),
         
-        if from_unit == MassFractionUnits.DecagramPerGram:
-            return ((value) / 10.0)
+        MassFractionUnits.DecagramPerGram: lambda value: ((value) * 10.0),
         
-        if from_unit == MassFractionUnits.HectogramPerGram:
-            return ((value) / 100.0)
+        MassFractionUnits.HectogramPerGram: lambda value: ((value) * 100.0),
         
-        if from_unit == MassFractionUnits.KilogramPerGram:
-            return ((value) / 1000.0)
+        MassFractionUnits.KilogramPerGram: lambda value: ((value) * 1000.0),
         
-        if from_unit == MassFractionUnits.NanogramPerKilogram:
-            return ((value * 1e3) / 1e-09)
+        MassFractionUnits.NanogramPerKilogram: lambda value: ((value / 1e3) * 1e-09),
         
-        if from_unit == MassFractionUnits.MicrogramPerKilogram:
-            return ((value * 1e3) / 1e-06)
+        MassFractionUnits.MicrogramPerKilogram: lambda value: ((value / 1e3) * 1e-06),
         
-        if from_unit == MassFractionUnits.MilligramPerKilogram:
-            return ((value * 1e3) / 0.001)
+        MassFractionUnits.MilligramPerKilogram: lambda value: ((value / 1e3) * 0.001),
         
-        if from_unit == MassFractionUnits.CentigramPerKilogram:
-            return ((value * 1e3) / 0.01)
+        MassFractionUnits.CentigramPerKilogram: lambda value: ((value / 1e3) * 0.01),
         
-        if from_unit == MassFractionUnits.DecigramPerKilogram:
-            return ((value * 1e3) / 0.1)
+        MassFractionUnits.DecigramPerKilogram: lambda value: ((value / 1e3) * 0.1),
         
-        if from_unit == MassFractionUnits.DecagramPerKilogram:
-            return ((value * 1e3) / 10.0)
+        MassFractionUnits.DecagramPerKilogram: lambda value: ((value / 1e3) * 10.0),
         
-        if from_unit == MassFractionUnits.HectogramPerKilogram:
-            return ((value * 1e3) / 100.0)
+        MassFractionUnits.HectogramPerKilogram: lambda value: ((value / 1e3) * 100.0),
         
-        if from_unit == MassFractionUnits.KilogramPerKilogram:
-            return ((value * 1e3) / 1000.0)
+        MassFractionUnits.KilogramPerKilogram: lambda value: ((value / 1e3) * 1000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        MassFractionUnits.DecimalFraction: ('1', '0'),
+        
+        MassFractionUnits.GramPerGram: ('1', '0'),
+        
+        MassFractionUnits.GramPerKilogram: ('1000', '0'),
+        
+        MassFractionUnits.Percent: ('100', '0'),
+        
+        MassFractionUnits.PartPerThousand: ('1000', '0'),
+        
+        MassFractionUnits.PartPerMillion: ('1000000', '0'),
+        
+        MassFractionUnits.PartPerBillion: ('1000000000', '0'),
+        
+        MassFractionUnits.PartPerTrillion: ('1000000000000', '0'),
+        
+        MassFractionUnits.NanogramPerGram: ('1000000000', '0'),
+        
+        MassFractionUnits.MicrogramPerGram: ('1000000', '0'),
+        
+        MassFractionUnits.MilligramPerGram: ('1000', '0'),
+        
+        MassFractionUnits.CentigramPerGram: ('100', '0'),
+        
+        MassFractionUnits.DecigramPerGram: ('10', '0'),
+        
+        MassFractionUnits.DecagramPerGram: ('1/10', '0'),
+        
+        MassFractionUnits.HectogramPerGram: ('1/100', '0'),
+        
+        MassFractionUnits.KilogramPerGram: ('1/1000', '0'),
+        
+        MassFractionUnits.NanogramPerKilogram: ('1000000000000', '0'),
+        
+        MassFractionUnits.MicrogramPerKilogram: ('1000000000', '0'),
+        
+        MassFractionUnits.MilligramPerKilogram: ('1000000', '0'),
+        
+        MassFractionUnits.CentigramPerKilogram: ('100000', '0'),
+        
+        MassFractionUnits.DecigramPerKilogram: ('10000', '0'),
+        
+        MassFractionUnits.DecagramPerKilogram: ('100', '0'),
+        
+        MassFractionUnits.HectogramPerKilogram: ('10', '0'),
+        
+        MassFractionUnits.KilogramPerKilogram: ('1', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: MassFractionUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == MassFractionUnits.DecimalFraction:
-            return (value)
+        MassFractionUnits.DecimalFraction: ('1', '0'),
         
-        if to_unit == MassFractionUnits.GramPerGram:
-            return (value)
+        MassFractionUnits.GramPerGram: ('1', '0'),
         
-        if to_unit == MassFractionUnits.GramPerKilogram:
-            return (value / 1e3)
+        MassFractionUnits.GramPerKilogram: ('1/1000', '0'),
         
-        if to_unit == MassFractionUnits.Percent:
-            return (value / 1e2)
+        MassFractionUnits.Percent: ('1/100', '0'),
         
-        if to_unit == MassFractionUnits.PartPerThousand:
-            return (value / 1e3)
+        MassFractionUnits.PartPerThousand: ('1/1000', '0'),
         
-        if to_unit == MassFractionUnits.PartPerMillion:
-            return (value / 1e6)
+        MassFractionUnits.PartPerMillion: ('1/1000000', '0'),
         
-        if to_unit == MassFractionUnits.PartPerBillion:
-            return (value / 1e9)
+        MassFractionUnits.PartPerBillion: ('1/1000000000', '0'),
         
-        if to_unit == MassFractionUnits.PartPerTrillion:
-            return (value / 1e12)
+        MassFractionUnits.PartPerTrillion: ('1/1000000000000', '0'),
         
-        if to_unit == MassFractionUnits.NanogramPerGram:
-            return ((value) * 1e-09)
+        MassFractionUnits.NanogramPerGram: ('1/1000000000', '0'),
         
-        if to_unit == MassFractionUnits.MicrogramPerGram:
-            return ((value) * 1e-06)
+        MassFractionUnits.MicrogramPerGram: ('1/1000000', '0'),
         
-        if to_unit == MassFractionUnits.MilligramPerGram:
-            return ((value) * 0.001)
+        MassFractionUnits.MilligramPerGram: ('1/1000', '0'),
         
-        if to_unit == MassFractionUnits.CentigramPerGram:
-            return ((value) * 0.01)
+        MassFractionUnits.CentigramPerGram: ('1/100', '0'),
         
-        if to_unit == MassFractionUnits.DecigramPerGram:
-            return ((value) * 0.1)
+        MassFractionUnits.DecigramPerGram: ('1/10', '0'),
         
-        if to_unit == MassFractionUnits.DecagramPerGram:
-            return ((value) * 10.0)
+        MassFractionUnits.DecagramPerGram: ('10', '0'),
         
-        if to_unit == MassFractionUnits.HectogramPerGram:
-            return ((value) * 100.0)
+        MassFractionUnits.HectogramPerGram: ('100', '0'),
         
-        if to_unit == MassFractionUnits.KilogramPerGram:
-            return ((value) * 1000.0)
+        MassFractionUnits.KilogramPerGram: ('1000', '0'),
         
-        if to_unit == MassFractionUnits.NanogramPerKilogram:
-            return ((value / 1e3) * 1e-09)
+        MassFractionUnits.NanogramPerKilogram: ('1/1000000000000', '0'),
         
-        if to_unit == MassFractionUnits.MicrogramPerKilogram:
-            return ((value / 1e3) * 1e-06)
+        MassFractionUnits.MicrogramPerKilogram: ('1/1000000000', '0'),
         
-        if to_unit == MassFractionUnits.MilligramPerKilogram:
-            return ((value / 1e3) * 0.001)
+        MassFractionUnits.MilligramPerKilogram: ('1/1000000', '0'),
         
-        if to_unit == MassFractionUnits.CentigramPerKilogram:
-            return ((value / 1e3) * 0.01)
+        MassFractionUnits.CentigramPerKilogram: ('1/100000', '0'),
         
-        if to_unit == MassFractionUnits.DecigramPerKilogram:
-            return ((value / 1e3) * 0.1)
+        MassFractionUnits.DecigramPerKilogram: ('1/10000', '0'),
         
-        if to_unit == MassFractionUnits.DecagramPerKilogram:
-            return ((value / 1e3) * 10.0)
+        MassFractionUnits.DecagramPerKilogram: ('1/100', '0'),
         
-        if to_unit == MassFractionUnits.HectogramPerKilogram:
-            return ((value / 1e3) * 100.0)
+        MassFractionUnits.HectogramPerKilogram: ('1/10', '0'),
         
-        if to_unit == MassFractionUnits.KilogramPerKilogram:
-            return ((value / 1e3) * 1000.0)
+        MassFractionUnits.KilogramPerKilogram: ('1', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        MassFractionUnits.DecimalFraction: (),
+        
+        MassFractionUnits.GramPerGram: ('g/g',),
+        
+        MassFractionUnits.GramPerKilogram: ('g/kg',),
+        
+        MassFractionUnits.Percent: ('%',),
+        
+        MassFractionUnits.PartPerThousand: ('‰',),
+        
+        MassFractionUnits.PartPerMillion: ('ppm',),
+        
+        MassFractionUnits.PartPerBillion: ('ppb',),
+        
+        MassFractionUnits.PartPerTrillion: ('ppt',),
+        
+        MassFractionUnits.NanogramPerGram: ('ng/g',),
+        
+        MassFractionUnits.MicrogramPerGram: ('μg/g',),
+        
+        MassFractionUnits.MilligramPerGram: ('mg/g',),
+        
+        MassFractionUnits.CentigramPerGram: ('cg/g',),
+        
+        MassFractionUnits.DecigramPerGram: ('dg/g',),
+        
+        MassFractionUnits.DecagramPerGram: ('dag/g',),
+        
+        MassFractionUnits.HectogramPerGram: ('hg/g',),
+        
+        MassFractionUnits.KilogramPerGram: ('kg/g',),
+        
+        MassFractionUnits.NanogramPerKilogram: ('ng/kg',),
+        
+        MassFractionUnits.MicrogramPerKilogram: ('μg/kg',),
+        
+        MassFractionUnits.MilligramPerKilogram: ('mg/kg',),
+        
+        MassFractionUnits.CentigramPerKilogram: ('cg/kg',),
+        
+        MassFractionUnits.DecigramPerKilogram: ('dg/kg',),
+        
+        MassFractionUnits.DecagramPerKilogram: ('dag/kg',),
+        
+        MassFractionUnits.HectogramPerKilogram: ('hg/kg',),
+        
+        MassFractionUnits.KilogramPerKilogram: ('kg/kg',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: MassFractionUnits = MassFractionUnits.DecimalFraction):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: MassFractionUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: MassFractionUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: MassFractionUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: MassFractionUnits, to_unit: MassFractionUnits) -> float:
+        """
+        Convert a value from one MassFraction unit to another, without creating a MassFraction instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: MassFractionUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MassFractionUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return MassFraction._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: MassFractionUnits, to_unit: MassFractionUnits) -> List[float]:
+        """
+        Convert many values from one MassFraction unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: MassFractionUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: MassFractionUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return MassFraction._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: MassFractionUnits, to_unit: MassFractionUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", MassFraction._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: MassFractionUnits, to_unit: MassFractionUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one MassFraction unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MassFractionUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MassFractionUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return MassFraction._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: MassFractionUnits = MassFractionUnits.DecimalFraction) -> MassFraction:
+        """
+        Create a new instance of MassFraction holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MassFractionUnits
+        :return: A new instance of MassFraction.
+        :rtype: MassFraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return MassFraction._from_exact(value, from_unit)
+
+    def to_exact(self, unit: MassFractionUnits = MassFractionUnits.DecimalFraction) -> Fraction:
+        """
+        Get the exact value of the MassFraction in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (DecimalFraction).
+        :type unit: MassFractionUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> MassFraction:
+        """
+        Parse a MassFraction from a value followed by a unit abbreviation, e.g. "1 ".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of MassFraction.
+        :rtype: MassFraction
+        :raises ValueError: When the string is not a valid or an ambiguous MassFraction.
+        """
+        return MassFraction._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[MassFraction]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return MassFraction._try_parse(text)
+
+    def to_binary(self, unit: Optional[MassFractionUnits] = None) -> bytes:
+        """
+        Encode the MassFraction to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: MassFractionUnits
+        :return: The encoded MassFraction.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> MassFraction:
+        """
+        Decode a MassFraction encoded by to_binary.
+
+        :param data: The encoded MassFraction, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of MassFraction.
+        :rtype: MassFraction
+        :raises ValueError: When the data is not a valid encoded MassFraction.
+        """
+        return MassFraction._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[MassFractionUnits] = None) -> dict:
+        """
+        Get the MassFraction DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (DecimalFraction).
+        :type hold_in_unit: MassFractionUnits
+        :return: The MassFraction DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[MassFractionUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> MassFraction:
+        """
+        Create a new instance of MassFraction from its DTO.
+
+        :param dto: The MassFraction DTO, the unit is the MassFractionUnits value or name.
+        :type dto: dict
+        :return: A new instance of MassFraction.
+        :rtype: MassFraction
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return MassFraction._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> MassFraction:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return MassFraction._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -721,10 +1035,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__decimal_fractions != None:
-            return self.__decimal_fractions
-        self.__decimal_fractions = self.__convert_from_base(MassFractionUnits.DecimalFraction)
-        return self.__decimal_fractions
+        return self._cached_convert(MassFractionUnits.DecimalFraction)
 
     
     @property
@@ -732,10 +1043,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_gram != None:
-            return self.__grams_per_gram
-        self.__grams_per_gram = self.__convert_from_base(MassFractionUnits.GramPerGram)
-        return self.__grams_per_gram
+        return self._cached_convert(MassFractionUnits.GramPerGram)
 
     
     @property
@@ -743,10 +1051,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_kilogram != None:
-            return self.__grams_per_kilogram
-        self.__grams_per_kilogram = self.__convert_from_base(MassFractionUnits.GramPerKilogram)
-        return self.__grams_per_kilogram
+        return self._cached_convert(MassFractionUnits.GramPerKilogram)
 
     
     @property
@@ -754,10 +1059,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__percent != None:
-            return self.__percent
-        self.__percent = self.__convert_from_base(MassFractionUnits.Percent)
-        return self.__percent
+        return self._cached_convert(MassFractionUnits.Percent)
 
     
     @property
@@ -765,10 +1067,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__parts_per_thousand != None:
-            return self.__parts_per_thousand
-        self.__parts_per_thousand = self.__convert_from_base(MassFractionUnits.PartPerThousand)
-        return self.__parts_per_thousand
+        return self._cached_convert(MassFractionUnits.PartPerThousand)
 
     
     @property
@@ -776,10 +1075,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__parts_per_million != None:
-            return self.__parts_per_million
-        self.__parts_per_million = self.__convert_from_base(MassFractionUnits.PartPerMillion)
-        return self.__parts_per_million
+        return self._cached_convert(MassFractionUnits.PartPerMillion)
 
     
     @property
@@ -787,10 +1083,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__parts_per_billion != None:
-            return self.__parts_per_billion
-        self.__parts_per_billion = self.__convert_from_base(MassFractionUnits.PartPerBillion)
-        return self.__parts_per_billion
+        return self._cached_convert(MassFractionUnits.PartPerBillion)
 
     
     @property
@@ -798,10 +1091,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__parts_per_trillion != None:
-            return self.__parts_per_trillion
-        self.__parts_per_trillion = self.__convert_from_base(MassFractionUnits.PartPerTrillion)
-        return self.__parts_per_trillion
+        return self._cached_convert(MassFractionUnits.PartPerTrillion)
 
     
     @property
@@ -809,10 +1099,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__nanograms_per_gram != None:
-            return self.__nanograms_per_gram
-        self.__nanograms_per_gram = self.__convert_from_base(MassFractionUnits.NanogramPerGram)
-        return self.__nanograms_per_gram
+        return self._cached_convert(MassFractionUnits.NanogramPerGram)
 
     
     @property
@@ -820,10 +1107,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_gram != None:
-            return self.__micrograms_per_gram
-        self.__micrograms_per_gram = self.__convert_from_base(MassFractionUnits.MicrogramPerGram)
-        return self.__micrograms_per_gram
+        return self._cached_convert(MassFractionUnits.MicrogramPerGram)
 
     
     @property
@@ -831,10 +1115,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_gram != None:
-            return self.__milligrams_per_gram
-        self.__milligrams_per_gram = self.__convert_from_base(MassFractionUnits.MilligramPerGram)
-        return self.__milligrams_per_gram
+        return self._cached_convert(MassFractionUnits.MilligramPerGram)
 
     
     @property
@@ -842,10 +1123,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__centigrams_per_gram != None:
-            return self.__centigrams_per_gram
-        self.__centigrams_per_gram = self.__convert_from_base(MassFractionUnits.CentigramPerGram)
-        return self.__centigrams_per_gram
+        return self._cached_convert(MassFractionUnits.CentigramPerGram)
 
     
     @property
@@ -853,10 +1131,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__decigrams_per_gram != None:
-            return self.__decigrams_per_gram
-        self.__decigrams_per_gram = self.__convert_from_base(MassFractionUnits.DecigramPerGram)
-        return self.__decigrams_per_gram
+        return self._cached_convert(MassFractionUnits.DecigramPerGram)
 
     
     @property
@@ -864,10 +1139,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__decagrams_per_gram != None:
-            return self.__decagrams_per_gram
-        self.__decagrams_per_gram = self.__convert_from_base(MassFractionUnits.DecagramPerGram)
-        return self.__decagrams_per_gram
+        return self._cached_convert(MassFractionUnits.DecagramPerGram)
 
     
     @property
@@ -875,10 +1147,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__hectograms_per_gram != None:
-            return self.__hectograms_per_gram
-        self.__hectograms_per_gram = self.__convert_from_base(MassFractionUnits.HectogramPerGram)
-        return self.__hectograms_per_gram
+        return self._cached_convert(MassFractionUnits.HectogramPerGram)
 
     
     @property
@@ -886,10 +1155,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_gram != None:
-            return self.__kilograms_per_gram
-        self.__kilograms_per_gram = self.__convert_from_base(MassFractionUnits.KilogramPerGram)
-        return self.__kilograms_per_gram
+        return self._cached_convert(MassFractionUnits.KilogramPerGram)
 
     
     @property
@@ -897,10 +1163,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__nanograms_per_kilogram != None:
-            return self.__nanograms_per_kilogram
-        self.__nanograms_per_kilogram = self.__convert_from_base(MassFractionUnits.NanogramPerKilogram)
-        return self.__nanograms_per_kilogram
+        return self._cached_convert(MassFractionUnits.NanogramPerKilogram)
 
     
     @property
@@ -908,10 +1171,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_kilogram != None:
-            return self.__micrograms_per_kilogram
-        self.__micrograms_per_kilogram = self.__convert_from_base(MassFractionUnits.MicrogramPerKilogram)
-        return self.__micrograms_per_kilogram
+        return self._cached_convert(MassFractionUnits.MicrogramPerKilogram)
 
     
     @property
@@ -919,10 +1179,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_kilogram != None:
-            return self.__milligrams_per_kilogram
-        self.__milligrams_per_kilogram = self.__convert_from_base(MassFractionUnits.MilligramPerKilogram)
-        return self.__milligrams_per_kilogram
+        return self._cached_convert(MassFractionUnits.MilligramPerKilogram)
 
     
     @property
@@ -930,10 +1187,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__centigrams_per_kilogram != None:
-            return self.__centigrams_per_kilogram
-        self.__centigrams_per_kilogram = self.__convert_from_base(MassFractionUnits.CentigramPerKilogram)
-        return self.__centigrams_per_kilogram
+        return self._cached_convert(MassFractionUnits.CentigramPerKilogram)
 
     
     @property
@@ -941,10 +1195,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__decigrams_per_kilogram != None:
-            return self.__decigrams_per_kilogram
-        self.__decigrams_per_kilogram = self.__convert_from_base(MassFractionUnits.DecigramPerKilogram)
-        return self.__decigrams_per_kilogram
+        return self._cached_convert(MassFractionUnits.DecigramPerKilogram)
 
     
     @property
@@ -952,10 +1203,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__decagrams_per_kilogram != None:
-            return self.__decagrams_per_kilogram
-        self.__decagrams_per_kilogram = self.__convert_from_base(MassFractionUnits.DecagramPerKilogram)
-        return self.__decagrams_per_kilogram
+        return self._cached_convert(MassFractionUnits.DecagramPerKilogram)
 
     
     @property
@@ -963,10 +1211,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__hectograms_per_kilogram != None:
-            return self.__hectograms_per_kilogram
-        self.__hectograms_per_kilogram = self.__convert_from_base(MassFractionUnits.HectogramPerKilogram)
-        return self.__hectograms_per_kilogram
+        return self._cached_convert(MassFractionUnits.HectogramPerKilogram)
 
     
     @property
@@ -974,10 +1219,7 @@ class MassFraction(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_kilogram != None:
-            return self.__kilograms_per_kilogram
-        self.__kilograms_per_kilogram = self.__convert_from_base(MassFractionUnits.KilogramPerKilogram)
-        return self.__kilograms_per_kilogram
+        return self._cached_convert(MassFractionUnits.KilogramPerKilogram)
 
     
     def to_string(self, unit: MassFractionUnits = MassFractionUnits.DecimalFraction) -> str:
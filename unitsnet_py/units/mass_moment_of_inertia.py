@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class MassMomentOfInertiaUnits(Enum):
         """
             MassMomentOfInertiaUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         GramSquareMeter = 'gram_square_meter'
         """
@@ -159,249 +170,568 @@ class MassMomentOfInertia(AbstractMeasure):
         value (float): The value.
         from_unit (MassMomentOfInertiaUnits): The MassMomentOfInertia unit to create from, The default unit is KilogramSquareMeter
     """
-    def __init__(self, value: float, from_unit: MassMomentOfInertiaUnits = MassMomentOfInertiaUnits.KilogramSquareMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = MassMomentOfInertiaUnits
+
+    _base_unit = MassMomentOfInertiaUnits.KilogramSquareMeter
+
+    _dimensions = (2, 1, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 69
+
+    _binary_unit_ids = {
         
-        self.__gram_square_meters = None
+        MassMomentOfInertiaUnits.GramSquareMeter: 0,
         
-        self.__gram_square_decimeters = None
+        MassMomentOfInertiaUnits.GramSquareDecimeter: 1,
         
-        self.__gram_square_centimeters = None
+        MassMomentOfInertiaUnits.GramSquareCentimeter: 2,
         
-        self.__gram_square_millimeters = None
+        MassMomentOfInertiaUnits.GramSquareMillimeter: 3,
         
-        self.__tonne_square_meters = None
+        MassMomentOfInertiaUnits.TonneSquareMeter: 4,
         
-        self.__tonne_square_decimeters = None
+        MassMomentOfInertiaUnits.TonneSquareDecimeter: 5,
         
-        self.__tonne_square_centimeters = None
+        MassMomentOfInertiaUnits.TonneSquareCentimeter: 6,
         
-        self.__tonne_square_milimeters = None
+        MassMomentOfInertiaUnits.TonneSquareMilimeter: 7,
         
-        self.__pound_square_feet = None
+        MassMomentOfInertiaUnits.PoundSquareFoot: 8,
         
-        self.__pound_square_inches = None
+        MassMomentOfInertiaUnits.PoundSquareInch: 9,
         
-        self.__slug_square_feet = None
+        MassMomentOfInertiaUnits.SlugSquareFoot: 10,
         
-        self.__slug_square_inches = None
+        MassMomentOfInertiaUnits.SlugSquareInch: 11,
         
-        self.__milligram_square_meters = None
+        MassMomentOfInertiaUnits.MilligramSquareMeter: 12,
         
-        self.__kilogram_square_meters = None
+        MassMomentOfInertiaUnits.KilogramSquareMeter: 13,
         
-        self.__milligram_square_decimeters = None
+        MassMomentOfInertiaUnits.MilligramSquareDecimeter: 14,
         
-        self.__kilogram_square_decimeters = None
+        MassMomentOfInertiaUnits.KilogramSquareDecimeter: 15,
         
-        self.__milligram_square_centimeters = None
+        MassMomentOfInertiaUnits.MilligramSquareCentimeter: 16,
         
-        self.__kilogram_square_centimeters = None
+        MassMomentOfInertiaUnits.KilogramSquareCentimeter: 17,
         
-        self.__milligram_square_millimeters = None
+        MassMomentOfInertiaUnits.MilligramSquareMillimeter: 18,
         
-        self.__kilogram_square_millimeters = None
+        MassMomentOfInertiaUnits.KilogramSquareMillimeter: 19,
         
-        self.__kilotonne_square_meters = None
+        MassMomentOfInertiaUnits.KilotonneSquareMeter: 20,
         
-        self.__megatonne_square_meters = None
+        MassMomentOfInertiaUnits.MegatonneSquareMeter: 21,
         
-        self.__kilotonne_square_decimeters = None
+        MassMomentOfInertiaUnits.KilotonneSquareDecimeter: 22,
         
-        self.__megatonne_square_decimeters = None
+        MassMomentOfInertiaUnits.MegatonneSquareDecimeter: 23,
         
-        self.__kilotonne_square_centimeters = None
+        MassMomentOfInertiaUnits.KilotonneSquareCentimeter: 24,
         
-        self.__megatonne_square_centimeters = None
+        MassMomentOfInertiaUnits.MegatonneSquareCentimeter: 25,
         
-        self.__kilotonne_square_milimeters = None
+        MassMomentOfInertiaUnits.KilotonneSquareMilimeter: 26,
         
-        self.__megatonne_square_milimeters = None
+        MassMomentOfInertiaUnits.MegatonneSquareMilimeter: 27,
         
+    }
 
-    def convert(self, unit: MassMomentOfInertiaUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        MassMomentOfInertiaUnits.GramSquareMeter: lambda value: (value * 1e3),
+        
+        MassMomentOfInertiaUnits.GramSquareDecimeter: lambda value: (value * 1e5),
+        
+        MassMomentOfInertiaUnits.GramSquareCentimeter: lambda value: (value * 1e7),
+        
+        MassMomentOfInertiaUnits.GramSquareMillimeter: lambda value: (value * 1e9),
+        
+        MassMomentOfInertiaUnits.TonneSquareMeter: lambda value: (value * 1e-3),
+        
+        MassMomentOfInertiaUnits.TonneSquareDecimeter: lambda value: (value * 1e-1),
+        
+        MassMomentOfInertiaUnits.TonneSquareCentimeter: lambda value: (value * 1e1),
+        
+        MassMomentOfInertiaUnits.TonneSquareMilimeter: lambda value: (value * 1e3),
+        
+        MassMomentOfInertiaUnits.PoundSquareFoot: lambda value: (value / 4.21401101e-2),
+        
+        MassMomentOfInertiaUnits.PoundSquareInch: lambda value: (value / 2.9263965e-4),
+        
+        MassMomentOfInertiaUnits.SlugSquareFoot: lambda value: (value / 1.3558179619),
+        
+        MassMomentOfInertiaUnits.SlugSquareInch: lambda value: (value / 9.41540242e-3),
+        
+        MassMomentOfInertiaUnits.MilligramSquareMeter: lambda value: ((value * 1e3) / 0.001),
+        
+        MassMomentOfInertiaUnits.KilogramSquareMeter: lambda value: ((value * 1e3) / 1000.0),
+        
+        MassMomentOfInertiaUnits.MilligramSquareDecimeter: lambda value: ((value * 1e5) / 0.001),
+        
+        MassMomentOfInertiaUnits.KilogramSquareDecimeter: lambda value: ((value * 1e5) / 1000.0),
+        
+        MassMomentOfInertiaUnits.MilligramSquareCentimeter: lambda value: ((value * 1e7) / 0.001),
+        
+        MassMomentOfInertiaUnits.KilogramSquareCentimeter: lambda value: ((value * 1e7) / 1000.0),
+        
+        MassMomentOfInertiaUnits.MilligramSquareMillimeter: lambda value: ((value * 1e9) / 0.001),
+        
+        MassMomentOfInertiaUnits.KilogramSquareMillimeter: lambda value: ((value * 1e9) / 1000.0),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareMeter: lambda value: ((value * 1e-3) / 1000.0),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareMeter: lambda value: ((value * 1e-3) / 1000000.0),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareDecimeter: lambda value: ((value * 1e-1) / 1000.0),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareDecimeter: lambda value: ((value * 1e-1) / 1000000.0),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareCentimeter: lambda value: ((value * 1e1) / 1000.0),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareCentimeter: lambda value: ((value * 1e1) / 1000000.0),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareMilimeter: lambda value: ((value * 1e3) / 1000.0),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareMilimeter: lambda value: ((value * 1e3) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: MassMomentOfInertiaUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == MassMomentOfInertiaUnits.GramSquareMeter:
-            return (value * 1e3)
+        MassMomentOfInertiaUnits.GramSquareMeter: lambda value: (value / 1e3),
         
-        if from_unit == MassMomentOfInertiaUnits.GramSquareDecimeter:
-            return (value * 1e5)
+        MassMomentOfInertiaUnits.GramSquareDecimeter: lambda value: (value / 1e5),
         
-        if from_unit == MassMomentOfInertiaUnits.GramSquareCentimeter:
-            return (value * 1e7)
+        MassMomentOfInertiaUnits.GramSquareCentimeter: lambda value: (value / 1e7),
         
-        if from_unit == MassMomentOfInertiaUnits.GramSquareMillimeter:
-            return (value * 1e9)
+        MassMomentOfInertiaUnits.GramSquareMillimeter: lambda value: (value / 1e9),
         
-        if from_unit == MassMomentOfInertiaUnits.TonneSquareMeter:
-            return (value * 1e-3)
+        MassMomentOfInertiaUnits.TonneSquareMeter: lambda value: (value / 1e-3),
         
-        if from_unit == MassMomentOfInertiaUnits.TonneSquareDecimeter:
-            return (value * 1e-1)
+        MassMomentOfInertiaUnits.TonneSquareDecimeter: lambda value: (value / 1e-1),
         
-        if from_unit == MassMomentOfInertiaUnits.TonneSquareCentimeter:
-            return (value * 1e1)
+        MassMomentOfInertiaUnits.TonneSquareCentimeter: lambda value: (value / 1e1),
         
-        if from_unit == MassMomentOfInertiaUnits.TonneSquareMilimeter:
-            return (value * 1e3)
+        MassMomentOfInertiaUnits.TonneSquareMilimeter: lambda value: (value / 1e3),
         
-        if from_unit == MassMomentOfInertiaUnits.PoundSquareFoot:
-            return (value / 4.21401101e-2)
+        MassMomentOfInertiaUnits.PoundSquareFoot: lambda value: (value * 4.21401101e-2),
         
-        if from_unit == MassMomentOfInertiaUnits.PoundSquareInch:
-            return (value / 2.9263965e-4)
+        MassMomentOfInertiaUnits.PoundSquareInch: lambda value: (value * 2.9263965e-4),
         
-        if from_unit == MassMomentOfInertiaUnits.SlugSquareFoot:
-            return (value / 1.3558179619)
+        MassMomentOfInertiaUnits.SlugSquareFoot: lambda value: (value * 1.3558179619),
         
-        if from_unit == MassMomentOfInertiaUnits.SlugSquareInch:
-            return (value / 9.41540242e-3)
+        MassMomentOfInertiaUnits.SlugSquareInch: lambda value: (value * 9.41540242e-3),
         
-        if from_unit == MassMomentOfInertiaUnits.MilligramSquareMeter:
-            return ((value * 1e3) / 0.001)
+        MassMomentOfInertiaUnits.MilligramSquareMeter: lambda value: ((value / 1e3) * 0.001),
         
-        if from_unit == MassMomentOfInertiaUnits.KilogramSquareMeter:
-            return ((value * 1e3) / 1000.0)
+        MassMomentOfInertiaUnits.KilogramSquareMeter: lambda value: ((value / 1e3) * 1000.0),
         
-        if from_unit == MassMomentOfInertiaUnits.MilligramSquareDecimeter:
-            return ((value * 1e5) / 0.001)
+        MassMomentOfInertiaUnits.MilligramSquareDecimeter: lambda value: ((value / 1e5) * 0.001),
         
-        if from_unit == MassMomentOfInertiaUnits.KilogramSquareDecimeter:
-            return ((value * 1e5) / 1000.0)
+        MassMomentOfInertiaUnits.KilogramSquareDecimeter: lambda value: ((value / 1e5) * 1000.0),
         
-        if from_unit == MassMomentOfInertiaUnits.MilligramSquareCentimeter:
-            return ((value * 1e7) / 0.001)
+        MassMomentOfInertiaUnits.MilligramSquareCentimeter: lambda value: ((value / 1e7) * 0.001),
         
-        if from_unit == MassMomentOfInertiaUnits.KilogramSquareCentimeter:
-            return ((value * 1e7) / 1000.0)
+        MassMomentOfInertiaUnits.KilogramSquareCentimeter: lambda value: ((value / 1e7) * 1000.0),
         
-        if from_unit == MassMomentOfInertiaUnits.MilligramSquareMillimeter:
-            return ((value * 1e9) / 0.001)
+        MassMomentOfInertiaUnits.MilligramSquareMillimeter: lambda value: ((value / 1e9) * 0.001),
         
-        if from_unit == MassMomentOfInertiaUnits.KilogramSquareMillimeter:
-            return ((value * 1e9) / 1000.0)
+        MassMomentOfInertiaUnits.KilogramSquareMillimeter: lambda value: ((value / 1e9) * 1000.0),
         
-        if from_unit == MassMomentOfInertiaUnits.KilotonneSquareMeter:
-            return ((value * 1e-3) / 1000.0)
+        MassMomentOfInertiaUnits.KilotonneSquareMeter: lambda value: ((value / 1e-3) * 1000.0),
         
-        if from_unit == MassMomentOfInertiaUnits.MegatonneSquareMeter:
-            return ((value * 1e-3) / 1000000.0)
+        MassMomentOfInertiaUnits.MegatonneSquareMeter: lambda value: ((value / 1e-3) * 1000000.0),
         
-        if from_unit == MassMomentOfInertiaUnits.KilotonneSquareDecimeter:
-            return ((value * 1e-1) / 1000.0)
+        MassMomentOfInertiaUnits.KilotonneSquareDecimeter: lambda value: ((value / 1e-1) * 1000.0),
         
-        if from_unit == MassMomentOfInertiaUnits.MegatonneSquareDecimeter:
-            return ((value * 1e-1) / 1000000.0)
+        MassMomentOfInertiaUnits.MegatonneSquareDecimeter: lambda value: ((value / 1e-1) * 1000000.0),
         
-        if from_unit == MassMomentOfInertiaUnits.KilotonneSquareCentimeter:
-            return ((value * 1e1) / 1000.0)
+        MassMomentOfInertiaUnits.KilotonneSquareCentimeter: lambda value: ((value / 1e1) * 1000.0),
         
-        if from_unit == MassMomentOfInertiaUnits.MegatonneSquareCentimeter:
-            return ((value * 1e1) / 1000000.0)
+        MassMomentOfInertiaUnits.MegatonneSquareCentimeter: lambda value: ((value / 1e1) * 1000000.0),
         
-        if from_unit == MassMomentOfInertiaUnits.KilotonneSquareMilimeter:
-            return ((value * 1e3) / 1000.0)
+        MassMomentOfInertiaUnits.KilotonneSquareMilimeter: lambda value: ((value / 1e3) * 1000.0),
         
-        if from_unit == MassMomentOfInertiaUnits.MegatonneSquareMilimeter:
-            return ((value * 1e3) / 1000000.0)
+        MassMomentOfInertiaUnits.MegatonneSquareMilimeter: lambda value: ((value / 1e3) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        MassMomentOfInertiaUnits.GramSquareMeter: ('1000', '0'),
+        
+        MassMomentOfInertiaUnits.GramSquareDecimeter: ('100000', '0'),
+        
+        MassMomentOfInertiaUnits.GramSquareCentimeter: ('10000000', '0'),
+        
+        MassMomentOfInertiaUnits.GramSquareMillimeter: ('1000000000', '0'),
+        
+        MassMomentOfInertiaUnits.TonneSquareMeter: ('1/1000', '0'),
+        
+        MassMomentOfInertiaUnits.TonneSquareDecimeter: ('1/10', '0'),
+        
+        MassMomentOfInertiaUnits.TonneSquareCentimeter: ('10', '0'),
+        
+        MassMomentOfInertiaUnits.TonneSquareMilimeter: ('1000', '0'),
+        
+        MassMomentOfInertiaUnits.PoundSquareFoot: ('10000000000/421401101', '0'),
+        
+        MassMomentOfInertiaUnits.PoundSquareInch: ('20000000000/5852793', '0'),
+        
+        MassMomentOfInertiaUnits.SlugSquareFoot: ('10000000000/13558179619', '0'),
+        
+        MassMomentOfInertiaUnits.SlugSquareInch: ('50000000000/470770121', '0'),
+        
+        MassMomentOfInertiaUnits.MilligramSquareMeter: ('1000000', '0'),
+        
+        MassMomentOfInertiaUnits.KilogramSquareMeter: ('1', '0'),
+        
+        MassMomentOfInertiaUnits.MilligramSquareDecimeter: ('100000000', '0'),
+        
+        MassMomentOfInertiaUnits.KilogramSquareDecimeter: ('100', '0'),
+        
+        MassMomentOfInertiaUnits.MilligramSquareCentimeter: ('10000000000', '0'),
+        
+        MassMomentOfInertiaUnits.KilogramSquareCentimeter: ('10000', '0'),
+        
+        MassMomentOfInertiaUnits.MilligramSquareMillimeter: ('1000000000000', '0'),
+        
+        MassMomentOfInertiaUnits.KilogramSquareMillimeter: ('1000000', '0'),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareMeter: ('1/1000000', '0'),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareMeter: ('1/1000000000', '0'),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareDecimeter: ('1/10000', '0'),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareDecimeter: ('1/10000000', '0'),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareCentimeter: ('1/100', '0'),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareCentimeter: ('1/100000', '0'),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareMilimeter: ('1', '0'),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareMilimeter: ('1/1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: MassMomentOfInertiaUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == MassMomentOfInertiaUnits.GramSquareMeter:
-            return (value / 1e3)
+        MassMomentOfInertiaUnits.GramSquareMeter: ('1/1000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.GramSquareDecimeter:
-            return (value / 1e5)
+        MassMomentOfInertiaUnits.GramSquareDecimeter: ('1/100000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.GramSquareCentimeter:
-            return (value / 1e7)
+        MassMomentOfInertiaUnits.GramSquareCentimeter: ('1/10000000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.GramSquareMillimeter:
-            return (value / 1e9)
+        MassMomentOfInertiaUnits.GramSquareMillimeter: ('1/1000000000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.TonneSquareMeter:
-            return (value / 1e-3)
+        MassMomentOfInertiaUnits.TonneSquareMeter: ('1000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.TonneSquareDecimeter:
-            return (value / 1e-1)
+        MassMomentOfInertiaUnits.TonneSquareDecimeter: ('10', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.TonneSquareCentimeter:
-            return (value / 1e1)
+        MassMomentOfInertiaUnits.TonneSquareCentimeter: ('1/10', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.TonneSquareMilimeter:
-            return (value / 1e3)
+        MassMomentOfInertiaUnits.TonneSquareMilimeter: ('1/1000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.PoundSquareFoot:
-            return (value * 4.21401101e-2)
+        MassMomentOfInertiaUnits.PoundSquareFoot: ('421401101/10000000000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.PoundSquareInch:
-            return (value * 2.9263965e-4)
+        MassMomentOfInertiaUnits.PoundSquareInch: ('5852793/20000000000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.SlugSquareFoot:
-            return (value * 1.3558179619)
+        MassMomentOfInertiaUnits.SlugSquareFoot: ('13558179619/10000000000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.SlugSquareInch:
-            return (value * 9.41540242e-3)
+        MassMomentOfInertiaUnits.SlugSquareInch: ('470770121/50000000000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.MilligramSquareMeter:
-            return ((value / 1e3) * 0.001)
+        MassMomentOfInertiaUnits.MilligramSquareMeter: ('1/1000000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.KilogramSquareMeter:
-            return ((value / 1e3) * 1000.0)
+        MassMomentOfInertiaUnits.KilogramSquareMeter: ('1', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.MilligramSquareDecimeter:
-            return ((value / 1e5) * 0.001)
+        MassMomentOfInertiaUnits.MilligramSquareDecimeter: ('1/100000000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.KilogramSquareDecimeter:
-            return ((value / 1e5) * 1000.0)
+        MassMomentOfInertiaUnits.KilogramSquareDecimeter: ('1/100', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.MilligramSquareCentimeter:
-            return ((value / 1e7) * 0.001)
+        MassMomentOfInertiaUnits.MilligramSquareCentimeter: ('1/10000000000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.KilogramSquareCentimeter:
-            return ((value / 1e7) * 1000.0)
+        MassMomentOfInertiaUnits.KilogramSquareCentimeter: ('1/10000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.MilligramSquareMillimeter:
-            return ((value / 1e9) * 0.001)
+        MassMomentOfInertiaUnits.MilligramSquareMillimeter: ('1/1000000000000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.KilogramSquareMillimeter:
-            return ((value / 1e9) * 1000.0)
+        MassMomentOfInertiaUnits.KilogramSquareMillimeter: ('1/1000000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.KilotonneSquareMeter:
-            return ((value / 1e-3) * 1000.0)
+        MassMomentOfInertiaUnits.KilotonneSquareMeter: ('1000000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.MegatonneSquareMeter:
-            return ((value / 1e-3) * 1000000.0)
+        MassMomentOfInertiaUnits.MegatonneSquareMeter: ('1000000000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.KilotonneSquareDecimeter:
-            return ((value / 1e-1) * 1000.0)
+        MassMomentOfInertiaUnits.KilotonneSquareDecimeter: ('10000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.MegatonneSquareDecimeter:
-            return ((value / 1e-1) * 1000000.0)
+        MassMomentOfInertiaUnits.MegatonneSquareDecimeter: ('10000000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.KilotonneSquareCentimeter:
-            return ((value / 1e1) * 1000.0)
+        MassMomentOfInertiaUnits.KilotonneSquareCentimeter: ('100', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.MegatonneSquareCentimeter:
-            return ((value / 1e1) * 1000000.0)
+        MassMomentOfInertiaUnits.MegatonneSquareCentimeter: ('100000', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.KilotonneSquareMilimeter:
-            return ((value / 1e3) * 1000.0)
+        MassMomentOfInertiaUnits.KilotonneSquareMilimeter: ('1', '0'),
         
-        if to_unit == MassMomentOfInertiaUnits.MegatonneSquareMilimeter:
-            return ((value / 1e3) * 1000000.0)
+        MassMomentOfInertiaUnits.MegatonneSquareMilimeter: ('1000', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        MassMomentOfInertiaUnits.GramSquareMeter: ('g·m²',),
+        
+        MassMomentOfInertiaUnits.GramSquareDecimeter: ('g·dm²',),
+        
+        MassMomentOfInertiaUnits.GramSquareCentimeter: ('g·cm²',),
+        
+        MassMomentOfInertiaUnits.GramSquareMillimeter: ('g·mm²',),
+        
+        MassMomentOfInertiaUnits.TonneSquareMeter: ('t·m²',),
+        
+        MassMomentOfInertiaUnits.TonneSquareDecimeter: ('t·dm²',),
+        
+        MassMomentOfInertiaUnits.TonneSquareCentimeter: ('t·cm²',),
+        
+        MassMomentOfInertiaUnits.TonneSquareMilimeter: ('t·mm²',),
+        
+        MassMomentOfInertiaUnits.PoundSquareFoot: ('lb·ft²',),
+        
+        MassMomentOfInertiaUnits.PoundSquareInch: ('lb·in²',),
+        
+        MassMomentOfInertiaUnits.SlugSquareFoot: ('slug·ft²',),
+        
+        MassMomentOfInertiaUnits.SlugSquareInch: ('slug·in²',),
+        
+        MassMomentOfInertiaUnits.MilligramSquareMeter: ('mg·m²',),
+        
+        MassMomentOfInertiaUnits.KilogramSquareMeter: ('kg·m²',),
+        
+        MassMomentOfInertiaUnits.MilligramSquareDecimeter: ('mg·dm²',),
+        
+        MassMomentOfInertiaUnits.KilogramSquareDecimeter: ('kg·dm²',),
+        
+        MassMomentOfInertiaUnits.MilligramSquareCentimeter: ('mg·cm²',),
+        
+        MassMomentOfInertiaUnits.KilogramSquareCentimeter: ('kg·cm²',),
+        
+        MassMomentOfInertiaUnits.MilligramSquareMillimeter: ('mg·mm²',),
+        
+        MassMomentOfInertiaUnits.KilogramSquareMillimeter: ('kg·mm²',),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareMeter: ('kt·m²',),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareMeter: ('Mt·m²',),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareDecimeter: ('kt·dm²',),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareDecimeter: ('Mt·dm²',),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareCentimeter: ('kt·cm²',),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareCentimeter: ('Mt·cm²',),
+        
+        MassMomentOfInertiaUnits.KilotonneSquareMilimeter: ('kt·mm²',),
+        
+        MassMomentOfInertiaUnits.MegatonneSquareMilimeter: ('Mt·mm²',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: MassMomentOfInertiaUnits = MassMomentOfInertiaUnits.KilogramSquareMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: MassMomentOfInertiaUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: MassMomentOfInertiaUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: MassMomentOfInertiaUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: MassMomentOfInertiaUnits, to_unit: MassMomentOfInertiaUnits) -> float:
+        """
+        Convert a value from one MassMomentOfInertia unit to another, without creating a MassMomentOfInertia instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: MassMomentOfInertiaUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MassMomentOfInertiaUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return MassMomentOfInertia._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: MassMomentOfInertiaUnits, to_unit: MassMomentOfInertiaUnits) -> List[float]:
+        """
+        Convert many values from one MassMomentOfInertia unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: MassMomentOfInertiaUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: MassMomentOfInertiaUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return MassMomentOfInertia._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: MassMomentOfInertiaUnits, to_unit: MassMomentOfInertiaUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", MassMomentOfInertia._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: MassMomentOfInertiaUnits, to_unit: MassMomentOfInertiaUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one MassMomentOfInertia unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MassMomentOfInertiaUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MassMomentOfInertiaUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return MassMomentOfInertia._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: MassMomentOfInertiaUnits = MassMomentOfInertiaUnits.KilogramSquareMeter) -> MassMomentOfInertia:
+        """
+        Create a new instance of MassMomentOfInertia holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MassMomentOfInertiaUnits
+        :return: A new instance of MassMomentOfInertia.
+        :rtype: MassMomentOfInertia
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return MassMomentOfInertia._from_exact(value, from_unit)
+
+    def to_exact(self, unit: MassMomentOfInertiaUnits = MassMomentOfInertiaUnits.KilogramSquareMeter) -> Fraction:
+        """
+        Get the exact value of the MassMomentOfInertia in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (KilogramSquareMeter).
+        :type unit: MassMomentOfInertiaUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> MassMomentOfInertia:
+        """
+        Parse a MassMomentOfInertia from a value followed by a unit abbreviation, e.g. "1 g·m²".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of MassMomentOfInertia.
+        :rtype: MassMomentOfInertia
+        :raises ValueError: When the string is not a valid or an ambiguous MassMomentOfInertia.
+        """
+        return MassMomentOfInertia._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[MassMomentOfInertia]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return MassMomentOfInertia._try_parse(text)
+
+    def to_binary(self, unit: Optional[MassMomentOfInertiaUnits] = None) -> bytes:
+        """
+        Encode the MassMomentOfInertia to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: MassMomentOfInertiaUnits
+        :return: The encoded MassMomentOfInertia.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> MassMomentOfInertia:
+        """
+        Decode a MassMomentOfInertia encoded by to_binary.
+
+        :param data: The encoded MassMomentOfInertia, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of MassMomentOfInertia.
+        :rtype: MassMomentOfInertia
+        :raises ValueError: When the data is not a valid encoded MassMomentOfInertia.
+        """
+        return MassMomentOfInertia._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[MassMomentOfInertiaUnits] = None) -> dict:
+        """
+        Get the MassMomentOfInertia DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (KilogramSquareMeter).
+        :type hold_in_unit: MassMomentOfInertiaUnits
+        :return: The MassMomentOfInertia DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[MassMomentOfInertiaUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> MassMomentOfInertia:
+        """
+        Create a new instance of MassMomentOfInertia from its DTO.
+
+        :param dto: The MassMomentOfInertia DTO, the unit is the MassMomentOfInertiaUnits value or name.
+        :type dto: dict
+        :return: A new instance of MassMomentOfInertia.
+        :rtype: MassMomentOfInertia
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return MassMomentOfInertia._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> MassMomentOfInertia:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return MassMomentOfInertia._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -833,10 +1163,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__gram_square_meters != None:
-            return self.__gram_square_meters
-        self.__gram_square_meters = self.__convert_from_base(MassMomentOfInertiaUnits.GramSquareMeter)
-        return self.__gram_square_meters
+        return self._cached_convert(MassMomentOfInertiaUnits.GramSquareMeter)
 
     
     @property
@@ -844,10 +1171,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__gram_square_decimeters != None:
-            return self.__gram_square_decimeters
-        self.__gram_square_decimeters = self.__convert_from_base(MassMomentOfInertiaUnits.GramSquareDecimeter)
-        return self.__gram_square_decimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.GramSquareDecimeter)
 
     
     @property
@@ -855,10 +1179,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__gram_square_centimeters != None:
-            return self.__gram_square_centimeters
-        self.__gram_square_centimeters = self.__convert_from_base(MassMomentOfInertiaUnits.GramSquareCentimeter)
-        return self.__gram_square_centimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.GramSquareCentimeter)
 
     
     @property
@@ -866,10 +1187,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__gram_square_millimeters != None:
-            return self.__gram_square_millimeters
-        self.__gram_square_millimeters = self.__convert_from_base(MassMomentOfInertiaUnits.GramSquareMillimeter)
-        return self.__gram_square_millimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.GramSquareMillimeter)
 
     
     @property
@@ -877,10 +1195,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__tonne_square_meters != None:
-            return self.__tonne_square_meters
-        self.__tonne_square_meters = self.__convert_from_base(MassMomentOfInertiaUnits.TonneSquareMeter)
-        return self.__tonne_square_meters
+        return self._cached_convert(MassMomentOfInertiaUnits.TonneSquareMeter)
 
     
     @property
@@ -888,10 +1203,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__tonne_square_decimeters != None:
-            return self.__tonne_square_decimeters
-        self.__tonne_square_decimeters = self.__convert_from_base(MassMomentOfInertiaUnits.TonneSquareDecimeter)
-        return self.__tonne_square_decimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.TonneSquareDecimeter)
 
     
     @property
@@ -899,10 +1211,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__tonne_square_centimeters != None:
-            return self.__tonne_square_centimeters
-        self.__tonne_square_centimeters = self.__convert_from_base(MassMomentOfInertiaUnits.TonneSquareCentimeter)
-        return self.__tonne_square_centimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.TonneSquareCentimeter)
 
     
     @property
@@ -910,10 +1219,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__tonne_square_milimeters != None:
-            return self.__tonne_square_milimeters
-        self.__tonne_square_milimeters = self.__convert_from_base(MassMomentOfInertiaUnits.TonneSquareMilimeter)
-        return self.__tonne_square_milimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.TonneSquareMilimeter)
 
     
     @property
@@ -921,10 +1227,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__pound_square_feet != None:
-            return self.__pound_square_feet
-        self.__pound_square_feet = self.__convert_from_base(MassMomentOfInertiaUnits.PoundSquareFoot)
-        return self.__pound_square_feet
+        return self._cached_convert(MassMomentOfInertiaUnits.PoundSquareFoot)
 
     
     @property
@@ -932,10 +1235,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__pound_square_inches != None:
-            return self.__pound_square_inches
-        self.__pound_square_inches = self.__convert_from_base(MassMomentOfInertiaUnits.PoundSquareInch)
-        return self.__pound_square_inches
+        return self._cached_convert(MassMomentOfInertiaUnits.PoundSquareInch)
 
     
     @property
@@ -943,10 +1243,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__slug_square_feet != None:
-            return self.__slug_square_feet
-        self.__slug_square_feet = self.__convert_from_base(MassMomentOfInertiaUnits.SlugSquareFoot)
-        return self.__slug_square_feet
+        return self._cached_convert(MassMomentOfInertiaUnits.SlugSquareFoot)
 
     
     @property
@@ -954,10 +1251,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__slug_square_inches != None:
-            return self.__slug_square_inches
-        self.__slug_square_inches = self.__convert_from_base(MassMomentOfInertiaUnits.SlugSquareInch)
-        return self.__slug_square_inches
+        return self._cached_convert(MassMomentOfInertiaUnits.SlugSquareInch)
 
     
     @property
@@ -965,10 +1259,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__milligram_square_meters != None:
-            return self.__milligram_square_meters
-        self.__milligram_square_meters = self.__convert_from_base(MassMomentOfInertiaUnits.MilligramSquareMeter)
-        return self.__milligram_square_meters
+        return self._cached_convert(MassMomentOfInertiaUnits.MilligramSquareMeter)
 
     
     @property
@@ -976,10 +1267,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__kilogram_square_meters != None:
-            return self.__kilogram_square_meters
-        self.__kilogram_square_meters = self.__convert_from_base(MassMomentOfInertiaUnits.KilogramSquareMeter)
-        return self.__kilogram_square_meters
+        return self._cached_convert(MassMomentOfInertiaUnits.KilogramSquareMeter)
 
     
     @property
@@ -987,10 +1275,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__milligram_square_decimeters != None:
-            return self.__milligram_square_decimeters
-        self.__milligram_square_decimeters = self.__convert_from_base(MassMomentOfInertiaUnits.MilligramSquareDecimeter)
-        return self.__milligram_square_decimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.MilligramSquareDecimeter)
 
     
     @property
@@ -998,10 +1283,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__kilogram_square_decimeters != None:
-            return self.__kilogram_square_decimeters
-        self.__kilogram_square_decimeters = self.__convert_from_base(MassMomentOfInertiaUnits.KilogramSquareDecimeter)
-        return self.__kilogram_square_decimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.KilogramSquareDecimeter)
 
     
     @property
@@ -1009,10 +1291,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__milligram_square_centimeters != None:
-            return self.__milligram_square_centimeters
-        self.__milligram_square_centimeters = self.__convert_from_base(MassMomentOfInertiaUnits.MilligramSquareCentimeter)
-        return self.__milligram_square_centimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.MilligramSquareCentimeter)
 
     
     @property
@@ -1020,10 +1299,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__kilogram_square_centimeters != None:
-            return self.__kilogram_square_centimeters
-        self.__kilogram_square_centimeters = self.__convert_from_base(MassMomentOfInertiaUnits.KilogramSquareCentimeter)
-        return self.__kilogram_square_centimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.KilogramSquareCentimeter)
 
     
     @property
@@ -1031,10 +1307,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__milligram_square_millimeters != None:
-            return self.__milligram_square_millimeters
-        self.__milligram_square_millimeters = self.__convert_from_base(MassMomentOfInertiaUnits.MilligramSquareMillimeter)
-        return self.__milligram_square_millimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.MilligramSquareMillimeter)
 
     
     @property
@@ -1042,10 +1315,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__kilogram_square_millimeters != None:
-            return self.__kilogram_square_millimeters
-        self.__kilogram_square_millimeters = self.__convert_from_base(MassMomentOfInertiaUnits.KilogramSquareMillimeter)
-        return self.__kilogram_square_millimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.KilogramSquareMillimeter)
 
     
     @property
@@ -1053,10 +1323,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__kilotonne_square_meters != None:
-            return self.__kilotonne_square_meters
-        self.__kilotonne_square_meters = self.__convert_from_base(MassMomentOfInertiaUnits.KilotonneSquareMeter)
-        return self.__kilotonne_square_meters
+        return self._cached_convert(MassMomentOfInertiaUnits.KilotonneSquareMeter)
 
     
     @property
@@ -1064,10 +1331,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__megatonne_square_meters != None:
-            return self.__megatonne_square_meters
-        self.__megatonne_square_meters = self.__convert_from_base(MassMomentOfInertiaUnits.MegatonneSquareMeter)
-        return self.__megatonne_square_meters
+        return self._cached_convert(MassMomentOfInertiaUnits.MegatonneSquareMeter)
 
     
     @property
@@ -1075,10 +1339,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__kilotonne_square_decimeters != None:
-            return self.__kilotonne_square_decimeters
-        self.__kilotonne_square_decimeters = self.__convert_from_base(MassMomentOfInertiaUnits.KilotonneSquareDecimeter)
-        return self.__kilotonne_square_decimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.KilotonneSquareDecimeter)
 
     
     @property
@@ -1086,10 +1347,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__megatonne_square_decimeters != None:
-            return self.__megatonne_square_decimeters
-        self.__megatonne_square_decimeters = self.__convert_from_base(MassMomentOfInertiaUnits.MegatonneSquareDecimeter)
-        return self.__megatonne_square_decimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.MegatonneSquareDecimeter)
 
     
     @property
@@ -1097,10 +1355,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__kilotonne_square_centimeters != None:
-            return self.__kilotonne_square_centimeters
-        self.__kilotonne_square_centimeters = self.__convert_from_base(MassMomentOfInertiaUnits.KilotonneSquareCentimeter)
-        return self.__kilotonne_square_centimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.KilotonneSquareCentimeter)
 
     
     @property
@@ -1108,10 +1363,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__megatonne_square_centimeters != None:
-            return self.__megatonne_square_centimeters
-        self.__megatonne_square_centimeters = self.__convert_from_base(MassMomentOfInertiaUnits.MegatonneSquareCentimeter)
-        return self.__megatonne_square_centimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.MegatonneSquareCentimeter)
 
     
     @property
@@ -1119,10 +1371,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__kilotonne_square_milimeters != None:
-            return self.__kilotonne_square_milimeters
-        self.__kilotonne_square_milimeters = self.__convert_from_base(MassMomentOfInertiaUnits.KilotonneSquareMilimeter)
-        return self.__kilotonne_square_milimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.KilotonneSquareMilimeter)
 
     
     @property
@@ -1130,10 +1379,7 @@ class MassMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__megatonne_square_milimeters != None:
-            return self.__megatonne_square_milimeters
-        self.__megatonne_square_milimeters = self.__convert_from_base(MassMomentOfInertiaUnits.MegatonneSquareMilimeter)
-        return self.__megatonne_square_milimeters
+        return self._cached_convert(MassMomentOfInertiaUnits.MegatonneSquareMilimeter)
 
     
     def to_string(self, unit: MassMomentOfInertiaUnits = MassMomentOfInertiaUnits.KilogramSquareMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class MolarEnergyUnits(Enum):
         """
             MolarEnergyUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         JoulePerMole = 'joule_per_mole'
         """
@@ -34,49 +45,268 @@ class MolarEnergy(AbstractMeasure):
         value (float): The value.
         from_unit (MolarEnergyUnits): The MolarEnergy unit to create from, The default unit is JoulePerMole
     """
-    def __init__(self, value: float, from_unit: MolarEnergyUnits = MolarEnergyUnits.JoulePerMole):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = MolarEnergyUnits
+
+    _base_unit = MolarEnergyUnits.JoulePerMole
+
+    _dimensions = (2, 1, -2, 0, 0, -1, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 70
+
+    _binary_unit_ids = {
         
-        self.__joules_per_mole = None
+        MolarEnergyUnits.JoulePerMole: 0,
         
-        self.__kilojoules_per_mole = None
+        MolarEnergyUnits.KilojoulePerMole: 1,
         
-        self.__megajoules_per_mole = None
+        MolarEnergyUnits.MegajoulePerMole: 2,
         
+    }
 
-    def convert(self, unit: MolarEnergyUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        MolarEnergyUnits.JoulePerMole: lambda value: (value),
+        
+        MolarEnergyUnits.KilojoulePerMole: lambda value: ((value) / 1000.0),
+        
+        MolarEnergyUnits.MegajoulePerMole: lambda value: ((value) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: MolarEnergyUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == MolarEnergyUnits.JoulePerMole:
-            return (value)
+        MolarEnergyUnits.JoulePerMole: lambda value: (value),
         
-        if from_unit == MolarEnergyUnits.KilojoulePerMole:
-            return ((value) / 1000.0)
+        MolarEnergyUnits.KilojoulePerMole: lambda value: ((value) * 1000.0),
         
-        if from_unit == MolarEnergyUnits.MegajoulePerMole:
-            return ((value) / 1000000.0)
+        MolarEnergyUnits.MegajoulePerMole: lambda value: ((value) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        MolarEnergyUnits.JoulePerMole: ('1', '0'),
+        
+        MolarEnergyUnits.KilojoulePerMole: ('1/1000', '0'),
+        
+        MolarEnergyUnits.MegajoulePerMole: ('1/1000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: MolarEnergyUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == MolarEnergyUnits.JoulePerMole:
-            return (value)
+        MolarEnergyUnits.JoulePerMole: ('1', '0'),
         
-        if to_unit == MolarEnergyUnits.KilojoulePerMole:
-            return ((value) * 1000.0)
+        MolarEnergyUnits.KilojoulePerMole: ('1000', '0'),
+        
+        MolarEnergyUnits.MegajoulePerMole: ('1000000', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == MolarEnergyUnits.MegajoulePerMole:
-            return ((value) * 1000000.0)
+        MolarEnergyUnits.JoulePerMole: ('J/mol',),
         
-        return None
+        MolarEnergyUnits.KilojoulePerMole: ('kJ/mol',),
+        
+        MolarEnergyUnits.MegajoulePerMole: ('MJ/mol',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: MolarEnergyUnits = MolarEnergyUnits.JoulePerMole):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: MolarEnergyUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: MolarEnergyUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: MolarEnergyUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: MolarEnergyUnits, to_unit: MolarEnergyUnits) -> float:
+        """
+        Convert a value from one MolarEnergy unit to another, without creating a MolarEnergy instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarEnergyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MolarEnergyUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return MolarEnergy._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: MolarEnergyUnits, to_unit: MolarEnergyUnits) -> List[float]:
+        """
+        Convert many values from one MolarEnergy unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: MolarEnergyUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: MolarEnergyUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return MolarEnergy._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: MolarEnergyUnits, to_unit: MolarEnergyUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", MolarEnergy._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: MolarEnergyUnits, to_unit: MolarEnergyUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one MolarEnergy unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarEnergyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MolarEnergyUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return MolarEnergy._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: MolarEnergyUnits = MolarEnergyUnits.JoulePerMole) -> MolarEnergy:
+        """
+        Create a new instance of MolarEnergy holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarEnergyUnits
+        :return: A new instance of MolarEnergy.
+        :rtype: MolarEnergy
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return MolarEnergy._from_exact(value, from_unit)
+
+    def to_exact(self, unit: MolarEnergyUnits = MolarEnergyUnits.JoulePerMole) -> Fraction:
+        """
+        Get the exact value of the MolarEnergy in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (JoulePerMole).
+        :type unit: MolarEnergyUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> MolarEnergy:
+        """
+        Parse a MolarEnergy from a value followed by a unit abbreviation, e.g. "1 J/mol".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of MolarEnergy.
+        :rtype: MolarEnergy
+        :raises ValueError: When the string is not a valid or an ambiguous MolarEnergy.
+        """
+        return MolarEnergy._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[MolarEnergy]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return MolarEnergy._try_parse(text)
 
+    def to_binary(self, unit: Optional[MolarEnergyUnits] = None) -> bytes:
+        """
+        Encode the MolarEnergy to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: MolarEnergyUnits
+        :return: The encoded MolarEnergy.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> MolarEnergy:
+        """
+        Decode a MolarEnergy encoded by to_binary.
+
+        :param data: The encoded MolarEnergy, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of MolarEnergy.
+        :rtype: MolarEnergy
+        :raises ValueError: When the data is not a valid encoded MolarEnergy.
+        """
+        return MolarEnergy._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[MolarEnergyUnits] = None) -> dict:
+        """
+        Get the MolarEnergy DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (JoulePerMole).
+        :type hold_in_unit: MolarEnergyUnits
+        :return: The MolarEnergy DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[MolarEnergyUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> MolarEnergy:
+        """
+        Create a new instance of MolarEnergy from its DTO.
+
+        :param dto: The MolarEnergy DTO, the unit is the MolarEnergyUnits value or name.
+        :type dto: dict
+        :return: A new instance of MolarEnergy.
+        :rtype: MolarEnergy
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return MolarEnergy._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> MolarEnergy:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return MolarEnergy._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -133,10 +363,7 @@ class MolarEnergy(AbstractMeasure):
         """
         
         """
-        if self.__joules_per_mole != None:
-            return self.__joules_per_mole
-        self.__joules_per_mole = self.__convert_from_base(MolarEnergyUnits.JoulePerMole)
-        return self.__joules_per_mole
+        return self._cached_convert(MolarEnergyUnits.JoulePerMole)
 
     
     @property
@@ -144,10 +371,7 @@ class MolarEnergy(AbstractMeasure):
         """
         
         """
-        if self.__kilojoules_per_mole != None:
-            return self.__kilojoules_per_mole
-        self.__kilojoules_per_mole = self.__convert_from_base(MolarEnergyUnits.KilojoulePerMole)
-        return self.__kilojoules_per_mole
+        return self._cached_convert(MolarEnergyUnits.KilojoulePerMole)
 
     
     @property
@@ -155,10 +379,7 @@ class MolarEnergy(AbstractMeasure):
         """
         
         """
-        if self.__megajoules_per_mole != None:
-            return self.__megajoules_per_mole
-        self.__megajoules_per_mole = self.__convert_from_base(MolarEnergyUnits.MegajoulePerMole)
-        return self.__megajoules_per_mole
+        return self._cached_convert(MolarEnergyUnits.MegajoulePerMole)
 
     
     def to_string(self, unit: MolarEnergyUnits = MolarEnergyUnits.JoulePerMole) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class MolarEntropyUnits(Enum):
         """
             MolarEntropyUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         JoulePerMoleKelvin = 'joule_per_mole_kelvin'
         """
@@ -34,49 +45,268 @@ class MolarEntropy(AbstractMeasure):
         value (float): The value.
         from_unit (MolarEntropyUnits): The MolarEntropy unit to create from, The default unit is JoulePerMoleKelvin
     """
-    def __init__(self, value: float, from_unit: MolarEntropyUnits = MolarEntropyUnits.JoulePerMoleKelvin):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = MolarEntropyUnits
+
+    _base_unit = MolarEntropyUnits.JoulePerMoleKelvin
+
+    _dimensions = (2, 1, -2, 0, -1, -1, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 71
+
+    _binary_unit_ids = {
         
-        self.__joules_per_mole_kelvin = None
+        MolarEntropyUnits.JoulePerMoleKelvin: 0,
         
-        self.__kilojoules_per_mole_kelvin = None
+        MolarEntropyUnits.KilojoulePerMoleKelvin: 1,
         
-        self.__megajoules_per_mole_kelvin = None
+        MolarEntropyUnits.MegajoulePerMoleKelvin: 2,
         
+    }
 
-    def convert(self, unit: MolarEntropyUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        MolarEntropyUnits.JoulePerMoleKelvin: lambda value: (value),
+        
+        MolarEntropyUnits.KilojoulePerMoleKelvin: lambda value: ((value) / 1000.0),
+        
+        MolarEntropyUnits.MegajoulePerMoleKelvin: lambda value: ((value) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: MolarEntropyUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == MolarEntropyUnits.JoulePerMoleKelvin:
-            return (value)
+        MolarEntropyUnits.JoulePerMoleKelvin: lambda value: (value),
         
-        if from_unit == MolarEntropyUnits.KilojoulePerMoleKelvin:
-            return ((value) / 1000.0)
+        MolarEntropyUnits.KilojoulePerMoleKelvin: lambda value: ((value) * 1000.0),
         
-        if from_unit == MolarEntropyUnits.MegajoulePerMoleKelvin:
-            return ((value) / 1000000.0)
+        MolarEntropyUnits.MegajoulePerMoleKelvin: lambda value: ((value) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        MolarEntropyUnits.JoulePerMoleKelvin: ('1', '0'),
+        
+        MolarEntropyUnits.KilojoulePerMoleKelvin: ('1/1000', '0'),
+        
+        MolarEntropyUnits.MegajoulePerMoleKelvin: ('1/1000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: MolarEntropyUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == MolarEntropyUnits.JoulePerMoleKelvin:
-            return (value)
+        MolarEntropyUnits.JoulePerMoleKelvin: ('1', '0'),
         
-        if to_unit == MolarEntropyUnits.KilojoulePerMoleKelvin:
-            return ((value) * 1000.0)
+        MolarEntropyUnits.KilojoulePerMoleKelvin: ('1000', '0'),
+        
+        MolarEntropyUnits.MegajoulePerMoleKelvin: ('1000000', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == MolarEntropyUnits.MegajoulePerMoleKelvin:
-            return ((value) * 1000000.0)
+        MolarEntropyUnits.JoulePerMoleKelvin: ('J/(mol*K)',),
         
-        return None
+        MolarEntropyUnits.KilojoulePerMoleKelvin: ('kJ/(mol*K)',),
+        
+        MolarEntropyUnits.MegajoulePerMoleKelvin: ('MJ/(mol*K)',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: MolarEntropyUnits = MolarEntropyUnits.JoulePerMoleKelvin):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: MolarEntropyUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: MolarEntropyUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: MolarEntropyUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: MolarEntropyUnits, to_unit: MolarEntropyUnits) -> float:
+        """
+        Convert a value from one MolarEntropy unit to another, without creating a MolarEntropy instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarEntropyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MolarEntropyUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return MolarEntropy._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: MolarEntropyUnits, to_unit: MolarEntropyUnits) -> List[float]:
+        """
+        Convert many values from one MolarEntropy unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: MolarEntropyUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: MolarEntropyUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return MolarEntropy._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: MolarEntropyUnits, to_unit: MolarEntropyUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", MolarEntropy._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: MolarEntropyUnits, to_unit: MolarEntropyUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one MolarEntropy unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarEntropyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MolarEntropyUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return MolarEntropy._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: MolarEntropyUnits = MolarEntropyUnits.JoulePerMoleKelvin) -> MolarEntropy:
+        """
+        Create a new instance of MolarEntropy holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarEntropyUnits
+        :return: A new instance of MolarEntropy.
+        :rtype: MolarEntropy
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return MolarEntropy._from_exact(value, from_unit)
+
+    def to_exact(self, unit: MolarEntropyUnits = MolarEntropyUnits.JoulePerMoleKelvin) -> Fraction:
+        """
+        Get the exact value of the MolarEntropy in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (JoulePerMoleKelvin).
+        :type unit: MolarEntropyUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> MolarEntropy:
+        """
+        Parse a MolarEntropy from a value followed by a unit abbreviation, e.g. "1 J/(mol*K)".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of MolarEntropy.
+        :rtype: MolarEntropy
+        :raises ValueError: When the string is not a valid or an ambiguous MolarEntropy.
+        """
+        return MolarEntropy._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[MolarEntropy]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return MolarEntropy._try_parse(text)
 
+    def to_binary(self, unit: Optional[MolarEntropyUnits] = None) -> bytes:
+        """
+        Encode the MolarEntropy to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: MolarEntropyUnits
+        :return: The encoded MolarEntropy.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> MolarEntropy:
+        """
+        Decode a MolarEntropy encoded by to_binary.
+
+        :param data: The encoded MolarEntropy, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of MolarEntropy.
+        :rtype: MolarEntropy
+        :raises ValueError: When the data is not a valid encoded MolarEntropy.
+        """
+        return MolarEntropy._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[MolarEntropyUnits] = None) -> dict:
+        """
+        Get the MolarEntropy DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (JoulePerMoleKelvin).
+        :type hold_in_unit: MolarEntropyUnits
+        :return: The MolarEntropy DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[MolarEntropyUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> MolarEntropy:
+        """
+        Create a new instance of MolarEntropy from its DTO.
+
+        :param dto: The MolarEntropy DTO, the unit is the MolarEntropyUnits value or name.
+        :type dto: dict
+        :return: A new instance of MolarEntropy.
+        :rtype: MolarEntropy
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return MolarEntropy._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> MolarEntropy:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return MolarEntropy._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -133,10 +363,7 @@ class MolarEntropy(AbstractMeasure):
         """
         
         """
-        if self.__joules_per_mole_kelvin != None:
-            return self.__joules_per_mole_kelvin
-        self.__joules_per_mole_kelvin = self.__convert_from_base(MolarEntropyUnits.JoulePerMoleKelvin)
-        return self.__joules_per_mole_kelvin
+        return self._cached_convert(MolarEntropyUnits.JoulePerMoleKelvin)
 
     
     @property
@@ -144,10 +371,7 @@ class MolarEntropy(AbstractMeasure):
         """
         
         """
-        if self.__kilojoules_per_mole_kelvin != None:
-            return self.__kilojoules_per_mole_kelvin
-        self.__kilojoules_per_mole_kelvin = self.__convert_from_base(MolarEntropyUnits.KilojoulePerMoleKelvin)
-        return self.__kilojoules_per_mole_kelvin
+        return self._cached_convert(MolarEntropyUnits.KilojoulePerMoleKelvin)
 
     
     @property
@@ -155,10 +379,7 @@ class MolarEntropy(AbstractMeasure):
         """
         
         """
-        if self.__megajoules_per_mole_kelvin != None:
-            return self.__megajoules_per_mole_kelvin
-        self.__megajoules_per_mole_kelvin = self.__convert_from_base(MolarEntropyUnits.MegajoulePerMoleKelvin)
-        return self.__megajoules_per_mole_kelvin
+        return self._cached_convert(MolarEntropyUnits.MegajoulePerMoleKelvin)
 
     
     def to_string(self, unit: MolarEntropyUnits = MolarEntropyUnits.JoulePerMoleKelvin) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class MolarFlowUnits(Enum):
         """
             MolarFlowUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         MolePerSecond = 'mole_per_second'
         """
@@ -64,97 +75,340 @@ class MolarFlow(AbstractMeasure):
         value (float): The value.
         from_unit (MolarFlowUnits): The MolarFlow unit to create from, The default unit is MolePerSecond
     """
-    def __init__(self, value: float, from_unit: MolarFlowUnits = MolarFlowUnits.MolePerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = MolarFlowUnits
+
+    _base_unit = MolarFlowUnits.MolePerSecond
+
+    _dimensions = (0, 0, -1, 0, 0, 1, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 72
+
+    _binary_unit_ids = {
         
-        self.__moles_per_second = None
+        MolarFlowUnits.MolePerSecond: 0,
         
-        self.__moles_per_minute = None
+        MolarFlowUnits.MolePerMinute: 1,
         
-        self.__moles_per_hour = None
+        MolarFlowUnits.MolePerHour: 2,
         
-        self.__pound_moles_per_second = None
+        MolarFlowUnits.PoundMolePerSecond: 3,
         
-        self.__pound_moles_per_minute = None
+        MolarFlowUnits.PoundMolePerMinute: 4,
         
-        self.__pound_moles_per_hour = None
+        MolarFlowUnits.PoundMolePerHour: 5,
         
-        self.__kilomoles_per_second = None
+        MolarFlowUnits.KilomolePerSecond: 6,
         
-        self.__kilomoles_per_minute = None
+        MolarFlowUnits.KilomolePerMinute: 7,
         
-        self.__kilomoles_per_hour = None
+        MolarFlowUnits.KilomolePerHour: 8,
         
+    }
 
-    def convert(self, unit: MolarFlowUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        MolarFlowUnits.MolePerSecond: lambda value: (value),
+        
+        MolarFlowUnits.MolePerMinute: lambda value: (value * 60),
+        
+        MolarFlowUnits.MolePerHour: lambda value: (value * 3600),
+        
+        MolarFlowUnits.PoundMolePerSecond: lambda value: (value / 453.59237),
+        
+        MolarFlowUnits.PoundMolePerMinute: lambda value: ((value / 453.59237) * 60),
+        
+        MolarFlowUnits.PoundMolePerHour: lambda value: ((value / 453.59237) * 3600),
+        
+        MolarFlowUnits.KilomolePerSecond: lambda value: ((value) / 1000.0),
+        
+        MolarFlowUnits.KilomolePerMinute: lambda value: ((value * 60) / 1000.0),
+        
+        MolarFlowUnits.KilomolePerHour: lambda value: ((value * 3600) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: MolarFlowUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        MolarFlowUnits.MolePerSecond: lambda value: (value),
+        
+        MolarFlowUnits.MolePerMinute: lambda value: (value / 60),
+        
+        MolarFlowUnits.MolePerHour: lambda value: (value / 3600),
+        
+        MolarFlowUnits.PoundMolePerSecond: lambda value: (value * 453.59237),
+        
+        MolarFlowUnits.PoundMolePerMinute: lambda value: ((value * 453.59237) / 60),
+        
+        MolarFlowUnits.PoundMolePerHour: lambda value: ((value * 453.59237) / 3600),
         
-        if from_unit == MolarFlowUnits.MolePerSecond:
-            return (value)
+        MolarFlowUnits.KilomolePerSecond: lambda value: ((value) * 1000.0),
         
-        if from_unit == MolarFlowUnits.MolePerMinute:
-            return (value * 60)
+        MolarFlowUnits.KilomolePerMinute: lambda value: ((value / 60) * 1000.0),
         
-        if from_unit == MolarFlowUnits.MolePerHour:
-            return (value * 3600)
+        MolarFlowUnits.KilomolePerHour: lambda value: ((value / 3600) * 1000.0),
         
-        if from_unit == MolarFlowUnits.PoundMolePerSecond:
-            return (value / 453.59237)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        MolarFlowUnits.MolePerSecond: ('1', '0'),
+        
+        MolarFlowUnits.MolePerMinute: ('60', '0'),
+        
+        MolarFlowUnits.MolePerHour: ('3600', '0'),
+        
+        MolarFlowUnits.PoundMolePerSecond: ('100000/45359237', '0'),
         
-        if from_unit == MolarFlowUnits.PoundMolePerMinute:
-            return ((value / 453.59237) * 60)
+        MolarFlowUnits.PoundMolePerMinute: ('6000000/45359237', '0'),
         
-        if from_unit == MolarFlowUnits.PoundMolePerHour:
-            return ((value / 453.59237) * 3600)
+        MolarFlowUnits.PoundMolePerHour: ('360000000/45359237', '0'),
         
-        if from_unit == MolarFlowUnits.KilomolePerSecond:
-            return ((value) / 1000.0)
+        MolarFlowUnits.KilomolePerSecond: ('1/1000', '0'),
         
-        if from_unit == MolarFlowUnits.KilomolePerMinute:
-            return ((value * 60) / 1000.0)
+        MolarFlowUnits.KilomolePerMinute: ('3/50', '0'),
         
-        if from_unit == MolarFlowUnits.KilomolePerHour:
-            return ((value * 3600) / 1000.0)
+        MolarFlowUnits.KilomolePerHour: ('18/5', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        MolarFlowUnits.MolePerSecond: ('1', '0'),
+        
+        MolarFlowUnits.MolePerMinute: ('1/60', '0'),
+        
+        MolarFlowUnits.MolePerHour: ('1/3600', '0'),
+        
+        MolarFlowUnits.PoundMolePerSecond: ('45359237/100000', '0'),
+        
+        MolarFlowUnits.PoundMolePerMinute: ('45359237/6000000', '0'),
+        
+        MolarFlowUnits.PoundMolePerHour: ('45359237/360000000', '0'),
+        
+        MolarFlowUnits.KilomolePerSecond: ('1000', '0'),
+        
+        MolarFlowUnits.KilomolePerMinute: ('50/3', '0'),
+        
+        MolarFlowUnits.KilomolePerHour: ('5/18', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: MolarFlowUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == MolarFlowUnits.MolePerSecond:
-            return (value)
+        MolarFlowUnits.MolePerSecond: ('mol/s',),
         
-        if to_unit == MolarFlowUnits.MolePerMinute:
-            return (value / 60)
+        MolarFlowUnits.MolePerMinute: ('mol/min',),
         
-        if to_unit == MolarFlowUnits.MolePerHour:
-            return (value / 3600)
+        MolarFlowUnits.MolePerHour: ('kmol/h',),
         
-        if to_unit == MolarFlowUnits.PoundMolePerSecond:
-            return (value * 453.59237)
+        MolarFlowUnits.PoundMolePerSecond: ('lbmol/s',),
         
-        if to_unit == MolarFlowUnits.PoundMolePerMinute:
-            return ((value * 453.59237) / 60)
+        MolarFlowUnits.PoundMolePerMinute: ('lbmol/min',),
         
-        if to_unit == MolarFlowUnits.PoundMolePerHour:
-            return ((value * 453.59237) / 3600)
+        MolarFlowUnits.PoundMolePerHour: ('lbmol/h',),
         
-        if to_unit == MolarFlowUnits.KilomolePerSecond:
-            return ((value) * 1000.0)
+        MolarFlowUnits.KilomolePerSecond: ('kmol/s',),
         
-        if to_unit == MolarFlowUnits.KilomolePerMinute:
-            return ((value / 60) * 1000.0)
+        MolarFlowUnits.KilomolePerMinute: ('kmol/min',),
         
-        if to_unit == MolarFlowUnits.KilomolePerHour:
-            return ((value / 3600) * 1000.0)
+        MolarFlowUnits.KilomolePerHour: ('kkmol/h',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: MolarFlowUnits = MolarFlowUnits.MolePerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: MolarFlowUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: MolarFlowUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: MolarFlowUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: MolarFlowUnits, to_unit: MolarFlowUnits) -> float:
+        """
+        Convert a value from one MolarFlow unit to another, without creating a MolarFlow instance.
 
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarFlowUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MolarFlowUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return MolarFlow._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: MolarFlowUnits, to_unit: MolarFlowUnits) -> List[float]:
+        """
+        Convert many values from one MolarFlow unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: MolarFlowUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: MolarFlowUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return MolarFlow._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: MolarFlowUnits, to_unit: MolarFlowUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", MolarFlow._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: MolarFlowUnits, to_unit: MolarFlowUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one MolarFlow unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarFlowUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MolarFlowUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return MolarFlow._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: MolarFlowUnits = MolarFlowUnits.MolePerSecond) -> MolarFlow:
+        """
+        Create a new instance of MolarFlow holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarFlowUnits
+        :return: A new instance of MolarFlow.
+        :rtype: MolarFlow
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return MolarFlow._from_exact(value, from_unit)
+
+    def to_exact(self, unit: MolarFlowUnits = MolarFlowUnits.MolePerSecond) -> Fraction:
+        """
+        Get the exact value of the MolarFlow in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (MolePerSecond).
+        :type unit: MolarFlowUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> MolarFlow:
+        """
+        Parse a MolarFlow from a value followed by a unit abbreviation, e.g. "1 mol/s".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of MolarFlow.
+        :rtype: MolarFlow
+        :raises ValueError: When the string is not a valid or an ambiguous MolarFlow.
+        """
+        return MolarFlow._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[MolarFlow]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return MolarFlow._try_parse(text)
+
+    def to_binary(self, unit: Optional[MolarFlowUnits] = None) -> bytes:
+        """
+        Encode the MolarFlow to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: MolarFlowUnits
+        :return: The encoded MolarFlow.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> MolarFlow:
+        """
+        Decode a MolarFlow encoded by to_binary.
+
+        :param data: The encoded MolarFlow, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of MolarFlow.
+        :rtype: MolarFlow
+        :raises ValueError: When the data is not a valid encoded MolarFlow.
+        """
+        return MolarFlow._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[MolarFlowUnits] = None) -> dict:
+        """
+        Get the MolarFlow DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (MolePerSecond).
+        :type hold_in_unit: MolarFlowUnits
+        :return: The MolarFlow DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[MolarFlowUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> MolarFlow:
+        """
+        Create a new instance of MolarFlow from its DTO.
+
+        :param dto: The MolarFlow DTO, the unit is the MolarFlowUnits value or name.
+        :type dto: dict
+        :return: A new instance of MolarFlow.
+        :rtype: MolarFlow
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return MolarFlow._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> MolarFlow:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return MolarFlow._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -301,10 +555,7 @@ class MolarFlow(AbstractMeasure):
         """
         
         """
-        if self.__moles_per_second != None:
-            return self.__moles_per_second
-        self.__moles_per_second = self.__convert_from_base(MolarFlowUnits.MolePerSecond)
-        return self.__moles_per_second
+        return self._cached_convert(MolarFlowUnits.MolePerSecond)
 
     
     @property
@@ -312,10 +563,7 @@ class MolarFlow(AbstractMeasure):
         """
         
         """
-        if self.__moles_per_minute != None:
-            return self.__moles_per_minute
-        self.__moles_per_minute = self.__convert_from_base(MolarFlowUnits.MolePerMinute)
-        return self.__moles_per_minute
+        return self._cached_convert(MolarFlowUnits.MolePerMinute)
 
     
     @property
@@ -323,10 +571,7 @@ class MolarFlow(AbstractMeasure):
         """
         
         """
-        if self.__moles_per_hour != None:
-            return self.__moles_per_hour
-        self.__moles_per_hour = self.__convert_from_base(MolarFlowUnits.MolePerHour)
-        return self.__moles_per_hour
+        return self._cached_convert(MolarFlowUnits.MolePerHour)
 
     
     @property
@@ -334,10 +579,7 @@ class MolarFlow(AbstractMeasure):
         """
         
         """
-        if self.__pound_moles_per_second != None:
-            return self.__pound_moles_per_second
-        self.__pound_moles_per_second = self.__convert_from_base(MolarFlowUnits.PoundMolePerSecond)
-        return self.__pound_moles_per_second
+        return self._cached_convert(MolarFlowUnits.PoundMolePerSecond)
 
     
     @property
@@ -345,10 +587,7 @@ class MolarFlow(AbstractMeasure):
         """
         
         """
-        if self.__pound_moles_per_minute != None:
-            return self.__pound_moles_per_minute
-        self.__pound_moles_per_minute = self.__convert_from_base(MolarFlowUnits.PoundMolePerMinute)
-        return self.__pound_moles_per_minute
+        return self._cached_convert(MolarFlowUnits.PoundMolePerMinute)
 
     
     @property
@@ -356,10 +595,7 @@ class MolarFlow(AbstractMeasure):
         """
         
         """
-        if self.__pound_moles_per_hour != None:
-            return self.__pound_moles_per_hour
-        self.__pound_moles_per_hour = self.__convert_from_base(MolarFlowUnits.PoundMolePerHour)
-        return self.__pound_moles_per_hour
+        return self._cached_convert(MolarFlowUnits.PoundMolePerHour)
 
     
     @property
@@ -367,10 +603,7 @@ class MolarFlow(AbstractMeasure):
         """
         
         """
-        if self.__kilomoles_per_second != None:
-            return self.__kilomoles_per_second
-        self.__kilomoles_per_second = self.__convert_from_base(MolarFlowUnits.KilomolePerSecond)
-        return self.__kilomoles_per_second
+        return self._cached_convert(MolarFlowUnits.KilomolePerSecond)
 
     
     @property
@@ -378,10 +611,7 @@ class MolarFlow(AbstractMeasure):
         """
         
         """
-        if self.__kilomoles_per_minute != None:
-            return self.__kilomoles_per_minute
-        self.__kilomoles_per_minute = self.__convert_from_base(MolarFlowUnits.KilomolePerMinute)
-        return self.__kilomoles_per_minute
+        return self._cached_convert(MolarFlowUnits.KilomolePerMinute)
 
     
     @property
@@ -389,10 +619,7 @@ class MolarFlow(AbstractMeasure):
         """
         
         """
-        if self.__kilomoles_per_hour != None:
-            return self.__kilomoles_per_hour
-        self.__kilomoles_per_hour = self.__convert_from_base(MolarFlowUnits.KilomolePerHour)
-        return self.__kilomoles_per_hour
+        return self._cached_convert(MolarFlowUnits.KilomolePerHour)
 
     
     def to_string(self, unit: MolarFlowUnits = MolarFlowUnits.MolePerSecond) -> str:
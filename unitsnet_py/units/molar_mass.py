@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class MolarMassUnits(Enum):
         """
             MolarMassUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         GramPerMole = 'gram_per_mole'
         """
@@ -84,129 +95,388 @@ class MolarMass(AbstractMeasure):
         value (float): The value.
         from_unit (MolarMassUnits): The MolarMass unit to create from, The default unit is KilogramPerMole
     """
-    def __init__(self, value: float, from_unit: MolarMassUnits = MolarMassUnits.KilogramPerMole):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = MolarMassUnits
+
+    _base_unit = MolarMassUnits.KilogramPerMole
+
+    _dimensions = (0, 1, 0, 0, 0, -1, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 73
+
+    _binary_unit_ids = {
         
-        self.__grams_per_mole = None
+        MolarMassUnits.GramPerMole: 0,
         
-        self.__kilograms_per_kilomole = None
+        MolarMassUnits.KilogramPerKilomole: 1,
         
-        self.__pounds_per_mole = None
+        MolarMassUnits.PoundPerMole: 2,
         
-        self.__nanograms_per_mole = None
+        MolarMassUnits.NanogramPerMole: 3,
         
-        self.__micrograms_per_mole = None
+        MolarMassUnits.MicrogramPerMole: 4,
         
-        self.__milligrams_per_mole = None
+        MolarMassUnits.MilligramPerMole: 5,
         
-        self.__centigrams_per_mole = None
+        MolarMassUnits.CentigramPerMole: 6,
         
-        self.__decigrams_per_mole = None
+        MolarMassUnits.DecigramPerMole: 7,
         
-        self.__decagrams_per_mole = None
+        MolarMassUnits.DecagramPerMole: 8,
         
-        self.__hectograms_per_mole = None
+        MolarMassUnits.HectogramPerMole: 9,
         
-        self.__kilograms_per_mole = None
+        MolarMassUnits.KilogramPerMole: 10,
         
-        self.__kilopounds_per_mole = None
+        MolarMassUnits.KilopoundPerMole: 11,
         
-        self.__megapounds_per_mole = None
+        MolarMassUnits.MegapoundPerMole: 12,
         
+    }
 
-    def convert(self, unit: MolarMassUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        MolarMassUnits.GramPerMole: lambda value: (value * 1e3),
+        
+        MolarMassUnits.KilogramPerKilomole: lambda value: (value * 1e3),
+        
+        MolarMassUnits.PoundPerMole: lambda value: (value / 0.45359237),
+        
+        MolarMassUnits.NanogramPerMole: lambda value: ((value * 1e3) / 1e-09),
+        
+        MolarMassUnits.MicrogramPerMole: lambda value: ((value * 1e3) / 1e-06),
+        
+        MolarMassUnits.MilligramPerMole: lambda value: ((value * 1e3) / 0.001),
+        
+        MolarMassUnits.CentigramPerMole: lambda value: ((value * 1e3) / 0.01),
+        
+        MolarMassUnits.DecigramPerMole: lambda value: ((value * 1e3) / 0.1),
+        
+        MolarMassUnits.DecagramPerMole: lambda value: ((value * 1e3) / 10.0),
+        
+        MolarMassUnits.HectogramPerMole: lambda value: ((value * 1e3) / 100.0),
+        
+        MolarMassUnits.KilogramPerMole: lambda value: ((value * 1e3) / 1000.0),
+        
+        MolarMassUnits.KilopoundPerMole: lambda value: ((value / 0.45359237) / 1000.0),
+        
+        MolarMassUnits.MegapoundPerMole: lambda value: ((value / 0.45359237) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: MolarMassUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        MolarMassUnits.GramPerMole: lambda value: (value / 1e3),
+        
+        MolarMassUnits.KilogramPerKilomole: lambda value: (value / 1e3),
+        
+        MolarMassUnits.PoundPerMole: lambda value: (value * 0.45359237),
+        
+        MolarMassUnits.NanogramPerMole: lambda value: ((value / 1e3) * 1e-09),
+        
+        MolarMassUnits.MicrogramPerMole: lambda value: ((value / 1e3) * 1e-06),
         
-        if from_unit == MolarMassUnits.GramPerMole:
-            return (value * 1e3)
+        MolarMassUnits.MilligramPerMole: lambda value: ((value / 1e3) * 0.001),
         
-        if from_unit == MolarMassUnits.KilogramPerKilomole:
-            return (value * 1e3)
+        MolarMassUnits.CentigramPerMole: lambda value: ((value / 1e3) * 0.01),
         
-        if from_unit == MolarMassUnits.PoundPerMole:
-            return (value / 0.45359237)
+        MolarMassUnits.DecigramPerMole: lambda value: ((value / 1e3) * 0.1),
         
-        if from_unit == MolarMassUnits.NanogramPerMole:
-            return ((value * 1e3) / 1e-09)
+        MolarMassUnits.DecagramPerMole: lambda value: ((value / 1e3) * 10.0),
         
-        if from_unit == MolarMassUnits.MicrogramPerMole:
-            return ((value * 1e3) / 1e-06)
+        MolarMassUnits.HectogramPerMole: lambda value: ((value / 1e3) * 100.0),
         
-        if from_unit == MolarMassUnits.MilligramPerMole:
-            return ((value * 1e3) / 0.001)
+        MolarMassUnits.KilogramPerMole: lambda value: ((value / 1e3) * 1000.0),
         
-        if from_unit == MolarMassUnits.CentigramPerMole:
-            return ((value * 1e3) / 0.01)
+        MolarMassUnits.KilopoundPerMole: lambda value: ((value * 0.45359237) * 1000.0),
         
-        if from_unit == MolarMassUnits.DecigramPerMole:
-            return ((value * 1e3) / 0.1)
+        MolarMassUnits.MegapoundPerMole: lambda value: ((value * 0.45359237) * 1000000.0),
         
-        if from_unit == MolarMassUnits.DecagramPerMole:
-            return ((value * 1e3) / 10.0)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        MolarMassUnits.GramPerMole: ('1000', '0'),
+        
+        MolarMassUnits.KilogramPerKilomole: ('1000', '0'),
+        
+        MolarMassUnits.PoundPerMole: ('100000000/45359237', '0'),
+        
+        MolarMassUnits.NanogramPerMole: ('1000000000000', '0'),
+        
+        MolarMassUnits.MicrogramPerMole: ('1000000000', '0'),
+        
+        MolarMassUnits.MilligramPerMole: ('1000000', '0'),
+        
+        MolarMassUnits.CentigramPerMole: ('100000', '0'),
+        
+        MolarMassUnits.DecigramPerMole: ('10000', '0'),
         
-        if from_unit == MolarMassUnits.HectogramPerMole:
-            return ((value * 1e3) / 100.0)
+        MolarMassUnits.DecagramPerMole: ('100', '0'),
         
-        if from_unit == MolarMassUnits.KilogramPerMole:
-            return ((value * 1e3) / 1000.0)
+        MolarMassUnits.HectogramPerMole: ('10', '0'),
         
-        if from_unit == MolarMassUnits.KilopoundPerMole:
-            return ((value / 0.45359237) / 1000.0)
+        MolarMassUnits.KilogramPerMole: ('1', '0'),
         
-        if from_unit == MolarMassUnits.MegapoundPerMole:
-            return ((value / 0.45359237) / 1000000.0)
+        MolarMassUnits.KilopoundPerMole: ('100000/45359237', '0'),
         
-        return None
+        MolarMassUnits.MegapoundPerMole: ('100/45359237', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        MolarMassUnits.GramPerMole: ('1/1000', '0'),
+        
+        MolarMassUnits.KilogramPerKilomole: ('1/1000', '0'),
+        
+        MolarMassUnits.PoundPerMole: ('45359237/100000000', '0'),
+        
+        MolarMassUnits.NanogramPerMole: ('1/1000000000000', '0'),
+        
+        MolarMassUnits.MicrogramPerMole: ('1/1000000000', '0'),
+        
+        MolarMassUnits.MilligramPerMole: ('1/1000000', '0'),
+        
+        MolarMassUnits.CentigramPerMole: ('1/100000', '0'),
+        
+        MolarMassUnits.DecigramPerMole: ('1/10000', '0'),
+        
+        MolarMassUnits.DecagramPerMole: ('1/100', '0'),
+        
+        MolarMassUnits.HectogramPerMole: ('1/10', '0'),
+        
+        MolarMassUnits.KilogramPerMole: ('1', '0'),
+        
+        MolarMassUnits.KilopoundPerMole: ('45359237/100000', '0'),
+        
+        MolarMassUnits.MegapoundPerMole: ('45359237/100', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: MolarMassUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == MolarMassUnits.GramPerMole:
-            return (value / 1e3)
+        MolarMassUnits.GramPerMole: ('g/mol',),
         
-        if to_unit == MolarMassUnits.KilogramPerKilomole:
-            return (value / 1e3)
+        MolarMassUnits.KilogramPerKilomole: ('kg/kmol',),
         
-        if to_unit == MolarMassUnits.PoundPerMole:
-            return (value * 0.45359237)
+        MolarMassUnits.PoundPerMole: ('lb/mol',),
         
-        if to_unit == MolarMassUnits.NanogramPerMole:
-            return ((value / 1e3) * 1e-09)
+        MolarMassUnits.NanogramPerMole: ('ng/mol',),
         
-        if to_unit == MolarMassUnits.MicrogramPerMole:
-            return ((value / 1e3) * 1e-06)
+        MolarMassUnits.MicrogramPerMole: ('μg/mol',),
         
-        if to_unit == MolarMassUnits.MilligramPerMole:
-            return ((value / 1e3) * 0.001)
+        MolarMassUnits.MilligramPerMole: ('mg/mol',),
         
-        if to_unit == MolarMassUnits.CentigramPerMole:
-            return ((value / 1e3) * 0.01)
+        MolarMassUnits.CentigramPerMole: ('cg/mol',),
         
-        if to_unit == MolarMassUnits.DecigramPerMole:
-            return ((value / 1e3) * 0.1)
+        MolarMassUnits.DecigramPerMole: ('dg/mol',),
         
-        if to_unit == MolarMassUnits.DecagramPerMole:
-            return ((value / 1e3) * 10.0)
+        MolarMassUnits.DecagramPerMole: ('dag/mol',),
         
-        if to_unit == MolarMassUnits.HectogramPerMole:
-            return ((value / 1e3) * 100.0)
+        MolarMassUnits.HectogramPerMole: ('hg/mol',),
         
-        if to_unit == MolarMassUnits.KilogramPerMole:
-            return ((value / 1e3) * 1000.0)
+        MolarMassUnits.KilogramPerMole: ('kg/mol',),
         
-        if to_unit == MolarMassUnits.KilopoundPerMole:
-            return ((value * 0.45359237) * 1000.0)
+        MolarMassUnits.KilopoundPerMole: ('klb/mol',),
         
-        if to_unit == MolarMassUnits.MegapoundPerMole:
-            return ((value * 0.45359237) * 1000000.0)
+        MolarMassUnits.MegapoundPerMole: ('Mlb/mol',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: MolarMassUnits = MolarMassUnits.KilogramPerMole):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: MolarMassUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: MolarMassUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
 
+    def __convert_to_base(self, value: float, to_unit: MolarMassUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: MolarMassUnits, to_unit: MolarMassUnits) -> float:
+        """
+        Convert a value from one MolarMass unit to another, without creating a MolarMass instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarMassUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MolarMassUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return MolarMass._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: MolarMassUnits, to_unit: MolarMassUnits) -> List[float]:
+        """
+        Convert many values from one MolarMass unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: MolarMassUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: MolarMassUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return MolarMass._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: MolarMassUnits, to_unit: MolarMassUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", MolarMass._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: MolarMassUnits, to_unit: MolarMassUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one MolarMass unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarMassUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MolarMassUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return MolarMass._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: MolarMassUnits = MolarMassUnits.KilogramPerMole) -> MolarMass:
+        """
+        Create a new instance of MolarMass holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarMassUnits
+        :return: A new instance of MolarMass.
+        :rtype: MolarMass
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return MolarMass._from_exact(value, from_unit)
+
+    def to_exact(self, unit: MolarMassUnits = MolarMassUnits.KilogramPerMole) -> Fraction:
+        """
+        Get the exact value of the MolarMass in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (KilogramPerMole).
+        :type unit: MolarMassUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> MolarMass:
+        """
+        Parse a MolarMass from a value followed by a unit abbreviation, e.g. "1 g/mol".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of MolarMass.
+        :rtype: MolarMass
+        :raises ValueError: When the string is not a valid or an ambiguous MolarMass.
+        """
+        return MolarMass._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[MolarMass]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return MolarMass._try_parse(text)
+
+    def to_binary(self, unit: Optional[MolarMassUnits] = None) -> bytes:
+        """
+        Encode the MolarMass to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: MolarMassUnits
+        :return: The encoded MolarMass.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> MolarMass:
+        """
+        Decode a MolarMass encoded by to_binary.
+
+        :param data: The encoded MolarMass, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of MolarMass.
+        :rtype: MolarMass
+        :raises ValueError: When the data is not a valid encoded MolarMass.
+        """
+        return MolarMass._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[MolarMassUnits] = None) -> dict:
+        """
+        Get the MolarMass DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (KilogramPerMole).
+        :type hold_in_unit: MolarMassUnits
+        :return: The MolarMass DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[MolarMassUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> MolarMass:
+        """
+        Create a new instance of MolarMass from its DTO.
+
+        :param dto: The MolarMass DTO, the unit is the MolarMassUnits value or name.
+        :type dto: dict
+        :return: A new instance of MolarMass.
+        :rtype: MolarMass
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return MolarMass._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> MolarMass:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return MolarMass._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -413,10 +683,7 @@ class MolarMass(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_mole != None:
-            return self.__grams_per_mole
-        self.__grams_per_mole = self.__convert_from_base(MolarMassUnits.GramPerMole)
-        return self.__grams_per_mole
+        return self._cached_convert(MolarMassUnits.GramPerMole)
 
     
     @property
@@ -424,10 +691,7 @@ class MolarMass(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_kilomole != None:
-            return self.__kilograms_per_kilomole
-        self.__kilograms_per_kilomole = self.__convert_from_base(MolarMassUnits.KilogramPerKilomole)
-        return self.__kilograms_per_kilomole
+        return self._cached_convert(MolarMassUnits.KilogramPerKilomole)
 
     
     @property
@@ -435,10 +699,7 @@ class MolarMass(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_mole != None:
-            return self.__pounds_per_mole
-        self.__pounds_per_mole = self.__convert_from_base(MolarMassUnits.PoundPerMole)
-        return self.__pounds_per_mole
+        return self._cached_convert(MolarMassUnits.PoundPerMole)
 
     
     @property
@@ -446,10 +707,7 @@ class MolarMass(AbstractMeasure):
         """
         
         """
-        if self.__nanograms_per_mole != None:
-            return self.__nanograms_per_mole
-        self.__nanograms_per_mole = self.__convert_from_base(MolarMassUnits.NanogramPerMole)
-        return self.__nanograms_per_mole
+        return self._cached_convert(MolarMassUnits.NanogramPerMole)
 
     
     @property
@@ -457,10 +715,7 @@ class MolarMass(AbstractMeasure):
         """
         
         """
-        if self.__micrograms_per_mole != None:
-            return self.__micrograms_per_mole
-        self.__micrograms_per_mole = self.__convert_from_base(MolarMassUnits.MicrogramPerMole)
-        return self.__micrograms_per_mole
+        return self._cached_convert(MolarMassUnits.MicrogramPerMole)
 
     
     @property
@@ -468,10 +723,7 @@ class MolarMass(AbstractMeasure):
         """
         
         """
-        if self.__milligrams_per_mole != None:
-            return self.__milligrams_per_mole
-        self.__milligrams_per_mole = self.__convert_from_base(MolarMassUnits.MilligramPerMole)
-        return self.__milligrams_per_mole
+        return self._cached_convert(MolarMassUnits.MilligramPerMole)
 
     
     @property
@@ -479,10 +731,7 @@ class MolarMass(AbstractMeasure):
         """
         
         """
-        if self.__centigrams_per_mole != None:
-            return self.__centigrams_per_mole
-        self.__centigrams_per_mole = self.__convert_from_base(MolarMassUnits.CentigramPerMole)
-        return self.__centigrams_per_mole
+        return self._cached_convert(MolarMassUnits.CentigramPerMole)
 
     
     @property
@@ -490,10 +739,7 @@ class MolarMass(AbstractMeasure):
         """
         
         """
-        if self.__decigrams_per_mole != None:
-            return self.__decigrams_per_mole
-        self.__decigrams_per_mole = self.__convert_from_base(MolarMassUnits.DecigramPerMole)
-        return self.__decigrams_per_mole
+        return self._cached_convert(MolarMassUnits.DecigramPerMole)
 
     
     @property
@@ -501,10 +747,7 @@ class MolarMass(AbstractMeasure):
         """
         
         """
-        if self.__decagrams_per_mole != None:
-            return self.__decagrams_per_mole
-        self.__decagrams_per_mole = self.__convert_from_base(MolarMassUnits.DecagramPerMole)
-        return self.__decagrams_per_mole
+        return self._cached_convert(MolarMassUnits.DecagramPerMole)
 
     
     @property
@@ -512,10 +755,7 @@ class MolarMass(AbstractMeasure):
         """
         
         """
-        if self.__hectograms_per_mole != None:
-            return self.__hectograms_per_mole
-        self.__hectograms_per_mole = self.__convert_from_base(MolarMassUnits.HectogramPerMole)
-        return self.__hectograms_per_mole
+        return self._cached_convert(MolarMassUnits.HectogramPerMole)
 
     
     @property
@@ -523,10 +763,7 @@ class MolarMass(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_mole != None:
-            return self.__kilograms_per_mole
-        self.__kilograms_per_mole = self.__convert_from_base(MolarMassUnits.KilogramPerMole)
-        return self.__kilograms_per_mole
+        return self._cached_convert(MolarMassUnits.KilogramPerMole)
 
     
     @property
@@ -534,10 +771,7 @@ class MolarMass(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_per_mole != None:
-            return self.__kilopounds_per_mole
-        self.__kilopounds_per_mole = self.__convert_from_base(MolarMassUnits.KilopoundPerMole)
-        return self.__kilopounds_per_mole
+        return self._cached_convert(MolarMassUnits.KilopoundPerMole)
 
     
     @property
@@ -545,10 +779,7 @@ class MolarMass(AbstractMeasure):
         """
         
         """
-        if self.__megapounds_per_mole != None:
-            return self.__megapounds_per_mole
-        self.__megapounds_per_mole = self.__convert_from_base(MolarMassUnits.MegapoundPerMole)
-        return self.__megapounds_per_mole
+        return self._cached_convert(MolarMassUnits.MegapoundPerMole)
 
     
     def to_string(self, unit: MolarMassUnits = MolarMassUnits.KilogramPerMole) -> str:
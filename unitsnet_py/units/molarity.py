@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class MolarityUnits(Enum):
         """
             MolarityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         MolePerCubicMeter = 'mole_per_cubic_meter'
         """
@@ -74,113 +85,364 @@ class Molarity(AbstractMeasure):
         value (float): The value.
         from_unit (MolarityUnits): The Molarity unit to create from, The default unit is MolePerCubicMeter
     """
-    def __init__(self, value: float, from_unit: MolarityUnits = MolarityUnits.MolePerCubicMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = MolarityUnits
+
+    _base_unit = MolarityUnits.MolePerCubicMeter
+
+    _dimensions = (-3, 0, 0, 0, 0, 1, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 74
+
+    _binary_unit_ids = {
         
-        self.__moles_per_cubic_meter = None
+        MolarityUnits.MolePerCubicMeter: 0,
         
-        self.__moles_per_liter = None
+        MolarityUnits.MolePerLiter: 1,
         
-        self.__pound_moles_per_cubic_foot = None
+        MolarityUnits.PoundMolePerCubicFoot: 2,
         
-        self.__kilomoles_per_cubic_meter = None
+        MolarityUnits.KilomolePerCubicMeter: 3,
         
-        self.__femtomoles_per_liter = None
+        MolarityUnits.FemtomolePerLiter: 4,
         
-        self.__picomoles_per_liter = None
+        MolarityUnits.PicomolePerLiter: 5,
         
-        self.__nanomoles_per_liter = None
+        MolarityUnits.NanomolePerLiter: 6,
         
-        self.__micromoles_per_liter = None
+        MolarityUnits.MicromolePerLiter: 7,
         
-        self.__millimoles_per_liter = None
+        MolarityUnits.MillimolePerLiter: 8,
         
-        self.__centimoles_per_liter = None
+        MolarityUnits.CentimolePerLiter: 9,
         
-        self.__decimoles_per_liter = None
+        MolarityUnits.DecimolePerLiter: 10,
         
+    }
 
-    def convert(self, unit: MolarityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        MolarityUnits.MolePerCubicMeter: lambda value: (value),
+        
+        MolarityUnits.MolePerLiter: lambda value: (value * 1e-3),
+        
+        MolarityUnits.PoundMolePerCubicFoot: lambda value: (value * 6.2427960576144611956325455827221e-5),
+        
+        MolarityUnits.KilomolePerCubicMeter: lambda value: ((value) / 1000.0),
+        
+        MolarityUnits.FemtomolePerLiter: lambda value: ((value * 1e-3) / 1e-15),
+        
+        MolarityUnits.PicomolePerLiter: lambda value: ((value * 1e-3) / 1e-12),
+        
+        MolarityUnits.NanomolePerLiter: lambda value: ((value * 1e-3) / 1e-09),
+        
+        MolarityUnits.MicromolePerLiter: lambda value: ((value * 1e-3) / 1e-06),
+        
+        MolarityUnits.MillimolePerLiter: lambda value: ((value * 1e-3) / 0.001),
+        
+        MolarityUnits.CentimolePerLiter: lambda value: ((value * 1e-3) / 0.01),
+        
+        MolarityUnits.DecimolePerLiter: lambda value: ((value * 1e-3) / 0.1),
+        
+    }
 
-    def __convert_from_base(self, from_unit: MolarityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == MolarityUnits.MolePerCubicMeter:
-            return (value)
+        MolarityUnits.MolePerCubicMeter: lambda value: (value),
         
-        if from_unit == MolarityUnits.MolePerLiter:
-            return (value * 1e-3)
+        MolarityUnits.MolePerLiter: lambda value: (value / 1e-3),
         
-        if from_unit == MolarityUnits.PoundMolePerCubicFoot:
-            return (value * 6.2427960576144611956325455827221e-5)
+        MolarityUnits.PoundMolePerCubicFoot: lambda value: (value / 6.2427960576144611956325455827221e-5),
         
-        if from_unit == MolarityUnits.KilomolePerCubicMeter:
-            return ((value) / 1000.0)
+        MolarityUnits.KilomolePerCubicMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == MolarityUnits.FemtomolePerLiter:
-            return ((value * 1e-3) / 1e-15)
+        MolarityUnits.FemtomolePerLiter: lambda value: ((value / 1e-3) * 1e-15),
         
-        if from_unit == MolarityUnits.PicomolePerLiter:
-            return ((value * 1e-3) / 1e-12)
+        MolarityUnits.PicomolePerLiter: lambda value: ((value / 1e-3) * 1e-12),
         
-        if from_unit == MolarityUnits.NanomolePerLiter:
-            return ((value * 1e-3) / 1e-09)
+        MolarityUnits.NanomolePerLiter: lambda value: ((value / 1e-3) * 1e-09),
         
-        if from_unit == MolarityUnits.MicromolePerLiter:
-            return ((value * 1e-3) / 1e-06)
+        MolarityUnits.MicromolePerLiter: lambda value: ((value / 1e-3) * 1e-06),
         
-        if from_unit == MolarityUnits.MillimolePerLiter:
-            return ((value * 1e-3) / 0.001)
+        MolarityUnits.MillimolePerLiter: lambda value: ((value / 1e-3) * 0.001),
         
-        if from_unit == MolarityUnits.CentimolePerLiter:
-            return ((value * 1e-3) / 0.01)
+        MolarityUnits.CentimolePerLiter: lambda value: ((value / 1e-3) * 0.01),
         
-        if from_unit == MolarityUnits.DecimolePerLiter:
-            return ((value * 1e-3) / 0.1)
+        MolarityUnits.DecimolePerLiter: lambda value: ((value / 1e-3) * 0.1),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        MolarityUnits.MolePerCubicMeter: ('1', '0'),
+        
+        MolarityUnits.MolePerLiter: ('1/1000', '0'),
+        
+        MolarityUnits.PoundMolePerCubicFoot: ('62427960576144611956325455827221/1000000000000000000000000000000000000', '0'),
+        
+        MolarityUnits.KilomolePerCubicMeter: ('1/1000', '0'),
+        
+        MolarityUnits.FemtomolePerLiter: ('1000000000000', '0'),
+        
+        MolarityUnits.PicomolePerLiter: ('1000000000', '0'),
+        
+        MolarityUnits.NanomolePerLiter: ('1000000', '0'),
+        
+        MolarityUnits.MicromolePerLiter: ('1000', '0'),
+        
+        MolarityUnits.MillimolePerLiter: ('1', '0'),
+        
+        MolarityUnits.CentimolePerLiter: ('1/10', '0'),
+        
+        MolarityUnits.DecimolePerLiter: ('1/100', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: MolarityUnits) -> float:
+    _affine_to_base = {
+        
+        MolarityUnits.MolePerCubicMeter: ('1', '0'),
+        
+        MolarityUnits.MolePerLiter: ('1000', '0'),
+        
+        MolarityUnits.PoundMolePerCubicFoot: ('1000000000000000000000000000000000000/62427960576144611956325455827221', '0'),
+        
+        MolarityUnits.KilomolePerCubicMeter: ('1000', '0'),
+        
+        MolarityUnits.FemtomolePerLiter: ('1/1000000000000', '0'),
+        
+        MolarityUnits.PicomolePerLiter: ('1/1000000000', '0'),
+        
+        MolarityUnits.NanomolePerLiter: ('1/1000000', '0'),
+        
+        MolarityUnits.MicromolePerLiter: ('1/1000', '0'),
+        
+        MolarityUnits.MillimolePerLiter: ('1', '0'),
+        
+        MolarityUnits.CentimolePerLiter: ('10', '0'),
         
-        if to_unit == MolarityUnits.MolePerCubicMeter:
-            return (value)
+        MolarityUnits.DecimolePerLiter: ('100', '0'),
         
-        if to_unit == MolarityUnits.MolePerLiter:
-            return (value / 1e-3)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        MolarityUnits.MolePerCubicMeter: ('mol/m³',),
+        
+        MolarityUnits.MolePerLiter: ('mol/L',),
         
-        if to_unit == MolarityUnits.PoundMolePerCubicFoot:
-            return (value / 6.2427960576144611956325455827221e-5)
+        MolarityUnits.PoundMolePerCubicFoot: ('lbmol/ft³',),
         
-        if to_unit == MolarityUnits.KilomolePerCubicMeter:
-            return ((value) * 1000.0)
+        MolarityUnits.KilomolePerCubicMeter: ('kmol/m³',),
         
-        if to_unit == MolarityUnits.FemtomolePerLiter:
-            return ((value / 1e-3) * 1e-15)
+        MolarityUnits.FemtomolePerLiter: ('fmol/L',),
         
-        if to_unit == MolarityUnits.PicomolePerLiter:
-            return ((value / 1e-3) * 1e-12)
+        MolarityUnits.PicomolePerLiter: ('pmol/L',),
         
-        if to_unit == MolarityUnits.NanomolePerLiter:
-            return ((value / 1e-3) * 1e-09)
+        MolarityUnits.NanomolePerLiter: ('nmol/L',),
         
-        if to_unit == MolarityUnits.MicromolePerLiter:
-            return ((value / 1e-3) * 1e-06)
+        MolarityUnits.MicromolePerLiter: ('μmol/L',),
         
-        if to_unit == MolarityUnits.MillimolePerLiter:
-            return ((value / 1e-3) * 0.001)
+        MolarityUnits.MillimolePerLiter: ('mmol/L',),
         
-        if to_unit == MolarityUnits.CentimolePerLiter:
-            return ((value / 1e-3) * 0.01)
+        MolarityUnits.CentimolePerLiter: ('cmol/L',),
         
-        if to_unit == MolarityUnits.DecimolePerLiter:
-            return ((value / 1e-3) * 0.1)
+        MolarityUnits.DecimolePerLiter: ('dmol/L',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: MolarityUnits = MolarityUnits.MolePerCubicMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: MolarityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: MolarityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: MolarityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
 
+    @staticmethod
+    def convert_value(value: float, from_unit: MolarityUnits, to_unit: MolarityUnits) -> float:
+        """
+        Convert a value from one Molarity unit to another, without creating a Molarity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MolarityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Molarity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: MolarityUnits, to_unit: MolarityUnits) -> List[float]:
+        """
+        Convert many values from one Molarity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: MolarityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: MolarityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Molarity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: MolarityUnits, to_unit: MolarityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Molarity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: MolarityUnits, to_unit: MolarityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Molarity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: MolarityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Molarity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: MolarityUnits = MolarityUnits.MolePerCubicMeter) -> Molarity:
+        """
+        Create a new instance of Molarity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: MolarityUnits
+        :return: A new instance of Molarity.
+        :rtype: Molarity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Molarity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: MolarityUnits = MolarityUnits.MolePerCubicMeter) -> Fraction:
+        """
+        Get the exact value of the Molarity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (MolePerCubicMeter).
+        :type unit: MolarityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Molarity:
+        """
+        Parse a Molarity from a value followed by a unit abbreviation, e.g. "1 mol/m³".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Molarity.
+        :rtype: Molarity
+        :raises ValueError: When the string is not a valid or an ambiguous Molarity.
+        """
+        return Molarity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Molarity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Molarity._try_parse(text)
+
+    def to_binary(self, unit: Optional[MolarityUnits] = None) -> bytes:
+        """
+        Encode the Molarity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: MolarityUnits
+        :return: The encoded Molarity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Molarity:
+        """
+        Decode a Molarity encoded by to_binary.
+
+        :param data: The encoded Molarity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Molarity.
+        :rtype: Molarity
+        :raises ValueError: When the data is not a valid encoded Molarity.
+        """
+        return Molarity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[MolarityUnits] = None) -> dict:
+        """
+        Get the Molarity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (MolePerCubicMeter).
+        :type hold_in_unit: MolarityUnits
+        :return: The Molarity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[MolarityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Molarity:
+        """
+        Create a new instance of Molarity from its DTO.
+
+        :param dto: The Molarity DTO, the unit is the MolarityUnits value or name.
+        :type dto: dict
+        :return: A new instance of Molarity.
+        :rtype: Molarity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Molarity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Molarity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Molarity._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -357,10 +619,7 @@ class Molarity(AbstractMeasure):
         """
         
         """
-        if self.__moles_per_cubic_meter != None:
-            return self.__moles_per_cubic_meter
-        self.__moles_per_cubic_meter = self.__convert_from_base(MolarityUnits.MolePerCubicMeter)
-        return self.__moles_per_cubic_meter
+        return self._cached_convert(MolarityUnits.MolePerCubicMeter)
 
     
     @property
@@ -368,10 +627,7 @@ class Molarity(AbstractMeasure):
         """
         
         """
-        if self.__moles_per_liter != None:
-            return self.__moles_per_liter
-        self.__moles_per_liter = self.__convert_from_base(MolarityUnits.MolePerLiter)
-        return self.__moles_per_liter
+        return self._cached_convert(MolarityUnits.MolePerLiter)
 
     
     @property
@@ -379,10 +635,7 @@ class Molarity(AbstractMeasure):
         """
         
         """
-        if self.__pound_moles_per_cubic_foot != None:
-            return self.__pound_moles_per_cubic_foot
-        self.__pound_moles_per_cubic_foot = self.__convert_from_base(MolarityUnits.PoundMolePerCubicFoot)
-        return self.__pound_moles_per_cubic_foot
+        return self._cached_convert(MolarityUnits.PoundMolePerCubicFoot)
 
     
     @property
@@ -390,10 +643,7 @@ class Molarity(AbstractMeasure):
         """
         
         """
-        if self.__kilomoles_per_cubic_meter != None:
-            return self.__kilomoles_per_cubic_meter
-        self.__kilomoles_per_cubic_meter = self.__convert_from_base(MolarityUnits.KilomolePerCubicMeter)
-        return self.__kilomoles_per_cubic_meter
+        return self._cached_convert(MolarityUnits.KilomolePerCubicMeter)
 
     
     @property
@@ -401,10 +651,7 @@ class Molarity(AbstractMeasure):
         """
         
         """
-        if self.__femtomoles_per_liter != None:
-            return self.__femtomoles_per_liter
-        self.__femtomoles_per_liter = self.__convert_from_base(MolarityUnits.FemtomolePerLiter)
-        return self.__femtomoles_per_liter
+        return self._cached_convert(MolarityUnits.FemtomolePerLiter)
 
     
     @property
@@ -412,10 +659,7 @@ class Molarity(AbstractMeasure):
         """
         
         """
-        if self.__picomoles_per_liter != None:
-            return self.__picomoles_per_liter
-        self.__picomoles_per_liter = self.__convert_from_base(MolarityUnits.PicomolePerLiter)
-        return self.__picomoles_per_liter
+        return self._cached_convert(MolarityUnits.PicomolePerLiter)
 
     
     @property
@@ -423,10 +667,7 @@ class Molarity(AbstractMeasure):
         """
         
         """
-        if self.__nanomoles_per_liter != None:
-            return self.__nanomoles_per_liter
-        self.__nanomoles_per_liter = self.__convert_from_base(MolarityUnits.NanomolePerLiter)
-        return self.__nanomoles_per_liter
+        return self._cached_convert(MolarityUnits.NanomolePerLiter)
 
     
     @property
@@ -434,10 +675,7 @@ class Molarity(AbstractMeasure):
         """
         
         """
-        if self.__micromoles_per_liter != None:
-            return self.__micromoles_per_liter
-        self.__micromoles_per_liter = self.__convert_from_base(MolarityUnits.MicromolePerLiter)
-        return self.__micromoles_per_liter
+        return self._cached_convert(MolarityUnits.MicromolePerLiter)
 
     
     @property
@@ -445,10 +683,7 @@ class Molarity(AbstractMeasure):
         """
         
         """
-        if self.__millimoles_per_liter != None:
-            return self.__millimoles_per_liter
-        self.__millimoles_per_liter = self.__convert_from_base(MolarityUnits.MillimolePerLiter)
-        return self.__millimoles_per_liter
+        return self._cached_convert(MolarityUnits.MillimolePerLiter)
 
     
     @property
@@ -456,10 +691,7 @@ class Molarity(AbstractMeasure):
         """
         
         """
-        if self.__centimoles_per_liter != None:
-            return self.__centimoles_per_liter
-        self.__centimoles_per_liter = self.__convert_from_base(MolarityUnits.CentimolePerLiter)
-        return self.__centimoles_per_liter
+        return self._cached_convert(MolarityUnits.CentimolePerLiter)
 
     
     @property
@@ -467,10 +699,7 @@ class Molarity(AbstractMeasure):
         """
         
         """
-        if self.__decimoles_per_liter != None:
-            return self.__decimoles_per_liter
-        self.__decimoles_per_liter = self.__convert_from_base(MolarityUnits.DecimolePerLiter)
-        return self.__decimoles_per_liter
+        return self._cached_convert(MolarityUnits.DecimolePerLiter)
 
     
     def to_string(self, unit: MolarityUnits = MolarityUnits.MolePerCubicMeter) -> str:
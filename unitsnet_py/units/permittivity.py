@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class PermittivityUnits(Enum):
         """
             PermittivityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         FaradPerMeter = 'farad_per_meter'
         """
@@ -24,33 +35,244 @@ class Permittivity(AbstractMeasure):
         value (float): The value.
         from_unit (PermittivityUnits): The Permittivity unit to create from, The default unit is FaradPerMeter
     """
+    __slots__ = ()
+
+    _units = PermittivityUnits
+
+    _base_unit = PermittivityUnits.FaradPerMeter
+
+    _dimensions = (-3, -1, 4, 2, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 76
+
+    _binary_unit_ids = {
+        
+        PermittivityUnits.FaradPerMeter: 0,
+        
+    }
+
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        PermittivityUnits.FaradPerMeter: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        PermittivityUnits.FaradPerMeter: lambda value: (value),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        PermittivityUnits.FaradPerMeter: ('1', '0'),
+        
+    }
+
+    _affine_to_base = {
+        
+        PermittivityUnits.FaradPerMeter: ('1', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        PermittivityUnits.FaradPerMeter: ('F/m',),
+        
+    }
+
     def __init__(self, value: float, from_unit: PermittivityUnits = PermittivityUnits.FaradPerMeter):
         if math.isnan(value):
             raise ValueError('Invalid unit: value is NaN')
         self._value = self.__convert_to_base(value, from_unit)
-        
-        self.__farads_per_meter = None
-        
 
     def convert(self, unit: PermittivityUnits) -> float:
         return self.__convert_from_base(unit)
 
     def __convert_from_base(self, from_unit: PermittivityUnits) -> float:
-        value = self._value
-        
-        if from_unit == PermittivityUnits.FaradPerMeter:
-            return (value)
-        
-        return None
+        return self._conversions_from_base[from_unit](self._value)
 
 
     def __convert_to_base(self, value: float, to_unit: PermittivityUnits) -> float:
-        
-        if to_unit == PermittivityUnits.FaradPerMeter:
-            return (value)
-        
-        return None
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: PermittivityUnits, to_unit: PermittivityUnits) -> float:
+        """
+        Convert a value from one Permittivity unit to another, without creating a Permittivity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: PermittivityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: PermittivityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Permittivity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: PermittivityUnits, to_unit: PermittivityUnits) -> List[float]:
+        """
+        Convert many values from one Permittivity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: PermittivityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: PermittivityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Permittivity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: PermittivityUnits, to_unit: PermittivityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Permittivity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: PermittivityUnits, to_unit: PermittivityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Permittivity unit to another exactly, using rational conversion factors.
 
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: PermittivityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: PermittivityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Permittivity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: PermittivityUnits = PermittivityUnits.FaradPerMeter) -> Permittivity:
+        """
+        Create a new instance of Permittivity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: PermittivityUnits
+        :return: A new instance of Permittivity.
+        :rtype: Permittivity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Permittivity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: PermittivityUnits = PermittivityUnits.FaradPerMeter) -> Fraction:
+        """
+        Get the exact value of the Permittivity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (FaradPerMeter).
+        :type unit: PermittivityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Permittivity:
+        """
+        Parse a Permittivity from a value followed by a unit abbreviation, e.g. "1 F/m".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Permittivity.
+        :rtype: Permittivity
+        :raises ValueError: When the string is not a valid or an ambiguous Permittivity.
+        """
+        return Permittivity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Permittivity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Permittivity._try_parse(text)
+
+    def to_binary(self, unit: Optional[PermittivityUnits] = None) -> bytes:
+        """
+        Encode the Permittivity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: PermittivityUnits
+        :return: The encoded Permittivity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Permittivity:
+        """
+        Decode a Permittivity encoded by to_binary.
+
+        :param data: The encoded Permittivity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Permittivity.
+        :rtype: Permittivity
+        :raises ValueError: When the data is not a valid encoded Permittivity.
+        """
+        return Permittivity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[PermittivityUnits] = None) -> dict:
+        """
+        Get the Permittivity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (FaradPerMeter).
+        :type hold_in_unit: PermittivityUnits
+        :return: The Permittivity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[PermittivityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Permittivity:
+        """
+        Create a new instance of Permittivity from its DTO.
+
+        :param dto: The Permittivity DTO, the unit is the PermittivityUnits value or name.
+        :type dto: dict
+        :return: A new instance of Permittivity.
+        :rtype: Permittivity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Permittivity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Permittivity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Permittivity._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -77,10 +299,7 @@ class Permittivity(AbstractMeasure):
         """
         
         """
-        if self.__farads_per_meter != None:
-            return self.__farads_per_meter
-        self.__farads_per_meter = self.__convert_from_base(PermittivityUnits.FaradPerMeter)
-        return self.__farads_per_meter
+        return self._cached_convert(PermittivityUnits.FaradPerMeter)
 
     
     def to_string(self, unit: PermittivityUnits = PermittivityUnits.FaradPerMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class PorousMediumPermeabilityUnits(Enum):
         """
             PorousMediumPermeabilityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Darcy = 'darcy'
         """
@@ -44,65 +55,292 @@ class PorousMediumPermeability(AbstractMeasure):
         value (float): The value.
         from_unit (PorousMediumPermeabilityUnits): The PorousMediumPermeability unit to create from, The default unit is SquareMeter
     """
-    def __init__(self, value: float, from_unit: PorousMediumPermeabilityUnits = PorousMediumPermeabilityUnits.SquareMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = PorousMediumPermeabilityUnits
+
+    _base_unit = PorousMediumPermeabilityUnits.SquareMeter
+
+    _dimensions = (2, 0, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 77
+
+    _binary_unit_ids = {
         
-        self.__darcys = None
+        PorousMediumPermeabilityUnits.Darcy: 0,
         
-        self.__square_meters = None
+        PorousMediumPermeabilityUnits.SquareMeter: 1,
         
-        self.__square_centimeters = None
+        PorousMediumPermeabilityUnits.SquareCentimeter: 2,
         
-        self.__microdarcys = None
+        PorousMediumPermeabilityUnits.Microdarcy: 3,
         
-        self.__millidarcys = None
+        PorousMediumPermeabilityUnits.Millidarcy: 4,
         
+    }
 
-    def convert(self, unit: PorousMediumPermeabilityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        PorousMediumPermeabilityUnits.Darcy: lambda value: (value / 9.869233e-13),
+        
+        PorousMediumPermeabilityUnits.SquareMeter: lambda value: (value),
+        
+        PorousMediumPermeabilityUnits.SquareCentimeter: lambda value: (value / 1e-4),
+        
+        PorousMediumPermeabilityUnits.Microdarcy: lambda value: ((value / 9.869233e-13) / 1e-06),
+        
+        PorousMediumPermeabilityUnits.Millidarcy: lambda value: ((value / 9.869233e-13) / 0.001),
+        
+    }
 
-    def __convert_from_base(self, from_unit: PorousMediumPermeabilityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == PorousMediumPermeabilityUnits.Darcy:
-            return (value / 9.869233e-13)
+        PorousMediumPermeabilityUnits.Darcy: lambda value: (value * 9.869233e-13),
         
-        if from_unit == PorousMediumPermeabilityUnits.SquareMeter:
-            return (value)
+        PorousMediumPermeabilityUnits.SquareMeter: lambda value: (value),
         
-        if from_unit == PorousMediumPermeabilityUnits.SquareCentimeter:
-            return (value / 1e-4)
+        PorousMediumPermeabilityUnits.SquareCentimeter: lambda value: (value * 1e-4),
         
-        if from_unit == PorousMediumPermeabilityUnits.Microdarcy:
-            return ((value / 9.869233e-13) / 1e-06)
+        PorousMediumPermeabilityUnits.Microdarcy: lambda value: ((value * 9.869233e-13) * 1e-06),
         
-        if from_unit == PorousMediumPermeabilityUnits.Millidarcy:
-            return ((value / 9.869233e-13) / 0.001)
+        PorousMediumPermeabilityUnits.Millidarcy: lambda value: ((value * 9.869233e-13) * 0.001),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        PorousMediumPermeabilityUnits.Darcy: ('10000000000000000000/9869233', '0'),
+        
+        PorousMediumPermeabilityUnits.SquareMeter: ('1', '0'),
+        
+        PorousMediumPermeabilityUnits.SquareCentimeter: ('10000', '0'),
+        
+        PorousMediumPermeabilityUnits.Microdarcy: ('10000000000000000000000000/9869233', '0'),
+        
+        PorousMediumPermeabilityUnits.Millidarcy: ('10000000000000000000000/9869233', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: PorousMediumPermeabilityUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == PorousMediumPermeabilityUnits.Darcy:
-            return (value * 9.869233e-13)
+        PorousMediumPermeabilityUnits.Darcy: ('9869233/10000000000000000000', '0'),
         
-        if to_unit == PorousMediumPermeabilityUnits.SquareMeter:
-            return (value)
+        PorousMediumPermeabilityUnits.SquareMeter: ('1', '0'),
         
-        if to_unit == PorousMediumPermeabilityUnits.SquareCentimeter:
-            return (value * 1e-4)
+        PorousMediumPermeabilityUnits.SquareCentimeter: ('1/10000', '0'),
         
-        if to_unit == PorousMediumPermeabilityUnits.Microdarcy:
-            return ((value * 9.869233e-13) * 1e-06)
+        PorousMediumPermeabilityUnits.Microdarcy: ('9869233/10000000000000000000000000', '0'),
         
-        if to_unit == PorousMediumPermeabilityUnits.Millidarcy:
-            return ((value * 9.869233e-13) * 0.001)
+        PorousMediumPermeabilityUnits.Millidarcy: ('9869233/10000000000000000000000', '0'),
         
-        return None
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        PorousMediumPermeabilityUnits.Darcy: ('D',),
+        
+        PorousMediumPermeabilityUnits.SquareMeter: ('m²',),
+        
+        PorousMediumPermeabilityUnits.SquareCentimeter: ('cm²',),
+        
+        PorousMediumPermeabilityUnits.Microdarcy: ('μD',),
+        
+        PorousMediumPermeabilityUnits.Millidarcy: ('mD',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: PorousMediumPermeabilityUnits = PorousMediumPermeabilityUnits.SquareMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: PorousMediumPermeabilityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: PorousMediumPermeabilityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: PorousMediumPermeabilityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: PorousMediumPermeabilityUnits, to_unit: PorousMediumPermeabilityUnits) -> float:
+        """
+        Convert a value from one PorousMediumPermeability unit to another, without creating a PorousMediumPermeability instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: PorousMediumPermeabilityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: PorousMediumPermeabilityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return PorousMediumPermeability._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: PorousMediumPermeabilityUnits, to_unit: PorousMediumPermeabilityUnits) -> List[float]:
+        """
+        Convert many values from one PorousMediumPermeability unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: PorousMediumPermeabilityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: PorousMediumPermeabilityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return PorousMediumPermeability._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: PorousMediumPermeabilityUnits, to_unit: PorousMediumPermeabilityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", PorousMediumPermeability._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: PorousMediumPermeabilityUnits, to_unit: PorousMediumPermeabilityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one PorousMediumPermeability unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: PorousMediumPermeabilityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: PorousMediumPermeabilityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return PorousMediumPermeability._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: PorousMediumPermeabilityUnits = PorousMediumPermeabilityUnits.SquareMeter) -> PorousMediumPermeability:
+        """
+        Create a new instance of PorousMediumPermeability holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: PorousMediumPermeabilityUnits
+        :return: A new instance of PorousMediumPermeability.
+        :rtype: PorousMediumPermeability
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return PorousMediumPermeability._from_exact(value, from_unit)
+
+    def to_exact(self, unit: PorousMediumPermeabilityUnits = PorousMediumPermeabilityUnits.SquareMeter) -> Fraction:
+        """
+        Get the exact value of the PorousMediumPermeability in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (SquareMeter).
+        :type unit: PorousMediumPermeabilityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> PorousMediumPermeability:
+        """
+        Parse a PorousMediumPermeability from a value followed by a unit abbreviation, e.g. "1 D".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of PorousMediumPermeability.
+        :rtype: PorousMediumPermeability
+        :raises ValueError: When the string is not a valid or an ambiguous PorousMediumPermeability.
+        """
+        return PorousMediumPermeability._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[PorousMediumPermeability]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return PorousMediumPermeability._try_parse(text)
+
+    def to_binary(self, unit: Optional[PorousMediumPermeabilityUnits] = None) -> bytes:
+        """
+        Encode the PorousMediumPermeability to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: PorousMediumPermeabilityUnits
+        :return: The encoded PorousMediumPermeability.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> PorousMediumPermeability:
+        """
+        Decode a PorousMediumPermeability encoded by to_binary.
+
+        :param data: The encoded PorousMediumPermeability, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of PorousMediumPermeability.
+        :rtype: PorousMediumPermeability
+        :raises ValueError: When the data is not a valid encoded PorousMediumPermeability.
+        """
+        return PorousMediumPermeability._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[PorousMediumPermeabilityUnits] = None) -> dict:
+        """
+        Get the PorousMediumPermeability DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
 
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (SquareMeter).
+        :type hold_in_unit: PorousMediumPermeabilityUnits
+        :return: The PorousMediumPermeability DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[PorousMediumPermeabilityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> PorousMediumPermeability:
+        """
+        Create a new instance of PorousMediumPermeability from its DTO.
+
+        :param dto: The PorousMediumPermeability DTO, the unit is the PorousMediumPermeabilityUnits value or name.
+        :type dto: dict
+        :return: A new instance of PorousMediumPermeability.
+        :rtype: PorousMediumPermeability
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return PorousMediumPermeability._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> PorousMediumPermeability:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return PorousMediumPermeability._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -189,10 +427,7 @@ class PorousMediumPermeability(AbstractMeasure):
         """
         
         """
-        if self.__darcys != None:
-            return self.__darcys
-        self.__darcys = self.__convert_from_base(PorousMediumPermeabilityUnits.Darcy)
-        return self.__darcys
+        return self._cached_convert(PorousMediumPermeabilityUnits.Darcy)
 
     
     @property
@@ -200,10 +435,7 @@ class PorousMediumPermeability(AbstractMeasure):
         """
         
         """
-        if self.__square_meters != None:
-            return self.__square_meters
-        self.__square_meters = self.__convert_from_base(PorousMediumPermeabilityUnits.SquareMeter)
-        return self.__square_meters
+        return self._cached_convert(PorousMediumPermeabilityUnits.SquareMeter)
 
     
     @property
@@ -211,10 +443,7 @@ class PorousMediumPermeability(AbstractMeasure):
         """
         
         """
-        if self.__square_centimeters != None:
-            return self.__square_centimeters
-        self.__square_centimeters = self.__convert_from_base(PorousMediumPermeabilityUnits.SquareCentimeter)
-        return self.__square_centimeters
+        return self._cached_convert(PorousMediumPermeabilityUnits.SquareCentimeter)
 
     
     @property
@@ -222,10 +451,7 @@ class PorousMediumPermeability(AbstractMeasure):
         """
         
         """
-        if self.__microdarcys != None:
-            return self.__microdarcys
-        self.__microdarcys = self.__convert_from_base(PorousMediumPermeabilityUnits.Microdarcy)
-        return self.__microdarcys
+        return self._cached_convert(PorousMediumPermeabilityUnits.Microdarcy)
 
     
     @property
@@ -233,10 +459,7 @@ class PorousMediumPermeability(AbstractMeasure):
         """
         
         """
-        if self.__millidarcys != None:
-            return self.__millidarcys
-        self.__millidarcys = self.__convert_from_base(PorousMediumPermeabilityUnits.Millidarcy)
-        return self.__millidarcys
+        return self._cached_convert(PorousMediumPermeabilityUnits.Millidarcy)
 
     
     def to_string(self, unit: PorousMediumPermeabilityUnits = PorousMediumPermeabilityUnits.SquareMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class PowerUnits(Enum):
         """
             PowerUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Watt = 'watt'
         """
@@ -149,233 +160,544 @@ class Power(AbstractMeasure):
         value (float): The value.
         from_unit (PowerUnits): The Power unit to create from, The default unit is Watt
     """
-    def __init__(self, value: float, from_unit: PowerUnits = PowerUnits.Watt):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = PowerUnits
+
+    _base_unit = PowerUnits.Watt
+
+    _dimensions = (2, 1, -3, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 78
+
+    _binary_unit_ids = {
         
-        self.__watts = None
+        PowerUnits.Watt: 0,
         
-        self.__mechanical_horsepower = None
+        PowerUnits.MechanicalHorsepower: 1,
         
-        self.__metric_horsepower = None
+        PowerUnits.MetricHorsepower: 2,
         
-        self.__electrical_horsepower = None
+        PowerUnits.ElectricalHorsepower: 3,
         
-        self.__boiler_horsepower = None
+        PowerUnits.BoilerHorsepower: 4,
         
-        self.__hydraulic_horsepower = None
+        PowerUnits.HydraulicHorsepower: 5,
         
-        self.__british_thermal_units_per_hour = None
+        PowerUnits.BritishThermalUnitPerHour: 6,
         
-        self.__joules_per_hour = None
+        PowerUnits.JoulePerHour: 7,
         
-        self.__femtowatts = None
+        PowerUnits.Femtowatt: 8,
         
-        self.__picowatts = None
+        PowerUnits.Picowatt: 9,
         
-        self.__nanowatts = None
+        PowerUnits.Nanowatt: 10,
         
-        self.__microwatts = None
+        PowerUnits.Microwatt: 11,
         
-        self.__milliwatts = None
+        PowerUnits.Milliwatt: 12,
         
-        self.__deciwatts = None
+        PowerUnits.Deciwatt: 13,
         
-        self.__decawatts = None
+        PowerUnits.Decawatt: 14,
         
-        self.__kilowatts = None
+        PowerUnits.Kilowatt: 15,
         
-        self.__megawatts = None
+        PowerUnits.Megawatt: 16,
         
-        self.__gigawatts = None
+        PowerUnits.Gigawatt: 17,
         
-        self.__terawatts = None
+        PowerUnits.Terawatt: 18,
         
-        self.__petawatts = None
+        PowerUnits.Petawatt: 19,
         
-        self.__kilobritish_thermal_units_per_hour = None
+        PowerUnits.KilobritishThermalUnitPerHour: 20,
         
-        self.__megabritish_thermal_units_per_hour = None
+        PowerUnits.MegabritishThermalUnitPerHour: 21,
         
-        self.__millijoules_per_hour = None
+        PowerUnits.MillijoulePerHour: 22,
         
-        self.__kilojoules_per_hour = None
+        PowerUnits.KilojoulePerHour: 23,
         
-        self.__megajoules_per_hour = None
+        PowerUnits.MegajoulePerHour: 24,
         
-        self.__gigajoules_per_hour = None
+        PowerUnits.GigajoulePerHour: 25,
         
+    }
 
-    def convert(self, unit: PowerUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        PowerUnits.Watt: lambda value: (value),
+        
+        PowerUnits.MechanicalHorsepower: lambda value: (value / 745.69),
+        
+        PowerUnits.MetricHorsepower: lambda value: (value / 735.49875),
+        
+        PowerUnits.ElectricalHorsepower: lambda value: (value / 746),
+        
+        PowerUnits.BoilerHorsepower: lambda value: (value / 9812.5),
+        
+        PowerUnits.HydraulicHorsepower: lambda value: (value / 745.69988145),
+        
+        PowerUnits.BritishThermalUnitPerHour: lambda value: (value / 0.29307107017),
+        
+        PowerUnits.JoulePerHour: lambda value: (value * 3600),
+        
+        PowerUnits.Femtowatt: lambda value: ((value) / 1e-15),
+        
+        PowerUnits.Picowatt: lambda value: ((value) / 1e-12),
+        
+        PowerUnits.Nanowatt: lambda value: ((value) / 1e-09),
+        
+        PowerUnits.Microwatt: lambda value: ((value) / 1e-06),
+        
+        PowerUnits.Milliwatt: lambda value: ((value) / 0.001),
+        
+        PowerUnits.Deciwatt: lambda value: ((value) / 0.1),
+        
+        PowerUnits.Decawatt: lambda value: ((value) / 10.0),
+        
+        PowerUnits.Kilowatt: lambda value: ((value) / 1000.0),
+        
+        PowerUnits.Megawatt: lambda value: ((value) / 1000000.0),
+        
+        PowerUnits.Gigawatt: lambda value: ((value) / 1000000000.0),
+        
+        PowerUnits.Terawatt: lambda value: ((value) / 1000000000000.0),
+        
+        PowerUnits.Petawatt: lambda value: ((value) / 1000000000000000.0),
+        
+        PowerUnits.KilobritishThermalUnitPerHour: lambda value: ((value / 0.29307107017) / 1000.0),
+        
+        PowerUnits.MegabritishThermalUnitPerHour: lambda value: ((value / 0.29307107017) / 1000000.0),
+        
+        PowerUnits.MillijoulePerHour: lambda value: ((value * 3600) / 0.001),
+        
+        PowerUnits.KilojoulePerHour: lambda value: ((value * 3600) / 1000.0),
+        
+        PowerUnits.MegajoulePerHour: lambda value: ((value * 3600) / 1000000.0),
+        
+        PowerUnits.GigajoulePerHour: lambda value: ((value * 3600) / 1000000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: PowerUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == PowerUnits.Watt:
-            return (value)
+        PowerUnits.Watt: lambda value: (value),
         
-        if from_unit == PowerUnits.MechanicalHorsepower:
-            return (value / 745.69)
+        PowerUnits.MechanicalHorsepower: lambda value: (value * 745.69),
         
-        if from_unit == PowerUnits.MetricHorsepower:
-            return (value / 735.49875)
+        PowerUnits.MetricHorsepower: lambda value: (value * 735.49875),
         
-        if from_unit == PowerUnits.ElectricalHorsepower:
-            return (value / 746)
+        PowerUnits.ElectricalHorsepower: lambda value: (value * 746),
         
-        if from_unit == PowerUnits.BoilerHorsepower:
-            return (value / 9812.5)
+        PowerUnits.BoilerHorsepower: lambda value: (value * 9812.5),
         
-        if from_unit == PowerUnits.HydraulicHorsepower:
-            return (value / 745.69988145)
+        PowerUnits.HydraulicHorsepower: lambda value: (value * 745.69988145),
         
-        if from_unit == PowerUnits.BritishThermalUnitPerHour:
-            return (value / 0.29307107017)
+        PowerUnits.BritishThermalUnitPerHour: lambda value: (value * 0.29307107017),
         
-        if from_unit == PowerUnits.JoulePerHour:
-            return (value * 3600)
+        PowerUnits.JoulePerHour: lambda value: (value / 3600),
         
-        if from_unit == PowerUnits.Femtowatt:
-            return ((value) / 1e-15)
+        PowerUnits.Femtowatt: lambda value: ((value) * 1e-15),
         
-        if from_unit == PowerUnits.Picowatt:
-            return ((value) / 1e-12)
+        PowerUnits.Picowatt: lambda value: ((value) * 1e-12),
         
-        if from_unit == PowerUnits.Nanowatt:
-            return ((value) / 1e-09)
+        PowerUnits.Nanowatt: lambda value: ((value) * 1e-09),
         
-        if from_unit == PowerUnits.Microwatt:
-            return ((value) / 1e-06)
+        PowerUnits.Microwatt: lambda value: ((value) * 1e-06),
         
-        if from_unit == PowerUnits.Milliwatt:
-            return ((value) / 0.001)
+        PowerUnits.Milliwatt: lambda value: ((value) * 0.001),
         
-        if from_unit == PowerUnits.Deciwatt:
-            return ((value) / 0.1)
+        PowerUnits.Deciwatt: lambda value: ((value) * 0.1),
         
-        if from_unit == PowerUnits.Decawatt:
-            return ((value) / 10.0)
+        PowerUnits.Decawatt: lambda value: ((value) * 10.0),
         
-        if from_unit == PowerUnits.Kilowatt:
-            return ((value) / 1000.0)
+        PowerUnits.Kilowatt: lambda value: ((value) * 1000.0),
         
-        if from_unit == PowerUnits.Megawatt:
-            return ((value) / 1000000.0)
+        PowerUnits.Megawatt: lambda value: ((value) * 1000000.0),
         
-        if from_unit == PowerUnits.Gigawatt:
-            return ((value) / 1000000000.0)
+        PowerUnits.Gigawatt: lambda value: ((value) * 1000000000.0),
         
-        if from_unit == PowerUnits.Terawatt:
-            return ((value) / 1000000000000.0)
+        PowerUnits.Terawatt: lambda value: ((value) * 1000000000000.0),
         
-        if from_unit == PowerUnits.Petawatt:
-            return ((value) / 1000000000000000.0)
+        PowerUnits.Petawatt: lambda value: ((value) * 1000000000000000.0),
         
-        if from_unit == PowerUnits.KilobritishThermalUnitPerHour:
-            return ((value / 0.29307107017) / 1000.0)
+        PowerUnits.KilobritishThermalUnitPerHour: lambda value: ((value * 0.29307107017) * 1000.0),
         
-        if from_unit == PowerUnits.MegabritishThermalUnitPerHour:
-            return ((value / 0.29307107017) / 1000000.0)
+        PowerUnits.MegabritishThermalUnitPerHour: lambda value: ((value * 0.29307107017) * 1000000.0),
         
-        if from_unit == PowerUnits.MillijoulePerHour:
-            return ((value * 3600) / 0.001)
+        PowerUnits.MillijoulePerHour: lambda value: ((value / 3600) * 0.001),
         
-        if from_unit == PowerUnits.KilojoulePerHour:
-            return ((value * 3600) / 1000.0)
+        PowerUnits.KilojoulePerHour: lambda value: ((value / 3600) * 1000.0),
         
-        if from_unit == PowerUnits.MegajoulePerHour:
-            return ((value * 3600) / 1000000.0)
+        PowerUnits.MegajoulePerHour: lambda value: ((value / 3600) * 1000000.0),
         
-        if from_unit == PowerUnits.GigajoulePerHour:
-            return ((value * 3600) / 1000000000.0)
+        PowerUnits.GigajoulePerHour: lambda value: ((value / 3600) * 1000000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        PowerUnits.Watt: ('1', '0'),
+        
+        PowerUnits.MechanicalHorsepower: ('100/74569', '0'),
+        
+        PowerUnits.MetricHorsepower: ('800/588399', '0'),
+        
+        PowerUnits.ElectricalHorsepower: ('1/746', '0'),
+        
+        PowerUnits.BoilerHorsepower: ('2/19625', '0'),
+        
+        PowerUnits.HydraulicHorsepower: ('20000000/14913997629', '0'),
+        
+        PowerUnits.BritishThermalUnitPerHour: ('100000000000/29307107017', '0'),
+        
+        PowerUnits.JoulePerHour: ('3600', '0'),
+        
+        PowerUnits.Femtowatt: ('1000000000000000', '0'),
+        
+        PowerUnits.Picowatt: ('1000000000000', '0'),
+        
+        PowerUnits.Nanowatt: ('1000000000', '0'),
+        
+        PowerUnits.Microwatt: ('1000000', '0'),
+        
+        PowerUnits.Milliwatt: ('1000', '0'),
+        
+        PowerUnits.Deciwatt: ('10', '0'),
+        
+        PowerUnits.Decawatt: ('1/10', '0'),
+        
+        PowerUnits.Kilowatt: ('1/1000', '0'),
+        
+        PowerUnits.Megawatt: ('1/1000000', '0'),
+        
+        PowerUnits.Gigawatt: ('1/1000000000', '0'),
+        
+        PowerUnits.Terawatt: ('1/1000000000000', '0'),
+        
+        PowerUnits.Petawatt: ('1/1000000000000000', '0'),
+        
+        PowerUnits.KilobritishThermalUnitPerHour: ('100000000/29307107017', '0'),
+        
+        PowerUnits.MegabritishThermalUnitPerHour: ('100000/29307107017', '0'),
+        
+        PowerUnits.MillijoulePerHour: ('3600000', '0'),
+        
+        PowerUnits.KilojoulePerHour: ('18/5', '0'),
+        
+        PowerUnits.MegajoulePerHour: ('9/2500', '0'),
+        
+        PowerUnits.GigajoulePerHour: ('9/2500000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: PowerUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == PowerUnits.Watt:
-            return (value)
+        PowerUnits.Watt: ('1', '0'),
         
-        if to_unit == PowerUnits.MechanicalHorsepower:
-            return (value * 745.69)
+        PowerUnits.MechanicalHorsepower: ('74569/100', '0'),
         
-        if to_unit == PowerUnits.MetricHorsepower:
-            return (value * 735.49875)
+        PowerUnits.MetricHorsepower: ('588399/800', '0'),
         
-        if to_unit == PowerUnits.ElectricalHorsepower:
-            return (value * 746)
+        PowerUnits.ElectricalHorsepower: ('746', '0'),
         
-        if to_unit == PowerUnits.BoilerHorsepower:
-            return (value * 9812.5)
+        PowerUnits.BoilerHorsepower: ('19625/2', '0'),
         
-        if to_unit == PowerUnits.HydraulicHorsepower:
-            return (value * 745.69988145)
+        PowerUnits.HydraulicHorsepower: ('14913997629/20000000', '0'),
         
-        if to_unit == PowerUnits.BritishThermalUnitPerHour:
-            return (value * 0.29307107017)
+        PowerUnits.BritishThermalUnitPerHour: ('29307107017/100000000000', '0'),
         
-        if to_unit == PowerUnits.JoulePerHour:
-            return (value / 3600)
+        PowerUnits.JoulePerHour: ('1/3600', '0'),
         
-        if to_unit == PowerUnits.Femtowatt:
-            return ((value) * 1e-15)
+        PowerUnits.Femtowatt: ('1/1000000000000000', '0'),
         
-        if to_unit == PowerUnits.Picowatt:
-            return ((value) * 1e-12)
+        PowerUnits.Picowatt: ('1/1000000000000', '0'),
         
-        if to_unit == PowerUnits.Nanowatt:
-            return ((value) * 1e-09)
+        PowerUnits.Nanowatt: ('1/1000000000', '0'),
         
-        if to_unit == PowerUnits.Microwatt:
-            return ((value) * 1e-06)
+        PowerUnits.Microwatt: ('1/1000000', '0'),
         
-        if to_unit == PowerUnits.Milliwatt:
-            return ((value) * 0.001)
+        PowerUnits.Milliwatt: ('1/1000', '0'),
         
-        if to_unit == PowerUnits.Deciwatt:
-            return ((value) * 0.1)
+        PowerUnits.Deciwatt: ('1/10', '0'),
         
-        if to_unit == PowerUnits.Decawatt:
-            return ((value) * 10.0)
+        PowerUnits.Decawatt: ('10', '0'),
         
-        if to_unit == PowerUnits.Kilowatt:
-            return ((value) * 1000.0)
+        PowerUnits.Kilowatt: ('1000', '0'),
         
-        if to_unit == PowerUnits.Megawatt:
-            return ((value) * 1000000.0)
+        PowerUnits.Megawatt: ('1000000', '0'),
         
-        if to_unit == PowerUnits.Gigawatt:
-            return ((value) * 1000000000.0)
+        PowerUnits.Gigawatt: ('1000000000', '0'),
         
-        if to_unit == PowerUnits.Terawatt:
-            return ((value) * 1000000000000.0)
+        PowerUnits.Terawatt: ('1000000000000', '0'),
         
-        if to_unit == PowerUnits.Petawatt:
-            return ((value) * 1000000000000000.0)
+        PowerUnits.Petawatt: ('1000000000000000', '0'),
         
-        if to_unit == PowerUnits.KilobritishThermalUnitPerHour:
-            return ((value * 0.29307107017) * 1000.0)
+        PowerUnits.KilobritishThermalUnitPerHour: ('29307107017/100000000', '0'),
         
-        if to_unit == PowerUnits.MegabritishThermalUnitPerHour:
-            return ((value * 0.29307107017) * 1000000.0)
+        PowerUnits.MegabritishThermalUnitPerHour: ('29307107017/100000', '0'),
         
-        if to_unit == PowerUnits.MillijoulePerHour:
-            return ((value / 3600) * 0.001)
+        PowerUnits.MillijoulePerHour: ('1/3600000', '0'),
         
-        if to_unit == PowerUnits.KilojoulePerHour:
-            return ((value / 3600) * 1000.0)
+        PowerUnits.KilojoulePerHour: ('5/18', '0'),
         
-        if to_unit == PowerUnits.MegajoulePerHour:
-            return ((value / 3600) * 1000000.0)
+        PowerUnits.MegajoulePerHour: ('2500/9', '0'),
         
-        if to_unit == PowerUnits.GigajoulePerHour:
-            return ((value / 3600) * 1000000000.0)
+        PowerUnits.GigajoulePerHour: ('2500000/9', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        PowerUnits.Watt: ('W',),
+        
+        PowerUnits.MechanicalHorsepower: ('hp(I)',),
+        
+        PowerUnits.MetricHorsepower: ('hp(M)',),
+        
+        PowerUnits.ElectricalHorsepower: ('hp(E)',),
+        
+        PowerUnits.BoilerHorsepower: ('hp(S)',),
+        
+        PowerUnits.HydraulicHorsepower: ('hp(H)',),
+        
+        PowerUnits.BritishThermalUnitPerHour: ('Btu/h',),
+        
+        PowerUnits.JoulePerHour: ('J/h',),
+        
+        PowerUnits.Femtowatt: ('fW',),
+        
+        PowerUnits.Picowatt: ('pW',),
+        
+        PowerUnits.Nanowatt: ('nW',),
+        
+        PowerUnits.Microwatt: ('μW',),
+        
+        PowerUnits.Milliwatt: ('mW',),
+        
+        PowerUnits.Deciwatt: ('dW',),
+        
+        PowerUnits.Decawatt: ('daW',),
+        
+        PowerUnits.Kilowatt: ('kW',),
+        
+        PowerUnits.Megawatt: ('MW',),
+        
+        PowerUnits.Gigawatt: ('GW',),
+        
+        PowerUnits.Terawatt: ('TW',),
+        
+        PowerUnits.Petawatt: ('PW',),
+        
+        PowerUnits.KilobritishThermalUnitPerHour: ('kBtu/h',),
+        
+        PowerUnits.MegabritishThermalUnitPerHour: ('MBtu/h',),
+        
+        PowerUnits.MillijoulePerHour: ('mJ/h',),
+        
+        PowerUnits.KilojoulePerHour: ('kJ/h',),
+        
+        PowerUnits.MegajoulePerHour: ('MJ/h',),
+        
+        PowerUnits.GigajoulePerHour: ('GJ/h',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: PowerUnits = PowerUnits.Watt):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: PowerUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: PowerUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: PowerUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: PowerUnits, to_unit: PowerUnits) -> float:
+        """
+        Convert a value from one Power unit to another, without creating a Power instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: PowerUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: PowerUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Power._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: PowerUnits, to_unit: PowerUnits) -> List[float]:
+        """
+        Convert many values from one Power unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: PowerUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: PowerUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Power._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: PowerUnits, to_unit: PowerUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Power._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: PowerUnits, to_unit: PowerUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Power unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: PowerUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: PowerUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Power._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: PowerUnits = PowerUnits.Watt) -> Power:
+        """
+        Create a new instance of Power holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: PowerUnits
+        :return: A new instance of Power.
+        :rtype: Power
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Power._from_exact(value, from_unit)
+
+    def to_exact(self, unit: PowerUnits = PowerUnits.Watt) -> Fraction:
+        """
+        Get the exact value of the Power in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Watt).
+        :type unit: PowerUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Power:
+        """
+        Parse a Power from a value followed by a unit abbreviation, e.g. "1 W".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Power.
+        :rtype: Power
+        :raises ValueError: When the string is not a valid or an ambiguous Power.
+        """
+        return Power._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Power]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Power._try_parse(text)
+
+    def to_binary(self, unit: Optional[PowerUnits] = None) -> bytes:
+        """
+        Encode the Power to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: PowerUnits
+        :return: The encoded Power.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Power:
+        """
+        Decode a Power encoded by to_binary.
+
+        :param data: The encoded Power, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Power.
+        :rtype: Power
+        :raises ValueError: When the data is not a valid encoded Power.
+        """
+        return Power._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[PowerUnits] = None) -> dict:
+        """
+        Get the Power DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Watt).
+        :type hold_in_unit: PowerUnits
+        :return: The Power DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[PowerUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Power:
+        """
+        Create a new instance of Power from its DTO.
+
+        :param dto: The Power DTO, the unit is the PowerUnits value or name.
+        :type dto: dict
+        :return: A new instance of Power.
+        :rtype: Power
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Power._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Power:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Power._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -777,10 +1099,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__watts != None:
-            return self.__watts
-        self.__watts = self.__convert_from_base(PowerUnits.Watt)
-        return self.__watts
+        return self._cached_convert(PowerUnits.Watt)
 
     
     @property
@@ -788,10 +1107,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__mechanical_horsepower != None:
-            return self.__mechanical_horsepower
-        self.__mechanical_horsepower = self.__convert_from_base(PowerUnits.MechanicalHorsepower)
-        return self.__mechanical_horsepower
+        return self._cached_convert(PowerUnits.MechanicalHorsepower)
 
     
     @property
@@ -799,10 +1115,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__metric_horsepower != None:
-            return self.__metric_horsepower
-        self.__metric_horsepower = self.__convert_from_base(PowerUnits.MetricHorsepower)
-        return self.__metric_horsepower
+        return self._cached_convert(PowerUnits.MetricHorsepower)
 
     
     @property
@@ -810,10 +1123,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__electrical_horsepower != None:
-            return self.__electrical_horsepower
-        self.__electrical_horsepower = self.__convert_from_base(PowerUnits.ElectricalHorsepower)
-        return self.__electrical_horsepower
+        return self._cached_convert(PowerUnits.ElectricalHorsepower)
 
     
     @property
@@ -821,10 +1131,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__boiler_horsepower != None:
-            return self.__boiler_horsepower
-        self.__boiler_horsepower = self.__convert_from_base(PowerUnits.BoilerHorsepower)
-        return self.__boiler_horsepower
+        return self._cached_convert(PowerUnits.BoilerHorsepower)
 
     
     @property
@@ -832,10 +1139,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__hydraulic_horsepower != None:
-            return self.__hydraulic_horsepower
-        self.__hydraulic_horsepower = self.__convert_from_base(PowerUnits.HydraulicHorsepower)
-        return self.__hydraulic_horsepower
+        return self._cached_convert(PowerUnits.HydraulicHorsepower)
 
     
     @property
@@ -843,10 +1147,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__british_thermal_units_per_hour != None:
-            return self.__british_thermal_units_per_hour
-        self.__british_thermal_units_per_hour = self.__convert_from_base(PowerUnits.BritishThermalUnitPerHour)
-        return self.__british_thermal_units_per_hour
+        return self._cached_convert(PowerUnits.BritishThermalUnitPerHour)
 
     
     @property
@@ -854,10 +1155,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__joules_per_hour != None:
-            return self.__joules_per_hour
-        self.__joules_per_hour = self.__convert_from_base(PowerUnits.JoulePerHour)
-        return self.__joules_per_hour
+        return self._cached_convert(PowerUnits.JoulePerHour)
 
     
     @property
@@ -865,10 +1163,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__femtowatts != None:
-            return self.__femtowatts
-        self.__femtowatts = self.__convert_from_base(PowerUnits.Femtowatt)
-        return self.__femtowatts
+        return self._cached_convert(PowerUnits.Femtowatt)
 
     
     @property
@@ -876,10 +1171,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__picowatts != None:
-            return self.__picowatts
-        self.__picowatts = self.__convert_from_base(PowerUnits.Picowatt)
-        return self.__picowatts
+        return self._cached_convert(PowerUnits.Picowatt)
 
     
     @property
@@ -887,10 +1179,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__nanowatts != None:
-            return self.__nanowatts
-        self.__nanowatts = self.__convert_from_base(PowerUnits.Nanowatt)
-        return self.__nanowatts
+        return self._cached_convert(PowerUnits.Nanowatt)
 
     
     @property
@@ -898,10 +1187,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__microwatts != None:
-            return self.__microwatts
-        self.__microwatts = self.__convert_from_base(PowerUnits.Microwatt)
-        return self.__microwatts
+        return self._cached_convert(PowerUnits.Microwatt)
 
     
     @property
@@ -909,10 +1195,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__milliwatts != None:
-            return self.__milliwatts
-        self.__milliwatts = self.__convert_from_base(PowerUnits.Milliwatt)
-        return self.__milliwatts
+        return self._cached_convert(PowerUnits.Milliwatt)
 
     
     @property
@@ -920,10 +1203,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__deciwatts != None:
-            return self.__deciwatts
-        self.__deciwatts = self.__convert_from_base(PowerUnits.Deciwatt)
-        return self.__deciwatts
+        return self._cached_convert(PowerUnits.Deciwatt)
 
     
     @property
@@ -931,10 +1211,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__decawatts != None:
-            return self.__decawatts
-        self.__decawatts = self.__convert_from_base(PowerUnits.Decawatt)
-        return self.__decawatts
+        return self._cached_convert(PowerUnits.Decawatt)
 
     
     @property
@@ -942,10 +1219,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__kilowatts != None:
-            return self.__kilowatts
-        self.__kilowatts = self.__convert_from_base(PowerUnits.Kilowatt)
-        return self.__kilowatts
+        return self._cached_convert(PowerUnits.Kilowatt)
 
     
     @property
@@ -953,10 +1227,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__megawatts != None:
-            return self.__megawatts
-        self.__megawatts = self.__convert_from_base(PowerUnits.Megawatt)
-        return self.__megawatts
+        return self._cached_convert(PowerUnits.Megawatt)
 
     
     @property
@@ -964,10 +1235,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__gigawatts != None:
-            return self.__gigawatts
-        self.__gigawatts = self.__convert_from_base(PowerUnits.Gigawatt)
-        return self.__gigawatts
+        return self._cached_convert(PowerUnits.Gigawatt)
 
     
     @property
@@ -975,10 +1243,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__terawatts != None:
-            return self.__terawatts
-        self.__terawatts = self.__convert_from_base(PowerUnits.Terawatt)
-        return self.__terawatts
+        return self._cached_convert(PowerUnits.Terawatt)
 
     
     @property
@@ -986,10 +1251,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__petawatts != None:
-            return self.__petawatts
-        self.__petawatts = self.__convert_from_base(PowerUnits.Petawatt)
-        return self.__petawatts
+        return self._cached_convert(PowerUnits.Petawatt)
 
     
     @property
@@ -997,10 +1259,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__kilobritish_thermal_units_per_hour != None:
-            return self.__kilobritish_thermal_units_per_hour
-        self.__kilobritish_thermal_units_per_hour = self.__convert_from_base(PowerUnits.KilobritishThermalUnitPerHour)
-        return self.__kilobritish_thermal_units_per_hour
+        return self._cached_convert(PowerUnits.KilobritishThermalUnitPerHour)
 
     
     @property
@@ -1008,10 +1267,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__megabritish_thermal_units_per_hour != None:
-            return self.__megabritish_thermal_units_per_hour
-        self.__megabritish_thermal_units_per_hour = self.__convert_from_base(PowerUnits.MegabritishThermalUnitPerHour)
-        return self.__megabritish_thermal_units_per_hour
+        return self._cached_convert(PowerUnits.MegabritishThermalUnitPerHour)
 
     
     @property
@@ -1019,10 +1275,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__millijoules_per_hour != None:
-            return self.__millijoules_per_hour
-        self.__millijoules_per_hour = self.__convert_from_base(PowerUnits.MillijoulePerHour)
-        return self.__millijoules_per_hour
+        return self._cached_convert(PowerUnits.MillijoulePerHour)
 
     
     @property
@@ -1030,10 +1283,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__kilojoules_per_hour != None:
-            return self.__kilojoules_per_hour
-        self.__kilojoules_per_hour = self.__convert_from_base(PowerUnits.KilojoulePerHour)
-        return self.__kilojoules_per_hour
+        return self._cached_convert(PowerUnits.KilojoulePerHour)
 
     
     @property
@@ -1041,10 +1291,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__megajoules_per_hour != None:
-            return self.__megajoules_per_hour
-        self.__megajoules_per_hour = self.__convert_from_base(PowerUnits.MegajoulePerHour)
-        return self.__megajoules_per_hour
+        return self._cached_convert(PowerUnits.MegajoulePerHour)
 
     
     @property
@@ -1052,10 +1299,7 @@ class Power(AbstractMeasure):
         """
         
         """
-        if self.__gigajoules_per_hour != None:
-            return self.__gigajoules_per_hour
-        self.__gigajoules_per_hour = self.__convert_from_base(PowerUnits.GigajoulePerHour)
-        return self.__gigajoules_per_hour
+        return self._cached_convert(PowerUnits.GigajoulePerHour)
 
     
     def to_string(self, unit: PowerUnits = PowerUnits.Watt) -> str:
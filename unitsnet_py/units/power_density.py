@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class PowerDensityUnits(Enum):
         """
             PowerDensityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         WattPerCubicMeter = 'watt_per_cubic_meter'
         """
@@ -239,377 +250,760 @@ class PowerDensity(AbstractMeasure):
         value (float): The value.
         from_unit (PowerDensityUnits): The PowerDensity unit to create from, The default unit is WattPerCubicMeter
     """
-    def __init__(self, value: float, from_unit: PowerDensityUnits = PowerDensityUnits.WattPerCubicMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = PowerDensityUnits
+
+    _base_unit = PowerDensityUnits.WattPerCubicMeter
+
+    _dimensions = (-1, 1, -3, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 79
+
+    _binary_unit_ids = {
         
-        self.__watts_per_cubic_meter = None
+        PowerDensityUnits.WattPerCubicMeter: 0,
         
-        self.__watts_per_cubic_inch = None
+        PowerDensityUnits.WattPerCubicInch: 1,
         
-        self.__watts_per_cubic_foot = None
+        PowerDensityUnits.WattPerCubicFoot: 2,
         
-        self.__watts_per_liter = None
+        PowerDensityUnits.WattPerLiter: 3,
         
-        self.__picowatts_per_cubic_meter = None
+        PowerDensityUnits.PicowattPerCubicMeter: 4,
         
-        self.__nanowatts_per_cubic_meter = None
+        PowerDensityUnits.NanowattPerCubicMeter: 5,
         
-        self.__microwatts_per_cubic_meter = None
+        PowerDensityUnits.MicrowattPerCubicMeter: 6,
         
-        self.__milliwatts_per_cubic_meter = None
+        PowerDensityUnits.MilliwattPerCubicMeter: 7,
         
-        self.__deciwatts_per_cubic_meter = None
+        PowerDensityUnits.DeciwattPerCubicMeter: 8,
         
-        self.__decawatts_per_cubic_meter = None
+        PowerDensityUnits.DecawattPerCubicMeter: 9,
         
-        self.__kilowatts_per_cubic_meter = None
+        PowerDensityUnits.KilowattPerCubicMeter: 10,
         
-        self.__megawatts_per_cubic_meter = None
+        PowerDensityUnits.MegawattPerCubicMeter: 11,
         
-        self.__gigawatts_per_cubic_meter = None
+        PowerDensityUnits.GigawattPerCubicMeter: 12,
         
-        self.__terawatts_per_cubic_meter = None
+        PowerDensityUnits.TerawattPerCubicMeter: 13,
         
-        self.__picowatts_per_cubic_inch = None
+        PowerDensityUnits.PicowattPerCubicInch: 14,
         
-        self.__nanowatts_per_cubic_inch = None
+        PowerDensityUnits.NanowattPerCubicInch: 15,
         
-        self.__microwatts_per_cubic_inch = None
+        PowerDensityUnits.MicrowattPerCubicInch: 16,
         
-        self.__milliwatts_per_cubic_inch = None
+        PowerDensityUnits.MilliwattPerCubicInch: 17,
         
-        self.__deciwatts_per_cubic_inch = None
+        PowerDensityUnits.DeciwattPerCubicInch: 18,
         
-        self.__decawatts_per_cubic_inch = None
+        PowerDensityUnits.DecawattPerCubicInch: 19,
         
-        self.__kilowatts_per_cubic_inch = None
+        PowerDensityUnits.KilowattPerCubicInch: 20,
         
-        self.__megawatts_per_cubic_inch = None
+        PowerDensityUnits.MegawattPerCubicInch: 21,
         
-        self.__gigawatts_per_cubic_inch = None
+        PowerDensityUnits.GigawattPerCubicInch: 22,
         
-        self.__terawatts_per_cubic_inch = None
+        PowerDensityUnits.TerawattPerCubicInch: 23,
         
-        self.__picowatts_per_cubic_foot = None
+        PowerDensityUnits.PicowattPerCubicFoot: 24,
         
-        self.__nanowatts_per_cubic_foot = None
+        PowerDensityUnits.NanowattPerCubicFoot: 25,
         
-        self.__microwatts_per_cubic_foot = None
+        PowerDensityUnits.MicrowattPerCubicFoot: 26,
         
-        self.__milliwatts_per_cubic_foot = None
+        PowerDensityUnits.MilliwattPerCubicFoot: 27,
         
-        self.__deciwatts_per_cubic_foot = None
+        PowerDensityUnits.DeciwattPerCubicFoot: 28,
         
-        self.__decawatts_per_cubic_foot = None
+        PowerDensityUnits.DecawattPerCubicFoot: 29,
         
-        self.__kilowatts_per_cubic_foot = None
+        PowerDensityUnits.KilowattPerCubicFoot: 30,
         
-        self.__megawatts_per_cubic_foot = None
+        PowerDensityUnits.MegawattPerCubicFoot: 31,
         
-        self.__gigawatts_per_cubic_foot = None
+        PowerDensityUnits.GigawattPerCubicFoot: 32,
         
-        self.__terawatts_per_cubic_foot = None
+        PowerDensityUnits.TerawattPerCubicFoot: 33,
         
-        self.__picowatts_per_liter = None
+        PowerDensityUnits.PicowattPerLiter: 34,
         
-        self.__nanowatts_per_liter = None
+        PowerDensityUnits.NanowattPerLiter: 35,
         
-        self.__microwatts_per_liter = None
+        PowerDensityUnits.MicrowattPerLiter: 36,
         
-        self.__milliwatts_per_liter = None
+        PowerDensityUnits.MilliwattPerLiter: 37,
         
-        self.__deciwatts_per_liter = None
+        PowerDensityUnits.DeciwattPerLiter: 38,
         
-        self.__decawatts_per_liter = None
+        PowerDensityUnits.DecawattPerLiter: 39,
         
-        self.__kilowatts_per_liter = None
+        PowerDensityUnits.KilowattPerLiter: 40,
         
-        self.__megawatts_per_liter = None
+        PowerDensityUnits.MegawattPerLiter: 41,
         
-        self.__gigawatts_per_liter = None
+        PowerDensityUnits.GigawattPerLiter: 42,
         
-        self.__terawatts_per_liter = None
+        PowerDensityUnits.TerawattPerLiter: 43,
         
+    }
 
-    def convert(self, unit: PowerDensityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        PowerDensityUnits.WattPerCubicMeter: lambda value: (value),
+        
+        PowerDensityUnits.WattPerCubicInch: lambda value: (value / 6.102374409473228e4),
+        
+        PowerDensityUnits.WattPerCubicFoot: lambda value: (value / 3.531466672148859e1),
+        
+        PowerDensityUnits.WattPerLiter: lambda value: (value / 1.0e3),
+        
+        PowerDensityUnits.PicowattPerCubicMeter: lambda value: ((value) / 1e-12),
+        
+        PowerDensityUnits.NanowattPerCubicMeter: lambda value: ((value) / 1e-09),
+        
+        PowerDensityUnits.MicrowattPerCubicMeter: lambda value: ((value) / 1e-06),
+        
+        PowerDensityUnits.MilliwattPerCubicMeter: lambda value: ((value) / 0.001),
+        
+        PowerDensityUnits.DeciwattPerCubicMeter: lambda value: ((value) / 0.1),
+        
+        PowerDensityUnits.DecawattPerCubicMeter: lambda value: ((value) / 10.0),
+        
+        PowerDensityUnits.KilowattPerCubicMeter: lambda value: ((value) / 1000.0),
+        
+        PowerDensityUnits.MegawattPerCubicMeter: lambda value: ((value) / 1000000.0),
+        
+        PowerDensityUnits.GigawattPerCubicMeter: lambda value: ((value) / 1000000000.0),
+        
+        PowerDensityUnits.TerawattPerCubicMeter: lambda value: ((value) / 1000000000000.0),
+        
+        PowerDensityUnits.PicowattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 1e-12),
+        
+        PowerDensityUnits.NanowattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 1e-09),
+        
+        PowerDensityUnits.MicrowattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 1e-06),
+        
+        PowerDensityUnits.MilliwattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 0.001),
+        
+        PowerDensityUnits.DeciwattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 0.1),
+        
+        PowerDensityUnits.DecawattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 10.0),
+        
+        PowerDensityUnits.KilowattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 1000.0),
+        
+        PowerDensityUnits.MegawattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 1000000.0),
+        
+        PowerDensityUnits.GigawattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 1000000000.0),
+        
+        PowerDensityUnits.TerawattPerCubicInch: lambda value: ((value / 6.102374409473228e4) / 1000000000000.0),
+        
+        PowerDensityUnits.PicowattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 1e-12),
+        
+        PowerDensityUnits.NanowattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 1e-09),
+        
+        PowerDensityUnits.MicrowattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 1e-06),
+        
+        PowerDensityUnits.MilliwattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 0.001),
+        
+        PowerDensityUnits.DeciwattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 0.1),
+        
+        PowerDensityUnits.DecawattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 10.0),
+        
+        PowerDensityUnits.KilowattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 1000.0),
+        
+        PowerDensityUnits.MegawattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 1000000.0),
+        
+        PowerDensityUnits.GigawattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 1000000000.0),
+        
+        PowerDensityUnits.TerawattPerCubicFoot: lambda value: ((value / 3.531466672148859e1) / 1000000000000.0),
+        
+        PowerDensityUnits.PicowattPerLiter: lambda value: ((value / 1.0e3) / 1e-12),
+        
+        PowerDensityUnits.NanowattPerLiter: lambda value: ((value / 1.0e3) / 1e-09),
+        
+        PowerDensityUnits.MicrowattPerLiter: lambda value: ((value / 1.0e3) / 1e-06),
+        
+        PowerDensityUnits.MilliwattPerLiter: lambda value: ((value / 1.0e3) / 0.001),
+        
+        PowerDensityUnits.DeciwattPerLiter: lambda value: ((value / 1.0e3) / 0.1),
+        
+        PowerDensityUnits.DecawattPerLiter: lambda value: ((value / 1.0e3) / 10.0),
+        
+        PowerDensityUnits.KilowattPerLiter: lambda value: ((value / 1.0e3) / 1000.0),
+        
+        PowerDensityUnits.MegawattPerLiter: lambda value: ((value / 1.0e3) / 1000000.0),
+        
+        PowerDensityUnits.GigawattPerLiter: lambda value: ((value / 1.0e3) / 1000000000.0),
+        
+        PowerDensityUnits.TerawattPerLiter: lambda value: ((value / 1.0e3) / 1000000000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: PowerDensityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == PowerDensityUnits.WattPerCubicMeter:
-            return (value)
+        PowerDensityUnits.WattPerCubicMeter: lambda value: (value),
         
-        if from_unit == PowerDensityUnits.WattPerCubicInch:
-            return (value / 6.102374409473228e4)
+        PowerDensityUnits.WattPerCubicInch: lambda value: (value * 6.102374409473228e4),
         
-        if from_unit == PowerDensityUnits.WattPerCubicFoot:
-            return (value / 3.531466672148859e1)
+        PowerDensityUnits.WattPerCubicFoot: lambda value: (value * 3.531466672148859e1),
         
-        if from_unit == PowerDensityUnits.WattPerLiter:
-            return (value / 1.0e3)
+        PowerDensityUnits.WattPerLiter: lambda value: (value * 1.0e3),
         
-        if from_unit == PowerDensityUnits.PicowattPerCubicMeter:
-            return ((value) / 1e-12)
+        PowerDensityUnits.PicowattPerCubicMeter: lambda value: ((value) * 1e-12),
         
-        if from_unit == PowerDensityUnits.NanowattPerCubicMeter:
-            return ((value) / 1e-09)
+        PowerDensityUnits.NanowattPerCubicMeter: lambda value: ((value) * 1e-09),
         
-        if from_unit == PowerDensityUnits.MicrowattPerCubicMeter:
-            return ((value) / 1e-06)
+        PowerDensityUnits.MicrowattPerCubicMeter: lambda value: ((value) * 1e-06),
         
-        if from_unit == PowerDensityUnits.MilliwattPerCubicMeter:
-            return ((value) / 0.001)
+        PowerDensityUnits.MilliwattPerCubicMeter: lambda value: ((value) * 0.001),
         
-        if from_unit == PowerDensityUnits.DeciwattPerCubicMeter:
-            return ((value) / 0.1)
+        PowerDensityUnits.DeciwattPerCubicMeter: lambda value: ((value) * 0.1),
         
-        if from_unit == PowerDensityUnits.DecawattPerCubicMeter:
-            return ((value) / 10.0)
+        PowerDensityUnits.DecawattPerCubicMeter: lambda value: ((value) * 10.0),
         
-        if from_unit == PowerDensityUnits.KilowattPerCubicMeter:
-            return ((value) / 1000.0)
+        PowerDensityUnits.KilowattPerCubicMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == PowerDensityUnits.MegawattPerCubicMeter:
-            return ((value) / 1000000.0)
+        PowerDensityUnits.MegawattPerCubicMeter: lambda value: ((value) * 1000000.0),
         
-        if from_unit == PowerDensityUnits.GigawattPerCubicMeter:
-            return ((value) / 1000000000.0)
+        PowerDensityUnits.GigawattPerCubicMeter: lambda value: ((value) * 1000000000.0),
         
-        if from_unit == PowerDensityUnits.TerawattPerCubicMeter:
-            return ((value) / 1000000000000.0)
+        PowerDensityUnits.TerawattPerCubicMeter: lambda value: ((value) * 1000000000000.0),
         
-        if from_unit == PowerDensityUnits.PicowattPerCubicInch:
-            return ((value / 6.102374409473228e4) / 1e-12)
+        PowerDensityUnits.PicowattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 1e-12),
         
-        if from_unit == PowerDensityUnits.NanowattPerCubicInch:
-            return ((value / 6.102374409473228e4) / 1e-09)
+        PowerDensityUnits.NanowattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 1e-09),
         
-        if from_unit == PowerDensityUnits.MicrowattPerCubicInch:
-            return ((value / 6.102374409473228e4) / 1e-06)
+        PowerDensityUnits.MicrowattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 1e-06),
         
-        if from_unit == PowerDensityUnits.MilliwattPerCubicInch:
-            return ((value / 6.102374409473228e4) / 0.001)
+        PowerDensityUnits.MilliwattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 0.001),
         
-        if from_unit == PowerDensityUnits.DeciwattPerCubicInch:
-            return ((value / 6.102374409473228e4) / 0.1)
+        PowerDensityUnits.DeciwattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 0.1),
         
-        if from_unit == PowerDensityUnits.DecawattPerCubicInch:
-            return ((value / 6.102374409473228e4) / 10.0)
+        PowerDensityUnits.DecawattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 10.0),
         
-        if from_unit == PowerDensityUnits.KilowattPerCubicInch:
-            return ((value / 6.102374409473228e4) / 1000.0)
+        PowerDensityUnits.KilowattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 1000.0),
         
-        if from_unit == PowerDensityUnits.MegawattPerCubicInch:
-            return ((value / 6.102374409473228e4) / 1000000.0)
+        PowerDensityUnits.MegawattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 1000000.0),
         
-        if from_unit == PowerDensityUnits.GigawattPerCubicInch:
-            return ((value / 6.102374409473228e4) / 1000000000.0)
+        PowerDensityUnits.GigawattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 1000000000.0),
         
-        if from_unit == PowerDensityUnits.TerawattPerCubicInch:
-            return ((value / 6.102374409473228e4) / 1000000000000.0)
+        PowerDensityUnits.TerawattPerCubicInch: lambda value: ((value * 6.102374409473228e4) * 1000000000000.0),
         
-        if from_unit == PowerDensityUnits.PicowattPerCubicFoot:
-            return ((value / 3.531466672148859e1) / 1e-12)
+        PowerDensityUnits.PicowattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 1e-12),
         
-        if from_unit == PowerDensityUnits.NanowattPerCubicFoot:
-            return ((value / 3.531466672148859e1) / 1e-09)
+        PowerDensityUnits.NanowattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 1e-09),
         
-        if from_unit == PowerDensityUnits.MicrowattPerCubicFoot:
-            return ((value / 3.531466672148859e1) / 1e-06)
+        PowerDensityUnits.MicrowattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 1e-06),
         
-        if from_unit == PowerDensityUnits.MilliwattPerCubicFoot:
-            return ((value / 3.531466672148859e1) / 0.001)
+        PowerDensityUnits.MilliwattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 0.001),
         
-        if from_unit == PowerDensityUnits.DeciwattPerCubicFoot:
-            return ((value / 3.531466672148859e1) / 0.1)
+        PowerDensityUnits.DeciwattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 0.1),
         
-        if from_unit == PowerDensityUnits.DecawattPerCubicFoot:
-            return ((value / 3.531466672148859e1) / 10.0)
+        PowerDensityUnits.DecawattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 10.0),
         
-        if from_unit == PowerDensityUnits.KilowattPerCubicFoot:
-            return ((value / 3.531466672148859e1) / 1000.0)
+        PowerDensityUnits.KilowattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 1000.0),
         
-        if from_unit == PowerDensityUnits.MegawattPerCubicFoot:
-            return ((value / 3.531466672148859e1) / 1000000.0)
+        PowerDensityUnits.MegawattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 1000000.0),
         
-        if from_unit == PowerDensityUnits.GigawattPerCubicFoot:
-            return ((value / 3.531466672148859e1) / 1000000000.0)
+        PowerDensityUnits.GigawattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 1000000000.0),
         
-        if from_unit == PowerDensityUnits.TerawattPerCubicFoot:
-            return ((value / 3.531466672148859e1) / 1000000000000.0)
+        PowerDensityUnits.TerawattPerCubicFoot: lambda value: ((value * 3.531466672148859e1) * 1000000000000.0),
         
-        if from_unit == PowerDensityUnits.PicowattPerLiter:
-            return ((value / 1.0e3) / 1e-12)
+        PowerDensityUnits.PicowattPerLiter: lambda value: ((value * 1.0e3) * 1e-12),
         
-        if from_unit == PowerDensityUnits.NanowattPerLiter:
-            return ((value / 1.0e3) / 1e-09)
+        PowerDensityUnits.NanowattPerLiter: lambda value: ((value * 1.0e3) * 1e-09),
         
-        if from_unit == PowerDensityUnits.MicrowattPerLiter:
-            return ((value / 1.0e3) / 1e-06)
+        PowerDensityUnits.MicrowattPerLiter: lambda value: ((value * 1.0e3) * 1e-06),
         
-        if from_unit == PowerDensityUnits.MilliwattPerLiter:
-            return ((value / 1.0e3) / 0.001)
+        PowerDensityUnits.MilliwattPerLiter: lambda value: ((value * 1.0e3) * 0.001),
         
-        if from_unit == PowerDensityUnits.DeciwattPerLiter:
-            return ((value / 1.0e3) / 0.1)
+        PowerDensityUnits.DeciwattPerLiter: lambda value: ((value * 1.0e3) * 0.1),
         
-        if from_unit == PowerDensityUnits.DecawattPerLiter:
-            return ((value / 1.0e3) / 10.0)
+        PowerDensityUnits.DecawattPerLiter: lambda value: ((value * 1.0e3) * 10.0),
         
-        if from_unit == PowerDensityUnits.KilowattPerLiter:
-            return ((value / 1.0e3) / 1000.0)
+        PowerDensityUnits.KilowattPerLiter: lambda value: ((value * 1.0e3) * 1000.0),
         
-        if from_unit == PowerDensityUnits.MegawattPerLiter:
-            return ((value / 1.0e3) / 1000000.0)
+        PowerDensityUnits.MegawattPerLiter: lambda value: ((value * 1.0e3) * 1000000.0),
         
-        if from_unit == PowerDensityUnits.GigawattPerLiter:
-            return ((value / 1.0e3) / 1000000000.0)
+        PowerDensityUnits.GigawattPerLiter: lambda value: ((value * 1.0e3) * 1000000000.0),
         
-        if from_unit == PowerDensityUnits.TerawattPerLiter:
-            return ((value / 1.0e3) / 1000000000000.0)
+        PowerDensityUnits.TerawattPerLiter: lambda value: ((value * 1.0e3) * 1000000000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        PowerDensityUnits.WattPerCubicMeter: ('1', '0'),
+        
+        PowerDensityUnits.WattPerCubicInch: ('25000000000/1525593602368307', '0'),
+        
+        PowerDensityUnits.WattPerCubicFoot: ('100000000000000/3531466672148859', '0'),
+        
+        PowerDensityUnits.WattPerLiter: ('1/1000', '0'),
+        
+        PowerDensityUnits.PicowattPerCubicMeter: ('1000000000000', '0'),
+        
+        PowerDensityUnits.NanowattPerCubicMeter: ('1000000000', '0'),
+        
+        PowerDensityUnits.MicrowattPerCubicMeter: ('1000000', '0'),
+        
+        PowerDensityUnits.MilliwattPerCubicMeter: ('1000', '0'),
+        
+        PowerDensityUnits.DeciwattPerCubicMeter: ('10', '0'),
+        
+        PowerDensityUnits.DecawattPerCubicMeter: ('1/10', '0'),
+        
+        PowerDensityUnits.KilowattPerCubicMeter: ('1/1000', '0'),
+        
+        PowerDensityUnits.MegawattPerCubicMeter: ('1/1000000', '0'),
+        
+        PowerDensityUnits.GigawattPerCubicMeter: ('1/1000000000', '0'),
+        
+        PowerDensityUnits.TerawattPerCubicMeter: ('1/1000000000000', '0'),
+        
+        PowerDensityUnits.PicowattPerCubicInch: ('25000000000000000000000/1525593602368307', '0'),
+        
+        PowerDensityUnits.NanowattPerCubicInch: ('25000000000000000000/1525593602368307', '0'),
+        
+        PowerDensityUnits.MicrowattPerCubicInch: ('25000000000000000/1525593602368307', '0'),
+        
+        PowerDensityUnits.MilliwattPerCubicInch: ('25000000000000/1525593602368307', '0'),
+        
+        PowerDensityUnits.DeciwattPerCubicInch: ('250000000000/1525593602368307', '0'),
+        
+        PowerDensityUnits.DecawattPerCubicInch: ('2500000000/1525593602368307', '0'),
+        
+        PowerDensityUnits.KilowattPerCubicInch: ('25000000/1525593602368307', '0'),
+        
+        PowerDensityUnits.MegawattPerCubicInch: ('25000/1525593602368307', '0'),
+        
+        PowerDensityUnits.GigawattPerCubicInch: ('25/1525593602368307', '0'),
+        
+        PowerDensityUnits.TerawattPerCubicInch: ('1/61023744094732280', '0'),
+        
+        PowerDensityUnits.PicowattPerCubicFoot: ('100000000000000000000000000/3531466672148859', '0'),
+        
+        PowerDensityUnits.NanowattPerCubicFoot: ('100000000000000000000000/3531466672148859', '0'),
+        
+        PowerDensityUnits.MicrowattPerCubicFoot: ('100000000000000000000/3531466672148859', '0'),
+        
+        PowerDensityUnits.MilliwattPerCubicFoot: ('100000000000000000/3531466672148859', '0'),
+        
+        PowerDensityUnits.DeciwattPerCubicFoot: ('1000000000000000/3531466672148859', '0'),
+        
+        PowerDensityUnits.DecawattPerCubicFoot: ('10000000000000/3531466672148859', '0'),
+        
+        PowerDensityUnits.KilowattPerCubicFoot: ('100000000000/3531466672148859', '0'),
+        
+        PowerDensityUnits.MegawattPerCubicFoot: ('100000000/3531466672148859', '0'),
+        
+        PowerDensityUnits.GigawattPerCubicFoot: ('100000/3531466672148859', '0'),
+        
+        PowerDensityUnits.TerawattPerCubicFoot: ('100/3531466672148859', '0'),
+        
+        PowerDensityUnits.PicowattPerLiter: ('1000000000', '0'),
+        
+        PowerDensityUnits.NanowattPerLiter: ('1000000', '0'),
+        
+        PowerDensityUnits.MicrowattPerLiter: ('1000', '0'),
+        
+        PowerDensityUnits.MilliwattPerLiter: ('1', '0'),
+        
+        PowerDensityUnits.DeciwattPerLiter: ('1/100', '0'),
+        
+        PowerDensityUnits.DecawattPerLiter: ('1/10000', '0'),
+        
+        PowerDensityUnits.KilowattPerLiter: ('1/1000000', '0'),
+        
+        PowerDensityUnits.MegawattPerLiter: ('1/1000000000', '0'),
+        
+        PowerDensityUnits.GigawattPerLiter: ('1/1000000000000', '0'),
+        
+        PowerDensityUnits.TerawattPerLiter: ('1/1000000000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: PowerDensityUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == PowerDensityUnits.WattPerCubicMeter:
-            return (value)
+        PowerDensityUnits.WattPerCubicMeter: ('1', '0'),
         
-        if to_unit == PowerDensityUnits.WattPerCubicInch:
-            return (value * 6.102374409473228e4)
+        PowerDensityUnits.WattPerCubicInch: ('1525593602368307/25000000000', '0'),
         
-        if to_unit == PowerDensityUnits.WattPerCubicFoot:
-            return (value * 3.531466672148859e1)
+        PowerDensityUnits.WattPerCubicFoot: ('3531466672148859/100000000000000', '0'),
         
-        if to_unit == PowerDensityUnits.WattPerLiter:
-            return (value * 1.0e3)
+        PowerDensityUnits.WattPerLiter: ('1000', '0'),
         
-        if to_unit == PowerDensityUnits.PicowattPerCubicMeter:
-            return ((value) * 1e-12)
+        PowerDensityUnits.PicowattPerCubicMeter: ('1/1000000000000', '0'),
         
-        if to_unit == PowerDensityUnits.NanowattPerCubicMeter:
-            return ((value) * 1e-09)
+        PowerDensityUnits.NanowattPerCubicMeter: ('1/1000000000', '0'),
         
-        if to_unit == PowerDensityUnits.MicrowattPerCubicMeter:
-            return ((value) * 1e-06)
+        PowerDensityUnits.MicrowattPerCubicMeter: ('1/1000000', '0'),
         
-        if to_unit == PowerDensityUnits.MilliwattPerCubicMeter:
-            return ((value) * 0.001)
+        PowerDensityUnits.MilliwattPerCubicMeter: ('1/1000', '0'),
         
-        if to_unit == PowerDensityUnits.DeciwattPerCubicMeter:
-            return ((value) * 0.1)
+        PowerDensityUnits.DeciwattPerCubicMeter: ('1/10', '0'),
         
-        if to_unit == PowerDensityUnits.DecawattPerCubicMeter:
-            return ((value) * 10.0)
+        PowerDensityUnits.DecawattPerCubicMeter: ('10', '0'),
         
-        if to_unit == PowerDensityUnits.KilowattPerCubicMeter:
-            return ((value) * 1000.0)
+        PowerDensityUnits.KilowattPerCubicMeter: ('1000', '0'),
         
-        if to_unit == PowerDensityUnits.MegawattPerCubicMeter:
-            return ((value) * 1000000.0)
+        PowerDensityUnits.MegawattPerCubicMeter: ('1000000', '0'),
         
-        if to_unit == PowerDensityUnits.GigawattPerCubicMeter:
-            return ((value) * 1000000000.0)
+        PowerDensityUnits.GigawattPerCubicMeter: ('1000000000', '0'),
         
-        if to_unit == PowerDensityUnits.TerawattPerCubicMeter:
-            return ((value) * 1000000000000.0)
+        PowerDensityUnits.TerawattPerCubicMeter: ('1000000000000', '0'),
         
-        if to_unit == PowerDensityUnits.PicowattPerCubicInch:
-            return ((value * 6.102374409473228e4) * 1e-12)
+        PowerDensityUnits.PicowattPerCubicInch: ('1525593602368307/25000000000000000000000', '0'),
         
-        if to_unit == PowerDensityUnits.NanowattPerCubicInch:
-            return ((value * 6.102374409473228e4) * 1e-09)
+        PowerDensityUnits.NanowattPerCubicInch: ('1525593602368307/25000000000000000000', '0'),
         
-        if to_unit == PowerDensityUnits.MicrowattPerCubicInch:
-            return ((value * 6.102374409473228e4) * 1e-06)
+        PowerDensityUnits.MicrowattPerCubicInch: ('1525593602368307/25000000000000000', '0'),
         
-        if to_unit == PowerDensityUnits.MilliwattPerCubicInch:
-            return ((value * 6.102374409473228e4) * 0.001)
+        PowerDensityUnits.MilliwattPerCubicInch: ('1525593602368307/25000000000000', '0'),
         
-        if to_unit == PowerDensityUnits.DeciwattPerCubicInch:
-            return ((value * 6.102374409473228e4) * 0.1)
+        PowerDensityUnits.DeciwattPerCubicInch: ('1525593602368307/250000000000', '0'),
         
-        if to_unit == PowerDensityUnits.DecawattPerCubicInch:
-            return ((value * 6.102374409473228e4) * 10.0)
+        PowerDensityUnits.DecawattPerCubicInch: ('1525593602368307/2500000000', '0'),
         
-        if to_unit == PowerDensityUnits.KilowattPerCubicInch:
-            return ((value * 6.102374409473228e4) * 1000.0)
+        PowerDensityUnits.KilowattPerCubicInch: ('1525593602368307/25000000', '0'),
         
-        if to_unit == PowerDensityUnits.MegawattPerCubicInch:
-            return ((value * 6.102374409473228e4) * 1000000.0)
+        PowerDensityUnits.MegawattPerCubicInch: ('1525593602368307/25000', '0'),
         
-        if to_unit == PowerDensityUnits.GigawattPerCubicInch:
-            return ((value * 6.102374409473228e4) * 1000000000.0)
+        PowerDensityUnits.GigawattPerCubicInch: ('1525593602368307/25', '0'),
         
-        if to_unit == PowerDensityUnits.TerawattPerCubicInch:
-            return ((value * 6.102374409473228e4) * 1000000000000.0)
+        PowerDensityUnits.TerawattPerCubicInch: ('61023744094732280', '0'),
         
-        if to_unit == PowerDensityUnits.PicowattPerCubicFoot:
-            return ((value * 3.531466672148859e1) * 1e-12)
+        PowerDensityUnits.PicowattPerCubicFoot: ('3531466672148859/100000000000000000000000000', '0'),
         
-        if to_unit == PowerDensityUnits.NanowattPerCubicFoot:
-            return ((value * 3.531466672148859e1) * 1e-09)
+        PowerDensityUnits.NanowattPerCubicFoot: ('3531466672148859/100000000000000000000000', '0'),
         
-        if to_unit == PowerDensityUnits.MicrowattPerCubicFoot:
-            return ((value * 3.531466672148859e1) * 1e-06)
+        PowerDensityUnits.MicrowattPerCubicFoot: ('3531466672148859/100000000000000000000', '0'),
         
-        if to_unit == PowerDensityUnits.MilliwattPerCubicFoot:
-            return ((value * 3.531466672148859e1) * 0.001)
+        PowerDensityUnits.MilliwattPerCubicFoot: ('3531466672148859/100000000000000000', '0'),
         
-        if to_unit == PowerDensityUnits.DeciwattPerCubicFoot:
-            return ((value * 3.531466672148859e1) * 0.1)
+        PowerDensityUnits.DeciwattPerCubicFoot: ('3531466672148859/1000000000000000', '0'),
         
-        if to_unit == PowerDensityUnits.DecawattPerCubicFoot:
-            return ((value * 3.531466672148859e1) * 10.0)
+        PowerDensityUnits.DecawattPerCubicFoot: ('3531466672148859/10000000000000', '0'),
         
-        if to_unit == PowerDensityUnits.KilowattPerCubicFoot:
-            return ((value * 3.531466672148859e1) * 1000.0)
+        PowerDensityUnits.KilowattPerCubicFoot: ('3531466672148859/100000000000', '0'),
         
-        if to_unit == PowerDensityUnits.MegawattPerCubicFoot:
-            return ((value * 3.531466672148859e1) * 1000000.0)
+        PowerDensityUnits.MegawattPerCubicFoot: ('3531466672148859/100000000', '0'),
         
-        if to_unit == PowerDensityUnits.GigawattPerCubicFoot:
-            return ((value * 3.531466672148859e1) * 1000000000.0)
+        PowerDensityUnits.GigawattPerCubicFoot: ('3531466672148859/100000', '0'),
         
-        if to_unit == PowerDensityUnits.TerawattPerCubicFoot:
-            return ((value * 3.531466672148859e1) * 1000000000000.0)
+        PowerDensityUnits.TerawattPerCubicFoot: ('3531466672148859/100', '0'),
         
-        if to_unit == PowerDensityUnits.PicowattPerLiter:
-            return ((value * 1.0e3) * 1e-12)
+        PowerDensityUnits.PicowattPerLiter: ('1/1000000000', '0'),
         
-        if to_unit == PowerDensityUnits.NanowattPerLiter:
-            return ((value * 1.0e3) * 1e-09)
+        PowerDensityUnits.NanowattPerLiter: ('1/1000000', '0'),
         
-        if to_unit == PowerDensityUnits.MicrowattPerLiter:
-            return ((value * 1.0e3) * 1e-06)
+        PowerDensityUnits.MicrowattPerLiter: ('1/1000', '0'),
         
-        if to_unit == PowerDensityUnits.MilliwattPerLiter:
-            return ((value * 1.0e3) * 0.001)
+        PowerDensityUnits.MilliwattPerLiter: ('1', '0'),
         
-        if to_unit == PowerDensityUnits.DeciwattPerLiter:
-            return ((value * 1.0e3) * 0.1)
+        PowerDensityUnits.DeciwattPerLiter: ('100', '0'),
         
-        if to_unit == PowerDensityUnits.DecawattPerLiter:
-            return ((value * 1.0e3) * 10.0)
+        PowerDensityUnits.DecawattPerLiter: ('10000', '0'),
         
-        if to_unit == PowerDensityUnits.KilowattPerLiter:
-            return ((value * 1.0e3) * 1000.0)
+        PowerDensityUnits.KilowattPerLiter: ('1000000', '0'),
         
-        if to_unit == PowerDensityUnits.MegawattPerLiter:
-            return ((value * 1.0e3) * 1000000.0)
+        PowerDensityUnits.MegawattPerLiter: ('1000000000', '0'),
         
-        if to_unit == PowerDensityUnits.GigawattPerLiter:
-            return ((value * 1.0e3) * 1000000000.0)
+        PowerDensityUnits.GigawattPerLiter: ('1000000000000', '0'),
         
-        if to_unit == PowerDensityUnits.TerawattPerLiter:
-            return ((value * 1.0e3) * 1000000000000.0)
+        PowerDensityUnits.TerawattPerLiter: ('1000000000000000', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        PowerDensityUnits.WattPerCubicMeter: ('W/m³',),
+        
+        PowerDensityUnits.WattPerCubicInch: ('W/in³',),
+        
+        PowerDensityUnits.WattPerCubicFoot: ('W/ft³',),
+        
+        PowerDensityUnits.WattPerLiter: ('W/l',),
+        
+        PowerDensityUnits.PicowattPerCubicMeter: ('pW/m³',),
+        
+        PowerDensityUnits.NanowattPerCubicMeter: ('nW/m³',),
+        
+        PowerDensityUnits.MicrowattPerCubicMeter: ('μW/m³',),
+        
+        PowerDensityUnits.MilliwattPerCubicMeter: ('mW/m³',),
+        
+        PowerDensityUnits.DeciwattPerCubicMeter: ('dW/m³',),
+        
+        PowerDensityUnits.DecawattPerCubicMeter: ('daW/m³',),
+        
+        PowerDensityUnits.KilowattPerCubicMeter: ('kW/m³',),
+        
+        PowerDensityUnits.MegawattPerCubicMeter: ('MW/m³',),
+        
+        PowerDensityUnits.GigawattPerCubicMeter: ('GW/m³',),
+        
+        PowerDensityUnits.TerawattPerCubicMeter: ('TW/m³',),
+        
+        PowerDensityUnits.PicowattPerCubicInch: ('pW/in³',),
+        
+        PowerDensityUnits.NanowattPerCubicInch: ('nW/in³',),
+        
+        PowerDensityUnits.MicrowattPerCubicInch: ('μW/in³',),
+        
+        PowerDensityUnits.MilliwattPerCubicInch: ('mW/in³',),
+        
+        PowerDensityUnits.DeciwattPerCubicInch: ('dW/in³',),
+        
+        PowerDensityUnits.DecawattPerCubicInch: ('daW/in³',),
+        
+        PowerDensityUnits.KilowattPerCubicInch: ('kW/in³',),
+        
+        PowerDensityUnits.MegawattPerCubicInch: ('MW/in³',),
+        
+        PowerDensityUnits.GigawattPerCubicInch: ('GW/in³',),
+        
+        PowerDensityUnits.TerawattPerCubicInch: ('TW/in³',),
+        
+        PowerDensityUnits.PicowattPerCubicFoot: ('pW/ft³',),
+        
+        PowerDensityUnits.NanowattPerCubicFoot: ('nW/ft³',),
+        
+        PowerDensityUnits.MicrowattPerCubicFoot: ('μW/ft³',),
+        
+        PowerDensityUnits.MilliwattPerCubicFoot: ('mW/ft³',),
+        
+        PowerDensityUnits.DeciwattPerCubicFoot: ('dW/ft³',),
+        
+        PowerDensityUnits.DecawattPerCubicFoot: ('daW/ft³',),
+        
+        PowerDensityUnits.KilowattPerCubicFoot: ('kW/ft³',),
+        
+        PowerDensityUnits.MegawattPerCubicFoot: ('MW/ft³',),
+        
+        PowerDensityUnits.GigawattPerCubicFoot: ('GW/ft³',),
+        
+        PowerDensityUnits.TerawattPerCubicFoot: ('TW/ft³',),
+        
+        PowerDensityUnits.PicowattPerLiter: ('pW/l',),
+        
+        PowerDensityUnits.NanowattPerLiter: ('nW/l',),
+        
+        PowerDensityUnits.MicrowattPerLiter: ('μW/l',),
+        
+        PowerDensityUnits.MilliwattPerLiter: ('mW/l',),
+        
+        PowerDensityUnits.DeciwattPerLiter: ('dW/l',),
+        
+        PowerDensityUnits.DecawattPerLiter: ('daW/l',),
+        
+        PowerDensityUnits.KilowattPerLiter: ('kW/l',),
+        
+        PowerDensityUnits.MegawattPerLiter: ('MW/l',),
+        
+        PowerDensityUnits.GigawattPerLiter: ('GW/l',),
+        
+        PowerDensityUnits.TerawattPerLiter: ('TW/l',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: PowerDensityUnits = PowerDensityUnits.WattPerCubicMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: PowerDensityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: PowerDensityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: PowerDensityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: PowerDensityUnits, to_unit: PowerDensityUnits) -> float:
+        """
+        Convert a value from one PowerDensity unit to another, without creating a PowerDensity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: PowerDensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: PowerDensityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return PowerDensity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: PowerDensityUnits, to_unit: PowerDensityUnits) -> List[float]:
+        """
+        Convert many values from one PowerDensity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: PowerDensityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: PowerDensityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return PowerDensity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: PowerDensityUnits, to_unit: PowerDensityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", PowerDensity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: PowerDensityUnits, to_unit: PowerDensityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one PowerDensity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: PowerDensityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: PowerDensityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return PowerDensity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: PowerDensityUnits = PowerDensityUnits.WattPerCubicMeter) -> PowerDensity:
+        """
+        Create a new instance of PowerDensity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: PowerDensityUnits
+        :return: A new instance of PowerDensity.
+        :rtype: PowerDensity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return PowerDensity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: PowerDensityUnits = PowerDensityUnits.WattPerCubicMeter) -> Fraction:
+        """
+        Get the exact value of the PowerDensity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (WattPerCubicMeter).
+        :type unit: PowerDensityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> PowerDensity:
+        """
+        Parse a PowerDensity from a value followed by a unit abbreviation, e.g. "1 W/m³".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of PowerDensity.
+        :rtype: PowerDensity
+        :raises ValueError: When the string is not a valid or an ambiguous PowerDensity.
+        """
+        return PowerDensity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[PowerDensity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return PowerDensity._try_parse(text)
+
+    def to_binary(self, unit: Optional[PowerDensityUnits] = None) -> bytes:
+        """
+        Encode the PowerDensity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: PowerDensityUnits
+        :return: The encoded PowerDensity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> PowerDensity:
+        """
+        Decode a PowerDensity encoded by to_binary.
+
+        :param data: The encoded PowerDensity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of PowerDensity.
+        :rtype: PowerDensity
+        :raises ValueError: When the data is not a valid encoded PowerDensity.
+        """
+        return PowerDensity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[PowerDensityUnits] = None) -> dict:
+        """
+        Get the PowerDensity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (WattPerCubicMeter).
+        :type hold_in_unit: PowerDensityUnits
+        :return: The PowerDensity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[PowerDensityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> PowerDensity:
+        """
+        Create a new instance of PowerDensity from its DTO.
+
+        :param dto: The PowerDensity DTO, the unit is the PowerDensityUnits value or name.
+        :type dto: dict
+        :return: A new instance of PowerDensity.
+        :rtype: PowerDensity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return PowerDensity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> PowerDensity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return PowerDensity._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -1281,10 +1675,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_cubic_meter != None:
-            return self.__watts_per_cubic_meter
-        self.__watts_per_cubic_meter = self.__convert_from_base(PowerDensityUnits.WattPerCubicMeter)
-        return self.__watts_per_cubic_meter
+        return self._cached_convert(PowerDensityUnits.WattPerCubicMeter)
 
     
     @property
@@ -1292,10 +1683,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_cubic_inch != None:
-            return self.__watts_per_cubic_inch
-        self.__watts_per_cubic_inch = self.__convert_from_base(PowerDensityUnits.WattPerCubicInch)
-        return self.__watts_per_cubic_inch
+        return self._cached_convert(PowerDensityUnits.WattPerCubicInch)
 
     
     @property
@@ -1303,10 +1691,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_cubic_foot != None:
-            return self.__watts_per_cubic_foot
-        self.__watts_per_cubic_foot = self.__convert_from_base(PowerDensityUnits.WattPerCubicFoot)
-        return self.__watts_per_cubic_foot
+        return self._cached_convert(PowerDensityUnits.WattPerCubicFoot)
 
     
     @property
@@ -1314,10 +1699,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_liter != None:
-            return self.__watts_per_liter
-        self.__watts_per_liter = self.__convert_from_base(PowerDensityUnits.WattPerLiter)
-        return self.__watts_per_liter
+        return self._cached_convert(PowerDensityUnits.WattPerLiter)
 
     
     @property
@@ -1325,10 +1707,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__picowatts_per_cubic_meter != None:
-            return self.__picowatts_per_cubic_meter
-        self.__picowatts_per_cubic_meter = self.__convert_from_base(PowerDensityUnits.PicowattPerCubicMeter)
-        return self.__picowatts_per_cubic_meter
+        return self._cached_convert(PowerDensityUnits.PicowattPerCubicMeter)
 
     
     @property
@@ -1336,10 +1715,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__nanowatts_per_cubic_meter != None:
-            return self.__nanowatts_per_cubic_meter
-        self.__nanowatts_per_cubic_meter = self.__convert_from_base(PowerDensityUnits.NanowattPerCubicMeter)
-        return self.__nanowatts_per_cubic_meter
+        return self._cached_convert(PowerDensityUnits.NanowattPerCubicMeter)
 
     
     @property
@@ -1347,10 +1723,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__microwatts_per_cubic_meter != None:
-            return self.__microwatts_per_cubic_meter
-        self.__microwatts_per_cubic_meter = self.__convert_from_base(PowerDensityUnits.MicrowattPerCubicMeter)
-        return self.__microwatts_per_cubic_meter
+        return self._cached_convert(PowerDensityUnits.MicrowattPerCubicMeter)
 
     
     @property
@@ -1358,10 +1731,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__milliwatts_per_cubic_meter != None:
-            return self.__milliwatts_per_cubic_meter
-        self.__milliwatts_per_cubic_meter = self.__convert_from_base(PowerDensityUnits.MilliwattPerCubicMeter)
-        return self.__milliwatts_per_cubic_meter
+        return self._cached_convert(PowerDensityUnits.MilliwattPerCubicMeter)
 
     
     @property
@@ -1369,10 +1739,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__deciwatts_per_cubic_meter != None:
-            return self.__deciwatts_per_cubic_meter
-        self.__deciwatts_per_cubic_meter = self.__convert_from_base(PowerDensityUnits.DeciwattPerCubicMeter)
-        return self.__deciwatts_per_cubic_meter
+        return self._cached_convert(PowerDensityUnits.DeciwattPerCubicMeter)
 
     
     @property
@@ -1380,10 +1747,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__decawatts_per_cubic_meter != None:
-            return self.__decawatts_per_cubic_meter
-        self.__decawatts_per_cubic_meter = self.__convert_from_base(PowerDensityUnits.DecawattPerCubicMeter)
-        return self.__decawatts_per_cubic_meter
+        return self._cached_convert(PowerDensityUnits.DecawattPerCubicMeter)
 
     
     @property
@@ -1391,10 +1755,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilowatts_per_cubic_meter != None:
-            return self.__kilowatts_per_cubic_meter
-        self.__kilowatts_per_cubic_meter = self.__convert_from_base(PowerDensityUnits.KilowattPerCubicMeter)
-        return self.__kilowatts_per_cubic_meter
+        return self._cached_convert(PowerDensityUnits.KilowattPerCubicMeter)
 
     
     @property
@@ -1402,10 +1763,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__megawatts_per_cubic_meter != None:
-            return self.__megawatts_per_cubic_meter
-        self.__megawatts_per_cubic_meter = self.__convert_from_base(PowerDensityUnits.MegawattPerCubicMeter)
-        return self.__megawatts_per_cubic_meter
+        return self._cached_convert(PowerDensityUnits.MegawattPerCubicMeter)
 
     
     @property
@@ -1413,10 +1771,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__gigawatts_per_cubic_meter != None:
-            return self.__gigawatts_per_cubic_meter
-        self.__gigawatts_per_cubic_meter = self.__convert_from_base(PowerDensityUnits.GigawattPerCubicMeter)
-        return self.__gigawatts_per_cubic_meter
+        return self._cached_convert(PowerDensityUnits.GigawattPerCubicMeter)
 
     
     @property
@@ -1424,10 +1779,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__terawatts_per_cubic_meter != None:
-            return self.__terawatts_per_cubic_meter
-        self.__terawatts_per_cubic_meter = self.__convert_from_base(PowerDensityUnits.TerawattPerCubicMeter)
-        return self.__terawatts_per_cubic_meter
+        return self._cached_convert(PowerDensityUnits.TerawattPerCubicMeter)
 
     
     @property
@@ -1435,10 +1787,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__picowatts_per_cubic_inch != None:
-            return self.__picowatts_per_cubic_inch
-        self.__picowatts_per_cubic_inch = self.__convert_from_base(PowerDensityUnits.PicowattPerCubicInch)
-        return self.__picowatts_per_cubic_inch
+        return self._cached_convert(PowerDensityUnits.PicowattPerCubicInch)
 
     
     @property
@@ -1446,10 +1795,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__nanowatts_per_cubic_inch != None:
-            return self.__nanowatts_per_cubic_inch
-        self.__nanowatts_per_cubic_inch = self.__convert_from_base(PowerDensityUnits.NanowattPerCubicInch)
-        return self.__nanowatts_per_cubic_inch
+        return self._cached_convert(PowerDensityUnits.NanowattPerCubicInch)
 
     
     @property
@@ -1457,10 +1803,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__microwatts_per_cubic_inch != None:
-            return self.__microwatts_per_cubic_inch
-        self.__microwatts_per_cubic_inch = self.__convert_from_base(PowerDensityUnits.MicrowattPerCubicInch)
-        return self.__microwatts_per_cubic_inch
+        return self._cached_convert(PowerDensityUnits.MicrowattPerCubicInch)
 
     
     @property
@@ -1468,10 +1811,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__milliwatts_per_cubic_inch != None:
-            return self.__milliwatts_per_cubic_inch
-        self.__milliwatts_per_cubic_inch = self.__convert_from_base(PowerDensityUnits.MilliwattPerCubicInch)
-        return self.__milliwatts_per_cubic_inch
+        return self._cached_convert(PowerDensityUnits.MilliwattPerCubicInch)
 
     
     @property
@@ -1479,10 +1819,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__deciwatts_per_cubic_inch != None:
-            return self.__deciwatts_per_cubic_inch
-        self.__deciwatts_per_cubic_inch = self.__convert_from_base(PowerDensityUnits.DeciwattPerCubicInch)
-        return self.__deciwatts_per_cubic_inch
+        return self._cached_convert(PowerDensityUnits.DeciwattPerCubicInch)
 
     
     @property
@@ -1490,10 +1827,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__decawatts_per_cubic_inch != None:
-            return self.__decawatts_per_cubic_inch
-        self.__decawatts_per_cubic_inch = self.__convert_from_base(PowerDensityUnits.DecawattPerCubicInch)
-        return self.__decawatts_per_cubic_inch
+        return self._cached_convert(PowerDensityUnits.DecawattPerCubicInch)
 
     
     @property
@@ -1501,10 +1835,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilowatts_per_cubic_inch != None:
-            return self.__kilowatts_per_cubic_inch
-        self.__kilowatts_per_cubic_inch = self.__convert_from_base(PowerDensityUnits.KilowattPerCubicInch)
-        return self.__kilowatts_per_cubic_inch
+        return self._cached_convert(PowerDensityUnits.KilowattPerCubicInch)
 
     
     @property
@@ -1512,10 +1843,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__megawatts_per_cubic_inch != None:
-            return self.__megawatts_per_cubic_inch
-        self.__megawatts_per_cubic_inch = self.__convert_from_base(PowerDensityUnits.MegawattPerCubicInch)
-        return self.__megawatts_per_cubic_inch
+        return self._cached_convert(PowerDensityUnits.MegawattPerCubicInch)
 
     
     @property
@@ -1523,10 +1851,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__gigawatts_per_cubic_inch != None:
-            return self.__gigawatts_per_cubic_inch
-        self.__gigawatts_per_cubic_inch = self.__convert_from_base(PowerDensityUnits.GigawattPerCubicInch)
-        return self.__gigawatts_per_cubic_inch
+        return self._cached_convert(PowerDensityUnits.GigawattPerCubicInch)
 
     
     @property
@@ -1534,10 +1859,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__terawatts_per_cubic_inch != None:
-            return self.__terawatts_per_cubic_inch
-        self.__terawatts_per_cubic_inch = self.__convert_from_base(PowerDensityUnits.TerawattPerCubicInch)
-        return self.__terawatts_per_cubic_inch
+        return self._cached_convert(PowerDensityUnits.TerawattPerCubicInch)
 
     
     @property
@@ -1545,10 +1867,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__picowatts_per_cubic_foot != None:
-            return self.__picowatts_per_cubic_foot
-        self.__picowatts_per_cubic_foot = self.__convert_from_base(PowerDensityUnits.PicowattPerCubicFoot)
-        return self.__picowatts_per_cubic_foot
+        return self._cached_convert(PowerDensityUnits.PicowattPerCubicFoot)
 
     
     @property
@@ -1556,10 +1875,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__nanowatts_per_cubic_foot != None:
-            return self.__nanowatts_per_cubic_foot
-        self.__nanowatts_per_cubic_foot = self.__convert_from_base(PowerDensityUnits.NanowattPerCubicFoot)
-        return self.__nanowatts_per_cubic_foot
+        return self._cached_convert(PowerDensityUnits.NanowattPerCubicFoot)
 
     
     @property
@@ -1567,10 +1883,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__microwatts_per_cubic_foot != None:
-            return self.__microwatts_per_cubic_foot
-        self.__microwatts_per_cubic_foot = self.__convert_from_base(PowerDensityUnits.MicrowattPerCubicFoot)
-        return self.__microwatts_per_cubic_foot
+        return self._cached_convert(PowerDensityUnits.MicrowattPerCubicFoot)
 
     
     @property
@@ -1578,10 +1891,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__milliwatts_per_cubic_foot != None:
-            return self.__milliwatts_per_cubic_foot
-        self.__milliwatts_per_cubic_foot = self.__convert_from_base(PowerDensityUnits.MilliwattPerCubicFoot)
-        return self.__milliwatts_per_cubic_foot
+        return self._cached_convert(PowerDensityUnits.MilliwattPerCubicFoot)
 
     
     @property
@@ -1589,10 +1899,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__deciwatts_per_cubic_foot != None:
-            return self.__deciwatts_per_cubic_foot
-        self.__deciwatts_per_cubic_foot = self.__convert_from_base(PowerDensityUnits.DeciwattPerCubicFoot)
-        return self.__deciwatts_per_cubic_foot
+        return self._cached_convert(PowerDensityUnits.DeciwattPerCubicFoot)
 
     
     @property
@@ -1600,10 +1907,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__decawatts_per_cubic_foot != None:
-            return self.__decawatts_per_cubic_foot
-        self.__decawatts_per_cubic_foot = self.__convert_from_base(PowerDensityUnits.DecawattPerCubicFoot)
-        return self.__decawatts_per_cubic_foot
+        return self._cached_convert(PowerDensityUnits.DecawattPerCubicFoot)
 
     
     @property
@@ -1611,10 +1915,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilowatts_per_cubic_foot != None:
-            return self.__kilowatts_per_cubic_foot
-        self.__kilowatts_per_cubic_foot = self.__convert_from_base(PowerDensityUnits.KilowattPerCubicFoot)
-        return self.__kilowatts_per_cubic_foot
+        return self._cached_convert(PowerDensityUnits.KilowattPerCubicFoot)
 
     
     @property
@@ -1622,10 +1923,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__megawatts_per_cubic_foot != None:
-            return self.__megawatts_per_cubic_foot
-        self.__megawatts_per_cubic_foot = self.__convert_from_base(PowerDensityUnits.MegawattPerCubicFoot)
-        return self.__megawatts_per_cubic_foot
+        return self._cached_convert(PowerDensityUnits.MegawattPerCubicFoot)
 
     
     @property
@@ -1633,10 +1931,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__gigawatts_per_cubic_foot != None:
-            return self.__gigawatts_per_cubic_foot
-        self.__gigawatts_per_cubic_foot = self.__convert_from_base(PowerDensityUnits.GigawattPerCubicFoot)
-        return self.__gigawatts_per_cubic_foot
+        return self._cached_convert(PowerDensityUnits.GigawattPerCubicFoot)
 
     
     @property
@@ -1644,10 +1939,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__terawatts_per_cubic_foot != None:
-            return self.__terawatts_per_cubic_foot
-        self.__terawatts_per_cubic_foot = self.__convert_from_base(PowerDensityUnits.TerawattPerCubicFoot)
-        return self.__terawatts_per_cubic_foot
+        return self._cached_convert(PowerDensityUnits.TerawattPerCubicFoot)
 
     
     @property
@@ -1655,10 +1947,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__picowatts_per_liter != None:
-            return self.__picowatts_per_liter
-        self.__picowatts_per_liter = self.__convert_from_base(PowerDensityUnits.PicowattPerLiter)
-        return self.__picowatts_per_liter
+        return self._cached_convert(PowerDensityUnits.PicowattPerLiter)
 
     
     @property
@@ -1666,10 +1955,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__nanowatts_per_liter != None:
-            return self.__nanowatts_per_liter
-        self.__nanowatts_per_liter = self.__convert_from_base(PowerDensityUnits.NanowattPerLiter)
-        return self.__nanowatts_per_liter
+        return self._cached_convert(PowerDensityUnits.NanowattPerLiter)
 
     
     @property
@@ -1677,10 +1963,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__microwatts_per_liter != None:
-            return self.__microwatts_per_liter
-        self.__microwatts_per_liter = self.__convert_from_base(PowerDensityUnits.MicrowattPerLiter)
-        return self.__microwatts_per_liter
+        return self._cached_convert(PowerDensityUnits.MicrowattPerLiter)
 
     
     @property
@@ -1688,10 +1971,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__milliwatts_per_liter != None:
-            return self.__milliwatts_per_liter
-        self.__milliwatts_per_liter = self.__convert_from_base(PowerDensityUnits.MilliwattPerLiter)
-        return self.__milliwatts_per_liter
+        return self._cached_convert(PowerDensityUnits.MilliwattPerLiter)
 
     
     @property
@@ -1699,10 +1979,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__deciwatts_per_liter != None:
-            return self.__deciwatts_per_liter
-        self.__deciwatts_per_liter = self.__convert_from_base(PowerDensityUnits.DeciwattPerLiter)
-        return self.__deciwatts_per_liter
+        return self._cached_convert(PowerDensityUnits.DeciwattPerLiter)
 
     
     @property
@@ -1710,10 +1987,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__decawatts_per_liter != None:
-            return self.__decawatts_per_liter
-        self.__decawatts_per_liter = self.__convert_from_base(PowerDensityUnits.DecawattPerLiter)
-        return self.__decawatts_per_liter
+        return self._cached_convert(PowerDensityUnits.DecawattPerLiter)
 
     
     @property
@@ -1721,10 +1995,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__kilowatts_per_liter != None:
-            return self.__kilowatts_per_liter
-        self.__kilowatts_per_liter = self.__convert_from_base(PowerDensityUnits.KilowattPerLiter)
-        return self.__kilowatts_per_liter
+        return self._cached_convert(PowerDensityUnits.KilowattPerLiter)
 
     
     @property
@@ -1732,10 +2003,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__megawatts_per_liter != None:
-            return self.__megawatts_per_liter
-        self.__megawatts_per_liter = self.__convert_from_base(PowerDensityUnits.MegawattPerLiter)
-        return self.__megawatts_per_liter
+        return self._cached_convert(PowerDensityUnits.MegawattPerLiter)
 
     
     @property
@@ -1743,10 +2011,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__gigawatts_per_liter != None:
-            return self.__gigawatts_per_liter
-        self.__gigawatts_per_liter = self.__convert_from_base(PowerDensityUnits.GigawattPerLiter)
-        return self.__gigawatts_per_liter
+        return self._cached_convert(PowerDensityUnits.GigawattPerLiter)
 
     
     @property
@@ -1754,10 +2019,7 @@ class PowerDensity(AbstractMeasure):
         """
         
         """
-        if self.__terawatts_per_liter != None:
-            return self.__terawatts_per_liter
-        self.__terawatts_per_liter = self.__convert_from_base(PowerDensityUnits.TerawattPerLiter)
-        return self.__terawatts_per_liter
+        return self._cached_convert(PowerDensityUnits.TerawattPerLiter)
 
     
     def to_string(self, unit: PowerDensityUnits = PowerDensityUnits.WattPerCubicMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class PowerRatioUnits(Enum):
         """
             PowerRatioUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         DecibelWatt = 'decibel_watt'
         """
@@ -29,41 +40,256 @@ class PowerRatio(AbstractMeasure):
         value (float): The value.
         from_unit (PowerRatioUnits): The PowerRatio unit to create from, The default unit is DecibelWatt
     """
-    def __init__(self, value: float, from_unit: PowerRatioUnits = PowerRatioUnits.DecibelWatt):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = PowerRatioUnits
+
+    _base_unit = PowerRatioUnits.DecibelWatt
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 80
+
+    _binary_unit_ids = {
         
-        self.__decibel_watts = None
+        PowerRatioUnits.DecibelWatt: 0,
         
-        self.__decibel_milliwatts = None
+        PowerRatioUnits.DecibelMilliwatt: 1,
         
+    }
 
-    def convert(self, unit: PowerRatioUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        PowerRatioUnits.DecibelWatt: lambda value: (value),
+        
+        PowerRatioUnits.DecibelMilliwatt: lambda value: (value + 30),
+        
+    }
 
-    def __convert_from_base(self, from_unit: PowerRatioUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        PowerRatioUnits.DecibelWatt: lambda value: (value),
         
-        if from_unit == PowerRatioUnits.DecibelWatt:
-            return (value)
+        PowerRatioUnits.DecibelMilliwatt: lambda value: (value - 30),
         
-        if from_unit == PowerRatioUnits.DecibelMilliwatt:
-            return (value + 30)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        PowerRatioUnits.DecibelWatt: ('1', '0'),
         
-        return None
+        PowerRatioUnits.DecibelMilliwatt: ('1', '30'),
+        
+    }
 
+    _affine_to_base = {
+        
+        PowerRatioUnits.DecibelWatt: ('1', '0'),
+        
+        PowerRatioUnits.DecibelMilliwatt: ('1', '-30'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: PowerRatioUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == PowerRatioUnits.DecibelWatt:
-            return (value)
+        PowerRatioUnits.DecibelWatt: ('dBW',),
         
-        if to_unit == PowerRatioUnits.DecibelMilliwatt:
-            return (value - 30)
+        PowerRatioUnits.DecibelMilliwatt: ('dBmW',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: PowerRatioUnits = PowerRatioUnits.DecibelWatt):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: PowerRatioUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: PowerRatioUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: PowerRatioUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: PowerRatioUnits, to_unit: PowerRatioUnits) -> float:
+        """
+        Convert a value from one PowerRatio unit to another, without creating a PowerRatio instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: PowerRatioUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: PowerRatioUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return PowerRatio._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: PowerRatioUnits, to_unit: PowerRatioUnits) -> List[float]:
+        """
+        Convert many values from one PowerRatio unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: PowerRatioUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: PowerRatioUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return PowerRatio._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: PowerRatioUnits, to_unit: PowerRatioUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", PowerRatio._convert_many(values, from_unit, to_unit))
 
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: PowerRatioUnits, to_unit: PowerRatioUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one PowerRatio unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: PowerRatioUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: PowerRatioUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return PowerRatio._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: PowerRatioUnits = PowerRatioUnits.DecibelWatt) -> PowerRatio:
+        """
+        Create a new instance of PowerRatio holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: PowerRatioUnits
+        :return: A new instance of PowerRatio.
+        :rtype: PowerRatio
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return PowerRatio._from_exact(value, from_unit)
+
+    def to_exact(self, unit: PowerRatioUnits = PowerRatioUnits.DecibelWatt) -> Fraction:
+        """
+        Get the exact value of the PowerRatio in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (DecibelWatt).
+        :type unit: PowerRatioUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> PowerRatio:
+        """
+        Parse a PowerRatio from a value followed by a unit abbreviation, e.g. "1 dBW".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of PowerRatio.
+        :rtype: PowerRatio
+        :raises ValueError: When the string is not a valid or an ambiguous PowerRatio.
+        """
+        return PowerRatio._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[PowerRatio]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return PowerRatio._try_parse(text)
+
+    def to_binary(self, unit: Optional[PowerRatioUnits] = None) -> bytes:
+        """
+        Encode the PowerRatio to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: PowerRatioUnits
+        :return: The encoded PowerRatio.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> PowerRatio:
+        """
+        Decode a PowerRatio encoded by to_binary.
+
+        :param data: The encoded PowerRatio, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of PowerRatio.
+        :rtype: PowerRatio
+        :raises ValueError: When the data is not a valid encoded PowerRatio.
+        """
+        return PowerRatio._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[PowerRatioUnits] = None) -> dict:
+        """
+        Get the PowerRatio DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (DecibelWatt).
+        :type hold_in_unit: PowerRatioUnits
+        :return: The PowerRatio DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[PowerRatioUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> PowerRatio:
+        """
+        Create a new instance of PowerRatio from its DTO.
+
+        :param dto: The PowerRatio DTO, the unit is the PowerRatioUnits value or name.
+        :type dto: dict
+        :return: A new instance of PowerRatio.
+        :rtype: PowerRatio
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return PowerRatio._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> PowerRatio:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return PowerRatio._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -105,10 +331,7 @@ class PowerRatio(AbstractMeasure):
         """
         
         """
-        if self.__decibel_watts != None:
-            return self.__decibel_watts
-        self.__decibel_watts = self.__convert_from_base(PowerRatioUnits.DecibelWatt)
-        return self.__decibel_watts
+        return self._cached_convert(PowerRatioUnits.DecibelWatt)
 
     
     @property
@@ -116,10 +339,7 @@ class PowerRatio(AbstractMeasure):
         """
         
         """
-        if self.__decibel_milliwatts != None:
-            return self.__decibel_milliwatts
-        self.__decibel_milliwatts = self.__convert_from_base(PowerRatioUnits.DecibelMilliwatt)
-        return self.__decibel_milliwatts
+        return self._cached_convert(PowerRatioUnits.DecibelMilliwatt)
 
     
     def to_string(self, unit: PowerRatioUnits = PowerRatioUnits.DecibelWatt) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class PressureUnits(Enum):
         """
             PressureUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Pascal = 'pascal'
         """
@@ -264,417 +275,812 @@ class Pressure(AbstractMeasure):
         value (float): The value.
         from_unit (PressureUnits): The Pressure unit to create from, The default unit is Pascal
     """
-    def __init__(self, value: float, from_unit: PressureUnits = PressureUnits.Pascal):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = PressureUnits
+
+    _base_unit = PressureUnits.Pascal
+
+    _dimensions = (-1, 1, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 81
+
+    _binary_unit_ids = {
         
-        self.__pascals = None
+        PressureUnits.Pascal: 0,
         
-        self.__atmospheres = None
+        PressureUnits.Atmosphere: 1,
         
-        self.__bars = None
+        PressureUnits.Bar: 2,
         
-        self.__kilograms_force_per_square_meter = None
+        PressureUnits.KilogramForcePerSquareMeter: 3,
         
-        self.__kilograms_force_per_square_centimeter = None
+        PressureUnits.KilogramForcePerSquareCentimeter: 4,
         
-        self.__kilograms_force_per_square_millimeter = None
+        PressureUnits.KilogramForcePerSquareMillimeter: 5,
         
-        self.__newtons_per_square_meter = None
+        PressureUnits.NewtonPerSquareMeter: 6,
         
-        self.__newtons_per_square_centimeter = None
+        PressureUnits.NewtonPerSquareCentimeter: 7,
         
-        self.__newtons_per_square_millimeter = None
+        PressureUnits.NewtonPerSquareMillimeter: 8,
         
-        self.__technical_atmospheres = None
+        PressureUnits.TechnicalAtmosphere: 9,
         
-        self.__torrs = None
+        PressureUnits.Torr: 10,
         
-        self.__pounds_force_per_square_inch = None
+        PressureUnits.PoundForcePerSquareInch: 11,
         
-        self.__pounds_force_per_square_mil = None
+        PressureUnits.PoundForcePerSquareMil: 12,
         
-        self.__pounds_force_per_square_foot = None
+        PressureUnits.PoundForcePerSquareFoot: 13,
         
-        self.__tonnes_force_per_square_millimeter = None
+        PressureUnits.TonneForcePerSquareMillimeter: 14,
         
-        self.__tonnes_force_per_square_meter = None
+        PressureUnits.TonneForcePerSquareMeter: 15,
         
-        self.__meters_of_head = None
+        PressureUnits.MeterOfHead: 16,
         
-        self.__tonnes_force_per_square_centimeter = None
+        PressureUnits.TonneForcePerSquareCentimeter: 17,
         
-        self.__feet_of_head = None
+        PressureUnits.FootOfHead: 18,
         
-        self.__millimeters_of_mercury = None
+        PressureUnits.MillimeterOfMercury: 19,
         
-        self.__inches_of_mercury = None
+        PressureUnits.InchOfMercury: 20,
         
-        self.__dynes_per_square_centimeter = None
+        PressureUnits.DynePerSquareCentimeter: 21,
         
-        self.__pounds_per_inch_second_squared = None
+        PressureUnits.PoundPerInchSecondSquared: 22,
         
-        self.__meters_of_water_column = None
+        PressureUnits.MeterOfWaterColumn: 23,
         
-        self.__inches_of_water_column = None
+        PressureUnits.InchOfWaterColumn: 24,
         
-        self.__meters_of_elevation = None
+        PressureUnits.MeterOfElevation: 25,
         
-        self.__feet_of_elevation = None
+        PressureUnits.FootOfElevation: 26,
         
-        self.__micropascals = None
+        PressureUnits.Micropascal: 27,
         
-        self.__millipascals = None
+        PressureUnits.Millipascal: 28,
         
-        self.__decapascals = None
+        PressureUnits.Decapascal: 29,
         
-        self.__hectopascals = None
+        PressureUnits.Hectopascal: 30,
         
-        self.__kilopascals = None
+        PressureUnits.Kilopascal: 31,
         
-        self.__megapascals = None
+        PressureUnits.Megapascal: 32,
         
-        self.__gigapascals = None
+        PressureUnits.Gigapascal: 33,
         
-        self.__microbars = None
+        PressureUnits.Microbar: 34,
         
-        self.__millibars = None
+        PressureUnits.Millibar: 35,
         
-        self.__centibars = None
+        PressureUnits.Centibar: 36,
         
-        self.__decibars = None
+        PressureUnits.Decibar: 37,
         
-        self.__kilobars = None
+        PressureUnits.Kilobar: 38,
         
-        self.__megabars = None
+        PressureUnits.Megabar: 39,
         
-        self.__kilonewtons_per_square_meter = None
+        PressureUnits.KilonewtonPerSquareMeter: 40,
         
-        self.__meganewtons_per_square_meter = None
+        PressureUnits.MeganewtonPerSquareMeter: 41,
         
-        self.__kilonewtons_per_square_centimeter = None
+        PressureUnits.KilonewtonPerSquareCentimeter: 42,
         
-        self.__kilonewtons_per_square_millimeter = None
+        PressureUnits.KilonewtonPerSquareMillimeter: 43,
         
-        self.__kilopounds_force_per_square_inch = None
+        PressureUnits.KilopoundForcePerSquareInch: 44,
         
-        self.__kilopounds_force_per_square_mil = None
+        PressureUnits.KilopoundForcePerSquareMil: 45,
         
-        self.__kilopounds_force_per_square_foot = None
+        PressureUnits.KilopoundForcePerSquareFoot: 46,
         
-        self.__millimeters_of_water_column = None
+        PressureUnits.MillimeterOfWaterColumn: 47,
         
-        self.__centimeters_of_water_column = None
+        PressureUnits.CentimeterOfWaterColumn: 48,
         
+    }
 
-    def convert(self, unit: PressureUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        PressureUnits.Pascal: lambda value: (value),
+        
+        PressureUnits.Atmosphere: lambda value: (value / (1.01325 * 1e5)),
+        
+        PressureUnits.Bar: lambda value: (value / 1e5),
+        
+        PressureUnits.KilogramForcePerSquareMeter: lambda value: (value * 0.101971619222242),
+        
+        PressureUnits.KilogramForcePerSquareCentimeter: lambda value: (value / 9.80665e4),
+        
+        PressureUnits.KilogramForcePerSquareMillimeter: lambda value: (value / 9.80665e6),
+        
+        PressureUnits.NewtonPerSquareMeter: lambda value: (value),
+        
+        PressureUnits.NewtonPerSquareCentimeter: lambda value: (value / 1e4),
+        
+        PressureUnits.NewtonPerSquareMillimeter: lambda value: (value / 1e6),
+        
+        PressureUnits.TechnicalAtmosphere: lambda value: (value / (9.80680592331 * 1e4)),
+        
+        PressureUnits.Torr: lambda value: (value / (1.3332266752 * 1e2)),
+        
+        PressureUnits.PoundForcePerSquareInch: lambda value: (value / 6.894757293168361e3),
+        
+        PressureUnits.PoundForcePerSquareMil: lambda value: (value / 6.894757293168361e9),
+        
+        PressureUnits.PoundForcePerSquareFoot: lambda value: (value / 4.788025898033584e1),
+        
+        PressureUnits.TonneForcePerSquareMillimeter: lambda value: (value / 9.80665e9),
+        
+        PressureUnits.TonneForcePerSquareMeter: lambda value: (value / 9.80665e3),
+        
+        PressureUnits.MeterOfHead: lambda value: (value * 0.0001019977334),
+        
+        PressureUnits.TonneForcePerSquareCentimeter: lambda value: (value / 9.80665e7),
+        
+        PressureUnits.FootOfHead: lambda value: (value * 0.000334552565551),
+        
+        PressureUnits.MillimeterOfMercury: lambda value: (value * 7.50061561302643e-3),
+        
+        PressureUnits.InchOfMercury: lambda value: (value * 2.95299830714159e-4),
+        
+        PressureUnits.DynePerSquareCentimeter: lambda value: (value / 1.0e-1),
+        
+        PressureUnits.PoundPerInchSecondSquared: lambda value: (value / 1.785796732283465e1),
+        
+        PressureUnits.MeterOfWaterColumn: lambda value: (value / 9.806650000000272e3),
+        
+        PressureUnits.InchOfWaterColumn: lambda value: (value / 249.08890833333),
+        
+        PressureUnits.MeterOfElevation: lambda value: ((1.0 - math.pow(value / 101325.0, 0.190284)) * 44307.69396),
+        
+        PressureUnits.FootOfElevation: lambda value: ((1.0 - math.pow(value / 101325.0, 0.190284)) * 145366.45),
+        
+        PressureUnits.Micropascal: lambda value: ((value) / 1e-06),
+        
+        PressureUnits.Millipascal: lambda value: ((value) / 0.001),
+        
+        PressureUnits.Decapascal: lambda value: ((value) / 10.0),
+        
+        PressureUnits.Hectopascal: lambda value: ((value) / 100.0),
+        
+        PressureUnits.Kilopascal: lambda value: ((value) / 1000.0),
+        
+        PressureUnits.Megapascal: lambda value: ((value) / 1000000.0),
+        
+        PressureUnits.Gigapascal: lambda value: ((value) / 1000000000.0),
+        
+        PressureUnits.Microbar: lambda value: ((value / 1e5) / 1e-06),
+        
+        PressureUnits.Millibar: lambda value: ((value / 1e5) / 0.001),
+        
+        PressureUnits.Centibar: lambda value: ((value / 1e5) / 0.01),
+        
+        PressureUnits.Decibar: lambda value: ((value / 1e5) / 0.1),
+        
+        PressureUnits.Kilobar: lambda value: ((value / 1e5) / 1000.0),
+        
+        PressureUnits.Megabar: lambda value: ((value / 1e5) / 1000000.0),
+        
+        PressureUnits.KilonewtonPerSquareMeter: lambda value: ((value) / 1000.0),
+        
+        PressureUnits.MeganewtonPerSquareMeter: lambda value: ((value) / 1000000.0),
+        
+        PressureUnits.KilonewtonPerSquareCentimeter: lambda value: ((value / 1e4) / 1000.0),
+        
+        PressureUnits.KilonewtonPerSquareMillimeter: lambda value: ((value / 1e6) / 1000.0),
+        
+        PressureUnits.KilopoundForcePerSquareInch: lambda value: ((value / 6.894757293168361e3) / 1000.0),
+        
+        PressureUnits.KilopoundForcePerSquareMil: lambda value: ((value / 6.894757293168361e9) / 1000.0),
+        
+        PressureUnits.KilopoundForcePerSquareFoot: lambda value: ((value / 4.788025898033584e1) / 1000.0),
+        
+        PressureUnits.MillimeterOfWaterColumn: lambda value: ((value / 9.806650000000272e3) / 0.001),
+        
+        PressureUnits.CentimeterOfWaterColumn: lambda value: ((value / 9.806650000000272e3) / 0.01),
+        
+    }
 
-    def __convert_from_base(self, from_unit: PressureUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == PressureUnits.Pascal:
-            return (value)
+        PressureUnits.Pascal: lambda value: (value),
         
-        if from_unit == PressureUnits.Atmosphere:
-            return (value / (1.01325 * 1e5))
+        PressureUnits.Atmosphere: lambda value: (value * 1.01325 * 1e5),
         
-        if from_unit == PressureUnits.Bar:
-            return (value / 1e5)
+        PressureUnits.Bar: lambda value: (value * 1e5),
         
-        if from_unit == PressureUnits.KilogramForcePerSquareMeter:
-            return (value * 0.101971619222242)
+        PressureUnits.KilogramForcePerSquareMeter: lambda value: (value * 9.80665019960652),
         
-        if from_unit == PressureUnits.KilogramForcePerSquareCentimeter:
-            return (value / 9.80665e4)
+        PressureUnits.KilogramForcePerSquareCentimeter: lambda value: (value * 9.80665e4),
         
-        if from_unit == PressureUnits.KilogramForcePerSquareMillimeter:
-            return (value / 9.80665e6)
+        PressureUnits.KilogramForcePerSquareMillimeter: lambda value: (value * 9.80665e6),
         
-        if from_unit == PressureUnits.NewtonPerSquareMeter:
-            return (value)
+        PressureUnits.NewtonPerSquareMeter: lambda value: (value),
         
-        if from_unit == PressureUnits.NewtonPerSquareCentimeter:
-            return (value / 1e4)
+        PressureUnits.NewtonPerSquareCentimeter: lambda value: (value * 1e4),
         
-        if from_unit == PressureUnits.NewtonPerSquareMillimeter:
-            return (value / 1e6)
+        PressureUnits.NewtonPerSquareMillimeter: lambda value: (value * 1e6),
         
-        if from_unit == PressureUnits.TechnicalAtmosphere:
-            return (value / (9.80680592331 * 1e4))
+        PressureUnits.TechnicalAtmosphere: lambda value: (value * 9.80680592331 * 1e4),
         
-        if from_unit == PressureUnits.Torr:
-            return (value / (1.3332266752 * 1e2))
+        PressureUnits.Torr: lambda value: (value * 1.3332266752 * 1e2),
         
-        if from_unit == PressureUnits.PoundForcePerSquareInch:
-            return (value / 6.894757293168361e3)
+        PressureUnits.PoundForcePerSquareInch: lambda value: (value * 6.894757293168361e3),
         
-        if from_unit == PressureUnits.PoundForcePerSquareMil:
-            return (value / 6.894757293168361e9)
+        PressureUnits.PoundForcePerSquareMil: lambda value: (value * 6.894757293168361e9),
         
-        if from_unit == PressureUnits.PoundForcePerSquareFoot:
-            return (value / 4.788025898033584e1)
+        PressureUnits.PoundForcePerSquareFoot: lambda value: (value * 4.788025898033584e1),
         
-        if from_unit == PressureUnits.TonneForcePerSquareMillimeter:
-            return (value / 9.80665e9)
+        PressureUnits.TonneForcePerSquareMillimeter: lambda value: (value * 9.80665e9),
         
-        if from_unit == PressureUnits.TonneForcePerSquareMeter:
-            return (value / 9.80665e3)
+        PressureUnits.TonneForcePerSquareMeter: lambda value: (value * 9.80665e3),
         
-        if from_unit == PressureUnits.MeterOfHead:
-            return (value * 0.0001019977334)
+        PressureUnits.MeterOfHead: lambda value: (value * 9804.139432),
         
-        if from_unit == PressureUnits.TonneForcePerSquareCentimeter:
-            return (value / 9.80665e7)
+        PressureUnits.TonneForcePerSquareCentimeter: lambda value: (value * 9.80665e7),
         
-        if from_unit == PressureUnits.FootOfHead:
-            return (value * 0.000334552565551)
+        PressureUnits.FootOfHead: lambda value: (value * 2989.0669),
         
-        if from_unit == PressureUnits.MillimeterOfMercury:
-            return (value * 7.50061561302643e-3)
+        PressureUnits.MillimeterOfMercury: lambda value: (value / 7.50061561302643e-3),
         
-        if from_unit == PressureUnits.InchOfMercury:
-            return (value * 2.95299830714159e-4)
+        PressureUnits.InchOfMercury: lambda value: (value / 2.95299830714159e-4),
         
-        if from_unit == PressureUnits.DynePerSquareCentimeter:
-            return (value / 1.0e-1)
+        PressureUnits.DynePerSquareCentimeter: lambda value: (value * 1.0e-1),
         
-        if from_unit == PressureUnits.PoundPerInchSecondSquared:
-            return (value / 1.785796732283465e1)
+        PressureUnits.PoundPerInchSecondSquared: lambda value: (value * 1.785796732283465e1),
         
-        if from_unit == PressureUnits.MeterOfWaterColumn:
-            return (value / 9.806650000000272e3)
+        PressureUnits.MeterOfWaterColumn: lambda value: (value * 9.806650000000272e3),
         
-        if from_unit == PressureUnits.InchOfWaterColumn:
-            return (value / 249.08890833333)
+        PressureUnits.InchOfWaterColumn: lambda value: (value * 249.08890833333),
         
-        if from_unit == PressureUnits.MeterOfElevation:
-            return ((1.0 - math.pow(value / 101325.0, 0.190284)) * 44307.69396)
+        PressureUnits.MeterOfElevation: lambda value: (math.pow(1.0 - (value / 44307.69396), 5.2553026003237266401799415610351) * 101325.0),
         
-        if from_unit == PressureUnits.FootOfElevation:
-            return ((1.0 - math.pow(value / 101325.0, 0.190284)) * 145366.45)
+        PressureUnits.FootOfElevation: lambda value: (math.pow(1.0 - (value / 145366.45), 5.2553026003237266401799415610351) * 101325.0),
         
-        if from_unit == PressureUnits.Micropascal:
-            return ((value) / 1e-06)
+        PressureUnits.Micropascal: lambda value: ((value) * 1e-06),
         
-        if from_unit == PressureUnits.Millipascal:
-            return ((value) / 0.001)
+        PressureUnits.Millipascal: lambda value: ((value) * 0.001),
         
-        if from_unit == PressureUnits.Decapascal:
-            return ((value) / 10.0)
+        PressureUnits.Decapascal: lambda value: ((value) * 10.0),
         
-        if from_unit == PressureUnits.Hectopascal:
-            return ((value) / 100.0)
+        PressureUnits.Hectopascal: lambda value: ((value) * 100.0),
         
-        if from_unit == PressureUnits.Kilopascal:
-            return ((value) / 1000.0)
+        PressureUnits.Kilopascal: lambda value: ((value) * 1000.0),
         
-        if from_unit == PressureUnits.Megapascal:
-            return ((value) / 1000000.0)
+        PressureUnits.Megapascal: lambda value: ((value) * 1000000.0),
         
-        if from_unit == PressureUnits.Gigapascal:
-            return ((value) / 1000000000.0)
+        PressureUnits.Gigapascal: lambda value: ((value) * 1000000000.0),
         
-        if from_unit == PressureUnits.Microbar:
-            return ((value / 1e5) / 1e-06)
+        PressureUnits.Microbar: lambda value: ((value * 1e5) * 1e-06),
         
-        if from_unit == PressureUnits.Millibar:
-            return ((value / 1e5) / 0.001)
+        PressureUnits.Millibar: lambda value: ((value * 1e5) * 0.001),
         
-        if from_unit == PressureUnits.Centibar:
-            return ((value / 1e5) / 0.01)
+        PressureUnits.Centibar: lambda value: ((value * 1e5) * 0.01),
         
-        if from_unit == PressureUnits.Decibar:
-            return ((value / 1e5) / 0.1)
+        PressureUnits.Decibar: lambda value: ((value * 1e5) * 0.1),
         
-        if from_unit == PressureUnits.Kilobar:
-            return ((value / 1e5) / 1000.0)
+        PressureUnits.Kilobar: lambda value: ((value * 1e5) * 1000.0),
         
-        if from_unit == PressureUnits.Megabar:
-            return ((value / 1e5) / 1000000.0)
+        PressureUnits.Megabar: lambda value: ((value * 1e5) * 1000000.0),
         
-        if from_unit == PressureUnits.KilonewtonPerSquareMeter:
-            return ((value) / 1000.0)
+        PressureUnits.KilonewtonPerSquareMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == PressureUnits.MeganewtonPerSquareMeter:
-            return ((value) / 1000000.0)
+        PressureUnits.MeganewtonPerSquareMeter: lambda value: ((value) * 1000000.0),
         
-        if from_unit == PressureUnits.KilonewtonPerSquareCentimeter:
-            return ((value / 1e4) / 1000.0)
+        PressureUnits.KilonewtonPerSquareCentimeter: lambda value: ((value * 1e4) * 1000.0),
         
-        if from_unit == PressureUnits.KilonewtonPerSquareMillimeter:
-            return ((value / 1e6) / 1000.0)
+        PressureUnits.KilonewtonPerSquareMillimeter: lambda value: ((value * 1e6) * 1000.0),
         
-        if from_unit == PressureUnits.KilopoundForcePerSquareInch:
-            return ((value / 6.894757293168361e3) / 1000.0)
+        PressureUnits.KilopoundForcePerSquareInch: lambda value: ((value * 6.894757293168361e3) * 1000.0),
         
-        if from_unit == PressureUnits.KilopoundForcePerSquareMil:
-            return ((value / 6.894757293168361e9) / 1000.0)
+        PressureUnits.KilopoundForcePerSquareMil: lambda value: ((value * 6.894757293168361e9) * 1000.0),
         
-        if from_unit == PressureUnits.KilopoundForcePerSquareFoot:
-            return ((value / 4.788025898033584e1) / 1000.0)
+        PressureUnits.KilopoundForcePerSquareFoot: lambda value: ((value * 4.788025898033584e1) * 1000.0),
         
-        if from_unit == PressureUnits.MillimeterOfWaterColumn:
-            return ((value / 9.806650000000272e3) / 0.001)
+        PressureUnits.MillimeterOfWaterColumn: lambda value: ((value * 9.806650000000272e3) * 0.001),
         
-        if from_unit == PressureUnits.CentimeterOfWaterColumn:
-            return ((value / 9.806650000000272e3) / 0.01)
+        PressureUnits.CentimeterOfWaterColumn: lambda value: ((value * 9.806650000000272e3) * 0.01),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        PressureUnits.Pascal: ('1', '0'),
+        
+        PressureUnits.Atmosphere: ('1/101325', '0'),
+        
+        PressureUnits.Bar: ('1/100000', '0'),
+        
+        PressureUnits.KilogramForcePerSquareMeter: ('50985809611121/500000000000000', '0'),
+        
+        PressureUnits.KilogramForcePerSquareCentimeter: ('2/196133', '0'),
+        
+        PressureUnits.KilogramForcePerSquareMillimeter: ('1/9806650', '0'),
+        
+        PressureUnits.NewtonPerSquareMeter: ('1', '0'),
+        
+        PressureUnits.NewtonPerSquareCentimeter: ('1/10000', '0'),
+        
+        PressureUnits.NewtonPerSquareMillimeter: ('1/1000000', '0'),
+        
+        PressureUnits.TechnicalAtmosphere: ('10000000/980680592331', '0'),
+        
+        PressureUnits.Torr: ('390625/52079167', '0'),
+        
+        PressureUnits.PoundForcePerSquareInch: ('1000000000000/6894757293168361', '0'),
+        
+        PressureUnits.PoundForcePerSquareMil: ('1000000/6894757293168361', '0'),
+        
+        PressureUnits.PoundForcePerSquareFoot: ('6250000000000/299251618627099', '0'),
+        
+        PressureUnits.TonneForcePerSquareMillimeter: ('1/9806650000', '0'),
+        
+        PressureUnits.TonneForcePerSquareMeter: ('20/196133', '0'),
+        
+        PressureUnits.MeterOfHead: ('509988667/5000000000000', '0'),
+        
+        PressureUnits.TonneForcePerSquareCentimeter: ('1/98066500', '0'),
+        
+        PressureUnits.FootOfHead: ('334552565551/1000000000000000', '0'),
+        
+        PressureUnits.MillimeterOfMercury: ('750061561302643/100000000000000000', '0'),
+        
+        PressureUnits.InchOfMercury: ('295299830714159/1000000000000000000', '0'),
+        
+        PressureUnits.DynePerSquareCentimeter: ('10', '0'),
+        
+        PressureUnits.PoundPerInchSecondSquared: ('20000000000000/357159346456693', '0'),
+        
+        PressureUnits.MeterOfWaterColumn: ('62500000000/612915625000017', '0'),
+        
+        PressureUnits.InchOfWaterColumn: ('100000000000/24908890833333', '0'),
+        
+        PressureUnits.Micropascal: ('1000000', '0'),
+        
+        PressureUnits.Millipascal: ('1000', '0'),
+        
+        PressureUnits.Decapascal: ('1/10', '0'),
+        
+        PressureUnits.Hectopascal: ('1/100', '0'),
+        
+        PressureUnits.Kilopascal: ('1/1000', '0'),
+        
+        PressureUnits.Megapascal: ('1/1000000', '0'),
+        
+        PressureUnits.Gigapascal: ('1/1000000000', '0'),
+        
+        PressureUnits.Microbar: ('10', '0'),
+        
+        PressureUnits.Millibar: ('1/100', '0'),
+        
+        PressureUnits.Centibar: ('1/1000', '0'),
+        
+        PressureUnits.Decibar: ('1/10000', '0'),
+        
+        PressureUnits.Kilobar: ('1/100000000', '0'),
+        
+        PressureUnits.Megabar: ('1/100000000000', '0'),
+        
+        PressureUnits.KilonewtonPerSquareMeter: ('1/1000', '0'),
+        
+        PressureUnits.MeganewtonPerSquareMeter: ('1/1000000', '0'),
+        
+        PressureUnits.KilonewtonPerSquareCentimeter: ('1/10000000', '0'),
+        
+        PressureUnits.KilonewtonPerSquareMillimeter: ('1/1000000000', '0'),
+        
+        PressureUnits.KilopoundForcePerSquareInch: ('1000000000/6894757293168361', '0'),
+        
+        PressureUnits.KilopoundForcePerSquareMil: ('1000/6894757293168361', '0'),
+        
+        PressureUnits.KilopoundForcePerSquareFoot: ('6250000000/299251618627099', '0'),
+        
+        PressureUnits.MillimeterOfWaterColumn: ('62500000000000/612915625000017', '0'),
+        
+        PressureUnits.CentimeterOfWaterColumn: ('6250000000000/612915625000017', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: PressureUnits) -> float:
+    _affine_to_base = {
+        
+        PressureUnits.Pascal: ('1', '0'),
+        
+        PressureUnits.Atmosphere: ('101325', '0'),
+        
+        PressureUnits.Bar: ('100000', '0'),
+        
+        PressureUnits.KilogramForcePerSquareMeter: ('245166254990163/25000000000000', '0'),
+        
+        PressureUnits.KilogramForcePerSquareCentimeter: ('196133/2', '0'),
+        
+        PressureUnits.KilogramForcePerSquareMillimeter: ('9806650', '0'),
+        
+        PressureUnits.NewtonPerSquareMeter: ('1', '0'),
+        
+        PressureUnits.NewtonPerSquareCentimeter: ('10000', '0'),
         
-        if to_unit == PressureUnits.Pascal:
-            return (value)
+        PressureUnits.NewtonPerSquareMillimeter: ('1000000', '0'),
         
-        if to_unit == PressureUnits.Atmosphere:
-            return (value * 1.01325 * 1e5)
+        PressureUnits.TechnicalAtmosphere: ('980680592331/10000000', '0'),
         
-        if to_unit == PressureUnits.Bar:
-            return (value * 1e5)
+        PressureUnits.Torr: ('52079167/390625', '0'),
         
-        if to_unit == PressureUnits.KilogramForcePerSquareMeter:
-            return (value * 9.80665019960652)
+        PressureUnits.PoundForcePerSquareInch: ('6894757293168361/1000000000000', '0'),
         
-        if to_unit == PressureUnits.KilogramForcePerSquareCentimeter:
-            return (value * 9.80665e4)
+        PressureUnits.PoundForcePerSquareMil: ('6894757293168361/1000000', '0'),
         
-        if to_unit == PressureUnits.KilogramForcePerSquareMillimeter:
-            return (value * 9.80665e6)
+        PressureUnits.PoundForcePerSquareFoot: ('299251618627099/6250000000000', '0'),
         
-        if to_unit == PressureUnits.NewtonPerSquareMeter:
-            return (value)
+        PressureUnits.TonneForcePerSquareMillimeter: ('9806650000', '0'),
         
-        if to_unit == PressureUnits.NewtonPerSquareCentimeter:
-            return (value * 1e4)
+        PressureUnits.TonneForcePerSquareMeter: ('196133/20', '0'),
         
-        if to_unit == PressureUnits.NewtonPerSquareMillimeter:
-            return (value * 1e6)
+        PressureUnits.MeterOfHead: ('1225517429/125000', '0'),
         
-        if to_unit == PressureUnits.TechnicalAtmosphere:
-            return (value * 9.80680592331 * 1e4)
+        PressureUnits.TonneForcePerSquareCentimeter: ('98066500', '0'),
         
-        if to_unit == PressureUnits.Torr:
-            return (value * 1.3332266752 * 1e2)
+        PressureUnits.FootOfHead: ('29890669/10000', '0'),
         
-        if to_unit == PressureUnits.PoundForcePerSquareInch:
-            return (value * 6.894757293168361e3)
+        PressureUnits.MillimeterOfMercury: ('100000000000000000/750061561302643', '0'),
         
-        if to_unit == PressureUnits.PoundForcePerSquareMil:
-            return (value * 6.894757293168361e9)
+        PressureUnits.InchOfMercury: ('1000000000000000000/295299830714159', '0'),
         
-        if to_unit == PressureUnits.PoundForcePerSquareFoot:
-            return (value * 4.788025898033584e1)
+        PressureUnits.DynePerSquareCentimeter: ('1/10', '0'),
         
-        if to_unit == PressureUnits.TonneForcePerSquareMillimeter:
-            return (value * 9.80665e9)
+        PressureUnits.PoundPerInchSecondSquared: ('357159346456693/20000000000000', '0'),
         
-        if to_unit == PressureUnits.TonneForcePerSquareMeter:
-            return (value * 9.80665e3)
+        PressureUnits.MeterOfWaterColumn: ('612915625000017/62500000000', '0'),
         
-        if to_unit == PressureUnits.MeterOfHead:
-            return (value * 9804.139432)
+        PressureUnits.InchOfWaterColumn: ('24908890833333/100000000000', '0'),
         
-        if to_unit == PressureUnits.TonneForcePerSquareCentimeter:
-            return (value * 9.80665e7)
+        PressureUnits.Micropascal: ('1/1000000', '0'),
         
-        if to_unit == PressureUnits.FootOfHead:
-            return (value * 2989.0669)
+        PressureUnits.Millipascal: ('1/1000', '0'),
         
-        if to_unit == PressureUnits.MillimeterOfMercury:
-            return (value / 7.50061561302643e-3)
+        PressureUnits.Decapascal: ('10', '0'),
         
-        if to_unit == PressureUnits.InchOfMercury:
-            return (value / 2.95299830714159e-4)
+        PressureUnits.Hectopascal: ('100', '0'),
         
-        if to_unit == PressureUnits.DynePerSquareCentimeter:
-            return (value * 1.0e-1)
+        PressureUnits.Kilopascal: ('1000', '0'),
         
-        if to_unit == PressureUnits.PoundPerInchSecondSquared:
-            return (value * 1.785796732283465e1)
+        PressureUnits.Megapascal: ('1000000', '0'),
         
-        if to_unit == PressureUnits.MeterOfWaterColumn:
-            return (value * 9.806650000000272e3)
+        PressureUnits.Gigapascal: ('1000000000', '0'),
         
-        if to_unit == PressureUnits.InchOfWaterColumn:
-            return (value * 249.08890833333)
+        PressureUnits.Microbar: ('1/10', '0'),
         
-        if to_unit == PressureUnits.MeterOfElevation:
-            return (math.pow(1.0 - (value / 44307.69396), 5.2553026003237266401799415610351) * 101325.0)
+        PressureUnits.Millibar: ('100', '0'),
         
-        if to_unit == PressureUnits.FootOfElevation:
-            return (math.pow(1.0 - (value / 145366.45), 5.2553026003237266401799415610351) * 101325.0)
+        PressureUnits.Centibar: ('1000', '0'),
         
-        if to_unit == PressureUnits.Micropascal:
-            return ((value) * 1e-06)
+        PressureUnits.Decibar: ('10000', '0'),
         
-        if to_unit == PressureUnits.Millipascal:
-            return ((value) * 0.001)
+        PressureUnits.Kilobar: ('100000000', '0'),
         
-        if to_unit == PressureUnits.Decapascal:
-            return ((value) * 10.0)
+        PressureUnits.Megabar: ('100000000000', '0'),
         
-        if to_unit == PressureUnits.Hectopascal:
-            return ((value) * 100.0)
+        PressureUnits.KilonewtonPerSquareMeter: ('1000', '0'),
         
-        if to_unit == PressureUnits.Kilopascal:
-            return ((value) * 1000.0)
+        PressureUnits.MeganewtonPerSquareMeter: ('1000000', '0'),
         
-        if to_unit == PressureUnits.Megapascal:
-            return ((value) * 1000000.0)
+        PressureUnits.KilonewtonPerSquareCentimeter: ('10000000', '0'),
         
-        if to_unit == PressureUnits.Gigapascal:
-            return ((value) * 1000000000.0)
+        PressureUnits.KilonewtonPerSquareMillimeter: ('1000000000', '0'),
         
-        if to_unit == PressureUnits.Microbar:
-            return ((value * 1e5) * 1e-06)
+        PressureUnits.KilopoundForcePerSquareInch: ('6894757293168361/1000000000', '0'),
         
-        if to_unit == PressureUnits.Millibar:
-            return ((value * 1e5) * 0.001)
+        PressureUnits.KilopoundForcePerSquareMil: ('6894757293168361/1000', '0'),
         
-        if to_unit == PressureUnits.Centibar:
-            return ((value * 1e5) * 0.01)
+        PressureUnits.KilopoundForcePerSquareFoot: ('299251618627099/6250000000', '0'),
         
-        if to_unit == PressureUnits.Decibar:
-            return ((value * 1e5) * 0.1)
+        PressureUnits.MillimeterOfWaterColumn: ('612915625000017/62500000000000', '0'),
         
-        if to_unit == PressureUnits.Kilobar:
-            return ((value * 1e5) * 1000.0)
+        PressureUnits.CentimeterOfWaterColumn: ('612915625000017/6250000000000', '0'),
         
-        if to_unit == PressureUnits.Megabar:
-            return ((value * 1e5) * 1000000.0)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        PressureUnits.Pascal: ('Pa',),
+        
+        PressureUnits.Atmosphere: ('atm',),
+        
+        PressureUnits.Bar: ('bar',),
+        
+        PressureUnits.KilogramForcePerSquareMeter: ('kgf/m²',),
+        
+        PressureUnits.KilogramForcePerSquareCentimeter: ('kgf/cm²',),
+        
+        PressureUnits.KilogramForcePerSquareMillimeter: ('kgf/mm²',),
+        
+        PressureUnits.NewtonPerSquareMeter: ('N/m²',),
+        
+        PressureUnits.NewtonPerSquareCentimeter: ('N/cm²',),
+        
+        PressureUnits.NewtonPerSquareMillimeter: ('N/mm²',),
+        
+        PressureUnits.TechnicalAtmosphere: ('at',),
+        
+        PressureUnits.Torr: ('torr',),
+        
+        PressureUnits.PoundForcePerSquareInch: ('psi',),
+        
+        PressureUnits.PoundForcePerSquareMil: ('lb/mil²',),
+        
+        PressureUnits.PoundForcePerSquareFoot: ('lb/ft²',),
+        
+        PressureUnits.TonneForcePerSquareMillimeter: ('tf/mm²',),
+        
+        PressureUnits.TonneForcePerSquareMeter: ('tf/m²',),
+        
+        PressureUnits.MeterOfHead: ('m of head',),
+        
+        PressureUnits.TonneForcePerSquareCentimeter: ('tf/cm²',),
+        
+        PressureUnits.FootOfHead: ('ft of head',),
+        
+        PressureUnits.MillimeterOfMercury: ('mmHg',),
+        
+        PressureUnits.InchOfMercury: ('inHg',),
+        
+        PressureUnits.DynePerSquareCentimeter: ('dyn/cm²',),
+        
+        PressureUnits.PoundPerInchSecondSquared: ('lbm/(in·s²)',),
+        
+        PressureUnits.MeterOfWaterColumn: ('mH₂O',),
+        
+        PressureUnits.InchOfWaterColumn: ('inH2O',),
+        
+        PressureUnits.MeterOfElevation: ('m of elevation',),
+        
+        PressureUnits.FootOfElevation: ('ft of elevation',),
+        
+        PressureUnits.Micropascal: ('μPa',),
+        
+        PressureUnits.Millipascal: ('mPa',),
+        
+        PressureUnits.Decapascal: ('daPa',),
         
-        if to_unit == PressureUnits.KilonewtonPerSquareMeter:
-            return ((value) * 1000.0)
+        PressureUnits.Hectopascal: ('hPa',),
         
-        if to_unit == PressureUnits.MeganewtonPerSquareMeter:
-            return ((value) * 1000000.0)
+        PressureUnits.Kilopascal: ('kPa',),
         
-        if to_unit == PressureUnits.KilonewtonPerSquareCentimeter:
-            return ((value * 1e4) * 1000.0)
+        PressureUnits.Megapascal: ('MPa',),
         
-        if to_unit == PressureUnits.KilonewtonPerSquareMillimeter:
-            return ((value * 1e6) * 1000.0)
+        PressureUnits.Gigapascal: ('GPa',),
         
-        if to_unit == PressureUnits.KilopoundForcePerSquareInch:
-            return ((value * 6.894757293168361e3) * 1000.0)
+        PressureUnits.Microbar: ('μbar',),
         
-        if to_unit == PressureUnits.KilopoundForcePerSquareMil:
-            return ((value * 6.894757293168361e9) * 1000.0)
+        PressureUnits.Millibar: ('mbar',),
         
-        if to_unit == PressureUnits.KilopoundForcePerSquareFoot:
-            return ((value * 4.788025898033584e1) * 1000.0)
+        PressureUnits.Centibar: ('cbar',),
         
-        if to_unit == PressureUnits.MillimeterOfWaterColumn:
-            return ((value * 9.806650000000272e3) * 0.001)
+        PressureUnits.Decibar: ('dbar',),
         
-        if to_unit == PressureUnits.CentimeterOfWaterColumn:
-            return ((value * 9.806650000000272e3) * 0.01)
+        PressureUnits.Kilobar: ('kbar',),
         
-        return None
+        PressureUnits.Megabar: ('Mbar',),
+        
+        PressureUnits.KilonewtonPerSquareMeter: ('kN/m²',),
+        
+        PressureUnits.MeganewtonPerSquareMeter: ('MN/m²',),
+        
+        PressureUnits.KilonewtonPerSquareCentimeter: ('kN/cm²',),
+        
+        PressureUnits.KilonewtonPerSquareMillimeter: ('kN/mm²',),
+        
+        PressureUnits.KilopoundForcePerSquareInch: ('kpsi',),
+        
+        PressureUnits.KilopoundForcePerSquareMil: ('klb/mil²',),
+        
+        PressureUnits.KilopoundForcePerSquareFoot: ('klb/ft²',),
+        
+        PressureUnits.MillimeterOfWaterColumn: ('mmH₂O',),
+        
+        PressureUnits.CentimeterOfWaterColumn: ('cmH₂O',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: PressureUnits = PressureUnits.Pascal):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: PressureUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: PressureUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: PressureUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: PressureUnits, to_unit: PressureUnits) -> float:
+        """
+        Convert a value from one Pressure unit to another, without creating a Pressure instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: PressureUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: PressureUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Pressure._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: PressureUnits, to_unit: PressureUnits) -> List[float]:
+        """
+        Convert many values from one Pressure unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: PressureUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: PressureUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Pressure._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: PressureUnits, to_unit: PressureUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Pressure._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: PressureUnits, to_unit: PressureUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Pressure unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: PressureUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: PressureUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Pressure._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: PressureUnits = PressureUnits.Pascal) -> Pressure:
+        """
+        Create a new instance of Pressure holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: PressureUnits
+        :return: A new instance of Pressure.
+        :rtype: Pressure
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Pressure._from_exact(value, from_unit)
+
+    def to_exact(self, unit: PressureUnits = PressureUnits.Pascal) -> Fraction:
+        """
+        Get the exact value of the Pressure in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Pascal).
+        :type unit: PressureUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Pressure:
+        """
+        Parse a Pressure from a value followed by a unit abbreviation, e.g. "1 Pa".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Pressure.
+        :rtype: Pressure
+        :raises ValueError: When the string is not a valid or an ambiguous Pressure.
+        """
+        return Pressure._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Pressure]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Pressure._try_parse(text)
+
+    def to_binary(self, unit: Optional[PressureUnits] = None) -> bytes:
+        """
+        Encode the Pressure to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: PressureUnits
+        :return: The encoded Pressure.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Pressure:
+        """
+        Decode a Pressure encoded by to_binary.
+
+        :param data: The encoded Pressure, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Pressure.
+        :rtype: Pressure
+        :raises ValueError: When the data is not a valid encoded Pressure.
+        """
+        return Pressure._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[PressureUnits] = None) -> dict:
+        """
+        Get the Pressure DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
 
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Pascal).
+        :type hold_in_unit: PressureUnits
+        :return: The Pressure DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[PressureUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Pressure:
+        """
+        Create a new instance of Pressure from its DTO.
+
+        :param dto: The Pressure DTO, the unit is the PressureUnits value or name.
+        :type dto: dict
+        :return: A new instance of Pressure.
+        :rtype: Pressure
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Pressure._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Pressure:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Pressure._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -1421,10 +1827,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__pascals != None:
-            return self.__pascals
-        self.__pascals = self.__convert_from_base(PressureUnits.Pascal)
-        return self.__pascals
+        return self._cached_convert(PressureUnits.Pascal)
 
     
     @property
@@ -1432,10 +1835,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__atmospheres != None:
-            return self.__atmospheres
-        self.__atmospheres = self.__convert_from_base(PressureUnits.Atmosphere)
-        return self.__atmospheres
+        return self._cached_convert(PressureUnits.Atmosphere)
 
     
     @property
@@ -1443,10 +1843,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__bars != None:
-            return self.__bars
-        self.__bars = self.__convert_from_base(PressureUnits.Bar)
-        return self.__bars
+        return self._cached_convert(PressureUnits.Bar)
 
     
     @property
@@ -1454,10 +1851,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_force_per_square_meter != None:
-            return self.__kilograms_force_per_square_meter
-        self.__kilograms_force_per_square_meter = self.__convert_from_base(PressureUnits.KilogramForcePerSquareMeter)
-        return self.__kilograms_force_per_square_meter
+        return self._cached_convert(PressureUnits.KilogramForcePerSquareMeter)
 
     
     @property
@@ -1465,10 +1859,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_force_per_square_centimeter != None:
-            return self.__kilograms_force_per_square_centimeter
-        self.__kilograms_force_per_square_centimeter = self.__convert_from_base(PressureUnits.KilogramForcePerSquareCentimeter)
-        return self.__kilograms_force_per_square_centimeter
+        return self._cached_convert(PressureUnits.KilogramForcePerSquareCentimeter)
 
     
     @property
@@ -1476,10 +1867,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_force_per_square_millimeter != None:
-            return self.__kilograms_force_per_square_millimeter
-        self.__kilograms_force_per_square_millimeter = self.__convert_from_base(PressureUnits.KilogramForcePerSquareMillimeter)
-        return self.__kilograms_force_per_square_millimeter
+        return self._cached_convert(PressureUnits.KilogramForcePerSquareMillimeter)
 
     
     @property
@@ -1487,10 +1875,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__newtons_per_square_meter != None:
-            return self.__newtons_per_square_meter
-        self.__newtons_per_square_meter = self.__convert_from_base(PressureUnits.NewtonPerSquareMeter)
-        return self.__newtons_per_square_meter
+        return self._cached_convert(PressureUnits.NewtonPerSquareMeter)
 
     
     @property
@@ -1498,10 +1883,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__newtons_per_square_centimeter != None:
-            return self.__newtons_per_square_centimeter
-        self.__newtons_per_square_centimeter = self.__convert_from_base(PressureUnits.NewtonPerSquareCentimeter)
-        return self.__newtons_per_square_centimeter
+        return self._cached_convert(PressureUnits.NewtonPerSquareCentimeter)
 
     
     @property
@@ -1509,10 +1891,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__newtons_per_square_millimeter != None:
-            return self.__newtons_per_square_millimeter
-        self.__newtons_per_square_millimeter = self.__convert_from_base(PressureUnits.NewtonPerSquareMillimeter)
-        return self.__newtons_per_square_millimeter
+        return self._cached_convert(PressureUnits.NewtonPerSquareMillimeter)
 
     
     @property
@@ -1520,10 +1899,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__technical_atmospheres != None:
-            return self.__technical_atmospheres
-        self.__technical_atmospheres = self.__convert_from_base(PressureUnits.TechnicalAtmosphere)
-        return self.__technical_atmospheres
+        return self._cached_convert(PressureUnits.TechnicalAtmosphere)
 
     
     @property
@@ -1531,10 +1907,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__torrs != None:
-            return self.__torrs
-        self.__torrs = self.__convert_from_base(PressureUnits.Torr)
-        return self.__torrs
+        return self._cached_convert(PressureUnits.Torr)
 
     
     @property
@@ -1542,10 +1915,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_per_square_inch != None:
-            return self.__pounds_force_per_square_inch
-        self.__pounds_force_per_square_inch = self.__convert_from_base(PressureUnits.PoundForcePerSquareInch)
-        return self.__pounds_force_per_square_inch
+        return self._cached_convert(PressureUnits.PoundForcePerSquareInch)
 
     
     @property
@@ -1553,10 +1923,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_per_square_mil != None:
-            return self.__pounds_force_per_square_mil
-        self.__pounds_force_per_square_mil = self.__convert_from_base(PressureUnits.PoundForcePerSquareMil)
-        return self.__pounds_force_per_square_mil
+        return self._cached_convert(PressureUnits.PoundForcePerSquareMil)
 
     
     @property
@@ -1564,10 +1931,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_per_square_foot != None:
-            return self.__pounds_force_per_square_foot
-        self.__pounds_force_per_square_foot = self.__convert_from_base(PressureUnits.PoundForcePerSquareFoot)
-        return self.__pounds_force_per_square_foot
+        return self._cached_convert(PressureUnits.PoundForcePerSquareFoot)
 
     
     @property
@@ -1575,10 +1939,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_force_per_square_millimeter != None:
-            return self.__tonnes_force_per_square_millimeter
-        self.__tonnes_force_per_square_millimeter = self.__convert_from_base(PressureUnits.TonneForcePerSquareMillimeter)
-        return self.__tonnes_force_per_square_millimeter
+        return self._cached_convert(PressureUnits.TonneForcePerSquareMillimeter)
 
     
     @property
@@ -1586,10 +1947,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_force_per_square_meter != None:
-            return self.__tonnes_force_per_square_meter
-        self.__tonnes_force_per_square_meter = self.__convert_from_base(PressureUnits.TonneForcePerSquareMeter)
-        return self.__tonnes_force_per_square_meter
+        return self._cached_convert(PressureUnits.TonneForcePerSquareMeter)
 
     
     @property
@@ -1597,10 +1955,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__meters_of_head != None:
-            return self.__meters_of_head
-        self.__meters_of_head = self.__convert_from_base(PressureUnits.MeterOfHead)
-        return self.__meters_of_head
+        return self._cached_convert(PressureUnits.MeterOfHead)
 
     
     @property
@@ -1608,10 +1963,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_force_per_square_centimeter != None:
-            return self.__tonnes_force_per_square_centimeter
-        self.__tonnes_force_per_square_centimeter = self.__convert_from_base(PressureUnits.TonneForcePerSquareCentimeter)
-        return self.__tonnes_force_per_square_centimeter
+        return self._cached_convert(PressureUnits.TonneForcePerSquareCentimeter)
 
     
     @property
@@ -1619,10 +1971,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__feet_of_head != None:
-            return self.__feet_of_head
-        self.__feet_of_head = self.__convert_from_base(PressureUnits.FootOfHead)
-        return self.__feet_of_head
+        return self._cached_convert(PressureUnits.FootOfHead)
 
     
     @property
@@ -1630,10 +1979,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__millimeters_of_mercury != None:
-            return self.__millimeters_of_mercury
-        self.__millimeters_of_mercury = self.__convert_from_base(PressureUnits.MillimeterOfMercury)
-        return self.__millimeters_of_mercury
+        return self._cached_convert(PressureUnits.MillimeterOfMercury)
 
     
     @property
@@ -1641,10 +1987,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__inches_of_mercury != None:
-            return self.__inches_of_mercury
-        self.__inches_of_mercury = self.__convert_from_base(PressureUnits.InchOfMercury)
-        return self.__inches_of_mercury
+        return self._cached_convert(PressureUnits.InchOfMercury)
 
     
     @property
@@ -1652,10 +1995,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__dynes_per_square_centimeter != None:
-            return self.__dynes_per_square_centimeter
-        self.__dynes_per_square_centimeter = self.__convert_from_base(PressureUnits.DynePerSquareCentimeter)
-        return self.__dynes_per_square_centimeter
+        return self._cached_convert(PressureUnits.DynePerSquareCentimeter)
 
     
     @property
@@ -1663,10 +2003,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__pounds_per_inch_second_squared != None:
-            return self.__pounds_per_inch_second_squared
-        self.__pounds_per_inch_second_squared = self.__convert_from_base(PressureUnits.PoundPerInchSecondSquared)
-        return self.__pounds_per_inch_second_squared
+        return self._cached_convert(PressureUnits.PoundPerInchSecondSquared)
 
     
     @property
@@ -1674,10 +2011,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__meters_of_water_column != None:
-            return self.__meters_of_water_column
-        self.__meters_of_water_column = self.__convert_from_base(PressureUnits.MeterOfWaterColumn)
-        return self.__meters_of_water_column
+        return self._cached_convert(PressureUnits.MeterOfWaterColumn)
 
     
     @property
@@ -1685,10 +2019,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__inches_of_water_column != None:
-            return self.__inches_of_water_column
-        self.__inches_of_water_column = self.__convert_from_base(PressureUnits.InchOfWaterColumn)
-        return self.__inches_of_water_column
+        return self._cached_convert(PressureUnits.InchOfWaterColumn)
 
     
     @property
@@ -1696,10 +2027,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__meters_of_elevation != None:
-            return self.__meters_of_elevation
-        self.__meters_of_elevation = self.__convert_from_base(PressureUnits.MeterOfElevation)
-        return self.__meters_of_elevation
+        return self._cached_convert(PressureUnits.MeterOfElevation)
 
     
     @property
@@ -1707,10 +2035,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__feet_of_elevation != None:
-            return self.__feet_of_elevation
-        self.__feet_of_elevation = self.__convert_from_base(PressureUnits.FootOfElevation)
-        return self.__feet_of_elevation
+        return self._cached_convert(PressureUnits.FootOfElevation)
 
     
     @property
@@ -1718,10 +2043,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__micropascals != None:
-            return self.__micropascals
-        self.__micropascals = self.__convert_from_base(PressureUnits.Micropascal)
-        return self.__micropascals
+        return self._cached_convert(PressureUnits.Micropascal)
 
     
     @property
@@ -1729,10 +2051,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__millipascals != None:
-            return self.__millipascals
-        self.__millipascals = self.__convert_from_base(PressureUnits.Millipascal)
-        return self.__millipascals
+        return self._cached_convert(PressureUnits.Millipascal)
 
     
     @property
@@ -1740,10 +2059,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__decapascals != None:
-            return self.__decapascals
-        self.__decapascals = self.__convert_from_base(PressureUnits.Decapascal)
-        return self.__decapascals
+        return self._cached_convert(PressureUnits.Decapascal)
 
     
     @property
@@ -1751,10 +2067,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__hectopascals != None:
-            return self.__hectopascals
-        self.__hectopascals = self.__convert_from_base(PressureUnits.Hectopascal)
-        return self.__hectopascals
+        return self._cached_convert(PressureUnits.Hectopascal)
 
     
     @property
@@ -1762,10 +2075,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__kilopascals != None:
-            return self.__kilopascals
-        self.__kilopascals = self.__convert_from_base(PressureUnits.Kilopascal)
-        return self.__kilopascals
+        return self._cached_convert(PressureUnits.Kilopascal)
 
     
     @property
@@ -1773,10 +2083,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__megapascals != None:
-            return self.__megapascals
-        self.__megapascals = self.__convert_from_base(PressureUnits.Megapascal)
-        return self.__megapascals
+        return self._cached_convert(PressureUnits.Megapascal)
 
     
     @property
@@ -1784,10 +2091,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__gigapascals != None:
-            return self.__gigapascals
-        self.__gigapascals = self.__convert_from_base(PressureUnits.Gigapascal)
-        return self.__gigapascals
+        return self._cached_convert(PressureUnits.Gigapascal)
 
     
     @property
@@ -1795,10 +2099,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__microbars != None:
-            return self.__microbars
-        self.__microbars = self.__convert_from_base(PressureUnits.Microbar)
-        return self.__microbars
+        return self._cached_convert(PressureUnits.Microbar)
 
     
     @property
@@ -1806,10 +2107,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__millibars != None:
-            return self.__millibars
-        self.__millibars = self.__convert_from_base(PressureUnits.Millibar)
-        return self.__millibars
+        return self._cached_convert(PressureUnits.Millibar)
 
     
     @property
@@ -1817,10 +2115,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__centibars != None:
-            return self.__centibars
-        self.__centibars = self.__convert_from_base(PressureUnits.Centibar)
-        return self.__centibars
+        return self._cached_convert(PressureUnits.Centibar)
 
     
     @property
@@ -1828,10 +2123,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__decibars != None:
-            return self.__decibars
-        self.__decibars = self.__convert_from_base(PressureUnits.Decibar)
-        return self.__decibars
+        return self._cached_convert(PressureUnits.Decibar)
 
     
     @property
@@ -1839,10 +2131,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__kilobars != None:
-            return self.__kilobars
-        self.__kilobars = self.__convert_from_base(PressureUnits.Kilobar)
-        return self.__kilobars
+        return self._cached_convert(PressureUnits.Kilobar)
 
     
     @property
@@ -1850,10 +2139,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__megabars != None:
-            return self.__megabars
-        self.__megabars = self.__convert_from_base(PressureUnits.Megabar)
-        return self.__megabars
+        return self._cached_convert(PressureUnits.Megabar)
 
     
     @property
@@ -1861,10 +2147,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__kilonewtons_per_square_meter != None:
-            return self.__kilonewtons_per_square_meter
-        self.__kilonewtons_per_square_meter = self.__convert_from_base(PressureUnits.KilonewtonPerSquareMeter)
-        return self.__kilonewtons_per_square_meter
+        return self._cached_convert(PressureUnits.KilonewtonPerSquareMeter)
 
     
     @property
@@ -1872,10 +2155,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__meganewtons_per_square_meter != None:
-            return self.__meganewtons_per_square_meter
-        self.__meganewtons_per_square_meter = self.__convert_from_base(PressureUnits.MeganewtonPerSquareMeter)
-        return self.__meganewtons_per_square_meter
+        return self._cached_convert(PressureUnits.MeganewtonPerSquareMeter)
 
     
     @property
@@ -1883,10 +2163,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__kilonewtons_per_square_centimeter != None:
-            return self.__kilonewtons_per_square_centimeter
-        self.__kilonewtons_per_square_centimeter = self.__convert_from_base(PressureUnits.KilonewtonPerSquareCentimeter)
-        return self.__kilonewtons_per_square_centimeter
+        return self._cached_convert(PressureUnits.KilonewtonPerSquareCentimeter)
 
     
     @property
@@ -1894,10 +2171,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__kilonewtons_per_square_millimeter != None:
-            return self.__kilonewtons_per_square_millimeter
-        self.__kilonewtons_per_square_millimeter = self.__convert_from_base(PressureUnits.KilonewtonPerSquareMillimeter)
-        return self.__kilonewtons_per_square_millimeter
+        return self._cached_convert(PressureUnits.KilonewtonPerSquareMillimeter)
 
     
     @property
@@ -1905,10 +2179,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_force_per_square_inch != None:
-            return self.__kilopounds_force_per_square_inch
-        self.__kilopounds_force_per_square_inch = self.__convert_from_base(PressureUnits.KilopoundForcePerSquareInch)
-        return self.__kilopounds_force_per_square_inch
+        return self._cached_convert(PressureUnits.KilopoundForcePerSquareInch)
 
     
     @property
@@ -1916,10 +2187,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_force_per_square_mil != None:
-            return self.__kilopounds_force_per_square_mil
-        self.__kilopounds_force_per_square_mil = self.__convert_from_base(PressureUnits.KilopoundForcePerSquareMil)
-        return self.__kilopounds_force_per_square_mil
+        return self._cached_convert(PressureUnits.KilopoundForcePerSquareMil)
 
     
     @property
@@ -1927,10 +2195,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_force_per_square_foot != None:
-            return self.__kilopounds_force_per_square_foot
-        self.__kilopounds_force_per_square_foot = self.__convert_from_base(PressureUnits.KilopoundForcePerSquareFoot)
-        return self.__kilopounds_force_per_square_foot
+        return self._cached_convert(PressureUnits.KilopoundForcePerSquareFoot)
 
     
     @property
@@ -1938,10 +2203,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__millimeters_of_water_column != None:
-            return self.__millimeters_of_water_column
-        self.__millimeters_of_water_column = self.__convert_from_base(PressureUnits.MillimeterOfWaterColumn)
-        return self.__millimeters_of_water_column
+        return self._cached_convert(PressureUnits.MillimeterOfWaterColumn)
 
     
     @property
@@ -1949,10 +2211,7 @@ class Pressure(AbstractMeasure):
         """
         
         """
-        if self.__centimeters_of_water_column != None:
-            return self.__centimeters_of_water_column
-        self.__centimeters_of_water_column = self.__convert_from_base(PressureUnits.CentimeterOfWaterColumn)
-        return self.__centimeters_of_water_column
+        return self._cached_convert(PressureUnits.CentimeterOfWaterColumn)
 
     
     def to_string(self, unit: PressureUnits = PressureUnits.Pascal) -> str:
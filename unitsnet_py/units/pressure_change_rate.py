@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class PressureChangeRateUnits(Enum):
         """
             PressureChangeRateUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         PascalPerSecond = 'pascal_per_second'
         """
@@ -109,169 +120,448 @@ class PressureChangeRate(AbstractMeasure):
         value (float): The value.
         from_unit (PressureChangeRateUnits): The PressureChangeRate unit to create from, The default unit is PascalPerSecond
     """
-    def __init__(self, value: float, from_unit: PressureChangeRateUnits = PressureChangeRateUnits.PascalPerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = PressureChangeRateUnits
+
+    _base_unit = PressureChangeRateUnits.PascalPerSecond
+
+    _dimensions = (-1, 1, -3, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 82
+
+    _binary_unit_ids = {
         
-        self.__pascals_per_second = None
+        PressureChangeRateUnits.PascalPerSecond: 0,
         
-        self.__pascals_per_minute = None
+        PressureChangeRateUnits.PascalPerMinute: 1,
         
-        self.__millimeters_of_mercury_per_second = None
+        PressureChangeRateUnits.MillimeterOfMercuryPerSecond: 2,
         
-        self.__atmospheres_per_second = None
+        PressureChangeRateUnits.AtmospherePerSecond: 3,
         
-        self.__pounds_force_per_square_inch_per_second = None
+        PressureChangeRateUnits.PoundForcePerSquareInchPerSecond: 4,
         
-        self.__pounds_force_per_square_inch_per_minute = None
+        PressureChangeRateUnits.PoundForcePerSquareInchPerMinute: 5,
         
-        self.__bars_per_second = None
+        PressureChangeRateUnits.BarPerSecond: 6,
         
-        self.__bars_per_minute = None
+        PressureChangeRateUnits.BarPerMinute: 7,
         
-        self.__kilopascals_per_second = None
+        PressureChangeRateUnits.KilopascalPerSecond: 8,
         
-        self.__megapascals_per_second = None
+        PressureChangeRateUnits.MegapascalPerSecond: 9,
         
-        self.__kilopascals_per_minute = None
+        PressureChangeRateUnits.KilopascalPerMinute: 10,
         
-        self.__megapascals_per_minute = None
+        PressureChangeRateUnits.MegapascalPerMinute: 11,
         
-        self.__kilopounds_force_per_square_inch_per_second = None
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerSecond: 12,
         
-        self.__megapounds_force_per_square_inch_per_second = None
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerSecond: 13,
         
-        self.__kilopounds_force_per_square_inch_per_minute = None
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerMinute: 14,
         
-        self.__megapounds_force_per_square_inch_per_minute = None
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerMinute: 15,
         
-        self.__millibars_per_second = None
+        PressureChangeRateUnits.MillibarPerSecond: 16,
         
-        self.__millibars_per_minute = None
+        PressureChangeRateUnits.MillibarPerMinute: 17,
         
+    }
 
-    def convert(self, unit: PressureChangeRateUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        PressureChangeRateUnits.PascalPerSecond: lambda value: (value),
+        
+        PressureChangeRateUnits.PascalPerMinute: lambda value: (value * 60),
+        
+        PressureChangeRateUnits.MillimeterOfMercuryPerSecond: lambda value: (value / 133.322),
+        
+        PressureChangeRateUnits.AtmospherePerSecond: lambda value: (value / (1.01325 * 1e5)),
+        
+        PressureChangeRateUnits.PoundForcePerSquareInchPerSecond: lambda value: (value / 6.894757293168361e3),
+        
+        PressureChangeRateUnits.PoundForcePerSquareInchPerMinute: lambda value: (value / 6.894757293168361e3 * 60),
+        
+        PressureChangeRateUnits.BarPerSecond: lambda value: (value / 1e5),
+        
+        PressureChangeRateUnits.BarPerMinute: lambda value: (value / 1e5 * 60),
+        
+        PressureChangeRateUnits.KilopascalPerSecond: lambda value: ((value) / 1000.0),
+        
+        PressureChangeRateUnits.MegapascalPerSecond: lambda value: ((value) / 1000000.0),
+        
+        PressureChangeRateUnits.KilopascalPerMinute: lambda value: ((value * 60) / 1000.0),
+        
+        PressureChangeRateUnits.MegapascalPerMinute: lambda value: ((value * 60) / 1000000.0),
+        
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerSecond: lambda value: ((value / 6.894757293168361e3) / 1000.0),
+        
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerSecond: lambda value: ((value / 6.894757293168361e3) / 1000000.0),
+        
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerMinute: lambda value: ((value / 6.894757293168361e3 * 60) / 1000.0),
+        
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerMinute: lambda value: ((value / 6.894757293168361e3 * 60) / 1000000.0),
+        
+        PressureChangeRateUnits.MillibarPerSecond: lambda value: ((value / 1e5) / 0.001),
+        
+        PressureChangeRateUnits.MillibarPerMinute: lambda value: ((value / 1e5 * 60) / 0.001),
+        
+    }
 
-    def __convert_from_base(self, from_unit: PressureChangeRateUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        PressureChangeRateUnits.PascalPerSecond: lambda value: (value),
+        
+        PressureChangeRateUnits.PascalPerMinute: lambda value: (value / 60),
+        
+        PressureChangeRateUnits.MillimeterOfMercuryPerSecond: lambda value: (value * 133.322),
+        
+        PressureChangeRateUnits.AtmospherePerSecond: lambda value: (value * 1.01325 * 1e5),
         
-        if from_unit == PressureChangeRateUnits.PascalPerSecond:
-            return (value)
+        PressureChangeRateUnits.PoundForcePerSquareInchPerSecond: lambda value: (value * 6.894757293168361e3),
         
-        if from_unit == PressureChangeRateUnits.PascalPerMinute:
-            return (value * 60)
+        PressureChangeRateUnits.PoundForcePerSquareInchPerMinute: lambda value: (value * 6.894757293168361e3 / 60),
         
-        if from_unit == PressureChangeRateUnits.MillimeterOfMercuryPerSecond:
-            return (value / 133.322)
+        PressureChangeRateUnits.BarPerSecond: lambda value: (value * 1e5),
         
-        if from_unit == PressureChangeRateUnits.AtmospherePerSecond:
-            return (value / (1.01325 * 1e5))
+        PressureChangeRateUnits.BarPerMinute: lambda value: (value * 1e5 / 60),
         
-        if from_unit == PressureChangeRateUnits.PoundForcePerSquareInchPerSecond:
-            return (value / 6.894757293168361e3)
+        PressureChangeRateUnits.KilopascalPerSecond: lambda value: ((value) * 1000.0),
         
-        if from_unit == PressureChangeRateUnits.PoundForcePerSquareInchPerMinute:
-            return (value / 6.894757293168361e3 * 60)
+        PressureChangeRateUnits.MegapascalPerSecond: lambda value: ((value) * 1000000.0),
         
-        if from_unit == PressureChangeRateUnits.BarPerSecond:
-            return (value / 1e5)
+        PressureChangeRateUnits.KilopascalPerMinute: lambda value: ((value / 60) * 1000.0),
         
-        if from_unit == PressureChangeRateUnits.BarPerMinute:
-            return (value / 1e5 * 60)
+        PressureChangeRateUnits.MegapascalPerMinute: lambda value: ((value / 60) * 1000000.0),
         
-        if from_unit == PressureChangeRateUnits.KilopascalPerSecond:
-            return ((value) / 1000.0)
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerSecond: lambda value: ((value * 6.894757293168361e3) * 1000.0),
         
-        if from_unit == PressureChangeRateUnits.MegapascalPerSecond:
-            return ((value) / 1000000.0)
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerSecond: lambda value: ((value * 6.894757293168361e3) * 1000000.0),
         
-        if from_unit == PressureChangeRateUnits.KilopascalPerMinute:
-            return ((value * 60) / 1000.0)
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerMinute: lambda value: ((value * 6.894757293168361e3 / 60) * 1000.0),
         
-        if from_unit == PressureChangeRateUnits.MegapascalPerMinute:
-            return ((value * 60) / 1000000.0)
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerMinute: lambda value: ((value * 6.894757293168361e3 / 60) * 1000000.0),
         
-        if from_unit == PressureChangeRateUnits.KilopoundForcePerSquareInchPerSecond:
-            return ((value / 6.894757293168361e3) / 1000.0)
+        PressureChangeRateUnits.MillibarPerSecond: lambda value: ((value * 1e5) * 0.001),
         
-        if from_unit == PressureChangeRateUnits.MegapoundForcePerSquareInchPerSecond:
-            return ((value / 6.894757293168361e3) / 1000000.0)
+        PressureChangeRateUnits.MillibarPerMinute: lambda value: ((value * 1e5 / 60) * 0.001),
         
-        if from_unit == PressureChangeRateUnits.KilopoundForcePerSquareInchPerMinute:
-            return ((value / 6.894757293168361e3 * 60) / 1000.0)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        PressureChangeRateUnits.PascalPerSecond: ('1', '0'),
+        
+        PressureChangeRateUnits.PascalPerMinute: ('60', '0'),
+        
+        PressureChangeRateUnits.MillimeterOfMercuryPerSecond: ('500/66661', '0'),
+        
+        PressureChangeRateUnits.AtmospherePerSecond: ('1/101325', '0'),
+        
+        PressureChangeRateUnits.PoundForcePerSquareInchPerSecond: ('1000000000000/6894757293168361', '0'),
+        
+        PressureChangeRateUnits.PoundForcePerSquareInchPerMinute: ('60000000000000/6894757293168361', '0'),
+        
+        PressureChangeRateUnits.BarPerSecond: ('1/100000', '0'),
+        
+        PressureChangeRateUnits.BarPerMinute: ('3/5000', '0'),
+        
+        PressureChangeRateUnits.KilopascalPerSecond: ('1/1000', '0'),
         
-        if from_unit == PressureChangeRateUnits.MegapoundForcePerSquareInchPerMinute:
-            return ((value / 6.894757293168361e3 * 60) / 1000000.0)
+        PressureChangeRateUnits.MegapascalPerSecond: ('1/1000000', '0'),
         
-        if from_unit == PressureChangeRateUnits.MillibarPerSecond:
-            return ((value / 1e5) / 0.001)
+        PressureChangeRateUnits.KilopascalPerMinute: ('3/50', '0'),
         
-        if from_unit == PressureChangeRateUnits.MillibarPerMinute:
-            return ((value / 1e5 * 60) / 0.001)
+        PressureChangeRateUnits.MegapascalPerMinute: ('3/50000', '0'),
         
-        return None
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerSecond: ('1000000000/6894757293168361', '0'),
+        
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerSecond: ('1000000/6894757293168361', '0'),
+        
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerMinute: ('60000000000/6894757293168361', '0'),
+        
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerMinute: ('60000000/6894757293168361', '0'),
+        
+        PressureChangeRateUnits.MillibarPerSecond: ('1/100', '0'),
+        
+        PressureChangeRateUnits.MillibarPerMinute: ('3/5', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        PressureChangeRateUnits.PascalPerSecond: ('1', '0'),
+        
+        PressureChangeRateUnits.PascalPerMinute: ('1/60', '0'),
+        
+        PressureChangeRateUnits.MillimeterOfMercuryPerSecond: ('66661/500', '0'),
+        
+        PressureChangeRateUnits.AtmospherePerSecond: ('101325', '0'),
+        
+        PressureChangeRateUnits.PoundForcePerSquareInchPerSecond: ('6894757293168361/1000000000000', '0'),
+        
+        PressureChangeRateUnits.PoundForcePerSquareInchPerMinute: ('6894757293168361/60000000000000', '0'),
+        
+        PressureChangeRateUnits.BarPerSecond: ('100000', '0'),
+        
+        PressureChangeRateUnits.BarPerMinute: ('5000/3', '0'),
+        
+        PressureChangeRateUnits.KilopascalPerSecond: ('1000', '0'),
+        
+        PressureChangeRateUnits.MegapascalPerSecond: ('1000000', '0'),
+        
+        PressureChangeRateUnits.KilopascalPerMinute: ('50/3', '0'),
+        
+        PressureChangeRateUnits.MegapascalPerMinute: ('50000/3', '0'),
+        
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerSecond: ('6894757293168361/1000000000', '0'),
+        
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerSecond: ('6894757293168361/1000000', '0'),
+        
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerMinute: ('6894757293168361/60000000000', '0'),
+        
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerMinute: ('6894757293168361/60000000', '0'),
+        
+        PressureChangeRateUnits.MillibarPerSecond: ('100', '0'),
+        
+        PressureChangeRateUnits.MillibarPerMinute: ('5/3', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: PressureChangeRateUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == PressureChangeRateUnits.PascalPerSecond:
-            return (value)
+        PressureChangeRateUnits.PascalPerSecond: ('Pa/s',),
         
-        if to_unit == PressureChangeRateUnits.PascalPerMinute:
-            return (value / 60)
+        PressureChangeRateUnits.PascalPerMinute: ('Pa/min',),
         
-        if to_unit == PressureChangeRateUnits.MillimeterOfMercuryPerSecond:
-            return (value * 133.322)
+        PressureChangeRateUnits.MillimeterOfMercuryPerSecond: ('mmHg/s',),
         
-        if to_unit == PressureChangeRateUnits.AtmospherePerSecond:
-            return (value * 1.01325 * 1e5)
+        PressureChangeRateUnits.AtmospherePerSecond: ('atm/s',),
         
-        if to_unit == PressureChangeRateUnits.PoundForcePerSquareInchPerSecond:
-            return (value * 6.894757293168361e3)
+        PressureChangeRateUnits.PoundForcePerSquareInchPerSecond: ('psi/s',),
         
-        if to_unit == PressureChangeRateUnits.PoundForcePerSquareInchPerMinute:
-            return (value * 6.894757293168361e3 / 60)
+        PressureChangeRateUnits.PoundForcePerSquareInchPerMinute: ('psi/min',),
         
-        if to_unit == PressureChangeRateUnits.BarPerSecond:
-            return (value * 1e5)
+        PressureChangeRateUnits.BarPerSecond: ('bar/s',),
         
-        if to_unit == PressureChangeRateUnits.BarPerMinute:
-            return (value * 1e5 / 60)
+        PressureChangeRateUnits.BarPerMinute: ('bar/min',),
         
-        if to_unit == PressureChangeRateUnits.KilopascalPerSecond:
-            return ((value) * 1000.0)
+        PressureChangeRateUnits.KilopascalPerSecond: ('kPa/s',),
         
-        if to_unit == PressureChangeRateUnits.MegapascalPerSecond:
-            return ((value) * 1000000.0)
+        PressureChangeRateUnits.MegapascalPerSecond: ('MPa/s',),
         
-        if to_unit == PressureChangeRateUnits.KilopascalPerMinute:
-            return ((value / 60) * 1000.0)
+        PressureChangeRateUnits.KilopascalPerMinute: ('kPa/min',),
         
-        if to_unit == PressureChangeRateUnits.MegapascalPerMinute:
-            return ((value / 60) * 1000000.0)
+        PressureChangeRateUnits.MegapascalPerMinute: ('MPa/min',),
         
-        if to_unit == PressureChangeRateUnits.KilopoundForcePerSquareInchPerSecond:
-            return ((value * 6.894757293168361e3) * 1000.0)
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerSecond: ('kpsi/s',),
         
-        if to_unit == PressureChangeRateUnits.MegapoundForcePerSquareInchPerSecond:
-            return ((value * 6.894757293168361e3) * 1000000.0)
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerSecond: ('Mpsi/s',),
         
-        if to_unit == PressureChangeRateUnits.KilopoundForcePerSquareInchPerMinute:
-            return ((value * 6.894757293168361e3 / 60) * 1000.0)
+        PressureChangeRateUnits.KilopoundForcePerSquareInchPerMinute: ('kpsi/min',),
         
-        if to_unit == PressureChangeRateUnits.MegapoundForcePerSquareInchPerMinute:
-            return ((value * 6.894757293168361e3 / 60) * 1000000.0)
+        PressureChangeRateUnits.MegapoundForcePerSquareInchPerMinute: ('Mpsi/min',),
         
-        if to_unit == PressureChangeRateUnits.MillibarPerSecond:
-            return ((value * 1e5) * 0.001)
+        PressureChangeRateUnits.MillibarPerSecond: ('mbar/s',),
         
-        if to_unit == PressureChangeRateUnits.MillibarPerMinute:
-            return ((value * 1e5 / 60) * 0.001)
+        PressureChangeRateUnits.MillibarPerMinute: ('mbar/min',),
         
-        return None
+    }
 
+    def __init__(self, value: float, from_unit: PressureChangeRateUnits = PressureChangeRateUnits.PascalPerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: PressureChangeRateUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: PressureChangeRateUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: PressureChangeRateUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: PressureChangeRateUnits, to_unit: PressureChangeRateUnits) -> float:
+        """
+        Convert a value from one PressureChangeRate unit to another, without creating a PressureChangeRate instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: PressureChangeRateUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: PressureChangeRateUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return PressureChangeRate._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: PressureChangeRateUnits, to_unit: PressureChangeRateUnits) -> List[float]:
+        """
+        Convert many values from one PressureChangeRate unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: PressureChangeRateUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: PressureChangeRateUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return PressureChangeRate._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: PressureChangeRateUnits, to_unit: PressureChangeRateUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", PressureChangeRate._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: PressureChangeRateUnits, to_unit: PressureChangeRateUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one PressureChangeRate unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: PressureChangeRateUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: PressureChangeRateUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return PressureChangeRate._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: PressureChangeRateUnits = PressureChangeRateUnits.PascalPerSecond) -> PressureChangeRate:
+        """
+        Create a new instance of PressureChangeRate holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: PressureChangeRateUnits
+        :return: A new instance of PressureChangeRate.
+        :rtype: PressureChangeRate
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return PressureChangeRate._from_exact(value, from_unit)
+
+    def to_exact(self, unit: PressureChangeRateUnits = PressureChangeRateUnits.PascalPerSecond) -> Fraction:
+        """
+        Get the exact value of the PressureChangeRate in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (PascalPerSecond).
+        :type unit: PressureChangeRateUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> PressureChangeRate:
+        """
+        Parse a PressureChangeRate from a value followed by a unit abbreviation, e.g. "1 Pa/s".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of PressureChangeRate.
+        :rtype: PressureChangeRate
+        :raises ValueError: When the string is not a valid or an ambiguous PressureChangeRate.
+        """
+        return PressureChangeRate._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[PressureChangeRate]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return PressureChangeRate._try_parse(text)
+
+    def to_binary(self, unit: Optional[PressureChangeRateUnits] = None) -> bytes:
+        """
+        Encode the PressureChangeRate to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: PressureChangeRateUnits
+        :return: The encoded PressureChangeRate.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> PressureChangeRate:
+        """
+        Decode a PressureChangeRate encoded by to_binary.
+
+        :param data: The encoded PressureChangeRate, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of PressureChangeRate.
+        :rtype: PressureChangeRate
+        :raises ValueError: When the data is not a valid encoded PressureChangeRate.
+        """
+        return PressureChangeRate._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[PressureChangeRateUnits] = None) -> dict:
+        """
+        Get the PressureChangeRate DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (PascalPerSecond).
+        :type hold_in_unit: PressureChangeRateUnits
+        :return: The PressureChangeRate DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[PressureChangeRateUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> PressureChangeRate:
+        """
+        Create a new instance of PressureChangeRate from its DTO.
+
+        :param dto: The PressureChangeRate DTO, the unit is the PressureChangeRateUnits value or name.
+        :type dto: dict
+        :return: A new instance of PressureChangeRate.
+        :rtype: PressureChangeRate
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return PressureChangeRate._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> PressureChangeRate:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return PressureChangeRate._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -553,10 +843,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__pascals_per_second != None:
-            return self.__pascals_per_second
-        self.__pascals_per_second = self.__convert_from_base(PressureChangeRateUnits.PascalPerSecond)
-        return self.__pascals_per_second
+        return self._cached_convert(PressureChangeRateUnits.PascalPerSecond)
 
     
     @property
@@ -564,10 +851,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__pascals_per_minute != None:
-            return self.__pascals_per_minute
-        self.__pascals_per_minute = self.__convert_from_base(PressureChangeRateUnits.PascalPerMinute)
-        return self.__pascals_per_minute
+        return self._cached_convert(PressureChangeRateUnits.PascalPerMinute)
 
     
     @property
@@ -575,10 +859,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__millimeters_of_mercury_per_second != None:
-            return self.__millimeters_of_mercury_per_second
-        self.__millimeters_of_mercury_per_second = self.__convert_from_base(PressureChangeRateUnits.MillimeterOfMercuryPerSecond)
-        return self.__millimeters_of_mercury_per_second
+        return self._cached_convert(PressureChangeRateUnits.MillimeterOfMercuryPerSecond)
 
     
     @property
@@ -586,10 +867,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__atmospheres_per_second != None:
-            return self.__atmospheres_per_second
-        self.__atmospheres_per_second = self.__convert_from_base(PressureChangeRateUnits.AtmospherePerSecond)
-        return self.__atmospheres_per_second
+        return self._cached_convert(PressureChangeRateUnits.AtmospherePerSecond)
 
     
     @property
@@ -597,10 +875,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_per_square_inch_per_second != None:
-            return self.__pounds_force_per_square_inch_per_second
-        self.__pounds_force_per_square_inch_per_second = self.__convert_from_base(PressureChangeRateUnits.PoundForcePerSquareInchPerSecond)
-        return self.__pounds_force_per_square_inch_per_second
+        return self._cached_convert(PressureChangeRateUnits.PoundForcePerSquareInchPerSecond)
 
     
     @property
@@ -608,10 +883,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_per_square_inch_per_minute != None:
-            return self.__pounds_force_per_square_inch_per_minute
-        self.__pounds_force_per_square_inch_per_minute = self.__convert_from_base(PressureChangeRateUnits.PoundForcePerSquareInchPerMinute)
-        return self.__pounds_force_per_square_inch_per_minute
+        return self._cached_convert(PressureChangeRateUnits.PoundForcePerSquareInchPerMinute)
 
     
     @property
@@ -619,10 +891,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__bars_per_second != None:
-            return self.__bars_per_second
-        self.__bars_per_second = self.__convert_from_base(PressureChangeRateUnits.BarPerSecond)
-        return self.__bars_per_second
+        return self._cached_convert(PressureChangeRateUnits.BarPerSecond)
 
     
     @property
@@ -630,10 +899,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__bars_per_minute != None:
-            return self.__bars_per_minute
-        self.__bars_per_minute = self.__convert_from_base(PressureChangeRateUnits.BarPerMinute)
-        return self.__bars_per_minute
+        return self._cached_convert(PressureChangeRateUnits.BarPerMinute)
 
     
     @property
@@ -641,10 +907,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__kilopascals_per_second != None:
-            return self.__kilopascals_per_second
-        self.__kilopascals_per_second = self.__convert_from_base(PressureChangeRateUnits.KilopascalPerSecond)
-        return self.__kilopascals_per_second
+        return self._cached_convert(PressureChangeRateUnits.KilopascalPerSecond)
 
     
     @property
@@ -652,10 +915,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__megapascals_per_second != None:
-            return self.__megapascals_per_second
-        self.__megapascals_per_second = self.__convert_from_base(PressureChangeRateUnits.MegapascalPerSecond)
-        return self.__megapascals_per_second
+        return self._cached_convert(PressureChangeRateUnits.MegapascalPerSecond)
 
     
     @property
@@ -663,10 +923,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__kilopascals_per_minute != None:
-            return self.__kilopascals_per_minute
-        self.__kilopascals_per_minute = self.__convert_from_base(PressureChangeRateUnits.KilopascalPerMinute)
-        return self.__kilopascals_per_minute
+        return self._cached_convert(PressureChangeRateUnits.KilopascalPerMinute)
 
     
     @property
@@ -674,10 +931,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__megapascals_per_minute != None:
-            return self.__megapascals_per_minute
-        self.__megapascals_per_minute = self.__convert_from_base(PressureChangeRateUnits.MegapascalPerMinute)
-        return self.__megapascals_per_minute
+        return self._cached_convert(PressureChangeRateUnits.MegapascalPerMinute)
 
     
     @property
@@ -685,10 +939,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_force_per_square_inch_per_second != None:
-            return self.__kilopounds_force_per_square_inch_per_second
-        self.__kilopounds_force_per_square_inch_per_second = self.__convert_from_base(PressureChangeRateUnits.KilopoundForcePerSquareInchPerSecond)
-        return self.__kilopounds_force_per_square_inch_per_second
+        return self._cached_convert(PressureChangeRateUnits.KilopoundForcePerSquareInchPerSecond)
 
     
     @property
@@ -696,10 +947,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__megapounds_force_per_square_inch_per_second != None:
-            return self.__megapounds_force_per_square_inch_per_second
-        self.__megapounds_force_per_square_inch_per_second = self.__convert_from_base(PressureChangeRateUnits.MegapoundForcePerSquareInchPerSecond)
-        return self.__megapounds_force_per_square_inch_per_second
+        return self._cached_convert(PressureChangeRateUnits.MegapoundForcePerSquareInchPerSecond)
 
     
     @property
@@ -707,10 +955,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_force_per_square_inch_per_minute != None:
-            return self.__kilopounds_force_per_square_inch_per_minute
-        self.__kilopounds_force_per_square_inch_per_minute = self.__convert_from_base(PressureChangeRateUnits.KilopoundForcePerSquareInchPerMinute)
-        return self.__kilopounds_force_per_square_inch_per_minute
+        return self._cached_convert(PressureChangeRateUnits.KilopoundForcePerSquareInchPerMinute)
 
     
     @property
@@ -718,10 +963,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__megapounds_force_per_square_inch_per_minute != None:
-            return self.__megapounds_force_per_square_inch_per_minute
-        self.__megapounds_force_per_square_inch_per_minute = self.__convert_from_base(PressureChangeRateUnits.MegapoundForcePerSquareInchPerMinute)
-        return self.__megapounds_force_per_square_inch_per_minute
+        return self._cached_convert(PressureChangeRateUnits.MegapoundForcePerSquareInchPerMinute)
 
     
     @property
@@ -729,10 +971,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__millibars_per_second != None:
-            return self.__millibars_per_second
-        self.__millibars_per_second = self.__convert_from_base(PressureChangeRateUnits.MillibarPerSecond)
-        return self.__millibars_per_second
+        return self._cached_convert(PressureChangeRateUnits.MillibarPerSecond)
 
     
     @property
@@ -740,10 +979,7 @@ class PressureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__millibars_per_minute != None:
-            return self.__millibars_per_minute
-        self.__millibars_per_minute = self.__convert_from_base(PressureChangeRateUnits.MillibarPerMinute)
-        return self.__millibars_per_minute
+        return self._cached_convert(PressureChangeRateUnits.MillibarPerMinute)
 
     
     def to_string(self, unit: PressureChangeRateUnits = PressureChangeRateUnits.PascalPerSecond) -> str:
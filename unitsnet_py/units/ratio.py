@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class RatioUnits(Enum):
         """
             RatioUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         DecimalFraction = 'decimal_fraction'
         """
@@ -49,73 +60,304 @@ class Ratio(AbstractMeasure):
         value (float): The value.
         from_unit (RatioUnits): The Ratio unit to create from, The default unit is DecimalFraction
     """
-    def __init__(self, value: float, from_unit: RatioUnits = RatioUnits.DecimalFraction):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = RatioUnits
+
+    _base_unit = RatioUnits.DecimalFraction
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 83
+
+    _binary_unit_ids = {
         
-        self.__decimal_fractions = None
+        RatioUnits.DecimalFraction: 0,
         
-        self.__percent = None
+        RatioUnits.Percent: 1,
         
-        self.__parts_per_thousand = None
+        RatioUnits.PartPerThousand: 2,
         
-        self.__parts_per_million = None
+        RatioUnits.PartPerMillion: 3,
         
-        self.__parts_per_billion = None
+        RatioUnits.PartPerBillion: 4,
         
-        self.__parts_per_trillion = None
+        RatioUnits.PartPerTrillion: 5,
         
+    }
 
-    def convert(self, unit: RatioUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        RatioUnits.DecimalFraction: lambda value: (value),
+        
+        RatioUnits.Percent: lambda value: (value * 1e2),
+        
+        RatioUnits.PartPerThousand: lambda value: (value * 1e3),
+        
+        RatioUnits.PartPerMillion: lambda value: (value * 1e6),
+        
+        RatioUnits.PartPerBillion: lambda value: (value * 1e9),
+        
+        RatioUnits.PartPerTrillion: lambda value: (value * 1e12),
+        
+    }
 
-    def __convert_from_base(self, from_unit: RatioUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        RatioUnits.DecimalFraction: lambda value: (value),
+        
+        RatioUnits.Percent: lambda value: (value / 1e2),
+        
+        RatioUnits.PartPerThousand: lambda value: (value / 1e3),
+        
+        RatioUnits.PartPerMillion: lambda value: (value / 1e6),
+        
+        RatioUnits.PartPerBillion: lambda value: (value / 1e9),
+        
+        RatioUnits.PartPerTrillion: lambda value: (value / 1e12),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
         
-        if from_unit == RatioUnits.DecimalFraction:
-            return (value)
+        RatioUnits.DecimalFraction: ('1', '0'),
         
-        if from_unit == RatioUnits.Percent:
-            return (value * 1e2)
+        RatioUnits.Percent: ('100', '0'),
         
-        if from_unit == RatioUnits.PartPerThousand:
-            return (value * 1e3)
+        RatioUnits.PartPerThousand: ('1000', '0'),
         
-        if from_unit == RatioUnits.PartPerMillion:
-            return (value * 1e6)
+        RatioUnits.PartPerMillion: ('1000000', '0'),
         
-        if from_unit == RatioUnits.PartPerBillion:
-            return (value * 1e9)
+        RatioUnits.PartPerBillion: ('1000000000', '0'),
         
-        if from_unit == RatioUnits.PartPerTrillion:
-            return (value * 1e12)
+        RatioUnits.PartPerTrillion: ('1000000000000', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        RatioUnits.DecimalFraction: ('1', '0'),
+        
+        RatioUnits.Percent: ('1/100', '0'),
+        
+        RatioUnits.PartPerThousand: ('1/1000', '0'),
+        
+        RatioUnits.PartPerMillion: ('1/1000000', '0'),
+        
+        RatioUnits.PartPerBillion: ('1/1000000000', '0'),
+        
+        RatioUnits.PartPerTrillion: ('1/1000000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: RatioUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == RatioUnits.DecimalFraction:
-            return (value)
+        RatioUnits.DecimalFraction: (),
         
-        if to_unit == RatioUnits.Percent:
-            return (value / 1e2)
+        RatioUnits.Percent: ('%',),
         
-        if to_unit == RatioUnits.PartPerThousand:
-            return (value / 1e3)
+        RatioUnits.PartPerThousand: ('‰',),
         
-        if to_unit == RatioUnits.PartPerMillion:
-            return (value / 1e6)
+        RatioUnits.PartPerMillion: ('ppm',),
         
-        if to_unit == RatioUnits.PartPerBillion:
-            return (value / 1e9)
+        RatioUnits.PartPerBillion: ('ppb',),
         
-        if to_unit == RatioUnits.PartPerTrillion:
-            return (value / 1e12)
+        RatioUnits.PartPerTrillion: ('ppt',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: RatioUnits = RatioUnits.DecimalFraction):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: RatioUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: RatioUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: RatioUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: RatioUnits, to_unit: RatioUnits) -> float:
+        """
+        Convert a value from one Ratio unit to another, without creating a Ratio instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: RatioUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: RatioUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Ratio._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: RatioUnits, to_unit: RatioUnits) -> List[float]:
+        """
+        Convert many values from one Ratio unit to another.
+        The conversion is resolved once and applied to all the values.
 
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: RatioUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: RatioUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Ratio._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: RatioUnits, to_unit: RatioUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Ratio._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: RatioUnits, to_unit: RatioUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Ratio unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: RatioUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: RatioUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Ratio._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: RatioUnits = RatioUnits.DecimalFraction) -> Ratio:
+        """
+        Create a new instance of Ratio holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: RatioUnits
+        :return: A new instance of Ratio.
+        :rtype: Ratio
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Ratio._from_exact(value, from_unit)
+
+    def to_exact(self, unit: RatioUnits = RatioUnits.DecimalFraction) -> Fraction:
+        """
+        Get the exact value of the Ratio in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (DecimalFraction).
+        :type unit: RatioUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Ratio:
+        """
+        Parse a Ratio from a value followed by a unit abbreviation, e.g. "1 ".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Ratio.
+        :rtype: Ratio
+        :raises ValueError: When the string is not a valid or an ambiguous Ratio.
+        """
+        return Ratio._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Ratio]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Ratio._try_parse(text)
+
+    def to_binary(self, unit: Optional[RatioUnits] = None) -> bytes:
+        """
+        Encode the Ratio to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: RatioUnits
+        :return: The encoded Ratio.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Ratio:
+        """
+        Decode a Ratio encoded by to_binary.
+
+        :param data: The encoded Ratio, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Ratio.
+        :rtype: Ratio
+        :raises ValueError: When the data is not a valid encoded Ratio.
+        """
+        return Ratio._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[RatioUnits] = None) -> dict:
+        """
+        Get the Ratio DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (DecimalFraction).
+        :type hold_in_unit: RatioUnits
+        :return: The Ratio DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[RatioUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Ratio:
+        """
+        Create a new instance of Ratio from its DTO.
+
+        :param dto: The Ratio DTO, the unit is the RatioUnits value or name.
+        :type dto: dict
+        :return: A new instance of Ratio.
+        :rtype: Ratio
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Ratio._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Ratio:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Ratio._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -217,10 +459,7 @@ class Ratio(AbstractMeasure):
         """
         
         """
-        if self.__decimal_fractions != None:
-            return self.__decimal_fractions
-        self.__decimal_fractions = self.__convert_from_base(RatioUnits.DecimalFraction)
-        return self.__decimal_fractions
+        return self._cached_convert(RatioUnits.DecimalFraction)
 
     
     @property
@@ -228,10 +467,7 @@ class Ratio(AbstractMeasure):
         """
         
         """
-        if self.__percent != None:
-            return self.__percent
-        self.__percent = self.__convert_from_base(RatioUnits.Percent)
-        return self.__percent
+        return self._cached_convert(RatioUnits.Percent)
 
     
     @property
@@ -239,10 +475,7 @@ class Ratio(AbstractMeasure):
         """
         
         """
-        if self.__parts_per_thousand != None:
-            return self.__parts_per_thousand
-        self.__parts_per_thousand = self.__convert_from_base(RatioUnits.PartPerThousand)
-        return self.__parts_per_thousand
+        return self._cached_convert(RatioUnits.PartPerThousand)
 
     
     @property
@@ -250,10 +483,7 @@ class Ratio(AbstractMeasure):
         """
         
         """
-        if self.__parts_per_million != None:
-            return self.__parts_per_million
-        self.__parts_per_million = self.__convert_from_base(RatioUnits.PartPerMillion)
-        return self.__parts_per_million
+        return self._cached_convert(RatioUnits.PartPerMillion)
 
     
     @property
@@ -261,10 +491,7 @@ class Ratio(AbstractMeasure):
         """
         
         """
-        if self.__parts_per_billion != None:
-            return self.__parts_per_billion
-        self.__parts_per_billion = self.__convert_from_base(RatioUnits.PartPerBillion)
-        return self.__parts_per_billion
+        return self._cached_convert(RatioUnits.PartPerBillion)
 
     
     @property
@@ -272,10 +499,7 @@ class Ratio(AbstractMeasure):
         """
         
         """
-        if self.__parts_per_trillion != None:
-            return self.__parts_per_trillion
-        self.__parts_per_trillion = self.__convert_from_base(RatioUnits.PartPerTrillion)
-        return self.__parts_per_trillion
+        return self._cached_convert(RatioUnits.PartPerTrillion)
 
     
     def to_string(self, unit: RatioUnits = RatioUnits.DecimalFraction) -> str:
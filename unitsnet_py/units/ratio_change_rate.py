@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class RatioChangeRateUnits(Enum):
         """
             RatioChangeRateUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         PercentPerSecond = 'percent_per_second'
         """
@@ -29,41 +40,256 @@ class RatioChangeRate(AbstractMeasure):
         value (float): The value.
         from_unit (RatioChangeRateUnits): The RatioChangeRate unit to create from, The default unit is DecimalFractionPerSecond
     """
-    def __init__(self, value: float, from_unit: RatioChangeRateUnits = RatioChangeRateUnits.DecimalFractionPerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = RatioChangeRateUnits
+
+    _base_unit = RatioChangeRateUnits.DecimalFractionPerSecond
+
+    _dimensions = (0, 0, -1, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 84
+
+    _binary_unit_ids = {
         
-        self.__percents_per_second = None
+        RatioChangeRateUnits.PercentPerSecond: 0,
         
-        self.__decimal_fractions_per_second = None
+        RatioChangeRateUnits.DecimalFractionPerSecond: 1,
         
+    }
 
-    def convert(self, unit: RatioChangeRateUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        RatioChangeRateUnits.PercentPerSecond: lambda value: (value * 1e2),
+        
+        RatioChangeRateUnits.DecimalFractionPerSecond: lambda value: (value),
+        
+    }
 
-    def __convert_from_base(self, from_unit: RatioChangeRateUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        RatioChangeRateUnits.PercentPerSecond: lambda value: (value / 1e2),
         
-        if from_unit == RatioChangeRateUnits.PercentPerSecond:
-            return (value * 1e2)
+        RatioChangeRateUnits.DecimalFractionPerSecond: lambda value: (value),
         
-        if from_unit == RatioChangeRateUnits.DecimalFractionPerSecond:
-            return (value)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        RatioChangeRateUnits.PercentPerSecond: ('100', '0'),
         
-        return None
+        RatioChangeRateUnits.DecimalFractionPerSecond: ('1', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        RatioChangeRateUnits.PercentPerSecond: ('1/100', '0'),
+        
+        RatioChangeRateUnits.DecimalFractionPerSecond: ('1', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: RatioChangeRateUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == RatioChangeRateUnits.PercentPerSecond:
-            return (value / 1e2)
+        RatioChangeRateUnits.PercentPerSecond: ('%/s',),
         
-        if to_unit == RatioChangeRateUnits.DecimalFractionPerSecond:
-            return (value)
+        RatioChangeRateUnits.DecimalFractionPerSecond: ('/s',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: RatioChangeRateUnits = RatioChangeRateUnits.DecimalFractionPerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: RatioChangeRateUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: RatioChangeRateUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: RatioChangeRateUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: RatioChangeRateUnits, to_unit: RatioChangeRateUnits) -> float:
+        """
+        Convert a value from one RatioChangeRate unit to another, without creating a RatioChangeRate instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: RatioChangeRateUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: RatioChangeRateUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return RatioChangeRate._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: RatioChangeRateUnits, to_unit: RatioChangeRateUnits) -> List[float]:
+        """
+        Convert many values from one RatioChangeRate unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: RatioChangeRateUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: RatioChangeRateUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return RatioChangeRate._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: RatioChangeRateUnits, to_unit: RatioChangeRateUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", RatioChangeRate._convert_many(values, from_unit, to_unit))
 
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: RatioChangeRateUnits, to_unit: RatioChangeRateUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one RatioChangeRate unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: RatioChangeRateUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: RatioChangeRateUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return RatioChangeRate._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: RatioChangeRateUnits = RatioChangeRateUnits.DecimalFractionPerSecond) -> RatioChangeRate:
+        """
+        Create a new instance of RatioChangeRate holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: RatioChangeRateUnits
+        :return: A new instance of RatioChangeRate.
+        :rtype: RatioChangeRate
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return RatioChangeRate._from_exact(value, from_unit)
+
+    def to_exact(self, unit: RatioChangeRateUnits = RatioChangeRateUnits.DecimalFractionPerSecond) -> Fraction:
+        """
+        Get the exact value of the RatioChangeRate in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (DecimalFractionPerSecond).
+        :type unit: RatioChangeRateUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> RatioChangeRate:
+        """
+        Parse a RatioChangeRate from a value followed by a unit abbreviation, e.g. "1 %/s".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of RatioChangeRate.
+        :rtype: RatioChangeRate
+        :raises ValueError: When the string is not a valid or an ambiguous RatioChangeRate.
+        """
+        return RatioChangeRate._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[RatioChangeRate]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return RatioChangeRate._try_parse(text)
+
+    def to_binary(self, unit: Optional[RatioChangeRateUnits] = None) -> bytes:
+        """
+        Encode the RatioChangeRate to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: RatioChangeRateUnits
+        :return: The encoded RatioChangeRate.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> RatioChangeRate:
+        """
+        Decode a RatioChangeRate encoded by to_binary.
+
+        :param data: The encoded RatioChangeRate, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of RatioChangeRate.
+        :rtype: RatioChangeRate
+        :raises ValueError: When the data is not a valid encoded RatioChangeRate.
+        """
+        return RatioChangeRate._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[RatioChangeRateUnits] = None) -> dict:
+        """
+        Get the RatioChangeRate DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (DecimalFractionPerSecond).
+        :type hold_in_unit: RatioChangeRateUnits
+        :return: The RatioChangeRate DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[RatioChangeRateUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> RatioChangeRate:
+        """
+        Create a new instance of RatioChangeRate from its DTO.
+
+        :param dto: The RatioChangeRate DTO, the unit is the RatioChangeRateUnits value or name.
+        :type dto: dict
+        :return: A new instance of RatioChangeRate.
+        :rtype: RatioChangeRate
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return RatioChangeRate._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> RatioChangeRate:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return RatioChangeRate._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -105,10 +331,7 @@ class RatioChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__percents_per_second != None:
-            return self.__percents_per_second
-        self.__percents_per_second = self.__convert_from_base(RatioChangeRateUnits.PercentPerSecond)
-        return self.__percents_per_second
+        return self._cached_convert(RatioChangeRateUnits.PercentPerSecond)
 
     
     @property
@@ -116,10 +339,7 @@ class RatioChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__decimal_fractions_per_second != None:
-            return self.__decimal_fractions_per_second
-        self.__decimal_fractions_per_second = self.__convert_from_base(RatioChangeRateUnits.DecimalFractionPerSecond)
-        return self.__decimal_fractions_per_second
+        return self._cached_convert(RatioChangeRateUnits.DecimalFractionPerSecond)
 
     
     def to_string(self, unit: RatioChangeRateUnits = RatioChangeRateUnits.DecimalFractionPerSecond) -> str:
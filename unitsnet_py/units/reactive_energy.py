@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ReactiveEnergyUnits(Enum):
         """
             ReactiveEnergyUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         VoltampereReactiveHour = 'voltampere_reactive_hour'
         """
@@ -34,49 +45,268 @@ class ReactiveEnergy(AbstractMeasure):
         value (float): The value.
         from_unit (ReactiveEnergyUnits): The ReactiveEnergy unit to create from, The default unit is VoltampereReactiveHour
     """
-    def __init__(self, value: float, from_unit: ReactiveEnergyUnits = ReactiveEnergyUnits.VoltampereReactiveHour):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ReactiveEnergyUnits
+
+    _base_unit = ReactiveEnergyUnits.VoltampereReactiveHour
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 85
+
+    _binary_unit_ids = {
         
-        self.__voltampere_reactive_hours = None
+        ReactiveEnergyUnits.VoltampereReactiveHour: 0,
         
-        self.__kilovoltampere_reactive_hours = None
+        ReactiveEnergyUnits.KilovoltampereReactiveHour: 1,
         
-        self.__megavoltampere_reactive_hours = None
+        ReactiveEnergyUnits.MegavoltampereReactiveHour: 2,
         
+    }
 
-    def convert(self, unit: ReactiveEnergyUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ReactiveEnergyUnits.VoltampereReactiveHour: lambda value: (value),
+        
+        ReactiveEnergyUnits.KilovoltampereReactiveHour: lambda value: ((value) / 1000.0),
+        
+        ReactiveEnergyUnits.MegavoltampereReactiveHour: lambda value: ((value) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ReactiveEnergyUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ReactiveEnergyUnits.VoltampereReactiveHour:
-            return (value)
+        ReactiveEnergyUnits.VoltampereReactiveHour: lambda value: (value),
         
-        if from_unit == ReactiveEnergyUnits.KilovoltampereReactiveHour:
-            return ((value) / 1000.0)
+        ReactiveEnergyUnits.KilovoltampereReactiveHour: lambda value: ((value) * 1000.0),
         
-        if from_unit == ReactiveEnergyUnits.MegavoltampereReactiveHour:
-            return ((value) / 1000000.0)
+        ReactiveEnergyUnits.MegavoltampereReactiveHour: lambda value: ((value) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ReactiveEnergyUnits.VoltampereReactiveHour: ('1', '0'),
+        
+        ReactiveEnergyUnits.KilovoltampereReactiveHour: ('1/1000', '0'),
+        
+        ReactiveEnergyUnits.MegavoltampereReactiveHour: ('1/1000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ReactiveEnergyUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == ReactiveEnergyUnits.VoltampereReactiveHour:
-            return (value)
+        ReactiveEnergyUnits.VoltampereReactiveHour: ('1', '0'),
         
-        if to_unit == ReactiveEnergyUnits.KilovoltampereReactiveHour:
-            return ((value) * 1000.0)
+        ReactiveEnergyUnits.KilovoltampereReactiveHour: ('1000', '0'),
+        
+        ReactiveEnergyUnits.MegavoltampereReactiveHour: ('1000000', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ReactiveEnergyUnits.MegavoltampereReactiveHour:
-            return ((value) * 1000000.0)
+        ReactiveEnergyUnits.VoltampereReactiveHour: ('varh',),
         
-        return None
+        ReactiveEnergyUnits.KilovoltampereReactiveHour: ('kvarh',),
+        
+        ReactiveEnergyUnits.MegavoltampereReactiveHour: ('Mvarh',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ReactiveEnergyUnits = ReactiveEnergyUnits.VoltampereReactiveHour):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ReactiveEnergyUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ReactiveEnergyUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ReactiveEnergyUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ReactiveEnergyUnits, to_unit: ReactiveEnergyUnits) -> float:
+        """
+        Convert a value from one ReactiveEnergy unit to another, without creating a ReactiveEnergy instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ReactiveEnergyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ReactiveEnergyUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ReactiveEnergy._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ReactiveEnergyUnits, to_unit: ReactiveEnergyUnits) -> List[float]:
+        """
+        Convert many values from one ReactiveEnergy unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ReactiveEnergyUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ReactiveEnergyUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ReactiveEnergy._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ReactiveEnergyUnits, to_unit: ReactiveEnergyUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ReactiveEnergy._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ReactiveEnergyUnits, to_unit: ReactiveEnergyUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ReactiveEnergy unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ReactiveEnergyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ReactiveEnergyUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ReactiveEnergy._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ReactiveEnergyUnits = ReactiveEnergyUnits.VoltampereReactiveHour) -> ReactiveEnergy:
+        """
+        Create a new instance of ReactiveEnergy holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ReactiveEnergyUnits
+        :return: A new instance of ReactiveEnergy.
+        :rtype: ReactiveEnergy
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ReactiveEnergy._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ReactiveEnergyUnits = ReactiveEnergyUnits.VoltampereReactiveHour) -> Fraction:
+        """
+        Get the exact value of the ReactiveEnergy in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (VoltampereReactiveHour).
+        :type unit: ReactiveEnergyUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ReactiveEnergy:
+        """
+        Parse a ReactiveEnergy from a value followed by a unit abbreviation, e.g. "1 varh".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ReactiveEnergy.
+        :rtype: ReactiveEnergy
+        :raises ValueError: When the string is not a valid or an ambiguous ReactiveEnergy.
+        """
+        return ReactiveEnergy._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ReactiveEnergy]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ReactiveEnergy._try_parse(text)
 
+    def to_binary(self, unit: Optional[ReactiveEnergyUnits] = None) -> bytes:
+        """
+        Encode the ReactiveEnergy to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ReactiveEnergyUnits
+        :return: The encoded ReactiveEnergy.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ReactiveEnergy:
+        """
+        Decode a ReactiveEnergy encoded by to_binary.
+
+        :param data: The encoded ReactiveEnergy, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ReactiveEnergy.
+        :rtype: ReactiveEnergy
+        :raises ValueError: When the data is not a valid encoded ReactiveEnergy.
+        """
+        return ReactiveEnergy._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ReactiveEnergyUnits] = None) -> dict:
+        """
+        Get the ReactiveEnergy DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (VoltampereReactiveHour).
+        :type hold_in_unit: ReactiveEnergyUnits
+        :return: The ReactiveEnergy DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ReactiveEnergyUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ReactiveEnergy:
+        """
+        Create a new instance of ReactiveEnergy from its DTO.
+
+        :param dto: The ReactiveEnergy DTO, the unit is the ReactiveEnergyUnits value or name.
+        :type dto: dict
+        :return: A new instance of ReactiveEnergy.
+        :rtype: ReactiveEnergy
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ReactiveEnergy._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ReactiveEnergy:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ReactiveEnergy._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -133,10 +363,7 @@ class ReactiveEnergy(AbstractMeasure):
         """
         
         """
-        if self.__voltampere_reactive_hours != None:
-            return self.__voltampere_reactive_hours
-        self.__voltampere_reactive_hours = self.__convert_from_base(ReactiveEnergyUnits.VoltampereReactiveHour)
-        return self.__voltampere_reactive_hours
+        return self._cached_convert(ReactiveEnergyUnits.VoltampereReactiveHour)
 
     
     @property
@@ -144,10 +371,7 @@ class ReactiveEnergy(AbstractMeasure):
         """
         
         """
-        if self.__kilovoltampere_reactive_hours != None:
-            return self.__kilovoltampere_reactive_hours
-        self.__kilovoltampere_reactive_hours = self.__convert_from_base(ReactiveEnergyUnits.KilovoltampereReactiveHour)
-        return self.__kilovoltampere_reactive_hours
+        return self._cached_convert(ReactiveEnergyUnits.KilovoltampereReactiveHour)
 
     
     @property
@@ -155,10 +379,7 @@ class ReactiveEnergy(AbstractMeasure):
         """
         
         """
-        if self.__megavoltampere_reactive_hours != None:
-            return self.__megavoltampere_reactive_hours
-        self.__megavoltampere_reactive_hours = self.__convert_from_base(ReactiveEnergyUnits.MegavoltampereReactiveHour)
-        return self.__megavoltampere_reactive_hours
+        return self._cached_convert(ReactiveEnergyUnits.MegavoltampereReactiveHour)
 
     
     def to_string(self, unit: ReactiveEnergyUnits = ReactiveEnergyUnits.VoltampereReactiveHour) -> str:
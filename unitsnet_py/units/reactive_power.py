@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ReactivePowerUnits(Enum):
         """
             ReactivePowerUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         VoltampereReactive = 'voltampere_reactive'
         """
@@ -39,57 +50,280 @@ class ReactivePower(AbstractMeasure):
         value (float): The value.
         from_unit (ReactivePowerUnits): The ReactivePower unit to create from, The default unit is VoltampereReactive
     """
-    def __init__(self, value: float, from_unit: ReactivePowerUnits = ReactivePowerUnits.VoltampereReactive):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ReactivePowerUnits
+
+    _base_unit = ReactivePowerUnits.VoltampereReactive
+
+    _dimensions = (2, 1, -3, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 86
+
+    _binary_unit_ids = {
         
-        self.__voltamperes_reactive = None
+        ReactivePowerUnits.VoltampereReactive: 0,
         
-        self.__kilovoltamperes_reactive = None
+        ReactivePowerUnits.KilovoltampereReactive: 1,
         
-        self.__megavoltamperes_reactive = None
+        ReactivePowerUnits.MegavoltampereReactive: 2,
         
-        self.__gigavoltamperes_reactive = None
+        ReactivePowerUnits.GigavoltampereReactive: 3,
         
+    }
 
-    def convert(self, unit: ReactivePowerUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ReactivePowerUnits.VoltampereReactive: lambda value: (value),
+        
+        ReactivePowerUnits.KilovoltampereReactive: lambda value: ((value) / 1000.0),
+        
+        ReactivePowerUnits.MegavoltampereReactive: lambda value: ((value) / 1000000.0),
+        
+        ReactivePowerUnits.GigavoltampereReactive: lambda value: ((value) / 1000000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ReactivePowerUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ReactivePowerUnits.VoltampereReactive:
-            return (value)
+        ReactivePowerUnits.VoltampereReactive: lambda value: (value),
         
-        if from_unit == ReactivePowerUnits.KilovoltampereReactive:
-            return ((value) / 1000.0)
+        ReactivePowerUnits.KilovoltampereReactive: lambda value: ((value) * 1000.0),
         
-        if from_unit == ReactivePowerUnits.MegavoltampereReactive:
-            return ((value) / 1000000.0)
+        ReactivePowerUnits.MegavoltampereReactive: lambda value: ((value) * 1000000.0),
         
-        if from_unit == ReactivePowerUnits.GigavoltampereReactive:
-            return ((value) / 1000000000.0)
+        ReactivePowerUnits.GigavoltampereReactive: lambda value: ((value) * 1000000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ReactivePowerUnits.VoltampereReactive: ('1', '0'),
+        
+        ReactivePowerUnits.KilovoltampereReactive: ('1/1000', '0'),
+        
+        ReactivePowerUnits.MegavoltampereReactive: ('1/1000000', '0'),
+        
+        ReactivePowerUnits.GigavoltampereReactive: ('1/1000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ReactivePowerUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == ReactivePowerUnits.VoltampereReactive:
-            return (value)
+        ReactivePowerUnits.VoltampereReactive: ('1', '0'),
         
-        if to_unit == ReactivePowerUnits.KilovoltampereReactive:
-            return ((value) * 1000.0)
+        ReactivePowerUnits.KilovoltampereReactive: ('1000', '0'),
         
-        if to_unit == ReactivePowerUnits.MegavoltampereReactive:
-            return ((value) * 1000000.0)
+        ReactivePowerUnits.MegavoltampereReactive: ('1000000', '0'),
         
-        if to_unit == ReactivePowerUnits.GigavoltampereReactive:
-            return ((value) * 1000000000.0)
+        ReactivePowerUnits.GigavoltampereReactive: ('1000000000', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        ReactivePowerUnits.VoltampereReactive: ('var',),
+        
+        ReactivePowerUnits.KilovoltampereReactive: ('kvar',),
+        
+        ReactivePowerUnits.MegavoltampereReactive: ('Mvar',),
+        
+        ReactivePowerUnits.GigavoltampereReactive: ('Gvar',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: ReactivePowerUnits = ReactivePowerUnits.VoltampereReactive):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ReactivePowerUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ReactivePowerUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ReactivePowerUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ReactivePowerUnits, to_unit: ReactivePowerUnits) -> float:
+        """
+        Convert a value from one ReactivePower unit to another, without creating a ReactivePower instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ReactivePowerUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ReactivePowerUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ReactivePower._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ReactivePowerUnits, to_unit: ReactivePowerUnits) -> List[float]:
+        """
+        Convert many values from one ReactivePower unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ReactivePowerUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ReactivePowerUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ReactivePower._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ReactivePowerUnits, to_unit: ReactivePowerUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ReactivePower._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ReactivePowerUnits, to_unit: ReactivePowerUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ReactivePower unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ReactivePowerUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ReactivePowerUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ReactivePower._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ReactivePowerUnits = ReactivePowerUnits.VoltampereReactive) -> ReactivePower:
+        """
+        Create a new instance of ReactivePower holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ReactivePowerUnits
+        :return: A new instance of ReactivePower.
+        :rtype: ReactivePower
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ReactivePower._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ReactivePowerUnits = ReactivePowerUnits.VoltampereReactive) -> Fraction:
+        """
+        Get the exact value of the ReactivePower in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (VoltampereReactive).
+        :type unit: ReactivePowerUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ReactivePower:
+        """
+        Parse a ReactivePower from a value followed by a unit abbreviation, e.g. "1 var".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ReactivePower.
+        :rtype: ReactivePower
+        :raises ValueError: When the string is not a valid or an ambiguous ReactivePower.
+        """
+        return ReactivePower._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ReactivePower]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ReactivePower._try_parse(text)
+
+    def to_binary(self, unit: Optional[ReactivePowerUnits] = None) -> bytes:
+        """
+        Encode the ReactivePower to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ReactivePowerUnits
+        :return: The encoded ReactivePower.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ReactivePower:
+        """
+        Decode a ReactivePower encoded by to_binary.
+
+        :param data: The encoded ReactivePower, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ReactivePower.
+        :rtype: ReactivePower
+        :raises ValueError: When the data is not a valid encoded ReactivePower.
+        """
+        return ReactivePower._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ReactivePowerUnits] = None) -> dict:
+        """
+        Get the ReactivePower DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (VoltampereReactive).
+        :type hold_in_unit: ReactivePowerUnits
+        :return: The ReactivePower DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ReactivePowerUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ReactivePower:
+        """
+        Create a new instance of ReactivePower from its DTO.
+
+        :param dto: The ReactivePower DTO, the unit is the ReactivePowerUnits value or name.
+        :type dto: dict
+        :return: A new instance of ReactivePower.
+        :rtype: ReactivePower
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ReactivePower._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ReactivePower:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ReactivePower._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -161,10 +395,7 @@ class ReactivePower(AbstractMeasure):
         """
         
         """
-        if self.__voltamperes_reactive != None:
-            return self.__voltamperes_reactive
-        self.__voltamperes_reactive = self.__convert_from_base(ReactivePowerUnits.VoltampereReactive)
-        return self.__voltamperes_reactive
+        return self._cached_convert(ReactivePowerUnits.VoltampereReactive)
 
     
     @property
@@ -172,10 +403,7 @@ class ReactivePower(AbstractMeasure):
         """
         
         """
-        if self.__kilovoltamperes_reactive != None:
-            return self.__kilovoltamperes_reactive
-        self.__kilovoltamperes_reactive = self.__convert_from_base(ReactivePowerUnits.KilovoltampereReactive)
-        return self.__kilovoltamperes_reactive
+        return self._cached_convert(ReactivePowerUnits.KilovoltampereReactive)
 
     
     @property
@@ -183,10 +411,7 @@ class ReactivePower(AbstractMeasure):
         """
         
         """
-        if self.__megavoltamperes_reactive != None:
-            return self.__megavoltamperes_reactive
-        self.__megavoltamperes_reactive = self.__convert_from_base(ReactivePowerUnits.MegavoltampereReactive)
-        return self.__megavoltamperes_reactive
+        return self._cached_convert(ReactivePowerUnits.MegavoltampereReactive)
 
     
     @property
@@ -194,10 +419,7 @@ class ReactivePower(AbstractMeasure):
         """
         
         """
-        if self.__gigavoltamperes_reactive != None:
-            return self.__gigavoltamperes_reactive
-        self.__gigavoltamperes_reactive = self.__convert_from_base(ReactivePowerUnits.GigavoltampereReactive)
-        return self.__gigavoltamperes_reactive
+        return self._cached_convert(ReactivePowerUnits.GigavoltampereReactive)
 
     
     def to_string(self, unit: ReactivePowerUnits = ReactivePowerUnits.VoltampereReactive) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ReciprocalAreaUnits(Enum):
         """
             ReciprocalAreaUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         InverseSquareMeter = 'inverse_square_meter'
         """
@@ -74,113 +85,364 @@ class ReciprocalArea(AbstractMeasure):
         value (float): The value.
         from_unit (ReciprocalAreaUnits): The ReciprocalArea unit to create from, The default unit is InverseSquareMeter
     """
-    def __init__(self, value: float, from_unit: ReciprocalAreaUnits = ReciprocalAreaUnits.InverseSquareMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ReciprocalAreaUnits
+
+    _base_unit = ReciprocalAreaUnits.InverseSquareMeter
+
+    _dimensions = (-2, 0, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 87
+
+    _binary_unit_ids = {
         
-        self.__inverse_square_meters = None
+        ReciprocalAreaUnits.InverseSquareMeter: 0,
         
-        self.__inverse_square_kilometers = None
+        ReciprocalAreaUnits.InverseSquareKilometer: 1,
         
-        self.__inverse_square_decimeters = None
+        ReciprocalAreaUnits.InverseSquareDecimeter: 2,
         
-        self.__inverse_square_centimeters = None
+        ReciprocalAreaUnits.InverseSquareCentimeter: 3,
         
-        self.__inverse_square_millimeters = None
+        ReciprocalAreaUnits.InverseSquareMillimeter: 4,
         
-        self.__inverse_square_micrometers = None
+        ReciprocalAreaUnits.InverseSquareMicrometer: 5,
         
-        self.__inverse_square_miles = None
+        ReciprocalAreaUnits.InverseSquareMile: 6,
         
-        self.__inverse_square_yards = None
+        ReciprocalAreaUnits.InverseSquareYard: 7,
         
-        self.__inverse_square_feet = None
+        ReciprocalAreaUnits.InverseSquareFoot: 8,
         
-        self.__inverse_us_survey_square_feet = None
+        ReciprocalAreaUnits.InverseUsSurveySquareFoot: 9,
         
-        self.__inverse_square_inches = None
+        ReciprocalAreaUnits.InverseSquareInch: 10,
         
+    }
 
-    def convert(self, unit: ReciprocalAreaUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ReciprocalAreaUnits.InverseSquareMeter: lambda value: (value),
+        
+        ReciprocalAreaUnits.InverseSquareKilometer: lambda value: (value * 1e6),
+        
+        ReciprocalAreaUnits.InverseSquareDecimeter: lambda value: (value * 1e-2),
+        
+        ReciprocalAreaUnits.InverseSquareCentimeter: lambda value: (value * 1e-4),
+        
+        ReciprocalAreaUnits.InverseSquareMillimeter: lambda value: (value * 1e-6),
+        
+        ReciprocalAreaUnits.InverseSquareMicrometer: lambda value: (value * 1e-12),
+        
+        ReciprocalAreaUnits.InverseSquareMile: lambda value: (value * 2.59e6),
+        
+        ReciprocalAreaUnits.InverseSquareYard: lambda value: (value * 0.836127),
+        
+        ReciprocalAreaUnits.InverseSquareFoot: lambda value: (value * 0.092903),
+        
+        ReciprocalAreaUnits.InverseUsSurveySquareFoot: lambda value: (value * 0.09290341161),
+        
+        ReciprocalAreaUnits.InverseSquareInch: lambda value: (value * 0.00064516),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ReciprocalAreaUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == ReciprocalAreaUnits.InverseSquareMeter:
-            return (value)
+        ReciprocalAreaUnits.InverseSquareMeter: lambda value: (value),
         
-        if from_unit == ReciprocalAreaUnits.InverseSquareKilometer:
-            return (value * 1e6)
+        ReciprocalAreaUnits.InverseSquareKilometer: lambda value: (value / 1e6),
         
-        if from_unit == ReciprocalAreaUnits.InverseSquareDecimeter:
-            return (value * 1e-2)
+        ReciprocalAreaUnits.InverseSquareDecimeter: lambda value: (value / 1e-2),
         
-        if from_unit == ReciprocalAreaUnits.InverseSquareCentimeter:
-            return (value * 1e-4)
+        ReciprocalAreaUnits.InverseSquareCentimeter: lambda value: (value / 1e-4),
         
-        if from_unit == ReciprocalAreaUnits.InverseSquareMillimeter:
-            return (value * 1e-6)
+        ReciprocalAreaUnits.InverseSquareMillimeter: lambda value: (value / 1e-6),
         
-        if from_unit == ReciprocalAreaUnits.InverseSquareMicrometer:
-            return (value * 1e-12)
+        ReciprocalAreaUnits.InverseSquareMicrometer: lambda value: (value / 1e-12),
         
-        if from_unit == ReciprocalAreaUnits.InverseSquareMile:
-            return (value * 2.59e6)
+        ReciprocalAreaUnits.InverseSquareMile: lambda value: (value / 2.59e6),
         
-        if from_unit == ReciprocalAreaUnits.InverseSquareYard:
-            return (value * 0.836127)
+        ReciprocalAreaUnits.InverseSquareYard: lambda value: (value / 0.836127),
         
-        if from_unit == ReciprocalAreaUnits.InverseSquareFoot:
-            return (value * 0.092903)
+        ReciprocalAreaUnits.InverseSquareFoot: lambda value: (value / 0.092903),
         
-        if from_unit == ReciprocalAreaUnits.InverseUsSurveySquareFoot:
-            return (value * 0.09290341161)
+        ReciprocalAreaUnits.InverseUsSurveySquareFoot: lambda value: (value / 0.09290341161),
         
-        if from_unit == ReciprocalAreaUnits.InverseSquareInch:
-            return (value * 0.00064516)
+        ReciprocalAreaUnits.InverseSquareInch: lambda value: (value / 0.00064516),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ReciprocalAreaUnits.InverseSquareMeter: ('1', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareKilometer: ('1000000', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareDecimeter: ('1/100', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareCentimeter: ('1/10000', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareMillimeter: ('1/1000000', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareMicrometer: ('1/1000000000000', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareMile: ('2590000', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareYard: ('836127/1000000', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareFoot: ('92903/1000000', '0'),
+        
+        ReciprocalAreaUnits.InverseUsSurveySquareFoot: ('9290341161/100000000000', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareInch: ('16129/25000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ReciprocalAreaUnits) -> float:
+    _affine_to_base = {
+        
+        ReciprocalAreaUnits.InverseSquareMeter: ('1', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareKilometer: ('1/1000000', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareDecimeter: ('100', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareCentimeter: ('10000', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareMillimeter: ('1000000', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareMicrometer: ('1000000000000', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareMile: ('1/2590000', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareYard: ('1000000/836127', '0'),
+        
+        ReciprocalAreaUnits.InverseSquareFoot: ('1000000/92903', '0'),
+        
+        ReciprocalAreaUnits.InverseUsSurveySquareFoot: ('100000000000/9290341161', '0'),
         
-        if to_unit == ReciprocalAreaUnits.InverseSquareMeter:
-            return (value)
+        ReciprocalAreaUnits.InverseSquareInch: ('25000000/16129', '0'),
         
-        if to_unit == ReciprocalAreaUnits.InverseSquareKilometer:
-            return (value / 1e6)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        ReciprocalAreaUnits.InverseSquareMeter: ('m⁻²',),
+        
+        ReciprocalAreaUnits.InverseSquareKilometer: ('km⁻²',),
         
-        if to_unit == ReciprocalAreaUnits.InverseSquareDecimeter:
-            return (value / 1e-2)
+        ReciprocalAreaUnits.InverseSquareDecimeter: ('dm⁻²',),
         
-        if to_unit == ReciprocalAreaUnits.InverseSquareCentimeter:
-            return (value / 1e-4)
+        ReciprocalAreaUnits.InverseSquareCentimeter: ('cm⁻²',),
         
-        if to_unit == ReciprocalAreaUnits.InverseSquareMillimeter:
-            return (value / 1e-6)
+        ReciprocalAreaUnits.InverseSquareMillimeter: ('mm⁻²',),
         
-        if to_unit == ReciprocalAreaUnits.InverseSquareMicrometer:
-            return (value / 1e-12)
+        ReciprocalAreaUnits.InverseSquareMicrometer: ('µm⁻²',),
         
-        if to_unit == ReciprocalAreaUnits.InverseSquareMile:
-            return (value / 2.59e6)
+        ReciprocalAreaUnits.InverseSquareMile: ('mi⁻²',),
         
-        if to_unit == ReciprocalAreaUnits.InverseSquareYard:
-            return (value / 0.836127)
+        ReciprocalAreaUnits.InverseSquareYard: ('yd⁻²',),
         
-        if to_unit == ReciprocalAreaUnits.InverseSquareFoot:
-            return (value / 0.092903)
+        ReciprocalAreaUnits.InverseSquareFoot: ('ft⁻²',),
         
-        if to_unit == ReciprocalAreaUnits.InverseUsSurveySquareFoot:
-            return (value / 0.09290341161)
+        ReciprocalAreaUnits.InverseUsSurveySquareFoot: ('ft⁻² (US)',),
         
-        if to_unit == ReciprocalAreaUnits.InverseSquareInch:
-            return (value / 0.00064516)
+        ReciprocalAreaUnits.InverseSquareInch: ('in⁻²',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: ReciprocalAreaUnits = ReciprocalAreaUnits.InverseSquareMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ReciprocalAreaUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ReciprocalAreaUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ReciprocalAreaUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
 
+    @staticmethod
+    def convert_value(value: float, from_unit: ReciprocalAreaUnits, to_unit: ReciprocalAreaUnits) -> float:
+        """
+        Convert a value from one ReciprocalArea unit to another, without creating a ReciprocalArea instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ReciprocalAreaUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ReciprocalAreaUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ReciprocalArea._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ReciprocalAreaUnits, to_unit: ReciprocalAreaUnits) -> List[float]:
+        """
+        Convert many values from one ReciprocalArea unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ReciprocalAreaUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ReciprocalAreaUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ReciprocalArea._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ReciprocalAreaUnits, to_unit: ReciprocalAreaUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ReciprocalArea._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ReciprocalAreaUnits, to_unit: ReciprocalAreaUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ReciprocalArea unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ReciprocalAreaUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ReciprocalAreaUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ReciprocalArea._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ReciprocalAreaUnits = ReciprocalAreaUnits.InverseSquareMeter) -> ReciprocalArea:
+        """
+        Create a new instance of ReciprocalArea holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ReciprocalAreaUnits
+        :return: A new instance of ReciprocalArea.
+        :rtype: ReciprocalArea
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ReciprocalArea._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ReciprocalAreaUnits = ReciprocalAreaUnits.InverseSquareMeter) -> Fraction:
+        """
+        Get the exact value of the ReciprocalArea in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (InverseSquareMeter).
+        :type unit: ReciprocalAreaUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ReciprocalArea:
+        """
+        Parse a ReciprocalArea from a value followed by a unit abbreviation, e.g. "1 m⁻²".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ReciprocalArea.
+        :rtype: ReciprocalArea
+        :raises ValueError: When the string is not a valid or an ambiguous ReciprocalArea.
+        """
+        return ReciprocalArea._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ReciprocalArea]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ReciprocalArea._try_parse(text)
+
+    def to_binary(self, unit: Optional[ReciprocalAreaUnits] = None) -> bytes:
+        """
+        Encode the ReciprocalArea to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ReciprocalAreaUnits
+        :return: The encoded ReciprocalArea.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ReciprocalArea:
+        """
+        Decode a ReciprocalArea encoded by to_binary.
+
+        :param data: The encoded ReciprocalArea, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ReciprocalArea.
+        :rtype: ReciprocalArea
+        :raises ValueError: When the data is not a valid encoded ReciprocalArea.
+        """
+        return ReciprocalArea._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ReciprocalAreaUnits] = None) -> dict:
+        """
+        Get the ReciprocalArea DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (InverseSquareMeter).
+        :type hold_in_unit: ReciprocalAreaUnits
+        :return: The ReciprocalArea DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ReciprocalAreaUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ReciprocalArea:
+        """
+        Create a new instance of ReciprocalArea from its DTO.
+
+        :param dto: The ReciprocalArea DTO, the unit is the ReciprocalAreaUnits value or name.
+        :type dto: dict
+        :return: A new instance of ReciprocalArea.
+        :rtype: ReciprocalArea
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ReciprocalArea._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ReciprocalArea:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ReciprocalArea._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -357,10 +619,7 @@ class ReciprocalArea(AbstractMeasure):
         """
         
         """
-        if self.__inverse_square_meters != None:
-            return self.__inverse_square_meters
-        self.__inverse_square_meters = self.__convert_from_base(ReciprocalAreaUnits.InverseSquareMeter)
-        return self.__inverse_square_meters
+        return self._cached_convert(ReciprocalAreaUnits.InverseSquareMeter)
 
     
     @property
@@ -368,10 +627,7 @@ class ReciprocalArea(AbstractMeasure):
         """
         
         """
-        if self.__inverse_square_kilometers != None:
-            return self.__inverse_square_kilometers
-        self.__inverse_square_kilometers = self.__convert_from_base(ReciprocalAreaUnits.InverseSquareKilometer)
-        return self.__inverse_square_kilometers
+        return self._cached_convert(ReciprocalAreaUnits.InverseSquareKilometer)
 
     
     @property
@@ -379,10 +635,7 @@ class ReciprocalArea(AbstractMeasure):
         """
         
         """
-        if self.__inverse_square_decimeters != None:
-            return self.__inverse_square_decimeters
-        self.__inverse_square_decimeters = self.__convert_from_base(ReciprocalAreaUnits.InverseSquareDecimeter)
-        return self.__inverse_square_decimeters
+        return self._cached_convert(ReciprocalAreaUnits.InverseSquareDecimeter)
 
     
     @property
@@ -390,10 +643,7 @@ class ReciprocalArea(AbstractMeasure):
         """
         
         """
-        if self.__inverse_square_centimeters != None:
-            return self.__inverse_square_centimeters
-        self.__inverse_square_centimeters = self.__convert_from_base(ReciprocalAreaUnits.InverseSquareCentimeter)
-        return self.__inverse_square_centimeters
+        return self._cached_convert(ReciprocalAreaUnits.InverseSquareCentimeter)
 
     
     @property
@@ -401,10 +651,7 @@ class ReciprocalArea(AbstractMeasure):
         """
         
         """
-        if self.__inverse_square_millimeters != None:
-            return self.__inverse_square_millimeters
-        self.__inverse_square_millimeters = self.__convert_from_base(ReciprocalAreaUnits.InverseSquareMillimeter)
-        return self.__inverse_square_millimeters
+        return self._cached_convert(ReciprocalAreaUnits.InverseSquareMillimeter)
 
     
     @property
@@ -412,10 +659,7 @@ class ReciprocalArea(AbstractMeasure):
         """
         
         """
-        if self.__inverse_square_micrometers != None:
-            return self.__inverse_square_micrometers
-        self.__inverse_square_micrometers = self.__convert_from_base(ReciprocalAreaUnits.InverseSquareMicrometer)
-        return self.__inverse_square_micrometers
+        return self._cached_convert(ReciprocalAreaUnits.InverseSquareMicrometer)
 
     
     @property
@@ -423,10 +667,7 @@ class ReciprocalArea(AbstractMeasure):
         """
         
         """
-        if self.__inverse_square_miles != None:
-            return self.__inverse_square_miles
-        self.__inverse_square_miles = self.__convert_from_base(ReciprocalAreaUnits.InverseSquareMile)
-        return self.__inverse_square_miles
+        return self._cached_convert(ReciprocalAreaUnits.InverseSquareMile)
 
     
     @property
@@ -434,10 +675,7 @@ class ReciprocalArea(AbstractMeasure):
         """
         
         """
-        if self.__inverse_square_yards != None:
-            return self.__inverse_square_yards
-        self.__inverse_square_yards = self.__convert_from_base(ReciprocalAreaUnits.InverseSquareYard)
-        return self.__inverse_square_yards
+        return self._cached_convert(ReciprocalAreaUnits.InverseSquareYard)
 
     
     @property
@@ -445,10 +683,7 @@ class ReciprocalArea(AbstractMeasure):
         """
         
         """
-        if self.__inverse_square_feet != None:
-            return self.__inverse_square_feet
-        self.__inverse_square_feet = self.__convert_from_base(ReciprocalAreaUnits.InverseSquareFoot)
-        return self.__inverse_square_feet
+        return self._cached_convert(ReciprocalAreaUnits.InverseSquareFoot)
 
     
     @property
@@ -456,10 +691,7 @@ class ReciprocalArea(AbstractMeasure):
         """
         
         """
-        if self.__inverse_us_survey_square_feet != None:
-            return self.__inverse_us_survey_square_feet
-        self.__inverse_us_survey_square_feet = self.__convert_from_base(ReciprocalAreaUnits.InverseUsSurveySquareFoot)
-        return self.__inverse_us_survey_square_feet
+        return self._cached_convert(ReciprocalAreaUnits.InverseUsSurveySquareFoot)
 
     
     @property
@@ -467,10 +699,7 @@ class ReciprocalArea(AbstractMeasure):
         """
         
         """
-        if self.__inverse_square_inches != None:
-            return self.__inverse_square_inches
-        self.__inverse_square_inches = self.__convert_from_base(ReciprocalAreaUnits.InverseSquareInch)
-        return self.__inverse_square_inches
+        return self._cached_convert(ReciprocalAreaUnits.InverseSquareInch)
 
     
     def to_string(self, unit: ReciprocalAreaUnits = ReciprocalAreaUnits.InverseSquareMeter) -> str:
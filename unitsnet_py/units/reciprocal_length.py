@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ReciprocalLengthUnits(Enum):
         """
             ReciprocalLengthUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         InverseMeter = 'inverse_meter'
         """
@@ -69,105 +80,352 @@ class ReciprocalLength(AbstractMeasure):
         value (float): The value.
         from_unit (ReciprocalLengthUnits): The ReciprocalLength unit to create from, The default unit is InverseMeter
     """
-    def __init__(self, value: float, from_unit: ReciprocalLengthUnits = ReciprocalLengthUnits.InverseMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ReciprocalLengthUnits
+
+    _base_unit = ReciprocalLengthUnits.InverseMeter
+
+    _dimensions = (-1, 0, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 88
+
+    _binary_unit_ids = {
         
-        self.__inverse_meters = None
+        ReciprocalLengthUnits.InverseMeter: 0,
         
-        self.__inverse_centimeters = None
+        ReciprocalLengthUnits.InverseCentimeter: 1,
         
-        self.__inverse_millimeters = None
+        ReciprocalLengthUnits.InverseMillimeter: 2,
         
-        self.__inverse_miles = None
+        ReciprocalLengthUnits.InverseMile: 3,
         
-        self.__inverse_yards = None
+        ReciprocalLengthUnits.InverseYard: 4,
         
-        self.__inverse_feet = None
+        ReciprocalLengthUnits.InverseFoot: 5,
         
-        self.__inverse_us_survey_feet = None
+        ReciprocalLengthUnits.InverseUsSurveyFoot: 6,
         
-        self.__inverse_inches = None
+        ReciprocalLengthUnits.InverseInch: 7,
         
-        self.__inverse_mils = None
+        ReciprocalLengthUnits.InverseMil: 8,
         
-        self.__inverse_microinches = None
+        ReciprocalLengthUnits.InverseMicroinch: 9,
         
+    }
 
-    def convert(self, unit: ReciprocalLengthUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ReciprocalLengthUnits.InverseMeter: lambda value: (value),
+        
+        ReciprocalLengthUnits.InverseCentimeter: lambda value: (value / 1e2),
+        
+        ReciprocalLengthUnits.InverseMillimeter: lambda value: (value / 1e3),
+        
+        ReciprocalLengthUnits.InverseMile: lambda value: (value * 1609.344),
+        
+        ReciprocalLengthUnits.InverseYard: lambda value: (value * 0.9144),
+        
+        ReciprocalLengthUnits.InverseFoot: lambda value: (value * 0.3048),
+        
+        ReciprocalLengthUnits.InverseUsSurveyFoot: lambda value: (value * 1200 / 3937),
+        
+        ReciprocalLengthUnits.InverseInch: lambda value: (value * 2.54e-2),
+        
+        ReciprocalLengthUnits.InverseMil: lambda value: (value * 2.54e-5),
+        
+        ReciprocalLengthUnits.InverseMicroinch: lambda value: (value * 2.54e-8),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ReciprocalLengthUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        ReciprocalLengthUnits.InverseMeter: lambda value: (value),
+        
+        ReciprocalLengthUnits.InverseCentimeter: lambda value: (value * 1e2),
+        
+        ReciprocalLengthUnits.InverseMillimeter: lambda value: (value * 1e3),
+        
+        ReciprocalLengthUnits.InverseMile: lambda value: (value / 1609.344),
+        
+        ReciprocalLengthUnits.InverseYard: lambda value: (value / 0.9144),
+        
+        ReciprocalLengthUnits.InverseFoot: lambda value: (value / 0.3048),
         
-        if from_unit == ReciprocalLengthUnits.InverseMeter:
-            return (value)
+        ReciprocalLengthUnits.InverseUsSurveyFoot: lambda value: (value * 3937 / 1200),
         
-        if from_unit == ReciprocalLengthUnits.InverseCentimeter:
-            return (value / 1e2)
+        ReciprocalLengthUnits.InverseInch: lambda value: (value / 2.54e-2),
         
-        if from_unit == ReciprocalLengthUnits.InverseMillimeter:
-            return (value / 1e3)
+        ReciprocalLengthUnits.InverseMil: lambda value: (value / 2.54e-5),
         
-        if from_unit == ReciprocalLengthUnits.InverseMile:
-            return (value * 1609.344)
+        ReciprocalLengthUnits.InverseMicroinch: lambda value: (value / 2.54e-8),
         
-        if from_unit == ReciprocalLengthUnits.InverseYard:
-            return (value * 0.9144)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ReciprocalLengthUnits.InverseMeter: ('1', '0'),
+        
+        ReciprocalLengthUnits.InverseCentimeter: ('1/100', '0'),
+        
+        ReciprocalLengthUnits.InverseMillimeter: ('1/1000', '0'),
+        
+        ReciprocalLengthUnits.InverseMile: ('201168/125', '0'),
         
-        if from_unit == ReciprocalLengthUnits.InverseFoot:
-            return (value * 0.3048)
+        ReciprocalLengthUnits.InverseYard: ('1143/1250', '0'),
         
-        if from_unit == ReciprocalLengthUnits.InverseUsSurveyFoot:
-            return (value * 1200 / 3937)
+        ReciprocalLengthUnits.InverseFoot: ('381/1250', '0'),
         
-        if from_unit == ReciprocalLengthUnits.InverseInch:
-            return (value * 2.54e-2)
+        ReciprocalLengthUnits.InverseUsSurveyFoot: ('1200/3937', '0'),
         
-        if from_unit == ReciprocalLengthUnits.InverseMil:
-            return (value * 2.54e-5)
+        ReciprocalLengthUnits.InverseInch: ('127/5000', '0'),
         
-        if from_unit == ReciprocalLengthUnits.InverseMicroinch:
-            return (value * 2.54e-8)
+        ReciprocalLengthUnits.InverseMil: ('127/5000000', '0'),
         
-        return None
+        ReciprocalLengthUnits.InverseMicroinch: ('127/5000000000', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        ReciprocalLengthUnits.InverseMeter: ('1', '0'),
+        
+        ReciprocalLengthUnits.InverseCentimeter: ('100', '0'),
+        
+        ReciprocalLengthUnits.InverseMillimeter: ('1000', '0'),
+        
+        ReciprocalLengthUnits.InverseMile: ('125/201168', '0'),
+        
+        ReciprocalLengthUnits.InverseYard: ('1250/1143', '0'),
+        
+        ReciprocalLengthUnits.InverseFoot: ('1250/381', '0'),
+        
+        ReciprocalLengthUnits.InverseUsSurveyFoot: ('3937/1200', '0'),
+        
+        ReciprocalLengthUnits.InverseInch: ('5000/127', '0'),
+        
+        ReciprocalLengthUnits.InverseMil: ('5000000/127', '0'),
+        
+        ReciprocalLengthUnits.InverseMicroinch: ('5000000000/127', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ReciprocalLengthUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ReciprocalLengthUnits.InverseMeter:
-            return (value)
+        ReciprocalLengthUnits.InverseMeter: ('m⁻¹',),
         
-        if to_unit == ReciprocalLengthUnits.InverseCentimeter:
-            return (value * 1e2)
+        ReciprocalLengthUnits.InverseCentimeter: ('cm⁻¹',),
         
-        if to_unit == ReciprocalLengthUnits.InverseMillimeter:
-            return (value * 1e3)
+        ReciprocalLengthUnits.InverseMillimeter: ('mm⁻¹',),
         
-        if to_unit == ReciprocalLengthUnits.InverseMile:
-            return (value / 1609.344)
+        ReciprocalLengthUnits.InverseMile: ('mi⁻¹',),
         
-        if to_unit == ReciprocalLengthUnits.InverseYard:
-            return (value / 0.9144)
+        ReciprocalLengthUnits.InverseYard: ('yd⁻¹',),
         
-        if to_unit == ReciprocalLengthUnits.InverseFoot:
-            return (value / 0.3048)
+        ReciprocalLengthUnits.InverseFoot: ('ft⁻¹',),
         
-        if to_unit == ReciprocalLengthUnits.InverseUsSurveyFoot:
-            return (value * 3937 / 1200)
+        ReciprocalLengthUnits.InverseUsSurveyFoot: ('ftUS⁻¹',),
         
-        if to_unit == ReciprocalLengthUnits.InverseInch:
-            return (value / 2.54e-2)
+        ReciprocalLengthUnits.InverseInch: ('in⁻¹',),
         
-        if to_unit == ReciprocalLengthUnits.InverseMil:
-            return (value / 2.54e-5)
+        ReciprocalLengthUnits.InverseMil: ('mil⁻¹',),
         
-        if to_unit == ReciprocalLengthUnits.InverseMicroinch:
-            return (value / 2.54e-8)
+        ReciprocalLengthUnits.InverseMicroinch: ('µin⁻¹',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: ReciprocalLengthUnits = ReciprocalLengthUnits.InverseMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ReciprocalLengthUnits) -> float:
+        return self.__convert_from_base(unit)
 
+    def __convert_from_base(self, from_unit: ReciprocalLengthUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ReciprocalLengthUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ReciprocalLengthUnits, to_unit: ReciprocalLengthUnits) -> float:
+        """
+        Convert a value from one ReciprocalLength unit to another, without creating a ReciprocalLength instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ReciprocalLengthUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ReciprocalLengthUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ReciprocalLength._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ReciprocalLengthUnits, to_unit: ReciprocalLengthUnits) -> List[float]:
+        """
+        Convert many values from one ReciprocalLength unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ReciprocalLengthUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ReciprocalLengthUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ReciprocalLength._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ReciprocalLengthUnits, to_unit: ReciprocalLengthUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ReciprocalLength._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ReciprocalLengthUnits, to_unit: ReciprocalLengthUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ReciprocalLength unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ReciprocalLengthUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ReciprocalLengthUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ReciprocalLength._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ReciprocalLengthUnits = ReciprocalLengthUnits.InverseMeter) -> ReciprocalLength:
+        """
+        Create a new instance of ReciprocalLength holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ReciprocalLengthUnits
+        :return: A new instance of ReciprocalLength.
+        :rtype: ReciprocalLength
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ReciprocalLength._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ReciprocalLengthUnits = ReciprocalLengthUnits.InverseMeter) -> Fraction:
+        """
+        Get the exact value of the ReciprocalLength in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (InverseMeter).
+        :type unit: ReciprocalLengthUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ReciprocalLength:
+        """
+        Parse a ReciprocalLength from a value followed by a unit abbreviation, e.g. "1 m⁻¹".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ReciprocalLength.
+        :rtype: ReciprocalLength
+        :raises ValueError: When the string is not a valid or an ambiguous ReciprocalLength.
+        """
+        return ReciprocalLength._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ReciprocalLength]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ReciprocalLength._try_parse(text)
+
+    def to_binary(self, unit: Optional[ReciprocalLengthUnits] = None) -> bytes:
+        """
+        Encode the ReciprocalLength to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ReciprocalLengthUnits
+        :return: The encoded ReciprocalLength.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ReciprocalLength:
+        """
+        Decode a ReciprocalLength encoded by to_binary.
+
+        :param data: The encoded ReciprocalLength, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ReciprocalLength.
+        :rtype: ReciprocalLength
+        :raises ValueError: When the data is not a valid encoded ReciprocalLength.
+        """
+        return ReciprocalLength._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ReciprocalLengthUnits] = None) -> dict:
+        """
+        Get the ReciprocalLength DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (InverseMeter).
+        :type hold_in_unit: ReciprocalLengthUnits
+        :return: The ReciprocalLength DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ReciprocalLengthUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ReciprocalLength:
+        """
+        Create a new instance of ReciprocalLength from its DTO.
+
+        :param dto: The ReciprocalLength DTO, the unit is the ReciprocalLengthUnits value or name.
+        :type dto: dict
+        :return: A new instance of ReciprocalLength.
+        :rtype: ReciprocalLength
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ReciprocalLength._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ReciprocalLength:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ReciprocalLength._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -329,10 +587,7 @@ class ReciprocalLength(AbstractMeasure):
         """
         
         """
-        if self.__inverse_meters != None:
-            return self.__inverse_meters
-        self.__inverse_meters = self.__convert_from_base(ReciprocalLengthUnits.InverseMeter)
-        return self.__inverse_meters
+        return self._cached_convert(ReciprocalLengthUnits.InverseMeter)
 
     
     @property
@@ -340,10 +595,7 @@ class ReciprocalLength(AbstractMeasure):
         """
         
         """
-        if self.__inverse_centimeters != None:
-            return self.__inverse_centimeters
-        self.__inverse_centimeters = self.__convert_from_base(ReciprocalLengthUnits.InverseCentimeter)
-        return self.__inverse_centimeters
+        return self._cached_convert(ReciprocalLengthUnits.InverseCentimeter)
 
     
     @property
@@ -351,10 +603,7 @@ class ReciprocalLength(AbstractMeasure):
         """
         
         """
-        if self.__inverse_millimeters != None:
-            return self.__inverse_millimeters
-        self.__inverse_millimeters = self.__convert_from_base(ReciprocalLengthUnits.InverseMillimeter)
-        return self.__inverse_millimeters
+        return self._cached_convert(ReciprocalLengthUnits.InverseMillimeter)
 
     
     @property
@@ -362,10 +611,7 @@ class ReciprocalLength(AbstractMeasure):
         """
         
         """
-        if self.__inverse_miles != None:
-            return self.__inverse_miles
-        self.__inverse_miles = self.__convert_from_base(ReciprocalLengthUnits.InverseMile)
-        return self.__inverse_miles
+        return self._cached_convert(ReciprocalLengthUnits.InverseMile)
 
     
     @property
@@ -373,10 +619,7 @@ class ReciprocalLength(AbstractMeasure):
         """
         
         """
-        if self.__inverse_yards != None:
-            return self.__inverse_yards
-        self.__inverse_yards = self.__convert_from_base(ReciprocalLengthUnits.InverseYard)
-        return self.__inverse_yards
+        return self._cached_convert(ReciprocalLengthUnits.InverseYard)
 
     
     @property
@@ -384,10 +627,7 @@ class ReciprocalLength(AbstractMeasure):
         """
         
         """
-        if self.__inverse_feet != None:
-            return self.__inverse_feet
-        self.__inverse_feet = self.__convert_from_base(ReciprocalLengthUnits.InverseFoot)
-        return self.__inverse_feet
+        return self._cached_convert(ReciprocalLengthUnits.InverseFoot)
 
     
     @property
@@ -395,10 +635,7 @@ class ReciprocalLength(AbstractMeasure):
         """
         
         """
-        if self.__inverse_us_survey_feet != None:
-            return self.__inverse_us_survey_feet
-        self.__inverse_us_survey_feet = self.__convert_from_base(ReciprocalLengthUnits.InverseUsSurveyFoot)
-        return self.__inverse_us_survey_feet
+        return self._cached_convert(ReciprocalLengthUnits.InverseUsSurveyFoot)
 
     
     @property
@@ -406,10 +643,7 @@ class ReciprocalLength(AbstractMeasure):
         """
         
         """
-        if self.__inverse_inches != None:
-            return self.__inverse_inches
-        self.__inverse_inches = self.__convert_from_base(ReciprocalLengthUnits.InverseInch)
-        return self.__inverse_inches
+        return self._cached_convert(ReciprocalLengthUnits.InverseInch)
 
     
     @property
@@ -417,10 +651,7 @@ class ReciprocalLength(AbstractMeasure):
         """
         
         """
-        if self.__inverse_mils != None:
-            return self.__inverse_mils
-        self.__inverse_mils = self.__convert_from_base(ReciprocalLengthUnits.InverseMil)
-        return self.__inverse_mils
+        return self._cached_convert(ReciprocalLengthUnits.InverseMil)
 
     
     @property
@@ -428,10 +659,7 @@ class ReciprocalLength(AbstractMeasure):
         """
         
         """
-        if self.__inverse_microinches != None:
-            return self.__inverse_microinches
-        self.__inverse_microinches = self.__convert_from_base(ReciprocalLengthUnits.InverseMicroinch)
-        return self.__inverse_microinches
+        return self._cached_convert(ReciprocalLengthUnits.InverseMicroinch)
 
     
     def to_string(self, unit: ReciprocalLengthUnits = ReciprocalLengthUnits.InverseMeter) -> str:
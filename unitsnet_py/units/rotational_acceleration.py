@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class RotationalAccelerationUnits(Enum):
         """
             RotationalAccelerationUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         RadianPerSecondSquared = 'radian_per_second_squared'
         """
@@ -39,57 +50,280 @@ class RotationalAcceleration(AbstractMeasure):
         value (float): The value.
         from_unit (RotationalAccelerationUnits): The RotationalAcceleration unit to create from, The default unit is RadianPerSecondSquared
     """
-    def __init__(self, value: float, from_unit: RotationalAccelerationUnits = RotationalAccelerationUnits.RadianPerSecondSquared):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = RotationalAccelerationUnits
+
+    _base_unit = RotationalAccelerationUnits.RadianPerSecondSquared
+
+    _dimensions = (0, 0, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 90
+
+    _binary_unit_ids = {
         
-        self.__radians_per_second_squared = None
+        RotationalAccelerationUnits.RadianPerSecondSquared: 0,
         
-        self.__degrees_per_second_squared = None
+        RotationalAccelerationUnits.DegreePerSecondSquared: 1,
         
-        self.__revolutions_per_minute_per_second = None
+        RotationalAccelerationUnits.RevolutionPerMinutePerSecond: 2,
         
-        self.__revolutions_per_second_squared = None
+        RotationalAccelerationUnits.RevolutionPerSecondSquared: 3,
         
+    }
 
-    def convert(self, unit: RotationalAccelerationUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        RotationalAccelerationUnits.RadianPerSecondSquared: lambda value: (value),
+        
+        RotationalAccelerationUnits.DegreePerSecondSquared: lambda value: ((180 / math.pi) * value),
+        
+        RotationalAccelerationUnits.RevolutionPerMinutePerSecond: lambda value: ((60 / (2 * math.pi)) * value),
+        
+        RotationalAccelerationUnits.RevolutionPerSecondSquared: lambda value: ((1 / (2 * math.pi)) * value),
+        
+    }
 
-    def __convert_from_base(self, from_unit: RotationalAccelerationUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == RotationalAccelerationUnits.RadianPerSecondSquared:
-            return (value)
+        RotationalAccelerationUnits.RadianPerSecondSquared: lambda value: (value),
         
-        if from_unit == RotationalAccelerationUnits.DegreePerSecondSquared:
-            return ((180 / math.pi) * value)
+        RotationalAccelerationUnits.DegreePerSecondSquared: lambda value: ((math.pi / 180) * value),
         
-        if from_unit == RotationalAccelerationUnits.RevolutionPerMinutePerSecond:
-            return ((60 / (2 * math.pi)) * value)
+        RotationalAccelerationUnits.RevolutionPerMinutePerSecond: lambda value: (((2 * math.pi) / 60) * value),
         
-        if from_unit == RotationalAccelerationUnits.RevolutionPerSecondSquared:
-            return ((1 / (2 * math.pi)) * value)
+        RotationalAccelerationUnits.RevolutionPerSecondSquared: lambda value: ((2 * math.pi) * value),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        RotationalAccelerationUnits.RadianPerSecondSquared: ('1', '0'),
+        
+        RotationalAccelerationUnits.DegreePerSecondSquared: ('57.29577951308232', '0'),
+        
+        RotationalAccelerationUnits.RevolutionPerMinutePerSecond: ('9.549296585513721', '0'),
+        
+        RotationalAccelerationUnits.RevolutionPerSecondSquared: ('0.15915494309189535', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: RotationalAccelerationUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == RotationalAccelerationUnits.RadianPerSecondSquared:
-            return (value)
+        RotationalAccelerationUnits.RadianPerSecondSquared: ('1', '0'),
         
-        if to_unit == RotationalAccelerationUnits.DegreePerSecondSquared:
-            return ((math.pi / 180) * value)
+        RotationalAccelerationUnits.DegreePerSecondSquared: ('0.017453292519943295', '0'),
         
-        if to_unit == RotationalAccelerationUnits.RevolutionPerMinutePerSecond:
-            return (((2 * math.pi) / 60) * value)
+        RotationalAccelerationUnits.RevolutionPerMinutePerSecond: ('0.10471975511965977', '0'),
         
-        if to_unit == RotationalAccelerationUnits.RevolutionPerSecondSquared:
-            return ((2 * math.pi) * value)
+        RotationalAccelerationUnits.RevolutionPerSecondSquared: ('6.283185307179586', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        RotationalAccelerationUnits.RadianPerSecondSquared: ('rad/s²',),
+        
+        RotationalAccelerationUnits.DegreePerSecondSquared: ('°/s²',),
+        
+        RotationalAccelerationUnits.RevolutionPerMinutePerSecond: ('rpm/s',),
+        
+        RotationalAccelerationUnits.RevolutionPerSecondSquared: ('r/s²',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: RotationalAccelerationUnits = RotationalAccelerationUnits.RadianPerSecondSquared):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: RotationalAccelerationUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: RotationalAccelerationUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: RotationalAccelerationUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: RotationalAccelerationUnits, to_unit: RotationalAccelerationUnits) -> float:
+        """
+        Convert a value from one RotationalAcceleration unit to another, without creating a RotationalAcceleration instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: RotationalAccelerationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: RotationalAccelerationUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return RotationalAcceleration._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: RotationalAccelerationUnits, to_unit: RotationalAccelerationUnits) -> List[float]:
+        """
+        Convert many values from one RotationalAcceleration unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: RotationalAccelerationUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: RotationalAccelerationUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return RotationalAcceleration._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: RotationalAccelerationUnits, to_unit: RotationalAccelerationUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", RotationalAcceleration._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: RotationalAccelerationUnits, to_unit: RotationalAccelerationUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one RotationalAcceleration unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: RotationalAccelerationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: RotationalAccelerationUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return RotationalAcceleration._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: RotationalAccelerationUnits = RotationalAccelerationUnits.RadianPerSecondSquared) -> RotationalAcceleration:
+        """
+        Create a new instance of RotationalAcceleration holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: RotationalAccelerationUnits
+        :return: A new instance of RotationalAcceleration.
+        :rtype: RotationalAcceleration
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return RotationalAcceleration._from_exact(value, from_unit)
+
+    def to_exact(self, unit: RotationalAccelerationUnits = RotationalAccelerationUnits.RadianPerSecondSquared) -> Fraction:
+        """
+        Get the exact value of the RotationalAcceleration in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (RadianPerSecondSquared).
+        :type unit: RotationalAccelerationUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> RotationalAcceleration:
+        """
+        Parse a RotationalAcceleration from a value followed by a unit abbreviation, e.g. "1 rad/s²".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of RotationalAcceleration.
+        :rtype: RotationalAcceleration
+        :raises ValueError: When the string is not a valid or an ambiguous RotationalAcceleration.
+        """
+        return RotationalAcceleration._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[RotationalAcceleration]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return RotationalAcceleration._try_parse(text)
+
+    def to_binary(self, unit: Optional[RotationalAccelerationUnits] = None) -> bytes:
+        """
+        Encode the RotationalAcceleration to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: RotationalAccelerationUnits
+        :return: The encoded RotationalAcceleration.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> RotationalAcceleration:
+        """
+        Decode a RotationalAcceleration encoded by to_binary.
+
+        :param data: The encoded RotationalAcceleration, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of RotationalAcceleration.
+        :rtype: RotationalAcceleration
+        :raises ValueError: When the data is not a valid encoded RotationalAcceleration.
+        """
+        return RotationalAcceleration._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[RotationalAccelerationUnits] = None) -> dict:
+        """
+        Get the RotationalAcceleration DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (RadianPerSecondSquared).
+        :type hold_in_unit: RotationalAccelerationUnits
+        :return: The RotationalAcceleration DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[RotationalAccelerationUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> RotationalAcceleration:
+        """
+        Create a new instance of RotationalAcceleration from its DTO.
+
+        :param dto: The RotationalAcceleration DTO, the unit is the RotationalAccelerationUnits value or name.
+        :type dto: dict
+        :return: A new instance of RotationalAcceleration.
+        :rtype: RotationalAcceleration
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return RotationalAcceleration._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> RotationalAcceleration:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return RotationalAcceleration._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -161,10 +395,7 @@ class RotationalAcceleration(AbstractMeasure):
         """
         
         """
-        if self.__radians_per_second_squared != None:
-            return self.__radians_per_second_squared
-        self.__radians_per_second_squared = self.__convert_from_base(RotationalAccelerationUnits.RadianPerSecondSquared)
-        return self.__radians_per_second_squared
+        return self._cached_convert(RotationalAccelerationUnits.RadianPerSecondSquared)
 
     
     @property
@@ -172,10 +403,7 @@ class RotationalAcceleration(AbstractMeasure):
         """
         
         """
-        if self.__degrees_per_second_squared != None:
-            return self.__degrees_per_second_squared
-        self.__degrees_per_second_squared = self.__convert_from_base(RotationalAccelerationUnits.DegreePerSecondSquared)
-        return self.__degrees_per_second_squared
+        return self._cached_convert(RotationalAccelerationUnits.DegreePerSecondSquared)
 
     
     @property
@@ -183,10 +411,7 @@ class RotationalAcceleration(AbstractMeasure):
         """
         
         """
-        if self.__revolutions_per_minute_per_second != None:
-            return self.__revolutions_per_minute_per_second
-        self.__revolutions_per_minute_per_second = self.__convert_from_base(RotationalAccelerationUnits.RevolutionPerMinutePerSecond)
-        return self.__revolutions_per_minute_per_second
+        return self._cached_convert(RotationalAccelerationUnits.RevolutionPerMinutePerSecond)
 
     
     @property
@@ -194,10 +419,7 @@ class RotationalAcceleration(AbstractMeasure):
         """
         
         """
-        if self.__revolutions_per_second_squared != None:
-            return self.__revolutions_per_second_squared
-        self.__revolutions_per_second_squared = self.__convert_from_base(RotationalAccelerationUnits.RevolutionPerSecondSquared)
-        return self.__revolutions_per_second_squared
+        return self._cached_convert(RotationalAccelerationUnits.RevolutionPerSecondSquared)
 
     
     def to_string(self, unit: RotationalAccelerationUnits = RotationalAccelerationUnits.RadianPerSecondSquared) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class RotationalSpeedUnits(Enum):
         """
             RotationalSpeedUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         RadianPerSecond = 'radian_per_second'
         """
@@ -84,129 +95,388 @@ class RotationalSpeed(AbstractMeasure):
         value (float): The value.
         from_unit (RotationalSpeedUnits): The RotationalSpeed unit to create from, The default unit is RadianPerSecond
     """
-    def __init__(self, value: float, from_unit: RotationalSpeedUnits = RotationalSpeedUnits.RadianPerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = RotationalSpeedUnits
+
+    _base_unit = RotationalSpeedUnits.RadianPerSecond
+
+    _dimensions = (0, 0, -1, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 91
+
+    _binary_unit_ids = {
         
-        self.__radians_per_second = None
+        RotationalSpeedUnits.RadianPerSecond: 0,
         
-        self.__degrees_per_second = None
+        RotationalSpeedUnits.DegreePerSecond: 1,
         
-        self.__degrees_per_minute = None
+        RotationalSpeedUnits.DegreePerMinute: 2,
         
-        self.__revolutions_per_second = None
+        RotationalSpeedUnits.RevolutionPerSecond: 3,
         
-        self.__revolutions_per_minute = None
+        RotationalSpeedUnits.RevolutionPerMinute: 4,
         
-        self.__nanoradians_per_second = None
+        RotationalSpeedUnits.NanoradianPerSecond: 5,
         
-        self.__microradians_per_second = None
+        RotationalSpeedUnits.MicroradianPerSecond: 6,
         
-        self.__milliradians_per_second = None
+        RotationalSpeedUnits.MilliradianPerSecond: 7,
         
-        self.__centiradians_per_second = None
+        RotationalSpeedUnits.CentiradianPerSecond: 8,
         
-        self.__deciradians_per_second = None
+        RotationalSpeedUnits.DeciradianPerSecond: 9,
         
-        self.__nanodegrees_per_second = None
+        RotationalSpeedUnits.NanodegreePerSecond: 10,
         
-        self.__microdegrees_per_second = None
+        RotationalSpeedUnits.MicrodegreePerSecond: 11,
         
-        self.__millidegrees_per_second = None
+        RotationalSpeedUnits.MillidegreePerSecond: 12,
         
+    }
 
-    def convert(self, unit: RotationalSpeedUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        RotationalSpeedUnits.RadianPerSecond: lambda value: (value),
+        
+        RotationalSpeedUnits.DegreePerSecond: lambda value: ((180 / math.pi) * value),
+        
+        RotationalSpeedUnits.DegreePerMinute: lambda value: ((180 * 60 / math.pi) * value),
+        
+        RotationalSpeedUnits.RevolutionPerSecond: lambda value: (value / 6.2831853072),
+        
+        RotationalSpeedUnits.RevolutionPerMinute: lambda value: ((value / 6.2831853072) * 60),
+        
+        RotationalSpeedUnits.NanoradianPerSecond: lambda value: ((value) / 1e-09),
+        
+        RotationalSpeedUnits.MicroradianPerSecond: lambda value: ((value) / 1e-06),
+        
+        RotationalSpeedUnits.MilliradianPerSecond: lambda value: ((value) / 0.001),
+        
+        RotationalSpeedUnits.CentiradianPerSecond: lambda value: ((value) / 0.01),
+        
+        RotationalSpeedUnits.DeciradianPerSecond: lambda value: ((value) / 0.1),
+        
+        RotationalSpeedUnits.NanodegreePerSecond: lambda value: (((180 / math.pi) * value) / 1e-09),
+        
+        RotationalSpeedUnits.MicrodegreePerSecond: lambda value: (((180 / math.pi) * value) / 1e-06),
+        
+        RotationalSpeedUnits.MillidegreePerSecond: lambda value: (((180 / math.pi) * value) / 0.001),
+        
+    }
 
-    def __convert_from_base(self, from_unit: RotationalSpeedUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        RotationalSpeedUnits.RadianPerSecond: lambda value: (value),
+        
+        RotationalSpeedUnits.DegreePerSecond: lambda value: ((math.pi / 180) * value),
+        
+        RotationalSpeedUnits.DegreePerMinute: lambda value: ((math.pi / (180 * 60)) * value),
+        
+        RotationalSpeedUnits.RevolutionPerSecond: lambda value: (value * 6.2831853072),
+        
+        RotationalSpeedUnits.RevolutionPerMinute: lambda value: ((value * 6.2831853072) / 60),
         
-        if from_unit == RotationalSpeedUnits.RadianPerSecond:
-            return (value)
+        RotationalSpeedUnits.NanoradianPerSecond: lambda value: ((value) * 1e-09),
         
-        if from_unit == RotationalSpeedUnits.DegreePerSecond:
-            return ((180 / math.pi) * value)
+        RotationalSpeedUnits.MicroradianPerSecond: lambda value: ((value) * 1e-06),
         
-        if from_unit == RotationalSpeedUnits.DegreePerMinute:
-            return ((180 * 60 / math.pi) * value)
+        RotationalSpeedUnits.MilliradianPerSecond: lambda value: ((value) * 0.001),
         
-        if from_unit == RotationalSpeedUnits.RevolutionPerSecond:
-            return (value / 6.2831853072)
+        RotationalSpeedUnits.CentiradianPerSecond: lambda value: ((value) * 0.01),
         
-        if from_unit == RotationalSpeedUnits.RevolutionPerMinute:
-            return ((value / 6.2831853072) * 60)
+        RotationalSpeedUnits.DeciradianPerSecond: lambda value: ((value) * 0.1),
         
-        if from_unit == RotationalSpeedUnits.NanoradianPerSecond:
-            return ((value) / 1e-09)
+        RotationalSpeedUnits.NanodegreePerSecond: lambda value: (((math.pi / 180) * value) * 1e-09),
         
-        if from_unit == RotationalSpeedUnits.MicroradianPerSecond:
-            return ((value) / 1e-06)
+        RotationalSpeedUnits.MicrodegreePerSecond: lambda value: (((math.pi / 180) * value) * 1e-06),
         
-        if from_unit == RotationalSpeedUnits.MilliradianPerSecond:
-            return ((value) / 0.001)
+        RotationalSpeedUnits.MillidegreePerSecond: lambda value: (((math.pi / 180) * value) * 0.001),
         
-        if from_unit == RotationalSpeedUnits.CentiradianPerSecond:
-            return ((value) / 0.01)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        RotationalSpeedUnits.RadianPerSecond: ('1', '0'),
+        
+        RotationalSpeedUnits.DegreePerSecond: ('57.29577951308232', '0'),
+        
+        RotationalSpeedUnits.DegreePerMinute: ('3437.7467707849396', '0'),
+        
+        RotationalSpeedUnits.RevolutionPerSecond: ('625000000/3926990817', '0'),
+        
+        RotationalSpeedUnits.RevolutionPerMinute: ('12500000000/1308996939', '0'),
+        
+        RotationalSpeedUnits.NanoradianPerSecond: ('1000000000', '0'),
+        
+        RotationalSpeedUnits.MicroradianPerSecond: ('1000000', '0'),
+        
+        RotationalSpeedUnits.MilliradianPerSecond: ('1000', '0'),
         
-        if from_unit == RotationalSpeedUnits.DeciradianPerSecond:
-            return ((value) / 0.1)
+        RotationalSpeedUnits.CentiradianPerSecond: ('100', '0'),
         
-        if from_unit == RotationalSpeedUnits.NanodegreePerSecond:
-            return (((180 / math.pi) * value) / 1e-09)
+        RotationalSpeedUnits.DeciradianPerSecond: ('10', '0'),
         
-        if from_unit == RotationalSpeedUnits.MicrodegreePerSecond:
-            return (((180 / math.pi) * value) / 1e-06)
+        RotationalSpeedUnits.NanodegreePerSecond: ('57295779513.08232', '0'),
         
-        if from_unit == RotationalSpeedUnits.MillidegreePerSecond:
-            return (((180 / math.pi) * value) / 0.001)
+        RotationalSpeedUnits.MicrodegreePerSecond: ('57295779.513082325', '0'),
         
-        return None
+        RotationalSpeedUnits.MillidegreePerSecond: ('57295.77951308232', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        RotationalSpeedUnits.RadianPerSecond: ('1', '0'),
+        
+        RotationalSpeedUnits.DegreePerSecond: ('0.017453292519943295', '0'),
+        
+        RotationalSpeedUnits.DegreePerMinute: ('0.0002908882086657216', '0'),
+        
+        RotationalSpeedUnits.RevolutionPerSecond: ('3926990817/625000000', '0'),
+        
+        RotationalSpeedUnits.RevolutionPerMinute: ('1308996939/12500000000', '0'),
+        
+        RotationalSpeedUnits.NanoradianPerSecond: ('1/1000000000', '0'),
+        
+        RotationalSpeedUnits.MicroradianPerSecond: ('1/1000000', '0'),
+        
+        RotationalSpeedUnits.MilliradianPerSecond: ('1/1000', '0'),
+        
+        RotationalSpeedUnits.CentiradianPerSecond: ('1/100', '0'),
+        
+        RotationalSpeedUnits.DeciradianPerSecond: ('1/10', '0'),
+        
+        RotationalSpeedUnits.NanodegreePerSecond: ('1.7453292519943298e-11', '0'),
+        
+        RotationalSpeedUnits.MicrodegreePerSecond: ('1.7453292519943295e-08', '0'),
+        
+        RotationalSpeedUnits.MillidegreePerSecond: ('1.7453292519943296e-05', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: RotationalSpeedUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == RotationalSpeedUnits.RadianPerSecond:
-            return (value)
+        RotationalSpeedUnits.RadianPerSecond: ('rad/s',),
         
-        if to_unit == RotationalSpeedUnits.DegreePerSecond:
-            return ((math.pi / 180) * value)
+        RotationalSpeedUnits.DegreePerSecond: ('°/s',),
         
-        if to_unit == RotationalSpeedUnits.DegreePerMinute:
-            return ((math.pi / (180 * 60)) * value)
+        RotationalSpeedUnits.DegreePerMinute: ('°/min',),
         
-        if to_unit == RotationalSpeedUnits.RevolutionPerSecond:
-            return (value * 6.2831853072)
+        RotationalSpeedUnits.RevolutionPerSecond: ('r/s',),
         
-        if to_unit == RotationalSpeedUnits.RevolutionPerMinute:
-            return ((value * 6.2831853072) / 60)
+        RotationalSpeedUnits.RevolutionPerMinute: ('rpm',),
         
-        if to_unit == RotationalSpeedUnits.NanoradianPerSecond:
-            return ((value) * 1e-09)
+        RotationalSpeedUnits.NanoradianPerSecond: ('nrad/s',),
         
-        if to_unit == RotationalSpeedUnits.MicroradianPerSecond:
-            return ((value) * 1e-06)
+        RotationalSpeedUnits.MicroradianPerSecond: ('μrad/s',),
         
-        if to_unit == RotationalSpeedUnits.MilliradianPerSecond:
-            return ((value) * 0.001)
+        RotationalSpeedUnits.MilliradianPerSecond: ('mrad/s',),
         
-        if to_unit == RotationalSpeedUnits.CentiradianPerSecond:
-            return ((value) * 0.01)
+        RotationalSpeedUnits.CentiradianPerSecond: ('crad/s',),
         
-        if to_unit == RotationalSpeedUnits.DeciradianPerSecond:
-            return ((value) * 0.1)
+        RotationalSpeedUnits.DeciradianPerSecond: ('drad/s',),
         
-        if to_unit == RotationalSpeedUnits.NanodegreePerSecond:
-            return (((math.pi / 180) * value) * 1e-09)
+        RotationalSpeedUnits.NanodegreePerSecond: ('n°/s',),
         
-        if to_unit == RotationalSpeedUnits.MicrodegreePerSecond:
-            return (((math.pi / 180) * value) * 1e-06)
+        RotationalSpeedUnits.MicrodegreePerSecond: ('μ°/s',),
         
-        if to_unit == RotationalSpeedUnits.MillidegreePerSecond:
-            return (((math.pi / 180) * value) * 0.001)
+        RotationalSpeedUnits.MillidegreePerSecond: ('m°/s',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: RotationalSpeedUnits = RotationalSpeedUnits.RadianPerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: RotationalSpeedUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: RotationalSpeedUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
 
+    def __convert_to_base(self, value: float, to_unit: RotationalSpeedUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: RotationalSpeedUnits, to_unit: RotationalSpeedUnits) -> float:
+        """
+        Convert a value from one RotationalSpeed unit to another, without creating a RotationalSpeed instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: RotationalSpeedUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: RotationalSpeedUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return RotationalSpeed._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: RotationalSpeedUnits, to_unit: RotationalSpeedUnits) -> List[float]:
+        """
+        Convert many values from one RotationalSpeed unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: RotationalSpeedUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: RotationalSpeedUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return RotationalSpeed._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: RotationalSpeedUnits, to_unit: RotationalSpeedUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", RotationalSpeed._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: RotationalSpeedUnits, to_unit: RotationalSpeedUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one RotationalSpeed unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: RotationalSpeedUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: RotationalSpeedUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return RotationalSpeed._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: RotationalSpeedUnits = RotationalSpeedUnits.RadianPerSecond) -> RotationalSpeed:
+        """
+        Create a new instance of RotationalSpeed holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: RotationalSpeedUnits
+        :return: A new instance of RotationalSpeed.
+        :rtype: RotationalSpeed
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return RotationalSpeed._from_exact(value, from_unit)
+
+    def to_exact(self, unit: RotationalSpeedUnits = RotationalSpeedUnits.RadianPerSecond) -> Fraction:
+        """
+        Get the exact value of the RotationalSpeed in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (RadianPerSecond).
+        :type unit: RotationalSpeedUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> RotationalSpeed:
+        """
+        Parse a RotationalSpeed from a value followed by a unit abbreviation, e.g. "1 rad/s".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of RotationalSpeed.
+        :rtype: RotationalSpeed
+        :raises ValueError: When the string is not a valid or an ambiguous RotationalSpeed.
+        """
+        return RotationalSpeed._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[RotationalSpeed]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return RotationalSpeed._try_parse(text)
+
+    def to_binary(self, unit: Optional[RotationalSpeedUnits] = None) -> bytes:
+        """
+        Encode the RotationalSpeed to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: RotationalSpeedUnits
+        :return: The encoded RotationalSpeed.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> RotationalSpeed:
+        """
+        Decode a RotationalSpeed encoded by to_binary.
+
+        :param data: The encoded RotationalSpeed, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of RotationalSpeed.
+        :rtype: RotationalSpeed
+        :raises ValueError: When the data is not a valid encoded RotationalSpeed.
+        """
+        return RotationalSpeed._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[RotationalSpeedUnits] = None) -> dict:
+        """
+        Get the RotationalSpeed DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (RadianPerSecond).
+        :type hold_in_unit: RotationalSpeedUnits
+        :return: The RotationalSpeed DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[RotationalSpeedUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> RotationalSpeed:
+        """
+        Create a new instance of RotationalSpeed from its DTO.
+
+        :param dto: The RotationalSpeed DTO, the unit is the RotationalSpeedUnits value or name.
+        :type dto: dict
+        :return: A new instance of RotationalSpeed.
+        :rtype: RotationalSpeed
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return RotationalSpeed._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> RotationalSpeed:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return RotationalSpeed._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -413,10 +683,7 @@ class RotationalSpeed(AbstractMeasure):
         """
         
         """
-        if self.__radians_per_second != None:
-            return self.__radians_per_second
-        self.__radians_per_second = self.__convert_from_base(RotationalSpeedUnits.RadianPerSecond)
-        return self.__radians_per_second
+        return self._cached_convert(RotationalSpeedUnits.RadianPerSecond)
 
     
     @property
@@ -424,10 +691,7 @@ class RotationalSpeed(AbstractMeasure):
         """
         
         """
-        if self.__degrees_per_second != None:
-            return self.__degrees_per_second
-        self.__degrees_per_second = self.__convert_from_base(RotationalSpeedUnits.DegreePerSecond)
-        return self.__degrees_per_second
+        return self._cached_convert(RotationalSpeedUnits.DegreePerSecond)
 
     
     @property
@@ -435,10 +699,7 @@ class RotationalSpeed(AbstractMeasure):
         """
         
         """
-        if self.__degrees_per_minute != None:
-            return self.__degrees_per_minute
-        self.__degrees_per_minute = self.__convert_from_base(RotationalSpeedUnits.DegreePerMinute)
-        return self.__degrees_per_minute
+        return self._cached_convert(RotationalSpeedUnits.DegreePerMinute)
 
     
     @property
@@ -446,10 +707,7 @@ class RotationalSpeed(AbstractMeasure):
         """
         
         """
-        if self.__revolutions_per_second != None:
-            return self.__revolutions_per_second
-        self.__revolutions_per_second = self.__convert_from_base(RotationalSpeedUnits.RevolutionPerSecond)
-        return self.__revolutions_per_second
+        return self._cached_convert(RotationalSpeedUnits.RevolutionPerSecond)
 
     
     @property
@@ -457,10 +715,7 @@ class RotationalSpeed(AbstractMeasure):
         """
         
         """
-        if self.__revolutions_per_minute != None:
-            return self.__revolutions_per_minute
-        self.__revolutions_per_minute = self.__convert_from_base(RotationalSpeedUnits.RevolutionPerMinute)
-        return self.__revolutions_per_minute
+        return self._cached_convert(RotationalSpeedUnits.RevolutionPerMinute)
 
     
     @property
@@ -468,10 +723,7 @@ class RotationalSpeed(AbstractMeasure):
         """
         
         """
-        if self.__nanoradians_per_second != None:
-            return self.__nanoradians_per_second
-        self.__nanoradians_per_second = self.__convert_from_base(RotationalSpeedUnits.NanoradianPerSecond)
-        return self.__nanoradians_per_second
+        return self._cached_convert(RotationalSpeedUnits.NanoradianPerSecond)
 
     
     @property
@@ -479,10 +731,7 @@ class RotationalSpeed(AbstractMeasure):
         """
         
         """
-        if self.__microradians_per_second != None:
-            return self.__microradians_per_second
-        self.__microradians_per_second = self.__convert_from_base(RotationalSpeedUnits.MicroradianPerSecond)
-        return self.__microradians_per_second
+        return self._cached_convert(RotationalSpeedUnits.MicroradianPerSecond)
 
     
     @property
@@ -490,10 +739,7 @@ class RotationalSpeed(AbstractMeasure):
         """
         
         """
-        if self.__milliradians_per_second != None:
-            return self.__milliradians_per_second
-        self.__milliradians_per_second = self.__convert_from_base(RotationalSpeedUnits.MilliradianPerSecond)
-        return self.__milliradians_per_second
+        return self._cached_convert(RotationalSpeedUnits.MilliradianPerSecond)
 
     
     @property
@@ -501,10 +747,7 @@ class RotationalSpeed(AbstractMeasure):
         """
         
         """
-        if self.__centiradians_per_second != None:
-            return self.__centiradians_per_second
-        self.__centiradians_per_second = self.__convert_from_base(RotationalSpeedUnits.CentiradianPerSecond)
-        return self.__centiradians_per_second
+        return self._cached_convert(RotationalSpeedUnits.CentiradianPerSecond)
 
     
     @property
@@ -512,10 +755,7 @@ class RotationalSpeed(AbstractMeasure):
         """
         
         """
-        if self.__deciradians_per_second != None:
-            return self.__deciradians_per_second
-        self.__deciradians_per_second = self.__convert_from_base(RotationalSpeedUnits.DeciradianPerSecond)
-        return self.__deciradians_per_second
+        return self._cached_convert(RotationalSpeedUnits.DeciradianPerSecond)
 
     
     @property
@@ -523,10 +763,7 @@ class RotationalSpeed(AbstractMeasure):
         """
         
         """
-        if self.__nanodegrees_per_second != None:
-            return self.__nanodegrees_per_second
-        self.__nanodegrees_per_second = self.__convert_from_base(RotationalSpeedUnits.NanodegreePerSecond)
-        return self.__nanodegrees_per_second
+        return self._cached_convert(RotationalSpeedUnits.NanodegreePerSecond)
 
     
     @property
@@ -534,10 +771,7 @@ class RotationalSpeed(AbstractMeasure):
         """
         
         """
-        if self.__microdegrees_per_second != None:
-            return self.__microdegrees_per_second
-        self.__microdegrees_per_second = self.__convert_from_base(RotationalSpeedUnits.MicrodegreePerSecond)
-        return self.__microdegrees_per_second
+        return self._cached_convert(RotationalSpeedUnits.MicrodegreePerSecond)
 
     
     @property
@@ -545,10 +779,7 @@ class RotationalSpeed(AbstractMeasure):
         """
         
         """
-        if self.__millidegrees_per_second != None:
-            return self.__millidegrees_per_second
-        self.__millidegrees_per_second = self.__convert_from_base(RotationalSpeedUnits.MillidegreePerSecond)
-        return self.__millidegrees_per_second
+        return self._cached_convert(RotationalSpeedUnits.MillidegreePerSecond)
 
     
     def to_string(self, unit: RotationalSpeedUnits = RotationalSpeedUnits.RadianPerSecond) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class RotationalStiffnessUnits(Enum):
         """
             RotationalStiffnessUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         NewtonMeterPerRadian = 'newton_meter_per_radian'
         """
@@ -184,289 +195,628 @@ class RotationalStiffness(AbstractMeasure):
         value (float): The value.
         from_unit (RotationalStiffnessUnits): The RotationalStiffness unit to create from, The default unit is NewtonMeterPerRadian
     """
-    def __init__(self, value: float, from_unit: RotationalStiffnessUnits = RotationalStiffnessUnits.NewtonMeterPerRadian):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = RotationalStiffnessUnits
+
+    _base_unit = RotationalStiffnessUnits.NewtonMeterPerRadian
+
+    _dimensions = (2, 1, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 92
+
+    _binary_unit_ids = {
         
-        self.__newton_meters_per_radian = None
+        RotationalStiffnessUnits.NewtonMeterPerRadian: 0,
         
-        self.__pound_force_feet_per_degrees = None
+        RotationalStiffnessUnits.PoundForceFootPerDegrees: 1,
         
-        self.__kilopound_force_feet_per_degrees = None
+        RotationalStiffnessUnits.KilopoundForceFootPerDegrees: 2,
         
-        self.__newton_millimeters_per_degree = None
+        RotationalStiffnessUnits.NewtonMillimeterPerDegree: 3,
         
-        self.__newton_meters_per_degree = None
+        RotationalStiffnessUnits.NewtonMeterPerDegree: 4,
         
-        self.__newton_millimeters_per_radian = None
+        RotationalStiffnessUnits.NewtonMillimeterPerRadian: 5,
         
-        self.__pound_force_feet_per_radian = None
+        RotationalStiffnessUnits.PoundForceFeetPerRadian: 6,
         
-        self.__kilonewton_meters_per_radian = None
+        RotationalStiffnessUnits.KilonewtonMeterPerRadian: 7,
         
-        self.__meganewton_meters_per_radian = None
+        RotationalStiffnessUnits.MeganewtonMeterPerRadian: 8,
         
-        self.__nanonewton_millimeters_per_degree = None
+        RotationalStiffnessUnits.NanonewtonMillimeterPerDegree: 9,
         
-        self.__micronewton_millimeters_per_degree = None
+        RotationalStiffnessUnits.MicronewtonMillimeterPerDegree: 10,
         
-        self.__millinewton_millimeters_per_degree = None
+        RotationalStiffnessUnits.MillinewtonMillimeterPerDegree: 11,
         
-        self.__centinewton_millimeters_per_degree = None
+        RotationalStiffnessUnits.CentinewtonMillimeterPerDegree: 12,
         
-        self.__decinewton_millimeters_per_degree = None
+        RotationalStiffnessUnits.DecinewtonMillimeterPerDegree: 13,
         
-        self.__decanewton_millimeters_per_degree = None
+        RotationalStiffnessUnits.DecanewtonMillimeterPerDegree: 14,
         
-        self.__kilonewton_millimeters_per_degree = None
+        RotationalStiffnessUnits.KilonewtonMillimeterPerDegree: 15,
         
-        self.__meganewton_millimeters_per_degree = None
+        RotationalStiffnessUnits.MeganewtonMillimeterPerDegree: 16,
         
-        self.__nanonewton_meters_per_degree = None
+        RotationalStiffnessUnits.NanonewtonMeterPerDegree: 17,
         
-        self.__micronewton_meters_per_degree = None
+        RotationalStiffnessUnits.MicronewtonMeterPerDegree: 18,
         
-        self.__millinewton_meters_per_degree = None
+        RotationalStiffnessUnits.MillinewtonMeterPerDegree: 19,
         
-        self.__centinewton_meters_per_degree = None
+        RotationalStiffnessUnits.CentinewtonMeterPerDegree: 20,
         
-        self.__decinewton_meters_per_degree = None
+        RotationalStiffnessUnits.DecinewtonMeterPerDegree: 21,
         
-        self.__decanewton_meters_per_degree = None
+        RotationalStiffnessUnits.DecanewtonMeterPerDegree: 22,
         
-        self.__kilonewton_meters_per_degree = None
+        RotationalStiffnessUnits.KilonewtonMeterPerDegree: 23,
         
-        self.__meganewton_meters_per_degree = None
+        RotationalStiffnessUnits.MeganewtonMeterPerDegree: 24,
         
-        self.__nanonewton_millimeters_per_radian = None
+        RotationalStiffnessUnits.NanonewtonMillimeterPerRadian: 25,
         
-        self.__micronewton_millimeters_per_radian = None
+        RotationalStiffnessUnits.MicronewtonMillimeterPerRadian: 26,
         
-        self.__millinewton_millimeters_per_radian = None
+        RotationalStiffnessUnits.MillinewtonMillimeterPerRadian: 27,
         
-        self.__centinewton_millimeters_per_radian = None
+        RotationalStiffnessUnits.CentinewtonMillimeterPerRadian: 28,
         
-        self.__decinewton_millimeters_per_radian = None
+        RotationalStiffnessUnits.DecinewtonMillimeterPerRadian: 29,
         
-        self.__decanewton_millimeters_per_radian = None
+        RotationalStiffnessUnits.DecanewtonMillimeterPerRadian: 30,
         
-        self.__kilonewton_millimeters_per_radian = None
+        RotationalStiffnessUnits.KilonewtonMillimeterPerRadian: 31,
         
-        self.__meganewton_millimeters_per_radian = None
+        RotationalStiffnessUnits.MeganewtonMillimeterPerRadian: 32,
         
+    }
 
-    def convert(self, unit: RotationalStiffnessUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        RotationalStiffnessUnits.NewtonMeterPerRadian: lambda value: (value),
+        
+        RotationalStiffnessUnits.PoundForceFootPerDegrees: lambda value: (value / 77.6826),
+        
+        RotationalStiffnessUnits.KilopoundForceFootPerDegrees: lambda value: (value / 77682.6),
+        
+        RotationalStiffnessUnits.NewtonMillimeterPerDegree: lambda value: (value / 180 * math.pi * 1000),
+        
+        RotationalStiffnessUnits.NewtonMeterPerDegree: lambda value: (value / (180 / math.pi)),
+        
+        RotationalStiffnessUnits.NewtonMillimeterPerRadian: lambda value: (value * 1000),
+        
+        RotationalStiffnessUnits.PoundForceFeetPerRadian: lambda value: (value / 1.3558179483314),
+        
+        RotationalStiffnessUnits.KilonewtonMeterPerRadian: lambda value: ((value) / 1000.0),
+        
+        RotationalStiffnessUnits.MeganewtonMeterPerRadian: lambda value: ((value) / 1000000.0),
+        
+        RotationalStiffnessUnits.NanonewtonMillimeterPerDegree: lambda value: ((value / 180 * math.pi * 1000) / 1e-09),
+        
+        RotationalStiffnessUnits.MicronewtonMillimeterPerDegree: lambda value: ((value / 180 * math.pi * 1000) / 1e-06),
+        
+        RotationalStiffnessUnits.MillinewtonMillimeterPerDegree: lambda value: ((value / 180 * math.pi * 1000) / 0.001),
+        
+        RotationalStiffnessUnits.CentinewtonMillimeterPerDegree: lambda value: ((value / 180 * math.pi * 1000) / 0.01),
+        
+        RotationalStiffnessUnits.DecinewtonMillimeterPerDegree: lambda value: ((value / 180 * math.pi * 1000) / 0.1),
+        
+        RotationalStiffnessUnits.DecanewtonMillimeterPerDegree: lambda value: ((value / 180 * math.pi * 1000) / 10.0),
+        
+        RotationalStiffnessUnits.KilonewtonMillimeterPerDegree: lambda value: ((value / 180 * math.pi * 1000) / 1000.0),
+        
+        RotationalStiffnessUnits.MeganewtonMillimeterPerDegree: lambda value: ((value / 180 * math.pi * 1000) / 1000000.0),
+        
+        RotationalStiffnessUnits.NanonewtonMeterPerDegree: lambda value: ((value / (180 / math.pi)) / 1e-09),
+        
+        RotationalStiffnessUnits.MicronewtonMeterPerDegree: lambda value: ((value / (180 / math.pi)) / 1e-06),
+        
+        RotationalStiffnessUnits.MillinewtonMeterPerDegree: lambda value: ((value / (180 / math.pi)) / 0.001),
+        
+        RotationalStiffnessUnits.CentinewtonMeterPerDegree: lambda value: ((value / (180 / math.pi)) / 0.01),
+        
+        RotationalStiffnessUnits.DecinewtonMeterPerDegree: lambda value: ((value / (180 / math.pi)) / 0.1),
+        
+        RotationalStiffnessUnits.DecanewtonMeterPerDegree: lambda value: ((value / (180 / math.pi)) / 10.0),
+        
+        RotationalStiffnessUnits.KilonewtonMeterPerDegree: lambda value: ((value / (180 / math.pi)) / 1000.0),
+        
+        RotationalStiffnessUnits.MeganewtonMeterPerDegree: lambda value: ((value / (180 / math.pi)) / 1000000.0),
+        
+        RotationalStiffnessUnits.NanonewtonMillimeterPerRadian: lambda value: ((value * 1000) / 1e-09),
+        
+        RotationalStiffnessUnits.MicronewtonMillimeterPerRadian: lambda value: ((value * 1000) / 1e-06),
+        
+        RotationalStiffnessUnits.MillinewtonMillimeterPerRadian: lambda value: ((value * 1000) / 0.001),
+        
+        RotationalStiffnessUnits.CentinewtonMillimeterPerRadian: lambda value: ((value * 1000) / 0.01),
+        
+        RotationalStiffnessUnits.DecinewtonMillimeterPerRadian: lambda value: ((value * 1000) / 0.1),
+        
+        RotationalStiffnessUnits.DecanewtonMillimeterPerRadian: lambda value: ((value * 1000) / 10.0),
+        
+        RotationalStiffnessUnits.KilonewtonMillimeterPerRadian: lambda value: ((value * 1000) / 1000.0),
+        
+        RotationalStiffnessUnits.MeganewtonMillimeterPerRadian: lambda value: ((value * 1000) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: RotationalStiffnessUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == RotationalStiffnessUnits.NewtonMeterPerRadian:
-            return (value)
+        RotationalStiffnessUnits.NewtonMeterPerRadian: lambda value: (value),
         
-        if from_unit == RotationalStiffnessUnits.PoundForceFootPerDegrees:
-            return (value / 77.6826)
+        RotationalStiffnessUnits.PoundForceFootPerDegrees: lambda value: (value * 77.6826),
         
-        if from_unit == RotationalStiffnessUnits.KilopoundForceFootPerDegrees:
-            return (value / 77682.6)
+        RotationalStiffnessUnits.KilopoundForceFootPerDegrees: lambda value: (value * 77682.6),
         
-        if from_unit == RotationalStiffnessUnits.NewtonMillimeterPerDegree:
-            return (value / 180 * math.pi * 1000)
+        RotationalStiffnessUnits.NewtonMillimeterPerDegree: lambda value: (value * 180 / math.pi * 0.001),
         
-        if from_unit == RotationalStiffnessUnits.NewtonMeterPerDegree:
-            return (value / (180 / math.pi))
+        RotationalStiffnessUnits.NewtonMeterPerDegree: lambda value: (value * (180 / math.pi)),
         
-        if from_unit == RotationalStiffnessUnits.NewtonMillimeterPerRadian:
-            return (value * 1000)
+        RotationalStiffnessUnits.NewtonMillimeterPerRadian: lambda value: (value * 0.001),
         
-        if from_unit == RotationalStiffnessUnits.PoundForceFeetPerRadian:
-            return (value / 1.3558179483314)
+        RotationalStiffnessUnits.PoundForceFeetPerRadian: lambda value: (value * 1.3558179483314),
         
-        if from_unit == RotationalStiffnessUnits.KilonewtonMeterPerRadian:
-            return ((value) / 1000.0)
+        RotationalStiffnessUnits.KilonewtonMeterPerRadian: lambda value: ((value) * 1000.0),
         
-        if from_unit == RotationalStiffnessUnits.MeganewtonMeterPerRadian:
-            return ((value) / 1000000.0)
+        RotationalStiffnessUnits.MeganewtonMeterPerRadian: lambda value: ((value) * 1000000.0),
         
-        if from_unit == RotationalStiffnessUnits.NanonewtonMillimeterPerDegree:
-            return ((value / 180 * math.pi * 1000) / 1e-09)
+        RotationalStiffnessUnits.NanonewtonMillimeterPerDegree: lambda value: ((value * 180 / math.pi * 0.001) * 1e-09),
         
-        if from_unit == RotationalStiffnessUnits.MicronewtonMillimeterPerDegree:
-            return ((value / 180 * math.pi * 1000) / 1e-06)
+        RotationalStiffnessUnits.MicronewtonMillimeterPerDegree: lambda value: ((value * 180 / math.pi * 0.001) * 1e-06),
         
-        if from_unit == RotationalStiffnessUnits.MillinewtonMillimeterPerDegree:
-            return ((value / 180 * math.pi * 1000) / 0.001)
+        RotationalStiffnessUnits.MillinewtonMillimeterPerDegree: lambda value: ((value * 180 / math.pi * 0.001) * 0.001),
         
-        if from_unit == RotationalStiffnessUnits.CentinewtonMillimeterPerDegree:
-            return ((value / 180 * math.pi * 1000) / 0.01)
+        RotationalStiffnessUnits.CentinewtonMillimeterPerDegree: lambda value: ((value * 180 / math.pi * 0.001) * 0.01),
         
-        if from_unit == RotationalStiffnessUnits.DecinewtonMillimeterPerDegree:
-            return ((value / 180 * math.pi * 1000) / 0.1)
+        RotationalStiffnessUnits.DecinewtonMillimeterPerDegree: lambda value: ((value * 180 / math.pi * 0.001) * 0.1),
         
-        if from_unit == RotationalStiffnessUnits.DecanewtonMillimeterPerDegree:
-            return ((value / 180 * math.pi * 1000) / 10.0)
+        RotationalStiffnessUnits.DecanewtonMillimeterPerDegree: lambda value: ((value * 180 / math.pi * 0.001) * 10.0),
         
-        if from_unit == RotationalStiffnessUnits.KilonewtonMillimeterPerDegree:
-            return ((value / 180 * math.pi * 1000) / 1000.0)
+        RotationalStiffnessUnits.KilonewtonMillimeterPerDegree: lambda value: ((value * 180 / math.pi * 0.001) * 1000.0),
         
-        if from_unit == RotationalStiffnessUnits.MeganewtonMillimeterPerDegree:
-            return ((value / 180 * math.pi * 1000) / 1000000.0)
+        RotationalStiffnessUnits.MeganewtonMillimeterPerDegree: lambda value: ((value * 180 / math.pi * 0.001) * 1000000.0),
         
-        if from_unit == RotationalStiffnessUnits.NanonewtonMeterPerDegree:
-            return ((value / (180 / math.pi)) / 1e-09)
+        RotationalStiffnessUnits.NanonewtonMeterPerDegree: lambda value: ((value * (180 / math.pi)) * 1e-09),
         
-        if from_unit == RotationalStiffnessUnits.MicronewtonMeterPerDegree:
-            return ((value / (180 / math.pi)) / 1e-06)
+        RotationalStiffnessUnits.MicronewtonMeterPerDegree: lambda value: ((value * (180 / math.pi)) * 1e-06),
         
-        if from_unit == RotationalStiffnessUnits.MillinewtonMeterPerDegree:
-            return ((value / (180 / math.pi)) / 0.001)
+        RotationalStiffnessUnits.MillinewtonMeterPerDegree: lambda value: ((value * (180 / math.pi)) * 0.001),
         
-        if from_unit == RotationalStiffnessUnits.CentinewtonMeterPerDegree:
-            return ((value / (180 / math.pi)) / 0.01)
+        RotationalStiffnessUnits.CentinewtonMeterPerDegree: lambda value: ((value * (180 / math.pi)) * 0.01),
         
-        if from_unit == RotationalStiffnessUnits.DecinewtonMeterPerDegree:
-            return ((value / (180 / math.pi)) / 0.1)
+        RotationalStiffnessUnits.DecinewtonMeterPerDegree: lambda value: ((value * (180 / math.pi)) * 0.1),
         
-        if from_unit == RotationalStiffnessUnits.DecanewtonMeterPerDegree:
-            return ((value / (180 / math.pi)) / 10.0)
+        RotationalStiffnessUnits.DecanewtonMeterPerDegree: lambda value: ((value * (180 / math.pi)) * 10.0),
         
-        if from_unit == RotationalStiffnessUnits.KilonewtonMeterPerDegree:
-            return ((value / (180 / math.pi)) / 1000.0)
+        RotationalStiffnessUnits.KilonewtonMeterPerDegree: lambda value: ((value * (180 / math.pi)) * 1000.0),
         
-        if from_unit == RotationalStiffnessUnits.MeganewtonMeterPerDegree:
-            return ((value / (180 / math.pi)) / 1000000.0)
+        RotationalStiffnessUnits.MeganewtonMeterPerDegree: lambda value: ((value * (180 / math.pi)) * 1000000.0),
         
-        if from_unit == RotationalStiffnessUnits.NanonewtonMillimeterPerRadian:
-            return ((value * 1000) / 1e-09)
+        RotationalStiffnessUnits.NanonewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 1e-09),
         
-        if from_unit == RotationalStiffnessUnits.MicronewtonMillimeterPerRadian:
-            return ((value * 1000) / 1e-06)
+        RotationalStiffnessUnits.MicronewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 1e-06),
         
-        if from_unit == RotationalStiffnessUnits.MillinewtonMillimeterPerRadian:
-            return ((value * 1000) / 0.001)
+        RotationalStiffnessUnits.MillinewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 0.001),
         
-        if from_unit == RotationalStiffnessUnits.CentinewtonMillimeterPerRadian:
-            return ((value * 1000) / 0.01)
+        RotationalStiffnessUnits.CentinewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 0.01),
         
-        if from_unit == RotationalStiffnessUnits.DecinewtonMillimeterPerRadian:
-            return ((value * 1000) / 0.1)
+        RotationalStiffnessUnits.DecinewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 0.1),
         
-        if from_unit == RotationalStiffnessUnits.DecanewtonMillimeterPerRadian:
-            return ((value * 1000) / 10.0)
+        RotationalStiffnessUnits.DecanewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 10.0),
         
-        if from_unit == RotationalStiffnessUnits.KilonewtonMillimeterPerRadian:
-            return ((value * 1000) / 1000.0)
+        RotationalStiffnessUnits.KilonewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 1000.0),
         
-        if from_unit == RotationalStiffnessUnits.MeganewtonMillimeterPerRadian:
-            return ((value * 1000) / 1000000.0)
+        RotationalStiffnessUnits.MeganewtonMillimeterPerRadian: lambda value: ((value * 0.001) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        RotationalStiffnessUnits.NewtonMeterPerRadian: ('1', '0'),
+        
+        RotationalStiffnessUnits.PoundForceFootPerDegrees: ('5000/388413', '0'),
+        
+        RotationalStiffnessUnits.KilopoundForceFootPerDegrees: ('5/388413', '0'),
+        
+        RotationalStiffnessUnits.NewtonMillimeterPerDegree: ('17.453292519943297', '0'),
+        
+        RotationalStiffnessUnits.NewtonMeterPerDegree: ('0.017453292519943295', '0'),
+        
+        RotationalStiffnessUnits.NewtonMillimeterPerRadian: ('1000', '0'),
+        
+        RotationalStiffnessUnits.PoundForceFeetPerRadian: ('5000000000000/6779089741657', '0'),
+        
+        RotationalStiffnessUnits.KilonewtonMeterPerRadian: ('1/1000', '0'),
+        
+        RotationalStiffnessUnits.MeganewtonMeterPerRadian: ('1/1000000', '0'),
+        
+        RotationalStiffnessUnits.NanonewtonMillimeterPerDegree: ('17453292519.943295', '0'),
+        
+        RotationalStiffnessUnits.MicronewtonMillimeterPerDegree: ('17453292.519943297', '0'),
+        
+        RotationalStiffnessUnits.MillinewtonMillimeterPerDegree: ('17453.292519943298', '0'),
+        
+        RotationalStiffnessUnits.CentinewtonMillimeterPerDegree: ('1745.3292519943295', '0'),
+        
+        RotationalStiffnessUnits.DecinewtonMillimeterPerDegree: ('174.53292519943295', '0'),
+        
+        RotationalStiffnessUnits.DecanewtonMillimeterPerDegree: ('1.7453292519943298', '0'),
+        
+        RotationalStiffnessUnits.KilonewtonMillimeterPerDegree: ('0.017453292519943295', '0'),
+        
+        RotationalStiffnessUnits.MeganewtonMillimeterPerDegree: ('1.7453292519943296e-05', '0'),
+        
+        RotationalStiffnessUnits.NanonewtonMeterPerDegree: ('17453292.519943293', '0'),
+        
+        RotationalStiffnessUnits.MicronewtonMeterPerDegree: ('17453.292519943298', '0'),
+        
+        RotationalStiffnessUnits.MillinewtonMeterPerDegree: ('17.453292519943297', '0'),
+        
+        RotationalStiffnessUnits.CentinewtonMeterPerDegree: ('1.7453292519943295', '0'),
+        
+        RotationalStiffnessUnits.DecinewtonMeterPerDegree: ('0.17453292519943295', '0'),
+        
+        RotationalStiffnessUnits.DecanewtonMeterPerDegree: ('0.0017453292519943296', '0'),
+        
+        RotationalStiffnessUnits.KilonewtonMeterPerDegree: ('1.7453292519943296e-05', '0'),
+        
+        RotationalStiffnessUnits.MeganewtonMeterPerDegree: ('1.7453292519943295e-08', '0'),
+        
+        RotationalStiffnessUnits.NanonewtonMillimeterPerRadian: ('1000000000000', '0'),
+        
+        RotationalStiffnessUnits.MicronewtonMillimeterPerRadian: ('1000000000', '0'),
+        
+        RotationalStiffnessUnits.MillinewtonMillimeterPerRadian: ('1000000', '0'),
+        
+        RotationalStiffnessUnits.CentinewtonMillimeterPerRadian: ('100000', '0'),
+        
+        RotationalStiffnessUnits.DecinewtonMillimeterPerRadian: ('10000', '0'),
+        
+        RotationalStiffnessUnits.DecanewtonMillimeterPerRadian: ('100', '0'),
+        
+        RotationalStiffnessUnits.KilonewtonMillimeterPerRadian: ('1', '0'),
+        
+        RotationalStiffnessUnits.MeganewtonMillimeterPerRadian: ('1/1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: RotationalStiffnessUnits) -> float:
+    _affine_to_base = {
+        
+        RotationalStiffnessUnits.NewtonMeterPerRadian: ('1', '0'),
+        
+        RotationalStiffnessUnits.PoundForceFootPerDegrees: ('388413/5000', '0'),
+        
+        RotationalStiffnessUnits.KilopoundForceFootPerDegrees: ('388413/5', '0'),
+        
+        RotationalStiffnessUnits.NewtonMillimeterPerDegree: ('0.057295779513082325', '0'),
+        
+        RotationalStiffnessUnits.NewtonMeterPerDegree: ('57.29577951308232', '0'),
+        
+        RotationalStiffnessUnits.NewtonMillimeterPerRadian: ('1/1000', '0'),
+        
+        RotationalStiffnessUnits.PoundForceFeetPerRadian: ('6779089741657/5000000000000', '0'),
+        
+        RotationalStiffnessUnits.KilonewtonMeterPerRadian: ('1000', '0'),
+        
+        RotationalStiffnessUnits.MeganewtonMeterPerRadian: ('1000000', '0'),
+        
+        RotationalStiffnessUnits.NanonewtonMillimeterPerDegree: ('5.729577951308233e-11', '0'),
+        
+        RotationalStiffnessUnits.MicronewtonMillimeterPerDegree: ('5.7295779513082324e-08', '0'),
+        
+        RotationalStiffnessUnits.MillinewtonMillimeterPerDegree: ('5.7295779513082324e-05', '0'),
+        
+        RotationalStiffnessUnits.CentinewtonMillimeterPerDegree: ('0.0005729577951308233', '0'),
+        
+        RotationalStiffnessUnits.DecinewtonMillimeterPerDegree: ('0.005729577951308233', '0'),
+        
+        RotationalStiffnessUnits.DecanewtonMillimeterPerDegree: ('0.5729577951308232', '0'),
+        
+        RotationalStiffnessUnits.KilonewtonMillimeterPerDegree: ('57.29577951308232', '0'),
         
-        if to_unit == RotationalStiffnessUnits.NewtonMeterPerRadian:
-            return (value)
+        RotationalStiffnessUnits.MeganewtonMillimeterPerDegree: ('57295.77951308232', '0'),
         
-        if to_unit == RotationalStiffnessUnits.PoundForceFootPerDegrees:
-            return (value * 77.6826)
+        RotationalStiffnessUnits.NanonewtonMeterPerDegree: ('5.7295779513082324e-08', '0'),
         
-        if to_unit == RotationalStiffnessUnits.KilopoundForceFootPerDegrees:
-            return (value * 77682.6)
+        RotationalStiffnessUnits.MicronewtonMeterPerDegree: ('5.729577951308232e-05', '0'),
         
-        if to_unit == RotationalStiffnessUnits.NewtonMillimeterPerDegree:
-            return (value * 180 / math.pi * 0.001)
+        RotationalStiffnessUnits.MillinewtonMeterPerDegree: ('0.057295779513082325', '0'),
         
-        if to_unit == RotationalStiffnessUnits.NewtonMeterPerDegree:
-            return (value * (180 / math.pi))
+        RotationalStiffnessUnits.CentinewtonMeterPerDegree: ('0.5729577951308232', '0'),
         
-        if to_unit == RotationalStiffnessUnits.NewtonMillimeterPerRadian:
-            return (value * 0.001)
+        RotationalStiffnessUnits.DecinewtonMeterPerDegree: ('5.729577951308233', '0'),
         
-        if to_unit == RotationalStiffnessUnits.PoundForceFeetPerRadian:
-            return (value * 1.3558179483314)
+        RotationalStiffnessUnits.DecanewtonMeterPerDegree: ('572.9577951308232', '0'),
         
-        if to_unit == RotationalStiffnessUnits.KilonewtonMeterPerRadian:
-            return ((value) * 1000.0)
+        RotationalStiffnessUnits.KilonewtonMeterPerDegree: ('57295.77951308232', '0'),
         
-        if to_unit == RotationalStiffnessUnits.MeganewtonMeterPerRadian:
-            return ((value) * 1000000.0)
+        RotationalStiffnessUnits.MeganewtonMeterPerDegree: ('57295779.513082325', '0'),
         
-        if to_unit == RotationalStiffnessUnits.NanonewtonMillimeterPerDegree:
-            return ((value * 180 / math.pi * 0.001) * 1e-09)
+        RotationalStiffnessUnits.NanonewtonMillimeterPerRadian: ('1/1000000000000', '0'),
         
-        if to_unit == RotationalStiffnessUnits.MicronewtonMillimeterPerDegree:
-            return ((value * 180 / math.pi * 0.001) * 1e-06)
+        RotationalStiffnessUnits.MicronewtonMillimeterPerRadian: ('1/1000000000', '0'),
         
-        if to_unit == RotationalStiffnessUnits.MillinewtonMillimeterPerDegree:
-            return ((value * 180 / math.pi * 0.001) * 0.001)
+        RotationalStiffnessUnits.MillinewtonMillimeterPerRadian: ('1/1000000', '0'),
         
-        if to_unit == RotationalStiffnessUnits.CentinewtonMillimeterPerDegree:
-            return ((value * 180 / math.pi * 0.001) * 0.01)
+        RotationalStiffnessUnits.CentinewtonMillimeterPerRadian: ('1/100000', '0'),
         
-        if to_unit == RotationalStiffnessUnits.DecinewtonMillimeterPerDegree:
-            return ((value * 180 / math.pi * 0.001) * 0.1)
+        RotationalStiffnessUnits.DecinewtonMillimeterPerRadian: ('1/10000', '0'),
         
-        if to_unit == RotationalStiffnessUnits.DecanewtonMillimeterPerDegree:
-            return ((value * 180 / math.pi * 0.001) * 10.0)
+        RotationalStiffnessUnits.DecanewtonMillimeterPerRadian: ('1/100', '0'),
         
-        if to_unit == RotationalStiffnessUnits.KilonewtonMillimeterPerDegree:
-            return ((value * 180 / math.pi * 0.001) * 1000.0)
+        RotationalStiffnessUnits.KilonewtonMillimeterPerRadian: ('1', '0'),
         
-        if to_unit == RotationalStiffnessUnits.MeganewtonMillimeterPerDegree:
-            return ((value * 180 / math.pi * 0.001) * 1000000.0)
+        RotationalStiffnessUnits.MeganewtonMillimeterPerRadian: ('1000', '0'),
         
-        if to_unit == RotationalStiffnessUnits.NanonewtonMeterPerDegree:
-            return ((value * (180 / math.pi)) * 1e-09)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        RotationalStiffnessUnits.NewtonMeterPerRadian: ('N·m/rad',),
+        
+        RotationalStiffnessUnits.PoundForceFootPerDegrees: ('lbf·ft/deg',),
+        
+        RotationalStiffnessUnits.KilopoundForceFootPerDegrees: ('kipf·ft/°',),
+        
+        RotationalStiffnessUnits.NewtonMillimeterPerDegree: ('N·mm/deg',),
+        
+        RotationalStiffnessUnits.NewtonMeterPerDegree: ('N·m/deg',),
+        
+        RotationalStiffnessUnits.NewtonMillimeterPerRadian: ('N·mm/rad',),
+        
+        RotationalStiffnessUnits.PoundForceFeetPerRadian: ('lbf·ft/rad',),
+        
+        RotationalStiffnessUnits.KilonewtonMeterPerRadian: ('kN·m/rad',),
+        
+        RotationalStiffnessUnits.MeganewtonMeterPerRadian: ('MN·m/rad',),
+        
+        RotationalStiffnessUnits.NanonewtonMillimeterPerDegree: ('nN·mm/deg',),
+        
+        RotationalStiffnessUnits.MicronewtonMillimeterPerDegree: ('μN·mm/deg',),
+        
+        RotationalStiffnessUnits.MillinewtonMillimeterPerDegree: ('mN·mm/deg',),
         
-        if to_unit == RotationalStiffnessUnits.MicronewtonMeterPerDegree:
-            return ((value * (180 / math.pi)) * 1e-06)
+        RotationalStiffnessUnits.CentinewtonMillimeterPerDegree: ('cN·mm/deg',),
         
-        if to_unit == RotationalStiffnessUnits.MillinewtonMeterPerDegree:
-            return ((value * (180 / math.pi)) * 0.001)
+        RotationalStiffnessUnits.DecinewtonMillimeterPerDegree: ('dN·mm/deg',),
         
-        if to_unit == RotationalStiffnessUnits.CentinewtonMeterPerDegree:
-            return ((value * (180 / math.pi)) * 0.01)
+        RotationalStiffnessUnits.DecanewtonMillimeterPerDegree: ('daN·mm/deg',),
         
-        if to_unit == RotationalStiffnessUnits.DecinewtonMeterPerDegree:
-            return ((value * (180 / math.pi)) * 0.1)
+        RotationalStiffnessUnits.KilonewtonMillimeterPerDegree: ('kN·mm/deg',),
         
-        if to_unit == RotationalStiffnessUnits.DecanewtonMeterPerDegree:
-            return ((value * (180 / math.pi)) * 10.0)
+        RotationalStiffnessUnits.MeganewtonMillimeterPerDegree: ('MN·mm/deg',),
         
-        if to_unit == RotationalStiffnessUnits.KilonewtonMeterPerDegree:
-            return ((value * (180 / math.pi)) * 1000.0)
+        RotationalStiffnessUnits.NanonewtonMeterPerDegree: ('nN·m/deg',),
         
-        if to_unit == RotationalStiffnessUnits.MeganewtonMeterPerDegree:
-            return ((value * (180 / math.pi)) * 1000000.0)
+        RotationalStiffnessUnits.MicronewtonMeterPerDegree: ('μN·m/deg',),
         
-        if to_unit == RotationalStiffnessUnits.NanonewtonMillimeterPerRadian:
-            return ((value * 0.001) * 1e-09)
+        RotationalStiffnessUnits.MillinewtonMeterPerDegree: ('mN·m/deg',),
         
-        if to_unit == RotationalStiffnessUnits.MicronewtonMillimeterPerRadian:
-            return ((value * 0.001) * 1e-06)
+        RotationalStiffnessUnits.CentinewtonMeterPerDegree: ('cN·m/deg',),
         
-        if to_unit == RotationalStiffnessUnits.MillinewtonMillimeterPerRadian:
-            return ((value * 0.001) * 0.001)
+        RotationalStiffnessUnits.DecinewtonMeterPerDegree: ('dN·m/deg',),
         
-        if to_unit == RotationalStiffnessUnits.CentinewtonMillimeterPerRadian:
-            return ((value * 0.001) * 0.01)
+        RotationalStiffnessUnits.DecanewtonMeterPerDegree: ('daN·m/deg',),
         
-        if to_unit == RotationalStiffnessUnits.DecinewtonMillimeterPerRadian:
-            return ((value * 0.001) * 0.1)
+        RotationalStiffnessUnits.KilonewtonMeterPerDegree: ('kN·m/deg',),
         
-        if to_unit == RotationalStiffnessUnits.DecanewtonMillimeterPerRadian:
-            return ((value * 0.001) * 10.0)
+        RotationalStiffnessUnits.MeganewtonMeterPerDegree: ('MN·m/deg',),
         
-        if to_unit == RotationalStiffnessUnits.KilonewtonMillimeterPerRadian:
-            return ((value * 0.001) * 1000.0)
+        RotationalStiffnessUnits.NanonewtonMillimeterPerRadian: ('nN·mm/rad',),
         
-        if to_unit == RotationalStiffnessUnits.MeganewtonMillimeterPerRadian:
-            return ((value * 0.001) * 1000000.0)
+        RotationalStiffnessUnits.MicronewtonMillimeterPerRadian: ('μN·mm/rad',),
         
-        return None
+        RotationalStiffnessUnits.MillinewtonMillimeterPerRadian: ('mN·mm/rad',),
+        
+        RotationalStiffnessUnits.CentinewtonMillimeterPerRadian: ('cN·mm/rad',),
+        
+        RotationalStiffnessUnits.DecinewtonMillimeterPerRadian: ('dN·mm/rad',),
+        
+        RotationalStiffnessUnits.DecanewtonMillimeterPerRadian: ('daN·mm/rad',),
+        
+        RotationalStiffnessUnits.KilonewtonMillimeterPerRadian: ('kN·mm/rad',),
+        
+        RotationalStiffnessUnits.MeganewtonMillimeterPerRadian: ('MN·mm/rad',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: RotationalStiffnessUnits = RotationalStiffnessUnits.NewtonMeterPerRadian):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: RotationalStiffnessUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: RotationalStiffnessUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: RotationalStiffnessUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: RotationalStiffnessUnits, to_unit: RotationalStiffnessUnits) -> float:
+        """
+        Convert a value from one RotationalStiffness unit to another, without creating a RotationalStiffness instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: RotationalStiffnessUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: RotationalStiffnessUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return RotationalStiffness._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: RotationalStiffnessUnits, to_unit: RotationalStiffnessUnits) -> List[float]:
+        """
+        Convert many values from one RotationalStiffness unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: RotationalStiffnessUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: RotationalStiffnessUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return RotationalStiffness._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: RotationalStiffnessUnits, to_unit: RotationalStiffnessUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", RotationalStiffness._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: RotationalStiffnessUnits, to_unit: RotationalStiffnessUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one RotationalStiffness unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: RotationalStiffnessUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: RotationalStiffnessUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return RotationalStiffness._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: RotationalStiffnessUnits = RotationalStiffnessUnits.NewtonMeterPerRadian) -> RotationalStiffness:
+        """
+        Create a new instance of RotationalStiffness holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: RotationalStiffnessUnits
+        :return: A new instance of RotationalStiffness.
+        :rtype: RotationalStiffness
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return RotationalStiffness._from_exact(value, from_unit)
+
+    def to_exact(self, unit: RotationalStiffnessUnits = RotationalStiffnessUnits.NewtonMeterPerRadian) -> Fraction:
+        """
+        Get the exact value of the RotationalStiffness in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (NewtonMeterPerRadian).
+        :type unit: RotationalStiffnessUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> RotationalStiffness:
+        """
+        Parse a RotationalStiffness from a value followed by a unit abbreviation, e.g. "1 N·m/rad".
 
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of RotationalStiffness.
+        :rtype: RotationalStiffness
+        :raises ValueError: When the string is not a valid or an ambiguous RotationalStiffness.
+        """
+        return RotationalStiffness._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[RotationalStiffness]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return RotationalStiffness._try_parse(text)
+
+    def to_binary(self, unit: Optional[RotationalStiffnessUnits] = None) -> bytes:
+        """
+        Encode the RotationalStiffness to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: RotationalStiffnessUnits
+        :return: The encoded RotationalStiffness.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> RotationalStiffness:
+        """
+        Decode a RotationalStiffness encoded by to_binary.
+
+        :param data: The encoded RotationalStiffness, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of RotationalStiffness.
+        :rtype: RotationalStiffness
+        :raises ValueError: When the data is not a valid encoded RotationalStiffness.
+        """
+        return RotationalStiffness._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[RotationalStiffnessUnits] = None) -> dict:
+        """
+        Get the RotationalStiffness DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (NewtonMeterPerRadian).
+        :type hold_in_unit: RotationalStiffnessUnits
+        :return: The RotationalStiffness DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[RotationalStiffnessUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> RotationalStiffness:
+        """
+        Create a new instance of RotationalStiffness from its DTO.
+
+        :param dto: The RotationalStiffness DTO, the unit is the RotationalStiffnessUnits value or name.
+        :type dto: dict
+        :return: A new instance of RotationalStiffness.
+        :rtype: RotationalStiffness
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return RotationalStiffness._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> RotationalStiffness:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return RotationalStiffness._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -973,10 +1323,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__newton_meters_per_radian != None:
-            return self.__newton_meters_per_radian
-        self.__newton_meters_per_radian = self.__convert_from_base(RotationalStiffnessUnits.NewtonMeterPerRadian)
-        return self.__newton_meters_per_radian
+        return self._cached_convert(RotationalStiffnessUnits.NewtonMeterPerRadian)
 
     
     @property
@@ -984,10 +1331,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__pound_force_feet_per_degrees != None:
-            return self.__pound_force_feet_per_degrees
-        self.__pound_force_feet_per_degrees = self.__convert_from_base(RotationalStiffnessUnits.PoundForceFootPerDegrees)
-        return self.__pound_force_feet_per_degrees
+        return self._cached_convert(RotationalStiffnessUnits.PoundForceFootPerDegrees)
 
     
     @property
@@ -995,10 +1339,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__kilopound_force_feet_per_degrees != None:
-            return self.__kilopound_force_feet_per_degrees
-        self.__kilopound_force_feet_per_degrees = self.__convert_from_base(RotationalStiffnessUnits.KilopoundForceFootPerDegrees)
-        return self.__kilopound_force_feet_per_degrees
+        return self._cached_convert(RotationalStiffnessUnits.KilopoundForceFootPerDegrees)
 
     
     @property
@@ -1006,10 +1347,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__newton_millimeters_per_degree != None:
-            return self.__newton_millimeters_per_degree
-        self.__newton_millimeters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.NewtonMillimeterPerDegree)
-        return self.__newton_millimeters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.NewtonMillimeterPerDegree)
 
     
     @property
@@ -1017,10 +1355,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__newton_meters_per_degree != None:
-            return self.__newton_meters_per_degree
-        self.__newton_meters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.NewtonMeterPerDegree)
-        return self.__newton_meters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.NewtonMeterPerDegree)
 
     
     @property
@@ -1028,10 +1363,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__newton_millimeters_per_radian != None:
-            return self.__newton_millimeters_per_radian
-        self.__newton_millimeters_per_radian = self.__convert_from_base(RotationalStiffnessUnits.NewtonMillimeterPerRadian)
-        return self.__newton_millimeters_per_radian
+        return self._cached_convert(RotationalStiffnessUnits.NewtonMillimeterPerRadian)
 
     
     @property
@@ -1039,10 +1371,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__pound_force_feet_per_radian != None:
-            return self.__pound_force_feet_per_radian
-        self.__pound_force_feet_per_radian = self.__convert_from_base(RotationalStiffnessUnits.PoundForceFeetPerRadian)
-        return self.__pound_force_feet_per_radian
+        return self._cached_convert(RotationalStiffnessUnits.PoundForceFeetPerRadian)
 
     
     @property
@@ -1050,10 +1379,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__kilonewton_meters_per_radian != None:
-            return self.__kilonewton_meters_per_radian
-        self.__kilonewton_meters_per_radian = self.__convert_from_base(RotationalStiffnessUnits.KilonewtonMeterPerRadian)
-        return self.__kilonewton_meters_per_radian
+        return self._cached_convert(RotationalStiffnessUnits.KilonewtonMeterPerRadian)
 
     
     @property
@@ -1061,10 +1387,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__meganewton_meters_per_radian != None:
-            return self.__meganewton_meters_per_radian
-        self.__meganewton_meters_per_radian = self.__convert_from_base(RotationalStiffnessUnits.MeganewtonMeterPerRadian)
-        return self.__meganewton_meters_per_radian
+        return self._cached_convert(RotationalStiffnessUnits.MeganewtonMeterPerRadian)
 
     
     @property
@@ -1072,10 +1395,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__nanonewton_millimeters_per_degree != None:
-            return self.__nanonewton_millimeters_per_degree
-        self.__nanonewton_millimeters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.NanonewtonMillimeterPerDegree)
-        return self.__nanonewton_millimeters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.NanonewtonMillimeterPerDegree)
 
     
     @property
@@ -1083,10 +1403,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__micronewton_millimeters_per_degree != None:
-            return self.__micronewton_millimeters_per_degree
-        self.__micronewton_millimeters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.MicronewtonMillimeterPerDegree)
-        return self.__micronewton_millimeters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.MicronewtonMillimeterPerDegree)
 
     
     @property
@@ -1094,10 +1411,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__millinewton_millimeters_per_degree != None:
-            return self.__millinewton_millimeters_per_degree
-        self.__millinewton_millimeters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.MillinewtonMillimeterPerDegree)
-        return self.__millinewton_millimeters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.MillinewtonMillimeterPerDegree)
 
     
     @property
@@ -1105,10 +1419,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__centinewton_millimeters_per_degree != None:
-            return self.__centinewton_millimeters_per_degree
-        self.__centinewton_millimeters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.CentinewtonMillimeterPerDegree)
-        return self.__centinewton_millimeters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.CentinewtonMillimeterPerDegree)
 
     
     @property
@@ -1116,10 +1427,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__decinewton_millimeters_per_degree != None:
-            return self.__decinewton_millimeters_per_degree
-        self.__decinewton_millimeters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.DecinewtonMillimeterPerDegree)
-        return self.__decinewton_millimeters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.DecinewtonMillimeterPerDegree)
 
     
     @property
@@ -1127,10 +1435,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__decanewton_millimeters_per_degree != None:
-            return self.__decanewton_millimeters_per_degree
-        self.__decanewton_millimeters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.DecanewtonMillimeterPerDegree)
-        return self.__decanewton_millimeters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.DecanewtonMillimeterPerDegree)
 
     
     @property
@@ -1138,10 +1443,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__kilonewton_millimeters_per_degree != None:
-            return self.__kilonewton_millimeters_per_degree
-        self.__kilonewton_millimeters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.KilonewtonMillimeterPerDegree)
-        return self.__kilonewton_millimeters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.KilonewtonMillimeterPerDegree)
 
     
     @property
@@ -1149,10 +1451,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__meganewton_millimeters_per_degree != None:
-            return self.__meganewton_millimeters_per_degree
-        self.__meganewton_millimeters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.MeganewtonMillimeterPerDegree)
-        return self.__meganewton_millimeters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.MeganewtonMillimeterPerDegree)
 
     
     @property
@@ -1160,10 +1459,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__nanonewton_meters_per_degree != None:
-            return self.__nanonewton_meters_per_degree
-        self.__nanonewton_meters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.NanonewtonMeterPerDegree)
-        return self.__nanonewton_meters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.NanonewtonMeterPerDegree)
 
     
     @property
@@ -1171,10 +1467,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__micronewton_meters_per_degree != None:
-            return self.__micronewton_meters_per_degree
-        self.__micronewton_meters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.MicronewtonMeterPerDegree)
-        return self.__micronewton_meters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.MicronewtonMeterPerDegree)
 
     
     @property
@@ -1182,10 +1475,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__millinewton_meters_per_degree != None:
-            return self.__millinewton_meters_per_degree
-        self.__millinewton_meters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.MillinewtonMeterPerDegree)
-        return self.__millinewton_meters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.MillinewtonMeterPerDegree)
 
     
     @property
@@ -1193,10 +1483,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__centinewton_meters_per_degree != None:
-            return self.__centinewton_meters_per_degree
-        self.__centinewton_meters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.CentinewtonMeterPerDegree)
-        return self.__centinewton_meters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.CentinewtonMeterPerDegree)
 
     
     @property
@@ -1204,10 +1491,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__decinewton_meters_per_degree != None:
-            return self.__decinewton_meters_per_degree
-        self.__decinewton_meters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.DecinewtonMeterPerDegree)
-        return self.__decinewton_meters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.DecinewtonMeterPerDegree)
 
     
     @property
@@ -1215,10 +1499,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__decanewton_meters_per_degree != None:
-            return self.__decanewton_meters_per_degree
-        self.__decanewton_meters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.DecanewtonMeterPerDegree)
-        return self.__decanewton_meters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.DecanewtonMeterPerDegree)
 
     
     @property
@@ -1226,10 +1507,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__kilonewton_meters_per_degree != None:
-            return self.__kilonewton_meters_per_degree
-        self.__kilonewton_meters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.KilonewtonMeterPerDegree)
-        return self.__kilonewton_meters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.KilonewtonMeterPerDegree)
 
     
     @property
@@ -1237,10 +1515,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__meganewton_meters_per_degree != None:
-            return self.__meganewton_meters_per_degree
-        self.__meganewton_meters_per_degree = self.__convert_from_base(RotationalStiffnessUnits.MeganewtonMeterPerDegree)
-        return self.__meganewton_meters_per_degree
+        return self._cached_convert(RotationalStiffnessUnits.MeganewtonMeterPerDegree)
 
     
     @property
@@ -1248,10 +1523,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__nanonewton_millimeters_per_radian != None:
-            return self.__nanonewton_millimeters_per_radian
-        self.__nanonewton_millimeters_per_radian = self.__convert_from_base(RotationalStiffnessUnits.NanonewtonMillimeterPerRadian)
-        return self.__nanonewton_millimeters_per_radian
+        return self._cached_convert(RotationalStiffnessUnits.NanonewtonMillimeterPerRadian)
 
     
     @property
@@ -1259,10 +1531,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__micronewton_millimeters_per_radian != None:
-            return self.__micronewton_millimeters_per_radian
-        self.__micronewton_millimeters_per_radian = self.__convert_from_base(RotationalStiffnessUnits.MicronewtonMillimeterPerRadian)
-        return self.__micronewton_millimeters_per_radian
+        return self._cached_convert(RotationalStiffnessUnits.MicronewtonMillimeterPerRadian)
 
     
     @property
@@ -1270,10 +1539,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__millinewton_millimeters_per_radian != None:
-            return self.__millinewton_millimeters_per_radian
-        self.__millinewton_millimeters_per_radian = self.__convert_from_base(RotationalStiffnessUnits.MillinewtonMillimeterPerRadian)
-        return self.__millinewton_millimeters_per_radian
+        return self._cached_convert(RotationalStiffnessUnits.MillinewtonMillimeterPerRadian)
 
     
     @property
@@ -1281,10 +1547,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__centinewton_millimeters_per_radian != None:
-            return self.__centinewton_millimeters_per_radian
-        self.__centinewton_millimeters_per_radian = self.__convert_from_base(RotationalStiffnessUnits.CentinewtonMillimeterPerRadian)
-        return self.__centinewton_millimeters_per_radian
+        return self._cached_convert(RotationalStiffnessUnits.CentinewtonMillimeterPerRadian)
 
     
     @property
@@ -1292,10 +1555,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__decinewton_millimeters_per_radian != None:
-            return self.__decinewton_millimeters_per_radian
-        self.__decinewton_millimeters_per_radian = self.__convert_from_base(RotationalStiffnessUnits.DecinewtonMillimeterPerRadian)
-        return self.__decinewton_millimeters_per_radian
+        return self._cached_convert(RotationalStiffnessUnits.DecinewtonMillimeterPerRadian)
 
     
     @property
@@ -1303,10 +1563,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__decanewton_millimeters_per_radian != None:
-            return self.__decanewton_millimeters_per_radian
-        self.__decanewton_millimeters_per_radian = self.__convert_from_base(RotationalStiffnessUnits.DecanewtonMillimeterPerRadian)
-        return self.__decanewton_millimeters_per_radian
+        return self._cached_convert(RotationalStiffnessUnits.DecanewtonMillimeterPerRadian)
 
     
     @property
@@ -1314,10 +1571,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__kilonewton_millimeters_per_radian != None:
-            return self.__kilonewton_millimeters_per_radian
-        self.__kilonewton_millimeters_per_radian = self.__convert_from_base(RotationalStiffnessUnits.KilonewtonMillimeterPerRadian)
-        return self.__kilonewton_millimeters_per_radian
+        return self._cached_convert(RotationalStiffnessUnits.KilonewtonMillimeterPerRadian)
 
     
     @property
@@ -1325,10 +1579,7 @@ class RotationalStiffness(AbstractMeasure):
         """
         
         """
-        if self.__meganewton_millimeters_per_radian != None:
-            return self.__meganewton_millimeters_per_radian
-        self.__meganewton_millimeters_per_radian = self.__convert_from_base(RotationalStiffnessUnits.MeganewtonMillimeterPerRadian)
-        return self.__meganewton_millimeters_per_radian
+        return self._cached_convert(RotationalStiffnessUnits.MeganewtonMillimeterPerRadian)
 
     
     def to_string(self, unit: RotationalStiffnessUnits = RotationalStiffnessUnits.NewtonMeterPerRadian) -> str:
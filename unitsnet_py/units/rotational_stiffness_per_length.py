@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class RotationalStiffnessPerLengthUnits(Enum):
         """
             RotationalStiffnessPerLengthUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         NewtonMeterPerRadianPerMeter = 'newton_meter_per_radian_per_meter'
         """
@@ -44,65 +55,292 @@ class RotationalStiffnessPerLength(AbstractMeasure):
         value (float): The value.
         from_unit (RotationalStiffnessPerLengthUnits): The RotationalStiffnessPerLength unit to create from, The default unit is NewtonMeterPerRadianPerMeter
     """
-    def __init__(self, value: float, from_unit: RotationalStiffnessPerLengthUnits = RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = RotationalStiffnessPerLengthUnits
+
+    _base_unit = RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter
+
+    _dimensions = (1, 1, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 93
+
+    _binary_unit_ids = {
         
-        self.__newton_meters_per_radian_per_meter = None
+        RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter: 0,
         
-        self.__pound_force_feet_per_degrees_per_feet = None
+        RotationalStiffnessPerLengthUnits.PoundForceFootPerDegreesPerFoot: 1,
         
-        self.__kilopound_force_feet_per_degrees_per_feet = None
+        RotationalStiffnessPerLengthUnits.KilopoundForceFootPerDegreesPerFoot: 2,
         
-        self.__kilonewton_meters_per_radian_per_meter = None
+        RotationalStiffnessPerLengthUnits.KilonewtonMeterPerRadianPerMeter: 3,
         
-        self.__meganewton_meters_per_radian_per_meter = None
+        RotationalStiffnessPerLengthUnits.MeganewtonMeterPerRadianPerMeter: 4,
         
+    }
 
-    def convert(self, unit: RotationalStiffnessPerLengthUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter: lambda value: (value),
+        
+        RotationalStiffnessPerLengthUnits.PoundForceFootPerDegreesPerFoot: lambda value: (value / 254.864324570),
+        
+        RotationalStiffnessPerLengthUnits.KilopoundForceFootPerDegreesPerFoot: lambda value: (value / 254864.324570),
+        
+        RotationalStiffnessPerLengthUnits.KilonewtonMeterPerRadianPerMeter: lambda value: ((value) / 1000.0),
+        
+        RotationalStiffnessPerLengthUnits.MeganewtonMeterPerRadianPerMeter: lambda value: ((value) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: RotationalStiffnessPerLengthUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter:
-            return (value)
+        RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter: lambda value: (value),
         
-        if from_unit == RotationalStiffnessPerLengthUnits.PoundForceFootPerDegreesPerFoot:
-            return (value / 254.864324570)
+        RotationalStiffnessPerLengthUnits.PoundForceFootPerDegreesPerFoot: lambda value: (value * 254.864324570),
         
-        if from_unit == RotationalStiffnessPerLengthUnits.KilopoundForceFootPerDegreesPerFoot:
-            return (value / 254864.324570)
+        RotationalStiffnessPerLengthUnits.KilopoundForceFootPerDegreesPerFoot: lambda value: (value * 254864.324570),
         
-        if from_unit == RotationalStiffnessPerLengthUnits.KilonewtonMeterPerRadianPerMeter:
-            return ((value) / 1000.0)
+        RotationalStiffnessPerLengthUnits.KilonewtonMeterPerRadianPerMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == RotationalStiffnessPerLengthUnits.MeganewtonMeterPerRadianPerMeter:
-            return ((value) / 1000000.0)
+        RotationalStiffnessPerLengthUnits.MeganewtonMeterPerRadianPerMeter: lambda value: ((value) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter: ('1', '0'),
+        
+        RotationalStiffnessPerLengthUnits.PoundForceFootPerDegreesPerFoot: ('100000000/25486432457', '0'),
+        
+        RotationalStiffnessPerLengthUnits.KilopoundForceFootPerDegreesPerFoot: ('100000/25486432457', '0'),
+        
+        RotationalStiffnessPerLengthUnits.KilonewtonMeterPerRadianPerMeter: ('1/1000', '0'),
+        
+        RotationalStiffnessPerLengthUnits.MeganewtonMeterPerRadianPerMeter: ('1/1000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: RotationalStiffnessPerLengthUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter:
-            return (value)
+        RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter: ('1', '0'),
         
-        if to_unit == RotationalStiffnessPerLengthUnits.PoundForceFootPerDegreesPerFoot:
-            return (value * 254.864324570)
+        RotationalStiffnessPerLengthUnits.PoundForceFootPerDegreesPerFoot: ('25486432457/100000000', '0'),
         
-        if to_unit == RotationalStiffnessPerLengthUnits.KilopoundForceFootPerDegreesPerFoot:
-            return (value * 254864.324570)
+        RotationalStiffnessPerLengthUnits.KilopoundForceFootPerDegreesPerFoot: ('25486432457/100000', '0'),
         
-        if to_unit == RotationalStiffnessPerLengthUnits.KilonewtonMeterPerRadianPerMeter:
-            return ((value) * 1000.0)
+        RotationalStiffnessPerLengthUnits.KilonewtonMeterPerRadianPerMeter: ('1000', '0'),
         
-        if to_unit == RotationalStiffnessPerLengthUnits.MeganewtonMeterPerRadianPerMeter:
-            return ((value) * 1000000.0)
+        RotationalStiffnessPerLengthUnits.MeganewtonMeterPerRadianPerMeter: ('1000000', '0'),
         
-        return None
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter: ('N·m/rad/m',),
+        
+        RotationalStiffnessPerLengthUnits.PoundForceFootPerDegreesPerFoot: ('lbf·ft/deg/ft',),
+        
+        RotationalStiffnessPerLengthUnits.KilopoundForceFootPerDegreesPerFoot: ('kipf·ft/°/ft',),
+        
+        RotationalStiffnessPerLengthUnits.KilonewtonMeterPerRadianPerMeter: ('kN·m/rad/m',),
+        
+        RotationalStiffnessPerLengthUnits.MeganewtonMeterPerRadianPerMeter: ('MN·m/rad/m',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: RotationalStiffnessPerLengthUnits = RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: RotationalStiffnessPerLengthUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: RotationalStiffnessPerLengthUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: RotationalStiffnessPerLengthUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: RotationalStiffnessPerLengthUnits, to_unit: RotationalStiffnessPerLengthUnits) -> float:
+        """
+        Convert a value from one RotationalStiffnessPerLength unit to another, without creating a RotationalStiffnessPerLength instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: RotationalStiffnessPerLengthUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: RotationalStiffnessPerLengthUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return RotationalStiffnessPerLength._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: RotationalStiffnessPerLengthUnits, to_unit: RotationalStiffnessPerLengthUnits) -> List[float]:
+        """
+        Convert many values from one RotationalStiffnessPerLength unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: RotationalStiffnessPerLengthUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: RotationalStiffnessPerLengthUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return RotationalStiffnessPerLength._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: RotationalStiffnessPerLengthUnits, to_unit: RotationalStiffnessPerLengthUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", RotationalStiffnessPerLength._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: RotationalStiffnessPerLengthUnits, to_unit: RotationalStiffnessPerLengthUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one RotationalStiffnessPerLength unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: RotationalStiffnessPerLengthUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: RotationalStiffnessPerLengthUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return RotationalStiffnessPerLength._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: RotationalStiffnessPerLengthUnits = RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter) -> RotationalStiffnessPerLength:
+        """
+        Create a new instance of RotationalStiffnessPerLength holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: RotationalStiffnessPerLengthUnits
+        :return: A new instance of RotationalStiffnessPerLength.
+        :rtype: RotationalStiffnessPerLength
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return RotationalStiffnessPerLength._from_exact(value, from_unit)
+
+    def to_exact(self, unit: RotationalStiffnessPerLengthUnits = RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter) -> Fraction:
+        """
+        Get the exact value of the RotationalStiffnessPerLength in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (NewtonMeterPerRadianPerMeter).
+        :type unit: RotationalStiffnessPerLengthUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> RotationalStiffnessPerLength:
+        """
+        Parse a RotationalStiffnessPerLength from a value followed by a unit abbreviation, e.g. "1 N·m/rad/m".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of RotationalStiffnessPerLength.
+        :rtype: RotationalStiffnessPerLength
+        :raises ValueError: When the string is not a valid or an ambiguous RotationalStiffnessPerLength.
+        """
+        return RotationalStiffnessPerLength._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[RotationalStiffnessPerLength]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return RotationalStiffnessPerLength._try_parse(text)
+
+    def to_binary(self, unit: Optional[RotationalStiffnessPerLengthUnits] = None) -> bytes:
+        """
+        Encode the RotationalStiffnessPerLength to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: RotationalStiffnessPerLengthUnits
+        :return: The encoded RotationalStiffnessPerLength.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> RotationalStiffnessPerLength:
+        """
+        Decode a RotationalStiffnessPerLength encoded by to_binary.
+
+        :param data: The encoded RotationalStiffnessPerLength, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of RotationalStiffnessPerLength.
+        :rtype: RotationalStiffnessPerLength
+        :raises ValueError: When the data is not a valid encoded RotationalStiffnessPerLength.
+        """
+        return RotationalStiffnessPerLength._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[RotationalStiffnessPerLengthUnits] = None) -> dict:
+        """
+        Get the RotationalStiffnessPerLength DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
 
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (NewtonMeterPerRadianPerMeter).
+        :type hold_in_unit: RotationalStiffnessPerLengthUnits
+        :return: The RotationalStiffnessPerLength DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[RotationalStiffnessPerLengthUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> RotationalStiffnessPerLength:
+        """
+        Create a new instance of RotationalStiffnessPerLength from its DTO.
+
+        :param dto: The RotationalStiffnessPerLength DTO, the unit is the RotationalStiffnessPerLengthUnits value or name.
+        :type dto: dict
+        :return: A new instance of RotationalStiffnessPerLength.
+        :rtype: RotationalStiffnessPerLength
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return RotationalStiffnessPerLength._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> RotationalStiffnessPerLength:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return RotationalStiffnessPerLength._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -189,10 +427,7 @@ class RotationalStiffnessPerLength(AbstractMeasure):
         """
         
         """
-        if self.__newton_meters_per_radian_per_meter != None:
-            return self.__newton_meters_per_radian_per_meter
-        self.__newton_meters_per_radian_per_meter = self.__convert_from_base(RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter)
-        return self.__newton_meters_per_radian_per_meter
+        return self._cached_convert(RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter)
 
     
     @property
@@ -200,10 +435,7 @@ class RotationalStiffnessPerLength(AbstractMeasure):
         """
         
         """
-        if self.__pound_force_feet_per_degrees_per_feet != None:
-            return self.__pound_force_feet_per_degrees_per_feet
-        self.__pound_force_feet_per_degrees_per_feet = self.__convert_from_base(RotationalStiffnessPerLengthUnits.PoundForceFootPerDegreesPerFoot)
-        return self.__pound_force_feet_per_degrees_per_feet
+        return self._cached_convert(RotationalStiffnessPerLengthUnits.PoundForceFootPerDegreesPerFoot)
 
     
     @property
@@ -211,10 +443,7 @@ class RotationalStiffnessPerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilopound_force_feet_per_degrees_per_feet != None:
-            return self.__kilopound_force_feet_per_degrees_per_feet
-        self.__kilopound_force_feet_per_degrees_per_feet = self.__convert_from_base(RotationalStiffnessPerLengthUnits.KilopoundForceFootPerDegreesPerFoot)
-        return self.__kilopound_force_feet_per_degrees_per_feet
+        return self._cached_convert(RotationalStiffnessPerLengthUnits.KilopoundForceFootPerDegreesPerFoot)
 
     
     @property
@@ -222,10 +451,7 @@ class RotationalStiffnessPerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilonewton_meters_per_radian_per_meter != None:
-            return self.__kilonewton_meters_per_radian_per_meter
-        self.__kilonewton_meters_per_radian_per_meter = self.__convert_from_base(RotationalStiffnessPerLengthUnits.KilonewtonMeterPerRadianPerMeter)
-        return self.__kilonewton_meters_per_radian_per_meter
+        return self._cached_convert(RotationalStiffnessPerLengthUnits.KilonewtonMeterPerRadianPerMeter)
 
     
     @property
@@ -233,10 +459,7 @@ class RotationalStiffnessPerLength(AbstractMeasure):
         """
         
         """
-        if self.__meganewton_meters_per_radian_per_meter != None:
-            return self.__meganewton_meters_per_radian_per_meter
-        self.__meganewton_meters_per_radian_per_meter = self.__convert_from_base(RotationalStiffnessPerLengthUnits.MeganewtonMeterPerRadianPerMeter)
-        return self.__meganewton_meters_per_radian_per_meter
+        return self._cached_convert(RotationalStiffnessPerLengthUnits.MeganewtonMeterPerRadianPerMeter)
 
     
     def to_string(self, unit: RotationalStiffnessPerLengthUnits = RotationalStiffnessPerLengthUnits.NewtonMeterPerRadianPerMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class SpecificEnergyUnits(Enum):
         """
             SpecificEnergyUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         JoulePerKilogram = 'joule_per_kilogram'
         """
@@ -169,265 +180,592 @@ class SpecificEnergy(AbstractMeasure):
         value (float): The value.
         from_unit (SpecificEnergyUnits): The SpecificEnergy unit to create from, The default unit is JoulePerKilogram
     """
-    def __init__(self, value: float, from_unit: SpecificEnergyUnits = SpecificEnergyUnits.JoulePerKilogram):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = SpecificEnergyUnits
+
+    _base_unit = SpecificEnergyUnits.JoulePerKilogram
+
+    _dimensions = (2, 0, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 96
+
+    _binary_unit_ids = {
         
-        self.__joules_per_kilogram = None
+        SpecificEnergyUnits.JoulePerKilogram: 0,
         
-        self.__mega_joules_per_tonne = None
+        SpecificEnergyUnits.MegaJoulePerTonne: 1,
         
-        self.__calories_per_gram = None
+        SpecificEnergyUnits.CaloriePerGram: 2,
         
-        self.__watt_hours_per_kilogram = None
+        SpecificEnergyUnits.WattHourPerKilogram: 3,
         
-        self.__watt_days_per_kilogram = None
+        SpecificEnergyUnits.WattDayPerKilogram: 4,
         
-        self.__watt_days_per_tonne = None
+        SpecificEnergyUnits.WattDayPerTonne: 5,
         
-        self.__watt_days_per_short_ton = None
+        SpecificEnergyUnits.WattDayPerShortTon: 6,
         
-        self.__watt_hours_per_pound = None
+        SpecificEnergyUnits.WattHourPerPound: 7,
         
-        self.__btu_per_pound = None
+        SpecificEnergyUnits.BtuPerPound: 8,
         
-        self.__kilojoules_per_kilogram = None
+        SpecificEnergyUnits.KilojoulePerKilogram: 9,
         
-        self.__megajoules_per_kilogram = None
+        SpecificEnergyUnits.MegajoulePerKilogram: 10,
         
-        self.__kilocalories_per_gram = None
+        SpecificEnergyUnits.KilocaloriePerGram: 11,
         
-        self.__kilowatt_hours_per_kilogram = None
+        SpecificEnergyUnits.KilowattHourPerKilogram: 12,
         
-        self.__megawatt_hours_per_kilogram = None
+        SpecificEnergyUnits.MegawattHourPerKilogram: 13,
         
-        self.__gigawatt_hours_per_kilogram = None
+        SpecificEnergyUnits.GigawattHourPerKilogram: 14,
         
-        self.__kilowatt_days_per_kilogram = None
+        SpecificEnergyUnits.KilowattDayPerKilogram: 15,
         
-        self.__megawatt_days_per_kilogram = None
+        SpecificEnergyUnits.MegawattDayPerKilogram: 16,
         
-        self.__gigawatt_days_per_kilogram = None
+        SpecificEnergyUnits.GigawattDayPerKilogram: 17,
         
-        self.__terawatt_days_per_kilogram = None
+        SpecificEnergyUnits.TerawattDayPerKilogram: 18,
         
-        self.__kilowatt_days_per_tonne = None
+        SpecificEnergyUnits.KilowattDayPerTonne: 19,
         
-        self.__megawatt_days_per_tonne = None
+        SpecificEnergyUnits.MegawattDayPerTonne: 20,
         
-        self.__gigawatt_days_per_tonne = None
+        SpecificEnergyUnits.GigawattDayPerTonne: 21,
         
-        self.__terawatt_days_per_tonne = None
+        SpecificEnergyUnits.TerawattDayPerTonne: 22,
         
-        self.__kilowatt_days_per_short_ton = None
+        SpecificEnergyUnits.KilowattDayPerShortTon: 23,
         
-        self.__megawatt_days_per_short_ton = None
+        SpecificEnergyUnits.MegawattDayPerShortTon: 24,
         
-        self.__gigawatt_days_per_short_ton = None
+        SpecificEnergyUnits.GigawattDayPerShortTon: 25,
         
-        self.__terawatt_days_per_short_ton = None
+        SpecificEnergyUnits.TerawattDayPerShortTon: 26,
         
-        self.__kilowatt_hours_per_pound = None
+        SpecificEnergyUnits.KilowattHourPerPound: 27,
         
-        self.__megawatt_hours_per_pound = None
+        SpecificEnergyUnits.MegawattHourPerPound: 28,
         
-        self.__gigawatt_hours_per_pound = None
+        SpecificEnergyUnits.GigawattHourPerPound: 29,
         
+    }
 
-    def convert(self, unit: SpecificEnergyUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        SpecificEnergyUnits.JoulePerKilogram: lambda value: (value),
+        
+        SpecificEnergyUnits.MegaJoulePerTonne: lambda value: (value / 1e3),
+        
+        SpecificEnergyUnits.CaloriePerGram: lambda value: (value / 4.184e3),
+        
+        SpecificEnergyUnits.WattHourPerKilogram: lambda value: (value / 3.6e3),
+        
+        SpecificEnergyUnits.WattDayPerKilogram: lambda value: (value / (24 * 3.6e3)),
+        
+        SpecificEnergyUnits.WattDayPerTonne: lambda value: (value / ((24 * 3.6e3) / 1e3)),
+        
+        SpecificEnergyUnits.WattDayPerShortTon: lambda value: (value / ((24 * 3.6e3) / 9.0718474e2)),
+        
+        SpecificEnergyUnits.WattHourPerPound: lambda value: (value / 7.93664e3),
+        
+        SpecificEnergyUnits.BtuPerPound: lambda value: (value / 2326.000075362),
+        
+        SpecificEnergyUnits.KilojoulePerKilogram: lambda value: ((value) / 1000.0),
+        
+        SpecificEnergyUnits.MegajoulePerKilogram: lambda value: ((value) / 1000000.0),
+        
+        SpecificEnergyUnits.KilocaloriePerGram: lambda value: ((value / 4.184e3) / 1000.0),
+        
+        SpecificEnergyUnits.KilowattHourPerKilogram: lambda value: ((value / 3.6e3) / 1000.0),
+        
+        SpecificEnergyUnits.MegawattHourPerKilogram: lambda value: ((value / 3.6e3) / 1000000.0),
+        
+        SpecificEnergyUnits.GigawattHourPerKilogram: lambda value: ((value / 3.6e3) / 1000000000.0),
+        
+        SpecificEnergyUnits.KilowattDayPerKilogram: lambda value: ((value / (24 * 3.6e3)) / 1000.0),
+        
+        SpecificEnergyUnits.MegawattDayPerKilogram: lambda value: ((value / (24 * 3.6e3)) / 1000000.0),
+        
+        SpecificEnergyUnits.GigawattDayPerKilogram: lambda value: ((value / (24 * 3.6e3)) / 1000000000.0),
+        
+        SpecificEnergyUnits.TerawattDayPerKilogram: lambda value: ((value / (24 * 3.6e3)) / 1000000000000.0),
+        
+        SpecificEnergyUnits.KilowattDayPerTonne: lambda value: ((value / ((24 * 3.6e3) / 1e3)) / 1000.0),
+        
+        SpecificEnergyUnits.MegawattDayPerTonne: lambda value: ((value / ((24 * 3.6e3) / 1e3)) / 1000000.0),
+        
+        SpecificEnergyUnits.GigawattDayPerTonne: lambda value: ((value / ((24 * 3.6e3) / 1e3)) / 1000000000.0),
+        
+        SpecificEnergyUnits.TerawattDayPerTonne: lambda value: ((value / ((24 * 3.6e3) / 1e3)) / 1000000000000.0),
+        
+        SpecificEnergyUnits.KilowattDayPerShortTon: lambda value: ((value / ((24 * 3.6e3) / 9.0718474e2)) / 1000.0),
+        
+        SpecificEnergyUnits.MegawattDayPerShortTon: lambda value: ((value / ((24 * 3.6e3) / 9.0718474e2)) / 1000000.0),
+        
+        SpecificEnergyUnits.GigawattDayPerShortTon: lambda value: ((value / ((24 * 3.6e3) / 9.0718474e2)) / 1000000000.0),
+        
+        SpecificEnergyUnits.TerawattDayPerShortTon: lambda value: ((value / ((24 * 3.6e3) / 9.0718474e2)) / 1000000000000.0),
+        
+        SpecificEnergyUnits.KilowattHourPerPound: lambda value: ((value / 7.93664e3) / 1000.0),
+        
+        SpecificEnergyUnits.MegawattHourPerPound: lambda value: ((value / 7.93664e3) / 1000000.0),
+        
+        SpecificEnergyUnits.GigawattHourPerPound: lambda value: ((value / 7.93664e3) / 1000000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: SpecificEnergyUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == SpecificEnergyUnits.JoulePerKilogram:
-            return (value)
+        SpecificEnergyUnits.JoulePerKilogram: lambda value: (value),
         
-        if from_unit == SpecificEnergyUnits.MegaJoulePerTonne:
-            return (value / 1e3)
+        SpecificEnergyUnits.MegaJoulePerTonne: lambda value: (value * 1e3),
         
-        if from_unit == SpecificEnergyUnits.CaloriePerGram:
-            return (value / 4.184e3)
+        SpecificEnergyUnits.CaloriePerGram: lambda value: (value * 4.184e3),
         
-        if from_unit == SpecificEnergyUnits.WattHourPerKilogram:
-            return (value / 3.6e3)
+        SpecificEnergyUnits.WattHourPerKilogram: lambda value: (value * 3.6e3),
         
-        if from_unit == SpecificEnergyUnits.WattDayPerKilogram:
-            return (value / (24 * 3.6e3))
+        SpecificEnergyUnits.WattDayPerKilogram: lambda value: (value * (24 * 3.6e3)),
         
-        if from_unit == SpecificEnergyUnits.WattDayPerTonne:
-            return (value / ((24 * 3.6e3) / 1e3))
+        SpecificEnergyUnits.WattDayPerTonne: lambda value: (value * ((24 * 3.6e3) / 1e3)),
         
-        if from_unit == SpecificEnergyUnits.WattDayPerShortTon:
-            return (value / ((24 * 3.6e3) / 9.0718474e2))
+        SpecificEnergyUnits.WattDayPerShortTon: lambda value: (value * ((24 * 3.6e3) / 9.0718474e2)),
         
-        if from_unit == SpecificEnergyUnits.WattHourPerPound:
-            return (value / 7.93664e3)
+        SpecificEnergyUnits.WattHourPerPound: lambda value: (value * 7.93664e3),
         
-        if from_unit == SpecificEnergyUnits.BtuPerPound:
-            return (value / 2326.000075362)
+        SpecificEnergyUnits.BtuPerPound: lambda value: (value * 2326.000075362),
         
-        if from_unit == SpecificEnergyUnits.KilojoulePerKilogram:
-            return ((value) / 1000.0)
+        SpecificEnergyUnits.KilojoulePerKilogram: lambda value: ((value) * 1000.0),
         
-        if from_unit == SpecificEnergyUnits.MegajoulePerKilogram:
-            return ((value) / 1000000.0)
+        SpecificEnergyUnits.MegajoulePerKilogram: lambda value: ((value) * 1000000.0),
         
-        if from_unit == SpecificEnergyUnits.KilocaloriePerGram:
-            return ((value / 4.184e3) / 1000.0)
+        SpecificEnergyUnits.KilocaloriePerGram: lambda value: ((value * 4.184e3) * 1000.0),
         
-        if from_unit == SpecificEnergyUnits.KilowattHourPerKilogram:
-            return ((value / 3.6e3) / 1000.0)
+        SpecificEnergyUnits.KilowattHourPerKilogram: lambda value: ((value * 3.6e3) * 1000.0),
         
-        if from_unit == SpecificEnergyUnits.MegawattHourPerKilogram:
-            return ((value / 3.6e3) / 1000000.0)
+        SpecificEnergyUnits.MegawattHourPerKilogram: lambda value: ((value * 3.6e3) * 1000000.0),
         
-        if from_unit == SpecificEnergyUnits.GigawattHourPerKilogram:
-            return ((value / 3.6e3) / 1000000000.0)
+        SpecificEnergyUnits.GigawattHourPerKilogram: lambda value: ((value * 3.6e3) * 1000000000.0),
         
-        if from_unit == SpecificEnergyUnits.KilowattDayPerKilogram:
-            return ((value / (24 * 3.6e3)) / 1000.0)
+        SpecificEnergyUnits.KilowattDayPerKilogram: lambda value: ((value * (24 * 3.6e3)) * 1000.0),
         
-        if from_unit == SpecificEnergyUnits.MegawattDayPerKilogram:
-            return ((value / (24 * 3.6e3)) / 1000000.0)
+        SpecificEnergyUnits.MegawattDayPerKilogram: lambda value: ((value * (24 * 3.6e3)) * 1000000.0),
         
-        if from_unit == SpecificEnergyUnits.GigawattDayPerKilogram:
-            return ((value / (24 * 3.6e3)) / 1000000000.0)
+        SpecificEnergyUnits.GigawattDayPerKilogram: lambda value: ((value * (24 * 3.6e3)) * 1000000000.0),
         
-        if from_unit == SpecificEnergyUnits.TerawattDayPerKilogram:
-            return ((value / (24 * 3.6e3)) / 1000000000000.0)
+        SpecificEnergyUnits.TerawattDayPerKilogram: lambda value: ((value * (24 * 3.6e3)) * 1000000000000.0),
         
-        if from_unit == SpecificEnergyUnits.KilowattDayPerTonne:
-            return ((value / ((24 * 3.6e3) / 1e3)) / 1000.0)
+        SpecificEnergyUnits.KilowattDayPerTonne: lambda value: ((value * ((24 * 3.6e3) / 1e3)) * 1000.0),
         
-        if from_unit == SpecificEnergyUnits.MegawattDayPerTonne:
-            return ((value / ((24 * 3.6e3) / 1e3)) / 1000000.0)
+        SpecificEnergyUnits.MegawattDayPerTonne: lambda value: ((value * ((24 * 3.6e3) / 1e3)) * 1000000.0),
         
-        if from_unit == SpecificEnergyUnits.GigawattDayPerTonne:
-            return ((value / ((24 * 3.6e3) / 1e3)) / 1000000000.0)
+        SpecificEnergyUnits.GigawattDayPerTonne: lambda value: ((value * ((24 * 3.6e3) / 1e3)) * 1000000000.0),
         
-        if from_unit == SpecificEnergyUnits.TerawattDayPerTonne:
-            return ((value / ((24 * 3.6e3) / 1e3)) / 1000000000000.0)
+        SpecificEnergyUnits.TerawattDayPerTonne: lambda value: ((value * ((24 * 3.6e3) / 1e3)) * 1000000000000.0),
         
-        if from_unit == SpecificEnergyUnits.KilowattDayPerShortTon:
-            return ((value / ((24 * 3.6e3) / 9.0718474e2)) / 1000.0)
+        SpecificEnergyUnits.KilowattDayPerShortTon: lambda value: ((value * ((24 * 3.6e3) / 9.0718474e2)) * 1000.0),
         
-        if from_unit == SpecificEnergyUnits.MegawattDayPerShortTon:
-            return ((value / ((24 * 3.6e3) / 9.0718474e2)) / 1000000.0)
+        SpecificEnergyUnits.MegawattDayPerShortTon: lambda value: ((value * ((24 * 3.6e3) / 9.0718474e2)) * 1000000.0),
         
-        if from_unit == SpecificEnergyUnits.GigawattDayPerShortTon:
-            return ((value / ((24 * 3.6e3) / 9.0718474e2)) / 1000000000.0)
+        SpecificEnergyUnits.GigawattDayPerShortTon: lambda value: ((value * ((24 * 3.6e3) / 9.0718474e2)) * 1000000000.0),
         
-        if from_unit == SpecificEnergyUnits.TerawattDayPerShortTon:
-            return ((value / ((24 * 3.6e3) / 9.0718474e2)) / 1000000000000.0)
+        SpecificEnergyUnits.TerawattDayPerShortTon: lambda value: ((value * ((24 * 3.6e3) / 9.0718474e2)) * 1000000000000.0),
         
-        if from_unit == SpecificEnergyUnits.KilowattHourPerPound:
-            return ((value / 7.93664e3) / 1000.0)
+        SpecificEnergyUnits.KilowattHourPerPound: lambda value: ((value * 7.93664e3) * 1000.0),
         
-        if from_unit == SpecificEnergyUnits.MegawattHourPerPound:
-            return ((value / 7.93664e3) / 1000000.0)
+        SpecificEnergyUnits.MegawattHourPerPound: lambda value: ((value * 7.93664e3) * 1000000.0),
         
-        if from_unit == SpecificEnergyUnits.GigawattHourPerPound:
-            return ((value / 7.93664e3) / 1000000000.0)
+        SpecificEnergyUnits.GigawattHourPerPound: lambda value: ((value * 7.93664e3) * 1000000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        SpecificEnergyUnits.JoulePerKilogram: ('1', '0'),
+        
+        SpecificEnergyUnits.MegaJoulePerTonne: ('1/1000', '0'),
+        
+        SpecificEnergyUnits.CaloriePerGram: ('1/4184', '0'),
+        
+        SpecificEnergyUnits.WattHourPerKilogram: ('1/3600', '0'),
+        
+        SpecificEnergyUnits.WattDayPerKilogram: ('1/86400', '0'),
+        
+        SpecificEnergyUnits.WattDayPerTonne: ('5/432', '0'),
+        
+        SpecificEnergyUnits.WattDayPerShortTon: ('45359237/4320000000', '0'),
+        
+        SpecificEnergyUnits.WattHourPerPound: ('25/198416', '0'),
+        
+        SpecificEnergyUnits.BtuPerPound: ('500000000/1163000037681', '0'),
+        
+        SpecificEnergyUnits.KilojoulePerKilogram: ('1/1000', '0'),
+        
+        SpecificEnergyUnits.MegajoulePerKilogram: ('1/1000000', '0'),
+        
+        SpecificEnergyUnits.KilocaloriePerGram: ('1/4184000', '0'),
+        
+        SpecificEnergyUnits.KilowattHourPerKilogram: ('1/3600000', '0'),
+        
+        SpecificEnergyUnits.MegawattHourPerKilogram: ('1/3600000000', '0'),
+        
+        SpecificEnergyUnits.GigawattHourPerKilogram: ('1/3600000000000', '0'),
+        
+        SpecificEnergyUnits.KilowattDayPerKilogram: ('1/86400000', '0'),
+        
+        SpecificEnergyUnits.MegawattDayPerKilogram: ('1/86400000000', '0'),
+        
+        SpecificEnergyUnits.GigawattDayPerKilogram: ('1/86400000000000', '0'),
+        
+        SpecificEnergyUnits.TerawattDayPerKilogram: ('1/86400000000000000', '0'),
+        
+        SpecificEnergyUnits.KilowattDayPerTonne: ('1/86400', '0'),
+        
+        SpecificEnergyUnits.MegawattDayPerTonne: ('1/86400000', '0'),
+        
+        SpecificEnergyUnits.GigawattDayPerTonne: ('1/86400000000', '0'),
+        
+        SpecificEnergyUnits.TerawattDayPerTonne: ('1/86400000000000', '0'),
+        
+        SpecificEnergyUnits.KilowattDayPerShortTon: ('45359237/4320000000000', '0'),
+        
+        SpecificEnergyUnits.MegawattDayPerShortTon: ('45359237/4320000000000000', '0'),
+        
+        SpecificEnergyUnits.GigawattDayPerShortTon: ('45359237/4320000000000000000', '0'),
+        
+        SpecificEnergyUnits.TerawattDayPerShortTon: ('45359237/4320000000000000000000', '0'),
+        
+        SpecificEnergyUnits.KilowattHourPerPound: ('1/7936640', '0'),
+        
+        SpecificEnergyUnits.MegawattHourPerPound: ('1/7936640000', '0'),
+        
+        SpecificEnergyUnits.GigawattHourPerPound: ('1/7936640000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: SpecificEnergyUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == SpecificEnergyUnits.JoulePerKilogram:
-            return (value)
+        SpecificEnergyUnits.JoulePerKilogram: ('1', '0'),
         
-        if to_unit == SpecificEnergyUnits.MegaJoulePerTonne:
-            return (value * 1e3)
+        SpecificEnergyUnits.MegaJoulePerTonne: ('1000', '0'),
         
-        if to_unit == SpecificEnergyUnits.CaloriePerGram:
-            return (value * 4.184e3)
+        SpecificEnergyUnits.CaloriePerGram: ('4184', '0'),
         
-        if to_unit == SpecificEnergyUnits.WattHourPerKilogram:
-            return (value * 3.6e3)
+        SpecificEnergyUnits.WattHourPerKilogram: ('3600', '0'),
         
-        if to_unit == SpecificEnergyUnits.WattDayPerKilogram:
-            return (value * (24 * 3.6e3))
+        SpecificEnergyUnits.WattDayPerKilogram: ('86400', '0'),
         
-        if to_unit == SpecificEnergyUnits.WattDayPerTonne:
-            return (value * ((24 * 3.6e3) / 1e3))
+        SpecificEnergyUnits.WattDayPerTonne: ('432/5', '0'),
         
-        if to_unit == SpecificEnergyUnits.WattDayPerShortTon:
-            return (value * ((24 * 3.6e3) / 9.0718474e2))
+        SpecificEnergyUnits.WattDayPerShortTon: ('4320000000/45359237', '0'),
         
-        if to_unit == SpecificEnergyUnits.WattHourPerPound:
-            return (value * 7.93664e3)
+        SpecificEnergyUnits.WattHourPerPound: ('198416/25', '0'),
         
-        if to_unit == SpecificEnergyUnits.BtuPerPound:
-            return (value * 2326.000075362)
+        SpecificEnergyUnits.BtuPerPound: ('1163000037681/500000000', '0'),
         
-        if to_unit == SpecificEnergyUnits.KilojoulePerKilogram:
-            return ((value) * 1000.0)
+        SpecificEnergyUnits.KilojoulePerKilogram: ('1000', '0'),
         
-        if to_unit == SpecificEnergyUnits.MegajoulePerKilogram:
-            return ((value) * 1000000.0)
+        SpecificEnergyUnits.MegajoulePerKilogram: ('1000000', '0'),
         
-        if to_unit == SpecificEnergyUnits.KilocaloriePerGram:
-            return ((value * 4.184e3) * 1000.0)
+        SpecificEnergyUnits.KilocaloriePerGram: ('4184000', '0'),
         
-        if to_unit == SpecificEnergyUnits.KilowattHourPerKilogram:
-            return ((value * 3.6e3) * 1000.0)
+        SpecificEnergyUnits.KilowattHourPerKilogram: ('3600000', '0'),
         
-        if to_unit == SpecificEnergyUnits.MegawattHourPerKilogram:
-            return ((value * 3.6e3) * 1000000.0)
+        SpecificEnergyUnits.MegawattHourPerKilogram: ('3600000000', '0'),
         
-        if to_unit == SpecificEnergyUnits.GigawattHourPerKilogram:
-            return ((value * 3.6e3) * 1000000000.0)
+        SpecificEnergyUnits.GigawattHourPerKilogram: ('3600000000000', '0'),
         
-        if to_unit == SpecificEnergyUnits.KilowattDayPerKilogram:
-            return ((value * (24 * 3.6e3)) * 1000.0)
+        SpecificEnergyUnits.KilowattDayPerKilogram: ('86400000', '0'),
         
-        if to_unit == SpecificEnergyUnits.MegawattDayPerKilogram:
-            return ((value * (24 * 3.6e3)) * 1000000.0)
+        SpecificEnergyUnits.MegawattDayPerKilogram: ('86400000000', '0'),
         
-        if to_unit == SpecificEnergyUnits.GigawattDayPerKilogram:
-            return ((value * (24 * 3.6e3)) * 1000000000.0)
+        SpecificEnergyUnits.GigawattDayPerKilogram: ('86400000000000', '0'),
         
-        if to_unit == SpecificEnergyUnits.TerawattDayPerKilogram:
-            return ((value * (24 * 3.6e3)) * 1000000000000.0)
+        SpecificEnergyUnits.TerawattDayPerKilogram: ('86400000000000000', '0'),
         
-        if to_unit == SpecificEnergyUnits.KilowattDayPerTonne:
-            return ((value * ((24 * 3.6e3) / 1e3)) * 1000.0)
+        SpecificEnergyUnits.KilowattDayPerTonne: ('86400', '0'),
         
-        if to_unit == SpecificEnergyUnits.MegawattDayPerTonne:
-            return ((value * ((24 * 3.6e3) / 1e3)) * 1000000.0)
+        SpecificEnergyUnits.MegawattDayPerTonne: ('86400000', '0'),
         
-        if to_unit == SpecificEnergyUnits.GigawattDayPerTonne:
-            return ((value * ((24 * 3.6e3) / 1e3)) * 1000000000.0)
+        SpecificEnergyUnits.GigawattDayPerTonne: ('86400000000', '0'),
         
-        if to_unit == SpecificEnergyUnits.TerawattDayPerTonne:
-            return ((value * ((24 * 3.6e3) / 1e3)) * 1000000000000.0)
+        SpecificEnergyUnits.TerawattDayPerTonne: ('86400000000000', '0'),
         
-        if to_unit == SpecificEnergyUnits.KilowattDayPerShortTon:
-            return ((value * ((24 * 3.6e3) / 9.0718474e2)) * 1000.0)
+        SpecificEnergyUnits.KilowattDayPerShortTon: ('4320000000000/45359237', '0'),
         
-        if to_unit == SpecificEnergyUnits.MegawattDayPerShortTon:
-            return ((value * ((24 * 3.6e3) / 9.0718474e2)) * 1000000.0)
+        SpecificEnergyUnits.MegawattDayPerShortTon: ('4320000000000000/45359237', '0'),
         
-        if to_unit == SpecificEnergyUnits.GigawattDayPerShortTon:
-            return ((value * ((24 * 3.6e3) / 9.0718474e2)) * 1000000000.0)
+        SpecificEnergyUnits.GigawattDayPerShortTon: ('4320000000000000000/45359237', '0'),
         
-        if to_unit == SpecificEnergyUnits.TerawattDayPerShortTon:
-            return ((value * ((24 * 3.6e3) / 9.0718474e2)) * 1000000000000.0)
+        SpecificEnergyUnits.TerawattDayPerShortTon: ('4320000000000000000000/45359237', '0'),
         
-        if to_unit == SpecificEnergyUnits.KilowattHourPerPound:
-            return ((value * 7.93664e3) * 1000.0)
+        SpecificEnergyUnits.KilowattHourPerPound: ('7936640', '0'),
         
-        if to_unit == SpecificEnergyUnits.MegawattHourPerPound:
-            return ((value * 7.93664e3) * 1000000.0)
+        SpecificEnergyUnits.MegawattHourPerPound: ('7936640000', '0'),
         
-        if to_unit == SpecificEnergyUnits.GigawattHourPerPound:
-            return ((value * 7.93664e3) * 1000000000.0)
+        SpecificEnergyUnits.GigawattHourPerPound: ('7936640000000', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        SpecificEnergyUnits.JoulePerKilogram: ('J/kg',),
+        
+        SpecificEnergyUnits.MegaJoulePerTonne: ('MJ/t',),
+        
+        SpecificEnergyUnits.CaloriePerGram: ('cal/g',),
+        
+        SpecificEnergyUnits.WattHourPerKilogram: ('Wh/kg',),
+        
+        SpecificEnergyUnits.WattDayPerKilogram: ('Wd/kg',),
+        
+        SpecificEnergyUnits.WattDayPerTonne: ('Wd/t',),
+        
+        SpecificEnergyUnits.WattDayPerShortTon: ('Wd/ST',),
+        
+        SpecificEnergyUnits.WattHourPerPound: ('Wh/lbs',),
+        
+        SpecificEnergyUnits.BtuPerPound: ('btu/lb',),
+        
+        SpecificEnergyUnits.KilojoulePerKilogram: ('kJ/kg',),
+        
+        SpecificEnergyUnits.MegajoulePerKilogram: ('MJ/kg',),
+        
+        SpecificEnergyUnits.KilocaloriePerGram: ('kcal/g',),
+        
+        SpecificEnergyUnits.KilowattHourPerKilogram: ('kWh/kg',),
+        
+        SpecificEnergyUnits.MegawattHourPerKilogram: ('MWh/kg',),
+        
+        SpecificEnergyUnits.GigawattHourPerKilogram: ('GWh/kg',),
+        
+        SpecificEnergyUnits.KilowattDayPerKilogram: ('kWd/kg',),
+        
+        SpecificEnergyUnits.MegawattDayPerKilogram: ('MWd/kg',),
+        
+        SpecificEnergyUnits.GigawattDayPerKilogram: ('GWd/kg',),
+        
+        SpecificEnergyUnits.TerawattDayPerKilogram: ('TWd/kg',),
+        
+        SpecificEnergyUnits.KilowattDayPerTonne: ('kWd/t',),
+        
+        SpecificEnergyUnits.MegawattDayPerTonne: ('MWd/t',),
+        
+        SpecificEnergyUnits.GigawattDayPerTonne: ('GWd/t',),
+        
+        SpecificEnergyUnits.TerawattDayPerTonne: ('TWd/t',),
+        
+        SpecificEnergyUnits.KilowattDayPerShortTon: ('kWd/ST',),
+        
+        SpecificEnergyUnits.MegawattDayPerShortTon: ('MWd/ST',),
+        
+        SpecificEnergyUnits.GigawattDayPerShortTon: ('GWd/ST',),
+        
+        SpecificEnergyUnits.TerawattDayPerShortTon: ('TWd/ST',),
+        
+        SpecificEnergyUnits.KilowattHourPerPound: ('kWh/lbs',),
+        
+        SpecificEnergyUnits.MegawattHourPerPound: ('MWh/lbs',),
+        
+        SpecificEnergyUnits.GigawattHourPerPound: ('GWh/lbs',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: SpecificEnergyUnits = SpecificEnergyUnits.JoulePerKilogram):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: SpecificEnergyUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: SpecificEnergyUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: SpecificEnergyUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: SpecificEnergyUnits, to_unit: SpecificEnergyUnits) -> float:
+        """
+        Convert a value from one SpecificEnergy unit to another, without creating a SpecificEnergy instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificEnergyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: SpecificEnergyUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return SpecificEnergy._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: SpecificEnergyUnits, to_unit: SpecificEnergyUnits) -> List[float]:
+        """
+        Convert many values from one SpecificEnergy unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: SpecificEnergyUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: SpecificEnergyUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return SpecificEnergy._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: SpecificEnergyUnits, to_unit: SpecificEnergyUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", SpecificEnergy._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: SpecificEnergyUnits, to_unit: SpecificEnergyUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one SpecificEnergy unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificEnergyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: SpecificEnergyUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return SpecificEnergy._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: SpecificEnergyUnits = SpecificEnergyUnits.JoulePerKilogram) -> SpecificEnergy:
+        """
+        Create a new instance of SpecificEnergy holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificEnergyUnits
+        :return: A new instance of SpecificEnergy.
+        :rtype: SpecificEnergy
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return SpecificEnergy._from_exact(value, from_unit)
+
+    def to_exact(self, unit: SpecificEnergyUnits = SpecificEnergyUnits.JoulePerKilogram) -> Fraction:
+        """
+        Get the exact value of the SpecificEnergy in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (JoulePerKilogram).
+        :type unit: SpecificEnergyUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> SpecificEnergy:
+        """
+        Parse a SpecificEnergy from a value followed by a unit abbreviation, e.g. "1 J/kg".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of SpecificEnergy.
+        :rtype: SpecificEnergy
+        :raises ValueError: When the string is not a valid or an ambiguous SpecificEnergy.
+        """
+        return SpecificEnergy._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[SpecificEnergy]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return SpecificEnergy._try_parse(text)
+
+    def to_binary(self, unit: Optional[SpecificEnergyUnits] = None) -> bytes:
+        """
+        Encode the SpecificEnergy to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: SpecificEnergyUnits
+        :return: The encoded SpecificEnergy.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> SpecificEnergy:
+        """
+        Decode a SpecificEnergy encoded by to_binary.
+
+        :param data: The encoded SpecificEnergy, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of SpecificEnergy.
+        :rtype: SpecificEnergy
+        :raises ValueError: When the data is not a valid encoded SpecificEnergy.
+        """
+        return SpecificEnergy._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[SpecificEnergyUnits] = None) -> dict:
+        """
+        Get the SpecificEnergy DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (JoulePerKilogram).
+        :type hold_in_unit: SpecificEnergyUnits
+        :return: The SpecificEnergy DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[SpecificEnergyUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> SpecificEnergy:
+        """
+        Create a new instance of SpecificEnergy from its DTO.
+
+        :param dto: The SpecificEnergy DTO, the unit is the SpecificEnergyUnits value or name.
+        :type dto: dict
+        :return: A new instance of SpecificEnergy.
+        :rtype: SpecificEnergy
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return SpecificEnergy._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> SpecificEnergy:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return SpecificEnergy._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -889,10 +1227,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__joules_per_kilogram != None:
-            return self.__joules_per_kilogram
-        self.__joules_per_kilogram = self.__convert_from_base(SpecificEnergyUnits.JoulePerKilogram)
-        return self.__joules_per_kilogram
+        return self._cached_convert(SpecificEnergyUnits.JoulePerKilogram)
 
     
     @property
@@ -900,10 +1235,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__mega_joules_per_tonne != None:
-            return self.__mega_joules_per_tonne
-        self.__mega_joules_per_tonne = self.__convert_from_base(SpecificEnergyUnits.MegaJoulePerTonne)
-        return self.__mega_joules_per_tonne
+        return self._cached_convert(SpecificEnergyUnits.MegaJoulePerTonne)
 
     
     @property
@@ -911,10 +1243,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__calories_per_gram != None:
-            return self.__calories_per_gram
-        self.__calories_per_gram = self.__convert_from_base(SpecificEnergyUnits.CaloriePerGram)
-        return self.__calories_per_gram
+        return self._cached_convert(SpecificEnergyUnits.CaloriePerGram)
 
     
     @property
@@ -922,10 +1251,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__watt_hours_per_kilogram != None:
-            return self.__watt_hours_per_kilogram
-        self.__watt_hours_per_kilogram = self.__convert_from_base(SpecificEnergyUnits.WattHourPerKilogram)
-        return self.__watt_hours_per_kilogram
+        return self._cached_convert(SpecificEnergyUnits.WattHourPerKilogram)
 
     
     @property
@@ -933,10 +1259,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__watt_days_per_kilogram != None:
-            return self.__watt_days_per_kilogram
-        self.__watt_days_per_kilogram = self.__convert_from_base(SpecificEnergyUnits.WattDayPerKilogram)
-        return self.__watt_days_per_kilogram
+        return self._cached_convert(SpecificEnergyUnits.WattDayPerKilogram)
 
     
     @property
@@ -944,10 +1267,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__watt_days_per_tonne != None:
-            return self.__watt_days_per_tonne
-        self.__watt_days_per_tonne = self.__convert_from_base(SpecificEnergyUnits.WattDayPerTonne)
-        return self.__watt_days_per_tonne
+        return self._cached_convert(SpecificEnergyUnits.WattDayPerTonne)
 
     
     @property
@@ -955,10 +1275,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__watt_days_per_short_ton != None:
-            return self.__watt_days_per_short_ton
-        self.__watt_days_per_short_ton = self.__convert_from_base(SpecificEnergyUnits.WattDayPerShortTon)
-        return self.__watt_days_per_short_ton
+        return self._cached_convert(SpecificEnergyUnits.WattDayPerShortTon)
 
     
     @property
@@ -966,10 +1283,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__watt_hours_per_pound != None:
-            return self.__watt_hours_per_pound
-        self.__watt_hours_per_pound = self.__convert_from_base(SpecificEnergyUnits.WattHourPerPound)
-        return self.__watt_hours_per_pound
+        return self._cached_convert(SpecificEnergyUnits.WattHourPerPound)
 
     
     @property
@@ -977,10 +1291,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__btu_per_pound != None:
-            return self.__btu_per_pound
-        self.__btu_per_pound = self.__convert_from_base(SpecificEnergyUnits.BtuPerPound)
-        return self.__btu_per_pound
+        return self._cached_convert(SpecificEnergyUnits.BtuPerPound)
 
     
     @property
@@ -988,10 +1299,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__kilojoules_per_kilogram != None:
-            return self.__kilojoules_per_kilogram
-        self.__kilojoules_per_kilogram = self.__convert_from_base(SpecificEnergyUnits.KilojoulePerKilogram)
-        return self.__kilojoules_per_kilogram
+        return self._cached_convert(SpecificEnergyUnits.KilojoulePerKilogram)
 
     
     @property
@@ -999,10 +1307,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__megajoules_per_kilogram != None:
-            return self.__megajoules_per_kilogram
-        self.__megajoules_per_kilogram = self.__convert_from_base(SpecificEnergyUnits.MegajoulePerKilogram)
-        return self.__megajoules_per_kilogram
+        return self._cached_convert(SpecificEnergyUnits.MegajoulePerKilogram)
 
     
     @property
@@ -1010,10 +1315,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__kilocalories_per_gram != None:
-            return self.__kilocalories_per_gram
-        self.__kilocalories_per_gram = self.__convert_from_base(SpecificEnergyUnits.KilocaloriePerGram)
-        return self.__kilocalories_per_gram
+        return self._cached_convert(SpecificEnergyUnits.KilocaloriePerGram)
 
     
     @property
@@ -1021,10 +1323,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__kilowatt_hours_per_kilogram != None:
-            return self.__kilowatt_hours_per_kilogram
-        self.__kilowatt_hours_per_kilogram = self.__convert_from_base(SpecificEnergyUnits.KilowattHourPerKilogram)
-        return self.__kilowatt_hours_per_kilogram
+        return self._cached_convert(SpecificEnergyUnits.KilowattHourPerKilogram)
 
     
     @property
@@ -1032,10 +1331,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__megawatt_hours_per_kilogram != None:
-            return self.__megawatt_hours_per_kilogram
-        self.__megawatt_hours_per_kilogram = self.__convert_from_base(SpecificEnergyUnits.MegawattHourPerKilogram)
-        return self.__megawatt_hours_per_kilogram
+        return self._cached_convert(SpecificEnergyUnits.MegawattHourPerKilogram)
 
     
     @property
@@ -1043,10 +1339,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__gigawatt_hours_per_kilogram != None:
-            return self.__gigawatt_hours_per_kilogram
-        self.__gigawatt_hours_per_kilogram = self.__convert_from_base(SpecificEnergyUnits.GigawattHourPerKilogram)
-        return self.__gigawatt_hours_per_kilogram
+        return self._cached_convert(SpecificEnergyUnits.GigawattHourPerKilogram)
 
     
     @property
@@ -1054,10 +1347,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__kilowatt_days_per_kilogram != None:
-            return self.__kilowatt_days_per_kilogram
-        self.__kilowatt_days_per_kilogram = self.__convert_from_base(SpecificEnergyUnits.KilowattDayPerKilogram)
-        return self.__kilowatt_days_per_kilogram
+        return self._cached_convert(SpecificEnergyUnits.KilowattDayPerKilogram)
 
     
     @property
@@ -1065,10 +1355,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__megawatt_days_per_kilogram != None:
-            return self.__megawatt_days_per_kilogram
-        self.__megawatt_days_per_kilogram = self.__convert_from_base(SpecificEnergyUnits.MegawattDayPerKilogram)
-        return self.__megawatt_days_per_kilogram
+        return self._cached_convert(SpecificEnergyUnits.MegawattDayPerKilogram)
 
     
     @property
@@ -1076,10 +1363,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__gigawatt_days_per_kilogram != None:
-            return self.__gigawatt_days_per_kilogram
-        self.__gigawatt_days_per_kilogram = self.__convert_from_base(SpecificEnergyUnits.GigawattDayPerKilogram)
-        return self.__gigawatt_days_per_kilogram
+        return self._cached_convert(SpecificEnergyUnits.GigawattDayPerKilogram)
 
     
     @property
@@ -1087,10 +1371,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__terawatt_days_per_kilogram != None:
-            return self.__terawatt_days_per_kilogram
-        self.__terawatt_days_per_kilogram = self.__convert_from_base(SpecificEnergyUnits.TerawattDayPerKilogram)
-        return self.__terawatt_days_per_kilogram
+        return self._cached_convert(SpecificEnergyUnits.TerawattDayPerKilogram)
 
     
     @property
@@ -1098,10 +1379,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__kilowatt_days_per_tonne != None:
-            return self.__kilowatt_days_per_tonne
-        self.__kilowatt_days_per_tonne = self.__convert_from_base(SpecificEnergyUnits.KilowattDayPerTonne)
-        return self.__kilowatt_days_per_tonne
+        return self._cached_convert(SpecificEnergyUnits.KilowattDayPerTonne)
 
     
     @property
@@ -1109,10 +1387,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__megawatt_days_per_tonne != None:
-            return self.__megawatt_days_per_tonne
-        self.__megawatt_days_per_tonne = self.__convert_from_base(SpecificEnergyUnits.MegawattDayPerTonne)
-        return self.__megawatt_days_per_tonne
+        return self._cached_convert(SpecificEnergyUnits.MegawattDayPerTonne)
 
     
     @property
@@ -1120,10 +1395,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__gigawatt_days_per_tonne != None:
-            return self.__gigawatt_days_per_tonne
-        self.__gigawatt_days_per_tonne = self.__convert_from_base(SpecificEnergyUnits.GigawattDayPerTonne)
-        return self.__gigawatt_days_per_tonne
+        return self._cached_convert(SpecificEnergyUnits.GigawattDayPerTonne)
 
     
     @property
@@ -1131,10 +1403,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__terawatt_days_per_tonne != None:
-            return self.__terawatt_days_per_tonne
-        self.__terawatt_days_per_tonne = self.__convert_from_base(SpecificEnergyUnits.TerawattDayPerTonne)
-        return self.__terawatt_days_per_tonne
+        return self._cached_convert(SpecificEnergyUnits.TerawattDayPerTonne)
 
     
     @property
@@ -1142,10 +1411,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__kilowatt_days_per_short_ton != None:
-            return self.__kilowatt_days_per_short_ton
-        self.__kilowatt_days_per_short_ton = self.__convert_from_base(SpecificEnergyUnits.KilowattDayPerShortTon)
-        return self.__kilowatt_days_per_short_ton
+        return self._cached_convert(SpecificEnergyUnits.KilowattDayPerShortTon)
 
     
     @property
@@ -1153,10 +1419,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__megawatt_days_per_short_ton != None:
-            return self.__megawatt_days_per_short_ton
-        self.__megawatt_days_per_short_ton = self.__convert_from_base(SpecificEnergyUnits.MegawattDayPerShortTon)
-        return self.__megawatt_days_per_short_ton
+        return self._cached_convert(SpecificEnergyUnits.MegawattDayPerShortTon)
 
     
     @property
@@ -1164,10 +1427,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__gigawatt_days_per_short_ton != None:
-            return self.__gigawatt_days_per_short_ton
-        self.__gigawatt_days_per_short_ton = self.__convert_from_base(SpecificEnergyUnits.GigawattDayPerShortTon)
-        return self.__gigawatt_days_per_short_ton
+        return self._cached_convert(SpecificEnergyUnits.GigawattDayPerShortTon)
 
     
     @property
@@ -1175,10 +1435,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__terawatt_days_per_short_ton != None:
-            return self.__terawatt_days_per_short_ton
-        self.__terawatt_days_per_short_ton = self.__convert_from_base(SpecificEnergyUnits.TerawattDayPerShortTon)
-        return self.__terawatt_days_per_short_ton
+        return self._cached_convert(SpecificEnergyUnits.TerawattDayPerShortTon)
 
     
     @property
@@ -1186,10 +1443,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__kilowatt_hours_per_pound != None:
-            return self.__kilowatt_hours_per_pound
-        self.__kilowatt_hours_per_pound = self.__convert_from_base(SpecificEnergyUnits.KilowattHourPerPound)
-        return self.__kilowatt_hours_per_pound
+        return self._cached_convert(SpecificEnergyUnits.KilowattHourPerPound)
 
     
     @property
@@ -1197,10 +1451,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__megawatt_hours_per_pound != None:
-            return self.__megawatt_hours_per_pound
-        self.__megawatt_hours_per_pound = self.__convert_from_base(SpecificEnergyUnits.MegawattHourPerPound)
-        return self.__megawatt_hours_per_pound
+        return self._cached_convert(SpecificEnergyUnits.MegawattHourPerPound)
 
     
     @property
@@ -1208,10 +1459,7 @@ class SpecificEnergy(AbstractMeasure):
         """
         
         """
-        if self.__gigawatt_hours_per_pound != None:
-            return self.__gigawatt_hours_per_pound
-        self.__gigawatt_hours_per_pound = self.__convert_from_base(SpecificEnergyUnits.GigawattHourPerPound)
-        return self.__gigawatt_hours_per_pound
+        return self._cached_convert(SpecificEnergyUnits.GigawattHourPerPound)
 
     
     def to_string(self, unit: SpecificEnergyUnits = SpecificEnergyUnits.JoulePerKilogram) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class SpecificEntropyUnits(Enum):
         """
             SpecificEntropyUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         JoulePerKilogramKelvin = 'joule_per_kilogram_kelvin'
         """
@@ -64,97 +75,340 @@ class SpecificEntropy(AbstractMeasure):
         value (float): The value.
         from_unit (SpecificEntropyUnits): The SpecificEntropy unit to create from, The default unit is JoulePerKilogramKelvin
     """
-    def __init__(self, value: float, from_unit: SpecificEntropyUnits = SpecificEntropyUnits.JoulePerKilogramKelvin):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = SpecificEntropyUnits
+
+    _base_unit = SpecificEntropyUnits.JoulePerKilogramKelvin
+
+    _dimensions = (2, 0, -2, 0, -1, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 97
+
+    _binary_unit_ids = {
         
-        self.__joules_per_kilogram_kelvin = None
+        SpecificEntropyUnits.JoulePerKilogramKelvin: 0,
         
-        self.__joules_per_kilogram_degree_celsius = None
+        SpecificEntropyUnits.JoulePerKilogramDegreeCelsius: 1,
         
-        self.__calories_per_gram_kelvin = None
+        SpecificEntropyUnits.CaloriePerGramKelvin: 2,
         
-        self.__btus_per_pound_fahrenheit = None
+        SpecificEntropyUnits.BtuPerPoundFahrenheit: 3,
         
-        self.__kilojoules_per_kilogram_kelvin = None
+        SpecificEntropyUnits.KilojoulePerKilogramKelvin: 4,
         
-        self.__megajoules_per_kilogram_kelvin = None
+        SpecificEntropyUnits.MegajoulePerKilogramKelvin: 5,
         
-        self.__kilojoules_per_kilogram_degree_celsius = None
+        SpecificEntropyUnits.KilojoulePerKilogramDegreeCelsius: 6,
         
-        self.__megajoules_per_kilogram_degree_celsius = None
+        SpecificEntropyUnits.MegajoulePerKilogramDegreeCelsius: 7,
         
-        self.__kilocalories_per_gram_kelvin = None
+        SpecificEntropyUnits.KilocaloriePerGramKelvin: 8,
         
+    }
 
-    def convert(self, unit: SpecificEntropyUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        SpecificEntropyUnits.JoulePerKilogramKelvin: lambda value: (value),
+        
+        SpecificEntropyUnits.JoulePerKilogramDegreeCelsius: lambda value: (value),
+        
+        SpecificEntropyUnits.CaloriePerGramKelvin: lambda value: (value / 4.184e3),
+        
+        SpecificEntropyUnits.BtuPerPoundFahrenheit: lambda value: (value / 4.1868e3),
+        
+        SpecificEntropyUnits.KilojoulePerKilogramKelvin: lambda value: ((value) / 1000.0),
+        
+        SpecificEntropyUnits.MegajoulePerKilogramKelvin: lambda value: ((value) / 1000000.0),
+        
+        SpecificEntropyUnits.KilojoulePerKilogramDegreeCelsius: lambda value: ((value) / 1000.0),
+        
+        SpecificEntropyUnits.MegajoulePerKilogramDegreeCelsius: lambda value: ((value) / 1000000.0),
+        
+        SpecificEntropyUnits.KilocaloriePerGramKelvin: lambda value: ((value / 4.184e3) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: SpecificEntropyUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        SpecificEntropyUnits.JoulePerKilogramKelvin: lambda value: (value),
+        
+        SpecificEntropyUnits.JoulePerKilogramDegreeCelsius: lambda value: (value),
+        
+        SpecificEntropyUnits.CaloriePerGramKelvin: lambda value: (value * 4.184e3),
+        
+        SpecificEntropyUnits.BtuPerPoundFahrenheit: lambda value: (value * 4.1868e3),
+        
+        SpecificEntropyUnits.KilojoulePerKilogramKelvin: lambda value: ((value) * 1000.0),
+        
+        SpecificEntropyUnits.MegajoulePerKilogramKelvin: lambda value: ((value) * 1000000.0),
         
-        if from_unit == SpecificEntropyUnits.JoulePerKilogramKelvin:
-            return (value)
+        SpecificEntropyUnits.KilojoulePerKilogramDegreeCelsius: lambda value: ((value) * 1000.0),
         
-        if from_unit == SpecificEntropyUnits.JoulePerKilogramDegreeCelsius:
-            return (value)
+        SpecificEntropyUnits.MegajoulePerKilogramDegreeCelsius: lambda value: ((value) * 1000000.0),
         
-        if from_unit == SpecificEntropyUnits.CaloriePerGramKelvin:
-            return (value / 4.184e3)
+        SpecificEntropyUnits.KilocaloriePerGramKelvin: lambda value: ((value * 4.184e3) * 1000.0),
         
-        if from_unit == SpecificEntropyUnits.BtuPerPoundFahrenheit:
-            return (value / 4.1868e3)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        SpecificEntropyUnits.JoulePerKilogramKelvin: ('1', '0'),
+        
+        SpecificEntropyUnits.JoulePerKilogramDegreeCelsius: ('1', '0'),
+        
+        SpecificEntropyUnits.CaloriePerGramKelvin: ('1/4184', '0'),
+        
+        SpecificEntropyUnits.BtuPerPoundFahrenheit: ('5/20934', '0'),
         
-        if from_unit == SpecificEntropyUnits.KilojoulePerKilogramKelvin:
-            return ((value) / 1000.0)
+        SpecificEntropyUnits.KilojoulePerKilogramKelvin: ('1/1000', '0'),
         
-        if from_unit == SpecificEntropyUnits.MegajoulePerKilogramKelvin:
-            return ((value) / 1000000.0)
+        SpecificEntropyUnits.MegajoulePerKilogramKelvin: ('1/1000000', '0'),
         
-        if from_unit == SpecificEntropyUnits.KilojoulePerKilogramDegreeCelsius:
-            return ((value) / 1000.0)
+        SpecificEntropyUnits.KilojoulePerKilogramDegreeCelsius: ('1/1000', '0'),
         
-        if from_unit == SpecificEntropyUnits.MegajoulePerKilogramDegreeCelsius:
-            return ((value) / 1000000.0)
+        SpecificEntropyUnits.MegajoulePerKilogramDegreeCelsius: ('1/1000000', '0'),
         
-        if from_unit == SpecificEntropyUnits.KilocaloriePerGramKelvin:
-            return ((value / 4.184e3) / 1000.0)
+        SpecificEntropyUnits.KilocaloriePerGramKelvin: ('1/4184000', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        SpecificEntropyUnits.JoulePerKilogramKelvin: ('1', '0'),
+        
+        SpecificEntropyUnits.JoulePerKilogramDegreeCelsius: ('1', '0'),
+        
+        SpecificEntropyUnits.CaloriePerGramKelvin: ('4184', '0'),
+        
+        SpecificEntropyUnits.BtuPerPoundFahrenheit: ('20934/5', '0'),
+        
+        SpecificEntropyUnits.KilojoulePerKilogramKelvin: ('1000', '0'),
+        
+        SpecificEntropyUnits.MegajoulePerKilogramKelvin: ('1000000', '0'),
+        
+        SpecificEntropyUnits.KilojoulePerKilogramDegreeCelsius: ('1000', '0'),
+        
+        SpecificEntropyUnits.MegajoulePerKilogramDegreeCelsius: ('1000000', '0'),
+        
+        SpecificEntropyUnits.KilocaloriePerGramKelvin: ('4184000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: SpecificEntropyUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == SpecificEntropyUnits.JoulePerKilogramKelvin:
-            return (value)
+        SpecificEntropyUnits.JoulePerKilogramKelvin: ('J/kg.K',),
         
-        if to_unit == SpecificEntropyUnits.JoulePerKilogramDegreeCelsius:
-            return (value)
+        SpecificEntropyUnits.JoulePerKilogramDegreeCelsius: ('J/kg.C',),
         
-        if to_unit == SpecificEntropyUnits.CaloriePerGramKelvin:
-            return (value * 4.184e3)
+        SpecificEntropyUnits.CaloriePerGramKelvin: ('cal/g.K',),
         
-        if to_unit == SpecificEntropyUnits.BtuPerPoundFahrenheit:
-            return (value * 4.1868e3)
+        SpecificEntropyUnits.BtuPerPoundFahrenheit: ('BTU/lb·°F',),
         
-        if to_unit == SpecificEntropyUnits.KilojoulePerKilogramKelvin:
-            return ((value) * 1000.0)
+        SpecificEntropyUnits.KilojoulePerKilogramKelvin: ('kJ/kg.K',),
         
-        if to_unit == SpecificEntropyUnits.MegajoulePerKilogramKelvin:
-            return ((value) * 1000000.0)
+        SpecificEntropyUnits.MegajoulePerKilogramKelvin: ('MJ/kg.K',),
         
-        if to_unit == SpecificEntropyUnits.KilojoulePerKilogramDegreeCelsius:
-            return ((value) * 1000.0)
+        SpecificEntropyUnits.KilojoulePerKilogramDegreeCelsius: ('kJ/kg.C',),
         
-        if to_unit == SpecificEntropyUnits.MegajoulePerKilogramDegreeCelsius:
-            return ((value) * 1000000.0)
+        SpecificEntropyUnits.MegajoulePerKilogramDegreeCelsius: ('MJ/kg.C',),
         
-        if to_unit == SpecificEntropyUnits.KilocaloriePerGramKelvin:
-            return ((value * 4.184e3) * 1000.0)
+        SpecificEntropyUnits.KilocaloriePerGramKelvin: ('kcal/g.K',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: SpecificEntropyUnits = SpecificEntropyUnits.JoulePerKilogramKelvin):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: SpecificEntropyUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: SpecificEntropyUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: SpecificEntropyUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: SpecificEntropyUnits, to_unit: SpecificEntropyUnits) -> float:
+        """
+        Convert a value from one SpecificEntropy unit to another, without creating a SpecificEntropy instance.
 
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificEntropyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: SpecificEntropyUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return SpecificEntropy._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: SpecificEntropyUnits, to_unit: SpecificEntropyUnits) -> List[float]:
+        """
+        Convert many values from one SpecificEntropy unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: SpecificEntropyUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: SpecificEntropyUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return SpecificEntropy._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: SpecificEntropyUnits, to_unit: SpecificEntropyUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", SpecificEntropy._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: SpecificEntropyUnits, to_unit: SpecificEntropyUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one SpecificEntropy unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificEntropyUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: SpecificEntropyUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return SpecificEntropy._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: SpecificEntropyUnits = SpecificEntropyUnits.JoulePerKilogramKelvin) -> SpecificEntropy:
+        """
+        Create a new instance of SpecificEntropy holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificEntropyUnits
+        :return: A new instance of SpecificEntropy.
+        :rtype: SpecificEntropy
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return SpecificEntropy._from_exact(value, from_unit)
+
+    def to_exact(self, unit: SpecificEntropyUnits = SpecificEntropyUnits.JoulePerKilogramKelvin) -> Fraction:
+        """
+        Get the exact value of the SpecificEntropy in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (JoulePerKilogramKelvin).
+        :type unit: SpecificEntropyUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> SpecificEntropy:
+        """
+        Parse a SpecificEntropy from a value followed by a unit abbreviation, e.g. "1 J/kg.K".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of SpecificEntropy.
+        :rtype: SpecificEntropy
+        :raises ValueError: When the string is not a valid or an ambiguous SpecificEntropy.
+        """
+        return SpecificEntropy._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[SpecificEntropy]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return SpecificEntropy._try_parse(text)
+
+    def to_binary(self, unit: Optional[SpecificEntropyUnits] = None) -> bytes:
+        """
+        Encode the SpecificEntropy to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: SpecificEntropyUnits
+        :return: The encoded SpecificEntropy.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> SpecificEntropy:
+        """
+        Decode a SpecificEntropy encoded by to_binary.
+
+        :param data: The encoded SpecificEntropy, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of SpecificEntropy.
+        :rtype: SpecificEntropy
+        :raises ValueError: When the data is not a valid encoded SpecificEntropy.
+        """
+        return SpecificEntropy._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[SpecificEntropyUnits] = None) -> dict:
+        """
+        Get the SpecificEntropy DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (JoulePerKilogramKelvin).
+        :type hold_in_unit: SpecificEntropyUnits
+        :return: The SpecificEntropy DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[SpecificEntropyUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> SpecificEntropy:
+        """
+        Create a new instance of SpecificEntropy from its DTO.
+
+        :param dto: The SpecificEntropy DTO, the unit is the SpecificEntropyUnits value or name.
+        :type dto: dict
+        :return: A new instance of SpecificEntropy.
+        :rtype: SpecificEntropy
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return SpecificEntropy._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> SpecificEntropy:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return SpecificEntropy._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -301,10 +555,7 @@ class SpecificEntropy(AbstractMeasure):
         """
         
         """
-        if self.__joules_per_kilogram_kelvin != None:
-            return self.__joules_per_kilogram_kelvin
-        self.__joules_per_kilogram_kelvin = self.__convert_from_base(SpecificEntropyUnits.JoulePerKilogramKelvin)
-        return self.__joules_per_kilogram_kelvin
+        return self._cached_convert(SpecificEntropyUnits.JoulePerKilogramKelvin)
 
     
     @property
@@ -312,10 +563,7 @@ class SpecificEntropy(AbstractMeasure):
         """
         
         """
-        if self.__joules_per_kilogram_degree_celsius != None:
-            return self.__joules_per_kilogram_degree_celsius
-        self.__joules_per_kilogram_degree_celsius = self.__convert_from_base(SpecificEntropyUnits.JoulePerKilogramDegreeCelsius)
-        return self.__joules_per_kilogram_degree_celsius
+        return self._cached_convert(SpecificEntropyUnits.JoulePerKilogramDegreeCelsius)
 
     
     @property
@@ -323,10 +571,7 @@ class SpecificEntropy(AbstractMeasure):
         """
         
         """
-        if self.__calories_per_gram_kelvin != None:
-            return self.__calories_per_gram_kelvin
-        self.__calories_per_gram_kelvin = self.__convert_from_base(SpecificEntropyUnits.CaloriePerGramKelvin)
-        return self.__calories_per_gram_kelvin
+        return self._cached_convert(SpecificEntropyUnits.CaloriePerGramKelvin)
 
     
     @property
@@ -334,10 +579,7 @@ class SpecificEntropy(AbstractMeasure):
         """
         
         """
-        if self.__btus_per_pound_fahrenheit != None:
-            return self.__btus_per_pound_fahrenheit
-        self.__btus_per_pound_fahrenheit = self.__convert_from_base(SpecificEntropyUnits.BtuPerPoundFahrenheit)
-        return self.__btus_per_pound_fahrenheit
+        return self._cached_convert(SpecificEntropyUnits.BtuPerPoundFahrenheit)
 
     
     @property
@@ -345,10 +587,7 @@ class SpecificEntropy(AbstractMeasure):
         """
         
         """
-        if self.__kilojoules_per_kilogram_kelvin != None:
-            return self.__kilojoules_per_kilogram_kelvin
-        self.__kilojoules_per_kilogram_kelvin = self.__convert_from_base(SpecificEntropyUnits.KilojoulePerKilogramKelvin)
-        return self.__kilojoules_per_kilogram_kelvin
+        return self._cached_convert(SpecificEntropyUnits.KilojoulePerKilogramKelvin)
 
     
     @property
@@ -356,10 +595,7 @@ class SpecificEntropy(AbstractMeasure):
         """
         
         """
-        if self.__megajoules_per_kilogram_kelvin != None:
-            return self.__megajoules_per_kilogram_kelvin
-        self.__megajoules_per_kilogram_kelvin = self.__convert_from_base(SpecificEntropyUnits.MegajoulePerKilogramKelvin)
-        return self.__megajoules_per_kilogram_kelvin
+        return self._cached_convert(SpecificEntropyUnits.MegajoulePerKilogramKelvin)
 
     
     @property
@@ -367,10 +603,7 @@ class SpecificEntropy(AbstractMeasure):
         """
         
         """
-        if self.__kilojoules_per_kilogram_degree_celsius != None:
-            return self.__kilojoules_per_kilogram_degree_celsius
-        self.__kilojoules_per_kilogram_degree_celsius = self.__convert_from_base(SpecificEntropyUnits.KilojoulePerKilogramDegreeCelsius)
-        return self.__kilojoules_per_kilogram_degree_celsius
+        return self._cached_convert(SpecificEntropyUnits.KilojoulePerKilogramDegreeCelsius)
 
     
     @property
@@ -378,10 +611,7 @@ class SpecificEntropy(AbstractMeasure):
         """
         
         """
-        if self.__megajoules_per_kilogram_degree_celsius != None:
-            return self.__megajoules_per_kilogram_degree_celsius
-        self.__megajoules_per_kilogram_degree_celsius = self.__convert_from_base(SpecificEntropyUnits.MegajoulePerKilogramDegreeCelsius)
-        return self.__megajoules_per_kilogram_degree_celsius
+        return self._cached_convert(SpecificEntropyUnits.MegajoulePerKilogramDegreeCelsius)
 
     
     @property
@@ -389,10 +619,7 @@ class SpecificEntropy(AbstractMeasure):
         """
         
         """
-        if self.__kilocalories_per_gram_kelvin != None:
-            return self.__kilocalories_per_gram_kelvin
-        self.__kilocalories_per_gram_kelvin = self.__convert_from_base(SpecificEntropyUnits.KilocaloriePerGramKelvin)
-        return self.__kilocalories_per_gram_kelvin
+        return self._cached_convert(SpecificEntropyUnits.KilocaloriePerGramKelvin)
 
     
     def to_string(self, unit: SpecificEntropyUnits = SpecificEntropyUnits.JoulePerKilogramKelvin) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class SpecificFuelConsumptionUnits(Enum):
         """
             SpecificFuelConsumptionUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         PoundMassPerPoundForceHour = 'pound_mass_per_pound_force_hour'
         """
@@ -39,57 +50,280 @@ class SpecificFuelConsumption(AbstractMeasure):
         value (float): The value.
         from_unit (SpecificFuelConsumptionUnits): The SpecificFuelConsumption unit to create from, The default unit is GramPerKiloNewtonSecond
     """
-    def __init__(self, value: float, from_unit: SpecificFuelConsumptionUnits = SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = SpecificFuelConsumptionUnits
+
+    _base_unit = SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 98
+
+    _binary_unit_ids = {
         
-        self.__pounds_mass_per_pound_force_hour = None
+        SpecificFuelConsumptionUnits.PoundMassPerPoundForceHour: 0,
         
-        self.__kilograms_per_kilogram_force_hour = None
+        SpecificFuelConsumptionUnits.KilogramPerKilogramForceHour: 1,
         
-        self.__grams_per_kilo_newton_second = None
+        SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond: 2,
         
-        self.__kilograms_per_kilo_newton_second = None
+        SpecificFuelConsumptionUnits.KilogramPerKiloNewtonSecond: 3,
         
+    }
 
-    def convert(self, unit: SpecificFuelConsumptionUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        SpecificFuelConsumptionUnits.PoundMassPerPoundForceHour: lambda value: (value / 28.33),
+        
+        SpecificFuelConsumptionUnits.KilogramPerKilogramForceHour: lambda value: (value / 28.33),
+        
+        SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond: lambda value: (value),
+        
+        SpecificFuelConsumptionUnits.KilogramPerKiloNewtonSecond: lambda value: ((value) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: SpecificFuelConsumptionUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == SpecificFuelConsumptionUnits.PoundMassPerPoundForceHour:
-            return (value / 28.33)
+        SpecificFuelConsumptionUnits.PoundMassPerPoundForceHour: lambda value: (value * 28.33),
         
-        if from_unit == SpecificFuelConsumptionUnits.KilogramPerKilogramForceHour:
-            return (value / 28.33)
+        SpecificFuelConsumptionUnits.KilogramPerKilogramForceHour: lambda value: (value * 28.33),
         
-        if from_unit == SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond:
-            return (value)
+        SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond: lambda value: (value),
         
-        if from_unit == SpecificFuelConsumptionUnits.KilogramPerKiloNewtonSecond:
-            return ((value) / 1000.0)
+        SpecificFuelConsumptionUnits.KilogramPerKiloNewtonSecond: lambda value: ((value) * 1000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        SpecificFuelConsumptionUnits.PoundMassPerPoundForceHour: ('100/2833', '0'),
+        
+        SpecificFuelConsumptionUnits.KilogramPerKilogramForceHour: ('100/2833', '0'),
+        
+        SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond: ('1', '0'),
+        
+        SpecificFuelConsumptionUnits.KilogramPerKiloNewtonSecond: ('1/1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: SpecificFuelConsumptionUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == SpecificFuelConsumptionUnits.PoundMassPerPoundForceHour:
-            return (value * 28.33)
+        SpecificFuelConsumptionUnits.PoundMassPerPoundForceHour: ('2833/100', '0'),
         
-        if to_unit == SpecificFuelConsumptionUnits.KilogramPerKilogramForceHour:
-            return (value * 28.33)
+        SpecificFuelConsumptionUnits.KilogramPerKilogramForceHour: ('2833/100', '0'),
         
-        if to_unit == SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond:
-            return (value)
+        SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond: ('1', '0'),
         
-        if to_unit == SpecificFuelConsumptionUnits.KilogramPerKiloNewtonSecond:
-            return ((value) * 1000.0)
+        SpecificFuelConsumptionUnits.KilogramPerKiloNewtonSecond: ('1000', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        SpecificFuelConsumptionUnits.PoundMassPerPoundForceHour: ('lb/(lbf·h)',),
+        
+        SpecificFuelConsumptionUnits.KilogramPerKilogramForceHour: ('kg/(kgf�h)',),
+        
+        SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond: ('g/(kN�s)',),
+        
+        SpecificFuelConsumptionUnits.KilogramPerKiloNewtonSecond: ('kg/(kN�s)',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: SpecificFuelConsumptionUnits = SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: SpecificFuelConsumptionUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: SpecificFuelConsumptionUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: SpecificFuelConsumptionUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: SpecificFuelConsumptionUnits, to_unit: SpecificFuelConsumptionUnits) -> float:
+        """
+        Convert a value from one SpecificFuelConsumption unit to another, without creating a SpecificFuelConsumption instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificFuelConsumptionUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: SpecificFuelConsumptionUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return SpecificFuelConsumption._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: SpecificFuelConsumptionUnits, to_unit: SpecificFuelConsumptionUnits) -> List[float]:
+        """
+        Convert many values from one SpecificFuelConsumption unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: SpecificFuelConsumptionUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: SpecificFuelConsumptionUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return SpecificFuelConsumption._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: SpecificFuelConsumptionUnits, to_unit: SpecificFuelConsumptionUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", SpecificFuelConsumption._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: SpecificFuelConsumptionUnits, to_unit: SpecificFuelConsumptionUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one SpecificFuelConsumption unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificFuelConsumptionUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: SpecificFuelConsumptionUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return SpecificFuelConsumption._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: SpecificFuelConsumptionUnits = SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond) -> SpecificFuelConsumption:
+        """
+        Create a new instance of SpecificFuelConsumption holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificFuelConsumptionUnits
+        :return: A new instance of SpecificFuelConsumption.
+        :rtype: SpecificFuelConsumption
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return SpecificFuelConsumption._from_exact(value, from_unit)
+
+    def to_exact(self, unit: SpecificFuelConsumptionUnits = SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond) -> Fraction:
+        """
+        Get the exact value of the SpecificFuelConsumption in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (GramPerKiloNewtonSecond).
+        :type unit: SpecificFuelConsumptionUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> SpecificFuelConsumption:
+        """
+        Parse a SpecificFuelConsumption from a value followed by a unit abbreviation, e.g. "1 lb/(lbf·h)".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of SpecificFuelConsumption.
+        :rtype: SpecificFuelConsumption
+        :raises ValueError: When the string is not a valid or an ambiguous SpecificFuelConsumption.
+        """
+        return SpecificFuelConsumption._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[SpecificFuelConsumption]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return SpecificFuelConsumption._try_parse(text)
+
+    def to_binary(self, unit: Optional[SpecificFuelConsumptionUnits] = None) -> bytes:
+        """
+        Encode the SpecificFuelConsumption to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: SpecificFuelConsumptionUnits
+        :return: The encoded SpecificFuelConsumption.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> SpecificFuelConsumption:
+        """
+        Decode a SpecificFuelConsumption encoded by to_binary.
+
+        :param data: The encoded SpecificFuelConsumption, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of SpecificFuelConsumption.
+        :rtype: SpecificFuelConsumption
+        :raises ValueError: When the data is not a valid encoded SpecificFuelConsumption.
+        """
+        return SpecificFuelConsumption._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[SpecificFuelConsumptionUnits] = None) -> dict:
+        """
+        Get the SpecificFuelConsumption DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (GramPerKiloNewtonSecond).
+        :type hold_in_unit: SpecificFuelConsumptionUnits
+        :return: The SpecificFuelConsumption DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[SpecificFuelConsumptionUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> SpecificFuelConsumption:
+        """
+        Create a new instance of SpecificFuelConsumption from its DTO.
+
+        :param dto: The SpecificFuelConsumption DTO, the unit is the SpecificFuelConsumptionUnits value or name.
+        :type dto: dict
+        :return: A new instance of SpecificFuelConsumption.
+        :rtype: SpecificFuelConsumption
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return SpecificFuelConsumption._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> SpecificFuelConsumption:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return SpecificFuelConsumption._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -161,10 +395,7 @@ class SpecificFuelConsumption(AbstractMeasure):
         """
         
         """
-        if self.__pounds_mass_per_pound_force_hour != None:
-            return self.__pounds_mass_per_pound_force_hour
-        self.__pounds_mass_per_pound_force_hour = self.__convert_from_base(SpecificFuelConsumptionUnits.PoundMassPerPoundForceHour)
-        return self.__pounds_mass_per_pound_force_hour
+        return self._cached_convert(SpecificFuelConsumptionUnits.PoundMassPerPoundForceHour)
 
     
     @property
@@ -172,10 +403,7 @@ class SpecificFuelConsumption(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_kilogram_force_hour != None:
-            return self.__kilograms_per_kilogram_force_hour
-        self.__kilograms_per_kilogram_force_hour = self.__convert_from_base(SpecificFuelConsumptionUnits.KilogramPerKilogramForceHour)
-        return self.__kilograms_per_kilogram_force_hour
+        return self._cached_convert(SpecificFuelConsumptionUnits.KilogramPerKilogramForceHour)
 
     
     @property
@@ -183,10 +411,7 @@ class SpecificFuelConsumption(AbstractMeasure):
         """
         
         """
-        if self.__grams_per_kilo_newton_second != None:
-            return self.__grams_per_kilo_newton_second
-        self.__grams_per_kilo_newton_second = self.__convert_from_base(SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond)
-        return self.__grams_per_kilo_newton_second
+        return self._cached_convert(SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond)
 
     
     @property
@@ -194,10 +419,7 @@ class SpecificFuelConsumption(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_per_kilo_newton_second != None:
-            return self.__kilograms_per_kilo_newton_second
-        self.__kilograms_per_kilo_newton_second = self.__convert_from_base(SpecificFuelConsumptionUnits.KilogramPerKiloNewtonSecond)
-        return self.__kilograms_per_kilo_newton_second
+        return self._cached_convert(SpecificFuelConsumptionUnits.KilogramPerKiloNewtonSecond)
 
     
     def to_string(self, unit: SpecificFuelConsumptionUnits = SpecificFuelConsumptionUnits.GramPerKiloNewtonSecond) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class SpecificVolumeUnits(Enum):
         """
             SpecificVolumeUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         CubicMeterPerKilogram = 'cubic_meter_per_kilogram'
         """
@@ -34,49 +45,268 @@ class SpecificVolume(AbstractMeasure):
         value (float): The value.
         from_unit (SpecificVolumeUnits): The SpecificVolume unit to create from, The default unit is CubicMeterPerKilogram
     """
-    def __init__(self, value: float, from_unit: SpecificVolumeUnits = SpecificVolumeUnits.CubicMeterPerKilogram):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = SpecificVolumeUnits
+
+    _base_unit = SpecificVolumeUnits.CubicMeterPerKilogram
+
+    _dimensions = (3, -1, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 99
+
+    _binary_unit_ids = {
         
-        self.__cubic_meters_per_kilogram = None
+        SpecificVolumeUnits.CubicMeterPerKilogram: 0,
         
-        self.__cubic_feet_per_pound = None
+        SpecificVolumeUnits.CubicFootPerPound: 1,
         
-        self.__millicubic_meters_per_kilogram = None
+        SpecificVolumeUnits.MillicubicMeterPerKilogram: 2,
         
+    }
 
-    def convert(self, unit: SpecificVolumeUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        SpecificVolumeUnits.CubicMeterPerKilogram: lambda value: (value),
+        
+        SpecificVolumeUnits.CubicFootPerPound: lambda value: (value * 16.01846353),
+        
+        SpecificVolumeUnits.MillicubicMeterPerKilogram: lambda value: ((value) / 0.001),
+        
+    }
 
-    def __convert_from_base(self, from_unit: SpecificVolumeUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == SpecificVolumeUnits.CubicMeterPerKilogram:
-            return (value)
+        SpecificVolumeUnits.CubicMeterPerKilogram: lambda value: (value),
         
-        if from_unit == SpecificVolumeUnits.CubicFootPerPound:
-            return (value * 16.01846353)
+        SpecificVolumeUnits.CubicFootPerPound: lambda value: (value / 16.01846353),
         
-        if from_unit == SpecificVolumeUnits.MillicubicMeterPerKilogram:
-            return ((value) / 0.001)
+        SpecificVolumeUnits.MillicubicMeterPerKilogram: lambda value: ((value) * 0.001),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        SpecificVolumeUnits.CubicMeterPerKilogram: ('1', '0'),
+        
+        SpecificVolumeUnits.CubicFootPerPound: ('1601846353/100000000', '0'),
+        
+        SpecificVolumeUnits.MillicubicMeterPerKilogram: ('1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: SpecificVolumeUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == SpecificVolumeUnits.CubicMeterPerKilogram:
-            return (value)
+        SpecificVolumeUnits.CubicMeterPerKilogram: ('1', '0'),
         
-        if to_unit == SpecificVolumeUnits.CubicFootPerPound:
-            return (value / 16.01846353)
+        SpecificVolumeUnits.CubicFootPerPound: ('100000000/1601846353', '0'),
+        
+        SpecificVolumeUnits.MillicubicMeterPerKilogram: ('1/1000', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == SpecificVolumeUnits.MillicubicMeterPerKilogram:
-            return ((value) * 0.001)
+        SpecificVolumeUnits.CubicMeterPerKilogram: ('m³/kg',),
         
-        return None
+        SpecificVolumeUnits.CubicFootPerPound: ('ft³/lb',),
+        
+        SpecificVolumeUnits.MillicubicMeterPerKilogram: ('mm³/kg',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: SpecificVolumeUnits = SpecificVolumeUnits.CubicMeterPerKilogram):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: SpecificVolumeUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: SpecificVolumeUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: SpecificVolumeUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: SpecificVolumeUnits, to_unit: SpecificVolumeUnits) -> float:
+        """
+        Convert a value from one SpecificVolume unit to another, without creating a SpecificVolume instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificVolumeUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: SpecificVolumeUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return SpecificVolume._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: SpecificVolumeUnits, to_unit: SpecificVolumeUnits) -> List[float]:
+        """
+        Convert many values from one SpecificVolume unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: SpecificVolumeUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: SpecificVolumeUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return SpecificVolume._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: SpecificVolumeUnits, to_unit: SpecificVolumeUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", SpecificVolume._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: SpecificVolumeUnits, to_unit: SpecificVolumeUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one SpecificVolume unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificVolumeUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: SpecificVolumeUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return SpecificVolume._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: SpecificVolumeUnits = SpecificVolumeUnits.CubicMeterPerKilogram) -> SpecificVolume:
+        """
+        Create a new instance of SpecificVolume holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificVolumeUnits
+        :return: A new instance of SpecificVolume.
+        :rtype: SpecificVolume
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return SpecificVolume._from_exact(value, from_unit)
+
+    def to_exact(self, unit: SpecificVolumeUnits = SpecificVolumeUnits.CubicMeterPerKilogram) -> Fraction:
+        """
+        Get the exact value of the SpecificVolume in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (CubicMeterPerKilogram).
+        :type unit: SpecificVolumeUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> SpecificVolume:
+        """
+        Parse a SpecificVolume from a value followed by a unit abbreviation, e.g. "1 m³/kg".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of SpecificVolume.
+        :rtype: SpecificVolume
+        :raises ValueError: When the string is not a valid or an ambiguous SpecificVolume.
+        """
+        return SpecificVolume._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[SpecificVolume]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return SpecificVolume._try_parse(text)
 
+    def to_binary(self, unit: Optional[SpecificVolumeUnits] = None) -> bytes:
+        """
+        Encode the SpecificVolume to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: SpecificVolumeUnits
+        :return: The encoded SpecificVolume.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> SpecificVolume:
+        """
+        Decode a SpecificVolume encoded by to_binary.
+
+        :param data: The encoded SpecificVolume, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of SpecificVolume.
+        :rtype: SpecificVolume
+        :raises ValueError: When the data is not a valid encoded SpecificVolume.
+        """
+        return SpecificVolume._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[SpecificVolumeUnits] = None) -> dict:
+        """
+        Get the SpecificVolume DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (CubicMeterPerKilogram).
+        :type hold_in_unit: SpecificVolumeUnits
+        :return: The SpecificVolume DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[SpecificVolumeUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> SpecificVolume:
+        """
+        Create a new instance of SpecificVolume from its DTO.
+
+        :param dto: The SpecificVolume DTO, the unit is the SpecificVolumeUnits value or name.
+        :type dto: dict
+        :return: A new instance of SpecificVolume.
+        :rtype: SpecificVolume
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return SpecificVolume._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> SpecificVolume:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return SpecificVolume._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -133,10 +363,7 @@ class SpecificVolume(AbstractMeasure):
         """
         
         """
-        if self.__cubic_meters_per_kilogram != None:
-            return self.__cubic_meters_per_kilogram
-        self.__cubic_meters_per_kilogram = self.__convert_from_base(SpecificVolumeUnits.CubicMeterPerKilogram)
-        return self.__cubic_meters_per_kilogram
+        return self._cached_convert(SpecificVolumeUnits.CubicMeterPerKilogram)
 
     
     @property
@@ -144,10 +371,7 @@ class SpecificVolume(AbstractMeasure):
         """
         
         """
-        if self.__cubic_feet_per_pound != None:
-            return self.__cubic_feet_per_pound
-        self.__cubic_feet_per_pound = self.__convert_from_base(SpecificVolumeUnits.CubicFootPerPound)
-        return self.__cubic_feet_per_pound
+        return self._cached_convert(SpecificVolumeUnits.CubicFootPerPound)
 
     
     @property
@@ -155,10 +379,7 @@ class SpecificVolume(AbstractMeasure):
         """
         
         """
-        if self.__millicubic_meters_per_kilogram != None:
-            return self.__millicubic_meters_per_kilogram
-        self.__millicubic_meters_per_kilogram = self.__convert_from_base(SpecificVolumeUnits.MillicubicMeterPerKilogram)
-        return self.__millicubic_meters_per_kilogram
+        return self._cached_convert(SpecificVolumeUnits.MillicubicMeterPerKilogram)
 
     
     def to_string(self, unit: SpecificVolumeUnits = SpecificVolumeUnits.CubicMeterPerKilogram) -> str:
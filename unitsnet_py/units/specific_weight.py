@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class SpecificWeightUnits(Enum):
         """
             SpecificWeightUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         NewtonPerCubicMillimeter = 'newton_per_cubic_millimeter'
         """
@@ -104,161 +115,436 @@ class SpecificWeight(AbstractMeasure):
         value (float): The value.
         from_unit (SpecificWeightUnits): The SpecificWeight unit to create from, The default unit is NewtonPerCubicMeter
     """
-    def __init__(self, value: float, from_unit: SpecificWeightUnits = SpecificWeightUnits.NewtonPerCubicMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = SpecificWeightUnits
+
+    _base_unit = SpecificWeightUnits.NewtonPerCubicMeter
+
+    _dimensions = (-2, 1, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 100
+
+    _binary_unit_ids = {
         
-        self.__newtons_per_cubic_millimeter = None
+        SpecificWeightUnits.NewtonPerCubicMillimeter: 0,
         
-        self.__newtons_per_cubic_centimeter = None
+        SpecificWeightUnits.NewtonPerCubicCentimeter: 1,
         
-        self.__newtons_per_cubic_meter = None
+        SpecificWeightUnits.NewtonPerCubicMeter: 2,
         
-        self.__kilograms_force_per_cubic_millimeter = None
+        SpecificWeightUnits.KilogramForcePerCubicMillimeter: 3,
         
-        self.__kilograms_force_per_cubic_centimeter = None
+        SpecificWeightUnits.KilogramForcePerCubicCentimeter: 4,
         
-        self.__kilograms_force_per_cubic_meter = None
+        SpecificWeightUnits.KilogramForcePerCubicMeter: 5,
         
-        self.__pounds_force_per_cubic_inch = None
+        SpecificWeightUnits.PoundForcePerCubicInch: 6,
         
-        self.__pounds_force_per_cubic_foot = None
+        SpecificWeightUnits.PoundForcePerCubicFoot: 7,
         
-        self.__tonnes_force_per_cubic_millimeter = None
+        SpecificWeightUnits.TonneForcePerCubicMillimeter: 8,
         
-        self.__tonnes_force_per_cubic_centimeter = None
+        SpecificWeightUnits.TonneForcePerCubicCentimeter: 9,
         
-        self.__tonnes_force_per_cubic_meter = None
+        SpecificWeightUnits.TonneForcePerCubicMeter: 10,
         
-        self.__kilonewtons_per_cubic_millimeter = None
+        SpecificWeightUnits.KilonewtonPerCubicMillimeter: 11,
         
-        self.__kilonewtons_per_cubic_centimeter = None
+        SpecificWeightUnits.KilonewtonPerCubicCentimeter: 12,
         
-        self.__kilonewtons_per_cubic_meter = None
+        SpecificWeightUnits.KilonewtonPerCubicMeter: 13,
         
-        self.__meganewtons_per_cubic_meter = None
+        SpecificWeightUnits.MeganewtonPerCubicMeter: 14,
         
-        self.__kilopounds_force_per_cubic_inch = None
+        SpecificWeightUnits.KilopoundForcePerCubicInch: 15,
         
-        self.__kilopounds_force_per_cubic_foot = None
+        SpecificWeightUnits.KilopoundForcePerCubicFoot: 16,
         
+    }
 
-    def convert(self, unit: SpecificWeightUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        SpecificWeightUnits.NewtonPerCubicMillimeter: lambda value: (value * 0.000000001),
+        
+        SpecificWeightUnits.NewtonPerCubicCentimeter: lambda value: (value * 0.000001),
+        
+        SpecificWeightUnits.NewtonPerCubicMeter: lambda value: (value),
+        
+        SpecificWeightUnits.KilogramForcePerCubicMillimeter: lambda value: (value / 9.80665e9),
+        
+        SpecificWeightUnits.KilogramForcePerCubicCentimeter: lambda value: (value / 9.80665e6),
+        
+        SpecificWeightUnits.KilogramForcePerCubicMeter: lambda value: (value / 9.80665),
+        
+        SpecificWeightUnits.PoundForcePerCubicInch: lambda value: (value / 2.714471375263134e5),
+        
+        SpecificWeightUnits.PoundForcePerCubicFoot: lambda value: (value / 1.570874638462462e2),
+        
+        SpecificWeightUnits.TonneForcePerCubicMillimeter: lambda value: (value / 9.80665e12),
+        
+        SpecificWeightUnits.TonneForcePerCubicCentimeter: lambda value: (value / 9.80665e9),
+        
+        SpecificWeightUnits.TonneForcePerCubicMeter: lambda value: (value / 9.80665e3),
+        
+        SpecificWeightUnits.KilonewtonPerCubicMillimeter: lambda value: ((value * 0.000000001) / 1000.0),
+        
+        SpecificWeightUnits.KilonewtonPerCubicCentimeter: lambda value: ((value * 0.000001) / 1000.0),
+        
+        SpecificWeightUnits.KilonewtonPerCubicMeter: lambda value: ((value) / 1000.0),
+        
+        SpecificWeightUnits.MeganewtonPerCubicMeter: lambda value: ((value) / 1000000.0),
+        
+        SpecificWeightUnits.KilopoundForcePerCubicInch: lambda value: ((value / 2.714471375263134e5) / 1000.0),
+        
+        SpecificWeightUnits.KilopoundForcePerCubicFoot: lambda value: ((value / 1.570874638462462e2) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: SpecificWeightUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        SpecificWeightUnits.NewtonPerCubicMillimeter: lambda value: (value * 1000000000),
+        
+        SpecificWeightUnits.NewtonPerCubicCentimeter: lambda value: (value * 1000000),
+        
+        SpecificWeightUnits.NewtonPerCubicMeter: lambda value: (value),
+        
+        SpecificWeightUnits.KilogramForcePerCubicMillimeter: lambda value: (value * 9.80665e9),
         
-        if from_unit == SpecificWeightUnits.NewtonPerCubicMillimeter:
-            return (value * 0.000000001)
+        SpecificWeightUnits.KilogramForcePerCubicCentimeter: lambda value: (value * 9.80665e6),
         
-        if from_unit == SpecificWeightUnits.NewtonPerCubicCentimeter:
-            return (value * 0.000001)
+        SpecificWeightUnits.KilogramForcePerCubicMeter: lambda value: (value * 9.80665),
         
-        if from_unit == SpecificWeightUnits.NewtonPerCubicMeter:
-            return (value)
+        SpecificWeightUnits.PoundForcePerCubicInch: lambda value: (value * 2.714471375263134e5),
         
-        if from_unit == SpecificWeightUnits.KilogramForcePerCubicMillimeter:
-            return (value / 9.80665e9)
+        SpecificWeightUnits.PoundForcePerCubicFoot: lambda value: (value * 1.570874638462462e2),
         
-        if from_unit == SpecificWeightUnits.KilogramForcePerCubicCentimeter:
-            return (value / 9.80665e6)
+        SpecificWeightUnits.TonneForcePerCubicMillimeter: lambda value: (value * 9.80665e12),
         
-        if from_unit == SpecificWeightUnits.KilogramForcePerCubicMeter:
-            return (value / 9.80665)
+        SpecificWeightUnits.TonneForcePerCubicCentimeter: lambda value: (value * 9.80665e9),
         
-        if from_unit == SpecificWeightUnits.PoundForcePerCubicInch:
-            return (value / 2.714471375263134e5)
+        SpecificWeightUnits.TonneForcePerCubicMeter: lambda value: (value * 9.80665e3),
         
-        if from_unit == SpecificWeightUnits.PoundForcePerCubicFoot:
-            return (value / 1.570874638462462e2)
+        SpecificWeightUnits.KilonewtonPerCubicMillimeter: lambda value: ((value * 1000000000) * 1000.0),
         
-        if from_unit == SpecificWeightUnits.TonneForcePerCubicMillimeter:
-            return (value / 9.80665e12)
+        SpecificWeightUnits.KilonewtonPerCubicCentimeter: lambda value: ((value * 1000000) * 1000.0),
         
-        if from_unit == SpecificWeightUnits.TonneForcePerCubicCentimeter:
-            return (value / 9.80665e9)
+        SpecificWeightUnits.KilonewtonPerCubicMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == SpecificWeightUnits.TonneForcePerCubicMeter:
-            return (value / 9.80665e3)
+        SpecificWeightUnits.MeganewtonPerCubicMeter: lambda value: ((value) * 1000000.0),
         
-        if from_unit == SpecificWeightUnits.KilonewtonPerCubicMillimeter:
-            return ((value * 0.000000001) / 1000.0)
+        SpecificWeightUnits.KilopoundForcePerCubicInch: lambda value: ((value * 2.714471375263134e5) * 1000.0),
         
-        if from_unit == SpecificWeightUnits.KilonewtonPerCubicCentimeter:
-            return ((value * 0.000001) / 1000.0)
+        SpecificWeightUnits.KilopoundForcePerCubicFoot: lambda value: ((value * 1.570874638462462e2) * 1000.0),
         
-        if from_unit == SpecificWeightUnits.KilonewtonPerCubicMeter:
-            return ((value) / 1000.0)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        SpecificWeightUnits.NewtonPerCubicMillimeter: ('1/1000000000', '0'),
+        
+        SpecificWeightUnits.NewtonPerCubicCentimeter: ('1/1000000', '0'),
+        
+        SpecificWeightUnits.NewtonPerCubicMeter: ('1', '0'),
+        
+        SpecificWeightUnits.KilogramForcePerCubicMillimeter: ('1/9806650000', '0'),
+        
+        SpecificWeightUnits.KilogramForcePerCubicCentimeter: ('1/9806650', '0'),
+        
+        SpecificWeightUnits.KilogramForcePerCubicMeter: ('20000/196133', '0'),
+        
+        SpecificWeightUnits.PoundForcePerCubicInch: ('5000000000/1357235687631567', '0'),
+        
+        SpecificWeightUnits.PoundForcePerCubicFoot: ('5000000000000/785437319231231', '0'),
+        
+        SpecificWeightUnits.TonneForcePerCubicMillimeter: ('1/9806650000000', '0'),
         
-        if from_unit == SpecificWeightUnits.MeganewtonPerCubicMeter:
-            return ((value) / 1000000.0)
+        SpecificWeightUnits.TonneForcePerCubicCentimeter: ('1/9806650000', '0'),
         
-        if from_unit == SpecificWeightUnits.KilopoundForcePerCubicInch:
-            return ((value / 2.714471375263134e5) / 1000.0)
+        SpecificWeightUnits.TonneForcePerCubicMeter: ('20/196133', '0'),
         
-        if from_unit == SpecificWeightUnits.KilopoundForcePerCubicFoot:
-            return ((value / 1.570874638462462e2) / 1000.0)
+        SpecificWeightUnits.KilonewtonPerCubicMillimeter: ('1/1000000000000', '0'),
         
-        return None
+        SpecificWeightUnits.KilonewtonPerCubicCentimeter: ('1/1000000000', '0'),
+        
+        SpecificWeightUnits.KilonewtonPerCubicMeter: ('1/1000', '0'),
+        
+        SpecificWeightUnits.MeganewtonPerCubicMeter: ('1/1000000', '0'),
+        
+        SpecificWeightUnits.KilopoundForcePerCubicInch: ('5000000/1357235687631567', '0'),
+        
+        SpecificWeightUnits.KilopoundForcePerCubicFoot: ('5000000000/785437319231231', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        SpecificWeightUnits.NewtonPerCubicMillimeter: ('1000000000', '0'),
+        
+        SpecificWeightUnits.NewtonPerCubicCentimeter: ('1000000', '0'),
+        
+        SpecificWeightUnits.NewtonPerCubicMeter: ('1', '0'),
+        
+        SpecificWeightUnits.KilogramForcePerCubicMillimeter: ('9806650000', '0'),
+        
+        SpecificWeightUnits.KilogramForcePerCubicCentimeter: ('9806650', '0'),
+        
+        SpecificWeightUnits.KilogramForcePerCubicMeter: ('196133/20000', '0'),
+        
+        SpecificWeightUnits.PoundForcePerCubicInch: ('1357235687631567/5000000000', '0'),
+        
+        SpecificWeightUnits.PoundForcePerCubicFoot: ('785437319231231/5000000000000', '0'),
+        
+        SpecificWeightUnits.TonneForcePerCubicMillimeter: ('9806650000000', '0'),
+        
+        SpecificWeightUnits.TonneForcePerCubicCentimeter: ('9806650000', '0'),
+        
+        SpecificWeightUnits.TonneForcePerCubicMeter: ('196133/20', '0'),
+        
+        SpecificWeightUnits.KilonewtonPerCubicMillimeter: ('1000000000000', '0'),
+        
+        SpecificWeightUnits.KilonewtonPerCubicCentimeter: ('1000000000', '0'),
+        
+        SpecificWeightUnits.KilonewtonPerCubicMeter: ('1000', '0'),
+        
+        SpecificWeightUnits.MeganewtonPerCubicMeter: ('1000000', '0'),
+        
+        SpecificWeightUnits.KilopoundForcePerCubicInch: ('1357235687631567/5000000', '0'),
+        
+        SpecificWeightUnits.KilopoundForcePerCubicFoot: ('785437319231231/5000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: SpecificWeightUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == SpecificWeightUnits.NewtonPerCubicMillimeter:
-            return (value * 1000000000)
+        SpecificWeightUnits.NewtonPerCubicMillimeter: ('N/mm³',),
         
-        if to_unit == SpecificWeightUnits.NewtonPerCubicCentimeter:
-            return (value * 1000000)
+        SpecificWeightUnits.NewtonPerCubicCentimeter: ('N/cm³',),
         
-        if to_unit == SpecificWeightUnits.NewtonPerCubicMeter:
-            return (value)
+        SpecificWeightUnits.NewtonPerCubicMeter: ('N/m³',),
         
-        if to_unit == SpecificWeightUnits.KilogramForcePerCubicMillimeter:
-            return (value * 9.80665e9)
+        SpecificWeightUnits.KilogramForcePerCubicMillimeter: ('kgf/mm³',),
         
-        if to_unit == SpecificWeightUnits.KilogramForcePerCubicCentimeter:
-            return (value * 9.80665e6)
+        SpecificWeightUnits.KilogramForcePerCubicCentimeter: ('kgf/cm³',),
         
-        if to_unit == SpecificWeightUnits.KilogramForcePerCubicMeter:
-            return (value * 9.80665)
+        SpecificWeightUnits.KilogramForcePerCubicMeter: ('kgf/m³',),
         
-        if to_unit == SpecificWeightUnits.PoundForcePerCubicInch:
-            return (value * 2.714471375263134e5)
+        SpecificWeightUnits.PoundForcePerCubicInch: ('lbf/in³',),
         
-        if to_unit == SpecificWeightUnits.PoundForcePerCubicFoot:
-            return (value * 1.570874638462462e2)
+        SpecificWeightUnits.PoundForcePerCubicFoot: ('lbf/ft³',),
         
-        if to_unit == SpecificWeightUnits.TonneForcePerCubicMillimeter:
-            return (value * 9.80665e12)
+        SpecificWeightUnits.TonneForcePerCubicMillimeter: ('tf/mm³',),
         
-        if to_unit == SpecificWeightUnits.TonneForcePerCubicCentimeter:
-            return (value * 9.80665e9)
+        SpecificWeightUnits.TonneForcePerCubicCentimeter: ('tf/cm³',),
         
-        if to_unit == SpecificWeightUnits.TonneForcePerCubicMeter:
-            return (value * 9.80665e3)
+        SpecificWeightUnits.TonneForcePerCubicMeter: ('tf/m³',),
         
-        if to_unit == SpecificWeightUnits.KilonewtonPerCubicMillimeter:
-            return ((value * 1000000000) * 1000.0)
+        SpecificWeightUnits.KilonewtonPerCubicMillimeter: ('kN/mm³',),
         
-        if to_unit == SpecificWeightUnits.KilonewtonPerCubicCentimeter:
-            return ((value * 1000000) * 1000.0)
+        SpecificWeightUnits.KilonewtonPerCubicCentimeter: ('kN/cm³',),
         
-        if to_unit == SpecificWeightUnits.KilonewtonPerCubicMeter:
-            return ((value) * 1000.0)
+        SpecificWeightUnits.KilonewtonPerCubicMeter: ('kN/m³',),
         
-        if to_unit == SpecificWeightUnits.MeganewtonPerCubicMeter:
-            return ((value) * 1000000.0)
+        SpecificWeightUnits.MeganewtonPerCubicMeter: ('MN/m³',),
         
-        if to_unit == SpecificWeightUnits.KilopoundForcePerCubicInch:
-            return ((value * 2.714471375263134e5) * 1000.0)
+        SpecificWeightUnits.KilopoundForcePerCubicInch: ('klbf/in³',),
         
-        if to_unit == SpecificWeightUnits.KilopoundForcePerCubicFoot:
-            return ((value * 1.570874638462462e2) * 1000.0)
+        SpecificWeightUnits.KilopoundForcePerCubicFoot: ('klbf/ft³',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: SpecificWeightUnits = SpecificWeightUnits.NewtonPerCubicMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
 
+    def convert(self, unit: SpecificWeightUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: SpecificWeightUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: SpecificWeightUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: SpecificWeightUnits, to_unit: SpecificWeightUnits) -> float:
+        """
+        Convert a value from one SpecificWeight unit to another, without creating a SpecificWeight instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificWeightUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: SpecificWeightUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return SpecificWeight._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: SpecificWeightUnits, to_unit: SpecificWeightUnits) -> List[float]:
+        """
+        Convert many values from one SpecificWeight unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: SpecificWeightUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: SpecificWeightUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return SpecificWeight._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: SpecificWeightUnits, to_unit: SpecificWeightUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", SpecificWeight._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: SpecificWeightUnits, to_unit: SpecificWeightUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one SpecificWeight unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificWeightUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: SpecificWeightUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return SpecificWeight._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: SpecificWeightUnits = SpecificWeightUnits.NewtonPerCubicMeter) -> SpecificWeight:
+        """
+        Create a new instance of SpecificWeight holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: SpecificWeightUnits
+        :return: A new instance of SpecificWeight.
+        :rtype: SpecificWeight
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return SpecificWeight._from_exact(value, from_unit)
+
+    def to_exact(self, unit: SpecificWeightUnits = SpecificWeightUnits.NewtonPerCubicMeter) -> Fraction:
+        """
+        Get the exact value of the SpecificWeight in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (NewtonPerCubicMeter).
+        :type unit: SpecificWeightUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> SpecificWeight:
+        """
+        Parse a SpecificWeight from a value followed by a unit abbreviation, e.g. "1 N/mm³".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of SpecificWeight.
+        :rtype: SpecificWeight
+        :raises ValueError: When the string is not a valid or an ambiguous SpecificWeight.
+        """
+        return SpecificWeight._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[SpecificWeight]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return SpecificWeight._try_parse(text)
+
+    def to_binary(self, unit: Optional[SpecificWeightUnits] = None) -> bytes:
+        """
+        Encode the SpecificWeight to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: SpecificWeightUnits
+        :return: The encoded SpecificWeight.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> SpecificWeight:
+        """
+        Decode a SpecificWeight encoded by to_binary.
+
+        :param data: The encoded SpecificWeight, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of SpecificWeight.
+        :rtype: SpecificWeight
+        :raises ValueError: When the data is not a valid encoded SpecificWeight.
+        """
+        return SpecificWeight._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[SpecificWeightUnits] = None) -> dict:
+        """
+        Get the SpecificWeight DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (NewtonPerCubicMeter).
+        :type hold_in_unit: SpecificWeightUnits
+        :return: The SpecificWeight DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[SpecificWeightUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> SpecificWeight:
+        """
+        Create a new instance of SpecificWeight from its DTO.
+
+        :param dto: The SpecificWeight DTO, the unit is the SpecificWeightUnits value or name.
+        :type dto: dict
+        :return: A new instance of SpecificWeight.
+        :rtype: SpecificWeight
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return SpecificWeight._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> SpecificWeight:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return SpecificWeight._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -525,10 +811,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__newtons_per_cubic_millimeter != None:
-            return self.__newtons_per_cubic_millimeter
-        self.__newtons_per_cubic_millimeter = self.__convert_from_base(SpecificWeightUnits.NewtonPerCubicMillimeter)
-        return self.__newtons_per_cubic_millimeter
+        return self._cached_convert(SpecificWeightUnits.NewtonPerCubicMillimeter)
 
     
     @property
@@ -536,10 +819,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__newtons_per_cubic_centimeter != None:
-            return self.__newtons_per_cubic_centimeter
-        self.__newtons_per_cubic_centimeter = self.__convert_from_base(SpecificWeightUnits.NewtonPerCubicCentimeter)
-        return self.__newtons_per_cubic_centimeter
+        return self._cached_convert(SpecificWeightUnits.NewtonPerCubicCentimeter)
 
     
     @property
@@ -547,10 +827,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__newtons_per_cubic_meter != None:
-            return self.__newtons_per_cubic_meter
-        self.__newtons_per_cubic_meter = self.__convert_from_base(SpecificWeightUnits.NewtonPerCubicMeter)
-        return self.__newtons_per_cubic_meter
+        return self._cached_convert(SpecificWeightUnits.NewtonPerCubicMeter)
 
     
     @property
@@ -558,10 +835,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_force_per_cubic_millimeter != None:
-            return self.__kilograms_force_per_cubic_millimeter
-        self.__kilograms_force_per_cubic_millimeter = self.__convert_from_base(SpecificWeightUnits.KilogramForcePerCubicMillimeter)
-        return self.__kilograms_force_per_cubic_millimeter
+        return self._cached_convert(SpecificWeightUnits.KilogramForcePerCubicMillimeter)
 
     
     @property
@@ -569,10 +843,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_force_per_cubic_centimeter != None:
-            return self.__kilograms_force_per_cubic_centimeter
-        self.__kilograms_force_per_cubic_centimeter = self.__convert_from_base(SpecificWeightUnits.KilogramForcePerCubicCentimeter)
-        return self.__kilograms_force_per_cubic_centimeter
+        return self._cached_convert(SpecificWeightUnits.KilogramForcePerCubicCentimeter)
 
     
     @property
@@ -580,10 +851,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__kilograms_force_per_cubic_meter != None:
-            return self.__kilograms_force_per_cubic_meter
-        self.__kilograms_force_per_cubic_meter = self.__convert_from_base(SpecificWeightUnits.KilogramForcePerCubicMeter)
-        return self.__kilograms_force_per_cubic_meter
+        return self._cached_convert(SpecificWeightUnits.KilogramForcePerCubicMeter)
 
     
     @property
@@ -591,10 +859,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_per_cubic_inch != None:
-            return self.__pounds_force_per_cubic_inch
-        self.__pounds_force_per_cubic_inch = self.__convert_from_base(SpecificWeightUnits.PoundForcePerCubicInch)
-        return self.__pounds_force_per_cubic_inch
+        return self._cached_convert(SpecificWeightUnits.PoundForcePerCubicInch)
 
     
     @property
@@ -602,10 +867,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__pounds_force_per_cubic_foot != None:
-            return self.__pounds_force_per_cubic_foot
-        self.__pounds_force_per_cubic_foot = self.__convert_from_base(SpecificWeightUnits.PoundForcePerCubicFoot)
-        return self.__pounds_force_per_cubic_foot
+        return self._cached_convert(SpecificWeightUnits.PoundForcePerCubicFoot)
 
     
     @property
@@ -613,10 +875,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_force_per_cubic_millimeter != None:
-            return self.__tonnes_force_per_cubic_millimeter
-        self.__tonnes_force_per_cubic_millimeter = self.__convert_from_base(SpecificWeightUnits.TonneForcePerCubicMillimeter)
-        return self.__tonnes_force_per_cubic_millimeter
+        return self._cached_convert(SpecificWeightUnits.TonneForcePerCubicMillimeter)
 
     
     @property
@@ -624,10 +883,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_force_per_cubic_centimeter != None:
-            return self.__tonnes_force_per_cubic_centimeter
-        self.__tonnes_force_per_cubic_centimeter = self.__convert_from_base(SpecificWeightUnits.TonneForcePerCubicCentimeter)
-        return self.__tonnes_force_per_cubic_centimeter
+        return self._cached_convert(SpecificWeightUnits.TonneForcePerCubicCentimeter)
 
     
     @property
@@ -635,10 +891,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__tonnes_force_per_cubic_meter != None:
-            return self.__tonnes_force_per_cubic_meter
-        self.__tonnes_force_per_cubic_meter = self.__convert_from_base(SpecificWeightUnits.TonneForcePerCubicMeter)
-        return self.__tonnes_force_per_cubic_meter
+        return self._cached_convert(SpecificWeightUnits.TonneForcePerCubicMeter)
 
     
     @property
@@ -646,10 +899,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__kilonewtons_per_cubic_millimeter != None:
-            return self.__kilonewtons_per_cubic_millimeter
-        self.__kilonewtons_per_cubic_millimeter = self.__convert_from_base(SpecificWeightUnits.KilonewtonPerCubicMillimeter)
-        return self.__kilonewtons_per_cubic_millimeter
+        return self._cached_convert(SpecificWeightUnits.KilonewtonPerCubicMillimeter)
 
     
     @property
@@ -657,10 +907,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__kilonewtons_per_cubic_centimeter != None:
-            return self.__kilonewtons_per_cubic_centimeter
-        self.__kilonewtons_per_cubic_centimeter = self.__convert_from_base(SpecificWeightUnits.KilonewtonPerCubicCentimeter)
-        return self.__kilonewtons_per_cubic_centimeter
+        return self._cached_convert(SpecificWeightUnits.KilonewtonPerCubicCentimeter)
 
     
     @property
@@ -668,10 +915,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__kilonewtons_per_cubic_meter != None:
-            return self.__kilonewtons_per_cubic_meter
-        self.__kilonewtons_per_cubic_meter = self.__convert_from_base(SpecificWeightUnits.KilonewtonPerCubicMeter)
-        return self.__kilonewtons_per_cubic_meter
+        return self._cached_convert(SpecificWeightUnits.KilonewtonPerCubicMeter)
 
     
     @property
@@ -679,10 +923,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__meganewtons_per_cubic_meter != None:
-            return self.__meganewtons_per_cubic_meter
-        self.__meganewtons_per_cubic_meter = self.__convert_from_base(SpecificWeightUnits.MeganewtonPerCubicMeter)
-        return self.__meganewtons_per_cubic_meter
+        return self._cached_convert(SpecificWeightUnits.MeganewtonPerCubicMeter)
 
     
     @property
@@ -690,10 +931,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_force_per_cubic_inch != None:
-            return self.__kilopounds_force_per_cubic_inch
-        self.__kilopounds_force_per_cubic_inch = self.__convert_from_base(SpecificWeightUnits.KilopoundForcePerCubicInch)
-        return self.__kilopounds_force_per_cubic_inch
+        return self._cached_convert(SpecificWeightUnits.KilopoundForcePerCubicInch)
 
     
     @property
@@ -701,10 +939,7 @@ class SpecificWeight(AbstractMeasure):
         """
         
         """
-        if self.__kilopounds_force_per_cubic_foot != None:
-            return self.__kilopounds_force_per_cubic_foot
-        self.__kilopounds_force_per_cubic_foot = self.__convert_from_base(SpecificWeightUnits.KilopoundForcePerCubicFoot)
-        return self.__kilopounds_force_per_cubic_foot
+        return self._cached_convert(SpecificWeightUnits.KilopoundForcePerCubicFoot)
 
     
     def to_string(self, unit: SpecificWeightUnits = SpecificWeightUnits.NewtonPerCubicMeter) -> str:
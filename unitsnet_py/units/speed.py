@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class SpeedUnits(Enum):
         """
             SpeedUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         MeterPerSecond = 'meter_per_second'
         """
@@ -184,289 +195,628 @@ class Speed(AbstractMeasure):
         value (float): The value.
         from_unit (SpeedUnits): The Speed unit to create from, The default unit is MeterPerSecond
     """
-    def __init__(self, value: float, from_unit: SpeedUnits = SpeedUnits.MeterPerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = SpeedUnits
+
+    _base_unit = SpeedUnits.MeterPerSecond
+
+    _dimensions = (1, 0, -1, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 101
+
+    _binary_unit_ids = {
         
-        self.__meters_per_second = None
+        SpeedUnits.MeterPerSecond: 0,
         
-        self.__meters_per_minutes = None
+        SpeedUnits.MeterPerMinute: 1,
         
-        self.__meters_per_hour = None
+        SpeedUnits.MeterPerHour: 2,
         
-        self.__feet_per_second = None
+        SpeedUnits.FootPerSecond: 3,
         
-        self.__feet_per_minute = None
+        SpeedUnits.FootPerMinute: 4,
         
-        self.__feet_per_hour = None
+        SpeedUnits.FootPerHour: 5,
         
-        self.__us_survey_feet_per_second = None
+        SpeedUnits.UsSurveyFootPerSecond: 6,
         
-        self.__us_survey_feet_per_minute = None
+        SpeedUnits.UsSurveyFootPerMinute: 7,
         
-        self.__us_survey_feet_per_hour = None
+        SpeedUnits.UsSurveyFootPerHour: 8,
         
-        self.__inches_per_second = None
+        SpeedUnits.InchPerSecond: 9,
         
-        self.__inches_per_minute = None
+        SpeedUnits.InchPerMinute: 10,
         
-        self.__inches_per_hour = None
+        SpeedUnits.InchPerHour: 11,
         
-        self.__yards_per_second = None
+        SpeedUnits.YardPerSecond: 12,
         
-        self.__yards_per_minute = None
+        SpeedUnits.YardPerMinute: 13,
         
-        self.__yards_per_hour = None
+        SpeedUnits.YardPerHour: 14,
         
-        self.__knots = None
+        SpeedUnits.Knot: 15,
         
-        self.__miles_per_hour = None
+        SpeedUnits.MilePerHour: 16,
         
-        self.__mach = None
+        SpeedUnits.Mach: 17,
         
-        self.__nanometers_per_second = None
+        SpeedUnits.NanometerPerSecond: 18,
         
-        self.__micrometers_per_second = None
+        SpeedUnits.MicrometerPerSecond: 19,
         
-        self.__millimeters_per_second = None
+        SpeedUnits.MillimeterPerSecond: 20,
         
-        self.__centimeters_per_second = None
+        SpeedUnits.CentimeterPerSecond: 21,
         
-        self.__decimeters_per_second = None
+        SpeedUnits.DecimeterPerSecond: 22,
         
-        self.__kilometers_per_second = None
+        SpeedUnits.KilometerPerSecond: 23,
         
-        self.__nanometers_per_minutes = None
+        SpeedUnits.NanometerPerMinute: 24,
         
-        self.__micrometers_per_minutes = None
+        SpeedUnits.MicrometerPerMinute: 25,
         
-        self.__millimeters_per_minutes = None
+        SpeedUnits.MillimeterPerMinute: 26,
         
-        self.__centimeters_per_minutes = None
+        SpeedUnits.CentimeterPerMinute: 27,
         
-        self.__decimeters_per_minutes = None
+        SpeedUnits.DecimeterPerMinute: 28,
         
-        self.__kilometers_per_minutes = None
+        SpeedUnits.KilometerPerMinute: 29,
         
-        self.__millimeters_per_hour = None
+        SpeedUnits.MillimeterPerHour: 30,
         
-        self.__centimeters_per_hour = None
+        SpeedUnits.CentimeterPerHour: 31,
         
-        self.__kilometers_per_hour = None
+        SpeedUnits.KilometerPerHour: 32,
         
+    }
 
-    def convert(self, unit: SpeedUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        SpeedUnits.MeterPerSecond: lambda value: (value),
+        
+        SpeedUnits.MeterPerMinute: lambda value: (value * 60),
+        
+        SpeedUnits.MeterPerHour: lambda value: (value * 3600),
+        
+        SpeedUnits.FootPerSecond: lambda value: (value / 0.3048),
+        
+        SpeedUnits.FootPerMinute: lambda value: (value / 0.3048 * 60),
+        
+        SpeedUnits.FootPerHour: lambda value: (value / 0.3048 * 3600),
+        
+        SpeedUnits.UsSurveyFootPerSecond: lambda value: (value * 3937 / 1200),
+        
+        SpeedUnits.UsSurveyFootPerMinute: lambda value: ((value * 3937 / 1200) * 60),
+        
+        SpeedUnits.UsSurveyFootPerHour: lambda value: ((value * 3937 / 1200) * 3600),
+        
+        SpeedUnits.InchPerSecond: lambda value: (value / 2.54e-2),
+        
+        SpeedUnits.InchPerMinute: lambda value: ((value / 2.54e-2) * 60),
+        
+        SpeedUnits.InchPerHour: lambda value: ((value / 2.54e-2) * 3600),
+        
+        SpeedUnits.YardPerSecond: lambda value: (value / 0.9144),
+        
+        SpeedUnits.YardPerMinute: lambda value: (value / 0.9144 * 60),
+        
+        SpeedUnits.YardPerHour: lambda value: (value / 0.9144 * 3600),
+        
+        SpeedUnits.Knot: lambda value: (value / (1852.0 / 3600.0)),
+        
+        SpeedUnits.MilePerHour: lambda value: (value / 0.44704),
+        
+        SpeedUnits.Mach: lambda value: (value / 340.29),
+        
+        SpeedUnits.NanometerPerSecond: lambda value: ((value) / 1e-09),
+        
+        SpeedUnits.MicrometerPerSecond: lambda value: ((value) / 1e-06),
+        
+        SpeedUnits.MillimeterPerSecond: lambda value: ((value) / 0.001),
+        
+        SpeedUnits.CentimeterPerSecond: lambda value: ((value) / 0.01),
+        
+        SpeedUnits.DecimeterPerSecond: lambda value: ((value) / 0.1),
+        
+        SpeedUnits.KilometerPerSecond: lambda value: ((value) / 1000.0),
+        
+        SpeedUnits.NanometerPerMinute: lambda value: ((value * 60) / 1e-09),
+        
+        SpeedUnits.MicrometerPerMinute: lambda value: ((value * 60) / 1e-06),
+        
+        SpeedUnits.MillimeterPerMinute: lambda value: ((value * 60) / 0.001),
+        
+        SpeedUnits.CentimeterPerMinute: lambda value: ((value * 60) / 0.01),
+        
+        SpeedUnits.DecimeterPerMinute: lambda value: ((value * 60) / 0.1),
+        
+        SpeedUnits.KilometerPerMinute: lambda value: ((value * 60) / 1000.0),
+        
+        SpeedUnits.MillimeterPerHour: lambda value: ((value * 3600) / 0.001),
+        
+        SpeedUnits.CentimeterPerHour: lambda value: ((value * 3600) / 0.01),
+        
+        SpeedUnits.KilometerPerHour: lambda value: ((value * 3600) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: SpeedUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == SpeedUnits.MeterPerSecond:
-            return (value)
+        SpeedUnits.MeterPerSecond: lambda value: (value),
         
-        if from_unit == SpeedUnits.MeterPerMinute:
-            return (value * 60)
+        SpeedUnits.MeterPerMinute: lambda value: (value / 60),
         
-        if from_unit == SpeedUnits.MeterPerHour:
-            return (value * 3600)
+        SpeedUnits.MeterPerHour: lambda value: (value / 3600),
         
-        if from_unit == SpeedUnits.FootPerSecond:
-            return (value / 0.3048)
+        SpeedUnits.FootPerSecond: lambda value: (value * 0.3048),
         
-        if from_unit == SpeedUnits.FootPerMinute:
-            return (value / 0.3048 * 60)
+        SpeedUnits.FootPerMinute: lambda value: (value * 0.3048 / 60),
         
-        if from_unit == SpeedUnits.FootPerHour:
-            return (value / 0.3048 * 3600)
+        SpeedUnits.FootPerHour: lambda value: (value * 0.3048 / 3600),
         
-        if from_unit == SpeedUnits.UsSurveyFootPerSecond:
-            return (value * 3937 / 1200)
+        SpeedUnits.UsSurveyFootPerSecond: lambda value: (value * 1200 / 3937),
         
-        if from_unit == SpeedUnits.UsSurveyFootPerMinute:
-            return ((value * 3937 / 1200) * 60)
+        SpeedUnits.UsSurveyFootPerMinute: lambda value: ((value * 1200 / 3937) / 60),
         
-        if from_unit == SpeedUnits.UsSurveyFootPerHour:
-            return ((value * 3937 / 1200) * 3600)
+        SpeedUnits.UsSurveyFootPerHour: lambda value: ((value * 1200 / 3937) / 3600),
         
-        if from_unit == SpeedUnits.InchPerSecond:
-            return (value / 2.54e-2)
+        SpeedUnits.InchPerSecond: lambda value: (value * 2.54e-2),
         
-        if from_unit == SpeedUnits.InchPerMinute:
-            return ((value / 2.54e-2) * 60)
+        SpeedUnits.InchPerMinute: lambda value: ((value / 60) * 2.54e-2),
         
-        if from_unit == SpeedUnits.InchPerHour:
-            return ((value / 2.54e-2) * 3600)
+        SpeedUnits.InchPerHour: lambda value: ((value / 3600) * 2.54e-2),
         
-        if from_unit == SpeedUnits.YardPerSecond:
-            return (value / 0.9144)
+        SpeedUnits.YardPerSecond: lambda value: (value * 0.9144),
         
-        if from_unit == SpeedUnits.YardPerMinute:
-            return (value / 0.9144 * 60)
+        SpeedUnits.YardPerMinute: lambda value: (value * 0.9144 / 60),
         
-        if from_unit == SpeedUnits.YardPerHour:
-            return (value / 0.9144 * 3600)
+        SpeedUnits.YardPerHour: lambda value: (value * 0.9144 / 3600),
         
-        if from_unit == SpeedUnits.Knot:
-            return (value / (1852.0 / 3600.0))
+        SpeedUnits.Knot: lambda value: (value * (1852.0 / 3600.0)),
         
-        if from_unit == SpeedUnits.MilePerHour:
-            return (value / 0.44704)
+        SpeedUnits.MilePerHour: lambda value: (value * 0.44704),
         
-        if from_unit == SpeedUnits.Mach:
-            return (value / 340.29)
+        SpeedUnits.Mach: lambda value: (value * 340.29),
         
-        if from_unit == SpeedUnits.NanometerPerSecond:
-            return ((value) / 1e-09)
+        SpeedUnits.NanometerPerSecond: lambda value: ((value) * 1e-09),
         
-        if from_unit == SpeedUnits.MicrometerPerSecond:
-            return ((value) / 1e-06)
+        SpeedUnits.MicrometerPerSecond: lambda value: ((value) * 1e-06),
         
-        if from_unit == SpeedUnits.MillimeterPerSecond:
-            return ((value) / 0.001)
+        SpeedUnits.MillimeterPerSecond: lambda value: ((value) * 0.001),
         
-        if from_unit == SpeedUnits.CentimeterPerSecond:
-            return ((value) / 0.01)
+        SpeedUnits.CentimeterPerSecond: lambda value: ((value) * 0.01),
         
-        if from_unit == SpeedUnits.DecimeterPerSecond:
-            return ((value) / 0.1)
+        SpeedUnits.DecimeterPerSecond: lambda value: ((value) * 0.1),
         
-        if from_unit == SpeedUnits.KilometerPerSecond:
-            return ((value) / 1000.0)
+        SpeedUnits.KilometerPerSecond: lambda value: ((value) * 1000.0),
         
-        if from_unit == SpeedUnits.NanometerPerMinute:
-            return ((value * 60) / 1e-09)
+        SpeedUnits.NanometerPerMinute: lambda value: ((value / 60) * 1e-09),
         
-        if from_unit == SpeedUnits.MicrometerPerMinute:
-            return ((value * 60) / 1e-06)
+        SpeedUnits.MicrometerPerMinute: lambda value: ((value / 60) * 1e-06),
         
-        if from_unit == SpeedUnits.MillimeterPerMinute:
-            return ((value * 60) / 0.001)
+        SpeedUnits.MillimeterPerMinute: lambda value: ((value / 60) * 0.001),
         
-        if from_unit == SpeedUnits.CentimeterPerMinute:
-            return ((value * 60) / 0.01)
+        SpeedUnits.CentimeterPerMinute: lambda value: ((value / 60) * 0.01),
         
-        if from_unit == SpeedUnits.DecimeterPerMinute:
-            return ((value * 60) / 0.1)
+        SpeedUnits.DecimeterPerMinute: lambda value: ((value / 60) * 0.1),
         
-        if from_unit == SpeedUnits.KilometerPerMinute:
-            return ((value * 60) / 1000.0)
+        SpeedUnits.KilometerPerMinute: lambda value: ((value / 60) * 1000.0),
         
-        if from_unit == SpeedUnits.MillimeterPerHour:
-            return ((value * 3600) / 0.001)
+        SpeedUnits.MillimeterPerHour: lambda value: ((value / 3600) * 0.001),
         
-        if from_unit == SpeedUnits.CentimeterPerHour:
-            return ((value * 3600) / 0.01)
+        SpeedUnits.CentimeterPerHour: lambda value: ((value / 3600) * 0.01),
         
-        if from_unit == SpeedUnits.KilometerPerHour:
-            return ((value * 3600) / 1000.0)
+        SpeedUnits.KilometerPerHour: lambda value: ((value / 3600) * 1000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        SpeedUnits.MeterPerSecond: ('1', '0'),
+        
+        SpeedUnits.MeterPerMinute: ('60', '0'),
+        
+        SpeedUnits.MeterPerHour: ('3600', '0'),
+        
+        SpeedUnits.FootPerSecond: ('1250/381', '0'),
+        
+        SpeedUnits.FootPerMinute: ('25000/127', '0'),
+        
+        SpeedUnits.FootPerHour: ('1500000/127', '0'),
+        
+        SpeedUnits.UsSurveyFootPerSecond: ('3937/1200', '0'),
+        
+        SpeedUnits.UsSurveyFootPerMinute: ('3937/20', '0'),
+        
+        SpeedUnits.UsSurveyFootPerHour: ('11811', '0'),
+        
+        SpeedUnits.InchPerSecond: ('5000/127', '0'),
+        
+        SpeedUnits.InchPerMinute: ('300000/127', '0'),
+        
+        SpeedUnits.InchPerHour: ('18000000/127', '0'),
+        
+        SpeedUnits.YardPerSecond: ('1250/1143', '0'),
+        
+        SpeedUnits.YardPerMinute: ('25000/381', '0'),
+        
+        SpeedUnits.YardPerHour: ('500000/127', '0'),
+        
+        SpeedUnits.Knot: ('900/463', '0'),
+        
+        SpeedUnits.MilePerHour: ('3125/1397', '0'),
+        
+        SpeedUnits.Mach: ('100/34029', '0'),
+        
+        SpeedUnits.NanometerPerSecond: ('1000000000', '0'),
+        
+        SpeedUnits.MicrometerPerSecond: ('1000000', '0'),
+        
+        SpeedUnits.MillimeterPerSecond: ('1000', '0'),
+        
+        SpeedUnits.CentimeterPerSecond: ('100', '0'),
+        
+        SpeedUnits.DecimeterPerSecond: ('10', '0'),
+        
+        SpeedUnits.KilometerPerSecond: ('1/1000', '0'),
+        
+        SpeedUnits.NanometerPerMinute: ('60000000000', '0'),
+        
+        SpeedUnits.MicrometerPerMinute: ('60000000', '0'),
+        
+        SpeedUnits.MillimeterPerMinute: ('60000', '0'),
+        
+        SpeedUnits.CentimeterPerMinute: ('6000', '0'),
+        
+        SpeedUnits.DecimeterPerMinute: ('600', '0'),
+        
+        SpeedUnits.KilometerPerMinute: ('3/50', '0'),
+        
+        SpeedUnits.MillimeterPerHour: ('3600000', '0'),
+        
+        SpeedUnits.CentimeterPerHour: ('360000', '0'),
+        
+        SpeedUnits.KilometerPerHour: ('18/5', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: SpeedUnits) -> float:
+    _affine_to_base = {
+        
+        SpeedUnits.MeterPerSecond: ('1', '0'),
+        
+        SpeedUnits.MeterPerMinute: ('1/60', '0'),
+        
+        SpeedUnits.MeterPerHour: ('1/3600', '0'),
+        
+        SpeedUnits.FootPerSecond: ('381/1250', '0'),
+        
+        SpeedUnits.FootPerMinute: ('127/25000', '0'),
+        
+        SpeedUnits.FootPerHour: ('127/1500000', '0'),
+        
+        SpeedUnits.UsSurveyFootPerSecond: ('1200/3937', '0'),
+        
+        SpeedUnits.UsSurveyFootPerMinute: ('20/3937', '0'),
+        
+        SpeedUnits.UsSurveyFootPerHour: ('1/11811', '0'),
+        
+        SpeedUnits.InchPerSecond: ('127/5000', '0'),
+        
+        SpeedUnits.InchPerMinute: ('127/300000', '0'),
+        
+        SpeedUnits.InchPerHour: ('127/18000000', '0'),
+        
+        SpeedUnits.YardPerSecond: ('1143/1250', '0'),
+        
+        SpeedUnits.YardPerMinute: ('381/25000', '0'),
+        
+        SpeedUnits.YardPerHour: ('127/500000', '0'),
+        
+        SpeedUnits.Knot: ('463/900', '0'),
         
-        if to_unit == SpeedUnits.MeterPerSecond:
-            return (value)
+        SpeedUnits.MilePerHour: ('1397/3125', '0'),
         
-        if to_unit == SpeedUnits.MeterPerMinute:
-            return (value / 60)
+        SpeedUnits.Mach: ('34029/100', '0'),
         
-        if to_unit == SpeedUnits.MeterPerHour:
-            return (value / 3600)
+        SpeedUnits.NanometerPerSecond: ('1/1000000000', '0'),
         
-        if to_unit == SpeedUnits.FootPerSecond:
-            return (value * 0.3048)
+        SpeedUnits.MicrometerPerSecond: ('1/1000000', '0'),
         
-        if to_unit == SpeedUnits.FootPerMinute:
-            return (value * 0.3048 / 60)
+        SpeedUnits.MillimeterPerSecond: ('1/1000', '0'),
         
-        if to_unit == SpeedUnits.FootPerHour:
-            return (value * 0.3048 / 3600)
+        SpeedUnits.CentimeterPerSecond: ('1/100', '0'),
         
-        if to_unit == SpeedUnits.UsSurveyFootPerSecond:
-            return (value * 1200 / 3937)
+        SpeedUnits.DecimeterPerSecond: ('1/10', '0'),
         
-        if to_unit == SpeedUnits.UsSurveyFootPerMinute:
-            return ((value * 1200 / 3937) / 60)
+        SpeedUnits.KilometerPerSecond: ('1000', '0'),
         
-        if to_unit == SpeedUnits.UsSurveyFootPerHour:
-            return ((value * 1200 / 3937) / 3600)
+        SpeedUnits.NanometerPerMinute: ('1/60000000000', '0'),
         
-        if to_unit == SpeedUnits.InchPerSecond:
-            return (value * 2.54e-2)
+        SpeedUnits.MicrometerPerMinute: ('1/60000000', '0'),
         
-        if to_unit == SpeedUnits.InchPerMinute:
-            return ((value / 60) * 2.54e-2)
+        SpeedUnits.MillimeterPerMinute: ('1/60000', '0'),
         
-        if to_unit == SpeedUnits.InchPerHour:
-            return ((value / 3600) * 2.54e-2)
+        SpeedUnits.CentimeterPerMinute: ('1/6000', '0'),
         
-        if to_unit == SpeedUnits.YardPerSecond:
-            return (value * 0.9144)
+        SpeedUnits.DecimeterPerMinute: ('1/600', '0'),
         
-        if to_unit == SpeedUnits.YardPerMinute:
-            return (value * 0.9144 / 60)
+        SpeedUnits.KilometerPerMinute: ('50/3', '0'),
         
-        if to_unit == SpeedUnits.YardPerHour:
-            return (value * 0.9144 / 3600)
+        SpeedUnits.MillimeterPerHour: ('1/3600000', '0'),
         
-        if to_unit == SpeedUnits.Knot:
-            return (value * (1852.0 / 3600.0))
+        SpeedUnits.CentimeterPerHour: ('1/360000', '0'),
         
-        if to_unit == SpeedUnits.MilePerHour:
-            return (value * 0.44704)
+        SpeedUnits.KilometerPerHour: ('5/18', '0'),
         
-        if to_unit == SpeedUnits.Mach:
-            return (value * 340.29)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        SpeedUnits.MeterPerSecond: ('m/s',),
+        
+        SpeedUnits.MeterPerMinute: ('m/min',),
+        
+        SpeedUnits.MeterPerHour: ('m/h',),
+        
+        SpeedUnits.FootPerSecond: ('ft/s',),
+        
+        SpeedUnits.FootPerMinute: ('ft/min',),
+        
+        SpeedUnits.FootPerHour: ('ft/h',),
+        
+        SpeedUnits.UsSurveyFootPerSecond: ('ftUS/s',),
+        
+        SpeedUnits.UsSurveyFootPerMinute: ('ftUS/min',),
+        
+        SpeedUnits.UsSurveyFootPerHour: ('ftUS/h',),
+        
+        SpeedUnits.InchPerSecond: ('in/s',),
+        
+        SpeedUnits.InchPerMinute: ('in/min',),
+        
+        SpeedUnits.InchPerHour: ('in/h',),
         
-        if to_unit == SpeedUnits.NanometerPerSecond:
-            return ((value) * 1e-09)
+        SpeedUnits.YardPerSecond: ('yd/s',),
         
-        if to_unit == SpeedUnits.MicrometerPerSecond:
-            return ((value) * 1e-06)
+        SpeedUnits.YardPerMinute: ('yd/min',),
         
-        if to_unit == SpeedUnits.MillimeterPerSecond:
-            return ((value) * 0.001)
+        SpeedUnits.YardPerHour: ('yd/h',),
         
-        if to_unit == SpeedUnits.CentimeterPerSecond:
-            return ((value) * 0.01)
+        SpeedUnits.Knot: ('kn',),
         
-        if to_unit == SpeedUnits.DecimeterPerSecond:
-            return ((value) * 0.1)
+        SpeedUnits.MilePerHour: ('mph',),
         
-        if to_unit == SpeedUnits.KilometerPerSecond:
-            return ((value) * 1000.0)
+        SpeedUnits.Mach: ('M',),
         
-        if to_unit == SpeedUnits.NanometerPerMinute:
-            return ((value / 60) * 1e-09)
+        SpeedUnits.NanometerPerSecond: ('nm/s',),
         
-        if to_unit == SpeedUnits.MicrometerPerMinute:
-            return ((value / 60) * 1e-06)
+        SpeedUnits.MicrometerPerSecond: ('μm/s',),
         
-        if to_unit == SpeedUnits.MillimeterPerMinute:
-            return ((value / 60) * 0.001)
+        SpeedUnits.MillimeterPerSecond: ('mm/s',),
         
-        if to_unit == SpeedUnits.CentimeterPerMinute:
-            return ((value / 60) * 0.01)
+        SpeedUnits.CentimeterPerSecond: ('cm/s',),
         
-        if to_unit == SpeedUnits.DecimeterPerMinute:
-            return ((value / 60) * 0.1)
+        SpeedUnits.DecimeterPerSecond: ('dm/s',),
         
-        if to_unit == SpeedUnits.KilometerPerMinute:
-            return ((value / 60) * 1000.0)
+        SpeedUnits.KilometerPerSecond: ('km/s',),
         
-        if to_unit == SpeedUnits.MillimeterPerHour:
-            return ((value / 3600) * 0.001)
+        SpeedUnits.NanometerPerMinute: ('nm/min',),
         
-        if to_unit == SpeedUnits.CentimeterPerHour:
-            return ((value / 3600) * 0.01)
+        SpeedUnits.MicrometerPerMinute: ('μm/min',),
         
-        if to_unit == SpeedUnits.KilometerPerHour:
-            return ((value / 3600) * 1000.0)
+        SpeedUnits.MillimeterPerMinute: ('mm/min',),
         
-        return None
+        SpeedUnits.CentimeterPerMinute: ('cm/min',),
+        
+        SpeedUnits.DecimeterPerMinute: ('dm/min',),
+        
+        SpeedUnits.KilometerPerMinute: ('km/min',),
+        
+        SpeedUnits.MillimeterPerHour: ('mm/h',),
+        
+        SpeedUnits.CentimeterPerHour: ('cm/h',),
+        
+        SpeedUnits.KilometerPerHour: ('km/h',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: SpeedUnits = SpeedUnits.MeterPerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: SpeedUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: SpeedUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: SpeedUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: SpeedUnits, to_unit: SpeedUnits) -> float:
+        """
+        Convert a value from one Speed unit to another, without creating a Speed instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: SpeedUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: SpeedUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Speed._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: SpeedUnits, to_unit: SpeedUnits) -> List[float]:
+        """
+        Convert many values from one Speed unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: SpeedUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: SpeedUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Speed._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: SpeedUnits, to_unit: SpeedUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Speed._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: SpeedUnits, to_unit: SpeedUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Speed unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: SpeedUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: SpeedUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Speed._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: SpeedUnits = SpeedUnits.MeterPerSecond) -> Speed:
+        """
+        Create a new instance of Speed holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: SpeedUnits
+        :return: A new instance of Speed.
+        :rtype: Speed
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Speed._from_exact(value, from_unit)
+
+    def to_exact(self, unit: SpeedUnits = SpeedUnits.MeterPerSecond) -> Fraction:
+        """
+        Get the exact value of the Speed in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (MeterPerSecond).
+        :type unit: SpeedUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Speed:
+        """
+        Parse a Speed from a value followed by a unit abbreviation, e.g. "1 m/s".
 
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Speed.
+        :rtype: Speed
+        :raises ValueError: When the string is not a valid or an ambiguous Speed.
+        """
+        return Speed._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Speed]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Speed._try_parse(text)
+
+    def to_binary(self, unit: Optional[SpeedUnits] = None) -> bytes:
+        """
+        Encode the Speed to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: SpeedUnits
+        :return: The encoded Speed.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Speed:
+        """
+        Decode a Speed encoded by to_binary.
+
+        :param data: The encoded Speed, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Speed.
+        :rtype: Speed
+        :raises ValueError: When the data is not a valid encoded Speed.
+        """
+        return Speed._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[SpeedUnits] = None) -> dict:
+        """
+        Get the Speed DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (MeterPerSecond).
+        :type hold_in_unit: SpeedUnits
+        :return: The Speed DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[SpeedUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Speed:
+        """
+        Create a new instance of Speed from its DTO.
+
+        :param dto: The Speed DTO, the unit is the SpeedUnits value or name.
+        :type dto: dict
+        :return: A new instance of Speed.
+        :rtype: Speed
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Speed._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Speed:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Speed._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -973,10 +1323,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__meters_per_second != None:
-            return self.__meters_per_second
-        self.__meters_per_second = self.__convert_from_base(SpeedUnits.MeterPerSecond)
-        return self.__meters_per_second
+        return self._cached_convert(SpeedUnits.MeterPerSecond)
 
     
     @property
@@ -984,10 +1331,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__meters_per_minutes != None:
-            return self.__meters_per_minutes
-        self.__meters_per_minutes = self.__convert_from_base(SpeedUnits.MeterPerMinute)
-        return self.__meters_per_minutes
+        return self._cached_convert(SpeedUnits.MeterPerMinute)
 
     
     @property
@@ -995,10 +1339,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__meters_per_hour != None:
-            return self.__meters_per_hour
-        self.__meters_per_hour = self.__convert_from_base(SpeedUnits.MeterPerHour)
-        return self.__meters_per_hour
+        return self._cached_convert(SpeedUnits.MeterPerHour)
 
     
     @property
@@ -1006,10 +1347,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__feet_per_second != None:
-            return self.__feet_per_second
-        self.__feet_per_second = self.__convert_from_base(SpeedUnits.FootPerSecond)
-        return self.__feet_per_second
+        return self._cached_convert(SpeedUnits.FootPerSecond)
 
     
     @property
@@ -1017,10 +1355,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__feet_per_minute != None:
-            return self.__feet_per_minute
-        self.__feet_per_minute = self.__convert_from_base(SpeedUnits.FootPerMinute)
-        return self.__feet_per_minute
+        return self._cached_convert(SpeedUnits.FootPerMinute)
 
     
     @property
@@ -1028,10 +1363,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__feet_per_hour != None:
-            return self.__feet_per_hour
-        self.__feet_per_hour = self.__convert_from_base(SpeedUnits.FootPerHour)
-        return self.__feet_per_hour
+        return self._cached_convert(SpeedUnits.FootPerHour)
 
     
     @property
@@ -1039,10 +1371,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__us_survey_feet_per_second != None:
-            return self.__us_survey_feet_per_second
-        self.__us_survey_feet_per_second = self.__convert_from_base(SpeedUnits.UsSurveyFootPerSecond)
-        return self.__us_survey_feet_per_second
+        return self._cached_convert(SpeedUnits.UsSurveyFootPerSecond)
 
     
     @property
@@ -1050,10 +1379,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__us_survey_feet_per_minute != None:
-            return self.__us_survey_feet_per_minute
-        self.__us_survey_feet_per_minute = self.__convert_from_base(SpeedUnits.UsSurveyFootPerMinute)
-        return self.__us_survey_feet_per_minute
+        return self._cached_convert(SpeedUnits.UsSurveyFootPerMinute)
 
     
     @property
@@ -1061,10 +1387,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__us_survey_feet_per_hour != None:
-            return self.__us_survey_feet_per_hour
-        self.__us_survey_feet_per_hour = self.__convert_from_base(SpeedUnits.UsSurveyFootPerHour)
-        return self.__us_survey_feet_per_hour
+        return self._cached_convert(SpeedUnits.UsSurveyFootPerHour)
 
     
     @property
@@ -1072,10 +1395,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__inches_per_second != None:
-            return self.__inches_per_second
-        self.__inches_per_second = self.__convert_from_base(SpeedUnits.InchPerSecond)
-        return self.__inches_per_second
+        return self._cached_convert(SpeedUnits.InchPerSecond)
 
     
     @property
@@ -1083,10 +1403,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__inches_per_minute != None:
-            return self.__inches_per_minute
-        self.__inches_per_minute = self.__convert_from_base(SpeedUnits.InchPerMinute)
-        return self.__inches_per_minute
+        return self._cached_convert(SpeedUnits.InchPerMinute)
 
     
     @property
@@ -1094,10 +1411,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__inches_per_hour != None:
-            return self.__inches_per_hour
-        self.__inches_per_hour = self.__convert_from_base(SpeedUnits.InchPerHour)
-        return self.__inches_per_hour
+        return self._cached_convert(SpeedUnits.InchPerHour)
 
     
     @property
@@ -1105,10 +1419,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__yards_per_second != None:
-            return self.__yards_per_second
-        self.__yards_per_second = self.__convert_from_base(SpeedUnits.YardPerSecond)
-        return self.__yards_per_second
+        return self._cached_convert(SpeedUnits.YardPerSecond)
 
     
     @property
@@ -1116,10 +1427,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__yards_per_minute != None:
-            return self.__yards_per_minute
-        self.__yards_per_minute = self.__convert_from_base(SpeedUnits.YardPerMinute)
-        return self.__yards_per_minute
+        return self._cached_convert(SpeedUnits.YardPerMinute)
 
     
     @property
@@ -1127,10 +1435,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__yards_per_hour != None:
-            return self.__yards_per_hour
-        self.__yards_per_hour = self.__convert_from_base(SpeedUnits.YardPerHour)
-        return self.__yards_per_hour
+        return self._cached_convert(SpeedUnits.YardPerHour)
 
     
     @property
@@ -1138,10 +1443,7 @@ class Speed(AbstractMeasure):
         """
         The knot, by definition, is a unit of speed equals to 1 nautical mile per hour, which is exactly 1852.000 metres per hour. The length of the internationally agreed nautical mile is 1852 m. The US adopted the international definition in 1954, the UK adopted the international nautical mile definition in 1970.
         """
-        if self.__knots != None:
-            return self.__knots
-        self.__knots = self.__convert_from_base(SpeedUnits.Knot)
-        return self.__knots
+        return self._cached_convert(SpeedUnits.Knot)
 
     
     @property
@@ -1149,10 +1451,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__miles_per_hour != None:
-            return self.__miles_per_hour
-        self.__miles_per_hour = self.__convert_from_base(SpeedUnits.MilePerHour)
-        return self.__miles_per_hour
+        return self._cached_convert(SpeedUnits.MilePerHour)
 
     
     @property
@@ -1160,10 +1459,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__mach != None:
-            return self.__mach
-        self.__mach = self.__convert_from_base(SpeedUnits.Mach)
-        return self.__mach
+        return self._cached_convert(SpeedUnits.Mach)
 
     
     @property
@@ -1171,10 +1467,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__nanometers_per_second != None:
-            return self.__nanometers_per_second
-        self.__nanometers_per_second = self.__convert_from_base(SpeedUnits.NanometerPerSecond)
-        return self.__nanometers_per_second
+        return self._cached_convert(SpeedUnits.NanometerPerSecond)
 
     
     @property
@@ -1182,10 +1475,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__micrometers_per_second != None:
-            return self.__micrometers_per_second
-        self.__micrometers_per_second = self.__convert_from_base(SpeedUnits.MicrometerPerSecond)
-        return self.__micrometers_per_second
+        return self._cached_convert(SpeedUnits.MicrometerPerSecond)
 
     
     @property
@@ -1193,10 +1483,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__millimeters_per_second != None:
-            return self.__millimeters_per_second
-        self.__millimeters_per_second = self.__convert_from_base(SpeedUnits.MillimeterPerSecond)
-        return self.__millimeters_per_second
+        return self._cached_convert(SpeedUnits.MillimeterPerSecond)
 
     
     @property
@@ -1204,10 +1491,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__centimeters_per_second != None:
-            return self.__centimeters_per_second
-        self.__centimeters_per_second = self.__convert_from_base(SpeedUnits.CentimeterPerSecond)
-        return self.__centimeters_per_second
+        return self._cached_convert(SpeedUnits.CentimeterPerSecond)
 
     
     @property
@@ -1215,10 +1499,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__decimeters_per_second != None:
-            return self.__decimeters_per_second
-        self.__decimeters_per_second = self.__convert_from_base(SpeedUnits.DecimeterPerSecond)
-        return self.__decimeters_per_second
+        return self._cached_convert(SpeedUnits.DecimeterPerSecond)
 
     
     @property
@@ -1226,10 +1507,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__kilometers_per_second != None:
-            return self.__kilometers_per_second
-        self.__kilometers_per_second = self.__convert_from_base(SpeedUnits.KilometerPerSecond)
-        return self.__kilometers_per_second
+        return self._cached_convert(SpeedUnits.KilometerPerSecond)
 
     
     @property
@@ -1237,10 +1515,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__nanometers_per_minutes != None:
-            return self.__nanometers_per_minutes
-        self.__nanometers_per_minutes = self.__convert_from_base(SpeedUnits.NanometerPerMinute)
-        return self.__nanometers_per_minutes
+        return self._cached_convert(SpeedUnits.NanometerPerMinute)
 
     
     @property
@@ -1248,10 +1523,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__micrometers_per_minutes != None:
-            return self.__micrometers_per_minutes
-        self.__micrometers_per_minutes = self.__convert_from_base(SpeedUnits.MicrometerPerMinute)
-        return self.__micrometers_per_minutes
+        return self._cached_convert(SpeedUnits.MicrometerPerMinute)
 
     
     @property
@@ -1259,10 +1531,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__millimeters_per_minutes != None:
-            return self.__millimeters_per_minutes
-        self.__millimeters_per_minutes = self.__convert_from_base(SpeedUnits.MillimeterPerMinute)
-        return self.__millimeters_per_minutes
+        return self._cached_convert(SpeedUnits.MillimeterPerMinute)
 
     
     @property
@@ -1270,10 +1539,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__centimeters_per_minutes != None:
-            return self.__centimeters_per_minutes
-        self.__centimeters_per_minutes = self.__convert_from_base(SpeedUnits.CentimeterPerMinute)
-        return self.__centimeters_per_minutes
+        return self._cached_convert(SpeedUnits.CentimeterPerMinute)
 
     
     @property
@@ -1281,10 +1547,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__decimeters_per_minutes != None:
-            return self.__decimeters_per_minutes
-        self.__decimeters_per_minutes = self.__convert_from_base(SpeedUnits.DecimeterPerMinute)
-        return self.__decimeters_per_minutes
+        return self._cached_convert(SpeedUnits.DecimeterPerMinute)
 
     
     @property
@@ -1292,10 +1555,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__kilometers_per_minutes != None:
-            return self.__kilometers_per_minutes
-        self.__kilometers_per_minutes = self.__convert_from_base(SpeedUnits.KilometerPerMinute)
-        return self.__kilometers_per_minutes
+        return self._cached_convert(SpeedUnits.KilometerPerMinute)
 
     
     @property
@@ -1303,10 +1563,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__millimeters_per_hour != None:
-            return self.__millimeters_per_hour
-        self.__millimeters_per_hour = self.__convert_from_base(SpeedUnits.MillimeterPerHour)
-        return self.__millimeters_per_hour
+        return self._cached_convert(SpeedUnits.MillimeterPerHour)
 
     
     @property
@@ -1314,10 +1571,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__centimeters_per_hour != None:
-            return self.__centimeters_per_hour
-        self.__centimeters_per_hour = self.__convert_from_base(SpeedUnits.CentimeterPerHour)
-        return self.__centimeters_per_hour
+        return self._cached_convert(SpeedUnits.CentimeterPerHour)
 
     
     @property
@@ -1325,10 +1579,7 @@ class Speed(AbstractMeasure):
         """
         
         """
-        if self.__kilometers_per_hour != None:
-            return self.__kilometers_per_hour
-        self.__kilometers_per_hour = self.__convert_from_base(SpeedUnits.KilometerPerHour)
-        return self.__kilometers_per_hour
+        return self._cached_convert(SpeedUnits.KilometerPerHour)
 
     
     def to_string(self, unit: SpeedUnits = SpeedUnits.MeterPerSecond) -> str:
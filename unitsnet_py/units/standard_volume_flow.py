@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class StandardVolumeFlowUnits(Enum):
         """
             StandardVolumeFlowUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         StandardCubicMeterPerSecond = 'standard_cubic_meter_per_second'
         """
@@ -64,97 +75,340 @@ class StandardVolumeFlow(AbstractMeasure):
         value (float): The value.
         from_unit (StandardVolumeFlowUnits): The StandardVolumeFlow unit to create from, The default unit is StandardCubicMeterPerSecond
     """
-    def __init__(self, value: float, from_unit: StandardVolumeFlowUnits = StandardVolumeFlowUnits.StandardCubicMeterPerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = StandardVolumeFlowUnits
+
+    _base_unit = StandardVolumeFlowUnits.StandardCubicMeterPerSecond
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 102
+
+    _binary_unit_ids = {
         
-        self.__standard_cubic_meters_per_second = None
+        StandardVolumeFlowUnits.StandardCubicMeterPerSecond: 0,
         
-        self.__standard_cubic_meters_per_minute = None
+        StandardVolumeFlowUnits.StandardCubicMeterPerMinute: 1,
         
-        self.__standard_cubic_meters_per_hour = None
+        StandardVolumeFlowUnits.StandardCubicMeterPerHour: 2,
         
-        self.__standard_cubic_meters_per_day = None
+        StandardVolumeFlowUnits.StandardCubicMeterPerDay: 3,
         
-        self.__standard_cubic_centimeters_per_minute = None
+        StandardVolumeFlowUnits.StandardCubicCentimeterPerMinute: 4,
         
-        self.__standard_liters_per_minute = None
+        StandardVolumeFlowUnits.StandardLiterPerMinute: 5,
         
-        self.__standard_cubic_feet_per_second = None
+        StandardVolumeFlowUnits.StandardCubicFootPerSecond: 6,
         
-        self.__standard_cubic_feet_per_minute = None
+        StandardVolumeFlowUnits.StandardCubicFootPerMinute: 7,
         
-        self.__standard_cubic_feet_per_hour = None
+        StandardVolumeFlowUnits.StandardCubicFootPerHour: 8,
         
+    }
 
-    def convert(self, unit: StandardVolumeFlowUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerSecond: lambda value: (value),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerMinute: lambda value: (value * 60),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerHour: lambda value: (value * 3600),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerDay: lambda value: (value * 86400),
+        
+        StandardVolumeFlowUnits.StandardCubicCentimeterPerMinute: lambda value: (value * 6e7),
+        
+        StandardVolumeFlowUnits.StandardLiterPerMinute: lambda value: (value * 60000),
+        
+        StandardVolumeFlowUnits.StandardCubicFootPerSecond: lambda value: (value * 35.314666721),
+        
+        StandardVolumeFlowUnits.StandardCubicFootPerMinute: lambda value: (value * 2118.88000326),
+        
+        StandardVolumeFlowUnits.StandardCubicFootPerHour: lambda value: (value / 7.8657907199999087346816086183876e-6),
+        
+    }
 
-    def __convert_from_base(self, from_unit: StandardVolumeFlowUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerSecond: lambda value: (value),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerMinute: lambda value: (value / 60),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerHour: lambda value: (value / 3600),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerDay: lambda value: (value / 86400),
+        
+        StandardVolumeFlowUnits.StandardCubicCentimeterPerMinute: lambda value: (value / 6e7),
+        
+        StandardVolumeFlowUnits.StandardLiterPerMinute: lambda value: (value / 60000),
         
-        if from_unit == StandardVolumeFlowUnits.StandardCubicMeterPerSecond:
-            return (value)
+        StandardVolumeFlowUnits.StandardCubicFootPerSecond: lambda value: (value / 35.314666721),
         
-        if from_unit == StandardVolumeFlowUnits.StandardCubicMeterPerMinute:
-            return (value * 60)
+        StandardVolumeFlowUnits.StandardCubicFootPerMinute: lambda value: (value / 2118.88000326),
         
-        if from_unit == StandardVolumeFlowUnits.StandardCubicMeterPerHour:
-            return (value * 3600)
+        StandardVolumeFlowUnits.StandardCubicFootPerHour: lambda value: (value * 7.8657907199999087346816086183876e-6),
         
-        if from_unit == StandardVolumeFlowUnits.StandardCubicMeterPerDay:
-            return (value * 86400)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerSecond: ('1', '0'),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerMinute: ('60', '0'),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerHour: ('3600', '0'),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerDay: ('86400', '0'),
         
-        if from_unit == StandardVolumeFlowUnits.StandardCubicCentimeterPerMinute:
-            return (value * 6e7)
+        StandardVolumeFlowUnits.StandardCubicCentimeterPerMinute: ('60000000', '0'),
         
-        if from_unit == StandardVolumeFlowUnits.StandardLiterPerMinute:
-            return (value * 60000)
+        StandardVolumeFlowUnits.StandardLiterPerMinute: ('60000', '0'),
         
-        if from_unit == StandardVolumeFlowUnits.StandardCubicFootPerSecond:
-            return (value * 35.314666721)
+        StandardVolumeFlowUnits.StandardCubicFootPerSecond: ('35314666721/1000000000', '0'),
         
-        if from_unit == StandardVolumeFlowUnits.StandardCubicFootPerMinute:
-            return (value * 2118.88000326)
+        StandardVolumeFlowUnits.StandardCubicFootPerMinute: ('105944000163/50000000', '0'),
         
-        if from_unit == StandardVolumeFlowUnits.StandardCubicFootPerHour:
-            return (value / 7.8657907199999087346816086183876e-6)
+        StandardVolumeFlowUnits.StandardCubicFootPerHour: ('2500000000000000000000000000000000000/19664476799999771836704021545969', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerSecond: ('1', '0'),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerMinute: ('1/60', '0'),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerHour: ('1/3600', '0'),
+        
+        StandardVolumeFlowUnits.StandardCubicMeterPerDay: ('1/86400', '0'),
+        
+        StandardVolumeFlowUnits.StandardCubicCentimeterPerMinute: ('1/60000000', '0'),
+        
+        StandardVolumeFlowUnits.StandardLiterPerMinute: ('1/60000', '0'),
+        
+        StandardVolumeFlowUnits.StandardCubicFootPerSecond: ('1000000000/35314666721', '0'),
+        
+        StandardVolumeFlowUnits.StandardCubicFootPerMinute: ('50000000/105944000163', '0'),
+        
+        StandardVolumeFlowUnits.StandardCubicFootPerHour: ('19664476799999771836704021545969/2500000000000000000000000000000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: StandardVolumeFlowUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == StandardVolumeFlowUnits.StandardCubicMeterPerSecond:
-            return (value)
+        StandardVolumeFlowUnits.StandardCubicMeterPerSecond: ('Sm³/s',),
         
-        if to_unit == StandardVolumeFlowUnits.StandardCubicMeterPerMinute:
-            return (value / 60)
+        StandardVolumeFlowUnits.StandardCubicMeterPerMinute: ('Sm³/min',),
         
-        if to_unit == StandardVolumeFlowUnits.StandardCubicMeterPerHour:
-            return (value / 3600)
+        StandardVolumeFlowUnits.StandardCubicMeterPerHour: ('Sm³/h',),
         
-        if to_unit == StandardVolumeFlowUnits.StandardCubicMeterPerDay:
-            return (value / 86400)
+        StandardVolumeFlowUnits.StandardCubicMeterPerDay: ('Sm³/d',),
         
-        if to_unit == StandardVolumeFlowUnits.StandardCubicCentimeterPerMinute:
-            return (value / 6e7)
+        StandardVolumeFlowUnits.StandardCubicCentimeterPerMinute: ('sccm',),
         
-        if to_unit == StandardVolumeFlowUnits.StandardLiterPerMinute:
-            return (value / 60000)
+        StandardVolumeFlowUnits.StandardLiterPerMinute: ('slm',),
         
-        if to_unit == StandardVolumeFlowUnits.StandardCubicFootPerSecond:
-            return (value / 35.314666721)
+        StandardVolumeFlowUnits.StandardCubicFootPerSecond: ('Sft³/s',),
         
-        if to_unit == StandardVolumeFlowUnits.StandardCubicFootPerMinute:
-            return (value / 2118.88000326)
+        StandardVolumeFlowUnits.StandardCubicFootPerMinute: ('scfm',),
         
-        if to_unit == StandardVolumeFlowUnits.StandardCubicFootPerHour:
-            return (value * 7.8657907199999087346816086183876e-6)
+        StandardVolumeFlowUnits.StandardCubicFootPerHour: ('scfh',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: StandardVolumeFlowUnits = StandardVolumeFlowUnits.StandardCubicMeterPerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: StandardVolumeFlowUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: StandardVolumeFlowUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: StandardVolumeFlowUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: StandardVolumeFlowUnits, to_unit: StandardVolumeFlowUnits) -> float:
+        """
+        Convert a value from one StandardVolumeFlow unit to another, without creating a StandardVolumeFlow instance.
 
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: StandardVolumeFlowUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: StandardVolumeFlowUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return StandardVolumeFlow._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: StandardVolumeFlowUnits, to_unit: StandardVolumeFlowUnits) -> List[float]:
+        """
+        Convert many values from one StandardVolumeFlow unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: StandardVolumeFlowUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: StandardVolumeFlowUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return StandardVolumeFlow._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: StandardVolumeFlowUnits, to_unit: StandardVolumeFlowUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", StandardVolumeFlow._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: StandardVolumeFlowUnits, to_unit: StandardVolumeFlowUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one StandardVolumeFlow unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: StandardVolumeFlowUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: StandardVolumeFlowUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return StandardVolumeFlow._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: StandardVolumeFlowUnits = StandardVolumeFlowUnits.StandardCubicMeterPerSecond) -> StandardVolumeFlow:
+        """
+        Create a new instance of StandardVolumeFlow holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: StandardVolumeFlowUnits
+        :return: A new instance of StandardVolumeFlow.
+        :rtype: StandardVolumeFlow
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return StandardVolumeFlow._from_exact(value, from_unit)
+
+    def to_exact(self, unit: StandardVolumeFlowUnits = StandardVolumeFlowUnits.StandardCubicMeterPerSecond) -> Fraction:
+        """
+        Get the exact value of the StandardVolumeFlow in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (StandardCubicMeterPerSecond).
+        :type unit: StandardVolumeFlowUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> StandardVolumeFlow:
+        """
+        Parse a StandardVolumeFlow from a value followed by a unit abbreviation, e.g. "1 Sm³/s".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of StandardVolumeFlow.
+        :rtype: StandardVolumeFlow
+        :raises ValueError: When the string is not a valid or an ambiguous StandardVolumeFlow.
+        """
+        return StandardVolumeFlow._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[StandardVolumeFlow]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return StandardVolumeFlow._try_parse(text)
+
+    def to_binary(self, unit: Optional[StandardVolumeFlowUnits] = None) -> bytes:
+        """
+        Encode the StandardVolumeFlow to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: StandardVolumeFlowUnits
+        :return: The encoded StandardVolumeFlow.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> StandardVolumeFlow:
+        """
+        Decode a StandardVolumeFlow encoded by to_binary.
+
+        :param data: The encoded StandardVolumeFlow, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of StandardVolumeFlow.
+        :rtype: StandardVolumeFlow
+        :raises ValueError: When the data is not a valid encoded StandardVolumeFlow.
+        """
+        return StandardVolumeFlow._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[StandardVolumeFlowUnits] = None) -> dict:
+        """
+        Get the StandardVolumeFlow DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (StandardCubicMeterPerSecond).
+        :type hold_in_unit: StandardVolumeFlowUnits
+        :return: The StandardVolumeFlow DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[StandardVolumeFlowUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> StandardVolumeFlow:
+        """
+        Create a new instance of StandardVolumeFlow from its DTO.
+
+        :param dto: The StandardVolumeFlow DTO, the unit is the StandardVolumeFlowUnits value or name.
+        :type dto: dict
+        :return: A new instance of StandardVolumeFlow.
+        :rtype: StandardVolumeFlow
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return StandardVolumeFlow._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> StandardVolumeFlow:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return StandardVolumeFlow._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -301,10 +555,7 @@ class StandardVolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__standard_cubic_meters_per_second != None:
-            return self.__standard_cubic_meters_per_second
-        self.__standard_cubic_meters_per_second = self.__convert_from_base(StandardVolumeFlowUnits.StandardCubicMeterPerSecond)
-        return self.__standard_cubic_meters_per_second
+        return self._cached_convert(StandardVolumeFlowUnits.StandardCubicMeterPerSecond)
 
     
     @property
@@ -312,10 +563,7 @@ class StandardVolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__standard_cubic_meters_per_minute != None:
-            return self.__standard_cubic_meters_per_minute
-        self.__standard_cubic_meters_per_minute = self.__convert_from_base(StandardVolumeFlowUnits.StandardCubicMeterPerMinute)
-        return self.__standard_cubic_meters_per_minute
+        return self._cached_convert(StandardVolumeFlowUnits.StandardCubicMeterPerMinute)
 
     
     @property
@@ -323,10 +571,7 @@ class StandardVolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__standard_cubic_meters_per_hour != None:
-            return self.__standard_cubic_meters_per_hour
-        self.__standard_cubic_meters_per_hour = self.__convert_from_base(StandardVolumeFlowUnits.StandardCubicMeterPerHour)
-        return self.__standard_cubic_meters_per_hour
+        return self._cached_convert(StandardVolumeFlowUnits.StandardCubicMeterPerHour)
 
     
     @property
@@ -334,10 +579,7 @@ class StandardVolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__standard_cubic_meters_per_day != None:
-            return self.__standard_cubic_meters_per_day
-        self.__standard_cubic_meters_per_day = self.__convert_from_base(StandardVolumeFlowUnits.StandardCubicMeterPerDay)
-        return self.__standard_cubic_meters_per_day
+        return self._cached_convert(StandardVolumeFlowUnits.StandardCubicMeterPerDay)
 
     
     @property
@@ -345,10 +587,7 @@ class StandardVolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__standard_cubic_centimeters_per_minute != None:
-            return self.__standard_cubic_centimeters_per_minute
-        self.__standard_cubic_centimeters_per_minute = self.__convert_from_base(StandardVolumeFlowUnits.StandardCubicCentimeterPerMinute)
-        return self.__standard_cubic_centimeters_per_minute
+        return self._cached_convert(StandardVolumeFlowUnits.StandardCubicCentimeterPerMinute)
 
     
     @property
@@ -356,10 +595,7 @@ class StandardVolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__standard_liters_per_minute != None:
-            return self.__standard_liters_per_minute
-        self.__standard_liters_per_minute = self.__convert_from_base(StandardVolumeFlowUnits.StandardLiterPerMinute)
-        return self.__standard_liters_per_minute
+        return self._cached_convert(StandardVolumeFlowUnits.StandardLiterPerMinute)
 
     
     @property
@@ -367,10 +603,7 @@ class StandardVolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__standard_cubic_feet_per_second != None:
-            return self.__standard_cubic_feet_per_second
-        self.__standard_cubic_feet_per_second = self.__convert_from_base(StandardVolumeFlowUnits.StandardCubicFootPerSecond)
-        return self.__standard_cubic_feet_per_second
+        return self._cached_convert(StandardVolumeFlowUnits.StandardCubicFootPerSecond)
 
     
     @property
@@ -378,10 +611,7 @@ class StandardVolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__standard_cubic_feet_per_minute != None:
-            return self.__standard_cubic_feet_per_minute
-        self.__standard_cubic_feet_per_minute = self.__convert_from_base(StandardVolumeFlowUnits.StandardCubicFootPerMinute)
-        return self.__standard_cubic_feet_per_minute
+        return self._cached_convert(StandardVolumeFlowUnits.StandardCubicFootPerMinute)
 
     
     @property
@@ -389,10 +619,7 @@ class StandardVolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__standard_cubic_feet_per_hour != None:
-            return self.__standard_cubic_feet_per_hour
-        self.__standard_cubic_feet_per_hour = self.__convert_from_base(StandardVolumeFlowUnits.StandardCubicFootPerHour)
-        return self.__standard_cubic_feet_per_hour
+        return self._cached_convert(StandardVolumeFlowUnits.StandardCubicFootPerHour)
 
     
     def to_string(self, unit: StandardVolumeFlowUnits = StandardVolumeFlowUnits.StandardCubicMeterPerSecond) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class TemperatureUnits(Enum):
         """
             TemperatureUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Kelvin = 'kelvin'
         """
@@ -69,105 +80,352 @@ class Temperature(AbstractMeasure):
         value (float): The value.
         from_unit (TemperatureUnits): The Temperature unit to create from, The default unit is Kelvin
     """
-    def __init__(self, value: float, from_unit: TemperatureUnits = TemperatureUnits.Kelvin):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = TemperatureUnits
+
+    _base_unit = TemperatureUnits.Kelvin
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = 'TemperatureDelta'
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 103
+
+    _binary_unit_ids = {
         
-        self.__kelvins = None
+        TemperatureUnits.Kelvin: 0,
         
-        self.__degrees_celsius = None
+        TemperatureUnits.DegreeCelsius: 1,
         
-        self.__millidegrees_celsius = None
+        TemperatureUnits.MillidegreeCelsius: 2,
         
-        self.__degrees_delisle = None
+        TemperatureUnits.DegreeDelisle: 3,
         
-        self.__degrees_fahrenheit = None
+        TemperatureUnits.DegreeFahrenheit: 4,
         
-        self.__degrees_newton = None
+        TemperatureUnits.DegreeNewton: 5,
         
-        self.__degrees_rankine = None
+        TemperatureUnits.DegreeRankine: 6,
         
-        self.__degrees_reaumur = None
+        TemperatureUnits.DegreeReaumur: 7,
         
-        self.__degrees_roemer = None
+        TemperatureUnits.DegreeRoemer: 8,
         
-        self.__solar_temperatures = None
+        TemperatureUnits.SolarTemperature: 9,
         
+    }
 
-    def convert(self, unit: TemperatureUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        TemperatureUnits.Kelvin: lambda value: (value),
+        
+        TemperatureUnits.DegreeCelsius: lambda value: (value - 273.15),
+        
+        TemperatureUnits.MillidegreeCelsius: lambda value: ((value - 273.15) * 1000),
+        
+        TemperatureUnits.DegreeDelisle: lambda value: ((value - 373.15) * -3 / 2),
+        
+        TemperatureUnits.DegreeFahrenheit: lambda value: ((value - 459.67 * 5 / 9) * 9 / 5),
+        
+        TemperatureUnits.DegreeNewton: lambda value: ((value - 273.15) * 33 / 100),
+        
+        TemperatureUnits.DegreeRankine: lambda value: (value * 9 / 5),
+        
+        TemperatureUnits.DegreeReaumur: lambda value: ((value - 273.15) * 4 / 5),
+        
+        TemperatureUnits.DegreeRoemer: lambda value: ((value - (273.15 - 7.5 * 40 / 21)) * 21 / 40),
+        
+        TemperatureUnits.SolarTemperature: lambda value: (value / 5778),
+        
+    }
 
-    def __convert_from_base(self, from_unit: TemperatureUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        TemperatureUnits.Kelvin: lambda value: (value),
+        
+        TemperatureUnits.DegreeCelsius: lambda value: (value + 273.15),
+        
+        TemperatureUnits.MillidegreeCelsius: lambda value: (value / 1000 + 273.15),
+        
+        TemperatureUnits.DegreeDelisle: lambda value: (value * -2 / 3 + 373.15),
+        
+        TemperatureUnits.DegreeFahrenheit: lambda value: (value * 5 / 9 + 459.67 * 5 / 9),
+        
+        TemperatureUnits.DegreeNewton: lambda value: (value * 100 / 33 + 273.15),
         
-        if from_unit == TemperatureUnits.Kelvin:
-            return (value)
+        TemperatureUnits.DegreeRankine: lambda value: (value * 5 / 9),
         
-        if from_unit == TemperatureUnits.DegreeCelsius:
-            return (value - 273.15)
+        TemperatureUnits.DegreeReaumur: lambda value: (value * 5 / 4 + 273.15),
         
-        if from_unit == TemperatureUnits.MillidegreeCelsius:
-            return ((value - 273.15) * 1000)
+        TemperatureUnits.DegreeRoemer: lambda value: (value * 40 / 21 + 273.15 - 7.5 * 40 / 21),
         
-        if from_unit == TemperatureUnits.DegreeDelisle:
-            return ((value - 373.15) * -3 / 2)
+        TemperatureUnits.SolarTemperature: lambda value: (value * 5778),
         
-        if from_unit == TemperatureUnits.DegreeFahrenheit:
-            return ((value - 459.67 * 5 / 9) * 9 / 5)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        TemperatureUnits.Kelvin: ('1', '0'),
+        
+        TemperatureUnits.DegreeCelsius: ('1', '-5463/20'),
+        
+        TemperatureUnits.MillidegreeCelsius: ('1000', '-273150'),
+        
+        TemperatureUnits.DegreeDelisle: ('-3/2', '22389/40'),
         
-        if from_unit == TemperatureUnits.DegreeNewton:
-            return ((value - 273.15) * 33 / 100)
+        TemperatureUnits.DegreeFahrenheit: ('9/5', '-45967/100'),
         
-        if from_unit == TemperatureUnits.DegreeRankine:
-            return (value * 9 / 5)
+        TemperatureUnits.DegreeNewton: ('33/100', '-180279/2000'),
         
-        if from_unit == TemperatureUnits.DegreeReaumur:
-            return ((value - 273.15) * 4 / 5)
+        TemperatureUnits.DegreeRankine: ('9/5', '0'),
         
-        if from_unit == TemperatureUnits.DegreeRoemer:
-            return ((value - (273.15 - 7.5 * 40 / 21)) * 21 / 40)
+        TemperatureUnits.DegreeReaumur: ('4/5', '-5463/25'),
         
-        if from_unit == TemperatureUnits.SolarTemperature:
-            return (value / 5778)
+        TemperatureUnits.DegreeRoemer: ('21/40', '-108723/800'),
         
-        return None
+        TemperatureUnits.SolarTemperature: ('1/5778', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        TemperatureUnits.Kelvin: ('1', '0'),
+        
+        TemperatureUnits.DegreeCelsius: ('1', '5463/20'),
+        
+        TemperatureUnits.MillidegreeCelsius: ('1/1000', '5463/20'),
+        
+        TemperatureUnits.DegreeDelisle: ('-2/3', '7463/20'),
+        
+        TemperatureUnits.DegreeFahrenheit: ('5/9', '45967/180'),
+        
+        TemperatureUnits.DegreeNewton: ('100/33', '5463/20'),
+        
+        TemperatureUnits.DegreeRankine: ('5/9', '0'),
+        
+        TemperatureUnits.DegreeReaumur: ('5/4', '5463/20'),
+        
+        TemperatureUnits.DegreeRoemer: ('40/21', '36241/140'),
+        
+        TemperatureUnits.SolarTemperature: ('5778', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: TemperatureUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == TemperatureUnits.Kelvin:
-            return (value)
+        TemperatureUnits.Kelvin: ('K',),
         
-        if to_unit == TemperatureUnits.DegreeCelsius:
-            return (value + 273.15)
+        TemperatureUnits.DegreeCelsius: ('°C',),
         
-        if to_unit == TemperatureUnits.MillidegreeCelsius:
-            return (value / 1000 + 273.15)
+        TemperatureUnits.MillidegreeCelsius: ('m°C',),
         
-        if to_unit == TemperatureUnits.DegreeDelisle:
-            return (value * -2 / 3 + 373.15)
+        TemperatureUnits.DegreeDelisle: ('°De',),
         
-        if to_unit == TemperatureUnits.DegreeFahrenheit:
-            return (value * 5 / 9 + 459.67 * 5 / 9)
+        TemperatureUnits.DegreeFahrenheit: ('°F',),
         
-        if to_unit == TemperatureUnits.DegreeNewton:
-            return (value * 100 / 33 + 273.15)
+        TemperatureUnits.DegreeNewton: ('°N',),
         
-        if to_unit == TemperatureUnits.DegreeRankine:
-            return (value * 5 / 9)
+        TemperatureUnits.DegreeRankine: ('°R',),
         
-        if to_unit == TemperatureUnits.DegreeReaumur:
-            return (value * 5 / 4 + 273.15)
+        TemperatureUnits.DegreeReaumur: ('°Ré',),
         
-        if to_unit == TemperatureUnits.DegreeRoemer:
-            return (value * 40 / 21 + 273.15 - 7.5 * 40 / 21)
+        TemperatureUnits.DegreeRoemer: ('°Rø',),
         
-        if to_unit == TemperatureUnits.SolarTemperature:
-            return (value * 5778)
+        TemperatureUnits.SolarTemperature: ('T⊙',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: TemperatureUnits = TemperatureUnits.Kelvin):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: TemperatureUnits) -> float:
+        return self.__convert_from_base(unit)
 
+    def __convert_from_base(self, from_unit: TemperatureUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: TemperatureUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: TemperatureUnits, to_unit: TemperatureUnits) -> float:
+        """
+        Convert a value from one Temperature unit to another, without creating a Temperature instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: TemperatureUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: TemperatureUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Temperature._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: TemperatureUnits, to_unit: TemperatureUnits) -> List[float]:
+        """
+        Convert many values from one Temperature unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: TemperatureUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: TemperatureUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Temperature._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: TemperatureUnits, to_unit: TemperatureUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Temperature._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: TemperatureUnits, to_unit: TemperatureUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Temperature unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: TemperatureUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: TemperatureUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Temperature._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: TemperatureUnits = TemperatureUnits.Kelvin) -> Temperature:
+        """
+        Create a new instance of Temperature holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: TemperatureUnits
+        :return: A new instance of Temperature.
+        :rtype: Temperature
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Temperature._from_exact(value, from_unit)
+
+    def to_exact(self, unit: TemperatureUnits = TemperatureUnits.Kelvin) -> Fraction:
+        """
+        Get the exact value of the Temperature in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Kelvin).
+        :type unit: TemperatureUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Temperature:
+        """
+        Parse a Temperature from a value followed by a unit abbreviation, e.g. "1 K".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Temperature.
+        :rtype: Temperature
+        :raises ValueError: When the string is not a valid or an ambiguous Temperature.
+        """
+        return Temperature._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Temperature]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Temperature._try_parse(text)
+
+    def to_binary(self, unit: Optional[TemperatureUnits] = None) -> bytes:
+        """
+        Encode the Temperature to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: TemperatureUnits
+        :return: The encoded Temperature.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Temperature:
+        """
+        Decode a Temperature encoded by to_binary.
+
+        :param data: The encoded Temperature, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Temperature.
+        :rtype: Temperature
+        :raises ValueError: When the data is not a valid encoded Temperature.
+        """
+        return Temperature._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[TemperatureUnits] = None) -> dict:
+        """
+        Get the Temperature DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Kelvin).
+        :type hold_in_unit: TemperatureUnits
+        :return: The Temperature DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[TemperatureUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Temperature:
+        """
+        Create a new instance of Temperature from its DTO.
+
+        :param dto: The Temperature DTO, the unit is the TemperatureUnits value or name.
+        :type dto: dict
+        :return: A new instance of Temperature.
+        :rtype: Temperature
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Temperature._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Temperature:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Temperature._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -329,10 +587,7 @@ class Temperature(AbstractMeasure):
         """
         
         """
-        if self.__kelvins != None:
-            return self.__kelvins
-        self.__kelvins = self.__convert_from_base(TemperatureUnits.Kelvin)
-        return self.__kelvins
+        return self._cached_convert(TemperatureUnits.Kelvin)
 
     
     @property
@@ -340,10 +595,7 @@ class Temperature(AbstractMeasure):
         """
         
         """
-        if self.__degrees_celsius != None:
-            return self.__degrees_celsius
-        self.__degrees_celsius = self.__convert_from_base(TemperatureUnits.DegreeCelsius)
-        return self.__degrees_celsius
+        return self._cached_convert(TemperatureUnits.DegreeCelsius)
 
     
     @property
@@ -351,10 +603,7 @@ class Temperature(AbstractMeasure):
         """
         
         """
-        if self.__millidegrees_celsius != None:
-            return self.__millidegrees_celsius
-        self.__millidegrees_celsius = self.__convert_from_base(TemperatureUnits.MillidegreeCelsius)
-        return self.__millidegrees_celsius
+        return self._cached_convert(TemperatureUnits.MillidegreeCelsius)
 
     
     @property
@@ -362,10 +611,7 @@ class Temperature(AbstractMeasure):
         """
         
         """
-        if self.__degrees_delisle != None:
-            return self.__degrees_delisle
-        self.__degrees_delisle = self.__convert_from_base(TemperatureUnits.DegreeDelisle)
-        return self.__degrees_delisle
+        return self._cached_convert(TemperatureUnits.DegreeDelisle)
 
     
     @property
@@ -373,10 +619,7 @@ class Temperature(AbstractMeasure):
         """
         
         """
-        if self.__degrees_fahrenheit != None:
-            return self.__degrees_fahrenheit
-        self.__degrees_fahrenheit = self.__convert_from_base(TemperatureUnits.DegreeFahrenheit)
-        return self.__degrees_fahrenheit
+        return self._cached_convert(TemperatureUnits.DegreeFahrenheit)
 
     
     @property
@@ -384,10 +627,7 @@ class Temperature(AbstractMeasure):
         """
         
         """
-        if self.__degrees_newton != None:
-            return self.__degrees_newton
-        self.__degrees_newton = self.__convert_from_base(TemperatureUnits.DegreeNewton)
-        return self.__degrees_newton
+        return self._cached_convert(TemperatureUnits.DegreeNewton)
 
     
     @property
@@ -395,10 +635,7 @@ class Temperature(AbstractMeasure):
         """
         
         """
-        if self.__degrees_rankine != None:
-            return self.__degrees_rankine
-        self.__degrees_rankine = self.__convert_from_base(TemperatureUnits.DegreeRankine)
-        return self.__degrees_rankine
+        return self._cached_convert(TemperatureUnits.DegreeRankine)
 
     
     @property
@@ -406,10 +643,7 @@ class Temperature(AbstractMeasure):
         """
         
         """
-        if self.__degrees_reaumur != None:
-            return self.__degrees_reaumur
-        self.__degrees_reaumur = self.__convert_from_base(TemperatureUnits.DegreeReaumur)
-        return self.__degrees_reaumur
+        return self._cached_convert(TemperatureUnits.DegreeReaumur)
 
     
     @property
@@ -417,10 +651,7 @@ class Temperature(AbstractMeasure):
         """
         
         """
-        if self.__degrees_roemer != None:
-            return self.__degrees_roemer
-        self.__degrees_roemer = self.__convert_from_base(TemperatureUnits.DegreeRoemer)
-        return self.__degrees_roemer
+        return self._cached_convert(TemperatureUnits.DegreeRoemer)
 
     
     @property
@@ -428,10 +659,7 @@ class Temperature(AbstractMeasure):
         """
         
         """
-        if self.__solar_temperatures != None:
-            return self.__solar_temperatures
-        self.__solar_temperatures = self.__convert_from_base(TemperatureUnits.SolarTemperature)
-        return self.__solar_temperatures
+        return self._cached_convert(TemperatureUnits.SolarTemperature)
 
     
     def to_string(self, unit: TemperatureUnits = TemperatureUnits.Kelvin) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class TemperatureChangeRateUnits(Enum):
         """
             TemperatureChangeRateUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         DegreeCelsiusPerSecond = 'degree_celsius_per_second'
         """
@@ -69,105 +80,352 @@ class TemperatureChangeRate(AbstractMeasure):
         value (float): The value.
         from_unit (TemperatureChangeRateUnits): The TemperatureChangeRate unit to create from, The default unit is DegreeCelsiusPerSecond
     """
-    def __init__(self, value: float, from_unit: TemperatureChangeRateUnits = TemperatureChangeRateUnits.DegreeCelsiusPerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = TemperatureChangeRateUnits
+
+    _base_unit = TemperatureChangeRateUnits.DegreeCelsiusPerSecond
+
+    _dimensions = (0, 0, -1, 0, 1, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 104
+
+    _binary_unit_ids = {
         
-        self.__degrees_celsius_per_second = None
+        TemperatureChangeRateUnits.DegreeCelsiusPerSecond: 0,
         
-        self.__degrees_celsius_per_minute = None
+        TemperatureChangeRateUnits.DegreeCelsiusPerMinute: 1,
         
-        self.__nanodegrees_celsius_per_second = None
+        TemperatureChangeRateUnits.NanodegreeCelsiusPerSecond: 2,
         
-        self.__microdegrees_celsius_per_second = None
+        TemperatureChangeRateUnits.MicrodegreeCelsiusPerSecond: 3,
         
-        self.__millidegrees_celsius_per_second = None
+        TemperatureChangeRateUnits.MillidegreeCelsiusPerSecond: 4,
         
-        self.__centidegrees_celsius_per_second = None
+        TemperatureChangeRateUnits.CentidegreeCelsiusPerSecond: 5,
         
-        self.__decidegrees_celsius_per_second = None
+        TemperatureChangeRateUnits.DecidegreeCelsiusPerSecond: 6,
         
-        self.__decadegrees_celsius_per_second = None
+        TemperatureChangeRateUnits.DecadegreeCelsiusPerSecond: 7,
         
-        self.__hectodegrees_celsius_per_second = None
+        TemperatureChangeRateUnits.HectodegreeCelsiusPerSecond: 8,
         
-        self.__kilodegrees_celsius_per_second = None
+        TemperatureChangeRateUnits.KilodegreeCelsiusPerSecond: 9,
         
+    }
 
-    def convert(self, unit: TemperatureChangeRateUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        TemperatureChangeRateUnits.DegreeCelsiusPerSecond: lambda value: (value),
+        
+        TemperatureChangeRateUnits.DegreeCelsiusPerMinute: lambda value: (value * 60),
+        
+        TemperatureChangeRateUnits.NanodegreeCelsiusPerSecond: lambda value: ((value) / 1e-09),
+        
+        TemperatureChangeRateUnits.MicrodegreeCelsiusPerSecond: lambda value: ((value) / 1e-06),
+        
+        TemperatureChangeRateUnits.MillidegreeCelsiusPerSecond: lambda value: ((value) / 0.001),
+        
+        TemperatureChangeRateUnits.CentidegreeCelsiusPerSecond: lambda value: ((value) / 0.01),
+        
+        TemperatureChangeRateUnits.DecidegreeCelsiusPerSecond: lambda value: ((value) / 0.1),
+        
+        TemperatureChangeRateUnits.DecadegreeCelsiusPerSecond: lambda value: ((value) / 10.0),
+        
+        TemperatureChangeRateUnits.HectodegreeCelsiusPerSecond: lambda value: ((value) / 100.0),
+        
+        TemperatureChangeRateUnits.KilodegreeCelsiusPerSecond: lambda value: ((value) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: TemperatureChangeRateUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        TemperatureChangeRateUnits.DegreeCelsiusPerSecond: lambda value: (value),
+        
+        TemperatureChangeRateUnits.DegreeCelsiusPerMinute: lambda value: (value / 60),
+        
+        TemperatureChangeRateUnits.NanodegreeCelsiusPerSecond: lambda value: ((value) * 1e-09),
+        
+        TemperatureChangeRateUnits.MicrodegreeCelsiusPerSecond: lambda value: ((value) * 1e-06),
+        
+        TemperatureChangeRateUnits.MillidegreeCelsiusPerSecond: lambda value: ((value) * 0.001),
+        
+        TemperatureChangeRateUnits.CentidegreeCelsiusPerSecond: lambda value: ((value) * 0.01),
         
-        if from_unit == TemperatureChangeRateUnits.DegreeCelsiusPerSecond:
-            return (value)
+        TemperatureChangeRateUnits.DecidegreeCelsiusPerSecond: lambda value: ((value) * 0.1),
         
-        if from_unit == TemperatureChangeRateUnits.DegreeCelsiusPerMinute:
-            return (value * 60)
+        TemperatureChangeRateUnits.DecadegreeCelsiusPerSecond: lambda value: ((value) * 10.0),
         
-        if from_unit == TemperatureChangeRateUnits.NanodegreeCelsiusPerSecond:
-            return ((value) / 1e-09)
+        TemperatureChangeRateUnits.HectodegreeCelsiusPerSecond: lambda value: ((value) * 100.0),
         
-        if from_unit == TemperatureChangeRateUnits.MicrodegreeCelsiusPerSecond:
-            return ((value) / 1e-06)
+        TemperatureChangeRateUnits.KilodegreeCelsiusPerSecond: lambda value: ((value) * 1000.0),
         
-        if from_unit == TemperatureChangeRateUnits.MillidegreeCelsiusPerSecond:
-            return ((value) / 0.001)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        TemperatureChangeRateUnits.DegreeCelsiusPerSecond: ('1', '0'),
+        
+        TemperatureChangeRateUnits.DegreeCelsiusPerMinute: ('60', '0'),
+        
+        TemperatureChangeRateUnits.NanodegreeCelsiusPerSecond: ('1000000000', '0'),
+        
+        TemperatureChangeRateUnits.MicrodegreeCelsiusPerSecond: ('1000000', '0'),
         
-        if from_unit == TemperatureChangeRateUnits.CentidegreeCelsiusPerSecond:
-            return ((value) / 0.01)
+        TemperatureChangeRateUnits.MillidegreeCelsiusPerSecond: ('1000', '0'),
         
-        if from_unit == TemperatureChangeRateUnits.DecidegreeCelsiusPerSecond:
-            return ((value) / 0.1)
+        TemperatureChangeRateUnits.CentidegreeCelsiusPerSecond: ('100', '0'),
         
-        if from_unit == TemperatureChangeRateUnits.DecadegreeCelsiusPerSecond:
-            return ((value) / 10.0)
+        TemperatureChangeRateUnits.DecidegreeCelsiusPerSecond: ('10', '0'),
         
-        if from_unit == TemperatureChangeRateUnits.HectodegreeCelsiusPerSecond:
-            return ((value) / 100.0)
+        TemperatureChangeRateUnits.DecadegreeCelsiusPerSecond: ('1/10', '0'),
         
-        if from_unit == TemperatureChangeRateUnits.KilodegreeCelsiusPerSecond:
-            return ((value) / 1000.0)
+        TemperatureChangeRateUnits.HectodegreeCelsiusPerSecond: ('1/100', '0'),
         
-        return None
+        TemperatureChangeRateUnits.KilodegreeCelsiusPerSecond: ('1/1000', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        TemperatureChangeRateUnits.DegreeCelsiusPerSecond: ('1', '0'),
+        
+        TemperatureChangeRateUnits.DegreeCelsiusPerMinute: ('1/60', '0'),
+        
+        TemperatureChangeRateUnits.NanodegreeCelsiusPerSecond: ('1/1000000000', '0'),
+        
+        TemperatureChangeRateUnits.MicrodegreeCelsiusPerSecond: ('1/1000000', '0'),
+        
+        TemperatureChangeRateUnits.MillidegreeCelsiusPerSecond: ('1/1000', '0'),
+        
+        TemperatureChangeRateUnits.CentidegreeCelsiusPerSecond: ('1/100', '0'),
+        
+        TemperatureChangeRateUnits.DecidegreeCelsiusPerSecond: ('1/10', '0'),
+        
+        TemperatureChangeRateUnits.DecadegreeCelsiusPerSecond: ('10', '0'),
+        
+        TemperatureChangeRateUnits.HectodegreeCelsiusPerSecond: ('100', '0'),
+        
+        TemperatureChangeRateUnits.KilodegreeCelsiusPerSecond: ('1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: TemperatureChangeRateUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == TemperatureChangeRateUnits.DegreeCelsiusPerSecond:
-            return (value)
+        TemperatureChangeRateUnits.DegreeCelsiusPerSecond: ('°C/s',),
         
-        if to_unit == TemperatureChangeRateUnits.DegreeCelsiusPerMinute:
-            return (value / 60)
+        TemperatureChangeRateUnits.DegreeCelsiusPerMinute: ('°C/min',),
         
-        if to_unit == TemperatureChangeRateUnits.NanodegreeCelsiusPerSecond:
-            return ((value) * 1e-09)
+        TemperatureChangeRateUnits.NanodegreeCelsiusPerSecond: ('n°C/s',),
         
-        if to_unit == TemperatureChangeRateUnits.MicrodegreeCelsiusPerSecond:
-            return ((value) * 1e-06)
+        TemperatureChangeRateUnits.MicrodegreeCelsiusPerSecond: ('μ°C/s',),
         
-        if to_unit == TemperatureChangeRateUnits.MillidegreeCelsiusPerSecond:
-            return ((value) * 0.001)
+        TemperatureChangeRateUnits.MillidegreeCelsiusPerSecond: ('m°C/s',),
         
-        if to_unit == TemperatureChangeRateUnits.CentidegreeCelsiusPerSecond:
-            return ((value) * 0.01)
+        TemperatureChangeRateUnits.CentidegreeCelsiusPerSecond: ('c°C/s',),
         
-        if to_unit == TemperatureChangeRateUnits.DecidegreeCelsiusPerSecond:
-            return ((value) * 0.1)
+        TemperatureChangeRateUnits.DecidegreeCelsiusPerSecond: ('d°C/s',),
         
-        if to_unit == TemperatureChangeRateUnits.DecadegreeCelsiusPerSecond:
-            return ((value) * 10.0)
+        TemperatureChangeRateUnits.DecadegreeCelsiusPerSecond: ('da°C/s',),
         
-        if to_unit == TemperatureChangeRateUnits.HectodegreeCelsiusPerSecond:
-            return ((value) * 100.0)
+        TemperatureChangeRateUnits.HectodegreeCelsiusPerSecond: ('h°C/s',),
         
-        if to_unit == TemperatureChangeRateUnits.KilodegreeCelsiusPerSecond:
-            return ((value) * 1000.0)
+        TemperatureChangeRateUnits.KilodegreeCelsiusPerSecond: ('k°C/s',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: TemperatureChangeRateUnits = TemperatureChangeRateUnits.DegreeCelsiusPerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: TemperatureChangeRateUnits) -> float:
+        return self.__convert_from_base(unit)
 
+    def __convert_from_base(self, from_unit: TemperatureChangeRateUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: TemperatureChangeRateUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: TemperatureChangeRateUnits, to_unit: TemperatureChangeRateUnits) -> float:
+        """
+        Convert a value from one TemperatureChangeRate unit to another, without creating a TemperatureChangeRate instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: TemperatureChangeRateUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: TemperatureChangeRateUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return TemperatureChangeRate._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: TemperatureChangeRateUnits, to_unit: TemperatureChangeRateUnits) -> List[float]:
+        """
+        Convert many values from one TemperatureChangeRate unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: TemperatureChangeRateUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: TemperatureChangeRateUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return TemperatureChangeRate._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: TemperatureChangeRateUnits, to_unit: TemperatureChangeRateUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", TemperatureChangeRate._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: TemperatureChangeRateUnits, to_unit: TemperatureChangeRateUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one TemperatureChangeRate unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: TemperatureChangeRateUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: TemperatureChangeRateUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return TemperatureChangeRate._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: TemperatureChangeRateUnits = TemperatureChangeRateUnits.DegreeCelsiusPerSecond) -> TemperatureChangeRate:
+        """
+        Create a new instance of TemperatureChangeRate holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: TemperatureChangeRateUnits
+        :return: A new instance of TemperatureChangeRate.
+        :rtype: TemperatureChangeRate
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return TemperatureChangeRate._from_exact(value, from_unit)
+
+    def to_exact(self, unit: TemperatureChangeRateUnits = TemperatureChangeRateUnits.DegreeCelsiusPerSecond) -> Fraction:
+        """
+        Get the exact value of the TemperatureChangeRate in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (DegreeCelsiusPerSecond).
+        :type unit: TemperatureChangeRateUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> TemperatureChangeRate:
+        """
+        Parse a TemperatureChangeRate from a value followed by a unit abbreviation, e.g. "1 °C/s".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of TemperatureChangeRate.
+        :rtype: TemperatureChangeRate
+        :raises ValueError: When the string is not a valid or an ambiguous TemperatureChangeRate.
+        """
+        return TemperatureChangeRate._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[TemperatureChangeRate]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return TemperatureChangeRate._try_parse(text)
+
+    def to_binary(self, unit: Optional[TemperatureChangeRateUnits] = None) -> bytes:
+        """
+        Encode the TemperatureChangeRate to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: TemperatureChangeRateUnits
+        :return: The encoded TemperatureChangeRate.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> TemperatureChangeRate:
+        """
+        Decode a TemperatureChangeRate encoded by to_binary.
+
+        :param data: The encoded TemperatureChangeRate, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of TemperatureChangeRate.
+        :rtype: TemperatureChangeRate
+        :raises ValueError: When the data is not a valid encoded TemperatureChangeRate.
+        """
+        return TemperatureChangeRate._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[TemperatureChangeRateUnits] = None) -> dict:
+        """
+        Get the TemperatureChangeRate DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (DegreeCelsiusPerSecond).
+        :type hold_in_unit: TemperatureChangeRateUnits
+        :return: The TemperatureChangeRate DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[TemperatureChangeRateUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> TemperatureChangeRate:
+        """
+        Create a new instance of TemperatureChangeRate from its DTO.
+
+        :param dto: The TemperatureChangeRate DTO, the unit is the TemperatureChangeRateUnits value or name.
+        :type dto: dict
+        :return: A new instance of TemperatureChangeRate.
+        :rtype: TemperatureChangeRate
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return TemperatureChangeRate._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> TemperatureChangeRate:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return TemperatureChangeRate._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -329,10 +587,7 @@ class TemperatureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__degrees_celsius_per_second != None:
-            return self.__degrees_celsius_per_second
-        self.__degrees_celsius_per_second = self.__convert_from_base(TemperatureChangeRateUnits.DegreeCelsiusPerSecond)
-        return self.__degrees_celsius_per_second
+        return self._cached_convert(TemperatureChangeRateUnits.DegreeCelsiusPerSecond)
 
     
     @property
@@ -340,10 +595,7 @@ class TemperatureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__degrees_celsius_per_minute != None:
-            return self.__degrees_celsius_per_minute
-        self.__degrees_celsius_per_minute = self.__convert_from_base(TemperatureChangeRateUnits.DegreeCelsiusPerMinute)
-        return self.__degrees_celsius_per_minute
+        return self._cached_convert(TemperatureChangeRateUnits.DegreeCelsiusPerMinute)
 
     
     @property
@@ -351,10 +603,7 @@ class TemperatureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__nanodegrees_celsius_per_second != None:
-            return self.__nanodegrees_celsius_per_second
-        self.__nanodegrees_celsius_per_second = self.__convert_from_base(TemperatureChangeRateUnits.NanodegreeCelsiusPerSecond)
-        return self.__nanodegrees_celsius_per_second
+        return self._cached_convert(TemperatureChangeRateUnits.NanodegreeCelsiusPerSecond)
 
     
     @property
@@ -362,10 +611,7 @@ class TemperatureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__microdegrees_celsius_per_second != None:
-            return self.__microdegrees_celsius_per_second
-        self.__microdegrees_celsius_per_second = self.__convert_from_base(TemperatureChangeRateUnits.MicrodegreeCelsiusPerSecond)
-        return self.__microdegrees_celsius_per_second
+        return self._cached_convert(TemperatureChangeRateUnits.MicrodegreeCelsiusPerSecond)
 
     
     @property
@@ -373,10 +619,7 @@ class TemperatureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__millidegrees_celsius_per_second != None:
-            return self.__millidegrees_celsius_per_second
-        self.__millidegrees_celsius_per_second = self.__convert_from_base(TemperatureChangeRateUnits.MillidegreeCelsiusPerSecond)
-        return self.__millidegrees_celsius_per_second
+        return self._cached_convert(TemperatureChangeRateUnits.MillidegreeCelsiusPerSecond)
 
     
     @property
@@ -384,10 +627,7 @@ class TemperatureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__centidegrees_celsius_per_second != None:
-            return self.__centidegrees_celsius_per_second
-        self.__centidegrees_celsius_per_second = self.__convert_from_base(TemperatureChangeRateUnits.CentidegreeCelsiusPerSecond)
-        return self.__centidegrees_celsius_per_second
+        return self._cached_convert(TemperatureChangeRateUnits.CentidegreeCelsiusPerSecond)
 
     
     @property
@@ -395,10 +635,7 @@ class TemperatureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__decidegrees_celsius_per_second != None:
-            return self.__decidegrees_celsius_per_second
-        self.__decidegrees_celsius_per_second = self.__convert_from_base(TemperatureChangeRateUnits.DecidegreeCelsiusPerSecond)
-        return self.__decidegrees_celsius_per_second
+        return self._cached_convert(TemperatureChangeRateUnits.DecidegreeCelsiusPerSecond)
 
     
     @property
@@ -406,10 +643,7 @@ class TemperatureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__decadegrees_celsius_per_second != None:
-            return self.__decadegrees_celsius_per_second
-        self.__decadegrees_celsius_per_second = self.__convert_from_base(TemperatureChangeRateUnits.DecadegreeCelsiusPerSecond)
-        return self.__decadegrees_celsius_per_second
+        return self._cached_convert(TemperatureChangeRateUnits.DecadegreeCelsiusPerSecond)
 
     
     @property
@@ -417,10 +651,7 @@ class TemperatureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__hectodegrees_celsius_per_second != None:
-            return self.__hectodegrees_celsius_per_second
-        self.__hectodegrees_celsius_per_second = self.__convert_from_base(TemperatureChangeRateUnits.HectodegreeCelsiusPerSecond)
-        return self.__hectodegrees_celsius_per_second
+        return self._cached_convert(TemperatureChangeRateUnits.HectodegreeCelsiusPerSecond)
 
     
     @property
@@ -428,10 +659,7 @@ class TemperatureChangeRate(AbstractMeasure):
         """
         
         """
-        if self.__kilodegrees_celsius_per_second != None:
-            return self.__kilodegrees_celsius_per_second
-        self.__kilodegrees_celsius_per_second = self.__convert_from_base(TemperatureChangeRateUnits.KilodegreeCelsiusPerSecond)
-        return self.__kilodegrees_celsius_per_second
+        return self._cached_convert(TemperatureChangeRateUnits.KilodegreeCelsiusPerSecond)
 
     
     def to_string(self, unit: TemperatureChangeRateUnits = TemperatureChangeRateUnits.DegreeCelsiusPerSecond) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class TemperatureDeltaUnits(Enum):
         """
             TemperatureDeltaUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Kelvin = 'kelvin'
         """
@@ -64,97 +75,340 @@ class TemperatureDelta(AbstractMeasure):
         value (float): The value.
         from_unit (TemperatureDeltaUnits): The TemperatureDelta unit to create from, The default unit is Kelvin
     """
-    def __init__(self, value: float, from_unit: TemperatureDeltaUnits = TemperatureDeltaUnits.Kelvin):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = TemperatureDeltaUnits
+
+    _base_unit = TemperatureDeltaUnits.Kelvin
+
+    _dimensions = (0, 0, 0, 0, 1, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 105
+
+    _binary_unit_ids = {
         
-        self.__kelvins = None
+        TemperatureDeltaUnits.Kelvin: 0,
         
-        self.__degrees_celsius = None
+        TemperatureDeltaUnits.DegreeCelsius: 1,
         
-        self.__degrees_delisle = None
+        TemperatureDeltaUnits.DegreeDelisle: 2,
         
-        self.__degrees_fahrenheit = None
+        TemperatureDeltaUnits.DegreeFahrenheit: 3,
         
-        self.__degrees_newton = None
+        TemperatureDeltaUnits.DegreeNewton: 4,
         
-        self.__degrees_rankine = None
+        TemperatureDeltaUnits.DegreeRankine: 5,
         
-        self.__degrees_reaumur = None
+        TemperatureDeltaUnits.DegreeReaumur: 6,
         
-        self.__degrees_roemer = None
+        TemperatureDeltaUnits.DegreeRoemer: 7,
         
-        self.__millidegrees_celsius = None
+        TemperatureDeltaUnits.MillidegreeCelsius: 8,
         
+    }
 
-    def convert(self, unit: TemperatureDeltaUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        TemperatureDeltaUnits.Kelvin: lambda value: (value),
+        
+        TemperatureDeltaUnits.DegreeCelsius: lambda value: (value),
+        
+        TemperatureDeltaUnits.DegreeDelisle: lambda value: (value * -3 / 2),
+        
+        TemperatureDeltaUnits.DegreeFahrenheit: lambda value: (value * 9 / 5),
+        
+        TemperatureDeltaUnits.DegreeNewton: lambda value: (value * 33 / 100),
+        
+        TemperatureDeltaUnits.DegreeRankine: lambda value: (value * 9 / 5),
+        
+        TemperatureDeltaUnits.DegreeReaumur: lambda value: (value * 4 / 5),
+        
+        TemperatureDeltaUnits.DegreeRoemer: lambda value: (value * 21 / 40),
+        
+        TemperatureDeltaUnits.MillidegreeCelsius: lambda value: ((value) / 0.001),
+        
+    }
 
-    def __convert_from_base(self, from_unit: TemperatureDeltaUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        TemperatureDeltaUnits.Kelvin: lambda value: (value),
+        
+        TemperatureDeltaUnits.DegreeCelsius: lambda value: (value),
+        
+        TemperatureDeltaUnits.DegreeDelisle: lambda value: (value * -2 / 3),
+        
+        TemperatureDeltaUnits.DegreeFahrenheit: lambda value: (value * 5 / 9),
+        
+        TemperatureDeltaUnits.DegreeNewton: lambda value: (value * 100 / 33),
+        
+        TemperatureDeltaUnits.DegreeRankine: lambda value: (value * 5 / 9),
         
-        if from_unit == TemperatureDeltaUnits.Kelvin:
-            return (value)
+        TemperatureDeltaUnits.DegreeReaumur: lambda value: (value * 5 / 4),
         
-        if from_unit == TemperatureDeltaUnits.DegreeCelsius:
-            return (value)
+        TemperatureDeltaUnits.DegreeRoemer: lambda value: (value * 40 / 21),
         
-        if from_unit == TemperatureDeltaUnits.DegreeDelisle:
-            return (value * -3 / 2)
+        TemperatureDeltaUnits.MillidegreeCelsius: lambda value: ((value) * 0.001),
         
-        if from_unit == TemperatureDeltaUnits.DegreeFahrenheit:
-            return (value * 9 / 5)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        TemperatureDeltaUnits.Kelvin: ('1', '0'),
+        
+        TemperatureDeltaUnits.DegreeCelsius: ('1', '0'),
+        
+        TemperatureDeltaUnits.DegreeDelisle: ('-3/2', '0'),
+        
+        TemperatureDeltaUnits.DegreeFahrenheit: ('9/5', '0'),
         
-        if from_unit == TemperatureDeltaUnits.DegreeNewton:
-            return (value * 33 / 100)
+        TemperatureDeltaUnits.DegreeNewton: ('33/100', '0'),
         
-        if from_unit == TemperatureDeltaUnits.DegreeRankine:
-            return (value * 9 / 5)
+        TemperatureDeltaUnits.DegreeRankine: ('9/5', '0'),
         
-        if from_unit == TemperatureDeltaUnits.DegreeReaumur:
-            return (value * 4 / 5)
+        TemperatureDeltaUnits.DegreeReaumur: ('4/5', '0'),
         
-        if from_unit == TemperatureDeltaUnits.DegreeRoemer:
-            return (value * 21 / 40)
+        TemperatureDeltaUnits.DegreeRoemer: ('21/40', '0'),
         
-        if from_unit == TemperatureDeltaUnits.MillidegreeCelsius:
-            return ((value) / 0.001)
+        TemperatureDeltaUnits.MillidegreeCelsius: ('1000', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        TemperatureDeltaUnits.Kelvin: ('1', '0'),
+        
+        TemperatureDeltaUnits.DegreeCelsius: ('1', '0'),
+        
+        TemperatureDeltaUnits.DegreeDelisle: ('-2/3', '0'),
+        
+        TemperatureDeltaUnits.DegreeFahrenheit: ('5/9', '0'),
+        
+        TemperatureDeltaUnits.DegreeNewton: ('100/33', '0'),
+        
+        TemperatureDeltaUnits.DegreeRankine: ('5/9', '0'),
+        
+        TemperatureDeltaUnits.DegreeReaumur: ('5/4', '0'),
+        
+        TemperatureDeltaUnits.DegreeRoemer: ('40/21', '0'),
+        
+        TemperatureDeltaUnits.MillidegreeCelsius: ('1/1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: TemperatureDeltaUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == TemperatureDeltaUnits.Kelvin:
-            return (value)
+        TemperatureDeltaUnits.Kelvin: ('∆K',),
         
-        if to_unit == TemperatureDeltaUnits.DegreeCelsius:
-            return (value)
+        TemperatureDeltaUnits.DegreeCelsius: ('∆°C',),
         
-        if to_unit == TemperatureDeltaUnits.DegreeDelisle:
-            return (value * -2 / 3)
+        TemperatureDeltaUnits.DegreeDelisle: ('∆°De',),
         
-        if to_unit == TemperatureDeltaUnits.DegreeFahrenheit:
-            return (value * 5 / 9)
+        TemperatureDeltaUnits.DegreeFahrenheit: ('∆°F',),
         
-        if to_unit == TemperatureDeltaUnits.DegreeNewton:
-            return (value * 100 / 33)
+        TemperatureDeltaUnits.DegreeNewton: ('∆°N',),
         
-        if to_unit == TemperatureDeltaUnits.DegreeRankine:
-            return (value * 5 / 9)
+        TemperatureDeltaUnits.DegreeRankine: ('∆°R',),
         
-        if to_unit == TemperatureDeltaUnits.DegreeReaumur:
-            return (value * 5 / 4)
+        TemperatureDeltaUnits.DegreeReaumur: ('∆°Ré',),
         
-        if to_unit == TemperatureDeltaUnits.DegreeRoemer:
-            return (value * 40 / 21)
+        TemperatureDeltaUnits.DegreeRoemer: ('∆°Rø',),
         
-        if to_unit == TemperatureDeltaUnits.MillidegreeCelsius:
-            return ((value) * 0.001)
+        TemperatureDeltaUnits.MillidegreeCelsius: ('m∆°C',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: TemperatureDeltaUnits = TemperatureDeltaUnits.Kelvin):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: TemperatureDeltaUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: TemperatureDeltaUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: TemperatureDeltaUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: TemperatureDeltaUnits, to_unit: TemperatureDeltaUnits) -> float:
+        """
+        Convert a value from one TemperatureDelta unit to another, without creating a TemperatureDelta instance.
 
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: TemperatureDeltaUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: TemperatureDeltaUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return TemperatureDelta._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: TemperatureDeltaUnits, to_unit: TemperatureDeltaUnits) -> List[float]:
+        """
+        Convert many values from one TemperatureDelta unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: TemperatureDeltaUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: TemperatureDeltaUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return TemperatureDelta._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: TemperatureDeltaUnits, to_unit: TemperatureDeltaUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", TemperatureDelta._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: TemperatureDeltaUnits, to_unit: TemperatureDeltaUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one TemperatureDelta unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: TemperatureDeltaUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: TemperatureDeltaUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return TemperatureDelta._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: TemperatureDeltaUnits = TemperatureDeltaUnits.Kelvin) -> TemperatureDelta:
+        """
+        Create a new instance of TemperatureDelta holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: TemperatureDeltaUnits
+        :return: A new instance of TemperatureDelta.
+        :rtype: TemperatureDelta
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return TemperatureDelta._from_exact(value, from_unit)
+
+    def to_exact(self, unit: TemperatureDeltaUnits = TemperatureDeltaUnits.Kelvin) -> Fraction:
+        """
+        Get the exact value of the TemperatureDelta in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (Kelvin).
+        :type unit: TemperatureDeltaUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> TemperatureDelta:
+        """
+        Parse a TemperatureDelta from a value followed by a unit abbreviation, e.g. "1 ∆K".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of TemperatureDelta.
+        :rtype: TemperatureDelta
+        :raises ValueError: When the string is not a valid or an ambiguous TemperatureDelta.
+        """
+        return TemperatureDelta._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[TemperatureDelta]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return TemperatureDelta._try_parse(text)
+
+    def to_binary(self, unit: Optional[TemperatureDeltaUnits] = None) -> bytes:
+        """
+        Encode the TemperatureDelta to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: TemperatureDeltaUnits
+        :return: The encoded TemperatureDelta.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> TemperatureDelta:
+        """
+        Decode a TemperatureDelta encoded by to_binary.
+
+        :param data: The encoded TemperatureDelta, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of TemperatureDelta.
+        :rtype: TemperatureDelta
+        :raises ValueError: When the data is not a valid encoded TemperatureDelta.
+        """
+        return TemperatureDelta._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[TemperatureDeltaUnits] = None) -> dict:
+        """
+        Get the TemperatureDelta DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (Kelvin).
+        :type hold_in_unit: TemperatureDeltaUnits
+        :return: The TemperatureDelta DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[TemperatureDeltaUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> TemperatureDelta:
+        """
+        Create a new instance of TemperatureDelta from its DTO.
+
+        :param dto: The TemperatureDelta DTO, the unit is the TemperatureDeltaUnits value or name.
+        :type dto: dict
+        :return: A new instance of TemperatureDelta.
+        :rtype: TemperatureDelta
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return TemperatureDelta._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> TemperatureDelta:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return TemperatureDelta._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -301,10 +555,7 @@ class TemperatureDelta(AbstractMeasure):
         """
         
         """
-        if self.__kelvins != None:
-            return self.__kelvins
-        self.__kelvins = self.__convert_from_base(TemperatureDeltaUnits.Kelvin)
-        return self.__kelvins
+        return self._cached_convert(TemperatureDeltaUnits.Kelvin)
 
     
     @property
@@ -312,10 +563,7 @@ class TemperatureDelta(AbstractMeasure):
         """
         
         """
-        if self.__degrees_celsius != None:
-            return self.__degrees_celsius
-        self.__degrees_celsius = self.__convert_from_base(TemperatureDeltaUnits.DegreeCelsius)
-        return self.__degrees_celsius
+        return self._cached_convert(TemperatureDeltaUnits.DegreeCelsius)
 
     
     @property
@@ -323,10 +571,7 @@ class TemperatureDelta(AbstractMeasure):
         """
         
         """
-        if self.__degrees_delisle != None:
-            return self.__degrees_delisle
-        self.__degrees_delisle = self.__convert_from_base(TemperatureDeltaUnits.DegreeDelisle)
-        return self.__degrees_delisle
+        return self._cached_convert(TemperatureDeltaUnits.DegreeDelisle)
 
     
     @property
@@ -334,10 +579,7 @@ class TemperatureDelta(AbstractMeasure):
         """
         
         """
-        if self.__degrees_fahrenheit != None:
-            return self.__degrees_fahrenheit
-        self.__degrees_fahrenheit = self.__convert_from_base(TemperatureDeltaUnits.DegreeFahrenheit)
-        return self.__degrees_fahrenheit
+        return self._cached_convert(TemperatureDeltaUnits.DegreeFahrenheit)
 
     
     @property
@@ -345,10 +587,7 @@ class TemperatureDelta(AbstractMeasure):
         """
         
         """
-        if self.__degrees_newton != None:
-            return self.__degrees_newton
-        self.__degrees_newton = self.__convert_from_base(TemperatureDeltaUnits.DegreeNewton)
-        return self.__degrees_newton
+        return self._cached_convert(TemperatureDeltaUnits.DegreeNewton)
 
     
     @property
@@ -356,10 +595,7 @@ class TemperatureDelta(AbstractMeasure):
         """
         
         """
-        if self.__degrees_rankine != None:
-            return self.__degrees_rankine
-        self.__degrees_rankine = self.__convert_from_base(TemperatureDeltaUnits.DegreeRankine)
-        return self.__degrees_rankine
+        return self._cached_convert(TemperatureDeltaUnits.DegreeRankine)
 
     
     @property
@@ -367,10 +603,7 @@ class TemperatureDelta(AbstractMeasure):
         """
         
         """
-        if self.__degrees_reaumur != None:
-            return self.__degrees_reaumur
-        self.__degrees_reaumur = self.__convert_from_base(TemperatureDeltaUnits.DegreeReaumur)
-        return self.__degrees_reaumur
+        return self._cached_convert(TemperatureDeltaUnits.DegreeReaumur)
 
     
     @property
@@ -378,10 +611,7 @@ class TemperatureDelta(AbstractMeasure):
         """
         
         """
-        if self.__degrees_roemer != None:
-            return self.__degrees_roemer
-        self.__degrees_roemer = self.__convert_from_base(TemperatureDeltaUnits.DegreeRoemer)
-        return self.__degrees_roemer
+        return self._cached_convert(TemperatureDeltaUnits.DegreeRoemer)
 
     
     @property
@@ -389,10 +619,7 @@ class TemperatureDelta(AbstractMeasure):
         """
         
         """
-        if self.__millidegrees_celsius != None:
-            return self.__millidegrees_celsius
-        self.__millidegrees_celsius = self.__convert_from_base(TemperatureDeltaUnits.MillidegreeCelsius)
-        return self.__millidegrees_celsius
+        return self._cached_convert(TemperatureDeltaUnits.MillidegreeCelsius)
 
     
     def to_string(self, unit: TemperatureDeltaUnits = TemperatureDeltaUnits.Kelvin) -> str:
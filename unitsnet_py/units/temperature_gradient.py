@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class TemperatureGradientUnits(Enum):
         """
             TemperatureGradientUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         KelvinPerMeter = 'kelvin_per_meter'
         """
@@ -39,57 +50,280 @@ class TemperatureGradient(AbstractMeasure):
         value (float): The value.
         from_unit (TemperatureGradientUnits): The TemperatureGradient unit to create from, The default unit is KelvinPerMeter
     """
-    def __init__(self, value: float, from_unit: TemperatureGradientUnits = TemperatureGradientUnits.KelvinPerMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = TemperatureGradientUnits
+
+    _base_unit = TemperatureGradientUnits.KelvinPerMeter
+
+    _dimensions = (-1, 0, 0, 0, 1, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 106
+
+    _binary_unit_ids = {
         
-        self.__kelvins_per_meter = None
+        TemperatureGradientUnits.KelvinPerMeter: 0,
         
-        self.__degrees_celcius_per_meter = None
+        TemperatureGradientUnits.DegreeCelsiusPerMeter: 1,
         
-        self.__degrees_fahrenheit_per_foot = None
+        TemperatureGradientUnits.DegreeFahrenheitPerFoot: 2,
         
-        self.__degrees_celcius_per_kilometer = None
+        TemperatureGradientUnits.DegreeCelsiusPerKilometer: 3,
         
+    }
 
-    def convert(self, unit: TemperatureGradientUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        TemperatureGradientUnits.KelvinPerMeter: lambda value: (value),
+        
+        TemperatureGradientUnits.DegreeCelsiusPerMeter: lambda value: (value),
+        
+        TemperatureGradientUnits.DegreeFahrenheitPerFoot: lambda value: ((value * 0.3048) * 9 / 5),
+        
+        TemperatureGradientUnits.DegreeCelsiusPerKilometer: lambda value: (value * 1e3),
+        
+    }
 
-    def __convert_from_base(self, from_unit: TemperatureGradientUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == TemperatureGradientUnits.KelvinPerMeter:
-            return (value)
+        TemperatureGradientUnits.KelvinPerMeter: lambda value: (value),
         
-        if from_unit == TemperatureGradientUnits.DegreeCelsiusPerMeter:
-            return (value)
+        TemperatureGradientUnits.DegreeCelsiusPerMeter: lambda value: (value),
         
-        if from_unit == TemperatureGradientUnits.DegreeFahrenheitPerFoot:
-            return ((value * 0.3048) * 9 / 5)
+        TemperatureGradientUnits.DegreeFahrenheitPerFoot: lambda value: ((value / 0.3048) * 5 / 9),
         
-        if from_unit == TemperatureGradientUnits.DegreeCelsiusPerKilometer:
-            return (value * 1e3)
+        TemperatureGradientUnits.DegreeCelsiusPerKilometer: lambda value: (value / 1e3),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        TemperatureGradientUnits.KelvinPerMeter: ('1', '0'),
+        
+        TemperatureGradientUnits.DegreeCelsiusPerMeter: ('1', '0'),
+        
+        TemperatureGradientUnits.DegreeFahrenheitPerFoot: ('3429/6250', '0'),
+        
+        TemperatureGradientUnits.DegreeCelsiusPerKilometer: ('1000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: TemperatureGradientUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == TemperatureGradientUnits.KelvinPerMeter:
-            return (value)
+        TemperatureGradientUnits.KelvinPerMeter: ('1', '0'),
         
-        if to_unit == TemperatureGradientUnits.DegreeCelsiusPerMeter:
-            return (value)
+        TemperatureGradientUnits.DegreeCelsiusPerMeter: ('1', '0'),
         
-        if to_unit == TemperatureGradientUnits.DegreeFahrenheitPerFoot:
-            return ((value / 0.3048) * 5 / 9)
+        TemperatureGradientUnits.DegreeFahrenheitPerFoot: ('6250/3429', '0'),
         
-        if to_unit == TemperatureGradientUnits.DegreeCelsiusPerKilometer:
-            return (value / 1e3)
+        TemperatureGradientUnits.DegreeCelsiusPerKilometer: ('1/1000', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        TemperatureGradientUnits.KelvinPerMeter: ('∆°K/m',),
+        
+        TemperatureGradientUnits.DegreeCelsiusPerMeter: ('∆°C/m',),
+        
+        TemperatureGradientUnits.DegreeFahrenheitPerFoot: ('∆°F/ft',),
+        
+        TemperatureGradientUnits.DegreeCelsiusPerKilometer: ('∆°C/km',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: TemperatureGradientUnits = TemperatureGradientUnits.KelvinPerMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: TemperatureGradientUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: TemperatureGradientUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: TemperatureGradientUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: TemperatureGradientUnits, to_unit: TemperatureGradientUnits) -> float:
+        """
+        Convert a value from one TemperatureGradient unit to another, without creating a TemperatureGradient instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: TemperatureGradientUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: TemperatureGradientUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return TemperatureGradient._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: TemperatureGradientUnits, to_unit: TemperatureGradientUnits) -> List[float]:
+        """
+        Convert many values from one TemperatureGradient unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: TemperatureGradientUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: TemperatureGradientUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return TemperatureGradient._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: TemperatureGradientUnits, to_unit: TemperatureGradientUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", TemperatureGradient._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: TemperatureGradientUnits, to_unit: TemperatureGradientUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one TemperatureGradient unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: TemperatureGradientUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: TemperatureGradientUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return TemperatureGradient._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: TemperatureGradientUnits = TemperatureGradientUnits.KelvinPerMeter) -> TemperatureGradient:
+        """
+        Create a new instance of TemperatureGradient holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: TemperatureGradientUnits
+        :return: A new instance of TemperatureGradient.
+        :rtype: TemperatureGradient
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return TemperatureGradient._from_exact(value, from_unit)
+
+    def to_exact(self, unit: TemperatureGradientUnits = TemperatureGradientUnits.KelvinPerMeter) -> Fraction:
+        """
+        Get the exact value of the TemperatureGradient in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (KelvinPerMeter).
+        :type unit: TemperatureGradientUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> TemperatureGradient:
+        """
+        Parse a TemperatureGradient from a value followed by a unit abbreviation, e.g. "1 ∆°K/m".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of TemperatureGradient.
+        :rtype: TemperatureGradient
+        :raises ValueError: When the string is not a valid or an ambiguous TemperatureGradient.
+        """
+        return TemperatureGradient._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[TemperatureGradient]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return TemperatureGradient._try_parse(text)
+
+    def to_binary(self, unit: Optional[TemperatureGradientUnits] = None) -> bytes:
+        """
+        Encode the TemperatureGradient to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: TemperatureGradientUnits
+        :return: The encoded TemperatureGradient.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> TemperatureGradient:
+        """
+        Decode a TemperatureGradient encoded by to_binary.
+
+        :param data: The encoded TemperatureGradient, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of TemperatureGradient.
+        :rtype: TemperatureGradient
+        :raises ValueError: When the data is not a valid encoded TemperatureGradient.
+        """
+        return TemperatureGradient._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[TemperatureGradientUnits] = None) -> dict:
+        """
+        Get the TemperatureGradient DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (KelvinPerMeter).
+        :type hold_in_unit: TemperatureGradientUnits
+        :return: The TemperatureGradient DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[TemperatureGradientUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> TemperatureGradient:
+        """
+        Create a new instance of TemperatureGradient from its DTO.
+
+        :param dto: The TemperatureGradient DTO, the unit is the TemperatureGradientUnits value or name.
+        :type dto: dict
+        :return: A new instance of TemperatureGradient.
+        :rtype: TemperatureGradient
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return TemperatureGradient._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> TemperatureGradient:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return TemperatureGradient._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -161,10 +395,7 @@ class TemperatureGradient(AbstractMeasure):
         """
         
         """
-        if self.__kelvins_per_meter != None:
-            return self.__kelvins_per_meter
-        self.__kelvins_per_meter = self.__convert_from_base(TemperatureGradientUnits.KelvinPerMeter)
-        return self.__kelvins_per_meter
+        return self._cached_convert(TemperatureGradientUnits.KelvinPerMeter)
 
     
     @property
@@ -172,10 +403,7 @@ class TemperatureGradient(AbstractMeasure):
         """
         
         """
-        if self.__degrees_celcius_per_meter != None:
-            return self.__degrees_celcius_per_meter
-        self.__degrees_celcius_per_meter = self.__convert_from_base(TemperatureGradientUnits.DegreeCelsiusPerMeter)
-        return self.__degrees_celcius_per_meter
+        return self._cached_convert(TemperatureGradientUnits.DegreeCelsiusPerMeter)
 
     
     @property
@@ -183,10 +411,7 @@ class TemperatureGradient(AbstractMeasure):
         """
         
         """
-        if self.__degrees_fahrenheit_per_foot != None:
-            return self.__degrees_fahrenheit_per_foot
-        self.__degrees_fahrenheit_per_foot = self.__convert_from_base(TemperatureGradientUnits.DegreeFahrenheitPerFoot)
-        return self.__degrees_fahrenheit_per_foot
+        return self._cached_convert(TemperatureGradientUnits.DegreeFahrenheitPerFoot)
 
     
     @property
@@ -194,10 +419,7 @@ class TemperatureGradient(AbstractMeasure):
         """
         
         """
-        if self.__degrees_celcius_per_kilometer != None:
-            return self.__degrees_celcius_per_kilometer
-        self.__degrees_celcius_per_kilometer = self.__convert_from_base(TemperatureGradientUnits.DegreeCelsiusPerKilometer)
-        return self.__degrees_celcius_per_kilometer
+        return self._cached_convert(TemperatureGradientUnits.DegreeCelsiusPerKilometer)
 
     
     def to_string(self, unit: TemperatureGradientUnits = TemperatureGradientUnits.KelvinPerMeter) -> str:
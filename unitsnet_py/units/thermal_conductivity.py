@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ThermalConductivityUnits(Enum):
         """
             ThermalConductivityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         WattPerMeterKelvin = 'watt_per_meter_kelvin'
         """
@@ -29,41 +40,256 @@ class ThermalConductivity(AbstractMeasure):
         value (float): The value.
         from_unit (ThermalConductivityUnits): The ThermalConductivity unit to create from, The default unit is WattPerMeterKelvin
     """
-    def __init__(self, value: float, from_unit: ThermalConductivityUnits = ThermalConductivityUnits.WattPerMeterKelvin):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ThermalConductivityUnits
+
+    _base_unit = ThermalConductivityUnits.WattPerMeterKelvin
+
+    _dimensions = (1, 1, -3, 0, -1, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 107
+
+    _binary_unit_ids = {
         
-        self.__watts_per_meter_kelvin = None
+        ThermalConductivityUnits.WattPerMeterKelvin: 0,
         
-        self.__btus_per_hour_foot_fahrenheit = None
+        ThermalConductivityUnits.BtuPerHourFootFahrenheit: 1,
         
+    }
 
-    def convert(self, unit: ThermalConductivityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ThermalConductivityUnits.WattPerMeterKelvin: lambda value: (value),
+        
+        ThermalConductivityUnits.BtuPerHourFootFahrenheit: lambda value: (value / 1.73073467),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ThermalConductivityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        ThermalConductivityUnits.WattPerMeterKelvin: lambda value: (value),
         
-        if from_unit == ThermalConductivityUnits.WattPerMeterKelvin:
-            return (value)
+        ThermalConductivityUnits.BtuPerHourFootFahrenheit: lambda value: (value * 1.73073467),
         
-        if from_unit == ThermalConductivityUnits.BtuPerHourFootFahrenheit:
-            return (value / 1.73073467)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        ThermalConductivityUnits.WattPerMeterKelvin: ('1', '0'),
         
-        return None
+        ThermalConductivityUnits.BtuPerHourFootFahrenheit: ('100000000/173073467', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        ThermalConductivityUnits.WattPerMeterKelvin: ('1', '0'),
+        
+        ThermalConductivityUnits.BtuPerHourFootFahrenheit: ('173073467/100000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ThermalConductivityUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ThermalConductivityUnits.WattPerMeterKelvin:
-            return (value)
+        ThermalConductivityUnits.WattPerMeterKelvin: ('W/m·K',),
         
-        if to_unit == ThermalConductivityUnits.BtuPerHourFootFahrenheit:
-            return (value * 1.73073467)
+        ThermalConductivityUnits.BtuPerHourFootFahrenheit: ('BTU/h·ft·°F',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: ThermalConductivityUnits = ThermalConductivityUnits.WattPerMeterKelvin):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ThermalConductivityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ThermalConductivityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ThermalConductivityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ThermalConductivityUnits, to_unit: ThermalConductivityUnits) -> float:
+        """
+        Convert a value from one ThermalConductivity unit to another, without creating a ThermalConductivity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ThermalConductivityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ThermalConductivityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ThermalConductivity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ThermalConductivityUnits, to_unit: ThermalConductivityUnits) -> List[float]:
+        """
+        Convert many values from one ThermalConductivity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ThermalConductivityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ThermalConductivityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ThermalConductivity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ThermalConductivityUnits, to_unit: ThermalConductivityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ThermalConductivity._convert_many(values, from_unit, to_unit))
 
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ThermalConductivityUnits, to_unit: ThermalConductivityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ThermalConductivity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ThermalConductivityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ThermalConductivityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ThermalConductivity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ThermalConductivityUnits = ThermalConductivityUnits.WattPerMeterKelvin) -> ThermalConductivity:
+        """
+        Create a new instance of ThermalConductivity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ThermalConductivityUnits
+        :return: A new instance of ThermalConductivity.
+        :rtype: ThermalConductivity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ThermalConductivity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ThermalConductivityUnits = ThermalConductivityUnits.WattPerMeterKelvin) -> Fraction:
+        """
+        Get the exact value of the ThermalConductivity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (WattPerMeterKelvin).
+        :type unit: ThermalConductivityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ThermalConductivity:
+        """
+        Parse a ThermalConductivity from a value followed by a unit abbreviation, e.g. "1 W/m·K".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ThermalConductivity.
+        :rtype: ThermalConductivity
+        :raises ValueError: When the string is not a valid or an ambiguous ThermalConductivity.
+        """
+        return ThermalConductivity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ThermalConductivity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ThermalConductivity._try_parse(text)
+
+    def to_binary(self, unit: Optional[ThermalConductivityUnits] = None) -> bytes:
+        """
+        Encode the ThermalConductivity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ThermalConductivityUnits
+        :return: The encoded ThermalConductivity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ThermalConductivity:
+        """
+        Decode a ThermalConductivity encoded by to_binary.
+
+        :param data: The encoded ThermalConductivity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ThermalConductivity.
+        :rtype: ThermalConductivity
+        :raises ValueError: When the data is not a valid encoded ThermalConductivity.
+        """
+        return ThermalConductivity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ThermalConductivityUnits] = None) -> dict:
+        """
+        Get the ThermalConductivity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (WattPerMeterKelvin).
+        :type hold_in_unit: ThermalConductivityUnits
+        :return: The ThermalConductivity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ThermalConductivityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ThermalConductivity:
+        """
+        Create a new instance of ThermalConductivity from its DTO.
+
+        :param dto: The ThermalConductivity DTO, the unit is the ThermalConductivityUnits value or name.
+        :type dto: dict
+        :return: A new instance of ThermalConductivity.
+        :rtype: ThermalConductivity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ThermalConductivity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ThermalConductivity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ThermalConductivity._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -105,10 +331,7 @@ class ThermalConductivity(AbstractMeasure):
         """
         
         """
-        if self.__watts_per_meter_kelvin != None:
-            return self.__watts_per_meter_kelvin
-        self.__watts_per_meter_kelvin = self.__convert_from_base(ThermalConductivityUnits.WattPerMeterKelvin)
-        return self.__watts_per_meter_kelvin
+        return self._cached_convert(ThermalConductivityUnits.WattPerMeterKelvin)
 
     
     @property
@@ -116,10 +339,7 @@ class ThermalConductivity(AbstractMeasure):
         """
         
         """
-        if self.__btus_per_hour_foot_fahrenheit != None:
-            return self.__btus_per_hour_foot_fahrenheit
-        self.__btus_per_hour_foot_fahrenheit = self.__convert_from_base(ThermalConductivityUnits.BtuPerHourFootFahrenheit)
-        return self.__btus_per_hour_foot_fahrenheit
+        return self._cached_convert(ThermalConductivityUnits.BtuPerHourFootFahrenheit)
 
     
     def to_string(self, unit: ThermalConductivityUnits = ThermalConductivityUnits.WattPerMeterKelvin) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class ThermalResistanceUnits(Enum):
         """
             ThermalResistanceUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         SquareMeterKelvinPerKilowatt = 'square_meter_kelvin_per_kilowatt'
         """
@@ -49,73 +60,304 @@ class ThermalResistance(AbstractMeasure):
         value (float): The value.
         from_unit (ThermalResistanceUnits): The ThermalResistance unit to create from, The default unit is SquareMeterKelvinPerKilowatt
     """
-    def __init__(self, value: float, from_unit: ThermalResistanceUnits = ThermalResistanceUnits.SquareMeterKelvinPerKilowatt):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = ThermalResistanceUnits
+
+    _base_unit = ThermalResistanceUnits.SquareMeterKelvinPerKilowatt
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 108
+
+    _binary_unit_ids = {
         
-        self.__square_meter_kelvins_per_kilowatt = None
+        ThermalResistanceUnits.SquareMeterKelvinPerKilowatt: 0,
         
-        self.__square_meter_kelvins_per_watt = None
+        ThermalResistanceUnits.SquareMeterKelvinPerWatt: 1,
         
-        self.__square_meter_degrees_celsius_per_watt = None
+        ThermalResistanceUnits.SquareMeterDegreeCelsiusPerWatt: 2,
         
-        self.__square_centimeter_kelvins_per_watt = None
+        ThermalResistanceUnits.SquareCentimeterKelvinPerWatt: 3,
         
-        self.__square_centimeter_hour_degrees_celsius_per_kilocalorie = None
+        ThermalResistanceUnits.SquareCentimeterHourDegreeCelsiusPerKilocalorie: 4,
         
-        self.__hour_square_feet_degrees_fahrenheit_per_btu = None
+        ThermalResistanceUnits.HourSquareFeetDegreeFahrenheitPerBtu: 5,
         
+    }
 
-    def convert(self, unit: ThermalResistanceUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        ThermalResistanceUnits.SquareMeterKelvinPerKilowatt: lambda value: (value),
+        
+        ThermalResistanceUnits.SquareMeterKelvinPerWatt: lambda value: (value / 1000),
+        
+        ThermalResistanceUnits.SquareMeterDegreeCelsiusPerWatt: lambda value: (value / 1000.0),
+        
+        ThermalResistanceUnits.SquareCentimeterKelvinPerWatt: lambda value: (value / 0.1),
+        
+        ThermalResistanceUnits.SquareCentimeterHourDegreeCelsiusPerKilocalorie: lambda value: (value / 0.0859779507590433),
+        
+        ThermalResistanceUnits.HourSquareFeetDegreeFahrenheitPerBtu: lambda value: (value / 176.1121482159839),
+        
+    }
 
-    def __convert_from_base(self, from_unit: ThermalResistanceUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        ThermalResistanceUnits.SquareMeterKelvinPerKilowatt: lambda value: (value),
+        
+        ThermalResistanceUnits.SquareMeterKelvinPerWatt: lambda value: (value * 1000),
+        
+        ThermalResistanceUnits.SquareMeterDegreeCelsiusPerWatt: lambda value: (value * 1000.0),
+        
+        ThermalResistanceUnits.SquareCentimeterKelvinPerWatt: lambda value: (value * 0.1),
+        
+        ThermalResistanceUnits.SquareCentimeterHourDegreeCelsiusPerKilocalorie: lambda value: (value * 0.0859779507590433),
+        
+        ThermalResistanceUnits.HourSquareFeetDegreeFahrenheitPerBtu: lambda value: (value * 176.1121482159839),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
         
-        if from_unit == ThermalResistanceUnits.SquareMeterKelvinPerKilowatt:
-            return (value)
+        ThermalResistanceUnits.SquareMeterKelvinPerKilowatt: ('1', '0'),
         
-        if from_unit == ThermalResistanceUnits.SquareMeterKelvinPerWatt:
-            return (value / 1000)
+        ThermalResistanceUnits.SquareMeterKelvinPerWatt: ('1/1000', '0'),
         
-        if from_unit == ThermalResistanceUnits.SquareMeterDegreeCelsiusPerWatt:
-            return (value / 1000.0)
+        ThermalResistanceUnits.SquareMeterDegreeCelsiusPerWatt: ('1/1000', '0'),
         
-        if from_unit == ThermalResistanceUnits.SquareCentimeterKelvinPerWatt:
-            return (value / 0.1)
+        ThermalResistanceUnits.SquareCentimeterKelvinPerWatt: ('10', '0'),
         
-        if from_unit == ThermalResistanceUnits.SquareCentimeterHourDegreeCelsiusPerKilocalorie:
-            return (value / 0.0859779507590433)
+        ThermalResistanceUnits.SquareCentimeterHourDegreeCelsiusPerKilocalorie: ('10000000000000000/859779507590433', '0'),
         
-        if from_unit == ThermalResistanceUnits.HourSquareFeetDegreeFahrenheitPerBtu:
-            return (value / 176.1121482159839)
+        ThermalResistanceUnits.HourSquareFeetDegreeFahrenheitPerBtu: ('10000000000000/1761121482159839', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        ThermalResistanceUnits.SquareMeterKelvinPerKilowatt: ('1', '0'),
+        
+        ThermalResistanceUnits.SquareMeterKelvinPerWatt: ('1000', '0'),
+        
+        ThermalResistanceUnits.SquareMeterDegreeCelsiusPerWatt: ('1000', '0'),
+        
+        ThermalResistanceUnits.SquareCentimeterKelvinPerWatt: ('1/10', '0'),
+        
+        ThermalResistanceUnits.SquareCentimeterHourDegreeCelsiusPerKilocalorie: ('859779507590433/10000000000000000', '0'),
+        
+        ThermalResistanceUnits.HourSquareFeetDegreeFahrenheitPerBtu: ('1761121482159839/10000000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: ThermalResistanceUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == ThermalResistanceUnits.SquareMeterKelvinPerKilowatt:
-            return (value)
+        ThermalResistanceUnits.SquareMeterKelvinPerKilowatt: ('m²K/kW',),
         
-        if to_unit == ThermalResistanceUnits.SquareMeterKelvinPerWatt:
-            return (value * 1000)
+        ThermalResistanceUnits.SquareMeterKelvinPerWatt: ('m²K/W',),
         
-        if to_unit == ThermalResistanceUnits.SquareMeterDegreeCelsiusPerWatt:
-            return (value * 1000.0)
+        ThermalResistanceUnits.SquareMeterDegreeCelsiusPerWatt: ('m²°C/W',),
         
-        if to_unit == ThermalResistanceUnits.SquareCentimeterKelvinPerWatt:
-            return (value * 0.1)
+        ThermalResistanceUnits.SquareCentimeterKelvinPerWatt: ('cm²K/W',),
         
-        if to_unit == ThermalResistanceUnits.SquareCentimeterHourDegreeCelsiusPerKilocalorie:
-            return (value * 0.0859779507590433)
+        ThermalResistanceUnits.SquareCentimeterHourDegreeCelsiusPerKilocalorie: ('cm²Hr°C/kcal',),
         
-        if to_unit == ThermalResistanceUnits.HourSquareFeetDegreeFahrenheitPerBtu:
-            return (value * 176.1121482159839)
+        ThermalResistanceUnits.HourSquareFeetDegreeFahrenheitPerBtu: ('Hrft²°F/Btu',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: ThermalResistanceUnits = ThermalResistanceUnits.SquareMeterKelvinPerKilowatt):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: ThermalResistanceUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: ThermalResistanceUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: ThermalResistanceUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: ThermalResistanceUnits, to_unit: ThermalResistanceUnits) -> float:
+        """
+        Convert a value from one ThermalResistance unit to another, without creating a ThermalResistance instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: ThermalResistanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ThermalResistanceUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return ThermalResistance._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: ThermalResistanceUnits, to_unit: ThermalResistanceUnits) -> List[float]:
+        """
+        Convert many values from one ThermalResistance unit to another.
+        The conversion is resolved once and applied to all the values.
 
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: ThermalResistanceUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: ThermalResistanceUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return ThermalResistance._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: ThermalResistanceUnits, to_unit: ThermalResistanceUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", ThermalResistance._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: ThermalResistanceUnits, to_unit: ThermalResistanceUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one ThermalResistance unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ThermalResistanceUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: ThermalResistanceUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return ThermalResistance._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: ThermalResistanceUnits = ThermalResistanceUnits.SquareMeterKelvinPerKilowatt) -> ThermalResistance:
+        """
+        Create a new instance of ThermalResistance holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: ThermalResistanceUnits
+        :return: A new instance of ThermalResistance.
+        :rtype: ThermalResistance
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return ThermalResistance._from_exact(value, from_unit)
+
+    def to_exact(self, unit: ThermalResistanceUnits = ThermalResistanceUnits.SquareMeterKelvinPerKilowatt) -> Fraction:
+        """
+        Get the exact value of the ThermalResistance in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (SquareMeterKelvinPerKilowatt).
+        :type unit: ThermalResistanceUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> ThermalResistance:
+        """
+        Parse a ThermalResistance from a value followed by a unit abbreviation, e.g. "1 m²K/kW".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of ThermalResistance.
+        :rtype: ThermalResistance
+        :raises ValueError: When the string is not a valid or an ambiguous ThermalResistance.
+        """
+        return ThermalResistance._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[ThermalResistance]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return ThermalResistance._try_parse(text)
+
+    def to_binary(self, unit: Optional[ThermalResistanceUnits] = None) -> bytes:
+        """
+        Encode the ThermalResistance to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: ThermalResistanceUnits
+        :return: The encoded ThermalResistance.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> ThermalResistance:
+        """
+        Decode a ThermalResistance encoded by to_binary.
+
+        :param data: The encoded ThermalResistance, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of ThermalResistance.
+        :rtype: ThermalResistance
+        :raises ValueError: When the data is not a valid encoded ThermalResistance.
+        """
+        return ThermalResistance._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[ThermalResistanceUnits] = None) -> dict:
+        """
+        Get the ThermalResistance DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (SquareMeterKelvinPerKilowatt).
+        :type hold_in_unit: ThermalResistanceUnits
+        :return: The ThermalResistance DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[ThermalResistanceUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> ThermalResistance:
+        """
+        Create a new instance of ThermalResistance from its DTO.
+
+        :param dto: The ThermalResistance DTO, the unit is the ThermalResistanceUnits value or name.
+        :type dto: dict
+        :return: A new instance of ThermalResistance.
+        :rtype: ThermalResistance
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return ThermalResistance._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> ThermalResistance:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return ThermalResistance._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -217,10 +459,7 @@ class ThermalResistance(AbstractMeasure):
         """
         
         """
-        if self.__square_meter_kelvins_per_kilowatt != None:
-            return self.__square_meter_kelvins_per_kilowatt
-        self.__square_meter_kelvins_per_kilowatt = self.__convert_from_base(ThermalResistanceUnits.SquareMeterKelvinPerKilowatt)
-        return self.__square_meter_kelvins_per_kilowatt
+        return self._cached_convert(ThermalResistanceUnits.SquareMeterKelvinPerKilowatt)
 
     
     @property
@@ -228,10 +467,7 @@ class ThermalResistance(AbstractMeasure):
         """
         
         """
-        if self.__square_meter_kelvins_per_watt != None:
-            return self.__square_meter_kelvins_per_watt
-        self.__square_meter_kelvins_per_watt = self.__convert_from_base(ThermalResistanceUnits.SquareMeterKelvinPerWatt)
-        return self.__square_meter_kelvins_per_watt
+        return self._cached_convert(ThermalResistanceUnits.SquareMeterKelvinPerWatt)
 
     
     @property
@@ -239,10 +475,7 @@ class ThermalResistance(AbstractMeasure):
         """
         
         """
-        if self.__square_meter_degrees_celsius_per_watt != None:
-            return self.__square_meter_degrees_celsius_per_watt
-        self.__square_meter_degrees_celsius_per_watt = self.__convert_from_base(ThermalResistanceUnits.SquareMeterDegreeCelsiusPerWatt)
-        return self.__square_meter_degrees_celsius_per_watt
+        return self._cached_convert(ThermalResistanceUnits.SquareMeterDegreeCelsiusPerWatt)
 
     
     @property
@@ -250,10 +483,7 @@ class ThermalResistance(AbstractMeasure):
         """
         
         """
-        if self.__square_centimeter_kelvins_per_watt != None:
-            return self.__square_centimeter_kelvins_per_watt
-        self.__square_centimeter_kelvins_per_watt = self.__convert_from_base(ThermalResistanceUnits.SquareCentimeterKelvinPerWatt)
-        return self.__square_centimeter_kelvins_per_watt
+        return self._cached_convert(ThermalResistanceUnits.SquareCentimeterKelvinPerWatt)
 
     
     @property
@@ -261,10 +491,7 @@ class ThermalResistance(AbstractMeasure):
         """
         
         """
-        if self.__square_centimeter_hour_degrees_celsius_per_kilocalorie != None:
-            return self.__square_centimeter_hour_degrees_celsius_per_kilocalorie
-        self.__square_centimeter_hour_degrees_celsius_per_kilocalorie = self.__convert_from_base(ThermalResistanceUnits.SquareCentimeterHourDegreeCelsiusPerKilocalorie)
-        return self.__square_centimeter_hour_degrees_celsius_per_kilocalorie
+        return self._cached_convert(ThermalResistanceUnits.SquareCentimeterHourDegreeCelsiusPerKilocalorie)
 
     
     @property
@@ -272,10 +499,7 @@ class ThermalResistance(AbstractMeasure):
         """
         
         """
-        if self.__hour_square_feet_degrees_fahrenheit_per_btu != None:
-            return self.__hour_square_feet_degrees_fahrenheit_per_btu
-        self.__hour_square_feet_degrees_fahrenheit_per_btu = self.__convert_from_base(ThermalResistanceUnits.HourSquareFeetDegreeFahrenheitPerBtu)
-        return self.__hour_square_feet_degrees_fahrenheit_per_btu
+        return self._cached_convert(ThermalResistanceUnits.HourSquareFeetDegreeFahrenheitPerBtu)
 
     
     def to_string(self, unit: ThermalResistanceUnits = ThermalResistanceUnits.SquareMeterKelvinPerKilowatt) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class TorqueUnits(Enum):
         """
             TorqueUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         NewtonMillimeter = 'newton_millimeter'
         """
@@ -144,225 +155,532 @@ class Torque(AbstractMeasure):
         value (float): The value.
         from_unit (TorqueUnits): The Torque unit to create from, The default unit is NewtonMeter
     """
-    def __init__(self, value: float, from_unit: TorqueUnits = TorqueUnits.NewtonMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = TorqueUnits
+
+    _base_unit = TorqueUnits.NewtonMeter
+
+    _dimensions = (2, 1, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 109
+
+    _binary_unit_ids = {
         
-        self.__newton_millimeters = None
+        TorqueUnits.NewtonMillimeter: 0,
         
-        self.__newton_centimeters = None
+        TorqueUnits.NewtonCentimeter: 1,
         
-        self.__newton_meters = None
+        TorqueUnits.NewtonMeter: 2,
         
-        self.__poundal_feet = None
+        TorqueUnits.PoundalFoot: 3,
         
-        self.__pound_force_inches = None
+        TorqueUnits.PoundForceInch: 4,
         
-        self.__pound_force_feet = None
+        TorqueUnits.PoundForceFoot: 5,
         
-        self.__gram_force_millimeters = None
+        TorqueUnits.GramForceMillimeter: 6,
         
-        self.__gram_force_centimeters = None
+        TorqueUnits.GramForceCentimeter: 7,
         
-        self.__gram_force_meters = None
+        TorqueUnits.GramForceMeter: 8,
         
-        self.__kilogram_force_millimeters = None
+        TorqueUnits.KilogramForceMillimeter: 9,
         
-        self.__kilogram_force_centimeters = None
+        TorqueUnits.KilogramForceCentimeter: 10,
         
-        self.__kilogram_force_meters = None
+        TorqueUnits.KilogramForceMeter: 11,
         
-        self.__tonne_force_millimeters = None
+        TorqueUnits.TonneForceMillimeter: 12,
         
-        self.__tonne_force_centimeters = None
+        TorqueUnits.TonneForceCentimeter: 13,
         
-        self.__tonne_force_meters = None
+        TorqueUnits.TonneForceMeter: 14,
         
-        self.__kilonewton_millimeters = None
+        TorqueUnits.KilonewtonMillimeter: 15,
         
-        self.__meganewton_millimeters = None
+        TorqueUnits.MeganewtonMillimeter: 16,
         
-        self.__kilonewton_centimeters = None
+        TorqueUnits.KilonewtonCentimeter: 17,
         
-        self.__meganewton_centimeters = None
+        TorqueUnits.MeganewtonCentimeter: 18,
         
-        self.__kilonewton_meters = None
+        TorqueUnits.KilonewtonMeter: 19,
         
-        self.__meganewton_meters = None
+        TorqueUnits.MeganewtonMeter: 20,
         
-        self.__kilopound_force_inches = None
+        TorqueUnits.KilopoundForceInch: 21,
         
-        self.__megapound_force_inches = None
+        TorqueUnits.MegapoundForceInch: 22,
         
-        self.__kilopound_force_feet = None
+        TorqueUnits.KilopoundForceFoot: 23,
         
-        self.__megapound_force_feet = None
+        TorqueUnits.MegapoundForceFoot: 24,
         
+    }
 
-    def convert(self, unit: TorqueUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        TorqueUnits.NewtonMillimeter: lambda value: (value * 1000),
+        
+        TorqueUnits.NewtonCentimeter: lambda value: (value * 100),
+        
+        TorqueUnits.NewtonMeter: lambda value: (value),
+        
+        TorqueUnits.PoundalFoot: lambda value: (value / 4.21401100938048e-2),
+        
+        TorqueUnits.PoundForceInch: lambda value: (value / 1.129848290276167e-1),
+        
+        TorqueUnits.PoundForceFoot: lambda value: (value / 1.3558179483314),
+        
+        TorqueUnits.GramForceMillimeter: lambda value: (value / 9.80665e-6),
+        
+        TorqueUnits.GramForceCentimeter: lambda value: (value / 9.80665e-5),
+        
+        TorqueUnits.GramForceMeter: lambda value: (value / 9.80665e-3),
+        
+        TorqueUnits.KilogramForceMillimeter: lambda value: (value / 9.80665e-3),
+        
+        TorqueUnits.KilogramForceCentimeter: lambda value: (value / 9.80665e-2),
+        
+        TorqueUnits.KilogramForceMeter: lambda value: (value / 9.80665),
+        
+        TorqueUnits.TonneForceMillimeter: lambda value: (value / 9.80665),
+        
+        TorqueUnits.TonneForceCentimeter: lambda value: (value / 9.80665e1),
+        
+        TorqueUnits.TonneForceMeter: lambda value: (value / 9.80665e3),
+        
+        TorqueUnits.KilonewtonMillimeter: lambda value: ((value * 1000) / 1000.0),
+        
+        TorqueUnits.MeganewtonMillimeter: lambda value: ((value * 1000) / 1000000.0),
+        
+        TorqueUnits.KilonewtonCentimeter: lambda value: ((value * 100) / 1000.0),
+        
+        TorqueUnits.MeganewtonCentimeter: lambda value: ((value * 100) / 1000000.0),
+        
+        TorqueUnits.KilonewtonMeter: lambda value: ((value) / 1000.0),
+        
+        TorqueUnits.MeganewtonMeter: lambda value: ((value) / 1000000.0),
+        
+        TorqueUnits.KilopoundForceInch: lambda value: ((value / 1.129848290276167e-1) / 1000.0),
+        
+        TorqueUnits.MegapoundForceInch: lambda value: ((value / 1.129848290276167e-1) / 1000000.0),
+        
+        TorqueUnits.KilopoundForceFoot: lambda value: ((value / 1.3558179483314) / 1000.0),
+        
+        TorqueUnits.MegapoundForceFoot: lambda value: ((value / 1.3558179483314) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: TorqueUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == TorqueUnits.NewtonMillimeter:
-            return (value * 1000)
+        TorqueUnits.NewtonMillimeter: lambda value: (value * 0.001),
         
-        if from_unit == TorqueUnits.NewtonCentimeter:
-            return (value * 100)
+        TorqueUnits.NewtonCentimeter: lambda value: (value * 0.01),
         
-        if from_unit == TorqueUnits.NewtonMeter:
-            return (value)
+        TorqueUnits.NewtonMeter: lambda value: (value),
         
-        if from_unit == TorqueUnits.PoundalFoot:
-            return (value / 4.21401100938048e-2)
+        TorqueUnits.PoundalFoot: lambda value: (value * 4.21401100938048e-2),
         
-        if from_unit == TorqueUnits.PoundForceInch:
-            return (value / 1.129848290276167e-1)
+        TorqueUnits.PoundForceInch: lambda value: (value * 1.129848290276167e-1),
         
-        if from_unit == TorqueUnits.PoundForceFoot:
-            return (value / 1.3558179483314)
+        TorqueUnits.PoundForceFoot: lambda value: (value * 1.3558179483314),
         
-        if from_unit == TorqueUnits.GramForceMillimeter:
-            return (value / 9.80665e-6)
+        TorqueUnits.GramForceMillimeter: lambda value: (value * 9.80665e-6),
         
-        if from_unit == TorqueUnits.GramForceCentimeter:
-            return (value / 9.80665e-5)
+        TorqueUnits.GramForceCentimeter: lambda value: (value * 9.80665e-5),
         
-        if from_unit == TorqueUnits.GramForceMeter:
-            return (value / 9.80665e-3)
+        TorqueUnits.GramForceMeter: lambda value: (value * 9.80665e-3),
         
-        if from_unit == TorqueUnits.KilogramForceMillimeter:
-            return (value / 9.80665e-3)
+        TorqueUnits.KilogramForceMillimeter: lambda value: (value * 9.80665e-3),
         
-        if from_unit == TorqueUnits.KilogramForceCentimeter:
-            return (value / 9.80665e-2)
+        TorqueUnits.KilogramForceCentimeter: lambda value: (value * 9.80665e-2),
         
-        if from_unit == TorqueUnits.KilogramForceMeter:
-            return (value / 9.80665)
+        TorqueUnits.KilogramForceMeter: lambda value: (value * 9.80665),
         
-        if from_unit == TorqueUnits.TonneForceMillimeter:
-            return (value / 9.80665)
+        TorqueUnits.TonneForceMillimeter: lambda value: (value * 9.80665),
         
-        if from_unit == TorqueUnits.TonneForceCentimeter:
-            return (value / 9.80665e1)
+        TorqueUnits.TonneForceCentimeter: lambda value: (value * 9.80665e1),
         
-        if from_unit == TorqueUnits.TonneForceMeter:
-            return (value / 9.80665e3)
+        TorqueUnits.TonneForceMeter: lambda value: (value * 9.80665e3),
         
-        if from_unit == TorqueUnits.KilonewtonMillimeter:
-            return ((value * 1000) / 1000.0)
+        TorqueUnits.KilonewtonMillimeter: lambda value: ((value * 0.001) * 1000.0),
         
-        if from_unit == TorqueUnits.MeganewtonMillimeter:
-            return ((value * 1000) / 1000000.0)
+        TorqueUnits.MeganewtonMillimeter: lambda value: ((value * 0.001) * 1000000.0),
         
-        if from_unit == TorqueUnits.KilonewtonCentimeter:
-            return ((value * 100) / 1000.0)
+        TorqueUnits.KilonewtonCentimeter: lambda value: ((value * 0.01) * 1000.0),
         
-        if from_unit == TorqueUnits.MeganewtonCentimeter:
-            return ((value * 100) / 1000000.0)
+        TorqueUnits.MeganewtonCentimeter: lambda value: ((value * 0.01) * 1000000.0),
         
-        if from_unit == TorqueUnits.KilonewtonMeter:
-            return ((value) / 1000.0)
+        TorqueUnits.KilonewtonMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == TorqueUnits.MeganewtonMeter:
-            return ((value) / 1000000.0)
+        TorqueUnits.MeganewtonMeter: lambda value: ((value) * 1000000.0),
         
-        if from_unit == TorqueUnits.KilopoundForceInch:
-            return ((value / 1.129848290276167e-1) / 1000.0)
+        TorqueUnits.KilopoundForceInch: lambda value: ((value * 1.129848290276167e-1) * 1000.0),
         
-        if from_unit == TorqueUnits.MegapoundForceInch:
-            return ((value / 1.129848290276167e-1) / 1000000.0)
+        TorqueUnits.MegapoundForceInch: lambda value: ((value * 1.129848290276167e-1) * 1000000.0),
         
-        if from_unit == TorqueUnits.KilopoundForceFoot:
-            return ((value / 1.3558179483314) / 1000.0)
+        TorqueUnits.KilopoundForceFoot: lambda value: ((value * 1.3558179483314) * 1000.0),
         
-        if from_unit == TorqueUnits.MegapoundForceFoot:
-            return ((value / 1.3558179483314) / 1000000.0)
+        TorqueUnits.MegapoundForceFoot: lambda value: ((value * 1.3558179483314) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        TorqueUnits.NewtonMillimeter: ('1000', '0'),
+        
+        TorqueUnits.NewtonCentimeter: ('100', '0'),
+        
+        TorqueUnits.NewtonMeter: ('1', '0'),
+        
+        TorqueUnits.PoundalFoot: ('156250000000000/6584392202157', '0'),
+        
+        TorqueUnits.PoundForceInch: ('10000000000000000/1129848290276167', '0'),
+        
+        TorqueUnits.PoundForceFoot: ('5000000000000/6779089741657', '0'),
+        
+        TorqueUnits.GramForceMillimeter: ('20000000000/196133', '0'),
+        
+        TorqueUnits.GramForceCentimeter: ('2000000000/196133', '0'),
+        
+        TorqueUnits.GramForceMeter: ('20000000/196133', '0'),
+        
+        TorqueUnits.KilogramForceMillimeter: ('20000000/196133', '0'),
+        
+        TorqueUnits.KilogramForceCentimeter: ('2000000/196133', '0'),
+        
+        TorqueUnits.KilogramForceMeter: ('20000/196133', '0'),
+        
+        TorqueUnits.TonneForceMillimeter: ('20000/196133', '0'),
+        
+        TorqueUnits.TonneForceCentimeter: ('2000/196133', '0'),
+        
+        TorqueUnits.TonneForceMeter: ('20/196133', '0'),
+        
+        TorqueUnits.KilonewtonMillimeter: ('1', '0'),
+        
+        TorqueUnits.MeganewtonMillimeter: ('1/1000', '0'),
+        
+        TorqueUnits.KilonewtonCentimeter: ('1/10', '0'),
+        
+        TorqueUnits.MeganewtonCentimeter: ('1/10000', '0'),
+        
+        TorqueUnits.KilonewtonMeter: ('1/1000', '0'),
+        
+        TorqueUnits.MeganewtonMeter: ('1/1000000', '0'),
+        
+        TorqueUnits.KilopoundForceInch: ('10000000000000/1129848290276167', '0'),
+        
+        TorqueUnits.MegapoundForceInch: ('10000000000/1129848290276167', '0'),
+        
+        TorqueUnits.KilopoundForceFoot: ('5000000000/6779089741657', '0'),
+        
+        TorqueUnits.MegapoundForceFoot: ('5000000/6779089741657', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: TorqueUnits) -> float:
+    _affine_to_base = {
+        
+        TorqueUnits.NewtonMillimeter: ('1/1000', '0'),
+        
+        TorqueUnits.NewtonCentimeter: ('1/100', '0'),
+        
+        TorqueUnits.NewtonMeter: ('1', '0'),
+        
+        TorqueUnits.PoundalFoot: ('6584392202157/156250000000000', '0'),
+        
+        TorqueUnits.PoundForceInch: ('1129848290276167/10000000000000000', '0'),
+        
+        TorqueUnits.PoundForceFoot: ('6779089741657/5000000000000', '0'),
+        
+        TorqueUnits.GramForceMillimeter: ('196133/20000000000', '0'),
+        
+        TorqueUnits.GramForceCentimeter: ('196133/2000000000', '0'),
+        
+        TorqueUnits.GramForceMeter: ('196133/20000000', '0'),
+        
+        TorqueUnits.KilogramForceMillimeter: ('196133/20000000', '0'),
+        
+        TorqueUnits.KilogramForceCentimeter: ('196133/2000000', '0'),
+        
+        TorqueUnits.KilogramForceMeter: ('196133/20000', '0'),
+        
+        TorqueUnits.TonneForceMillimeter: ('196133/20000', '0'),
+        
+        TorqueUnits.TonneForceCentimeter: ('196133/2000', '0'),
+        
+        TorqueUnits.TonneForceMeter: ('196133/20', '0'),
+        
+        TorqueUnits.KilonewtonMillimeter: ('1', '0'),
+        
+        TorqueUnits.MeganewtonMillimeter: ('1000', '0'),
+        
+        TorqueUnits.KilonewtonCentimeter: ('10', '0'),
+        
+        TorqueUnits.MeganewtonCentimeter: ('10000', '0'),
+        
+        TorqueUnits.KilonewtonMeter: ('1000', '0'),
         
-        if to_unit == TorqueUnits.NewtonMillimeter:
-            return (value * 0.001)
+        TorqueUnits.MeganewtonMeter: ('1000000', '0'),
         
-        if to_unit == TorqueUnits.NewtonCentimeter:
-            return (value * 0.01)
+        TorqueUnits.KilopoundForceInch: ('1129848290276167/10000000000000', '0'),
         
-        if to_unit == TorqueUnits.NewtonMeter:
-            return (value)
+        TorqueUnits.MegapoundForceInch: ('1129848290276167/10000000000', '0'),
         
-        if to_unit == TorqueUnits.PoundalFoot:
-            return (value * 4.21401100938048e-2)
+        TorqueUnits.KilopoundForceFoot: ('6779089741657/5000000000', '0'),
         
-        if to_unit == TorqueUnits.PoundForceInch:
-            return (value * 1.129848290276167e-1)
+        TorqueUnits.MegapoundForceFoot: ('6779089741657/5000000', '0'),
         
-        if to_unit == TorqueUnits.PoundForceFoot:
-            return (value * 1.3558179483314)
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        TorqueUnits.NewtonMillimeter: ('N·mm',),
+        
+        TorqueUnits.NewtonCentimeter: ('N·cm',),
+        
+        TorqueUnits.NewtonMeter: ('N·m',),
+        
+        TorqueUnits.PoundalFoot: ('pdl·ft',),
+        
+        TorqueUnits.PoundForceInch: ('lbf·in',),
         
-        if to_unit == TorqueUnits.GramForceMillimeter:
-            return (value * 9.80665e-6)
+        TorqueUnits.PoundForceFoot: ('lbf·ft',),
         
-        if to_unit == TorqueUnits.GramForceCentimeter:
-            return (value * 9.80665e-5)
+        TorqueUnits.GramForceMillimeter: ('gf·mm',),
         
-        if to_unit == TorqueUnits.GramForceMeter:
-            return (value * 9.80665e-3)
+        TorqueUnits.GramForceCentimeter: ('gf·cm',),
         
-        if to_unit == TorqueUnits.KilogramForceMillimeter:
-            return (value * 9.80665e-3)
+        TorqueUnits.GramForceMeter: ('gf·m',),
         
-        if to_unit == TorqueUnits.KilogramForceCentimeter:
-            return (value * 9.80665e-2)
+        TorqueUnits.KilogramForceMillimeter: ('kgf·mm',),
         
-        if to_unit == TorqueUnits.KilogramForceMeter:
-            return (value * 9.80665)
+        TorqueUnits.KilogramForceCentimeter: ('kgf·cm',),
         
-        if to_unit == TorqueUnits.TonneForceMillimeter:
-            return (value * 9.80665)
+        TorqueUnits.KilogramForceMeter: ('kgf·m',),
         
-        if to_unit == TorqueUnits.TonneForceCentimeter:
-            return (value * 9.80665e1)
+        TorqueUnits.TonneForceMillimeter: ('tf·mm',),
         
-        if to_unit == TorqueUnits.TonneForceMeter:
-            return (value * 9.80665e3)
+        TorqueUnits.TonneForceCentimeter: ('tf·cm',),
         
-        if to_unit == TorqueUnits.KilonewtonMillimeter:
-            return ((value * 0.001) * 1000.0)
+        TorqueUnits.TonneForceMeter: ('tf·m',),
         
-        if to_unit == TorqueUnits.MeganewtonMillimeter:
-            return ((value * 0.001) * 1000000.0)
+        TorqueUnits.KilonewtonMillimeter: ('kN·mm',),
         
-        if to_unit == TorqueUnits.KilonewtonCentimeter:
-            return ((value * 0.01) * 1000.0)
+        TorqueUnits.MeganewtonMillimeter: ('MN·mm',),
         
-        if to_unit == TorqueUnits.MeganewtonCentimeter:
-            return ((value * 0.01) * 1000000.0)
+        TorqueUnits.KilonewtonCentimeter: ('kN·cm',),
         
-        if to_unit == TorqueUnits.KilonewtonMeter:
-            return ((value) * 1000.0)
+        TorqueUnits.MeganewtonCentimeter: ('MN·cm',),
         
-        if to_unit == TorqueUnits.MeganewtonMeter:
-            return ((value) * 1000000.0)
+        TorqueUnits.KilonewtonMeter: ('kN·m',),
         
-        if to_unit == TorqueUnits.KilopoundForceInch:
-            return ((value * 1.129848290276167e-1) * 1000.0)
+        TorqueUnits.MeganewtonMeter: ('MN·m',),
         
-        if to_unit == TorqueUnits.MegapoundForceInch:
-            return ((value * 1.129848290276167e-1) * 1000000.0)
+        TorqueUnits.KilopoundForceInch: ('klbf·in',),
         
-        if to_unit == TorqueUnits.KilopoundForceFoot:
-            return ((value * 1.3558179483314) * 1000.0)
+        TorqueUnits.MegapoundForceInch: ('Mlbf·in',),
         
-        if to_unit == TorqueUnits.MegapoundForceFoot:
-            return ((value * 1.3558179483314) * 1000000.0)
+        TorqueUnits.KilopoundForceFoot: ('klbf·ft',),
         
-        return None
+        TorqueUnits.MegapoundForceFoot: ('Mlbf·ft',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: TorqueUnits = TorqueUnits.NewtonMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: TorqueUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: TorqueUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: TorqueUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: TorqueUnits, to_unit: TorqueUnits) -> float:
+        """
+        Convert a value from one Torque unit to another, without creating a Torque instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: TorqueUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: TorqueUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Torque._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: TorqueUnits, to_unit: TorqueUnits) -> List[float]:
+        """
+        Convert many values from one Torque unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: TorqueUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: TorqueUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Torque._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: TorqueUnits, to_unit: TorqueUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Torque._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: TorqueUnits, to_unit: TorqueUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Torque unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: TorqueUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: TorqueUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Torque._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: TorqueUnits = TorqueUnits.NewtonMeter) -> Torque:
+        """
+        Create a new instance of Torque holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: TorqueUnits
+        :return: A new instance of Torque.
+        :rtype: Torque
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Torque._from_exact(value, from_unit)
+
+    def to_exact(self, unit: TorqueUnits = TorqueUnits.NewtonMeter) -> Fraction:
+        """
+        Get the exact value of the Torque in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (NewtonMeter).
+        :type unit: TorqueUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
 
+    @staticmethod
+    def parse(text: str) -> Torque:
+        """
+        Parse a Torque from a value followed by a unit abbreviation, e.g. "1 N·mm".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Torque.
+        :rtype: Torque
+        :raises ValueError: When the string is not a valid or an ambiguous Torque.
+        """
+        return Torque._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Torque]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Torque._try_parse(text)
+
+    def to_binary(self, unit: Optional[TorqueUnits] = None) -> bytes:
+        """
+        Encode the Torque to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: TorqueUnits
+        :return: The encoded Torque.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Torque:
+        """
+        Decode a Torque encoded by to_binary.
+
+        :param data: The encoded Torque, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Torque.
+        :rtype: Torque
+        :raises ValueError: When the data is not a valid encoded Torque.
+        """
+        return Torque._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[TorqueUnits] = None) -> dict:
+        """
+        Get the Torque DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (NewtonMeter).
+        :type hold_in_unit: TorqueUnits
+        :return: The Torque DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[TorqueUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Torque:
+        """
+        Create a new instance of Torque from its DTO.
+
+        :param dto: The Torque DTO, the unit is the TorqueUnits value or name.
+        :type dto: dict
+        :return: A new instance of Torque.
+        :rtype: Torque
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Torque._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Torque:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Torque._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -749,10 +1067,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__newton_millimeters != None:
-            return self.__newton_millimeters
-        self.__newton_millimeters = self.__convert_from_base(TorqueUnits.NewtonMillimeter)
-        return self.__newton_millimeters
+        return self._cached_convert(TorqueUnits.NewtonMillimeter)
 
     
     @property
@@ -760,10 +1075,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__newton_centimeters != None:
-            return self.__newton_centimeters
-        self.__newton_centimeters = self.__convert_from_base(TorqueUnits.NewtonCentimeter)
-        return self.__newton_centimeters
+        return self._cached_convert(TorqueUnits.NewtonCentimeter)
 
     
     @property
@@ -771,10 +1083,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__newton_meters != None:
-            return self.__newton_meters
-        self.__newton_meters = self.__convert_from_base(TorqueUnits.NewtonMeter)
-        return self.__newton_meters
+        return self._cached_convert(TorqueUnits.NewtonMeter)
 
     
     @property
@@ -782,10 +1091,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__poundal_feet != None:
-            return self.__poundal_feet
-        self.__poundal_feet = self.__convert_from_base(TorqueUnits.PoundalFoot)
-        return self.__poundal_feet
+        return self._cached_convert(TorqueUnits.PoundalFoot)
 
     
     @property
@@ -793,10 +1099,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__pound_force_inches != None:
-            return self.__pound_force_inches
-        self.__pound_force_inches = self.__convert_from_base(TorqueUnits.PoundForceInch)
-        return self.__pound_force_inches
+        return self._cached_convert(TorqueUnits.PoundForceInch)
 
     
     @property
@@ -804,10 +1107,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__pound_force_feet != None:
-            return self.__pound_force_feet
-        self.__pound_force_feet = self.__convert_from_base(TorqueUnits.PoundForceFoot)
-        return self.__pound_force_feet
+        return self._cached_convert(TorqueUnits.PoundForceFoot)
 
     
     @property
@@ -815,10 +1115,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__gram_force_millimeters != None:
-            return self.__gram_force_millimeters
-        self.__gram_force_millimeters = self.__convert_from_base(TorqueUnits.GramForceMillimeter)
-        return self.__gram_force_millimeters
+        return self._cached_convert(TorqueUnits.GramForceMillimeter)
 
     
     @property
@@ -826,10 +1123,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__gram_force_centimeters != None:
-            return self.__gram_force_centimeters
-        self.__gram_force_centimeters = self.__convert_from_base(TorqueUnits.GramForceCentimeter)
-        return self.__gram_force_centimeters
+        return self._cached_convert(TorqueUnits.GramForceCentimeter)
 
     
     @property
@@ -837,10 +1131,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__gram_force_meters != None:
-            return self.__gram_force_meters
-        self.__gram_force_meters = self.__convert_from_base(TorqueUnits.GramForceMeter)
-        return self.__gram_force_meters
+        return self._cached_convert(TorqueUnits.GramForceMeter)
 
     
     @property
@@ -848,10 +1139,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__kilogram_force_millimeters != None:
-            return self.__kilogram_force_millimeters
-        self.__kilogram_force_millimeters = self.__convert_from_base(TorqueUnits.KilogramForceMillimeter)
-        return self.__kilogram_force_millimeters
+        return self._cached_convert(TorqueUnits.KilogramForceMillimeter)
 
     
     @property
@@ -859,10 +1147,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__kilogram_force_centimeters != None:
-            return self.__kilogram_force_centimeters
-        self.__kilogram_force_centimeters = self.__convert_from_base(TorqueUnits.KilogramForceCentimeter)
-        return self.__kilogram_force_centimeters
+        return self._cached_convert(TorqueUnits.KilogramForceCentimeter)
 
     
     @property
@@ -870,10 +1155,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__kilogram_force_meters != None:
-            return self.__kilogram_force_meters
-        self.__kilogram_force_meters = self.__convert_from_base(TorqueUnits.KilogramForceMeter)
-        return self.__kilogram_force_meters
+        return self._cached_convert(TorqueUnits.KilogramForceMeter)
 
     
     @property
@@ -881,10 +1163,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__tonne_force_millimeters != None:
-            return self.__tonne_force_millimeters
-        self.__tonne_force_millimeters = self.__convert_from_base(TorqueUnits.TonneForceMillimeter)
-        return self.__tonne_force_millimeters
+        return self._cached_convert(TorqueUnits.TonneForceMillimeter)
 
     
     @property
@@ -892,10 +1171,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__tonne_force_centimeters != None:
-            return self.__tonne_force_centimeters
-        self.__tonne_force_centimeters = self.__convert_from_base(TorqueUnits.TonneForceCentimeter)
-        return self.__tonne_force_centimeters
+        return self._cached_convert(TorqueUnits.TonneForceCentimeter)
 
     
     @property
@@ -903,10 +1179,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__tonne_force_meters != None:
-            return self.__tonne_force_meters
-        self.__tonne_force_meters = self.__convert_from_base(TorqueUnits.TonneForceMeter)
-        return self.__tonne_force_meters
+        return self._cached_convert(TorqueUnits.TonneForceMeter)
 
     
     @property
@@ -914,10 +1187,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__kilonewton_millimeters != None:
-            return self.__kilonewton_millimeters
-        self.__kilonewton_millimeters = self.__convert_from_base(TorqueUnits.KilonewtonMillimeter)
-        return self.__kilonewton_millimeters
+        return self._cached_convert(TorqueUnits.KilonewtonMillimeter)
 
     
     @property
@@ -925,10 +1195,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__meganewton_millimeters != None:
-            return self.__meganewton_millimeters
-        self.__meganewton_millimeters = self.__convert_from_base(TorqueUnits.MeganewtonMillimeter)
-        return self.__meganewton_millimeters
+        return self._cached_convert(TorqueUnits.MeganewtonMillimeter)
 
     
     @property
@@ -936,10 +1203,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__kilonewton_centimeters != None:
-            return self.__kilonewton_centimeters
-        self.__kilonewton_centimeters = self.__convert_from_base(TorqueUnits.KilonewtonCentimeter)
-        return self.__kilonewton_centimeters
+        return self._cached_convert(TorqueUnits.KilonewtonCentimeter)
 
     
     @property
@@ -947,10 +1211,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__meganewton_centimeters != None:
-            return self.__meganewton_centimeters
-        self.__meganewton_centimeters = self.__convert_from_base(TorqueUnits.MeganewtonCentimeter)
-        return self.__meganewton_centimeters
+        return self._cached_convert(TorqueUnits.MeganewtonCentimeter)
 
     
     @property
@@ -958,10 +1219,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__kilonewton_meters != None:
-            return self.__kilonewton_meters
-        self.__kilonewton_meters = self.__convert_from_base(TorqueUnits.KilonewtonMeter)
-        return self.__kilonewton_meters
+        return self._cached_convert(TorqueUnits.KilonewtonMeter)
 
     
     @property
@@ -969,10 +1227,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__meganewton_meters != None:
-            return self.__meganewton_meters
-        self.__meganewton_meters = self.__convert_from_base(TorqueUnits.MeganewtonMeter)
-        return self.__meganewton_meters
+        return self._cached_convert(TorqueUnits.MeganewtonMeter)
 
     
     @property
@@ -980,10 +1235,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__kilopound_force_inches != None:
-            return self.__kilopound_force_inches
-        self.__kilopound_force_inches = self.__convert_from_base(TorqueUnits.KilopoundForceInch)
-        return self.__kilopound_force_inches
+        return self._cached_convert(TorqueUnits.KilopoundForceInch)
 
     
     @property
@@ -991,10 +1243,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__megapound_force_inches != None:
-            return self.__megapound_force_inches
-        self.__megapound_force_inches = self.__convert_from_base(TorqueUnits.MegapoundForceInch)
-        return self.__megapound_force_inches
+        return self._cached_convert(TorqueUnits.MegapoundForceInch)
 
     
     @property
@@ -1002,10 +1251,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__kilopound_force_feet != None:
-            return self.__kilopound_force_feet
-        self.__kilopound_force_feet = self.__convert_from_base(TorqueUnits.KilopoundForceFoot)
-        return self.__kilopound_force_feet
+        return self._cached_convert(TorqueUnits.KilopoundForceFoot)
 
     
     @property
@@ -1013,10 +1259,7 @@ class Torque(AbstractMeasure):
         """
         
         """
-        if self.__megapound_force_feet != None:
-            return self.__megapound_force_feet
-        self.__megapound_force_feet = self.__convert_from_base(TorqueUnits.MegapoundForceFoot)
-        return self.__megapound_force_feet
+        return self._cached_convert(TorqueUnits.MegapoundForceFoot)
 
     
     def to_string(self, unit: TorqueUnits = TorqueUnits.NewtonMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class TorquePerLengthUnits(Enum):
         """
             TorquePerLengthUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         NewtonMillimeterPerMeter = 'newton_millimeter_per_meter'
         """
@@ -124,193 +135,484 @@ class TorquePerLength(AbstractMeasure):
         value (float): The value.
         from_unit (TorquePerLengthUnits): The TorquePerLength unit to create from, The default unit is NewtonMeterPerMeter
     """
-    def __init__(self, value: float, from_unit: TorquePerLengthUnits = TorquePerLengthUnits.NewtonMeterPerMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = TorquePerLengthUnits
+
+    _base_unit = TorquePerLengthUnits.NewtonMeterPerMeter
+
+    _dimensions = (1, 1, -2, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 110
+
+    _binary_unit_ids = {
         
-        self.__newton_millimeters_per_meter = None
+        TorquePerLengthUnits.NewtonMillimeterPerMeter: 0,
         
-        self.__newton_centimeters_per_meter = None
+        TorquePerLengthUnits.NewtonCentimeterPerMeter: 1,
         
-        self.__newton_meters_per_meter = None
+        TorquePerLengthUnits.NewtonMeterPerMeter: 2,
         
-        self.__pound_force_inches_per_foot = None
+        TorquePerLengthUnits.PoundForceInchPerFoot: 3,
         
-        self.__pound_force_feet_per_foot = None
+        TorquePerLengthUnits.PoundForceFootPerFoot: 4,
         
-        self.__kilogram_force_millimeters_per_meter = None
+        TorquePerLengthUnits.KilogramForceMillimeterPerMeter: 5,
         
-        self.__kilogram_force_centimeters_per_meter = None
+        TorquePerLengthUnits.KilogramForceCentimeterPerMeter: 6,
         
-        self.__kilogram_force_meters_per_meter = None
+        TorquePerLengthUnits.KilogramForceMeterPerMeter: 7,
         
-        self.__tonne_force_millimeters_per_meter = None
+        TorquePerLengthUnits.TonneForceMillimeterPerMeter: 8,
         
-        self.__tonne_force_centimeters_per_meter = None
+        TorquePerLengthUnits.TonneForceCentimeterPerMeter: 9,
         
-        self.__tonne_force_meters_per_meter = None
+        TorquePerLengthUnits.TonneForceMeterPerMeter: 10,
         
-        self.__kilonewton_millimeters_per_meter = None
+        TorquePerLengthUnits.KilonewtonMillimeterPerMeter: 11,
         
-        self.__meganewton_millimeters_per_meter = None
+        TorquePerLengthUnits.MeganewtonMillimeterPerMeter: 12,
         
-        self.__kilonewton_centimeters_per_meter = None
+        TorquePerLengthUnits.KilonewtonCentimeterPerMeter: 13,
         
-        self.__meganewton_centimeters_per_meter = None
+        TorquePerLengthUnits.MeganewtonCentimeterPerMeter: 14,
         
-        self.__kilonewton_meters_per_meter = None
+        TorquePerLengthUnits.KilonewtonMeterPerMeter: 15,
         
-        self.__meganewton_meters_per_meter = None
+        TorquePerLengthUnits.MeganewtonMeterPerMeter: 16,
         
-        self.__kilopound_force_inches_per_foot = None
+        TorquePerLengthUnits.KilopoundForceInchPerFoot: 17,
         
-        self.__megapound_force_inches_per_foot = None
+        TorquePerLengthUnits.MegapoundForceInchPerFoot: 18,
         
-        self.__kilopound_force_feet_per_foot = None
+        TorquePerLengthUnits.KilopoundForceFootPerFoot: 19,
         
-        self.__megapound_force_feet_per_foot = None
+        TorquePerLengthUnits.MegapoundForceFootPerFoot: 20,
         
+    }
 
-    def convert(self, unit: TorquePerLengthUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        TorquePerLengthUnits.NewtonMillimeterPerMeter: lambda value: (value * 1000),
+        
+        TorquePerLengthUnits.NewtonCentimeterPerMeter: lambda value: (value * 100),
+        
+        TorquePerLengthUnits.NewtonMeterPerMeter: lambda value: (value),
+        
+        TorquePerLengthUnits.PoundForceInchPerFoot: lambda value: (value / 0.370685147638),
+        
+        TorquePerLengthUnits.PoundForceFootPerFoot: lambda value: (value / 4.44822161526),
+        
+        TorquePerLengthUnits.KilogramForceMillimeterPerMeter: lambda value: (value * 101.971619222242),
+        
+        TorquePerLengthUnits.KilogramForceCentimeterPerMeter: lambda value: (value * 10.1971619222242),
+        
+        TorquePerLengthUnits.KilogramForceMeterPerMeter: lambda value: (value * 0.101971619222242),
+        
+        TorquePerLengthUnits.TonneForceMillimeterPerMeter: lambda value: (value * 0.101971619222242),
+        
+        TorquePerLengthUnits.TonneForceCentimeterPerMeter: lambda value: (value * 0.0101971619222242),
+        
+        TorquePerLengthUnits.TonneForceMeterPerMeter: lambda value: (value * 0.000101971619222242),
+        
+        TorquePerLengthUnits.KilonewtonMillimeterPerMeter: lambda value: ((value * 1000) / 1000.0),
+        
+        TorquePerLengthUnits.MeganewtonMillimeterPerMeter: lambda value: ((value * 1000) / 1000000.0),
+        
+        TorquePerLengthUnits.KilonewtonCentimeterPerMeter: lambda value: ((value * 100) / 1000.0),
+        
+        TorquePerLengthUnits.MeganewtonCentimeterPerMeter: lambda value: ((value * 100) / 1000000.0),
+        
+        TorquePerLengthUnits.KilonewtonMeterPerMeter: lambda value: ((value) / 1000.0),
+        
+        TorquePerLengthUnits.MeganewtonMeterPerMeter: lambda value: ((value) / 1000000.0),
+        
+        TorquePerLengthUnits.KilopoundForceInchPerFoot: lambda value: ((value / 0.370685147638) / 1000.0),
+        
+        TorquePerLengthUnits.MegapoundForceInchPerFoot: lambda value: ((value / 0.370685147638) / 1000000.0),
+        
+        TorquePerLengthUnits.KilopoundForceFootPerFoot: lambda value: ((value / 4.44822161526) / 1000.0),
+        
+        TorquePerLengthUnits.MegapoundForceFootPerFoot: lambda value: ((value / 4.44822161526) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: TorquePerLengthUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == TorquePerLengthUnits.NewtonMillimeterPerMeter:
-            return (value * 1000)
+        TorquePerLengthUnits.NewtonMillimeterPerMeter: lambda value: (value * 0.001),
         
-        if from_unit == TorquePerLengthUnits.NewtonCentimeterPerMeter:
-            return (value * 100)
+        TorquePerLengthUnits.NewtonCentimeterPerMeter: lambda value: (value * 0.01),
         
-        if from_unit == TorquePerLengthUnits.NewtonMeterPerMeter:
-            return (value)
+        TorquePerLengthUnits.NewtonMeterPerMeter: lambda value: (value),
         
-        if from_unit == TorquePerLengthUnits.PoundForceInchPerFoot:
-            return (value / 0.370685147638)
+        TorquePerLengthUnits.PoundForceInchPerFoot: lambda value: (value * 0.370685147638),
         
-        if from_unit == TorquePerLengthUnits.PoundForceFootPerFoot:
-            return (value / 4.44822161526)
+        TorquePerLengthUnits.PoundForceFootPerFoot: lambda value: (value * 4.44822161526),
         
-        if from_unit == TorquePerLengthUnits.KilogramForceMillimeterPerMeter:
-            return (value * 101.971619222242)
+        TorquePerLengthUnits.KilogramForceMillimeterPerMeter: lambda value: (value * 0.00980665019960652),
         
-        if from_unit == TorquePerLengthUnits.KilogramForceCentimeterPerMeter:
-            return (value * 10.1971619222242)
+        TorquePerLengthUnits.KilogramForceCentimeterPerMeter: lambda value: (value * 0.0980665019960652),
         
-        if from_unit == TorquePerLengthUnits.KilogramForceMeterPerMeter:
-            return (value * 0.101971619222242)
+        TorquePerLengthUnits.KilogramForceMeterPerMeter: lambda value: (value * 9.80665019960652),
         
-        if from_unit == TorquePerLengthUnits.TonneForceMillimeterPerMeter:
-            return (value * 0.101971619222242)
+        TorquePerLengthUnits.TonneForceMillimeterPerMeter: lambda value: (value * 9.80665019960652),
         
-        if from_unit == TorquePerLengthUnits.TonneForceCentimeterPerMeter:
-            return (value * 0.0101971619222242)
+        TorquePerLengthUnits.TonneForceCentimeterPerMeter: lambda value: (value * 98.0665019960652),
         
-        if from_unit == TorquePerLengthUnits.TonneForceMeterPerMeter:
-            return (value * 0.000101971619222242)
+        TorquePerLengthUnits.TonneForceMeterPerMeter: lambda value: (value * 9806.65019960653),
         
-        if from_unit == TorquePerLengthUnits.KilonewtonMillimeterPerMeter:
-            return ((value * 1000) / 1000.0)
+        TorquePerLengthUnits.KilonewtonMillimeterPerMeter: lambda value: ((value * 0.001) * 1000.0),
         
-        if from_unit == TorquePerLengthUnits.MeganewtonMillimeterPerMeter:
-            return ((value * 1000) / 1000000.0)
+        TorquePerLengthUnits.MeganewtonMillimeterPerMeter: lambda value: ((value * 0.001) * 1000000.0),
         
-        if from_unit == TorquePerLengthUnits.KilonewtonCentimeterPerMeter:
-            return ((value * 100) / 1000.0)
+        TorquePerLengthUnits.KilonewtonCentimeterPerMeter: lambda value: ((value * 0.01) * 1000.0),
         
-        if from_unit == TorquePerLengthUnits.MeganewtonCentimeterPerMeter:
-            return ((value * 100) / 1000000.0)
+        TorquePerLengthUnits.MeganewtonCentimeterPerMeter: lambda value: ((value * 0.01) * 1000000.0),
         
-        if from_unit == TorquePerLengthUnits.KilonewtonMeterPerMeter:
-            return ((value) / 1000.0)
+        TorquePerLengthUnits.KilonewtonMeterPerMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == TorquePerLengthUnits.MeganewtonMeterPerMeter:
-            return ((value) / 1000000.0)
+        TorquePerLengthUnits.MeganewtonMeterPerMeter: lambda value: ((value) * 1000000.0),
         
-        if from_unit == TorquePerLengthUnits.KilopoundForceInchPerFoot:
-            return ((value / 0.370685147638) / 1000.0)
+        TorquePerLengthUnits.KilopoundForceInchPerFoot: lambda value: ((value * 0.370685147638) * 1000.0),
         
-        if from_unit == TorquePerLengthUnits.MegapoundForceInchPerFoot:
-            return ((value / 0.370685147638) / 1000000.0)
+        TorquePerLengthUnits.MegapoundForceInchPerFoot: lambda value: ((value * 0.370685147638) * 1000000.0),
         
-        if from_unit == TorquePerLengthUnits.KilopoundForceFootPerFoot:
-            return ((value / 4.44822161526) / 1000.0)
+        TorquePerLengthUnits.KilopoundForceFootPerFoot: lambda value: ((value * 4.44822161526) * 1000.0),
         
-        if from_unit == TorquePerLengthUnits.MegapoundForceFootPerFoot:
-            return ((value / 4.44822161526) / 1000000.0)
+        TorquePerLengthUnits.MegapoundForceFootPerFoot: lambda value: ((value * 4.44822161526) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        TorquePerLengthUnits.NewtonMillimeterPerMeter: ('1000', '0'),
+        
+        TorquePerLengthUnits.NewtonCentimeterPerMeter: ('100', '0'),
+        
+        TorquePerLengthUnits.NewtonMeterPerMeter: ('1', '0'),
+        
+        TorquePerLengthUnits.PoundForceInchPerFoot: ('500000000000/185342573819', '0'),
+        
+        TorquePerLengthUnits.PoundForceFootPerFoot: ('50000000000/222411080763', '0'),
+        
+        TorquePerLengthUnits.KilogramForceMillimeterPerMeter: ('50985809611121/500000000000', '0'),
+        
+        TorquePerLengthUnits.KilogramForceCentimeterPerMeter: ('50985809611121/5000000000000', '0'),
+        
+        TorquePerLengthUnits.KilogramForceMeterPerMeter: ('50985809611121/500000000000000', '0'),
+        
+        TorquePerLengthUnits.TonneForceMillimeterPerMeter: ('50985809611121/500000000000000', '0'),
+        
+        TorquePerLengthUnits.TonneForceCentimeterPerMeter: ('50985809611121/5000000000000000', '0'),
+        
+        TorquePerLengthUnits.TonneForceMeterPerMeter: ('50985809611121/500000000000000000', '0'),
+        
+        TorquePerLengthUnits.KilonewtonMillimeterPerMeter: ('1', '0'),
+        
+        TorquePerLengthUnits.MeganewtonMillimeterPerMeter: ('1/1000', '0'),
+        
+        TorquePerLengthUnits.KilonewtonCentimeterPerMeter: ('1/10', '0'),
+        
+        TorquePerLengthUnits.MeganewtonCentimeterPerMeter: ('1/10000', '0'),
+        
+        TorquePerLengthUnits.KilonewtonMeterPerMeter: ('1/1000', '0'),
+        
+        TorquePerLengthUnits.MeganewtonMeterPerMeter: ('1/1000000', '0'),
+        
+        TorquePerLengthUnits.KilopoundForceInchPerFoot: ('500000000/185342573819', '0'),
+        
+        TorquePerLengthUnits.MegapoundForceInchPerFoot: ('500000/185342573819', '0'),
+        
+        TorquePerLengthUnits.KilopoundForceFootPerFoot: ('50000000/222411080763', '0'),
+        
+        TorquePerLengthUnits.MegapoundForceFootPerFoot: ('50000/222411080763', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: TorquePerLengthUnits) -> float:
+    _affine_to_base = {
+        
+        TorquePerLengthUnits.NewtonMillimeterPerMeter: ('1/1000', '0'),
+        
+        TorquePerLengthUnits.NewtonCentimeterPerMeter: ('1/100', '0'),
+        
+        TorquePerLengthUnits.NewtonMeterPerMeter: ('1', '0'),
+        
+        TorquePerLengthUnits.PoundForceInchPerFoot: ('185342573819/500000000000', '0'),
+        
+        TorquePerLengthUnits.PoundForceFootPerFoot: ('222411080763/50000000000', '0'),
+        
+        TorquePerLengthUnits.KilogramForceMillimeterPerMeter: ('245166254990163/25000000000000000', '0'),
+        
+        TorquePerLengthUnits.KilogramForceCentimeterPerMeter: ('245166254990163/2500000000000000', '0'),
+        
+        TorquePerLengthUnits.KilogramForceMeterPerMeter: ('245166254990163/25000000000000', '0'),
+        
+        TorquePerLengthUnits.TonneForceMillimeterPerMeter: ('245166254990163/25000000000000', '0'),
+        
+        TorquePerLengthUnits.TonneForceCentimeterPerMeter: ('245166254990163/2500000000000', '0'),
+        
+        TorquePerLengthUnits.TonneForceMeterPerMeter: ('980665019960653/100000000000', '0'),
+        
+        TorquePerLengthUnits.KilonewtonMillimeterPerMeter: ('1', '0'),
+        
+        TorquePerLengthUnits.MeganewtonMillimeterPerMeter: ('1000', '0'),
+        
+        TorquePerLengthUnits.KilonewtonCentimeterPerMeter: ('10', '0'),
+        
+        TorquePerLengthUnits.MeganewtonCentimeterPerMeter: ('10000', '0'),
+        
+        TorquePerLengthUnits.KilonewtonMeterPerMeter: ('1000', '0'),
+        
+        TorquePerLengthUnits.MeganewtonMeterPerMeter: ('1000000', '0'),
+        
+        TorquePerLengthUnits.KilopoundForceInchPerFoot: ('185342573819/500000000', '0'),
+        
+        TorquePerLengthUnits.MegapoundForceInchPerFoot: ('185342573819/500000', '0'),
+        
+        TorquePerLengthUnits.KilopoundForceFootPerFoot: ('222411080763/50000000', '0'),
+        
+        TorquePerLengthUnits.MegapoundForceFootPerFoot: ('222411080763/50000', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == TorquePerLengthUnits.NewtonMillimeterPerMeter:
-            return (value * 0.001)
+        TorquePerLengthUnits.NewtonMillimeterPerMeter: ('N·mm/m',),
         
-        if to_unit == TorquePerLengthUnits.NewtonCentimeterPerMeter:
-            return (value * 0.01)
+        TorquePerLengthUnits.NewtonCentimeterPerMeter: ('N·cm/m',),
         
-        if to_unit == TorquePerLengthUnits.NewtonMeterPerMeter:
-            return (value)
+        TorquePerLengthUnits.NewtonMeterPerMeter: ('N·m/m',),
         
-        if to_unit == TorquePerLengthUnits.PoundForceInchPerFoot:
-            return (value * 0.370685147638)
+        TorquePerLengthUnits.PoundForceInchPerFoot: ('lbf·in/ft',),
         
-        if to_unit == TorquePerLengthUnits.PoundForceFootPerFoot:
-            return (value * 4.44822161526)
+        TorquePerLengthUnits.PoundForceFootPerFoot: ('lbf·ft/ft',),
         
-        if to_unit == TorquePerLengthUnits.KilogramForceMillimeterPerMeter:
-            return (value * 0.00980665019960652)
+        TorquePerLengthUnits.KilogramForceMillimeterPerMeter: ('kgf·mm/m',),
         
-        if to_unit == TorquePerLengthUnits.KilogramForceCentimeterPerMeter:
-            return (value * 0.0980665019960652)
+        TorquePerLengthUnits.KilogramForceCentimeterPerMeter: ('kgf·cm/m',),
         
-        if to_unit == TorquePerLengthUnits.KilogramForceMeterPerMeter:
-            return (value * 9.80665019960652)
+        TorquePerLengthUnits.KilogramForceMeterPerMeter: ('kgf·m/m',),
         
-        if to_unit == TorquePerLengthUnits.TonneForceMillimeterPerMeter:
-            return (value * 9.80665019960652)
+        TorquePerLengthUnits.TonneForceMillimeterPerMeter: ('tf·mm/m',),
         
-        if to_unit == TorquePerLengthUnits.TonneForceCentimeterPerMeter:
-            return (value * 98.0665019960652)
+        TorquePerLengthUnits.TonneForceCentimeterPerMeter: ('tf·cm/m',),
         
-        if to_unit == TorquePerLengthUnits.TonneForceMeterPerMeter:
-            return (value * 9806.65019960653)
+        TorquePerLengthUnits.TonneForceMeterPerMeter: ('tf·m/m',),
         
-        if to_unit == TorquePerLengthUnits.KilonewtonMillimeterPerMeter:
-            return ((value * 0.001) * 1000.0)
+        TorquePerLengthUnits.KilonewtonMillimeterPerMeter: ('kN·mm/m',),
         
-        if to_unit == TorquePerLengthUnits.MeganewtonMillimeterPerMeter:
-            return ((value * 0.001) * 1000000.0)
+        TorquePerLengthUnits.MeganewtonMillimeterPerMeter: ('MN·mm/m',),
         
-        if to_unit == TorquePerLengthUnits.KilonewtonCentimeterPerMeter:
-            return ((value * 0.01) * 1000.0)
+        TorquePerLengthUnits.KilonewtonCentimeterPerMeter: ('kN·cm/m',),
         
-        if to_unit == TorquePerLengthUnits.MeganewtonCentimeterPerMeter:
-            return ((value * 0.01) * 1000000.0)
+        TorquePerLengthUnits.MeganewtonCentimeterPerMeter: ('MN·cm/m',),
         
-        if to_unit == TorquePerLengthUnits.KilonewtonMeterPerMeter:
-            return ((value) * 1000.0)
+        TorquePerLengthUnits.KilonewtonMeterPerMeter: ('kN·m/m',),
         
-        if to_unit == TorquePerLengthUnits.MeganewtonMeterPerMeter:
-            return ((value) * 1000000.0)
+        TorquePerLengthUnits.MeganewtonMeterPerMeter: ('MN·m/m',),
         
-        if to_unit == TorquePerLengthUnits.KilopoundForceInchPerFoot:
-            return ((value * 0.370685147638) * 1000.0)
+        TorquePerLengthUnits.KilopoundForceInchPerFoot: ('klbf·in/ft',),
         
-        if to_unit == TorquePerLengthUnits.MegapoundForceInchPerFoot:
-            return ((value * 0.370685147638) * 1000000.0)
+        TorquePerLengthUnits.MegapoundForceInchPerFoot: ('Mlbf·in/ft',),
         
-        if to_unit == TorquePerLengthUnits.KilopoundForceFootPerFoot:
-            return ((value * 4.44822161526) * 1000.0)
+        TorquePerLengthUnits.KilopoundForceFootPerFoot: ('klbf·ft/ft',),
         
-        if to_unit == TorquePerLengthUnits.MegapoundForceFootPerFoot:
-            return ((value * 4.44822161526) * 1000000.0)
+        TorquePerLengthUnits.MegapoundForceFootPerFoot: ('Mlbf·ft/ft',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: TorquePerLengthUnits = TorquePerLengthUnits.NewtonMeterPerMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: TorquePerLengthUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: TorquePerLengthUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: TorquePerLengthUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: TorquePerLengthUnits, to_unit: TorquePerLengthUnits) -> float:
+        """
+        Convert a value from one TorquePerLength unit to another, without creating a TorquePerLength instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: TorquePerLengthUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: TorquePerLengthUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return TorquePerLength._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: TorquePerLengthUnits, to_unit: TorquePerLengthUnits) -> List[float]:
+        """
+        Convert many values from one TorquePerLength unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: TorquePerLengthUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: TorquePerLengthUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return TorquePerLength._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: TorquePerLengthUnits, to_unit: TorquePerLengthUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", TorquePerLength._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: TorquePerLengthUnits, to_unit: TorquePerLengthUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one TorquePerLength unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: TorquePerLengthUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: TorquePerLengthUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return TorquePerLength._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: TorquePerLengthUnits = TorquePerLengthUnits.NewtonMeterPerMeter) -> TorquePerLength:
+        """
+        Create a new instance of TorquePerLength holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: TorquePerLengthUnits
+        :return: A new instance of TorquePerLength.
+        :rtype: TorquePerLength
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return TorquePerLength._from_exact(value, from_unit)
+
+    def to_exact(self, unit: TorquePerLengthUnits = TorquePerLengthUnits.NewtonMeterPerMeter) -> Fraction:
+        """
+        Get the exact value of the TorquePerLength in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (NewtonMeterPerMeter).
+        :type unit: TorquePerLengthUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> TorquePerLength:
+        """
+        Parse a TorquePerLength from a value followed by a unit abbreviation, e.g. "1 N·mm/m".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of TorquePerLength.
+        :rtype: TorquePerLength
+        :raises ValueError: When the string is not a valid or an ambiguous TorquePerLength.
+        """
+        return TorquePerLength._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[TorquePerLength]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return TorquePerLength._try_parse(text)
+
+    def to_binary(self, unit: Optional[TorquePerLengthUnits] = None) -> bytes:
+        """
+        Encode the TorquePerLength to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: TorquePerLengthUnits
+        :return: The encoded TorquePerLength.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> TorquePerLength:
+        """
+        Decode a TorquePerLength encoded by to_binary.
 
+        :param data: The encoded TorquePerLength, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of TorquePerLength.
+        :rtype: TorquePerLength
+        :raises ValueError: When the data is not a valid encoded TorquePerLength.
+        """
+        return TorquePerLength._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[TorquePerLengthUnits] = None) -> dict:
+        """
+        Get the TorquePerLength DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (NewtonMeterPerMeter).
+        :type hold_in_unit: TorquePerLengthUnits
+        :return: The TorquePerLength DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[TorquePerLengthUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> TorquePerLength:
+        """
+        Create a new instance of TorquePerLength from its DTO.
+
+        :param dto: The TorquePerLength DTO, the unit is the TorquePerLengthUnits value or name.
+        :type dto: dict
+        :return: A new instance of TorquePerLength.
+        :rtype: TorquePerLength
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return TorquePerLength._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> TorquePerLength:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return TorquePerLength._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -637,10 +939,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__newton_millimeters_per_meter != None:
-            return self.__newton_millimeters_per_meter
-        self.__newton_millimeters_per_meter = self.__convert_from_base(TorquePerLengthUnits.NewtonMillimeterPerMeter)
-        return self.__newton_millimeters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.NewtonMillimeterPerMeter)
 
     
     @property
@@ -648,10 +947,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__newton_centimeters_per_meter != None:
-            return self.__newton_centimeters_per_meter
-        self.__newton_centimeters_per_meter = self.__convert_from_base(TorquePerLengthUnits.NewtonCentimeterPerMeter)
-        return self.__newton_centimeters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.NewtonCentimeterPerMeter)
 
     
     @property
@@ -659,10 +955,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__newton_meters_per_meter != None:
-            return self.__newton_meters_per_meter
-        self.__newton_meters_per_meter = self.__convert_from_base(TorquePerLengthUnits.NewtonMeterPerMeter)
-        return self.__newton_meters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.NewtonMeterPerMeter)
 
     
     @property
@@ -670,10 +963,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__pound_force_inches_per_foot != None:
-            return self.__pound_force_inches_per_foot
-        self.__pound_force_inches_per_foot = self.__convert_from_base(TorquePerLengthUnits.PoundForceInchPerFoot)
-        return self.__pound_force_inches_per_foot
+        return self._cached_convert(TorquePerLengthUnits.PoundForceInchPerFoot)
 
     
     @property
@@ -681,10 +971,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__pound_force_feet_per_foot != None:
-            return self.__pound_force_feet_per_foot
-        self.__pound_force_feet_per_foot = self.__convert_from_base(TorquePerLengthUnits.PoundForceFootPerFoot)
-        return self.__pound_force_feet_per_foot
+        return self._cached_convert(TorquePerLengthUnits.PoundForceFootPerFoot)
 
     
     @property
@@ -692,10 +979,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilogram_force_millimeters_per_meter != None:
-            return self.__kilogram_force_millimeters_per_meter
-        self.__kilogram_force_millimeters_per_meter = self.__convert_from_base(TorquePerLengthUnits.KilogramForceMillimeterPerMeter)
-        return self.__kilogram_force_millimeters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.KilogramForceMillimeterPerMeter)
 
     
     @property
@@ -703,10 +987,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilogram_force_centimeters_per_meter != None:
-            return self.__kilogram_force_centimeters_per_meter
-        self.__kilogram_force_centimeters_per_meter = self.__convert_from_base(TorquePerLengthUnits.KilogramForceCentimeterPerMeter)
-        return self.__kilogram_force_centimeters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.KilogramForceCentimeterPerMeter)
 
     
     @property
@@ -714,10 +995,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilogram_force_meters_per_meter != None:
-            return self.__kilogram_force_meters_per_meter
-        self.__kilogram_force_meters_per_meter = self.__convert_from_base(TorquePerLengthUnits.KilogramForceMeterPerMeter)
-        return self.__kilogram_force_meters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.KilogramForceMeterPerMeter)
 
     
     @property
@@ -725,10 +1003,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__tonne_force_millimeters_per_meter != None:
-            return self.__tonne_force_millimeters_per_meter
-        self.__tonne_force_millimeters_per_meter = self.__convert_from_base(TorquePerLengthUnits.TonneForceMillimeterPerMeter)
-        return self.__tonne_force_millimeters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.TonneForceMillimeterPerMeter)
 
     
     @property
@@ -736,10 +1011,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__tonne_force_centimeters_per_meter != None:
-            return self.__tonne_force_centimeters_per_meter
-        self.__tonne_force_centimeters_per_meter = self.__convert_from_base(TorquePerLengthUnits.TonneForceCentimeterPerMeter)
-        return self.__tonne_force_centimeters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.TonneForceCentimeterPerMeter)
 
     
     @property
@@ -747,10 +1019,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__tonne_force_meters_per_meter != None:
-            return self.__tonne_force_meters_per_meter
-        self.__tonne_force_meters_per_meter = self.__convert_from_base(TorquePerLengthUnits.TonneForceMeterPerMeter)
-        return self.__tonne_force_meters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.TonneForceMeterPerMeter)
 
     
     @property
@@ -758,10 +1027,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilonewton_millimeters_per_meter != None:
-            return self.__kilonewton_millimeters_per_meter
-        self.__kilonewton_millimeters_per_meter = self.__convert_from_base(TorquePerLengthUnits.KilonewtonMillimeterPerMeter)
-        return self.__kilonewton_millimeters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.KilonewtonMillimeterPerMeter)
 
     
     @property
@@ -769,10 +1035,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__meganewton_millimeters_per_meter != None:
-            return self.__meganewton_millimeters_per_meter
-        self.__meganewton_millimeters_per_meter = self.__convert_from_base(TorquePerLengthUnits.MeganewtonMillimeterPerMeter)
-        return self.__meganewton_millimeters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.MeganewtonMillimeterPerMeter)
 
     
     @property
@@ -780,10 +1043,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilonewton_centimeters_per_meter != None:
-            return self.__kilonewton_centimeters_per_meter
-        self.__kilonewton_centimeters_per_meter = self.__convert_from_base(TorquePerLengthUnits.KilonewtonCentimeterPerMeter)
-        return self.__kilonewton_centimeters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.KilonewtonCentimeterPerMeter)
 
     
     @property
@@ -791,10 +1051,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__meganewton_centimeters_per_meter != None:
-            return self.__meganewton_centimeters_per_meter
-        self.__meganewton_centimeters_per_meter = self.__convert_from_base(TorquePerLengthUnits.MeganewtonCentimeterPerMeter)
-        return self.__meganewton_centimeters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.MeganewtonCentimeterPerMeter)
 
     
     @property
@@ -802,10 +1059,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilonewton_meters_per_meter != None:
-            return self.__kilonewton_meters_per_meter
-        self.__kilonewton_meters_per_meter = self.__convert_from_base(TorquePerLengthUnits.KilonewtonMeterPerMeter)
-        return self.__kilonewton_meters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.KilonewtonMeterPerMeter)
 
     
     @property
@@ -813,10 +1067,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__meganewton_meters_per_meter != None:
-            return self.__meganewton_meters_per_meter
-        self.__meganewton_meters_per_meter = self.__convert_from_base(TorquePerLengthUnits.MeganewtonMeterPerMeter)
-        return self.__meganewton_meters_per_meter
+        return self._cached_convert(TorquePerLengthUnits.MeganewtonMeterPerMeter)
 
     
     @property
@@ -824,10 +1075,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilopound_force_inches_per_foot != None:
-            return self.__kilopound_force_inches_per_foot
-        self.__kilopound_force_inches_per_foot = self.__convert_from_base(TorquePerLengthUnits.KilopoundForceInchPerFoot)
-        return self.__kilopound_force_inches_per_foot
+        return self._cached_convert(TorquePerLengthUnits.KilopoundForceInchPerFoot)
 
     
     @property
@@ -835,10 +1083,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__megapound_force_inches_per_foot != None:
-            return self.__megapound_force_inches_per_foot
-        self.__megapound_force_inches_per_foot = self.__convert_from_base(TorquePerLengthUnits.MegapoundForceInchPerFoot)
-        return self.__megapound_force_inches_per_foot
+        return self._cached_convert(TorquePerLengthUnits.MegapoundForceInchPerFoot)
 
     
     @property
@@ -846,10 +1091,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__kilopound_force_feet_per_foot != None:
-            return self.__kilopound_force_feet_per_foot
-        self.__kilopound_force_feet_per_foot = self.__convert_from_base(TorquePerLengthUnits.KilopoundForceFootPerFoot)
-        return self.__kilopound_force_feet_per_foot
+        return self._cached_convert(TorquePerLengthUnits.KilopoundForceFootPerFoot)
 
     
     @property
@@ -857,10 +1099,7 @@ class TorquePerLength(AbstractMeasure):
         """
         
         """
-        if self.__megapound_force_feet_per_foot != None:
-            return self.__megapound_force_feet_per_foot
-        self.__megapound_force_feet_per_foot = self.__convert_from_base(TorquePerLengthUnits.MegapoundForceFootPerFoot)
-        return self.__megapound_force_feet_per_foot
+        return self._cached_convert(TorquePerLengthUnits.MegapoundForceFootPerFoot)
 
     
     def to_string(self, unit: TorquePerLengthUnits = TorquePerLengthUnits.NewtonMeterPerMeter) -> str:
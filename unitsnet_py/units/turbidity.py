@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class TurbidityUnits(Enum):
         """
             TurbidityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         NTU = 'ntu'
         """
@@ -24,33 +35,244 @@ class Turbidity(AbstractMeasure):
         value (float): The value.
         from_unit (TurbidityUnits): The Turbidity unit to create from, The default unit is NTU
     """
+    __slots__ = ()
+
+    _units = TurbidityUnits
+
+    _base_unit = TurbidityUnits.NTU
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 111
+
+    _binary_unit_ids = {
+        
+        TurbidityUnits.NTU: 0,
+        
+    }
+
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        TurbidityUnits.NTU: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        TurbidityUnits.NTU: lambda value: (value),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        TurbidityUnits.NTU: ('1', '0'),
+        
+    }
+
+    _affine_to_base = {
+        
+        TurbidityUnits.NTU: ('1', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        TurbidityUnits.NTU: ('NTU',),
+        
+    }
+
     def __init__(self, value: float, from_unit: TurbidityUnits = TurbidityUnits.NTU):
         if math.isnan(value):
             raise ValueError('Invalid unit: value is NaN')
         self._value = self.__convert_to_base(value, from_unit)
-        
-        self.__ntu = None
-        
 
     def convert(self, unit: TurbidityUnits) -> float:
         return self.__convert_from_base(unit)
 
     def __convert_from_base(self, from_unit: TurbidityUnits) -> float:
-        value = self._value
-        
-        if from_unit == TurbidityUnits.NTU:
-            return (value)
-        
-        return None
+        return self._conversions_from_base[from_unit](self._value)
 
 
     def __convert_to_base(self, value: float, to_unit: TurbidityUnits) -> float:
-        
-        if to_unit == TurbidityUnits.NTU:
-            return (value)
-        
-        return None
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: TurbidityUnits, to_unit: TurbidityUnits) -> float:
+        """
+        Convert a value from one Turbidity unit to another, without creating a Turbidity instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: TurbidityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: TurbidityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Turbidity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: TurbidityUnits, to_unit: TurbidityUnits) -> List[float]:
+        """
+        Convert many values from one Turbidity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: TurbidityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: TurbidityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Turbidity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: TurbidityUnits, to_unit: TurbidityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Turbidity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: TurbidityUnits, to_unit: TurbidityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Turbidity unit to another exactly, using rational conversion factors.
 
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: TurbidityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: TurbidityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Turbidity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: TurbidityUnits = TurbidityUnits.NTU) -> Turbidity:
+        """
+        Create a new instance of Turbidity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: TurbidityUnits
+        :return: A new instance of Turbidity.
+        :rtype: Turbidity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Turbidity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: TurbidityUnits = TurbidityUnits.NTU) -> Fraction:
+        """
+        Get the exact value of the Turbidity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (NTU).
+        :type unit: TurbidityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Turbidity:
+        """
+        Parse a Turbidity from a value followed by a unit abbreviation, e.g. "1 NTU".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Turbidity.
+        :rtype: Turbidity
+        :raises ValueError: When the string is not a valid or an ambiguous Turbidity.
+        """
+        return Turbidity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Turbidity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Turbidity._try_parse(text)
+
+    def to_binary(self, unit: Optional[TurbidityUnits] = None) -> bytes:
+        """
+        Encode the Turbidity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: TurbidityUnits
+        :return: The encoded Turbidity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Turbidity:
+        """
+        Decode a Turbidity encoded by to_binary.
+
+        :param data: The encoded Turbidity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Turbidity.
+        :rtype: Turbidity
+        :raises ValueError: When the data is not a valid encoded Turbidity.
+        """
+        return Turbidity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[TurbidityUnits] = None) -> dict:
+        """
+        Get the Turbidity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (NTU).
+        :type hold_in_unit: TurbidityUnits
+        :return: The Turbidity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[TurbidityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Turbidity:
+        """
+        Create a new instance of Turbidity from its DTO.
+
+        :param dto: The Turbidity DTO, the unit is the TurbidityUnits value or name.
+        :type dto: dict
+        :return: A new instance of Turbidity.
+        :rtype: Turbidity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Turbidity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Turbidity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Turbidity._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -77,10 +299,7 @@ class Turbidity(AbstractMeasure):
         """
         
         """
-        if self.__ntu != None:
-            return self.__ntu
-        self.__ntu = self.__convert_from_base(TurbidityUnits.NTU)
-        return self.__ntu
+        return self._cached_convert(TurbidityUnits.NTU)
 
     
     def to_string(self, unit: TurbidityUnits = TurbidityUnits.NTU) -> str:
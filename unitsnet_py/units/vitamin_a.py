@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class VitaminAUnits(Enum):
         """
             VitaminAUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         InternationalUnit = 'international_unit'
         """
@@ -24,33 +35,244 @@ class VitaminA(AbstractMeasure):
         value (float): The value.
         from_unit (VitaminAUnits): The VitaminA unit to create from, The default unit is InternationalUnit
     """
+    __slots__ = ()
+
+    _units = VitaminAUnits
+
+    _base_unit = VitaminAUnits.InternationalUnit
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 112
+
+    _binary_unit_ids = {
+        
+        VitaminAUnits.InternationalUnit: 0,
+        
+    }
+
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        VitaminAUnits.InternationalUnit: lambda value: (value),
+        
+    }
+
+    _conversions_to_base = {
+        
+        VitaminAUnits.InternationalUnit: lambda value: (value),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        VitaminAUnits.InternationalUnit: ('1', '0'),
+        
+    }
+
+    _affine_to_base = {
+        
+        VitaminAUnits.InternationalUnit: ('1', '0'),
+        
+    }
+
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        VitaminAUnits.InternationalUnit: ('IU',),
+        
+    }
+
     def __init__(self, value: float, from_unit: VitaminAUnits = VitaminAUnits.InternationalUnit):
         if math.isnan(value):
             raise ValueError('Invalid unit: value is NaN')
         self._value = self.__convert_to_base(value, from_unit)
-        
-        self.__international_units = None
-        
 
     def convert(self, unit: VitaminAUnits) -> float:
         return self.__convert_from_base(unit)
 
     def __convert_from_base(self, from_unit: VitaminAUnits) -> float:
-        value = self._value
-        
-        if from_unit == VitaminAUnits.InternationalUnit:
-            return (value)
-        
-        return None
+        return self._conversions_from_base[from_unit](self._value)
 
 
     def __convert_to_base(self, value: float, to_unit: VitaminAUnits) -> float:
-        
-        if to_unit == VitaminAUnits.InternationalUnit:
-            return (value)
-        
-        return None
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: VitaminAUnits, to_unit: VitaminAUnits) -> float:
+        """
+        Convert a value from one VitaminA unit to another, without creating a VitaminA instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: VitaminAUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: VitaminAUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return VitaminA._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: VitaminAUnits, to_unit: VitaminAUnits) -> List[float]:
+        """
+        Convert many values from one VitaminA unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: VitaminAUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: VitaminAUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return VitaminA._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: VitaminAUnits, to_unit: VitaminAUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", VitaminA._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: VitaminAUnits, to_unit: VitaminAUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one VitaminA unit to another exactly, using rational conversion factors.
 
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: VitaminAUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: VitaminAUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return VitaminA._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: VitaminAUnits = VitaminAUnits.InternationalUnit) -> VitaminA:
+        """
+        Create a new instance of VitaminA holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: VitaminAUnits
+        :return: A new instance of VitaminA.
+        :rtype: VitaminA
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return VitaminA._from_exact(value, from_unit)
+
+    def to_exact(self, unit: VitaminAUnits = VitaminAUnits.InternationalUnit) -> Fraction:
+        """
+        Get the exact value of the VitaminA in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (InternationalUnit).
+        :type unit: VitaminAUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> VitaminA:
+        """
+        Parse a VitaminA from a value followed by a unit abbreviation, e.g. "1 IU".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of VitaminA.
+        :rtype: VitaminA
+        :raises ValueError: When the string is not a valid or an ambiguous VitaminA.
+        """
+        return VitaminA._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[VitaminA]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return VitaminA._try_parse(text)
+
+    def to_binary(self, unit: Optional[VitaminAUnits] = None) -> bytes:
+        """
+        Encode the VitaminA to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: VitaminAUnits
+        :return: The encoded VitaminA.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> VitaminA:
+        """
+        Decode a VitaminA encoded by to_binary.
+
+        :param data: The encoded VitaminA, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of VitaminA.
+        :rtype: VitaminA
+        :raises ValueError: When the data is not a valid encoded VitaminA.
+        """
+        return VitaminA._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[VitaminAUnits] = None) -> dict:
+        """
+        Get the VitaminA DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (InternationalUnit).
+        :type hold_in_unit: VitaminAUnits
+        :return: The VitaminA DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[VitaminAUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> VitaminA:
+        """
+        Create a new instance of VitaminA from its DTO.
+
+        :param dto: The VitaminA DTO, the unit is the VitaminAUnits value or name.
+        :type dto: dict
+        :return: A new instance of VitaminA.
+        :rtype: VitaminA
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return VitaminA._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> VitaminA:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return VitaminA._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -77,10 +299,7 @@ class VitaminA(AbstractMeasure):
         """
         
         """
-        if self.__international_units != None:
-            return self.__international_units
-        self.__international_units = self.__convert_from_base(VitaminAUnits.InternationalUnit)
-        return self.__international_units
+        return self._cached_convert(VitaminAUnits.InternationalUnit)
 
     
     def to_string(self, unit: VitaminAUnits = VitaminAUnits.InternationalUnit) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class VolumeUnits(Enum):
         """
             VolumeUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         Liter = 'liter'
         """
@@ -289,457 +300,880 @@ class Volume(AbstractMeasure):
         value (float): The value.
         from_unit (VolumeUnits): The Volume unit to create from, The default unit is CubicMeter
     """
-    def __init__(self, value: float, from_unit: VolumeUnits = VolumeUnits.CubicMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = VolumeUnits
+
+    _base_unit = VolumeUnits.CubicMeter
+
+    _dimensions = (3, 0, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 113
+
+    _binary_unit_ids = {
         
-        self.__liters = None
+        VolumeUnits.Liter: 0,
         
-        self.__cubic_meters = None
+        VolumeUnits.CubicMeter: 1,
         
-        self.__cubic_kilometers = None
+        VolumeUnits.CubicKilometer: 2,
         
-        self.__cubic_hectometers = None
+        VolumeUnits.CubicHectometer: 3,
         
-        self.__cubic_decimeters = None
+        VolumeUnits.CubicDecimeter: 4,
         
-        self.__cubic_centimeters = None
+        VolumeUnits.CubicCentimeter: 5,
         
-        self.__cubic_millimeters = None
+        VolumeUnits.CubicMillimeter: 6,
         
-        self.__cubic_micrometers = None
+        VolumeUnits.CubicMicrometer: 7,
         
-        self.__cubic_miles = None
+        VolumeUnits.CubicMile: 8,
         
-        self.__cubic_yards = None
+        VolumeUnits.CubicYard: 9,
         
-        self.__cubic_feet = None
+        VolumeUnits.CubicFoot: 10,
         
-        self.__cubic_inches = None
+        VolumeUnits.CubicInch: 11,
         
-        self.__imperial_gallons = None
+        VolumeUnits.ImperialGallon: 12,
         
-        self.__imperial_ounces = None
+        VolumeUnits.ImperialOunce: 13,
         
-        self.__us_gallons = None
+        VolumeUnits.UsGallon: 14,
         
-        self.__us_ounces = None
+        VolumeUnits.UsOunce: 15,
         
-        self.__us_tablespoons = None
+        VolumeUnits.UsTablespoon: 16,
         
-        self.__au_tablespoons = None
+        VolumeUnits.AuTablespoon: 17,
         
-        self.__uk_tablespoons = None
+        VolumeUnits.UkTablespoon: 18,
         
-        self.__metric_teaspoons = None
+        VolumeUnits.MetricTeaspoon: 19,
         
-        self.__us_teaspoons = None
+        VolumeUnits.UsTeaspoon: 20,
         
-        self.__metric_cups = None
+        VolumeUnits.MetricCup: 21,
         
-        self.__us_customary_cups = None
+        VolumeUnits.UsCustomaryCup: 22,
         
-        self.__us_legal_cups = None
+        VolumeUnits.UsLegalCup: 23,
         
-        self.__oil_barrels = None
+        VolumeUnits.OilBarrel: 24,
         
-        self.__us_beer_barrels = None
+        VolumeUnits.UsBeerBarrel: 25,
         
-        self.__imperial_beer_barrels = None
+        VolumeUnits.ImperialBeerBarrel: 26,
         
-        self.__us_quarts = None
+        VolumeUnits.UsQuart: 27,
         
-        self.__imperial_quarts = None
+        VolumeUnits.ImperialQuart: 28,
         
-        self.__us_pints = None
+        VolumeUnits.UsPint: 29,
         
-        self.__acre_feet = None
+        VolumeUnits.AcreFoot: 30,
         
-        self.__imperial_pints = None
+        VolumeUnits.ImperialPint: 31,
         
-        self.__board_feet = None
+        VolumeUnits.BoardFoot: 32,
         
-        self.__nanoliters = None
+        VolumeUnits.Nanoliter: 33,
         
-        self.__microliters = None
+        VolumeUnits.Microliter: 34,
         
-        self.__milliliters = None
+        VolumeUnits.Milliliter: 35,
         
-        self.__centiliters = None
+        VolumeUnits.Centiliter: 36,
         
-        self.__deciliters = None
+        VolumeUnits.Deciliter: 37,
         
-        self.__decaliters = None
+        VolumeUnits.Decaliter: 38,
         
-        self.__hectoliters = None
+        VolumeUnits.Hectoliter: 39,
         
-        self.__kiloliters = None
+        VolumeUnits.Kiloliter: 40,
         
-        self.__megaliters = None
+        VolumeUnits.Megaliter: 41,
         
-        self.__hectocubic_meters = None
+        VolumeUnits.HectocubicMeter: 42,
         
-        self.__kilocubic_meters = None
+        VolumeUnits.KilocubicMeter: 43,
         
-        self.__hectocubic_feet = None
+        VolumeUnits.HectocubicFoot: 44,
         
-        self.__kilocubic_feet = None
+        VolumeUnits.KilocubicFoot: 45,
         
-        self.__megacubic_feet = None
+        VolumeUnits.MegacubicFoot: 46,
         
-        self.__kiloimperial_gallons = None
+        VolumeUnits.KiloimperialGallon: 47,
         
-        self.__megaimperial_gallons = None
+        VolumeUnits.MegaimperialGallon: 48,
         
-        self.__decaus_gallons = None
+        VolumeUnits.DecausGallon: 49,
         
-        self.__decius_gallons = None
+        VolumeUnits.DeciusGallon: 50,
         
-        self.__hectous_gallons = None
+        VolumeUnits.HectousGallon: 51,
         
-        self.__kilous_gallons = None
+        VolumeUnits.KilousGallon: 52,
         
-        self.__megaus_gallons = None
+        VolumeUnits.MegausGallon: 53,
         
+    }
 
-    def convert(self, unit: VolumeUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        VolumeUnits.Liter: lambda value: (value * 1e3),
+        
+        VolumeUnits.CubicMeter: lambda value: (value),
+        
+        VolumeUnits.CubicKilometer: lambda value: (value / 1e9),
+        
+        VolumeUnits.CubicHectometer: lambda value: (value / 1e6),
+        
+        VolumeUnits.CubicDecimeter: lambda value: (value * 1e3),
+        
+        VolumeUnits.CubicCentimeter: lambda value: (value * 1e6),
+        
+        VolumeUnits.CubicMillimeter: lambda value: (value * 1e9),
+        
+        VolumeUnits.CubicMicrometer: lambda value: (value * 1e18),
+        
+        VolumeUnits.CubicMile: lambda value: (value / 4.16818182544058e9),
+        
+        VolumeUnits.CubicYard: lambda value: (value / 0.764554858),
+        
+        VolumeUnits.CubicFoot: lambda value: (value / 2.8316846592e-2),
+        
+        VolumeUnits.CubicInch: lambda value: (value / (1.6387 * 1e-5)),
+        
+        VolumeUnits.ImperialGallon: lambda value: (value / 0.00454609),
+        
+        VolumeUnits.ImperialOunce: lambda value: (value / 2.8413062499962901241875439064617e-5),
+        
+        VolumeUnits.UsGallon: lambda value: (value / 0.003785411784),
+        
+        VolumeUnits.UsOunce: lambda value: (value / 2.957352956253760505068307980135e-5),
+        
+        VolumeUnits.UsTablespoon: lambda value: (value / 1.478676478125e-5),
+        
+        VolumeUnits.AuTablespoon: lambda value: (value / 2e-5),
+        
+        VolumeUnits.UkTablespoon: lambda value: (value / 1.5e-5),
+        
+        VolumeUnits.MetricTeaspoon: lambda value: (value / 0.5e-5),
+        
+        VolumeUnits.UsTeaspoon: lambda value: (value / 4.92892159375e-6),
+        
+        VolumeUnits.MetricCup: lambda value: (value / 0.00025),
+        
+        VolumeUnits.UsCustomaryCup: lambda value: (value / 0.0002365882365),
+        
+        VolumeUnits.UsLegalCup: lambda value: (value / 0.00024),
+        
+        VolumeUnits.OilBarrel: lambda value: (value / 0.158987294928),
+        
+        VolumeUnits.UsBeerBarrel: lambda value: (value / 0.1173477658),
+        
+        VolumeUnits.ImperialBeerBarrel: lambda value: (value / 0.16365924),
+        
+        VolumeUnits.UsQuart: lambda value: (value / 9.46352946e-4),
+        
+        VolumeUnits.ImperialQuart: lambda value: (value / 1.1365225e-3),
+        
+        VolumeUnits.UsPint: lambda value: (value / 4.73176473e-4),
+        
+        VolumeUnits.AcreFoot: lambda value: (value * 0.000810714),
+        
+        VolumeUnits.ImperialPint: lambda value: (value / 5.6826125e-4),
+        
+        VolumeUnits.BoardFoot: lambda value: (value / 2.3597372158e-3),
+        
+        VolumeUnits.Nanoliter: lambda value: ((value * 1e3) / 1e-09),
+        
+        VolumeUnits.Microliter: lambda value: ((value * 1e3) / 1e-06),
+        
+        VolumeUnits.Milliliter: lambda value: ((value * 1e3) / 0.001),
+        
+        VolumeUnits.Centiliter: lambda value: ((value * 1e3) / 0.01),
+        
+        VolumeUnits.Deciliter: lambda value: ((value * 1e3) / 0.1),
+        
+        VolumeUnits.Decaliter: lambda value: ((value * 1e3) / 10.0),
+        
+        VolumeUnits.Hectoliter: lambda value: ((value * 1e3) / 100.0),
+        
+        VolumeUnits.Kiloliter: lambda value: ((value * 1e3) / 1000.0),
+        
+        VolumeUnits.Megaliter: lambda value: ((value * 1e3) / 1000000.0),
+        
+        VolumeUnits.HectocubicMeter: lambda value: ((value) / 100.0),
+        
+        VolumeUnits.KilocubicMeter: lambda value: ((value) / 1000.0),
+        
+        VolumeUnits.HectocubicFoot: lambda value: ((value / 2.8316846592e-2) / 100.0),
+        
+        VolumeUnits.KilocubicFoot: lambda value: ((value / 2.8316846592e-2) / 1000.0),
+        
+        VolumeUnits.MegacubicFoot: lambda value: ((value / 2.8316846592e-2) / 1000000.0),
+        
+        VolumeUnits.KiloimperialGallon: lambda value: ((value / 0.00454609) / 1000.0),
+        
+        VolumeUnits.MegaimperialGallon: lambda value: ((value / 0.00454609) / 1000000.0),
+        
+        VolumeUnits.DecausGallon: lambda value: ((value / 0.003785411784) / 10.0),
+        
+        VolumeUnits.DeciusGallon: lambda value: ((value / 0.003785411784) / 0.1),
+        
+        VolumeUnits.HectousGallon: lambda value: ((value / 0.003785411784) / 100.0),
+        
+        VolumeUnits.KilousGallon: lambda value: ((value / 0.003785411784) / 1000.0),
+        
+        VolumeUnits.MegausGallon: lambda value: ((value / 0.003785411784) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: VolumeUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == VolumeUnits.Liter:
-            return (value * 1e3)
+        VolumeUnits.Liter: lambda value: (value / 1e3),
         
-        if from_unit == VolumeUnits.CubicMeter:
-            return (value)
+        VolumeUnits.CubicMeter: lambda value: (value),
         
-        if from_unit == VolumeUnits.CubicKilometer:
-            return (value / 1e9)
+        VolumeUnits.CubicKilometer: lambda value: (value * 1e9),
         
-        if from_unit == VolumeUnits.CubicHectometer:
-            return (value / 1e6)
+        VolumeUnits.CubicHectometer: lambda value: (value * 1e6),
         
-        if from_unit == VolumeUnits.CubicDecimeter:
-            return (value * 1e3)
+        VolumeUnits.CubicDecimeter: lambda value: (value / 1e3),
         
-        if from_unit == VolumeUnits.CubicCentimeter:
-            return (value * 1e6)
+        VolumeUnits.CubicCentimeter: lambda value: (value / 1e6),
         
-        if from_unit == VolumeUnits.CubicMillimeter:
-            return (value * 1e9)
+        VolumeUnits.CubicMillimeter: lambda value: (value / 1e9),
         
-        if from_unit == VolumeUnits.CubicMicrometer:
-            return (value * 1e18)
+        VolumeUnits.CubicMicrometer: lambda value: (value / 1e18),
         
-        if from_unit == VolumeUnits.CubicMile:
-            return (value / 4.16818182544058e9)
+        VolumeUnits.CubicMile: lambda value: (value * 4.16818182544058e9),
         
-        if from_unit == VolumeUnits.CubicYard:
-            return (value / 0.764554858)
+        VolumeUnits.CubicYard: lambda value: (value * 0.764554858),
         
-        if from_unit == VolumeUnits.CubicFoot:
-            return (value / 2.8316846592e-2)
+        VolumeUnits.CubicFoot: lambda value: (value * 2.8316846592e-2),
         
-        if from_unit == VolumeUnits.CubicInch:
-            return (value / (1.6387 * 1e-5))
+        VolumeUnits.CubicInch: lambda value: (value * 1.6387 * 1e-5),
         
-        if from_unit == VolumeUnits.ImperialGallon:
-            return (value / 0.00454609)
+        VolumeUnits.ImperialGallon: lambda value: (value * 0.00454609),
         
-        if from_unit == VolumeUnits.ImperialOunce:
-            return (value / 2.8413062499962901241875439064617e-5)
+        VolumeUnits.ImperialOunce: lambda value: (value * 2.8413062499962901241875439064617e-5),
         
-        if from_unit == VolumeUnits.UsGallon:
-            return (value / 0.003785411784)
+        VolumeUnits.UsGallon: lambda value: (value * 0.003785411784),
         
-        if from_unit == VolumeUnits.UsOunce:
-            return (value / 2.957352956253760505068307980135e-5)
+        VolumeUnits.UsOunce: lambda value: (value * 2.957352956253760505068307980135e-5),
         
-        if from_unit == VolumeUnits.UsTablespoon:
-            return (value / 1.478676478125e-5)
+        VolumeUnits.UsTablespoon: lambda value: (value * 1.478676478125e-5),
         
-        if from_unit == VolumeUnits.AuTablespoon:
-            return (value / 2e-5)
+        VolumeUnits.AuTablespoon: lambda value: (value * 2e-5),
         
-        if from_unit == VolumeUnits.UkTablespoon:
-            return (value / 1.5e-5)
+        VolumeUnits.UkTablespoon: lambda value: (value * 1.5e-5),
         
-        if from_unit == VolumeUnits.MetricTeaspoon:
-            return (value / 0.5e-5)
+        VolumeUnits.MetricTeaspoon: lambda value: (value * 0.5e-5),
         
-        if from_unit == VolumeUnits.UsTeaspoon:
-            return (value / 4.92892159375e-6)
+        VolumeUnits.UsTeaspoon: lambda value: (value * 4.92892159375e-6),
         
-        if from_unit == VolumeUnits.MetricCup:
-            return (value / 0.00025)
+        VolumeUnits.MetricCup: lambda value: (value * 0.00025),
         
-        if from_unit == VolumeUnits.UsCustomaryCup:
-            return (value / 0.0002365882365)
+        VolumeUnits.UsCustomaryCup: lambda value: (value * 0.0002365882365),
         
-        if from_unit == VolumeUnits.UsLegalCup:
-            return (value / 0.00024)
+        VolumeUnits.UsLegalCup: lambda value: (value * 0.00024),
         
-        if from_unit == VolumeUnits.OilBarrel:
-            return (value / 0.158987294928)
+        VolumeUnits.OilBarrel: lambda value: (value * 0.158987294928),
         
-        if from_unit == VolumeUnits.UsBeerBarrel:
-            return (value / 0.1173477658)
+        VolumeUnits.UsBeerBarrel: lambda value: (value * 0.1173477658),
         
-        if from_unit == VolumeUnits.ImperialBeerBarrel:
-            return (value / 0.16365924)
+        VolumeUnits.ImperialBeerBarrel: lambda value: (value * 0.16365924),
         
-        if from_unit == VolumeUnits.UsQuart:
-            return (value / 9.46352946e-4)
+        VolumeUnits.UsQuart: lambda value: (value * 9.46352946e-4),
         
-        if from_unit == VolumeUnits.ImperialQuart:
-            return (value / 1.1365225e-3)
+        VolumeUnits.ImperialQuart: lambda value: (value * 1.1365225e-3),
         
-        if from_unit == VolumeUnits.UsPint:
-            return (value / 4.73176473e-4)
+        VolumeUnits.UsPint: lambda value: (value * 4.73176473e-4),
         
-        if from_unit == VolumeUnits.AcreFoot:
-            return (value * 0.000810714)
+        VolumeUnits.AcreFoot: lambda value: (value / 0.000810714),
         
-        if from_unit == VolumeUnits.ImperialPint:
-            return (value / 5.6826125e-4)
+        VolumeUnits.ImperialPint: lambda value: (value * 5.6826125e-4),
         
-        if from_unit == VolumeUnits.BoardFoot:
-            return (value / 2.3597372158e-3)
+        VolumeUnits.BoardFoot: lambda value: (value * 2.3597372158e-3),
         
-        if from_unit == VolumeUnits.Nanoliter:
-            return ((value * 1e3) / 1e-09)
+        VolumeUnits.Nanoliter: lambda value: ((value / 1e3) * 1e-09),
         
-        if from_unit == VolumeUnits.Microliter:
-            return ((value * 1e3) / 1e-06)
+        VolumeUnits.Microliter: lambda value: ((value / 1e3) * 1e-06),
         
-        if from_unit == VolumeUnits.Milliliter:
-            return ((value * 1e3) / 0.001)
+        VolumeUnits.Milliliter: lambda value: ((value / 1e3) * 0.001),
         
-        if from_unit == VolumeUnits.Centiliter:
-            return ((value * 1e3) / 0.01)
+        VolumeUnits.Centiliter: lambda value: ((value / 1e3) * 0.01),
         
-        if from_unit == VolumeUnits.Deciliter:
-            return ((value * 1e3) / 0.1)
+        VolumeUnits.Deciliter: lambda value: ((value / 1e3) * 0.1),
         
-        if from_unit == VolumeUnits.Decaliter:
-            return ((value * 1e3) / 10.0)
+        VolumeUnits.Decaliter: lambda value: ((value / 1e3) * 10.0),
         
-        if from_unit == VolumeUnits.Hectoliter:
-            return ((value * 1e3) / 100.0)
+        VolumeUnits.Hectoliter: lambda value: ((value / 1e3) * 100.0),
         
-        if from_unit == VolumeUnits.Kiloliter:
-            return ((value * 1e3) / 1000.0)
+        VolumeUnits.Kiloliter: lambda value: ((value / 1e3) * 1000.0),
         
-        if from_unit == VolumeUnits.Megaliter:
-            return ((value * 1e3) / 1000000.0)
+        VolumeUnits.Megaliter: lambda value: ((value / 1e3) * 1000000.0),
         
-        if from_unit == VolumeUnits.HectocubicMeter:
-            return ((value) / 100.0)
+        VolumeUnits.HectocubicMeter: lambda value: ((value) * 100.0),
         
-        if from_unit == VolumeUnits.KilocubicMeter:
-            return ((value) / 1000.0)
+        VolumeUnits.KilocubicMeter: lambda value: ((value) * 1000.0),
         
-        if from_unit == VolumeUnits.HectocubicFoot:
-            return ((value / 2.8316846592e-2) / 100.0)
+        VolumeUnits.HectocubicFoot: lambda value: ((value * 2.8316846592e-2) * 100.0),
         
-        if from_unit == VolumeUnits.KilocubicFoot:
-            return ((value / 2.8316846592e-2) / 1000.0)
+        VolumeUnits.KilocubicFoot: lambda value: ((value * 2.8316846592e-2) * 1000.0),
         
-        if from_unit == VolumeUnits.MegacubicFoot:
-            return ((value / 2.8316846592e-2) / 1000000.0)
+        VolumeUnits.MegacubicFoot: lambda value: ((value * 2.8316846592e-2) * 1000000.0),
         
-        if from_unit == VolumeUnits.KiloimperialGallon:
-            return ((value / 0.00454609) / 1000.0)
+        VolumeUnits.KiloimperialGallon: lambda value: ((value * 0.00454609) * 1000.0),
         
-        if from_unit == VolumeUnits.MegaimperialGallon:
-            return ((value / 0.00454609) / 1000000.0)
+        VolumeUnits.MegaimperialGallon: lambda value: ((value * 0.00454609) * 1000000.0),
         
-        if from_unit == VolumeUnits.DecausGallon:
-            return ((value / 0.003785411784) / 10.0)
+        VolumeUnits.DecausGallon: lambda value: ((value * 0.003785411784) * 10.0),
         
-        if from_unit == VolumeUnits.DeciusGallon:
-            return ((value / 0.003785411784) / 0.1)
+        VolumeUnits.DeciusGallon: lambda value: ((value * 0.003785411784) * 0.1),
         
-        if from_unit == VolumeUnits.HectousGallon:
-            return ((value / 0.003785411784) / 100.0)
+        VolumeUnits.HectousGallon: lambda value: ((value * 0.003785411784) * 100.0),
         
-        if from_unit == VolumeUnits.KilousGallon:
-            return ((value / 0.003785411784) / 1000.0)
+        VolumeUnits.KilousGallon: lambda value: ((value * 0.003785411784) * 1000.0),
         
-        if from_unit == VolumeUnits.MegausGallon:
-            return ((value / 0.003785411784) / 1000000.0)
+        VolumeUnits.MegausGallon: lambda value: ((value * 0.003785411784) * 1000000.0),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        VolumeUnits.Liter: ('1000', '0'),
+        
+        VolumeUnits.CubicMeter: ('1', '0'),
+        
+        VolumeUnits.CubicKilometer: ('1/1000000000', '0'),
+        
+        VolumeUnits.CubicHectometer: ('1/1000000', '0'),
+        
+        VolumeUnits.CubicDecimeter: ('1000', '0'),
+        
+        VolumeUnits.CubicCentimeter: ('1000000', '0'),
+        
+        VolumeUnits.CubicMillimeter: ('1000000000', '0'),
+        
+        VolumeUnits.CubicMicrometer: ('1000000000000000000', '0'),
+        
+        VolumeUnits.CubicMile: ('50000/208409091272029', '0'),
+        
+        VolumeUnits.CubicYard: ('500000000/382277429', '0'),
+        
+        VolumeUnits.CubicFoot: ('1953125000/55306341', '0'),
+        
+        VolumeUnits.CubicInch: ('1000000000/16387', '0'),
+        
+        VolumeUnits.ImperialGallon: ('100000000/454609', '0'),
+        
+        VolumeUnits.ImperialOunce: ('1000000000000000000000000000000000000/28413062499962901241875439064617', '0'),
+        
+        VolumeUnits.UsGallon: ('125000000000/473176473', '0'),
+        
+        VolumeUnits.UsOunce: ('20000000000000000000000000000000000/591470591250752101013661596027', '0'),
+        
+        VolumeUnits.UsTablespoon: ('32000000000000/473176473', '0'),
+        
+        VolumeUnits.AuTablespoon: ('50000', '0'),
+        
+        VolumeUnits.UkTablespoon: ('200000/3', '0'),
+        
+        VolumeUnits.MetricTeaspoon: ('200000', '0'),
+        
+        VolumeUnits.UsTeaspoon: ('32000000000000/157725491', '0'),
+        
+        VolumeUnits.MetricCup: ('4000', '0'),
+        
+        VolumeUnits.UsCustomaryCup: ('2000000000000/473176473', '0'),
+        
+        VolumeUnits.UsLegalCup: ('12500/3', '0'),
+        
+        VolumeUnits.OilBarrel: ('62500000000/9936705933', '0'),
+        
+        VolumeUnits.UsBeerBarrel: ('5000000000/586738829', '0'),
+        
+        VolumeUnits.ImperialBeerBarrel: ('25000000/4091481', '0'),
+        
+        VolumeUnits.UsQuart: ('500000000000/473176473', '0'),
+        
+        VolumeUnits.ImperialQuart: ('400000000/454609', '0'),
+        
+        VolumeUnits.UsPint: ('1000000000000/473176473', '0'),
+        
+        VolumeUnits.AcreFoot: ('405357/500000000', '0'),
+        
+        VolumeUnits.ImperialPint: ('800000000/454609', '0'),
+        
+        VolumeUnits.BoardFoot: ('5000000000000/11798686079', '0'),
+        
+        VolumeUnits.Nanoliter: ('1000000000000', '0'),
+        
+        VolumeUnits.Microliter: ('1000000000', '0'),
+        
+        VolumeUnits.Milliliter: ('1000000', '0'),
+        
+        VolumeUnits.Centiliter: ('100000', '0'),
+        
+        VolumeUnits.Deciliter: ('10000', '0'),
+        
+        VolumeUnits.Decaliter: ('100', '0'),
+        
+        VolumeUnits.Hectoliter: ('10', '0'),
+        
+        VolumeUnits.Kiloliter: ('1', '0'),
+        
+        VolumeUnits.Megaliter: ('1/1000', '0'),
+        
+        VolumeUnits.HectocubicMeter: ('1/100', '0'),
+        
+        VolumeUnits.KilocubicMeter: ('1/1000', '0'),
+        
+        VolumeUnits.HectocubicFoot: ('19531250/55306341', '0'),
+        
+        VolumeUnits.KilocubicFoot: ('1953125/55306341', '0'),
+        
+        VolumeUnits.MegacubicFoot: ('15625/442450728', '0'),
+        
+        VolumeUnits.KiloimperialGallon: ('100000/454609', '0'),
+        
+        VolumeUnits.MegaimperialGallon: ('100/454609', '0'),
+        
+        VolumeUnits.DecausGallon: ('12500000000/473176473', '0'),
+        
+        VolumeUnits.DeciusGallon: ('1250000000000/473176473', '0'),
+        
+        VolumeUnits.HectousGallon: ('1250000000/473176473', '0'),
+        
+        VolumeUnits.KilousGallon: ('125000000/473176473', '0'),
+        
+        VolumeUnits.MegausGallon: ('125000/473176473', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: VolumeUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == VolumeUnits.Liter:
-            return (value / 1e3)
+        VolumeUnits.Liter: ('1/1000', '0'),
         
-        if to_unit == VolumeUnits.CubicMeter:
-            return (value)
+        VolumeUnits.CubicMeter: ('1', '0'),
         
-        if to_unit == VolumeUnits.CubicKilometer:
-            return (value * 1e9)
+        VolumeUnits.CubicKilometer: ('1000000000', '0'),
         
-        if to_unit == VolumeUnits.CubicHectometer:
-            return (value * 1e6)
+        VolumeUnits.CubicHectometer: ('1000000', '0'),
         
-        if to_unit == VolumeUnits.CubicDecimeter:
-            return (value / 1e3)
+        VolumeUnits.CubicDecimeter: ('1/1000', '0'),
         
-        if to_unit == VolumeUnits.CubicCentimeter:
-            return (value / 1e6)
+        VolumeUnits.CubicCentimeter: ('1/1000000', '0'),
         
-        if to_unit == VolumeUnits.CubicMillimeter:
-            return (value / 1e9)
+        VolumeUnits.CubicMillimeter: ('1/1000000000', '0'),
         
-        if to_unit == VolumeUnits.CubicMicrometer:
-            return (value / 1e18)
+        VolumeUnits.CubicMicrometer: ('1/1000000000000000000', '0'),
         
-        if to_unit == VolumeUnits.CubicMile:
-            return (value * 4.16818182544058e9)
+        VolumeUnits.CubicMile: ('208409091272029/50000', '0'),
         
-        if to_unit == VolumeUnits.CubicYard:
-            return (value * 0.764554858)
+        VolumeUnits.CubicYard: ('382277429/500000000', '0'),
         
-        if to_unit == VolumeUnits.CubicFoot:
-            return (value * 2.8316846592e-2)
+        VolumeUnits.CubicFoot: ('55306341/1953125000', '0'),
         
-        if to_unit == VolumeUnits.CubicInch:
-            return (value * 1.6387 * 1e-5)
+        VolumeUnits.CubicInch: ('16387/1000000000', '0'),
         
-        if to_unit == VolumeUnits.ImperialGallon:
-            return (value * 0.00454609)
+        VolumeUnits.ImperialGallon: ('454609/100000000', '0'),
         
-        if to_unit == VolumeUnits.ImperialOunce:
-            return (value * 2.8413062499962901241875439064617e-5)
+        VolumeUnits.ImperialOunce: ('28413062499962901241875439064617/1000000000000000000000000000000000000', '0'),
         
-        if to_unit == VolumeUnits.UsGallon:
-            return (value * 0.003785411784)
+        VolumeUnits.UsGallon: ('473176473/125000000000', '0'),
         
-        if to_unit == VolumeUnits.UsOunce:
-            return (value * 2.957352956253760505068307980135e-5)
+        VolumeUnits.UsOunce: ('591470591250752101013661596027/20000000000000000000000000000000000', '0'),
         
-        if to_unit == VolumeUnits.UsTablespoon:
-            return (value * 1.478676478125e-5)
+        VolumeUnits.UsTablespoon: ('473176473/32000000000000', '0'),
         
-        if to_unit == VolumeUnits.AuTablespoon:
-            return (value * 2e-5)
+        VolumeUnits.AuTablespoon: ('1/50000', '0'),
         
-        if to_unit == VolumeUnits.UkTablespoon:
-            return (value * 1.5e-5)
+        VolumeUnits.UkTablespoon: ('3/200000', '0'),
         
-        if to_unit == VolumeUnits.MetricTeaspoon:
-            return (value * 0.5e-5)
+        VolumeUnits.MetricTeaspoon: ('1/200000', '0'),
         
-        if to_unit == VolumeUnits.UsTeaspoon:
-            return (value * 4.92892159375e-6)
+        VolumeUnits.UsTeaspoon: ('157725491/32000000000000', '0'),
         
-        if to_unit == VolumeUnits.MetricCup:
-            return (value * 0.00025)
+        VolumeUnits.MetricCup: ('1/4000', '0'),
         
-        if to_unit == VolumeUnits.UsCustomaryCup:
-            return (value * 0.0002365882365)
+        VolumeUnits.UsCustomaryCup: ('473176473/2000000000000', '0'),
         
-        if to_unit == VolumeUnits.UsLegalCup:
-            return (value * 0.00024)
+        VolumeUnits.UsLegalCup: ('3/12500', '0'),
         
-        if to_unit == VolumeUnits.OilBarrel:
-            return (value * 0.158987294928)
+        VolumeUnits.OilBarrel: ('9936705933/62500000000', '0'),
         
-        if to_unit == VolumeUnits.UsBeerBarrel:
-            return (value * 0.1173477658)
+        VolumeUnits.UsBeerBarrel: ('586738829/5000000000', '0'),
         
-        if to_unit == VolumeUnits.ImperialBeerBarrel:
-            return (value * 0.16365924)
+        VolumeUnits.ImperialBeerBarrel: ('4091481/25000000', '0'),
         
-        if to_unit == VolumeUnits.UsQuart:
-            return (value * 9.46352946e-4)
+        VolumeUnits.UsQuart: ('473176473/500000000000', '0'),
         
-        if to_unit == VolumeUnits.ImperialQuart:
-            return (value * 1.1365225e-3)
+        VolumeUnits.ImperialQuart: ('454609/400000000', '0'),
         
-        if to_unit == VolumeUnits.UsPint:
-            return (value * 4.73176473e-4)
+        VolumeUnits.UsPint: ('473176473/1000000000000', '0'),
         
-        if to_unit == VolumeUnits.AcreFoot:
-            return (value / 0.000810714)
+        VolumeUnits.AcreFoot: ('500000000/405357', '0'),
         
-        if to_unit == VolumeUnits.ImperialPint:
-            return (value * 5.6826125e-4)
+        VolumeUnits.ImperialPint: ('454609/800000000', '0'),
         
-        if to_unit == VolumeUnits.BoardFoot:
-            return (value * 2.3597372158e-3)
+        VolumeUnits.BoardFoot: ('11798686079/5000000000000', '0'),
         
-        if to_unit == VolumeUnits.Nanoliter:
-            return ((value / 1e3) * 1e-09)
+        VolumeUnits.Nanoliter: ('1/1000000000000', '0'),
         
-        if to_unit == VolumeUnits.Microliter:
-            return ((value / 1e3) * 1e-06)
+        VolumeUnits.Microliter: ('1/1000000000', '0'),
         
-        if to_unit == VolumeUnits.Milliliter:
-            return ((value / 1e3) * 0.001)
+        VolumeUnits.Milliliter: ('1/1000000', '0'),
         
-        if to_unit == VolumeUnits.Centiliter:
-            return ((value / 1e3) * 0.01)
+        VolumeUnits.Centiliter: ('1/100000', '0'),
         
-        if to_unit == VolumeUnits.Deciliter:
-            return ((value / 1e3) * 0.1)
+        VolumeUnits.Deciliter: ('1/10000', '0'),
         
-        if to_unit == VolumeUnits.Decaliter:
-            return ((value / 1e3) * 10.0)
+        VolumeUnits.Decaliter: ('1/100', '0'),
         
-        if to_unit == VolumeUnits.Hectoliter:
-            return ((value / 1e3) * 100.0)
+        VolumeUnits.Hectoliter: ('1/10', '0'),
         
-        if to_unit == VolumeUnits.Kiloliter:
-            return ((value / 1e3) * 1000.0)
+        VolumeUnits.Kiloliter: ('1', '0'),
         
-        if to_unit == VolumeUnits.Megaliter:
-            return ((value / 1e3) * 1000000.0)
+        VolumeUnits.Megaliter: ('1000', '0'),
         
-        if to_unit == VolumeUnits.HectocubicMeter:
-            return ((value) * 100.0)
+        VolumeUnits.HectocubicMeter: ('100', '0'),
         
-        if to_unit == VolumeUnits.KilocubicMeter:
-            return ((value) * 1000.0)
+        VolumeUnits.KilocubicMeter: ('1000', '0'),
         
-        if to_unit == VolumeUnits.HectocubicFoot:
-            return ((value * 2.8316846592e-2) * 100.0)
+        VolumeUnits.HectocubicFoot: ('55306341/19531250', '0'),
         
-        if to_unit == VolumeUnits.KilocubicFoot:
-            return ((value * 2.8316846592e-2) * 1000.0)
+        VolumeUnits.KilocubicFoot: ('55306341/1953125', '0'),
         
-        if to_unit == VolumeUnits.MegacubicFoot:
-            return ((value * 2.8316846592e-2) * 1000000.0)
+        VolumeUnits.MegacubicFoot: ('442450728/15625', '0'),
         
-        if to_unit == VolumeUnits.KiloimperialGallon:
-            return ((value * 0.00454609) * 1000.0)
+        VolumeUnits.KiloimperialGallon: ('454609/100000', '0'),
         
-        if to_unit == VolumeUnits.MegaimperialGallon:
-            return ((value * 0.00454609) * 1000000.0)
+        VolumeUnits.MegaimperialGallon: ('454609/100', '0'),
         
-        if to_unit == VolumeUnits.DecausGallon:
-            return ((value * 0.003785411784) * 10.0)
+        VolumeUnits.DecausGallon: ('473176473/12500000000', '0'),
         
-        if to_unit == VolumeUnits.DeciusGallon:
-            return ((value * 0.003785411784) * 0.1)
+        VolumeUnits.DeciusGallon: ('473176473/1250000000000', '0'),
         
-        if to_unit == VolumeUnits.HectousGallon:
-            return ((value * 0.003785411784) * 100.0)
+        VolumeUnits.HectousGallon: ('473176473/1250000000', '0'),
         
-        if to_unit == VolumeUnits.KilousGallon:
-            return ((value * 0.003785411784) * 1000.0)
+        VolumeUnits.KilousGallon: ('473176473/125000000', '0'),
         
-        if to_unit == VolumeUnits.MegausGallon:
-            return ((value * 0.003785411784) * 1000000.0)
+        VolumeUnits.MegausGallon: ('473176473/125000', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        VolumeUnits.Liter: ('l',),
+        
+        VolumeUnits.CubicMeter: ('m³',),
+        
+        VolumeUnits.CubicKilometer: ('km³',),
+        
+        VolumeUnits.CubicHectometer: ('hm³',),
+        
+        VolumeUnits.CubicDecimeter: ('dm³',),
+        
+        VolumeUnits.CubicCentimeter: ('cm³',),
+        
+        VolumeUnits.CubicMillimeter: ('mm³',),
+        
+        VolumeUnits.CubicMicrometer: ('µm³',),
+        
+        VolumeUnits.CubicMile: ('mi³',),
+        
+        VolumeUnits.CubicYard: ('yd³',),
+        
+        VolumeUnits.CubicFoot: ('ft³',),
+        
+        VolumeUnits.CubicInch: ('in³',),
+        
+        VolumeUnits.ImperialGallon: ('gal (imp.)',),
+        
+        VolumeUnits.ImperialOunce: ('oz (imp.)',),
+        
+        VolumeUnits.UsGallon: ('gal (U.S.)',),
+        
+        VolumeUnits.UsOunce: ('oz (U.S.)',),
+        
+        VolumeUnits.UsTablespoon: (),
+        
+        VolumeUnits.AuTablespoon: (),
+        
+        VolumeUnits.UkTablespoon: (),
+        
+        VolumeUnits.MetricTeaspoon: ('tsp',),
+        
+        VolumeUnits.UsTeaspoon: (),
+        
+        VolumeUnits.MetricCup: (),
+        
+        VolumeUnits.UsCustomaryCup: (),
+        
+        VolumeUnits.UsLegalCup: (),
+        
+        VolumeUnits.OilBarrel: ('bbl',),
+        
+        VolumeUnits.UsBeerBarrel: ('bl (U.S.)',),
+        
+        VolumeUnits.ImperialBeerBarrel: ('bl (imp.)',),
+        
+        VolumeUnits.UsQuart: ('qt (U.S.)',),
+        
+        VolumeUnits.ImperialQuart: ('qt (imp.)',),
+        
+        VolumeUnits.UsPint: ('pt (U.S.)',),
+        
+        VolumeUnits.AcreFoot: ('ac-ft',),
+        
+        VolumeUnits.ImperialPint: ('pt (imp.)',),
+        
+        VolumeUnits.BoardFoot: ('bf',),
+        
+        VolumeUnits.Nanoliter: ('nl',),
+        
+        VolumeUnits.Microliter: ('μl',),
+        
+        VolumeUnits.Milliliter: ('ml',),
+        
+        VolumeUnits.Centiliter: ('cl',),
+        
+        VolumeUnits.Deciliter: ('dl',),
+        
+        VolumeUnits.Decaliter: ('dal',),
+        
+        VolumeUnits.Hectoliter: ('hl',),
+        
+        VolumeUnits.Kiloliter: ('kl',),
+        
+        VolumeUnits.Megaliter: ('Ml',),
+        
+        VolumeUnits.HectocubicMeter: ('hm³',),
+        
+        VolumeUnits.KilocubicMeter: ('km³',),
+        
+        VolumeUnits.HectocubicFoot: ('hft³',),
+        
+        VolumeUnits.KilocubicFoot: ('kft³',),
+        
+        VolumeUnits.MegacubicFoot: ('Mft³',),
+        
+        VolumeUnits.KiloimperialGallon: ('kgal (imp.)',),
+        
+        VolumeUnits.MegaimperialGallon: ('Mgal (imp.)',),
+        
+        VolumeUnits.DecausGallon: ('dagal (U.S.)',),
+        
+        VolumeUnits.DeciusGallon: ('dgal (U.S.)',),
+        
+        VolumeUnits.HectousGallon: ('hgal (U.S.)',),
+        
+        VolumeUnits.KilousGallon: ('kgal (U.S.)',),
+        
+        VolumeUnits.MegausGallon: ('Mgal (U.S.)',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: VolumeUnits = VolumeUnits.CubicMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: VolumeUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: VolumeUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: VolumeUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: VolumeUnits, to_unit: VolumeUnits) -> float:
+        """
+        Convert a value from one Volume unit to another, without creating a Volume instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumeUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: VolumeUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return Volume._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: VolumeUnits, to_unit: VolumeUnits) -> List[float]:
+        """
+        Convert many values from one Volume unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: VolumeUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: VolumeUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return Volume._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: VolumeUnits, to_unit: VolumeUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", Volume._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: VolumeUnits, to_unit: VolumeUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one Volume unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumeUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: VolumeUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return Volume._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: VolumeUnits = VolumeUnits.CubicMeter) -> Volume:
+        """
+        Create a new instance of Volume holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumeUnits
+        :return: A new instance of Volume.
+        :rtype: Volume
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return Volume._from_exact(value, from_unit)
+
+    def to_exact(self, unit: VolumeUnits = VolumeUnits.CubicMeter) -> Fraction:
+        """
+        Get the exact value of the Volume in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (CubicMeter).
+        :type unit: VolumeUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> Volume:
+        """
+        Parse a Volume from a value followed by a unit abbreviation, e.g. "1 l".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of Volume.
+        :rtype: Volume
+        :raises ValueError: When the string is not a valid or an ambiguous Volume.
+        """
+        return Volume._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[Volume]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return Volume._try_parse(text)
+
+    def to_binary(self, unit: Optional[VolumeUnits] = None) -> bytes:
+        """
+        Encode the Volume to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: VolumeUnits
+        :return: The encoded Volume.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> Volume:
+        """
+        Decode a Volume encoded by to_binary.
+
+        :param data: The encoded Volume, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of Volume.
+        :rtype: Volume
+        :raises ValueError: When the data is not a valid encoded Volume.
+        """
+        return Volume._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[VolumeUnits] = None) -> dict:
+        """
+        Get the Volume DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (CubicMeter).
+        :type hold_in_unit: VolumeUnits
+        :return: The Volume DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[VolumeUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> Volume:
+        """
+        Create a new instance of Volume from its DTO.
+
+        :param dto: The Volume DTO, the unit is the VolumeUnits value or name.
+        :type dto: dict
+        :return: A new instance of Volume.
+        :rtype: Volume
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return Volume._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> Volume:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return Volume._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -1561,10 +1995,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__liters != None:
-            return self.__liters
-        self.__liters = self.__convert_from_base(VolumeUnits.Liter)
-        return self.__liters
+        return self._cached_convert(VolumeUnits.Liter)
 
     
     @property
@@ -1572,10 +2003,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__cubic_meters != None:
-            return self.__cubic_meters
-        self.__cubic_meters = self.__convert_from_base(VolumeUnits.CubicMeter)
-        return self.__cubic_meters
+        return self._cached_convert(VolumeUnits.CubicMeter)
 
     
     @property
@@ -1583,10 +2011,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__cubic_kilometers != None:
-            return self.__cubic_kilometers
-        self.__cubic_kilometers = self.__convert_from_base(VolumeUnits.CubicKilometer)
-        return self.__cubic_kilometers
+        return self._cached_convert(VolumeUnits.CubicKilometer)
 
     
     @property
@@ -1594,10 +2019,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__cubic_hectometers != None:
-            return self.__cubic_hectometers
-        self.__cubic_hectometers = self.__convert_from_base(VolumeUnits.CubicHectometer)
-        return self.__cubic_hectometers
+        return self._cached_convert(VolumeUnits.CubicHectometer)
 
     
     @property
@@ -1605,10 +2027,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__cubic_decimeters != None:
-            return self.__cubic_decimeters
-        self.__cubic_decimeters = self.__convert_from_base(VolumeUnits.CubicDecimeter)
-        return self.__cubic_decimeters
+        return self._cached_convert(VolumeUnits.CubicDecimeter)
 
     
     @property
@@ -1616,10 +2035,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__cubic_centimeters != None:
-            return self.__cubic_centimeters
-        self.__cubic_centimeters = self.__convert_from_base(VolumeUnits.CubicCentimeter)
-        return self.__cubic_centimeters
+        return self._cached_convert(VolumeUnits.CubicCentimeter)
 
     
     @property
@@ -1627,10 +2043,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__cubic_millimeters != None:
-            return self.__cubic_millimeters
-        self.__cubic_millimeters = self.__convert_from_base(VolumeUnits.CubicMillimeter)
-        return self.__cubic_millimeters
+        return self._cached_convert(VolumeUnits.CubicMillimeter)
 
     
     @property
@@ -1638,10 +2051,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__cubic_micrometers != None:
-            return self.__cubic_micrometers
-        self.__cubic_micrometers = self.__convert_from_base(VolumeUnits.CubicMicrometer)
-        return self.__cubic_micrometers
+        return self._cached_convert(VolumeUnits.CubicMicrometer)
 
     
     @property
@@ -1649,10 +2059,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__cubic_miles != None:
-            return self.__cubic_miles
-        self.__cubic_miles = self.__convert_from_base(VolumeUnits.CubicMile)
-        return self.__cubic_miles
+        return self._cached_convert(VolumeUnits.CubicMile)
 
     
     @property
@@ -1660,10 +2067,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__cubic_yards != None:
-            return self.__cubic_yards
-        self.__cubic_yards = self.__convert_from_base(VolumeUnits.CubicYard)
-        return self.__cubic_yards
+        return self._cached_convert(VolumeUnits.CubicYard)
 
     
     @property
@@ -1671,10 +2075,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__cubic_feet != None:
-            return self.__cubic_feet
-        self.__cubic_feet = self.__convert_from_base(VolumeUnits.CubicFoot)
-        return self.__cubic_feet
+        return self._cached_convert(VolumeUnits.CubicFoot)
 
     
     @property
@@ -1682,10 +2083,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__cubic_inches != None:
-            return self.__cubic_inches
-        self.__cubic_inches = self.__convert_from_base(VolumeUnits.CubicInch)
-        return self.__cubic_inches
+        return self._cached_convert(VolumeUnits.CubicInch)
 
     
     @property
@@ -1693,10 +2091,7 @@ class Volume(AbstractMeasure):
         """
         The British imperial gallon (frequently called simply "gallon") is defined as exactly 4.54609 litres.
         """
-        if self.__imperial_gallons != None:
-            return self.__imperial_gallons
-        self.__imperial_gallons = self.__convert_from_base(VolumeUnits.ImperialGallon)
-        return self.__imperial_gallons
+        return self._cached_convert(VolumeUnits.ImperialGallon)
 
     
     @property
@@ -1704,10 +2099,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__imperial_ounces != None:
-            return self.__imperial_ounces
-        self.__imperial_ounces = self.__convert_from_base(VolumeUnits.ImperialOunce)
-        return self.__imperial_ounces
+        return self._cached_convert(VolumeUnits.ImperialOunce)
 
     
     @property
@@ -1715,10 +2107,7 @@ class Volume(AbstractMeasure):
         """
         The US liquid gallon (frequently called simply "gallon") is legally defined as 231 cubic inches, which is exactly 3.785411784 litres.
         """
-        if self.__us_gallons != None:
-            return self.__us_gallons
-        self.__us_gallons = self.__convert_from_base(VolumeUnits.UsGallon)
-        return self.__us_gallons
+        return self._cached_convert(VolumeUnits.UsGallon)
 
     
     @property
@@ -1726,10 +2115,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__us_ounces != None:
-            return self.__us_ounces
-        self.__us_ounces = self.__convert_from_base(VolumeUnits.UsOunce)
-        return self.__us_ounces
+        return self._cached_convert(VolumeUnits.UsOunce)
 
     
     @property
@@ -1737,10 +2123,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__us_tablespoons != None:
-            return self.__us_tablespoons
-        self.__us_tablespoons = self.__convert_from_base(VolumeUnits.UsTablespoon)
-        return self.__us_tablespoons
+        return self._cached_convert(VolumeUnits.UsTablespoon)
 
     
     @property
@@ -1748,10 +2131,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__au_tablespoons != None:
-            return self.__au_tablespoons
-        self.__au_tablespoons = self.__convert_from_base(VolumeUnits.AuTablespoon)
-        return self.__au_tablespoons
+        return self._cached_convert(VolumeUnits.AuTablespoon)
 
     
     @property
@@ -1759,10 +2139,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__uk_tablespoons != None:
-            return self.__uk_tablespoons
-        self.__uk_tablespoons = self.__convert_from_base(VolumeUnits.UkTablespoon)
-        return self.__uk_tablespoons
+        return self._cached_convert(VolumeUnits.UkTablespoon)
 
     
     @property
@@ -1770,10 +2147,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__metric_teaspoons != None:
-            return self.__metric_teaspoons
-        self.__metric_teaspoons = self.__convert_from_base(VolumeUnits.MetricTeaspoon)
-        return self.__metric_teaspoons
+        return self._cached_convert(VolumeUnits.MetricTeaspoon)
 
     
     @property
@@ -1781,10 +2155,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__us_teaspoons != None:
-            return self.__us_teaspoons
-        self.__us_teaspoons = self.__convert_from_base(VolumeUnits.UsTeaspoon)
-        return self.__us_teaspoons
+        return self._cached_convert(VolumeUnits.UsTeaspoon)
 
     
     @property
@@ -1792,10 +2163,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__metric_cups != None:
-            return self.__metric_cups
-        self.__metric_cups = self.__convert_from_base(VolumeUnits.MetricCup)
-        return self.__metric_cups
+        return self._cached_convert(VolumeUnits.MetricCup)
 
     
     @property
@@ -1803,10 +2171,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__us_customary_cups != None:
-            return self.__us_customary_cups
-        self.__us_customary_cups = self.__convert_from_base(VolumeUnits.UsCustomaryCup)
-        return self.__us_customary_cups
+        return self._cached_convert(VolumeUnits.UsCustomaryCup)
 
     
     @property
@@ -1814,10 +2179,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__us_legal_cups != None:
-            return self.__us_legal_cups
-        self.__us_legal_cups = self.__convert_from_base(VolumeUnits.UsLegalCup)
-        return self.__us_legal_cups
+        return self._cached_convert(VolumeUnits.UsLegalCup)
 
     
     @property
@@ -1825,10 +2187,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__oil_barrels != None:
-            return self.__oil_barrels
-        self.__oil_barrels = self.__convert_from_base(VolumeUnits.OilBarrel)
-        return self.__oil_barrels
+        return self._cached_convert(VolumeUnits.OilBarrel)
 
     
     @property
@@ -1836,10 +2195,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__us_beer_barrels != None:
-            return self.__us_beer_barrels
-        self.__us_beer_barrels = self.__convert_from_base(VolumeUnits.UsBeerBarrel)
-        return self.__us_beer_barrels
+        return self._cached_convert(VolumeUnits.UsBeerBarrel)
 
     
     @property
@@ -1847,10 +2203,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__imperial_beer_barrels != None:
-            return self.__imperial_beer_barrels
-        self.__imperial_beer_barrels = self.__convert_from_base(VolumeUnits.ImperialBeerBarrel)
-        return self.__imperial_beer_barrels
+        return self._cached_convert(VolumeUnits.ImperialBeerBarrel)
 
     
     @property
@@ -1858,10 +2211,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__us_quarts != None:
-            return self.__us_quarts
-        self.__us_quarts = self.__convert_from_base(VolumeUnits.UsQuart)
-        return self.__us_quarts
+        return self._cached_convert(VolumeUnits.UsQuart)
 
     
     @property
@@ -1869,10 +2219,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__imperial_quarts != None:
-            return self.__imperial_quarts
-        self.__imperial_quarts = self.__convert_from_base(VolumeUnits.ImperialQuart)
-        return self.__imperial_quarts
+        return self._cached_convert(VolumeUnits.ImperialQuart)
 
     
     @property
@@ -1880,10 +2227,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__us_pints != None:
-            return self.__us_pints
-        self.__us_pints = self.__convert_from_base(VolumeUnits.UsPint)
-        return self.__us_pints
+        return self._cached_convert(VolumeUnits.UsPint)
 
     
     @property
@@ -1891,10 +2235,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__acre_feet != None:
-            return self.__acre_feet
-        self.__acre_feet = self.__convert_from_base(VolumeUnits.AcreFoot)
-        return self.__acre_feet
+        return self._cached_convert(VolumeUnits.AcreFoot)
 
     
     @property
@@ -1902,10 +2243,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__imperial_pints != None:
-            return self.__imperial_pints
-        self.__imperial_pints = self.__convert_from_base(VolumeUnits.ImperialPint)
-        return self.__imperial_pints
+        return self._cached_convert(VolumeUnits.ImperialPint)
 
     
     @property
@@ -1913,10 +2251,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__board_feet != None:
-            return self.__board_feet
-        self.__board_feet = self.__convert_from_base(VolumeUnits.BoardFoot)
-        return self.__board_feet
+        return self._cached_convert(VolumeUnits.BoardFoot)
 
     
     @property
@@ -1924,10 +2259,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__nanoliters != None:
-            return self.__nanoliters
-        self.__nanoliters = self.__convert_from_base(VolumeUnits.Nanoliter)
-        return self.__nanoliters
+        return self._cached_convert(VolumeUnits.Nanoliter)
 
     
     @property
@@ -1935,10 +2267,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__microliters != None:
-            return self.__microliters
-        self.__microliters = self.__convert_from_base(VolumeUnits.Microliter)
-        return self.__microliters
+        return self._cached_convert(VolumeUnits.Microliter)
 
     
     @property
@@ -1946,10 +2275,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__milliliters != None:
-            return self.__milliliters
-        self.__milliliters = self.__convert_from_base(VolumeUnits.Milliliter)
-        return self.__milliliters
+        return self._cached_convert(VolumeUnits.Milliliter)
 
     
     @property
@@ -1957,10 +2283,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__centiliters != None:
-            return self.__centiliters
-        self.__centiliters = self.__convert_from_base(VolumeUnits.Centiliter)
-        return self.__centiliters
+        return self._cached_convert(VolumeUnits.Centiliter)
 
     
     @property
@@ -1968,10 +2291,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__deciliters != None:
-            return self.__deciliters
-        self.__deciliters = self.__convert_from_base(VolumeUnits.Deciliter)
-        return self.__deciliters
+        return self._cached_convert(VolumeUnits.Deciliter)
 
     
     @property
@@ -1979,10 +2299,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__decaliters != None:
-            return self.__decaliters
-        self.__decaliters = self.__convert_from_base(VolumeUnits.Decaliter)
-        return self.__decaliters
+        return self._cached_convert(VolumeUnits.Decaliter)
 
     
     @property
@@ -1990,10 +2307,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__hectoliters != None:
-            return self.__hectoliters
-        self.__hectoliters = self.__convert_from_base(VolumeUnits.Hectoliter)
-        return self.__hectoliters
+        return self._cached_convert(VolumeUnits.Hectoliter)
 
     
     @property
@@ -2001,10 +2315,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__kiloliters != None:
-            return self.__kiloliters
-        self.__kiloliters = self.__convert_from_base(VolumeUnits.Kiloliter)
-        return self.__kiloliters
+        return self._cached_convert(VolumeUnits.Kiloliter)
 
     
     @property
@@ -2012,10 +2323,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__megaliters != None:
-            return self.__megaliters
-        self.__megaliters = self.__convert_from_base(VolumeUnits.Megaliter)
-        return self.__megaliters
+        return self._cached_convert(VolumeUnits.Megaliter)
 
     
     @property
@@ -2023,10 +2331,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__hectocubic_meters != None:
-            return self.__hectocubic_meters
-        self.__hectocubic_meters = self.__convert_from_base(VolumeUnits.HectocubicMeter)
-        return self.__hectocubic_meters
+        return self._cached_convert(VolumeUnits.HectocubicMeter)
 
     
     @property
@@ -2034,10 +2339,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__kilocubic_meters != None:
-            return self.__kilocubic_meters
-        self.__kilocubic_meters = self.__convert_from_base(VolumeUnits.KilocubicMeter)
-        return self.__kilocubic_meters
+        return self._cached_convert(VolumeUnits.KilocubicMeter)
 
     
     @property
@@ -2045,10 +2347,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__hectocubic_feet != None:
-            return self.__hectocubic_feet
-        self.__hectocubic_feet = self.__convert_from_base(VolumeUnits.HectocubicFoot)
-        return self.__hectocubic_feet
+        return self._cached_convert(VolumeUnits.HectocubicFoot)
 
     
     @property
@@ -2056,10 +2355,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__kilocubic_feet != None:
-            return self.__kilocubic_feet
-        self.__kilocubic_feet = self.__convert_from_base(VolumeUnits.KilocubicFoot)
-        return self.__kilocubic_feet
+        return self._cached_convert(VolumeUnits.KilocubicFoot)
 
     
     @property
@@ -2067,10 +2363,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__megacubic_feet != None:
-            return self.__megacubic_feet
-        self.__megacubic_feet = self.__convert_from_base(VolumeUnits.MegacubicFoot)
-        return self.__megacubic_feet
+        return self._cached_convert(VolumeUnits.MegacubicFoot)
 
     
     @property
@@ -2078,10 +2371,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__kiloimperial_gallons != None:
-            return self.__kiloimperial_gallons
-        self.__kiloimperial_gallons = self.__convert_from_base(VolumeUnits.KiloimperialGallon)
-        return self.__kiloimperial_gallons
+        return self._cached_convert(VolumeUnits.KiloimperialGallon)
 
     
     @property
@@ -2089,10 +2379,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__megaimperial_gallons != None:
-            return self.__megaimperial_gallons
-        self.__megaimperial_gallons = self.__convert_from_base(VolumeUnits.MegaimperialGallon)
-        return self.__megaimperial_gallons
+        return self._cached_convert(VolumeUnits.MegaimperialGallon)
 
     
     @property
@@ -2100,10 +2387,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__decaus_gallons != None:
-            return self.__decaus_gallons
-        self.__decaus_gallons = self.__convert_from_base(VolumeUnits.DecausGallon)
-        return self.__decaus_gallons
+        return self._cached_convert(VolumeUnits.DecausGallon)
 
     
     @property
@@ -2111,10 +2395,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__decius_gallons != None:
-            return self.__decius_gallons
-        self.__decius_gallons = self.__convert_from_base(VolumeUnits.DeciusGallon)
-        return self.__decius_gallons
+        return self._cached_convert(VolumeUnits.DeciusGallon)
 
     
     @property
@@ -2122,10 +2403,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__hectous_gallons != None:
-            return self.__hectous_gallons
-        self.__hectous_gallons = self.__convert_from_base(VolumeUnits.HectousGallon)
-        return self.__hectous_gallons
+        return self._cached_convert(VolumeUnits.HectousGallon)
 
     
     @property
@@ -2133,10 +2411,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__kilous_gallons != None:
-            return self.__kilous_gallons
-        self.__kilous_gallons = self.__convert_from_base(VolumeUnits.KilousGallon)
-        return self.__kilous_gallons
+        return self._cached_convert(VolumeUnits.KilousGallon)
 
     
     @property
@@ -2144,10 +2419,7 @@ class Volume(AbstractMeasure):
         """
         
         """
-        if self.__megaus_gallons != None:
-            return self.__megaus_gallons
-        self.__megaus_gallons = self.__convert_from_base(VolumeUnits.MegausGallon)
-        return self.__megaus_gallons
+        return self._cached_convert(VolumeUnits.MegausGallon)
 
     
     def to_string(self, unit: VolumeUnits = VolumeUnits.CubicMeter) -> str:
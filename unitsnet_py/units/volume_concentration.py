@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class VolumeConcentrationUnits(Enum):
         """
             VolumeConcentrationUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         DecimalFraction = 'decimal_fraction'
         """
@@ -119,185 +130,472 @@ class VolumeConcentration(AbstractMeasure):
         value (float): The value.
         from_unit (VolumeConcentrationUnits): The VolumeConcentration unit to create from, The default unit is DecimalFraction
     """
-    def __init__(self, value: float, from_unit: VolumeConcentrationUnits = VolumeConcentrationUnits.DecimalFraction):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = VolumeConcentrationUnits
+
+    _base_unit = VolumeConcentrationUnits.DecimalFraction
+
+    _dimensions = None
+
+    _si_scale = None
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 114
+
+    _binary_unit_ids = {
         
-        self.__decimal_fractions = None
+        VolumeConcentrationUnits.DecimalFraction: 0,
         
-        self.__liters_per_liter = None
+        VolumeConcentrationUnits.LitersPerLiter: 1,
         
-        self.__liters_per_mililiter = None
+        VolumeConcentrationUnits.LitersPerMililiter: 2,
         
-        self.__percent = None
+        VolumeConcentrationUnits.Percent: 3,
         
-        self.__parts_per_thousand = None
+        VolumeConcentrationUnits.PartPerThousand: 4,
         
-        self.__parts_per_million = None
+        VolumeConcentrationUnits.PartPerMillion: 5,
         
-        self.__parts_per_billion = None
+        VolumeConcentrationUnits.PartPerBillion: 6,
         
-        self.__parts_per_trillion = None
+        VolumeConcentrationUnits.PartPerTrillion: 7,
         
-        self.__picoliters_per_liter = None
+        VolumeConcentrationUnits.PicolitersPerLiter: 8,
         
-        self.__nanoliters_per_liter = None
+        VolumeConcentrationUnits.NanolitersPerLiter: 9,
         
-        self.__microliters_per_liter = None
+        VolumeConcentrationUnits.MicrolitersPerLiter: 10,
         
-        self.__milliliters_per_liter = None
+        VolumeConcentrationUnits.MillilitersPerLiter: 11,
         
-        self.__centiliters_per_liter = None
+        VolumeConcentrationUnits.CentilitersPerLiter: 12,
         
-        self.__deciliters_per_liter = None
+        VolumeConcentrationUnits.DecilitersPerLiter: 13,
         
-        self.__picoliters_per_mililiter = None
+        VolumeConcentrationUnits.PicolitersPerMililiter: 14,
         
-        self.__nanoliters_per_mililiter = None
+        VolumeConcentrationUnits.NanolitersPerMililiter: 15,
         
-        self.__microliters_per_mililiter = None
+        VolumeConcentrationUnits.MicrolitersPerMililiter: 16,
         
-        self.__milliliters_per_mililiter = None
+        VolumeConcentrationUnits.MillilitersPerMililiter: 17,
         
-        self.__centiliters_per_mililiter = None
+        VolumeConcentrationUnits.CentilitersPerMililiter: 18,
         
-        self.__deciliters_per_mililiter = None
+        VolumeConcentrationUnits.DecilitersPerMililiter: 19,
         
+    }
 
-    def convert(self, unit: VolumeConcentrationUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        VolumeConcentrationUnits.DecimalFraction: lambda value: (value),
+        
+        VolumeConcentrationUnits.LitersPerLiter: lambda value: (value),
+        
+        VolumeConcentrationUnits.LitersPerMililiter: lambda value: (value * 1e-3),
+        
+        VolumeConcentrationUnits.Percent: lambda value: (value * 1e2),
+        
+        VolumeConcentrationUnits.PartPerThousand: lambda value: (value * 1e3),
+        
+        VolumeConcentrationUnits.PartPerMillion: lambda value: (value * 1e6),
+        
+        VolumeConcentrationUnits.PartPerBillion: lambda value: (value * 1e9),
+        
+        VolumeConcentrationUnits.PartPerTrillion: lambda value: (value * 1e12),
+        
+        VolumeConcentrationUnits.PicolitersPerLiter: lambda value: ((value) / 1e-12),
+        
+        VolumeConcentrationUnits.NanolitersPerLiter: lambda value: ((value) / 1e-09),
+        
+        VolumeConcentrationUnits.MicrolitersPerLiter: lambda value: ((value) / 1e-06),
+        
+        VolumeConcentrationUnits.MillilitersPerLiter: lambda value: ((value) / 0.001),
+        
+        VolumeConcentrationUnits.CentilitersPerLiter: lambda value: ((value) / 0.01),
+        
+        VolumeConcentrationUnits.DecilitersPerLiter: lambda value: ((value) / 0.1),
+        
+        VolumeConcentrationUnits.PicolitersPerMililiter: lambda value: ((value * 1e-3) / 1e-12),
+        
+        VolumeConcentrationUnits.NanolitersPerMililiter: lambda value: ((value * 1e-3) / 1e-09),
+        
+        VolumeConcentrationUnits.MicrolitersPerMililiter: lambda value: ((value * 1e-3) / 1e-06),
+        
+        VolumeConcentrationUnits.MillilitersPerMililiter: lambda value: ((value * 1e-3) / 0.001),
+        
+        VolumeConcentrationUnits.CentilitersPerMililiter: lambda value: ((value * 1e-3) / 0.01),
+        
+        VolumeConcentrationUnits.DecilitersPerMililiter: lambda value: ((value * 1e-3) / 0.1),
+        
+    }
 
-    def __convert_from_base(self, from_unit: VolumeConcentrationUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
         
-        if from_unit == VolumeConcentrationUnits.DecimalFraction:
-            return (value)
+        VolumeConcentrationUnits.DecimalFraction: lambda value: (value),
         
-        if from_unit == VolumeConcentrationUnits.LitersPerLiter:
-            return (value)
+        VolumeConcentrationUnits.LitersPerLiter: lambda value: (value),
         
-        if from_unit == VolumeConcentrationUnits.LitersPerMililiter:
-            return (value * 1e-3)
+        VolumeConcentrationUnits.LitersPerMililiter: lambda value: (value / 1e-3),
         
-        if from_unit == VolumeConcentrationUnits.Percent:
-            return (value * 1e2)
+        VolumeConcentrationUnits.Percent: lambda value: (value / 1e2),
         
-        if from_unit == VolumeConcentrationUnits.PartPerThousand:
-            return (value * 1e3)
+        VolumeConcentrationUnits.PartPerThousand: lambda value: (value / 1e3),
         
-        if from_unit == VolumeConcentrationUnits.PartPerMillion:
-            return (value * 1e6)
+        VolumeConcentrationUnits.PartPerMillion: lambda value: (value / 1e6),
         
-        if from_unit == VolumeConcentrationUnits.PartPerBillion:
-            return (value * 1e9)
+        VolumeConcentrationUnits.PartPerBillion: lambda value: (value / 1e9),
         
-        if from_unit == VolumeConcentrationUnits.PartPerTrillion:
-            return (value * 1e12)
+        VolumeConcentrationUnits.PartPerTrillion: lambda value: (value / 1e12),
         
-        if from_unit == VolumeConcentrationUnits.PicolitersPerLiter:
-            return ((value) / 1e-12)
+        VolumeConcentrationUnits.PicolitersPerLiter: lambda value: ((value) * 1e-12),
         
-        if from_unit == VolumeConcentrationUnits.NanolitersPerLiter:
-            return ((value) / 1e-09)
+        VolumeConcentrationUnits.NanolitersPerLiter: lambda value: ((value) * 1e-09),
         
-        if from_unit == VolumeConcentrationUnits.MicrolitersPerLiter:
-            return ((value) / 1e-06)
+        VolumeConcentrationUnits.MicrolitersPerLiter: lambda value: ((value) * 1e-06),
         
-        if from_unit == VolumeConcentrationUnits.MillilitersPerLiter:
-            return ((value) / 0.001)
+        VolumeConcentrationUnits.MillilitersPerLiter: lambda value: ((value) * 0.001),
         
-        if from_unit == VolumeConcentrationUnits.CentilitersPerLiter:
-            return ((value) / 0.01)
+        VolumeConcentrationUnits.CentilitersPerLiter: lambda value: ((value) * 0.01),
         
-        if from_unit == VolumeConcentrationUnits.DecilitersPerLiter:
-            return ((value) / 0.1)
+        VolumeConcentrationUnits.DecilitersPerLiter: lambda value: ((value) * 0.1),
         
-        if from_unit == VolumeConcentrationUnits.PicolitersPerMililiter:
-            return ((value * 1e-3) / 1e-12)
+        VolumeConcentrationUnits.PicolitersPerMililiter: lambda value: ((value / 1e-3) * 1e-12),
         
-        if from_unit == VolumeConcentrationUnits.NanolitersPerMililiter:
-            return ((value * 1e-3) / 1e-09)
+        VolumeConcentrationUnits.NanolitersPerMililiter: lambda value: ((value / 1e-3) * 1e-09),
         
-        if from_unit == VolumeConcentrationUnits.MicrolitersPerMililiter:
-            return ((value * 1e-3) / 1e-06)
+        VolumeConcentrationUnits.MicrolitersPerMililiter: lambda value: ((value / 1e-3) * 1e-06),
         
-        if from_unit == VolumeConcentrationUnits.MillilitersPerMililiter:
-            return ((value * 1e-3) / 0.001)
+        VolumeConcentrationUnits.MillilitersPerMililiter: lambda value: ((value / 1e-3) * 0.001),
         
-        if from_unit == VolumeConcentrationUnits.CentilitersPerMililiter:
-            return ((value * 1e-3) / 0.01)
+        VolumeConcentrationUnits.CentilitersPerMililiter: lambda value: ((value / 1e-3) * 0.01),
         
-        if from_unit == VolumeConcentrationUnits.DecilitersPerMililiter:
-            return ((value * 1e-3) / 0.1)
+        VolumeConcentrationUnits.DecilitersPerMililiter: lambda value: ((value / 1e-3) * 0.1),
         
-        return None
+    }
 
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        VolumeConcentrationUnits.DecimalFraction: ('1', '0'),
+        
+        VolumeConcentrationUnits.LitersPerLiter: ('1', '0'),
+        
+        VolumeConcentrationUnits.LitersPerMililiter: ('1/1000', '0'),
+        
+        VolumeConcentrationUnits.Percent: ('100', '0'),
+        
+        VolumeConcentrationUnits.PartPerThousand: ('1000', '0'),
+        
+        VolumeConcentrationUnits.PartPerMillion: ('1000000', '0'),
+        
+        VolumeConcentrationUnits.PartPerBillion: ('1000000000', '0'),
+        
+        VolumeConcentrationUnits.PartPerTrillion: ('1000000000000', '0'),
+        
+        VolumeConcentrationUnits.PicolitersPerLiter: ('1000000000000', '0'),
+        
+        VolumeConcentrationUnits.NanolitersPerLiter: ('1000000000', '0'),
+        
+        VolumeConcentrationUnits.MicrolitersPerLiter: ('1000000', '0'),
+        
+        VolumeConcentrationUnits.MillilitersPerLiter: ('1000', '0'),
+        
+        VolumeConcentrationUnits.CentilitersPerLiter: ('100', '0'),
+        
+        VolumeConcentrationUnits.DecilitersPerLiter: ('10', '0'),
+        
+        VolumeConcentrationUnits.PicolitersPerMililiter: ('1000000000', '0'),
+        
+        VolumeConcentrationUnits.NanolitersPerMililiter: ('1000000', '0'),
+        
+        VolumeConcentrationUnits.MicrolitersPerMililiter: ('1000', '0'),
+        
+        VolumeConcentrationUnits.MillilitersPerMililiter: ('1', '0'),
+        
+        VolumeConcentrationUnits.CentilitersPerMililiter: ('1/10', '0'),
+        
+        VolumeConcentrationUnits.DecilitersPerMililiter: ('1/100', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: VolumeConcentrationUnits) -> float:
+    _affine_to_base = {
         
-        if to_unit == VolumeConcentrationUnits.DecimalFraction:
-            return (value)
+        VolumeConcentrationUnits.DecimalFraction: ('1', '0'),
         
-        if to_unit == VolumeConcentrationUnits.LitersPerLiter:
-            return (value)
+        VolumeConcentrationUnits.LitersPerLiter: ('1', '0'),
         
-        if to_unit == VolumeConcentrationUnits.LitersPerMililiter:
-            return (value / 1e-3)
+        VolumeConcentrationUnits.LitersPerMililiter: ('1000', '0'),
         
-        if to_unit == VolumeConcentrationUnits.Percent:
-            return (value / 1e2)
+        VolumeConcentrationUnits.Percent: ('1/100', '0'),
         
-        if to_unit == VolumeConcentrationUnits.PartPerThousand:
-            return (value / 1e3)
+        VolumeConcentrationUnits.PartPerThousand: ('1/1000', '0'),
         
-        if to_unit == VolumeConcentrationUnits.PartPerMillion:
-            return (value / 1e6)
+        VolumeConcentrationUnits.PartPerMillion: ('1/1000000', '0'),
         
-        if to_unit == VolumeConcentrationUnits.PartPerBillion:
-            return (value / 1e9)
+        VolumeConcentrationUnits.PartPerBillion: ('1/1000000000', '0'),
         
-        if to_unit == VolumeConcentrationUnits.PartPerTrillion:
-            return (value / 1e12)
+        VolumeConcentrationUnits.PartPerTrillion: ('1/1000000000000', '0'),
         
-        if to_unit == VolumeConcentrationUnits.PicolitersPerLiter:
-            return ((value) * 1e-12)
+        VolumeConcentrationUnits.PicolitersPerLiter: ('1/1000000000000', '0'),
         
-        if to_unit == VolumeConcentrationUnits.NanolitersPerLiter:
-            return ((value) * 1e-09)
+        VolumeConcentrationUnits.NanolitersPerLiter: ('1/1000000000', '0'),
         
-        if to_unit == VolumeConcentrationUnits.MicrolitersPerLiter:
-            return ((value) * 1e-06)
+        VolumeConcentrationUnits.MicrolitersPerLiter: ('1/1000000', '0'),
         
-        if to_unit == VolumeConcentrationUnits.MillilitersPerLiter:
-            return ((value) * 0.001)
+        VolumeConcentrationUnits.MillilitersPerLiter: ('1/1000', '0'),
         
-        if to_unit == VolumeConcentrationUnits.CentilitersPerLiter:
-            return ((value) * 0.01)
+        VolumeConcentrationUnits.CentilitersPerLiter: ('1/100', '0'),
         
-        if to_unit == VolumeConcentrationUnits.DecilitersPerLiter:
-            return ((value) * 0.1)
+        VolumeConcentrationUnits.DecilitersPerLiter: ('1/10', '0'),
         
-        if to_unit == VolumeConcentrationUnits.PicolitersPerMililiter:
-            return ((value / 1e-3) * 1e-12)
+        VolumeConcentrationUnits.PicolitersPerMililiter: ('1/1000000000', '0'),
         
-        if to_unit == VolumeConcentrationUnits.NanolitersPerMililiter:
-            return ((value / 1e-3) * 1e-09)
+        VolumeConcentrationUnits.NanolitersPerMililiter: ('1/1000000', '0'),
         
-        if to_unit == VolumeConcentrationUnits.MicrolitersPerMililiter:
-            return ((value / 1e-3) * 1e-06)
+        VolumeConcentrationUnits.MicrolitersPerMililiter: ('1/1000', '0'),
         
-        if to_unit == VolumeConcentrationUnits.MillilitersPerMililiter:
-            return ((value / 1e-3) * 0.001)
+        VolumeConcentrationUnits.MillilitersPerMililiter: ('1', '0'),
         
-        if to_unit == VolumeConcentrationUnits.CentilitersPerMililiter:
-            return ((value / 1e-3) * 0.01)
+        VolumeConcentrationUnits.CentilitersPerMililiter: ('10', '0'),
         
-        if to_unit == VolumeConcentrationUnits.DecilitersPerMililiter:
-            return ((value / 1e-3) * 0.1)
+        VolumeConcentrationUnits.DecilitersPerMililiter: ('100', '0'),
         
-        return None
+    }
 
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
+        
+        VolumeConcentrationUnits.DecimalFraction: (),
+        
+        VolumeConcentrationUnits.LitersPerLiter: ('L/L',),
+        
+        VolumeConcentrationUnits.LitersPerMililiter: ('L/mL',),
+        
+        VolumeConcentrationUnits.Percent: ('%',),
+        
+        VolumeConcentrationUnits.PartPerThousand: ('‰',),
+        
+        VolumeConcentrationUnits.PartPerMillion: ('ppm',),
+        
+        VolumeConcentrationUnits.PartPerBillion: ('ppb',),
+        
+        VolumeConcentrationUnits.PartPerTrillion: ('ppt',),
+        
+        VolumeConcentrationUnits.PicolitersPerLiter: ('pL/L',),
+        
+        VolumeConcentrationUnits.NanolitersPerLiter: ('nL/L',),
+        
+        VolumeConcentrationUnits.MicrolitersPerLiter: ('μL/L',),
+        
+        VolumeConcentrationUnits.MillilitersPerLiter: ('mL/L',),
+        
+        VolumeConcentrationUnits.CentilitersPerLiter: ('cL/L',),
+        
+        VolumeConcentrationUnits.DecilitersPerLiter: ('dL/L',),
+        
+        VolumeConcentrationUnits.PicolitersPerMililiter: ('pL/mL',),
+        
+        VolumeConcentrationUnits.NanolitersPerMililiter: ('nL/mL',),
+        
+        VolumeConcentrationUnits.MicrolitersPerMililiter: ('μL/mL',),
+        
+        VolumeConcentrationUnits.MillilitersPerMililiter: ('mL/mL',),
+        
+        VolumeConcentrationUnits.CentilitersPerMililiter: ('cL/mL',),
+        
+        VolumeConcentrationUnits.DecilitersPerMililiter: ('dL/mL',),
+        
+    }
+
+    def __init__(self, value: float, from_unit: VolumeConcentrationUnits = VolumeConcentrationUnits.DecimalFraction):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: VolumeConcentrationUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: VolumeConcentrationUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: VolumeConcentrationUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: VolumeConcentrationUnits, to_unit: VolumeConcentrationUnits) -> float:
+        """
+        Convert a value from one VolumeConcentration unit to another, without creating a VolumeConcentration instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumeConcentrationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: VolumeConcentrationUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return VolumeConcentration._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: VolumeConcentrationUnits, to_unit: VolumeConcentrationUnits) -> List[float]:
+        """
+        Convert many values from one VolumeConcentration unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: VolumeConcentrationUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: VolumeConcentrationUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return VolumeConcentration._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: VolumeConcentrationUnits, to_unit: VolumeConcentrationUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", VolumeConcentration._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: VolumeConcentrationUnits, to_unit: VolumeConcentrationUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one VolumeConcentration unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumeConcentrationUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: VolumeConcentrationUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return VolumeConcentration._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: VolumeConcentrationUnits = VolumeConcentrationUnits.DecimalFraction) -> VolumeConcentration:
+        """
+        Create a new instance of VolumeConcentration holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumeConcentrationUnits
+        :return: A new instance of VolumeConcentration.
+        :rtype: VolumeConcentration
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return VolumeConcentration._from_exact(value, from_unit)
+
+    def to_exact(self, unit: VolumeConcentrationUnits = VolumeConcentrationUnits.DecimalFraction) -> Fraction:
+        """
+        Get the exact value of the VolumeConcentration in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (DecimalFraction).
+        :type unit: VolumeConcentrationUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> VolumeConcentration:
+        """
+        Parse a VolumeConcentration from a value followed by a unit abbreviation, e.g. "1 ".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of VolumeConcentration.
+        :rtype: VolumeConcentration
+        :raises ValueError: When the string is not a valid or an ambiguous VolumeConcentration.
+        """
+        return VolumeConcentration._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[VolumeConcentration]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return VolumeConcentration._try_parse(text)
+
+    def to_binary(self, unit: Optional[VolumeConcentrationUnits] = None) -> bytes:
+        """
+        Encode the VolumeConcentration to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: VolumeConcentrationUnits
+        :return: The encoded VolumeConcentration.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> VolumeConcentration:
+        """
+        Decode a VolumeConcentration encoded by to_binary.
+
+        :param data: The encoded VolumeConcentration, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of VolumeConcentration.
+        :rtype: VolumeConcentration
+        :raises ValueError: When the data is not a valid encoded VolumeConcentration.
+        """
+        return VolumeConcentration._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[VolumeConcentrationUnits] = None) -> dict:
+        """
+        Get the VolumeConcentration DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (DecimalFraction).
+        :type hold_in_unit: VolumeConcentrationUnits
+        :return: The VolumeConcentration DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[VolumeConcentrationUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> VolumeConcentration:
+        """
+        Create a new instance of VolumeConcentration from its DTO.
+
+        :param dto: The VolumeConcentration DTO, the unit is the VolumeConcentrationUnits value or name.
+        :type dto: dict
+        :return: A new instance of VolumeConcentration.
+        :rtype: VolumeConcentration
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return VolumeConcentration._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> VolumeConcentration:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return VolumeConcentration._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -609,10 +907,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__decimal_fractions != None:
-            return self.__decimal_fractions
-        self.__decimal_fractions = self.__convert_from_base(VolumeConcentrationUnits.DecimalFraction)
-        return self.__decimal_fractions
+        return self._cached_convert(VolumeConcentrationUnits.DecimalFraction)
 
     
     @property
@@ -620,10 +915,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__liters_per_liter != None:
-            return self.__liters_per_liter
-        self.__liters_per_liter = self.__convert_from_base(VolumeConcentrationUnits.LitersPerLiter)
-        return self.__liters_per_liter
+        return self._cached_convert(VolumeConcentrationUnits.LitersPerLiter)
 
     
     @property
@@ -631,10 +923,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__liters_per_mililiter != None:
-            return self.__liters_per_mililiter
-        self.__liters_per_mililiter = self.__convert_from_base(VolumeConcentrationUnits.LitersPerMililiter)
-        return self.__liters_per_mililiter
+        return self._cached_convert(VolumeConcentrationUnits.LitersPerMililiter)
 
     
     @property
@@ -642,10 +931,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__percent != None:
-            return self.__percent
-        self.__percent = self.__convert_from_base(VolumeConcentrationUnits.Percent)
-        return self.__percent
+        return self._cached_convert(VolumeConcentrationUnits.Percent)
 
     
     @property
@@ -653,10 +939,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__parts_per_thousand != None:
-            return self.__parts_per_thousand
-        self.__parts_per_thousand = self.__convert_from_base(VolumeConcentrationUnits.PartPerThousand)
-        return self.__parts_per_thousand
+        return self._cached_convert(VolumeConcentrationUnits.PartPerThousand)
 
     
     @property
@@ -664,10 +947,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__parts_per_million != None:
-            return self.__parts_per_million
-        self.__parts_per_million = self.__convert_from_base(VolumeConcentrationUnits.PartPerMillion)
-        return self.__parts_per_million
+        return self._cached_convert(VolumeConcentrationUnits.PartPerMillion)
 
     
     @property
@@ -675,10 +955,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__parts_per_billion != None:
-            return self.__parts_per_billion
-        self.__parts_per_billion = self.__convert_from_base(VolumeConcentrationUnits.PartPerBillion)
-        return self.__parts_per_billion
+        return self._cached_convert(VolumeConcentrationUnits.PartPerBillion)
 
     
     @property
@@ -686,10 +963,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__parts_per_trillion != None:
-            return self.__parts_per_trillion
-        self.__parts_per_trillion = self.__convert_from_base(VolumeConcentrationUnits.PartPerTrillion)
-        return self.__parts_per_trillion
+        return self._cached_convert(VolumeConcentrationUnits.PartPerTrillion)
 
     
     @property
@@ -697,10 +971,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__picoliters_per_liter != None:
-            return self.__picoliters_per_liter
-        self.__picoliters_per_liter = self.__convert_from_base(VolumeConcentrationUnits.PicolitersPerLiter)
-        return self.__picoliters_per_liter
+        return self._cached_convert(VolumeConcentrationUnits.PicolitersPerLiter)
 
     
     @property
@@ -708,10 +979,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__nanoliters_per_liter != None:
-            return self.__nanoliters_per_liter
-        self.__nanoliters_per_liter = self.__convert_from_base(VolumeConcentrationUnits.NanolitersPerLiter)
-        return self.__nanoliters_per_liter
+        return self._cached_convert(VolumeConcentrationUnits.NanolitersPerLiter)
 
     
     @property
@@ -719,10 +987,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__microliters_per_liter != None:
-            return self.__microliters_per_liter
-        self.__microliters_per_liter = self.__convert_from_base(VolumeConcentrationUnits.MicrolitersPerLiter)
-        return self.__microliters_per_liter
+        return self._cached_convert(VolumeConcentrationUnits.MicrolitersPerLiter)
 
     
     @property
@@ -730,10 +995,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__milliliters_per_liter != None:
-            return self.__milliliters_per_liter
-        self.__milliliters_per_liter = self.__convert_from_base(VolumeConcentrationUnits.MillilitersPerLiter)
-        return self.__milliliters_per_liter
+        return self._cached_convert(VolumeConcentrationUnits.MillilitersPerLiter)
 
     
     @property
@@ -741,10 +1003,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__centiliters_per_liter != None:
-            return self.__centiliters_per_liter
-        self.__centiliters_per_liter = self.__convert_from_base(VolumeConcentrationUnits.CentilitersPerLiter)
-        return self.__centiliters_per_liter
+        return self._cached_convert(VolumeConcentrationUnits.CentilitersPerLiter)
 
     
     @property
@@ -752,10 +1011,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__deciliters_per_liter != None:
-            return self.__deciliters_per_liter
-        self.__deciliters_per_liter = self.__convert_from_base(VolumeConcentrationUnits.DecilitersPerLiter)
-        return self.__deciliters_per_liter
+        return self._cached_convert(VolumeConcentrationUnits.DecilitersPerLiter)
 
     
     @property
@@ -763,10 +1019,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__picoliters_per_mililiter != None:
-            return self.__picoliters_per_mililiter
-        self.__picoliters_per_mililiter = self.__convert_from_base(VolumeConcentrationUnits.PicolitersPerMililiter)
-        return self.__picoliters_per_mililiter
+        return self._cached_convert(VolumeConcentrationUnits.PicolitersPerMililiter)
 
     
     @property
@@ -774,10 +1027,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__nanoliters_per_mililiter != None:
-            return self.__nanoliters_per_mililiter
-        self.__nanoliters_per_mililiter = self.__convert_from_base(VolumeConcentrationUnits.NanolitersPerMililiter)
-        return self.__nanoliters_per_mililiter
+        return self._cached_convert(VolumeConcentrationUnits.NanolitersPerMililiter)
 
     
     @property
@@ -785,10 +1035,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__microliters_per_mililiter != None:
-            return self.__microliters_per_mililiter
-        self.__microliters_per_mililiter = self.__convert_from_base(VolumeConcentrationUnits.MicrolitersPerMililiter)
-        return self.__microliters_per_mililiter
+        return self._cached_convert(VolumeConcentrationUnits.MicrolitersPerMililiter)
 
     
     @property
@@ -796,10 +1043,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__milliliters_per_mililiter != None:
-            return self.__milliliters_per_mililiter
-        self.__milliliters_per_mililiter = self.__convert_from_base(VolumeConcentrationUnits.MillilitersPerMililiter)
-        return self.__milliliters_per_mililiter
+        return self._cached_convert(VolumeConcentrationUnits.MillilitersPerMililiter)
 
     
     @property
@@ -807,10 +1051,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__centiliters_per_mililiter != None:
-            return self.__centiliters_per_mililiter
-        self.__centiliters_per_mililiter = self.__convert_from_base(VolumeConcentrationUnits.CentilitersPerMililiter)
-        return self.__centiliters_per_mililiter
+        return self._cached_convert(VolumeConcentrationUnits.CentilitersPerMililiter)
 
     
     @property
@@ -818,10 +1059,7 @@ class VolumeConcentration(AbstractMeasure):
         """
         
         """
-        if self.__deciliters_per_mililiter != None:
-            return self.__deciliters_per_mililiter
-        self.__deciliters_per_mililiter = self.__convert_from_base(VolumeConcentrationUnits.DecilitersPerMililiter)
-        return self.__deciliters_per_mililiter
+        return self._cached_convert(VolumeConcentrationUnits.DecilitersPerMililiter)
 
     
     def to_string(self, unit: VolumeConcentrationUnits = VolumeConcentrationUnits.DecimalFraction) -> str:
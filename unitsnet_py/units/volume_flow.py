@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class VolumeFlowUnits(Enum):
         """
             VolumeFlowUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         CubicMeterPerSecond = 'cubic_meter_per_second'
         """
@@ -354,561 +365,1036 @@ class VolumeFlow(AbstractMeasure):
         value (float): The value.
         from_unit (VolumeFlowUnits): The VolumeFlow unit to create from, The default unit is CubicMeterPerSecond
     """
-    def __init__(self, value: float, from_unit: VolumeFlowUnits = VolumeFlowUnits.CubicMeterPerSecond):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = VolumeFlowUnits
+
+    _base_unit = VolumeFlowUnits.CubicMeterPerSecond
+
+    _dimensions = (3, 0, -1, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 115
+
+    _binary_unit_ids = {
         
-        self.__cubic_meters_per_second = None
+        VolumeFlowUnits.CubicMeterPerSecond: 0,
         
-        self.__cubic_meters_per_minute = None
+        VolumeFlowUnits.CubicMeterPerMinute: 1,
         
-        self.__cubic_meters_per_hour = None
+        VolumeFlowUnits.CubicMeterPerHour: 2,
         
-        self.__cubic_meters_per_day = None
+        VolumeFlowUnits.CubicMeterPerDay: 3,
         
-        self.__cubic_feet_per_second = None
+        VolumeFlowUnits.CubicFootPerSecond: 4,
         
-        self.__cubic_feet_per_minute = None
+        VolumeFlowUnits.CubicFootPerMinute: 5,
         
-        self.__cubic_feet_per_hour = None
+        VolumeFlowUnits.CubicFootPerHour: 6,
         
-        self.__cubic_yards_per_second = None
+        VolumeFlowUnits.CubicYardPerSecond: 7,
         
-        self.__cubic_yards_per_minute = None
+        VolumeFlowUnits.CubicYardPerMinute: 8,
         
-        self.__cubic_yards_per_hour = None
+        VolumeFlowUnits.CubicYardPerHour: 9,
         
-        self.__cubic_yards_per_day = None
+        VolumeFlowUnits.CubicYardPerDay: 10,
         
-        self.__million_us_gallons_per_day = None
+        VolumeFlowUnits.MillionUsGallonPerDay: 11,
         
-        self.__us_gallons_per_day = None
+        VolumeFlowUnits.UsGallonPerDay: 12,
         
-        self.__liters_per_second = None
+        VolumeFlowUnits.LiterPerSecond: 13,
         
-        self.__liters_per_minute = None
+        VolumeFlowUnits.LiterPerMinute: 14,
         
-        self.__liters_per_hour = None
+        VolumeFlowUnits.LiterPerHour: 15,
         
-        self.__liters_per_day = None
+        VolumeFlowUnits.LiterPerDay: 16,
         
-        self.__us_gallons_per_second = None
+        VolumeFlowUnits.UsGallonPerSecond: 17,
         
-        self.__us_gallons_per_minute = None
+        VolumeFlowUnits.UsGallonPerMinute: 18,
         
-        self.__uk_gallons_per_day = None
+        VolumeFlowUnits.UkGallonPerDay: 19,
         
-        self.__uk_gallons_per_hour = None
+        VolumeFlowUnits.UkGallonPerHour: 20,
         
-        self.__uk_gallons_per_minute = None
+        VolumeFlowUnits.UkGallonPerMinute: 21,
         
-        self.__uk_gallons_per_second = None
+        VolumeFlowUnits.UkGallonPerSecond: 22,
         
-        self.__kilous_gallons_per_minute = None
+        VolumeFlowUnits.KilousGallonPerMinute: 23,
         
-        self.__us_gallons_per_hour = None
+        VolumeFlowUnits.UsGallonPerHour: 24,
         
-        self.__cubic_decimeters_per_minute = None
+        VolumeFlowUnits.CubicDecimeterPerMinute: 25,
         
-        self.__oil_barrels_per_day = None
+        VolumeFlowUnits.OilBarrelPerDay: 26,
         
-        self.__oil_barrels_per_minute = None
+        VolumeFlowUnits.OilBarrelPerMinute: 27,
         
-        self.__oil_barrels_per_hour = None
+        VolumeFlowUnits.OilBarrelPerHour: 28,
         
-        self.__oil_barrels_per_second = None
+        VolumeFlowUnits.OilBarrelPerSecond: 29,
         
-        self.__cubic_millimeters_per_second = None
+        VolumeFlowUnits.CubicMillimeterPerSecond: 30,
         
-        self.__acre_feet_per_second = None
+        VolumeFlowUnits.AcreFootPerSecond: 31,
         
-        self.__acre_feet_per_minute = None
+        VolumeFlowUnits.AcreFootPerMinute: 32,
         
-        self.__acre_feet_per_hour = None
+        VolumeFlowUnits.AcreFootPerHour: 33,
         
-        self.__acre_feet_per_day = None
+        VolumeFlowUnits.AcreFootPerDay: 34,
         
-        self.__cubic_centimeters_per_minute = None
+        VolumeFlowUnits.CubicCentimeterPerMinute: 35,
         
-        self.__megaus_gallons_per_day = None
+        VolumeFlowUnits.MegausGallonPerDay: 36,
         
-        self.__nanoliters_per_second = None
+        VolumeFlowUnits.NanoliterPerSecond: 37,
         
-        self.__microliters_per_second = None
+        VolumeFlowUnits.MicroliterPerSecond: 38,
         
-        self.__milliliters_per_second = None
+        VolumeFlowUnits.MilliliterPerSecond: 39,
         
-        self.__centiliters_per_second = None
+        VolumeFlowUnits.CentiliterPerSecond: 40,
         
-        self.__deciliters_per_second = None
+        VolumeFlowUnits.DeciliterPerSecond: 41,
         
-        self.__kiloliters_per_second = None
+        VolumeFlowUnits.KiloliterPerSecond: 42,
         
-        self.__megaliters_per_second = None
+        VolumeFlowUnits.MegaliterPerSecond: 43,
         
-        self.__nanoliters_per_minute = None
+        VolumeFlowUnits.NanoliterPerMinute: 44,
         
-        self.__microliters_per_minute = None
+        VolumeFlowUnits.MicroliterPerMinute: 45,
         
-        self.__milliliters_per_minute = None
+        VolumeFlowUnits.MilliliterPerMinute: 46,
         
-        self.__centiliters_per_minute = None
+        VolumeFlowUnits.CentiliterPerMinute: 47,
         
-        self.__deciliters_per_minute = None
+        VolumeFlowUnits.DeciliterPerMinute: 48,
         
-        self.__kiloliters_per_minute = None
+        VolumeFlowUnits.KiloliterPerMinute: 49,
         
-        self.__megaliters_per_minute = None
+        VolumeFlowUnits.MegaliterPerMinute: 50,
         
-        self.__nanoliters_per_hour = None
+        VolumeFlowUnits.NanoliterPerHour: 51,
         
-        self.__microliters_per_hour = None
+        VolumeFlowUnits.MicroliterPerHour: 52,
         
-        self.__milliliters_per_hour = None
+        VolumeFlowUnits.MilliliterPerHour: 53,
         
-        self.__centiliters_per_hour = None
+        VolumeFlowUnits.CentiliterPerHour: 54,
         
-        self.__deciliters_per_hour = None
+        VolumeFlowUnits.DeciliterPerHour: 55,
         
-        self.__kiloliters_per_hour = None
+        VolumeFlowUnits.KiloliterPerHour: 56,
         
-        self.__megaliters_per_hour = None
+        VolumeFlowUnits.MegaliterPerHour: 57,
         
-        self.__nanoliters_per_day = None
+        VolumeFlowUnits.NanoliterPerDay: 58,
         
-        self.__microliters_per_day = None
+        VolumeFlowUnits.MicroliterPerDay: 59,
         
-        self.__milliliters_per_day = None
+        VolumeFlowUnits.MilliliterPerDay: 60,
         
-        self.__centiliters_per_day = None
+        VolumeFlowUnits.CentiliterPerDay: 61,
         
-        self.__deciliters_per_day = None
+        VolumeFlowUnits.DeciliterPerDay: 62,
         
-        self.__kiloliters_per_day = None
+        VolumeFlowUnits.KiloliterPerDay: 63,
         
-        self.__megaliters_per_day = None
+        VolumeFlowUnits.MegaliterPerDay: 64,
         
-        self.__megauk_gallons_per_day = None
+        VolumeFlowUnits.MegaukGallonPerDay: 65,
         
-        self.__megauk_gallons_per_second = None
+        VolumeFlowUnits.MegaukGallonPerSecond: 66,
         
+    }
 
-    def convert(self, unit: VolumeFlowUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        VolumeFlowUnits.CubicMeterPerSecond: lambda value: (value),
+        
+        VolumeFlowUnits.CubicMeterPerMinute: lambda value: (value * 60),
+        
+        VolumeFlowUnits.CubicMeterPerHour: lambda value: (value * 3600),
+        
+        VolumeFlowUnits.CubicMeterPerDay: lambda value: (value * 86400),
+        
+        VolumeFlowUnits.CubicFootPerSecond: lambda value: (value * 35.314666721),
+        
+        VolumeFlowUnits.CubicFootPerMinute: lambda value: (value * 2118.88000326),
+        
+        VolumeFlowUnits.CubicFootPerHour: lambda value: (value / 7.8657907199999087346816086183876e-6),
+        
+        VolumeFlowUnits.CubicYardPerSecond: lambda value: (value / 0.764554857984),
+        
+        VolumeFlowUnits.CubicYardPerMinute: lambda value: (value / 0.0127425809664),
+        
+        VolumeFlowUnits.CubicYardPerHour: lambda value: (value / 2.1237634944e-4),
+        
+        VolumeFlowUnits.CubicYardPerDay: lambda value: (value * 113007),
+        
+        VolumeFlowUnits.MillionUsGallonPerDay: lambda value: (value * 22.824465227),
+        
+        VolumeFlowUnits.UsGallonPerDay: lambda value: (value * 22824465.227),
+        
+        VolumeFlowUnits.LiterPerSecond: lambda value: (value * 1000),
+        
+        VolumeFlowUnits.LiterPerMinute: lambda value: (value * 60000.00000),
+        
+        VolumeFlowUnits.LiterPerHour: lambda value: (value * 3600000.000),
+        
+        VolumeFlowUnits.LiterPerDay: lambda value: (value * 86400000),
+        
+        VolumeFlowUnits.UsGallonPerSecond: lambda value: (value * 264.1720523581484),
+        
+        VolumeFlowUnits.UsGallonPerMinute: lambda value: (value * 15850.323141489),
+        
+        VolumeFlowUnits.UkGallonPerDay: lambda value: (value * 19005304),
+        
+        VolumeFlowUnits.UkGallonPerHour: lambda value: (value * 791887.667),
+        
+        VolumeFlowUnits.UkGallonPerMinute: lambda value: (value * 13198.2),
+        
+        VolumeFlowUnits.UkGallonPerSecond: lambda value: (value * 219.969),
+        
+        VolumeFlowUnits.KilousGallonPerMinute: lambda value: (value * 15.850323141489),
+        
+        VolumeFlowUnits.UsGallonPerHour: lambda value: (value * 951019.38848933424),
+        
+        VolumeFlowUnits.CubicDecimeterPerMinute: lambda value: (value * 60000.00000),
+        
+        VolumeFlowUnits.OilBarrelPerDay: lambda value: (value / 1.8401307283333333333333333333333e-6),
+        
+        VolumeFlowUnits.OilBarrelPerMinute: lambda value: (value / 2.64978825e-3),
+        
+        VolumeFlowUnits.OilBarrelPerHour: lambda value: (value / 4.41631375e-5),
+        
+        VolumeFlowUnits.OilBarrelPerSecond: lambda value: (value * 6.28981),
+        
+        VolumeFlowUnits.CubicMillimeterPerSecond: lambda value: (value / 1e-9),
+        
+        VolumeFlowUnits.AcreFootPerSecond: lambda value: (value * 0.000810713194),
+        
+        VolumeFlowUnits.AcreFootPerMinute: lambda value: (value * 0.0486427916),
+        
+        VolumeFlowUnits.AcreFootPerHour: lambda value: (value * 2.91857),
+        
+        VolumeFlowUnits.AcreFootPerDay: lambda value: (value * 70.0457),
+        
+        VolumeFlowUnits.CubicCentimeterPerMinute: lambda value: (value / 1.6666666666667e-8),
+        
+        VolumeFlowUnits.MegausGallonPerDay: lambda value: ((value * 22824465.227) / 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerSecond: lambda value: ((value * 1000) / 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerSecond: lambda value: ((value * 1000) / 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerSecond: lambda value: ((value * 1000) / 0.001),
+        
+        VolumeFlowUnits.CentiliterPerSecond: lambda value: ((value * 1000) / 0.01),
+        
+        VolumeFlowUnits.DeciliterPerSecond: lambda value: ((value * 1000) / 0.1),
+        
+        VolumeFlowUnits.KiloliterPerSecond: lambda value: ((value * 1000) / 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerSecond: lambda value: ((value * 1000) / 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerMinute: lambda value: ((value * 60000.00000) / 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerMinute: lambda value: ((value * 60000.00000) / 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerMinute: lambda value: ((value * 60000.00000) / 0.001),
+        
+        VolumeFlowUnits.CentiliterPerMinute: lambda value: ((value * 60000.00000) / 0.01),
+        
+        VolumeFlowUnits.DeciliterPerMinute: lambda value: ((value * 60000.00000) / 0.1),
+        
+        VolumeFlowUnits.KiloliterPerMinute: lambda value: ((value * 60000.00000) / 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerMinute: lambda value: ((value * 60000.00000) / 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerHour: lambda value: ((value * 3600000.000) / 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerHour: lambda value: ((value * 3600000.000) / 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerHour: lambda value: ((value * 3600000.000) / 0.001),
+        
+        VolumeFlowUnits.CentiliterPerHour: lambda value: ((value * 3600000.000) / 0.01),
+        
+        VolumeFlowUnits.DeciliterPerHour: lambda value: ((value * 3600000.000) / 0.1),
+        
+        VolumeFlowUnits.KiloliterPerHour: lambda value: ((value * 3600000.000) / 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerHour: lambda value: ((value * 3600000.000) / 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerDay: lambda value: ((value * 86400000) / 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerDay: lambda value: ((value * 86400000) / 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerDay: lambda value: ((value * 86400000) / 0.001),
+        
+        VolumeFlowUnits.CentiliterPerDay: lambda value: ((value * 86400000) / 0.01),
+        
+        VolumeFlowUnits.DeciliterPerDay: lambda value: ((value * 86400000) / 0.1),
+        
+        VolumeFlowUnits.KiloliterPerDay: lambda value: ((value * 86400000) / 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerDay: lambda value: ((value * 86400000) / 1000000.0),
+        
+        VolumeFlowUnits.MegaukGallonPerDay: lambda value: ((value * 19005304) / 1000000.0),
+        
+        VolumeFlowUnits.MegaukGallonPerSecond: lambda value: ((value * 219.969) / 1000000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: VolumeFlowUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        VolumeFlowUnits.CubicMeterPerSecond: lambda value: (value),
+        
+        VolumeFlowUnits.CubicMeterPerMinute: lambda value: (value / 60),
+        
+        VolumeFlowUnits.CubicMeterPerHour: lambda value: (value / 3600),
+        
+        VolumeFlowUnits.CubicMeterPerDay: lambda value: (value / 86400),
+        
+        VolumeFlowUnits.CubicFootPerSecond: lambda value: (value / 35.314666721),
+        
+        VolumeFlowUnits.CubicFootPerMinute: lambda value: (value / 2118.88000326),
+        
+        VolumeFlowUnits.CubicFootPerHour: lambda value: (value * 7.8657907199999087346816086183876e-6),
+        
+        VolumeFlowUnits.CubicYardPerSecond: lambda value: (value * 0.764554857984),
+        
+        VolumeFlowUnits.CubicYardPerMinute: lambda value: (value * 0.0127425809664),
+        
+        VolumeFlowUnits.CubicYardPerHour: lambda value: (value * 2.1237634944e-4),
+        
+        VolumeFlowUnits.CubicYardPerDay: lambda value: (value / 113007),
+        
+        VolumeFlowUnits.MillionUsGallonPerDay: lambda value: (value / 22.824465227),
+        
+        VolumeFlowUnits.UsGallonPerDay: lambda value: (value / 22824465.227),
+        
+        VolumeFlowUnits.LiterPerSecond: lambda value: (value / 1000),
+        
+        VolumeFlowUnits.LiterPerMinute: lambda value: (value / 60000.00000),
+        
+        VolumeFlowUnits.LiterPerHour: lambda value: (value / 3600000.000),
+        
+        VolumeFlowUnits.LiterPerDay: lambda value: (value / 86400000),
+        
+        VolumeFlowUnits.UsGallonPerSecond: lambda value: (value / 264.1720523581484),
+        
+        VolumeFlowUnits.UsGallonPerMinute: lambda value: (value / 15850.323141489),
+        
+        VolumeFlowUnits.UkGallonPerDay: lambda value: (value / 19005304),
+        
+        VolumeFlowUnits.UkGallonPerHour: lambda value: (value / 791887.667),
+        
+        VolumeFlowUnits.UkGallonPerMinute: lambda value: (value / 13198.2),
+        
+        VolumeFlowUnits.UkGallonPerSecond: lambda value: (value / 219.969),
+        
+        VolumeFlowUnits.KilousGallonPerMinute: lambda value: (value / 15.850323141489),
+        
+        VolumeFlowUnits.UsGallonPerHour: lambda value: (value / 951019.38848933424),
+        
+        VolumeFlowUnits.CubicDecimeterPerMinute: lambda value: (value / 60000.00000),
+        
+        VolumeFlowUnits.OilBarrelPerDay: lambda value: (value * 1.8401307283333333333333333333333e-6),
+        
+        VolumeFlowUnits.OilBarrelPerMinute: lambda value: (value * 2.64978825e-3),
+        
+        VolumeFlowUnits.OilBarrelPerHour: lambda value: (value * 4.41631375e-5),
+        
+        VolumeFlowUnits.OilBarrelPerSecond: lambda value: (value / 6.28981),
+        
+        VolumeFlowUnits.CubicMillimeterPerSecond: lambda value: (value * 1e-9),
+        
+        VolumeFlowUnits.AcreFootPerSecond: lambda value: (value / 0.000810713194),
+        
+        VolumeFlowUnits.AcreFootPerMinute: lambda value: (value / 0.0486427916),
+        
+        VolumeFlowUnits.AcreFootPerHour: lambda value: (value / 2.91857),
+        
+        VolumeFlowUnits.AcreFootPerDay: lambda value: (value / 70.0457),
+        
+        VolumeFlowUnits.CubicCentimeterPerMinute: lambda value: (value * 1.6666666666667e-8),
+        
+        VolumeFlowUnits.MegausGallonPerDay: lambda value: ((value / 22824465.227) * 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerSecond: lambda value: ((value / 1000) * 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerSecond: lambda value: ((value / 1000) * 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerSecond: lambda value: ((value / 1000) * 0.001),
+        
+        VolumeFlowUnits.CentiliterPerSecond: lambda value: ((value / 1000) * 0.01),
+        
+        VolumeFlowUnits.DeciliterPerSecond: lambda value: ((value / 1000) * 0.1),
+        
+        VolumeFlowUnits.KiloliterPerSecond: lambda value: ((value / 1000) * 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerSecond: lambda value: ((value / 1000) * 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerMinute: lambda value: ((value / 60000.00000) * 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerMinute: lambda value: ((value / 60000.00000) * 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerMinute: lambda value: ((value / 60000.00000) * 0.001),
+        
+        VolumeFlowUnits.CentiliterPerMinute: lambda value: ((value / 60000.00000) * 0.01),
+        
+        VolumeFlowUnits.DeciliterPerMinute: lambda value: ((value / 60000.00000) * 0.1),
+        
+        VolumeFlowUnits.KiloliterPerMinute: lambda value: ((value / 60000.00000) * 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerMinute: lambda value: ((value / 60000.00000) * 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerHour: lambda value: ((value / 3600000.000) * 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerHour: lambda value: ((value / 3600000.000) * 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerHour: lambda value: ((value / 3600000.000) * 0.001),
+        
+        VolumeFlowUnits.CentiliterPerHour: lambda value: ((value / 3600000.000) * 0.01),
+        
+        VolumeFlowUnits.DeciliterPerHour: lambda value: ((value / 3600000.000) * 0.1),
+        
+        VolumeFlowUnits.KiloliterPerHour: lambda value: ((value / 3600000.000) * 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerHour: lambda value: ((value / 3600000.000) * 1000000.0),
+        
+        VolumeFlowUnits.NanoliterPerDay: lambda value: ((value / 86400000) * 1e-09),
+        
+        VolumeFlowUnits.MicroliterPerDay: lambda value: ((value / 86400000) * 1e-06),
+        
+        VolumeFlowUnits.MilliliterPerDay: lambda value: ((value / 86400000) * 0.001),
+        
+        VolumeFlowUnits.CentiliterPerDay: lambda value: ((value / 86400000) * 0.01),
+        
+        VolumeFlowUnits.DeciliterPerDay: lambda value: ((value / 86400000) * 0.1),
+        
+        VolumeFlowUnits.KiloliterPerDay: lambda value: ((value / 86400000) * 1000.0),
+        
+        VolumeFlowUnits.MegaliterPerDay: lambda value: ((value / 86400000) * 1000000.0),
+        
+        VolumeFlowUnits.MegaukGallonPerDay: lambda value: ((value / 19005304) * 1000000.0),
+        
+        VolumeFlowUnits.MegaukGallonPerSecond: lambda value: ((value / 219.969) * 1000000.0),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
         
-        if from_unit == VolumeFlowUnits.CubicMeterPerSecond:
-            return (value)
+        VolumeFlowUnits.CubicMeterPerSecond: ('1', '0'),
         
-        if from_unit == VolumeFlowUnits.CubicMeterPerMinute:
-            return (value * 60)
+        VolumeFlowUnits.CubicMeterPerMinute: ('60', '0'),
         
-        if from_unit == VolumeFlowUnits.CubicMeterPerHour:
-            return (value * 3600)
+        VolumeFlowUnits.CubicMeterPerHour: ('3600', '0'),
         
-        if from_unit == VolumeFlowUnits.CubicMeterPerDay:
-            return (value * 86400)
+        VolumeFlowUnits.CubicMeterPerDay: ('86400', '0'),
         
-        if from_unit == VolumeFlowUnits.CubicFootPerSecond:
-            return (value * 35.314666721)
+        VolumeFlowUnits.CubicFootPerSecond: ('35314666721/1000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.CubicFootPerMinute:
-            return (value * 2118.88000326)
+        VolumeFlowUnits.CubicFootPerMinute: ('105944000163/50000000', '0'),
         
-        if from_unit == VolumeFlowUnits.CubicFootPerHour:
-            return (value / 7.8657907199999087346816086183876e-6)
+        VolumeFlowUnits.CubicFootPerHour: ('2500000000000000000000000000000000000/19664476799999771836704021545969', '0'),
         
-        if from_unit == VolumeFlowUnits.CubicYardPerSecond:
-            return (value / 0.764554857984)
+        VolumeFlowUnits.CubicYardPerSecond: ('1953125000/1493271207', '0'),
         
-        if from_unit == VolumeFlowUnits.CubicYardPerMinute:
-            return (value / 0.0127425809664)
+        VolumeFlowUnits.CubicYardPerMinute: ('39062500000/497757069', '0'),
         
-        if from_unit == VolumeFlowUnits.CubicYardPerHour:
-            return (value / 2.1237634944e-4)
+        VolumeFlowUnits.CubicYardPerHour: ('781250000000/165919023', '0'),
         
-        if from_unit == VolumeFlowUnits.CubicYardPerDay:
-            return (value * 113007)
+        VolumeFlowUnits.CubicYardPerDay: ('113007', '0'),
         
-        if from_unit == VolumeFlowUnits.MillionUsGallonPerDay:
-            return (value * 22.824465227)
+        VolumeFlowUnits.MillionUsGallonPerDay: ('22824465227/1000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.UsGallonPerDay:
-            return (value * 22824465.227)
+        VolumeFlowUnits.UsGallonPerDay: ('22824465227/1000', '0'),
         
-        if from_unit == VolumeFlowUnits.LiterPerSecond:
-            return (value * 1000)
+        VolumeFlowUnits.LiterPerSecond: ('1000', '0'),
         
-        if from_unit == VolumeFlowUnits.LiterPerMinute:
-            return (value * 60000.00000)
+        VolumeFlowUnits.LiterPerMinute: ('60000', '0'),
         
-        if from_unit == VolumeFlowUnits.LiterPerHour:
-            return (value * 3600000.000)
+        VolumeFlowUnits.LiterPerHour: ('3600000', '0'),
         
-        if from_unit == VolumeFlowUnits.LiterPerDay:
-            return (value * 86400000)
+        VolumeFlowUnits.LiterPerDay: ('86400000', '0'),
         
-        if from_unit == VolumeFlowUnits.UsGallonPerSecond:
-            return (value * 264.1720523581484)
+        VolumeFlowUnits.UsGallonPerSecond: ('660430130895371/2500000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.UsGallonPerMinute:
-            return (value * 15850.323141489)
+        VolumeFlowUnits.UsGallonPerMinute: ('15850323141489/1000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.UkGallonPerDay:
-            return (value * 19005304)
+        VolumeFlowUnits.UkGallonPerDay: ('19005304', '0'),
         
-        if from_unit == VolumeFlowUnits.UkGallonPerHour:
-            return (value * 791887.667)
+        VolumeFlowUnits.UkGallonPerHour: ('791887667/1000', '0'),
         
-        if from_unit == VolumeFlowUnits.UkGallonPerMinute:
-            return (value * 13198.2)
+        VolumeFlowUnits.UkGallonPerMinute: ('65991/5', '0'),
         
-        if from_unit == VolumeFlowUnits.UkGallonPerSecond:
-            return (value * 219.969)
+        VolumeFlowUnits.UkGallonPerSecond: ('219969/1000', '0'),
         
-        if from_unit == VolumeFlowUnits.KilousGallonPerMinute:
-            return (value * 15.850323141489)
+        VolumeFlowUnits.KilousGallonPerMinute: ('15850323141489/1000000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.UsGallonPerHour:
-            return (value * 951019.38848933424)
+        VolumeFlowUnits.UsGallonPerHour: ('5943871178058339/6250000000', '0'),
         
-        if from_unit == VolumeFlowUnits.CubicDecimeterPerMinute:
-            return (value * 60000.00000)
+        VolumeFlowUnits.CubicDecimeterPerMinute: ('60000', '0'),
         
-        if from_unit == VolumeFlowUnits.OilBarrelPerDay:
-            return (value / 1.8401307283333333333333333333333e-6)
+        VolumeFlowUnits.OilBarrelPerDay: ('10000000000000000000000000000000000000/18401307283333333333333333333333', '0'),
         
-        if from_unit == VolumeFlowUnits.OilBarrelPerMinute:
-            return (value / 2.64978825e-3)
+        VolumeFlowUnits.OilBarrelPerMinute: ('4000000000/10599153', '0'),
         
-        if from_unit == VolumeFlowUnits.OilBarrelPerHour:
-            return (value / 4.41631375e-5)
+        VolumeFlowUnits.OilBarrelPerHour: ('80000000000/3533051', '0'),
         
-        if from_unit == VolumeFlowUnits.OilBarrelPerSecond:
-            return (value * 6.28981)
+        VolumeFlowUnits.OilBarrelPerSecond: ('628981/100000', '0'),
         
-        if from_unit == VolumeFlowUnits.CubicMillimeterPerSecond:
-            return (value / 1e-9)
+        VolumeFlowUnits.CubicMillimeterPerSecond: ('1000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.AcreFootPerSecond:
-            return (value * 0.000810713194)
+        VolumeFlowUnits.AcreFootPerSecond: ('405356597/500000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.AcreFootPerMinute:
-            return (value * 0.0486427916)
+        VolumeFlowUnits.AcreFootPerMinute: ('121606979/2500000000', '0'),
         
-        if from_unit == VolumeFlowUnits.AcreFootPerHour:
-            return (value * 2.91857)
+        VolumeFlowUnits.AcreFootPerHour: ('291857/100000', '0'),
         
-        if from_unit == VolumeFlowUnits.AcreFootPerDay:
-            return (value * 70.0457)
+        VolumeFlowUnits.AcreFootPerDay: ('700457/10000', '0'),
         
-        if from_unit == VolumeFlowUnits.CubicCentimeterPerMinute:
-            return (value / 1.6666666666667e-8)
+        VolumeFlowUnits.CubicCentimeterPerMinute: ('1000000000000000000000/16666666666667', '0'),
         
-        if from_unit == VolumeFlowUnits.MegausGallonPerDay:
-            return ((value * 22824465.227) / 1000000.0)
+        VolumeFlowUnits.MegausGallonPerDay: ('22824465227/1000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.NanoliterPerSecond:
-            return ((value * 1000) / 1e-09)
+        VolumeFlowUnits.NanoliterPerSecond: ('1000000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.MicroliterPerSecond:
-            return ((value * 1000) / 1e-06)
+        VolumeFlowUnits.MicroliterPerSecond: ('1000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.MilliliterPerSecond:
-            return ((value * 1000) / 0.001)
+        VolumeFlowUnits.MilliliterPerSecond: ('1000000', '0'),
         
-        if from_unit == VolumeFlowUnits.CentiliterPerSecond:
-            return ((value * 1000) / 0.01)
+        VolumeFlowUnits.CentiliterPerSecond: ('100000', '0'),
         
-        if from_unit == VolumeFlowUnits.DeciliterPerSecond:
-            return ((value * 1000) / 0.1)
+        VolumeFlowUnits.DeciliterPerSecond: ('10000', '0'),
         
-        if from_unit == VolumeFlowUnits.KiloliterPerSecond:
-            return ((value * 1000) / 1000.0)
+        VolumeFlowUnits.KiloliterPerSecond: ('1', '0'),
         
-        if from_unit == VolumeFlowUnits.MegaliterPerSecond:
-            return ((value * 1000) / 1000000.0)
+        VolumeFlowUnits.MegaliterPerSecond: ('1/1000', '0'),
         
-        if from_unit == VolumeFlowUnits.NanoliterPerMinute:
-            return ((value * 60000.00000) / 1e-09)
+        VolumeFlowUnits.NanoliterPerMinute: ('60000000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.MicroliterPerMinute:
-            return ((value * 60000.00000) / 1e-06)
+        VolumeFlowUnits.MicroliterPerMinute: ('60000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.MilliliterPerMinute:
-            return ((value * 60000.00000) / 0.001)
+        VolumeFlowUnits.MilliliterPerMinute: ('60000000', '0'),
         
-        if from_unit == VolumeFlowUnits.CentiliterPerMinute:
-            return ((value * 60000.00000) / 0.01)
+        VolumeFlowUnits.CentiliterPerMinute: ('6000000', '0'),
         
-        if from_unit == VolumeFlowUnits.DeciliterPerMinute:
-            return ((value * 60000.00000) / 0.1)
+        VolumeFlowUnits.DeciliterPerMinute: ('600000', '0'),
         
-        if from_unit == VolumeFlowUnits.KiloliterPerMinute:
-            return ((value * 60000.00000) / 1000.0)
+        VolumeFlowUnits.KiloliterPerMinute: ('60', '0'),
         
-        if from_unit == VolumeFlowUnits.MegaliterPerMinute:
-            return ((value * 60000.00000) / 1000000.0)
+        VolumeFlowUnits.MegaliterPerMinute: ('3/50', '0'),
         
-        if from_unit == VolumeFlowUnits.NanoliterPerHour:
-            return ((value * 3600000.000) / 1e-09)
+        VolumeFlowUnits.NanoliterPerHour: ('3600000000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.MicroliterPerHour:
-            return ((value * 3600000.000) / 1e-06)
+        VolumeFlowUnits.MicroliterPerHour: ('3600000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.MilliliterPerHour:
-            return ((value * 3600000.000) / 0.001)
+        VolumeFlowUnits.MilliliterPerHour: ('3600000000', '0'),
         
-        if from_unit == VolumeFlowUnits.CentiliterPerHour:
-            return ((value * 3600000.000) / 0.01)
+        VolumeFlowUnits.CentiliterPerHour: ('360000000', '0'),
         
-        if from_unit == VolumeFlowUnits.DeciliterPerHour:
-            return ((value * 3600000.000) / 0.1)
+        VolumeFlowUnits.DeciliterPerHour: ('36000000', '0'),
         
-        if from_unit == VolumeFlowUnits.KiloliterPerHour:
-            return ((value * 3600000.000) / 1000.0)
+        VolumeFlowUnits.KiloliterPerHour: ('3600', '0'),
         
-        if from_unit == VolumeFlowUnits.MegaliterPerHour:
-            return ((value * 3600000.000) / 1000000.0)
+        VolumeFlowUnits.MegaliterPerHour: ('18/5', '0'),
         
-        if from_unit == VolumeFlowUnits.NanoliterPerDay:
-            return ((value * 86400000) / 1e-09)
+        VolumeFlowUnits.NanoliterPerDay: ('86400000000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.MicroliterPerDay:
-            return ((value * 86400000) / 1e-06)
+        VolumeFlowUnits.MicroliterPerDay: ('86400000000000', '0'),
         
-        if from_unit == VolumeFlowUnits.MilliliterPerDay:
-            return ((value * 86400000) / 0.001)
+        VolumeFlowUnits.MilliliterPerDay: ('86400000000', '0'),
         
-        if from_unit == VolumeFlowUnits.CentiliterPerDay:
-            return ((value * 86400000) / 0.01)
+        VolumeFlowUnits.CentiliterPerDay: ('8640000000', '0'),
         
-        if from_unit == VolumeFlowUnits.DeciliterPerDay:
-            return ((value * 86400000) / 0.1)
+        VolumeFlowUnits.DeciliterPerDay: ('864000000', '0'),
         
-        if from_unit == VolumeFlowUnits.KiloliterPerDay:
-            return ((value * 86400000) / 1000.0)
+        VolumeFlowUnits.KiloliterPerDay: ('86400', '0'),
         
-        if from_unit == VolumeFlowUnits.MegaliterPerDay:
-            return ((value * 86400000) / 1000000.0)
+        VolumeFlowUnits.MegaliterPerDay: ('432/5', '0'),
         
-        if from_unit == VolumeFlowUnits.MegaukGallonPerDay:
-            return ((value * 19005304) / 1000000.0)
+        VolumeFlowUnits.MegaukGallonPerDay: ('2375663/125000', '0'),
         
-        if from_unit == VolumeFlowUnits.MegaukGallonPerSecond:
-            return ((value * 219.969) / 1000000.0)
+        VolumeFlowUnits.MegaukGallonPerSecond: ('219969/1000000000', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        VolumeFlowUnits.CubicMeterPerSecond: ('1', '0'),
+        
+        VolumeFlowUnits.CubicMeterPerMinute: ('1/60', '0'),
+        
+        VolumeFlowUnits.CubicMeterPerHour: ('1/3600', '0'),
+        
+        VolumeFlowUnits.CubicMeterPerDay: ('1/86400', '0'),
+        
+        VolumeFlowUnits.CubicFootPerSecond: ('1000000000/35314666721', '0'),
+        
+        VolumeFlowUnits.CubicFootPerMinute: ('50000000/105944000163', '0'),
+        
+        VolumeFlowUnits.CubicFootPerHour: ('19664476799999771836704021545969/2500000000000000000000000000000000000', '0'),
+        
+        VolumeFlowUnits.CubicYardPerSecond: ('1493271207/1953125000', '0'),
+        
+        VolumeFlowUnits.CubicYardPerMinute: ('497757069/39062500000', '0'),
+        
+        VolumeFlowUnits.CubicYardPerHour: ('165919023/781250000000', '0'),
+        
+        VolumeFlowUnits.CubicYardPerDay: ('1/113007', '0'),
+        
+        VolumeFlowUnits.MillionUsGallonPerDay: ('1000000000/22824465227', '0'),
+        
+        VolumeFlowUnits.UsGallonPerDay: ('1000/22824465227', '0'),
+        
+        VolumeFlowUnits.LiterPerSecond: ('1/1000', '0'),
+        
+        VolumeFlowUnits.LiterPerMinute: ('1/60000', '0'),
+        
+        VolumeFlowUnits.LiterPerHour: ('1/3600000', '0'),
+        
+        VolumeFlowUnits.LiterPerDay: ('1/86400000', '0'),
+        
+        VolumeFlowUnits.UsGallonPerSecond: ('2500000000000/660430130895371', '0'),
+        
+        VolumeFlowUnits.UsGallonPerMinute: ('1000000000/15850323141489', '0'),
+        
+        VolumeFlowUnits.UkGallonPerDay: ('1/19005304', '0'),
+        
+        VolumeFlowUnits.UkGallonPerHour: ('1000/791887667', '0'),
+        
+        VolumeFlowUnits.UkGallonPerMinute: ('5/65991', '0'),
+        
+        VolumeFlowUnits.UkGallonPerSecond: ('1000/219969', '0'),
+        
+        VolumeFlowUnits.KilousGallonPerMinute: ('1000000000000/15850323141489', '0'),
+        
+        VolumeFlowUnits.UsGallonPerHour: ('6250000000/5943871178058339', '0'),
+        
+        VolumeFlowUnits.CubicDecimeterPerMinute: ('1/60000', '0'),
+        
+        VolumeFlowUnits.OilBarrelPerDay: ('18401307283333333333333333333333/10000000000000000000000000000000000000', '0'),
+        
+        VolumeFlowUnits.OilBarrelPerMinute: ('10599153/4000000000', '0'),
+        
+        VolumeFlowUnits.OilBarrelPerHour: ('3533051/80000000000', '0'),
+        
+        VolumeFlowUnits.OilBarrelPerSecond: ('100000/628981', '0'),
+        
+        VolumeFlowUnits.CubicMillimeterPerSecond: ('1/1000000000', '0'),
+        
+        VolumeFlowUnits.AcreFootPerSecond: ('500000000000/405356597', '0'),
+        
+        VolumeFlowUnits.AcreFootPerMinute: ('2500000000/121606979', '0'),
+        
+        VolumeFlowUnits.AcreFootPerHour: ('100000/291857', '0'),
+        
+        VolumeFlowUnits.AcreFootPerDay: ('10000/700457', '0'),
+        
+        VolumeFlowUnits.CubicCentimeterPerMinute: ('16666666666667/1000000000000000000000', '0'),
+        
+        VolumeFlowUnits.MegausGallonPerDay: ('1000000000/22824465227', '0'),
+        
+        VolumeFlowUnits.NanoliterPerSecond: ('1/1000000000000', '0'),
+        
+        VolumeFlowUnits.MicroliterPerSecond: ('1/1000000000', '0'),
+        
+        VolumeFlowUnits.MilliliterPerSecond: ('1/1000000', '0'),
+        
+        VolumeFlowUnits.CentiliterPerSecond: ('1/100000', '0'),
+        
+        VolumeFlowUnits.DeciliterPerSecond: ('1/10000', '0'),
+        
+        VolumeFlowUnits.KiloliterPerSecond: ('1', '0'),
+        
+        VolumeFlowUnits.MegaliterPerSecond: ('1000', '0'),
+        
+        VolumeFlowUnits.NanoliterPerMinute: ('1/60000000000000', '0'),
+        
+        VolumeFlowUnits.MicroliterPerMinute: ('1/60000000000', '0'),
+        
+        VolumeFlowUnits.MilliliterPerMinute: ('1/60000000', '0'),
+        
+        VolumeFlowUnits.CentiliterPerMinute: ('1/6000000', '0'),
+        
+        VolumeFlowUnits.DeciliterPerMinute: ('1/600000', '0'),
+        
+        VolumeFlowUnits.KiloliterPerMinute: ('1/60', '0'),
+        
+        VolumeFlowUnits.MegaliterPerMinute: ('50/3', '0'),
+        
+        VolumeFlowUnits.NanoliterPerHour: ('1/3600000000000000', '0'),
+        
+        VolumeFlowUnits.MicroliterPerHour: ('1/3600000000000', '0'),
+        
+        VolumeFlowUnits.MilliliterPerHour: ('1/3600000000', '0'),
+        
+        VolumeFlowUnits.CentiliterPerHour: ('1/360000000', '0'),
+        
+        VolumeFlowUnits.DeciliterPerHour: ('1/36000000', '0'),
+        
+        VolumeFlowUnits.KiloliterPerHour: ('1/3600', '0'),
+        
+        VolumeFlowUnits.MegaliterPerHour: ('5/18', '0'),
+        
+        VolumeFlowUnits.NanoliterPerDay: ('1/86400000000000000', '0'),
+        
+        VolumeFlowUnits.MicroliterPerDay: ('1/86400000000000', '0'),
+        
+        VolumeFlowUnits.MilliliterPerDay: ('1/86400000000', '0'),
+        
+        VolumeFlowUnits.CentiliterPerDay: ('1/8640000000', '0'),
+        
+        VolumeFlowUnits.DeciliterPerDay: ('1/864000000', '0'),
+        
+        VolumeFlowUnits.KiloliterPerDay: ('1/86400', '0'),
+        
+        VolumeFlowUnits.MegaliterPerDay: ('5/432', '0'),
+        
+        VolumeFlowUnits.MegaukGallonPerDay: ('125000/2375663', '0'),
+        
+        VolumeFlowUnits.MegaukGallonPerSecond: ('1000000000/219969', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: VolumeFlowUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == VolumeFlowUnits.CubicMeterPerSecond:
-            return (value)
+        VolumeFlowUnits.CubicMeterPerSecond: ('m³/s',),
         
-        if to_unit == VolumeFlowUnits.CubicMeterPerMinute:
-            return (value / 60)
+        VolumeFlowUnits.CubicMeterPerMinute: ('m³/min',),
         
-        if to_unit == VolumeFlowUnits.CubicMeterPerHour:
-            return (value / 3600)
+        VolumeFlowUnits.CubicMeterPerHour: ('m³/h',),
         
-        if to_unit == VolumeFlowUnits.CubicMeterPerDay:
-            return (value / 86400)
+        VolumeFlowUnits.CubicMeterPerDay: ('m³/d',),
         
-        if to_unit == VolumeFlowUnits.CubicFootPerSecond:
-            return (value / 35.314666721)
+        VolumeFlowUnits.CubicFootPerSecond: ('ft³/s',),
         
-        if to_unit == VolumeFlowUnits.CubicFootPerMinute:
-            return (value / 2118.88000326)
+        VolumeFlowUnits.CubicFootPerMinute: ('ft³/min',),
         
-        if to_unit == VolumeFlowUnits.CubicFootPerHour:
-            return (value * 7.8657907199999087346816086183876e-6)
+        VolumeFlowUnits.CubicFootPerHour: ('ft³/h',),
         
-        if to_unit == VolumeFlowUnits.CubicYardPerSecond:
-            return (value * 0.764554857984)
+        VolumeFlowUnits.CubicYardPerSecond: ('yd³/s',),
         
-        if to_unit == VolumeFlowUnits.CubicYardPerMinute:
-            return (value * 0.0127425809664)
+        VolumeFlowUnits.CubicYardPerMinute: ('yd³/min',),
         
-        if to_unit == VolumeFlowUnits.CubicYardPerHour:
-            return (value * 2.1237634944e-4)
+        VolumeFlowUnits.CubicYardPerHour: ('yd³/h',),
         
-        if to_unit == VolumeFlowUnits.CubicYardPerDay:
-            return (value / 113007)
+        VolumeFlowUnits.CubicYardPerDay: ('cy/day',),
         
-        if to_unit == VolumeFlowUnits.MillionUsGallonPerDay:
-            return (value / 22.824465227)
+        VolumeFlowUnits.MillionUsGallonPerDay: ('MGD',),
         
-        if to_unit == VolumeFlowUnits.UsGallonPerDay:
-            return (value / 22824465.227)
+        VolumeFlowUnits.UsGallonPerDay: ('gpd',),
         
-        if to_unit == VolumeFlowUnits.LiterPerSecond:
-            return (value / 1000)
+        VolumeFlowUnits.LiterPerSecond: ('L/s',),
         
-        if to_unit == VolumeFlowUnits.LiterPerMinute:
-            return (value / 60000.00000)
+        VolumeFlowUnits.LiterPerMinute: ('L/min',),
         
-        if to_unit == VolumeFlowUnits.LiterPerHour:
-            return (value / 3600000.000)
+        VolumeFlowUnits.LiterPerHour: ('L/h',),
         
-        if to_unit == VolumeFlowUnits.LiterPerDay:
-            return (value / 86400000)
+        VolumeFlowUnits.LiterPerDay: ('l/day',),
         
-        if to_unit == VolumeFlowUnits.UsGallonPerSecond:
-            return (value / 264.1720523581484)
+        VolumeFlowUnits.UsGallonPerSecond: ('gal (U.S.)/s',),
         
-        if to_unit == VolumeFlowUnits.UsGallonPerMinute:
-            return (value / 15850.323141489)
+        VolumeFlowUnits.UsGallonPerMinute: ('gal (U.S.)/min',),
         
-        if to_unit == VolumeFlowUnits.UkGallonPerDay:
-            return (value / 19005304)
+        VolumeFlowUnits.UkGallonPerDay: ('gal (U. K.)/d',),
         
-        if to_unit == VolumeFlowUnits.UkGallonPerHour:
-            return (value / 791887.667)
+        VolumeFlowUnits.UkGallonPerHour: ('gal (imp.)/h',),
         
-        if to_unit == VolumeFlowUnits.UkGallonPerMinute:
-            return (value / 13198.2)
+        VolumeFlowUnits.UkGallonPerMinute: ('gal (imp.)/min',),
         
-        if to_unit == VolumeFlowUnits.UkGallonPerSecond:
-            return (value / 219.969)
+        VolumeFlowUnits.UkGallonPerSecond: ('gal (imp.)/s',),
         
-        if to_unit == VolumeFlowUnits.KilousGallonPerMinute:
-            return (value / 15.850323141489)
+        VolumeFlowUnits.KilousGallonPerMinute: ('kgal (U.S.)/min',),
         
-        if to_unit == VolumeFlowUnits.UsGallonPerHour:
-            return (value / 951019.38848933424)
+        VolumeFlowUnits.UsGallonPerHour: ('gal (U.S.)/h',),
         
-        if to_unit == VolumeFlowUnits.CubicDecimeterPerMinute:
-            return (value / 60000.00000)
+        VolumeFlowUnits.CubicDecimeterPerMinute: ('dm³/min',),
         
-        if to_unit == VolumeFlowUnits.OilBarrelPerDay:
-            return (value * 1.8401307283333333333333333333333e-6)
+        VolumeFlowUnits.OilBarrelPerDay: ('bbl/d',),
         
-        if to_unit == VolumeFlowUnits.OilBarrelPerMinute:
-            return (value * 2.64978825e-3)
+        VolumeFlowUnits.OilBarrelPerMinute: ('bbl/min',),
         
-        if to_unit == VolumeFlowUnits.OilBarrelPerHour:
-            return (value * 4.41631375e-5)
+        VolumeFlowUnits.OilBarrelPerHour: ('bbl/hr',),
         
-        if to_unit == VolumeFlowUnits.OilBarrelPerSecond:
-            return (value / 6.28981)
+        VolumeFlowUnits.OilBarrelPerSecond: ('bbl/s',),
         
-        if to_unit == VolumeFlowUnits.CubicMillimeterPerSecond:
-            return (value * 1e-9)
+        VolumeFlowUnits.CubicMillimeterPerSecond: ('mm³/s',),
         
-        if to_unit == VolumeFlowUnits.AcreFootPerSecond:
-            return (value / 0.000810713194)
+        VolumeFlowUnits.AcreFootPerSecond: ('af/s',),
         
-        if to_unit == VolumeFlowUnits.AcreFootPerMinute:
-            return (value / 0.0486427916)
+        VolumeFlowUnits.AcreFootPerMinute: ('af/m',),
         
-        if to_unit == VolumeFlowUnits.AcreFootPerHour:
-            return (value / 2.91857)
+        VolumeFlowUnits.AcreFootPerHour: ('af/h',),
         
-        if to_unit == VolumeFlowUnits.AcreFootPerDay:
-            return (value / 70.0457)
+        VolumeFlowUnits.AcreFootPerDay: ('af/d',),
         
-        if to_unit == VolumeFlowUnits.CubicCentimeterPerMinute:
-            return (value * 1.6666666666667e-8)
+        VolumeFlowUnits.CubicCentimeterPerMinute: ('cm³/min',),
         
-        if to_unit == VolumeFlowUnits.MegausGallonPerDay:
-            return ((value / 22824465.227) * 1000000.0)
+        VolumeFlowUnits.MegausGallonPerDay: ('Mgpd',),
         
-        if to_unit == VolumeFlowUnits.NanoliterPerSecond:
-            return ((value / 1000) * 1e-09)
+        VolumeFlowUnits.NanoliterPerSecond: ('nL/s',),
         
-        if to_unit == VolumeFlowUnits.MicroliterPerSecond:
-            return ((value / 1000) * 1e-06)
+        VolumeFlowUnits.MicroliterPerSecond: ('μL/s',),
         
-        if to_unit == VolumeFlowUnits.MilliliterPerSecond:
-            return ((value / 1000) * 0.001)
+        VolumeFlowUnits.MilliliterPerSecond: ('mL/s',),
         
-        if to_unit == VolumeFlowUnits.CentiliterPerSecond:
-            return ((value / 1000) * 0.01)
+        VolumeFlowUnits.CentiliterPerSecond: ('cL/s',),
         
-        if to_unit == VolumeFlowUnits.DeciliterPerSecond:
-            return ((value / 1000) * 0.1)
+        VolumeFlowUnits.DeciliterPerSecond: ('dL/s',),
         
-        if to_unit == VolumeFlowUnits.KiloliterPerSecond:
-            return ((value / 1000) * 1000.0)
+        VolumeFlowUnits.KiloliterPerSecond: ('kL/s',),
         
-        if to_unit == VolumeFlowUnits.MegaliterPerSecond:
-            return ((value / 1000) * 1000000.0)
+        VolumeFlowUnits.MegaliterPerSecond: ('ML/s',),
         
-        if to_unit == VolumeFlowUnits.NanoliterPerMinute:
-            return ((value / 60000.00000) * 1e-09)
+        VolumeFlowUnits.NanoliterPerMinute: ('nL/min',),
         
-        if to_unit == VolumeFlowUnits.MicroliterPerMinute:
-            return ((value / 60000.00000) * 1e-06)
+        VolumeFlowUnits.MicroliterPerMinute: ('μL/min',),
         
-        if to_unit == VolumeFlowUnits.MilliliterPerMinute:
-            return ((value / 60000.00000) * 0.001)
+        VolumeFlowUnits.MilliliterPerMinute: ('mL/min',),
         
-        if to_unit == VolumeFlowUnits.CentiliterPerMinute:
-            return ((value / 60000.00000) * 0.01)
+        VolumeFlowUnits.CentiliterPerMinute: ('cL/min',),
         
-        if to_unit == VolumeFlowUnits.DeciliterPerMinute:
-            return ((value / 60000.00000) * 0.1)
+        VolumeFlowUnits.DeciliterPerMinute: ('dL/min',),
         
-        if to_unit == VolumeFlowUnits.KiloliterPerMinute:
-            return ((value / 60000.00000) * 1000.0)
+        VolumeFlowUnits.KiloliterPerMinute: ('kL/min',),
         
-        if to_unit == VolumeFlowUnits.MegaliterPerMinute:
-            return ((value / 60000.00000) * 1000000.0)
+        VolumeFlowUnits.MegaliterPerMinute: ('ML/min',),
         
-        if to_unit == VolumeFlowUnits.NanoliterPerHour:
-            return ((value / 3600000.000) * 1e-09)
+        VolumeFlowUnits.NanoliterPerHour: ('nL/h',),
         
-        if to_unit == VolumeFlowUnits.MicroliterPerHour:
-            return ((value / 3600000.000) * 1e-06)
+        VolumeFlowUnits.MicroliterPerHour: ('μL/h',),
         
-        if to_unit == VolumeFlowUnits.MilliliterPerHour:
-            return ((value / 3600000.000) * 0.001)
+        VolumeFlowUnits.MilliliterPerHour: ('mL/h',),
         
-        if to_unit == VolumeFlowUnits.CentiliterPerHour:
-            return ((value / 3600000.000) * 0.01)
+        VolumeFlowUnits.CentiliterPerHour: ('cL/h',),
         
-        if to_unit == VolumeFlowUnits.DeciliterPerHour:
-            return ((value / 3600000.000) * 0.1)
+        VolumeFlowUnits.DeciliterPerHour: ('dL/h',),
         
-        if to_unit == VolumeFlowUnits.KiloliterPerHour:
-            return ((value / 3600000.000) * 1000.0)
+        VolumeFlowUnits.KiloliterPerHour: ('kL/h',),
         
-        if to_unit == VolumeFlowUnits.MegaliterPerHour:
-            return ((value / 3600000.000) * 1000000.0)
+        VolumeFlowUnits.MegaliterPerHour: ('ML/h',),
         
-        if to_unit == VolumeFlowUnits.NanoliterPerDay:
-            return ((value / 86400000) * 1e-09)
+        VolumeFlowUnits.NanoliterPerDay: ('nl/day',),
         
-        if to_unit == VolumeFlowUnits.MicroliterPerDay:
-            return ((value / 86400000) * 1e-06)
+        VolumeFlowUnits.MicroliterPerDay: ('μl/day',),
         
-        if to_unit == VolumeFlowUnits.MilliliterPerDay:
-            return ((value / 86400000) * 0.001)
+        VolumeFlowUnits.MilliliterPerDay: ('ml/day',),
         
-        if to_unit == VolumeFlowUnits.CentiliterPerDay:
-            return ((value / 86400000) * 0.01)
+        VolumeFlowUnits.CentiliterPerDay: ('cl/day',),
         
-        if to_unit == VolumeFlowUnits.DeciliterPerDay:
-            return ((value / 86400000) * 0.1)
+        VolumeFlowUnits.DeciliterPerDay: ('dl/day',),
         
-        if to_unit == VolumeFlowUnits.KiloliterPerDay:
-            return ((value / 86400000) * 1000.0)
+        VolumeFlowUnits.KiloliterPerDay: ('kl/day',),
         
-        if to_unit == VolumeFlowUnits.MegaliterPerDay:
-            return ((value / 86400000) * 1000000.0)
+        VolumeFlowUnits.MegaliterPerDay: ('Ml/day',),
         
-        if to_unit == VolumeFlowUnits.MegaukGallonPerDay:
-            return ((value / 19005304) * 1000000.0)
+        VolumeFlowUnits.MegaukGallonPerDay: ('Mgal (U. K.)/d',),
         
-        if to_unit == VolumeFlowUnits.MegaukGallonPerSecond:
-            return ((value / 219.969) * 1000000.0)
+        VolumeFlowUnits.MegaukGallonPerSecond: ('Mgal (imp.)/s',),
         
-        return None
+    }
 
+    def __init__(self, value: float, from_unit: VolumeFlowUnits = VolumeFlowUnits.CubicMeterPerSecond):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: VolumeFlowUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: VolumeFlowUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: VolumeFlowUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: VolumeFlowUnits, to_unit: VolumeFlowUnits) -> float:
+        """
+        Convert a value from one VolumeFlow unit to another, without creating a VolumeFlow instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumeFlowUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: VolumeFlowUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return VolumeFlow._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: VolumeFlowUnits, to_unit: VolumeFlowUnits) -> List[float]:
+        """
+        Convert many values from one VolumeFlow unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: VolumeFlowUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: VolumeFlowUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return VolumeFlow._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: VolumeFlowUnits, to_unit: VolumeFlowUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", VolumeFlow._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: VolumeFlowUnits, to_unit: VolumeFlowUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one VolumeFlow unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumeFlowUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: VolumeFlowUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return VolumeFlow._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: VolumeFlowUnits = VolumeFlowUnits.CubicMeterPerSecond) -> VolumeFlow:
+        """
+        Create a new instance of VolumeFlow holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumeFlowUnits
+        :return: A new instance of VolumeFlow.
+        :rtype: VolumeFlow
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return VolumeFlow._from_exact(value, from_unit)
+
+    def to_exact(self, unit: VolumeFlowUnits = VolumeFlowUnits.CubicMeterPerSecond) -> Fraction:
+        """
+        Get the exact value of the VolumeFlow in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (CubicMeterPerSecond).
+        :type unit: VolumeFlowUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> VolumeFlow:
+        """
+        Parse a VolumeFlow from a value followed by a unit abbreviation, e.g. "1 m³/s".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of VolumeFlow.
+        :rtype: VolumeFlow
+        :raises ValueError: When the string is not a valid or an ambiguous VolumeFlow.
+        """
+        return VolumeFlow._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[VolumeFlow]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return VolumeFlow._try_parse(text)
+
+    def to_binary(self, unit: Optional[VolumeFlowUnits] = None) -> bytes:
+        """
+        Encode the VolumeFlow to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: VolumeFlowUnits
+        :return: The encoded VolumeFlow.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> VolumeFlow:
+        """
+        Decode a VolumeFlow encoded by to_binary.
+
+        :param data: The encoded VolumeFlow, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of VolumeFlow.
+        :rtype: VolumeFlow
+        :raises ValueError: When the data is not a valid encoded VolumeFlow.
+        """
+        return VolumeFlow._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[VolumeFlowUnits] = None) -> dict:
+        """
+        Get the VolumeFlow DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (CubicMeterPerSecond).
+        :type hold_in_unit: VolumeFlowUnits
+        :return: The VolumeFlow DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[VolumeFlowUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> VolumeFlow:
+        """
+        Create a new instance of VolumeFlow from its DTO.
+
+        :param dto: The VolumeFlow DTO, the unit is the VolumeFlowUnits value or name.
+        :type dto: dict
+        :return: A new instance of VolumeFlow.
+        :rtype: VolumeFlow
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return VolumeFlow._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> VolumeFlow:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return VolumeFlow._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -1925,10 +2411,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__cubic_meters_per_second != None:
-            return self.__cubic_meters_per_second
-        self.__cubic_meters_per_second = self.__convert_from_base(VolumeFlowUnits.CubicMeterPerSecond)
-        return self.__cubic_meters_per_second
+        return self._cached_convert(VolumeFlowUnits.CubicMeterPerSecond)
 
     
     @property
@@ -1936,10 +2419,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__cubic_meters_per_minute != None:
-            return self.__cubic_meters_per_minute
-        self.__cubic_meters_per_minute = self.__convert_from_base(VolumeFlowUnits.CubicMeterPerMinute)
-        return self.__cubic_meters_per_minute
+        return self._cached_convert(VolumeFlowUnits.CubicMeterPerMinute)
 
     
     @property
@@ -1947,10 +2427,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__cubic_meters_per_hour != None:
-            return self.__cubic_meters_per_hour
-        self.__cubic_meters_per_hour = self.__convert_from_base(VolumeFlowUnits.CubicMeterPerHour)
-        return self.__cubic_meters_per_hour
+        return self._cached_convert(VolumeFlowUnits.CubicMeterPerHour)
 
     
     @property
@@ -1958,10 +2435,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__cubic_meters_per_day != None:
-            return self.__cubic_meters_per_day
-        self.__cubic_meters_per_day = self.__convert_from_base(VolumeFlowUnits.CubicMeterPerDay)
-        return self.__cubic_meters_per_day
+        return self._cached_convert(VolumeFlowUnits.CubicMeterPerDay)
 
     
     @property
@@ -1969,10 +2443,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__cubic_feet_per_second != None:
-            return self.__cubic_feet_per_second
-        self.__cubic_feet_per_second = self.__convert_from_base(VolumeFlowUnits.CubicFootPerSecond)
-        return self.__cubic_feet_per_second
+        return self._cached_convert(VolumeFlowUnits.CubicFootPerSecond)
 
     
     @property
@@ -1980,10 +2451,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__cubic_feet_per_minute != None:
-            return self.__cubic_feet_per_minute
-        self.__cubic_feet_per_minute = self.__convert_from_base(VolumeFlowUnits.CubicFootPerMinute)
-        return self.__cubic_feet_per_minute
+        return self._cached_convert(VolumeFlowUnits.CubicFootPerMinute)
 
     
     @property
@@ -1991,10 +2459,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__cubic_feet_per_hour != None:
-            return self.__cubic_feet_per_hour
-        self.__cubic_feet_per_hour = self.__convert_from_base(VolumeFlowUnits.CubicFootPerHour)
-        return self.__cubic_feet_per_hour
+        return self._cached_convert(VolumeFlowUnits.CubicFootPerHour)
 
     
     @property
@@ -2002,10 +2467,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__cubic_yards_per_second != None:
-            return self.__cubic_yards_per_second
-        self.__cubic_yards_per_second = self.__convert_from_base(VolumeFlowUnits.CubicYardPerSecond)
-        return self.__cubic_yards_per_second
+        return self._cached_convert(VolumeFlowUnits.CubicYardPerSecond)
 
     
     @property
@@ -2013,10 +2475,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__cubic_yards_per_minute != None:
-            return self.__cubic_yards_per_minute
-        self.__cubic_yards_per_minute = self.__convert_from_base(VolumeFlowUnits.CubicYardPerMinute)
-        return self.__cubic_yards_per_minute
+        return self._cached_convert(VolumeFlowUnits.CubicYardPerMinute)
 
     
     @property
@@ -2024,10 +2483,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__cubic_yards_per_hour != None:
-            return self.__cubic_yards_per_hour
-        self.__cubic_yards_per_hour = self.__convert_from_base(VolumeFlowUnits.CubicYardPerHour)
-        return self.__cubic_yards_per_hour
+        return self._cached_convert(VolumeFlowUnits.CubicYardPerHour)
 
     
     @property
@@ -2035,10 +2491,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__cubic_yards_per_day != None:
-            return self.__cubic_yards_per_day
-        self.__cubic_yards_per_day = self.__convert_from_base(VolumeFlowUnits.CubicYardPerDay)
-        return self.__cubic_yards_per_day
+        return self._cached_convert(VolumeFlowUnits.CubicYardPerDay)
 
     
     @property
@@ -2046,10 +2499,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__million_us_gallons_per_day != None:
-            return self.__million_us_gallons_per_day
-        self.__million_us_gallons_per_day = self.__convert_from_base(VolumeFlowUnits.MillionUsGallonPerDay)
-        return self.__million_us_gallons_per_day
+        return self._cached_convert(VolumeFlowUnits.MillionUsGallonPerDay)
 
     
     @property
@@ -2057,10 +2507,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__us_gallons_per_day != None:
-            return self.__us_gallons_per_day
-        self.__us_gallons_per_day = self.__convert_from_base(VolumeFlowUnits.UsGallonPerDay)
-        return self.__us_gallons_per_day
+        return self._cached_convert(VolumeFlowUnits.UsGallonPerDay)
 
     
     @property
@@ -2068,10 +2515,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__liters_per_second != None:
-            return self.__liters_per_second
-        self.__liters_per_second = self.__convert_from_base(VolumeFlowUnits.LiterPerSecond)
-        return self.__liters_per_second
+        return self._cached_convert(VolumeFlowUnits.LiterPerSecond)
 
     
     @property
@@ -2079,10 +2523,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__liters_per_minute != None:
-            return self.__liters_per_minute
-        self.__liters_per_minute = self.__convert_from_base(VolumeFlowUnits.LiterPerMinute)
-        return self.__liters_per_minute
+        return self._cached_convert(VolumeFlowUnits.LiterPerMinute)
 
     
     @property
@@ -2090,10 +2531,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__liters_per_hour != None:
-            return self.__liters_per_hour
-        self.__liters_per_hour = self.__convert_from_base(VolumeFlowUnits.LiterPerHour)
-        return self.__liters_per_hour
+        return self._cached_convert(VolumeFlowUnits.LiterPerHour)
 
     
     @property
@@ -2101,10 +2539,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__liters_per_day != None:
-            return self.__liters_per_day
-        self.__liters_per_day = self.__convert_from_base(VolumeFlowUnits.LiterPerDay)
-        return self.__liters_per_day
+        return self._cached_convert(VolumeFlowUnits.LiterPerDay)
 
     
     @property
@@ -2112,10 +2547,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__us_gallons_per_second != None:
-            return self.__us_gallons_per_second
-        self.__us_gallons_per_second = self.__convert_from_base(VolumeFlowUnits.UsGallonPerSecond)
-        return self.__us_gallons_per_second
+        return self._cached_convert(VolumeFlowUnits.UsGallonPerSecond)
 
     
     @property
@@ -2123,10 +2555,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__us_gallons_per_minute != None:
-            return self.__us_gallons_per_minute
-        self.__us_gallons_per_minute = self.__convert_from_base(VolumeFlowUnits.UsGallonPerMinute)
-        return self.__us_gallons_per_minute
+        return self._cached_convert(VolumeFlowUnits.UsGallonPerMinute)
 
     
     @property
@@ -2134,10 +2563,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__uk_gallons_per_day != None:
-            return self.__uk_gallons_per_day
-        self.__uk_gallons_per_day = self.__convert_from_base(VolumeFlowUnits.UkGallonPerDay)
-        return self.__uk_gallons_per_day
+        return self._cached_convert(VolumeFlowUnits.UkGallonPerDay)
 
     
     @property
@@ -2145,10 +2571,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__uk_gallons_per_hour != None:
-            return self.__uk_gallons_per_hour
-        self.__uk_gallons_per_hour = self.__convert_from_base(VolumeFlowUnits.UkGallonPerHour)
-        return self.__uk_gallons_per_hour
+        return self._cached_convert(VolumeFlowUnits.UkGallonPerHour)
 
     
     @property
@@ -2156,10 +2579,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__uk_gallons_per_minute != None:
-            return self.__uk_gallons_per_minute
-        self.__uk_gallons_per_minute = self.__convert_from_base(VolumeFlowUnits.UkGallonPerMinute)
-        return self.__uk_gallons_per_minute
+        return self._cached_convert(VolumeFlowUnits.UkGallonPerMinute)
 
     
     @property
@@ -2167,10 +2587,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__uk_gallons_per_second != None:
-            return self.__uk_gallons_per_second
-        self.__uk_gallons_per_second = self.__convert_from_base(VolumeFlowUnits.UkGallonPerSecond)
-        return self.__uk_gallons_per_second
+        return self._cached_convert(VolumeFlowUnits.UkGallonPerSecond)
 
     
     @property
@@ -2178,10 +2595,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__kilous_gallons_per_minute != None:
-            return self.__kilous_gallons_per_minute
-        self.__kilous_gallons_per_minute = self.__convert_from_base(VolumeFlowUnits.KilousGallonPerMinute)
-        return self.__kilous_gallons_per_minute
+        return self._cached_convert(VolumeFlowUnits.KilousGallonPerMinute)
 
     
     @property
@@ -2189,10 +2603,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__us_gallons_per_hour != None:
-            return self.__us_gallons_per_hour
-        self.__us_gallons_per_hour = self.__convert_from_base(VolumeFlowUnits.UsGallonPerHour)
-        return self.__us_gallons_per_hour
+        return self._cached_convert(VolumeFlowUnits.UsGallonPerHour)
 
     
     @property
@@ -2200,10 +2611,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__cubic_decimeters_per_minute != None:
-            return self.__cubic_decimeters_per_minute
-        self.__cubic_decimeters_per_minute = self.__convert_from_base(VolumeFlowUnits.CubicDecimeterPerMinute)
-        return self.__cubic_decimeters_per_minute
+        return self._cached_convert(VolumeFlowUnits.CubicDecimeterPerMinute)
 
     
     @property
@@ -2211,10 +2619,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__oil_barrels_per_day != None:
-            return self.__oil_barrels_per_day
-        self.__oil_barrels_per_day = self.__convert_from_base(VolumeFlowUnits.OilBarrelPerDay)
-        return self.__oil_barrels_per_day
+        return self._cached_convert(VolumeFlowUnits.OilBarrelPerDay)
 
     
     @property
@@ -2222,10 +2627,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__oil_barrels_per_minute != None:
-            return self.__oil_barrels_per_minute
-        self.__oil_barrels_per_minute = self.__convert_from_base(VolumeFlowUnits.OilBarrelPerMinute)
-        return self.__oil_barrels_per_minute
+        return self._cached_convert(VolumeFlowUnits.OilBarrelPerMinute)
 
     
     @property
@@ -2233,10 +2635,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__oil_barrels_per_hour != None:
-            return self.__oil_barrels_per_hour
-        self.__oil_barrels_per_hour = self.__convert_from_base(VolumeFlowUnits.OilBarrelPerHour)
-        return self.__oil_barrels_per_hour
+        return self._cached_convert(VolumeFlowUnits.OilBarrelPerHour)
 
     
     @property
@@ -2244,10 +2643,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__oil_barrels_per_second != None:
-            return self.__oil_barrels_per_second
-        self.__oil_barrels_per_second = self.__convert_from_base(VolumeFlowUnits.OilBarrelPerSecond)
-        return self.__oil_barrels_per_second
+        return self._cached_convert(VolumeFlowUnits.OilBarrelPerSecond)
 
     
     @property
@@ -2255,10 +2651,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__cubic_millimeters_per_second != None:
-            return self.__cubic_millimeters_per_second
-        self.__cubic_millimeters_per_second = self.__convert_from_base(VolumeFlowUnits.CubicMillimeterPerSecond)
-        return self.__cubic_millimeters_per_second
+        return self._cached_convert(VolumeFlowUnits.CubicMillimeterPerSecond)
 
     
     @property
@@ -2266,10 +2659,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__acre_feet_per_second != None:
-            return self.__acre_feet_per_second
-        self.__acre_feet_per_second = self.__convert_from_base(VolumeFlowUnits.AcreFootPerSecond)
-        return self.__acre_feet_per_second
+        return self._cached_convert(VolumeFlowUnits.AcreFootPerSecond)
 
     
     @property
@@ -2277,10 +2667,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__acre_feet_per_minute != None:
-            return self.__acre_feet_per_minute
-        self.__acre_feet_per_minute = self.__convert_from_base(VolumeFlowUnits.AcreFootPerMinute)
-        return self.__acre_feet_per_minute
+        return self._cached_convert(VolumeFlowUnits.AcreFootPerMinute)
 
     
     @property
@@ -2288,10 +2675,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__acre_feet_per_hour != None:
-            return self.__acre_feet_per_hour
-        self.__acre_feet_per_hour = self.__convert_from_base(VolumeFlowUnits.AcreFootPerHour)
-        return self.__acre_feet_per_hour
+        return self._cached_convert(VolumeFlowUnits.AcreFootPerHour)
 
     
     @property
@@ -2299,10 +2683,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__acre_feet_per_day != None:
-            return self.__acre_feet_per_day
-        self.__acre_feet_per_day = self.__convert_from_base(VolumeFlowUnits.AcreFootPerDay)
-        return self.__acre_feet_per_day
+        return self._cached_convert(VolumeFlowUnits.AcreFootPerDay)
 
     
     @property
@@ -2310,10 +2691,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__cubic_centimeters_per_minute != None:
-            return self.__cubic_centimeters_per_minute
-        self.__cubic_centimeters_per_minute = self.__convert_from_base(VolumeFlowUnits.CubicCentimeterPerMinute)
-        return self.__cubic_centimeters_per_minute
+        return self._cached_convert(VolumeFlowUnits.CubicCentimeterPerMinute)
 
     
     @property
@@ -2321,10 +2699,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__megaus_gallons_per_day != None:
-            return self.__megaus_gallons_per_day
-        self.__megaus_gallons_per_day = self.__convert_from_base(VolumeFlowUnits.MegausGallonPerDay)
-        return self.__megaus_gallons_per_day
+        return self._cached_convert(VolumeFlowUnits.MegausGallonPerDay)
 
     
     @property
@@ -2332,10 +2707,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__nanoliters_per_second != None:
-            return self.__nanoliters_per_second
-        self.__nanoliters_per_second = self.__convert_from_base(VolumeFlowUnits.NanoliterPerSecond)
-        return self.__nanoliters_per_second
+        return self._cached_convert(VolumeFlowUnits.NanoliterPerSecond)
 
     
     @property
@@ -2343,10 +2715,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__microliters_per_second != None:
-            return self.__microliters_per_second
-        self.__microliters_per_second = self.__convert_from_base(VolumeFlowUnits.MicroliterPerSecond)
-        return self.__microliters_per_second
+        return self._cached_convert(VolumeFlowUnits.MicroliterPerSecond)
 
     
     @property
@@ -2354,10 +2723,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__milliliters_per_second != None:
-            return self.__milliliters_per_second
-        self.__milliliters_per_second = self.__convert_from_base(VolumeFlowUnits.MilliliterPerSecond)
-        return self.__milliliters_per_second
+        return self._cached_convert(VolumeFlowUnits.MilliliterPerSecond)
 
     
     @property
@@ -2365,10 +2731,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__centiliters_per_second != None:
-            return self.__centiliters_per_second
-        self.__centiliters_per_second = self.__convert_from_base(VolumeFlowUnits.CentiliterPerSecond)
-        return self.__centiliters_per_second
+        return self._cached_convert(VolumeFlowUnits.CentiliterPerSecond)
 
     
     @property
@@ -2376,10 +2739,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__deciliters_per_second != None:
-            return self.__deciliters_per_second
-        self.__deciliters_per_second = self.__convert_from_base(VolumeFlowUnits.DeciliterPerSecond)
-        return self.__deciliters_per_second
+        return self._cached_convert(VolumeFlowUnits.DeciliterPerSecond)
 
     
     @property
@@ -2387,10 +2747,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__kiloliters_per_second != None:
-            return self.__kiloliters_per_second
-        self.__kiloliters_per_second = self.__convert_from_base(VolumeFlowUnits.KiloliterPerSecond)
-        return self.__kiloliters_per_second
+        return self._cached_convert(VolumeFlowUnits.KiloliterPerSecond)
 
     
     @property
@@ -2398,10 +2755,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__megaliters_per_second != None:
-            return self.__megaliters_per_second
-        self.__megaliters_per_second = self.__convert_from_base(VolumeFlowUnits.MegaliterPerSecond)
-        return self.__megaliters_per_second
+        return self._cached_convert(VolumeFlowUnits.MegaliterPerSecond)
 
     
     @property
@@ -2409,10 +2763,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__nanoliters_per_minute != None:
-            return self.__nanoliters_per_minute
-        self.__nanoliters_per_minute = self.__convert_from_base(VolumeFlowUnits.NanoliterPerMinute)
-        return self.__nanoliters_per_minute
+        return self._cached_convert(VolumeFlowUnits.NanoliterPerMinute)
 
     
     @property
@@ -2420,10 +2771,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__microliters_per_minute != None:
-            return self.__microliters_per_minute
-        self.__microliters_per_minute = self.__convert_from_base(VolumeFlowUnits.MicroliterPerMinute)
-        return self.__microliters_per_minute
+        return self._cached_convert(VolumeFlowUnits.MicroliterPerMinute)
 
     
     @property
@@ -2431,10 +2779,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__milliliters_per_minute != None:
-            return self.__milliliters_per_minute
-        self.__milliliters_per_minute = self.__convert_from_base(VolumeFlowUnits.MilliliterPerMinute)
-        return self.__milliliters_per_minute
+        return self._cached_convert(VolumeFlowUnits.MilliliterPerMinute)
 
     
     @property
@@ -2442,10 +2787,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__centiliters_per_minute != None:
-            return self.__centiliters_per_minute
-        self.__centiliters_per_minute = self.__convert_from_base(VolumeFlowUnits.CentiliterPerMinute)
-        return self.__centiliters_per_minute
+        return self._cached_convert(VolumeFlowUnits.CentiliterPerMinute)
 
     
     @property
@@ -2453,10 +2795,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__deciliters_per_minute != None:
-            return self.__deciliters_per_minute
-        self.__deciliters_per_minute = self.__convert_from_base(VolumeFlowUnits.DeciliterPerMinute)
-        return self.__deciliters_per_minute
+        return self._cached_convert(VolumeFlowUnits.DeciliterPerMinute)
 
     
     @property
@@ -2464,10 +2803,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__kiloliters_per_minute != None:
-            return self.__kiloliters_per_minute
-        self.__kiloliters_per_minute = self.__convert_from_base(VolumeFlowUnits.KiloliterPerMinute)
-        return self.__kiloliters_per_minute
+        return self._cached_convert(VolumeFlowUnits.KiloliterPerMinute)
 
     
     @property
@@ -2475,10 +2811,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__megaliters_per_minute != None:
-            return self.__megaliters_per_minute
-        self.__megaliters_per_minute = self.__convert_from_base(VolumeFlowUnits.MegaliterPerMinute)
-        return self.__megaliters_per_minute
+        return self._cached_convert(VolumeFlowUnits.MegaliterPerMinute)
 
     
     @property
@@ -2486,10 +2819,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__nanoliters_per_hour != None:
-            return self.__nanoliters_per_hour
-        self.__nanoliters_per_hour = self.__convert_from_base(VolumeFlowUnits.NanoliterPerHour)
-        return self.__nanoliters_per_hour
+        return self._cached_convert(VolumeFlowUnits.NanoliterPerHour)
 
     
     @property
@@ -2497,10 +2827,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__microliters_per_hour != None:
-            return self.__microliters_per_hour
-        self.__microliters_per_hour = self.__convert_from_base(VolumeFlowUnits.MicroliterPerHour)
-        return self.__microliters_per_hour
+        return self._cached_convert(VolumeFlowUnits.MicroliterPerHour)
 
     
     @property
@@ -2508,10 +2835,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__milliliters_per_hour != None:
-            return self.__milliliters_per_hour
-        self.__milliliters_per_hour = self.__convert_from_base(VolumeFlowUnits.MilliliterPerHour)
-        return self.__milliliters_per_hour
+        return self._cached_convert(VolumeFlowUnits.MilliliterPerHour)
 
     
     @property
@@ -2519,10 +2843,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__centiliters_per_hour != None:
-            return self.__centiliters_per_hour
-        self.__centiliters_per_hour = self.__convert_from_base(VolumeFlowUnits.CentiliterPerHour)
-        return self.__centiliters_per_hour
+        return self._cached_convert(VolumeFlowUnits.CentiliterPerHour)
 
     
     @property
@@ -2530,10 +2851,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__deciliters_per_hour != None:
-            return self.__deciliters_per_hour
-        self.__deciliters_per_hour = self.__convert_from_base(VolumeFlowUnits.DeciliterPerHour)
-        return self.__deciliters_per_hour
+        return self._cached_convert(VolumeFlowUnits.DeciliterPerHour)
 
     
     @property
@@ -2541,10 +2859,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__kiloliters_per_hour != None:
-            return self.__kiloliters_per_hour
-        self.__kiloliters_per_hour = self.__convert_from_base(VolumeFlowUnits.KiloliterPerHour)
-        return self.__kiloliters_per_hour
+        return self._cached_convert(VolumeFlowUnits.KiloliterPerHour)
 
     
     @property
@@ -2552,10 +2867,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__megaliters_per_hour != None:
-            return self.__megaliters_per_hour
-        self.__megaliters_per_hour = self.__convert_from_base(VolumeFlowUnits.MegaliterPerHour)
-        return self.__megaliters_per_hour
+        return self._cached_convert(VolumeFlowUnits.MegaliterPerHour)
 
     
     @property
@@ -2563,10 +2875,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__nanoliters_per_day != None:
-            return self.__nanoliters_per_day
-        self.__nanoliters_per_day = self.__convert_from_base(VolumeFlowUnits.NanoliterPerDay)
-        return self.__nanoliters_per_day
+        return self._cached_convert(VolumeFlowUnits.NanoliterPerDay)
 
     
     @property
@@ -2574,10 +2883,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__microliters_per_day != None:
-            return self.__microliters_per_day
-        self.__microliters_per_day = self.__convert_from_base(VolumeFlowUnits.MicroliterPerDay)
-        return self.__microliters_per_day
+        return self._cached_convert(VolumeFlowUnits.MicroliterPerDay)
 
     
     @property
@@ -2585,10 +2891,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__milliliters_per_day != None:
-            return self.__milliliters_per_day
-        self.__milliliters_per_day = self.__convert_from_base(VolumeFlowUnits.MilliliterPerDay)
-        return self.__milliliters_per_day
+        return self._cached_convert(VolumeFlowUnits.MilliliterPerDay)
 
     
     @property
@@ -2596,10 +2899,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__centiliters_per_day != None:
-            return self.__centiliters_per_day
-        self.__centiliters_per_day = self.__convert_from_base(VolumeFlowUnits.CentiliterPerDay)
-        return self.__centiliters_per_day
+        return self._cached_convert(VolumeFlowUnits.CentiliterPerDay)
 
     
     @property
@@ -2607,10 +2907,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__deciliters_per_day != None:
-            return self.__deciliters_per_day
-        self.__deciliters_per_day = self.__convert_from_base(VolumeFlowUnits.DeciliterPerDay)
-        return self.__deciliters_per_day
+        return self._cached_convert(VolumeFlowUnits.DeciliterPerDay)
 
     
     @property
@@ -2618,10 +2915,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__kiloliters_per_day != None:
-            return self.__kiloliters_per_day
-        self.__kiloliters_per_day = self.__convert_from_base(VolumeFlowUnits.KiloliterPerDay)
-        return self.__kiloliters_per_day
+        return self._cached_convert(VolumeFlowUnits.KiloliterPerDay)
 
     
     @property
@@ -2629,10 +2923,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__megaliters_per_day != None:
-            return self.__megaliters_per_day
-        self.__megaliters_per_day = self.__convert_from_base(VolumeFlowUnits.MegaliterPerDay)
-        return self.__megaliters_per_day
+        return self._cached_convert(VolumeFlowUnits.MegaliterPerDay)
 
     
     @property
@@ -2640,10 +2931,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__megauk_gallons_per_day != None:
-            return self.__megauk_gallons_per_day
-        self.__megauk_gallons_per_day = self.__convert_from_base(VolumeFlowUnits.MegaukGallonPerDay)
-        return self.__megauk_gallons_per_day
+        return self._cached_convert(VolumeFlowUnits.MegaukGallonPerDay)
 
     
     @property
@@ -2651,10 +2939,7 @@ class VolumeFlow(AbstractMeasure):
         """
         
         """
-        if self.__megauk_gallons_per_second != None:
-            return self.__megauk_gallons_per_second
-        self.__megauk_gallons_per_second = self.__convert_from_base(VolumeFlowUnits.MegaukGallonPerSecond)
-        return self.__megauk_gallons_per_second
+        return self._cached_convert(VolumeFlowUnits.MegaukGallonPerSecond)
 
     
     def to_string(self, unit: VolumeFlowUnits = VolumeFlowUnits.CubicMeterPerSecond) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class VolumeFlowPerAreaUnits(Enum):
         """
             VolumeFlowPerAreaUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         CubicMeterPerSecondPerSquareMeter = 'cubic_meter_per_second_per_square_meter'
         """
@@ -29,41 +40,256 @@ class VolumeFlowPerArea(AbstractMeasure):
         value (float): The value.
         from_unit (VolumeFlowPerAreaUnits): The VolumeFlowPerArea unit to create from, The default unit is CubicMeterPerSecondPerSquareMeter
     """
-    def __init__(self, value: float, from_unit: VolumeFlowPerAreaUnits = VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = VolumeFlowPerAreaUnits
+
+    _base_unit = VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter
+
+    _dimensions = (1, 0, -1, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 116
+
+    _binary_unit_ids = {
         
-        self.__cubic_meters_per_second_per_square_meter = None
+        VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter: 0,
         
-        self.__cubic_feet_per_minute_per_square_foot = None
+        VolumeFlowPerAreaUnits.CubicFootPerMinutePerSquareFoot: 1,
         
+    }
 
-    def convert(self, unit: VolumeFlowPerAreaUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter: lambda value: (value),
+        
+        VolumeFlowPerAreaUnits.CubicFootPerMinutePerSquareFoot: lambda value: (value * 196.850394),
+        
+    }
 
-    def __convert_from_base(self, from_unit: VolumeFlowPerAreaUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter: lambda value: (value),
         
-        if from_unit == VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter:
-            return (value)
+        VolumeFlowPerAreaUnits.CubicFootPerMinutePerSquareFoot: lambda value: (value / 196.850394),
         
-        if from_unit == VolumeFlowPerAreaUnits.CubicFootPerMinutePerSquareFoot:
-            return (value * 196.850394)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter: ('1', '0'),
         
-        return None
+        VolumeFlowPerAreaUnits.CubicFootPerMinutePerSquareFoot: ('98425197/500000', '0'),
+        
+    }
 
+    _affine_to_base = {
+        
+        VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter: ('1', '0'),
+        
+        VolumeFlowPerAreaUnits.CubicFootPerMinutePerSquareFoot: ('500000/98425197', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: VolumeFlowPerAreaUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter:
-            return (value)
+        VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter: ('m³/(s·m²)',),
         
-        if to_unit == VolumeFlowPerAreaUnits.CubicFootPerMinutePerSquareFoot:
-            return (value / 196.850394)
+        VolumeFlowPerAreaUnits.CubicFootPerMinutePerSquareFoot: ('CFM/ft²',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: VolumeFlowPerAreaUnits = VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: VolumeFlowPerAreaUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: VolumeFlowPerAreaUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: VolumeFlowPerAreaUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: VolumeFlowPerAreaUnits, to_unit: VolumeFlowPerAreaUnits) -> float:
+        """
+        Convert a value from one VolumeFlowPerArea unit to another, without creating a VolumeFlowPerArea instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumeFlowPerAreaUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: VolumeFlowPerAreaUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return VolumeFlowPerArea._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: VolumeFlowPerAreaUnits, to_unit: VolumeFlowPerAreaUnits) -> List[float]:
+        """
+        Convert many values from one VolumeFlowPerArea unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: VolumeFlowPerAreaUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: VolumeFlowPerAreaUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return VolumeFlowPerArea._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: VolumeFlowPerAreaUnits, to_unit: VolumeFlowPerAreaUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", VolumeFlowPerArea._convert_many(values, from_unit, to_unit))
 
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: VolumeFlowPerAreaUnits, to_unit: VolumeFlowPerAreaUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one VolumeFlowPerArea unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumeFlowPerAreaUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: VolumeFlowPerAreaUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return VolumeFlowPerArea._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: VolumeFlowPerAreaUnits = VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter) -> VolumeFlowPerArea:
+        """
+        Create a new instance of VolumeFlowPerArea holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumeFlowPerAreaUnits
+        :return: A new instance of VolumeFlowPerArea.
+        :rtype: VolumeFlowPerArea
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return VolumeFlowPerArea._from_exact(value, from_unit)
+
+    def to_exact(self, unit: VolumeFlowPerAreaUnits = VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter) -> Fraction:
+        """
+        Get the exact value of the VolumeFlowPerArea in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (CubicMeterPerSecondPerSquareMeter).
+        :type unit: VolumeFlowPerAreaUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> VolumeFlowPerArea:
+        """
+        Parse a VolumeFlowPerArea from a value followed by a unit abbreviation, e.g. "1 m³/(s·m²)".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of VolumeFlowPerArea.
+        :rtype: VolumeFlowPerArea
+        :raises ValueError: When the string is not a valid or an ambiguous VolumeFlowPerArea.
+        """
+        return VolumeFlowPerArea._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[VolumeFlowPerArea]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return VolumeFlowPerArea._try_parse(text)
+
+    def to_binary(self, unit: Optional[VolumeFlowPerAreaUnits] = None) -> bytes:
+        """
+        Encode the VolumeFlowPerArea to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: VolumeFlowPerAreaUnits
+        :return: The encoded VolumeFlowPerArea.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> VolumeFlowPerArea:
+        """
+        Decode a VolumeFlowPerArea encoded by to_binary.
+
+        :param data: The encoded VolumeFlowPerArea, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of VolumeFlowPerArea.
+        :rtype: VolumeFlowPerArea
+        :raises ValueError: When the data is not a valid encoded VolumeFlowPerArea.
+        """
+        return VolumeFlowPerArea._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[VolumeFlowPerAreaUnits] = None) -> dict:
+        """
+        Get the VolumeFlowPerArea DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (CubicMeterPerSecondPerSquareMeter).
+        :type hold_in_unit: VolumeFlowPerAreaUnits
+        :return: The VolumeFlowPerArea DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[VolumeFlowPerAreaUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> VolumeFlowPerArea:
+        """
+        Create a new instance of VolumeFlowPerArea from its DTO.
+
+        :param dto: The VolumeFlowPerArea DTO, the unit is the VolumeFlowPerAreaUnits value or name.
+        :type dto: dict
+        :return: A new instance of VolumeFlowPerArea.
+        :rtype: VolumeFlowPerArea
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return VolumeFlowPerArea._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> VolumeFlowPerArea:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return VolumeFlowPerArea._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -105,10 +331,7 @@ class VolumeFlowPerArea(AbstractMeasure):
         """
         
         """
-        if self.__cubic_meters_per_second_per_square_meter != None:
-            return self.__cubic_meters_per_second_per_square_meter
-        self.__cubic_meters_per_second_per_square_meter = self.__convert_from_base(VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter)
-        return self.__cubic_meters_per_second_per_square_meter
+        return self._cached_convert(VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter)
 
     
     @property
@@ -116,10 +339,7 @@ class VolumeFlowPerArea(AbstractMeasure):
         """
         
         """
-        if self.__cubic_feet_per_minute_per_square_foot != None:
-            return self.__cubic_feet_per_minute_per_square_foot
-        self.__cubic_feet_per_minute_per_square_foot = self.__convert_from_base(VolumeFlowPerAreaUnits.CubicFootPerMinutePerSquareFoot)
-        return self.__cubic_feet_per_minute_per_square_foot
+        return self._cached_convert(VolumeFlowPerAreaUnits.CubicFootPerMinutePerSquareFoot)
 
     
     def to_string(self, unit: VolumeFlowPerAreaUnits = VolumeFlowPerAreaUnits.CubicMeterPerSecondPerSquareMeter) -> str:
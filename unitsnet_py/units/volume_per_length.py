@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class VolumePerLengthUnits(Enum):
         """
             VolumePerLengthUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         CubicMeterPerMeter = 'cubic_meter_per_meter'
         """
@@ -64,97 +75,340 @@ class VolumePerLength(AbstractMeasure):
         value (float): The value.
         from_unit (VolumePerLengthUnits): The VolumePerLength unit to create from, The default unit is CubicMeterPerMeter
     """
-    def __init__(self, value: float, from_unit: VolumePerLengthUnits = VolumePerLengthUnits.CubicMeterPerMeter):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = VolumePerLengthUnits
+
+    _base_unit = VolumePerLengthUnits.CubicMeterPerMeter
+
+    _dimensions = (2, 0, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 117
+
+    _binary_unit_ids = {
         
-        self.__cubic_meters_per_meter = None
+        VolumePerLengthUnits.CubicMeterPerMeter: 0,
         
-        self.__liters_per_meter = None
+        VolumePerLengthUnits.LiterPerMeter: 1,
         
-        self.__liters_per_kilometer = None
+        VolumePerLengthUnits.LiterPerKilometer: 2,
         
-        self.__liters_per_millimeter = None
+        VolumePerLengthUnits.LiterPerMillimeter: 3,
         
-        self.__oil_barrels_per_foot = None
+        VolumePerLengthUnits.OilBarrelPerFoot: 4,
         
-        self.__cubic_yards_per_foot = None
+        VolumePerLengthUnits.CubicYardPerFoot: 5,
         
-        self.__cubic_yards_per_us_survey_foot = None
+        VolumePerLengthUnits.CubicYardPerUsSurveyFoot: 6,
         
-        self.__us_gallons_per_mile = None
+        VolumePerLengthUnits.UsGallonPerMile: 7,
         
-        self.__imperial_gallons_per_mile = None
+        VolumePerLengthUnits.ImperialGallonPerMile: 8,
         
+    }
 
-    def convert(self, unit: VolumePerLengthUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        VolumePerLengthUnits.CubicMeterPerMeter: lambda value: (value),
+        
+        VolumePerLengthUnits.LiterPerMeter: lambda value: (value * 1000),
+        
+        VolumePerLengthUnits.LiterPerKilometer: lambda value: (value * 1e6),
+        
+        VolumePerLengthUnits.LiterPerMillimeter: lambda value: (value),
+        
+        VolumePerLengthUnits.OilBarrelPerFoot: lambda value: (value * 1.91713408),
+        
+        VolumePerLengthUnits.CubicYardPerFoot: lambda value: (value / 2.50838208),
+        
+        VolumePerLengthUnits.CubicYardPerUsSurveyFoot: lambda value: (value / 2.50837706323584),
+        
+        VolumePerLengthUnits.UsGallonPerMile: lambda value: (value * (1000 * 1609.344 / 3.785411784)),
+        
+        VolumePerLengthUnits.ImperialGallonPerMile: lambda value: (value * (1000 * 1609.344 / 4.54609)),
+        
+    }
 
-    def __convert_from_base(self, from_unit: VolumePerLengthUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        VolumePerLengthUnits.CubicMeterPerMeter: lambda value: (value),
+        
+        VolumePerLengthUnits.LiterPerMeter: lambda value: (value / 1000),
+        
+        VolumePerLengthUnits.LiterPerKilometer: lambda value: (value / 1e6),
+        
+        VolumePerLengthUnits.LiterPerMillimeter: lambda value: (value),
+        
+        VolumePerLengthUnits.OilBarrelPerFoot: lambda value: (value / 1.91713408),
+        
+        VolumePerLengthUnits.CubicYardPerFoot: lambda value: (value * 2.50838208),
         
-        if from_unit == VolumePerLengthUnits.CubicMeterPerMeter:
-            return (value)
+        VolumePerLengthUnits.CubicYardPerUsSurveyFoot: lambda value: (value * 2.50837706323584),
         
-        if from_unit == VolumePerLengthUnits.LiterPerMeter:
-            return (value * 1000)
+        VolumePerLengthUnits.UsGallonPerMile: lambda value: (value / (1000 * 1609.344 / 3.785411784)),
         
-        if from_unit == VolumePerLengthUnits.LiterPerKilometer:
-            return (value * 1e6)
+        VolumePerLengthUnits.ImperialGallonPerMile: lambda value: (value / (1000 * 1609.344 / 4.54609)),
         
-        if from_unit == VolumePerLengthUnits.LiterPerMillimeter:
-            return (value)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        VolumePerLengthUnits.CubicMeterPerMeter: ('1', '0'),
+        
+        VolumePerLengthUnits.LiterPerMeter: ('1000', '0'),
+        
+        VolumePerLengthUnits.LiterPerKilometer: ('1000000', '0'),
+        
+        VolumePerLengthUnits.LiterPerMillimeter: ('1', '0'),
         
-        if from_unit == VolumePerLengthUnits.OilBarrelPerFoot:
-            return (value * 1.91713408)
+        VolumePerLengthUnits.OilBarrelPerFoot: ('1497761/781250', '0'),
         
-        if from_unit == VolumePerLengthUnits.CubicYardPerFoot:
-            return (value / 2.50838208)
+        VolumePerLengthUnits.CubicYardPerFoot: ('1562500/3919347', '0'),
         
-        if from_unit == VolumePerLengthUnits.CubicYardPerUsSurveyFoot:
-            return (value / 2.50837706323584)
+        VolumePerLengthUnits.CubicYardPerUsSurveyFoot: ('781250000000/1959669580653', '0'),
         
-        if from_unit == VolumePerLengthUnits.UsGallonPerMile:
-            return (value * (1000 * 1609.344 / 3.785411784))
+        VolumePerLengthUnits.UsGallonPerMile: ('48000000000/112903', '0'),
         
-        if from_unit == VolumePerLengthUnits.ImperialGallonPerMile:
-            return (value * (1000 * 1609.344 / 4.54609))
+        VolumePerLengthUnits.ImperialGallonPerMile: ('160934400000/454609', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        VolumePerLengthUnits.CubicMeterPerMeter: ('1', '0'),
+        
+        VolumePerLengthUnits.LiterPerMeter: ('1/1000', '0'),
+        
+        VolumePerLengthUnits.LiterPerKilometer: ('1/1000000', '0'),
+        
+        VolumePerLengthUnits.LiterPerMillimeter: ('1', '0'),
+        
+        VolumePerLengthUnits.OilBarrelPerFoot: ('781250/1497761', '0'),
+        
+        VolumePerLengthUnits.CubicYardPerFoot: ('3919347/1562500', '0'),
+        
+        VolumePerLengthUnits.CubicYardPerUsSurveyFoot: ('1959669580653/781250000000', '0'),
+        
+        VolumePerLengthUnits.UsGallonPerMile: ('112903/48000000000', '0'),
+        
+        VolumePerLengthUnits.ImperialGallonPerMile: ('454609/160934400000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: VolumePerLengthUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == VolumePerLengthUnits.CubicMeterPerMeter:
-            return (value)
+        VolumePerLengthUnits.CubicMeterPerMeter: ('m³/m',),
         
-        if to_unit == VolumePerLengthUnits.LiterPerMeter:
-            return (value / 1000)
+        VolumePerLengthUnits.LiterPerMeter: ('l/m',),
         
-        if to_unit == VolumePerLengthUnits.LiterPerKilometer:
-            return (value / 1e6)
+        VolumePerLengthUnits.LiterPerKilometer: ('l/km',),
         
-        if to_unit == VolumePerLengthUnits.LiterPerMillimeter:
-            return (value)
+        VolumePerLengthUnits.LiterPerMillimeter: ('l/mm',),
         
-        if to_unit == VolumePerLengthUnits.OilBarrelPerFoot:
-            return (value / 1.91713408)
+        VolumePerLengthUnits.OilBarrelPerFoot: ('bbl/ft',),
         
-        if to_unit == VolumePerLengthUnits.CubicYardPerFoot:
-            return (value * 2.50838208)
+        VolumePerLengthUnits.CubicYardPerFoot: ('yd³/ft',),
         
-        if to_unit == VolumePerLengthUnits.CubicYardPerUsSurveyFoot:
-            return (value * 2.50837706323584)
+        VolumePerLengthUnits.CubicYardPerUsSurveyFoot: ('yd³/ftUS',),
         
-        if to_unit == VolumePerLengthUnits.UsGallonPerMile:
-            return (value / (1000 * 1609.344 / 3.785411784))
+        VolumePerLengthUnits.UsGallonPerMile: ('gal (U.S.)/mi',),
         
-        if to_unit == VolumePerLengthUnits.ImperialGallonPerMile:
-            return (value / (1000 * 1609.344 / 4.54609))
+        VolumePerLengthUnits.ImperialGallonPerMile: ('gal (imp.)/mi',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: VolumePerLengthUnits = VolumePerLengthUnits.CubicMeterPerMeter):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: VolumePerLengthUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: VolumePerLengthUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: VolumePerLengthUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: VolumePerLengthUnits, to_unit: VolumePerLengthUnits) -> float:
+        """
+        Convert a value from one VolumePerLength unit to another, without creating a VolumePerLength instance.
 
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumePerLengthUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: VolumePerLengthUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return VolumePerLength._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: VolumePerLengthUnits, to_unit: VolumePerLengthUnits) -> List[float]:
+        """
+        Convert many values from one VolumePerLength unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: VolumePerLengthUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: VolumePerLengthUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return VolumePerLength._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: VolumePerLengthUnits, to_unit: VolumePerLengthUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", VolumePerLength._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: VolumePerLengthUnits, to_unit: VolumePerLengthUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one VolumePerLength unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumePerLengthUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: VolumePerLengthUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return VolumePerLength._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: VolumePerLengthUnits = VolumePerLengthUnits.CubicMeterPerMeter) -> VolumePerLength:
+        """
+        Create a new instance of VolumePerLength holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumePerLengthUnits
+        :return: A new instance of VolumePerLength.
+        :rtype: VolumePerLength
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return VolumePerLength._from_exact(value, from_unit)
+
+    def to_exact(self, unit: VolumePerLengthUnits = VolumePerLengthUnits.CubicMeterPerMeter) -> Fraction:
+        """
+        Get the exact value of the VolumePerLength in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (CubicMeterPerMeter).
+        :type unit: VolumePerLengthUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> VolumePerLength:
+        """
+        Parse a VolumePerLength from a value followed by a unit abbreviation, e.g. "1 m³/m".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of VolumePerLength.
+        :rtype: VolumePerLength
+        :raises ValueError: When the string is not a valid or an ambiguous VolumePerLength.
+        """
+        return VolumePerLength._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[VolumePerLength]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return VolumePerLength._try_parse(text)
+
+    def to_binary(self, unit: Optional[VolumePerLengthUnits] = None) -> bytes:
+        """
+        Encode the VolumePerLength to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: VolumePerLengthUnits
+        :return: The encoded VolumePerLength.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> VolumePerLength:
+        """
+        Decode a VolumePerLength encoded by to_binary.
+
+        :param data: The encoded VolumePerLength, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of VolumePerLength.
+        :rtype: VolumePerLength
+        :raises ValueError: When the data is not a valid encoded VolumePerLength.
+        """
+        return VolumePerLength._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[VolumePerLengthUnits] = None) -> dict:
+        """
+        Get the VolumePerLength DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (CubicMeterPerMeter).
+        :type hold_in_unit: VolumePerLengthUnits
+        :return: The VolumePerLength DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[VolumePerLengthUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> VolumePerLength:
+        """
+        Create a new instance of VolumePerLength from its DTO.
+
+        :param dto: The VolumePerLength DTO, the unit is the VolumePerLengthUnits value or name.
+        :type dto: dict
+        :return: A new instance of VolumePerLength.
+        :rtype: VolumePerLength
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return VolumePerLength._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> VolumePerLength:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return VolumePerLength._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -301,10 +555,7 @@ class VolumePerLength(AbstractMeasure):
         """
         
         """
-        if self.__cubic_meters_per_meter != None:
-            return self.__cubic_meters_per_meter
-        self.__cubic_meters_per_meter = self.__convert_from_base(VolumePerLengthUnits.CubicMeterPerMeter)
-        return self.__cubic_meters_per_meter
+        return self._cached_convert(VolumePerLengthUnits.CubicMeterPerMeter)
 
     
     @property
@@ -312,10 +563,7 @@ class VolumePerLength(AbstractMeasure):
         """
         
         """
-        if self.__liters_per_meter != None:
-            return self.__liters_per_meter
-        self.__liters_per_meter = self.__convert_from_base(VolumePerLengthUnits.LiterPerMeter)
-        return self.__liters_per_meter
+        return self._cached_convert(VolumePerLengthUnits.LiterPerMeter)
 
     
     @property
@@ -323,10 +571,7 @@ class VolumePerLength(AbstractMeasure):
         """
         
         """
-        if self.__liters_per_kilometer != None:
-            return self.__liters_per_kilometer
-        self.__liters_per_kilometer = self.__convert_from_base(VolumePerLengthUnits.LiterPerKilometer)
-        return self.__liters_per_kilometer
+        return self._cached_convert(VolumePerLengthUnits.LiterPerKilometer)
 
     
     @property
@@ -334,10 +579,7 @@ class VolumePerLength(AbstractMeasure):
         """
         
         """
-        if self.__liters_per_millimeter != None:
-            return self.__liters_per_millimeter
-        self.__liters_per_millimeter = self.__convert_from_base(VolumePerLengthUnits.LiterPerMillimeter)
-        return self.__liters_per_millimeter
+        return self._cached_convert(VolumePerLengthUnits.LiterPerMillimeter)
 
     
     @property
@@ -345,10 +587,7 @@ class VolumePerLength(AbstractMeasure):
         """
         
         """
-        if self.__oil_barrels_per_foot != None:
-            return self.__oil_barrels_per_foot
-        self.__oil_barrels_per_foot = self.__convert_from_base(VolumePerLengthUnits.OilBarrelPerFoot)
-        return self.__oil_barrels_per_foot
+        return self._cached_convert(VolumePerLengthUnits.OilBarrelPerFoot)
 
     
     @property
@@ -356,10 +595,7 @@ class VolumePerLength(AbstractMeasure):
         """
         
         """
-        if self.__cubic_yards_per_foot != None:
-            return self.__cubic_yards_per_foot
-        self.__cubic_yards_per_foot = self.__convert_from_base(VolumePerLengthUnits.CubicYardPerFoot)
-        return self.__cubic_yards_per_foot
+        return self._cached_convert(VolumePerLengthUnits.CubicYardPerFoot)
 
     
     @property
@@ -367,10 +603,7 @@ class VolumePerLength(AbstractMeasure):
         """
         
         """
-        if self.__cubic_yards_per_us_survey_foot != None:
-            return self.__cubic_yards_per_us_survey_foot
-        self.__cubic_yards_per_us_survey_foot = self.__convert_from_base(VolumePerLengthUnits.CubicYardPerUsSurveyFoot)
-        return self.__cubic_yards_per_us_survey_foot
+        return self._cached_convert(VolumePerLengthUnits.CubicYardPerUsSurveyFoot)
 
     
     @property
@@ -378,10 +611,7 @@ class VolumePerLength(AbstractMeasure):
         """
         
         """
-        if self.__us_gallons_per_mile != None:
-            return self.__us_gallons_per_mile
-        self.__us_gallons_per_mile = self.__convert_from_base(VolumePerLengthUnits.UsGallonPerMile)
-        return self.__us_gallons_per_mile
+        return self._cached_convert(VolumePerLengthUnits.UsGallonPerMile)
 
     
     @property
@@ -389,10 +619,7 @@ class VolumePerLength(AbstractMeasure):
         """
         
         """
-        if self.__imperial_gallons_per_mile != None:
-            return self.__imperial_gallons_per_mile
-        self.__imperial_gallons_per_mile = self.__convert_from_base(VolumePerLengthUnits.ImperialGallonPerMile)
-        return self.__imperial_gallons_per_mile
+        return self._cached_convert(VolumePerLengthUnits.ImperialGallonPerMile)
 
     
     def to_string(self, unit: VolumePerLengthUnits = VolumePerLengthUnits.CubicMeterPerMeter) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class VolumetricHeatCapacityUnits(Enum):
         """
             VolumetricHeatCapacityUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         JoulePerCubicMeterKelvin = 'joule_per_cubic_meter_kelvin'
         """
@@ -64,97 +75,340 @@ class VolumetricHeatCapacity(AbstractMeasure):
         value (float): The value.
         from_unit (VolumetricHeatCapacityUnits): The VolumetricHeatCapacity unit to create from, The default unit is JoulePerCubicMeterKelvin
     """
-    def __init__(self, value: float, from_unit: VolumetricHeatCapacityUnits = VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = VolumetricHeatCapacityUnits
+
+    _base_unit = VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin
+
+    _dimensions = (-1, 1, -2, 0, -1, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 118
+
+    _binary_unit_ids = {
         
-        self.__joules_per_cubic_meter_kelvin = None
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin: 0,
         
-        self.__joules_per_cubic_meter_degree_celsius = None
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterDegreeCelsius: 1,
         
-        self.__calories_per_cubic_centimeter_degree_celsius = None
+        VolumetricHeatCapacityUnits.CaloriePerCubicCentimeterDegreeCelsius: 2,
         
-        self.__btus_per_cubic_foot_degree_fahrenheit = None
+        VolumetricHeatCapacityUnits.BtuPerCubicFootDegreeFahrenheit: 3,
         
-        self.__kilojoules_per_cubic_meter_kelvin = None
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterKelvin: 4,
         
-        self.__megajoules_per_cubic_meter_kelvin = None
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterKelvin: 5,
         
-        self.__kilojoules_per_cubic_meter_degree_celsius = None
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterDegreeCelsius: 6,
         
-        self.__megajoules_per_cubic_meter_degree_celsius = None
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterDegreeCelsius: 7,
         
-        self.__kilocalories_per_cubic_centimeter_degree_celsius = None
+        VolumetricHeatCapacityUnits.KilocaloriePerCubicCentimeterDegreeCelsius: 8,
         
+    }
 
-    def convert(self, unit: VolumetricHeatCapacityUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin: lambda value: (value),
+        
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterDegreeCelsius: lambda value: (value),
+        
+        VolumetricHeatCapacityUnits.CaloriePerCubicCentimeterDegreeCelsius: lambda value: (value * 2.388459e-7),
+        
+        VolumetricHeatCapacityUnits.BtuPerCubicFootDegreeFahrenheit: lambda value: (value * 1.4910660e-5),
+        
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterKelvin: lambda value: ((value) / 1000.0),
+        
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterKelvin: lambda value: ((value) / 1000000.0),
+        
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterDegreeCelsius: lambda value: ((value) / 1000.0),
+        
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterDegreeCelsius: lambda value: ((value) / 1000000.0),
+        
+        VolumetricHeatCapacityUnits.KilocaloriePerCubicCentimeterDegreeCelsius: lambda value: ((value * 2.388459e-7) / 1000.0),
+        
+    }
 
-    def __convert_from_base(self, from_unit: VolumetricHeatCapacityUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin: lambda value: (value),
+        
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterDegreeCelsius: lambda value: (value),
+        
+        VolumetricHeatCapacityUnits.CaloriePerCubicCentimeterDegreeCelsius: lambda value: (value / 2.388459e-7),
+        
+        VolumetricHeatCapacityUnits.BtuPerCubicFootDegreeFahrenheit: lambda value: (value / 1.4910660e-5),
+        
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterKelvin: lambda value: ((value) * 1000.0),
+        
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterKelvin: lambda value: ((value) * 1000000.0),
         
-        if from_unit == VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin:
-            return (value)
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterDegreeCelsius: lambda value: ((value) * 1000.0),
         
-        if from_unit == VolumetricHeatCapacityUnits.JoulePerCubicMeterDegreeCelsius:
-            return (value)
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterDegreeCelsius: lambda value: ((value) * 1000000.0),
         
-        if from_unit == VolumetricHeatCapacityUnits.CaloriePerCubicCentimeterDegreeCelsius:
-            return (value * 2.388459e-7)
+        VolumetricHeatCapacityUnits.KilocaloriePerCubicCentimeterDegreeCelsius: lambda value: ((value / 2.388459e-7) * 1000.0),
         
-        if from_unit == VolumetricHeatCapacityUnits.BtuPerCubicFootDegreeFahrenheit:
-            return (value * 1.4910660e-5)
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
+        
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin: ('1', '0'),
+        
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterDegreeCelsius: ('1', '0'),
+        
+        VolumetricHeatCapacityUnits.CaloriePerCubicCentimeterDegreeCelsius: ('2388459/10000000000000', '0'),
+        
+        VolumetricHeatCapacityUnits.BtuPerCubicFootDegreeFahrenheit: ('745533/50000000000', '0'),
         
-        if from_unit == VolumetricHeatCapacityUnits.KilojoulePerCubicMeterKelvin:
-            return ((value) / 1000.0)
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterKelvin: ('1/1000', '0'),
         
-        if from_unit == VolumetricHeatCapacityUnits.MegajoulePerCubicMeterKelvin:
-            return ((value) / 1000000.0)
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterKelvin: ('1/1000000', '0'),
         
-        if from_unit == VolumetricHeatCapacityUnits.KilojoulePerCubicMeterDegreeCelsius:
-            return ((value) / 1000.0)
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterDegreeCelsius: ('1/1000', '0'),
         
-        if from_unit == VolumetricHeatCapacityUnits.MegajoulePerCubicMeterDegreeCelsius:
-            return ((value) / 1000000.0)
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterDegreeCelsius: ('1/1000000', '0'),
         
-        if from_unit == VolumetricHeatCapacityUnits.KilocaloriePerCubicCentimeterDegreeCelsius:
-            return ((value * 2.388459e-7) / 1000.0)
+        VolumetricHeatCapacityUnits.KilocaloriePerCubicCentimeterDegreeCelsius: ('2388459/10000000000000000', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin: ('1', '0'),
+        
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterDegreeCelsius: ('1', '0'),
+        
+        VolumetricHeatCapacityUnits.CaloriePerCubicCentimeterDegreeCelsius: ('10000000000000/2388459', '0'),
+        
+        VolumetricHeatCapacityUnits.BtuPerCubicFootDegreeFahrenheit: ('50000000000/745533', '0'),
+        
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterKelvin: ('1000', '0'),
+        
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterKelvin: ('1000000', '0'),
+        
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterDegreeCelsius: ('1000', '0'),
+        
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterDegreeCelsius: ('1000000', '0'),
+        
+        VolumetricHeatCapacityUnits.KilocaloriePerCubicCentimeterDegreeCelsius: ('10000000000000000/2388459', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: VolumetricHeatCapacityUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin:
-            return (value)
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin: ('J/m³·K',),
         
-        if to_unit == VolumetricHeatCapacityUnits.JoulePerCubicMeterDegreeCelsius:
-            return (value)
+        VolumetricHeatCapacityUnits.JoulePerCubicMeterDegreeCelsius: ('J/m³·°C',),
         
-        if to_unit == VolumetricHeatCapacityUnits.CaloriePerCubicCentimeterDegreeCelsius:
-            return (value / 2.388459e-7)
+        VolumetricHeatCapacityUnits.CaloriePerCubicCentimeterDegreeCelsius: ('cal/cm³·°C',),
         
-        if to_unit == VolumetricHeatCapacityUnits.BtuPerCubicFootDegreeFahrenheit:
-            return (value / 1.4910660e-5)
+        VolumetricHeatCapacityUnits.BtuPerCubicFootDegreeFahrenheit: ('BTU/ft³·°F',),
         
-        if to_unit == VolumetricHeatCapacityUnits.KilojoulePerCubicMeterKelvin:
-            return ((value) * 1000.0)
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterKelvin: ('kJ/m³·K',),
         
-        if to_unit == VolumetricHeatCapacityUnits.MegajoulePerCubicMeterKelvin:
-            return ((value) * 1000000.0)
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterKelvin: ('MJ/m³·K',),
         
-        if to_unit == VolumetricHeatCapacityUnits.KilojoulePerCubicMeterDegreeCelsius:
-            return ((value) * 1000.0)
+        VolumetricHeatCapacityUnits.KilojoulePerCubicMeterDegreeCelsius: ('kJ/m³·°C',),
         
-        if to_unit == VolumetricHeatCapacityUnits.MegajoulePerCubicMeterDegreeCelsius:
-            return ((value) * 1000000.0)
+        VolumetricHeatCapacityUnits.MegajoulePerCubicMeterDegreeCelsius: ('MJ/m³·°C',),
         
-        if to_unit == VolumetricHeatCapacityUnits.KilocaloriePerCubicCentimeterDegreeCelsius:
-            return ((value / 2.388459e-7) * 1000.0)
+        VolumetricHeatCapacityUnits.KilocaloriePerCubicCentimeterDegreeCelsius: ('kcal/cm³·°C',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: VolumetricHeatCapacityUnits = VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: VolumetricHeatCapacityUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: VolumetricHeatCapacityUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: VolumetricHeatCapacityUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: VolumetricHeatCapacityUnits, to_unit: VolumetricHeatCapacityUnits) -> float:
+        """
+        Convert a value from one VolumetricHeatCapacity unit to another, without creating a VolumetricHeatCapacity instance.
 
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumetricHeatCapacityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: VolumetricHeatCapacityUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return VolumetricHeatCapacity._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: VolumetricHeatCapacityUnits, to_unit: VolumetricHeatCapacityUnits) -> List[float]:
+        """
+        Convert many values from one VolumetricHeatCapacity unit to another.
+        The conversion is resolved once and applied to all the values.
+
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: VolumetricHeatCapacityUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: VolumetricHeatCapacityUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return VolumetricHeatCapacity._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: VolumetricHeatCapacityUnits, to_unit: VolumetricHeatCapacityUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", VolumetricHeatCapacity._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: VolumetricHeatCapacityUnits, to_unit: VolumetricHeatCapacityUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one VolumetricHeatCapacity unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumetricHeatCapacityUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: VolumetricHeatCapacityUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return VolumetricHeatCapacity._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: VolumetricHeatCapacityUnits = VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin) -> VolumetricHeatCapacity:
+        """
+        Create a new instance of VolumetricHeatCapacity holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: VolumetricHeatCapacityUnits
+        :return: A new instance of VolumetricHeatCapacity.
+        :rtype: VolumetricHeatCapacity
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return VolumetricHeatCapacity._from_exact(value, from_unit)
+
+    def to_exact(self, unit: VolumetricHeatCapacityUnits = VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin) -> Fraction:
+        """
+        Get the exact value of the VolumetricHeatCapacity in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (JoulePerCubicMeterKelvin).
+        :type unit: VolumetricHeatCapacityUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> VolumetricHeatCapacity:
+        """
+        Parse a VolumetricHeatCapacity from a value followed by a unit abbreviation, e.g. "1 J/m³·K".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of VolumetricHeatCapacity.
+        :rtype: VolumetricHeatCapacity
+        :raises ValueError: When the string is not a valid or an ambiguous VolumetricHeatCapacity.
+        """
+        return VolumetricHeatCapacity._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[VolumetricHeatCapacity]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return VolumetricHeatCapacity._try_parse(text)
+
+    def to_binary(self, unit: Optional[VolumetricHeatCapacityUnits] = None) -> bytes:
+        """
+        Encode the VolumetricHeatCapacity to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: VolumetricHeatCapacityUnits
+        :return: The encoded VolumetricHeatCapacity.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> VolumetricHeatCapacity:
+        """
+        Decode a VolumetricHeatCapacity encoded by to_binary.
+
+        :param data: The encoded VolumetricHeatCapacity, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of VolumetricHeatCapacity.
+        :rtype: VolumetricHeatCapacity
+        :raises ValueError: When the data is not a valid encoded VolumetricHeatCapacity.
+        """
+        return VolumetricHeatCapacity._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[VolumetricHeatCapacityUnits] = None) -> dict:
+        """
+        Get the VolumetricHeatCapacity DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (JoulePerCubicMeterKelvin).
+        :type hold_in_unit: VolumetricHeatCapacityUnits
+        :return: The VolumetricHeatCapacity DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[VolumetricHeatCapacityUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> VolumetricHeatCapacity:
+        """
+        Create a new instance of VolumetricHeatCapacity from its DTO.
+
+        :param dto: The VolumetricHeatCapacity DTO, the unit is the VolumetricHeatCapacityUnits value or name.
+        :type dto: dict
+        :return: A new instance of VolumetricHeatCapacity.
+        :rtype: VolumetricHeatCapacity
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return VolumetricHeatCapacity._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> VolumetricHeatCapacity:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return VolumetricHeatCapacity._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -301,10 +555,7 @@ class VolumetricHeatCapacity(AbstractMeasure):
         """
         
         """
-        if self.__joules_per_cubic_meter_kelvin != None:
-            return self.__joules_per_cubic_meter_kelvin
-        self.__joules_per_cubic_meter_kelvin = self.__convert_from_base(VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin)
-        return self.__joules_per_cubic_meter_kelvin
+        return self._cached_convert(VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin)
 
     
     @property
@@ -312,10 +563,7 @@ class VolumetricHeatCapacity(AbstractMeasure):
         """
         
         """
-        if self.__joules_per_cubic_meter_degree_celsius != None:
-            return self.__joules_per_cubic_meter_degree_celsius
-        self.__joules_per_cubic_meter_degree_celsius = self.__convert_from_base(VolumetricHeatCapacityUnits.JoulePerCubicMeterDegreeCelsius)
-        return self.__joules_per_cubic_meter_degree_celsius
+        return self._cached_convert(VolumetricHeatCapacityUnits.JoulePerCubicMeterDegreeCelsius)
 
     
     @property
@@ -323,10 +571,7 @@ class VolumetricHeatCapacity(AbstractMeasure):
         """
         
         """
-        if self.__calories_per_cubic_centimeter_degree_celsius != None:
-            return self.__calories_per_cubic_centimeter_degree_celsius
-        self.__calories_per_cubic_centimeter_degree_celsius = self.__convert_from_base(VolumetricHeatCapacityUnits.CaloriePerCubicCentimeterDegreeCelsius)
-        return self.__calories_per_cubic_centimeter_degree_celsius
+        return self._cached_convert(VolumetricHeatCapacityUnits.CaloriePerCubicCentimeterDegreeCelsius)
 
     
     @property
@@ -334,10 +579,7 @@ class VolumetricHeatCapacity(AbstractMeasure):
         """
         
         """
-        if self.__btus_per_cubic_foot_degree_fahrenheit != None:
-            return self.__btus_per_cubic_foot_degree_fahrenheit
-        self.__btus_per_cubic_foot_degree_fahrenheit = self.__convert_from_base(VolumetricHeatCapacityUnits.BtuPerCubicFootDegreeFahrenheit)
-        return self.__btus_per_cubic_foot_degree_fahrenheit
+        return self._cached_convert(VolumetricHeatCapacityUnits.BtuPerCubicFootDegreeFahrenheit)
 
     
     @property
@@ -345,10 +587,7 @@ class VolumetricHeatCapacity(AbstractMeasure):
         """
         
         """
-        if self.__kilojoules_per_cubic_meter_kelvin != None:
-            return self.__kilojoules_per_cubic_meter_kelvin
-        self.__kilojoules_per_cubic_meter_kelvin = self.__convert_from_base(VolumetricHeatCapacityUnits.KilojoulePerCubicMeterKelvin)
-        return self.__kilojoules_per_cubic_meter_kelvin
+        return self._cached_convert(VolumetricHeatCapacityUnits.KilojoulePerCubicMeterKelvin)
 
     
     @property
@@ -356,10 +595,7 @@ class VolumetricHeatCapacity(AbstractMeasure):
         """
         
         """
-        if self.__megajoules_per_cubic_meter_kelvin != None:
-            return self.__megajoules_per_cubic_meter_kelvin
-        self.__megajoules_per_cubic_meter_kelvin = self.__convert_from_base(VolumetricHeatCapacityUnits.MegajoulePerCubicMeterKelvin)
-        return self.__megajoules_per_cubic_meter_kelvin
+        return self._cached_convert(VolumetricHeatCapacityUnits.MegajoulePerCubicMeterKelvin)
 
     
     @property
@@ -367,10 +603,7 @@ class VolumetricHeatCapacity(AbstractMeasure):
         """
         
         """
-        if self.__kilojoules_per_cubic_meter_degree_celsius != None:
-            return self.__kilojoules_per_cubic_meter_degree_celsius
-        self.__kilojoules_per_cubic_meter_degree_celsius = self.__convert_from_base(VolumetricHeatCapacityUnits.KilojoulePerCubicMeterDegreeCelsius)
-        return self.__kilojoules_per_cubic_meter_degree_celsius
+        return self._cached_convert(VolumetricHeatCapacityUnits.KilojoulePerCubicMeterDegreeCelsius)
 
     
     @property
@@ -378,10 +611,7 @@ class VolumetricHeatCapacity(AbstractMeasure):
         """
         
         """
-        if self.__megajoules_per_cubic_meter_degree_celsius != None:
-            return self.__megajoules_per_cubic_meter_degree_celsius
-        self.__megajoules_per_cubic_meter_degree_celsius = self.__convert_from_base(VolumetricHeatCapacityUnits.MegajoulePerCubicMeterDegreeCelsius)
-        return self.__megajoules_per_cubic_meter_degree_celsius
+        return self._cached_convert(VolumetricHeatCapacityUnits.MegajoulePerCubicMeterDegreeCelsius)
 
     
     @property
@@ -389,10 +619,7 @@ class VolumetricHeatCapacity(AbstractMeasure):
         """
         
         """
-        if self.__kilocalories_per_cubic_centimeter_degree_celsius != None:
-            return self.__kilocalories_per_cubic_centimeter_degree_celsius
-        self.__kilocalories_per_cubic_centimeter_degree_celsius = self.__convert_from_base(VolumetricHeatCapacityUnits.KilocaloriePerCubicCentimeterDegreeCelsius)
-        return self.__kilocalories_per_cubic_centimeter_degree_celsius
+        return self._cached_convert(VolumetricHeatCapacityUnits.KilocaloriePerCubicCentimeterDegreeCelsius)
 
     
     def to_string(self, unit: VolumetricHeatCapacityUnits = VolumetricHeatCapacityUnits.JoulePerCubicMeterKelvin) -> str:
@@ -1,14 +1,25 @@
+from __future__ import annotations
+
+from array import array
 from enum import Enum
 import math
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
 
 from ..abstract_unit import AbstractMeasure
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+    from fractions import Fraction
+
 
 
 class WarpingMomentOfInertiaUnits(Enum):
         """
             WarpingMomentOfInertiaUnits enumeration
         """
+        # Members are singletons, hashing by identity keeps the unit keyed lookups cheap.
+        __hash__ = object.__hash__
+
         
         MeterToTheSixth = 'meter_to_the_sixth'
         """
@@ -49,73 +60,304 @@ class WarpingMomentOfInertia(AbstractMeasure):
         value (float): The value.
         from_unit (WarpingMomentOfInertiaUnits): The WarpingMomentOfInertia unit to create from, The default unit is MeterToTheSixth
     """
-    def __init__(self, value: float, from_unit: WarpingMomentOfInertiaUnits = WarpingMomentOfInertiaUnits.MeterToTheSixth):
-        if math.isnan(value):
-            raise ValueError('Invalid unit: value is NaN')
-        self._value = self.__convert_to_base(value, from_unit)
+    __slots__ = ()
+
+    _units = WarpingMomentOfInertiaUnits
+
+    _base_unit = WarpingMomentOfInertiaUnits.MeterToTheSixth
+
+    _dimensions = (6, 0, 0, 0, 0, 0, 0)
+
+    _si_scale = '1'
+
+    _delta_quantity = None
+
+    # The pinned binary codec ids of the quantity and its units, see 'unitsnet_py.binary'.
+    _binary_id = 119
+
+    _binary_unit_ids = {
         
-        self.__meters_to_the_sixth = None
+        WarpingMomentOfInertiaUnits.MeterToTheSixth: 0,
         
-        self.__decimeters_to_the_sixth = None
+        WarpingMomentOfInertiaUnits.DecimeterToTheSixth: 1,
         
-        self.__centimeters_to_the_sixth = None
+        WarpingMomentOfInertiaUnits.CentimeterToTheSixth: 2,
         
-        self.__millimeters_to_the_sixth = None
+        WarpingMomentOfInertiaUnits.MillimeterToTheSixth: 3,
         
-        self.__feet_to_the_sixth = None
+        WarpingMomentOfInertiaUnits.FootToTheSixth: 4,
         
-        self.__inches_to_the_sixth = None
+        WarpingMomentOfInertiaUnits.InchToTheSixth: 5,
         
+    }
 
-    def convert(self, unit: WarpingMomentOfInertiaUnits) -> float:
-        return self.__convert_from_base(unit)
+    # Conversion functions per unit, built once at import so dispatching a unit is a single lookup.
+    _conversions_from_base = {
+        
+        WarpingMomentOfInertiaUnits.MeterToTheSixth: lambda value: (value),
+        
+        WarpingMomentOfInertiaUnits.DecimeterToTheSixth: lambda value: (value * 1e6),
+        
+        WarpingMomentOfInertiaUnits.CentimeterToTheSixth: lambda value: (value * 1e12),
+        
+        WarpingMomentOfInertiaUnits.MillimeterToTheSixth: lambda value: (value * 1e18),
+        
+        WarpingMomentOfInertiaUnits.FootToTheSixth: lambda value: (value / math.pow(0.3048, 6)),
+        
+        WarpingMomentOfInertiaUnits.InchToTheSixth: lambda value: (value / math.pow(2.54e-2, 6)),
+        
+    }
 
-    def __convert_from_base(self, from_unit: WarpingMomentOfInertiaUnits) -> float:
-        value = self._value
+    _conversions_to_base = {
+        
+        WarpingMomentOfInertiaUnits.MeterToTheSixth: lambda value: (value),
+        
+        WarpingMomentOfInertiaUnits.DecimeterToTheSixth: lambda value: (value / 1e6),
+        
+        WarpingMomentOfInertiaUnits.CentimeterToTheSixth: lambda value: (value / 1e12),
+        
+        WarpingMomentOfInertiaUnits.MillimeterToTheSixth: lambda value: (value / 1e18),
+        
+        WarpingMomentOfInertiaUnits.FootToTheSixth: lambda value: (value * math.pow(0.3048, 6)),
+        
+        WarpingMomentOfInertiaUnits.InchToTheSixth: lambda value: (value * math.pow(2.54e-2, 6)),
+        
+    }
+
+    # Affine (scale, offset) coefficients of the unit formulas as fraction strings, non-affine units are omitted.
+    _affine_from_base = {
         
-        if from_unit == WarpingMomentOfInertiaUnits.MeterToTheSixth:
-            return (value)
+        WarpingMomentOfInertiaUnits.MeterToTheSixth: ('1', '0'),
         
-        if from_unit == WarpingMomentOfInertiaUnits.DecimeterToTheSixth:
-            return (value * 1e6)
+        WarpingMomentOfInertiaUnits.DecimeterToTheSixth: ('1000000', '0'),
         
-        if from_unit == WarpingMomentOfInertiaUnits.CentimeterToTheSixth:
-            return (value * 1e12)
+        WarpingMomentOfInertiaUnits.CentimeterToTheSixth: ('1000000000000', '0'),
         
-        if from_unit == WarpingMomentOfInertiaUnits.MillimeterToTheSixth:
-            return (value * 1e18)
+        WarpingMomentOfInertiaUnits.MillimeterToTheSixth: ('1000000000000000000', '0'),
         
-        if from_unit == WarpingMomentOfInertiaUnits.FootToTheSixth:
-            return (value / math.pow(0.3048, 6))
+        WarpingMomentOfInertiaUnits.FootToTheSixth: ('3814697265625000000/3058791354808281', '0'),
         
-        if from_unit == WarpingMomentOfInertiaUnits.InchToTheSixth:
-            return (value / math.pow(2.54e-2, 6))
+        WarpingMomentOfInertiaUnits.InchToTheSixth: ('15625000000000000000000/4195872914689', '0'),
         
-        return None
+    }
 
+    _affine_to_base = {
+        
+        WarpingMomentOfInertiaUnits.MeterToTheSixth: ('1', '0'),
+        
+        WarpingMomentOfInertiaUnits.DecimeterToTheSixth: ('1/1000000', '0'),
+        
+        WarpingMomentOfInertiaUnits.CentimeterToTheSixth: ('1/1000000000000', '0'),
+        
+        WarpingMomentOfInertiaUnits.MillimeterToTheSixth: ('1/1000000000000000000', '0'),
+        
+        WarpingMomentOfInertiaUnits.FootToTheSixth: ('3058791354808281/3814697265625000000', '0'),
+        
+        WarpingMomentOfInertiaUnits.InchToTheSixth: ('4195872914689/15625000000000000000000', '0'),
+        
+    }
 
-    def __convert_to_base(self, value: float, to_unit: WarpingMomentOfInertiaUnits) -> float:
+    # The en-US abbreviations of each unit, the first one is used for formatting.
+    _abbreviations = {
         
-        if to_unit == WarpingMomentOfInertiaUnits.MeterToTheSixth:
-            return (value)
+        WarpingMomentOfInertiaUnits.MeterToTheSixth: ('m⁶',),
         
-        if to_unit == WarpingMomentOfInertiaUnits.DecimeterToTheSixth:
-            return (value / 1e6)
+        WarpingMomentOfInertiaUnits.DecimeterToTheSixth: ('dm⁶',),
         
-        if to_unit == WarpingMomentOfInertiaUnits.CentimeterToTheSixth:
-            return (value / 1e12)
+        WarpingMomentOfInertiaUnits.CentimeterToTheSixth: ('cm⁶',),
         
-        if to_unit == WarpingMomentOfInertiaUnits.MillimeterToTheSixth:
-            return (value / 1e18)
+        WarpingMomentOfInertiaUnits.MillimeterToTheSixth: ('mm⁶',),
         
-        if to_unit == WarpingMomentOfInertiaUnits.FootToTheSixth:
-            return (value * math.pow(0.3048, 6))
+        WarpingMomentOfInertiaUnits.FootToTheSixth: ('ft⁶',),
         
-        if to_unit == WarpingMomentOfInertiaUnits.InchToTheSixth:
-            return (value * math.pow(2.54e-2, 6))
+        WarpingMomentOfInertiaUnits.InchToTheSixth: ('in⁶',),
         
-        return None
+    }
+
+    def __init__(self, value: float, from_unit: WarpingMomentOfInertiaUnits = WarpingMomentOfInertiaUnits.MeterToTheSixth):
+        if math.isnan(value):
+            raise ValueError('Invalid unit: value is NaN')
+        self._value = self.__convert_to_base(value, from_unit)
+
+    def convert(self, unit: WarpingMomentOfInertiaUnits) -> float:
+        return self.__convert_from_base(unit)
+
+    def __convert_from_base(self, from_unit: WarpingMomentOfInertiaUnits) -> float:
+        return self._conversions_from_base[from_unit](self._value)
+
+
+    def __convert_to_base(self, value: float, to_unit: WarpingMomentOfInertiaUnits) -> float:
+        return self._conversions_to_base[to_unit](value)
+
+
+    @staticmethod
+    def convert_value(value: float, from_unit: WarpingMomentOfInertiaUnits, to_unit: WarpingMomentOfInertiaUnits) -> float:
+        """
+        Convert a value from one WarpingMomentOfInertia unit to another, without creating a WarpingMomentOfInertia instance.
+
+        :param value: The value in from_unit.
+        :type value: float
+        :param from_unit: The unit of the value.
+        :type from_unit: WarpingMomentOfInertiaUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: WarpingMomentOfInertiaUnits
+        :return: The value in to_unit.
+        :rtype: float
+        """
+        return WarpingMomentOfInertia._convert_value(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_many(values: Iterable[float], from_unit: WarpingMomentOfInertiaUnits, to_unit: WarpingMomentOfInertiaUnits) -> List[float]:
+        """
+        Convert many values from one WarpingMomentOfInertia unit to another.
+        The conversion is resolved once and applied to all the values.
 
+        :param values: The values in from_unit.
+        :type values: Iterable[float]
+        :param from_unit: The unit of the values.
+        :type from_unit: WarpingMomentOfInertiaUnits
+        :param to_unit: The unit to convert the values to.
+        :type to_unit: WarpingMomentOfInertiaUnits
+        :return: The values in to_unit.
+        :rtype: List[float]
+        """
+        return WarpingMomentOfInertia._convert_many(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_array(values: Iterable[float], from_unit: WarpingMomentOfInertiaUnits, to_unit: WarpingMomentOfInertiaUnits) -> array:
+        """
+        Same as convert_many, but returns a compact array('d') (and accepts one as input).
+        """
+        return array("d", WarpingMomentOfInertia._convert_many(values, from_unit, to_unit))
+
+    @staticmethod
+    def convert_exact(
+        value: Union[Fraction, Decimal, int, str], from_unit: WarpingMomentOfInertiaUnits, to_unit: WarpingMomentOfInertiaUnits
+    ) -> Union[Fraction, Decimal]:
+        """
+        Convert a value from one WarpingMomentOfInertia unit to another exactly, using rational conversion factors.
+
+        :param value: The value in from_unit, a Decimal value is converted to a Decimal (in the current context).
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: WarpingMomentOfInertiaUnits
+        :param to_unit: The unit to convert the value to.
+        :type to_unit: WarpingMomentOfInertiaUnits
+        :return: The value in to_unit, as a Fraction (or a Decimal).
+        :rtype: Union[Fraction, Decimal]
+        :raises ValueError: When one of the units has no exact (linear) conversion.
+        """
+        return WarpingMomentOfInertia._convert_exact(value, from_unit, to_unit)
+
+    @staticmethod
+    def from_exact(value: Union[Fraction, Decimal, int, str], from_unit: WarpingMomentOfInertiaUnits = WarpingMomentOfInertiaUnits.MeterToTheSixth) -> WarpingMomentOfInertia:
+        """
+        Create a new instance of WarpingMomentOfInertia holding the exact base value as a Fraction, see 'to_exact'.
+        Note! the other operations use the float base value, and arithmetic results hold only a float base value.
+
+        :param value: The value in from_unit.
+        :type value: Union[Fraction, Decimal, int, str]
+        :param from_unit: The unit of the value.
+        :type from_unit: WarpingMomentOfInertiaUnits
+        :return: A new instance of WarpingMomentOfInertia.
+        :rtype: WarpingMomentOfInertia
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return WarpingMomentOfInertia._from_exact(value, from_unit)
+
+    def to_exact(self, unit: WarpingMomentOfInertiaUnits = WarpingMomentOfInertiaUnits.MeterToTheSixth) -> Fraction:
+        """
+        Get the exact value of the WarpingMomentOfInertia in the given unit, as a Fraction.
+        Note! for an instance not created by 'from_exact', the exact value of its float base value is converted.
+
+        :param unit: The unit of the value, by default the base unit (MeterToTheSixth).
+        :type unit: WarpingMomentOfInertiaUnits
+        :return: The exact value.
+        :rtype: Fraction
+        :raises ValueError: When the unit has no exact (linear) conversion.
+        """
+        return self._to_exact(unit)
+
+    @staticmethod
+    def parse(text: str) -> WarpingMomentOfInertia:
+        """
+        Parse a WarpingMomentOfInertia from a value followed by a unit abbreviation, e.g. "1 m⁶".
+
+        :param text: The string to parse.
+        :type text: str
+        :return: A new instance of WarpingMomentOfInertia.
+        :rtype: WarpingMomentOfInertia
+        :raises ValueError: When the string is not a valid or an ambiguous WarpingMomentOfInertia.
+        """
+        return WarpingMomentOfInertia._parse(text)
+
+    @staticmethod
+    def try_parse(text: str) -> Optional[WarpingMomentOfInertia]:
+        """
+        Same as parse, but returns None when the string can not be parsed.
+        """
+        return WarpingMomentOfInertia._try_parse(text)
+
+    def to_binary(self, unit: Optional[WarpingMomentOfInertiaUnits] = None) -> bytes:
+        """
+        Encode the WarpingMomentOfInertia to 12 bytes (quantity id, unit id, float64 value), see 'unitsnet_py.binary'.
+
+        :param unit: The unit to encode the value in, by default the base unit (lossless).
+        :type unit: WarpingMomentOfInertiaUnits
+        :return: The encoded WarpingMomentOfInertia.
+        :rtype: bytes
+        """
+        return self._to_binary(unit)
+
+    @staticmethod
+    def from_binary(data: bytes) -> WarpingMomentOfInertia:
+        """
+        Decode a WarpingMomentOfInertia encoded by to_binary.
+
+        :param data: The encoded WarpingMomentOfInertia, any bytes-like object.
+        :type data: bytes
+        :return: A new instance of WarpingMomentOfInertia.
+        :rtype: WarpingMomentOfInertia
+        :raises ValueError: When the data is not a valid encoded WarpingMomentOfInertia.
+        """
+        return WarpingMomentOfInertia._from_binary(data)
+
+    def to_dto(self, hold_in_unit: Optional[WarpingMomentOfInertiaUnits] = None) -> dict:
+        """
+        Get the WarpingMomentOfInertia DTO, {"value": float, "unit": str}, see 'unitsnet_py.dto'.
+
+        :param hold_in_unit: The unit of the DTO value, by default the base unit (MeterToTheSixth).
+        :type hold_in_unit: WarpingMomentOfInertiaUnits
+        :return: The WarpingMomentOfInertia DTO.
+        :rtype: dict
+        """
+        return self._to_dto(hold_in_unit)
+
+    def to_json(self, hold_in_unit: Optional[WarpingMomentOfInertiaUnits] = None) -> str:
+        """
+        Same as to_dto, but returns the DTO as JSON text.
+        """
+        return self._to_json(hold_in_unit)
+
+    @staticmethod
+    def from_dto(dto: dict) -> WarpingMomentOfInertia:
+        """
+        Create a new instance of WarpingMomentOfInertia from its DTO.
+
+        :param dto: The WarpingMomentOfInertia DTO, the unit is the WarpingMomentOfInertiaUnits value or name.
+        :type dto: dict
+        :return: A new instance of WarpingMomentOfInertia.
+        :rtype: WarpingMomentOfInertia
+        :raises ValueError: When the DTO is not valid or its unit is unknown.
+        """
+        return WarpingMomentOfInertia._from_dto(dto)
+
+    @staticmethod
+    def from_json(text: str) -> WarpingMomentOfInertia:
+        """
+        Same as from_dto, but accepts the DTO as JSON text.
+        """
+        return WarpingMomentOfInertia._from_json(text)
 
     @property
     def base_value(self) -> float:
@@ -217,10 +459,7 @@ class WarpingMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__meters_to_the_sixth != None:
-            return self.__meters_to_the_sixth
-        self.__meters_to_the_sixth = self.__convert_from_base(WarpingMomentOfInertiaUnits.MeterToTheSixth)
-        return self.__meters_to_the_sixth
+        return self._cached_convert(WarpingMomentOfInertiaUnits.MeterToTheSixth)
 
     
     @property
@@ -228,10 +467,7 @@ class WarpingMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__decimeters_to_the_sixth != None:
-            return self.__decimeters_to_the_sixth
-        self.__decimeters_to_the_sixth = self.__convert_from_base(WarpingMomentOfInertiaUnits.DecimeterToTheSixth)
-        return self.__decimeters_to_the_sixth
+        return self._cached_convert(WarpingMomentOfInertiaUnits.DecimeterToTheSixth)
 
     
     @property
@@ -239,10 +475,7 @@ class WarpingMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__centimeters_to_the_sixth != None:
-            return self.__centimeters_to_the_sixth
-        self.__centimeters_to_the_sixth = self.__convert_from_base(WarpingMomentOfInertiaUnits.CentimeterToTheSixth)
-        return self.__centimeters_to_the_sixth
+        return self._cached_convert(WarpingMomentOfInertiaUnits.CentimeterToTheSixth)
 
     
     @property
@@ -250,10 +483,7 @@ class WarpingMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__millimeters_to_the_sixth != None:
-            return self.__millimeters_to_the_sixth
-        self.__millimeters_to_the_sixth = self.__convert_from_base(WarpingMomentOfInertiaUnits.MillimeterToTheSixth)
-        return self.__millimeters_to_the_sixth
+        return self._cached_convert(WarpingMomentOfInertiaUnits.MillimeterToTheSixth)
 
     
     @property
@@ -261,10 +491,7 @@ class WarpingMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__feet_to_the_sixth != None:
-            return self.__feet_to_the_sixth
-        self.__feet_to_the_sixth = self.__convert_from_base(WarpingMomentOfInertiaUnits.FootToTheSixth)
-        return self.__feet_to_the_sixth
+        return self._cached_convert(WarpingMomentOfInertiaUnits.FootToTheSixth)
 
     
     @property
@@ -272,10 +499,7 @@ class WarpingMomentOfInertia(AbstractMeasure):
         """
         
         """
-        if self.__inches_to_the_sixth != None:
-            return self.__inches_to_the_sixth
-        self.__inches_to_the_sixth = self.__convert_from_base(WarpingMomentOfInertiaUnits.InchToTheSixth)
-        return self.__inches_to_the_sixth
+        return self._cached_convert(WarpingMomentOfInertiaUnits.InchToTheSixth)
 
     
     def to_string(self, unit: WarpingMomentOfInertiaUnits = WarpingMomentOfInertiaUnits.MeterToTheSixth) -> str: